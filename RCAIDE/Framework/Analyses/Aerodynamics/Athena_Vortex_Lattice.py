@@ -113,6 +113,7 @@ class Athena_Vortex_Lattice(Aerodynamics):
         settings.print_output                                        = False 
         settings.keep_files                                          = False        
         settings.new_regression_results                              = False  
+        settings.number_of_workers                                   = 1      # number of concurrent AVL processes
         settings.side_slip_angle                                     = 0.0
         settings.roll_rate_coefficient                               = 0.0
         settings.pitch_rate_coefficient                              = 0.0 
@@ -132,6 +133,7 @@ class Athena_Vortex_Lattice(Aerodynamics):
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
+        self.training_restored                                      = False
         self.training.angle_of_attack               = np.array([-2.,0., 2.,5., 7., 10.])*Units.degrees
         self.training.Mach                          = np.array([0.05,0.15,0.25, 0.45,0.65,0.85]) 
         self.training.lift_coefficient              = None
@@ -196,8 +198,11 @@ class Athena_Vortex_Lattice(Aerodynamics):
 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            train_AVL_surrogates(self)
+            # sample training data, unless it was restored from an identical analysis
+            if self.training_restored:
+                self.training_restored = False
+            else:
+                train_AVL_surrogates(self)
 
             # build surrogate
             build_AVL_surrogates(self)  
@@ -112,9 +112,19 @@ class Vortex_Lattice_Method(Aerodynamics):
         self.settings.leading_edge_suction_multiplier                     = 1.0  
         self.settings.use_VORLAX_matrix_calculation                       = False
         self.settings.floating_point_precision                            = np.float32     
+        self.settings.influence_matrix_block_size                         = None
+        self.settings.influence_matrix_precision                          = np.float64
+        self.settings.use_hierarchical_influence_matrix                   = False
+        self.settings.hierarchical_matrix                                 = Data()
+        self.settings.hierarchical_matrix.tolerance                       = 1e-4
+        self.settings.hierarchical_matrix.solver_tolerance                = 1e-6
+        self.settings.hierarchical_matrix.leaf_size                       = 64
+        self.settings.hierarchical_matrix.admissibility                   = 2.0
+        self.settings.hierarchical_matrix.maximum_iterations              = 500
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
+        self.training_restored                                      = False
         self.training.angle_of_attack                               = np.array([-5., -2. , 1E-20 , 2.0, 5.0, 8.0, 12., 45., 75.]) * Units.deg 
         self.training.Mach                                          = np.array([0.1  ,0.3,  0.5,  0.65 , 0.85 , 0.9, 1.3, 1.35 , 1.5 , 2.0, 2.25 , 2.5  , 3.5])             
                       
@@ -200,8 +210,11 @@ class Vortex_Lattice_Method(Aerodynamics):
 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            train_VLM_surrogates(self)
+            # sample training data, unless it was restored from an identical analysis
+            if self.training_restored:
+                self.training_restored = False
+            else:
+                train_VLM_surrogates(self)
 
             # build surrogate
             build_VLM_surrogates(self)  
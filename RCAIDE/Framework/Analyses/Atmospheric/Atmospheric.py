@@ -11,6 +11,8 @@
 from RCAIDE.Library.Attributes.Atmospheres.Atmosphere import Atmosphere
 from RCAIDE.Framework.Analyses import Analysis
 
+import numpy as np
+
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -51,3 +53,74 @@ class Atmospheric(Analysis):
     def compute_values(self,altitude):
         """This function is not implemented for the base class."""
         raise NotImplementedError
+
+    def compute_freestream(self,altitude,temperature_deviation,freestream,var_gamma=False):
+        """Computes the atmospheric values at the altitudes and writes them into the freestream conditions.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        altitude                                 [m]
+        temperature_deviation                    [K]
+        freestream                               [Data]
+
+        Outputs:
+        freestream.
+          pressure                               [Pa]
+          temperature                            [K]
+          density                                [kg/m^3]
+          speed_of_sound                         [m/s]
+          dynamic_viscosity                      [kg/(m*s)]
+          kinematic_viscosity                    [m^2/s]
+          thermal_conductivity                   [W/(m*K)]
+          prandtl_number                         [-]
+
+        Properties Used:
+        N/A
+        """
+        atmo_data = self.compute_values(altitude,temperature_deviation)
+        for key in freestream_keys:
+            set_freestream_array(freestream,key,atmo_data[key])
+
+        return
+
+
+# ----------------------------------------------------------------------
+#  Freestream Arrays
+# ----------------------------------------------------------------------
+
+freestream_keys = ['pressure','temperature','density','speed_of_sound','dynamic_viscosity',
+                   'kinematic_viscosity','thermal_conductivity','prandtl_number']
+
+def set_freestream_array(freestream,key,values):
+    """Writes values into the freestream array of a key, in place when the array already has their shape.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    freestream                               [Data]
+    key                                      [string]
+    values                                   [-]
+
+    Outputs:
+    freestream[key]                          [-]
+
+    Properties Used:
+    N/A
+    """
+    array = dict.get(freestream,key)
+    if isinstance(array,np.ndarray) and array.dtype == float and array.shape == np.shape(values):
+        array[...] = values
+    else:
+        freestream[key] = np.array(values,dtype=float)
+
+    return
+
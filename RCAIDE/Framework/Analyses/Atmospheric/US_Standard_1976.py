@@ -11,9 +11,9 @@
 import numpy as np
 from warnings import warn
 import RCAIDE
-from RCAIDE.Framework.Analyses.Atmospheric import Atmospheric
+from RCAIDE.Framework.Analyses.Atmospheric.Atmospheric import Atmospheric, freestream_keys, set_freestream_array
 from RCAIDE.Framework.Mission.Common.Conditions import Conditions
-from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Core import Units, Data
 from RCAIDE.Framework.Core.Arrays import atleast_2d_col
 
 from RCAIDE.Library.Attributes.Gases import Air
@@ -56,7 +56,49 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = RCAIDE.Library.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+
+        self.settings.use_lookup_table       = False
+        self.settings.lookup_table_tolerance = 1e-6
+        self.layers                          = None
+        self.tables                          = Data()
     
+    def initialize(self):
+        """Precomputes the constants of the layers of the atmosphere and, when enabled, the lookup table of the
+        atmospheric values. This is redone on the next evaluation after the breaks or fluid properties change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        None
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+
+        # check properties
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')
+
+        self.layers = compute_layers(self)
+        self.tables = Data()
+
+        return
+
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
         """Computes atmospheric values.
@@ -92,88 +134,385 @@ class US_Standard_1976(Atmospheric):
             pressure                             [Pa]
         """
 
-        # unpack
-        zs        = altitude
-        gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
-        delta_isa = temperature_deviation
-        
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
-        
-        # convert input if necessary
-        zs = atleast_2d_col(zs)
+        zs = atleast_2d_col(altitude)
 
-        # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
-        
-        # convert geometric to geopotential altitude
-        zs = zs/(1 + zs/Rad)
-        
-        # check ranges
-        if np.amin(zs) < zmin:
-            print("Warning: altitude requested below minimum for this atmospheric model; returning values for h = -2.0 km")
-            zs[zs < zmin] = zmin
-        if np.amax(zs) > zmax:
-            print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
-            zs[zs > zmax] = zmax        
-
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
-        
-        T     = T0 - dz*alpha + delta_isa
-        rho   = gas.compute_density(T,p)
-        a     = gas.compute_speed_of_sound(T,p,var_gamma)
-        mu    = gas.compute_absolute_viscosity(T)
-        K     = gas.compute_thermal_conductivity(T)  
-        Pr    = gas.compute_prandtl_number(T)
-        
         atmo_data = Conditions()
         atmo_data.expand_rows(zs.shape[0])
-        atmo_data.pressure                     = p
-        atmo_data.temperature                  = T
-        atmo_data.density                      = rho
-        atmo_data.speed_of_sound               = a
-        atmo_data.dynamic_viscosity            = mu
-        atmo_data.kinematic_viscosity          = mu/rho
-        atmo_data.thermal_conductivity         = K
-        atmo_data.prandtl_number               = Pr 
-        
+        self.compute_freestream(zs,temperature_deviation,atmo_data,var_gamma)
+
         return atmo_data
 
+    def compute_freestream(self,altitude,temperature_deviation,freestream,var_gamma=False):
+        """Computes the atmospheric values at the altitudes and writes them into the existing freestream arrays.
+        The layer of each altitude is found with a binary search of the precomputed layers. With the lookup
+        table setting the values are interpolated in a table of the atmosphere instead, whose interpolation
+        error is below settings.lookup_table_tolerance.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        altitude                                 [m]
+        temperature_deviation                    [K]
+        freestream                               [Data]
+
+        Output:
+        freestream.
+          pressure                               [Pa]
+          temperature                            [K]
+          density                                [kg/m^3]
+          speed_of_sound                         [m/s]
+          dynamic_viscosity                      [kg/(m*s)]
+          kinematic_viscosity                    [m^2/s]
+          thermal_conductivity                   [W/(m*K)]
+          prandtl_number                         [-]
+
+        Properties Used:
+        self.
+          settings.use_lookup_table              [boolean]
+          settings.lookup_table_tolerance        [-]
+        """
+
+        if not layers_are_current(self):
+            self.initialize()
+
+        # convert geometric to geopotential altitude within the bounds of the model
+        zs = geopotential_altitude(self,altitude)
+
+        if self.settings.use_lookup_table and np.ndim(temperature_deviation) == 0:
+            key = (float(temperature_deviation),bool(var_gamma))
+            if key not in self.tables:
+                self.tables[key] = compute_lookup_table(self,temperature_deviation,var_gamma,self.settings.lookup_table_tolerance)
+            values = interpolate_lookup_table(self.tables[key],zs)
+            for i, name in enumerate(freestream_keys):
+                set_freestream_array(freestream,name,values[i])
+            return
+
+        p, T = compute_pressure_temperature(self.layers,zs,temperature_deviation)
+        compute_gas_properties(self.fluid_properties,p,T,var_gamma,freestream)
+
+        return
+
+
+# ----------------------------------------------------------------------
+#  Layers
+# ----------------------------------------------------------------------
+
+def compute_layers(atmosphere):
+    """Precomputes the base altitude, temperature, pressure, lapse rate and pressure exponent of each layer of the
+    atmosphere.
+
+    Assumptions:
+    Isothermal layers are those with no temperature change between their breaks
+
+    Source:
+    U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+    Inputs:
+    atmosphere                               [Atmospheric]
+
+    Outputs:
+    layers.
+      altitude                               [m]
+      temperature                            [K]
+      pressure                               [Pa]
+      lapse_rate                             [K/m]
+      exponent                               [-]
+      isothermal_constant                    [1/m]
+
+    Properties Used:
+    N/A
+    """
+    breaks = atmosphere.breaks
+    grav   = atmosphere.planet.sea_level_gravity
+    R      = atmosphere.fluid_properties.gas_specific_constant
+
+    z      = np.array(breaks.altitude,dtype=float)
+    T      = np.array(breaks.temperature,dtype=float)
+    alpha  = -np.diff(T)/np.diff(z)
+    isoth  = (alpha == 0.)
+
+    layers                     = Data()
+    layers.breaks              = breaks
+    layers.break_arrays        = (breaks.altitude, breaks.temperature, breaks.pressure)
+    layers.fluid_properties    = atmosphere.fluid_properties
+    layers.planet              = atmosphere.planet
+    layers.altitude            = z[:-1]
+    layers.temperature         = T[:-1]
+    layers.pressure            = np.array(breaks.pressure[:-1],dtype=float)
+    layers.lapse_rate          = alpha
+    layers.exponent            = np.where(isoth,0.,grav/(R*np.where(isoth,1.,alpha)))
+    layers.isothermal_constant = np.where(isoth,-grav/(R*T[:-1]),0.)
+    layers.minimum_altitude    = z[0]
+    layers.maximum_altitude    = z[-1]
+
+    return layers
+
+def layers_are_current(atmosphere):
+    """Checks that the precomputed layers were built from the current breaks, fluid properties and planet. The
+    arrays of the breaks are compared by identity, layers are recomputed when they are replaced.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    atmosphere                               [Atmospheric]
+
+    Outputs:
+    current                                  [boolean]
+
+    Properties Used:
+    N/A
+    """
+    layers = dict.get(atmosphere,'layers')
+    if layers is None:
+        return False
+    breaks = atmosphere.breaks
+    if layers.breaks is not breaks or layers.fluid_properties is not atmosphere.fluid_properties or layers.planet is not atmosphere.planet:
+        return False
+    return all(a is b for a, b in zip(layers.break_arrays,(breaks.altitude, breaks.temperature, breaks.pressure)))
+
+def geopotential_altitude(atmosphere,altitude):
+    """Converts geometric altitudes to geopotential altitudes limited to the range of the atmosphere model.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    altitude                                 [m]
+
+    Outputs:
+    zs                                       [m]
+
+    Properties Used:
+    N/A
+    """
+    zs   = atleast_2d_col(altitude)
+    Rad  = atmosphere.planet.mean_radius
+    zmin = atmosphere.layers.minimum_altitude
+    zmax = atmosphere.layers.maximum_altitude
+
+    # convert geometric to geopotential altitude
+    zs = zs/(1 + zs/Rad)
+
+    # check ranges
+    if np.amin(zs) < zmin:
+        print("Warning: altitude requested below minimum for this atmospheric model; returning values for h = -2.0 km")
+        zs[zs < zmin] = zmin
+    if np.amax(zs) > zmax:
+        print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")
+        zs[zs > zmax] = zmax
+
+    return zs
+
+def compute_pressure_temperature(layers,zs,temperature_deviation=0.0,i=None):
+    """Computes the pressure and temperature at geopotential altitudes from the precomputed layers.
+
+    Assumptions:
+    Values at a break are taken from the layer above it unless the layers are given
+
+    Source:
+    U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+    Inputs:
+    layers                                   [Data]
+    zs                                       [m]
+    temperature_deviation                    [K]
+    i                                        [-]
+
+    Outputs:
+    p                                        [Pa]
+    T                                        [K]
+
+    Properties Used:
+    N/A
+    """
+    if i is None:
+        i = np.searchsorted(layers.altitude,zs,side='right') - 1
+        np.clip(i,0,len(layers.altitude) - 1,out=i)
+
+    T0    = layers.temperature[i]
+    alpha = layers.lapse_rate[i]
+    dz    = zs - layers.altitude[i]
+
+    # isothermal layers have no exponent and gradient layers no isothermal constant
+    log_p = layers.exponent[i]*np.log1p(-alpha*dz/T0) + layers.isothermal_constant[i]*dz
+    p     = layers.pressure[i]*np.exp(log_p)
+    T     = T0 - dz*alpha + temperature_deviation
+
+    return p, T
+
+def compute_gas_properties(gas,p,T,var_gamma,freestream):
+    """Computes the properties of the gas at pressures and temperatures and writes them into the freestream arrays.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    gas                                      [Gas]
+    p                                        [Pa]
+    T                                        [K]
+    var_gamma                                [boolean]
+
+    Outputs:
+    freestream.
+      pressure                               [Pa]
+      temperature                            [K]
+      density                                [kg/m^3]
+      speed_of_sound                         [m/s]
+      dynamic_viscosity                      [kg/(m*s)]
+      kinematic_viscosity                    [m^2/s]
+      thermal_conductivity                   [W/(m*K)]
+      prandtl_number                         [-]
+
+    Properties Used:
+    N/A
+    """
+    rho = gas.compute_density(T,p)
+    mu  = gas.compute_absolute_viscosity(T)
+
+    set_freestream_array(freestream,'pressure',p)
+    set_freestream_array(freestream,'temperature',T)
+    set_freestream_array(freestream,'density',rho)
+    set_freestream_array(freestream,'speed_of_sound',gas.compute_speed_of_sound(T,p,var_gamma))
+    set_freestream_array(freestream,'dynamic_viscosity',mu)
+    set_freestream_array(freestream,'kinematic_viscosity',mu/rho)
+    set_freestream_array(freestream,'thermal_conductivity',gas.compute_thermal_conductivity(T))
+    set_freestream_array(freestream,'prandtl_number',gas.compute_prandtl_number(T))
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Lookup Table
+# ----------------------------------------------------------------------
+
+def compute_lookup_table(atmosphere,temperature_deviation,var_gamma,tolerance):
+    """Tabulates the atmospheric values against geopotential altitude. The spacing of the table is halved until
+    linear interpolation of the values, and of the logarithm of pressure and density, matches the model within a
+    relative tolerance at the middle of every interval. Each layer is tabulated from its bottom to its top break,
+    so the breaks appear twice and the values of the model are kept on either side of them.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    atmosphere                               [Atmospheric]
+    temperature_deviation                    [K]
+    var_gamma                                [boolean]
+    tolerance                                [-]
+
+    Outputs:
+    table.
+      altitude                               [m]
+      values                                 [-]
+      logarithmic                            [boolean]
+      error                                  [-]
+
+    Properties Used:
+    N/A
+    """
+    layers      = atmosphere.layers
+    breaks      = np.append(layers.altitude,layers.maximum_altitude)
+    logarithmic = np.array([key in ['pressure','density','kinematic_viscosity'] for key in freestream_keys])
+    spacing     = 1. * Units.km
+
+    while True:
+        n_nodes = np.ceil(np.diff(breaks)/spacing).astype(int) + 1
+        z       = np.concatenate([np.linspace(breaks[i],breaks[i+1],n) for i, n in enumerate(n_nodes)])
+        i       = np.repeat(np.arange(len(n_nodes)),n_nodes)
+
+        table             = Data()
+        table.altitude    = z
+        table.logarithmic = logarithmic
+        table.values      = tabulate(atmosphere,z,i,temperature_deviation,var_gamma,logarithmic)
+
+        # interpolation error at the middle of the intervals within the layers
+        inside      = np.diff(z) > 0.
+        z_mid       = 0.5*(z[1:] + z[:-1])[inside]
+        exact       = tabulate(atmosphere,z_mid,i[:-1][inside],temperature_deviation,var_gamma,np.zeros_like(logarithmic))
+        values      = interpolate_lookup_table(table,z_mid[:,None])[:,:,0]
+        table.error = np.max(np.abs(values/exact - 1.))
+        if table.error < tolerance or spacing < 1.:
+            return table
+        spacing = spacing/2.
+
+def tabulate(atmosphere,z,i,temperature_deviation,var_gamma,logarithmic):
+    """Computes the atmospheric values at geopotential altitudes within given layers, as the rows of an array.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    atmosphere                               [Atmospheric]
+    z                                        [m]
+    i                                        [-]
+    temperature_deviation                    [K]
+    var_gamma                                [boolean]
+    logarithmic                              [boolean]
+
+    Outputs:
+    values                                   [-]
+
+    Properties Used:
+    N/A
+    """
+    data = Data()
+    p, T = compute_pressure_temperature(atmosphere.layers,z,temperature_deviation,i)
+    compute_gas_properties(atmosphere.fluid_properties,p,T,var_gamma,data)
+
+    values = np.array([data[key]*np.ones_like(z) for key in freestream_keys])
+    values[logarithmic] = np.log(values[logarithmic])
+
+    return values
+
+def interpolate_lookup_table(table,zs):
+    """Linearly interpolates the atmospheric values of a lookup table at geopotential altitudes.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    table                                    [Data]
+    zs                                       [m]
+
+    Outputs:
+    values                                   [-]
+
+    Properties Used:
+    N/A
+    """
+    z = table.altitude
+    i = np.searchsorted(z,zs,side='right') - 1
+    np.clip(i,0,len(z) - 2,out=i)
+    w = (zs - z[i])/(z[i+1] - z[i])
+
+    values = table.values[:,i]*(1. - w) + table.values[:,i+1]*w
+    values[table.logarithmic] = np.exp(values[table.logarithmic])
+
+    return values
+
 
 # ----------------------------------------------------------------------
 #   Module Tests
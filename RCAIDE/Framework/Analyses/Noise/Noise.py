@@ -63,6 +63,7 @@ class Noise(Analysis):
         self.settings.noise_reduction_factors                = Data()
         self.settings.noise_reduction_factors.SPL_dbA        = 0.0     # Reduction factors are proportional (.1 is a 10% weight reduction)
         self.settings.topography_file                        = None
+        self.settings.topography_binary_grid                 = False  # store the topography as a memory-mapped binary grid 
         self.settings.microphone_locations                   = None   
         self.settings.microphone_coordinates                 = None
         self.settings.microphone_x_resolution                = 11 
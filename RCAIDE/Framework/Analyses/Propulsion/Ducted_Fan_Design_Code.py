@@ -45,8 +45,10 @@ class Ducted_Fan_Design_Code(Analysis):
         self.settings.filenames.case                      = None
         self.settings.filenames.log_filename              = 'dfdc_log.txt'
         self.settings.filenames.err_filename              = 'dfdc_err.txt'
+        self.settings.filenames.cache_folder              = None   # folder of stored performance maps, no caching if None
  
         self.settings.print_output                        = False 
+        self.settings.number_of_workers                   = 1      # number of concurrent DFDC processes
                    
         # Regression Status           
         self.settings.keep_files                          = False           
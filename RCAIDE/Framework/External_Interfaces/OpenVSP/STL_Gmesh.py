@@ -5,7 +5,11 @@ Created on Thu May 22 23:16:27 2025
 @author: wz10
 """
 
-import gmsh
+try:
+    import gmsh
+except (ImportError, OSError):
+    # This allows RCAIDE to build without gmsh
+    pass
 import os
 
 def stl_to_su2(stl_path, su2_output_path):
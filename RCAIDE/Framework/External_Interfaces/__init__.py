@@ -2,10 +2,23 @@
 # 
 
 """ RCAIDE Package Setup
+
+External interfaces depend on third party tools (OpenVSP, gmsh) and are loaded lazily on first access.
 """
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
- 
-from . import OpenVSP  
\ No newline at end of file
+
+import importlib
+
+_subpackages = ('OpenVSP',)
+
+__all__ = list(_subpackages)
+
+def __getattr__(name):
+    """Imports an external interface subpackage on first access."""
+    if name in _subpackages:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+  
\ No newline at end of file
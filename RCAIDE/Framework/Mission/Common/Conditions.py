@@ -11,6 +11,12 @@ from RCAIDE.Framework.Core                    import Data
 
 # python imports 
 import numpy as np 
+from copy import deepcopy
+
+objgetattrib = object.__getattribute__
+
+# compiled templates, one default tree per class
+_templates = {}
 # ----------------------------------------------------------------------------------------------------------------------
 #  Conditions
 # ----------------------------------------------------------------------------------------------------------------------
@@ -27,6 +33,75 @@ class Conditions(Data):
     """ 
 
     _size = 1
+
+    @classmethod
+    def template(cls,rows=None):
+        """ Returns a new instance of the class cloned from a compiled template. The default tree of the class is built
+            once and compiled into a flat list of copy operations, later calls replay it without running the
+            __defaults__ of every nested Conditions. If rows is given the arrays of the clone are preallocated to that
+            number of rows, as if expand_rows(rows) had been called on a new instance.
+        
+            Assumptions:
+            The defaults of the class do not change after the first call
+    
+            Source:
+            N/A
+    
+            Inputs:
+            rows   [int]
+    
+            Outputs:
+            Conditions
+    
+            Properties Used:
+            None
+        """
+        compiled = _templates.get(cls)
+        if compiled is None:
+            template = cls()
+            program  = []
+            template.compile_rows(program,-1,None)
+            compiled = _templates[cls] = (template,program)
+        
+        template, program = compiled
+        if rows is None:
+            return _clone(template)
+        
+        return _run_program(program,rows)
+    
+    def compile_rows(self,program,parent,key):
+        """ Appends the operations that copy the conditions with their arrays sized to a number of rows to a template
+            program. Follows the rules of expand_rows.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            program [list]
+            parent  [int]
+            key     [str]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        index = len(program)
+        program.append((parent,key,_NODE,(type(self),dict(objgetattrib(self,'__dict__')))))
+        
+        for k,v in dict.items(self):
+            if isinstance(v,Conditions):
+                v.compile_rows(program,index,k)
+            elif isinstance(v,expanded_array):
+                program.append(_fill_operation(index,k,v(),v._adjustment))
+            elif isinstance(v,np.ndarray) and v.ndim == 2 and v.shape[0]<=1:
+                program.append(_fill_operation(index,k,v,0))
+            else:
+                program.append((index,k,_COPY,v))
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
@@ -269,6 +344,105 @@ class expanded_array(Data):
         
         self._array = np.resize(other,[1,1])
         
-        return self    
+        return self
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Template cloning
+# ----------------------------------------------------------------------------------------------------------------------
+_atoms = (str, int, float, bool, complex, type(None), type)
+
+# template program operations
+_NODE  = 'node'
+_ZEROS = 'zeros'
+_FILL  = 'fill'
+_COPY  = 'copy'
+
+def _new_node(node):
+    """ Creates an empty Data node of the same class and attributes without running its __defaults__
+    
+        Assumptions:
+        None
+        
+        Source:
+        None   
+    """
+    clone = dict.__new__(type(node))
+    objgetattrib(clone,'__dict__').update(objgetattrib(node,'__dict__'))
+    return clone
+
+def _clone(value):
+    """ Copies a value of a template, Data nodes are rebuilt without running their __defaults__
+    
+        Assumptions:
+        None
+        
+        Source:
+        None   
+    """
+    if isinstance(value,_atoms):
+        return value
+    elif isinstance(value,np.ndarray):
+        return value.copy()
+    elif isinstance(value,Data):
+        clone = _new_node(value)
+        for k,v in dict.items(value):
+            dict.__setitem__(clone,k,_clone(v))
+        return clone
+    return deepcopy(value)
+
+def _fill_operation(parent,key,value,adjustment):
+    """ Template program operation that preallocates an array of the rows of value, short of adjustment rows
+    
+        Assumptions:
+        None
+        
+        Source:
+        None   
+    """
+    if value.shape[0] == 1 and not np.any(value):
+        return (parent,key,_ZEROS,(value.shape[1:],value.dtype,adjustment))
+    return (parent,key,_FILL,(value,adjustment))
+
+def _run_program(program,rows):
+    """ Replays a template program for the given number of rows and returns the root of the clone
+    
+        Assumptions:
+        None
+        
+        Source:
+        None   
+    """
+    values = [None]*len(program)
+    for i,(parent,key,operation,payload) in enumerate(program):
+        if operation is _ZEROS:
+            shape, dtype, adjustment = payload
+            value = np.zeros((rows-adjustment,) + shape,dtype=dtype)
+        elif operation is _NODE:
+            value = dict.__new__(payload[0])
+            attributes = objgetattrib(value,'__dict__')
+            attributes.update(payload[1])
+            attributes['_size'] = rows
+        elif operation is _FILL:
+            value = _fill_rows(payload[0],rows-payload[1])
+        else:
+            value = _clone(payload)
+        values[i] = value
+        if parent >= 0:
+            dict.__setitem__(values[parent],key,value)
+            
+    return values[0]
+
+def _fill_rows(value,rows):
+    """ Preallocates an array of the given number of rows filled with the rows of value, as np.resize
+    
+        Assumptions:
+        None
         
-    
\ No newline at end of file
+        Source:
+        None   
+    """
+    if value.shape[0] == 1:
+        array      = np.empty((rows,) + value.shape[1:],dtype=value.dtype)
+        array[...] = value
+        return array
+    return np.resize(value,[rows,value.shape[1]])
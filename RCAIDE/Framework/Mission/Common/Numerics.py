@@ -55,6 +55,9 @@ class Numerics(Conditions):
         self.solver.print_output              = True
         self.solver.max_evaluations           = 200
         self.solver.step_size                 = 1E-8    
+        self.solver.evaluations               = 0 
+        self.solver.iterations                = 0 
+        self.solver.warm_start                = None 
         
         self.dimensionless                    = Conditions()
         self.dimensionless.control_points     = np.empty([0,0])
@@ -9,7 +9,7 @@
 
 # RCAIDE imports
 from RCAIDE.Framework.Core import DataOrdered
-from .Conditions           import Conditions
+from .Conditions           import Conditions, _fill_operation, _NODE, _COPY, objgetattrib
 from .Unknowns             import Unknowns
 from .Residuals            import Residuals
 from .Numerics             import Numerics   
@@ -96,8 +96,43 @@ class State(Conditions):
             elif rank == 2:
                 self[k] = np.resize(v,[rows,v.shape[1]])
             #: if type
-        #: for each key,value        
-        
+        #: for each key,value
+
+    def compile_rows(self,program,parent,key):
+        """ Appends the operations that copy the state with its arrays sized to a number of rows to a template
+            program. Follows the rules of expand_rows.
+
+            Assumptions:
+            Doesn't expand initials or numerics
+
+            Source:
+            N/A
+
+            Inputs:
+            program [list]
+            parent  [int]
+            key     [str]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        index = len(program)
+        program.append((parent,key,_NODE,(type(self),dict(objgetattrib(self,'__dict__')))))
+
+        for k,v in dict.items(self):
+            # don't expand initials or numerics
+            if k in ('initials','numerics'):
+                program.append((index,k,_COPY,v))
+            elif isinstance(v,Conditions):
+                v.compile_rows(program,index,k)
+            elif isinstance(v,np.ndarray) and v.ndim == 2:
+                program.append(_fill_operation(index,k,v,0))
+            else:
+                program.append((index,k,_COPY,v))
+
 # ----------------------------------------------------------------------------------------------------------------------
 # Container
 # ----------------------------------------------------------------------------------------------------------------------        
@@ -124,10 +159,11 @@ class Container(State):
         self.segments = DataOrdered()
         
     def merged(self):
-        """ Combines the states of multiple segments
+        """ Combines the states of multiple segments. The arrays of every segment are gathered first and stacked
+            with one concatenation each, so the cost grows linearly with the number of segments.
     
             Assumptions:
-            None
+            The segments share the layout of the first segment
     
             Source:
             N/A
@@ -143,24 +179,25 @@ class Container(State):
         """              
         
         state_out = State()
+        states    = list(self.segments.values())
+        if len(states) == 0:
+            return state_out
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        for key in ['unknowns','conditions','residuals']:
+            state_out[key] = stack_arrays([sub_state[key] for sub_state in states],type(state_out[key])())
             
         return state_out
         
 State.Container = Container 
         
 # ----------------------------------------------------------------------------------------------------------------------
-# append_array
+# stack_arrays
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-def append_array(A,B=None):
-    """ A stacking operation used by merged to put together data structures
+def stack_arrays(data_list,data_out):
+    """ A stacking operation used by merged to put together data structures. The arrays under each key are stacked
+        in the order of the list, keys missing from a data structure are skipped and other values are taken from the
+        first data structure.
 
         Assumptions:
         None
@@ -169,16 +206,22 @@ def append_array(A,B=None):
         N/A
 
         Inputs:
-        A [array]
-        B [array]
+        data_list [list]
+        data_out  [Data]
 
         Outputs:
-        array
+        data_out  [Data]
 
         Properties Used:
         None
     """       
-    if isinstance(A,np.ndarray) and isinstance(B,np.ndarray):
-        return np.vstack([A,B])
-    else:
-        return None
\ No newline at end of file
+    first = data_list[0]
+    for k,v in first.items():
+        values = [data[k] for data in data_list if isinstance(data,dict) and k in data]
+        if isinstance(v,dict):
+            data_out[k] = stack_arrays(values,Conditions())
+        elif isinstance(v,np.ndarray):
+            data_out[k] = np.vstack([value for value in values if isinstance(value,np.ndarray)])
+        else:
+            data_out[k] = v
+    return data_out
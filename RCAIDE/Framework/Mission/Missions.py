@@ -7,7 +7,22 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports        
-from RCAIDE.Framework.Core import Container 
+from RCAIDE.Framework.Core                     import Container, Data
+from RCAIDE.Framework.Core.Data                import t_table
+from RCAIDE.Library.Mission.Common.Pre_Process import find_surrogate_analyses, train_surrogates, surrogate_training_key, \
+                                                      export_surrogate_training, restore_surrogate_training
+
+# python imports
+from concurrent.futures import ProcessPoolExecutor
+from copy               import deepcopy
+import traceback
+import hashlib
+import pickle
+import time
+import os
+
+# surrogate training data of the analyses evaluated by this process, keyed on the training inputs
+_surrogate_cache = {}
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Mission
@@ -46,5 +61,211 @@ class Missions(Container):
         
         self.append(mission)
         return        
-    
-     
\ No newline at end of file
+
+    def append_vehicle_variants(self,mission_setup,vehicles):
+        """Builds one mission per vehicle variant and appends them to the container.
+
+            Assumptions:
+            mission_setup builds a complete mission, including its analyses, from a vehicle. The missions are
+            tagged with the mission and vehicle tags, duplicate tags are numbered.
+
+            Source:
+            N/A
+
+            Inputs:
+            mission_setup  - function returning a mission for a vehicle   [function]
+            vehicles       - vehicle variants                             [list]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        for vehicle in vehicles:
+            mission     = mission_setup(vehicle)
+            tag         = mission.tag + '_' + vehicle.tag
+            mission.tag = tag
+            number      = 1
+            while mission.tag.translate(t_table) in self:
+                number     += 1
+                mission.tag = tag + '_' + str(number)
+            self.append_mission(mission)
+        return
+
+    def train_surrogates(self,number_of_workers=None):
+        """Trains the surrogates of the aerodynamic and stability analyses of all missions, in parallel in a
+           pool of processes.
+
+            Assumptions:
+            Each mission trains the analyses its pre-processing would initialize, analyses that are identical
+            across missions are trained once. The missions keep the training data and only build their
+            surrogates when they are evaluated.
+
+            Source:
+            N/A
+
+            Inputs:
+            number_of_workers  - number of processes, defaults to the number of CPUs. With a single worker
+                                 the surrogates are trained in this process                      [-]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        analyses = []
+        for mission in self.values():
+            if isinstance(mission,Data) and ('segments' in mission):
+                analyses.extend(find_surrogate_analyses(mission))
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+        train_surrogates(analyses,number_of_workers)
+        return
+
+    def evaluate_batch(self,number_of_workers=None):
+        """Evaluates all missions of the container, in parallel in a pool of processes.
+
+            Assumptions:
+            The missions are independent. Each mission is serialized and evaluated on a copy, so the missions of
+            the container are left untouched. Each worker keeps the surrogate training data of the aerodynamic
+            and stability analyses it has evaluated and reuses it for any later analysis with identical vehicle,
+            settings and training inputs. A mission that fails or does not converge is reported in its case
+            and does not stop the batch. Analyses that write to a run folder (e.g. AVL) should use a different
+            folder in each mission.
+
+            Source:
+            N/A
+
+            Inputs:
+            number_of_workers  - number of processes, defaults to the number of CPUs. With a single worker
+                                 the missions are evaluated in this process                      [-]
+
+            Outputs:
+            cases              - container of the cases in mission order, each with             [Container]
+                                 tag, results (evaluated mission), converged, error, traceback,
+                                 evaluation_time and surrogates_restored (number of analyses whose
+                                 training was reused from an earlier mission of the worker)
+
+            Properties Used:
+            None
+        """
+        missions = [mission for mission in self.values() if isinstance(mission,Data)]
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+        number_of_workers = max(1,min(number_of_workers,len(missions)))
+
+        # serialize the missions here so that a mission that cannot be sent to a worker fails on its own
+        payloads = []
+        for mission in missions:
+            try:
+                payloads.append(pickle.dumps(mission,protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception as error:
+                payloads.append(_failed_case(mission.tag,error))
+
+        outcomes = [None]*len(missions)
+        if number_of_workers == 1:
+            _initialize_worker()
+            for i,payload in enumerate(payloads):
+                outcomes[i] = payload if isinstance(payload,Data) else _evaluate_case(payload)
+        else:
+            with ProcessPoolExecutor(max_workers=number_of_workers,initializer=_initialize_worker) as pool:
+                futures = [None if isinstance(payload,Data) else pool.submit(_evaluate_case,payload) for payload in payloads]
+                for i,future in enumerate(futures):
+                    if future is None:
+                        outcomes[i] = payloads[i]
+                        continue
+                    try:
+                        outcomes[i] = future.result()
+                    except Exception as error:
+                        # the worker process died or the results could not be returned
+                        outcomes[i] = _failed_case(missions[i].tag,error)
+
+        cases = Container()
+        for outcome in outcomes:
+            if isinstance(outcome,bytes):
+                outcome = pickle.loads(outcome)
+            cases.append(outcome)
+        return cases
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Batch Workers
+# ----------------------------------------------------------------------------------------------------------------------
+def _initialize_worker():
+    """Clears the surrogate training cache at the start of a batch."""
+    _surrogate_cache.clear()
+    return
+
+def _evaluate_case(payload):
+    """Evaluates one serialized mission and returns its serialized case."""
+    ti      = time.time()
+    mission = pickle.loads(payload)
+    case    = Data(tag = mission.tag, results = None, converged = False, error = None, traceback = None, evaluation_time = 0.,
+                   surrogates_restored = 0)
+
+    training_keys, case.surrogates_restored = _restore_surrogate_training(mission)
+    try:
+        case.results   = mission.evaluate()
+        unconverged    = [tag for tag,segment in mission.segments.items() if segment.state.numerics.solver.converged == False]
+        case.converged = len(unconverged) == 0
+        if not case.converged:
+            case.error = 'Segments did not converge: ' + ', '.join(unconverged)
+        _store_surrogate_training(training_keys)
+    except Exception as error:
+        case.results   = None
+        case.error     = repr(error)
+        case.traceback = traceback.format_exc()
+    case.evaluation_time = time.time() - ti
+
+    try:
+        return pickle.dumps(case,protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        return pickle.dumps(_failed_case(case.tag,error),protocol=pickle.HIGHEST_PROTOCOL)
+
+def _failed_case(tag,error):
+    """Returns the case of a mission that could not be evaluated."""
+    return Data(tag = tag, results = None, converged = False, error = repr(error),
+                traceback = ''.join(traceback.format_exception(type(error),error,error.__traceback__)), evaluation_time = 0.,
+                surrogates_restored = 0)
+
+def _surrogate_analyses(mission):
+    """Returns the unique aerodynamic and stability analyses of a mission that use surrogates."""
+    analyses = {}
+    for segment in mission.segments.values():
+        for tag in ['aerodynamics','stability']:
+            analysis = segment.analyses.get(tag,None)
+            if isinstance(analysis,Data) and ('training' in analysis) and analysis.settings.get('use_surrogate',False):
+                analyses[id(analysis)] = analysis
+    return list(analyses.values())
+
+def _restore_surrogate_training(mission):
+    """Attaches cached training data to the analyses of a mission before it is evaluated.
+
+    Returns the analyses that were not found in the cache, with their key and a digest of their training data,
+    and the number of analyses restored from the cache.
+    """
+    training_keys = []
+    restored      = 0
+    for analysis in _surrogate_analyses(mission):
+        try:
+            key = surrogate_training_key(analysis)
+        except Exception:
+            continue
+        if key in _surrogate_cache:
+            restore_surrogate_training(analysis,_surrogate_cache[key])
+            restored += 1
+        else:
+            training_keys.append((analysis,key,_digest(analysis.training)))
+    return training_keys, restored
+
+def _store_surrogate_training(training_keys):
+    """Caches the training data of the analyses that were trained while evaluating a mission."""
+    for analysis,key,training_digest in training_keys:
+        if _digest(analysis.training) != training_digest:
+            _surrogate_cache[key] = deepcopy(export_surrogate_training(analysis))
+    return
+
+def _digest(data):
+    """Returns a digest of the serialized data."""
+    return hashlib.sha1(pickle.dumps(data,protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
@@ -67,7 +67,7 @@ class Evaluate(Segment):
         self.hybrid_power_split_ratio             = None
         self.battery_fuel_cell_power_split_ratio  = None
         self.trim_lift_coefficient                = None
-        self.state.conditions.update(Results())       
+        self.state.conditions.update(Results.template())       
         
         # ---------------------------------------------------------------
         # Define Flight Controls and Residuals 
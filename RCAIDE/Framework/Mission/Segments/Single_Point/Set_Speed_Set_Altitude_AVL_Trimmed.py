@@ -72,7 +72,7 @@ class Set_Speed_Set_Altitude_AVL_Trimmed(Segment):
         self.state.numerics.number_of_control_points = 1
         self.hybrid_power_split_ratio                = None
         self.battery_fuel_cell_power_split_ratio     = None 
-        self.state.conditions.update(Results())
+        self.state.conditions.update(Results.template())
         
         # ---------------------------------------------------------------
         # Define Flight Controls and Residuals 
@@ -76,7 +76,7 @@ class Untrimmed(Segment):
         self.yaw_rate                                = 0.  
         self.state.numerics.number_of_control_points = 2     
         self.trim_lift_coefficient                   = None
-        self.state.conditions.update(Results())
+        self.state.conditions.update(Results.template())
         
         # ---------------------------------------------------------------
         # Define Flight Controls and Residuals 
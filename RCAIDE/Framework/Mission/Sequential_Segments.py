@@ -8,8 +8,8 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports    
 from RCAIDE.Library.Mission.Common.Segments    import sequential_segments
-from RCAIDE.Library.Mission.Common.Pre_Process import aerodynamics,stability, energy,emissions,mass_properties, set_residuals_and_unknowns
-from RCAIDE.Framework.Core                     import Container as ContainerBase
+from RCAIDE.Library.Mission.Common.Pre_Process import aerodynamics,stability, energy,emissions,mass_properties, set_residuals_and_unknowns, surrogates
+from RCAIDE.Framework.Core                     import Container as ContainerBase, Data
 from RCAIDE.Framework.Analyses                 import Process 
 from . import Segments
 
@@ -47,9 +47,17 @@ class Sequential_Segments(Segments.Segment.Container):
 
         self.tag = 'mission'
         
+        #   Settings: processes training the aerodynamic and stability surrogates concurrently at setup
+        self.settings.number_of_surrogate_workers              = 1
+        
+        #   Settings: noise and emissions of a segment computed in the background while the next segment is solved
+        self.settings.pipeline_post_processing                 = False
+        self.settings.pipelined_post_processes                 = ['noise','emissions']
+        
         #   Initialize   
         self.process.initialize                                = Process() 
         self.process.initialize.mass_properties                = mass_properties 
+        self.process.initialize.surrogates                     = surrogates
         self.process.initialize.aero                           = aerodynamics
         self.process.initialize.stability                      = stability
         self.process.initialize.energy                         = energy
@@ -61,9 +69,42 @@ class Sequential_Segments(Segments.Segment.Container):
          
         #   Iterate     
         del self.process.iterate  
+        
+        #   Warm Start: converged unknowns of each segment, used as initial guess of the next evaluation
+        self.warm_start                          = Data()
+        self.warm_start.active                   = False
+        self.warm_start.segments                 = Data()
+        self.warm_start.report                   = Data()
+        self.warm_start.report.segments          = Data()
+        self.warm_start.report.evaluations_saved = 0
+        self.warm_start.report.iterations_saved  = 0
 
         return  
 
+    def clear_warm_start(self):
+        """ Removes the stored solves and the report of the warm start
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        self.warm_start.segments                 = Data()
+        self.warm_start.report.segments          = Data()
+        self.warm_start.report.evaluations_saved = 0
+        self.warm_start.report.iterations_saved  = 0
+        return
+
                         
     def evaluate(self,state=None):
         """ This executes the entire process
@@ -121,7 +162,11 @@ class Container(ContainerBase):
             Properties Used:
             None
         """
-        pass
+        results = ContainerBase()
+        for mission in self.values():
+            if isinstance(mission,Sequential_Segments):
+                results.append(mission.evaluate())
+        return results
 
 # Link container
 Sequential_Segments.Container = Container
\ No newline at end of file
@@ -0,0 +1,342 @@
+# RCAIDE/Framework/Optimization/Common/Evaluation_Cache.py
+#
+# Created:  Oct 2026
+
+# -----------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# --- -------------------------------------------------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+from copy import deepcopy
+import numpy as np
+import pickle
+import os
+
+# -----------------------------------------------------------------------------------------------------------------
+#  Evaluation Cache Class
+# --- -------------------------------------------------------------------------------------------------------------
+## @ingroupFramework-Optimization-Common
+class Evaluation_Cache(Data):
+    """Least recently used cache of the evaluations of a nexus. Each entry holds the results, the summary and the
+        objective and constraint values of the nexus, keyed on the design vector rounded to a number of significant
+        digits and on the fidelity level. The cache is disabled when it holds a single entry, the nexus then only
+        remembers its last inputs. The entries stored during an optimization are appended to the cache file one
+        by one, the file is only rewritten when it holds more than twice the maximum number of entries.
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag                = 'evaluation_cache'
+        self.maximum_size       = 1
+        self.significant_digits = 12
+        self.file               = None
+        self.hits               = 0
+        self.misses             = 0
+        self.entries            = Data()
+        self.loaded             = False
+        self.file_records       = 0
+
+    def key(self,nexus):
+        """Key of the current inputs and fidelity level of the nexus
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus        [Nexus()]
+
+            Outputs:
+            key          [tuple]
+
+            Properties Used:
+            self.significant_digits
+        """
+        values = np.asarray(nexus.optimization_problem.inputs[:,1],dtype=float)
+        digits = self.significant_digits - 1
+        return tuple(float('%.*e' % (digits,value)) for value in values) + (nexus.fidelity_level,)
+
+    def restore(self,nexus):
+        """Restores the evaluation of the current inputs of the nexus if it is cached
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus        [Nexus()]
+
+            Outputs:
+            hit          [bool]
+
+            Properties Used:
+            self.maximum_size
+        """
+        if self.maximum_size <= 1:
+            return False
+        self.load()
+
+        key = self.key(nexus)
+        if key not in self.entries:
+            return False
+
+        self.entries[key] = self.entries.pop(key)
+        entry         = deepcopy(self.entries[key])
+        nexus.results = entry.results
+        nexus.summary = entry.summary
+        for path, value in entry.outputs.items():
+            nexus.deep_set(path,value)
+
+        nexus.last_inputs   = deepcopy(nexus.optimization_problem.inputs)
+        nexus.last_fidelity = nexus.fidelity_level
+        self.hits += 1
+
+        return True
+
+    def store(self,nexus):
+        """Stores the evaluation of the current inputs of the nexus, dropping the least recently used entries
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus        [Nexus()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.maximum_size
+            self.file
+        """
+        if self.maximum_size <= 1:
+            return
+        self.load()
+
+        entry         = Data()
+        entry.results = deepcopy(nexus.results)
+        entry.summary = deepcopy(nexus.summary)
+        entry.outputs = Data()
+        for path in output_paths(nexus):
+            entry.outputs[path] = deepcopy(nexus.deep_get(path))
+
+        key = self.key(nexus)
+        self.entries.pop(key,None)
+        self.entries[key] = entry
+        while len(self.entries) > self.maximum_size:
+            del self.entries[next(iter(self.entries.keys()))]
+
+        self.append(key,entry)
+
+        return
+
+    def load(self):
+        """Loads the entries saved in the cache file, once
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.file
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+
+        if self.file is None or not os.path.isfile(self.file):
+            return
+
+        # records are in the order they were stored, a later record of a key replaces the earlier ones
+        entries   = Data()
+        truncated = False
+        file_size = os.path.getsize(self.file)
+        with open(self.file,'rb') as file:
+            while file.tell() < file_size:
+                try:
+                    key, entry = pickle.load(file)
+                except (EOFError,pickle.UnpicklingError):
+                    # last record of an interrupted optimization
+                    truncated = True
+                    break
+                entries.pop(key,None)
+                entries[key] = entry
+                self.file_records += 1
+
+        for key, entry in entries.items():
+            if key not in self.entries:
+                self.entries[key] = entry
+        while len(self.entries) > self.maximum_size:
+            del self.entries[next(iter(self.entries.keys()))]
+
+        if truncated:
+            self.save()
+
+        return
+
+    def append(self,key,entry):
+        """Appends an entry to the cache file, the file is rewritten with the current entries once it holds more
+            than twice the maximum number of entries
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key          [tuple]
+            entry        [Data()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.file
+            self.maximum_size
+        """
+        if self.file is None:
+            return
+
+        if self.file_records >= 2*self.maximum_size:
+            self.save()
+            return
+
+        with open(self.file,'ab') as file:
+            pickle.dump((key,entry),file,protocol=pickle.HIGHEST_PROTOCOL)
+        self.file_records += 1
+
+        return
+
+    def save(self):
+        """Saves the entries to the cache file, one record per entry, replacing the file at once so that an
+            interrupted optimization leaves a readable cache
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.file
+        """
+        if self.file is None:
+            return
+
+        temporary_file = self.file + '.' + str(os.getpid()) + '.tmp'
+        with open(temporary_file,'wb') as file:
+            for key, entry in self.entries.items():
+                pickle.dump((key,entry),file,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file,self.file)
+        self.file_records = len(self.entries)
+
+        return
+
+    def clear(self):
+        """Removes the entries and statistics of the cache, the cache file is kept
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.entries      = Data()
+        self.hits         = 0
+        self.misses       = 0
+        self.loaded       = False
+        self.file_records = 0
+
+        return
+
+    def statistics(self):
+        """Hits, misses, hit rate and number of entries of the cache
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            statistics   [Data()]
+
+            Properties Used:
+            None
+        """
+        statistics          = Data()
+        statistics.hits     = self.hits
+        statistics.misses   = self.misses
+        statistics.hit_rate = self.hits / max(1,self.hits + self.misses)
+        statistics.entries  = len(self.entries)
+
+        return statistics
+
+# -----------------------------------------------------------------------------------------------------------------
+#  Output Paths
+# --- -------------------------------------------------------------------------------------------------------------
+def output_paths(nexus):
+    """Paths of the objective and constraint values of the nexus that are not in its results or summary"""
+
+    problem = nexus.optimization_problem
+    names   = list(np.array(problem.objective)[:,0])
+    if problem.constraints is not None and len(problem.constraints):
+        names += list(np.array(problem.constraints)[:,0])
+
+    paths = []
+    for name, path in problem.aliases:
+        if name in names and isinstance(path,str) and '*' not in path and path not in paths:
+            if path.split('.')[0] not in ('results','summary'):
+                paths.append(path)
+
+    return paths
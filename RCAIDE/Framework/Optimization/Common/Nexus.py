@@ -8,8 +8,11 @@ import RCAIDE
 from RCAIDE.Framework.Core import Data,  Units
 from RCAIDE.Framework.Analyses import Process
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+import pickle
 
 from . import helper_functions as help_fun
+from .Evaluation_Cache import Evaluation_Cache
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------- 
@@ -58,6 +61,8 @@ class Nexus(Data):
         self.evaluation_count       = 0
         self.force_evaluate         = False
         self.hard_bounded_inputs    = False
+        self.number_of_workers      = 1
+        self.evaluation_cache       = Evaluation_Cache()
 
         opt_prob = self.optimization_problem
         opt_prob.objective     = None
@@ -67,7 +72,8 @@ class Nexus(Data):
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in RCAIDE
-            If the last time you ran this the inputs were the same, a cache is used.
+            If the last time you ran this the inputs were the same, a cache is used. Evaluations of earlier
+            inputs are restored from the evaluation cache when it holds more than one entry.
     
             Assumptions:
             None
@@ -87,13 +93,19 @@ class Nexus(Data):
         
         self.unpack_inputs(x)
         
+        cache = self.evaluation_cache
+        
         # Check if last call was the same
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
            and self.last_fidelity == self.fidelity_level \
            and self.force_evaluate == False:
+            cache.hits += 1
+        elif self.force_evaluate == False and cache.restore(self):
             pass
         else:
+            cache.misses += 1
             self._really_evaluate()
+            cache.store(self)
         
     
     def _really_evaluate(self):
@@ -343,6 +355,7 @@ class Nexus(Data):
 
     def finite_difference(self,x,diff_interval=1e-8):
         """Finite difference gradients and jacobians of the problem.
+            With more than one worker the perturbed inputs are evaluated in parallel.
     
             Assumptions:
             N/A
@@ -359,7 +372,7 @@ class Nexus(Data):
             jac_con            [array]
     
             Properties Used:
-            None
+            self.number_of_workers
         """           
         
         obj = self.objective(x)
@@ -376,12 +389,23 @@ class Nexus(Data):
         
         con2 = (con*np.ones_like(jac_con))
         
-        for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
+        if self.number_of_workers > 1:
+            perturbed_x = []
+            for ii in range(0,inplen):
+                newx     = np.asarray(x)*1.0
+                newx[ii] = newx[ii] + diff_interval
+                perturbed_x.append(newx)
             
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+            for ii, (obj_ii, con_ii) in enumerate(self.parallel_evaluate(perturbed_x)):
+                grad_obj[ii]  = obj_ii
+                jac_con[ii,:] = con_ii
+        else:
+            for ii in range(0,inplen):
+                newx     = np.asarray(x)*1.0
+                newx[ii] = newx[ii] + diff_interval
+                
+                grad_obj[ii]  = self.objective(newx)
+                jac_con[ii,:] = self.all_constraints(newx)
         
         grad_obj = (grad_obj - obj)/diff_interval
         
@@ -393,6 +417,118 @@ class Nexus(Data):
         return grad_obj, jac_con
     
     
+    def open_worker_pool(self):
+        """Starts a pool of worker processes that is reused by parallel_evaluate until close_worker_pool
+            is called, so that the nexus is only pickled and sent to the workers once per optimization.
+            Nothing is done if the problem has a single worker or the pool is already open.
+    
+            Assumptions:
+            The nexus is not changed while the pool is open, other than its inputs and fidelity level.
+            The workers keep the evaluation caches they fill between calls.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.number_of_workers
+        """  
+        
+        if self.number_of_workers > 1 and id(self) not in _worker_pools:
+            _worker_pools[id(self)] = self._start_worker_pool(self.number_of_workers)
+            
+        return
+    
+    
+    def close_worker_pool(self):
+        """Shuts down the pool of worker processes started by open_worker_pool.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """  
+        
+        pool = _worker_pools.pop(id(self),None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+            
+        return
+    
+    
+    def parallel_evaluate(self,xs,fidelity_levels=None):
+        """Evaluates the objective and constraints at several inputs in a pool of worker processes.
+            Each worker holds its own deep copy of the nexus. If fidelity levels are given, each input is
+            evaluated at its own fidelity level, otherwise at the fidelity level of the nexus. The pool
+            started by open_worker_pool is used if it is open, otherwise a pool is started for this call.
+    
+            Assumptions:
+            The evaluation of the problem does not depend on the inputs evaluated before it, so that the
+            results are the same as those of evaluating the inputs one after the other. The procedure
+            and the data of the nexus can be pickled.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            xs                 [list of vectors]
+            fidelity_levels    [list of int]
+    
+            Outputs:
+            outputs            [list of (scaled_objective, scaled_constraints)]
+    
+            Properties Used:
+            self.number_of_workers
+            self.fidelity_level
+        """  
+        
+        # the workers of an open pool hold the fidelity level of the nexus when the pool was started
+        if fidelity_levels is None:
+            fidelity_levels = [self.fidelity_level]*len(xs)
+        
+        pool = _worker_pools.get(id(self))
+        if pool is not None:
+            outputs = list(pool.map(_evaluate_fidelity_worker,xs,fidelity_levels))
+        else:
+            pool = self._start_worker_pool(max(1,min(self.number_of_workers,len(xs))))
+            try:
+                outputs = list(pool.map(_evaluate_fidelity_worker,xs,fidelity_levels))
+            finally:
+                pool.shutdown(wait=True)
+            
+        self.evaluation_count += len(xs)
+        
+        return outputs
+    
+    
+    def _start_worker_pool(self,number_of_workers):
+        """Starts a pool of worker processes, each loading a copy of the nexus with an empty evaluation cache."""
+        
+        entries = self.evaluation_cache.entries
+        self.evaluation_cache.entries = type(entries)()
+        try:
+            payload = pickle.dumps(self,protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            self.evaluation_cache.entries = entries
+        
+        return ProcessPoolExecutor(max_workers=number_of_workers,initializer=_initialize_worker,initargs=(payload,))
+        
+    
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
     
@@ -443,5 +579,30 @@ class Nexus(Data):
         print('\nConstraint Table:\n')
         print(const_table)
         
-        return inpu,const_table                             
-       
\ No newline at end of file
+        return inpu,const_table
+
+
+# ----------------------------------------------------------------------------------------------------------------- 
+#  Parallel Workers
+# --- ------------------------------------------------------------------------------------------------------------- 
+# pools opened by Nexus.open_worker_pool, by id of the nexus, kept out of the nexus so that it can be pickled
+_worker_pools = {}
+
+# copy of the nexus held by each worker process
+_worker_nexus = None
+
+def _initialize_worker(payload):
+    """Loads the copy of the nexus of a worker process."""
+    global _worker_nexus
+    _worker_nexus = pickle.loads(payload)
+    _worker_nexus.evaluation_cache.file = None
+    return
+
+def _evaluate_worker(x):
+    """Evaluates the objective and constraints of the worker nexus."""
+    return _worker_nexus.objective(x), _worker_nexus.all_constraints(x)
+
+def _evaluate_fidelity_worker(x,fidelity_level):
+    """Evaluates the objective and constraints of the worker nexus at a fidelity level."""
+    _worker_nexus.fidelity_level = fidelity_level
+    return _evaluate_worker(x)
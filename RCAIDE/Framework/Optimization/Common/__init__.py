@@ -9,4 +9,5 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
  
 from .Nexus                                                 import Nexus
+from .Evaluation_Cache                                      import Evaluation_Cache
 from .helper_functions                                      import * 
@@ -2,14 +2,22 @@
 # 
 
 """ RCAIDE Package Setup
+
+Optimizer packages pull in optional dependencies (scikit-learn, pyOpt) and are loaded lazily on first access.
 """
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from . import additive  
-from . import particle_swarm
-from . import pyopt  
-from . import scipy
-from . import trmm
\ No newline at end of file
+import importlib
+
+_subpackages = ('additive', 'particle_swarm', 'pyopt', 'scipy', 'trmm')
+
+__all__ = list(_subpackages)
+
+def __getattr__(name):
+    """Imports an optimizer package on first access."""
+    if name in _subpackages:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
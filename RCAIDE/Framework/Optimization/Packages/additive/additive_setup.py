@@ -18,11 +18,11 @@ try:
     import pyOpt.pyALPSO
 except:
     pass
-import sklearn
-from sklearn import gaussian_process
 from RCAIDE.Framework.Optimization.Common import helper_functions as help_fun
 from RCAIDE.Library.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
 from scipy.stats import norm
+from scipy.linalg import cholesky, cho_solve, solve_triangular
+from scipy.spatial.distance import cdist
 import os
 import sys
 from scipy.optimize import minimize
@@ -37,6 +37,7 @@ class Additive_Solver():
         # therefore are always available when running RCAIDE
         self.local_optimizer  = 'SLSQP'
         self.global_optimizer = 'SHGO'
+        self.sample_cache     = {}
         return
 
     
@@ -64,6 +65,26 @@ class Additive_Solver():
         (fOpt,xOpt)  [tuple]
     
         Properties Used:
+        problem.number_of_workers
+        """        
+        
+        # the pool of workers is started once and reused by every set of samples
+        problem.open_worker_pool()
+        try:
+            return self.solve_additive_corrections(problem,num_fidelity_levels,num_samples,max_iterations,
+                                                   tolerance,opt_type,num_starts,print_output)
+        finally:
+            problem.close_worker_pool()
+        
+        
+    def solve_additive_corrections(self,problem,num_fidelity_levels,num_samples,max_iterations,
+                                   tolerance,opt_type,num_starts,print_output):
+        """Runs the additive corrections of Additive_Solve, see Additive_Solve for the inputs and outputs.
+    
+        Assumptions:
+        N/A
+    
+        Source:
         N/A
         """        
         
@@ -95,29 +116,26 @@ class Additive_Solver():
         # Get initial set of samples
         x_samples = latin_hypercube_sampling(len(x),num_samples,bounds=(x_low_bound,x_up_bound),criterion='center')
         
-        # Initialize objective and constraint variables
-        f = np.zeros([num_fidelity_levels,num_samples])
-        g = np.zeros([num_fidelity_levels,num_samples,len(scaled_constraints)])
+        # Evaluate the objective and constraint variables of the samples at every fidelity level
+        self.sample_cache = {}
+        levels = range(1,num_fidelity_levels+1)
+        f, g   = self.evaluate_samples(problem,x_samples,levels,scaled_constraints)
         
-        for level in range(1,num_fidelity_levels+1):
-            problem.fidelity_level = level
-            for ii,x in enumerate(x_samples):
-                res = self.evaluate_model(problem,x,scaled_constraints)
-                f[level-1,ii]    = res[0]  # objective value
-                g[level-1,ii,:]  = res[1]  # constraints vector
+        # Additive correction surrogates, updated with the new samples of each iteration
+        f_additive_surrogate = Additive_Correction_Surrogate()
+        g_additive_surrogate = Additive_Correction_Surrogate()
         
         converged = False
         
         for kk in range(max_iterations):
-            # Build objective surrogate
+            # Update objective surrogate
+            n_fit  = f_additive_surrogate.number_of_samples
             f_diff = f[1,:] - f[0,:]
-            f_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
-            f_additive_surrogate = f_additive_surrogate_base.fit(x_samples, f_diff)     
+            f_additive_surrogate.add_samples(x_samples[n_fit:], f_diff[n_fit:])
             
-            # Build constraint surrogate
+            # Update constraint surrogate
             g_diff = g[1,:] - g[0,:]
-            g_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
-            g_additive_surrogate = g_additive_surrogate_base.fit(x_samples, g_diff)     
+            g_additive_surrogate.add_samples(x_samples[n_fit:], g_diff[n_fit:])
             
             # Optimize corrected model
             
@@ -197,14 +215,10 @@ class Additive_Solver():
             else:
             
                 # Add new samples and check objective and constraint values
-                f = np.hstack((f,np.zeros((num_fidelity_levels,1))))
-                g = np.hstack((g,np.zeros((num_fidelity_levels,1,len(con)))))
+                f_new, g_new = self.evaluate_samples(problem,[xOpt],levels,scaled_constraints)
+                f = np.hstack((f,f_new))
+                g = np.hstack((g,g_new))
                 x_samples = np.vstack((x_samples,xOpt))
-                for level in range(1,num_fidelity_levels+1):
-                    problem.fidelity_level = level
-                    res = self.evaluate_model(problem,xOpt,scaled_constraints)
-                    f[level-1][-1] = res[0]
-                    g[level-1][-1] = res[1]
                     
                 # History writing
                 f_out.write('Iteration: ' + str(kk+1)    + '\n')
@@ -219,8 +233,7 @@ class Additive_Solver():
             if kk == (max_iterations-1) or complete_flag == True: # Reached maximum number of iterations
                 f_diff = f[1,:] - f[0,:]
                 if opt_type == 'basic': # If basic setting f already has the expected optimum
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]
+                    fOpt = self.evaluate_samples(problem,[xOpt],[2],scaled_constraints)[0][0,0]
                 elif opt_type == 'MEI': # If MEI, find the optimum of the final surrogate
                 
                     min_ind = np.argmin(f[1])
@@ -243,8 +256,7 @@ class Additive_Solver():
                         fOpt = res['fun']
                         xOpt = res['x'] 
                     
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]               
+                    fOpt = self.evaluate_samples(problem,[xOpt],[2],scaled_constraints)[0][0,0]               
             
                     f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
                     f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
@@ -291,8 +303,7 @@ class Additive_Solver():
                     else:
                         raise NotImplementedError
                     
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]                      
+                    fOpt = self.evaluate_samples(problem,[xOpt],[2],scaled_constraints)[0][0,0]                      
                     
                     f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
                     f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
@@ -322,6 +333,59 @@ class Additive_Solver():
         return (FOpt,xOpt)
         
         
+    def evaluate_samples(self,problem,x_samples,levels,cons):
+        """Objective and constraint values of samples at several fidelity levels. Samples already evaluated
+        at a fidelity level are taken from the sample cache, the others are evaluated in parallel if the
+        problem has more than one worker.
+    
+        Assumptions:
+        The fidelity level of the problem is left at the last level
+    
+        Source:
+        N/A
+    
+        Inputs:
+        problem   [nexus()]
+        x_samples [array]
+        levels    [list of int]
+        cons      [array]
+        
+        Outputs:
+        f         [array]
+        g         [array]
+    
+        Properties Used:
+        problem.number_of_workers
+        """
+        keys    = [[(tuple(np.asarray(x,dtype=float)),level) for x in x_samples] for level in levels]
+        missing = []
+        for level_keys in keys:
+            for key in level_keys:
+                if key not in self.sample_cache and key not in missing:
+                    missing.append(key)
+        
+        if problem.number_of_workers > 1 and len(missing) > 1:
+            outputs = problem.parallel_evaluate([np.array(x) for x,level in missing],[level for x,level in missing])
+        else:
+            outputs = []
+            for x,level in missing:
+                problem.fidelity_level = level
+                outputs.append(self.evaluate_model(problem,np.array(x),cons))
+        
+        for key,res in zip(missing,outputs):
+            self.sample_cache[key] = res
+        problem.fidelity_level = levels[-1]
+        
+        f = np.zeros([len(levels),len(x_samples)])
+        g = np.zeros([len(levels),len(x_samples),len(cons)])
+        for ii,level_keys in enumerate(keys):
+            for jj,key in enumerate(level_keys):
+                res      = self.sample_cache[key]
+                f[ii,jj] = res[0]  # objective value
+                g[ii,jj] = res[1]  # constraints vector
+        
+        return f,g
+    
     def evaluate_model(self,problem,x,cons):
         """Solves the optimization problem to get the objective and constraints
     
@@ -683,4 +747,118 @@ class Additive_Solver():
         fOpt = outputs[0][0]
         xOpt = outputs[1]
         
-        return fOpt, xOpt
\ No newline at end of file
+        return fOpt, xOpt
+
+
+# ----------------------------------------------------------------------
+#  Additive Correction Surrogate
+# ----------------------------------------------------------------------
+class Additive_Correction_Surrogate():
+    """Gaussian process regression of the additive corrections. The kernel and the noise level are the fixed
+    defaults of sklearn.gaussian_process.GaussianProcessRegressor, so adding samples only extends the Cholesky
+    factor of the kernel matrix instead of refactoring it.
+
+    Assumptions:
+    Constant times squared exponential kernel of unit length scale, noise level of 1e-10, zero mean
+    
+    Source:
+    Rasmussen and Williams, Gaussian Processes for Machine Learning, 2006
+    """
+    def __init__(self):
+        self.alpha   = 1e-10
+        self.X_train = None
+        self.y_train = None
+        self.L       = None
+        self.weights = None
+        return
+    
+    @property
+    def number_of_samples(self):
+        if self.X_train is None:
+            return 0
+        return len(self.X_train)
+    
+    def kernel(self,X1,X2):
+        """Squared exponential kernel of unit length scale and variance"""
+        return np.exp(-0.5*cdist(X1,X2,'sqeuclidean'))
+    
+    def add_samples(self,X,y):
+        """Adds samples to the regression
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        X         [array]
+        y         [array]
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A    
+        """
+        X = np.atleast_2d(np.asarray(X,dtype=float))
+        y = np.asarray(y,dtype=float)
+        if len(X) == 0:
+            return
+        
+        K22 = self.kernel(X,X) + self.alpha*np.eye(len(X))
+        if self.X_train is None:
+            self.L       = cholesky(K22,lower=True)
+            self.X_train = X
+            self.y_train = y
+        else:
+            # extend the lower triangular factor with the rows of the new samples
+            n   = len(self.X_train)
+            B   = solve_triangular(self.L,self.kernel(self.X_train,X),lower=True)
+            L22 = cholesky(K22 - B.T @ B,lower=True)
+            L   = np.zeros((n+len(X),n+len(X)))
+            L[:n,:n] = self.L
+            L[n:,:n] = B.T
+            L[n:,n:] = L22
+            self.L       = L
+            self.X_train = np.vstack((self.X_train,X))
+            self.y_train = np.concatenate((self.y_train,y))
+        
+        self.weights = cho_solve((self.L,True),self.y_train)
+        return
+    
+    def predict(self,X,return_std=False):
+        """Predicts the additive correction and optionally its standard deviation
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        X          [array]
+        return_std [bool]
+        
+        Outputs:
+        y_mean     [array]
+        y_std      [array]
+    
+        Properties Used:
+        N/A    
+        """
+        X       = np.atleast_2d(X)
+        K_trans = self.kernel(X,self.X_train)
+        y_mean  = K_trans @ self.weights
+        if y_mean.ndim > 1 and y_mean.shape[1] == 1:
+            y_mean = y_mean[:,0]
+        if not return_std:
+            return y_mean
+        
+        V      = solve_triangular(self.L,K_trans.T,lower=True)
+        y_var  = 1. - np.einsum('ij,ij->j',V,V)
+        y_var  = np.maximum(y_var,0.)
+        y_std  = np.sqrt(y_var)
+        if self.y_train.ndim > 1 and self.y_train.shape[1] > 1:
+            y_std = np.repeat(y_std[:,None],self.y_train.shape[1],axis=1)
+        return y_mean, y_std
@@ -9,13 +9,23 @@
 # RCAIDE imports
 import numpy as np
 import scipy as sp
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import pickle
   
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, processes=1, batch_func=None, 
+        synchronous=None, asynchronous=False, seed=None):
     """
     This function perform a particle swarm optimization (PSO)
     
+    By default the particles are updated and evaluated one at a time and each particle sees the swarm's best
+    position found by the particles before it. In the synchronous mode the whole swarm is moved with array
+    operations and the particles of a generation are evaluated together, either in a pool of processes or by a
+    batch function. In the asynchronous mode the particles are evaluated in a pool of processes and each
+    particle is moved and resubmitted as soon as its result arrives, using the best swarm position known at
+    that time.
+    
     Source:
         Pyswarm: https://github.com/tisimst/pyswarm
           
@@ -39,6 +49,17 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        processes : The number of processes evaluating the particles, func and the constraints must
+                    be picklable if greater than 1 (Default: 1)                                                     [int]
+        batch_func: Returns the objective values and the 2-D array of inequality constraint values
+                    (or None) of all the particles of a generation from batch_func(x,*args,**kwargs),
+                    where each row of x is a particle. Replaces func and the constraints (Default: None)          [function]
+        synchronous : If True, the swarm is updated and evaluated one generation at a time
+                    (Default: True if processes is greater than 1 or batch_func is given)                         [boolean]
+        asynchronous: If True, the particles are evaluated in a pool of processes and updated as
+                    their results arrive, the search is then not reproducible (Default: False)                     [boolean]
+        seed      : Seed of the random number generator, the global numpy generator is used if None
+                    (Default: None)                                                                                 [int]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -88,30 +109,35 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     vhigh = np.abs(ub - lb)
     vlow = -vhigh
     
+    # Random number generator ##################################################
+    if seed is None:
+        rng = np.random
+    else:
+        rng = np.random.RandomState(seed)
+        
     # Check for constraint function(s) #########################################
     obj = lambda x: func(x, *args, **kwargs)
-    if f_ieqcons is None:
-        if not len(ieqcons):
-            if debug:
-                print('No constraints given.')
-            cons = lambda x: np.array([0])
-        else:
-            if debug:
-                print('Converting ieqcons to a single constraint function')
-            cons = lambda x: np.array([y(x, *args, **kwargs) for y in ieqcons])
-    else:
-        if debug:
-            print('Single constraint function given in f_ieqcons')
-        cons = lambda x: np.array(f_ieqcons(x, *args, **kwargs))
+    cons = constraint_function(ieqcons, f_ieqcons, args, kwargs, debug)
         
     def is_feasible(x):
         check = np.all(cons(x)>=0)
         return check
+    
+    # Evaluate a whole generation at once ######################################
+    if synchronous is None:
+        synchronous = processes > 1 or batch_func is not None
+    if asynchronous:
+        assert batch_func is None, 'The asynchronous mode evaluates the particles one at a time'
+        return asynchronous_swarm(func, lb, ub, ieqcons, f_ieqcons, args, kwargs, swarmsize, omega, phip, phig,
+                                  maxiter, minstep, minfunc, debug, processes, rng)
+    elif synchronous:
+        return synchronous_swarm(func, lb, ub, ieqcons, f_ieqcons, args, kwargs, swarmsize, omega, phip, phig,
+                                 maxiter, minstep, minfunc, debug, processes, batch_func, rng)
         
     # Initialize the particle swarm ############################################
     S = swarmsize
     D = len(lb)  # the number of dimensions each particle has
-    x = np.random.rand(S, D)  # particle positions
+    x = rng.rand(S, D)  # particle positions
     v = np.zeros_like(x)  # particle velocities
     p = np.zeros_like(x)  # best particle positions
     fp = np.zeros(S)  # best particle function values
@@ -140,13 +166,13 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
             g = p[i, :].copy()
        
         # Initialize the particle's velocity
-        v[i, :] = vlow + np.random.rand(D)*(vhigh - vlow)
+        v[i, :] = vlow + rng.rand(D)*(vhigh - vlow)
        
     # Iterate until termination criterion met ##################################
     it = 1
     while it<=maxiter:
-        rp = np.random.uniform(size=(S, D))
-        rg = np.random.uniform(size=(S, D))
+        rp = rng.uniform(size=(S, D))
+        rg = rng.uniform(size=(S, D))
         for i in range(S):
 
             # Update the particle's velocity
@@ -195,3 +221,247 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         print("However, the optimization couldn't find a feasible design. Sorry")
     return g, fg
 
+def synchronous_swarm(func, lb, ub, ieqcons, f_ieqcons, args, kwargs, S, omega, phip, phig, maxiter,
+                      minstep, minfunc, debug, processes, batch_func, rng):
+    """
+    Particle swarm optimization that moves the whole swarm with array operations and evaluates the particles
+    of each generation together. The inputs and outputs are those of particle_swarm_optimization.
+    
+    Source:
+        Pyswarm: https://github.com/tisimst/pyswarm
+    """
+    
+    D = len(lb)
+    vhigh = np.abs(ub - lb)
+    vlow = -vhigh
+    
+    pool = None
+    if batch_func is None and processes > 1:
+        pool = swarm_pool(func, ieqcons, f_ieqcons, args, kwargs, processes)
+        evaluate = lambda x: list(pool.map(_evaluate_particle, x))
+    elif batch_func is None:
+        evaluate_particle = particle_evaluation(func, ieqcons, f_ieqcons, args, kwargs)
+        evaluate = lambda x: [evaluate_particle(x_i) for x_i in x]
+    else:
+        evaluate = None
+        
+    def evaluate_swarm(x):
+        if evaluate is None:
+            f, c = batch_func(x, *args, **kwargs)
+            f = np.reshape(np.asarray(f, dtype=float), (S,))
+            if c is None:
+                feasible = np.ones(S, dtype=bool)
+            else:
+                feasible = np.all(np.reshape(np.asarray(c), (S, -1))>=0, axis=1)
+            return f, feasible, ()
+        results = evaluate(x)
+        f = np.array([np.ravel(result[0])[0] for result in results], dtype=float)
+        feasible = np.array([result[1] for result in results], dtype=bool)
+        return f, feasible, np.shape(results[0][0])
+    
+    try:
+        # Initialize the particle swarm ########################################
+        x = lb + rng.rand(S, D)*(ub - lb)
+        v = vlow + rng.rand(S, D)*(vhigh - vlow)
+        p = x.copy()
+        fp, feasible, shape = evaluate_swarm(x)
+        
+        # At the start, there may not be any feasible starting point, so just
+        # give it a temporary "best" point since it's likely to change
+        g = p[0, :].copy()
+        fg = 1e100
+        if np.any(feasible):
+            i_min = np.flatnonzero(feasible)[np.argmin(fp[feasible])]
+            if fp[i_min]<fg:
+                g = p[i_min, :].copy()
+                fg = fp[i_min]
+        
+        # Iterate until termination criterion met ##############################
+        it = 1
+        while it<=maxiter:
+            rp = rng.uniform(size=(S, D))
+            rg = rng.uniform(size=(S, D))
+            
+            # Update the velocities and positions of the swarm, correcting lower
+            # and upper bound violations
+            v = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+            x = np.clip(x + v, lb, ub)
+            fx, feasible, shape = evaluate_swarm(x)
+            
+            # Compare the particles' best positions (if constraints are satisfied)
+            improved = (fx<fp) & feasible
+            p[improved, :] = x[improved, :]
+            fp[improved] = fx[improved]
+            
+            # Compare swarm's best position to the best improved particle
+            if np.any(improved):
+                i_min = np.flatnonzero(improved)[np.argmin(fx[improved])]
+                if fx[i_min]<fg:
+                    if debug:
+                        print('New best for swarm at iteration {:}: {:} {:}'.format(it, x[i_min, :], fx[i_min]))
+                        
+                    tmp = x[i_min, :].copy()
+                    stepsize = np.sqrt(np.sum((g-tmp)**2))
+                    if np.abs(fg - fx[i_min])<=minfunc:
+                        print('Stopping search: Swarm best objective change less than {:}'.format(minfunc))
+                        return tmp, objective_value(fx[i_min], shape)
+                    elif stepsize<=minstep:
+                        print('Stopping search: Swarm best position change less than {:}'.format(minstep))
+                        return tmp, objective_value(fx[i_min], shape)
+                    else:
+                        g = tmp.copy()
+                        fg = fx[i_min]
+                        
+            if debug:
+                print('Best after iteration {:}: {:} {:}'.format(it, g, fg))
+            it += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            
+    print('Stopping search: maximum iterations reached --> {:}'.format(maxiter))
+    
+    if fg == 1e100:
+        print("However, the optimization couldn't find a feasible design. Sorry")
+    return g, objective_value(fg, shape)
+
+def asynchronous_swarm(func, lb, ub, ieqcons, f_ieqcons, args, kwargs, S, omega, phip, phig, maxiter,
+                       minstep, minfunc, debug, processes, rng):
+    """
+    Particle swarm optimization that evaluates the particles in a pool of processes and moves each particle as
+    soon as its result arrives, with the best swarm position known at that time. Every particle is evaluated
+    maxiter times after its initial position. The inputs and outputs are those of particle_swarm_optimization.
+    
+    Source:
+        Pyswarm: https://github.com/tisimst/pyswarm
+    """
+    
+    D = len(lb)
+    vhigh = np.abs(ub - lb)
+    vlow = -vhigh
+    
+    # Initialize the particle swarm ############################################
+    x = lb + rng.rand(S, D)*(ub - lb)
+    v = vlow + rng.rand(S, D)*(vhigh - vlow)
+    p = x.copy()
+    fp = np.zeros(S)
+    it = np.zeros(S, dtype=int)  # evaluations of each particle
+    g = p[0, :].copy()
+    fg = 1e100
+    shape = ()
+    
+    pool = swarm_pool(func, ieqcons, f_ieqcons, args, kwargs, processes)
+    try:
+        running = {pool.submit(_evaluate_particle, x[i, :]): i for i in range(S)}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                f, feasible = future.result()
+                shape = np.shape(f)
+                fx = np.ravel(f)[0]
+                
+                if it[i]==0:
+                    # Initialize the particle's best known position
+                    fp[i] = fx
+                    if fx<fg and feasible:
+                        g = x[i, :].copy()
+                        fg = fx
+                elif fx<fp[i] and feasible:
+                    # Compare particle's best position (if constraints are satisfied)
+                    p[i, :] = x[i, :].copy()
+                    fp[i] = fx
+                    
+                    # Compare swarm's best position to current particle's position
+                    if fx<fg:
+                        if debug:
+                            print('New best for swarm after {:} evaluations of particle {:}: {:} {:}'.format(it[i], i, x[i, :], fx))
+                            
+                        tmp = x[i, :].copy()
+                        stepsize = np.sqrt(np.sum((g-tmp)**2))
+                        if np.abs(fg - fx)<=minfunc or stepsize<=minstep:
+                            if np.abs(fg - fx)<=minfunc:
+                                print('Stopping search: Swarm best objective change less than {:}'.format(minfunc))
+                            else:
+                                print('Stopping search: Swarm best position change less than {:}'.format(minstep))
+                            for pending in running:
+                                pending.cancel()
+                            return tmp, objective_value(fx, shape)
+                        g = tmp.copy()
+                        fg = fx
+                it[i] += 1
+                
+                # Move the particle with the current best swarm position and resubmit it
+                if it[i]<=maxiter:
+                    rp = rng.uniform(size=D)
+                    rg = rng.uniform(size=D)
+                    v[i, :] = omega*v[i, :] + phip*rp*(p[i, :] - x[i, :]) + phig*rg*(g - x[i, :])
+                    x[i, :] = np.clip(x[i, :] + v[i, :], lb, ub)
+                    running[pool.submit(_evaluate_particle, x[i, :].copy())] = i
+    finally:
+        pool.shutdown()
+        
+    print('Stopping search: maximum iterations reached --> {:}'.format(maxiter))
+    
+    if fg == 1e100:
+        print("However, the optimization couldn't find a feasible design. Sorry")
+    return g, objective_value(fg, shape)
+
+def constraint_function(ieqcons, f_ieqcons, args, kwargs, debug=False):
+    """
+    Combines the inequality constraints of particle_swarm_optimization into a single constraint function
+    """
+    if f_ieqcons is None:
+        if not len(ieqcons):
+            if debug:
+                print('No constraints given.')
+            cons = lambda x: np.array([0])
+        else:
+            if debug:
+                print('Converting ieqcons to a single constraint function')
+            cons = lambda x: np.array([y(x, *args, **kwargs) for y in ieqcons])
+    else:
+        if debug:
+            print('Single constraint function given in f_ieqcons')
+        cons = lambda x: np.array(f_ieqcons(x, *args, **kwargs))
+    return cons
+
+def objective_value(f, shape):
+    """
+    Returns an objective value in the shape of the values returned by the objective function
+    """
+    if len(shape):
+        return np.reshape(f, shape)
+    return f
+
+def particle_evaluation(func, ieqcons, f_ieqcons, args, kwargs):
+    """
+    Returns a function giving the objective value and the feasibility of a particle
+    """
+    cons = constraint_function(ieqcons, f_ieqcons, args, kwargs)
+    def evaluate_particle(x):
+        return func(x, *args, **kwargs), bool(np.all(cons(x)>=0))
+    return evaluate_particle
+
+def swarm_pool(func, ieqcons, f_ieqcons, args, kwargs, processes):
+    """
+    Starts a pool of processes, each holding its own copy of the objective and constraint functions
+    """
+    payload = pickle.dumps((func, ieqcons, f_ieqcons, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+    return ProcessPoolExecutor(max_workers=max(1, processes), initializer=_initialize_worker, initargs=(payload,))
+
+# ----------------------------------------------------------------------
+#  Parallel Workers
+# ----------------------------------------------------------------------
+# particle evaluation held by each worker process
+_worker_evaluation = None
+
+def _initialize_worker(payload):
+    """Loads the objective and constraint functions of a worker process."""
+    global _worker_evaluation
+    _worker_evaluation = particle_evaluation(*pickle.loads(payload))
+    return
+
+def _evaluate_particle(x):
+    """Evaluates the objective value and the feasibility of a particle in a worker process."""
+    return _worker_evaluation(x)
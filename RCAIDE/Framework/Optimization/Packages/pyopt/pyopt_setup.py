@@ -16,7 +16,7 @@ from RCAIDE.Framework.Optimization.Common import helper_functions as help_fun
 # ----------------------------------------------------------------------
 #  Pyopt_Solve
 # ---------------------------------------------------------------------- 
-def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False):
+def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False, number_of_workers=None):
     """ This converts your RCAIDE Nexus problem into a PyOpt optimization problem and solves it
         PyOpt has many algorithms, they can be switched out by using the solver input. 
 
@@ -32,14 +32,18 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
         FD (parallel or single)   [str]
         sense_step                [float]
         nonderivative_line_search [bool]
+        number_of_workers         [int]
 
         Outputs:
         outputs                   [list]
 
         Properties Used:
-        None
+        problem.number_of_workers
     """      
    
+    if number_of_workers != None:
+        problem.number_of_workers = number_of_workers
+   
     # Have the optimizer call the wrapper
     mywrap = lambda x:PyOpt_Problem(problem,x)
    
@@ -141,6 +145,16 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
     if FD == 'parallel':
         outputs = opt(opt_prob, sens_type='FD',sens_mode='pgc')
         
+    elif (solver == 'SNOPT' or solver == 'SLSQP') and problem.number_of_workers > 1:
+        # gradients are finite differenced by the nexus, evaluating the perturbed inputs in parallel
+        # the pool of workers is started once and reused by every gradient
+        mygrad  = lambda x,f,g:PyOpt_Gradients(problem,x,sense_step)
+        problem.open_worker_pool()
+        try:
+            outputs = opt(opt_prob, sens_type=mygrad)
+        finally:
+            problem.close_worker_pool()
+        
     elif solver == 'SNOPT' or solver == 'SLSQP':
         outputs = opt(opt_prob, sens_type='FD', sens_step = sense_step)
   
@@ -190,3 +204,36 @@ def PyOpt_Problem(problem,x):
     print(const)
    
     return obj,const,fail
+
+
+# ----------------------------------------------------------------------
+#  Gradient Wrapper
+# ---------------------------------------------------------------------- 
+def PyOpt_Gradients(problem,x,sense_step):
+    """ This wrapper finite differences the RCAIDE problem and is called by the PyOpt solver.
+        The perturbed inputs are evaluated in parallel by the nexus.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem    [nexus()]
+        x          [array]
+        sense_step [float]
+
+        Outputs:
+        grad_obj   [array]
+        jac_con    [array]
+        fail       [bool]
+
+        Properties Used:
+        None
+    """      
+   
+    grad_obj, jac_con = problem.finite_difference(np.array(x,dtype=float),diff_interval=sense_step)
+    fail              = np.array(np.isnan(grad_obj).any() or np.isnan(jac_con).any()).astype(int)
+   
+    return [grad_obj.tolist()],jac_con.tolist(),fail
@@ -20,7 +20,7 @@ from RCAIDE.Framework.Optimization.Common import helper_functions as help_fun
 # ----------------------------------------------------------------------
 #  Something that should become a class at some point
 # ---------------------------------------------------------------------- 
-def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None ):  
+def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None, number_of_workers = None ):  
     """ This converts your RCAIDE Nexus problem into a SciPy optimization problem and solves it
         SciPy has many algorithms, they can be switched out by using the solver input. 
 
@@ -34,14 +34,18 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         problem                   [nexus()]
         solver                    [str]
         sense_step                [float]
+        number_of_workers         [int]
 
         Outputs:
         outputs                   [list]
 
         Properties Used:
-        None
+        problem.number_of_workers
     """
     
+    if number_of_workers != None:
+        problem.number_of_workers = number_of_workers
+    
     inp = problem.optimization_problem.inputs
     obj = problem.optimization_problem.objective
     con = problem.optimization_problem.constraints
@@ -70,7 +74,18 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         de_bnds.append((bndl[ii]/scl[ii],bndu[ii]/scl[ii]))  
      
     # Finalize problem statement and run
-    if solver=='SLSQP':
+    if solver=='SLSQP' and problem.number_of_workers > 1:
+        # gradients are finite differenced by the nexus, evaluating the perturbed inputs in parallel
+        # the pool of workers is started once and reused by every gradient
+        gradients = SciPy_Gradients(problem,sense_step)
+        problem.open_worker_pool()
+        try:
+            outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
+                                             fprime=gradients.objective,fprime_eqcons=gradients.equality_constraint,fprime_ieqcons=gradients.inequality_constraint,\
+                                             iter=iter, epsilon = sense_step, acc  = tolerance, full_output=True,  iprint=0)
+        finally:
+            problem.close_worker_pool()
+    elif solver=='SLSQP':
         outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
                                          iter=iter, epsilon = sense_step, acc  = tolerance, full_output=True,  iprint=0)
     elif solver == 'differential_evolution':
@@ -105,9 +120,14 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
                                                      disp=False, polish=True, init='latinhypercube', atol=0, updating='immediate',\
                                                      workers=1,constraints=diff_evo_cons)
         
+    elif solver == 'particle_swarm_optimization' and problem.number_of_workers > 1:
+        # each generation of the swarm is evaluated in a pool of workers holding their own copy of the nexus
+        outputs = particle_swarm_optimization(problem.objective, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                              processes=problem.number_of_workers, seed=prob_seed)
     elif solver == 'particle_swarm_optimization':
         outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False, seed=prob_seed)    
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
     
@@ -143,3 +163,43 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+class SciPy_Gradients():
+    """ Objective gradient and constraint jacobians of the RCAIDE problem, from the finite differences of the nexus.
+        The finite differences of the last inputs are kept so that all three are computed once per point.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,problem,sense_step):
+        self.problem    = problem
+        self.sense_step = sense_step
+        self.last_x     = None
+        self.grad_obj   = None
+        self.jac_con    = None
+
+        # rows of the inequality and equality constraints, and the sign of the inequality constraints
+        con             = problem.optimization_problem.constraints
+        self.iq_indices = [ii for ii in range(len(con)) if con[ii][1] != '=']
+        self.eq_indices = [ii for ii in range(len(con)) if con[ii][1] == '=']
+        self.iq_signs   = np.array([-1. if con[ii][1] == '<' else 1. for ii in self.iq_indices])
+
+    def finite_difference(self,x):
+        if (self.last_x is None) or np.any(self.last_x != x):
+            self.grad_obj, self.jac_con = self.problem.finite_difference(x,diff_interval=self.sense_step)
+            self.last_x                 = np.array(x,dtype=float)
+        return self.grad_obj, self.jac_con
+
+    def objective(self,x):
+        return self.finite_difference(x)[0]
+
+    def inequality_constraint(self,x):
+        jac_con = self.finite_difference(x)[1]
+        return jac_con[self.iq_indices,:]*self.iq_signs[:,None]
+
+    def equality_constraint(self,x):
+        jac_con = self.finite_difference(x)[1]
+        return jac_con[self.eq_indices,:]
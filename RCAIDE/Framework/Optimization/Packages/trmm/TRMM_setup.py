@@ -14,7 +14,7 @@ from RCAIDE.Framework.Optimization.Packages.trmm.Trust_Region import Trust_Regio
 #  TRMM_Solve
 # ----------------------------------------------------------------------
 
-def TRMM_Solve(problem,tr=None,tr_opt=None,print_output=False):
+def TRMM_Solve(problem,tr=None,tr_opt=None,print_output=False,number_of_workers=None):
     """ This solves your TRMM
 
         Assumptions:
@@ -28,6 +28,7 @@ def TRMM_Solve(problem,tr=None,tr_opt=None,print_output=False):
         tr            [Trust_Region()]
         tr_opt        [Trust_Region_Optimization()]
         print_output  [bool]
+        number_of_workers [int]
 
         Outputs:
         None
@@ -39,10 +40,18 @@ def TRMM_Solve(problem,tr=None,tr_opt=None,print_output=False):
     if tr == None:
         tr = Trust_Region()
     problem.trust_region = tr
+    if number_of_workers != None:
+        problem.number_of_workers = number_of_workers
     if tr_opt == None:
         TRM_opt = tro.Trust_Region_Optimization()
     else:
         TRM_opt = tr_opt
-    TRM_opt.optimize(problem,print_output=print_output)
+    
+    # the pool of workers is started once and reused by every gradient
+    problem.open_worker_pool()
+    try:
+        TRM_opt.optimize(problem,print_output=print_output)
+    finally:
+        problem.close_worker_pool()
 
     return
@@ -52,6 +52,9 @@ class Ducted_Fan(Converter):
         Coefficients for propulsive efficiency polynomial [-, -, -]
     fidelity : str
         Analysis fidelity level, either 'Blade_Element_Momentum_Theory' or 'Rankine_Froude_Momentum_Theory'
+    DFDC : Data
+        DFDC settings: executable (bin_name), run_folder, number_of_workers and cache_folder of the
+        performance maps
     orientation_euler_angles : list
         Default orientation angles of rotor [rad, rad, rad]
     rotor : Data
@@ -107,6 +110,9 @@ class Ducted_Fan(Converter):
         self.fan_effectiveness                     = 1.1
         self.DFDC                                  = Data()
         self.DFDC.bin_name                         = 'dfdc'
+        self.DFDC.run_folder                       = None    # folder of the DFDC input and result files, defaults to VnV/Verification/network_electric/dfdc_files
+        self.DFDC.number_of_workers                = 1       # number of concurrent DFDC processes
+        self.DFDC.cache_folder                     = None    # folder of stored performance maps, no caching if None
         self.Cp_polynomial_coefficients            = [0.551,  0.0182, -0.0869]   
         self.Ct_polynomial_coefficients            = [0.4605,-0.0529, -0.1203]   
         self.etap_polynomial_coefficients          = [0.0653,4.1603 , -7.6128]  
@@ -106,6 +106,10 @@ class Rotor(Component):
     nonuniform_freestream : bool
         Flag for nonuniform inflow conditions. Default is False.
 
+    BEMT_surrogate : Data
+        Training grid (advance ratio, tip Mach number, blade pitch command, disc angle), cache folder,
+        trained surrogate and accuracy report of the 'Blade_Element_Momentum_Theory_Surrogate' fidelity.
+
     Notes
     -----
     The Rotor class provides a comprehensive framework for modeling rotary
@@ -236,6 +240,19 @@ class Rotor(Component):
         self.optimization_parameters.ideal_efficiency                   = 1.0     
         self.optimization_parameters.ideal_figure_of_merit              = 1.0
 
+        self.BEMT_surrogate                                    = Data()
+        self.BEMT_surrogate.training                           = Data()
+        self.BEMT_surrogate.training.advance_ratio             = np.linspace(0,2,11)
+        self.BEMT_surrogate.training.tip_mach                  = np.linspace(0.2,0.8,5)
+        self.BEMT_surrogate.training.blade_pitch_command       = np.linspace(-10,10,5) * Units.degrees
+        self.BEMT_surrogate.training.disc_angle                = np.linspace(0,90,4) * Units.degrees  # only used if use_2d_analysis
+        self.BEMT_surrogate.training.altitude                  = 0.
+        self.BEMT_surrogate.training.batch_size                = 4
+        self.BEMT_surrogate.accuracy_samples                   = 10
+        self.BEMT_surrogate.cache_folder                       = None
+        self.BEMT_surrogate.surrogate                          = None
+        self.BEMT_surrogate.accuracy                           = None
+
     def append_operating_conditions(rotor,segment,energy_conditions,noise_conditions=None): 
         append_rotor_conditions(rotor,segment,energy_conditions,noise_conditions)
         return        
@@ -9,7 +9,6 @@
 from RCAIDE.Library.Components import Component  
 from RCAIDE.Library.Methods.Thermal_Management.Batteries.Air_Cooled import append_air_cooled_conditions, air_cooled_performance, append_air_cooled_segment_conditions
 from RCAIDE.Library.Attributes.Gases import Air
-from RCAIDE.Library.Plots.Thermal_Management.plot_air_cooled_conditions import plot_air_cooled_conditions
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Air_Cooled
@@ -157,6 +156,8 @@ class Air_Cooled(Component):
         height : float
             Plot height
         """
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Thermal_Management.plot_air_cooled_conditions import plot_air_cooled_conditions
         plot_air_cooled_conditions(self, results, coolant_line, save_filename, 
                                  save_figure, show_legend, file_type, width, height)
         return
@@ -13,7 +13,6 @@ from RCAIDE.Library.Components.Component
 from RCAIDE.Library.Attributes.Materials.Aluminum                                   import Aluminum
 from RCAIDE.Library.Components                                                      import Component
 from RCAIDE.Library.Methods.Thermal_Management.Batteries.Liquid_Cooled_Wavy_Channel import wavy_channel_rating_model,append_wavy_channel_conditions,append_wavy_channel_segment_conditions 
-from RCAIDE.Library.Plots.Thermal_Management                                        import plot_wavy_channel_conditions
 # ----------------------------------------------------------------------------------------------------------------------
 # Liquid_Cooled_Wavy_Channel_Heat_Acquisition_System
 # ----------------------------------------------------------------------------------------------------------------------
@@ -86,5 +85,7 @@ class Liquid_Cooled_Wavy_Channel(Component):
         return  T_battery_current
     
     def plot_operating_conditions(self, results, coolant_line,save_filename, save_figure,show_legend,file_type , width, height):
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Thermal_Management.plot_wavy_channel_conditions import plot_wavy_channel_conditions
         plot_wavy_channel_conditions(self, results, coolant_line,save_filename,save_figure,show_legend,file_type , width, height)
         return
\ No newline at end of file
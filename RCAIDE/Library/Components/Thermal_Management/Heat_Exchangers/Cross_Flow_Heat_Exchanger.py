@@ -11,7 +11,6 @@ from RCAIDE.Library.Components
 from RCAIDE.Library.Attributes.Coolants.Glycol_Water                                      import Glycol_Water  
 from RCAIDE.Library.Attributes.Gases                                                      import Air
 from RCAIDE.Library.Methods.Thermal_Management.Heat_Exchangers.Cross_Flow_Heat_Exchanger  import  cross_flow_hex_rating_model, append_cross_flow_heat_exchanger_conditions, append_cross_flow_hex_segment_conditions
-from RCAIDE.Library.Plots.Thermal_Management.plot_cross_flow_heat_exchanger_conditions    import plot_cross_flow_heat_exchanger_conditions 
 
 import os
 import numpy as np 
@@ -305,6 +304,8 @@ class Cross_Flow_Heat_Exchanger(Component):
         height : float
             Plot height
         """
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Thermal_Management.plot_cross_flow_heat_exchanger_conditions import plot_cross_flow_heat_exchanger_conditions
         plot_cross_flow_heat_exchanger_conditions(self, results, coolant_line, save_filename,
                                                 save_figure, show_legend, file_type, width, height)     
         return    
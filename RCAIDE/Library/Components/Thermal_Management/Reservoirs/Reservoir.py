@@ -9,7 +9,6 @@ from RCAIDE.Library.Components
 from RCAIDE.Library.Attributes.Coolants.Glycol_Water                                import Glycol_Water
 from RCAIDE.Library.Attributes.Materials.Polyetherimide                             import Polyetherimide
 from RCAIDE.Library.Methods.Thermal_Management.Reservoirs.Reservoir_Tank            import compute_mixing_temperature, append_reservoir_conditions, append_reservoir_segment_conditions
-from RCAIDE.Library.Plots.Thermal_Management.plot_reservoir_conditions              import plot_reservoir_conditions
 
 # ----------------------------------------------------------------------
 #  Reservoir
@@ -163,6 +162,8 @@ class Reservoir(Component):
         height : float
             Plot height
         """
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Thermal_Management.plot_reservoir_conditions import plot_reservoir_conditions
         plot_reservoir_conditions(self, results, coolant_line, save_filename, 
                                 save_figure, show_legend, file_type, width, height)
         return    
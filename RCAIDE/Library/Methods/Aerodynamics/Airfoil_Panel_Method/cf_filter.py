@@ -12,12 +12,14 @@ from RCAIDE.Framework.Core import Data
 
 # package imports  
 import numpy as np 
-from scipy.signal import lfilter 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # cf_filter.py
 # ---------------------------------------------------------------------------------------------------------------------- 
 def cf_filter(ncpts,ncases,npanel,CF):
+    # scipy.signal is slow to import and only needed here
+    from scipy.signal import lfilter 
+    
     n = npanel
     
     #filter strength
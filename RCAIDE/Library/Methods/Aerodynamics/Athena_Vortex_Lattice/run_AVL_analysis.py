@@ -7,7 +7,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 # RCAIDE imports
-from RCAIDE.Framework.Core                                                        import redirect
+from RCAIDE.Framework.Core                                                        import redirect, Data
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.read_results       import read_results
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.purge_files        import purge_files
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.write_geometry     import write_geometry
@@ -22,7 +22,9 @@ from RCAIDE.Library.Components.Wings.Control_Surfaces
 import sys
 import time
 import subprocess
+import tempfile
 import os
+import numpy as np 
 from shutil import rmtree   
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -56,6 +58,7 @@ def run_AVL_analysis(aerodynamics,run_conditions):
       batch_file
       deck_file
       cases
+    aerodynamics.settings.number_of_workers
     """           
     
     # unpack
@@ -129,12 +132,17 @@ def run_AVL_analysis(aerodynamics,run_conditions):
     with redirect.folder(run_folder,force=False):
         write_geometry(aerodynamics,run_script_path)
         write_mass_file(aerodynamics,run_conditions)
-        write_run_cases(aerodynamics,trim_aircraft)
-        write_input_deck(aerodynamics, trim_aircraft,control_surfaces)
-
-        # RUN AVL! 
-        exit_status = call_avl(aerodynamics,print_output)
-        results_avl = read_results(aerodynamics)
+        
+        if aerodynamics.settings.number_of_workers > 1 and aerodynamics.settings.new_regression_results and len(cases) > 1:
+            # RUN AVL! in concurrent shards of run cases
+            results_avl = call_avl_shards(aerodynamics,trim_aircraft,control_surfaces)
+        else:
+            write_run_cases(aerodynamics,trim_aircraft)
+            write_input_deck(aerodynamics, trim_aircraft,control_surfaces)
+    
+            # RUN AVL! 
+            exit_status = call_avl(aerodynamics,print_output)
+            results_avl = read_results(aerodynamics)
         
     # translate results
     translate_results_to_conditions(cases,run_conditions,results_avl) 
@@ -200,3 +208,94 @@ def call_avl(avl_object,print_output):
         exit_status = 0        
     return exit_status
 
+
+def call_avl_shards(avl_object,trim_aircraft,control_surfaces):
+    """ This function splits the run cases into shards and executes each shard in its own AVL
+    process and temporary folder. The processes run concurrently and the results of each shard
+    are read as soon as its process finishes.
+    
+    Assumptions:
+        Called from the run folder once the geometry and mass files are written. These files,
+        and the airfoil files they reference, are linked into every shard. The result files are
+        moved back to the run folder.
+        
+    Source:
+        None
+    Inputs:
+        avl_object
+        trim_aircraft
+        control_surfaces
+    Outputs:
+        results
+    Properties Used:
+        avl_object.settings.number_of_workers
+    """
+    cases        = avl_object.current_status.cases
+    n_shards     = min(avl_object.settings.number_of_workers,len(cases))
+    avl_call     = avl_object.settings.filenames.avl_bin_name
+    geometry     = avl_object.settings.filenames.features
+    log_file     = avl_object.settings.filenames.log_filename
+    err_file     = avl_object.settings.filenames.err_filename
+    shared_files = [geometry,avl_object.settings.filenames.mass_file] + airfoil_files(geometry)
+    purge_files([log_file,err_file]) 
+    
+    # write the run cases and input deck of each shard and start its AVL process 
+    shards = []
+    try:
+        for indices in np.array_split(np.arange(len(cases)),n_shards):
+            shard        = Data()
+            shard.cases  = [cases[i] for i in indices]
+            shard.folder = tempfile.mkdtemp(prefix='avl_shard_',dir=os.getcwd())
+            shards.append(shard)
+                
+            avl_object.current_status.cases = shard.cases
+            with redirect.folder(shard.folder,link=shared_files,force=False):
+                write_run_cases(avl_object,trim_aircraft)
+                write_input_deck(avl_object,trim_aircraft,control_surfaces)
+            
+            shard.commands = open(os.path.join(shard.folder,avl_object.current_status.deck_file),'r')
+            shard.log      = open(os.path.join(shard.folder,'shard_' + log_file),'w')
+            shard.err      = open(os.path.join(shard.folder,'shard_' + err_file),'w')
+            shard.process  = subprocess.Popen([avl_call,geometry],stdout=shard.log,stderr=shard.err,stdin=shard.commands,cwd=shard.folder)
+    
+        # collect the results of the shards as they finish 
+        pending = list(shards)
+        while pending:
+            finished = [shard for shard in pending if shard.process.poll() is not None]
+            for shard in finished:
+                pending.remove(shard)
+                for stream in [shard.commands,shard.log,shard.err]:
+                    stream.close()
+                avl_object.current_status.cases = shard.cases
+                with redirect.folder(shard.folder,force=True) as push:
+                    shard.results = read_results(avl_object)
+                    for case in shard.cases:
+                        push.extend([case.aero_result_filename_1,case.aero_result_filename_2,case.aero_result_filename_3,case.aero_result_filename_4])
+                for shard_file, run_file in [[shard.log.name,log_file],[shard.err.name,err_file]]:
+                    with open(shard_file,'r') as source, open(run_file,'a') as destination:
+                        destination.write(source.read())
+            if not finished:
+                time.sleep(0.01)
+    finally:
+        avl_object.current_status.cases = cases
+        for shard in shards:
+            if ('process' in shard) and (shard.process.poll() is None):
+                shard.process.kill()
+            rmtree(shard.folder,ignore_errors=True)
+    
+    # assemble the results in the order of the run cases 
+    results = Data()
+    for shard in shards:
+        for case in shard.cases:
+            results.append(shard.results[case.tag])
+    return results
+
+def airfoil_files(geometry):
+    """ Returns the airfoil files referenced by an AVL geometry file """
+    files = []
+    with open(geometry,'r') as geometry_file:
+        lines = geometry_file.readlines()
+    for i,line in enumerate(lines[:-1]):
+        if line.strip().upper() == 'AFILE' and os.path.exists(lines[i+1].strip()):
+            files.append(lines[i+1].strip())
+    return list(dict.fromkeys(files))
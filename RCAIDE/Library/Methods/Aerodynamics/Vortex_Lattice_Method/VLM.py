@@ -12,11 +12,12 @@
 # package imports 
 import numpy as np 
 from RCAIDE.Framework.Core import Data
-from .compute_wing_induced_velocity      import compute_wing_induced_velocity
+from .compute_wing_induced_velocity      import compute_wing_induced_velocity, compute_horseshoe_geometry
 from .generate_vortex_distribution       import generate_vortex_distribution 
 from .compute_RHS_matrix                 import compute_RHS_matrix 
+from .compute_hierarchical_influence_matrix import compute_hierarchical_influence_matrix, hierarchical_matrix_product, solve_hierarchical_influence_matrix
 from scipy.integrate import trapezoid
-from copy import  deepcopy
+from scipy.linalg    import lu_factor, lu_solve
 # ----------------------------------------------------------------------
 #  Vortex Lattice
 # ----------------------------------------------------------------------
@@ -34,6 +35,16 @@ def VLM(conditions,settings,geometry):
     By default in Vortex_Lattice, VLM performs calculations based on panel coordinates with float32 precision. 
     The user may also choose to use float16 or float64, but be warned that the latter can be memory intensive.
     
+    For large vortex lattices the influence matrix can be built a block of control points at a time by setting 
+    settings.influence_matrix_block_size, and stored in float32 through settings.influence_matrix_precision. The 
+    matrix is then built once per unique mach number and the vortex strengths are refined in float64. A report of 
+    the memory and residual of the solve is returned in results.influence_matrix.
+    
+    With settings.use_hierarchical_influence_matrix the influence of well separated clusters of panels is 
+    compressed to low rank and the vortex strengths are solved with GMRES, see 
+    compute_hierarchical_influence_matrix.py. Its memory and cost grow much slower than the square of the number of 
+    panels, so lattices too large for the dense matrix can be solved.
+    
     The user should note that fully capitalized variables correspond to a VORLAX variable of the same name
     
     
@@ -93,6 +104,10 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.influence_matrix_block_size       [Unitless], control points per block, None to build the full matrix at once
+    settings.influence_matrix_precision        [float32/64], storage of the blocked influence matrix
+    settings.use_hierarchical_influence_matrix [boolean]
+    settings.hierarchical_matrix               [Data], tolerance, solver_tolerance, leaf_size, admissibility, maximum_iterations
        
     conditions.aerodynamics.angles.alpha    [radians]
     conditions.aerodynamics.angles.beta   [radians]
@@ -249,33 +264,56 @@ def VLM(conditions,settings,geometry):
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
     inv           = inv.reshape(-1) # this is done to ensure compatibility across numpy1.0 and numpy2.0
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
     
-    C_mn  = C_mn_small[inv,:,:,:]
-    RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
-
-    # Turn off sonic vortices when Mach>1
-    RHS = RHS*RFLAG
+    if settings.influence_matrix_block_size is None and not settings.use_hierarchical_influence_matrix:
+        C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+        
+        C_mn  = C_mn_small[inv,:,:,:]
+        RFLAG = RFLAG_small[inv,:]
+        EW    = EW_small[inv,:,:]
     
-    # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
-    RHS = np.atleast_3d(RHS)
-
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
+        # Turn off sonic vortices when Mach>1
+        RHS = RHS*RFLAG
+        
+        # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
+        RHS = np.atleast_3d(RHS)
+    
+        # Build Aerodynamic Influence Coefficient Matrix
+        if not use_VORLAX_induced_velocity:
+            A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
+                + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
+                - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
+        else:
+            A = EW
+    
+        # Compute vortex strength
+        GAMMA  = np.linalg.solve(A,RHS)
+    
+        # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
+        RHS    = RHS.squeeze(axis=2)
+        GAMMA  = GAMMA.squeeze(axis=2)
+        
+        # Normalwash induced on the leading edge strips, pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
+        EW_LE  = EW[:,LE_ind,:]
+        gamma  = np.array(np.split(np.repeat(GAMMA, EW_LE.shape[1], axis=0), len_mach))
+        EW_GAMMA = (EW_LE*gamma).sum(axis=2)
+    elif settings.use_hierarchical_influence_matrix:
+        # Hierarchical influence matrices of the subsonic mach numbers
+        GAMMA, s, EW_GAMMA, report = solve_hierarchical_VLM(VD,m_unique,inv,delta[0],phi[0],RHS,settings)
     else:
-        A = EW
-
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
-
-    # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
-    RHS    = RHS.squeeze(axis=2)
-    GAMMA  = GAMMA.squeeze(axis=2)
+        # Build the influence matrix of each unique mach number a block of control points at a time
+        block_size = settings.influence_matrix_block_size
+        A_small, s, RFLAG_small, EW_LE_small, report = compute_influence_matrix_blocks(VD,m_unique,delta[0],phi[0],block_size,settings)
+        
+        RFLAG = RFLAG_small[inv,:]
+        
+        # Turn off sonic vortices when Mach>1
+        RHS = RHS*RFLAG
+        
+        # Compute vortex strength
+        GAMMA    = solve_influence_matrix_blocks(A_small,RHS,inv,block_size,report)
+        EW_GAMMA = np.matmul(EW_LE_small[inv,:,:],GAMMA[:,:,None])[:,:,0]
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -412,7 +450,7 @@ def VLM(conditions,settings,geometry):
     # ONLY PERFORMED FOR COSINE CHORDWISE SPACING (LAX = 0).    
     # ** TO DO ** Add cosine spacing (earlier in VLM) to properly capture the magnitude of these earlier.
     # Right now, this computation still happens with linear spacing, though its effects are underestimated.
-    CLE = compute_rotation_effects(VD, settings, EW, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+    CLE = compute_rotation_effects(VD, settings, EW_GAMMA, X, CHORD, XLE, XBAR, 
                                    rhs, COSINP, SINALF,COSCOS, PITCH, ROLL, YAW, STB, RNMAX)    
     
     # Leading edge suction multiplier. See documentation. This is a negative integer if used
@@ -529,6 +567,8 @@ def VLM(conditions,settings,geometry):
     results.V_distribution    = rhs.V_distribution
     results.V_x               = rhs.Vx_ind_total
     results.V_z               = rhs.Vz_ind_total 
+    if settings.influence_matrix_block_size is not None or settings.use_hierarchical_influence_matrix:
+        results.influence_matrix = report
 
     # Dimensionalize the lift and drag for each wing 
     i = 0 
@@ -552,10 +592,256 @@ def VLM(conditions,settings,geometry):
     results.CDrag_induced_wings = Cdrag_wings
     return results
 
+# ----------------------------------------------------------------------
+#  Blocked influence matrix helper functions
+# ----------------------------------------------------------------------
+def compute_influence_matrix_blocks(VD, m_unique, delta, phi, block_size, settings):
+    """ This builds the aerodynamic influence coefficient matrix of each unique mach number a 
+    block of control points at a time, so that the induced velocities of the full vortex lattice 
+    are never held in memory at once
+    
+    Assumptions:
+    The mean camber surface and dihedral angles of the panels are the same for every case
+    
+    Source:
+    None
+    
+    Inputs:
+    VD                                      - vehicle vortex distribution                  [Unitless] 
+    m_unique                                - unique mach numbers                          [Unitless] 
+    delta                                   - mean camber surface angle of each panel      [radians]
+    phi                                     - dihedral angle of each panel                 [radians]
+    block_size                              - control points per block                     [Unitless]
+    settings.influence_matrix_precision     - storage of the influence matrix              [float32/64]
+    settings.use_VORLAX_matrix_calculation  - influence matrix equation switch             [boolean]
+    
+    Outputs:
+    A       - influence matrix of each unique mach number                                  [Unitless]
+    s       - semispan of the horshoe vortex                                               [m] 
+    RFLAG   - sonic vortex flag                                                            [boolean] 
+    EW_LE   - VORLAX frame normalwash on the leading edge strips                           [Unitless]
+    report  - block size, precision and memory of the influence matrix                     [bytes]
+    
+    Properties Used:
+    N/A
+    """
+    n_cp       = VD.n_cp
+    LE_ind     = VD.leading_edge_indices
+    block_size = int(block_size)
+    A          = np.empty((len(m_unique),n_cp,n_cp),dtype=settings.influence_matrix_precision)
+    
+    # flow tangency of each receiving panel, validated from book eqn 7.42 
+    C_x = np.sin(delta)*np.cos(phi)
+    C_y = np.cos(delta)*np.sin(phi)
+    C_z = np.cos(phi)*np.cos(delta)
+    
+    EW_LE        = []
+    block_memory = 0
+    for start in range(0,n_cp,block_size):
+        rows = slice(start,min(start + block_size,n_cp))
+        C_mn, s_block, RFLAG, EW = compute_wing_induced_velocity(VD,m_unique,compute_EW=True,rows=rows)
+        
+        if not settings.use_VORLAX_matrix_calculation:
+            A[:,rows] =   np.multiply(C_mn[:,:,:,0],np.atleast_2d(C_x[rows]).T) \
+                        + np.multiply(C_mn[:,:,:,1],np.atleast_2d(C_y[rows]).T) \
+                        - np.multiply(C_mn[:,:,:,2],np.atleast_2d(C_z[rows]).T)
+        else:
+            A[:,rows] = EW
+            
+        EW_LE.append(EW[:,LE_ind[rows],:])
+        if start == 0:
+            s            = s_block[:1]
+            block_memory = C_mn.nbytes + EW.nbytes
+            
+    report               = Data()
+    report.block_size    = block_size
+    report.precision     = A.dtype.name
+    report.matrix_memory = A.nbytes 
+    report.block_memory  = block_memory
+    
+    return A, s, RFLAG, np.concatenate(EW_LE,axis=1), report
+
+def solve_influence_matrix_blocks(A, RHS, inv, block_size, report, tolerance=1e-12, max_iterations=10):
+    """ This solves for the vortex strengths of every case with the LU factorization of the 
+    influence matrix of its mach number. A matrix stored in reduced precision is factorized in 
+    that precision and the vortex strengths are refined with residuals accumulated in float64.
+    
+    Assumptions:
+    The refinement converges when the condition number of the matrix times the precision is small
+    
+    Source:
+    Higham, N. J., "Accuracy and Stability of Numerical Algorithms", SIAM, 2002, Ch. 12
+    
+    Inputs:
+    A              - influence matrix of each unique mach number         [Unitless]
+    RHS            - right hand side of each case                        [Unitless]
+    inv            - unique mach number index of each case               [Unitless]
+    block_size     - rows of the matrix cast to float64 at a time        [Unitless]
+    report         - report of the influence matrix                      [Data]
+    tolerance      - residual relative to the right hand side            [Unitless]
+    max_iterations - refinement iterations                               [Unitless]
+    
+    Outputs:
+    GAMMA          - vortex strengths                                    [Unitless]
+    report.
+      dense_memory          - induced velocity and influence matrices of the full build [bytes]
+      refinement_iterations - most refinement iterations of a mach number               [Unitless]
+      residual              - largest residual relative to the right hand side          [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    n_cases, n_cp = np.shape(RHS)
+    GAMMA         = np.zeros((n_cases,n_cp))
+    iterations    = 0
+    residual      = 0.
+    
+    for i_mach in range(len(A)):
+        cases = np.where(inv == i_mach)[0]
+        if len(cases) == 0:
+            continue
+        b     = RHS[cases].T
+        scale = max(np.max(np.abs(b)),np.finfo(float).tiny)
+        LU    = lu_factor(A[i_mach])
+        x     = lu_solve(LU,b.astype(A.dtype)).astype(np.float64)
+        r     = b - block_product(A[i_mach],x,block_size)
+        error = np.max(np.abs(r))/scale
+        
+        i_iter = 0 
+        while A.dtype != np.float64 and error > tolerance and i_iter < max_iterations:
+            x_new     = x + lu_solve(LU,r.astype(A.dtype))
+            r_new     = b - block_product(A[i_mach],x_new,block_size)
+            error_new = np.max(np.abs(r_new))/scale
+            i_iter   += 1
+            if error_new >= error:
+                break
+            x, r, error = x_new, r_new, error_new
+            
+        GAMMA[cases] = x.T
+        iterations   = max(iterations,i_iter)
+        residual     = max(residual,error)
+    
+    # the full build holds C_mn and EW in float32 for each unique mach number and each case, and A in float64 
+    report.dense_memory          = (16*len(A) + 24*n_cases)*n_cp*n_cp
+    report.refinement_iterations = iterations
+    report.residual              = residual
+    
+    return GAMMA
+
+def block_product(A, x, block_size):
+    """ This multiplies a matrix by the vortex strengths in float64, casting a block of rows 
+    of the matrix at a time
+    
+    Assumptions:
+    None
+    
+    Source:
+    None
+    
+    Inputs:
+    A          - influence matrix                [Unitless]
+    x          - vortex strengths                [Unitless]
+    block_size - rows of the matrix per block    [Unitless]
+    
+    Outputs:
+    product    - A times x                       [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    if A.dtype == np.float64:
+        return A @ x
+    
+    n_rows  = len(A)
+    product = np.empty((n_rows,np.shape(x)[1]))
+    for start in range(0,n_rows,block_size):
+        rows          = slice(start,min(start + block_size,n_rows))
+        product[rows] = A[rows].astype(np.float64) @ x
+        
+    return product
+
+def solve_hierarchical_VLM(VD, m_unique, inv, delta, phi, RHS, settings):
+    """ This solves for the vortex strengths with hierarchical influence matrices, built once per 
+    unique subsonic mach number, and computes the normalwash they induce on the leading edge strips
+    
+    Assumptions:
+    The influence of a horseshoe vortex is not smooth across its mach cone, so supersonic mach 
+    numbers use the blocked influence matrix
+    
+    Source:
+    None
+    
+    Inputs:
+    VD                                      - vehicle vortex distribution                  [Unitless] 
+    m_unique                                - unique mach numbers                          [Unitless] 
+    inv                                     - unique mach number index of each case        [Unitless]
+    delta                                   - mean camber surface angle of each panel      [radians]
+    phi                                     - dihedral angle of each panel                 [radians]
+    RHS                                     - right hand side of each case                 [Unitless]
+    settings.hierarchical_matrix            - tolerance, leaf size and admissibility       [Unitless]
+    settings.influence_matrix_block_size    - control points per block, supersonic         [Unitless]
+    
+    Outputs:
+    GAMMA     - vortex strengths                                                           [Unitless]
+    s         - semispan of the horshoe vortex                                             [m] 
+    EW_GAMMA  - normalwash induced on the leading edge strips                              [Unitless]
+    report    - compression, memory, iterations and residual of the solve                  [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    n_cases, n_cp = np.shape(RHS)
+    LE_ind        = VD.leading_edge_indices
+    geometry      = compute_horseshoe_geometry(VD,np.float64)
+    s             = np.abs(geometry.y1bar)
+    GAMMA         = np.zeros((n_cases,n_cp))
+    EW_GAMMA      = np.zeros((n_cases,np.sum(LE_ind)))
+    block_size    = settings.influence_matrix_block_size
+    if block_size is None:
+        block_size = settings.hierarchical_matrix.leaf_size
+    
+    report                  = Data()
+    report.compression      = 0.
+    report.matrix_memory    = 0
+    report.dense_memory     = 0
+    report.gmres_iterations = 0
+    report.residual         = 0.
+    
+    for i_mach, mach in enumerate(m_unique[:,0]):
+        cases = np.where(inv == i_mach)[0]
+        if len(cases) == 0:
+            continue
+        
+        if mach < 1.:
+            H = compute_hierarchical_influence_matrix(VD,mach,delta,phi,settings,geometry=geometry)
+            GAMMA[cases], iterations, residual = solve_hierarchical_influence_matrix(H,RHS[cases],settings)
+            
+            H_LE = compute_hierarchical_influence_matrix(VD,mach,delta,phi,settings,rows=LE_ind,compute_EW=True,
+                                                         geometry=geometry,column_tree=H.column_tree)
+            EW_GAMMA[cases] = hierarchical_matrix_product(H_LE,GAMMA[cases].T).T
+            
+            report.compression      = max(report.compression,H.compression)
+            report.matrix_memory   += H.memory + H_LE.memory
+            report.gmres_iterations = max(report.gmres_iterations,iterations)
+            report.residual         = max(report.residual,residual)
+        else:
+            A, s_block, RFLAG, EW_LE, block_report = compute_influence_matrix_blocks(VD,m_unique[[i_mach]],delta,phi,block_size,settings)
+            
+            # Turn off sonic vortices when Mach>1
+            GAMMA[cases]    = solve_influence_matrix_blocks(A,RHS[cases]*RFLAG,np.zeros(len(cases),dtype=int),block_size,block_report)
+            EW_GAMMA[cases] = (EW_LE[0] @ GAMMA[cases].T).T
+            
+            report.matrix_memory += block_report.matrix_memory
+            report.residual       = max(report.residual,block_report.residual)
+            
+        report.dense_memory += 8*n_cp*n_cp
+    
+    return GAMMA, s, EW_GAMMA, report
+
 # ----------------------------------------------------------------------
 #  CLE rotation effects helper function
 # ----------------------------------------------------------------------
-def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+def compute_rotation_effects(VD, settings, EW_GAMMA, X, CHORD, XLE, XBAR, 
                              rhs, COSINP, SINALF,COSCOS, PITCH, ROLL, YAW, STB, RNMAX):
     """ This computes the effects of the freestream and aircraft rotation rate on 
     CLE, the induced flow at the leading edge
@@ -575,11 +861,8 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     ##    return 0 #CLE not calculated till later for linear spacing
     
     # Computate rotational effects (pitch, roll, yaw rates) on LE suction
-    # pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
-    EW    = EW_small[: ,LE_ind, :]
-    n_tot_strips = EW.shape[1]
-    gamma = np.array(np.split(np.repeat(GAMMA, n_tot_strips, axis=0), len_mach))
-    CLE = (EW*gamma).sum(axis=2)
+    # EW_GAMMA is the normalwash induced by the vortices on the leading edge strips
+    CLE = EW_GAMMA
     
     # Up till EFFINC, some of the following values were computed in compute_RHS_matrix().
     #     EFFINC and ALOC are calculated the exact same way, except for the XGIRO term.
@@ -650,9 +933,9 @@ def compute_induced_drag(cl, alpha, x_dist, y_dist, z_dist, chord_dist, SURF, n_
         cl_segments = cl[:, wing_span_index_previous:wing_span_index]
         
         # Control points 
-        y_control_points = np.tile(y_dist[wing_span_index_previous:wing_span_index][None,:],(n_cases,1))
-        z_control_points = np.tile(z_dist[wing_span_index_previous:wing_span_index][None,:],(n_cases,1))
-        x_control_points = np.tile(x_dist[wing_span_index_previous:wing_span_index][None,:],(n_cases,1))
+        y_control_points = y_dist[wing_span_index_previous:wing_span_index][None,:]
+        z_control_points = z_dist[wing_span_index_previous:wing_span_index][None,:]
+        x_control_points = x_dist[wing_span_index_previous:wing_span_index][None,:]
 
         # Centerpoints 
         y_centerpoints = (y_control_points[:,:-1] + y_control_points[:,1:]) / 2
@@ -661,7 +944,7 @@ def compute_induced_drag(cl, alpha, x_dist, y_dist, z_dist, chord_dist, SURF, n_
 
         # Shed vortex segments for this case
         differences = np.diff(y_control_points,axis=1)
-        direction   = np.sign(differences) * np.ones_like(y_centerpoints)
+        direction   = np.sign(differences) * np.ones((n_cases,wing_segments-1))
         shed_vortex_segments = direction * np.diff(circulation_segments, axis=1)
 
         # Trefftz Plane Y-Z location:
@@ -670,39 +953,29 @@ def compute_induced_drag(cl, alpha, x_dist, y_dist, z_dist, chord_dist, SURF, n_
         TP_y_control_points = y_control_points
         TP_z_control_points = np.cos(alpha) * z_control_points - np.sin(alpha) * x_control_points
 
-        V_induced = np.zeros_like(y_control_points)
-        for j in range(len(y_control_points[0])): # Loop through each control point
-            # Distance from segment to control point
-            A = ( np.tile(TP_y_control_points[:,j][:, None],(1,len(TP_y_centerpoints[0]) ))  - TP_y_centerpoints)**2
-            B = ( np.tile(TP_z_control_points[:,j][:, None],(1,len(TP_z_centerpoints[0]))) - TP_z_centerpoints)**2
-            r = (A + B) ** (0.5)
-            
-            # Calculate normal vector to the wake trace
-            if len(TP_y_control_points[0]) < 2 or len(TP_z_control_points[0]) < 2 : 
-                slope =  np.zeros((n_cases,1)) 
-                V_induced[:,j] = 0                
-            else:
-                slope = np.gradient(TP_z_control_points, TP_y_control_points[0],axis=1)
-            
-                # Normal vector to the wake trace
-                n_hat      = np.zeros((n_cases,2 ))
-                n_hat[:,0] = np.cos(np.arctan2(-1, slope[:,j]))
-                n_hat[:,1] = np.sin(np.arctan2(-1, slope[:,j]))
-                
-                # Calculate induced velocity vector
-                v_hat         =  np.zeros((n_cases ,2, len(TP_z_centerpoints[0]) ))
-                v_hat[:,0,:]  = -1*( np.tile(TP_z_control_points[:,j][:, None],(1,len(TP_z_centerpoints[0]))) - TP_z_centerpoints)/r
-                v_hat[:,1,:]  =    ( np.tile(TP_y_control_points[:,j][:, None],(1,len(TP_y_centerpoints[0]) ))  - TP_y_centerpoints)/r 
-                v = v_hat * np.tile(shed_vortex_segments[:,None,:],(1, 2,1)) / (2*np.pi*np.tile(r[:,None, :],(1, 2, 1)))
-                
-                # Downwash. Dot product of normal vector and induced velocity vector.
-                V_induced[:,j] = np.sum( np.tile(n_hat[:,0][:, None], (1,len(TP_z_centerpoints[0]) )) *v[:,0,:] +  np.tile(n_hat[:,1][:, None], (1,len(TP_z_centerpoints[0]) ))*v[:,1,:], axis=1) 
-
-        drag_sum = np.sqrt(np.square(y_control_points[:, 0]) + np.square(z_control_points[:, 0]))
-        s_wake   = np.atleast_2d(deepcopy(drag_sum)).T
-        for j in range(1,len(y_control_points[0])): 
-            drag_sum +=  np.sqrt(np.square(y_control_points[:,j] - y_control_points[:,j-1]) + np.square(z_control_points[:,j] - z_control_points[:,j-1]))
-            s_wake    =  np.hstack((s_wake, np.atleast_2d(drag_sum).T))
+        V_induced = np.zeros((n_cases,wing_segments),dtype=y_dist.dtype)
+        if wing_segments >= 2:
+            # Distance from every shed segment (last axis) to every control point (middle axis)
+            dy = TP_y_control_points[:,:,None] - TP_y_centerpoints[:,None,:]
+            dz = TP_z_control_points[:,:,None] - TP_z_centerpoints[:,None,:]
+            r  = (dy**2 + dz**2) ** (0.5)
+
+            # Normal vector to the wake trace
+            slope   = np.gradient(TP_z_control_points, TP_y_control_points[0],axis=1)
+            n_hat_y = np.cos(np.arctan2(-1, slope))[:,:,None]
+            n_hat_z = np.sin(np.arctan2(-1, slope))[:,:,None]
+
+            # Induced velocity vector
+            gamma = shed_vortex_segments[:,None,:]
+            v_y   = (-1*dz/r) * gamma / (2*np.pi*r)
+            v_z   = (   dy/r) * gamma / (2*np.pi*r)
+
+            # Downwash. Dot product of normal vector and induced velocity vector.
+            V_induced[:] = np.sum(n_hat_y*v_y + n_hat_z*v_z, axis=2)
+
+        # Wake arc length along the span
+        segment_lengths = np.sqrt(np.square(np.diff(y_control_points[0])) + np.square(np.diff(z_control_points[0])))
+        s_wake          = np.cumsum(np.concatenate((np.sqrt(np.square(y_control_points[0,:1]) + np.square(z_control_points[0,:1])),segment_lengths)))
         D_induced[:,wing_index] = -0.5 * rho * trapezoid(V_induced * circulation_segments, s_wake, axis=1)
 
         # Per-wing CDi (using wing's reference area)
@@ -9,6 +9,7 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
 from .build_VLM_surrogates                    import build_VLM_surrogates  
 from .compute_RHS_matrix                      import compute_RHS_matrix 
+from .compute_hierarchical_influence_matrix   import compute_hierarchical_influence_matrix, hierarchical_matrix_product, solve_hierarchical_influence_matrix
 from .compute_wing_induced_velocity           import compute_wing_induced_velocity
 from .deflect_control_surface                 import deflect_control_surfaces
 from .extract_wing_collocation_points         import extract_wing_collocation_points
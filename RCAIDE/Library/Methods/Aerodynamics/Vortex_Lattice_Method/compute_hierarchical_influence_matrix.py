@@ -0,0 +1,430 @@
+# compute_hierarchical_influence_matrix.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+from .compute_wing_induced_velocity import compute_wing_induced_velocity, compute_horseshoe_geometry
+
+# package imports
+import numpy as np
+from scipy.linalg        import lu_factor, lu_solve
+from scipy.sparse.linalg import LinearOperator, gmres
+
+# ----------------------------------------------------------------------
+#  Hierarchical Influence Matrix
+# ----------------------------------------------------------------------
+def compute_hierarchical_influence_matrix(VD, mach, delta, phi, settings, rows=None, compute_EW=False, geometry=None, column_tree=None):
+    """ This builds a hierarchical matrix of the aerodynamic influence coefficients for a subsonic
+    mach number. The control points and horseshoe vortices are split into a cluster tree. Blocks of
+    well separated clusters are compressed to low rank by adaptive cross approximation, the others
+    are computed in full with compute_wing_induced_velocity.
+
+    Assumptions:
+    Trailing vortex legs infinity are alligned to freestream, so a cluster of horseshoe vortices
+    extends downstream to infinity. Separation is measured after the Prandtl-Glauert transformation.
+    The influence coefficients are computed in double precision, as the far field influence of a
+    horseshoe vortex is a small difference of its legs and is lost to noise in single precision.
+
+    Source:
+    1. Hackbusch, W., "Hierarchical Matrices: Algorithms and Analysis", Springer, 2015
+
+    2. Bebendorf, M., "Approximation of boundary element matrices", Numerische Mathematik, 2000
+
+    Inputs:
+    VD                                       - vehicle vortex distribution                    [Unitless]
+    mach                                     - subsonic mach number                           [Unitless]
+    delta                                    - mean camber surface angle of each panel        [radians]
+    phi                                      - dihedral angle of each panel                   [radians]
+    settings.use_VORLAX_matrix_calculation   - influence matrix equation switch               [boolean]
+    settings.hierarchical_matrix.
+      tolerance                              - relative accuracy of the low rank blocks       [Unitless]
+      leaf_size                              - control points of the smallest clusters        [Unitless]
+      admissibility                          - cluster diameter to separation ratio           [Unitless]
+    rows                                     - receiving control points, all if None          [Unitless]
+    compute_EW                               - approximate the VORLAX frame normalwash        [boolean]
+    geometry                                 - horseshoe geometry                             [Unitless]
+    column_tree                              - cluster tree of the horseshoe vortices         [Unitless]
+
+    Outputs:
+    H.
+      n_rows, n_columns                      - size of the matrix                             [Unitless]
+      dense                                  - row and column indices and entries of full blocks
+      low_rank                               - row and column indices and factors of compressed blocks
+      diagonal                               - LU factors of the full diagonal blocks         [Unitless]
+      column_tree                            - cluster tree of the horseshoe vortices         [Unitless]
+      compression                            - stored entries over entries of the matrix      [Unitless]
+      memory                                 - memory of the blocks                           [bytes]
+
+    Properties Used:
+    N/A
+    """
+    hierarchical_settings = settings.hierarchical_matrix
+    leaf_size             = hierarchical_settings.leaf_size
+    n_cp                  = VD.n_cp
+    beta                  = np.sqrt(1. - float(mach)**2)
+    if geometry is None:
+        geometry = compute_horseshoe_geometry(VD,np.float64)
+
+    # kernel of the blocks
+    kernel            = Data()
+    kernel.VD         = VD
+    kernel.mach       = np.atleast_2d(mach)
+    kernel.geometry   = geometry
+    kernel.compute_EW = compute_EW or settings.use_VORLAX_matrix_calculation
+    kernel.C_x        = np.sin(delta)*np.cos(phi)
+    kernel.C_y        = np.cos(delta)*np.sin(phi)
+    kernel.C_z        = np.cos(phi)*np.cos(delta)
+
+    # cluster trees of the horseshoe vortices and of the control points, in the Prandtl-Glauert frame
+    scale          = np.array([1.,beta,beta])
+    control_points = np.stack([VD.XC,VD.YC,VD.ZC],axis=-1)*scale
+    if column_tree is None:
+        vortex_ends  = np.stack([np.concatenate([VD.XAH,VD.XBH]),np.concatenate([VD.YAH,VD.YBH]),np.concatenate([VD.ZAH,VD.ZBH])],axis=-1)*scale
+        column_tree  = cluster_tree(control_points,np.arange(n_cp),leaf_size,vortex_ends)
+    if rows is None:
+        row_tree     = column_tree
+        row_indices  = np.arange(n_cp)
+    else:
+        row_indices  = np.arange(n_cp)[rows]
+        row_tree     = cluster_tree(control_points,row_indices,leaf_size)
+
+    H           = Data()
+    H.n_rows    = n_cp if rows is None else len(row_indices)
+    H.n_columns = n_cp
+    H.dense     = []
+    H.low_rank  = []
+    H.diagonal  = []
+    H.column_tree = column_tree
+    H.local     = np.zeros(n_cp,dtype=int) # position of each control point among the rows
+    H.local[row_indices] = np.arange(len(row_indices))
+
+    build_blocks(H, kernel, row_tree, column_tree, hierarchical_settings)
+
+    n_stored      = sum(D.size for I, J, D in H.dense) + sum(U.size + V.size for I, J, U, V in H.low_rank)
+    H.compression = n_stored / (H.n_rows*H.n_columns)
+    H.memory      = 8*n_stored
+
+    # factorize the full diagonal blocks for the block Jacobi preconditioner
+    if rows is None:
+        for I, J, D in H.dense:
+            if len(I) == len(J) and np.array_equal(I,J):
+                H.diagonal.append((I,lu_factor(D)))
+
+    return H
+
+def build_blocks(H, kernel, row_node, column_node, hierarchical_settings):
+    """ This recursively splits a block of the matrix until its clusters are well separated,
+    when it is compressed, or until they are leaves, when it is computed in full. Well separated
+    blocks that do not compress are split further, unless they are small.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    H                      - hierarchical matrix                [Unitless]
+    kernel                 - kernel of the blocks               [Unitless]
+    row_node               - cluster of control points          [Unitless]
+    column_node            - cluster of horseshoe vortices      [Unitless]
+    hierarchical_settings  - tolerance and admissibility        [Unitless]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    I = row_node.indices
+    J = column_node.indices
+
+    if admissible(row_node, column_node, hierarchical_settings.admissibility):
+        max_rank = min(len(I)//4,len(J)//4,hierarchical_settings.leaf_size)
+        
+        # small blocks are cheaper to compute at once than a row and a column at a time
+        if len(I)*len(J) <= 4*hierarchical_settings.leaf_size**2:
+            D          = evaluate_kernel(kernel,I,J)
+            get_row    = lambda i: D[i]
+            get_column = lambda j: D[:,j]
+        else:
+            D          = None
+            get_row    = lambda i: evaluate_kernel(kernel,I[[i]],J)[0]
+            get_column = lambda j: evaluate_kernel(kernel,I,J[[j]])[:,0]
+        
+        U, V = adaptive_cross_approximation(get_row, get_column, len(I), len(J), hierarchical_settings.tolerance, max_rank)
+        if U is not None:
+            H.low_rank.append((H.local[I],J,U,V))
+            return
+        elif D is not None:
+            H.dense.append((H.local[I],J,D))
+            return
+
+    row_leaf    = len(row_node.children) == 0
+    column_leaf = len(column_node.children) == 0
+    if row_leaf and column_leaf:
+        H.dense.append((H.local[I],J,evaluate_kernel(kernel,I,J)))
+    elif row_leaf:
+        for column_child in column_node.children:
+            build_blocks(H, kernel, row_node, column_child, hierarchical_settings)
+    elif column_leaf:
+        for row_child in row_node.children:
+            build_blocks(H, kernel, row_child, column_node, hierarchical_settings)
+    else:
+        for row_child in row_node.children:
+            for column_child in column_node.children:
+                build_blocks(H, kernel, row_child, column_child, hierarchical_settings)
+
+    return
+
+def cluster_tree(points, indices, leaf_size, vortex_ends=None):
+    """ This splits a set of panels into a binary tree of clusters, halving each cluster across
+    the longest side of the box bounding its control points
+
+    Assumptions:
+    A cluster of horseshoe vortices extends downstream to infinity
+
+    Source:
+    None
+
+    Inputs:
+    points        - control points of every panel                      [m]
+    indices       - panels of the cluster                               [Unitless]
+    leaf_size     - largest number of panels of a leaf                  [Unitless]
+    vortex_ends   - ends of the bound leg of every horseshoe vortex     [m]
+
+    Outputs:
+    node.
+      indices     - panels of the cluster                               [Unitless]
+      box         - box bounding the control points                     [m]
+      vortex_box  - box bounding the horseshoe vortices                 [m]
+      diameter    - diameter of the cluster, bound vortex legs included [m]
+      children    - clusters of the two halves                          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_cp            = len(points)
+    cluster_points  = points[indices]
+    node            = Data()
+    node.indices    = indices
+    node.box        = np.array([np.min(cluster_points,axis=0),np.max(cluster_points,axis=0)])
+    node.vortex_box = None
+    node.diameter   = np.linalg.norm(node.box[1] - node.box[0])
+    node.children   = []
+    if vortex_ends is not None:
+        ends            = np.concatenate([vortex_ends[indices],vortex_ends[indices + n_cp]])
+        node.vortex_box = np.array([np.min(ends,axis=0),np.max(ends,axis=0)])
+        node.diameter   = max(node.diameter,np.linalg.norm(node.vortex_box[1] - node.vortex_box[0]))
+        node.vortex_box[1,0] = np.inf
+
+    if len(indices) > leaf_size:
+        axis   = np.argmax(node.box[1] - node.box[0])
+        order  = np.argsort(cluster_points[:,axis],kind='stable')
+        half   = len(indices) // 2
+        node.children = [cluster_tree(points,indices[order[:half]],leaf_size,vortex_ends),
+                         cluster_tree(points,indices[order[half:]],leaf_size,vortex_ends)]
+
+    return node
+
+def admissible(row_node, column_node, eta):
+    """ This checks if a cluster of control points and a cluster of horseshoe vortices are separated
+    enough for their interaction to be smooth
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    row_node     - cluster of control points          [Unitless]
+    column_node  - cluster of horseshoe vortices      [Unitless]
+    eta          - admissibility parameter            [Unitless]
+
+    Outputs:
+    admissible   - separation criterion               [boolean]
+
+    Properties Used:
+    N/A
+    """
+    row_box    = row_node.box
+    column_box = column_node.vortex_box
+    gap        = np.maximum(0.,np.maximum(row_box[0] - column_box[1],column_box[0] - row_box[1]))
+    distance   = np.sqrt(np.sum(gap**2))
+    if distance == 0.:
+        return False
+
+    return max(row_node.diameter,column_node.diameter) <= eta*distance
+
+def evaluate_kernel(kernel, I, J):
+    """ This computes the influence coefficients of the horseshoe vortices J on the control points I
+
+    Assumptions:
+    Subsonic mach number
+
+    Source:
+    None
+
+    Inputs:
+    kernel       - kernel of the blocks               [Unitless]
+    I            - control points                     [Unitless]
+    J            - horseshoe vortices                 [Unitless]
+
+    Outputs:
+    A            - influence coefficients             [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    C_mn, s, RFLAG, EW = compute_wing_induced_velocity(kernel.VD,kernel.mach,compute_EW=kernel.compute_EW,rows=I,columns=J,geometry=kernel.geometry)
+    if kernel.compute_EW:
+        return np.array(EW[0],dtype=np.float64)
+
+    # validated from book eqn 7.42
+    A =   np.multiply(C_mn[0,:,:,0],np.atleast_2d(kernel.C_x[I]).T) \
+        + np.multiply(C_mn[0,:,:,1],np.atleast_2d(kernel.C_y[I]).T) \
+        - np.multiply(C_mn[0,:,:,2],np.atleast_2d(kernel.C_z[I]).T)
+
+    return A
+
+def adaptive_cross_approximation(get_row, get_column, n_rows, n_columns, tolerance, max_rank):
+    """ This approximates a block of the matrix by the product of two low rank factors built from
+    some of its rows and columns, chosen by partial pivoting
+
+    Assumptions:
+    None
+
+    Source:
+    Bebendorf, M., "Approximation of boundary element matrices", Numerische Mathematik, 2000
+
+    Inputs:
+    get_row      - function returning a row of the block      [Unitless]
+    get_column   - function returning a column of the block   [Unitless]
+    n_rows       - rows of the block                          [Unitless]
+    n_columns    - columns of the block                       [Unitless]
+    tolerance    - relative accuracy in Frobenius norm        [Unitless]
+    max_rank     - largest rank of the approximation          [Unitless]
+
+    Outputs:
+    U, V         - factors, None if the rank is too large     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    U         = np.zeros((n_rows,max_rank))
+    V         = np.zeros((max_rank,n_columns))
+    used_rows = np.zeros(n_rows,dtype=bool)
+    norm_sq   = 0.
+    i         = 0
+
+    for k in range(max_rank):
+        used_rows[i] = True
+        row          = get_row(i) - U[i,:k] @ V[:k]
+        j            = np.argmax(np.abs(row))
+        if row[j] == 0.:
+            if np.all(used_rows):
+                return U[:,:k], V[:k]
+            i = np.argmin(used_rows)
+            continue
+
+        column  = get_column(j) - U[:,:k] @ V[:k,j]
+        V[k]    = row/row[j]
+        U[:,k]  = column
+
+        # update the Frobenius norm of the approximation
+        u_norm  = np.linalg.norm(U[:,k])
+        v_norm  = np.linalg.norm(V[k])
+        norm_sq = norm_sq + (u_norm*v_norm)**2 + 2.*np.sum((U[:,:k].T @ U[:,k])*(V[:k] @ V[k]))
+        if u_norm*v_norm <= tolerance*np.sqrt(abs(norm_sq)):
+            return U[:,:k+1], V[:k+1]
+
+        i = np.argmax(np.where(used_rows,-1.,np.abs(U[:,k])))
+
+    return None, None
+
+def hierarchical_matrix_product(H, x):
+    """ This multiplies a hierarchical matrix by a vector or a matrix
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    H            - hierarchical matrix      [Unitless]
+    x            - vector or matrix         [Unitless]
+
+    Outputs:
+    y            - H times x                [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    y = np.zeros((H.n_rows,) + np.shape(x)[1:])
+    for I, J, D in H.dense:
+        y[I] += D @ x[J]
+    for I, J, U, V in H.low_rank:
+        y[I] += U @ (V @ x[J])
+    return y
+
+def solve_hierarchical_influence_matrix(H, RHS, settings):
+    """ This solves for the vortex strengths of every case with GMRES, preconditioned by the
+    inverse of the full diagonal blocks of the hierarchical matrix
+
+    Assumptions:
+    None
+
+    Source:
+    Saad, Y., and Schultz, M. H., "GMRES: A generalized minimal residual algorithm for solving
+    nonsymmetric linear systems", SIAM J. Sci. Stat. Comput., 1986
+
+    Inputs:
+    H                                          - hierarchical matrix                 [Unitless]
+    RHS                                        - right hand side of each case        [Unitless]
+    settings.hierarchical_matrix.solver_tolerance - relative residual of the solve   [Unitless]
+    settings.hierarchical_matrix.maximum_iterations                                  [Unitless]
+
+    Outputs:
+    GAMMA                                      - vortex strengths                    [Unitless]
+    iterations                                 - most iterations of a case           [Unitless]
+    residual                                   - largest relative residual           [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_cp      = H.n_rows
+    tolerance = settings.hierarchical_matrix.solver_tolerance
+
+    def precondition(r):
+        z = np.array(r,dtype=np.float64)
+        for I, LU in H.diagonal:
+            z[I] = lu_solve(LU,r[I])
+        return z
+
+    A = LinearOperator((n_cp,n_cp),matvec=lambda x: hierarchical_matrix_product(H,x),dtype=np.float64)
+    M = LinearOperator((n_cp,n_cp),matvec=precondition,dtype=np.float64)
+
+    GAMMA      = np.zeros(np.shape(RHS))
+    iterations = 0
+    residual   = 0.
+    for i_case in range(len(RHS)):
+        b = RHS[i_case]
+        if not np.any(b):
+            continue
+        counter = [0]
+        def count(pr_norm):
+            counter[0] += 1
+        x, info = gmres(A,b,x0=precondition(b),M=M,rtol=tolerance,restart=100,
+                        maxiter=settings.hierarchical_matrix.maximum_iterations,callback=count,callback_type='pr_norm')
+        GAMMA[i_case] = x
+        iterations    = max(iterations,counter[0])
+        residual      = max(residual,np.linalg.norm(b - hierarchical_matrix_product(H,x))/np.linalg.norm(b))
+
+    return GAMMA, iterations, residual
@@ -10,8 +10,9 @@
 
 # package imports 
 import numpy as np 
+from RCAIDE.Framework.Core import Data
 
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,rows=None,columns=None,geometry=None):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -19,6 +20,10 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    The velocities can be computed on a block of control points (rows) and of horseshoe vortices 
+    (columns) so that large vortex lattices are built a block at a time. Supersonic mach numbers 
+    need a slice of rows and every horseshoe vortex.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,6 +34,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     Inputs: 
     VD       - vehicle vortex distribution                    [Unitless] 
     mach                                                      [Unitless] 
+    rows     - receiving control points, all if None          [-] 
+    columns  - inducing horseshoe vortices, all if None       [-] 
+    geometry - horseshoe geometry, see compute_horseshoe_geometry
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
@@ -46,83 +54,32 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     TE_ind       = VD.trailing_edge_indices
     n_cp         = VD.n_cp
     n_mach       = len(mach)
-    mach         = np.array(mach,dtype=np.float32)
-
-    # Control points from the VLM 
-    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=np.float32)
-    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=np.float32)
-    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=np.float32)
-    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=np.float32)
-    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=np.float32)
-    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=np.float32)
-    XA1   = np.array(np.atleast_2d(VD.XA1*1.),dtype=np.float32)
-    YA1   = np.array(np.atleast_2d(VD.YA1*1.),dtype=np.float32)
-    ZA1   = np.array(np.atleast_2d(VD.ZA1*1.),dtype=np.float32)
-    XB1   = np.array(np.atleast_2d(VD.XB1*1.),dtype=np.float32)
-    YB1   = np.array(np.atleast_2d(VD.YB1*1.),dtype=np.float32)
-    ZB1   = np.array(np.atleast_2d(VD.ZB1*1.),dtype=np.float32)
-    XA2   = np.array(np.atleast_2d(VD.XA2*1.),dtype=np.float32)
-    YA2   = np.array(np.atleast_2d(VD.YA2*1.),dtype=np.float32)
-    ZA2   = np.array(np.atleast_2d(VD.ZA2*1.),dtype=np.float32)
-    XB2   = np.array(np.atleast_2d(VD.XB2*1.),dtype=np.float32)
-    YB2   = np.array(np.atleast_2d(VD.YB2*1.),dtype=np.float32)
-    ZB2   = np.array(np.atleast_2d(VD.ZB2*1.),dtype=np.float32)
-    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=np.float32)
-    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=np.float32)
-    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=np.float32)
-    XA_TE = np.array(np.atleast_2d(VD.XA_TE*1.),dtype=np.float32)
-    XB_TE = np.array(np.atleast_2d(VD.XB_TE*1.),dtype=np.float32)
-    
-    
-    # Panel Dihedral Angle, using AH and BH location
-    D      = np.sqrt((YAH-YBH)**2+(ZAH-ZBH)**2)
-    COS_DL = (YBH-YAH)/D    
-    DL     = np.arccos(COS_DL)
-    DL[DL>np.pi/2] = DL[DL>np.pi/2] - np.pi # This flips the dihedral angle for the other side of the wing
-    
+    if rows is None:
+        rows     = slice(0,n_cp)
+    if columns is None:
+        columns  = slice(0,n_cp)
+    if geometry is None:
+        geometry = compute_horseshoe_geometry(VD)
+    precision    = geometry.XC.dtype
+    mach         = np.array(mach,dtype=precision)
+
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
     # ------------------------------------------------------------------------------------------- 
-    # If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
-    boolean = YAH>YBH
-    XA1[boolean], XB1[boolean] = XB1[boolean], XA1[boolean]
-    YA1[boolean], YB1[boolean] = YB1[boolean], YA1[boolean]
-    ZA1[boolean], ZB1[boolean] = ZB1[boolean], ZA1[boolean]
-    XA2[boolean], XB2[boolean] = XB2[boolean], XA2[boolean]
-    YA2[boolean], YB2[boolean] = YB2[boolean], YA2[boolean]
-    ZA2[boolean], ZB2[boolean] = ZB2[boolean], ZA2[boolean]    
-    XAH[boolean], XBH[boolean] = XBH[boolean], XAH[boolean]
-    YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
-    ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
-
-    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
-    
-    # These vortices will use AH and BH, rather than the typical location
-    xa = XAH
-    ya = YAH
-    za = ZAH
-    xb = XBH
-    yb = YBH
-    zb = ZBH
-    
-    # This is not the control point for the panel, its the middle front of the vortex
-    xc = 0.5*(xa+xb)
-    yc = 0.5*(ya+yb)
-    zc = 0.5*(za+zb)
+    # Horseshoe vortices and control points
+    xc       = geometry.xc[:,columns]
+    yc       = geometry.yc[:,columns]
+    zc       = geometry.zc[:,columns]
+    costheta = geometry.costheta[:,columns]
+    sintheta = geometry.sintheta[:,columns]
+    x1bar    = geometry.x1bar[:,columns]
+    y1bar    = geometry.y1bar[:,columns]
+    DL       = geometry.DL
     
     # This is the receiving point, or the control points
-    xo = XC.T
-    yo = YC.T
-    zo = ZC.T
-    
-    # Incline the vortex
-    theta    = np.arctan2(zb-za,yb-ya)
-    costheta = np.cos(theta)
-    sintheta = np.sin(theta)
-    
-    # rotated axes
-    x1bar = (xb - xc)
-    y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
+    xo = geometry.XC[:,rows].T
+    yo = geometry.YC[:,rows].T
+    zo = geometry.ZC[:,rows].T
     
     xobar = (xo - xc)
     yobar = (yo - yc)*costheta + (zo - zc)*sintheta
@@ -170,9 +127,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     RO2_sub  = B2_sub*RTV2
     
     # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
+    U = np.zeros((n_mach,shape_0,shape_1),dtype=precision)
+    V = np.zeros((n_mach,shape_0,shape_1),dtype=precision)
+    W = np.zeros((n_mach,shape_0,shape_1),dtype=precision)    
     
     if np.sum(sub)>0:
         # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
@@ -185,13 +142,15 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     RO1_sup     = B2[sup,:,:]*RTV1
     RO2_sup     = B2[sup,:,:]*RTV2
     RNMAX       = VD.panels_per_strip
-    CHORD       = VD.chord_lengths
-    CHORD       = np.repeat(CHORD,shape_0,axis=0)
     RFLAG       = np.ones((n_mach,shape_1),dtype=np.int8)
     
     if np.sum(sup)>0:
+        if not isinstance(columns,slice) or columns != slice(0,n_cp):
+            raise ValueError('supersonic induced velocities need every horseshoe vortex')
+        CHORD = VD.chord_lengths
+        CHORD = np.repeat(CHORD,shape_0,axis=0)
         U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
+                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind,rows)
          
     
     # Rotate into the vehicle frame and pack into a velocity matrix
@@ -201,8 +160,8 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     if compute_EW == True:
         # Calculate the W velocity in the VORLAX frame for later calcs
         # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
+        COS1   = np.cos(DL[:,rows].T - DL[:,columns])
+        SIN1   = np.sin(DL[:,rows].T - DL[:,columns]) 
         WEIGHT = 1
         
         EW = (W*COS1-V*SIN1)*WEIGHT
@@ -213,6 +172,95 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
 
     return C_mn, s, RFLAG, EW
     
+def compute_horseshoe_geometry(VD,precision=np.float32):
+    """ This computes the position and inclination of the horseshoe vortex of each panel, in 
+    the frame of its bound leg, so that the induced velocities of several blocks of control 
+    points can be computed without repeating it. The induced velocities are computed in the 
+    precision of the geometry.
+
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    VD        - vehicle vortex distribution                    [Unitless] 
+    precision - floating point precision                       [float32/64] 
+    
+    Outputs:                                
+    geometry.
+      XC, YC, ZC          - control points                    [m] 
+      xc, yc, zc          - middle front of the vortex        [m] 
+      costheta, sintheta  - inclination of the vortex         [-] 
+      x1bar, y1bar        - end of the bound leg, rotated     [m] 
+      DL                  - panel dihedral angle              [radians] 
+
+    Properties Used:
+    N/A
+    """
+    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=precision)
+    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=precision)
+    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=precision)
+    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=precision)
+    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=precision)
+    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=precision)
+    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=precision)
+    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=precision)
+    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=precision)
+    
+    # Panel Dihedral Angle, using AH and BH location
+    D      = np.sqrt((YAH-YBH)**2+(ZAH-ZBH)**2)
+    COS_DL = (YBH-YAH)/D    
+    DL     = np.arccos(COS_DL)
+    DL[DL>np.pi/2] = DL[DL>np.pi/2] - np.pi # This flips the dihedral angle for the other side of the wing
+    
+    # If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
+    boolean = YAH>YBH
+    XAH[boolean], XBH[boolean] = XBH[boolean], XAH[boolean]
+    YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
+    ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
+    
+    # These vortices will use AH and BH, rather than the typical location
+    xa = XAH
+    ya = YAH
+    za = ZAH
+    xb = XBH
+    yb = YBH
+    zb = ZBH
+    
+    # This is not the control point for the panel, its the middle front of the vortex
+    xc = 0.5*(xa+xb)
+    yc = 0.5*(ya+yb)
+    zc = 0.5*(za+zb)
+    
+    # Incline the vortex
+    theta    = np.arctan2(zb-za,yb-ya)
+    costheta = np.cos(theta)
+    sintheta = np.sin(theta)
+    
+    # rotated axes
+    x1bar = (xb - xc)
+    y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
+    
+    geometry          = Data()
+    geometry.XC       = XC
+    geometry.YC       = YC
+    geometry.ZC       = ZC
+    geometry.xc       = xc
+    geometry.yc       = yc
+    geometry.zc       = zc
+    geometry.costheta = costheta
+    geometry.sintheta = sintheta
+    geometry.x1bar    = x1bar
+    geometry.y1bar    = y1bar
+    geometry.DL       = DL
+    
+    return geometry
+    
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for subsonic mach numbers
@@ -283,7 +331,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind, rows):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -319,7 +367,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
-    
+    rows         slice of receiving control points            [-]
 
     
     Outputs:           
@@ -420,7 +468,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
+    size   = shape[2]
     n_mach = shape[0]    
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
@@ -447,14 +495,14 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     
     FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
     FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
+    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))[:,rows]
     
 
     # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.eye(shape[1],n_cp,k=rows.start,dtype=np.int8)
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -473,13 +521,8 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     W[FLAG_bool_rep]  = 0. # Default to zero
 
     # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
+    FLAG_ind          = np.array(np.where(FLAG_bool[:,:,0]))
+    FLAG_bool_self    = (FLAG_ind[0]*shape[1] + FLAG_ind[1])*size + FLAG_ind[1] + rows.start
     W                 = W.ravel()
     W[FLAG_bool_self] = 2. # It's own value, -2
     
@@ -130,14 +130,10 @@ def deflect_control_surface(VD,wing):
         zeta_prime_ch  = VD.ZCH[condition]
         zeta_prime     = VD.ZC [condition]
         
-        X_as = np.zeros_like(VD.X[condition_full][:-(n_cw+1)])
-        Y_as = np.zeros_like(VD.Y[condition_full][:-(n_cw+1)])
-        Z_as = np.zeros_like(VD.Z[condition_full][:-(n_cw+1)])
-        
-        
-        for idx_y in range(n_sw):
-            start     , stop      = idx_y*n_cw    , (idx_y+1)*n_cw
-            start_full, stop_full = idx_y*(n_cw+1), (idx_y+1)*(n_cw+1)
+        # the hinge is found on the first strip, all other strips are then deflected at once
+        for start, stop in [(0, n_cw), (n_cw, n_sw*n_cw)]:
+            if start == stop:
+                continue
             
             # pack strip values
             raw_VD = Data()
@@ -173,7 +169,7 @@ def deflect_control_surface(VD,wing):
             raw_VD.zeta_prime    = zeta_prime   [start:stop]
             
             # deflect the surface
-            raw_VD = deflect_control_surface_strip(wing, raw_VD, idx_y==0, sym_sign)
+            raw_VD = deflect_control_surface_strip(wing, raw_VD, start==0, sym_sign)
             
             # unpack strip values into surface values
             xi_prime_a1  [start:stop]  = raw_VD.xi_prime_a1  
@@ -208,10 +204,11 @@ def deflect_control_surface(VD,wing):
             y_prime      [start:stop]  = raw_VD.y_prime      
             zeta_prime_ch[start:stop]  = raw_VD.zeta_prime_ch
             zeta_prime   [start:stop]  = raw_VD.zeta_prime   
-            
-            X_as[start_full:stop_full] = np.append(raw_VD.xi_prime_a1  , raw_VD.xi_prime_a2  [-1])
-            Y_as[start_full:stop_full] = np.append(raw_VD.y_prime_a1   , raw_VD.y_prime_a2   [-1])
-            Z_as[start_full:stop_full] = np.append(raw_VD.zeta_prime_a1, raw_VD.zeta_prime_a2[-1])
+        
+        # inboard corners of every strip
+        X_as = np.concatenate([xi_prime_a1.reshape(n_sw,n_cw)  , xi_prime_a2.reshape(n_sw,n_cw)  [:,-1:]], axis=1).ravel()
+        Y_as = np.concatenate([y_prime_a1.reshape(n_sw,n_cw)   , y_prime_a2.reshape(n_sw,n_cw)   [:,-1:]], axis=1).ravel()
+        Z_as = np.concatenate([zeta_prime_a1.reshape(n_sw,n_cw), zeta_prime_a2.reshape(n_sw,n_cw)[:,-1:]], axis=1).ravel()
         
         # pack surface VD values into vehicle VD    
         VD.XA1[condition]    = xi_prime_a1    
@@ -245,9 +242,9 @@ def deflect_control_surface(VD,wing):
         VD.ZCH[condition]    = zeta_prime_ch  
         VD.ZC [condition]    = zeta_prime    
         
-        X_last_bs = np.append(raw_VD.xi_prime_b1  , raw_VD.xi_prime_b2  [-1])
-        Y_last_bs = np.append(raw_VD.y_prime_b1   , raw_VD.y_prime_b2   [-1])
-        Z_last_bs = np.append(raw_VD.zeta_prime_b1, raw_VD.zeta_prime_b2[-1])
+        X_last_bs = np.append(xi_prime_b1  [-n_cw:], xi_prime_b2  [-1])
+        Y_last_bs = np.append(y_prime_b1   [-n_cw:], y_prime_b2   [-1])
+        Z_last_bs = np.append(zeta_prime_b1[-n_cw:], zeta_prime_b2[-1])
         
         VD.X[condition_full] = np.append(X_as, X_last_bs)
         VD.Y[condition_full] = np.append(Y_as, Y_last_bs)
@@ -281,8 +278,8 @@ def deflect_control_surface_strip(wing, raw_VD, is_first_strip, sym_sign):
     wing.deflection_last - last deflection applied to this wing           [radians]
     wing.deflection      - deflection to set this wing to.                [radians]
     
-    raw_VD               - undeflected VD pertaining a strip of wing      [Unitless] 
-    is_first_strip       - whether this is the first strip of wing        [Unitless]
+    raw_VD               - undeflected VD pertaining to strips of wing    [Unitless] 
+    is_first_strip       - whether raw_VD is the first strip of wing      [Unitless]
     sym_sign             - 1 for original side, -1 for symmetric side     [Unitless]
     
     Outputs:      
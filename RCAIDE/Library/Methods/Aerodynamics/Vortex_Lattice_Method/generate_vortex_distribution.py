@@ -125,106 +125,133 @@ def generate_vortex_distribution(geometry,settings):
         pass
     
     # ---------------------------------------------------------------------------------------
-    # STEP 1: Define empty vectors for coordinates of panes, control points and bound vortices
+    # STEP 1: Lay out the strips of every wing and count the panels of the vehicle
+    # ---------------------------------------------------------------------------------------
+    #reformat/preprocess wings and control surfaces for VLM panelization
+    VLM_wings = make_VLM_wings(geometry, settings)
+
+    # wings first, then control surface wings, which are given their required y-coords by their owning wing
+    airfoils    = {}
+    wing_strips = []
+    for wing in VLM_wings:
+        if not wing.is_a_control_surface:
+            wing_strips.append(compute_wing_strips(VLM_wings,wing,n_cw_wing,n_sw_wing,spc,airfoils))
+    for wing in VLM_wings:
+        if wing.is_a_control_surface:
+            wing_strips.append(compute_wing_strips(VLM_wings,wing,n_cw_wing,n_sw_wing,spc,airfoils))
+
+    n_surfaces = 0
+    n_strips   = 0
+    n_panels   = 0
+    n_points   = 0
+    for strips in wing_strips:
+        n_sides     = 1 + int(strips.symmetric is True)
+        n_surfaces += n_sides
+        n_strips   += n_sides*strips.n_sw
+        n_panels   += n_sides*strips.n_sw*strips.n_cw
+        n_points   += n_sides*(strips.n_sw+1)*(strips.n_cw+1)
+    n_wing_strips = n_strips
+
+    if model_fuselage == True:
+        n_fuselages = len(geometry.fuselages)
+        n_surfaces += 2*n_fuselages
+        n_strips   += 2*n_fuselages*n_sw_fuse
+        n_panels   += 2*n_fuselages*n_sw_fuse*n_cw_fuse
+        n_points   += 2*n_fuselages*(n_sw_fuse+1)*(n_cw_fuse+1)
+
+    # ---------------------------------------------------------------------------------------
+    # STEP 2: Preallocate vectors for coordinates of panels, control points and bound vortices
     # ---------------------------------------------------------------------------------------
     VD = Data()
 
-    VD.XAH    = np.empty(shape=[0,1], dtype=precision)
-    VD.YAH    = np.empty(shape=[0,1], dtype=precision)
-    VD.ZAH    = np.empty(shape=[0,1], dtype=precision)
-    VD.XBH    = np.empty(shape=[0,1], dtype=precision)
-    VD.YBH    = np.empty(shape=[0,1], dtype=precision)
-    VD.ZBH    = np.empty(shape=[0,1], dtype=precision)
-    VD.XCH    = np.empty(shape=[0,1], dtype=precision)
-    VD.YCH    = np.empty(shape=[0,1], dtype=precision)
-    VD.ZCH    = np.empty(shape=[0,1], dtype=precision)     
-    VD.XA1    = np.empty(shape=[0,1], dtype=precision)
-    VD.YA1    = np.empty(shape=[0,1], dtype=precision)  
-    VD.ZA1    = np.empty(shape=[0,1], dtype=precision)
-    VD.XA2    = np.empty(shape=[0,1], dtype=precision)
-    VD.YA2    = np.empty(shape=[0,1], dtype=precision)    
-    VD.ZA2    = np.empty(shape=[0,1], dtype=precision)    
-    VD.XB1    = np.empty(shape=[0,1], dtype=precision)
-    VD.YB1    = np.empty(shape=[0,1], dtype=precision)  
-    VD.ZB1    = np.empty(shape=[0,1], dtype=precision)
-    VD.XB2    = np.empty(shape=[0,1], dtype=precision)
-    VD.YB2    = np.empty(shape=[0,1], dtype=precision)    
-    VD.ZB2    = np.empty(shape=[0,1], dtype=precision)     
-    VD.XAC    = np.empty(shape=[0,1], dtype=precision)
-    VD.YAC    = np.empty(shape=[0,1], dtype=precision)
-    VD.ZAC    = np.empty(shape=[0,1], dtype=precision) 
-    VD.XBC    = np.empty(shape=[0,1], dtype=precision)
-    VD.YBC    = np.empty(shape=[0,1], dtype=precision)
-    VD.ZBC    = np.empty(shape=[0,1], dtype=precision) 
+    VD.XAH    = np.empty(n_panels, dtype=precision)
+    VD.YAH    = np.empty(n_panels, dtype=precision)
+    VD.ZAH    = np.empty(n_panels, dtype=precision)
+    VD.XBH    = np.empty(n_panels, dtype=precision)
+    VD.YBH    = np.empty(n_panels, dtype=precision)
+    VD.ZBH    = np.empty(n_panels, dtype=precision)
+    VD.XCH    = np.empty(n_panels, dtype=precision)
+    VD.YCH    = np.empty(n_panels, dtype=precision)
+    VD.ZCH    = np.empty(n_panels, dtype=precision)
+    VD.XA1    = np.empty(n_panels, dtype=precision)
+    VD.YA1    = np.empty(n_panels, dtype=precision)
+    VD.ZA1    = np.empty(n_panels, dtype=precision)
+    VD.XA2    = np.empty(n_panels, dtype=precision)
+    VD.YA2    = np.empty(n_panels, dtype=precision)
+    VD.ZA2    = np.empty(n_panels, dtype=precision)
+    VD.XB1    = np.empty(n_panels, dtype=precision)
+    VD.YB1    = np.empty(n_panels, dtype=precision)
+    VD.ZB1    = np.empty(n_panels, dtype=precision)
+    VD.XB2    = np.empty(n_panels, dtype=precision)
+    VD.YB2    = np.empty(n_panels, dtype=precision)
+    VD.ZB2    = np.empty(n_panels, dtype=precision)
+    VD.XAC    = np.empty(n_panels, dtype=precision)
+    VD.YAC    = np.empty(n_panels, dtype=precision)
+    VD.ZAC    = np.empty(n_panels, dtype=precision)
+    VD.XBC    = np.empty(n_panels, dtype=precision)
+    VD.YBC    = np.empty(n_panels, dtype=precision)
+    VD.ZBC    = np.empty(n_panels, dtype=precision)
     VD.XC_TE  = np.empty(shape=[0,1], dtype=precision)
     VD.YC_TE  = np.empty(shape=[0,1], dtype=precision)
-    VD.ZC_TE  = np.empty(shape=[0,1], dtype=precision)     
+    VD.ZC_TE  = np.empty(shape=[0,1], dtype=precision)
     VD.XA_TE  = np.empty(shape=[0,1], dtype=precision)
     VD.YA_TE  = np.empty(shape=[0,1], dtype=precision)
-    VD.ZA_TE  = np.empty(shape=[0,1], dtype=precision) 
+    VD.ZA_TE  = np.empty(shape=[0,1], dtype=precision)
     VD.XB_TE  = np.empty(shape=[0,1], dtype=precision)
     VD.YB_TE  = np.empty(shape=[0,1], dtype=precision)
-    VD.ZB_TE  = np.empty(shape=[0,1], dtype=precision)  
-    VD.XC     = np.empty(shape=[0,1], dtype=precision)
-    VD.YC     = np.empty(shape=[0,1], dtype=precision)
-    VD.ZC     = np.empty(shape=[0,1], dtype=precision)    
+    VD.ZB_TE  = np.empty(shape=[0,1], dtype=precision)
+    VD.XC     = np.empty(n_panels, dtype=precision)
+    VD.YC     = np.empty(n_panels, dtype=precision)
+    VD.ZC     = np.empty(n_panels, dtype=precision)
     VD.FUS_XC = np.empty(shape=[0,1], dtype=precision)
     VD.FUS_YC = np.empty(shape=[0,1], dtype=precision)
-    VD.FUS_ZC = np.empty(shape=[0,1], dtype=precision)      
-    VD.CS     = np.empty(shape=[0,1], dtype=precision) 
-    VD.X      = np.empty(shape=[0,1], dtype=precision)
-    VD.Y      = np.empty(shape=[0,1], dtype=precision)
-    VD.Z      = np.empty(shape=[0,1], dtype=precision)
+    VD.FUS_ZC = np.empty(shape=[0,1], dtype=precision)
+    VD.CS     = np.empty(n_strips, dtype=precision)
+    VD.X      = np.empty(n_points, dtype=precision)
+    VD.Y      = np.empty(n_points, dtype=precision)
+    VD.Z      = np.empty(n_points, dtype=precision)
     VD.Y_SW   = np.empty(shape=[0,1], dtype=precision)
-    VD.DY     = np.empty(shape=[0,1], dtype=precision) 
-
-    # empty vectors necessary for arbitrary discretization dimensions
-    VD.n_w              = 0                            # number of wings counter (refers to wings, fuselages or other structures)  
-    VD.n_cp             = 0                            # number of bound vortices (panels) counter 
-    VD.n_sw             = np.array([], dtype=np.int16) # array of the number of spanwise  strips in each wing
-    VD.n_cw             = np.array([], dtype=np.int16) # array of the number of chordwise panels per strip in each wing
-    VD.chordwise_breaks = np.array([], dtype=np.int32) # indices of the first panel in every strip      (given a list of all panels)
-    VD.spanwise_breaks  = np.array([], dtype=np.int32) # indices of the first strip of panels in a wing (given chordwise_breaks)    
+    VD.DY     = np.empty(n_wing_strips, dtype=precision)
+
+    # vectors necessary for arbitrary discretization dimensions
+    VD.n_w              = 0                                     # number of wings counter (refers to wings, fuselages or other structures)
+    VD.n_cp             = 0                                     # number of bound vortices (panels) counter
+    VD.n_sw             = np.empty(n_surfaces, dtype=np.int16)  # array of the number of spanwise  strips in each wing
+    VD.n_cw             = np.empty(n_surfaces, dtype=np.int16)  # array of the number of chordwise panels per strip in each wing
+    VD.chordwise_breaks = np.empty(n_strips, dtype=np.int32)    # indices of the first panel in every strip      (given a list of all panels)
+    VD.spanwise_breaks  = np.empty(n_surfaces, dtype=np.int32)  # indices of the first strip of panels in a wing (given chordwise_breaks)
     VD.symmetric_wings  = np.array([], dtype=np.int32)
-    VD.surface_ID       = np.empty(shape=[0,1], dtype=np.int16) 
-    VD.surface_ID_full  = np.empty(shape=[0,1], dtype=np.int16)     
-    
-    VD.leading_edge_indices      = np.array([], dtype=bool)      # bool array of leading  edge indices (all false except for panels at leading  edge)
-    VD.trailing_edge_indices     = np.array([], dtype=bool)      # bool array of trailing edge indices (all false except for panels at trailing edge)    
-    VD.panels_per_strip          = np.array([], dtype=np.int16)  # array of the number of panels per strip (RNMAX); this is assigned for all panels  
-    VD.chordwise_panel_number    = np.array([], dtype=np.int16)  # array of panels' numbers in their strips.     
-    VD.chord_lengths             = np.array([], dtype=precision) # Chord length, this is assigned for all panels.
-    VD.tangent_incidence_angle   = np.array([], dtype=precision) # Tangent Incidence Angles of the chordwise strip. LE to TE, ZETA
-    VD.exposed_leading_edge_flag = np.array([], dtype=np.int16)  # 0 or 1 per strip. 0 turns off leading edge suction for non-slat control surfaces
-    
+    VD.surface_ID       = np.empty(n_panels)
+    VD.surface_ID_full  = np.empty(n_points)
+
+    VD.leading_edge_indices      = np.empty(n_panels, dtype=bool)      # bool array of leading  edge indices (all false except for panels at leading  edge)
+    VD.trailing_edge_indices     = np.empty(n_panels, dtype=bool)      # bool array of trailing edge indices (all false except for panels at trailing edge)
+    VD.panels_per_strip          = np.empty(n_panels, dtype=np.int16)  # array of the number of panels per strip (RNMAX); this is assigned for all panels
+    VD.chordwise_panel_number    = np.empty(n_panels, dtype=np.int16)  # array of panels' numbers in their strips.
+    VD.chord_lengths             = np.array([], dtype=precision)       # Chord length, this is assigned for all panels.
+    VD.tangent_incidence_angle   = np.array([], dtype=precision)       # Tangent Incidence Angles of the chordwise strip. LE to TE, ZETA
+    VD.exposed_leading_edge_flag = np.empty(n_strips, dtype=np.int16)  # 0 or 1 per strip. 0 turns off leading edge suction for non-slat control surfaces
+
+    # ---------------------------------------------------------------------------------------
+    # Unpack aircraft wing geometry
     # ---------------------------------------------------------------------------------------
-    # Unpack aircraft wing geometry 
-    # ---------------------------------------------------------------------------------------    
     VD.wing_areas  = [] # instantiate wing areas
     VD.vortex_lift = []
     VD.counter     = 0
-    
-    #reformat/preprocess wings and control surfaces for VLM panelization
-    VLM_wings = make_VLM_wings(geometry, settings)
-    VD.VLM_wings = VLM_wings
-    
+    VD.VLM_wings   = VLM_wings
+
     #generate panelization for each wing. Wings first, then control surface wings
-    for wing in VD.VLM_wings:
-        if not wing.is_a_control_surface:
-            if show_prints: print('discretizing ' + wing.tag) 
-            VD, wing = generate_wing_vortex_distribution(VD,wing,n_cw_wing,n_sw_wing,spc,precision)    
-                    
-    for wing in VD.VLM_wings:
-        if wing.is_a_control_surface:
-            if show_prints:print('discretizing ' + wing.tag)
-            VD, wing = generate_wing_vortex_distribution(VD,wing,n_cw_wing,n_sw_wing,spc,precision)     
-            
-            
+    for strips in wing_strips:
+        wing = strips.wing
+        if show_prints: print('discretizing ' + wing.tag)
+        VD, wing = generate_wing_vortex_distribution(VD,wing,strips,precision)
+
+
     # ---------------------------------------------------------------------------------------
     # Unpack aircraft fuselage geometry
-    # ---------------------------------------------------------------------------------------      
+    # ---------------------------------------------------------------------------------------
     VD.wing_areas = np.array(VD.wing_areas, dtype=precision)
-    VD.n_fus      = 0   
+    VD.n_fus      = 0
     for fus in geometry.fuselages:
         if show_prints: print('discretizing ' + fus.tag)
         VD = generate_fuselage_and_nacelle_vortex_distribution(VD,fus,n_cw_fuse,n_sw_fuse,precision,model_fuselage)
@@ -232,90 +259,74 @@ def generate_vortex_distribution(geometry,settings):
 
     # ---------------------------------------------------------------------------------------
     # Deflect Control Surfaces
-    # ---------------------------------------------------------------------------------------      
+    # ---------------------------------------------------------------------------------------
     for wing in VD.VLM_wings:
-        wing_is_all_moving = (not wing.is_a_control_surface) and issubclass(wing.wing_type, All_Moving_Surface)        
+        wing_is_all_moving = (not wing.is_a_control_surface) and issubclass(wing.wing_type, All_Moving_Surface)
         if wing.is_a_control_surface or wing_is_all_moving:
             # Deflect the control surface
             VD, wing = deflect_control_surface(VD, wing)
-            
+
     # ---------------------------------------------------------------------------------------
     # Postprocess VD information
-    # ---------------------------------------------------------------------------------------  
-    
+    # ---------------------------------------------------------------------------------------
+
     VD = postprocess_VD(VD, settings)
-    
+
     # pack VD into geometry
     geometry.vortex_distribution = VD
-    
-    if show_prints: print('finish discretization')     
-    
-    return VD 
+
+    if show_prints: print('finish discretization')
+
+    return VD
 
 
 # ----------------------------------------------------------------------
-#  Discretize Wings
+#  Lay Out Wing Strips
 # ----------------------------------------------------------------------
-def generate_wing_vortex_distribution(VD,wing,n_cw,n_sw,spc,precision):
-    """ This generates vortex distribution points for the given wing 
+def compute_wing_strips(wings,wing,n_cw,n_sw,spc,airfoils):
+    """ This computes the spanwise strips of the given wing and the geometry of its span breaks.
+    Control surface wings that are attached to the wing are given the y-coordinates of the strips
+    they span, so a wing must be laid out before its control surfaces.
 
-    Assumptions: 
+    Assumptions:
     The wing is segmented and was made or modified by make_VLM_wings()
-    
-    For control surfaces, "positve" deflection corresponds to the RH rule where the axis of rotation is the OUTBOARD-pointing hinge vector
-    symmetry: the LH rule is applied to the reflected surface for non-ailerons. Ailerons follow a RH rule for both sides
-    
-    The hinge_vector will only ever be calcualted on the first strip of any control/all-moving surface. It is assumed that all control
-    surfaces are trapezoids, thus needing only one hinge, and that all all-moving surfaces have exactly one point of rotation.
 
-    Source:   
+    Source:
     None
-    
-    Inputs:   
-    VD                   - vortex distribution
+
+    Inputs:
+    wings                - all wings made by make_VLM_wings()
     wing                 - a Data object made or modified by make_VLM_wings() to mimick a Wing object
-    
+    n_cw, n_sw           - number of chordwise panels and spanwise strips of a wing
+    spc                  - cosine spacing flag
+    airfoils             - airfoil geometry already imported, by coordinate file
+
+    Outputs:
+    strips               - strip layout of the wing
+
     Properties Used:
     N/A
-    """ 
-    wings = VD.VLM_wings
-    
-    # get geometry of wing  
-    span          = wing.spans.projected
-    root_chord    = wing.chords.root
-    tip_chord     = wing.chords.tip
-    sweep_qc      = wing.sweeps.quarter_chord
-    sweep_le      = wing.sweeps.leading_edge 
-    twist_rc      = wing.twists.root
-    twist_tc      = wing.twists.tip
-    dihedral      = wing.dihedral
-    sym_para      = wing.symmetric 
-    vertical_wing = wing.vertical
-    wing_origin   = wing.origin[0]
-    VD.vortex_lift.append(wing.vortex_lift)
-
-    # determine if vehicle has symmetry 
+    """
+    # get geometry of wing
+    span     = wing.spans.projected
+    sym_para = wing.symmetric
     if sym_para is True :
         span = span/2
-        VD.vortex_lift.append(wing.vortex_lift)
-        
-    VD.counter  +=1
-    wing.surface_ID = VD.counter*1
 
     # ---------------------------------------------------------------------------------------
-    # STEP 3: Get discretization control variables  
+    # STEP 3: Get discretization control variables
     # ---------------------------------------------------------------------------------------
     # get number of spanwise and chordwise panels for this wing
     n_sw = n_sw if (not wing.is_a_control_surface) else max(len(wing.y_coords_required)-1,1)
-    n_cw = n_cw if (not wing.is_a_control_surface) else max(int(np.ceil(wing.chord_fraction*n_cw)),2)  
-    
+    n_cw = n_cw if (not wing.is_a_control_surface) else max(int(np.ceil(wing.chord_fraction*n_cw)),2)
+
     # get y_coordinates (y-locations of the edges of each strip in wing-local coords)
-    if spc == True: # discretize wing using cosine spacing     
+    if spc == True: # discretize wing using cosine spacing
         n               = np.linspace(n_sw+1,0,n_sw+1)         # vectorize
         thetan          = n*(np.pi/2)/(n_sw+1)                 # angular stations
         y_coordinates   = span*np.cos(thetan)                  # y locations based on the angular spacing
-    else:           # discretize wing using linear spacing 
-        y_coordinates   = np.linspace(0,span,n_sw+1) 
+    else:           # discretize wing using linear spacing
+        y_coordinates   = np.linspace(0,span,n_sw+1)
 
     # get span_breaks object
     span_breaks   = wing.span_breaks
@@ -329,11 +340,12 @@ def generate_wing_vortex_distribution(VD,wing,n_cw,n_sw,spc,precision):
     break_twist       = np.zeros(n_breaks)
     break_sweep       = np.zeros(n_breaks)
     break_dihedral    = np.zeros(n_breaks)
-    break_camber_xs   = [] 
+    break_camber_xs   = []
     break_camber_zs   = []
     break_x_offset    = np.zeros(n_breaks)
     break_z_offset    = np.zeros(n_breaks)
-    break_spans       = np.zeros(n_breaks) 
+    break_spans       = np.zeros(n_breaks)
+    break_LE_cs_ID    = np.zeros(n_breaks)
     section_span      = np.zeros(n_breaks)
     section_area      = np.zeros(n_breaks)
     section_LE_cut    = np.zeros(n_breaks)
@@ -342,12 +354,13 @@ def generate_wing_vortex_distribution(VD,wing,n_cw,n_sw,spc,precision):
     # ---------------------------------------------------------------------------------------
     # STEP 5:  Obtain sweep, chord, dihedral and twist at the beginning/end of each break.
     #          If applicable, append airfoil section VD and flap/aileron deflection angles.
-    # --------------------------------------------------------------------------------------- 
-    for i_break in range(n_breaks):   
-        break_spans[i_break]    = span_breaks[i_break].span_fraction*span  
+    # ---------------------------------------------------------------------------------------
+    for i_break in range(n_breaks):
+        break_spans[i_break]    = span_breaks[i_break].span_fraction*span
         break_chord[i_break]    = span_breaks[i_break].local_chord
         break_twist[i_break]    = span_breaks[i_break].twist
-        break_dihedral[i_break] = span_breaks[i_break].dihedral_outboard                    
+        break_dihedral[i_break] = span_breaks[i_break].dihedral_outboard
+        break_LE_cs_ID[i_break] = span_breaks[i_break].cs_IDs[0,1] # leading edge, outboard control surface ID
 
         # get leading edge sweep. make_VLM wings should have precomputed this for all span_breaks
         is_not_last_break    = (i_break != n_breaks-1)
@@ -356,547 +369,478 @@ def generate_wing_vortex_distribution(VD,wing,n_cw,n_sw,spc,precision):
         # find span and area. All span_break offsets should be calculated in make_VLM_wings
         if i_break == 0:
             section_span[i_break]   = 0.0
-            break_x_offset[i_break] = 0.0  
-            break_z_offset[i_break] = 0.0       
+            break_x_offset[i_break] = 0.0
+            break_z_offset[i_break] = 0.0
         else:
             section_span[i_break]   = break_spans[i_break] - break_spans[i_break-1]
             section_area[i_break]   = 0.5*(break_chord[i_break-1] + break_chord[i_break])*section_span[i_break]
             break_x_offset[i_break] = span_breaks[i_break].x_offset
             break_z_offset[i_break] = span_breaks[i_break].dih_offset
 
-        # Get airfoil section VD  
-        if span_breaks[i_break].airfoil:  
-            airfoil_geo_data = import_airfoil_geometry(span_breaks[i_break].airfoil.coordinate_file) 
+        # Get airfoil section VD, importing each airfoil file once
+        if span_breaks[i_break].airfoil:
+            coordinate_file = span_breaks[i_break].airfoil.coordinate_file
+            if coordinate_file not in airfoils:
+                airfoils[coordinate_file] = import_airfoil_geometry(coordinate_file)
+            airfoil_geo_data = airfoils[coordinate_file]
             break_camber_zs.append(airfoil_geo_data.camber_coordinates)
-            break_camber_xs.append(airfoil_geo_data.x_lower_surface) 
+            break_camber_xs.append(airfoil_geo_data.x_lower_surface)
         else:
-            break_camber_zs.append(np.zeros(30))              
-            break_camber_xs.append(np.linspace(0,1,30)) 
+            break_camber_zs.append(np.zeros(30))
+            break_camber_xs.append(np.linspace(0,1,30))
 
         # Get control surface leading and trailing edge cute cuts: section__cuts[-1] should never be used in the following code
         section_LE_cut[i_break] = span_breaks[i_break].cuts[0,1]
         section_TE_cut[i_break] = span_breaks[i_break].cuts[1,1]
 
-    VD.wing_areas.append(np.sum(section_area[:], dtype=precision))
-    if sym_para is True :
-        VD.wing_areas.append(np.sum(section_area[:], dtype=precision))            
-
-    #Shift spanwise vortices onto section breaks  
+    #Shift spanwise vortices onto section breaks
     if len(y_coordinates) < n_breaks:
         raise ValueError('Not enough spanwise VLM stations for segment breaks')
 
-    y_coords_required = break_spans if (not wing.is_a_control_surface) else np.array(sorted(wing.y_coords_required))  #control surfaces have additional required y_coords  
-    shifted_idxs = np.zeros(len(y_coordinates))
-    for y_req in y_coords_required:
-        idx = (np.abs(y_coordinates - y_req) + shifted_idxs).argmin() #index of y-coord nearest to the span break
-        shifted_idxs[idx]  = np.inf 
-        y_coordinates[idx] = y_req
+    y_coords_required = break_spans if (not wing.is_a_control_surface) else np.array(sorted(wing.y_coords_required))  #control surfaces have additional required y_coords
+    if len(y_coords_required) == len(y_coordinates):
+        # every station is shifted onto a required y-coord
+        y_coordinates = np.sort(y_coords_required)
+    else:
+        shifted_idxs = np.zeros(len(y_coordinates))
+        for y_req in y_coords_required:
+            idx = (np.abs(y_coordinates - y_req) + shifted_idxs).argmin() #index of y-coord nearest to the span break
+            shifted_idxs[idx]  = np.inf
+            y_coordinates[idx] = y_req
+
+        y_coordinates = np.array(sorted(y_coordinates))
+
+    if not np.all(np.isin(y_coords_required, y_coordinates)):
+        raise ValueError('VLM did not capture all section breaks')
+
+    # index of the span break at the inboard edge of each strip
+    y_a          = y_coordinates[:-1]
+    y_b          = y_coordinates[1:]
+    strip_breaks = np.zeros(n_sw, dtype=int)
+    first_strip  = 0
+    for i_break in range(1,n_breaks):
+        at_break = np.flatnonzero(y_b[first_strip:] == break_spans[i_break])
+        if len(at_break) == 0:
+            break
+        first_strip              += at_break[0] + 1
+        strip_breaks[first_strip:] = i_break
 
-    y_coordinates = np.array(sorted(y_coordinates))
-    
-    for y_req in y_coords_required:
-        if y_req not in y_coordinates:
-            raise ValueError('VLM did not capture all section breaks')  
-    
-    # ---------------------------------------------------------------------------------------
-    # STEP 6: Define coordinates of panels horseshoe vortices and control points 
-    # --------------------------------------------------------------------------------------- 
-    y_a   = y_coordinates[:-1] 
-    y_b   = y_coordinates[1:]             
-    del_y = y_coordinates[1:] - y_coordinates[:-1] 
-    
     # Let relevant control surfaces know which y-coords they are required to have----------------------------------
     if not wing.is_a_control_surface:
-        i_break = 0
-        for idx_y in range(n_sw):
-            span_break = span_breaks[i_break]
-            cs_IDs     = span_break.cs_IDs[:,1] #only the outboard control surfaces
-            y_coord    = y_coordinates[idx_y]
-            
+        vertical_wing = wing.vertical
+        for i_break in range(n_breaks):
+            cs_IDs  = span_breaks[i_break].cs_IDs[:,1] #only the outboard control surfaces
+            y_coord = y_a[strip_breaks == i_break]
+
             for cs_ID in cs_IDs[cs_IDs >= 0]:
                 cs_tag     = wing.tag + '__cs_id_{}'.format(cs_ID)
                 cs_wing    = wings[cs_tag]
                 rel_offset = cs_wing.origin[0,1] - wing.origin[0][1] if not vertical_wing else cs_wing.origin[0,2] - wing.origin[0][2]
-                cs_wing.y_coords_required.append(y_coord - rel_offset)
-            
-            if y_coordinates[idx_y+1] == break_spans[i_break+1]: 
-                i_break += 1
-            
-    
+                cs_wing.y_coords_required.extend(y_coord - rel_offset)
+
+    # pack the strip layout
+    strips                 = Data()
+    strips.wing            = wing
+    strips.symmetric       = sym_para
+    strips.n_sw            = n_sw
+    strips.n_cw            = n_cw
+    strips.y_coordinates   = y_coordinates
+    strips.strip_breaks    = strip_breaks
+    strips.break_chord     = break_chord
+    strips.break_twist     = break_twist
+    strips.break_sweep     = break_sweep
+    strips.break_dihedral  = break_dihedral
+    strips.break_camber_xs = break_camber_xs
+    strips.break_camber_zs = break_camber_zs
+    strips.break_x_offset  = break_x_offset
+    strips.break_z_offset  = break_z_offset
+    strips.break_spans     = break_spans
+    strips.break_LE_cs_ID  = break_LE_cs_ID
+    strips.section_span    = section_span
+    strips.section_area    = section_area
+    strips.section_LE_cut  = section_LE_cut
+    strips.section_TE_cut  = section_TE_cut
+
+    return strips
+
+
+# ----------------------------------------------------------------------
+#  Discretize Wings
+# ----------------------------------------------------------------------
+def generate_wing_vortex_distribution(VD,wing,strips,precision):
+    """ This generates vortex distribution points for the given wing, computing all strips
+    of the wing at once and storing them in the preallocated arrays of the VD
+
+    Assumptions:
+    The wing is segmented and was made or modified by make_VLM_wings()
+
+    For control surfaces, "positve" deflection corresponds to the RH rule where the axis of rotation is the OUTBOARD-pointing hinge vector
+    symmetry: the LH rule is applied to the reflected surface for non-ailerons. Ailerons follow a RH rule for both sides
+
+    The hinge_vector will only ever be calcualted on the first strip of any control/all-moving surface. It is assumed that all control
+    surfaces are trapezoids, thus needing only one hinge, and that all all-moving surfaces have exactly one point of rotation.
+
+    Source:
+    None
+
+    Inputs:
+    VD                   - vortex distribution
+    wing                 - a Data object made or modified by make_VLM_wings() to mimick a Wing object
+    strips               - strip layout of the wing made by compute_wing_strips()
+
+    Properties Used:
+    N/A
+    """
+    # get geometry of wing
+    sym_para      = wing.symmetric
+    vertical_wing = wing.vertical
+    wing_origin   = wing.origin[0]
+    VD.vortex_lift.append(wing.vortex_lift)
+
+    # determine if vehicle has symmetry
+    if sym_para is True :
+        VD.vortex_lift.append(wing.vortex_lift)
+
+    VD.counter  +=1
+    wing.surface_ID = VD.counter*1
+
+    # unpack the strip layout
+    n_sw           = strips.n_sw
+    n_cw           = strips.n_cw
+    i_break        = strips.strip_breaks
+    break_chord    = strips.break_chord
+    break_twist    = strips.break_twist
+    break_spans    = strips.break_spans
+    break_x_offset = strips.break_x_offset
+    break_z_offset = strips.break_z_offset
+    section_span   = strips.section_span
+
+    VD.wing_areas.append(np.sum(strips.section_area[:], dtype=precision))
+    if sym_para is True :
+        VD.wing_areas.append(np.sum(strips.section_area[:], dtype=precision))
+
+    # ---------------------------------------------------------------------------------------
+    # STEP 6: Define coordinates of panels horseshoe vortices and control points. Rows are
+    #         the strips of the wing, columns are the chordwise panels of a strip
+    # ---------------------------------------------------------------------------------------
+    y_coordinates = strips.y_coordinates
+    y_a   = y_coordinates[:-1]
+    y_b   = y_coordinates[1:]
+    del_y = y_coordinates[1:] - y_coordinates[:-1]
+
+    # define basic geometric values--------------------------------------------------------------------------------
+    # inboard, outboard, and central panel values
+    eta_a = (y_a - break_spans[i_break])
+    eta_b = (y_b - break_spans[i_break])
+    eta   = (y_b - del_y/2 - break_spans[i_break])
+
+    # Inverted wing
+    inverted_wing = -np.sign(strips.break_dihedral[i_break] - np.pi/2)
+
+    segment_chord_ratio = (break_chord[i_break+1] - break_chord[i_break])/section_span[i_break+1]
+    segment_twist_ratio = (break_twist[i_break+1] - break_twist[i_break])/section_span[i_break+1]
+
+    wing_chord_section_a  = break_chord[i_break] + (eta_a*segment_chord_ratio)
+    wing_chord_section_b  = break_chord[i_break] + (eta_b*segment_chord_ratio)
+    wing_chord_section    = break_chord[i_break] + (eta*segment_chord_ratio)
+
+    # x-positions based on whether the wing needs 'cuts' for its control sufaces
+    nondim_x_stations = np.array([np.interp(np.linspace(0.,1.,num=n_cw+1), [0.,1.], [LE_cut, TE_cut]) \
+                                  for LE_cut, TE_cut in zip(strips.section_LE_cut, strips.section_TE_cut)])[i_break]
+    x_stations_a      = nondim_x_stations * wing_chord_section_a[:,None]  #x positions accounting for control surface cuts, relative to leading
+    x_stations_b      = nondim_x_stations * wing_chord_section_b[:,None]
+    x_stations        = nondim_x_stations * wing_chord_section[:,None]
+
+    delta_x_a = ((x_stations_a[:,-1] - x_stations_a[:,0])/n_cw)[:,None]
+    delta_x_b = ((x_stations_b[:,-1] - x_stations_b[:,0])/n_cw)[:,None]
+    delta_x   = ((x_stations[:,-1]   - x_stations[:,0]  )/n_cw)[:,None]
+
+    # leading edge of each strip before camber and twist
+    tan_sweep    = np.tan(strips.break_sweep)[i_break]
+    tan_dihedral = np.tan(strips.break_dihedral)[i_break]
+    pivot_x_a    = break_x_offset[i_break] + eta_a*tan_sweep      # x location of leading edge left corner of wing
+    pivot_x_b    = break_x_offset[i_break] + eta_b*tan_sweep      # x location of leading edge right of wing
+    pivot_x      = break_x_offset[i_break] + eta  *tan_sweep      # x location of leading edge center of wing
+    pivot_z_a    = break_z_offset[i_break] + eta_a*tan_dihedral   # z location of leading edge left corner of wing
+    pivot_z_b    = break_z_offset[i_break] + eta_b*tan_dihedral   # z location of leading edge right of wing
+    pivot_z      = break_z_offset[i_break] + eta  *tan_dihedral   # z location of leading edge center of wing
+
+    # define coordinates of horseshoe vortices and control points--------------------------------------------------
+    xi_a1 = pivot_x_a[:,None] + x_stations_a[:,:-1]                  # x coordinate of top left corner of panel
+    xi_ah = pivot_x_a[:,None] + x_stations_a[:,:-1] + delta_x_a*0.25 # x coordinate of left corner of panel
+    xi_ac = pivot_x_a[:,None] + x_stations_a[:,:-1] + delta_x_a*0.75 # x coordinate of bottom left corner of control point vortex
+    xi_a2 = pivot_x_a[:,None] + x_stations_a[:,1:]                   # x coordinate of bottom left corner of bound vortex
+    xi_b1 = pivot_x_b[:,None] + x_stations_b[:,:-1]                  # x coordinate of top right corner of panel
+    xi_bh = pivot_x_b[:,None] + x_stations_b[:,:-1] + delta_x_b*0.25 # x coordinate of right corner of bound vortex
+    xi_bc = pivot_x_b[:,None] + x_stations_b[:,:-1] + delta_x_b*0.75 # x coordinate of bottom right corner of control point vortex
+    xi_b2 = pivot_x_b[:,None] + x_stations_b[:,1:]                   # x coordinate of bottom right corner of panel
+    xi_ch = pivot_x[:,None]   + x_stations[:,:-1]   + delta_x  *0.25 # x coordinate center of bound vortex of each panel
+    xi_c  = pivot_x[:,None]   + x_stations[:,:-1]   + delta_x  *0.75 # x coordinate three-quarter chord control point for each panel
+
+    #adjust for camber, one span break at a time-------------------------------------------------------------------
+    z_c_a = np.zeros((n_sw,4*n_cw))
+    z_c_b = np.zeros((n_sw,4*n_cw))
+    z_c_c = np.zeros((n_sw,2*n_cw))
+    for j_break in np.unique(i_break):
+        #format camber vars for wings vs control surface wings
+        nondim_camber_x_coords = strips.break_camber_xs[j_break] *1
+        nondim_camber          = strips.break_camber_zs[j_break] *1
+        if not np.any(nondim_camber):
+            continue
+        if wing.is_a_control_surface: #rescale so that airfoils get cut properly
+            if not wing.is_slat:
+                nondim_camber_x_coords -= 1 - wing.chord_fraction
+            nondim_camber_x_coords /= wing.chord_fraction
+            nondim_camber          /= wing.chord_fraction
+
+        # adjustment of coordinates for camber
+        in_break = (i_break == j_break)
+        chord_a  = wing_chord_section_a[in_break,None]
+        chord_b  = wing_chord_section_b[in_break,None]
+        chord_c  = wing_chord_section[in_break,None]
+
+        x_a = x_stations_a[in_break]
+        x_b = x_stations_b[in_break]
+        x_c = x_stations[in_break]
+        d_a = delta_x_a[in_break]
+        d_b = delta_x_b[in_break]
+        d_c = delta_x[in_break]
+
+        z_c_a[in_break] = interpolate_camber(np.hstack([x_a[:,:-1], x_a[:,:-1] + d_a*0.25, x_a[:,:-1] + d_a*0.75, x_a[:,1:]]),
+                                             nondim_camber_x_coords*chord_a, nondim_camber*chord_a)
+        z_c_b[in_break] = interpolate_camber(np.hstack([x_b[:,:-1], x_b[:,:-1] + d_b*0.25, x_b[:,:-1] + d_b*0.75, x_b[:,1:]]),
+                                             nondim_camber_x_coords*chord_b, nondim_camber*chord_b)
+        z_c_c[in_break] = interpolate_camber(np.hstack([x_c[:,:-1] + d_c*0.25, x_c[:,:-1] + d_c*0.75]),
+                                             nondim_camber_x_coords*chord_c, nondim_camber*chord_c)
+    z_c_a1, z_c_ah, z_c_ac, z_c_a2 = np.hsplit(z_c_a, 4)
+    z_c_b1, z_c_bh, z_c_bc, z_c_b2 = np.hsplit(z_c_b, 4)
+    z_c_ch, z_c                    = np.hsplit(z_c_c, 2)
+
+    # adjust for dihedral and add to camber------------------------------------------------------------------------
+    zeta_a1 = pivot_z_a[:,None] + z_c_a1  # z coordinate of top left corner of panel
+    zeta_ah = pivot_z_a[:,None] + z_c_ah  # z coordinate of left corner of bound vortex
+    zeta_a2 = pivot_z_a[:,None] + z_c_a2  # z coordinate of bottom left corner of panel
+    zeta_ac = pivot_z_a[:,None] + z_c_ac  # z coordinate of bottom left corner of panel of control point
+    zeta_bc = pivot_z_b[:,None] + z_c_bc  # z coordinate of top right corner of panel of control point
+    zeta_b1 = pivot_z_b[:,None] + z_c_b1  # z coordinate of top right corner of panel
+    zeta_bh = pivot_z_b[:,None] + z_c_bh  # z coordinate of right corner of bound vortex
+    zeta_b2 = pivot_z_b[:,None] + z_c_b2  # z coordinate of bottom right corner of panel
+    zeta_ch = pivot_z[:,None]   + z_c_ch  # z coordinate center of bound vortex on each panel
+    zeta    = pivot_z[:,None]   + z_c     # z coordinate three-quarter chord control point for each panel
+
+    # adjust for twist---------------------------------------------------------------------------------------------
+    # pivot point is the leading edge before camber
+    # adjust twist pivot line for control surface wings: offset leading edge to match that of the owning wing
+    if wing.is_a_control_surface and not wing.is_slat: #correction only leading for non-leading edge control surfaces since the LE is the pivot by default
+        nondim_cs_LE = (1 - wing.chord_fraction)
+        pivot_x_a    = pivot_x_a - nondim_cs_LE *(wing_chord_section_a /wing.chord_fraction)
+        pivot_x_b    = pivot_x_b - nondim_cs_LE *(wing_chord_section_b /wing.chord_fraction)
+        pivot_x      = pivot_x   - nondim_cs_LE *(wing_chord_section   /wing.chord_fraction)
+
+    # adjust coordinates for twist
+    section_twist_a = break_twist[i_break] + (eta_a * segment_twist_ratio)               # twist at left side of panel
+    section_twist_b = break_twist[i_break] + (eta_b * segment_twist_ratio)               # twist at right side of panel
+    section_twist   = break_twist[i_break] + (eta   * segment_twist_ratio)               # twist at center local chord
+
+    cos_a, sin_a = np.cos(section_twist_a)[:,None], np.sin(section_twist_a)[:,None]
+    cos_b, sin_b = np.cos(section_twist_b)[:,None], np.sin(section_twist_b)[:,None]
+    cos_c, sin_c = np.cos(section_twist)[:,None]  , np.sin(section_twist)[:,None]
+    cos_m        = np.cos(-section_twist)[:,None]
+    pivot_x_a, pivot_x_b, pivot_x = pivot_x_a[:,None], pivot_x_b[:,None], pivot_x[:,None]
+    pivot_z_a, pivot_z_b, pivot_z = pivot_z_a[:,None], pivot_z_b[:,None], pivot_z[:,None]
+
+    xi_prime_a1    = pivot_x_a + cos_a*(xi_a1-pivot_x_a) + sin_a*(zeta_a1-pivot_z_a) # x coordinate transformation of top left corner
+    xi_prime_ah    = pivot_x_a + cos_a*(xi_ah-pivot_x_a) + sin_a*(zeta_ah-pivot_z_a) # x coordinate transformation of bottom left corner
+    xi_prime_ac    = pivot_x_a + cos_a*(xi_ac-pivot_x_a) + sin_a*(zeta_a2-pivot_z_a) # x coordinate transformation of bottom left corner of control point
+    xi_prime_a2    = pivot_x_a + cos_a*(xi_a2-pivot_x_a) + sin_a*(zeta_a2-pivot_z_a) # x coordinate transformation of bottom left corner
+    xi_prime_b1    = pivot_x_b + cos_b*(xi_b1-pivot_x_b) + sin_b*(zeta_b1-pivot_z_b) # x coordinate transformation of top right corner
+    xi_prime_bh    = pivot_x_b + cos_b*(xi_bh-pivot_x_b) + sin_b*(zeta_bh-pivot_z_b) # x coordinate transformation of top right corner
+    xi_prime_bc    = pivot_x_b + cos_b*(xi_bc-pivot_x_b) + sin_b*(zeta_b1-pivot_z_b) # x coordinate transformation of top right corner of control point
+    xi_prime_b2    = pivot_x_b + cos_b*(xi_b2-pivot_x_b) + sin_b*(zeta_b2-pivot_z_b) # x coordinate transformation of botton right corner
+    xi_prime_ch    = pivot_x   + cos_c*(xi_ch-pivot_x)   + sin_c*(zeta_ch-pivot_z)   # x coordinate transformation of center of horeshoe vortex
+    xi_prime       = pivot_x   + cos_c*(xi_c -pivot_x)   + sin_c*(zeta   -pivot_z)   # x coordinate transformation of control point
+
+    zeta_prime_a1  = pivot_z_a - sin_a*(xi_a1-pivot_x_a) + cos_a*(zeta_a1-pivot_z_a) # z coordinate transformation of top left corner
+    zeta_prime_ah  = pivot_z_a - sin_a*(xi_ah-pivot_x_a) + cos_a*(zeta_ah-pivot_z_a) # z coordinate transformation of bottom left corner
+    zeta_prime_ac  = pivot_z_a - sin_a*(xi_ac-pivot_x_a) + cos_a*(zeta_ac-pivot_z_a) # z coordinate transformation of bottom left corner
+    zeta_prime_a2  = pivot_z_a - sin_a*(xi_a2-pivot_x_a) + cos_a*(zeta_a2-pivot_z_a) # z coordinate transformation of bottom left corner
+    zeta_prime_b1  = pivot_z_b - sin_b*(xi_b1-pivot_x_b) + cos_b*(zeta_b1-pivot_z_b) # z coordinate transformation of top right corner
+    zeta_prime_bh  = pivot_z_b - sin_b*(xi_bh-pivot_x_b) + cos_b*(zeta_bh-pivot_z_b) # z coordinate transformation of top right corner
+    zeta_prime_bc  = pivot_z_b - sin_b*(xi_bc-pivot_x_b) + cos_b*(zeta_bc-pivot_z_b) # z coordinate transformation of top right corner
+    zeta_prime_b2  = pivot_z_b - sin_b*(xi_b2-pivot_x_b) + cos_b*(zeta_b2-pivot_z_b) # z coordinate transformation of botton right corner
+    zeta_prime_ch  = pivot_z   - sin_c*(xi_ch-pivot_x)   + cos_m*(zeta_ch-pivot_z)   # z coordinate transformation of center of horseshoe
+    zeta_prime     = pivot_z   - sin_c*(xi_c -pivot_x)   + cos_m*(zeta   -pivot_z)   # z coordinate transformation of control point
+
+    # all corners of all panels, LE and TE inclusive. The right side is only used for the last strip of the wing
+    xi_prime_as   = np.concatenate([xi_prime_a1,  xi_prime_a2  [:,-1:]],axis=1)
+    xi_prime_bs   = np.concatenate([xi_prime_b1,  xi_prime_b2  [:,-1:]],axis=1)
+    zeta_prime_as = np.concatenate([zeta_prime_a1,zeta_prime_a2[:,-1:]],axis=1)
+    zeta_prime_bs = np.concatenate([zeta_prime_b1,zeta_prime_b2[:,-1:]],axis=1)
+    xi_prime_s    = np.concatenate([xi_prime_as,  xi_prime_bs  [-1:]])
+    zeta_prime_s  = np.concatenate([zeta_prime_as,zeta_prime_bs[-1:]])
+    y_s           = np.concatenate([y_a,y_b[-1:]])[:,None]*np.ones(n_cw+1)
+    inverted_s    = np.concatenate([inverted_wing,inverted_wing[-1:]])[:,None]
+    inverted_wing = inverted_wing[:,None]
+
+    # store this wing's strip discretization information-----------------------------------------------------------
+    panel_numbers = np.tile(np.linspace(1,n_cw,n_cw, dtype=np.int16), n_sw)
+    is_a_slat     = wing.is_a_control_surface and wing.is_slat
+    if is_a_slat:
+        exposed_leading_edge_flag = np.ones(n_sw, dtype=np.int16)
+    elif wing.is_a_control_surface:
+        exposed_leading_edge_flag = np.zeros(n_sw, dtype=np.int16)
+    else:
+        exposed_leading_edge_flag = np.int16(strips.break_LE_cs_ID[i_break] == -1)
+
     # -------------------------------------------------------------------------------------------------------------
-    # Run the strip contruction loop again if wing is symmetric. 
+    # Reflect the strips if wing is symmetric.
     # Reflection plane = x-y plane for vertical wings. Otherwise, reflection plane = x-z plane
     signs         = np.array([1, -1]) # acts as a multiplier for symmetry. -1 is only ever used for symmetric wings
     symmetry_mask = [True,sym_para]
     for sym_sign in signs[symmetry_mask]:
-        # create empty vectors for coordinates 
-        xah   = np.zeros(n_cw*n_sw)
-        yah   = np.zeros(n_cw*n_sw)
-        zah   = np.zeros(n_cw*n_sw)
-        xbh   = np.zeros(n_cw*n_sw)
-        ybh   = np.zeros(n_cw*n_sw)
-        zbh   = np.zeros(n_cw*n_sw)    
-        xch   = np.zeros(n_cw*n_sw)
-        ych   = np.zeros(n_cw*n_sw)
-        zch   = np.zeros(n_cw*n_sw)    
-        xa1   = np.zeros(n_cw*n_sw)
-        ya1   = np.zeros(n_cw*n_sw)
-        za1   = np.zeros(n_cw*n_sw)
-        xa2   = np.zeros(n_cw*n_sw)
-        ya2   = np.zeros(n_cw*n_sw)
-        za2   = np.zeros(n_cw*n_sw)    
-        xb1   = np.zeros(n_cw*n_sw)
-        yb1   = np.zeros(n_cw*n_sw)
-        zb1   = np.zeros(n_cw*n_sw)
-        xb2   = np.zeros(n_cw*n_sw) 
-        yb2   = np.zeros(n_cw*n_sw) 
-        zb2   = np.zeros(n_cw*n_sw)    
-        xac   = np.zeros(n_cw*n_sw)
-        yac   = np.zeros(n_cw*n_sw)
-        zac   = np.zeros(n_cw*n_sw)    
-        xbc   = np.zeros(n_cw*n_sw)
-        ybc   = np.zeros(n_cw*n_sw)
-        zbc   = np.zeros(n_cw*n_sw)  
-        xc    = np.zeros(n_cw*n_sw) 
-        yc    = np.zeros(n_cw*n_sw) 
-        zc    = np.zeros(n_cw*n_sw) 
-        x     = np.zeros((n_cw+1)*(n_sw+1)) # may have to change to make space for split if control surfaces are allowed to have more than two Segments
-        y     = np.zeros((n_cw+1)*(n_sw+1)) 
-        z     = np.zeros((n_cw+1)*(n_sw+1))         
-        cs_w  = np.zeros(n_sw)        
-        
         # adjust origin for symmetry with special case for vertical symmetry
         wing_origin_x = wing_origin[0]
         wing_origin_y = wing_origin[1] * ((1-vertical_wing)*sym_sign+vertical_wing)
         wing_origin_z = wing_origin[2] * ((1-vertical_wing)+sym_sign*vertical_wing)
-            
-        # ---------------------------------------------------------------------------------------------------------
-        # Loop over each strip of panels in the wing
-        i_break = 0           
-        for idx_y in range(n_sw):
-            # define basic geometric values------------------------------------------------------------------------
-            # inboard, outboard, and central panel values
-            eta_a = (y_a[idx_y] - break_spans[i_break])  
-            eta_b = (y_b[idx_y] - break_spans[i_break]) 
-            eta   = (y_b[idx_y] - del_y[idx_y]/2 - break_spans[i_break]) 
-            
-            # Inverted wing
-            wing.inverted_wing = -np.sign(break_dihedral[i_break] - np.pi/2)
-    
-            segment_chord_ratio = (break_chord[i_break+1] - break_chord[i_break])/section_span[i_break+1]
-            segment_twist_ratio = (break_twist[i_break+1] - break_twist[i_break])/section_span[i_break+1]
-    
-            wing_chord_section_a  = break_chord[i_break] + (eta_a*segment_chord_ratio) 
-            wing_chord_section_b  = break_chord[i_break] + (eta_b*segment_chord_ratio)
-            wing_chord_section    = break_chord[i_break] + (eta*segment_chord_ratio)
-    
-            # x-positions based on whether the wing needs 'cuts' for its control sufaces
-            nondim_x_stations = np.interp(np.linspace(0.,1.,num=n_cw+1), [0.,1.], [section_LE_cut[i_break], section_TE_cut[i_break]])
-            x_stations_a      = nondim_x_stations * wing_chord_section_a  #x positions accounting for control surface cuts, relative to leading
-            x_stations_b      = nondim_x_stations * wing_chord_section_b
-            x_stations        = nondim_x_stations * wing_chord_section
-            
-            delta_x_a = (x_stations_a[-1] - x_stations_a[0])/n_cw  
-            delta_x_b = (x_stations_b[-1] - x_stations_b[0])/n_cw      
-            delta_x   = (x_stations[-1]   - x_stations[0]  )/n_cw             
-    
-            # define coordinates of horseshoe vortices and control points------------------------------------------
-            xi_a1 = break_x_offset[i_break] + eta_a*np.tan(break_sweep[i_break]) + x_stations_a[:-1]                  # x coordinate of top left corner of panel
-            xi_ah = break_x_offset[i_break] + eta_a*np.tan(break_sweep[i_break]) + x_stations_a[:-1] + delta_x_a*0.25 # x coordinate of left corner of panel
-            xi_ac = break_x_offset[i_break] + eta_a*np.tan(break_sweep[i_break]) + x_stations_a[:-1] + delta_x_a*0.75 # x coordinate of bottom left corner of control point vortex  
-            xi_a2 = break_x_offset[i_break] + eta_a*np.tan(break_sweep[i_break]) + x_stations_a[1:]                   # x coordinate of bottom left corner of bound vortex 
-            xi_b1 = break_x_offset[i_break] + eta_b*np.tan(break_sweep[i_break]) + x_stations_b[:-1]                  # x coordinate of top right corner of panel      
-            xi_bh = break_x_offset[i_break] + eta_b*np.tan(break_sweep[i_break]) + x_stations_b[:-1] + delta_x_b*0.25 # x coordinate of right corner of bound vortex         
-            xi_bc = break_x_offset[i_break] + eta_b*np.tan(break_sweep[i_break]) + x_stations_b[:-1] + delta_x_b*0.75 # x coordinate of bottom right corner of control point vortex         
-            xi_b2 = break_x_offset[i_break] + eta_b*np.tan(break_sweep[i_break]) + x_stations_b[1:]                   # x coordinate of bottom right corner of panel
-            xi_ch = break_x_offset[i_break] + eta  *np.tan(break_sweep[i_break]) + x_stations[:-1]   + delta_x  *0.25 # x coordinate center of bound vortex of each panel 
-            xi_c  = break_x_offset[i_break] + eta  *np.tan(break_sweep[i_break]) + x_stations[:-1]   + delta_x  *0.75 # x coordinate three-quarter chord control point for each panel
-    
-            #adjust for camber-------------------------------------------------------------------------------------    
-            #format camber vars for wings vs control surface wings
-            nondim_camber_x_coords = break_camber_xs[i_break] *1
-            nondim_camber          = break_camber_zs[i_break] *1
-            if wing.is_a_control_surface: #rescale so that airfoils get cut properly
-                if not wing.is_slat:
-                    nondim_camber_x_coords -= 1 - wing.chord_fraction
-                nondim_camber_x_coords /= wing.chord_fraction
-                nondim_camber          /= wing.chord_fraction
-    
-            # adjustment of coordinates for camber
-            section_camber_a  = nondim_camber*wing_chord_section_a  
-            section_camber_b  = nondim_camber*wing_chord_section_b  
-            section_camber_c  = nondim_camber*wing_chord_section             
-            
-            section_x_coord_a = nondim_camber_x_coords*wing_chord_section_a
-            section_x_coord_b = nondim_camber_x_coords*wing_chord_section_b
-            section_x_coord   = nondim_camber_x_coords*wing_chord_section
-    
-            z_c_a1 = np.interp((x_stations_a[:-1]                 ) ,section_x_coord_a, section_camber_a) 
-            z_c_ah = np.interp((x_stations_a[:-1] + delta_x_a*0.25) ,section_x_coord_a, section_camber_a)
-            z_c_ac = np.interp((x_stations_a[:-1] + delta_x_a*0.75) ,section_x_coord_a, section_camber_a) 
-            z_c_a2 = np.interp((x_stations_a[1:]                  ) ,section_x_coord_a, section_camber_a) 
-            z_c_b1 = np.interp((x_stations_b[:-1]                 ) ,section_x_coord_b, section_camber_b)   
-            z_c_bh = np.interp((x_stations_b[:-1] + delta_x_b*0.25) ,section_x_coord_b, section_camber_b) 
-            z_c_bc = np.interp((x_stations_b[:-1] + delta_x_b*0.75) ,section_x_coord_b, section_camber_b) 
-            z_c_b2 = np.interp((x_stations_b[1:]                  ) ,section_x_coord_b, section_camber_b) 
-            z_c_ch = np.interp((x_stations[:-1]   + delta_x  *0.25) ,section_x_coord  , section_camber_c) 
-            z_c    = np.interp((x_stations[:-1]   + delta_x  *0.75) ,section_x_coord  , section_camber_c) 
-    
-            # adjust for dihedral and add to camber----------------------------------------------------------------    
-            zeta_a1 = break_z_offset[i_break] + eta_a*np.tan(break_dihedral[i_break])  + z_c_a1  # z coordinate of top left corner of panel
-            zeta_ah = break_z_offset[i_break] + eta_a*np.tan(break_dihedral[i_break])  + z_c_ah  # z coordinate of left corner of bound vortex  
-            zeta_a2 = break_z_offset[i_break] + eta_a*np.tan(break_dihedral[i_break])  + z_c_a2  # z coordinate of bottom left corner of panel
-            zeta_ac = break_z_offset[i_break] + eta_a*np.tan(break_dihedral[i_break])  + z_c_ac  # z coordinate of bottom left corner of panel of control point
-            zeta_bc = break_z_offset[i_break] + eta_b*np.tan(break_dihedral[i_break])  + z_c_bc  # z coordinate of top right corner of panel of control point                          
-            zeta_b1 = break_z_offset[i_break] + eta_b*np.tan(break_dihedral[i_break])  + z_c_b1  # z coordinate of top right corner of panel  
-            zeta_bh = break_z_offset[i_break] + eta_b*np.tan(break_dihedral[i_break])  + z_c_bh  # z coordinate of right corner of bound vortex        
-            zeta_b2 = break_z_offset[i_break] + eta_b*np.tan(break_dihedral[i_break])  + z_c_b2  # z coordinate of bottom right corner of panel                 
-            zeta_ch = break_z_offset[i_break] + eta  *np.tan(break_dihedral[i_break])  + z_c_ch  # z coordinate center of bound vortex on each panel
-            zeta    = break_z_offset[i_break] + eta  *np.tan(break_dihedral[i_break])  + z_c     # z coordinate three-quarter chord control point for each panel
-    
-            # adjust for twist-------------------------------------------------------------------------------------
-            # pivot point is the leading edge before camber  
-            pivot_x_a = break_x_offset[i_break] + eta_a*np.tan(break_sweep[i_break])             # x location of leading edge left corner of wing
-            pivot_x_b = break_x_offset[i_break] + eta_b*np.tan(break_sweep[i_break])             # x location of leading edge right of wing
-            pivot_x   = break_x_offset[i_break] + eta  *np.tan(break_sweep[i_break])             # x location of leading edge center of wing
-            
-            pivot_z_a = break_z_offset[i_break] + eta_a*np.tan(break_dihedral[i_break])          # z location of leading edge left corner of wing
-            pivot_z_b = break_z_offset[i_break] + eta_b*np.tan(break_dihedral[i_break])          # z location of leading edge right of wing
-            pivot_z   = break_z_offset[i_break] + eta  *np.tan(break_dihedral[i_break])          # z location of leading edge center of wing
-    
-            # adjust twist pivot line for control surface wings: offset leading edge to match that of the owning wing            
-            if wing.is_a_control_surface and not wing.is_slat: #correction only leading for non-leading edge control surfaces since the LE is the pivot by default
-                nondim_cs_LE = (1 - wing.chord_fraction)
-                pivot_x_a   -= nondim_cs_LE *(wing_chord_section_a /wing.chord_fraction) 
-                pivot_x_b   -= nondim_cs_LE *(wing_chord_section_b /wing.chord_fraction) 
-                pivot_x     -= nondim_cs_LE *(wing_chord_section   /wing.chord_fraction) 
-    
-            # adjust coordinates for twist
-            section_twist_a = break_twist[i_break] + (eta_a * segment_twist_ratio)               # twist at left side of panel
-            section_twist_b = break_twist[i_break] + (eta_b * segment_twist_ratio)               # twist at right side of panel
-            section_twist   = break_twist[i_break] + (eta   * segment_twist_ratio)               # twist at center local chord 
-    
-            xi_prime_a1    = pivot_x_a + np.cos(section_twist_a)*(xi_a1-pivot_x_a) + np.sin(section_twist_a)*(zeta_a1-pivot_z_a) # x coordinate transformation of top left corner
-            xi_prime_ah    = pivot_x_a + np.cos(section_twist_a)*(xi_ah-pivot_x_a) + np.sin(section_twist_a)*(zeta_ah-pivot_z_a) # x coordinate transformation of bottom left corner
-            xi_prime_ac    = pivot_x_a + np.cos(section_twist_a)*(xi_ac-pivot_x_a) + np.sin(section_twist_a)*(zeta_a2-pivot_z_a) # x coordinate transformation of bottom left corner of control point
-            xi_prime_a2    = pivot_x_a + np.cos(section_twist_a)*(xi_a2-pivot_x_a) + np.sin(section_twist_a)*(zeta_a2-pivot_z_a) # x coordinate transformation of bottom left corner
-            xi_prime_b1    = pivot_x_b + np.cos(section_twist_b)*(xi_b1-pivot_x_b) + np.sin(section_twist_b)*(zeta_b1-pivot_z_b) # x coordinate transformation of top right corner 
-            xi_prime_bh    = pivot_x_b + np.cos(section_twist_b)*(xi_bh-pivot_x_b) + np.sin(section_twist_b)*(zeta_bh-pivot_z_b) # x coordinate transformation of top right corner 
-            xi_prime_bc    = pivot_x_b + np.cos(section_twist_b)*(xi_bc-pivot_x_b) + np.sin(section_twist_b)*(zeta_b1-pivot_z_b) # x coordinate transformation of top right corner of control point                         
-            xi_prime_b2    = pivot_x_b + np.cos(section_twist_b)*(xi_b2-pivot_x_b) + np.sin(section_twist_b)*(zeta_b2-pivot_z_b) # x coordinate transformation of botton right corner 
-            xi_prime_ch    = pivot_x   + np.cos(section_twist)  *(xi_ch-pivot_x)   + np.sin(section_twist)  *(zeta_ch-pivot_z)   # x coordinate transformation of center of horeshoe vortex 
-            xi_prime       = pivot_x   + np.cos(section_twist)  *(xi_c -pivot_x)   + np.sin(section_twist)  *(zeta   -pivot_z)   # x coordinate transformation of control point
-    
-            zeta_prime_a1  = pivot_z_a - np.sin(section_twist_a)*(xi_a1-pivot_x_a) + np.cos(section_twist_a)*(zeta_a1-pivot_z_a) # z coordinate transformation of top left corner
-            zeta_prime_ah  = pivot_z_a - np.sin(section_twist_a)*(xi_ah-pivot_x_a) + np.cos(section_twist_a)*(zeta_ah-pivot_z_a) # z coordinate transformation of bottom left corner
-            zeta_prime_ac  = pivot_z_a - np.sin(section_twist_a)*(xi_ac-pivot_x_a) + np.cos(section_twist_a)*(zeta_ac-pivot_z_a) # z coordinate transformation of bottom left corner
-            zeta_prime_a2  = pivot_z_a - np.sin(section_twist_a)*(xi_a2-pivot_x_a) + np.cos(section_twist_a)*(zeta_a2-pivot_z_a) # z coordinate transformation of bottom left corner
-            zeta_prime_b1  = pivot_z_b - np.sin(section_twist_b)*(xi_b1-pivot_x_b) + np.cos(section_twist_b)*(zeta_b1-pivot_z_b) # z coordinate transformation of top right corner 
-            zeta_prime_bh  = pivot_z_b - np.sin(section_twist_b)*(xi_bh-pivot_x_b) + np.cos(section_twist_b)*(zeta_bh-pivot_z_b) # z coordinate transformation of top right corner 
-            zeta_prime_bc  = pivot_z_b - np.sin(section_twist_b)*(xi_bc-pivot_x_b) + np.cos(section_twist_b)*(zeta_bc-pivot_z_b) # z coordinate transformation of top right corner                         
-            zeta_prime_b2  = pivot_z_b - np.sin(section_twist_b)*(xi_b2-pivot_x_b) + np.cos(section_twist_b)*(zeta_b2-pivot_z_b) # z coordinate transformation of botton right corner 
-            zeta_prime_ch  = pivot_z   - np.sin(section_twist)  *(xi_ch-pivot_x)   + np.cos(-section_twist) *(zeta_ch-pivot_z)   # z coordinate transformation of center of horseshoe
-            zeta_prime     = pivot_z   - np.sin(section_twist)  *(xi_c -pivot_x)   + np.cos(-section_twist) *(zeta   -pivot_z)   # z coordinate transformation of control point
-            
-            # Define y-coordinate and other arrays-----------------------------------------------------------------
-            # take normal value for first wing, then reflect over xz plane for a symmetric wing
-            y_prime_as = (np.ones(n_cw+1)*y_a[idx_y]                 ) *sym_sign          
-            y_prime_a1 = (y_prime_as[:-1]                            ) *1       
-            y_prime_ah = (y_prime_as[:-1]                            ) *1       
-            y_prime_ac = (y_prime_as[:-1]                            ) *1          
-            y_prime_a2 = (y_prime_as[:-1]                            ) *1        
-            y_prime_bs = (np.ones(n_cw+1)*y_b[idx_y]                 ) *sym_sign            
-            y_prime_b1 = (y_prime_bs[:-1]                            ) *1         
-            y_prime_bh = (y_prime_bs[:-1]                            ) *1         
-            y_prime_bc = (y_prime_bs[:-1]                            ) *1         
-            y_prime_b2 = (y_prime_bs[:-1]                            ) *1   
-            y_prime_ch = (np.ones(n_cw)*(y_b[idx_y] - del_y[idx_y]/2)) *sym_sign
-            y_prime    = (y_prime_ch                                 ) *1    
-            
-            # populate all corners of all panels. Right side only populated for last strip wing the wing
-            xi_prime_as   = np.concatenate([xi_prime_a1,  np.array([xi_prime_a2  [-1]])])*1
-            xi_prime_bs   = np.concatenate([xi_prime_b1,  np.array([xi_prime_b2  [-1]])])*1
-            zeta_prime_as = np.concatenate([zeta_prime_a1,np.array([zeta_prime_a2[-1]])])*1            
-            zeta_prime_bs = np.concatenate([zeta_prime_b1,np.array([zeta_prime_b2[-1]])])*1  
-            
-            # reflect over the plane y = z for a vertical wing-----------------------------------------------------
-            if vertical_wing:
-                y_prime_a1, zeta_prime_a1 = zeta_prime_a1, wing.inverted_wing*y_prime_a1
-                y_prime_ah, zeta_prime_ah = zeta_prime_ah, wing.inverted_wing*y_prime_ah
-                y_prime_ac, zeta_prime_ac = zeta_prime_ac, wing.inverted_wing*y_prime_ac
-                y_prime_a2, zeta_prime_a2 = zeta_prime_a2, wing.inverted_wing*y_prime_a2
-                                                                     
-                y_prime_b1, zeta_prime_b1 = zeta_prime_b1, wing.inverted_wing*y_prime_b1
-                y_prime_bh, zeta_prime_bh = zeta_prime_bh, wing.inverted_wing*y_prime_bh
-                y_prime_bc, zeta_prime_bc = zeta_prime_bc, wing.inverted_wing*y_prime_bc
-                y_prime_b2, zeta_prime_b2 = zeta_prime_b2, wing.inverted_wing*y_prime_b2
-                
-                y_prime_ch, zeta_prime_ch = zeta_prime_ch, wing.inverted_wing*y_prime_ch
-                y_prime   , zeta_prime    = zeta_prime   , wing.inverted_wing*y_prime
-                
-                y_prime_as, zeta_prime_as = zeta_prime_as, wing.inverted_wing*y_prime_as
-
- 
-                y_prime_bs = wing.inverted_wing*y_prime_bs
-                y_prime_bs, zeta_prime_bs = zeta_prime_bs, y_prime_bs
-                 
-            # store coordinates of panels, horseshoeces vortices and control points relative to wing root----------
-            xa1[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_a1     # top left corner of panel
-            ya1[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_a1
-            za1[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_a1
-            xah[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_ah     # left coord of horseshoe
-            yah[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_ah
-            zah[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_ah                    
-            xac[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_ac     # left coord of control point
-            yac[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_ac
-            zac[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_ac
-            xa2[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_a2     # bottom left corner of panel
-            ya2[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_a2
-            za2[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_a2
-                                             
-            xb1[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_b1     # top right corner of panel
-            yb1[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_b1          
-            zb1[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_b1   
-            xbh[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_bh     # right coord of horseshoe
-            ybh[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_bh          
-            zbh[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_bh                    
-            xbc[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_bc     # right coord of control point
-            ybc[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_bc                           
-            zbc[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_bc   
-            xb2[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_b2     # bottom right corner of panel
-            yb2[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_b2                        
-            zb2[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_b2 
-                                             
-            xch[idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime_ch     # center coord of horseshoe
-            ych[idx_y*n_cw:(idx_y+1)*n_cw] = y_prime_ch                              
-            zch[idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime_ch
-            xc [idx_y*n_cw:(idx_y+1)*n_cw] = xi_prime        # center (true) coord of control point
-            yc [idx_y*n_cw:(idx_y+1)*n_cw] = y_prime
-            zc [idx_y*n_cw:(idx_y+1)*n_cw] = zeta_prime 
-           
-            x[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = xi_prime_as     # x, y, z represent all all points of the corners of the panels, LE and TE inclusive
-            y[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = y_prime_as      # the final right corners get appended at last strip in wing, later
-            z[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = zeta_prime_as              
-
-            cs_w[idx_y] = wing_chord_section       
-                   
-            # store this strip's discretization information--------------------------------------------------------
-            LE_inds        = np.full(n_cw, False)
-            TE_inds        = np.full(n_cw, False)
-            LE_inds[0]     = True
-            TE_inds[-1]    = True
-            
-            RNMAX          = np.ones(n_cw, np.int16)*n_cw
-            panel_numbers  = np.linspace(1,n_cw,n_cw, dtype=np.int16)           
-                        
-            is_a_slat                  = wing.is_a_control_surface and wing.is_slat
-            strip_has_no_slat          = (not wing.is_a_control_surface) and (span_breaks[i_break].cs_IDs[0,1] == -1) # wing's le, outboard control surface ID
-            exposed_leading_edge_flag  = np.int16(1) if is_a_slat or strip_has_no_slat else np.int16(0)   
-            
-            VD.leading_edge_indices      = np.append(VD.leading_edge_indices     , LE_inds                  ) 
-            VD.trailing_edge_indices     = np.append(VD.trailing_edge_indices    , TE_inds                  )            
-            VD.panels_per_strip          = np.append(VD.panels_per_strip         , RNMAX                    )
-            VD.chordwise_panel_number    = np.append(VD.chordwise_panel_number   , panel_numbers            )  
-            VD.exposed_leading_edge_flag = np.append(VD.exposed_leading_edge_flag, exposed_leading_edge_flag)
-            
-            #increment i_break if needed; check for end of wing----------------------------------------------------
-            if y_b[idx_y] == break_spans[i_break+1]: 
-                i_break += 1            
-        #End 'for each strip' loop    
-        
-        # store outboardmost edge
-        x[-(n_cw+1):] = xi_prime_bs
-        y[-(n_cw+1):] = y_prime_bs
-        z[-(n_cw+1):] = zeta_prime_bs              
-        
-        # adjusting coordinate axis so reference point is at the nose of the aircraft------------------------------
-        xah = xah + wing_origin_x # x coordinate of left corner of bound vortex 
-        yah = yah + wing_origin_y # y coordinate of left corner of bound vortex 
-        zah = zah + wing_origin_z # z coordinate of left corner of bound vortex 
-        xbh = xbh + wing_origin_x # x coordinate of right corner of bound vortex 
-        ybh = ybh + wing_origin_y # y coordinate of right corner of bound vortex 
-        zbh = zbh + wing_origin_z # z coordinate of right corner of bound vortex 
-        xch = xch + wing_origin_x # x coordinate of center of bound vortex on panel
-        ych = ych + wing_origin_y # y coordinate of center of bound vortex on panel
-        zch = zch + wing_origin_z # z coordinate of center of bound vortex on panel  
-    
-        xa1 = xa1 + wing_origin_x # x coordinate of top left corner of panel
-        ya1 = ya1 + wing_origin_y # y coordinate of bottom left corner of panel
-        za1 = za1 + wing_origin_z # z coordinate of top left corner of panel
-        xa2 = xa2 + wing_origin_x # x coordinate of bottom left corner of panel
-        ya2 = ya2 + wing_origin_y # x coordinate of bottom left corner of panel
-        za2 = za2 + wing_origin_z # z coordinate of bottom left corner of panel  
-    
-        xb1 = xb1 + wing_origin_x # x coordinate of top right corner of panel  
-        yb1 = yb1 + wing_origin_y # y coordinate of top right corner of panel 
-        zb1 = zb1 + wing_origin_z # z coordinate of top right corner of panel 
-        xb2 = xb2 + wing_origin_x # x coordinate of bottom rightcorner of panel 
-        yb2 = yb2 + wing_origin_y # y coordinate of bottom rightcorner of panel 
-        zb2 = zb2 + wing_origin_z # z coordinate of bottom right corner of panel                   
-    
-        xac = xac + wing_origin_x  # x coordinate of control points on panel
-        yac = yac + wing_origin_y  # y coordinate of control points on panel
-        zac = zac + wing_origin_z  # z coordinate of control points on panel
-        xbc = xbc + wing_origin_x  # x coordinate of control points on panel
-        ybc = ybc + wing_origin_y  # y coordinate of control points on panel
-        zbc = zbc + wing_origin_z  # z coordinate of control points on panel
-    
-        xc  = xc  + wing_origin_x  # x coordinate of control points on panel
-        yc  = yc  + wing_origin_y  # y coordinate of control points on panel
-        zc  = zc  + wing_origin_z  # y coordinate of control points on panel
-        x   = x   + wing_origin_x  # x coordinate of control points on panel
-        y   = y   + wing_origin_y  # y coordinate of control points on panel
-        z   = z   + wing_origin_z  # y coordinate of control points on panel
-        
+
+        # Define y-coordinate and other arrays-------------------------------------------------------------------------
+        # take normal value for first wing, then reflect over xz plane for a symmetric wing
+        y_prime_a  = (y_a[:,None]*np.ones(n_cw)           ) *sym_sign
+        y_prime_b  = (y_b[:,None]*np.ones(n_cw)           ) *sym_sign
+        y_prime_ch = ((y_b - del_y/2)[:,None]*np.ones(n_cw)) *sym_sign
+        y_prime_s  = y_s*sym_sign
+
+        y_prime_a1, y_prime_ah, y_prime_ac, y_prime_a2 = y_prime_a, y_prime_a, y_prime_a, y_prime_a
+        y_prime_b1, y_prime_bh, y_prime_bc, y_prime_b2 = y_prime_b, y_prime_b, y_prime_b, y_prime_b
+        y_prime = y_prime_ch
+
+        z_prime_a1, z_prime_ah, z_prime_ac, z_prime_a2 = zeta_prime_a1, zeta_prime_ah, zeta_prime_ac, zeta_prime_a2
+        z_prime_b1, z_prime_bh, z_prime_bc, z_prime_b2 = zeta_prime_b1, zeta_prime_bh, zeta_prime_bc, zeta_prime_b2
+        z_prime_ch, z_prime, z_prime_s                 = zeta_prime_ch, zeta_prime   , zeta_prime_s
+
+        # reflect over the plane y = z for a vertical wing---------------------------------------------------------
+        if vertical_wing:
+            y_prime_a1, z_prime_a1 = z_prime_a1, inverted_wing*y_prime_a1
+            y_prime_ah, z_prime_ah = z_prime_ah, inverted_wing*y_prime_ah
+            y_prime_ac, z_prime_ac = z_prime_ac, inverted_wing*y_prime_ac
+            y_prime_a2, z_prime_a2 = z_prime_a2, inverted_wing*y_prime_a2
+
+            y_prime_b1, z_prime_b1 = z_prime_b1, inverted_wing*y_prime_b1
+            y_prime_bh, z_prime_bh = z_prime_bh, inverted_wing*y_prime_bh
+            y_prime_bc, z_prime_bc = z_prime_bc, inverted_wing*y_prime_bc
+            y_prime_b2, z_prime_b2 = z_prime_b2, inverted_wing*y_prime_b2
+
+            y_prime_ch, z_prime_ch = z_prime_ch, inverted_wing*y_prime_ch
+            y_prime   , z_prime    = z_prime   , inverted_wing*y_prime
+
+            y_prime_s , z_prime_s  = z_prime_s , inverted_s*y_prime_s
+
         # VD discretization information----------------------------------------------------------------------------
-        
+        first_panel_ind, first_strip_ind, first_point_ind = first_surface_indices(VD)
+        n_panels = n_cw*n_sw
+        n_points = (n_cw+1)*(n_sw+1)
+        panels   = slice(first_panel_ind, first_panel_ind + n_panels)
+        strip    = slice(first_strip_ind, first_strip_ind + n_sw)
+        points   = slice(first_point_ind, first_point_ind + n_points)
+        ID       = VD.counter*1
+
+        # store this wing's discretization information
+        VD.chordwise_breaks[strip]      = first_panel_ind + np.arange(n_panels)[0::n_cw]
+        VD.spanwise_breaks[VD.n_w]      = first_strip_ind
+        VD.n_sw[VD.n_w]                 = n_sw
+        VD.n_cw[VD.n_w]                 = n_cw
+        VD.surface_ID[panels]           = ID*sym_sign
+        VD.surface_ID_full[points]      = ID*sym_sign
+
+        VD.leading_edge_indices[panels]      = panel_numbers == 1
+        VD.trailing_edge_indices[panels]     = panel_numbers == n_cw
+        VD.panels_per_strip[panels]          = n_cw
+        VD.chordwise_panel_number[panels]    = panel_numbers
+        VD.exposed_leading_edge_flag[strip]  = exposed_leading_edge_flag
+
         # increment number of wings and panels
-        n_panels = len(xch)
-        VD.n_w  += 1             
-        VD.n_cp += n_panels 
-        
-        # store this wing's discretization information  
-        first_panel_ind  = VD.XAH.size
-        first_strip_ind  = VD.chordwise_breaks.size
-        chordwise_breaks = first_panel_ind + np.arange(n_panels)[0::n_cw]
-        ID               = VD.counter*1
-        
-        VD.chordwise_breaks = np.append(VD.chordwise_breaks, np.int32(chordwise_breaks))
-        VD.spanwise_breaks  = np.append(VD.spanwise_breaks , np.int32(first_strip_ind ))            
-        VD.n_sw             = np.append(VD.n_sw            , np.int16(n_sw)            )
-        VD.n_cw             = np.append(VD.n_cw            , np.int16(n_cw)            )
-        VD.surface_ID       = np.append(VD.surface_ID      , np.ones(n_cw*n_sw)*ID*sym_sign) # Update me when the loop is gone
-        VD.surface_ID_full  = np.append(VD.surface_ID_full , np.ones((n_cw+1)*(n_sw+1))*ID*sym_sign) # Update me when the loop is gone    
-                
+        VD.n_w  += 1
+        VD.n_cp += n_panels
+
+        # ---------------------------------------------------------------------------------------
+        # STEP 7: Store wing in vehicle vector, with the reference point at the nose of the aircraft
         # ---------------------------------------------------------------------------------------
-        # STEP 7: Store wing in vehicle vector
-        # --------------------------------------------------------------------------------------- 
-        VD.XAH    = np.append(VD.XAH  , np.array(xah  , dtype=precision))
-        VD.YAH    = np.append(VD.YAH  , np.array(yah  , dtype=precision))
-        VD.ZAH    = np.append(VD.ZAH  , np.array(zah  , dtype=precision))
-        VD.XBH    = np.append(VD.XBH  , np.array(xbh  , dtype=precision))
-        VD.YBH    = np.append(VD.YBH  , np.array(ybh  , dtype=precision))
-        VD.ZBH    = np.append(VD.ZBH  , np.array(zbh  , dtype=precision))
-        VD.XCH    = np.append(VD.XCH  , np.array(xch  , dtype=precision))
-        VD.YCH    = np.append(VD.YCH  , np.array(ych  , dtype=precision))
-        VD.ZCH    = np.append(VD.ZCH  , np.array(zch  , dtype=precision))            
-        VD.XA1    = np.append(VD.XA1  , np.array(xa1  , dtype=precision))
-        VD.YA1    = np.append(VD.YA1  , np.array(ya1  , dtype=precision))
-        VD.ZA1    = np.append(VD.ZA1  , np.array(za1  , dtype=precision))
-        VD.XA2    = np.append(VD.XA2  , np.array(xa2  , dtype=precision))
-        VD.YA2    = np.append(VD.YA2  , np.array(ya2  , dtype=precision))
-        VD.ZA2    = np.append(VD.ZA2  , np.array(za2  , dtype=precision))        
-        VD.XB1    = np.append(VD.XB1  , np.array(xb1  , dtype=precision))
-        VD.YB1    = np.append(VD.YB1  , np.array(yb1  , dtype=precision))
-        VD.ZB1    = np.append(VD.ZB1  , np.array(zb1  , dtype=precision))
-        VD.XB2    = np.append(VD.XB2  , np.array(xb2  , dtype=precision))                
-        VD.YB2    = np.append(VD.YB2  , np.array(yb2  , dtype=precision))        
-        VD.ZB2    = np.append(VD.ZB2  , np.array(zb2  , dtype=precision)) 
-        VD.XAC    = np.append(VD.XAC  , np.array(xac  , dtype=precision))
-        VD.YAC    = np.append(VD.YAC  , np.array(yac  , dtype=precision)) 
-        VD.ZAC    = np.append(VD.ZAC  , np.array(zac  , dtype=precision)) 
-        VD.XBC    = np.append(VD.XBC  , np.array(xbc  , dtype=precision))
-        VD.YBC    = np.append(VD.YBC  , np.array(ybc  , dtype=precision)) 
-        VD.ZBC    = np.append(VD.ZBC  , np.array(zbc  , dtype=precision))  
-        VD.XC     = np.append(VD.XC   , np.array(xc   , dtype=precision))
-        VD.YC     = np.append(VD.YC   , np.array(yc   , dtype=precision))
-        VD.ZC     = np.append(VD.ZC   , np.array(zc   , dtype=precision))  
-        VD.X      = np.append(VD.X    , np.array(x    , dtype=precision))
-        VD.Y      = np.append(VD.Y    , np.array(y    , dtype=precision))
-        VD.Z      = np.append(VD.Z    , np.array(z    , dtype=precision))         
-        VD.CS     = np.append(VD.CS   , np.array(cs_w , dtype=precision)) 
-        VD.DY     = np.append(VD.DY   , np.array(del_y, dtype=precision))    
+        VD.XAH[panels] = (xi_prime_ah + wing_origin_x).ravel() # x coordinate of left corner of bound vortex
+        VD.YAH[panels] = (y_prime_ah  + wing_origin_y).ravel() # y coordinate of left corner of bound vortex
+        VD.ZAH[panels] = (z_prime_ah  + wing_origin_z).ravel() # z coordinate of left corner of bound vortex
+        VD.XBH[panels] = (xi_prime_bh + wing_origin_x).ravel() # x coordinate of right corner of bound vortex
+        VD.YBH[panels] = (y_prime_bh  + wing_origin_y).ravel() # y coordinate of right corner of bound vortex
+        VD.ZBH[panels] = (z_prime_bh  + wing_origin_z).ravel() # z coordinate of right corner of bound vortex
+        VD.XCH[panels] = (xi_prime_ch + wing_origin_x).ravel() # x coordinate of center of bound vortex on panel
+        VD.YCH[panels] = (y_prime_ch  + wing_origin_y).ravel() # y coordinate of center of bound vortex on panel
+        VD.ZCH[panels] = (z_prime_ch  + wing_origin_z).ravel() # z coordinate of center of bound vortex on panel
+        VD.XA1[panels] = (xi_prime_a1 + wing_origin_x).ravel() # x coordinate of top left corner of panel
+        VD.YA1[panels] = (y_prime_a1  + wing_origin_y).ravel() # y coordinate of bottom left corner of panel
+        VD.ZA1[panels] = (z_prime_a1  + wing_origin_z).ravel() # z coordinate of top left corner of panel
+        VD.XA2[panels] = (xi_prime_a2 + wing_origin_x).ravel() # x coordinate of bottom left corner of panel
+        VD.YA2[panels] = (y_prime_a2  + wing_origin_y).ravel() # x coordinate of bottom left corner of panel
+        VD.ZA2[panels] = (z_prime_a2  + wing_origin_z).ravel() # z coordinate of bottom left corner of panel
+        VD.XB1[panels] = (xi_prime_b1 + wing_origin_x).ravel() # x coordinate of top right corner of panel
+        VD.YB1[panels] = (y_prime_b1  + wing_origin_y).ravel() # y coordinate of top right corner of panel
+        VD.ZB1[panels] = (z_prime_b1  + wing_origin_z).ravel() # z coordinate of top right corner of panel
+        VD.XB2[panels] = (xi_prime_b2 + wing_origin_x).ravel() # x coordinate of bottom rightcorner of panel
+        VD.YB2[panels] = (y_prime_b2  + wing_origin_y).ravel() # y coordinate of bottom rightcorner of panel
+        VD.ZB2[panels] = (z_prime_b2  + wing_origin_z).ravel() # z coordinate of bottom right corner of panel
+        VD.XAC[panels] = (xi_prime_ac + wing_origin_x).ravel() # x coordinate of control points on panel
+        VD.YAC[panels] = (y_prime_ac  + wing_origin_y).ravel() # y coordinate of control points on panel
+        VD.ZAC[panels] = (z_prime_ac  + wing_origin_z).ravel() # z coordinate of control points on panel
+        VD.XBC[panels] = (xi_prime_bc + wing_origin_x).ravel() # x coordinate of control points on panel
+        VD.YBC[panels] = (y_prime_bc  + wing_origin_y).ravel() # y coordinate of control points on panel
+        VD.ZBC[panels] = (z_prime_bc  + wing_origin_z).ravel() # z coordinate of control points on panel
+        VD.XC [panels] = (xi_prime    + wing_origin_x).ravel() # x coordinate of control points on panel
+        VD.YC [panels] = (y_prime     + wing_origin_y).ravel() # y coordinate of control points on panel
+        VD.ZC [panels] = (z_prime     + wing_origin_z).ravel() # z coordinate of control points on panel
+        VD.X  [points] = (xi_prime_s  + wing_origin_x).ravel() # x coordinate of all corners of the panels
+        VD.Y  [points] = (y_prime_s   + wing_origin_y).ravel() # y coordinate of all corners of the panels
+        VD.Z  [points] = (z_prime_s   + wing_origin_z).ravel() # z coordinate of all corners of the panels
+        VD.CS [strip]  = wing_chord_section
+        VD.DY [strip]  = del_y
     #End symmetry loop
-    
+
     VD.symmetric_wings = np.append(VD.symmetric_wings, int(sym_para))
-    
+
     # Pack wing data
-    wing.n_sw = n_sw
-    wing.n_cw = n_cw    
-    
+    wing.n_sw          = n_sw
+    wing.n_cw          = n_cw
+    wing.inverted_wing = inverted_wing[-1,0]
+
     return VD, wing
-    
+
 
 # ----------------------------------------------------------------------
 #  Discretize Fuselage
 # ----------------------------------------------------------------------
 def generate_fuselage_and_nacelle_vortex_distribution(VD,fus,n_cw,n_sw,precision,model_geometry=False):
     """ This generates the vortex distribution points on a fuselage or nacelle component
-    Assumptions: 
+    Assumptions:
     If nacelle has segments defined, the mean width and height of the nacelle is used
-    Source:   
+    The fuselage is modelled by its horizontal section
+    Source:
     None
-    
-    Inputs:   
+
+    Inputs:
     VD                   - vortex distribution
-    
+
     Properties Used:
     N/A
-    """    
-    
-    fhs_xa1 = np.zeros(n_cw*n_sw)
-    fhs_ya1 = np.zeros(n_cw*n_sw)
-    fhs_za1 = np.zeros(n_cw*n_sw)
-    fhs_xa2 = np.zeros(n_cw*n_sw)
-    fhs_ya2 = np.zeros(n_cw*n_sw)
-    fhs_za2 = np.zeros(n_cw*n_sw)
-    fhs_xb1 = np.zeros(n_cw*n_sw)
-    fhs_yb1 = np.zeros(n_cw*n_sw)
-    fhs_zb1 = np.zeros(n_cw*n_sw)
-    fhs_yb2 = np.zeros(n_cw*n_sw)
-    fhs_xb2 = np.zeros(n_cw*n_sw)
-    fhs_zb2 = np.zeros(n_cw*n_sw)
-    fhs_xah = np.zeros(n_cw*n_sw)
-    fhs_yah = np.zeros(n_cw*n_sw)
-    fhs_zah = np.zeros(n_cw*n_sw)
-    fhs_xbh = np.zeros(n_cw*n_sw)
-    fhs_ybh = np.zeros(n_cw*n_sw)
-    fhs_zbh = np.zeros(n_cw*n_sw)
-    fhs_xch = np.zeros(n_cw*n_sw)
-    fhs_ych = np.zeros(n_cw*n_sw)
-    fhs_zch = np.zeros(n_cw*n_sw)
-    fhs_xc  = np.zeros(n_cw*n_sw)
-    fhs_yc  = np.zeros(n_cw*n_sw)
-    fhs_zc  = np.zeros(n_cw*n_sw)
-    fhs_xac = np.zeros(n_cw*n_sw)
-    fhs_yac = np.zeros(n_cw*n_sw)
-    fhs_zac = np.zeros(n_cw*n_sw)
-    fhs_xbc = np.zeros(n_cw*n_sw)
-    fhs_ybc = np.zeros(n_cw*n_sw)
-    fhs_zbc = np.zeros(n_cw*n_sw)
-    fhs_x   = np.zeros((n_cw+1)*(n_sw+1))
-    fhs_y   = np.zeros((n_cw+1)*(n_sw+1))
-    fhs_z   = np.zeros((n_cw+1)*(n_sw+1))      
-
-    fvs_xc    = np.zeros(n_cw*n_sw)
-    fvs_zc    = np.zeros(n_cw*n_sw)
-    fvs_yc    = np.zeros(n_cw*n_sw)   
-    fvs_x     = np.zeros((n_cw+1)*(n_sw+1))
-    fvs_y     = np.zeros((n_cw+1)*(n_sw+1))
-    fvs_z     = np.zeros((n_cw+1)*(n_sw+1))   
-    fus_v_cs  = np.zeros(n_sw)     
-    
-    # arrays to hold strip discretization values
-    leading_edge_indices    = np.array([],dtype=bool)    
-    trailing_edge_indices   = np.array([],dtype=bool)    
-    panels_per_strip        = np.array([],dtype=np.int16)
-    chordwise_panel_number  = np.array([],dtype=np.int16)               
+    """
+    if model_geometry != True:
+        return VD
 
     # geometry values
     origin     = fus.origin[0]
 
     # --TO DO-- model fuselage segments if defined, else use the following code
-    
+
     # Horizontal Sections of fuselage
-    fhs        = Data()        
-    fhs.origin = np.zeros((n_sw+1,3))        
-    fhs.chord  = np.zeros((n_sw+1))         
-    fhs.sweep  = np.zeros((n_sw+1))     
-                 
-    fvs        = Data() 
-    fvs.origin = np.zeros((n_sw+1,3))
-    fvs.chord  = np.zeros((n_sw+1)) 
-    fvs.sweep  = np.zeros((n_sw+1))
+    fhs        = Data()
+    fhs.origin = np.zeros((n_sw+1,3))
+    fhs.chord  = np.zeros((n_sw+1))
 
     if isinstance(fus, RCAIDE.Library.Components.Fuselages.Fuselage):
 
@@ -908,11 +852,9 @@ def generate_fuselage_and_nacelle_vortex_distribution(VD,fus,n_cw,n_sw,precision
         fus_nose_curvature =  np.interp(np.interp(fus.fineness.nose,vec2,x), x , vec1)
         fus_tail_curvature =  np.interp(np.interp(fus.fineness.tail,vec2,x), x , vec1)
         semispan_h = fus.width * 0.5
-        semispan_v = fus.heights.maximum * 0.5
         si         = np.arange(1,((n_sw*2)+2))
         spacing    = np.cos((2*si - 1)/(2*len(si))*np.pi)
         h_array    = semispan_h*spacing[0:int((len(si)+1)/2)][::-1]
-        v_array    = semispan_v*spacing[0:int((len(si)+1)/2)][::-1]
 
         for i in range(n_sw+1):
             fhs_cabin_length  = fus.lengths.total - (fus.lengths.nose + fus.lengths.tail)
@@ -922,249 +864,210 @@ def generate_fuselage_and_nacelle_vortex_distribution(VD,fus,n_cw,n_sw,precision
             fhs.origin[i][:]  = np.array([fhs.nose_origin , h_array[i], 0.]) # Local origin
             fhs.chord[i]      = fhs_cabin_length + fhs.nose_length + fhs.tail_length
 
-            fvs_cabin_length  = fus.lengths.total - (fus.lengths.nose + fus.lengths.tail)
-            fvs.nose_length   = ((1 - ((abs(v_array[i]/semispan_v))**fus_nose_curvature ))**(1/fus_nose_curvature))*fus.lengths.nose
-            fvs.tail_length   = ((1 - ((abs(v_array[i]/semispan_v))**fus_tail_curvature ))**(1/fus_tail_curvature))*fus.lengths.tail
-            fvs.nose_origin   = fus.lengths.nose - fvs.nose_length
-            fvs.origin[i][:]  = np.array([origin[0] + fvs.nose_origin , origin[1] , origin[2]+  v_array[i]])
-            fvs.chord[i]      = fvs_cabin_length + fvs.nose_length + fvs.tail_length
-
-        fhs.sweep[:] = np.concatenate([np.arctan((fhs.origin[:,0][1:] - fhs.origin[:,0][:-1])/(fhs.origin[:,1][1:]  - fhs.origin[:,1][:-1])) ,np.zeros(1)])
-        fvs.sweep[:] = np.concatenate([np.arctan((fvs.origin[:,0][1:] - fvs.origin[:,0][:-1])/(fvs.origin[:,2][1:]  - fvs.origin[:,2][:-1])) ,np.zeros(1)])
-
     # ---------------------------------------------------------------------------------------
-    # STEP 9: Define coordinates of panels horseshoe vortices and control points  
-    # ---------------------------------------------------------------------------------------        
-    fhs_eta_a = h_array[:-1] 
-    fhs_eta_b = h_array[1:]            
+    # STEP 9: Define coordinates of panels horseshoe vortices and control points. Rows are
+    #         the strips of the section, columns are the chordwise panels of a strip
+    # ---------------------------------------------------------------------------------------
+    fhs_eta_a = h_array[:-1,None]
+    fhs_eta_b = h_array[1:,None]
     fhs_del_y = h_array[1:] - h_array[:-1]
-    fhs_eta   = h_array[1:] - fhs_del_y/2
+    fhs_eta   = (h_array[1:] - fhs_del_y/2)[:,None]
+    idx_x     = np.arange(n_cw)
 
-    fvs_eta_a = v_array[:-1] 
-    fvs_eta_b = v_array[1:]                  
-    fvs_del_y = v_array[1:] - v_array[:-1]
-    fvs_eta   = v_array[1:] - fvs_del_y/2 
+    delta_x_a = fhs.chord[:-1,None]/n_cw
+    delta_x_b = fhs.chord[1:,None]/n_cw
+    delta_x   = (fhs.chord[:-1,None]+fhs.chord[1:,None])/(2*n_cw)
+    origin_a  = fhs.origin[:-1,0,None]
+    origin_b  = fhs.origin[1:,0,None]
+
+    fhs_xi_a1 = origin_a + delta_x_a*idx_x                    # x coordinate of top left corner of panel
+    fhs_xi_ah = origin_a + delta_x_a*idx_x + delta_x_a*0.25   # x coordinate of left corner of panel
+    fhs_xi_a2 = origin_a + delta_x_a*idx_x + delta_x_a        # x coordinate of bottom left corner of bound vortex
+    fhs_xi_ac = origin_a + delta_x_a*idx_x + delta_x_a*0.75   # x coordinate of bottom left corner of control point vortex
+    fhs_xi_b1 = origin_b + delta_x_b*idx_x                    # x coordinate of top right corner of panel
+    fhs_xi_bh = origin_b + delta_x_b*idx_x + delta_x_b*0.25   # x coordinate of right corner of bound vortex
+    fhs_xi_b2 = origin_b + delta_x_b*idx_x + delta_x_b        # x coordinate of bottom right corner of panel
+    fhs_xi_bc = origin_b + delta_x_b*idx_x + delta_x_b*0.75   # x coordinate of bottom right corner of control point vortex
+    fhs_xi_c  = (origin_a + origin_b)/2  + delta_x*idx_x + delta_x*0.75   # x coordinate three-quarter chord control point for each panel
+    fhs_xi_ch = (origin_a + origin_b)/2  + delta_x*idx_x + delta_x*0.25   # x coordinate center of bound vortex of each panel
+
+    ones      = np.ones(n_cw)
+    fhs_xa1   = fhs_xi_a1            + origin[0]
+    fhs_ya1   = ones*fhs_eta_a       + origin[1]
+    fhs_xa2   = fhs_xi_a2            + origin[0]
+    fhs_ya2   = ones*fhs_eta_a       + origin[1]
+    fhs_xb1   = fhs_xi_b1            + origin[0]
+    fhs_yb1   = ones*fhs_eta_b       + origin[1]
+    fhs_xb2   = fhs_xi_b2            + origin[0]
+    fhs_yb2   = ones*fhs_eta_b       + origin[1]
+    fhs_xah   = fhs_xi_ah            + origin[0]
+    fhs_yah   = ones*fhs_eta_a       + origin[1]
+    fhs_xbh   = fhs_xi_bh            + origin[0]
+    fhs_ybh   = ones*fhs_eta_b       + origin[1]
+    fhs_xch   = fhs_xi_ch            + origin[0]
+    fhs_ych   = ones*fhs_eta         + origin[1]
+    fhs_xc    = fhs_xi_c             + origin[0]
+    fhs_yc    = ones*fhs_eta         + origin[1]
+    fhs_xac   = fhs_xi_ac            + origin[0]
+    fhs_yac   = ones*fhs_eta_a       + origin[1]
+    fhs_xbc   = fhs_xi_bc            + origin[0]
+    fhs_ybc   = ones*fhs_eta_b       + origin[1]
+    fhs_z     = np.zeros(n_cw)       + origin[2]
+
+    # xyz positions of the corners of the panels, with the right side of the outermost panels last
+    fhs_x     = np.concatenate([np.concatenate([fhs_xi_a1,fhs_xi_a2[:,-1:]],axis=1),
+                                np.concatenate([fhs_xi_b1[-1:],fhs_xi_b2[-1:,-1:]],axis=1)]) + origin[0]
+    fhs_y     = np.concatenate([fhs_eta_a,fhs_eta_b[-1:]])*np.ones(n_cw+1) + origin[1]
+    fhs_cs    = (fhs.chord[:-1]+fhs.chord[1:])/2
+
+    fus_h_area = sum(((fhs.chord[:-1]+fhs.chord[1:])/2)*(fhs_eta_b[:,0] - fhs_eta_a[:,0]))
+
+    # increment fuslage lifting surface sections
+    VD.n_fus   += 2
+    VD.counter += 1
+
+    # store this fuselage's discretization information, the second half is the reflection of the first
+    n_panels = n_sw*n_cw
+    n_points = (n_sw+1)*(n_cw+1)
+    for half in range(2):
+        first_panel_ind, first_strip_ind, first_point_ind = first_surface_indices(VD)
+        panels = slice(first_panel_ind, first_panel_ind + n_panels)
+        strip  = slice(first_strip_ind, first_strip_ind + n_sw)
+        points = slice(first_point_ind, first_point_ind + n_points)
+        sign   = 1 - 2*half
+
+        VD.chordwise_breaks[strip]  = first_panel_ind + np.arange(0,n_panels)[0::n_cw]
+        VD.spanwise_breaks[VD.n_w]  = first_strip_ind
+        VD.n_sw[VD.n_w]             = n_sw
+        VD.n_cw[VD.n_w]             = n_cw
+        VD.surface_ID[panels]       = VD.counter
+        VD.surface_ID_full[points]  = VD.counter
+
+        VD.leading_edge_indices[panels]      = np.tile(idx_x == 0       , n_sw)
+        VD.trailing_edge_indices[panels]     = np.tile(idx_x == n_cw - 1, n_sw)
+        VD.panels_per_strip[panels]          = n_cw
+        VD.chordwise_panel_number[panels]    = np.tile(idx_x + 1        , n_sw)
+        VD.exposed_leading_edge_flag[strip]  = 1
+
+        # Store fus in vehicle vector
+        VD.XAH[panels] = fhs_xah.ravel()
+        VD.YAH[panels] = (sign*fhs_yah).ravel()
+        VD.ZAH[panels] = fhs_z[0]
+        VD.XBH[panels] = fhs_xbh.ravel()
+        VD.YBH[panels] = (sign*fhs_ybh).ravel()
+        VD.ZBH[panels] = fhs_z[0]
+        VD.XCH[panels] = fhs_xch.ravel()
+        VD.YCH[panels] = (sign*fhs_ych).ravel()
+        VD.ZCH[panels] = fhs_z[0]
+        VD.XA1[panels] = fhs_xa1.ravel()
+        VD.YA1[panels] = (sign*fhs_ya1).ravel()
+        VD.ZA1[panels] = fhs_z[0]
+        VD.XA2[panels] = fhs_xa2.ravel()
+        VD.YA2[panels] = (sign*fhs_ya2).ravel()
+        VD.ZA2[panels] = fhs_z[0]
+        VD.XB1[panels] = fhs_xb1.ravel()
+        VD.YB1[panels] = (sign*fhs_yb1).ravel()
+        VD.ZB1[panels] = fhs_z[0]
+        VD.XB2[panels] = fhs_xb2.ravel()
+        VD.YB2[panels] = (sign*fhs_yb2).ravel()
+        VD.ZB2[panels] = fhs_z[0]
+        VD.XAC[panels] = fhs_xac.ravel()
+        VD.YAC[panels] = (sign*fhs_yac).ravel()
+        VD.ZAC[panels] = fhs_z[0]
+        VD.XBC[panels] = fhs_xbc.ravel()
+        VD.YBC[panels] = (sign*fhs_ybc).ravel()
+        VD.ZBC[panels] = fhs_z[0]
+        VD.XC [panels] = fhs_xc.ravel()
+        VD.YC [panels] = (sign*fhs_yc).ravel()
+        VD.ZC [panels] = fhs_z[0]
+        VD.CS [strip]  = fhs_cs
+        VD.X  [points] = fhs_x.ravel()
+        VD.Y  [points] = (sign*fhs_y).ravel()
+        VD.Z  [points] = fhs_z[0]
+
+        VD.n_w  += 1
+        VD.n_cp += n_panels
+
+    VD.wing_areas = np.append(VD.wing_areas, [np.array(fus_h_area, dtype=precision), np.array(fus_h_area, dtype=precision)])
+
+    VL = VD.vortex_lift
+    VL.append(False)
+    VL.append(False)
 
-    fhs_cs = np.concatenate([fhs.chord,fhs.chord])
-    fvs_cs = np.concatenate([fvs.chord,fvs.chord])
-    
-    fus_h_area = 0
-    fus_v_area = 0    
-
-    # define coordinates of horseshoe vortices and control points       
-    for idx_y in range(n_sw):  
-        idx_x = np.arange(n_cw)
-
-        # fuselage horizontal section 
-        delta_x_a = fhs.chord[idx_y]/n_cw      
-        delta_x_b = fhs.chord[idx_y + 1]/n_cw    
-        delta_x   = (fhs.chord[idx_y]+fhs.chord[idx_y + 1])/(2*n_cw)
-
-        fhs_xi_a1 = fhs.origin[idx_y][0] + delta_x_a*idx_x                    # x coordinate of top left corner of panel
-        fhs_xi_ah = fhs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a*0.25   # x coordinate of left corner of panel
-        fhs_xi_a2 = fhs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a        # x coordinate of bottom left corner of bound vortex 
-        fhs_xi_ac = fhs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a*0.75   # x coordinate of bottom left corner of control point vortex  
-        fhs_xi_b1 = fhs.origin[idx_y+1][0] + delta_x_b*idx_x                  # x coordinate of top right corner of panel      
-        fhs_xi_bh = fhs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b*0.25 # x coordinate of right corner of bound vortex         
-        fhs_xi_b2 = fhs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b      # x coordinate of bottom right corner of panel
-        fhs_xi_bc = fhs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b*0.75 # x coordinate of bottom right corner of control point vortex         
-        fhs_xi_c  = (fhs.origin[idx_y][0] + fhs.origin[idx_y+1][0])/2  + delta_x*idx_x + delta_x*0.75   # x coordinate three-quarter chord control point for each panel
-        fhs_xi_ch = (fhs.origin[idx_y][0] + fhs.origin[idx_y+1][0])/2  + delta_x*idx_x + delta_x*0.25   # x coordinate center of bound vortex of each panel 
-
-
-        fhs_xa1[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_a1                       + fus.origin[0][0]  
-        fhs_ya1[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_a[idx_y]  + fus.origin[0][1]  
-        fhs_za1[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]
-        fhs_xa2[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_a2                       + fus.origin[0][0]  
-        fhs_ya2[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_a[idx_y]  + fus.origin[0][1] 
-        fhs_za2[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]      
-        fhs_xb1[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_b1                       + fus.origin[0][0]  
-        fhs_yb1[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_b[idx_y]  + fus.origin[0][1] 
-        fhs_zb1[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]
-        fhs_xb2[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_b2                       + fus.origin[0][0] 
-        fhs_yb2[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_b[idx_y]  + fus.origin[0][1] 
-        fhs_zb2[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]       
-        fhs_xah[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_ah                       + fus.origin[0][0]   
-        fhs_yah[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_a[idx_y]  + fus.origin[0][1]  
-        fhs_zah[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]             
-        fhs_xbh[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_bh                       + fus.origin[0][0] 
-        fhs_ybh[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_b[idx_y]  + fus.origin[0][1]  
-        fhs_zbh[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]    
-        fhs_xch[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_ch                       + fus.origin[0][0]  
-        fhs_ych[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta[idx_y]    + fus.origin[0][1]                
-        fhs_zch[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]     
-        fhs_xc [idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_c                        + fus.origin[0][0]  
-        fhs_yc [idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta[idx_y]    + fus.origin[0][1]  
-        fhs_zc [idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]       
-        fhs_xac[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_ac                       + fus.origin[0][0]  
-        fhs_yac[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_a[idx_y]  + fus.origin[0][1]
-        fhs_zac[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]
-        fhs_xbc[idx_y*n_cw:(idx_y+1)*n_cw] = fhs_xi_bc                       + fus.origin[0][0]  
-        fhs_ybc[idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fhs_eta_b[idx_y]  + fus.origin[0][1]                             
-        fhs_zbc[idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                  + fus.origin[0][2]              
-        fhs_x[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.concatenate([fhs_xi_a1,np.array([fhs_xi_a2[-1]])]) + fus.origin[0][0]  
-        fhs_y[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.ones(n_cw+1)*fhs_eta_a[idx_y]  + fus.origin[0][1]                             
-        fhs_z[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.zeros(n_cw+1)                  + fus.origin[0][2]
-
-        # fuselage vertical section                      
-        delta_x_a = fvs.chord[idx_y]/n_cw      
-        delta_x_b = fvs.chord[idx_y + 1]/n_cw    
-        delta_x   = (fvs.chord[idx_y]+fvs.chord[idx_y + 1])/(2*n_cw)   
-
-        fvs_xi_a1 = fvs.origin[idx_y][0] + delta_x_a*idx_x                    # z coordinate of top left corner of panel
-        fvs_xi_ah = fvs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a*0.25   # z coordinate of left corner of panel
-        fvs_xi_a2 = fvs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a        # z coordinate of bottom left corner of bound vortex 
-        fvs_xi_ac = fvs.origin[idx_y][0] + delta_x_a*idx_x + delta_x_a*0.75   # z coordinate of bottom left corner of control point vortex  
-        fvs_xi_b1 = fvs.origin[idx_y+1][0] + delta_x_b*idx_x                    # z coordinate of top right corner of panel      
-        fvs_xi_bh = fvs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b*0.25   # z coordinate of right corner of bound vortex         
-        fvs_xi_b2 = fvs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b        # z coordinate of bottom right corner of panel
-        fvs_xi_bc = fvs.origin[idx_y+1][0] + delta_x_b*idx_x + delta_x_b*0.75   # z coordinate of bottom right corner of control point vortex         
-        fvs_xi_c  = (fvs.origin[idx_y][0] + fvs.origin[idx_y+1][0])/2 + delta_x *idx_x + delta_x*0.75     # z coordinate three-quarter chord control point for each panel
-        fvs_xi_ch = (fvs.origin[idx_y][0] + fvs.origin[idx_y+1][0])/2 + delta_x *idx_x + delta_x*0.25     # z coordinate center of bound vortex of each panel 
-
-        fvs_xc [idx_y*n_cw:(idx_y+1)*n_cw] = fvs_xi_c                       + fus.origin[0][0]  
-        fvs_zc [idx_y*n_cw:(idx_y+1)*n_cw] = np.ones(n_cw)*fvs_eta[idx_y]   + fus.origin[0][2]  
-        fvs_yc [idx_y*n_cw:(idx_y+1)*n_cw] = np.zeros(n_cw)                 + fus.origin[0][1]  
-        fvs_x[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.concatenate([fvs_xi_a1,np.array([fvs_xi_a2[-1]])]) + fus.origin[0][0]  
-        fvs_z[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.ones(n_cw+1)*fvs_eta_a[idx_y] + fus.origin[0][2]               
-        fvs_y[idx_y*(n_cw+1):(idx_y+1)*(n_cw+1)] = np.zeros(n_cw+1)                 + fus.origin[0][1]
-        
-        fus_h_area += ((fhs.chord[idx_y]+fhs.chord[idx_y + 1])/2)*(fhs_eta_b[idx_y] - fhs_eta_a[idx_y])
-        fus_v_area += ((fvs.chord[idx_y]+fvs.chord[idx_y + 1])/2)*(fvs_eta_b[idx_y] - fvs_eta_a[idx_y])
-        
-        # store this strip's discretization information
-        LE_inds        = np.full(n_cw, False)
-        TE_inds        = np.full(n_cw, False)
-        LE_inds[0]     = True
-        TE_inds[-1]    = True
-        
-        RNMAX          = np.ones(n_cw, np.int16)*n_cw
-        panel_numbers  = np.linspace(1,n_cw,n_cw, dtype=np.int16)
-        
-        leading_edge_indices    = np.append(leading_edge_indices   , LE_inds       ) 
-        trailing_edge_indices   = np.append(trailing_edge_indices  , TE_inds       )            
-        panels_per_strip        = np.append(panels_per_strip       , RNMAX         )
-        chordwise_panel_number  = np.append(chordwise_panel_number , panel_numbers )       
-
-    # xyz positions for the right side of this fuselage's outermost panels
-    fhs_x[-(n_cw+1):] = np.concatenate([fhs_xi_b1,np.array([fhs_xi_b2[-1]])])+ fus.origin[0][0]  
-    fhs_y[-(n_cw+1):] = np.ones(n_cw+1)*fhs_eta_b[idx_y]  + fus.origin[0][1]                             
-    fhs_z[-(n_cw+1):] = np.zeros(n_cw+1)                  + fus.origin[0][2]        
-    fvs_x[-(n_cw+1):] = np.concatenate([fvs_xi_a1,np.array([fvs_xi_a2[-1]])]) + fus.origin[0][0]  
-    fvs_z[-(n_cw+1):] = np.ones(n_cw+1)*fvs_eta_a[idx_y] + fus.origin[0][2]               
-    fvs_y[-(n_cw+1):] = np.zeros(n_cw+1)                 + fus.origin[0][1]   
-    fhs_cs =  (fhs.chord[:-1]+fhs.chord[1:])/2
-    fvs_cs =  (fvs.chord[:-1]+fvs.chord[1:])/2     
-
-    # Horizontal Fuselage Sections 
-    wing_areas = []
-    wing_areas.append(np.array(fus_h_area, dtype=precision))
-    wing_areas.append(np.array(fus_h_area, dtype=precision))
-    
-    # store points of horizontal section of fuselage 
-    fhs_cs  = np.concatenate([fhs_cs, fhs_cs])
-    fhs_xah = np.concatenate([fhs_xah, fhs_xah])
-    fhs_yah = np.concatenate([fhs_yah,-fhs_yah])
-    fhs_zah = np.concatenate([fhs_zah, fhs_zah])
-    fhs_xbh = np.concatenate([fhs_xbh, fhs_xbh])
-    fhs_ybh = np.concatenate([fhs_ybh,-fhs_ybh])
-    fhs_zbh = np.concatenate([fhs_zbh, fhs_zbh])
-    fhs_xch = np.concatenate([fhs_xch, fhs_xch])
-    fhs_ych = np.concatenate([fhs_ych,-fhs_ych])
-    fhs_zch = np.concatenate([fhs_zch, fhs_zch])
-    fhs_xa1 = np.concatenate([fhs_xa1, fhs_xa1])
-    fhs_ya1 = np.concatenate([fhs_ya1,-fhs_ya1])
-    fhs_za1 = np.concatenate([fhs_za1, fhs_za1])
-    fhs_xa2 = np.concatenate([fhs_xa2, fhs_xa2])
-    fhs_ya2 = np.concatenate([fhs_ya2,-fhs_ya2])
-    fhs_za2 = np.concatenate([fhs_za2, fhs_za2])
-    fhs_xb1 = np.concatenate([fhs_xb1, fhs_xb1])
-    fhs_yb1 = np.concatenate([fhs_yb1,-fhs_yb1])    
-    fhs_zb1 = np.concatenate([fhs_zb1, fhs_zb1])
-    fhs_xb2 = np.concatenate([fhs_xb2, fhs_xb2])
-    fhs_yb2 = np.concatenate([fhs_yb2,-fhs_yb2])            
-    fhs_zb2 = np.concatenate([fhs_zb2, fhs_zb2])
-    fhs_xac = np.concatenate([fhs_xac, fhs_xac])
-    fhs_yac = np.concatenate([fhs_yac,-fhs_yac])
-    fhs_zac = np.concatenate([fhs_zac, fhs_zac])            
-    fhs_xbc = np.concatenate([fhs_xbc, fhs_xbc])
-    fhs_ybc = np.concatenate([fhs_ybc,-fhs_ybc])
-    fhs_zbc = np.concatenate([fhs_zbc, fhs_zbc])
-    fhs_xc  = np.concatenate([fhs_xc , fhs_xc ])
-    fhs_yc  = np.concatenate([fhs_yc ,-fhs_yc])
-    fhs_zc  = np.concatenate([fhs_zc , fhs_zc ])     
-    fhs_x   = np.concatenate([fhs_x  , fhs_x  ])
-    fhs_y   = np.concatenate([fhs_y  ,-fhs_y ])
-    fhs_z   = np.concatenate([fhs_z  , fhs_z  ])      
-    
-    if model_geometry == True:
-        
-        # increment fuslage lifting surface sections  
-        VD.n_fus   += 2    
-        VD.n_cp    += len(fhs_xch)
-        VD.n_w     += 2 
-        VD.counter += 1
-        
-        # store this fuselage's discretization information 
-        n_panels         = n_sw*n_cw
-        first_panel_ind  = VD.XAH.size
-        first_strip_ind  = [VD.chordwise_breaks.size, VD.chordwise_breaks.size+n_sw]
-        chordwise_breaks =  first_panel_ind + np.arange(0,2*n_panels)[0::n_cw]        
-        
-        VD.chordwise_breaks = np.append(VD.chordwise_breaks, np.int32(chordwise_breaks))
-        VD.spanwise_breaks  = np.append(VD.spanwise_breaks , np.int32(first_strip_ind ))            
-        VD.n_sw             = np.append(VD.n_sw            , np.int16([n_sw, n_sw])    )
-        VD.n_cw             = np.append(VD.n_cw            , np.int16([n_cw, n_cw])    )
-        VD.surface_ID       = np.append(VD.surface_ID      , np.ones(len(fhs_xch)) * VD.counter)
-        VD.surface_ID_full  = np.append(VD.surface_ID_full , np.ones(((n_sw+1)*(n_cw+1))*2) * VD.counter)
-        
-        VD.leading_edge_indices      = np.append(VD.leading_edge_indices     , np.tile(leading_edge_indices        , 2) )
-        VD.trailing_edge_indices     = np.append(VD.trailing_edge_indices    , np.tile(trailing_edge_indices       , 2) )           
-        VD.panels_per_strip          = np.append(VD.panels_per_strip         , np.tile(panels_per_strip            , 2) )
-        VD.chordwise_panel_number    = np.append(VD.chordwise_panel_number   , np.tile(chordwise_panel_number      , 2) ) 
-        VD.exposed_leading_edge_flag = np.append(VD.exposed_leading_edge_flag, np.tile(np.ones(n_sw,dtype=np.int16), 2) )
-        
-        # Store fus in vehicle vector  
-        VD.XAH    = np.append(VD.XAH  , np.array(fhs_xah  , dtype=precision))
-        VD.YAH    = np.append(VD.YAH  , np.array(fhs_yah  , dtype=precision))
-        VD.ZAH    = np.append(VD.ZAH  , np.array(fhs_zah  , dtype=precision))
-        VD.XBH    = np.append(VD.XBH  , np.array(fhs_xbh  , dtype=precision))
-        VD.YBH    = np.append(VD.YBH  , np.array(fhs_ybh  , dtype=precision))
-        VD.ZBH    = np.append(VD.ZBH  , np.array(fhs_zbh  , dtype=precision))
-        VD.XCH    = np.append(VD.XCH  , np.array(fhs_xch  , dtype=precision))
-        VD.YCH    = np.append(VD.YCH  , np.array(fhs_ych  , dtype=precision))
-        VD.ZCH    = np.append(VD.ZCH  , np.array(fhs_zch  , dtype=precision))
-        VD.XA1    = np.append(VD.XA1  , np.array(fhs_xa1  , dtype=precision))
-        VD.YA1    = np.append(VD.YA1  , np.array(fhs_ya1  , dtype=precision))
-        VD.ZA1    = np.append(VD.ZA1  , np.array(fhs_za1  , dtype=precision))
-        VD.XA2    = np.append(VD.XA2  , np.array(fhs_xa2  , dtype=precision))
-        VD.YA2    = np.append(VD.YA2  , np.array(fhs_ya2  , dtype=precision))
-        VD.ZA2    = np.append(VD.ZA2  , np.array(fhs_za2  , dtype=precision))
-        VD.XB1    = np.append(VD.XB1  , np.array(fhs_xb1  , dtype=precision))
-        VD.YB1    = np.append(VD.YB1  , np.array(fhs_yb1  , dtype=precision))
-        VD.ZB1    = np.append(VD.ZB1  , np.array(fhs_zb1  , dtype=precision))
-        VD.XB2    = np.append(VD.XB2  , np.array(fhs_xb2  , dtype=precision))
-        VD.YB2    = np.append(VD.YB2  , np.array(fhs_yb2  , dtype=precision))
-        VD.ZB2    = np.append(VD.ZB2  , np.array(fhs_zb2  , dtype=precision))
-        VD.XAC    = np.append(VD.XAC  , np.array(fhs_xac  , dtype=precision))
-        VD.YAC    = np.append(VD.YAC  , np.array(fhs_yac  , dtype=precision))
-        VD.ZAC    = np.append(VD.ZAC  , np.array(fhs_zac  , dtype=precision))
-        VD.XBC    = np.append(VD.XBC  , np.array(fhs_xbc  , dtype=precision))
-        VD.YBC    = np.append(VD.YBC  , np.array(fhs_ybc  , dtype=precision))
-        VD.ZBC    = np.append(VD.ZBC  , np.array(fhs_zbc  , dtype=precision))
-        VD.XC     = np.append(VD.XC   , np.array(fhs_xc   , dtype=precision))
-        VD.YC     = np.append(VD.YC   , np.array(fhs_yc   , dtype=precision))
-        VD.ZC     = np.append(VD.ZC   , np.array(fhs_zc   , dtype=precision))
-        VD.CS     = np.append(VD.CS   , np.array(fhs_cs   , dtype=precision))
-        VD.X      = np.append(VD.X    , np.array(fhs_x    , dtype=precision))
-        VD.Y      = np.append(VD.Y    , np.array(fhs_y    , dtype=precision))
-        VD.Z      = np.append(VD.Z    , np.array(fhs_z    , dtype=precision))
-        
-        VD.wing_areas = np.append(VD.wing_areas, wing_areas)
-        
-        VL = VD.vortex_lift
-        VL.append(False)
-        VL.append(False)
-    
-    
     return VD
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+def first_surface_indices(VD):
+    """ Indices of the first panel, strip and panel corner of the next surface in the
+    preallocated arrays of the vortex distribution
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    VD.n_w, VD.n_cp, VD.n_sw, VD.n_cw  - surfaces and panels already stored
+
+    Outputs:
+    first_panel_ind, first_strip_ind, first_point_ind
+
+    Properties Used:
+    N/A
+    """
+    n_sw = VD.n_sw[:VD.n_w].astype(np.int64)
+    n_cw = VD.n_cw[:VD.n_w].astype(np.int64)
+
+    first_panel_ind = VD.n_cp
+    first_strip_ind = int(np.sum(n_sw))
+    first_point_ind = int(np.sum((n_sw+1)*(n_cw+1)))
+
+    return first_panel_ind, first_strip_ind, first_point_ind
+
+def interpolate_camber(x, xp, fp):
+    """ Linear interpolation of the camber line of each strip, row by row. Matches np.interp,
+    holding the end values of a camber line outside of it
+
+    Assumptions:
+    None. Camber lines whose x-coordinates are not increasing are interpolated one strip at a
+    time with np.interp, which then does not interpolate between neighbouring points
+
+    Source:
+    None
+
+    Inputs:
+    x      - x-coordinates to interpolate at             [n_strips, n_x]
+    xp     - x-coordinates of the camber lines           [n_strips, n_camber]
+    fp     - z-coordinates of the camber lines           [n_strips, n_camber]
+
+    Outputs:
+    z      - z-coordinates of the camber lines at x      [n_strips, n_x]
+
+    Properties Used:
+    N/A
+    """
+    if np.any(np.diff(xp, axis=1) <= 0):
+        return np.array([np.interp(x_row, xp_row, fp_row) for x_row, xp_row, fp_row in zip(x, xp, fp)]).reshape(x.shape)
+
+    n_camber = xp.shape[1]
+    rows     = np.arange(xp.shape[0])[:,None]
+
+    # index of the last camber point at or before x
+    j  = np.sum(xp[:,None,:] <= x[:,:,None], axis=2) - 1
+    jc = np.clip(j, 0, n_camber - 2)
+    x0 = xp[rows,jc]
+    x1 = xp[rows,jc+1]
+    f0 = fp[rows,jc]
+    f1 = fp[rows,jc+1]
+
+    slope = (f1 - f0)/(x1 - x0)
+    z     = slope*(x - x0) + f0
+    z     = np.where(x == x0     , f0         , z)
+    z     = np.where(j <  0      , fp[:,:1]   , z)
+    z     = np.where(j >= n_camber - 1, fp[:,-1:] , z)
+
+    return z
@@ -13,12 +13,21 @@ from   RCAIDE.Framework.Core import Data
 import numpy                 as np
 import os
 
-try:
-    import cantera as ct
-    CANTERA_AVAILABLE = True
-except ImportError:
-    ct = None
-    CANTERA_AVAILABLE = False
+# cantera is slow to import, it is loaded on the first combustor evaluation
+ct                = None
+CANTERA_AVAILABLE = None
+
+def import_cantera():
+    """Imports cantera on first use and returns True if it is available."""
+    global ct, CANTERA_AVAILABLE
+    if CANTERA_AVAILABLE is None:
+        try:
+            import cantera
+            ct                = cantera
+            CANTERA_AVAILABLE = True
+        except ImportError:
+            CANTERA_AVAILABLE = False
+    return CANTERA_AVAILABLE
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  evaluate_cantera
@@ -258,7 +267,7 @@ def evaluate_cantera(combustor,T,P,mdot_air,FAR):
 # ----------------------------------------------------------------------
 
 def compute_combustor_performance(results, combustor, Temp_air, Pres_air, mdot_air_tot, FAR, gas):
-    if CANTERA_AVAILABLE:
+    if import_cantera():
         mdot_fuel_TakeOff = combustor.fuel_to_air_ratio_take_off * combustor.air_mass_flow_rate_take_off # [kg/s] Fuel mass flow rate at Take Off
         mdot_fuel_tot     = mdot_air_tot * FAR                             # [kg/s] Fuel mass flow rate 
         mdot_air          = mdot_air_tot / combustor.number_of_combustors  # [kg/s] Air mass flow rate per combustor
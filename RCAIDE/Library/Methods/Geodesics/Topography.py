@@ -0,0 +1,236 @@
+# RCAIDE/Library/Methods/Geodesics/Topography.py
+#
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial     import Delaunay, cKDTree
+import numpy as np
+import os
+
+# module level store of loaded topographies, keyed on file path, modification time and storage format
+_topography_store = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Topography
+# ----------------------------------------------------------------------------------------------------------------------
+class Topography:
+    """Indexed store of a digital elevation map. The topography file is parsed once and the Delaunay triangulation
+    and KD-tree used for elevation queries are built on first use and then reused by every subsequent lookup.
+
+    Assumptions:
+        topography_file is a text file obtained from https://topex.ucsd.edu/cgi-bin/get_data.cgi with columns
+        of longitude, latitude and elevation
+
+    Source:
+        N/A
+    """
+
+    def __init__(self, topography_file, use_binary_grid = False, binary_directory = None):
+        """Loads the elevation points of a topography file.
+
+        Assumptions:
+            If use_binary_grid is True, the text file is converted once into a NumPy binary file which is memory-mapped
+            on every subsequent load. The binary file is regenerated when the text file is newer.
+
+        Source:
+            N/A
+
+        Inputs:
+            topography_file   - file of longitude, latitude and elevation points                    [-]
+            use_binary_grid   - flag to store/load the points as a memory-mapped binary grid          [boolean]
+            binary_directory  - directory of the binary grid (defaults to that of topography_file)    [-]
+
+        Outputs:
+            None
+
+        Properties Used:
+            N/A
+        """
+        self.topography_file = topography_file
+
+        if use_binary_grid:
+            data = _load_binary_grid(topography_file, binary_directory)
+        else:
+            data = np.loadtxt(topography_file)
+
+        self.longitude     = data[:,0]
+        self.latitude      = data[:,1]
+        self.elevation     = data[:,2]
+        self._triangulation = None
+        self._kd_tree       = None
+        self._interpolant   = None
+        return
+
+    @property
+    def triangulation(self):
+        """Delaunay triangulation of the (latitude, longitude) points, built on first use."""
+        if self._triangulation is None:
+            self._triangulation = Delaunay(np.column_stack((self.latitude,self.longitude)))
+        return self._triangulation
+
+    @property
+    def kd_tree(self):
+        """KD-tree of the (latitude, longitude) points, built on first use."""
+        if self._kd_tree is None:
+            self._kd_tree = cKDTree(np.column_stack((self.latitude,self.longitude)))
+        return self._kd_tree
+
+    def bounds(self):
+        """Returns the latitude and longitude extents of the map as (min_lat, max_lat, min_long, max_long) [degrees]."""
+        return np.min(self.latitude), np.max(self.latitude), np.min(self.longitude), np.max(self.longitude)
+
+    def compute_elevation(self, latitude, longitude, method = 'linear'):
+        """Computes the elevation at arbitrary latitude-longitude locations.
+
+        Assumptions:
+            Linear interpolation is performed on the cached Delaunay triangulation and is identical to
+            scipy.interpolate.griddata(..., method='linear'). Points outside the convex hull return NaN.
+            Nearest neighbor lookups use the cached KD-tree.
+
+        Source:
+            N/A
+
+        Inputs:
+            latitude   - latitude of query points, any shape       [degrees]
+            longitude  - longitude of query points, same shape     [degrees]
+            method     - 'linear' or 'nearest'                     [-]
+
+        Outputs:
+            elevation  - elevation at query points                 [m]
+
+        Properties Used:
+            N/A
+        """
+        latitude  = np.asarray(latitude,dtype=float)
+        longitude = np.asarray(longitude,dtype=float)
+        shape     = np.broadcast(latitude,longitude).shape
+        points    = np.column_stack((np.broadcast_to(latitude,shape).ravel(),np.broadcast_to(longitude,shape).ravel()))
+
+        if method == 'linear':
+            if self._interpolant is None:
+                self._interpolant = LinearNDInterpolator(self.triangulation, self.elevation)
+            elevation = self._interpolant(points)
+        elif method == 'nearest':
+            elevation = self.elevation[self.find_nearest_points(points[:,0],points[:,1])]
+        else:
+            raise ValueError("Unknown topography interpolation method '" + str(method) + "'")
+
+        return elevation.reshape(shape)
+
+    def find_nearest_points(self, latitude, longitude):
+        """Returns the indices of the map points closest to the query locations.
+
+        Assumptions:
+            Distances are measured in latitude-longitude space.
+
+        Source:
+            N/A
+
+        Inputs:
+            latitude   - latitude of query points     [degrees]
+            longitude  - longitude of query points    [degrees]
+
+        Outputs:
+            indices    - indices of the nearest map points  [-]
+
+        Properties Used:
+            N/A
+        """
+        latitude  = np.asarray(latitude,dtype=float)
+        longitude = np.asarray(longitude,dtype=float)
+        shape     = np.broadcast(latitude,longitude).shape
+        points    = np.column_stack((np.broadcast_to(latitude,shape).ravel(),np.broadcast_to(longitude,shape).ravel()))
+        _, indices = self.kd_tree.query(points)
+        return indices.reshape(shape)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_topography
+# ----------------------------------------------------------------------------------------------------------------------
+def load_topography(topography, use_binary_grid = False, binary_directory = None):
+    """Returns the shared Topography of a topography file, loading it only if it has not been loaded before or if the
+    file has changed on disk since it was loaded.
+
+    Assumptions:
+        Topography objects are passed through unchanged
+
+    Source:
+        N/A
+
+    Inputs:
+        topography        - topography file name or Topography object                               [-]
+        use_binary_grid   - flag to store/load the points as a memory-mapped binary grid             [boolean]
+        binary_directory  - directory of the binary grid (defaults to that of the topography file)   [-]
+
+    Outputs:
+        topography        - Topography object                                                       [-]
+
+    Properties Used:
+        N/A
+    """
+    if isinstance(topography,Topography):
+        return topography
+
+    file_path = os.path.abspath(topography)
+    mtime     = os.path.getmtime(file_path)
+    key       = (file_path, mtime, use_binary_grid, binary_directory)
+    if key not in _topography_store:
+        # drop entries of earlier versions of the same file
+        for old_key in [k for k in _topography_store if (k[0] == file_path) and (k[1] != mtime)]:
+            del _topography_store[old_key]
+        _topography_store[key] = Topography(file_path, use_binary_grid, binary_directory)
+
+    return _topography_store[key]
+
+def clear_topography_store():
+    """Removes all loaded topographies from the shared store.
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        None
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+    _topography_store.clear()
+    return
+
+def _load_binary_grid(topography_file, binary_directory):
+    """Converts a topography text file to a NumPy binary file, if it is missing or out of date, and memory-maps it.
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        topography_file   - file of longitude, latitude and elevation points  [-]
+        binary_directory  - directory of the binary grid                     [-]
+
+    Outputs:
+        data              - memory-mapped (n_points, 3) array                 [-]
+
+    Properties Used:
+        N/A
+    """
+    if binary_directory is None:
+        binary_directory = os.path.dirname(os.path.abspath(topography_file))
+    binary_file = os.path.join(binary_directory, os.path.splitext(os.path.basename(topography_file))[0] + '.npy')
+
+    if (not os.path.exists(binary_file)) or (os.path.getmtime(binary_file) < os.path.getmtime(topography_file)):
+        np.save(binary_file, np.loadtxt(topography_file))
+
+    return np.load(binary_file, mmap_mode = 'r')
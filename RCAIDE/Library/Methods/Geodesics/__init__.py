@@ -13,4 +13,5 @@ from .Geodesics import Geodesic
 from .Geodesics import Distance
 from .Geodesics import Math
 from .Geodesics import Geodesic_Calculate
-from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
\ No newline at end of file
+from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
+from .Topography                             import Topography, load_topography, clear_topography_store
@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 import RCAIDE
 from RCAIDE.Framework.Core import Units 
-from scipy.interpolate import griddata
+from RCAIDE.Library.Methods.Geodesics.Topography import load_topography
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -24,7 +24,8 @@ def compute_point_to_point_geospacial_data(settings):
         N/A  
 
     Inputs:   
-        topography_file                        - file of lattide, longitude and elevation points     
+        topography_file                        - file of lattide, longitude and elevation points or Topography object  
+        topography_binary_grid                 - flag to store the topography as a memory-mapped binary grid    [boolean]
         origin_coordinates                     - coordinates of origin location                                              [degrees]
         destination_coordinates                - coordinates of destimation location                                            [degrees]  
         
@@ -42,11 +43,10 @@ def compute_point_to_point_geospacial_data(settings):
     origin_coordinates   = np.asarray(settings.aircraft_origin_coordinates)
     destination_coordinates = np.asarray(settings.aircraft_destination_coordinates)
     
-    # extract data from file 
-    data  = np.loadtxt(settings.topography_file)
-    Long  = data[:,0]
-    Lat   = data[:,1]
-    Elev  = data[:,2] 
+    # extract data from shared topography store 
+    topography = load_topography(settings.topography_file, settings.topography_binary_grid)
+    Long  = topography.longitude
+    Lat   = topography.latitude
 
     x_min_coord = np.min(Lat)
     y_min_coord = np.min(Long)
@@ -74,8 +74,8 @@ def compute_point_to_point_geospacial_data(settings):
     origin_coordinates[lat_flag]  = origin_coordinates[lat_flag] + 360 
     long_flag            = np.where(destination_coordinates<0)[0]
     destination_coordinates[long_flag] = destination_coordinates[long_flag] + 360 
-    z0                   = griddata((Lat,Long), Elev, (np.array([origin_coordinates[0]]),np.array([origin_coordinates[1]])), method='nearest')[0]
-    z1                   = griddata((Lat,Long), Elev, (np.array([destination_coordinates[0]]),np.array([destination_coordinates[1]])), method='nearest')[0] 
+    z0, z1               = topography.compute_elevation(np.array([origin_coordinates[0],destination_coordinates[0]]),
+                                                        np.array([origin_coordinates[1],destination_coordinates[1]]), method='nearest')
     dep_loc              = np.array([x0,y0,z0])
     des_loc              = np.array([x1,y1,z1])
     
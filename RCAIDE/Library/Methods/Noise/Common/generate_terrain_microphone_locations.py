@@ -9,9 +9,9 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Units, Data
 from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distance
+from RCAIDE.Library.Methods.Geodesics.Topography   import load_topography
 
 # package imports 
-from scipy.interpolate import griddata
 import numpy as np 
  
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -27,7 +27,8 @@ def generate_terrain_microphone_locations(settings):
         N/A  
 
     Inputs:  
-        topography_file                        - file of lattide, longitude and elevation points                                [-]
+        topography_file                        - file of lattide, longitude and elevation points or Topography object           [-]
+        topography_binary_grid                 - flag to store the topography as a memory-mapped binary grid                    [boolean]
         origin_coordinates                  - coordinates of origin location                                              [degrees]
         destination_coordinates                - coordinates of destimation location                                            [degrees]
         microphone_x_resolution         - number of points on computational domain in latitudal direction                [-]
@@ -56,11 +57,10 @@ def generate_terrain_microphone_locations(settings):
     y_res = settings.microphone_y_resolution 
     x_res = settings.microphone_x_resolution 
     
-    # extract data from file 
-    data  = np.loadtxt(settings.topography_file) # settings.topography_file) CHANGED 10-15-2024
-    Long  = data[:,0]
-    Lat   = data[:,1]
-    Elev  = data[:,2] 
+    # extract data from shared topography store 
+    topography = load_topography(settings.topography_file, settings.topography_binary_grid)
+    Long  = topography.longitude
+    Lat   = topography.latitude
     
     x_min_coord = np.min(Lat)
     x_max_coord = np.max(Lat)
@@ -81,7 +81,7 @@ def generate_terrain_microphone_locations(settings):
     
     [y_pts,x_pts]      = np.meshgrid(np.linspace(0,y_dist_max,y_res),np.linspace(0,x_dist_max,x_res))
     [long_deg,lat_deg] = np.meshgrid(np.linspace(np.min(Long),np.max(Long),y_res),np.linspace(np.min(Lat),np.max(Lat),x_res)) 
-    z_deg              = griddata((Lat,Long), Elev, (lat_deg, long_deg), method='linear')        
+    z_deg              = topography.compute_elevation(lat_deg, long_deg, method='linear')        
     cartesian_pts      = np.dstack((np.dstack((x_pts[:,:,None],y_pts[:,:,None] )),z_deg[:,:,None])).reshape(x_res*y_res,3)
     lat_long_pts       = np.dstack((np.dstack((lat_deg[:,:,None],long_deg[:,:,None] )),z_deg[:,:,None])).reshape(x_res*y_res,3)  
     return cartesian_pts , lat_long_pts
@@ -143,8 +143,6 @@ def airframe_noise(microphone_locations,segment,config,settings):
     
     viscosity           = segment.conditions.freestream.kinematic_viscosity[:,0] 
     M                   = segment.conditions.freestream.mach_number 
-    SPL_total_history   = np.zeros((n_cpts,n_mic,num_f)) 
-    SPLt_dBA_history    = np.zeros((n_cpts,n_mic,num_f))   
 
     # Distance vector from the aircraft position in relation to the microphone coordinates [meters]
     distance          = np.linalg.norm(microphone_locations,axis = 1)
@@ -169,41 +167,45 @@ def airframe_noise(microphone_locations,segment,config,settings):
     phi   = np.arctan(sideline_distance/altitude)
     
     
-    # START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(n_cpts):
-        for j in range(n_mic):  
-             
-            SPL_wing = clean_wing_noise(Sw,bw,0,1, velocity[i,0],viscosity[i],M[i],phi[j],theta[j],distance[j],frequency)      # Wing Noise
-            SPLht    = clean_wing_noise(Sht,bht,0,1, velocity[i,0],viscosity[i],M[i],phi[j],theta[j],distance[j],frequency)     # Horizontal Tail Noise
-            SPLvt    = clean_wing_noise(Svt,bvt,0,0,velocity[i,0],viscosity[i],M[i],phi[j],theta[j],distance[j],frequency)     # Vertical Tail Noise
-      
-            # Flap noise 
-            if deltaf==0:
-                SPL_flap = np.zeros(num_f)
-            else:
-                SPL_flap = trailing_edge_flap_noise(Sf,cf,deltaf,slots,velocity[i,0],M[i],phi[j],theta[j],distance[j],frequency)  
+    # The control points, microphones and frequencies are broadcast along the first, second and third axes
+    velocity  = velocity[:,:,None]
+    viscosity = viscosity[:,None,None]
+    M         = M[:,:,None]
+    phi       = phi[None,:,None]
+    theta     = theta[None,:,None]
+    distance  = distance[None,:,None]
+    frequency = frequency[None,None,:]
+    no_noise  = np.zeros((n_cpts,n_mic,num_f))
     
-            # Main landing gear noise     
-            if main_gear_extended == False:  
-                SPL_main_landing_gear = np.zeros(num_f)
-            else:
-                SPL_main_landing_gear = landing_gear_noise(Dp,Hp,main_wheels,M[i],velocity[i,0],phi[j],theta[j],distance[j],frequency)   
-                if main_units>1: # Incoherent summation of each main landing gear unit
-                    SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)      
-                
-            # Nose landing gear noise
-            if nose_gear_extended == False:                  
-                SPL_nose_landing_gear = np.zeros(num_f)
-            else:
-                SPL_nose_landing_gear = landing_gear_noise(Dn,Hn,nose_wheels,M[i],velocity[i,0],phi[j],theta[j],distance[j],frequency)   
-               
-            # Total Airframe Noise
-            SPL_total = 10.*np.log10( 10.0**(0.1*SPL_wing)+ 10.0**(0.1*SPLht) + 10.0**(0.1*SPLvt) + 10.0**(0.1*SPL_flap) + 10.0**(0.1*SPL_main_landing_gear)+ 10.0**(0.1*SPL_nose_landing_gear))      
-                
-            SPL_total_history[i,j,:]             = SPL_total  
-            
-            # Calculation of dBA based on the sound pressure time history 
-            SPLt_dBA_history[i,j,:] = A_weighting_metric(SPL_total,frequency) 
+    SPL_wing = clean_wing_noise(Sw,bw,0,1, velocity,viscosity,M,phi,theta,distance,frequency)      # Wing Noise
+    SPLht    = clean_wing_noise(Sht,bht,0,1, velocity,viscosity,M,phi,theta,distance,frequency)     # Horizontal Tail Noise
+    SPLvt    = clean_wing_noise(Svt,bvt,0,0,velocity,viscosity,M,phi,theta,distance,frequency)     # Vertical Tail Noise
+
+    # Flap noise 
+    if deltaf==0:
+        SPL_flap = no_noise
+    else:
+        SPL_flap = trailing_edge_flap_noise(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,frequency)  
+
+    # Main landing gear noise     
+    if main_gear_extended == False:  
+        SPL_main_landing_gear = no_noise
+    else:
+        SPL_main_landing_gear = landing_gear_noise(Dp,Hp,main_wheels,M,velocity,phi,theta,distance,frequency)   
+        if main_units>1: # Incoherent summation of each main landing gear unit
+            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)      
+        
+    # Nose landing gear noise
+    if nose_gear_extended == False:                  
+        SPL_nose_landing_gear = no_noise
+    else:
+        SPL_nose_landing_gear = landing_gear_noise(Dn,Hn,nose_wheels,M,velocity,phi,theta,distance,frequency)   
+       
+    # Total Airframe Noise
+    SPL_total_history = 10.*np.log10( 10.0**(0.1*SPL_wing)+ 10.0**(0.1*SPLht) + 10.0**(0.1*SPLvt) + 10.0**(0.1*SPL_flap) + 10.0**(0.1*SPL_main_landing_gear)+ 10.0**(0.1*SPL_nose_landing_gear))      
+    
+    # Calculation of dBA based on the sound pressure time history 
+    SPLt_dBA_history  = A_weighting_metric(SPL_total_history,frequency) 
     
     # Pack Airframe Noise 
     airframe_noise                        = Data()  
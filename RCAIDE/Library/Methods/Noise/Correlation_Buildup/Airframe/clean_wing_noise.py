@@ -56,15 +56,14 @@ def clean_wing_noise(S,b,ND,IsHorz, velocity,viscosity,M,phi,theta,distance,freq
     elif IsHorz==0:
         DIR = np.sin(phi)
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
-
-        fmax      = 0.1*velocity / delta   # eqn 7   
-        OASPL     = 50*np.log10((velocity*Units.ft/Units.kts)/100.0) + 10*np.log10(delta*Units.ft*b*Units.ft/((distance*Units.ft)**2.0)) * (DIR ** 2) * (np.cos(theta/2)) ** 2 + 101.3 
-        SPL       = OASPL + 10.0*np.log10( 0.613* (frequency/fmax)**4 * ((frequency/fmax)**1.5 + 0.5)**(-4)) # eqn 5 
-        Delta_SPL = -0.03* (distance_ft/500 ) * np.abs(((frequency/fmax)-1))**1.5 # eqn 6
-        
-        SPL += Delta_SPL
+    fmax      = 0.1*velocity / delta   # eqn 7   
+    OASPL     = 50*np.log10((velocity*Units.ft/Units.kts)/100.0) + 10*np.log10(delta*Units.ft*b*Units.ft/((distance*Units.ft)**2.0)) * (DIR ** 2) * (np.cos(theta/2)) ** 2 + 101.3 
+    SPL       = OASPL + 10.0*np.log10( 0.613* (frequency/fmax)**4 * ((frequency/fmax)**1.5 + 0.5)**(-4)) # eqn 5 
+    Delta_SPL = -0.03* (distance_ft/500 ) * np.abs(((frequency/fmax)-1))**1.5 # eqn 6
+    
+    SPL += Delta_SPL
+    
+    # no noise is radiated along the plane of the surface
+    SPL = np.where(DIR==0,0.,SPL)
         
     return SPL
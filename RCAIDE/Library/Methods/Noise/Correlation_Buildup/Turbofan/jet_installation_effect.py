@@ -36,7 +36,7 @@ def jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed):
         N/A 
     """ 
     # Instalation effect
-    INST_s = np.array([0.5*((Ce-Xe)**2/(Ce*Diameter_mixed))*(np.exp(-Ye/Diameter_mixed)*((1.8*theta_s/np.pi))-0.6)**2])  
-    INST_s[INST_s>2.5]=2.5 
+    INST_s = 0.5*((Ce-Xe)**2/(Ce*Diameter_mixed))*(np.exp(-Ye/Diameter_mixed)*((1.8*theta_s/np.pi))-0.6)**2  
+    INST_s = np.where(INST_s>2.5,2.5,INST_s)
 
     return INST_s
\ No newline at end of file
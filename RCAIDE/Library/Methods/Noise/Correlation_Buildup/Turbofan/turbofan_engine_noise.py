@@ -22,7 +22,6 @@ from RCAIDE.Library.Methods.Noise.Metrics import A_weighting_metric
 
 # Python package imports   
 import numpy as np   
-from copy import deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------     
 #  turbofan engine noise 
@@ -78,7 +77,6 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
     Velocity_aircraft      = segment.conditions.freestream.velocity[:,0]
     Mach_aircraft          = segment.conditions.freestream.mach_number 
     AOA                    = segment.conditions.aerodynamics.angles.alpha / Units.deg 
-    noise_time             = segment.conditions.frames.inertial.time[:,0]  
     distance_microphone    = np.linalg.norm(microphone_locations,axis = 1)    
     Diameter_primary       = turbofan.core_nozzle.diameter
     Diameter_secondary     = turbofan.fan_nozzle.diameter
@@ -90,8 +88,6 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
     Ce                     = turbofan.geometry_Ce 
 
     frequency              = settings.center_frequencies[5:]        
-    n_cpts                 = len(noise_time)     
-    num_f                  = len(frequency) 
     n_mic                  = len(microphone_locations)
   
     # ==============================================
@@ -109,7 +105,7 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
     Area_primary   =  np.pi*(Diameter_primary/2)**2 
     Area_secondary =  np.pi*(Diameter_secondary/2)**2   
 
-    # Defining each array before the main loop 
+    # Polar angle of the microphones
     theta     =  np.zeros(n_mic)
     bool_1    = (microphone_locations[:,1] > 0) &  (microphone_locations[:,0] > 0)
     bool_2    = (microphone_locations[:,1] > 0) &  (microphone_locations[:,0] < 0)
@@ -121,148 +117,135 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
     theta[bool_3] =  np.arctan(abs(microphone_locations[:,1])/ abs(microphone_locations[:,0]))[bool_3]
     theta[bool_4] =  np.pi - np.arctan(abs(microphone_locations[:,1])/ microphone_locations[:,0])[bool_4] 
 
-    theta_P                = np.tile(theta[None,:],(n_cpts,1))  
-    theta_S                = deepcopy(theta_P)
-    theta_M                = deepcopy(theta_P)
-    EX_p                   = np.zeros((n_cpts,n_mic,num_f)) 
-    EX_s                   = np.zeros((n_cpts,n_mic,num_f)) 
-    EX_m                   = np.zeros((n_cpts,n_mic,num_f))  
-    SPL_p                  = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL_s                  = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL_m                  = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL                    = np.zeros((n_cpts,n_mic))
-    SPL_dBA                = np.zeros((n_cpts,n_mic))
-    SPL_1_3_spectrum       = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL_1_3_spectrum_dBA   = np.zeros((n_cpts,n_mic,num_f)) 
-
-    # Start loop for each position of aircraft 
-    for i in range(n_cpts):
-        for j in range(n_mic): 
-
-            EX_p    = np.zeros(num_f)
-            EX_s    = np.zeros(num_f)
-            EX_m    = np.zeros(num_f) 
-            theta_p = abs(theta_P[i,j])
-            theta_s = abs(theta_S[i,j])
-            theta_m = abs(theta_M[i,j])
-
-            # Primary and Secondary jets
-            Cpp = R_gas/(1-1/gamma_primary)
-            Cp  = R_gas/(1-1/gamma)
-
-            density_primary   = Pressure_primary[i]/(R_gas*Temperature_primary[i]-(0.5*R_gas*Velocity_primary[i]**2/Cpp)) 
-            density_secondary = Pressure_secondary[i]/(R_gas*Temperature_secondary[i]-(0.5*R_gas*Velocity_secondary[i]**2/Cp))
-
-            mass_flow_primary   = Area_primary*Velocity_primary[i]*density_primary
-             
-            mass_flow_secondary = Area_secondary*Velocity_secondary[i]*density_secondary
-
-            #Mach number of the external flow - based on the aircraft velocity
-            Mach_aircraft[i] = Velocity_aircraft[i]/sound_ambient[i]
-
-            #Calculation Procedure for the Mixed Jet Flow Parameters 
-            Velocity_mixed    = (mass_flow_primary*Velocity_primary[i]+mass_flow_secondary*Velocity_secondary[i])/  (mass_flow_primary+mass_flow_secondary)
-            Temperature_mixed = (mass_flow_primary*Temperature_primary[i]+mass_flow_secondary*Temperature_secondary[i])/   (mass_flow_primary+mass_flow_secondary)
-            density_mixed     = pressure_amb[i]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-            Area_mixed        = Area_primary*density_primary*Velocity_primary[i]*(1+(mass_flow_secondary/mass_flow_primary))/   (density_mixed*Velocity_mixed)
-            Diameter_mixed    = (4*Area_mixed/np.pi)**0.5
-
-
-            XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-            if XBPR<0:
-                XBPR=0
-            elif XBPR>4:
-                XBPR=4
-
-            #Auxiliary parameter defined as DVPS
-            DVPS = np.abs((Velocity_primary[i] - (Velocity_secondary[i]*Area_secondary+Velocity_aircraft[i]*Area_primary)/\
-                           (Area_secondary+Area_primary)))
-            if DVPS<0.3:
-                DVPS=0.3
-
-            # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-            Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-            Str_s = frequency*Diameter_secondary/(Velocity_secondary[i]-Velocity_aircraft[i]) #Secondary jet
-            Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft[i]) #Mixed jet
-
-            #Calculation of the Excitation adjustment parameter 
-            excitation_Strouhal = (N1[i]/60)*(Diameter_mixed/Velocity_mixed)
-
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-            SX[excitation_Strouhal > 0.25] = 0.0 
-            SX[excitation_Strouhal < 0.5]  = 0.0 
-
-            # Effectiveness
-            exps = np.exp(-SX)
-
-            #Spectral Shape Factor
-            exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-
-            #Fan Duct Lenght Factor
-            exd = np.exp(0.6-(EXA)**0.5)
-
-            #Excitation source location factor (zk)
-            zk = 1-0.4*(exd)*(exps)     
-
-            # Loop for the frequency array range 
-            exc = sound_ambient[i]/Velocity_mixed 
-            if theta_m>1.4:
-                exc  = (sound_ambient[i]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4))
-
-            #Acoustic excitation adjustment (EX)
-            EX_m = exd*exs*exc   # mixed component - dependant of the frequency
-
-            EX_p = +5*exd*exps   #primary component - no frequency dependance
-            EX_s = 2*sound_ambient[i]/(Velocity_secondary[i]*(zk)) #secondary component - no frequency dependance    
-
-            distance_primary   = distance_microphone[j] 
-            distance_secondary = distance_microphone[j] 
-            distance_mixed     = distance_microphone[j]
-
-            #Noise attenuation due to Ambient Pressure
-            dspl_ambient_pressure = 20*np.log10(pressure_amb[i]/pressure_isa)
-
-            #Noise attenuation due to Density Gradientes
-            dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[i]))
-            dspl_density_s = 20*np.log10((density_secondary+density_ambient[i])/(2*density_ambient[i]))
-            dspl_density_m = 20*np.log10((density_mixed+density_ambient[i])/(2*density_ambient[i]))
-
-            #Noise attenuation due to Spherical divergence
-            dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-            dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-            dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed) 
-
-            # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-            DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_spherical_p 
-            DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_spherical_s 
-            DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_spherical_m  
-
-            # Calculation of interference effects on jet noise
-            ATK_m   = angle_of_attack_effect(AOA[i],Mach_aircraft[i],theta_m)
-            INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-            Plug    = external_plug_effect(Velocity_primary[i],Velocity_secondary[i], Velocity_mixed, Diameter_primary,Diameter_secondary,
-                                           Diameter_mixed, Plug_diameter, sound_ambient[i], theta_p,theta_s,theta_m)
-
-            GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[i],theta_m,engine_height,Diameter_mixed,frequency)
-
-            # Calculation of the sound pressure level for each jet component
-            SPL_p = primary_noise_component(Velocity_primary[i],Temperature_primary[i],R_gas,theta_p,DVPS,sound_ambient[i], Velocity_secondary[i],Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
-            SPL_p[np.isnan(SPL_p)] = 1E-6
-            
-            SPL_s = secondary_noise_component(Velocity_primary[i],theta_s,sound_ambient[i],Velocity_secondary[i], Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
-            SPL_s[np.isnan(SPL_s)] = 1E-6
-            
-            SPL_m = mixed_noise_component(Velocity_primary[i],theta_m,sound_ambient[i],Velocity_secondary[i],  Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug.PG_m + ATK_m + GPROX_m
-            SPL_m[np.isnan(SPL_m)] = 1E-6
-            
-            # Sum of the Total Noise
-            SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-
-            # Store SPL history      
-            SPL_1_3_spectrum[i,j,:]       = SPL_total 
-            SPL[i,j]                      = SPL_arithmetic(np.atleast_2d(SPL_total),sum_axis=1 ) 
-            SPL_1_3_spectrum_dBA[i,j,:]   = A_weighting_metric(SPL_total,frequency)
-            SPL_dBA[i,j]                  = SPL_arithmetic(np.atleast_2d(A_weighting_metric(SPL_total,frequency)),sum_axis=1)  
+    # The control points, microphones and frequencies are broadcast along the first, second and third axes
+    theta_p   = np.abs(theta)[None,:,None]
+    theta_s   = theta_p
+    theta_m   = theta_p
+    frequency = frequency[None,None,:]
+    
+    Velocity_primary      = Velocity_primary[:,:,None]
+    Velocity_secondary    = Velocity_secondary[:,:,None]
+    N1                    = N1[:,:,None]
+    AOA                   = AOA[:,:,None]
+    Temperature_primary   = Temperature_primary[:,None,None]
+    Temperature_secondary = Temperature_secondary[:,None,None]
+    Pressure_primary      = Pressure_primary[:,None,None]
+    Pressure_secondary    = Pressure_secondary[:,None,None]
+    Velocity_aircraft     = Velocity_aircraft[:,None,None]
+    sound_ambient         = sound_ambient[:,None,None]
+    density_ambient       = density_ambient[:,None,None]
+    pressure_amb          = pressure_amb[:,None,None]
+    distance_microphone   = distance_microphone[None,:,None]
+
+    # Primary and Secondary jets
+    Cpp = R_gas/(1-1/gamma_primary)
+    Cp  = R_gas/(1-1/gamma)
+
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp)) 
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+     
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft[:,0] = Velocity_aircraft[:,0,0]/sound_ambient[:,0,0]
+    Mach_aircraft      = Mach_aircraft[:,:,None]
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters 
+    Velocity_mixed    = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/  (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed = (mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/   (mass_flow_primary+mass_flow_secondary)
+    density_mixed     = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed        = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/   (density_mixed*Velocity_mixed)
+    Diameter_mixed    = (4*Area_mixed/np.pi)**0.5
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5,0,4)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/\
+                   (Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS,0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_secondary/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter 
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+
+    SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
+    SX[excitation_Strouhal > 0.25] = 0.0 
+    SX[excitation_Strouhal < 0.5]  = 0.0 
+
+    # Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)     
+
+    # Excitation of the mixed jet, reduced at large emission angles 
+    exc = np.where(theta_m>1.4,(sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)),sound_ambient/Velocity_mixed)
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   # mixed component - dependant of the frequency
+
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance_microphone 
+    distance_secondary = distance_microphone 
+    distance_mixed     = distance_microphone
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed) 
+
+    # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_spherical_p 
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_spherical_s 
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_spherical_m  
+
+    # Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,
+                                   Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+    # Calculation of the sound pressure level for each jet component
+    SPL_p = primary_noise_component(Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient, Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
+    SPL_p[np.isnan(SPL_p)] = 1E-6
+    
+    SPL_s = secondary_noise_component(Velocity_primary,theta_s,sound_ambient,Velocity_secondary, Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
+    SPL_s[np.isnan(SPL_s)] = 1E-6
+    
+    SPL_m = mixed_noise_component(Velocity_primary,theta_m,sound_ambient,Velocity_secondary,  Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug.PG_m + ATK_m + GPROX_m
+    SPL_m[np.isnan(SPL_m)] = 1E-6
+    
+    # Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+    # Store SPL history      
+    SPL_1_3_spectrum_dBA = A_weighting_metric(SPL_total,frequency)
+    SPL                  = SPL_arithmetic(SPL_total,sum_axis=2) 
+    SPL_dBA              = SPL_arithmetic(SPL_1_3_spectrum_dBA,sum_axis=2)  
 
     engine_noise                   = Data()   
     engine_noise.SPL_1_3_spectrum  = SPL_1_3_spectrum_dBA
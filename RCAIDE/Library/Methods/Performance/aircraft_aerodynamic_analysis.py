@@ -8,8 +8,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 # RCAIDE imports 
-import RCAIDE
 from RCAIDE.Framework.Core import  Data 
+from RCAIDE.Library.Methods.Performance.aircraft_aerodynamic_polar_sweep import aircraft_aerodynamic_polar_sweep
  
 # Pacakge imports 
 import numpy as np  
@@ -36,7 +36,8 @@ def aircraft_aerodynamic_analysis(aerodynamics_analysis = None,
     Mach_number_range : ndarray
         Array of Mach numbers to evaluate
     control_surface_deflection_range : ndarray, optional
-        Array of control surface deflection angles [radians], default [[0]]
+        Single control surface deflection angle [radians], default [[0]]. Sweeps over several
+        deflections are computed by aircraft_aerodynamic_polar_sweep
     altitude : float, optional
         Altitude for atmospheric properties [m], default 0
     delta_ISA : float, optional
@@ -65,6 +66,8 @@ def aircraft_aerodynamic_analysis(aerodynamics_analysis = None,
     The function uses the US Standard Atmosphere 1976 model for atmospheric properties
     and evaluates aerodynamic coefficients using vortex lattice methods. Can use a surrogate model
     for faster evaluation or just direct evaluation of the aerodynamics. 
+
+    The flight conditions are evaluated in batches by aircraft_aerodynamic_polar_sweep.
  
     **Major Assumptions**
         * Flow is steady and inviscid
@@ -75,67 +78,27 @@ def aircraft_aerodynamic_analysis(aerodynamics_analysis = None,
     See Also
     --------
     RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method
+    RCAIDE.Library.Methods.Performance.aircraft_aerodynamic_polar_sweep
     RCAIDE.Library.Attributes.Atmospheres.Earth.US_Standard_1976
     """
 
-    #------------------------------------------------------------------------
-    # setup flight conditions
-    #------------------------------------------------------------------------   
-    atmosphere     = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
-    atmo_data      = atmosphere.compute_values(altitude,delta_ISA)
-    P              = atmo_data.pressure 
-    T              = atmo_data.temperature 
-    rho            = atmo_data.density 
-    a              = atmo_data.speed_of_sound 
-    mu             = atmo_data.dynamic_viscosity
-       
-    # -----------------------------------------------------------------
-    # Evaluate Without Surrogate
-    # ----------------------------------------------------------------- 
-    ctrl_pts = len(angle_of_attack_range[:, 0] )
-    state                                         = RCAIDE.Framework.Mission.Common.State()
-    state.conditions                              = RCAIDE.Framework.Mission.Common.Results() 
-    state.conditions.freestream.density           = rho * np.ones_like(angle_of_attack_range)
-    state.conditions.freestream.dynamic_viscosity = mu  * np.ones_like(angle_of_attack_range)
-    state.conditions.freestream.temperature       = T   * np.ones_like(angle_of_attack_range)
-    state.conditions.freestream.pressure          = P   * np.ones_like(angle_of_attack_range)
-    state.conditions.aerodynamics.angles.alpha    = angle_of_attack_range  
-    state.conditions.aerodynamics.angles.beta     = angle_of_attack_range *0  
-    state.conditions.freestream.u                 = angle_of_attack_range *0       
-    state.conditions.freestream.v                 = angle_of_attack_range *0       
-    state.conditions.freestream.w                 = angle_of_attack_range *0       
-    state.conditions.static_stability.roll_rate   = angle_of_attack_range *0       
-    state.conditions.static_stability.pitch_rate  = angle_of_attack_range *0 
-    state.conditions.static_stability.yaw_rate    = angle_of_attack_range *0  
-    state.conditions.expand_rows(ctrl_pts)
- 
-    CL_vals    = np.zeros((len(angle_of_attack_range),len(Mach_number_range)))  
-    CD_vals    = np.zeros((len(angle_of_attack_range),len(Mach_number_range))) 
- 
-    state.analyses                                  =  Data()
-    aerodynamics_analysis.initialize()            
-    state.analyses.aerodynamics = aerodynamics_analysis 
-    
-    for i in range (len(Mach_number_range)):  
-        state.conditions.freestream.mach_number                 = Mach_number_range[i, 0] * np.ones_like(angle_of_attack_range)
-        state.conditions.freestream.velocity                    = Mach_number_range[i, 0] * a   * np.ones_like(angle_of_attack_range)   
-        state.conditions.freestream.reynolds_number             = state.conditions.freestream.density * state.conditions.freestream.velocity / state.conditions.freestream.dynamic_viscosity 
-        state.conditions.frames.inertial.velocity_vector[:,0]   = Mach_number_range[i, 0] * a[0, 0]   *  angle_of_attack_range[:, 0] 
-        
-     
-        # ---------------------------------------------------------------------------------------
-        # Evaluate With Surrogate
-        # ---------------------------------------------------------------------------------------  
-        _                 = state.analyses.aerodynamics.evaluate(state)        
-        CL_vals[:,i]      = state.conditions.aerodynamics.coefficients.lift.total[:, 0]
-        CD_vals[:,i]      = state.conditions.aerodynamics.coefficients.drag.total[:, 0] 
+    if np.size(control_surface_deflection_range) > 1:
+        raise ValueError('aircraft_aerodynamic_analysis takes a single control surface deflection, use aircraft_aerodynamic_polar_sweep to sweep deflections')
+    if np.size(altitude) > 1:
+        raise ValueError('aircraft_aerodynamic_analysis takes a single altitude, use aircraft_aerodynamic_polar_sweep to sweep altitudes')
 
+    sweep   = aircraft_aerodynamic_polar_sweep(aerodynamics_analysis            = aerodynamics_analysis,
+                                               angle_of_attack_range            = angle_of_attack_range,
+                                               Mach_number_range                = Mach_number_range,
+                                               control_surface_deflection_range = control_surface_deflection_range,
+                                               altitude_range                   = altitude,
+                                               delta_ISA                        = delta_ISA)
   
     results = Data(
         Mach              = Mach_number_range, 
         alpha             = angle_of_attack_range, 
-        lift_coefficient  = CL_vals, 
-        drag_coefficient  = CD_vals, 
+        lift_coefficient  = sweep.lift_coefficient[:,:,0,0], 
+        drag_coefficient  = sweep.drag_coefficient[:,:,0,0], 
     )  
           
     return results  
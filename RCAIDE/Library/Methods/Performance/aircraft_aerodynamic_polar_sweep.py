@@ -0,0 +1,151 @@
+# RCAIDE/Methods/Performance/aircraft_aerodynamic_polar_sweep.py
+#
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import  Data
+
+# Pacakge imports
+import numpy as np
+
+#------------------------------------------------------------------------------
+# aircraft_aerodynamic_polar_sweep
+#------------------------------------------------------------------------------
+def aircraft_aerodynamic_polar_sweep(aerodynamics_analysis = None,
+                                     angle_of_attack_range = None,
+                                     Mach_number_range = None,
+                                     control_surface_deflection_range = np.array([[0]]),
+                                     altitude_range = np.array([[0]]),
+                                     delta_ISA = 0,
+                                     control_surface = 'elevator',
+                                     batch_size = 256,
+                                     initialize = True):
+    """
+    Computes aerodynamic coefficients over the full grid of angles of attack, Mach numbers, control surface
+    deflections and altitudes in flattened batches of flight conditions.
+
+    Parameters
+    --------
+    aerodynamics_analysis : Analysis
+        Aerodynamics analysis of the vehicle, e.g. RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method
+    angle_of_attack_range : ndarray
+        Column of angle of attack values to evaluate [radians]
+    Mach_number_range : ndarray
+        Column of Mach numbers to evaluate
+    control_surface_deflection_range : ndarray, optional
+        Column of control surface deflection angles [radians], default [[0]]
+    altitude_range : ndarray or float, optional
+        Column of altitudes for atmospheric properties [m], default [[0]]
+    delta_ISA : float, optional
+        Temperature offset from ISA conditions [K], default 0
+    control_surface : str, optional
+        Control surface conditions swept by the deflections: 'aileron', 'elevator', 'rudder', 'slat',
+        'flap' or 'spoiler', default 'elevator'
+    batch_size : int, optional
+        Maximum number of flight conditions per evaluation of the aerodynamics analysis, default 256.
+        None evaluates the whole grid at once, which needs memory in proportion to the size of the grid
+    initialize : bool, optional
+        Flag to initialize the aerodynamics analysis before the sweep, default True
+
+    Returns
+    --------
+    results : Data
+        Container of analysis results including:
+            * Mach : ndarray
+                Evaluated Mach numbers
+            * alpha : ndarray
+                Evaluated angles of attack [rad]
+            * control_surface_deflection : ndarray
+                Evaluated control surface deflections [rad]
+            * altitude : ndarray
+                Evaluated altitudes [m]
+            * lift_coefficient : ndarray
+                Lift coefficients, of shape (alpha, Mach, deflection, altitude)
+            * drag_coefficient : ndarray
+                Drag coefficients, of shape (alpha, Mach, deflection, altitude)
+
+    Notes
+    -----
+    Every combination of the four ranges is one row of the flight conditions, so the aerodynamics analysis
+    is evaluated once per batch rather than once per Mach number. The coefficients of each batch are written
+    into the preallocated result arrays. Control surface deflections are read from the flight conditions only
+    when the aerodynamics analysis trims the aircraft (settings.trim_aircraft), otherwise the deflections set
+    on the vehicle are used.
+
+    **Major Assumptions**
+        * Atmospheric properties follow US Standard Atmosphere 1976
+        * No sideslip and no body rates
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Performance.aircraft_aerodynamic_analysis
+    """
+    alpha      = np.atleast_2d(angle_of_attack_range).reshape(-1,1)
+    Mach       = np.atleast_2d(Mach_number_range).reshape(-1,1)
+    deflection = np.atleast_2d(control_surface_deflection_range).reshape(-1,1)
+    altitude   = np.atleast_2d(altitude_range).reshape(-1,1).astype(float)
+    shape      = (len(alpha),len(Mach),len(deflection),len(altitude))
+    n_points   = int(np.prod(shape))
+    if batch_size == None:
+        batch_size = n_points
+
+    #------------------------------------------------------------------------
+    # setup flight conditions
+    #------------------------------------------------------------------------
+    atmosphere     = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data      = atmosphere.compute_values(altitude,delta_ISA)
+
+    # flattened grid, the last range varies fastest
+    i_alpha, i_Mach, i_deflection, i_altitude = [index.ravel() for index in np.meshgrid(*[np.arange(n) for n in shape],indexing='ij')]
+
+    CL_vals    = np.zeros(n_points)
+    CD_vals    = np.zeros(n_points)
+
+    if initialize:
+        aerodynamics_analysis.initialize()
+
+    for start in range(0,n_points,batch_size):
+        rows  = slice(start,min(start + batch_size,n_points))
+        n     = rows.stop - rows.start
+        i_h   = i_altitude[rows]
+
+        state                                         = RCAIDE.Framework.Mission.Common.State()
+        state.conditions                              = RCAIDE.Framework.Mission.Common.Results.template(n)
+        state.analyses                                = Data()
+        state.analyses.aerodynamics                   = aerodynamics_analysis
+
+        conditions                                    = state.conditions
+        a                                             = atmo_data.speed_of_sound[i_h]
+        conditions.freestream.density                 = atmo_data.density[i_h]
+        conditions.freestream.dynamic_viscosity       = atmo_data.dynamic_viscosity[i_h]
+        conditions.freestream.temperature             = atmo_data.temperature[i_h]
+        conditions.freestream.pressure                = atmo_data.pressure[i_h]
+        conditions.freestream.speed_of_sound          = a
+        conditions.freestream.altitude                = altitude[i_h]
+        conditions.freestream.mach_number             = Mach[i_Mach[rows]]
+        conditions.freestream.velocity                = conditions.freestream.mach_number * a
+        conditions.freestream.reynolds_number         = conditions.freestream.density * conditions.freestream.velocity / conditions.freestream.dynamic_viscosity
+        conditions.frames.inertial.velocity_vector[:,0] = conditions.freestream.velocity[:,0]
+        conditions.aerodynamics.angles.alpha          = alpha[i_alpha[rows]]
+        conditions.control_surfaces[control_surface].deflection = deflection[i_deflection[rows]]
+
+        _              = aerodynamics_analysis.evaluate(state)
+        CL_vals[rows]  = conditions.aerodynamics.coefficients.lift.total[:, 0]
+        CD_vals[rows]  = conditions.aerodynamics.coefficients.drag.total[:, 0]
+
+    results = Data(
+        Mach                       = Mach_number_range,
+        alpha                      = angle_of_attack_range,
+        control_surface_deflection = control_surface_deflection_range,
+        altitude                   = altitude_range,
+        lift_coefficient           = CL_vals.reshape(shape),
+        drag_coefficient           = CD_vals.reshape(shape),
+    )
+
+    return results
@@ -10,14 +10,9 @@
 # RCAIDE imports
 import RCAIDE
 from RCAIDE.Framework.Core import Units , Data   
-import matplotlib.colors
-import matplotlib.colors as colors
-from RCAIDE.Library.Plots import *
  
 # Pacakge imports 
 import numpy as np
-from matplotlib import pyplot as plt
-import plotly.graph_objects as go
  
 # ----------------------------------------------------------------------
 #  Compute Aircraft Noise Certification Data  
@@ -86,6 +81,10 @@ def compute_noise_certification_data(approach_mission  = None,
     
     # plot diagram
     if show_figure:  
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Common import set_axes
+        from matplotlib import pyplot as plt
+        
         fig = plt.figure(save_filename)
         fig.set_size_inches(width,height) 
         
@@ -166,6 +165,7 @@ def compute_noise_certification_data(approach_mission  = None,
     return noise_data 
     
 def post_process_certification_noise_data(approach_results,takeoff_results): 
+    from RCAIDE.Library.Plots.Noise.post_process_noise_data import post_process_noise_data
    
     approach_noise_data   = post_process_noise_data(approach_results)
     takeoff_noise_data    = post_process_noise_data(takeoff_results) 
@@ -222,6 +222,7 @@ def post_process_certification_noise_data(approach_results,takeoff_results):
 # Truncate colormaps
 # ------------------------------------------------------------------  
 def truncate_colormap(cmap, minval=0.0, maxval=1.0, n=100):
+    import matplotlib.colors as colors
     new_cmap = colors.LinearSegmentedColormap.from_list(
         'trunc({n},{a:.2f},{b:.2f})'.format(n=cmap.name, a=minval, b=maxval),
         cmap(np.linspace(minval, maxval, n)))
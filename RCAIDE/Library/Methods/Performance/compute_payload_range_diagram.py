@@ -10,16 +10,17 @@
 # RCAIDE imports
 import RCAIDE
 from RCAIDE.Framework.Core import Units , Data  
-from RCAIDE.Library.Plots.Common import set_axes, plot_style    
  
 # Pacakge imports 
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from matplotlib import pyplot as plt
+import pickle
  
 # ----------------------------------------------------------------------
 #  Calculate vehicle Payload Range Diagram
 # ----------------------------------------------------------------------  
-def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise", fuel_reserve_percentage=0., plot_diagram = True, fuel_name=None):  
+def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise", fuel_reserve_percentage=0., plot_diagram = True, fuel_name=None,
+                                  number_of_payload_levels = 0, number_of_workers = 1):  
     """
     Calculate and plot the payload range diagram for an aircraft by modifying the cruise segment and weights.
     
@@ -39,6 +40,14 @@ def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise",
     fuel_name : str, optional
         Name of fuel for plot title
         Default: None
+    number_of_payload_levels : int, optional
+        Number of evenly spaced payloads added between the maximum payload and zero payload, for a
+        dense payload range curve
+        Default: 0
+    number_of_workers : int, optional
+        Number of processes evaluating the payload range points. The points are split in contiguous
+        shards, one per process
+        Default: 1
     
     Returns
     -------
@@ -56,6 +65,8 @@ def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise",
             Takeoff weight for each point [kg]
         - fuel_reserve_percentage : float
             Fraction of fuel reserved
+        - mission_solves : ndarray
+            Number of mission evaluations used for each point [-]
     
     Notes
     -----
@@ -86,6 +97,11 @@ def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise",
     For electric aircraft, the diagram is simpler with just two points connected by
     a straight line, as there is no fuel weight to trade for payload.
     
+    The points are evaluated in order of decreasing payload, each mission warm starting from
+    the previous one (see Sequential_Segments.warm_start). For a fuel aircraft, the cruise distance
+    that burns the fuel of a point is found with a secant iteration on the fuel balance, started
+    from the specific range of the cruise segment.
+    
     See Also
     --------
     RCAIDE.Library.Methods.Performance.conventional_payload_range_diagram
@@ -104,12 +120,14 @@ def compute_payload_range_diagram(mission = None, cruise_segment_tag = "cruise",
     
     for network in vehicle.networks:
         if type(network) == RCAIDE.Framework.Networks.Fuel:  
-            payload_range  =  conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_reserve_percentage,plot_diagram,fuel_name) 
+            payload_range  =  conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_reserve_percentage,plot_diagram,fuel_name,
+                                                                 number_of_payload_levels,number_of_workers) 
         else:
-            payload_range  =  electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagram)
+            payload_range  =  electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagram,number_of_payload_levels,number_of_workers)
     return payload_range 
              
-def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_reserve_percentage,plot_diagram, fuel_name): 
+def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_reserve_percentage,plot_diagram, fuel_name,
+                                       number_of_payload_levels = 0, number_of_workers = 1): 
     """Calculates and plots the payload range diagram for a fuel-bases aircraft by modifying the
     cruise segment range and weights of the aicraft .
 
@@ -124,6 +142,8 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_r
             mission             data structure for mission                   [-] 
             cruise_segment_tag  string of cruise segment                     [string]
             fuel_reserve_percentage            reserve fuel                                 [unitless] 
+            number_of_payload_levels  payloads added between the corners     [-]
+            number_of_workers   processes evaluating the points              [-]
             
         Outputs: 
             payload_range       data structure of payload range properties   [m/s]
@@ -165,67 +185,25 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_r
     PLD     = [ MaxPLD                             , MTOW - MaxFuel - OEW   , 0.   ]
     OEW_PLD = [  OEW + MaxPLD                      , MTOW - MaxFuel         , OEW  ]
     
-    # allocating Range array
-    R       = [0,0,0]
-
-    # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-        ##    for i in [2]: 
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff  = TOW[i]
-        mission.segments[0].analyses.weights.vehicle.mass_properties.payload  = PLD[i]
-        mission.segments[0].analyses.weights.vehicle.mass_properties.fuel     = FUEL[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10    # maximum iteration limit
-        tol     = 1.    # fuel convergency tolerance
-        err     = 9999. # error to be minimized
-        iter    = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = results.segments[-1].conditions.energy.cumulative_fuel_consumption[-1, 0]
-
-            # Difference between burned fuel and target fuel
-        
-            reserve_fuel = fuel_reserve_percentage * MaxFuel
-            missingFuel = FUEL[i] - TotalFuel - reserve_fuel
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserve_fuel
-
-            if iter == maxIter:
-                print(f"Did not converge.")
-                break
-
-        # Allocating resulting range in ouput array.
-        R[i] =  results.segments[-1].conditions.frames.inertial.position_vector[-1,0]   
+    # add the payload levels between the corners, on the MTOW and maximum fuel limits
+    for payload in np.linspace(MaxPLD,0.,number_of_payload_levels + 2)[1:-1]:
+        if np.any(np.isclose(payload,PLD)):
+            continue
+        tow = min(MTOW, OEW + payload + MaxFuel)
+        TOW.append(tow)
+        FUEL.append(tow - OEW - payload)
+        PLD.append(payload)
+        OEW_PLD.append(OEW + payload)
+    order   = np.argsort(-np.array(PLD),kind='stable')
+    TOW     = [TOW[i] for i in order]
+    FUEL    = [FUEL[i] for i in order]
+    PLD     = [PLD[i] for i in order]
+    OEW_PLD = [OEW_PLD[i] for i in order]
+
+    # range of each point of Payload Range Diagram
+    reserve_fuel = fuel_reserve_percentage * MaxFuel
+    points       = [(TOW[i],PLD[i],FUEL[i]) for i in range(len(TOW))]
+    R, solves    = evaluate_payload_range_points(mission,cruise_segment_tag,points,reserve_fuel,number_of_workers)
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -233,6 +211,7 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_r
     OEW_PLD.insert(0,OEW + MaxPLD   ) 
     FUEL.insert(0,0)
     TOW.insert(0,0)
+    solves.insert(0,0)
 
     # packing results
     payload_range                          = Data()
@@ -242,8 +221,13 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_r
     payload_range.fuel                     = np.array(FUEL)
     payload_range.takeoff_weight           = np.array(TOW)
     payload_range.fuel_reserve_percentage  = fuel_reserve_percentage
+    payload_range.mission_solves           = np.array(solves)
      
     if plot_diagram:  
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Common import set_axes, plot_style
+        from matplotlib import pyplot as plt
+        
         # get plotting style 
         ps      = plot_style()  
     
@@ -272,7 +256,7 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,fuel_r
 
     return payload_range 
  
-def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagram):
+def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagram,number_of_payload_levels = 0, number_of_workers = 1):
     """Calculates and plots the payload range diagram for an electric aircraft by modifying the
     cruise segment distance and payload weight of the aicraft .
 
@@ -286,7 +270,8 @@ def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagr
             vehicle             data structure for aircraft                  [-]
             mission             data structure for mission                   [-] 
             cruise_segment_tag  string of cruise segment                     [string]
-            fuel_reserve_percentage            reserve fuel                                 [unitless] 
+            number_of_payload_levels  payloads added between the corners     [-]
+            number_of_workers   processes evaluating the points              [-]
             
         Outputs: 
             payload_range       data structure of payload range properties   [m/s]
@@ -312,15 +297,14 @@ def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagr
     TOW =   [MTOW,      OEW]    # Takeoff Weights
     PLD =   [MaxPLD,    0.]     # Payload Weights
 
-    # Initialize Range Array
-    R = np.zeros(2)
+    # Add the payload levels between the corners
+    levels = np.linspace(MaxPLD,0.,number_of_payload_levels + 2)[1:-1]
+    PLD    = [MaxPLD] + list(levels) + [0.]
+    TOW    = [MTOW] + list(OEW + levels) + [OEW]
 
-    # Calculate Vehicle Range for Max Payload and Ferry Conditions
-    for i in range(2):
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-        R[i]    = segment.conditions.frames.inertial.position_vector[-1,0] 
+    # Calculate Vehicle Range for each Payload
+    points    = [(TOW[i],PLD[i],None) for i in range(len(TOW))]
+    R, solves = evaluate_payload_range_points(mission,cruise_segment_tag,points,0.,number_of_workers)
 
     # Insert Starting Point for Diagram Construction
     R   = np.insert(R, 0, 0)
@@ -332,8 +316,13 @@ def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagr
     payload_range.range             = np.array(R)
     payload_range.payload           = np.array(PLD)
     payload_range.takeoff_weight    = np.array(TOW)
+    payload_range.mission_solves    = np.insert(solves, 0, 0)
 
     if plot_diagram: 
+        # plotting imports are deferred so that matplotlib is only loaded when plotting
+        from RCAIDE.Library.Plots.Common import set_axes, plot_style
+        from matplotlib import pyplot as plt
+        
         # get plotting style 
         ps      = plot_style()  
     
@@ -352,4 +341,143 @@ def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagr
         set_axes(axis) 
         fig.tight_layout()
 
-    return payload_range
\ No newline at end of file
+    return payload_range
+# ----------------------------------------------------------------------
+#  Payload Range Points
+# ----------------------------------------------------------------------
+def evaluate_payload_range_points(mission,cruise_segment_tag,points,reserve_fuel,number_of_workers = 1):
+    """Computes the range of each point of a payload range diagram. The points are split in contiguous
+    shards, each shard is evaluated in order by one process.
+
+        Sources:
+        N/A
+
+        Assumptions:
+        With a single worker the mission is evaluated in this process and is left at the last point.
+        Otherwise each process evaluates a copy of the mission.
+
+        Inputs:
+            mission             data structure for mission                   [-]
+            cruise_segment_tag  string of cruise segment                     [string]
+            points              takeoff weight, payload and fuel of each     [kg]
+                                point, the fuel is None for an electric aircraft
+            reserve_fuel        reserve fuel                                 [kg]
+            number_of_workers   number of processes                          [-]
+
+        Outputs:
+            R                   range of each point                          [m]
+            solves              mission evaluations used for each point      [-]
+    """
+    number_of_workers = max(1,min(number_of_workers,len(points)))
+    shards            = np.array_split(np.arange(len(points)),number_of_workers)
+
+    if number_of_workers == 1:
+        outcomes = [evaluate_payload_range_shard(mission,cruise_segment_tag,points,reserve_fuel)]
+    else:
+        payload = pickle.dumps(mission,protocol=pickle.HIGHEST_PROTOCOL)
+        with ProcessPoolExecutor(max_workers=number_of_workers) as pool:
+            futures  = [pool.submit(_payload_range_worker,payload,cruise_segment_tag,[points[i] for i in shard],reserve_fuel) for shard in shards]
+            outcomes = [future.result() for future in futures]
+
+    R      = []
+    solves = []
+    for shard_R, shard_solves in outcomes:
+        R.extend(shard_R)
+        solves.extend(shard_solves)
+    return R, solves
+
+def evaluate_payload_range_shard(mission,cruise_segment_tag,points,reserve_fuel):
+    """Computes the range of consecutive points of a payload range diagram, warm starting each mission
+    from the previous one. The sweep uses its own warm start store, the warm start of the mission is left
+    as it was."""
+    warm_start                = mission.warm_start
+    mission.warm_start        = Data()
+    mission.warm_start.active = True
+    mission.warm_start.report = Data()
+    mission.clear_warm_start()
+    R      = []
+    solves = []
+    try:
+        for TOW, PLD, FUEL in points:
+            point_R, point_solves = solve_payload_range_point(mission,cruise_segment_tag,TOW,PLD,FUEL,reserve_fuel)
+            R.append(point_R)
+            solves.append(point_solves)
+    finally:
+        # the next evaluation of the mission does not start from the solves of the sweep
+        mission.warm_start = warm_start
+        for segment in mission.segments.values():
+            segment.state.numerics.solver.warm_start = None
+    return R, solves
+
+def solve_payload_range_point(mission,cruise_segment_tag,TOW,PLD,FUEL,reserve_fuel):
+    """Computes the range of one point of a payload range diagram.
+
+        Sources:
+        N/A
+
+        Assumptions:
+        For a fuel aircraft, the cruise distance is iterated until the mission burns the fuel of the point,
+        less the reserve. The first step uses the specific range of the cruise segment, the following
+        steps are secant steps on the fuel balance. For an electric aircraft the mission is evaluated once.
+
+        Inputs:
+            mission             data structure for mission                   [-]
+            cruise_segment_tag  string of cruise segment                     [string]
+            TOW                 takeoff weight                               [kg]
+            PLD                 payload                                      [kg]
+            FUEL                fuel, None for an electric aircraft          [kg]
+            reserve_fuel        reserve fuel                                 [kg]
+
+        Outputs:
+            R                   range                                        [m]
+            solves              number of mission evaluations                [-]
+    """
+    mass_properties         = mission.segments[0].analyses.weights.vehicle.mass_properties
+    mass_properties.takeoff = TOW
+    if FUEL is not None:
+        mass_properties.payload = PLD
+        mass_properties.fuel    = FUEL
+
+    # Evaluate mission with current TOW
+    results = mission.evaluate()
+    solves  = 1
+
+    if FUEL is not None:
+        maxIter = 10    # maximum iteration limit
+        tol     = 1E-2  # fuel convergency tolerance
+
+        # Current distance and fuel burn of the cruise segment, and the error in the fuel burned
+        segment    = results.segments[cruise_segment_tag]
+        CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]              # Distance [m]
+        CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]  # [kg]
+        err        = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserve_fuel
+
+        # fuel burned per distance, from the specific range of the cruise for the first step
+        dFuel_dDist = CruiseFuel / CruiseDist
+
+        while abs(err) > tol and solves <= maxIter:
+            mission.segments[cruise_segment_tag].distance = CruiseDist - err / dFuel_dDist
+
+            # running mission with new distance
+            results = mission.evaluate()
+            solves += 1
+            segment = results.segments[cruise_segment_tag]
+
+            # secant update of the fuel burned per distance
+            new_dist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]
+            new_err  = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserve_fuel
+            if new_dist != CruiseDist and (new_err - err) / (new_dist - CruiseDist) > 0:
+                dFuel_dDist = (new_err - err) / (new_dist - CruiseDist)
+            CruiseDist = new_dist
+            err        = new_err
+
+        if abs(err) > tol:
+            print(f"Did not converge.")
+
+    R = results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+    return R, solves
+
+def _payload_range_worker(payload,cruise_segment_tag,points,reserve_fuel):
+    """Evaluates a shard of payload range points on a serialized mission."""
+    mission = pickle.loads(payload)
+    return evaluate_payload_range_shard(mission,cruise_segment_tag,points,reserve_fuel)
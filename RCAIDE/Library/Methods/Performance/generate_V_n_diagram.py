@@ -15,7 +15,6 @@ from RCAIDE.Framework.Mission.Common  import Results
 
 # package imports
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Compute a V-n diagram
@@ -999,6 +998,8 @@ def post_processing(category_tag, Uref_rough, Uref_cruise, Uref_dive, V_n_data,
     #-----------------------------
     # Plotting the V-n diagram
     #-----------------------------
+    # plotting imports are deferred so that matplotlib is only loaded when plotting
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.fill(airspeeds_pos, load_factors_pos, c='b', alpha=0.3)
     ax.fill(airspeeds_neg, load_factors_neg, c='b', alpha=0.3)
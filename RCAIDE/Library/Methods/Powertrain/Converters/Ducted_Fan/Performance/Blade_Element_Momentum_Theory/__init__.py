@@ -11,9 +11,10 @@ Ducted Fan - Blade Element Momentum Theory Methods Package
 # ----------------------------------------------------------------------------------------------------------------------
 
 from .BEMT_performance                   import BEMT_performance
+from .performance_map_cache              import performance_map_key, load_performance_map, save_performance_map, complete_performance_map
 from .purge_files                        import purge_files
 from .read_results                       import read_results
-from .run_dfdc_analysis                  import run_dfdc_analysis
+from .run_dfdc_analysis                  import run_dfdc_analysis, run_dfdc_shards
 from .translate_conditions_to_dfdc_cases import translate_conditions_to_dfdc_cases  
 from .write_geometry                     import write_geometry
 from .write_input_deck                   import write_input_deck 
\ No newline at end of file
@@ -0,0 +1,170 @@
+# RCAIDE/Library/Methods/Powertrain/Converters/Ducted_Fan/Performance/Blade_Element_Momentum_Theory/performance_map_cache.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+import numpy as np
+import hashlib
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Performance Map Key
+# ----------------------------------------------------------------------------------------------------------------------
+def performance_map_key(dfdc_analysis):
+    """
+    Computes the key of the performance map of a ducted fan in the performance map cache.
+
+    Parameters
+    ----------
+    dfdc_analysis : DFDCAnalysis
+        Analysis object containing the following attributes:
+            - settings.filenames : Data
+                File path information
+                    - case : str
+                        Case file with the ducted fan geometry
+                    - results_template : str
+                        Template for results filename
+            - current_status.deck_file : str
+                Input deck with the design settings and the run cases
+
+    Returns
+    -------
+    key : str
+        SHA-1 digest of the case file, the input deck and the results template
+
+    Notes
+    -----
+    Must be called from the run folder once the case file and input deck are written.
+    The case file holds the duct, hub and blade geometry, and the input deck holds the
+    design point and every case of the Mach, tip Mach and altitude grid, so two ducted
+    fans share a key only if DFDC would be run with identical inputs.
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.load_performance_map
+    """
+    digest = hashlib.sha1()
+    for filename in [dfdc_analysis.settings.filenames.case, dfdc_analysis.current_status.deck_file]:
+        with open(filename,'rb') as input_file:
+            digest.update(input_file.read())
+    digest.update(dfdc_analysis.settings.filenames.results_template.encode('utf-8'))
+    return digest.hexdigest()
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Load Performance Map
+# ----------------------------------------------------------------------------------------------------------------------
+def load_performance_map(dfdc_analysis, key):
+    """
+    Loads the DFDC results of a ducted fan from the performance map cache.
+
+    Parameters
+    ----------
+    dfdc_analysis : DFDCAnalysis
+        Analysis object containing the following attributes:
+            - settings.filenames.cache_folder : str
+                Folder of the stored performance maps, no caching if None
+    key : str
+        Key of the performance map, see performance_map_key
+
+    Returns
+    -------
+    results : Data
+        Stored results, as returned by read_results, or None if the performance map is
+        not in the cache or cannot be read
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.save_performance_map
+    """
+    cache_folder = dfdc_analysis.settings.filenames.cache_folder
+    if cache_folder is None:
+        return None
+
+    filename = os.path.join(cache_folder, 'dfdc_performance_map_' + key)
+    if not os.path.exists(filename + '.pkl'):
+        return None
+    try:
+        results = RCAIDE.load(filename, pickle_format=True)
+    except Exception:
+        # a damaged entry is treated as missing and overwritten by the next save
+        return None
+    return results
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Save Performance Map
+# ----------------------------------------------------------------------------------------------------------------------
+def save_performance_map(dfdc_analysis, key, results):
+    """
+    Stores the DFDC results of a ducted fan in the performance map cache.
+
+    Parameters
+    ----------
+    dfdc_analysis : DFDCAnalysis
+        Analysis object containing the following attributes:
+            - settings.filenames.cache_folder : str
+                Folder of the stored performance maps, no caching if None
+    key : str
+        Key of the performance map, see performance_map_key
+    results : Data
+        Results returned by read_results
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The results are written to a temporary file which then replaces the entry, so
+    concurrent vehicle builds sharing a cache folder never read a partial file.
+    """
+    cache_folder = dfdc_analysis.settings.filenames.cache_folder
+    if cache_folder is None:
+        return
+
+    os.makedirs(cache_folder, exist_ok=True)
+    filename = os.path.join(cache_folder, 'dfdc_performance_map_' + key)
+    RCAIDE.save(results, filename + '_' + str(os.getpid()), pickle_format=True)
+    os.replace(filename + '_' + str(os.getpid()) + '.pkl', filename + '.pkl')
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Complete Performance Map
+# ----------------------------------------------------------------------------------------------------------------------
+def complete_performance_map(results):
+    """
+    Checks that the DFDC results of a ducted fan are complete enough to be stored in the cache.
+
+    Parameters
+    ----------
+    results : Data
+        Results returned by read_results
+
+    Returns
+    -------
+    complete : bool
+        True if the blade geometry and the design point are finite and at least one case
+        of the performance map converged
+
+    Notes
+    -----
+    DFDC writes no results file for a case that does not converge, so read_results sets
+    the performance of that case to NaN and flags it in converged_solution. Such cases
+    are part of the performance map of the ducted fan and do not prevent storing it,
+    whereas a run where no case was read, or with a missing design point, is a failed run.
+    """
+    for value in results.geometry.values():
+        if not np.all(np.isfinite(value)):
+            return False
+    for tag in ['design_thrust','design_power','design_efficiency','design_thrust_coefficient','design_power_coefficient']:
+        if not np.isfinite(results.performance[tag]):
+            return False
+    converged = results.performance.converged_solution.astype(bool)
+    if not np.any(converged):
+        return False
+    for tag in ['thrust','power','efficiency','torque','thrust_coefficient','power_coefficient']:
+        if not np.all(np.isfinite(results.performance[tag][converged])):
+            return False
+    return True
@@ -153,7 +153,7 @@ def read_results(dfdc_analysis):
     design_velocity  = ducted_fan.cruise.design_freestream_velocity 
     design_altitude  = ducted_fan.cruise.design_altitude  
     string           = results_template.format(design_velocity,design_RPM,design_altitude)     
-    results_filename = os.path.join(run_folder, string + '.txt')
+    results_filename = results_file_path(run_folder, string)
     with open(results_filename,'r') as case_results_file: 
         case_lines                       = case_results_file.readlines() 
         results.performance.design_thrust              = float(case_lines[8][13:26].strip())
@@ -175,7 +175,7 @@ def read_results(dfdc_analysis):
                     rpm             = omega / Units.rpm
                     velocity        =  mach[i] * a 
                     string          = results_template.format(velocity,rpm,altitudes[k])   
-                    results_filename   = os.path.join(run_folder, string + '.txt')
+                    results_filename   = results_file_path(run_folder, string)
                     with open(results_filename,'r') as case_results_file: 
                         case_lines                       = case_results_file.readlines() 
                         results.performance.thrust[i,j,k]              = float(case_lines[8][13:26].strip())
@@ -197,4 +197,13 @@ def read_results(dfdc_analysis):
                     results.performance.power_coefficient[i,j,k]   = np.nan  
                     results.performance.advance_ratio[i,j,k]       = np.nan
 
-    return results
\ No newline at end of file
+    return results
+
+def results_file_path(run_folder, string):
+    """ Returns the path of a results file. The input deck requests the file with the lowercase case tag,
+    so the lowercase name is used if the file does not exist under the template name.
+    """
+    results_filename = os.path.join(run_folder, string + '.txt')
+    if not os.path.exists(results_filename):
+        results_filename = os.path.join(run_folder, string.lower() + '.txt')
+    return results_filename
@@ -6,11 +6,15 @@
 #  Imports
 # ----------------------------------------------------------------------------------------------------------------------
 
-from RCAIDE.Framework.Core  import redirect 
+from RCAIDE.Framework.Core  import redirect, Data, Container 
 import sys 
 import subprocess
+import tempfile
 import os 
+import numpy as np
+from shutil        import rmtree
 from .purge_files  import purge_files 
+from .write_input_deck import write_input_deck
 
 # ---------------------------------------------------------------------------------------------------------------------- 
 # Run DFDC Analysis
@@ -65,6 +69,9 @@ def run_dfdc_analysis(dfdc_object, print_output):
     If new_regression_results is True, the function will skip execution
     and return a success code (0) without running DFDC.
     
+    If settings.number_of_workers is greater than one, the run cases are split
+    across concurrent DFDC processes by run_dfdc_shards.
+    
     See Also
     --------
     RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.purge_files
@@ -73,6 +80,8 @@ def run_dfdc_analysis(dfdc_object, print_output):
     new_regression_results = dfdc_object.settings.new_regression_results
     if new_regression_results:
         exit_status = 0 
+    elif dfdc_object.settings.number_of_workers > 1 and len(dfdc_object.run_cases) > 1:
+        exit_status = run_dfdc_shards(dfdc_object)
     else:
         log_file = dfdc_object.settings.filenames.log_filename
         err_file = dfdc_object.settings.filenames.err_filename
@@ -109,3 +118,105 @@ def run_dfdc_analysis(dfdc_object, print_output):
 
     return exit_status
 
+# ---------------------------------------------------------------------------------------------------------------------- 
+# Run DFDC Shards
+# ----------------------------------------------------------------------------------------------------------------------   
+def run_dfdc_shards(dfdc_object):
+    """
+    Splits the run cases into shards and executes each shard in its own DFDC process.
+    
+    Parameters
+    ----------
+    dfdc_object : DFDCAnalysis
+        Analysis object containing the following attributes:
+            - settings : Data
+                Configuration settings
+                    - number_of_workers : int
+                        Number of concurrent DFDC processes
+                    - filenames : Data
+                        File path information
+                            - log_filename : str
+                                Path to log file for stdout
+                            - err_filename : str
+                                Path to error file for stderr
+                            - dfdc_bin_name : str
+                                Path to DFDC executable
+                            - case : str
+                                Case name for DFDC
+            - current_status : Data
+                Current analysis state
+                    - deck_file : str
+                        Name of the input deck file of each shard
+            - run_cases : Container
+                Cases to run
+    
+    Returns
+    -------
+    exit_status : int
+        0 if every DFDC process succeeded, otherwise the first non-zero return code
+    
+    Notes
+    -----
+    Called from the run folder once the case file is written. Each shard runs in a
+    temporary sub-folder with its own input deck, made of the design commands followed
+    by the commands of its run cases, so every DFDC process designs the same blade
+    before running its cases. The case file is linked into every shard folder. When all
+    processes have finished, the result files and the blade geometry file are moved to
+    the run folder and the shard logs are appended to the log and error files.
+    
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.run_dfdc_analysis
+    """
+    run_cases         = dfdc_object.run_cases
+    cases             = list(run_cases.values())
+    n_shards          = min(dfdc_object.settings.number_of_workers,len(cases))
+    dfdc_call         = dfdc_object.settings.filenames.dfdc_bin_name
+    case_file         = dfdc_object.settings.filenames.case
+    log_file          = dfdc_object.settings.filenames.log_filename
+    err_file          = dfdc_object.settings.filenames.err_filename
+    geometry_filename = dfdc_object.geometry.tag + '_geometry.txt'
+    purge_files([log_file,err_file])
+    
+    # write the input deck of each shard and start its DFDC process
+    shards = []
+    try:
+        for indices in np.array_split(np.arange(len(cases)),n_shards):
+            shard           = Data()
+            shard.run_cases = Container()
+            for i in indices:
+                shard.run_cases.append(cases[i])
+            shard.folder    = tempfile.mkdtemp(prefix='dfdc_shard_',dir=os.getcwd())
+            shards.append(shard)
+            
+            dfdc_object.run_cases = shard.run_cases
+            with redirect.folder(shard.folder,link=[case_file],force=False):
+                write_input_deck(dfdc_object)
+            
+            shard.commands = open(os.path.join(shard.folder,dfdc_object.current_status.deck_file),'r')
+            shard.log      = open(os.path.join(shard.folder,'shard_' + log_file),'w')
+            shard.err      = open(os.path.join(shard.folder,'shard_' + err_file),'w')
+            shard.process  = subprocess.Popen([dfdc_call,case_file],stdout=shard.log,stderr=shard.err,stdin=shard.commands,cwd=shard.folder)
+        
+        # wait for the shards and collect their files 
+        exit_status = 0
+        for shard in shards:
+            return_code = shard.process.wait()
+            if exit_status == 0:
+                exit_status = return_code
+            for stream in [shard.commands,shard.log,shard.err]:
+                stream.close()
+            for filename in [geometry_filename] + [case.tag + '.txt' for case in shard.run_cases]:
+                if os.path.exists(os.path.join(shard.folder,filename)):
+                    os.replace(os.path.join(shard.folder,filename),filename)
+            for shard_file, run_file in [[shard.log.name,log_file],[shard.err.name,err_file]]:
+                with open(shard_file,'r') as source, open(run_file,'a') as destination:
+                    destination.write(source.read())
+    finally:
+        dfdc_object.run_cases = run_cases
+        for shard in shards:
+            if ('process' in shard) and (shard.process.poll() is None):
+                shard.process.kill()
+            rmtree(shard.folder,ignore_errors=True)
+    
+    return exit_status
@@ -17,9 +17,11 @@ from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_E
 from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.run_dfdc_analysis                  import  run_dfdc_analysis
 from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.translate_conditions_to_dfdc_cases import  translate_conditions_to_dfdc_cases
 from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.read_results                       import  read_results 
+from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan.Performance.Blade_Element_Momentum_Theory.performance_map_cache              import  performance_map_key, load_performance_map, save_performance_map, complete_performance_map
 
 # python imports   
 from shutil import rmtree
+from warnings import warn
 from scipy import interpolate 
 import os
 import numpy as  np
@@ -66,6 +68,13 @@ def design_ducted_fan(ducted_fan, new_regression_results = False, keep_files = T
         - Accounts for 3D effects and losses
         - Requires external DFDC executable
 
+    The DFDC run cases are split across ducted_fan.DFDC.number_of_workers concurrent
+    DFDC processes. If ducted_fan.DFDC.cache_folder is set, the DFDC results are stored
+    there, keyed on the ducted fan geometry and the case grid, and a later design of an
+    identical ducted fan reads them instead of running DFDC. Results of a DFDC run that
+    exited with an error, or whose geometry, design point or performance map is incomplete,
+    are not stored.
+
     The BEMT method creates surrogate models for:
         - Thrust
         - Power
@@ -133,14 +142,19 @@ def design_ducted_fan(ducted_fan, new_regression_results = False, keep_files = T
         dfdc_analysis.settings.filenames.dfdc_bin_name  = ducted_fan.DFDC.bin_name
         dfdc_analysis.settings.new_regression_results   = new_regression_results
         dfdc_analysis.settings.keep_files               = keep_files
+        dfdc_analysis.settings.number_of_workers        = ducted_fan.DFDC.number_of_workers
+        dfdc_analysis.settings.filenames.cache_folder   = ducted_fan.DFDC.cache_folder
         
-        # Get the root directory (one level above RCAIDE)
-        current_dir = os.path.dirname(__file__)
-        # Go up to the root directory containing RCAIDE
-        root_dir = os.path.abspath(os.path.join(current_dir, *['..'] * 6))
-    
-        # Set the run folder path
-        dfdc_analysis.settings.filenames.run_folder = os.path.join(root_dir, 'VnV', 'Verification', 'network_electric', 'dfdc_files')
+        if ducted_fan.DFDC.run_folder == None:
+            # Get the root directory (one level above RCAIDE)
+            current_dir = os.path.dirname(__file__)
+            # Go up to the root directory containing RCAIDE
+            root_dir = os.path.abspath(os.path.join(current_dir, *['..'] * 6))
+        
+            # Set the run folder path
+            dfdc_analysis.settings.filenames.run_folder = os.path.join(root_dir, 'VnV', 'Verification', 'network_electric', 'dfdc_files')
+        else:
+            dfdc_analysis.settings.filenames.run_folder = os.path.abspath(ducted_fan.DFDC.run_folder)
         run_folder = dfdc_analysis.settings.filenames.run_folder
     
         # Ensure the directory exists
@@ -157,12 +171,24 @@ def design_ducted_fan(ducted_fan, new_regression_results = False, keep_files = T
         with redirect.folder(run_folder,force=False):
             write_geometry(dfdc_analysis,run_script_path)    
             write_input_deck(dfdc_analysis)   
+            
+            # look up the performance map of an identical ducted fan and case grid 
+            key     = performance_map_key(dfdc_analysis)
+            results = load_performance_map(dfdc_analysis,key)
     
             # RUN DFDC!
-            _ = run_dfdc_analysis(dfdc_analysis,print_output)
+            if results is None:
+                exit_status = run_dfdc_analysis(dfdc_analysis,print_output)
+                if exit_status != 0:
+                    warn('DFDC exited with status ' + str(exit_status) + ', the ducted fan results may be incomplete',RuntimeWarning)
     
-        # translate results
-        results = read_results(dfdc_analysis)
+        # translate results, only the results of a successful DFDC run are stored for later designs
+        if results is None: 
+            results = read_results(dfdc_analysis)
+            if (exit_status == 0) and complete_performance_map(results):
+                save_performance_map(dfdc_analysis,key,results)
+            elif dfdc_analysis.settings.filenames.cache_folder is not None:
+                warn('DFDC run failed or is incomplete, the performance map is not stored in the cache',RuntimeWarning)
     
         if not dfdc_analysis.settings.keep_files:
             rmtree(run_folder) 
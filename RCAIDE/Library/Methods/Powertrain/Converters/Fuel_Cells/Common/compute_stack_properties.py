@@ -13,8 +13,6 @@ from RCAIDE.Library.Methods.Powertrain.Converters.Fuel_Cells.Larminie_Model impo
 from RCAIDE.Library.Methods.Powertrain.Converters.Fuel_Cells.Proton_Exchange_Membrane.compute_fuel_cell_performance import  evaluate_PEM ,  evaluate_max_gross_power, set_rated_current_density 
 import  scipy as  sp
 import  numpy as  np
-import matplotlib.pyplot as  plt
-import matplotlib.cm as cm
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Compute Stack Properties
@@ -107,7 +107,8 @@ def BEMT_Helmholtz_performance(rotor, conditions):
         3. Set up the blade geometry (radial and azimuthal distributions)
         4. Initialize induced velocities
         5. Include effects of rotor incidence and external velocity fields if specified
-        6. Compute wake-induced inflow velocities using the Helmholtz wake model
+        6. Compute wake-induced inflow velocities using the Helmholtz wake model, flagging the
+           blade elements whose inflow angle did not converge in inflow_angle_converged
         7. Calculate aerodynamic forces (lift, drag) at each blade element
         8. Compute circulation, thrust, and torque distributions
         9. Apply tip loss corrections
@@ -523,6 +524,7 @@ def BEMT_Helmholtz_performance(rotor, conditions):
                 torque_coefficient                = Cq,
                 power_coefficient                 = Cp, 
                 converged_inflow_ratio            = lamdaw, 
+                inflow_angle_converged            = wake_inputs.converged,
                 blade_H_distribution              = rotor_drag_distribution,
                 rotor_drag                        = rotor_drag,
                 rotor_drag_coefficient            = Crd,
@@ -6,13 +6,13 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
+from RCAIDE.Framework.Core     import Data
 from RCAIDE.Library.Components import Wings 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.extract_wing_collocation_points import extract_wing_collocation_points
 from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake  import compute_wake_induced_velocity
 from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 # Python imports
 import numpy as np 
-import scipy as sp
 
 # ----------------------------------------------------------------------------------------------------------------------
 # wake model
@@ -207,13 +207,13 @@ def evaluate_wake_velocities(rotor,rotor_conditions,evaluation_points,ctrl_pts):
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  wake_convergence
 # ---------------------------------------------------------------------------------------------------------------------- 
-def wake_convergence(rotor,wake_inputs):
+def wake_convergence(rotor,wake_inputs,maximum_iterations=100):
     """
     Wake evaluation is performed using a simplified vortex wake method for Fidelity Zero, 
     following Helmholtz vortex theory.
     
     Assumptions:
-    None
+    Blade elements are independent, the residual of an element only depends on its own inflow angle
 
     Source:
     Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
@@ -226,11 +226,13 @@ def wake_convergence(rotor,wake_inputs):
           Ua        - Axial velocity
           Ut        - Tangential velocity
           r         - radius distribution
+       maximum_iterations - maximum number of solver iterations
        
        
     Outputs:
        va  - axially-induced velocity from rotor wake
        vt  - tangentially-induced velocity from rotor wake
+       wake_inputs.converged - True for the blade elements whose inflow angle converged
     
     Properties Used:
     None
@@ -241,20 +243,109 @@ def wake_convergence(rotor,wake_inputs):
     ctrl_pts        = wake_inputs.ctrl_pts
     Nr              = wake_inputs.Nr
     Na              = wake_inputs.Na    
+    tolerance       = rotor.sol_tolerance
 
     if wake_inputs.use_2d_analysis:
         PSI    = np.ones((ctrl_pts,Nr,Na))
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    # Every blade element is solved for its own inflow angle with a safeguarded Newton iteration. The first
+    # step uses the analytical derivative, later steps the secant through the last two iterates, since the
+    # analytical derivative assumes a thin airfoil lift slope. Once the residual of an element changes sign its
+    # root is bracketed and steps leaving the bracket are replaced by bisection.
+    R         = iteration(PSI, wake_inputs, rotor).reshape(PSI.shape)
+    slope     = compute_dR_dpsi(PSI, wake_inputs, rotor, diagonal = True)
+    max_step  = np.full(PSI.shape, 0.5)
+    PSI_a     = np.full(PSI.shape, np.nan)   # bracket end with the sign of R_a
+    PSI_b     = np.full(PSI.shape, np.nan)   # bracket end with the opposite sign
+    R_a       = np.full(PSI.shape, np.nan)
+    converged = (R == 0.)
+    
+    for _ in range(maximum_iterations):
+        active = ~converged
+        if not np.any(active):
+            break
+
+        # Newton or secant step, limited in size and kept inside the bracket
+        step        = np.divide(-R, slope, out=np.zeros_like(R), where=(slope != 0.) & np.isfinite(slope))
+        step        = np.clip(step, -max_step, max_step)
+        PSI_new     = PSI + step
+        bracketed   = ~np.isnan(PSI_b)
+        outside     = bracketed & ((PSI_new <= np.fmin(PSI_a,PSI_b)) | (PSI_new >= np.fmax(PSI_a,PSI_b)))
+        PSI_new     = np.where(outside, 0.5*(PSI_a + PSI_b), PSI_new)
+        PSI_new     = np.where(active, PSI_new, PSI)
+
+        # residual of the control points with active elements
+        rows        = np.any(active.reshape(ctrl_pts,-1), axis=1)
+        R_new       = R.copy()
+        R_new[rows] = iteration(PSI_new[rows], _wake_inputs_rows(wake_inputs, rows), rotor).reshape(PSI_new[rows].shape)
+
+        # steps into a region without a residual are retried with a smaller step
+        failed           = active & ~np.isfinite(R_new)
+        max_step[failed] = 0.5*np.abs(step[failed])
+        accept           = active & ~failed
+
+        # bracket the root at the first sign change, then keep the ends on either side of it
+        new_bracket        = accept & ~bracketed & (np.sign(R_new) != np.sign(R))
+        PSI_a[new_bracket] = PSI[new_bracket]
+        R_a[new_bracket]   = R[new_bracket]
+        PSI_b[new_bracket] = PSI_new[new_bracket]
+        update             = accept & bracketed
+        same_sign          = np.sign(R_new) == np.sign(R_a)
+        PSI_a              = np.where(update & same_sign, PSI_new, PSI_a)
+        R_a                = np.where(update & same_sign, R_new, R_a)
+        PSI_b              = np.where(update & ~same_sign, PSI_new, PSI_b)
+
+        # secant slope through the last two iterates
+        dPSI       = PSI_new - PSI
+        secant     = np.divide(R_new - R, dPSI, out=np.zeros_like(R), where=accept & (dPSI != 0.))
+        slope      = np.where(accept & (secant != 0.) & np.isfinite(secant), secant, slope)
+
+        width      = np.abs(PSI_b - PSI_a)
+        converged  = converged | (accept & ((np.abs(dPSI) <= tolerance*(1. + np.abs(PSI_new))) | (R_new == 0.) | (width <= tolerance*(1. + np.abs(PSI_new)))))
+        PSI        = np.where(accept, PSI_new, PSI)
+        R          = np.where(accept, R_new, R)
+
+    wake_inputs.converged = converged
     
     # Calculate the velocities given PSI
-    va, vt = va_vt(PSI_final, wake_inputs, rotor)
+    va, vt = va_vt(PSI, wake_inputs, rotor)
 
     
     return va, vt
 
+def _wake_inputs_rows(wake_inputs, rows):
+    """
+    Selects the control points of the wake inputs.
+
+    Assumptions:
+    Arrays with at least two dimensions and a leading dimension of ctrl_pts vary with the control point,
+    all other inputs are shared by the control points
+
+    Source:
+    N/A
+
+    Inputs:
+       wake_inputs  - wake inputs
+       rows         - boolean mask of the selected control points
+
+    Outputs:
+       wake_inputs of the selected control points
+
+    Properties Used:
+    None
+    """
+    ctrl_pts = wake_inputs.ctrl_pts
+    subset   = Data()
+    for key,value in wake_inputs.items():
+        if isinstance(value,np.ndarray) and value.ndim >= 2 and value.shape[0] == ctrl_pts:
+            subset[key] = value[rows]
+        else:
+            subset[key] = value
+    subset.ctrl_pts = int(np.sum(rows))
+    return subset
+
 def iteration(PSI, wake_inputs, rotor):
     """
     Computes the BEVW iteration.
@@ -383,7 +474,7 @@ def va_vt(PSI, wake_inputs, rotor):
 
     return va, vt
  
-def compute_dR_dpsi(PSI,wake_inputs,rotor):
+def compute_dR_dpsi(PSI,wake_inputs,rotor,diagonal=False):
     """
     Computes the analytical derivative for the BEVW iteration.
 
@@ -407,6 +498,9 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
        sin_psi                    sine of the inflow angle PSI                    [-]
        piece                      output of a step in tip loss calculation        [-]
 
+       diagonal                   return the derivative of every element instead  [Boolean]
+                                  of the Jacobian
+
     Outputs:
        dR_dpsi                    derivative of residual wrt inflow angle         [-]
 
@@ -467,6 +561,10 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
 
     dR_dpsi[np.isnan(dR_dpsi)] = 0.1
     
+    # The residual of a blade element only depends on its own inflow angle, the Jacobian is diagonal
+    if diagonal:
+        return dR_dpsi
+    
     # This needs to be made into a jacobian
     dR_dpsi = dR_dpsi.flatten()
     L       = np.size(PSI)
@@ -0,0 +1,275 @@
+# RCAIDE/Library/Methods/Powertrain/Converters/Rotor/Performance/Blade_Element_Momentum_Theory_Surrogate/BEMT_surrogate_performance.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+ # RCAIDE imports
+from RCAIDE.Framework.Core                              import Data , Units, orientation_product, orientation_transpose
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance import BEMT_Helmholtz_performance
+from .train_BEMT_surrogate                              import train_BEMT_surrogate, surrogate_scales
+
+# package imports
+import  numpy as  np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  BEMT_surrogate_performance
+# ----------------------------------------------------------------------------------------------------------------------
+def BEMT_surrogate_performance(rotor, conditions, surrogate = None):
+    """
+    Analyzes a general rotor given geometry and operating conditions using the surrogate of
+    Blade Element Momentum Theory with a Helmholtz Vortex Wake Prescription.
+
+    Parameters
+    ----------
+    rotor : Data
+        Rotor component with the attributes used by BEMT_Helmholtz_performance and:
+            - BEMT_surrogate.surrogate : Data
+                Trained surrogate, trained on the first call if None
+    conditions : Data
+        Flight conditions, see BEMT_Helmholtz_performance
+    surrogate : Data, optional
+        Surrogate to evaluate instead of rotor.BEMT_surrogate.surrogate
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The advance ratio, tip Mach number, blade pitch command and, for the 2D analysis, the angle
+    between the freestream and the rotor axis of every control point are computed as in
+    BEMT_Helmholtz_performance. The dimensionless BEMT outputs are interpolated at these inputs,
+    which are clipped to the bounds of the training grid, and scaled back with the density and
+    angular velocity of the control point. The remaining outputs of BEMT_Helmholtz_performance are
+    derived from the interpolated velocities and loads, so the results can be used by the noise and
+    plotting methods in place of the direct analysis.
+
+    Rotors with a nonuniform freestream are analyzed with BEMT_Helmholtz_performance.
+
+    **Major Assumptions**
+        * See train_BEMT_surrogate
+        * Linear interpolation between training points
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Surrogate.train_BEMT_surrogate
+    RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance
+    """
+    if rotor.nonuniform_freestream:
+        BEMT_Helmholtz_performance(rotor,conditions)
+        return
+
+    if surrogate is None:
+        if rotor.BEMT_surrogate.surrogate is None:
+            train_BEMT_surrogate(rotor)
+        surrogate = rotor.BEMT_surrogate.surrogate
+
+    commanded_TV          = conditions.energy.converters[rotor.tag].commanded_thrust_vector_angle
+    pitch_c               = conditions.energy.converters[rotor.tag].blade_pitch_command
+    eta                   = conditions.energy.converters[rotor.tag].throttle
+    omega                 = conditions.energy.converters[rotor.tag].omega
+    design_flag           = conditions.energy.converters[rotor.tag].design_flag
+    B                     = rotor.number_of_blades
+    R                     = rotor.tip_radius
+    c                     = rotor.chord_distribution
+    r_1d                  = rotor.radius_distribution
+    Na                    = rotor.number_azimuthal_stations
+    use_2d_analysis       = rotor.use_2d_analysis
+
+    # Unpack freestream conditions
+    rho     = conditions.freestream.density[:,0,None]
+    mu      = conditions.freestream.dynamic_viscosity[:,0,None]
+    a       = conditions.freestream.speed_of_sound[:,0,None]
+    Vv      = conditions.frames.inertial.velocity_vector
+    nu      = mu/rho
+
+    # Number of radial stations and segment control points
+    Nr       = len(c)
+    ctrl_pts = len(Vv)
+
+    # Velocity in the rotor frame
+    T_body2inertial         = conditions.frames.body.transform_to_inertial
+    T_inertial2body         = orientation_transpose(T_body2inertial)
+    V_body                  = orientation_product(T_inertial2body,Vv)
+    body2thrust,orientation = rotor.body_to_prop_vel(commanded_TV)
+    T_body2thrust           = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
+    V_thrust                = orientation_product(T_body2thrust,V_body)
+
+    # Check and correct for hover
+    V         = V_thrust[:,0,None]
+    V[V==0.0] = 1E-6
+
+    # surrogate inputs, the outputs scale with the magnitude of the angular velocity
+    D         = 2*R
+    omega_abs = np.abs(omega)
+    n         = omega/(2.*np.pi)
+    nD        = omega_abs[:,0]*D/(2.*np.pi)
+    inputs    = Data()
+    if use_2d_analysis:
+        V_total                = np.linalg.norm(V_thrust,axis=1)
+        inputs.advance_ratio   = np.divide(V_total,nD,out=np.zeros(ctrl_pts),where=nD>0)
+        inputs.disc_angle      = np.arctan2(np.linalg.norm(V_thrust[:,1:],axis=1),V_thrust[:,0])
+    else:
+        inputs.advance_ratio   = np.divide(V[:,0],nD,out=np.zeros(ctrl_pts),where=nD>0)
+    inputs.tip_mach            = omega_abs[:,0]*R/a[:,0]
+    inputs.blade_pitch_command = (np.ones((ctrl_pts,1))*pitch_c)[:,0]
+
+    points = np.zeros((ctrl_pts,len(surrogate.axes)))
+    for i,(axis,bounds) in enumerate(zip(surrogate.axes,surrogate.bounds)):
+        points[:,i] = np.clip(inputs[axis],bounds[0],bounds[1])
+    values = surrogate.interpolator(points)
+
+    # dimensional outputs
+    scales  = surrogate_scales(rotor,rho,omega_abs)
+    outputs = Data()
+    start   = 0
+    for name,kind,shape in surrogate.fields:
+        size          = int(np.prod(shape))
+        outputs[name] = values[:,start:start+size].reshape((ctrl_pts,) + tuple(shape))*scales[kind].reshape((-1,) + (1,)*len(shape))
+        start        += size
+
+    # velocities at the blade
+    Va_2d      = outputs.disc_axial_velocity
+    Vt_2d      = outputs.disc_tangential_velocity
+    Va_ind_2d  = outputs.disc_axial_induced_velocity
+    Vt_ind_2d  = outputs.disc_tangential_induced_velocity
+    alpha_disc = outputs.disc_effective_angle_of_attack
+    V_disc     = np.sqrt(Va_2d**2 + Vt_2d**2)
+    M_disc     = V_disc/a[:,:,None]
+    Re_disc    = V_disc*c[None,:,None]/nu[:,:,None]
+    if use_2d_analysis:
+        alpha = alpha_disc
+        W     = V_disc
+        Ma    = M_disc
+        Re    = Re_disc
+    else:
+        alpha = alpha_disc[:,:,0]
+        W     = V_disc[:,:,0]
+        Ma    = M_disc[:,:,0]
+        Re    = Re_disc[:,:,0]
+
+    # loads, the blade loads are averaged around the azimuth
+    blade_T_distribution_2d = outputs.disc_thrust_distribution
+    blade_Q_distribution_2d = outputs.disc_torque_distribution
+    blade_dT_dr_2d          = outputs.disc_dT_dr
+    blade_dQ_dr_2d          = outputs.disc_dQ_dr
+    blade_T_distribution    = np.mean(blade_T_distribution_2d, axis = 2)
+    blade_Q_distribution    = np.mean(blade_Q_distribution_2d, axis = 2)
+    blade_dT_dr             = np.mean(blade_dT_dr_2d, axis = 2)
+    blade_dQ_dr             = np.mean(blade_dQ_dr_2d, axis = 2)
+    rotor_drag_distribution = outputs.blade_H_distribution
+
+    # 2 dimensional radial and azimuthal distributions
+    psi            = np.linspace(0,2*np.pi,Na+1)[:-1]
+    r_dim_2d       = np.repeat(np.tile(r_1d[:, None] ,(1,Na))[None,:,:], ctrl_pts, axis=0)
+    psi_2d         = np.repeat(np.tile(np.atleast_2d(psi),(Nr,1))[None, :, :], ctrl_pts, axis=0)
+
+    # forces
+    thrust                  = B*outputs.thrust_per_blade
+    torque                  = outputs.torque
+    rotor_drag              = outputs.rotor_drag
+    power                   = omega*torque
+
+    # calculate coefficients, power = omega*torque gives Cp = 2 pi Cq
+    A        = np.pi*(R**2 - rotor.hub_radius**2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Cq   = np.nan_to_num(torque/scales['moment'][:,None])
+        Ct   = np.nan_to_num(thrust/scales['force'][:,None])
+        Crd  = np.nan_to_num(rotor_drag/scales['force'][:,None])
+        etap = V*thrust/power
+        FoM  = thrust*np.sqrt(thrust/(2*rho*A))/power
+    Cp       = 2*np.pi*Cq
+
+    # prevent things from breaking
+    Cq[Cq<0]                   = 0.
+    Ct[Ct<0]                   = 0.
+    Cp[Cp<0]                   = 0.
+    thrust[omega<0.0]          = -thrust[omega<0.0]
+    thrust[omega==0.0]         = 0.0
+    power[omega==0.0]          = 0.0
+    torque[omega==0.0]         = 0.0
+    rotor_drag[omega==0.0]     = 0.0
+    Ct[omega==0.0]             = 0.0
+    Cp[omega==0.0]             = 0.0
+    etap[omega==0.0]           = 0.
+    thrust[eta[:,0]  <=0.0]    = 0.0
+    power[eta[:,0]  <=0.0]     = 0.0
+    torque[eta[:,0]  <=0.0]    = 0.0
+    power[eta>1.0]             = power[eta>1.0]*eta[eta>1.0]
+    thrust[eta[:,0]>1.0,:]     = thrust[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc_loading           = thrust/(np.pi*(R**2))
+        power_loading          = thrust/(power)
+
+    # Make the thrust a 3D vector
+    thrust_prop_frame      = np.zeros((ctrl_pts,3))
+    thrust_prop_frame[:,0] = thrust[:,0]
+    thrust_vector          = orientation_product(orientation_transpose(T_body2thrust),thrust_prop_frame)
+
+    conditions.energy.converters[rotor.tag]  = Data(
+                torque                            = torque,
+                thrust                            = thrust_vector,
+                power                             = power,
+                azimuthal_distribution            = psi,
+                design_flag                       = design_flag,
+                rpm                               = omega /Units.rpm ,
+                tip_mach                          = omega * R / conditions.freestream.speed_of_sound,
+                efficiency                        = etap,
+                number_radial_stations            = Nr,
+                orientation                       = orientation,
+                number_azimuthal_stations         = Na,
+                advance_ratio                     = V/(n*D),
+                disc_radial_distribution          = r_dim_2d,
+                speed_of_sound                    = conditions.freestream.speed_of_sound,
+                density                           = conditions.freestream.density,
+                velocity                          = Vv,
+                blade_tangential_induced_velocity = np.mean(Vt_ind_2d, axis=2),
+                blade_axial_induced_velocity      = np.mean(Va_ind_2d, axis=2),
+                blade_reynolds_number             = Re,
+                blade_effective_angle_of_attack   = alpha,
+                disc_reynolds_number              = Re_disc,
+                disc_effective_angle_of_attack    = alpha_disc,
+                blade_tangential_velocity         = np.mean(Vt_2d, axis=2),
+                blade_axial_velocity              = np.mean(Va_2d, axis=2),
+                blade_velocity                    = W,
+                blade_Mach_number                 = Ma,
+                disc_tangential_induced_velocity  = Vt_ind_2d,
+                disc_axial_induced_velocity       = Va_ind_2d,
+                disc_tangential_velocity          = Vt_2d,
+                disc_axial_velocity               = Va_2d,
+                disc_velocity                     = V_disc,
+                disc_Mach_number                  = M_disc,
+                drag_coefficient                  = outputs.drag_coefficient,
+                lift_coefficient                  = outputs.lift_coefficient,
+                disc_loading                      = disc_loading,
+                power_loading                     = power_loading,
+                omega                             = omega,
+                disc_circulation                  = outputs.disc_circulation,
+                blade_dT_dr                       = blade_dT_dr,
+                disc_dT_dr                        = blade_dT_dr_2d,
+                blade_thrust_distribution         = blade_T_distribution,
+                disc_thrust_distribution          = blade_T_distribution_2d,
+                thrust_per_blade                  = thrust/B,
+                thrust_coefficient                = Ct,
+                disc_azimuthal_distribution       = psi_2d,
+                blade_dQ_dr                       = blade_dQ_dr,
+                disc_dQ_dr                        = blade_dQ_dr_2d,
+                blade_torque_distribution         = blade_Q_distribution,
+                disc_torque_distribution          = blade_Q_distribution_2d,
+                torque_per_blade                  = torque/B,
+                torque_coefficient                = Cq,
+                power_coefficient                 = Cp,
+                converged_inflow_ratio            = outputs.converged_inflow_ratio,
+                inflow_angle_converged            = np.ones(np.shape(outputs.converged_inflow_ratio),dtype=bool),
+                blade_H_distribution              = rotor_drag_distribution,
+                rotor_drag                        = rotor_drag,
+                rotor_drag_coefficient            = Crd,
+                blade_pitch_command               = pitch_c,
+                commanded_thrust_vector_angle     = commanded_TV,
+                figure_of_merit                   = FoM,
+        )
+
+    return
@@ -0,0 +1,18 @@
+"""
+Provides a surrogate of the Blade Element Momentum Theory rotor performance for mission analyses.
+
+This module contains the training of a surrogate of the Blade Element Momentum Theory rotor analysis
+with a Helmholtz wake over advance ratio, tip Mach number, blade pitch command and disc angle, and its
+evaluation in place of the direct analysis. Surrogates are trained once per rotor geometry and can be
+stored on disk.
+
+See Also
+--------
+RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from .train_BEMT_surrogate        import train_BEMT_surrogate, surrogate_key
+from .BEMT_surrogate_performance  import BEMT_surrogate_performance
@@ -0,0 +1,411 @@
+# RCAIDE/Library/Methods/Powertrain/Converters/Rotor/Performance/Blade_Element_Momentum_Theory_Surrogate/train_BEMT_surrogate.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+ # RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                              import Data, orientation_product
+from RCAIDE.Framework.Mission.Common                    import Results
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance import BEMT_Helmholtz_performance
+
+# package imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+import hashlib
+import pickle
+import os
+
+# BEMT outputs stored in the surrogate and the dimensional scale of each, see surrogate_scales
+surrogate_fields = [('thrust_per_blade'                 , 'force'),
+                    ('torque'                           , 'moment'),
+                    ('rotor_drag'                       , 'force'),
+                    ('blade_H_distribution'             , 'force'),
+                    ('disc_thrust_distribution'         , 'force'),
+                    ('disc_torque_distribution'         , 'moment'),
+                    ('disc_dT_dr'                       , 'force_per_length'),
+                    ('disc_dQ_dr'                       , 'moment_per_length'),
+                    ('disc_axial_velocity'              , 'velocity'),
+                    ('disc_tangential_velocity'         , 'velocity'),
+                    ('disc_axial_induced_velocity'      , 'velocity'),
+                    ('disc_tangential_induced_velocity' , 'velocity'),
+                    ('disc_circulation'                 , 'circulation'),
+                    ('disc_effective_angle_of_attack'   , None),
+                    ('lift_coefficient'                 , None),
+                    ('drag_coefficient'                 , None),
+                    ('converged_inflow_ratio'           , None)]
+
+# in-process store of trained surrogates, shared by the copies of a rotor in the vehicle configurations
+_surrogate_memory = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  train_BEMT_surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+def train_BEMT_surrogate(rotor):
+    """
+    Trains the surrogate of the Blade Element Momentum Theory rotor performance over advance ratio,
+    tip Mach number, blade pitch command and disc angle.
+
+    Parameters
+    ----------
+    rotor : RCAIDE.Library.Components.Powertrain.Converters.Rotor
+        Rotor component with the geometry used by BEMT_Helmholtz_performance and:
+            - BEMT_surrogate.training : Data
+                Training grid
+                    - advance_ratio : array_like
+                        Advance ratios, V/(nD), of the grid
+                    - tip_mach : array_like
+                        Tip Mach numbers of the grid
+                    - blade_pitch_command : array_like
+                        Blade pitch commands of the grid [rad]
+                    - disc_angle : array_like
+                        Angles between the freestream and the rotor axis [rad], only used if use_2d_analysis
+                    - altitude : float
+                        Altitude of the training conditions [m]
+                    - batch_size : int
+                        Number of grid points per BEMT evaluation
+            - BEMT_surrogate.accuracy_samples : int
+                Number of random operating points of the accuracy report, no report if 0
+            - BEMT_surrogate.cache_folder : str
+                Folder of the stored surrogates, no caching if None
+
+    Returns
+    -------
+    None
+        The surrogate is stored in rotor.BEMT_surrogate.surrogate and the accuracy report in
+        rotor.BEMT_surrogate.accuracy
+
+    Notes
+    -----
+    Every grid point is an operating condition of BEMT_Helmholtz_performance at the training altitude.
+    The outputs are made dimensionless with the density, rotational speed and diameter of the point
+    (forces by rho n^2 D^4, moments by rho n^2 D^5, velocities by omega R) and stacked into a single
+    vector-valued linear interpolant. Axes of the grid with a single value are dropped.
+
+    A surrogate is identified by a key hashing the blade geometry, the airfoil files and the training
+    grid. Trained surrogates are reused from memory and, if a cache folder is set, from disk, so a rotor
+    geometry is only analyzed once.
+
+    The accuracy report compares the surrogate with direct BEMT at random operating points inside the
+    grid. Errors of thrust, torque and power are normalized by the largest magnitude of the BEMT value
+    over the samples.
+
+    **Major Assumptions**
+        * Crossflow of the 2D analysis lies in the x-z plane of the rotor frame
+        * Airfoil Reynolds number effects are those of the training altitude
+        * Atmospheric properties follow US Standard Atmosphere 1976
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Surrogate.BEMT_surrogate_performance
+    """
+    settings = rotor.BEMT_surrogate
+    training = settings.training
+    key      = surrogate_key(rotor)
+
+    stored = _surrogate_memory.get(key)
+    if stored is None:
+        stored = load_BEMT_surrogate(settings.cache_folder, key)
+    if stored is None:
+        stored = _train(rotor)
+        save_BEMT_surrogate(settings.cache_folder, key, stored)
+    _surrogate_memory[key] = stored
+
+    settings.surrogate = Data(
+        key          = key,
+        axes         = stored.axes,
+        bounds       = stored.bounds,
+        fields       = stored.fields,
+        altitude     = training.altitude,
+        interpolator = RegularGridInterpolator(stored.points, stored.values, method='linear', bounds_error=False, fill_value=None),
+    )
+    settings.accuracy = stored.accuracy
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  surrogate_key
+# ----------------------------------------------------------------------------------------------------------------------
+def surrogate_key(rotor):
+    """
+    Computes the key of the BEMT surrogate of a rotor.
+
+    Parameters
+    ----------
+    rotor : RCAIDE.Library.Components.Powertrain.Converters.Rotor
+        Rotor component
+
+    Returns
+    -------
+    key : str
+        SHA-1 digest of the blade geometry, the airfoils and the training settings
+
+    Notes
+    -----
+    The airfoils are hashed through the contents of their coordinate and polar files, so a rotor with
+    renamed but identical airfoil files shares the key of the original rotor.
+    """
+    training = rotor.BEMT_surrogate.training
+    geometry = [rotor.number_of_blades, rotor.tip_radius, rotor.hub_radius, rotor.twist_distribution,
+                rotor.chord_distribution, rotor.sweep_distribution, rotor.radius_distribution, rotor.thickness_to_chord,
+                list(rotor.airfoil_polar_stations), rotor.number_azimuthal_stations, rotor.use_2d_analysis,
+                rotor.orientation_euler_angles, training.advance_ratio, training.tip_mach, training.blade_pitch_command,
+                training.disc_angle, training.altitude, rotor.BEMT_surrogate.accuracy_samples]
+    digest = hashlib.sha1(pickle.dumps([np.asarray(item, dtype=float) if not isinstance(item,(bool,list)) else item for item in geometry]))
+    for airfoil in rotor.airfoils:
+        digest.update(airfoil.tag.encode('utf-8'))
+        filenames = [getattr(airfoil,'coordinate_file',None)] + list(getattr(airfoil,'polar_files',None) or [])
+        for filename in filenames:
+            if filename is not None and os.path.exists(filename):
+                with open(filename,'rb') as airfoil_file:
+                    digest.update(airfoil_file.read())
+        if 'NACA_4_Series_code' in airfoil:
+            digest.update(str(airfoil.NACA_4_Series_code).encode('utf-8'))
+    return digest.hexdigest()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_BEMT_surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+def load_BEMT_surrogate(cache_folder, key):
+    """
+    Loads the training data of a BEMT surrogate from the cache folder.
+
+    Parameters
+    ----------
+    cache_folder : str
+        Folder of the stored surrogates, no caching if None
+    key : str
+        Key of the surrogate, see surrogate_key
+
+    Returns
+    -------
+    stored : Data
+        Stored training data, or None if the surrogate is not in the cache or cannot be read
+    """
+    if cache_folder is None:
+        return None
+
+    filename = os.path.join(cache_folder, 'BEMT_surrogate_' + key)
+    if not os.path.exists(filename + '.pkl'):
+        return None
+    try:
+        stored = RCAIDE.load(filename, pickle_format=True)
+    except Exception:
+        # a damaged entry is treated as missing and overwritten by the next save
+        return None
+    return stored
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  save_BEMT_surrogate
+# ----------------------------------------------------------------------------------------------------------------------
+def save_BEMT_surrogate(cache_folder, key, stored):
+    """
+    Stores the training data of a BEMT surrogate in the cache folder.
+
+    Parameters
+    ----------
+    cache_folder : str
+        Folder of the stored surrogates, no caching if None
+    key : str
+        Key of the surrogate, see surrogate_key
+    stored : Data
+        Training data of the surrogate
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The data is written to a temporary file which then replaces the entry, so concurrent
+    processes sharing a cache folder never read a partial file.
+    """
+    if cache_folder is None:
+        return
+
+    os.makedirs(cache_folder, exist_ok=True)
+    filename = os.path.join(cache_folder, 'BEMT_surrogate_' + key)
+    RCAIDE.save(stored, filename + '_' + str(os.getpid()), pickle_format=True)
+    os.replace(filename + '_' + str(os.getpid()) + '.pkl', filename + '.pkl')
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  surrogate_scales
+# ----------------------------------------------------------------------------------------------------------------------
+def surrogate_scales(rotor, rho, omega):
+    """
+    Computes the dimensional scales of the surrogate outputs at each operating point.
+
+    Parameters
+    ----------
+    rotor : RCAIDE.Library.Components.Powertrain.Converters.Rotor
+        Rotor component
+    rho : ndarray
+        Freestream density [kg/m³], shape (ctrl_pts,1)
+    omega : ndarray
+        Magnitude of the angular velocity [rad/s], shape (ctrl_pts,1)
+
+    Returns
+    -------
+    scales : dict
+        Scale of each kind of output in surrogate_fields, shape (ctrl_pts,)
+    """
+    R = rotor.tip_radius
+    D = 2*R
+    n = omega[:,0]/(2*np.pi)
+    q = rho[:,0]*n*n
+    scales = {'force'             : q*D**4,
+              'moment'            : q*D**5,
+              'force_per_length'  : q*D**3,
+              'moment_per_length' : q*D**4,
+              'velocity'          : omega[:,0]*R,
+              'circulation'       : omega[:,0]*R*R,
+              None                : np.ones_like(n)}
+    return scales
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  training_conditions
+# ----------------------------------------------------------------------------------------------------------------------
+def training_conditions(rotor, advance_ratio, tip_mach, blade_pitch_command, disc_angle, altitude):
+    """
+    Sets up the flight conditions of a set of rotor operating points.
+
+    Parameters
+    ----------
+    rotor : RCAIDE.Library.Components.Powertrain.Converters.Rotor
+        Rotor component
+    advance_ratio : ndarray
+        Advance ratios, V/(nD), of the operating points
+    tip_mach : ndarray
+        Tip Mach numbers of the operating points
+    blade_pitch_command : ndarray
+        Blade pitch commands of the operating points [rad]
+    disc_angle : ndarray
+        Angles between the freestream and the rotor axis [rad]
+    altitude : float
+        Altitude [m]
+
+    Returns
+    -------
+    conditions : RCAIDE.Framework.Mission.Common.Results
+        Flight conditions with the body frame aligned with the inertial frame and the rotor
+        conditions read by BEMT_Helmholtz_performance
+    """
+    ctrl_pts   = len(advance_ratio)
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude,0.0)
+    ones       = np.ones((ctrl_pts,1))
+    a          = atmo_data.speed_of_sound[0,0]
+    R          = rotor.tip_radius
+
+    conditions = Results.template(ctrl_pts)
+    conditions.freestream.altitude          = altitude*ones
+    conditions.freestream.density           = atmo_data.density[0,0]*ones
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity[0,0]*ones
+    conditions.freestream.temperature       = atmo_data.temperature[0,0]*ones
+    conditions.freestream.pressure          = atmo_data.pressure[0,0]*ones
+    conditions.freestream.speed_of_sound    = a*ones
+
+    # J = V/(nD) with n = omega/(2 pi) and D = 2R
+    omega    = tip_mach*a/R
+    V        = advance_ratio*omega*R/np.pi
+    V_thrust = np.zeros((ctrl_pts,3))
+    V_thrust[:,0] = V*np.cos(disc_angle)
+    V_thrust[:,2] = V*np.sin(disc_angle)
+
+    body2thrust,_ = rotor.body_to_prop_vel(np.zeros((ctrl_pts,1)))
+    conditions.frames.body.transform_to_inertial = np.repeat(np.eye(3)[None,:,:],ctrl_pts,axis=0)
+    conditions.frames.inertial.velocity_vector   = orientation_product(body2thrust,V_thrust)
+    conditions.freestream.velocity               = V[:,None]
+
+    conditions.energy.converters[rotor.tag] = Data(
+        commanded_thrust_vector_angle = 0.*ones,
+        blade_pitch_command           = blade_pitch_command[:,None]*ones,
+        throttle                      = ones,
+        omega                         = omega[:,None]*ones,
+        design_flag                   = False,
+    )
+    return conditions
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  _train
+# ----------------------------------------------------------------------------------------------------------------------
+def _train(rotor):
+    """Evaluates BEMT over the training grid and returns the dimensionless outputs and the accuracy report."""
+    training = rotor.BEMT_surrogate.training
+    axes     = ['advance_ratio','tip_mach','blade_pitch_command']
+    if rotor.use_2d_analysis:
+        axes.append('disc_angle')
+    points   = [np.atleast_1d(np.asarray(training[axis],dtype=float)) for axis in axes]
+    shape    = tuple(len(p) for p in points)
+    grid     = [g.ravel() for g in np.meshgrid(*points,indexing='ij')]
+    if not rotor.use_2d_analysis:
+        grid.append(np.zeros_like(grid[0]))
+    n_points = len(grid[0])
+
+    values = None
+    fields = None
+    for start in range(0,n_points,training.batch_size):
+        rows       = slice(start,min(start + training.batch_size,n_points))
+        conditions = training_conditions(rotor,*[g[rows] for g in grid],training.altitude)
+        omega      = conditions.energy.converters[rotor.tag].omega
+        rho        = conditions.freestream.density
+        BEMT_Helmholtz_performance(rotor,conditions)
+        outputs    = conditions.energy.converters[rotor.tag]
+        scales     = surrogate_scales(rotor,rho,omega)
+        if fields is None:
+            fields = [(name, kind, outputs[name].shape[1:]) for name,kind in surrogate_fields]
+            values = np.zeros((n_points,sum(int(np.prod(field[2])) for field in fields)))
+        values[rows] = np.hstack([(outputs[name]/scales[kind].reshape((-1,) + (1,)*(outputs[name].ndim-1))).reshape(len(omega),-1) for name,kind,_ in fields])
+
+    # drop axes with a single value
+    active = [i for i,p in enumerate(points) if len(p) > 1]
+    stored = Data(
+        axes     = [axes[i] for i in active],
+        points   = tuple(points[i] for i in active),
+        bounds   = [(points[i][0],points[i][-1]) for i in active],
+        values   = values.reshape(tuple(shape[i] for i in active) + (values.shape[1],)),
+        fields   = fields,
+        accuracy = None,
+    )
+    stored.accuracy = _accuracy_report(rotor,stored)
+    return stored
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  _accuracy_report
+# ----------------------------------------------------------------------------------------------------------------------
+def _accuracy_report(rotor, stored):
+    """Compares the surrogate with direct BEMT at random operating points inside the training grid."""
+    from .BEMT_surrogate_performance import BEMT_surrogate_performance
+
+    training  = rotor.BEMT_surrogate.training
+    n_samples = rotor.BEMT_surrogate.accuracy_samples
+    if not n_samples:
+        return None
+
+    rng     = np.random.default_rng(0)
+    samples = []
+    for axis in ['advance_ratio','tip_mach','blade_pitch_command','disc_angle']:
+        p = np.atleast_1d(np.asarray(training[axis],dtype=float))
+        if axis == 'disc_angle' and not rotor.use_2d_analysis:
+            p = np.zeros(1)
+        samples.append(rng.uniform(p[0],p[-1],n_samples))
+
+    direct_conditions    = training_conditions(rotor,*samples,training.altitude)
+    surrogate_conditions = training_conditions(rotor,*samples,training.altitude)
+    BEMT_Helmholtz_performance(rotor,direct_conditions)
+
+    surrogate = Data(axes = stored.axes, bounds = stored.bounds, fields = stored.fields, altitude = training.altitude,
+                     interpolator = RegularGridInterpolator(stored.points, stored.values, method='linear', bounds_error=False, fill_value=None))
+    BEMT_surrogate_performance(rotor,surrogate_conditions,surrogate)
+
+    direct   = direct_conditions.energy.converters[rotor.tag]
+    estimate = surrogate_conditions.energy.converters[rotor.tag]
+    accuracy = Data(number_of_samples = n_samples)
+    for name in ['thrust','torque','power']:
+        error     = (np.linalg.norm(estimate[name],axis=1) - np.linalg.norm(direct[name],axis=1))/np.max(np.linalg.norm(direct[name],axis=1))
+        accuracy[name] = Data(max_relative_error = np.max(np.abs(error)),
+                              rms_relative_error = np.sqrt(np.mean(error**2)))
+    return accuracy
@@ -5,8 +5,8 @@ Methods for analyzing and computing the performance of rotors in aircraft propul
 
 This module provides functions for calculating the aerodynamic performance of various types
 of rotors, including propellers, lift rotors, and prop rotors. It implements different
-analysis methods such as Blade Element Momentum Theory (BEMT) with Helmholtz wake modeling
-and Actuator Disc Theory.
+analysis methods such as Blade Element Momentum Theory (BEMT) with Helmholtz wake modeling,
+a surrogate of the BEMT analysis and Actuator Disc Theory.
 
 The performance analysis methods calculate key parameters such as thrust, torque, power,
 efficiency, and induced velocities based on the rotor geometry, operating conditions, and
@@ -23,6 +23,7 @@ RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Design
 # -------------------------------------------------------------------------------------------------------------------- 
 from . import Blade_Element_Momentum_Theory_Helmholtz_Wake
 from . import Actuator_Disc_Theory
+from . import Blade_Element_Momentum_Theory_Surrogate
 
 
 
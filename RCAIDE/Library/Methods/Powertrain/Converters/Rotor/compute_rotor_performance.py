@@ -8,6 +8,7 @@
  # RCAIDE imports
 import RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Actuator_Disc_Theory.Actuator_Disk_performance as Actuator_Disk_performance
 import RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance as BEMT_Helmholtz_performance
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Surrogate.BEMT_surrogate_performance import BEMT_surrogate_performance
  
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Generalized Rotor Class
@@ -21,7 +22,8 @@ def compute_rotor_performance(rotor, conditions):
     rotor : RCAIDE.Library.Components.Powertrain.Converters.Rotor
         Rotor component with the following attributes:
             - fidelity : str
-                Analysis fidelity level ('Actuator_Disk_Theory' or 'Blade_Element_Momentum_Theory_Helmholtz_Wake')
+                Analysis fidelity level ('Actuator_Disk_Theory', 'Blade_Element_Momentum_Theory_Helmholtz_Wake'
+                or 'Blade_Element_Momentum_Theory_Surrogate')
             - tag : str
                 Identifier for the rotor
             - number_of_blades : int
@@ -75,12 +77,15 @@ def compute_rotor_performance(rotor, conditions):
     Notes
     -----
     This function serves as a dispatcher that calls the appropriate rotor analysis method
-    based on the specified fidelity level. It supports two fidelity levels:
+    based on the specified fidelity level. It supports three fidelity levels:
         1. Actuator_Disk_Theory: A simplified model that treats the rotor as an actuator
            disk, suitable for preliminary design and analysis.
         2. Blade_Element_Momentum_Theory_Helmholtz_Wake: A higher-fidelity model that
            combines blade element theory with a Helmholtz wake model, providing more
            accurate predictions of rotor performance.
+        3. Blade_Element_Momentum_Theory_Surrogate: An interpolation of the Blade Element
+           Momentum Theory results, trained once per rotor geometry, for repeated evaluations
+           inside mission solves.
     
     The function simply checks the fidelity level and calls the corresponding analysis
     function, passing the rotor and conditions as arguments.
@@ -99,12 +104,17 @@ def compute_rotor_performance(rotor, conditions):
     --------
     RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Actuator_Disc_Theory.Actuator_Disk_performance
     RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance
+    RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Surrogate.BEMT_surrogate_performance
     """
     
     if rotor.fidelity == 'Blade_Element_Momentum_Theory_Helmholtz_Wake': 
 
         BEMT_Helmholtz_performance(rotor,conditions)
                       
+    elif rotor.fidelity == 'Blade_Element_Momentum_Theory_Surrogate': 
+
+        BEMT_surrogate_performance(rotor,conditions)
+                      
     elif rotor.fidelity == 'Actuator_Disk_Theory': 
 
         Actuator_Disk_performance(rotor,conditions)
@@ -118,7 +118,7 @@ def setup_operating_conditions(component, altitude=0, velocity_range=np.array([1
     a                                                 = atmo_data.speed_of_sound    
     mu                                                = atmo_data.dynamic_viscosity 
                                                       
-    conditions                                        = Results() 
+    conditions                                        = Results.template() 
     conditions.freestream.altitude                    = np.atleast_2d(altitude)
     conditions.freestream.mach_number                 = np.atleast_2d(velocity_range/a)
     conditions.freestream.pressure                    = np.atleast_2d(p)
@@ -10,6 +10,7 @@
    
 from .aerodynamics               import aerodynamics 
 from .stability                  import stability
+from .surrogates                 import surrogates, find_surrogate_analyses, train_surrogates, surrogate_training_key, export_surrogate_training, restore_surrogate_training
 from .energy                     import energy
 from .emissions                  import emissions
 from .mass_properties            import mass_properties
@@ -0,0 +1,218 @@
+# RCAIDE/Library/Missions/Common/Pre_Process/surrogates.py
+#
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                     import Data
+from RCAIDE.Library.Methods.Geometry.Planform  import wing_segmented_planform, wing_planform
+
+# python imports
+from concurrent.futures import ProcessPoolExecutor
+from copy               import deepcopy
+import hashlib
+import pickle
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  surrogates
+# ----------------------------------------------------------------------------------------------------------------------
+def surrogates(mission):
+    """
+    Trains the surrogates of the aerodynamic and stability analyses of a mission concurrently
+
+    Parameters
+    ----------
+    mission : Mission
+        The mission containing segments to be analyzed
+            - settings.number_of_surrogate_workers : int
+                Number of processes training the surrogates
+
+    Returns
+    -------
+    None
+        Attaches the training data to the analyses directly
+
+    Notes
+    -----
+    With a single worker nothing is done here and each analysis is trained when it is initialized
+    by the aerodynamics and stability pre-processing. Otherwise the analyses these steps would
+    initialize are trained in a pool of processes beforehand, and their initialization only builds
+    the surrogates from the training data.
+
+    See Also
+    --------
+    RCAIDE.Library.Mission.Common.Pre_Process.aerodynamics
+    RCAIDE.Library.Mission.Common.Pre_Process.stability
+    """
+    number_of_workers = mission.settings.get('number_of_surrogate_workers',1)
+    if number_of_workers > 1:
+        train_surrogates(find_surrogate_analyses(mission),number_of_workers)
+    return
+
+def find_surrogate_analyses(mission):
+    """
+    Finds the analyses of a mission whose surrogates are trained during the pre-processing
+
+    Parameters
+    ----------
+    mission : Mission
+        The mission containing segments to be analyzed
+
+    Returns
+    -------
+    analyses : list
+        Aerodynamic and stability analyses with untrained surrogates
+
+    Notes
+    -----
+    The aerodynamics pre-processing initializes the analysis of the first segment and shares its
+    surrogates with the following segments. The stability pre-processing does the same, unless it
+    reuses the surrogates of a vortex lattice aerodynamic analysis. Only analyses that can restore
+    their training data (VLM and AVL) are returned.
+    """
+    candidates = []
+    for segment in mission.segments.values():
+        if segment.analyses.aerodynamics != None:
+            candidates.append(segment.analyses.aerodynamics)
+            break
+    for segment in mission.segments.values():
+        if segment.analyses.stability != None:
+            if not ((type(segment.analyses.aerodynamics) == RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method) or\
+                    (type(segment.analyses.aerodynamics) == RCAIDE.Framework.Analyses.Aerodynamics.Athena_Vortex_Lattice)):
+                candidates.append(segment.analyses.stability)
+            break
+
+    analyses = []
+    for analysis in candidates:
+        if ('training_restored' in analysis) and analysis.settings.use_surrogate and not analysis.training_restored:
+            analyses.append(analysis)
+    return analyses
+
+def train_surrogates(analyses,number_of_workers = 1):
+    """
+    Trains the surrogates of several analyses, in parallel in a pool of processes
+
+    Parameters
+    ----------
+    analyses : list
+        Aerodynamic and stability analyses supporting restored training data
+    number_of_workers : int
+        Number of processes. With a single worker the analyses are trained in this process
+
+    Returns
+    -------
+    None
+        Attaches the training data to the analyses directly
+
+    Notes
+    -----
+    Analyses with identical type, vehicle, settings and training inputs are trained once. Each
+    analysis is trained on a copy, the training data and the control surface flags are attached
+    back to the analysis and it is flagged as restored, so that its initialization skips the
+    training. An analysis that cannot be serialized is left to train when it is initialized.
+    """
+    groups = {}
+    for analysis in analyses:
+        for wing in analysis.vehicle.wings:
+            if len(wing.segments) > 1:
+                wing_segmented_planform(wing)
+            else:
+                wing_planform(wing)
+        try:
+            payload = pickle.dumps(analysis,protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            continue
+        key = surrogate_training_key(analysis)
+        if key not in groups:
+            groups[key] = [payload]
+        groups[key].append(analysis)
+    if len(groups) == 0:
+        return
+
+    payloads          = [group[0] for group in groups.values()]
+    number_of_workers = max(1,min(number_of_workers,len(payloads)))
+    if number_of_workers == 1:
+        outcomes = [_train_worker(payload) for payload in payloads]
+    else:
+        with ProcessPoolExecutor(max_workers=number_of_workers) as pool:
+            outcomes = list(pool.map(_train_worker,payloads))
+
+    for outcome, group in zip(outcomes,groups.values()):
+        trained = pickle.loads(outcome)
+        for analysis in group[1:]:
+            restore_surrogate_training(analysis,trained)
+    return
+
+def surrogate_training_key(analysis):
+    """
+    Key of the surrogate training of an analysis
+
+    Parameters
+    ----------
+    analysis : Analysis
+        Aerodynamic or stability analysis supporting restored training data
+
+    Returns
+    -------
+    key : str
+        SHA-1 digest of the type, vehicle, settings and training inputs of the analysis
+
+    Notes
+    -----
+    Analyses with the same key have the same training data. The key is shared by the training of
+    the surrogates during the pre-processing and the surrogate cache of a batch of missions
+    (see RCAIDE.Framework.Mission.Missions.evaluate_batch), so that each recognises the training
+    data of the other. Raises an exception if the analysis cannot be serialized.
+    """
+    return hashlib.sha1(pickle.dumps((type(analysis).__module__,type(analysis).__name__,analysis.vehicle,
+                                      analysis.settings,analysis.training),protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+def export_surrogate_training(analysis):
+    """
+    Exports the surrogate training data of a trained analysis
+
+    Parameters
+    ----------
+    analysis : Analysis
+        Trained aerodynamic or stability analysis
+
+    Returns
+    -------
+    trained : Data
+        Training data and control surface flags of the analysis, restored by restore_surrogate_training
+    """
+    return Data(training = analysis.training,
+                flags    = Data({flag:value for flag,value in analysis.items() if flag.endswith('_flag')}))
+
+def restore_surrogate_training(analysis,trained):
+    """
+    Attaches exported surrogate training data to an analysis
+
+    Parameters
+    ----------
+    analysis : Analysis
+        Aerodynamic or stability analysis supporting restored training data
+    trained : Data
+        Training data and control surface flags from export_surrogate_training
+
+    Returns
+    -------
+    None
+        Attaches a copy of the training data and the flags to the analysis and flags it as restored,
+        so that its initialization skips the training
+    """
+    analysis.training = deepcopy(trained.training)
+    for flag,value in trained.flags.items():
+        analysis[flag] = value
+    analysis.training_restored = True
+    return
+
+def _train_worker(payload):
+    """Trains a serialized analysis and returns its serialized training data and control surface flags."""
+    analysis = pickle.loads(payload)
+    analysis.initialize()
+    return pickle.dumps(export_surrogate_training(analysis),protocol=pickle.HIGHEST_PROTOCOL)
@@ -8,27 +8,95 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports 
 import RCAIDE 
+from RCAIDE.Framework.Analyses     import Process
+from RCAIDE.Library.Mission.Solver import store_warm_start
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 import  numpy as  np
 
 def sequential_segments(mission):
 
     print('\n Mission Solver Initiated')    
-    pbar = tqdm(total=100)
-    progress_interval = round(np.ceil(100/ len(mission.segments)))
-    last_tag = None
-    for tag,segment in mission.segments.items(): 
-        print('\n Solving', segment.tag , 'segment.')        
-        segment.mission_tag = mission.tag
-        if last_tag:
-            segment.state.initials = mission.segments[last_tag].state
-        last_tag = tag        
+    warm_start = mission.get('warm_start',None)
+    if warm_start is not None and not warm_start.active:
+        warm_start = None
+    
+    # the deferred post-processing of each segment runs on a background worker while the next segment is solved
+    post_processing = None
+    futures         = []
+    if mission.settings.get('pipeline_post_processing',False):
+        post_processing = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        pbar = tqdm(total=100)
+        progress_interval = round(np.ceil(100/ len(mission.segments)))
+        last_tag = None
+        for tag,segment in mission.segments.items(): 
+            print('\n Solving', segment.tag , 'segment.')        
+            segment.mission_tag = mission.tag
+            if last_tag:
+                segment.state.initials = mission.segments[last_tag].state
+            last_tag = tag        
+            
+            segment.process.initialize.expand_state(segment) 
+            segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip        
+            # always assigned, so that a segment does not keep the warm start of an earlier evaluation once it is turned off
+            segment.state.numerics.solver.warm_start = warm_start.segments.get(tag,None) if warm_start is not None else None
+            if post_processing is None:
+                segment.evaluate() 
+            else:
+                futures.append(evaluate_pipelined(segment,post_processing,mission.settings.pipelined_post_processes))
+            if warm_start is not None:
+                store_warm_start(warm_start,segment)
+            pbar.update(progress_interval)
+            print('\n')
+        pbar.close()
         
-        segment.process.initialize.expand_state(segment) 
-        segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip        
-        segment.evaluate() 
-        pbar.update(progress_interval)
-        print('\n')
-    pbar.close()
+        # wait for the post-processing of all segments
+        for future in futures:
+            future.result()
+    finally:
+        # if a segment failed, the post-processing not yet started is cancelled and the running one awaited
+        if post_processing is not None:
+            for future in futures:
+                future.cancel()
+            post_processing.shutdown(wait=True)
+    return
+
+def evaluate_pipelined(segment,post_processing,pipelined_post_processes):
+    """Evaluates a segment, deferring some of its post-processing steps to a background worker.
+
+        Assumptions:
+        The deferred steps (e.g. noise and emissions) only write their own outputs to the segment conditions,
+        nothing that the following segments use as initials. Their order is kept, they run after the other
+        post-processing steps.
+
+        Source:
+        N/A
+
+        Inputs:
+        segment                   - mission segment                                        [Data]
+        post_processing           - background worker                                      [ThreadPoolExecutor]
+        pipelined_post_processes  - tags of the post-processing steps to defer             [list]
+
+        Outputs:
+        future                    - completion of the deferred post-processing steps       [Future]
+
+        Properties Used:
+        N/A
+    """
+    post_process = segment.process.post_process
+    deferred     = Process()
+    for tag in list(post_process.keys()):
+        if tag in pipelined_post_processes:
+            deferred[tag]     = post_process[tag]
+            post_process[tag] = RCAIDE.Library.Methods.skip
+    try:
+        segment.evaluate()
+    finally:
+        # the deferred steps are put back even if the segment fails, so later evaluations run them
+        for tag in deferred.keys():
+            post_process[tag] = deferred[tag]
+    return post_processing.submit(deferred,segment)
             
             
\ No newline at end of file
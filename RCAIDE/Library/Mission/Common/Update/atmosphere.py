@@ -39,18 +39,8 @@ def atmosphere(segment):
     temperature_deviation = segment.temperature_deviation
     atmosphere            = segment.analyses.atmosphere
     
-    # compute
-    atmosphere_data = atmosphere.compute_values(h,temperature_deviation)
-    
-    # pack
-    conditions.freestream.pressure               = atmosphere_data.pressure
-    conditions.freestream.temperature            = atmosphere_data.temperature
-    conditions.freestream.thermal_conductivity   = atmosphere_data.thermal_conductivity
-    conditions.freestream.density                = atmosphere_data.density
-    conditions.freestream.speed_of_sound         = atmosphere_data.speed_of_sound
-    conditions.freestream.dynamic_viscosity      = atmosphere_data.dynamic_viscosity
-    conditions.freestream.kinematic_viscosity    = atmosphere_data.kinematic_viscosity
-    conditions.freestream.prandtl_number         = atmosphere_data.prandtl_number
+    # compute and pack
+    atmosphere.compute_freestream(h,temperature_deviation,conditions.freestream)
     
     return
      
\ No newline at end of file
@@ -9,5 +9,6 @@
 # ----------------------------------------------------------------------------------------------------------------------
  
 from .converge      import * 
-from .expand_state  import expand_state 
+from .expand_state  import expand_state
+from .warm_start    import apply_warm_start, store_warm_start 
  
\ No newline at end of file
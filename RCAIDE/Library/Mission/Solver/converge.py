@@ -11,6 +11,7 @@ from RCAIDE.Framework.Core import  Units, Data
 from RCAIDE.Framework.Optimization.Packages.scipy import scipy_setup
 from RCAIDE.Framework.Optimization.Common         import Nexus
 from RCAIDE.Framework.Analyses.Process            import Process
+from .warm_start                                  import apply_warm_start
 
 import scipy 
 import scipy.optimize
@@ -37,13 +38,18 @@ def converge(segment):
     state.numerics.tolerance_solution  [Unitless]
 
     Outputs:
-    state.unknowns                     [Any]
-    segment.state.numerics.converged   [Unitless]
+    state.unknowns                              [Any]
+    segment.state.numerics.converged            [Unitless]
+    segment.state.numerics.solver.evaluations   [Unitless]
+    segment.state.numerics.solver.iterations    [Unitless]
 
     Properties Used:
     N/A
     """ 
     
+    # start from a previously converged solve, if any
+    apply_warm_start(segment)
+    
     if segment.state.numerics.solver.type  == "optimize": 
         problem  = add_mission_variables(segment) 
        
@@ -65,6 +71,8 @@ def converge(segment):
             error_message =  outputs[4] 
         else:
             mission_converge = True
+        segment.state.numerics.solver.evaluations = problem.evaluation_count
+        segment.state.numerics.solver.iterations  = outputs[2]
      
     elif segment.state.numerics.solver.type  == "root_finder": 
         unknowns = segment.state.unknowns.pack_array() 
@@ -81,6 +89,9 @@ def converge(segment):
             mission_converge = False
         else:
             mission_converge = True
+        # each iteration of the root finder is a residual evaluation
+        segment.state.numerics.solver.evaluations = infodict['nfev']
+        segment.state.numerics.solver.iterations  = infodict['nfev']
             
     else: 
         raise Exception('undefined mission solver type')        
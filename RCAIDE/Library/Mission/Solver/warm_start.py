@@ -0,0 +1,136 @@
+# RCAIDE/Library/Missions/Solver/warm_start.py
+#
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+from copy import deepcopy
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  apply_warm_start
+# ----------------------------------------------------------------------------------------------------------------------
+def apply_warm_start(segment):
+    """
+    Replaces the initial guess of the unknowns of a segment with the unknowns of a previously converged solve
+
+    Parameters
+    ----------
+    segment : Segment
+        The mission segment about to be converged
+            - state.numerics.solver.warm_start : Data or None
+                Converged solve from store_warm_start, with
+                    - control_points : dimensionless control points of the converged solve
+                    - unknowns : converged unknowns
+            - state.numerics.dimensionless.control_points : array
+                Dimensionless control points of the segment
+            - state.unknowns : Data
+                Initial guess of the unknowns
+
+    Returns
+    -------
+    None
+        Updates segment.state.unknowns directly
+
+    Notes
+    -----
+    Unknowns that are not found in the stored solve, or whose shape cannot be matched, keep their
+    initial guess. When the number of control points changed, each unknown is linearly interpolated
+    in dimensionless time. Unknowns shorter than the number of control points (e.g. the ground
+    velocity of the takeoff, which skips the first point) are taken to end on the last control point.
+    """
+    warm_start = segment.state.numerics.solver.warm_start
+    if warm_start is None:
+        return
+
+    cp_old   = np.ravel(warm_start.control_points)
+    cp_new   = np.ravel(segment.state.numerics.dimensionless.control_points)
+    unknowns = segment.state.unknowns
+    for key in unknowns.keys():
+        if key == 'tag' or key not in warm_start.unknowns:
+            continue
+        value  = np.asarray(unknowns[key])
+        stored = np.asarray(warm_start.unknowns[key])
+        if value.shape == stored.shape:
+            unknowns[key] = stored.copy()
+        elif value.ndim >= 1 and stored.ndim == value.ndim and value.shape[1:] == stored.shape[1:] \
+             and 0 < len(stored) <= len(cp_old) and 0 < len(value) <= len(cp_new):
+            unknowns[key] = interpolate_rows(stored,cp_old[len(cp_old)-len(stored):],cp_new[len(cp_new)-len(value):])
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  store_warm_start
+# ----------------------------------------------------------------------------------------------------------------------
+def store_warm_start(warm_start,segment):
+    """
+    Stores the converged unknowns of a segment in a warm start store and reports the solver work saved
+
+    Parameters
+    ----------
+    warm_start : Data
+        Warm start store of the mission
+            - segments : Data
+                Converged solves keyed on the segment tag
+            - report : Data
+                Solver work saved by the warm starts
+    segment : Segment
+        The mission segment that was just converged
+            - state.numerics.solver.converged : bool
+            - state.numerics.solver.evaluations : int
+            - state.numerics.solver.iterations : int
+            - state.numerics.solver.warm_start : Data or None
+
+    Returns
+    -------
+    None
+        Updates warm_start directly
+
+    Notes
+    -----
+    Segments that did not converge are not stored, the next solve starts from the last converged one.
+    The savings of a warm started solve are measured against the first solve of the segment that
+    started from the default initial guess, and are accumulated per segment and over the mission:
+
+        - report.segments[tag].cold_evaluations, cold_iterations : work of the cold solve
+        - report.segments[tag].warm_solves : number of warm started solves
+        - report.segments[tag].evaluations_saved, iterations_saved : work saved by the warm starts
+        - report.evaluations_saved, iterations_saved : work saved over all the segments
+    """
+    solver = segment.state.numerics.solver
+    if solver.converged != True:
+        return
+
+    report = warm_start.report
+    if segment.tag not in report.segments:
+        report.segments[segment.tag] = Data(cold_evaluations = None, cold_iterations = None, warm_solves = 0,
+                                            evaluations_saved = 0, iterations_saved = 0)
+    counts = report.segments[segment.tag]
+    if solver.warm_start is None:
+        if counts.cold_evaluations is None:
+            counts.cold_evaluations = solver.evaluations
+            counts.cold_iterations  = solver.iterations
+    elif counts.cold_evaluations is not None:
+        counts.warm_solves       += 1
+        counts.evaluations_saved += counts.cold_evaluations - solver.evaluations
+        counts.iterations_saved  += counts.cold_iterations - solver.iterations
+        report.evaluations_saved += counts.cold_evaluations - solver.evaluations
+        report.iterations_saved  += counts.cold_iterations - solver.iterations
+
+    converged                = Data()
+    converged.control_points = np.array(segment.state.numerics.dimensionless.control_points)
+    converged.unknowns       = deepcopy(segment.state.unknowns)
+    warm_start.segments[segment.tag] = converged
+    return
+
+def interpolate_rows(values,x_old,x_new):
+    """Linearly interpolates the rows of an array from the points x_old to the points x_new."""
+    if len(x_old) == 1:
+        return np.repeat(values[:1],len(x_new),axis=0)
+    order  = np.argsort(x_old)
+    flat   = np.reshape(values,(len(x_old),-1))[order]
+    result = np.stack([np.interp(x_new,x_old[order],column) for column in flat.T],axis=1)
+    return np.reshape(result,(len(x_new),) + values.shape[1:])
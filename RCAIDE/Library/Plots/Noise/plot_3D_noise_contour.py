@@ -7,7 +7,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------   
 from RCAIDE.Framework.Core import Units
-from RCAIDE.Library.Plots  import *
+from RCAIDE.Library.Plots.Geometry.Common.contour_surface_slice import contour_surface_slice
 
 # python imports 
 import numpy as np  
@@ -9,10 +9,10 @@
 from RCAIDE.Framework.Core                             import Units
 from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distance
 from RCAIDE.Library.Plots.Common import plot_style
+from RCAIDE.Library.Methods.Geodesics.Topography   import load_topography
 
 # python imports 
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
 import matplotlib.colors 
 import numpy as np 
 
@@ -35,8 +35,8 @@ def plot_elevation_contours(topography_file,
 
     Parameters
     ----------
-    topography_file : str
-        Path to file containing topographical data in format:
+    topography_file : str or Topography
+        Path to file, or loaded Topography object, containing topographical data in format:
             * Column 1: Longitude [degrees]
             * Column 2: Latitude [degrees]
             * Column 3: Elevation [meters]
@@ -122,10 +122,9 @@ def plot_elevation_contours(topography_file,
     colors          = np.vstack((colors_undersea, colors_land))
     cut_terrain_map = matplotlib.colors.LinearSegmentedColormap.from_list('cut_terrain', colors) 
     
-    data = np.loadtxt(topography_file)
-    Long = data[:,0]
-    Lat  = data[:,1]
-    Elev = data[:,2]    
+    topography = load_topography(topography_file)
+    Long = topography.longitude
+    Lat  = topography.latitude
 
     x_min_coord = np.min(Lat)
     x_max_coord = np.max(Lat)
@@ -146,7 +145,7 @@ def plot_elevation_contours(topography_file,
     
     [long_dist,lat_dist]  = np.meshgrid(np.linspace(0,y_dist_max,number_of_longitudinal_points),np.linspace(0,x_dist_max,number_of_latitudinal_points))
     [long_deg,lat_deg]    = np.meshgrid(np.linspace(np.min(Long),np.max(Long),number_of_longitudinal_points),np.linspace(np.min(Lat),np.max(Lat),number_of_latitudinal_points)) 
-    elevation             = griddata((Lat,Long), Elev, (lat_deg, long_deg), method='linear')     
+    elevation             = topography.compute_elevation(lat_deg, long_deg, method='linear')     
     elevation             = elevation/Units.feet
     norm                  = FixPointNormalize(sealevel=0,vmax=np.max(elevation),vmin=np.min(elevation)) 
     
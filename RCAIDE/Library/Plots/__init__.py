@@ -5,6 +5,9 @@
 This package contains modules for visualizing various aspects of aircraft analysis, simulation results,
 and aircraft geometry.
 
+The plotting subpackages pull in matplotlib and plotly, so they are loaded lazily (PEP 562) the first time
+one of their functions or subpackages is accessed, e.g. ``RCAIDE.Library.Plots.plot_flight_conditions``.
+
 See Also
 --------
 RCAIDE.Library.Analysis : Analysis tools generating data for plots
@@ -14,14 +17,102 @@ RCAIDE.Library.Analysis : Analysis tools generating data for plots
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Geometry           import *  
-from .Aerodynamics       import * 
-from .Common             import *
-from .Emissions          import *  
-from .Energy             import * 
-from .Mission            import *  
-from .Noise              import *
-from .Thermal_Management import * 
-from .Topography         import * 
-from .Stability          import * 
-from .Weights            import *
\ No newline at end of file
+import importlib
+
+_subpackages = (
+    'Geometry',
+    'Aerodynamics',
+    'Common',
+    'Emissions',
+    'Energy',
+    'Mission',
+    'Noise',
+    'Thermal_Management',
+    'Topography',
+    'Stability',
+    'Weights',
+)
+
+# plotting function -> subpackage that defines it
+_functions = {
+    'plot_3d_vehicle'                            : 'Geometry',
+    'plot_3d_energy_network'                     : 'Geometry',
+    'generate_3d_vehicle_geometry_data'          : 'Geometry',
+    'plot_3d_rotor'                              : 'Geometry',
+    'generate_3d_blade_points'                   : 'Geometry',
+    'plot_3d_nacelle'                            : 'Geometry',
+    'generate_3d_basic_nacelle_points'           : 'Geometry',
+    'generate_3d_BOR_nacelle_points'             : 'Geometry',
+    'generate_3d_stack_nacelle_points'           : 'Geometry',
+    'plot_3d_wing'                               : 'Geometry',
+    'generate_3d_wing_points'                    : 'Geometry',
+    'plot_3d_vehicle_vlm_panelization'           : 'Geometry',
+    'plot_layout_of_passenger_accommodations'    : 'Geometry',
+    'plot_airfoil'                               : 'Geometry',
+    'plot_rotor'                                 : 'Geometry',
+    'contour_surface_slice'                      : 'Geometry',
+    'plot_aircraft_aerodynamics'                 : 'Aerodynamics',
+    'plot_airfoil_boundary_layer_properties'     : 'Aerodynamics',
+    'plot_airfoil_polar_files'                   : 'Aerodynamics',
+    'plot_airfoil_polars'                        : 'Aerodynamics',
+    'plot_airfoil_surface_forces'                : 'Aerodynamics',
+    'plot_aerodynamic_coefficients'              : 'Aerodynamics',
+    'plot_aerodynamic_forces'                    : 'Aerodynamics',
+    'plot_drag_components'                       : 'Aerodynamics',
+    'plot_lift_distribution'                     : 'Aerodynamics',
+    'plot_rotor_disc_performance'                : 'Aerodynamics',
+    'plot_rotor_performance'                     : 'Aerodynamics',
+    'plot_disc_and_power_loading'                : 'Aerodynamics',
+    'plot_rotor_conditions'                      : 'Aerodynamics',
+    'plot_surface_pressures'                     : 'Aerodynamics',
+    'set_axes'                                   : 'Common',
+    'plot_style'                                 : 'Common',
+    'plot_CO2e_emissions'                        : 'Emissions',
+    'plot_battery_module_conditions'             : 'Energy',
+    'plot_battery_cell_conditions'               : 'Energy',
+    'plot_battery_degradation'                   : 'Energy',
+    'plot_battery_temperature'                   : 'Energy',
+    'plot_battery_module_C_rates'                : 'Energy',
+    'plot_battery_pack_conditions'               : 'Energy',
+    'plot_battery_ragone_diagram'                : 'Energy',
+    'plot_electric_propulsor_efficiencies'       : 'Energy',
+    'plot_fuel_consumption'                      : 'Energy',
+    'plot_altitude_sfc_weight'                   : 'Energy',
+    'plot_propulsor_throttles'                   : 'Energy',
+    'plot_aircraft_velocities'                   : 'Mission',
+    'plot_flight_conditions'                     : 'Mission',
+    'plot_flight_trajectory'                     : 'Mission',
+    'plot_noise_level'                           : 'Noise',
+    'plot_3D_noise_contour'                      : 'Noise',
+    'plot_2D_noise_contour'                      : 'Noise',
+    'post_process_noise_data'                    : 'Noise',
+    'plot_thermal_management_performance'        : 'Thermal_Management',
+    'plot_wavy_channel_conditions'               : 'Thermal_Management',
+    'plot_cross_flow_heat_exchanger_conditions'  : 'Thermal_Management',
+    'plot_reservoir_conditions'                  : 'Thermal_Management',
+    'plot_air_cooled_conditions'                 : 'Thermal_Management',
+    'plot_elevation_contours'                    : 'Topography',
+    'plot_flight_forces_and_moments'             : 'Stability',
+    'plot_longitudinal_stability'                : 'Stability',
+    'plot_lateral_stability'                     : 'Stability',
+    'plot_weight_breakdown'                      : 'Weights',
+}
+
+__all__ = list(_subpackages) + list(_functions)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Lazy Loading
+# ----------------------------------------------------------------------------------------------------------------------
+
+def __getattr__(name):
+    """Imports a plotting subpackage, or the subpackage defining a plotting function, on first access."""
+    if name in _subpackages:
+        return importlib.import_module('.' + name, __name__)
+    if name in _functions:
+        value = getattr(importlib.import_module('.' + _functions[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
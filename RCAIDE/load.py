@@ -10,14 +10,15 @@ import json
 import pickle
 from RCAIDE.Framework.Core import Data, DataOrdered
 import numpy as np
+import os
 from collections import OrderedDict
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  load
 # ----------------------------------------------------------------------------------------------------------------------    
-def load(filename, pickle_format=False):
+def load(filename, pickle_format=False, binary_format=False, keys=None, mmap_mode=None):
     """
-    Imports a Pickle or JSON file into a RCAIDE data structure.
+    Imports a Pickle file, JSON file or binary directory into a RCAIDE data structure.
     
     Parameters
     ----------
@@ -26,6 +27,17 @@ def load(filename, pickle_format=False):
     pickle_format : bool, optional
         Flag indicating whether to load a pickle file (True) or JSON file (False)
         Default is False (JSON format)
+    binary_format : bool, optional
+        Flag indicating whether to load a binary directory written by RCAIDE.save
+        Default is False
+    keys : str or list, optional
+        Binary format only. Path of the part of the data structure to read, e.g.
+        'segments.cruise.conditions.energy'. Default is None (read everything)
+    mmap_mode : str, optional
+        Binary format only. Memory-map mode passed to numpy.load. Default is None, every
+        array is read into memory as a writable numpy.ndarray. With 'r' the arrays are
+        returned as read-only numpy.memmap views and their data is only read from disk when
+        it is accessed, with 'c' the views are copy-on-write.
         
     Returns
     -------
@@ -34,7 +46,7 @@ def load(filename, pickle_format=False):
     
     Notes
     -----
-    This function supports two file formats:
+    This function supports three file formats:
     
     1. JSON format (default): Loads a JSON file and converts it to a RCAIDE data structure
        using the read_RCAIDE_json_dict function.
@@ -42,6 +54,10 @@ def load(filename, pickle_format=False):
     2. Pickle format: Loads a binary pickle file directly into a Python object.
        The .pkl extension is automatically added to the filename.
     
+    3. Binary format: Reads the manifest of a binary directory and rebuilds the requested
+       part of the data structure using the read_RCAIDE_binary_tree function. Only the
+       .npy files of that part are opened.
+    
     JSON format is human-readable and more portable across different Python versions,
     while pickle format is more efficient for large data structures but less portable.
     
@@ -54,6 +70,25 @@ def load(filename, pickle_format=False):
         load_file = filename + '.pkl' 
         with open(load_file, 'rb') as file:
             data = pickle.load(file)  
+    elif binary_format:
+        with open(os.path.join(filename, 'manifest.json')) as file:
+            manifest = json.load(file, object_pairs_hook=OrderedDict)
+        
+        # Find the requested part of the tree
+        tree = manifest['tree']
+        if keys is not None:
+            if isinstance(keys,str):
+                keys = keys.split('.')
+            for k in keys:
+                try:
+                    if tree['type'] not in ['Data','DataOrdered']:
+                        raise KeyError(k)
+                    tree = OrderedDict(tree['items'])[k]
+                except KeyError:
+                    raise KeyError('Key ' + str(k) + ' not found in RCAIDE binary structure')
+        
+        # Convert to RCAIDE data structure
+        data = read_RCAIDE_binary_tree(tree, os.path.join(filename, 'arrays'), mmap_mode)
     else: 
         # Get JSON string
         f = open(filename)
@@ -131,4 +166,49 @@ def build_data_r(v):
     else:
         raise TypeError('Data type not expected in RCAIDE JSON structure')
 
-    return ret
\ No newline at end of file
+    return ret
+
+def read_RCAIDE_binary_tree(node, array_directory, mmap_mode=None):
+    """Builds a RCAIDE data structure from the manifest tree of a binary directory. 
+
+    Assumptions:
+        Manifest was created by RCAIDE.save with binary_format=True. Arrays holding
+        Python objects cannot be memory-mapped and are read into memory.
+        
+    Source:
+        None
+
+    Args: 
+        node            : manifest entry                                        [unitless]
+        array_directory : directory of the .npy files                           [unitless]
+        mmap_mode       : memory-map mode passed to numpy.load                  [unitless]
+        
+    Returns:
+        ret             : value converted to needed format                      [unitless]
+    """      
+    node_type = node['type']
+    
+    if node_type == 'array':
+        if node['pickled']:
+            ret = np.load(os.path.join(array_directory, node['file']), allow_pickle=True)
+        else:
+            ret = np.load(os.path.join(array_directory, node['file']), mmap_mode=mmap_mode)
+    elif node_type == 'scalar':
+        ret = node['value']
+    elif node_type == 'none':
+        ret = None
+    elif node_type == 'list':
+        ret = [read_RCAIDE_binary_tree(v, array_directory, mmap_mode) for v in node['items']]
+    elif node_type == 'tuple':
+        ret = tuple(read_RCAIDE_binary_tree(v, array_directory, mmap_mode) for v in node['items'])
+    elif (node_type == 'Data') or (node_type == 'DataOrdered'):
+        if node_type == 'Data':
+            ret = Data()
+        else:
+            ret = DataOrdered()
+        for k, v in node['items']:
+            ret[str(k)] = read_RCAIDE_binary_tree(v, array_directory, mmap_mode)
+    else:
+        raise TypeError('Data type not expected in RCAIDE binary structure')
+    
+    return ret
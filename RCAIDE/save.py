@@ -6,18 +6,21 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------      
 
+from RCAIDE.Framework.Core import DataOrdered
+
 import numpy as np
 import types
 import json
 import pickle
+import os
 from collections import OrderedDict
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  save
 # ----------------------------------------------------------------------------------------------------------------------       
-def save(data, filename, pickle_format=False):
+def save(data, filename, pickle_format=False, binary_format=False):
     """
-    Converts a RCAIDE data structure to a JSON or Pickle file for storage.
+    Converts a RCAIDE data structure to a JSON file, Pickle file or binary directory for storage.
     
     Parameters
     ----------
@@ -28,6 +31,9 @@ def save(data, filename, pickle_format=False):
     pickle_format : bool, optional
         Flag indicating whether to save as a pickle file (True) or JSON file (False)
         Default is False (JSON format)
+    binary_format : bool, optional
+        Flag indicating whether to save as a binary directory of NumPy arrays.
+        Default is False
         
     Returns
     -------
@@ -35,16 +41,22 @@ def save(data, filename, pickle_format=False):
     
     Notes
     -----
-    This function supports two file formats:
+    This function supports three file formats:
     
     1. JSON format (default): Converts the RCAIDE data structure to a JSON string
        using the build_dict_base and build_dict_r helper functions, then writes it to a file.
        
     2. Pickle format: Serializes the Python object directly to a binary file.
        The .pkl extension is automatically added to the filename.
+       
+    3. Binary format: Writes a directory named filename containing every NumPy array
+       as a separate .npy file plus a manifest.json describing the data tree, using the
+       build_binary_tree_r helper function. Arrays can then be memory-mapped and read
+       individually by RCAIDE.load without parsing the rest of the data.
     
     JSON format is human-readable and more portable across different Python versions,
     while pickle format is more efficient for large data structures but less portable.
+    Binary format is the fastest to write and read for results with large arrays.
     
     See Also
     --------
@@ -56,6 +68,21 @@ def save(data, filename, pickle_format=False):
         pickle_file  =  filename + '.pkl'
         with open(pickle_file, 'wb') as file:
             pickle.dump(data, file) 
+    elif binary_format:
+        array_directory = os.path.join(filename, 'arrays')
+        os.makedirs(array_directory, exist_ok=True)
+        
+        # Remove arrays of a previous save to the same directory
+        for array_file in os.listdir(array_directory):
+            if array_file.endswith('.npy'):
+                os.remove(os.path.join(array_directory, array_file))
+        
+        # Write arrays and build the tree manifest 
+        tree     = build_binary_tree_r(data, array_directory, [0])
+        manifest = OrderedDict([('format','RCAIDE_binary'), ('version',2), ('tree',tree)])
+        
+        with open(os.path.join(filename, 'manifest.json'), 'w') as file:
+            json.dump(manifest, file)
     else: 
         # Create a dictionary structure with the results
         res_dict = build_dict_base(data)
@@ -146,4 +173,61 @@ def build_dict_r(v):
         for k in keys:
             ret[k] = build_dict_r(v[k])        
     
-    return ret
\ No newline at end of file
+    return ret
+
+def build_binary_tree_r(v, array_directory, counter):
+    """Builds the manifest tree of the binary format, writing each NumPy array to its own .npy file.
+
+    Assumptions:
+        Data must be numpy arrays, strings, booleans, floats, ints, lists or tuples.
+        Functions and classes are stored as None and all other data raises an error.
+        Containers are restored as DataOrdered if they are ordered and as Data otherwise,
+        lists and tuples are stored element by element and keep their type.
+
+    Source:
+        None
+
+    Args:
+        v               :  value in a data structure                  [unitless]
+        array_directory :  directory the .npy files are written to    [unitless]
+        counter         :  single element list with the next array id  [unitless]
+
+    Returns:
+        node            : manifest entry of v                          [unitless]
+    """
+    tv = type(v) # Get value type
+    
+    if (tv == type) or (tv == types.FunctionType):
+        return OrderedDict([('type','none')])
+    
+    if isinstance(v, np.ndarray):
+        array_file = '%06d.npy' % counter[0]
+        counter[0] += 1
+        pickled    = v.dtype.hasobject
+        np.save(os.path.join(array_directory, array_file), v, allow_pickle=pickled)
+        return OrderedDict([('type','array'), ('file',array_file), ('pickled',pickled)])
+    elif isinstance(v, np.generic):
+        return OrderedDict([('type','scalar'), ('value',v.item())])
+    elif (tv == str) or (tv == bool) or (tv == float) or (tv == int):
+        return OrderedDict([('type','scalar'), ('value',v)])
+    elif tv == type(None):
+        return OrderedDict([('type','none')])
+    elif (tv == list) or (tv == tuple):
+        # lists and tuples are stored element by element, so that nested containers and arrays keep their type
+        items = [build_binary_tree_r(item, array_directory, counter) for item in v]
+        return OrderedDict([('type',tv.__name__), ('items',items)])
+    
+    # Assume other data types are RCAIDE data types and check
+    try:
+        keys = v.keys()
+    except:
+        if callable(tv):
+            return OrderedDict([('type','none')])
+        else:
+            raise TypeError('Unexpected data type in RCAIDE data structure')
+    
+    # Recursively assign values
+    items = [[k, build_binary_tree_r(v[k], array_directory, counter)] for k in keys]
+    if isinstance(v, (DataOrdered, OrderedDict)):
+        return OrderedDict([('type','DataOrdered'), ('items',items)])
+    return OrderedDict([('type','Data'), ('items',items)])
@@ -1 +1 @@
-{"tag": "cruise_propulsor_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "active": true, "wing_mounted": false, "sealevel_static_thrust": 6192.372498200064, "working_fluid": {"tag": "air", "molecular_mass": 28.96442, "gas_specific_constant": 287.0528742, "composition": {"gas": 1.0, "O2": 0.20946, "Ar": 0.00934, "CO2": 0.00036, "N2": 0.78084, "other": 0.0}, "specific_heat_capacity": 1006, "air_surrogate": {"O2": 0.2095, "N2": 0.7809, "AR": 0.0096}, "kinetic_mechanism": "Air.yaml"}, "motor": {"tag": "propeller_motor_1", "mass_properties": {"mass": 46.995026558550954, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "working_fluid": {}, "active": true, "resistance": 0.07618996086121739, "no_load_current": 0.001, "speed_constant": 0.34402687970133916, "efficiency": 0.95, "gearbox": {"gear_ratio": 1.0}, "design_angular_velocity": 192.17391304347828, "design_torque": 1121.5914561942334, "design_current": 385.85860897418104, "inverse_calculation": false, "interpolated_func": null, "nominal_voltage": 588.0, "wing_tag": "horizontal_tail"}, "rotor": {"tag": "propeller_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "number_of_blades": 3, "tip_radius": 1.15, "hub_radius": 0.11499999999999999, "twist_distribution": [1.2858001219480846, 1.1582492970311906, 1.0442917586489076, 0.9444683956520885, 0.858067161290893, 0.7836133725611228, 0.7194144512783092, 0.6639209016481162, 0.6157552599841788, 0.5737406914123029, 0.5368931139356415, 0.5043985341063237, 0.4755866658934704, 0.4499058626865057, 0.4269012596338416, 0.40619652761930636, 0.38747899970815813, 0.37048771660062596, 0.3550039477106991, 0.34090429809360334], "sweep_distribution": 0.0, "chord_distribution": [0.05734547492806923, 0.10179378482846743, 0.1424460499520111, 0.17392695563242955, 0.19515355674578658, 0.2073509810298643, 0.21248451184642214, 0.2124541648939738, 0.20879110996809608, 0.2026165012049558, 0.19469706553420355, 0.1855206933798622, 0.175362234999023, 0.16433061903459759, 0.15239531816761623, 0.1393894449423898, 0.1249786983138569, 0.10855956485404965, 0.08895043005400863, 0.06314537296638266], "thickness_to_chord": [0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465], "max_thickness_distribution": [0.006899535955980281, 0.012247346096623877, 0.01713843410773116, 0.020926067586071313, 0.023479951703145253, 0.02494748802617514, 0.025565130141693426, 0.025561478940097585, 0.025120757519592734, 0.0243778578360722, 0.023425028842503557, 0.022320971204063036, 0.021098753601996888, 0.019771481814735713, 0.018335482939838034, 0.01677067786901198, 0.01503684508376083, 0.013061372706662614, 0.010702094476109082, 0.007597352219714385], "radius_distribution": [0.11499999999999999, 0.16675, 0.21849999999999997, 0.27025, 0.322, 0.3737499999999999, 0.4255, 0.47725, 0.5289999999999999, 0.58075, 0.6324999999999998, 0.6842499999999999, 0.736, 0.7877499999999998, 0.8394999999999999, 0.8912499999999999, 0.9429999999999998, 0.9947499999999999, 1.0464999999999998, 1.09825], "blade_pitch_command": 0.0, "mid_chord_alignment": [0.0, 0.01111207747509955, 0.021275143755985465, 0.029145370176090077, 0.034452020454429334, 0.037501376525448764, 0.038784759229588225, 0.03877717249147614, 0.03786140876000671, 0.03631775656922164, 0.034337897651533576, 0.03204380461294824, 0.029504190017738442, 0.026746286026632086, 0.023762460809886747, 0.02051099250358014, 0.016908305846446918, 0.012803522481495104, 0.007901238781484849, 0.0014499745095783566], "blade_solidity": 0.11402285267735066, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "airfoils": {"airfoil": {"tag": "airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402465, "max_thickness": 0.12031526401402465, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.016043449318962084, 0.019590256985204432, 0.02245677294482681, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.02976247187814689, 0.03120944342544214, 0.03276888891442653, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.04138168201270342, 0.043831218912609625, 0.04622131608757142, 0.04846502418500166, 0.050526443585207935, 0.05241695312849192, 0.05414971456533544, 0.05573788964622039, 0.05719464012162861, 0.05853647479776234, 0.05981375461787535, 0.06109649672976446, 0.06245496040041921, 0.06395940489682914, 0.0656800894859838, 0.0676688505121781, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275303, 0.0842766016889327, 0.085710806953059, 0.0870379883892214, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022884, 0.09268290622537607, 0.09359994223597635, 0.09443196809870935, 0.09517814045560118, 0.0958443004626162, 0.09643671550245721, 0.096961652957827, 0.09742538021142831, 0.09783279989437105, 0.09816741123853424, 0.09839571958896257, 0.0984837621809043, 0.09839757624960772, 0.09810319903032118, 0.09757115844868458, 0.09680920794395251, 0.09584350726715764, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.0904643327380958, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783351, 0.07651653661409304, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.06609674614077089, 0.06331982631104899, 0.06044200824136898, 0.05742402352501027, 0.054226603755252165, 0.05081048052537401, 0.047139368762024875, 0.04325609416755832, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.02820878356517617, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.01671358326777673, 0.01500107028568076, 0.013274898166135715, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.003665223223884563, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413802, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.018968040272831232, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.02271885485138349, -0.02367032713380571, -0.024535690747991005, -0.025270626378542282, -0.025865827824930857, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112896, -0.027577905285351957, -0.027817779092228732, -0.028040959225367316, -0.028244741943301413, -0.02842642350456472, -0.028583300167690947, -0.028712472367814792, -0.02880992257703332, -0.02887123715297097, -0.02889200198907823, -0.02886780297880557, -0.02879422623767004, -0.028668152085203107, -0.02849080290872854, -0.028264310680272065, -0.02799080737185942, -0.027672424955516337, -0.027311321418476225, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.025633665966898873, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.02222011929783598, -0.02149485811539941, -0.020697040726644425, -0.01985855320935335, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.01600951205009446, -0.015348714944608753, -0.014696685836695608, -0.014039154630508432, -0.013364802023979244, -0.012676394865126254, -0.011980898543506178, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.00802202799789677, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.005370460001161809, -0.004922598050038695, -0.004500041231814651, -0.004101592290880574, -0.003726130229006508, -0.003374556208971546, -0.003049954856793557, -0.002755519375891563, -0.0024944429696845878, -0.002269918841591665, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.0016082936412161188, -0.0015644504055181275, -0.0015249242118237462, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.0013576126052634095, 0.0024695527728248144, 0.003369024561693369, 0.0040892320308782235, 0.004663379239388539, 0.005124670246233462, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797651, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659965, 0.010080445889401959, 0.010842812669790206, 0.011597198903229692, 0.01233030788013854, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.01493535663325786, 0.015479284756205192, 0.01599798776282331, 0.01652776875219857, 0.0171051092285589, 0.017766490696132207, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.02166436767347927, 0.022834536936970913, 0.023998601824185305, 0.025113446025102817, 0.026147338867613706, 0.02710674861201224, 0.028006145504330313, 0.028859999790599788, 0.02968278171685253, 0.030488907954972666, 0.031285257126835116, 0.03206346266089256, 0.03281331888555653, 0.033524620129238604, 0.03418716072035033, 0.034791054320257794, 0.03533800740067584, 0.03584432730423963, 0.03632725237345171, 0.03680402095081467, 0.03729187137883104, 0.037806340298267536, 0.03833627656156741, 0.03884933943115907, 0.039312604485775476, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.03991699760853159, 0.03967581602068806, 0.03935466591571174, 0.03897382762536841, 0.03854976535705828, 0.038080726355359515, 0.03755952808633414, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.034812758024605164, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.02987492890811462, 0.028737500985127944, 0.027535774120103586, 0.026250712737485787, 0.024863281261718755, 0.023354444117246718, 0.021706619266509183, 0.01994076897929339, 0.01811947440626736, 0.016307386286377533, 0.014569155358570335, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.006696388322232322, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696687, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522144, 1.3189900988029917, 1.2133829765808901, 1.0761215426599497, 0.9043572397947004, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387613, 0.6364767634570125, 0.6587556980553567, 0.680972878036534, 0.7031258927040288, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.0321, 0.028095562130177523, 0.024411479289940825, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544, 0.022460710059171607, 0.01971976331360947, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744561908, 1.6324685435018864, 0.5984913458180275, 0.04447241567611945, 0.0057528331320200795, 0.0022393881794874303, 0.00014972371545378795, -0.0018771829603368912, -0.004555800736470006, -0.008093622361508465, -0.012114355480663532, -0.016291901080270555, -0.020439762425065504, -0.024437973806805246, -0.028216333043157214, -0.0317315025781406, -0.03494448187634495, -0.03779737471329425, -0.040181487634110384, -0.04193912931106033, -0.04467171053295017, -0.0451392245636954, -0.0451339178895979, -0.04472768294806369, -0.04405890649736998, -0.04337421815598758, -0.043018340205243026, -0.043012049351105565, -0.04320767012260687, -0.04351472623982401, -0.04388565947288009, -0.044287300888710426, -0.04469828938296477, -0.04509989436113371, -0.04546735656437459, -0.04576920660704229, -0.046015314952377005, -0.0462240402405635, -0.046365166633289, -0.04645605314918964, -0.04653288006898395, -0.04671797254318854, -0.047083065928941445, -0.047499086276526596, -0.04775948592382151, -0.04760816383732132, -0.04684604980216389, -0.04528031292097421, -0.042713584121938375, -0.03901834478488894, -0.03437040460126495, -0.029007852787020488, -0.023063730192226194, -0.016477168880098158, -0.009110509560628765, -0.0006961191116058339, 0.008415882155061297, 0.017493788088880306, 0.0256882263052477, 0.03262292188114894, 0.038527456799912985, 0.043673453822447875, 0.048200840390853456, 0.052103418303398236, 0.05536649359694452, 0.05799425887866476, 0.05999204270504046, 0.061335023500993, 0.06208147687741848, 0.062377217603170776, 0.06237415287184756, 0.06222841755769565, 0.06215264275945922, 0.062380710298768946, 0.06286144243604938, 0.06339111033180013, 0.06384324092559748, 0.06411876149201601, 0.0641076809141402, 0.06376331251328596, 0.06315447942297686, 0.062348272665749424, 0.06139278392606334, 0.060344746708086136, 0.059241546973631994, 0.058050941459205974, 0.05670370870088394, 0.05514342384033382, 0.05331838468269414, 0.05116499737970429, 0.04880750528421766, 0.0459144495591565, 0.0426806821934551, 0.03908522064104863, 0.0350946692663439, 0.030604159604929848, 0.02533364258248545, 0.018772596766888625, 0.009759473873716984, -0.00404696600042991], [-1.054613963720178, 0.8610460920260787, 0.31333322151896725, 0.03397673714180107, -0.012938687708860567, -0.015546259166158193, -0.01700341795515043, -0.019611513549386003, -0.024770739835784834, -0.03281058292115555, -0.04259590544654223, -0.053173350520733895, -0.06392493836034452, -0.07444700231806113, -0.0844966645782503, -0.09391945593442005, -0.10258172789508888, -0.11030495148130051, -0.11675806491997612, -0.12144938227306318, -0.1264158928168509, -0.12776344456352723, -0.1277835142506375, -0.12667840071076683, -0.12483821514807998, -0.12295961897805041, -0.12201220550434227, -0.12205343067768623, -0.12266298347332959, -0.12358699744244188, -0.12469213643098909, -0.12588665128426574, -0.12711059525736115, -0.12831151596237111, -0.12942032969479852, -0.13034947378887368, -0.1311217832918012, -0.13177538343300887, -0.13226304827595578, -0.13261962130841937, -0.13294750310024972, -0.1335930903590646, -0.13475951684198959, -0.13608363562817702, -0.13698379279429534, -0.13673309345237247, -0.13476520013868298, -0.13052944908253325, -0.12345943171744307, -0.11318323594304819, -0.1000055419681302, -0.08477592706239298, -0.06787325234635858, -0.04913092875314781, -0.028167748297421705, -0.004230034194598691, 0.021691993520975773, 0.04752584478211224, 0.07086742988499434, 0.09064961251379634, 0.10751765227425132, 0.12223630243431625, 0.13519636202174917, 0.14637809620630532, 0.15573925358826204, 0.16329141522125887, 0.1690497408737561, 0.17294471964922584, 0.1751421861646952, 0.17605491281780963, 0.17611270122261935, 0.17575710022459315, 0.1755889159078674, 0.17627132496603565, 0.17766300413678898, 0.17918900470173676, 0.18049236800151047, 0.18129345059142293, 0.18128162211246587, 0.18032393965708832, 0.17861465194557133, 0.17634344034353888, 0.1736467475678775, 0.1706884906955886, 0.16758311217117122, 0.1642332541869771, 0.16043084503082275, 0.15602375495590073, 0.15086670897863722, 0.14478083878411038, 0.13788376888766696, 0.12978675803779607, 0.12074482551991378, 0.11070867627291876, 0.09960070219903744, 0.08715911224938391, 0.07266406902812952, 0.05458703563515416, 0.03059077553923968, -0.005079339634003193], [-0.5797499211983311, 0.47677506545965465, 0.15953590139042917, 0.01409591604234637, -0.022811181664856607, -0.02381603898136546, -0.024280485849653914, -0.026428899080389517, -0.03170197999585239, -0.04040848181702582, -0.051224422447640375, -0.0630455802350941, -0.07513705145447601, -0.08701736851700434, -0.0983953212400415, -0.1090846936022486, -0.11892552595034937, -0.12770860065077844, -0.1350469708891767, -0.14036307785711882, -0.14532078410294305, -0.1468765223121331, -0.14690912512693965, -0.1456508321590966, -0.14354968429428958, -0.14140617962632632, -0.14033329804856293, -0.14039672380666746, -0.14111263672101346, -0.14218979566389614, -0.14347526380367276, -0.14486414595266106, -0.14628766719999997, -0.14768568140473476, -0.14897904055183117, -0.15006749275602968, -0.15097590320716167, -0.15174434213198756, -0.1523289208071076, -0.15276581390614957, -0.15317273944300702, -0.1539479586724419, -0.15532501856615205, -0.15688704063884257, -0.1579661623577029, -0.1577229096119585, -0.15550864168614706, -0.15068914559190394, -0.14261140231796846, -0.13084491146726396, -0.11568750034998421, -0.09816349022468526, -0.07870945680086491, -0.057135827354905314, -0.03300684973767341, -0.005457052717306861, 0.024376865427538173, 0.05411320556803884, 0.08098911373586928, 0.10377607697750003, 0.12321287368587448, 0.14017569457596943, 0.15511435874484267, 0.16800631791600998, 0.1788029002524833, 0.1875173720425037, 0.19416720784695266, 0.19867269314953565, 0.20122418360765662, 0.20229572487807537, 0.20238133344014483, 0.2019884900223293, 0.2018075827247339, 0.20260145223288217, 0.20420930723477515, 0.20596840543750009, 0.2074709960939147, 0.20839577487897776, 0.20838584825542056, 0.2072879599732208, 0.20532509328145648, 0.2027152182066235, 0.1996152550524898, 0.19621452095023476, 0.19264687851973325, 0.18879869555729822, 0.18442747241905932, 0.17936039293474304, 0.1734307520749953, 0.1664332389305195, 0.15855747638476655, 0.14927078161274965, 0.13889867387363874, 0.12738554754548698, 0.11464421828368149, 0.10038201403698507, 0.08378698675847521, 0.06342271100104034, 0.039373501792148755, 0.002863511742108774], [-0.23448954344955272, 0.16583878929398976, 0.0052601039476532245, -0.03660187905648791, -0.039052972117777036, -0.03775598524082886, -0.03678344857875179, -0.038403970036391344, -0.04422070781251988, -0.05453367440660372, -0.06764507324571005, -0.08214874030566617, -0.09708435798108977, -0.11182100476722368, -0.12597518642581354, -0.1393004308855135, -0.15158643915837977, -0.16256366845425294, -0.171734894340631, -0.17835431639209112, -0.18365161314629305, -0.18562629143335463, -0.18567977238375008, -0.18410515079393414, -0.18146811834567309, -0.17877987280319296, -0.1774395930288589, -0.17753574094469785, -0.17845574212151236, -0.17983197477612356, -0.18147148407338248, -0.1832429123215915, -0.18505935915211413, -0.18684493978636063, -0.18850001813182032, -0.1898984714373547, -0.19106991904355936, -0.19206012824555774, -0.1928270195386006, -0.19341123674981395, -0.19396136039036288, -0.19498037909652147, -0.19676337599399574, -0.1987846122784901, -0.20020129090609448, -0.1999562342432458, -0.19722490511143176, -0.19120405023538842, -0.18106559104104666, -0.16626151437050535, -0.14710041190140463, -0.12493799689474769, -0.10032788084627711, -0.0730330012444461, -0.042505515553160116, -0.007652390196794662, 0.030090549957271905, 0.0677168081326425, 0.10173423934420979, 0.13058696751468235, 0.15520512843473955, 0.17669519339036807, 0.1956240713738026, 0.211962967778179, 0.22565011570844007, 0.2367021202394522, 0.2451410249517267, 0.2508662809780398, 0.2541186418681043, 0.2554972554324993, 0.25562655597842765, 0.2551478104451233, 0.2549330512401657, 0.25594676178730985, 0.25798700760830034, 0.2602199067462207, 0.26212751265454254, 0.26330401399018766, 0.26329855960802007, 0.2619172242317508, 0.2594416601815499, 0.2561472707314949, 0.2522324897974594, 0.24793775326864806, 0.24343526664717513, 0.238579296612394, 0.23305911352364092, 0.22665895022690924, 0.21916848479208847, 0.21032862937602836, 0.20028048858515168, 0.18857868092995625, 0.17514480492390544, 0.16070715748017483, 0.14476818213720655, 0.1269898923936548, 0.10641358267750328, 0.08139984863875857, 0.049246867055528644, 0.003259078601665281], [-0.15246479161774737, 0.08068596310856445, -0.01058311182334464, -0.043421161449735624, -0.0441861523028052, -0.04200108177137501, -0.040480308770008216, -0.04182448040019901, -0.04764214949591153, -0.05821840054586571, -0.07176757100626856, -0.08681384324705912, -0.10234151035539413, -0.11768270725729822, -0.13243089742864933, -0.1463244147257732, -0.1591404330465106, -0.1705950616633474, -0.18016501733547072, -0.18706425973101545, -0.19229908332087856, -0.194361972022473, -0.19441584608168028, -0.19276701587521267, -0.1900071132058751, -0.1871942861612447, -0.18579872459978097, -0.18590687638451997, -0.1868772404668635, -0.18832522427790296, -0.19004896106895214, -0.19191104191464076, -0.1938205768143304, -0.19569819574614616, -0.19743968205166046, -0.1989131383451948, -0.20014897048274732, -0.2011935023008387, -0.2020069530488563, -0.20263022644789708, -0.20321884503960227, -0.20429946564424734, -0.20618123741164815, -0.20831411230824393, -0.2098159587785334, -0.20957959544997168, -0.20674133581616655, -0.20045953362873956, -0.18986620754631534, -0.17438627006648266, -0.15432102389218305, -0.13111438047634164, -0.10534109494985819, -0.07675348289777816, -0.04477866979291929, -0.008272426402147275, 0.03126396751945828, 0.07067859574464906, 0.10631483355973242, 0.1365436329757253, 0.1623387579906801, 0.18485841700738556, 0.20469544353862715, 0.22181934625211008, 0.23616536964682971, 0.247750869931903, 0.2565989391253152, 0.26260437672558823, 0.26601941962901454, 0.2674714700078, 0.2676143392307945, 0.26711946945150994, 0.2668999060517981, 0.2679657111612016, 0.27010576154649607, 0.27244705626498517, 0.2744473620384244, 0.2756818403483671, 0.2756784717884606, 0.27423412687520765, 0.2716436777853564, 0.2681954770234862, 0.26409734239143284, 0.2596014128907532, 0.25488898105679, 0.24980676689243406, 0.24402803514773724, 0.23732770699208844, 0.22948567141467768, 0.22021104704954253, 0.209104883062288, 0.19688981521879548, 0.1832605026464582, 0.1681547670247235, 0.1514759144330977, 0.13287019903126623, 0.11133395560320325, 0.08515105326545955, 0.051492200845446576, 0.0033327673969899716], [-0.11377021131835013, 0.03474718408165143, -0.021420156094463575, -0.04817954888128667, -0.047796488669756124, -0.045000323921841424, -0.043101881558425204, -0.0442609101706538, -0.05009362663669717, -0.06087564065246573, -0.07475694067886722, -0.09021054866398157, -0.10618046548655545, -0.12197197572964355, -0.13716182071368868, -0.15147732357804336, -0.16468656261087167, -0.17649515838165789, -0.18636075898155888, -0.1934679328481572, -0.19864924424068528, -0.20078493208443607, -0.20084529782034902, -0.19914677909990333, -0.19630056105569083, -0.1933998031170178, -0.19196294113805318, -0.19207944415490338, -0.19308649102481676, -0.1945869382043541, -0.1963723386759659, -0.19830081430143917, -0.20027852712077898, -0.20222352945025632, -0.20402821840744437, -0.20555643152642586, -0.20683918963457412, -0.20792331430210229, -0.2087704961918643, -0.20942192171747304, -0.21003824798601917, -0.21116358710991412, -0.21311743636459726, -0.21533178429713984, -0.21689548105583825, -0.21666449153744077, -0.2137462829244743, -0.20727093779295688, -0.1963463770796435, -0.18037182098413454, -0.1596443278566588, -0.13566380387673882, -0.10902958711814202, -0.07948612522357963, -0.04644214866534903, -0.008715805019927048, 0.032141635120145506, 0.07287355608241615, 0.10970208344949402, 0.14094422230620124, 0.16760591557670743, 0.19088354347562983, 0.21138907233784285, 0.22909077078479087, 0.24392168215517462, 0.25589971771165493, 0.26504874127836386, 0.2712601189085051, 0.2747945478938874, 0.2763002584419353, 0.2764527243392335, 0.2759456314433074, 0.2757222578751155, 0.2768262507844399, 0.27903968995189277, 0.2814607292184601, 0.2835292275929158, 0.2848063178797079, 0.284804374969685, 0.2833134899065868, 0.28063828248609374, 0.2770766514528737, 0.2728433296552545, 0.268199062628294, 0.26333178981253463, 0.2580827050880197, 0.2521133480535523, 0.24518473024850046, 0.2370729817433097, 0.22749902753082632, 0.21622629518493583, 0.20358522586520303, 0.18948761482363985, 0.17386776251237152, 0.15662480148683872, 0.13739245755479973, 0.1151330487162197, 0.08807255190392194, 0.053286999412602225, 0.003531324012520084], [-0.09611015498074384, 0.01040277164944418, -0.02832408986726012, -0.05133619319031811, -0.05022831935974327, -0.047037863776297255, -0.04489518380349262, -0.0459413204642418, -0.051802610626610804, -0.06274959460145733, -0.0768856502525559, -0.09264655823013801, -0.10894746923723107, -0.1250744718066572, -0.14059238290759027, -0.1552206937776407, -0.16872099117868858, -0.18079132174358428, -0.1908755405494987, -0.19813702350558607, -0.20331786572524999, -0.2055062100116235, -0.205570471895863, -0.2038346516416994, -0.2009243716880571, -0.1979585313610933, -0.19649096766671903, -0.19661315256321063, -0.19764659998991552, -0.19918498183650316, -0.2010150240898493, -0.20299156873989627, -0.2050186130069902, -0.2070123111924091, -0.208862578788629, -0.21043011872877523, -0.21174646094863805, -0.21285891657511502, -0.21372999552164554, -0.21440122294673625, -0.21503705377352395, -0.21619443603141786, -0.218200373624985, -0.22047355107966354, -0.22208151690002706, -0.22185323135213875, -0.21887655954859808, -0.21226053244017876, -0.20108561749764767, -0.18474203416175267, -0.16352506836174482, -0.13897766243838802, -0.11171314941332015, -0.08147012704144262, -0.04764377848789824, -0.009024670518705256, 0.0327992970433854, 0.074494859355903, 0.11219537147260941, 0.1441783979013761, 0.1714735020904722, 0.1953050498660945, 0.2162990444569435, 0.2344228531503029, 0.24960791636284632, 0.2618725548330676, 0.2712411980590325, 0.2776026942859186, 0.28122393456803607, 0.28276840366778483, 0.2829274357231248, 0.2824110048619642, 0.28218452947850287, 0.28331623698218467, 0.2855832034009764, 0.288062450146145, 0.2901807175412116, 0.2914888613279594, 0.2914878258339696, 0.28996274387487886, 0.28722537694789885, 0.28358061555211833, 0.2792482537357472, 0.27449531487517576, 0.2695145429781438, 0.264143129724119, 0.2580276197988025, 0.25093391022933215, 0.24263026712413027, 0.23283055659265134, 0.22127479691947324, 0.20834179316059317, 0.1939168567580264, 0.1779336564957416, 0.1602891904883295, 0.14060881386034765, 0.1178300543133253, 0.09013515546243203, 0.0545328283271281, 0.003605820171735612]], [[-0.00369074145444009, -0.004100105932992471, -0.004569346405350768, -0.005428022783000711, -0.00837501843490931, -0.11458658707506407, -0.6929237128086033, 0.21416582836999692, 0.09093844701838753, 0.010960807455578297, 0.004582627122575206, 0.004042539646003224, 0.0036787695744407035, 0.003326009742512016, 0.002940914252821344, 0.0025178261099417175, 0.002066964536071796, 0.0016091546978041684, 0.0011698548098809606, 0.0007737611877976062, 0.00010357433812924689, -7.145187068098687e-05, -0.00015047773461267344, -0.00013801783817904903, -4.959375956337645e-05, 8.223010342656997e-05, 0.00020482126744319289, 0.00029256365047640166, 0.0003657064923851808, 0.0004404181024430253, 0.000526985260406989, 0.0006367754942445141, 0.0007774302943134981, 0.0009536859439037239, 0.0011726688967136631, 0.0014438424069311878, 0.0017750410926620237, 0.0021737103657859976, 0.0026477399955112885, 0.0032014056308329584, 0.003835443125252818, 0.004540956040953337, 0.005310266268814176, 0.006175777728373147, 0.00720419119892941, 0.008461350609999552, 0.009978695165428753, 0.011774071875624292, 0.013847338066793046, 0.016164672826753226, 0.018622386519030934, 0.021088668435881152, 0.0234695791588795, 0.025757078464326913, 0.0280024858419607, 0.030293510519059857, 0.03259494656507865, 0.034753268722211066, 0.03658798109670162, 0.03799192523781815, 0.039004928385201316, 0.039713171544508256, 0.04018072935920273, 0.04043666567334046, 0.0404889021756015, 0.04035057375145413, 0.04003488985377676, 0.039548833484788486, 0.03890731986920486, 0.03814779848753732, 0.037318793947841794, 0.036468888990056327, 0.03566610043909209, 0.03496991733588206, 0.03436238659635231, 0.03378451219461353, 0.03319521428480212, 0.03255850667972696, 0.03184921595778519, 0.031055973763783162, 0.03019788051246529, 0.029294815358990575, 0.028361661810425657, 0.027418875237894314, 0.0264733150473864, 0.025501971265385084, 0.024480987165709543, 0.023392666697409463, 0.022218668616027257, 0.020937460655826086, 0.01948881067114833, 0.01794225264914732, 0.01626578135708282, 0.014442171357269046, 0.01244191939109315, 0.010220852102328181, 0.007687185921645518, 0.004672562308361589, 0.0009769566095762692, -0.0024037387396177415], [-0.0025971715306504295, -0.0026849619314736873, -0.0027453678882322636, -0.0028842297440259627, -0.003654859708994468, -0.03807461582495937, -0.10185376791910936, 0.031284269424314025, 0.013688801385343435, 0.004057572245685001, 0.002170209930169025, 0.0021088325319642202, 0.002033689126684417, 0.0019015661636865716, 0.0017098598647544436, 0.0014680468996572868, 0.0011907958612672107, 0.0008975243347243902, 0.0006105920938885083, 0.0003519255168404216, 3.142517575375451e-05, -9.204856131427814e-05, -0.0001467257224935051, -0.0001357522722619981, -7.031514060523588e-05, 2.594828071921131e-05, 0.0001148589760700761, 0.00017821552660279082, 0.00023086479743229503, 0.00028449261223924656, 0.0003465775553252963, 0.0004254254265734863, 0.0005266260509897117, 0.0006536377579186485, 0.0008116486286851126, 0.0010075451368571793, 0.0012470116635434833, 0.0015354490478967713, 0.0018785881730056142, 0.0022795139139358536, 0.002738709157956479, 0.0032496166750324725, 0.003806623518959195, 0.004433362491554056, 0.005178471918539496, 0.006090228707609882, 0.007191801651892775, 0.008496492212855412, 0.010004584818896559, 0.011691868495529341, 0.013488507661607788, 0.015292854291522417, 0.01703622595595866, 0.018712525423882558, 0.020358865906642768, 0.02203918800215031, 0.023727636441966526, 0.0253118734154139, 0.026659862972788165, 0.027693240694915168, 0.02844108367920988, 0.02896604244862682, 0.02931478807231663, 0.02950838112094103, 0.02955255613489789, 0.029456874953143357, 0.029230974489049866, 0.028879972989709166, 0.0284148388977558, 0.0278629646310375, 0.027259794286765768, 0.0266408205076586, 0.02605574339453725, 0.025548128443853044, 0.025104958159768508, 0.024683176479911785, 0.024253213433142788, 0.023790526564700935, 0.02327297304218022, 0.02269375148006992, 0.022066917497033847, 0.021407037989978943, 0.02072500837415103, 0.020035818859390937, 0.019344605809774693, 0.01863465013014047, 0.017888597045997368, 0.017093596232034592, 0.016236334405221098, 0.015301177334201787, 0.014264388917214918, 0.013148590133845004, 0.011941639662403929, 0.01063277218990824, 0.009204300729680977, 0.007629167992179054, 0.005850508513539038, 0.004063192400133837, 0.0018795180884597297, 0.00040637621135307535], [-0.0024904801351337564, -0.0025270541462848483, -0.0025208426982371497, -0.0025433689315160018, -0.0029725546677344854, -0.02639210094867807, -0.049725527446272004, 0.015128368847584596, 0.003768946246034694, 0.0019259079638502374, 0.0018303649093980793, 0.0018472653938581209, 0.0018181981421816526, 0.0017191051425954217, 0.001554121612139589, 0.0013355340125232233, 0.0010791858521634122, 0.0008048292810532557, 0.0005349621590474509, 0.000291691180076311, 2.0278438069250977e-05, -9.819622206573053e-05, -0.00015040539880720123, -0.00013935846479306156, -7.584564753417727e-05, 1.7295083786971505e-05, 0.00010318172632397865, 0.0001643188758258945, 0.00021508552545366772, 0.000266760711523602, 0.00032657280087264616, 0.0004025592484159614, 0.0005001307687044245, 0.0006226334359262741, 0.0007750833791409287, 0.0009641381838466789, 0.001195289407239823, 0.0014737544165664622, 0.0018050711892843596, 0.0021922159657326895, 0.002635643492228245, 0.003128995350485307, 0.0036668392839028408, 0.004272034614307713, 0.004991625982264443, 0.005872368877289283, 0.006936728750273921, 0.008197637155060437, 0.009655458316360223, 0.011286878086252247, 0.013025673948663576, 0.014772259547477904, 0.016460161235356315, 0.01808342781717258, 0.01967788555378515, 0.02130537603456993, 0.022940849175140773, 0.024475559267936944, 0.025781700760965393, 0.026783425473770484, 0.027508865792633945, 0.0280185751978544, 0.028357683540808466, 0.028546530847655502, 0.028590654132773466, 0.028499298228356968, 0.028281785329735215, 0.02794307199650954, 0.027493788437925704, 0.026960448844588532, 0.026377349685009554, 0.025778835794692964, 0.02521300222415804, 0.0247220296665397, 0.024293344116393906, 0.023885292016363455, 0.02346936072715651, 0.023022201650596923, 0.02252152888652258, 0.021961105358378467, 0.021354555401337044, 0.020715984896403822, 0.020055941971243416, 0.019388942668745534, 0.018719985903427754, 0.018032914121135373, 0.01731095073599875, 0.016541678788200162, 0.015712235254273236, 0.014807513575664196, 0.013809185982134336, 0.012732689814291364, 0.011590870105117642, 0.010340313101751342, 0.008982135275540586, 0.007494408150370247, 0.00583099971185621, 0.003922906640781182, 0.001818372396548116, 0.0003950191150990232], [-0.002395156698854377, -0.0023827676629113548, -0.0023127210680736845, -0.0022238626594233836, -0.0023271388727930655, -0.015271040064859014, -0.016695174531982215, 0.004874128669816545, 0.002261987375494294, 0.0014246211861394951, 0.0015098606058136569, 0.0016017963961401887, 0.0016167887281319337, 0.0015490637678613243, 0.0014092239799392621, 0.001212281509215418, 0.0009752492039510092, 0.000718254321425988, 0.0004639891964405099, 0.0002347943717839545, 9.656170357051442e-06, -0.0001043569901423166, -0.00015434621694386153, -0.00014319834968819909, -8.135341164031757e-05, 9.053325068538112e-06, 9.228041246968947e-05, 0.00015146042925778295, 0.00020056390613815142, 0.00025051136531504804, 0.00030831145254883334, 0.0003817667725282756, 0.0004761314130440429, 0.0005946531600390402, 0.0007421972824306162, 0.0009252204998903063, 0.001149044829146558, 0.0014187262980358798, 0.0017396333935848917, 0.002114646513833006, 0.0025441947037687374, 0.0030220924254927236, 0.0035430655024035374, 0.004129295470715483, 0.004826430303599014, 0.005679897254007893, 0.0067115500888221165, 0.007934001745845255, 0.0093476938997015, 0.010930107094036726, 0.01261829698665511, 0.014314376964389046, 0.015953805587928235, 0.017530755110164376, 0.019079858819059374, 0.020661123445229142, 0.022250209930199594, 0.023741535745776764, 0.025011024297137044, 0.02598503130583838, 0.026690840554022058, 0.02718733813460297, 0.02751813476861471, 0.027702949339284744, 0.02774714605491661, 0.027659691886846003, 0.027449633537242307, 0.027121786041496856, 0.026686475229105836, 0.02616943823044808, 0.02560396609727684, 0.025023398575101937, 0.024474425668007588, 0.023998020356534942, 0.023582011591612547, 0.023185978367917238, 0.02278234227298232, 0.022348833978690974, 0.021862968949554716, 0.02131903097677515, 0.02073026592652673, 0.020110376860834243, 0.019468477702723013, 0.01881974743116174, 0.018169164212497164, 0.017501015858223546, 0.01679902886216978, 0.016051172567966215, 0.01524499234511429, 0.014365865474404679, 0.01338619369011697, 0.012348664144242126, 0.011228486626509618, 0.010016973520838031, 0.008700294800586355, 0.00725719746936376, 0.005642266484606958, 0.0037899368030209447, 0.0017458826978696952, 0.00037045922089033154], [-0.0023723636219905734, -0.002345413473099958, -0.0022562592012497075, -0.0021341368088140357, -0.0021409173114844307, -0.012003727957971796, -0.010317348432434882, 0.0028883042265917705, 0.0018192863855739795, 0.001279103969430686, 0.0014181989392589387, 0.0015326170612835733, 0.001560721102824508, 0.0015021509458234886, 0.0013694529432342617, 0.0011784827187682429, 0.000946639256265293, 0.0006942073644694293, 0.00044398920625518485, 0.00021844603121149692, 6.525559906005391e-06, -0.00010642518521733555, -0.00015587029657455618, -0.00014466687369408458, -8.317496851885514e-05, 6.62788647810225e-06, 8.925670054258912e-05, 0.00014799171226584191, 0.00019671429623495357, 0.00024626364021266206, 0.00030359926806227533, 0.00037647199519955083, 0.0004701014856508428, 0.0005877138101089563, 0.0007341406325038024, 0.0009157938796813455, 0.0011379574676816404, 0.0014056511470353784, 0.0017242054256372777, 0.002096534972710235, 0.0025230116411920655, 0.0029974821198470395, 0.00351470406569348, 0.004096701531831852, 0.004788805767645501, 0.0056361444683811065, 0.006660428589391541, 0.007874195630504364, 0.009277903147102355, 0.010849213476923419, 0.012526018479881038, 0.01421072479555995, 0.015839186442174663, 0.017405576222073758, 0.018944324686115878, 0.02051504164830748, 0.022093649792282923, 0.023575323368747306, 0.024836827570039518, 0.025804905762185394, 0.026506549285645956, 0.02700023220686155, 0.027329275789936394, 0.027513294826748556, 0.02755761757315364, 0.027471149847908796, 0.0272628779814325, 0.026937585156711023, 0.02650550412869221, 0.025992281667374825, 0.025430901075321057, 0.024854472100865412, 0.02430937445742384, 0.023836325299857502, 0.02342327331802165, 0.02303007427655236, 0.02262935636935919, 0.02219911242654983, 0.021716740505386987, 0.021176315831652383, 0.020591152355782533, 0.019974917788093793, 0.019337814761111675, 0.018693880247107372, 0.01804799772581893, 0.017384615987445784, 0.01668758914928091, 0.015944978272112345, 0.015144419523943116, 0.014271393077989454, 0.013302677683553065, 0.012271704510921154, 0.011158613051072977, 0.009954755699671355, 0.008646586999716094, 0.007212905418946915, 0.0056085072042733886, 0.0037682423264629988, 0.001737426401688433, 0.0003704925838193777], [-0.002359496550003584, -0.0023234437637467643, -0.0022223138666933213, -0.0020793623968754535, -0.0020259262708858467, -0.009970533221106687, -0.007159831638114849, 0.0019029800671490171, 0.0015436481991141745, 0.001189020961097729, 0.0013618066988945077, 0.0014903209947720619, 0.0015266238053086975, 0.0014737334122225528, 0.0013454164828189182, 0.001158064107822345, 0.0009293262044757415, 0.0006795975126513337, 0.0004317617838467846, 0.00020836845032115163, 4.5755604595983285e-06, -0.00010777679061549101, -0.00015691062673178758, -0.00014566612225258484, -8.435934924832839e-05, 5.118025207090081e-06, 8.74207536818983e-05, 0.00014591165821977063, 0.00019442441649243655, 0.00024375365987087556, 0.0003008322388468822, 0.00037338308361253495, 0.0004666073619761172, 0.0005838164732412795, 0.0007297365992704373, 0.0009107423878881987, 0.001132090994565965, 0.0013987800796207961, 0.0017161179431839035, 0.002086951975859717, 0.0025117045978867766, 0.0029842539127779774, 0.0034993746035809972, 0.004079000729136522, 0.004768293720466937, 0.005612223728524378, 0.006632431030768305, 0.007841420212451756, 0.009239665771934105, 0.010804936779567396, 0.012475614994939094, 0.014154234144554073, 0.015776861951840894, 0.017337675250913488, 0.018870966138977565, 0.020436133351399228, 0.022009223942665652, 0.02348580552749768, 0.02474308770642294, 0.025708035235544702, 0.026407499870730135, 0.02689971824913429, 0.027227869118253048, 0.02741164994269311, 0.027456250380874916, 0.027370522837976533, 0.027163408437218286, 0.02683966513942628, 0.02640948267219219, 0.025898311230849475, 0.025339104190144904, 0.02476486553682576, 0.024221814368738766, 0.023750528533525696, 0.023339004111550796, 0.02294724331897289, 0.022547642225180572, 0.02211897137377871, 0.021637841063555555, 0.021099065870824784, 0.020515790714615033, 0.01990159310439943, 0.01926662577561638, 0.018624868250596883, 0.017981181321586215, 0.01732006660139205, 0.0166254358800431, 0.015885393461993882, 0.015087620564346768, 0.014217650733040495, 0.013254705405507059, 0.012227623483793394, 0.011118721870649849, 0.009919381512489117, 0.008615961253061612, 0.007187440307175434, 0.005588757957179838, 0.003754967793045388, 0.0017311415397535392, 0.00036835936919931626], [-0.0023523313337644363, -0.002310875777421715, -0.0022026273675917747, -0.0020473011932274562, -0.0019581603690721774, -0.008766602078917532, -0.0055893996557876795, 0.0014118971834445556, 0.0013802975933516516, 0.0011358548824598044, 0.0013286459866383197, 0.0014655411786382666, 0.0015067110324588713, 0.00145717704328212, 0.0013314319343889264, 0.0011461874112093876, 0.0009192455905871415, 0.0006710703682500767, 0.0004245983383956121, 0.00020243561923758975, 3.4205675232794886e-06, -0.00010859907241988859, -0.00015755801477309456, -0.00014628695729516447, -8.507792195342333e-05, 4.224036357281055e-06, 8.634958546551406e-05, 0.00014470724284012192, 0.00019310512135920443, 0.0002423135542379468, 0.0002993640944306169, 0.00037186048076220913, 0.00046498435274600286, 0.0005819396405956524, 0.0007275258355611842, 0.0009081132330631939, 0.0011289519234460232, 0.0013950306757851934, 0.0017116483382368668, 0.0020816473780365476, 0.002505449620197387, 0.0029769455629678173, 0.00349091731793739, 0.004069250121049552, 0.00475701376818842, 0.005599094174606211, 0.006617094073359262, 0.007823500902234817, 0.009218799099078415, 0.010780816001470121, 0.01244821039192567, 0.014123570847002397, 0.015743081582549737, 0.017300921923295586, 0.01883130836404554, 0.020393524583507665, 0.0219636791338332, 0.023437547918805923, 0.02469257804246978, 0.02565585777762259, 0.026354317293237724, 0.026845940233371206, 0.027173821375768386, 0.027357466158000356, 0.027402162763498737, 0.027316756484559824, 0.02711017528862483, 0.026787169668683147, 0.0263579144476067, 0.02584781365365661, 0.02528975702284487, 0.02471668455966405, 0.024174725691611647, 0.02370438155133036, 0.02329367251754269, 0.022902255761565446, 0.022503313792971814, 0.02207538901887373, 0.02159511697983029, 0.02105731779833498, 0.020475110889128723, 0.01986204953332153, 0.019228265235943495, 0.01858770899274796, 0.017945230723342157, 0.017285361522796937, 0.01659204486638729, 0.015853408690239153, 0.015057158616992751, 0.014188856894664587, 0.013229359973371282, 0.012204300500498682, 0.01109756719427973, 0.009900565432923242, 0.008599830828282641, 0.007174119428337066, 0.0055784969892030125, 0.0037481743386540245, 0.0017280913841280533, 0.0003675242164682017]], [[-0.0001664148926006841, -0.00022174771059010228, -0.00026020245796267187, -0.00028541838018169126, -0.0003050178606518305, -0.00034173869263343266, -0.00047243633136250434, -0.004065985749198655, -0.037312888540013744, -0.09837215139062186, 0.18024521275813588, 0.05096778458549444, 0.013186096516882897, 0.0036668273155852837, 0.003378778640407113, 0.003212918943706831, 0.0030787107620361283, 0.002954292544742774, 0.002834992213157443, 0.0027198681465045063, 0.0024685614949536056, 0.002429900089495981, 0.0024202926798785438, 0.0024404247238083744, 0.0024879585428125243, 0.0025560308488713295, 0.0026313925743215354, 0.0027028943452633686, 0.002775563429173155, 0.0028544993308813205, 0.002943711147151158, 0.00304870507985249, 0.003173167726287243, 0.003319038795717529, 0.0034893526102128636, 0.0036881839610148313, 0.003920527267571617, 0.004191331909538016, 0.004505002626138374, 0.004864489649469284, 0.0052722013638049695, 0.005729494511503625, 0.006236385007599051, 0.00680619653979441, 0.007467940742869193, 0.00824602061625945, 0.009147195338045722, 0.010169930919168986, 0.011301171869677655, 0.01251110832313003, 0.013743010616140219, 0.014931698508837677, 0.016028873426946352, 0.017026823831426903, 0.017949772336440527, 0.018835504599331473, 0.019681935314414884, 0.02043949229584455, 0.021049233017790336, 0.021470265124298265, 0.02171485426474612, 0.021819695593343656, 0.02181554655420845, 0.021720393868057682, 0.02154018078052875, 0.021282804183401616, 0.020956087470305435, 0.020565807658710945, 0.02011738204884479, 0.01961699413105625, 0.019099910805325, 0.018579979472211607, 0.018085785555801818, 0.01763921009233393, 0.017231721001851722, 0.01683964933781099, 0.01644617123444367, 0.01603786578145532, 0.015600277546392852, 0.015131743617363708, 0.014639804288197574, 0.01413254131467606, 0.013616129118854006, 0.013099590473330218, 0.012584560576964474, 0.01205909721601475, 0.011513338912767276, 0.01093962860346026, 0.010329876726769344, 0.009674772174575774, 0.00894002194329661, 0.008167960104667917, 0.0073371585473188256, 0.00643808639699098, 0.0054555883461435434, 0.004368018659725147, 0.0031334404542356967, 0.0016817941526504796, -4.925326690591499e-05, -0.001300979298500914], [-0.00015041418499362215, -0.0001631585871876816, -0.00015202914907205822, -0.00011556211505607903, -5.2880741615848995e-05, 3.025320665433573e-05, 0.00010115240837372272, -0.001469747189352635, -0.007061890922151494, -0.02001583926340892, 0.04075650774732208, 0.011155533559345147, 0.0036079229196669233, 0.0032691216870627125, 0.003182426410178936, 0.003123391432538148, 0.0030542619151856954, 0.0029722385375789942, 0.0028822557309816327, 0.0027892770685706446, 0.002635467731224402, 0.0025986810175085855, 0.0025921809836997258, 0.002616873741851494, 0.0026703597116783887, 0.002745308627557976, 0.002827549978355186, 0.002905435361159345, 0.002984510634216013, 0.0030702710898185288, 0.003167042645110819, 0.003280792951378033, 0.003415526720441063, 0.003573351956300194, 0.0037575556706214283, 0.003972548028745969, 0.004223724228336415, 0.0045164318932830174, 0.004855433965885433, 0.00524391117505746, 0.005684444007405139, 0.006178465801478959, 0.0067260176824480425, 0.007341563286235778, 0.008056515585548854, 0.00889742245028479, 0.009871716803321481, 0.010977862109788893, 0.012201886252089436, 0.013511695491951536, 0.014848004793009092, 0.016138122859759935, 0.01732970503703632, 0.018414301811110926, 0.019417986594490493, 0.020381643048329366, 0.021302851923268442, 0.022127739322748845, 0.022792314602518692, 0.0232523167230254, 0.0235211084583538, 0.023638143983826163, 0.02363684401070953, 0.023536594353977647, 0.023343808673236474, 0.023067024155689512, 0.022714703937232364, 0.02229309231144135, 0.021808315907128128, 0.021271926419396053, 0.020713222371045018, 0.020151033079177268, 0.01961647417270506, 0.019133339381274025, 0.01869239594325992, 0.018267981654324524, 0.017841886537430036, 0.017399582918523088, 0.01692541337123521, 0.016417598846931208, 0.015884417750574475, 0.015334645408563899, 0.014774976984797142, 0.014215180569945057, 0.013657058085890204, 0.013087737780954392, 0.0124965852568631, 0.011875360094156878, 0.01121536026349632, 0.010506565735556028, 0.00972961149473613, 0.00890424662762958, 0.00801834293487695, 0.007063152269413259, 0.00602485689862872, 0.005005390769128296, 0.0037733996618307527, 0.002384519619708957, 0.0009128752147099174, 0.00029687132294273157], [-0.0001439332430595669, -0.00014550409043954007, -0.0001217727662075044, -6.998357118085341e-05, 1.2916464612030479e-05, 0.00012563012014455853, 0.00024736333641743586, 0.0002586004019029512, -0.0014216102401585471, -0.00924503490055611, 0.02153114356025345, 0.008598182288586385, 0.00330856708584594, 0.0031153949280509044, 0.003081941521563202, 0.003051357569163097, 0.003000080618678472, 0.0029302670012272317, 0.002849249101528319, 0.002763434270894583, 0.002637158339692911, 0.0026014313820349674, 0.0025958339268603754, 0.0026213147371619877, 0.002675495900546456, 0.0027510417415509787, 0.0028337664712308618, 0.002912075713436443, 0.0029915620095167773, 0.003077736484849548, 0.0031749388744615596, 0.0032891621766881697, 0.003424430290218778, 0.003582861536468461, 0.0037677565072864196, 0.003983542645879198, 0.004235633838141266, 0.004529396489076554, 0.004869611170722108, 0.005259468139950414, 0.005701551774791643, 0.0061972926799450795, 0.006746737831759987, 0.00736441785080181, 0.008081872002653522, 0.008925784636142754, 0.009903645752356574, 0.01101394224865027, 0.01224268486030222, 0.01355769449600379, 0.014899957085675795, 0.0161959855383399, 0.01739321325014398, 0.018483133016089413, 0.01949188639207472, 0.02046051437043679, 0.021386549581007157, 0.022215854284246852, 0.0228841402658852, 0.02334697235614552, 0.02361778653758935, 0.023736129381017494, 0.02373558390665255, 0.02363559252346175, 0.02344258955594137, 0.02316514333908656, 0.022811749174952347, 0.02238867386861736, 0.021902130774707925, 0.021364873718637236, 0.020804204038937412, 0.02023993955706783, 0.01970336006141201, 0.019218379112024297, 0.01877572814425575, 0.018349633656340063, 0.017921813989002233, 0.017477684038113776, 0.017001522120355918, 0.016491547152212436, 0.015956097947542245, 0.01540399097466018, 0.014841950617209308, 0.014279783878016513, 0.013719307389834002, 0.013147611676864887, 0.012554029897417369, 0.011930206963571196, 0.011267576553836289, 0.010556136101948312, 0.009787435227925436, 0.008967313133756332, 0.00808925986116659, 0.0071458213084603555, 0.00612536450913654, 0.005012810017211888, 0.0037797776131999043, 0.002388699935562386, 0.0009208899561922805, 0.0003075336796085824], [-0.0001377369104146148, -0.00012777836294435672, -9.095627138712042e-05, -2.317176472949741e-05, 8.088519089864918e-05, 0.0002245218035422142, 0.0003991504265859932, 0.0005364161974425173, -0.00028465465602166696, -0.0020306410532408975, 0.008664198133694226, 0.005986794794908241, 0.0030108917127333436, 0.0029673936711505865, 0.002988788561570468, 0.0029874704385964997, 0.0029544471778826607, 0.002896998377900866, 0.0028249570735556758, 0.002746243067498914, 0.0026479571626819116, 0.002613201568945254, 0.0026085166556340223, 0.0026348984727268647, 0.002689983312681616, 0.002766404731385967, 0.0028499124673092516, 0.00292892811336288, 0.003009111602835301, 0.0030960093261589725, 0.00319399018159486, 0.0033090939083837653, 0.0034453780267208844, 0.0036049787813436165, 0.0037912221144960983, 0.004008568505568812, 0.004262469719133064, 0.004558329971748835, 0.00490096444720215, 0.005293584190742394, 0.005738786469990463, 0.006238003978782101, 0.006791289895084329, 0.007413293874357197, 0.008135793834632496, 0.00898570662526212, 0.009970606884563069, 0.011089000505069993, 0.012326832494409436, 0.01365172517564933, 0.015004741605498736, 0.016311320883436047, 0.01751848681647261, 0.018617643437362122, 0.01963509239430326, 0.020612177993959875, 0.02154637471898062, 0.022383086598158203, 0.023057497520818804, 0.023524840008255964, 0.02379867174499977, 0.023918770450691414, 0.023919001994814847, 0.023818933957191885, 0.023625044084798645, 0.023345962283130926, 0.022990246225307785, 0.022564207470092877, 0.02207417023261212, 0.021534173117397082, 0.020969549438715825, 0.020401205516040986, 0.01986069799019477, 0.019372146222678438, 0.018926212868669256, 0.01849692104848303, 0.018065665976503522, 0.017617791702896048, 0.01713749285974835, 0.016623012766647675, 0.0160828256656136, 0.015525829892386761, 0.014958809644836216, 0.014391650102503225, 0.013826191911276396, 0.013249446983568449, 0.012650689344161418, 0.012021620489361156, 0.011353481846522594, 0.01063618846480211, 0.00986014579277245, 0.009033992311371386, 0.008149284153959727, 0.007198499678578756, 0.006169866241971548, 0.005048073109036025, 0.0038043199941470065, 0.0024007786947070854, 0.0009217030139154263, 0.00031670212796738547], [-0.00013572573659774448, -0.0001221901465194265, -8.132241296511326e-05, -8.608762624340409e-06, 0.00010195901819270707, 0.00025511709845587325, 0.0004460768094955082, 0.0006224266451537404, 6.933479395034381e-05, -0.0005761950685617234, 0.006066836181454785, 0.0051709267988860825, 0.0029165099648739653, 0.002919556173690514, 0.002957984089938142, 0.002965762305910653, 0.0029384325850308627, 0.0028848622707760858, 0.0028156554767424964, 0.002739197148612099, 0.002649671209974468, 0.00261523905973531, 0.0026108406604512992, 0.0026374861407187605, 0.002692817673559213, 0.002769463820539596, 0.0028531631199320844, 0.0029323493079577803, 0.003012699752654537, 0.003099768364909196, 0.003197930397269092, 0.0033132363700590648, 0.003449751736445496, 0.0036096169867705754, 0.0037961638793569705, 0.004013860394761259, 0.0042681666889779375, 0.004564495378616371, 0.004907669418330154, 0.0053009043228712995, 0.005746799755132134, 0.00624678816975314, 0.006800924639122843, 0.007423886728625363, 0.008147506820130108, 0.008998757329437423, 0.00998523450187983, 0.01110545106006287, 0.012345340300259114, 0.013672482905996848, 0.015028002453640322, 0.0163370505521664, 0.01754655656536889, 0.01864790227034429, 0.01966742275951605, 0.020646530967092083, 0.021582684870356035, 0.022421179941777343, 0.023097076201235776, 0.0235655306541162, 0.023840130400952224, 0.023960700332142666, 0.023961173222095487, 0.023861143417725342, 0.023667098144131406, 0.02338768109050238, 0.023031464007251742, 0.0226047684480519, 0.022113949160412386, 0.02157343533914184, 0.02100793294632116, 0.020438673630557406, 0.019897280505901498, 0.019407751752376978, 0.018960796111573332, 0.018530408281780368, 0.01809814839830458, 0.01764930129935318, 0.017167999743942286, 0.016652472200433935, 0.01611120371887611, 0.015553106375039693, 0.014984974772890442, 0.01441670981616981, 0.013850153826673013, 0.013272295170933954, 0.012672389348826321, 0.012042123937466481, 0.011372725461590221, 0.010654091707808878, 0.009877910398755988, 0.009050311285288055, 0.008164021255793788, 0.007211498512102289, 0.006180933729511076, 0.0050569576815532626, 0.003810671246981733, 0.0024042329381896562, 0.0009228873178897291, 0.0003234937009087403], [-0.0001344383063520108, -0.00011864246488501948, -7.522134548358741e-05, 6.006512440595243e-07, 0.00011527251286522002, 0.000274433415360761, 0.000475697414649748, 0.0006767407778072741, 0.00029346042078765445, 0.00015243124501733765, 0.004764612503895913, 0.004654070211978235, 0.0028564927567959033, 0.002888969333083541, 0.002938163047117316, 0.0029516921200766644, 0.0029279656822541657, 0.0028768540055294127, 0.0028094475394949197, 0.0027344243751212405, 0.0026504478790034458, 0.002616224238562432, 0.0026120075164758495, 0.0026388166263776706, 0.002694297732981985, 0.0027710770943657165, 0.0028548878199295843, 0.002934172665062947, 0.003014619363949536, 0.0031017859389682457, 0.003200051153402217, 0.0033154716432488534, 0.003452117406549603, 0.0036121313700836683, 0.003798848583554151, 0.004016741252694526, 0.004271274206586713, 0.004567864745892765, 0.004911340179831032, 0.0053049184765477635, 0.0057512005121500434, 0.0062516184239811675, 0.006806228475918236, 0.007429724179805717, 0.00815396866584375, 0.009005966358729243, 0.009993326285693814, 0.011114565660509773, 0.012355612004789372, 0.01368402343077337, 0.015040968607317204, 0.01635142603505412, 0.017562271511795253, 0.01866487374105939, 0.019685585909814448, 0.0206658595459555, 0.021603142484835303, 0.02244266789840222, 0.023119425009780398, 0.02358852827265887, 0.0238635818127561, 0.023984435730780088, 0.023985061172686808, 0.023885067139267403, 0.02369094609678798, 0.023411349448106408, 0.0230548568512933, 0.02262779544716441, 0.022136538552693787, 0.021595760666443854, 0.021029768201904876, 0.02045982213584852, 0.019917666868718254, 0.01942752935221476, 0.0189800445647686, 0.018549159210625867, 0.018116405858853126, 0.017667051896765606, 0.017185213473995216, 0.01666911694073811, 0.016127256326831922, 0.015568553008695142, 0.014999808370582806, 0.014430932747359727, 0.01386376979222805, 0.01328529496566881, 0.012684753723496495, 0.012053826241428037, 0.011383731112238445, 0.010664356907546023, 0.00988861098864951, 0.009056241838910602, 0.008168866569175337, 0.007215211520366881, 0.006183385490817417, 0.005057982685980087, 0.003810025869875759, 0.0024020004974091443, 0.0009226297073097578, 0.00032248540772283186], [-0.0001336635334577047, -0.00011651899777577547, -7.157544063119115e-05, 6.098834515629142e-06, 0.0001232156714884949, 0.00028595310316922417, 0.0004933597815818501, 0.0007091368299992828, 0.0004274539610135995, 0.000517111511083798, 0.004112371304434686, 0.004345035571890352, 0.0028205305206969594, 0.002870576188167937, 0.0029261950567958193, 0.0029431568915304317, 0.002921582773718657, 0.0028719412927707567, 0.002805612743567496, 0.0027314498338715247, 0.0026507903115769674, 0.0026166927214909827, 0.0026125846573600807, 0.002639490231053347, 0.0026950580980931484, 0.002771913478665319, 0.0028557868937156435, 0.0029351270119940104, 0.003015627496280485, 0.003102848569326727, 0.003201170890074462, 0.0033166544686200968, 0.003453371830191847, 0.003613467258135811, 0.0038002776146026694, 0.004018277423245704, 0.004272934053067148, 0.004569667353370207, 0.004913307012294709, 0.005307072315495724, 0.005753564744407587, 0.006254216181421998, 0.006809083599185381, 0.007432869357697875, 0.008157453486848102, 0.009009858285885453, 0.009997700064995606, 0.011119498787106098, 0.012361179170036991, 0.013690287334682036, 0.015048021562511721, 0.016359260437043017, 0.017570850206457593, 0.018674031684569093, 0.019695241970453345, 0.02067595152532451, 0.021613618867256705, 0.022453467357218242, 0.023130472894267815, 0.02359972242252864, 0.023874806014095674, 0.023995800760161706, 0.02399649110861003, 0.023896505912179296, 0.023702341363814966, 0.02342265319645395, 0.023066025501345226, 0.022638788055723457, 0.022147315682539796, 0.02160710918098072, 0.021040726992337916, 0.02047044432909312, 0.019927980953117257, 0.019437564070373815, 0.018989833333670613, 0.018558722567773727, 0.018125755480486595, 0.017676190865791277, 0.017194135221407524, 0.01667780924331856, 0.016135708166959917, 0.015576758082764814, 0.015007763876819308, 0.014438817136078306, 0.013871588552582218, 0.013293043227721893, 0.012692416746947096, 0.012061382734693746, 0.011391153722216251, 0.010671611642064836, 0.009889764904096363, 0.009061081063351052, 0.00817357520459278, 0.007219606639519952, 0.006187337666863358, 0.005061369694339003, 0.003812716302171644, 0.002403833088222328, 0.0009234526213307306, 0.00032252556640483964]], [[-0.004086899341398165, -0.003972271729581582, -0.003833422684790087, -0.0036795577263572746, -0.0035275055000265334, -0.003401208739967655, -0.0033272382398079887, -0.0033203146280486907, -0.0033722314273751533, -0.003409032032146664, -0.0029677227320429444, 0.00047903794753158447, 1.6457757523161032, 2.0236096408181403, -0.1685965337161811, -0.01588354504592226, -0.012008180016022963, -0.011152596563021115, -0.010774480473182071, -0.01053424745351307, -0.009912099446113836, -0.009941976495251385, -0.010013195573267235, -0.010130520794723086, -0.010295216072764823, -0.010503274722324854, -0.010741094552688887, -0.01098758041126809, -0.011248795014462132, -0.01153338761444546, -0.011850123255129944, -0.01221297786369131, -0.012631241333157033, -0.013109209950355466, -0.01365372562002733, -0.014274005120012576, -0.014984032449700287, -0.015797960775117744, -0.016727443717107476, -0.01778099745899105, -0.01896780331332686, -0.02030027631951799, -0.02178555287369354, -0.02345366547227709, -0.025370226476781253, -0.027580642386416745, -0.030085771033843387, -0.03286286342976766, -0.03585593594659697, -0.03896705594848079, -0.04204314454877165, -0.04492356530560115, -0.04748785972367849, -0.04971193616104794, -0.05165516634258617, -0.05340142390982313, -0.05496936700038953, -0.05628222859616808, -0.05724720621670956, -0.05778741508466194, -0.05792283048249738, -0.05773413894294724, -0.05729556591505396, -0.0566574065753558, -0.05583793847116552, -0.0548536296267589, -0.053734747444764565, -0.05249633027801447, -0.051149696910876084, -0.049722595747126674, -0.048258797371201846, -0.04680141155220255, -0.04541305276668948, -0.0441343905205991, -0.04294400500382188, -0.041793039202306814, -0.04064499445125599, -0.039470650960832764, -0.03823879034277026, -0.03694936783321704, -0.035618148334958334, -0.034261886796157846, -0.03289367252800244, -0.03153370680347447, -0.030182738896195115, -0.028810377236020108, -0.027395731513268556, -0.02592184687442651, -0.024370497350391217, -0.022721057212047455, -0.020771275526724208, -0.018853863962618247, -0.016800475434534147, -0.01458529018378071, -0.012167221629944254, -0.009491652512208735, -0.006460466357592588, -0.0028158583625026543, 0.0011823715394687182, 0.003577297673186236], [0.002894812445777423, 0.0028494181728730347, 0.002789655656596182, 0.0027241031485527273, 0.0026672613997602837, 0.002639742292529324, 0.002666330034428615, 0.002769058315992844, 0.002959863248193588, 0.0032195784403313606, 0.0033686612165052966, 0.0025769700770609206, -0.5129967559903895, -0.2796135820647171, 0.028600968631906674, 0.008509780309922254, 0.0073901132046609586, 0.007186689689471919, 0.007109689315875484, 0.007055436566932245, 0.006875313262242781, 0.006908807931492183, 0.006968364067041197, 0.00705790453102206, 0.007178714967144244, 0.007328261506477538, 0.007497389974324815, 0.007672165401108187, 0.0078570687893728, 0.008058155979308514, 0.008281567873513244, 0.008537120992561553, 0.00883135610438272, 0.009167306111675627, 0.009549780579253148, 0.009985248773942447, 0.01048350440375301, 0.01105446192887402, 0.011706291558012073, 0.01244495276847222, 0.01327685074472946, 0.014210644435967888, 0.015251409690292643, 0.016420300750288063, 0.017763322165249305, 0.01931244344229917, 0.02106838662411468, 0.02301531816821469, 0.025114133547049933, 0.027296322066460977, 0.029456194184332957, 0.031479392247538984, 0.03328146734045773, 0.034845442879130016, 0.03621277667641075, 0.03744221760484064, 0.038546559502093236, 0.039471741974123516, 0.040152528544527034, 0.04053516898249024, 0.04063386354602414, 0.04050451583749952, 0.040199606437599754, 0.03975424663557246, 0.03918127990687062, 0.038494378817385856, 0.03771136441307788, 0.03684394362962887, 0.035900256110057434, 0.03489985086991001, 0.033873446795272114, 0.032851299474748054, 0.031877336105105826, 0.030980115028364515, 0.030144604277011617, 0.029336530516165697, 0.028530449370706062, 0.02770592833168603, 0.026841126404906223, 0.025936027149972448, 0.02500172064454633, 0.02404998255882203, 0.023089993295901248, 0.022135898244810093, 0.02118824208034556, 0.020225794120813663, 0.019233990760977652, 0.018201041231474435, 0.017114277508788033, 0.015959362023212617, 0.014668788304771922, 0.013428097397377686, 0.012036282805460598, 0.010548799346646176, 0.00894629806682537, 0.007197794046785197, 0.005276020049727234, 0.0031008482016906514, 0.0009474869747643125, 0.00048495949184287483], [0.002260743122651856, 0.002231832851277496, 0.0021922109547530383, 0.0021489527419386186, 0.002113854326148014, 0.0021036802873308016, 0.0021388758718424565, 0.0022387693789967843, 0.002415925531439143, 0.002661445663459889, 0.002862229455202424, 0.002545378969217545, -0.28136266325596526, -0.10691422299534446, 0.01355403497744008, 0.006144916542446611, 0.0055675922762602244, 0.005482289483079117, 0.0054570223783204485, 0.005435831524421587, 0.0053427698106756185, 0.005371181271826849, 0.005419357121115097, 0.005490461168185367, 0.005585568786471043, 0.005702756686231591, 0.005834963579792118, 0.005971490769359981, 0.006115871866378074, 0.006272823369715925, 0.006447128765333743, 0.006646439262066234, 0.006875855761776967, 0.007137744983285628, 0.007435856323217317, 0.007775231241831578, 0.008163497919169904, 0.00860837900805683, 0.009116239754219472, 0.009691721015413228, 0.010339807086868, 0.011067235660222783, 0.011877974630816105, 0.012788523089492436, 0.01383472309563368, 0.015041506478474409, 0.016409458034996157, 0.017926263489781196, 0.019561484038258994, 0.021261771815677993, 0.022945087520849755, 0.024522016664191, 0.02592676735022226, 0.02714609754402106, 0.028212275373808045, 0.029171060958676852, 0.03003236871222395, 0.030754036962681176, 0.031285209193846086, 0.03158403787348798, 0.03166162228956286, 0.031561393107934474, 0.03132431849823147, 0.030977725265044487, 0.030531624913967933, 0.02999706212341787, 0.029387293439197385, 0.028711654328128073, 0.02797652391568969, 0.027197149976636206, 0.026397470862881252, 0.025601063979074756, 0.024842157470259685, 0.02414300895935425, 0.023491904608953847, 0.022862139005776088, 0.022233915601356815, 0.02159132564434566, 0.020917361714525757, 0.020212013762027484, 0.01948392876656057, 0.018742286267155513, 0.017994089279170754, 0.01725049072692957, 0.016511938772943806, 0.015761937144078475, 0.014989186628287134, 0.014184554655472597, 0.013338236030143249, 0.012439135611669887, 0.011467432731633162, 0.010449312662111765, 0.009365577025100763, 0.00820648070926882, 0.0069568069251477686, 0.005599278217538444, 0.004105221189955269, 0.002423669865784707, 0.000743755169242518, 0.00039620803217078985], [0.001905879391430642, 0.001887106275591429, 0.0018597390091829112, 0.0018300641719992815, 0.0018084299245514587, 0.001809540693963494, 0.0018515652637071814, 0.0019526134342811308, 0.0021260537651854967, 0.0023695800326543363, 0.0026110566106090005, 0.0026019703190519414, -0.13509676424188283, -0.02772245208323422, 0.006503116599118501, 0.004751357112840641, 0.00451918788013304, 0.0045102482110099375, 0.004518794256555803, 0.0045190588068524, 0.0044813578202372905, 0.004507238487720233, 0.004549277265129005, 0.004610227116038597, 0.004691055676423719, 0.004790189119250399, 0.004901749700009631, 0.005016875582668135, 0.00513857491561404, 0.005270812824004996, 0.005417611381602443, 0.005585407847436103, 0.005778496283281703, 0.005998870310635358, 0.006249685057926142, 0.006535181392516657, 0.006861772697022479, 0.00723595214295179, 0.0076630726639637355, 0.008147035287572199, 0.008692026595188345, 0.00930370559261132, 0.009985420633089983, 0.010751062490606264, 0.011630773715840275, 0.012645542520583548, 0.013795879805001836, 0.015071448018149195, 0.016446672215878252, 0.017876712386856206, 0.019292835087191044, 0.020619570856931727, 0.02180159165317988, 0.022827747759998167, 0.02372514901873306, 0.024532269441400766, 0.025257401193336634, 0.025865049869347057, 0.026312419508492668, 0.026564342094017347, 0.026630182733247073, 0.026546359697600726, 0.02634739570697415, 0.02605624781633013, 0.025681339971033123, 0.025232297263985463, 0.024719729531046786, 0.02415167189071955, 0.02353352129256565, 0.02287811558621906, 0.022205591079460983, 0.02153519379531044, 0.0208962590020248, 0.020307517790183468, 0.019759109110421245, 0.0192285649256183, 0.018699285092311353, 0.0181579059752716, 0.01759014005193281, 0.01699599334088073, 0.016382751374810576, 0.015758143473327386, 0.015128189003680525, 0.014502151910534528, 0.013880392067773289, 0.013249021933914428, 0.01259853605686198, 0.011921254456566223, 0.011208931338434949, 0.010452236945083472, 0.009643344589073897, 0.008787098646367623, 0.007875521234667887, 0.006900384944555945, 0.005848813735088639, 0.004706119232469209, 0.0034478487885611663, 0.0020371076922169116, 0.0006245969471531738, 0.00035092451368125125], [0.0018289446633209727, 0.0018125784731887796, 0.0017880934949050607, 0.0017616173359719122, 0.0017431993200446663, 0.001747118576741089, 0.001791085198917484, 0.0018930126388802288, 0.0020665474421351806, 0.0023110067380450365, 0.002564003251920861, 0.002631280314180691, -0.0995685147933163, -0.01465684052695968, 0.0052964962381846495, 0.004433070783316002, 0.004285373439230465, 0.004295343277891095, 0.004312335197228077, 0.004317928603774933, 0.004293752384038666, 0.004319156435982011, 0.004359917928217705, 0.004418703956924034, 0.004496461081747153, 0.00459169301656599, 0.0046987814174609295, 0.004809268565985466, 0.004926049780632361, 0.005052926875881016, 0.005193756456258242, 0.005354712111485611, 0.005539912749541892, 0.005751271044406904, 0.005991813072495061, 0.006265605786579934, 0.006578798549490905, 0.006937617334899184, 0.007347195114264892, 0.007811272094737665, 0.008333861339657411, 0.008920387207159304, 0.009574063856186484, 0.01030821588478237, 0.011151747441287245, 0.012124790632774723, 0.0132278410071647, 0.014450991204507872, 0.015769723980372193, 0.017141048837225586, 0.018499133053563283, 0.019771527094162845, 0.020905176592455617, 0.021889385962430834, 0.022750143241800656, 0.023524338951822293, 0.02421991108724441, 0.0248028125511093, 0.025231997820714808, 0.02547375114291542, 0.025537061954076186, 0.025456820941264238, 0.025266152894189625, 0.024987064501927524, 0.024627634924947347, 0.02419719322253808, 0.02370575428155218, 0.023161077469008907, 0.022568180359677704, 0.021939441729910365, 0.021294198977575392, 0.020651487581276926, 0.02003892922804605, 0.01947448654247038, 0.018948704402186312, 0.01844003997361575, 0.017932577811373848, 0.017413505436999932, 0.016869123860163125, 0.01629943869953319, 0.01571143760978747, 0.015112533148851864, 0.014508497314385008, 0.013908212733809875, 0.013312025180866023, 0.01270662102825084, 0.01208288785199636, 0.011433462699165488, 0.010750439738441135, 0.010024873312305189, 0.009249502638742291, 0.008428321575541992, 0.00755406081083235, 0.006618823686950914, 0.005610246669561712, 0.004514214747063004, 0.003307222584256436, 0.001955776288133393, 0.0005996649957544295, 0.0003391062784370416], [0.001786135118464891, 0.0017711663543510134, 0.0017483478391120838, 0.0017237220625556243, 0.0017071762533759768, 0.001712758819021198, 0.0017579343004530627, 0.00186052573722279, 0.0020343631718258625, 0.0022797209601513498, 0.0025398771234109727, 0.0026523240111364266, -0.07873721237983802, -0.008485840031339668, 0.004711356607396005, 0.004251420248670604, 0.004153457906828413, 0.0041746042468651405, 0.004196605642776839, 0.004205352417139612, 0.0041891249157194835, 0.004214283780782002, 0.004254349331352987, 0.004311941773837212, 0.00438799657396567, 0.004481061086204854, 0.004585662087457059, 0.004693568361278509, 0.004807612746198829, 0.004931506069592267, 0.005069012752717783, 0.0052261595347133285, 0.005406967797043954, 0.005613305154674517, 0.005848125814826915, 0.006115399861303243, 0.00642112956501174, 0.006771392040816557, 0.007171197727717143, 0.007624197228045138, 0.00813430689355458, 0.008706820296222271, 0.009344876958081517, 0.01006148624241156, 0.010884862438702425, 0.011834660970608965, 0.012911369029217287, 0.014105319084391854, 0.015392583330041933, 0.01673120180216675, 0.0180569603025515, 0.019299088766469054, 0.02040579940969392, 0.02136664948486615, 0.0222070018458045, 0.022962864824851246, 0.02364197865704173, 0.024211102096459155, 0.0246301644406346, 0.02486625918378065, 0.024928166807537056, 0.024849925964350785, 0.024663883426642715, 0.02439151622836816, 0.02404071151108787, 0.0236206368691291, 0.02314087307652275, 0.022609014991379534, 0.02203016199222201, 0.021416350758968816, 0.02078644160287881, 0.02015901047553081, 0.019561016117367495, 0.019009990703614234, 0.0184967021565003, 0.018000121351738417, 0.017504713163865367, 0.016997971374957937, 0.016466524567016888, 0.015910379541704475, 0.01533635815940054, 0.014751696770076076, 0.014162029798334957, 0.01357602752110829, 0.012994026570400023, 0.012403030700782889, 0.011794145714412363, 0.011160185369994484, 0.010493432289625215, 0.009785154371243835, 0.00902996967258637, 0.008228350085535779, 0.007374898854661773, 0.006461903050304633, 0.005477283307117268, 0.004407241464788907, 0.0032287952959150767, 0.0019104061879785862, 0.0005856162702074541, 0.000332189193750579], [0.001762481396702207, 0.00174830707299156, 0.0017264333882508042, 0.0017028570846642655, 0.0016873774367305281, 0.0016939176471639026, 0.0017398102987533773, 0.0018428357102184653, 0.0020169363763380766, 0.0022629362600149624, 0.0025273361588213153, 0.002665769265322007, -0.06681881636922427, -0.005499595939453003, 0.004421286954577884, 0.004149282587763628, 0.0040798741367251805, 0.004107447428171927, 0.004132335722382482, 0.004142897097606826, 0.004131223953123829, 0.004156255031659746, 0.004195941730126379, 0.004252878688583007, 0.004327995486357622, 0.0044198637803998615, 0.004523090831278093, 0.004629571200322038, 0.004742103320143095, 0.004864347700680209, 0.005000017786735019, 0.005155059125891144, 0.005333439188352918, 0.005537000686083057, 0.005768658093291131, 0.006032327933544794, 0.006333931135066113, 0.006679462494347859, 0.00707386469455596, 0.007520738783032933, 0.008023947613971944, 0.008588712411537055, 0.00921813147145394, 0.009925039905431707, 0.010737270539829532, 0.01167421529452706, 0.012736356814506456, 0.013914160258202886, 0.015184023846700026, 0.01650455755452635, 0.017812443179443423, 0.01903783826165839, 0.02012965539114123, 0.021077591577226936, 0.02190666386691239, 0.022652392741843094, 0.023322408905062028, 0.02388391656687528, 0.02429738395573206, 0.02453035214398721, 0.024591486190806727, 0.0245143531928007, 0.024330869982657054, 0.02406222062183597, 0.023716028962750553, 0.023301686514888866, 0.022828316880374084, 0.022303574644168985, 0.0217324800874542, 0.02112690499303456, 0.020505453595116983, 0.019886450462695954, 0.019296490511339293, 0.01875286721810453, 0.018246470896287222, 0.01775655629793862, 0.01726779846778864, 0.016767860400332398, 0.016243551749274915, 0.015694880186987434, 0.015128576082440766, 0.014551778189440862, 0.013970044704839325, 0.013391928358027804, 0.012817760234371093, 0.012234719004361336, 0.0116340309757028, 0.0110086074196301, 0.010350836667790365, 0.009652105842314514, 0.008908654711105307, 0.008117850822902152, 0.007275904472024527, 0.00637520413483996, 0.005403827235036619, 0.00434815026384464, 0.0031854794160268373, 0.0018853828090307989, 0.0005778895727219952, 0.0003284235682443793]], [[0.005092432041770852, 0.005015474603446937, 0.004873375033056306, 0.004667440324167129, 0.004402233817446119, 0.004088423609406675, 0.0037461322577696165, 0.0034072308403314184, 0.0031186283143886688, 0.002956398411487665, 0.002946426952795971, 0.0030454499638579526, 0.0032057782301575626, 0.003388910249281439, 0.00356698561179081, 0.003719823488479654, 0.0038309851574455525, 0.0038672500740797064, 0.002105254566244973, -0.018131754854054785, -0.0008558972489752908, 0.00826151731821465, 0.005893453325998575, 0.005323058976841169, 0.005371897675487471, 0.005482246286552552, 0.005604838913037931, 0.005736158334171609, 0.005876588896513839, 0.006027946412413901, 0.0061932729072644, 0.006378030718667602, 0.006585772708924763, 0.006817898090706945, 0.007076632174150851, 0.007364956943904713, 0.007688264761805085, 0.00805215676651581, 0.00846097122770488, 0.00891806194423095, 0.009427862606522112, 0.009998085782859987, 0.010634799941530668, 0.01134866931231183, 0.012160643315207015, 0.01307922686518391, 0.014097024511604678, 0.015196652365459015, 0.016346741866067084, 0.01750066331136872, 0.01859655388257746, 0.019578138519885987, 0.020404370739291643, 0.02106574407318832, 0.02158419126623853, 0.021985045669785937, 0.022283417682527538, 0.02247307981804697, 0.022544517981685736, 0.022485688186777153, 0.022300538265107618, 0.022013060979561825, 0.021648345411080742, 0.021226248876340587, 0.020754961953831554, 0.020243335680937797, 0.019699855753990005, 0.01913241572013102, 0.01854404803626043, 0.017941294541965774, 0.01733632519850844, 0.016741048244661487, 0.016173539932826556, 0.015641586635546233, 0.015136812427626762, 0.014646533872433275, 0.014160588185968047, 0.013670610395163959, 0.013167792759913413, 0.012654122002286584, 0.012133645389756932, 0.011610656080745674, 0.011088681454489206, 0.010573801743796978, 0.010064698402023498, 0.009550270894712156, 0.009024766361589004, 0.008483676291413774, 0.007928456021923509, 0.007339521822319896, 0.006593824098871936, 0.005917203717253936, 0.005196013629033753, 0.004419311670916414, 0.0035696106322716734, 0.0026248713093195123, 0.0015483388355091562, 0.00029358590833088475, -0.001098209764123244, -0.0016576128999000155], [0.004952353714001224, 0.004884131332892882, 0.00475307166516922, 0.004560729755718729, 0.004311808293138643, 0.004016916944082374, 0.0036958263487269875, 0.00337980079383487, 0.003113744381775353, 0.002969530978588732, 0.0029721262510821462, 0.0030804860487672853, 0.0032493977722590182, 0.0034427583745551805, 0.0036354218253847005, 0.003811177508659926, 0.003960029844275687, 0.00406888976655677, 0.003388370024285311, 0.00016060664458639474, 0.00357023475751685, 0.0055096281341340736, 0.005132240063145311, 0.005105295536421781, 0.00518897193721904, 0.005302442966063697, 0.0054253338032506275, 0.005555732055983943, 0.005694483424790766, 0.005843483453110943, 0.006005764925383865, 0.0061866932670333165, 0.0063897674954354194, 0.006616382648305871, 0.006868726639373278, 0.007149715733261524, 0.007464596077215022, 0.00781881560128551, 0.008216597969492334, 0.008661205423377595, 0.00915693802251471, 0.009711270201766768, 0.010330151686352896, 0.011024006921143368, 0.011813184338162874, 0.012705972697794353, 0.013695209590902774, 0.014764016493678561, 0.01588192810659988, 0.017003644346321487, 0.018069126729943888, 0.01902357808142555, 0.019827186961472596, 0.020470721930129773, 0.020975451180514425, 0.0213659486877947, 0.02165672207507549, 0.02184166709780418, 0.02191205396632693, 0.02185550729584888, 0.021676247034189453, 0.02139705029452626, 0.021042755873721224, 0.020632601793750326, 0.020174605443581354, 0.019677379186297507, 0.019149181167651123, 0.018597699764634993, 0.01802593778049602, 0.017440290623544307, 0.01685258099873938, 0.016274359267717697, 0.01572312684438053, 0.01520637879830142, 0.014715958932772675, 0.014239595318775118, 0.013767462355842178, 0.013291473724491772, 0.012803110072884517, 0.012304320200618803, 0.011799536262540655, 0.011292517599756136, 0.010786700333342633, 0.010287969815250033, 0.00979504562591698, 0.00929723513910327, 0.008789086767727867, 0.008266060117771161, 0.007725936105429037, 0.007157084423933142, 0.006550337552957336, 0.0059212917489730905, 0.0052575400986377184, 0.004548511852919055, 0.00378902022594812, 0.002967965761395594, 0.0020725644356589853, 0.0010944370618394725, 0.0001542954765312712, 0.0002571715257355853], [0.004930723171364592, 0.004864357117852494, 0.004735549020760774, 0.004545914005798951, 0.004300196589751105, 0.004009015437955943, 0.003692102306820819, 0.0033806484792711007, 0.0031191936833853792, 0.0029788016652073975, 0.0029842800458179312, 0.003095006416011088, 0.0032662399275484094, 0.003462350601237796, 0.0036587609285404945, 0.0038401352333764342, 0.003997932256453085, 0.00412364519772162, 0.004167407168371289, 0.0034004321660389934, 0.0041714727226495356, 0.005109053351785996, 0.004980355709099402, 0.005052394106885516, 0.005158028927095265, 0.005272454291754093, 0.0053956726231764365, 0.005526134981647316, 0.0056647944961356975, 0.0058135689657408856, 0.005975495455732572, 0.0061559285168052355, 0.006358362216780623, 0.0065841935798417305, 0.006835606571235078, 0.007115508557600574, 0.007429123270191402, 0.0077818750471298735, 0.008177970217848805, 0.008620656939221242, 0.009114213740822353, 0.009666076293206248, 0.010282179680279604, 0.010972915426740318, 0.011758537265342602, 0.012647301942671536, 0.013632085306052318, 0.014696088953354681, 0.01580899016233844, 0.016925697767553885, 0.017986464401459484, 0.018936715725125383, 0.01973683913773684, 0.020377646706031264, 0.020880299308550374, 0.02126924886487887, 0.021558895569783347, 0.02174315052427544, 0.02181344512204023, 0.021757301989220067, 0.021579012285938465, 0.02130112279847187, 0.020948467402792582, 0.02054018288744938, 0.020084263893717383, 0.01958928629669004, 0.019063473554199056, 0.0185144832783875, 0.017945317815825958, 0.01736235253329361, 0.0167773169161694, 0.016201714183373454, 0.015652954796360762, 0.015138487991816595, 0.014650201576144635, 0.014175901947556881, 0.013705830266600577, 0.013231959510565904, 0.012745830653752776, 0.012249393860294052, 0.011746598258282732, 0.011241619056760651, 0.01073786888606709, 0.010241196759403484, 0.00975031590696947, 0.009254582097337632, 0.00874858048629808, 0.008227729700923472, 0.007688934260180579, 0.00712232471318922, 0.006518241736249279, 0.005891569346094339, 0.005230012997412363, 0.004527231038108247, 0.0037733860805281624, 0.0029591942068942162, 0.002066055375467239, 0.0010915701695563419, 0.0001571310413413889, 0.0002728675784287054], [0.004926265454215155, 0.0048615468654711015, 0.004734565728504041, 0.004547003831054922, 0.004303664934015942, 0.004015214475446604, 0.0037014147287767105, 0.0033934935152604203, 0.003135778907337371, 0.00299876493973575, 0.00300718688776908, 0.003120706069323202, 0.0032949014839904795, 0.0034944966362334194, 0.003695403497652166, 0.003883119416755982, 0.004050547874483603, 0.004193799402296947, 0.004283255163308985, 0.003896579284983971, 0.004499489760133565, 0.004921708120656221, 0.004948866784234304, 0.005036547624511669, 0.005144932050954424, 0.005260731003005913, 0.005384718331370762, 0.005515708231290903, 0.005654766168365315, 0.005803839313231842, 0.005965979840114626, 0.006146550253477965, 0.006349051988525497, 0.006574889036999005, 0.006826249102191012, 0.007106040833483889, 0.007419483746575743, 0.007771997482561743, 0.008167785702094916, 0.008610093792471154, 0.009103193615326738, 0.009654507886552127, 0.01026997788177098, 0.010959998577614939, 0.011744799464447285, 0.01263263409171438, 0.013616391850740331, 0.014679296046755747, 0.0157910610621922, 0.016906647763149433, 0.017966392220985807, 0.01891575262532208, 0.019715177606957728, 0.02035549078494814, 0.020857819216647314, 0.021246577717229907, 0.02153610857649685, 0.021720316872703867, 0.021790767099139054, 0.021734823181861644, 0.021556812777944336, 0.02127913417203909, 0.02092670467838971, 0.020518627163746812, 0.020062922337717153, 0.01956816678308111, 0.01904258445809841, 0.01849383499819975, 0.01792493605258738, 0.017342270170663865, 0.01675759574253219, 0.016182389464108483, 0.01563402291359946, 0.015119911208825956, 0.014631933495436544, 0.014157916236437734, 0.01368811802384999, 0.013214524843861614, 0.012728691732745174, 0.01223257384846821, 0.011730122715104938, 0.011225511958301276, 0.010722151059947425, 0.010225877842135323, 0.009735394598696967, 0.009240067273782075, 0.008734501325078269, 0.008214059814767019, 0.007674749665624541, 0.007108516904489132, 0.006512860148910819, 0.005886654113783923, 0.005225474163114098, 0.004522919159632626, 0.0037689944871794724, 0.0029542183720167544, 0.002066151455094846, 0.0010926636266340188, 0.00016069156268651205, 0.0002898762452640978], [0.004925024162572229, 0.004860810308199102, 0.004734387451813485, 0.004547457917046705, 0.004304843802175081, 0.004017225202451675, 0.00370437428973621, 0.003397530934911023, 0.0031409593085041628, 0.0030049801625602708, 0.0030143071811241993, 0.0031286878431654366, 0.003303798305937125, 0.00350446981065684, 0.003706764163877243, 0.0038964344053463067, 0.004066827942139717, 0.0042154745690799154, 0.004318978966923595, 0.004049266677052327, 0.004567992047908484, 0.004880657645027689, 0.004939315237985181, 0.005031808324056717, 0.005141040815907634, 0.005257265039997149, 0.005381492004252558, 0.005512647500239435, 0.0056518315536394255, 0.0058010004148667535, 0.005963210982553478, 0.006143828346576237, 0.0063463562985591, 0.006572201008832198, 0.00682355138705054, 0.007103316553080641, 0.0074167148634488676, 0.007769164657315344, 0.00816486888503597, 0.008607072167529714, 0.00910004442858383, 0.009651204596219222, 0.01026649600497498, 0.01095631496482258, 0.011740884043796, 0.01262845602468391, 0.0136119242760144, 0.014674518336501526, 0.01578596320141485, 0.016901234551843086, 0.017960692545738004, 0.018909803943653634, 0.019709035163180934, 0.020349213134240957, 0.020851462525913397, 0.021240149176678387, 0.021529585712206097, 0.021713672876423902, 0.02178415016041103, 0.02172813615739061, 0.021550099807991135, 0.02127239117844862, 0.020919956279176657, 0.02051188990216432, 0.020056211878511154, 0.019561497214709837, 0.019035968529751427, 0.018487284469277724, 0.017918465403059837, 0.017335894772452416, 0.016751326859186885, 0.0161762339053267, 0.015627978444759123, 0.015113965495033284, 0.0146260708497072, 0.01415212735175352, 0.0136823991243104, 0.013208876247085175, 0.012723118190750636, 0.012227082468677713, 0.01172472173379821, 0.011220209274270988, 0.010716953716004741, 0.010220789590621105, 0.009730800368316464, 0.009236066168143547, 0.008731176047000654, 0.008211396060192605, 0.007671496508176306, 0.007105739170544252, 0.006511718931762136, 0.005885641278621103, 0.00522456812417079, 0.0045220875852504646, 0.003768176519848433, 0.0029532812815638246, 0.0020647856090328055, 0.0010936828988814728, 0.00016183489130149178, 0.0002951549065372333], [0.004924265930462538, 0.004860369862344376, 0.004734298234746411, 0.004547766322008974, 0.004305607802794407, 0.004018512061995697, 0.0037062576064205454, 0.0034000920537016477, 0.00314423951763007, 0.0030089118855253765, 0.0030188093546944976, 0.003133733508907909, 0.0033094215207239617, 0.0035107723587009757, 0.0037139421432814544, 0.003904844989567281, 0.00407710804896168, 0.004229155571456208, 0.004341514427610655, 0.004145561355778747, 0.004603334921774378, 0.004858780946229752, 0.004933318705557607, 0.005028846053976543, 0.005138613558618499, 0.005255106371087712, 0.005379484968856705, 0.0055107454699019984, 0.005650009686175891, 0.005799239600025467, 0.00596149510249928, 0.006142142939106513, 0.006344688403688743, 0.006570539046466144, 0.006821884548080803, 0.007101634339131678, 0.007415006071101294, 0.007767417289109226, 0.008163070516400323, 0.008605209906755442, 0.009098104183534792, 0.009649169923779202, 0.010264351788670845, 0.010954046979306195, 0.011738473799876406, 0.01262588459033186, 0.013609175191031787, 0.014671578987271634, 0.015782827514912914, 0.016897960376877814, 0.017957296910813367, 0.018906293172101546, 0.019705414863227917, 0.02034548236530921, 0.020847601494120942, 0.021236163919442743, 0.021525476483160395, 0.02170944228875551, 0.021779804510398078, 0.02172369440084696, 0.02154558877934492, 0.021267809924269986, 0.020915323293253806, 0.020507219016114773, 0.020051516414312718, 0.019556789494940007, 0.019031259995044264, 0.01848258578637772, 0.017913788553208455, 0.017331252166564358, 0.016746729208562332, 0.016171689262344937, 0.015623489210577433, 0.015109526421131694, 0.014621672702052887, 0.01414776455277645, 0.013678069570372438, 0.013204580405768856, 0.012718859449416212, 0.012223182311635977, 0.011721279297471559, 0.011217294980974565, 0.010714622133858947, 0.010219083163983546, 0.009729359725283633, 0.009234819671359206, 0.008730090133177774, 0.008210453255959689, 0.0076706880603708725, 0.007105061346325297, 0.006511561612152732, 0.005885571857048707, 0.005224576741918396, 0.004522160502498265, 0.003768288403367071, 0.0029533779100565883, 0.0020647489854597996, 0.0010931792568662755, 0.0001625819816983367, 0.00029850771647104037], [0.004923779287374612, 0.004860073039272405, 0.00473421159961045, 0.004547917947907412, 0.004306032629384182, 0.004019250489041619, 0.0037073536688406296, 0.003401594181772672, 0.0031461719592301178, 0.003011233519842796, 0.003021470849566837, 0.0031367180573273357, 0.003312748987529659, 0.0035145032154970893, 0.003718193231730217, 0.003909829235448364, 0.004083205122327771, 0.004237278158526482, 0.004354912605248353, 0.004202944839107606, 0.00462147495308928, 0.0048471707904434004, 0.004929709850853522, 0.00502704528882747, 0.005137130830894112, 0.005253782871135698, 0.005378250947714595, 0.0055095730930990044, 0.005648884093711901, 0.005798149333678418, 0.0059604304655899425, 0.006141095183602088, 0.006343649651943292, 0.0065695022331566325, 0.0068208430518333285, 0.007100581703167977, 0.007413935381620625, 0.007766321120842156, 0.008161941159851409, 0.00860403935112674, 0.009096883672516657, 0.009647889247682855, 0.010263001486323881, 0.010952618047049266, 0.01173695455029296, 0.012624321108844068, 0.013607569549471938, 0.014669926763537604, 0.015781120221836545, 0.01689613163732711, 0.017955334526493928, 0.018904194677818884, 0.019703188983483094, 0.020343142511989314, 0.02084516103092536, 0.021233632680004836, 0.021522857812558614, 0.021706740072277044, 0.021777024498077946, 0.02172084977525345, 0.021542697007161105, 0.021264871673347733, 0.02091235068226019, 0.02050422123993318, 0.02004850228134299, 0.0195537671382708, 0.01902823694831101, 0.01847956904148921, 0.01791078580975404, 0.01732827131522602, 0.01674377669391127, 0.016168769787248856, 0.015620603951732943, 0.015106671801764514, 0.014618843010359333, 0.014145221396608698, 0.013675885520487504, 0.013202807861763935, 0.012717543077876906, 0.012222050136326401, 0.011720281145752453, 0.011216405044496731, 0.01071382472963471, 0.010218364442158115, 0.009728710173010656, 0.00923423468005847, 0.008729567521378316, 0.008209992572116891, 0.0076702902594823555, 0.007104728524285841, 0.006511460359377958, 0.0058855249103463144, 0.005224577941519181, 0.004522201269748859, 0.003768353121198578, 0.0029534336040290335, 0.002064724875161169, 0.0010928573560599804, 0.00016303353957391187, 0.00030051072090014116]], [[0.00756500176791615, 0.0074591530525352995, 0.007255087042051684, 0.006951084575739414, 0.006547988645034112, 0.00605346881726161, 0.0054877660186178805, 0.00488929316942599, 0.0043215083931294205, 0.0039033622094504236, 0.003703368975986437, 0.0036796187760104533, 0.00377410168691482, 0.003945670170221556, 0.004150277709528631, 0.0043549792217717894, 0.004562612267829752, 0.004768632848064081, 0.004964328327829433, 0.005137454609005932, -0.03918003698821255, -0.03280161991153967, -0.027018099347041896, -0.021919105753594327, -0.01761044230671174, 0.02631626619599552, 0.01301220155812699, 0.006707216451294563, 0.006866416634351305, 0.007045409225014398, 0.007242127256517015, 0.007461292450090421, 0.007706036622210269, 0.007978043457726933, 0.008279635134806933, 0.008613962762727655, 0.00898731359966443, 0.009404636956095091, 0.009870587127120438, 0.01038898947881828, 0.010964874673885853, 0.011607203608922898, 0.01232375889495944, 0.013126477055569522, 0.014037086315721252, 0.015064673848879261, 0.016191769749632386, 0.017399538741224522, 0.018650302158859457, 0.01989006050724474, 0.021049169552783454, 0.02206858225914594, 0.022906511630793536, 0.023553290504290357, 0.024033187935332517, 0.024371550346340247, 0.02458622075320019, 0.024678083166876624, 0.02464681210430862, 0.02448417975990814, 0.024195742900595903, 0.02380479209023153, 0.023335844608877533, 0.02281138400611359, 0.022241106814855423, 0.021635181291095762, 0.02100585107515987, 0.020357056171284325, 0.019691671813603578, 0.019016727714841537, 0.018344028769674302, 0.017684953841431855, 0.01705708039007383, 0.01646602991521128, 0.01590270342832499, 0.015377417007599559, 0.014835713594549042, 0.0142912909353054, 0.013736243109992158, 0.013175369305083126, 0.012609941491325254, 0.012043404223792943, 0.011479869693745894, 0.010925480005211785, 0.010378218485031837, 0.009826230886781548, 0.00926414098479013, 0.008687023394170025, 0.008089359621962573, 0.007465163412456349, 0.0066480344235007515, 0.005932464732760461, 0.00516999275054803, 0.004347707037458792, 0.003444877386102715, 0.0024351347767758453, 0.0012749152199465212, -8.861901453894802e-05, -0.0015669408178839433, 0.0002084900664932323], [0.006819294902224022, 0.00672868828576368, 0.0065499277954381195, 0.006281661485618648, 0.005924812084458824, 0.0054864093244517236, 0.004984756014617913, 0.004454552702555237, 0.003952309046251669, 0.0035835571893475466, 0.0034097457008889116, 0.003393727573295093, 0.003484022054755084, 0.0036397371193042207, 0.0038254028053407614, 0.004016486744274707, 0.0042084605344167424, 0.004399001258286105, 0.004581243782130736, 0.00474521743258061, -0.006613595217645051, -0.004851498141792166, -0.0032476892912243517, -0.0018235560319008917, -0.0006033209443034203, 0.010937020235692646, 0.008474696425174138, 0.0060185068000250625, 0.006170419589355938, 0.0063358124242705, 0.00651568810440478, 0.0067150987102581475, 0.006937339812980209, 0.007183882227433956, 0.007456863653907739, 0.007759133528899971, 0.008096094740628505, 0.008472749878565446, 0.00889328448234805, 0.009361028579192429, 0.00988048973996666, 0.010459722950276806, 0.01110581032422367, 0.011829585450913638, 0.012650597107500931, 0.01357549591513496, 0.014591881976078306, 0.01568117707463971, 0.016809415124499454, 0.01792786607264956, 0.018973983852936242, 0.019894394642436412, 0.02065143430322586, 0.021236359419618725, 0.02167097051040522, 0.021978078533329296, 0.022173596812636566, 0.02225822715496109, 0.02223161346928326, 0.022086423082735954, 0.0218274029179604, 0.021475209661617818, 0.0210532735537437, 0.02058132828857145, 0.020068005575166796, 0.01952227737528018, 0.018953708470658047, 0.01836829981931022, 0.01776871761936945, 0.017160732768969015, 0.016554869873295755, 0.01596132994628681, 0.01539589052672426, 0.01486355917657335, 0.01435625041011175, 0.013872038236560868, 0.013384211150250801, 0.012894309710208218, 0.012394979701451866, 0.011889627430840566, 0.011380661222370029, 0.010871438655796083, 0.01036526417603199, 0.009867579709650173, 0.009376572937275523, 0.008881670725145393, 0.008378147597368336, 0.007861691054484907, 0.007327475931034971, 0.006770278474227017, 0.006180565265852837, 0.005566634111468859, 0.004922345786888492, 0.004239306718226782, 0.0035074890460032736, 0.0027179435938922895, 0.0018600235576585454, 0.0009292693908302344, 5.910967939333858e-05, 0.00026641323372528366], [0.006722634823241776, 0.0066344345229416195, 0.00645941898462088, 0.0061963015715440955, 0.00584602993005991, 0.005415561260406944, 0.004922952262136387, 0.004402428914642672, 0.003909538122417527, 0.0035479210910232487, 0.0033780825566162957, 0.003363549462946538, 0.003453760007178336, 0.0036075149257497477, 0.0037908352115712182, 0.00398074154115172, 0.00417111611031058, 0.004360082699066274, 0.00454110419098, 0.004704600108008953, -0.0021096955617654167, -0.0009855767119518507, 4.0558556619587546e-05, 0.0009566869507442138, 0.001749431857917557, 0.00880463979055479, 0.007595042339003335, 0.005926766903026444, 0.006078487840344581, 0.006242480019204414, 0.0064204008156816305, 0.006617416399696726, 0.006836885880595736, 0.007080248280120327, 0.007349621364801963, 0.00764781626851631, 0.007980097548000904, 0.008351523161544163, 0.008766216995176442, 0.009227434278452282, 0.009739612341813754, 0.010310686720289293, 0.010947654697892332, 0.011661213498166992, 0.0124706260241012, 0.013382089079179297, 0.014384159776303727, 0.01545814996863814, 0.016570574664985696, 0.017673382060468704, 0.018704967044279285, 0.019612677980662813, 0.020359385483378165, 0.020936463261982823, 0.02136538502915065, 0.021668629778184373, 0.02186184540239589, 0.02194570157719345, 0.021919832629705056, 0.021777029446831932, 0.021521910505478265, 0.021174760809470176, 0.020758988776741275, 0.020293923874793424, 0.0197880500260371, 0.019250165296438977, 0.018689336625665603, 0.018112065673636962, 0.017521007001615702, 0.01692172325528893, 0.016324565110739476, 0.01573957332784303, 0.01518227928227306, 0.014657606190855153, 0.014157224689791255, 0.0136770050678666, 0.01319581873740966, 0.012712646624529334, 0.012220172429110755, 0.011721535767776719, 0.011219402856221028, 0.010717140103451171, 0.010217911552188496, 0.009727061714946953, 0.009242793335737553, 0.008754684425887067, 0.008258082334389575, 0.007748737736310526, 0.0072218921014404885, 0.006672390836815064, 0.006091063068543981, 0.005489078312459452, 0.004855722711811672, 0.004184648766933022, 0.0034616179545901562, 0.002683318526544909, 0.0018374830509758856, 0.0009191328975273497, 6.138882556483542e-05, 0.00028093207579666567], [0.0066473666119318325, 0.006561285409953195, 0.0063894508331588384, 0.00613063718980122, 0.005785819837785642, 0.00536190542489269, 0.0048767619209311676, 0.0043642495453225585, 0.0038791301485224376, 0.0035234861005474776, 0.0033570712604534003, 0.0033439696019650594, 0.0034343762740652703, 0.0035866588609176106, 0.003768215410119265, 0.003957539475977733, 0.004146914050533826, 0.0043349012223792656, 0.004515269742291011, 0.004678797387234705, 0.001468454836771464, 0.002085710668817615, 0.002652870347417687, 0.0031653087105053576, 0.003618008859091572, 0.007104611855659334, 0.006743986507151219, 0.005853923959083156, 0.006005924364965185, 0.006169032205336741, 0.006345560797215869, 0.006540805753538355, 0.006758199766286851, 0.006999154707122555, 0.007265775087092799, 0.007560842670466285, 0.0078895007956131, 0.00825687814624417, 0.008667050090855118, 0.009123207581006189, 0.0096297318636979, 0.010194464305613122, 0.010824339535569698, 0.01152995235030768, 0.01233034112580069, 0.013231270668225575, 0.014222214122360306, 0.015284316125223737, 0.016384466231377383, 0.01747513805298659, 0.01849547108509076, 0.019393374026493392, 0.020132121346729388, 0.02070316250175135, 0.021127706155213664, 0.021427965849606552, 0.021619367711963815, 0.02170254653293428, 0.021677122281493096, 0.02153598426718824, 0.02128364757033049, 0.02094009805670048, 0.020528803006730628, 0.020068757259797076, 0.01956833097540136, 0.019036186111777112, 0.018480966313483747, 0.017909667956865005, 0.01732492822391991, 0.016732112506976517, 0.016141428364306157, 0.015562793379646929, 0.015011553293744838, 0.014492555113476729, 0.013997499484767518, 0.013519729552372933, 0.013043609746211436, 0.012565577591272702, 0.012078335736218939, 0.01158477548693363, 0.011087830766704922, 0.010591024254426483, 0.010097401984519283, 0.00961215822904564, 0.009133468262913898, 0.008651015685584506, 0.008160212008460283, 0.007656861596019205, 0.007136259886681232, 0.006593308929535416, 0.006024539327618001, 0.005428869974845136, 0.004801918365003533, 0.004137514091408793, 0.0034260719025633996, 0.0026573260289424095, 0.00182088213306658, 0.0009120156884810237, 6.395374065474053e-05, 0.0002963412539391349], [0.0066281385600467715, 0.006542653677145466, 0.0063716910489132125, 0.006114042813556993, 0.005770693269879452, 0.005348537479799752, 0.004865395852934895, 0.004355036018848974, 0.0038720113523920754, 0.003517986646056702, 0.0033525203711540948, 0.0033398460229820083, 0.003430361393398571, 0.003582279961331319, 0.0037633999737529695, 0.003952650301468817, 0.004141824385201415, 0.004329616556864427, 0.004509885007791817, 0.004673511228267286, 0.002374084504279111, 0.002862979186496907, 0.0033138983419088793, 0.0037240794618411312, 0.004090556681919916, 0.006672166835669318, 0.006489355568990177, 0.005835000399223266, 0.005987168299193732, 0.006150096463027485, 0.006326298542247126, 0.006521112315775223, 0.006737994674831149, 0.006978350019048685, 0.00724427998115978, 0.007538558924898501, 0.007866296196767004, 0.00823264473504136, 0.008641667399958029, 0.009096537370510008, 0.009601621255580693, 0.01016473610710442, 0.01079280131011003, 0.011496386337817431, 0.012294476365336978, 0.013192313943519085, 0.014180459784276338, 0.015239589662009816, 0.0163366762311257, 0.017424301914051053, 0.0184418319895791, 0.019337301181422926, 0.020074083802711733, 0.020643657114800353, 0.021067164529518016, 0.021366754779610597, 0.021557798931742454, 0.021640923628233603, 0.021615745772785723, 0.02147518146221402, 0.02122371151474431, 0.020881238003249522, 0.02047125478075248, 0.020012662057876055, 0.019513796835330742, 0.018983280846142543, 0.018429625615765676, 0.01785998364830396, 0.017276989631482383, 0.016685952255922957, 0.016097041061430225, 0.015520141419971201, 0.014970550920298299, 0.014453099653108719, 0.013959528333684516, 0.013479686041727423, 0.013005100705418415, 0.012528726709379847, 0.012043191909239474, 0.011551078147525224, 0.011055708952124986, 0.010560535298388825, 0.010068451429920983, 0.009584677002328429, 0.009107409555687816, 0.008626372509137156, 0.008136996577521236, 0.007635101499930243, 0.0071159983685782375, 0.006574605127938956, 0.006008219723167245, 0.005414180493677109, 0.004788903703706441, 0.004126208911424678, 0.0034164661566113254, 0.0026511790606731003, 0.0018168864695858058, 0.0009104027383436234, 6.481635286130773e-05, 0.00030122604891461686], [0.006617206508347056, 0.006532081259421391, 0.006361636609217033, 0.006104675680277847, 0.005762188552304569, 0.005341064197822134, 0.004859096230845022, 0.004349999956753685, 0.0038682072525787806, 0.003515138245383947, 0.0033502389823003497, 0.003337830674927507, 0.003428429801212493, 0.0035801459425112473, 0.003761023019623605, 0.003950259529028001, 0.004139340220969573, 0.004327042210156698, 0.004507278774555132, 0.004670994939229514, 0.002899174170779433, 0.003313655901009611, 0.0036971870129081015, 0.004048081824309811, 0.0043645443642305135, 0.006421117622716026, 0.006330637495961437, 0.005824123409257746, 0.0059764225466192155, 0.006139265880941112, 0.0063152932413636335, 0.006509869789342094, 0.006726468198554028, 0.006966488419498744, 0.007232030638775009, 0.007525865050873885, 0.007853080542713262, 0.008218846160712143, 0.008627217610877216, 0.009081376683842736, 0.00958567652090998, 0.010147913616546631, 0.010774995451171766, 0.011477473903580535, 0.012274288295488415, 0.013170673938428001, 0.01415721236151947, 0.015214612374118981, 0.016309901108105, 0.01739573861041874, 0.018411591987096795, 0.019305576592336306, 0.020041132317753032, 0.02060975276824649, 0.021032546800729034, 0.021331624741707883, 0.021522324040371136, 0.021605268332424488, 0.021580074713663924, 0.021439677305112797, 0.021188537871862444, 0.02084651096960224, 0.02043711397233859, 0.01997919247671603, 0.01948106527241576, 0.018951331669740716, 0.018398422603229218, 0.017829590286714634, 0.017247467653514714, 0.01665743830948104, 0.01606963323035646, 0.015493886421610878, 0.014945447764528613, 0.014429111341074347, 0.013936534658365711, 0.013457591102938982, 0.01298385895158427, 0.012508318096638653, 0.012023615839523818, 0.01153233531862695, 0.011037796987042315, 0.010543447485119392, 0.010052177329398978, 0.009569198206957537, 0.009092711688508861, 0.008612459244905423, 0.008123878912776493, 0.007622797811205025, 0.0071045351174692, 0.00656401730974295, 0.0059989455077566305, 0.005405818032848434, 0.004781474257496473, 0.004119726800839681, 0.0034109176398277605, 0.0026464628677211033, 0.0018146903200271726, 0.0009095466678011446, 6.536908559936506e-05, 0.00030434398361099945], [0.0066109961025546185, 0.0065260809506942005, 0.0063559368114141385, 0.006099373285580445, 0.005757383933123225, 0.005336854407184961, 0.0048555631682051185, 0.0043471958859178095, 0.003866114580448981, 0.0035135983470625976, 0.003349028989702633, 0.0033367783118212232, 0.003427431192795328, 0.0035790336124950353, 0.0037597741581490434, 0.00394901072035052, 0.004138044148739572, 0.0043257007222002606, 0.004505926203912821, 0.0046697029972477735, 0.0031954021580342024, 0.0035678926658806362, 0.003913395912804457, 0.004230832598722729, 0.0045190591288708564, 0.006279212454626432, 0.006236547313631661, 0.005817911087587948, 0.005970294905121048, 0.006133094920108151, 0.0063090260945546355, 0.006503470104321587, 0.0067199091581062334, 0.0069597406223917534, 0.007225063915757829, 0.007518646874955957, 0.007845519748636665, 0.008210951389295012, 0.008618984591998315, 0.009072751690137762, 0.00957660084527292, 0.010138325017953332, 0.010764828864873493, 0.01146665756156022, 0.012262733067349115, 0.013158286661198676, 0.014143909605165225, 0.015200329161682805, 0.016294603724194723, 0.017379437721655296, 0.018394356779309094, 0.019287521579399187, 0.02002240862094665, 0.020590519947055692, 0.021012943674128332, 0.021311768393873408, 0.02150231252402726, 0.02158519731981369, 0.021560039318146627, 0.021419782327293666, 0.02116887645713101, 0.020827148360223532, 0.020418129580367542, 0.01996063356655974, 0.019462968218935624, 0.01893371939079172, 0.01838104027085351, 0.017812671538616008, 0.017231233790619797, 0.01664186920841606, 0.01605468759134636, 0.015479532043285019, 0.014931645093502248, 0.014415820157393587, 0.013923724925364693, 0.013445244089503908, 0.012971966572112489, 0.01249687982606924, 0.012012638553692539, 0.011521821759113572, 0.011027746958629932, 0.010533858053403627, 0.010043043296408243, 0.00956050972552039, 0.009084461147769958, 0.00860464931742926, 0.008116516640887859, 0.007615894234371174, 0.007098105722253289, 0.006558082315623053, 0.005993742874026944, 0.005401131902455738, 0.004777317010600714, 0.004116108045461555, 0.00340783451304363, 0.0026438646241130426, 0.0018140562160905108, 0.0009090908805401722, 6.571356566328505e-05, 0.00030622338176567707]], [[0.010238406229458756, 0.010109771299184061, 0.009858726229420838, 0.009477097273251998, 0.008953316996476234, 0.008281347444202702, 0.007465712847447415, 0.006540046306596325, 0.005585312399180717, 0.004754163814431298, 0.004172350474288603, 0.003843848564274387, 0.003703716155351525, 0.0036972196772255867, 0.0037774511004826155, 0.003911742882033787, 0.004080588504950592, 0.0042767205355067565, 0.004487214503227428, 0.004698152530850683, -0.0024057478587471578, -0.0008647881591819068, 0.0005524466977339794, 0.0018277216443600345, 0.0029377747702854138, 0.003852764167907395, 0.004586385930229921, 0.005311694530510728, 0.006078285763283247, 0.006893044045668461, 0.007764810260318487, 0.008705049478346792, 0.009723101300403028, 0.010823743497841175, 0.011747804912328939, 0.006804213975513523, 0.007920860948771006, 0.008773849234068955, 0.009215882029827007, 0.009692078066757698, 0.010216411954721616, 0.010797068187927307, 0.011442321603190529, 0.012163726643276798, 0.012979071153041219, 0.01388917901210372, 0.014881361330488509, 0.01593268283182626, 0.017006268467416336, 0.01805126964932852, 0.019005353467983193, 0.019819903361038956, 0.02046341809839064, 0.020929189329815023, 0.021239280530084757, 0.02141303003765641, 0.021465750091233384, 0.021406669606053846, 0.021245422212878035, 0.020983649102846225, 0.020626730699362605, 0.020192747720814804, 0.019702447757175095, 0.019173836031394085, 0.0186155986576483, 0.018036253419208018, 0.017443753555451805, 0.016845825196990745, 0.016244679832932235, 0.015643948119084497, 0.01505148550429679, 0.014474947677763984, 0.0139268030963041, 0.013408172725921241, 0.01290991155569995, 0.012424611758934577, 0.011945642520501567, 0.011467290093614822, 0.010983637513919169, 0.010498229984298581, 0.01001360685035553, 0.009532202604856528, 0.00905618641202586, 0.00858990679230157, 0.008130772165359896, 0.007668906299279451, 0.0072007867676742, 0.00672288080995848, 0.0062310942277954764, 0.005721063993816538, 0.004981540154329531, 0.004387634121959461, 0.004131932033224371, 0.003528759446790932, 0.002884515171473722, 0.0021920049902781963, 0.0014444418123188583, 0.0006453687970493331, -5.640676884798085e-05, 0.00019134222131281036], [0.010065763379763986, 0.009943447032571419, 0.009698998213117531, 0.009324380174455959, 0.008809746885645802, 0.008150273649596926, 0.007352899301258572, 0.006450160598010894, 0.005514697614001062, 0.004700989014713362, 0.004137932858763942, 0.003817137186602148, 0.0036802380660254665, 0.003673051921171167, 0.0037505401343551196, 0.0038810301348153084, 0.004045451127012924, 0.004236699078986572, 0.004441864995584616, 0.0046469385789504585, 0.0032793360870896223, 0.0037600840821191395, 0.004208925588747672, 0.0046224471223766835, 0.004996240131665691, 0.005324353588143247, 0.005610992825241694, 0.0058986287663704996, 0.006200039361702543, 0.006518426037221981, 0.006858535115700228, 0.007227329768569754, 0.0076294903765904585, 0.008066274681503855, 0.0084231328131199, 0.0076854399086719, 0.008178803518104438, 0.008650024599350556, 0.009078094695374192, 0.009545435009585946, 0.01006052219377465, 0.010631169190510163, 0.011265524884855476, 0.011974998019386136, 0.01277703184408483, 0.013672424664545232, 0.014648683849479005, 0.015683229464253542, 0.016739769038455095, 0.01776825608378399, 0.018707321722750827, 0.019509108539511953, 0.020142719746478212, 0.020601568056928234, 0.02090732178449287, 0.021078968577415997, 0.021131409548154508, 0.021073684804096687, 0.020915274503730066, 0.020657984720000234, 0.02030726996036635, 0.019880140460458946, 0.019397719919260585, 0.018877927144001477, 0.018329103033380947, 0.01775962554159726, 0.017177313307654225, 0.01658975939793114, 0.015999162621860127, 0.01540910116742436, 0.014827287986201625, 0.014261230724319783, 0.013723158510219607, 0.01321422118883965, 0.012725510794735054, 0.012249773279849049, 0.011780511812782843, 0.011312148950466765, 0.010838902019785041, 0.010364226384036074, 0.009890539301198585, 0.009420262156090379, 0.008955525159614517, 0.008500601328340764, 0.008053043730421797, 0.007603294949098334, 0.007147983751610766, 0.0066837614788531514, 0.0062067744065873115, 0.005712938724343822, 0.005183164799347142, 0.004647206169880997, 0.004085756381114561, 0.003492977774779457, 0.002859829704503866, 0.0021789998091717453, 0.001443483392254031, 0.0006542901306428461, -4.722221566329753e-05, 0.00027144960329747296], [0.010043912698102503, 0.009922842603300652, 0.009679482936641854, 0.009305814201586892, 0.008792372491293879, 0.008134606270156407, 0.007340028028936373, 0.006440978815972302, 0.005508296209662841, 0.004697163478877224, 0.004137444088777011, 0.003817856951994546, 0.0036814607136929126, 0.003674101275934897, 0.003751092677054122, 0.0038809360686660513, 0.004044627295290339, 0.004235087402660591, 0.004439387567107914, 0.004643470592831324, 0.00401121082785089, 0.004355424460551418, 0.004679562810168892, 0.004982122856580185, 0.005261123039103538, 0.005513684825589529, 0.005742788113302978, 0.005974102284220647, 0.006215674140666578, 0.006470240311169877, 0.006742034577338321, 0.007037466368554798, 0.007360674409696809, 0.00771268726028235, 0.008012989752886772, 0.007794723860448171, 0.008212082436776126, 0.008636948596435151, 0.009062550943348768, 0.009528681541363321, 0.010042554800386677, 0.010611911505290292, 0.011244886061406442, 0.011952874058050528, 0.012753270326269765, 0.013646868677788726, 0.014621199415701697, 0.015653724200557773, 0.016708220076003415, 0.017734736118676098, 0.018672016097757673, 0.019472292153868764, 0.02010475188482015, 0.02056282350544955, 0.020868112289491366, 0.0210395575276485, 0.021091993181418085, 0.021034434772512423, 0.02087634825517574, 0.020619586628265414, 0.020269638414844242, 0.01984330372989246, 0.019361838619590503, 0.018842864714259996, 0.018294919323058587, 0.01772635773331389, 0.01714497871906937, 0.016558356620033098, 0.015968689480360513, 0.015379549835798942, 0.01479863400849193, 0.01423343601173216, 0.013696162310139908, 0.013187967674710588, 0.012699965824958212, 0.01222491562207385, 0.011756328442961438, 0.011288633350374989, 0.010816054412343155, 0.010342032173881799, 0.009869030204898132, 0.009399438830863695, 0.008935389642433834, 0.00848115866335286, 0.008034369304059673, 0.007585463977747723, 0.007130981205289324, 0.006667599770864912, 0.006191458171794947, 0.0056984684242376545, 0.005177374646573789, 0.004642617778024928, 0.004082426513511717, 0.0034917218603135246, 0.002859273981759746, 0.0021799229001582916, 0.0014458712632173815, 0.0006575419061777746, -4.518188483543171e-05, 0.00029054849625055796], [0.010027941578325787, 0.009908062960877805, 0.009665659155054619, 0.009292723217014116, 0.008780173745323942, 0.008123734013211299, 0.007331504228162029, 0.006435646608422742, 0.005505210706097582, 0.004696192305106458, 0.004139516736317385, 0.0038209594596944336, 0.0036849896356713537, 0.003677449496424938, 0.0037539837614871184, 0.003883250588816586, 0.0040463017525426805, 0.004236079390674578, 0.004439626497249813, 0.004642829480656368, 0.004522953374695407, 0.004771562694329684, 0.005008385121891738, 0.005233256308585419, 0.00544589305864565, 0.005645564836948323, 0.005834391188253568, 0.006026288969366721, 0.0062259997986313185, 0.006435941452995267, 0.006659999041860144, 0.0069042122845028595, 0.007172381879719302, 0.007465535302004186, 0.007737951808551987, 0.007867496881991972, 0.008234645502290472, 0.008629039540449268, 0.009052413724177578, 0.009517618346298995, 0.010030588983148356, 0.010598997742149634, 0.0112309693267129, 0.011937893209195612, 0.012737125205851527, 0.013629451257879625, 0.014602412841017966, 0.015633494848315853, 0.01668651659300593, 0.01771158710667545, 0.01864752148132762, 0.019446612632873585, 0.02007811672631708, 0.020535477755675408, 0.020840275086966304, 0.021011412083392047, 0.02106365988429846, 0.0210060128158247, 0.0208479248776624, 0.020591293532733486, 0.02024163792166576, 0.019815546632070948, 0.01933441855579688, 0.018815838649806366, 0.018268332703849807, 0.017700241835846724, 0.017119351634760603, 0.016533409239843127, 0.0159444403642653, 0.01535600954287319, 0.014775800258580562, 0.014211298078182208, 0.013674697720652645, 0.013167166670342248, 0.012679841551163907, 0.012205487003652198, 0.011737613980827675, 0.011270651144755381, 0.010798822607302763, 0.01032555160215768, 0.009853283722476309, 0.009384399949510973, 0.008921029470058822, 0.008467441440453524, 0.008021213520245755, 0.007572822880239678, 0.007118897665539957, 0.006656092949236172, 0.006180564447890272, 0.005688243110543511, 0.005174789185540365, 0.004640921182294101, 0.004081660511880171, 0.0034912150822323093, 0.002860556317219958, 0.0021822851346223852, 0.0014492648035615895, 0.0006613218595552217, -4.3072288529638445e-05, 0.0003102009326870571], [0.010024007735246481, 0.009904483579788946, 0.009662349944096833, 0.009289602964009894, 0.008777277887224906, 0.008121182011088367, 0.007329596914627687, 0.006434632990121048, 0.005504797094097992, 0.004696349812830532, 0.004140555462536779, 0.0038222837003583214, 0.0036864316985608507, 0.00367883530394323, 0.003755236536905877, 0.0038843387553315666, 0.004047209079064149, 0.0042367954418525665, 0.004440130920390898, 0.004643083224395377, 0.004632937619377252, 0.00486092730753178, 0.0050789185905996065, 0.005287036015678337, 0.005485362249644213, 0.005673628876307558, 0.005853769214290214, 0.006037169481931802, 0.006227860821252877, 0.006428194144409672, 0.006642007144842454, 0.006875240577446736, 0.007131633866370296, 0.007412260824355813, 0.007682138705964422, 0.007881997779256505, 0.008239219762983174, 0.008627611292304516, 0.009050336290589479, 0.009515294727631138, 0.010028029803669555, 0.010596193173335523, 0.011227907184837797, 0.011934560355465291, 0.012733497738891243, 0.013625500991516258, 0.01459811293720494, 0.015628822964643935, 0.016681459570368016, 0.017706145339375094, 0.01864171170040323, 0.01944046756880067, 0.02007168943391575, 0.020528827432031514, 0.020833454200478465, 0.021004463438105827, 0.02105660775369308, 0.020998876430311664, 0.02084072131923028, 0.02058405438719671, 0.02023455678324498, 0.0198086374401091, 0.0193277397271172, 0.018809436239004884, 0.01826224665110944, 0.0176945045731825, 0.017113987727224545, 0.01652824842786381, 0.01593947964006761, 0.015351245914745404, 0.014771227582474181, 0.014206907503466648, 0.01367047547090357, 0.013163098457376819, 0.012675915626649702, 0.01220169480611572, 0.011733949476400758, 0.01126711047200566, 0.010795404297385992, 0.010322252781336206, 0.009850100566736087, 0.009381327714148234, 0.00891806274023822, 0.008464573047596584, 0.00801843731679383, 0.007570136342257563, 0.007116298667258394, 0.006653579420792728, 0.006178133700376237, 0.005685891231614116, 0.0051747021429466595, 0.004640874832500475, 0.004081845617745942, 0.003491647881781087, 0.002862169762526894, 0.0021832674730149567, 0.0014504918405014802, 0.0006625898124183107, -4.2387659368202805e-05, 0.00031630787762068564], [0.010021762731331853, 0.009902459164921166, 0.009660490134726444, 0.009287853530478368, 0.00877565790223996, 0.008119763401040082, 0.0073285660987662295, 0.006434144477078405, 0.00550466498819055, 0.004696558744595416, 0.004141306754773575, 0.003823207489994382, 0.0036874265667177645, 0.0036797945428440272, 0.003756113723777418, 0.0038851152213209557, 0.0040478753839846005, 0.004237345633281511, 0.00444055249323494, 0.004643351559725681, 0.004690814695018919, 0.004907928547890266, 0.005115987633801027, 0.0053152689381938826, 0.005506047951733105, 0.005688299604482219, 0.005863858759673582, 0.006042805149551098, 0.006228768596042117, 0.006424065693723115, 0.0066324725035263425, 0.006859916534703668, 0.007110109326766175, 0.007384165615029699, 0.007653881929206804, 0.007889186629427804, 0.008241464829440156, 0.00862688556944908, 0.009049209865264066, 0.00951402333203309, 0.010026621862235203, 0.010594644374624507, 0.011226211907283786, 0.011932712615151565, 0.012731485267778042, 0.013623309460715433, 0.014595729051451121, 0.015626236176059866, 0.016678664735927363, 0.017703145111056078, 0.01863851784772403, 0.019437100444929533, 0.020068180868783342, 0.020525212342774404, 0.020829763074650086, 0.02100072118872286, 0.021052828173809192, 0.02099518330895035, 0.020837154563289294, 0.02058066428298736, 0.020231250249021376, 0.019805398440080096, 0.01932458096814762, 0.018806364410896434, 0.018259266713599485, 0.017691619330572242, 0.017111198087662184, 0.016525553607985848, 0.015936879709064825, 0.015348740802312794, 0.014768815225350366, 0.014204584171823083, 0.013668234511656906, 0.013160932931013319, 0.012673819989422828, 0.012199665222662123, 0.01173198339644646, 0.011265206422606821, 0.010793562018067443, 0.010320471031703726, 0.009848377442369443, 0.009379660698580494, 0.008916448881359043, 0.008463008349325693, 0.008016918376543445, 0.007568661855583306, 0.007114867565241681, 0.0066521907603283295, 0.0061767864330049575, 0.005684583569350724, 0.005173538252421829, 0.004640996569354629, 0.00408206580840536, 0.0034920103014006417, 0.002861767159828334, 0.0021839128700292454, 0.001451274901207751, 0.0006633809900196587, -4.197961431018814e-05, 0.00032014268297630906], [0.010020495623608053, 0.009901322663823816, 0.009659450014788061, 0.009286876554931078, 0.008774754452162426, 0.008118975323588904, 0.007328003526100284, 0.006433898752199551, 0.0055046250894338795, 0.004696716369371213, 0.004141783653742075, 0.003823784935950003, 0.003688045410431138, 0.0036803921014155693, 0.0037566629261623617, 0.0038856053143834757, 0.004048300980447872, 0.004237703374500662, 0.00444083502436001, 0.004643544207570127, 0.004721090027658113, 0.004932501989815311, 0.005135354024309767, 0.005330003056957515, 0.005516825597878115, 0.005695953523006728, 0.005869139388881932, 0.0060457378009110335, 0.006229210501573304, 0.00642185622428913, 0.006627432000413556, 0.0068518464055479875, 0.007098798171499166, 0.0073694306031146135, 0.007639584589146334, 0.007892754229878174, 0.008242573217937936, 0.008626522050830044, 0.009048609945984935, 0.009513339746245221, 0.010025859954649292, 0.010593801952308482, 0.011225286052784432, 0.011931700278089541, 0.012730379758863796, 0.013622102773914223, 0.014594413656609356, 0.015624805985882775, 0.016677116599191008, 0.01770148015424107, 0.018636742210303262, 0.019435225131776035, 0.020066223607561752, 0.0205231927424013, 0.020827698337733423, 0.020998715115163828, 0.021050918417387834, 0.02099329350798613, 0.020835290759319478, 0.020578837038513514, 0.020229473238201203, 0.01980366134148185, 0.01932289069815068, 0.018804724414280053, 0.01825767946800206, 0.0176900860933113, 0.0171097190478636, 0.0165241280149386, 0.015935507367124107, 0.01534742147204192, 0.014767547544251388, 0.014203365847975767, 0.01366706161009011, 0.0131598014372991, 0.01267272675426713, 0.012198608067847649, 0.011730960861969012, 0.011264217650658426, 0.010792606825747892, 0.010319548635273417, 0.009847486672452718, 0.009378800050301075, 0.00891561662002463, 0.008462202165577781, 0.008016136350995755, 0.007567903317638272, 0.007114132002303455, 0.006651477783454041, 0.006176095700682825, 0.005683914542151346, 0.005173013502489477, 0.004640356370827631, 0.004082639757797727, 0.0034922585363023205, 0.002862101169160426, 0.002184332163333774, 0.0014517706175528836, 0.0006638754150316423, -4.171920470707896e-05, 0.00032244664632421924]]], "drag_distribution": [[[-9.726830162034886, 5.77551403786776, 2.67754667921622, 0.3835654672210644, 0.2061017277290296, 0.17364844338725255, 0.13930131964932566, 0.10162571302081913, 0.0626363472287364, 0.02704182034789489, -0.0019750292885798333, -0.02471411434510618, -0.04187098136459945, -0.05424031316241838, -0.06255728945185128, -0.06739936188435165, -0.06915463549964636, -0.06801430633812805, -0.06419916042619303, -0.05777120836112787, -0.06486789926330454, -0.0548035236292205, -0.04475398871694184, -0.03541863768523517, -0.027439236938954108, -0.021421641714727973, -0.017618042601072016, -0.01467992053640775, -0.012045074558256267, -0.009545230742422518, -0.007107688719160866, -0.0046875517403049405, -0.0022514561475673023, 0.0002400359993350723, 0.0028149958360921693, 0.005499054376612087, 0.008129771815286652, 0.010298030429043613, 0.012753074881530036, 0.01512710372561918, 0.01729698992090738, 0.01909820678652669, 0.02071987561423085, 0.022440702632870693, 0.02414195197747126, 0.025656112864282196, 0.02697281340704806, 0.028025654553125726, 0.028760251301889937, 0.029155640911718878, 0.02672659995711871, 0.02406591541016979, 0.021752116160638466, 0.01991585787524424, 0.01831253153373067, 0.016578501810629774, 0.014303298219209134, 0.011910701945689791, 0.010186485664772637, 0.00997847002439401, 0.011415481351071856, 0.013912674727693575, 0.016969439644984107, 0.020238587830957454, 0.02356036511679599, 0.02680166750968623, 0.029863956111478077, 0.03271662793759365, 0.035363799384883036, 0.0377075489641027, 0.039627050590691985, 0.04106442543414997, 0.04203112414657157, 0.04267754298449737, 0.043190154736007146, 0.04358393677256168, 0.043872032586823595, 0.04404972332639759, 0.04406214754319343, 0.043784931958799296, 0.04318068342299576, 0.04224990197627626, 0.04102740355403237, 0.03970971314885058, 0.0387267831614623, 0.037759858186388516, 0.036224127778235984, 0.0343578187935694, 0.03210780081181337, 0.029396849791031958, 0.020910582937987462, 0.020625375674565665, 0.02028679776307537, 0.020134746800038607, 0.020572945815056615, 0.02212888644099613, 0.026306610637583883, 0.038564146753668115, 0.0943784329930314, 0.2023814687475737], [-1.6171088162098692, 1.332315420874194, 0.6725554228542228, 0.269424114823267, 0.18093615724018897, 0.15279686378190707, 0.12060777434704562, 0.08437150538140382, 0.046565921069035045, 0.012067013579467673, -0.015843933053827117, -0.03754404508697121, -0.05377024264476048, -0.06533082409525842, -0.07296416584082716, -0.07724632037885773, -0.07856270707935221, -0.07711056074624734, -0.07308755169185126, -0.06643756019965064, -0.06461784130276302, -0.05489960447443844, -0.0452161418604033, -0.03625708390820866, -0.028655058797272828, -0.02301095860076026, -0.019555098244229484, -0.016966392978653645, -0.014673644388868106, -0.012519737568416763, -0.01043791172456293, -0.008398733818898399, -0.006374642973964473, -0.004332199040175345, -0.00225309752024671, -0.00012756298241829064, 0.0019388883972014002, 0.0037245476420721584, 0.005520709096765451, 0.007121576018400905, 0.008406492531895697, 0.009207676800692904, 0.009713436377347829, 0.010194865318919716, 0.010513840123925589, 0.010472650705519186, 0.010041949222096523, 0.009154714707798233, 0.007771763744167805, 0.005914163334350607, 0.0026066329707767942, -0.000787226241189827, -0.0036511481627937077, -0.005840827553096194, -0.007608805490361338, -0.009346796813520122, -0.01142792253561723, -0.013464328037894881, -0.01472808407101078, -0.014433379752309258, -0.01247851391258575, -0.009381304221324962, -0.005676794341507748, -0.001728123747905616, 0.002298986401008644, 0.006267860560606525, 0.010076888655651834, 0.01369366373446283, 0.017122370966196353, 0.020268953021856228, 0.023014078932538266, 0.02528588792348716, 0.02705530089312572, 0.02844904924024871, 0.029663593240862415, 0.0307309097877694, 0.031669388030324264, 0.03247849349631692, 0.03311770252820213, 0.03346215085612718, 0.033473091875522366, 0.033155403213082496, 0.03253546600791817, 0.031724171000240386, 0.03097570152015865, 0.030180183962860183, 0.029035063635725538, 0.02760030687753623, 0.025804823650665432, 0.023556355371195332, 0.018442545035558318, 0.01652679252135329, 0.014110015065345911, 0.011194320156322084, 0.007807148353252443, 0.003995315384088028, 0.00017318528598949754, -0.01138649619951669, -0.00942723034573698, -0.0042198494901372775], [-1.1050894214701281, 1.0852268787762778, 0.614442854536833, 0.34802996604785247, 0.2507972855655657, 0.2119258263458522, 0.1665394806264441, 0.11511844973822094, 0.06136510271249428, 0.0123184061083721, -0.027289496900715006, -0.05802432906495341, -0.08095523475185148, -0.09724438558805004, -0.10795035595897254, -0.11389771378862681, -0.11563757265744148, -0.1134544173133946, -0.10762369150160075, -0.09802585930868282, -0.09246382757570339, -0.07865995634554515, -0.06491249728719929, -0.05220593055573021, -0.04144328717446267, -0.03348352923791486, -0.028649265715115144, -0.025057512074355123, -0.021887205999160168, -0.018917024196057286, -0.01605331975014357, -0.01325906442435999, -0.010496708711205645, -0.007720347360134655, -0.004907002025351182, -0.0020479283195719766, 0.0007246220284400737, 0.003155240049537104, 0.005509311144896315, 0.007545794633805219, 0.009092704406123432, 0.009908661501652507, 0.01026309330086752, 0.01054174167221572, 0.010540356867676988, 0.01005583534221038, 0.008970799075252592, 0.007190662570175992, 0.004661943606921866, 0.0014303419182585585, -0.0034007365122830555, -0.008288449536066344, -0.012341260085789733, -0.015351622601022095, -0.017687031323850584, -0.019920525172528347, -0.022576939016188693, -0.025115258011737477, -0.026514089115509485, -0.025669719290088697, -0.0224465933917837, -0.01775773149716939, -0.012189461219312983, -0.006266359440689073, -0.00022702397483416844, 0.005732232535374761, 0.01146538887643342, 0.01692587921394203, 0.02212013950261581, 0.026915099518811228, 0.03114062319166596, 0.034689390186545856, 0.0375065187215285, 0.03976583253028815, 0.041752108547321407, 0.04328135773894847, 0.0446068301044631, 0.04573359842694284, 0.04661851212348889, 0.04708008714417648, 0.047061318013396705, 0.04657126917937117, 0.04564550360177264, 0.044414478091827955, 0.0431835738568247, 0.04186444904302093, 0.04011808089334204, 0.037972335661221525, 0.03532033193908889, 0.032025471340841126, 0.03209323685775721, 0.028440613065645198, 0.023733367243777368, 0.017818821185938267, 0.010491992067032515, 0.0016002311628587832, -0.008792443058260407, -0.020179726969953977, -0.06835220735862751, -0.11860996751008761], [-0.3978295541530134, 0.8566485207415537, 0.5498697715772383, 0.43214600382344964, 0.3803021618188821, 0.3215760786603758, 0.2514930258974393, 0.17156255719878216, 0.08783789143365321, 0.011452317018727128, -0.05011691149436068, -0.09779811773260919, -0.133290719330442, -0.1584255066508436, -0.17486522923689662, -0.18390302652157126, -0.18640226876148927, -0.1828125333738312, -0.1735538749399509, -0.15837658305665234, -0.14495860107903383, -0.12348025733301123, -0.10210091865711808, -0.08236027849705019, -0.06567052612816249, -0.053376896019413506, -0.0459247541416598, -0.04042404476722587, -0.03557892806491522, -0.031044335257948554, -0.02667431818522084, -0.022423449936152303, -0.01823340633073048, -0.014033522095591645, -0.00979232776009166, -0.0055039309653707735, -0.001344621514200241, 0.00238463424041808, 0.005859859570393973, 0.008788767874205764, 0.010904486022200044, 0.011831474838446139, 0.012003207144458038, 0.012030961935715113, 0.01158900863972955, 0.010204450797441422, 0.007794046280411731, 0.004207747972428491, -0.0006322133641081933, -0.006639768707766319, -0.014436649276129202, -0.02225714803507064, -0.02868924265510376, -0.03340477907701789, -0.036987032459479055, -0.04035019797803868, -0.04463466457924642, -0.048654875108876165, -0.050848634648248354, -0.049532405896410024, -0.0445121390824653, -0.037112206747131005, -0.02831674364077983, -0.018961144382264716, -0.0094190201712861, 3.992134192536974e-06, 0.009080999720285523, 0.017743343005284625, 0.026008804912316157, 0.03367699976777759, 0.040484056783915895, 0.04624518697330033, 0.050825998722712866, 0.054471971594817356, 0.057640874183742696, 0.06043202191646277, 0.06289895961859794, 0.0650490867708543, 0.06681560119408703, 0.06791516012594129, 0.06825830239707804, 0.06786114294310484, 0.06677467408095218, 0.06515855302161846, 0.06339978781932845, 0.06146979213114721, 0.05898457508759514, 0.05589338189813925, 0.05201847191659291, 0.04713726391849639, 0.047886172594949476, 0.04152552349175091, 0.0418615725246188, 0.030056304581053475, 0.015232534145956074, -0.0033774089701326527, -0.026799903411060453, -0.05720302667414713, -0.09968843409345622, -0.18054100251984473], [-0.11412385445094919, 0.7323213499746819, 0.5552358149325993, 0.45148904288538416, 0.3987693325171066, 0.3372645870408008, 0.26335522284452484, 0.17888641351889698, 0.09035270775364072, 0.009582304571360237, -0.055483216304181716, -0.10584091662345893, -0.14329898723113144, -0.16980011765556374, -0.18710712111955075, -0.19659029471094452, -0.19916422443891807, -0.195306426148592, -0.1854581506481817, -0.1693345830315146, -0.15359192801885801, -0.13083991473302567, -0.10819618119201943, -0.0872899556176636, -0.06961464255661609, -0.05659327660418416, -0.04875083193806088, -0.04297510274587679, -0.03789176486686163, -0.03313784815019051, -0.02856001702713845, -0.024111462299585367, -0.019731727341591475, -0.015347139095872611, -0.01092589390201489, -0.006464259658965751, -0.0021388325169074767, 0.0017640408760301674, 0.0053534796727262475, 0.008348170294487275, 0.010466572408450328, 0.011310298237053188, 0.011337413101165582, 0.0111935921030872, 0.010530592824934851, 0.008842485205598853, 0.006037855889712921, 0.0019571701848921795, -0.0034797580350995803, -0.010176612878117048, -0.018536995743107052, -0.02720909556489805, -0.03440166619665665, -0.03976358998284945, -0.04391836769488552, -0.04784441754425677, -0.05234724549824327, -0.05654826759742631, -0.05879748541328194, -0.05731549385848435, -0.05189920535781204, -0.043931051302575054, -0.03447562411425093, -0.02441972235968012, -0.014160904556763103, -0.00402444227674728, 0.005747969044823812, 0.01508213797786737, 0.023995207969655426, 0.03227394324269769, 0.03963791558278974, 0.04589110672692551, 0.05089075018929589, 0.0548966996840246, 0.05839468820652927, 0.06149090735331295, 0.06424167628041719, 0.06665464585636066, 0.0686593199501347, 0.0699559422476906, 0.07044976126712502, 0.07015847400887813, 0.06913457169986854, 0.06753266443220253, 0.06573302958071524, 0.0637410749417424, 0.06119784081597321, 0.05801889137185851, 0.05401260815433677, 0.04947150743921487, 0.06432759896961783, 0.05602218595272279, 0.04570308641028951, 0.03290792546463228, 0.016972298096222426, -0.0029264047204314984, -0.027882823796653734, -0.06019157944764354, -0.10519553257019928, -0.19047991861657726], [0.054665428615080926, 0.7217601562365437, 0.6011944557627765, 0.500035970820103, 0.442678146543594, 0.3744529743004936, 0.2921046260977112, 0.19786790530622317, 0.0990572458918848, 0.008912926781799335, -0.06367706014327087, -0.11983638107535509, -0.16159098733654112, -0.19111382617360714, -0.21037554961342592, -0.22090754909099936, -0.22373172060053875, -0.21938250072195206, -0.2083502944725769, -0.19030259242583855, -0.1714917461800541, -0.1461053055634538, -0.1208412316516827, -0.09751948139738982, -0.0778084321484723, -0.06329833334809644, -0.05457237811507452, -0.04815555737956491, -0.04251130105108672, -0.03723564062777057, -0.032158147583033286, -0.027227452640163838, -0.02237694842190956, -0.01752512552493782, -0.012637492087244458, -0.007711665682460351, -0.0029378785740137507, 0.00138671655756253, 0.005329590123475788, 0.008596292875904075, 0.010872796221324487, 0.011713457220868279, 0.011629191089616218, 0.011340016710193811, 0.010454500634560283, 0.008403815091830075, 0.005083552660158607, 0.00031507034275840844, -0.006257420575081195, -0.014291607077109292, -0.02405698000063759, -0.0338402950194766, -0.04194976898731362, -0.047990571369898705, -0.05265867479781552, -0.057048944168147084, -0.062063914606603314, -0.06672509267344492, -0.06919134728625591, -0.06747883544345262, -0.06136241768329025, -0.052370011560170716, -0.04170897045174669, -0.030371717599442752, -0.018804014430708147, -0.007370337285036565, 0.003658297764366768, 0.014197929798261654, 0.02426646024680378, 0.03362494442307525, 0.041960255767066114, 0.049053181958990284, 0.05474386470379162, 0.05932242437785676, 0.06333203015253616, 0.06689183100437168, 0.07006431842790181, 0.07285789450638266, 0.07519396966046228, 0.07673785493528724, 0.07738367063441264, 0.07715164727093604, 0.07609937151893523, 0.07438938338104199, 0.07242569325605523, 0.07023945851537004, 0.06746324729175023, 0.06420902304061246, 0.06011629823468431, 0.05487302587973108, 0.06517137796339102, 0.056781662383552076, 0.04595363906418904, 0.0322323666988586, 0.014916151921067005, -0.006883379350017791, -0.034362197167059884, -0.07006234998681561, -0.11997592988403852, -0.21495875363212602], [0.16073098952650647, 0.719193738658826, 0.6291804490457058, 0.5306488023476874, 0.470440142574062, 0.39796951483525494, 0.3102644462528861, 0.20981913866394367, 0.10447374237606165, 0.008369019464206692, -0.06900361931833772, -0.1288490645905688, -0.17333225575764633, -0.20477286788068483, -0.22527392327685836, -0.23646938216786761, -0.23944945104618384, -0.23478485926511747, -0.22299713004826086, -0.2037224553662342, -0.18298181115361034, -0.15593068259322315, -0.1290101048004835, -0.1041618064101079, -0.08316582873965177, -0.06771910104187469, -0.05844179908692379, -0.05162815337883716, -0.045638199809995346, -0.040042298505097926, -0.03465929318237892, -0.029435069269345852, -0.02429926738297442, -0.019165476011799843, -0.013997761730257085, -0.008794850241225732, -0.0037555839639405167, 0.0008170766113429777, 0.0049601699086836, 0.008371790533895833, 0.010716886271857103, 0.011519196962230792, 0.011322701219246901, 0.010894132088857615, 0.009813922286278965, 0.007472643596945932, 0.0036925226621208193, -0.0017208624086697411, -0.00884444417970316, -0.01755090272303688, -0.028008835342088468, -0.038481690648670706, -0.047160255420837585, -0.05362050720859159, -0.058603598265069876, -0.06327805127648715, -0.06860805591493568, -0.07355181925706558, -0.07614746347842782, -0.07427960991650254, -0.06770908960984036, -0.05805312957596188, -0.04661310102356131, -0.03444909973542214, -0.02203706230365667, -0.00976645758292306, 0.002073018105574845, 0.013391171421311654, 0.024206373394864155, 0.03426333251052529, 0.04322784639497749, 0.05086595211765512, 0.05700691179936498, 0.0619601173376351, 0.06630534545048725, 0.07017003807435421, 0.07362059618566812, 0.07666589770866686, 0.07922221885685173, 0.08093265455751085, 0.08168424543152877, 0.08149886943334687, 0.08043729117489827, 0.0786664316941809, 0.0766040407715905, 0.07429931962553786, 0.07161516085879316, 0.06827315232255769, 0.06399577592440175, 0.05847203377803749, 0.06941449031992794, 0.06033290783740049, 0.04869831765816539, 0.033997457811536534, 0.015475182724761971, -0.007821181172710811, -0.03715630086999731, -0.07519516655417254, -0.12835388903454614, -0.22955450764634794]], [[0.036908031936817805, 0.03714493247001657, 0.03763945124264233, 0.03854142819831394, 0.041052337888749305, 0.1192669404730668, 0.2035878673560299, 0.09778599283897846, 0.1120319501123512, 0.03885766859782939, 0.02588138145830821, 0.02142375509148364, 0.017275041209707673, 0.01344885121237708, 0.00997670595527176, 0.00687192928108081, 0.004133928498005519, 0.0017519358696524436, -0.0002870554453521574, -0.0019686738972766794, -0.006424340969376687, -0.0070756881004576415, -0.007428770150564097, -0.00758470563785469, -0.007645134809078337, -0.007714353450228556, -0.007884616983229705, -0.008137072527435441, -0.008423978544563835, -0.008722314420586397, -0.009029055632490866, -0.00934792256694398, -0.009675885187425537, -0.010006973413211646, -0.01033810968362733, -0.01066713052540203, -0.01099668862668974, -0.011331422047486016, -0.011674381103972899, -0.012031831069380137, -0.012423451372406266, -0.012883262272160315, -0.013422376445016197, -0.014045645863467534, -0.014785257696299606, -0.015606480185999815, -0.01644103975851918, -0.017215789282141385, -0.017838180293437523, -0.01819430117524961, -0.018472703194117437, -0.018343156323754235, -0.01778524628975089, -0.01683889178194501, -0.015607741557994707, -0.014124236412682794, -0.01238147502779065, -0.010373779113852292, -0.008098517055861294, -0.005594866568393363, -0.0029384963240875884, -0.00026123862155751223, 0.0023594124916006313, 0.004854832458786731, 0.007182008166576931, 0.00930710896397315, 0.011207789335900685, 0.012876898935793092, 0.014315702651924521, 0.015514116891727341, 0.01647086315064886, 0.017196560400289346, 0.01771929467504994, 0.01812403411938267, 0.01848731208218918, 0.018804653198176972, 0.019110738156404586, 0.019561509470874913, 0.019727248749640287, 0.0197375727027485, 0.019599525826299577, 0.019328448889978127, 0.018938969768618634, 0.01845658498691749, 0.01792322277097094, 0.01734704706366379, 0.016702157783198713, 0.015964905257918428, 0.015109207203430114, 0.014102013901603039, 0.015211436789794561, 0.014436937679274942, 0.013458800006798404, 0.012234040097053516, 0.011417580785094961, 0.01088880982349252, 0.009650967193891212, 0.012276195089667208, 0.025734151583605366, 0.05315344861547674], [0.1016221418712075, 0.10213042219282968, 0.10311058156384441, 0.10463369719375255, 0.1081482875342402, 0.21608102462154233, 0.19977587833781846, 0.13007242966993204, 0.13284681998995942, 0.09094354340300305, 0.06682683638968016, 0.054311187271723425, 0.042374904916871466, 0.0312616009190661, 0.021133181852498253, 0.012056040420563522, 0.004036245432423334, -0.002957431159146676, -0.00893110175036708, -0.01376023752388864, -0.021703112108311412, -0.02372020300545613, -0.024831553026880445, -0.025351160670424318, -0.02559329243160997, -0.025878588404780967, -0.026486729626998336, -0.02735084724551405, -0.028323394007347194, -0.029341771093457147, -0.030399592783539497, -0.03150905777889571, -0.03266141275902248, -0.03383929300275804, -0.03503580886289693, -0.0362480284998211, -0.03748973163132772, -0.038781589752172226, -0.0401395975447479, -0.04158925778021443, -0.043196672575133946, -0.04507267429491813, -0.04725547889324614, -0.04976500984352483, -0.052710120635432164, -0.055994557246535646, -0.05941253109608805, -0.06273669364845567, -0.06567052221604373, -0.06784133284692255, -0.06926737005278373, -0.06936154568877521, -0.06803448980704642, -0.06539958297282944, -0.06178412029163097, -0.05730691785914674, -0.051969312279837275, -0.04576942839791362, -0.03868713644871958, -0.030810472940225007, -0.022377046175988007, -0.013754039820417514, -0.005263082453626197, 0.002868491607620809, 0.010501066213479793, 0.01752680654911133, 0.023873727922539386, 0.02951778670357599, 0.03446134997809277, 0.038671155608983626, 0.042139650376833884, 0.0448943432866989, 0.04701242793774204, 0.04875225806667171, 0.050357885699069856, 0.051814564029956996, 0.053153194036560596, 0.054567796455750384, 0.05542021922214381, 0.05581563884135092, 0.05575477429955755, 0.0552780642735046, 0.05442817150776225, 0.05327859624863785, 0.051950536436518646, 0.05046863896526602, 0.04874794816447524, 0.046709495059910205, 0.04426696387378104, 0.04131248778022569, 0.04092246333374915, 0.03749546016855424, 0.03329865692241937, 0.0281850374398607, 0.022936107887296955, 0.017222553280508205, 0.00942797712881942, -0.018359901729071683, -0.02730182687372814, -0.037372459350366614], [0.15898977521693117, 0.15972302530218407, 0.16109236459015974, 0.16306204797681473, 0.16709810206892273, 0.2897296619539128, 0.23442605860200597, 0.1741333047671485, 0.1496635471751934, 0.12290503657018301, 0.10264357916215627, 0.08295844241753904, 0.06406303968239188, 0.04642720826309523, 0.0303365779505619, 0.015907804628965596, 0.0031536967678363784, -0.00797528251971382, -0.017475915772681445, -0.025116816843046046, -0.03568237199996995, -0.03893440059127724, -0.040733018576655906, -0.041584792998237925, -0.04199620735805623, -0.04248331308722055, -0.04349472084901787, -0.04491937580367899, -0.04651951108107839, -0.04819752780488286, -0.04994427104169646, -0.05177966716209478, -0.053689844807237055, -0.05564723774141414, -0.05764174862275272, -0.059670092238685586, -0.061756613838365004, -0.06393705429848044, -0.06623970623014357, -0.0687080201411989, -0.0714505420606231, -0.07464805605064839, -0.07836362999048817, -0.08263125913618895, -0.08762995189626033, -0.0932088485031276, -0.09903832716647376, -0.10475153191331296, -0.10986660306357357, -0.11377506352260648, -0.11628991038949592, -0.11663126323054841, -0.11464503132167865, -0.11051009342374268, -0.1047565431843452, -0.0975829622101278, -0.08900019355528602, -0.07901122430329845, -0.06757901697869731, -0.05483277119348219, -0.04115682185581453, -0.027127441308747145, -0.013294407833850382, -2.9907435926051387e-05, 0.012438511921650054, 0.023935821128181285, 0.03434489822978035, 0.04362625210004215, 0.05178310601753979, 0.05876105485114751, 0.06454654600460304, 0.06918187377059128, 0.07278774955339835, 0.07577887374108357, 0.07855141088857137, 0.0810812461006353, 0.08338893149123683, 0.08567674290208295, 0.08718081099618472, 0.08795737365024403, 0.08799951872351497, 0.08736973855718853, 0.08613580677335604, 0.08441413524751197, 0.08239681614805706, 0.0801233430894544, 0.07745493072104304, 0.07426206981790107, 0.07040347772310948, 0.06570313621172255, 0.06361064780810938, 0.05769199691612399, 0.04695431459013063, 0.03666918105383155, 0.024831702856747427, 0.010553373069331481, -0.009037445234445022, -0.029492676133044793, -0.049189860449305484, -0.07424977099738375], [0.2384875944386411, 0.23948655130501573, 0.24127322425718548, 0.24355463725974744, 0.24722641877717944, 0.3558500594407212, 0.2715492823732205, 0.2320318096689064, 0.21495796021125632, 0.18068068659198924, 0.15085891290678083, 0.12116117570751696, 0.09245796769702795, 0.06559854083990461, 0.04106399689270006, 0.019050144166903513, -0.0004184067799336256, -0.01741706984152686, -0.0319202010725811, -0.04352116789552955, -0.05633799764388046, -0.06137288202024502, -0.06416839496182483, -0.06550933510662188, -0.06617955673831398, -0.0669766086544935, -0.0685914049859097, -0.07084687596269726, -0.07337508468965792, -0.07603018188491217, -0.07879979614394307, -0.0817151877129861, -0.0847552616025708, -0.0878780183577227, -0.09106942208872401, -0.09432666523140475, -0.09769080515792906, -0.10122099189858418, -0.10496498907093257, -0.10899375726591902, -0.11347847040846572, -0.11870233669705818, -0.1247652990376836, -0.1317229518624192, -0.13985799051549747, -0.14894368518291395, -0.15847311725896662, -0.1678778098695899, -0.176405735624452, -0.18310278456331788, -0.18733735038335125, -0.18816540905578596, -0.18533257804889314, -0.1791096102359714, -0.1702287880299063, -0.15905828965068672, -0.14564169027784687, -0.12999998961097312, -0.11207328039176716, -0.09204513671449104, -0.07051550414414302, -0.04857402768402787, -0.0269126975369888, -0.0061163545500983576, 0.013459100671760503, 0.0315410581506335, 0.04794669697053005, 0.06261389020812345, 0.07554680705917184, 0.08666008199018549, 0.09593065790482307, 0.10342085010332328, 0.10931170403685013, 0.11424245187637935, 0.11883079215567285, 0.12303891019256516, 0.1268524048792434, 0.13040976866963108, 0.13294723757913177, 0.13437276168894402, 0.13466289662629308, 0.1339101409371671, 0.1326307808508869, 0.13057656187210073, 0.12790544050514488, 0.1247560849073122, 0.12092807186435639, 0.11622387694578576, 0.11042331519834793, 0.10325000826836855, 0.10845269013493526, 0.09759464839955574, 0.0844787514358218, 0.06870396877024805, 0.04975557504199859, 0.02682866413731902, -0.001187992979055888, -0.03636930057141257, -0.08233606793103658, -0.15508130098166295], [0.2595908404360466, 0.2606429156334227, 0.26249424059083654, 0.26474225532412243, 0.26790626873642814, 0.359799363667652, 0.27813004668235575, 0.2465412586606189, 0.23063742458529135, 0.19538277076708718, 0.16312167095229962, 0.13073674632338972, 0.09936791454960384, 0.06999007827639603, 0.043145313709573876, 0.019054033569727194, -0.002255087292229249, -0.02086452311765296, -0.03673908468544677, -0.04941534408561616, -0.062306683022785275, -0.06784189081873924, -0.07091886876368451, -0.0724005770752165, -0.07314866178501599, -0.07403944541051234, -0.07583126729231815, -0.07832772431651433, -0.08112437835527588, -0.08406266676670343, -0.08712959917519425, -0.090359680926369, -0.09372984982735438, -0.09719416294061664, -0.10073773044105476, -0.10435823741141088, -0.10810196076717991, -0.11203522022964578, -0.1162118667953507, -0.12067070317925303, -0.12562519011181258, -0.1313887957426924, -0.13807085453045995, -0.14573074021243343, -0.1546770924470658, -0.16465908693417214, -0.17511801480594572, -0.18542660204753214, -0.19475536041502262, -0.20205288105095265, -0.20651269653790066, -0.20719119887691942, -0.20380914189653365, -0.19666807969643885, -0.18668114646421044, -0.1742064619879373, -0.15928448576900384, -0.14193506512297724, -0.12208534848435355, -0.09992700420843638, -0.0761175843394454, -0.05186103637703243, -0.02791134191682926, -0.004913325182874868, 0.016741349566015754, 0.03675312498800168, 0.05492109426148302, 0.07117711463765918, 0.08552584052210044, 0.09770647535434039, 0.1078186996563494, 0.11594669759239763, 0.12229472359345143, 0.12756738106226204, 0.13244537511744903, 0.13688859375389614, 0.14087028148050817, 0.1444871383170766, 0.1470441183176127, 0.14854046515466768, 0.1488551058051465, 0.14805752356632365, 0.1462471535787998, 0.14360614748515968, 0.14044225625813309, 0.13681827122223572, 0.13248967698161734, 0.12722686451069345, 0.12078019378267395, 0.11284078810769373, 0.11738703293255057, 0.10548930239333933, 0.09113119938525437, 0.07387007227061344, 0.05306398055364616, 0.027885966788746917, -0.002862854959794012, -0.04145845172037085, -0.0918635559740937, -0.1716045391683702], [0.28468808969553827, 0.2858170788226203, 0.28778169453110636, 0.29008164287871663, 0.2929661610882352, 0.3752132948997903, 0.29557017645898787, 0.2672575051138378, 0.2505809159092769, 0.21336829344430358, 0.178128498029222, 0.14257091068554043, 0.1080809416294701, 0.07576325269903939, 0.04622526582104344, 0.01971381969765152, -0.0037383122297611777, -0.024221849978799684, -0.041693086955282455, -0.055629158759447656, -0.06902189080122774, -0.07513076663127133, -0.07852919733610562, -0.08016970203875537, -0.0810031573675131, -0.08199637378625513, -0.08398542733130797, -0.08675235016659295, -0.08985083083756265, -0.09310711221118413, -0.096507282464213, -0.10008951963262336, -0.10382846117826301, -0.10763456850217284, -0.11151868808804366, -0.11548150427916178, -0.11957546324902786, -0.12387395507001081, -0.12843661574071313, -0.13335030386607524, -0.1388220133244367, -0.1451940984306359, -0.15258550591338332, -0.16106109259317838, -0.17096220864461875, -0.1820135084358059, -0.19359881958955197, -0.20502602956432558, -0.2153795812370899, -0.22349841326330627, -0.22841461692382056, -0.229151850031534, -0.2254007163680383, -0.21749420510555514, -0.2064416930966293, -0.19264094511184898, -0.17613917770633766, -0.1569597322808607, -0.13501963734923986, -0.1105249313689029, -0.08420109953517783, -0.05735580594257743, -0.030846183653530018, -0.00560296827574743, 0.018111180524483458, 0.03998842300151896, 0.05981782926772895, 0.07752921379524062, 0.09313294931467653, 0.10652783689189742, 0.11768444472652323, 0.126675588809293, 0.1337166730694816, 0.13958022323220218, 0.14501695614086968, 0.14998148939876726, 0.15464767191344866, 0.15867935646592254, 0.16182380556902487, 0.16366418130487748, 0.16414755725898933, 0.163377717696241, 0.16147398972879906, 0.15864243206508438, 0.15522580562532007, 0.15129530964173626, 0.14658203318310342, 0.1408330868236773, 0.13377333765340674, 0.12506216855228763, 0.12861547447266455, 0.11544107213273778, 0.09955627583115237, 0.08047360541355415, 0.05752735627039661, 0.02977117830581772, -0.0041131003523055005, -0.04662814443733227, -0.10212443122066893, -0.18985767722749447], [0.3057411345093363, 0.3069375734495119, 0.3090049851780224, 0.3113680389656969, 0.3140872567844202, 0.39042410513012676, 0.3124332491193881, 0.2854459250070054, 0.26758510678588693, 0.22856238946310556, 0.19080733449391757, 0.15259325764643178, 0.11549553884501934, 0.08072349592283355, 0.04893783830284868, 0.020406967924130485, -0.0048330603147835405, -0.026879851317675767, -0.04568315792403636, -0.06067198554015539, -0.07457332114258797, -0.08115887223817823, -0.08482412456291114, -0.08659600056912119, -0.08749952858528974, -0.08857674460213913, -0.0907284125375644, -0.09371877917877353, -0.09706673477400946, -0.10058576016997986, -0.10422283964951552, -0.10804799792738713, -0.11203549559699051, -0.11613078939012769, -0.12031667905578665, -0.12459133150520689, -0.12901034302253564, -0.1336529178024664, -0.13858333722676333, -0.1438952275104209, -0.14981179600126882, -0.15670225293883713, -0.16469488362926715, -0.17385986729435668, -0.1845659207874732, -0.1965172053917866, -0.2090500159340814, -0.22141844392725396, -0.23263531437837767, -0.24144822308402258, -0.24676324388672644, -0.24756915388357462, -0.2435311745784473, -0.23500805070668238, -0.22308875362331756, -0.2082036511134959, -0.190405356727823, -0.16972006702917192, -0.1460568130899903, -0.11963428837325522, -0.09147126716244686, -0.06276783343257462, -0.03444971018762736, -0.007281220622116189, 0.01827651954141964, 0.04187332646837641, 0.06327405220129825, 0.08240095254665392, 0.09926244437862775, 0.1137472655439405, 0.12582243729465264, 0.13556547263705498, 0.1432073820930147, 0.14958046233751612, 0.15549468630621324, 0.16120314264043614, 0.16634583771109662, 0.1707741418308564, 0.17423329107125732, 0.17627897777274784, 0.17685555815341397, 0.1760747447133496, 0.17406677945979487, 0.1710549521082377, 0.16740965370814828, 0.16320820060984953, 0.158160912812548, 0.15199527190669634, 0.1444147980746145, 0.1350524241817772, 0.13780840196210536, 0.12361553747971783, 0.10650653667870394, 0.08595328350422131, 0.061190690557568976, 0.03128411429030985, -0.005202215588696959, -0.05097577480826001, -0.11071272656472086, -0.20511793321384275]], [[0.004101733563243972, 0.004366624478959808, 0.004901110356256826, 0.005667889000074789, 0.006592289664196302, 0.007529676043245156, 0.008180083346880324, 0.005351993450649068, -0.05701924854540083, -0.2673681876807147, 0.6887323338671546, 0.24446466722192037, 0.07103006135983077, 0.014443716992468792, 0.01124756098306893, 0.00880616603353124, 0.006691192128911952, 0.004761499380636895, 0.002971927646100578, 0.0013216130621227027, -0.0025064126455743804, -0.003442359705046106, -0.004163068606812871, -0.00470718799117139, -0.005116917319344342, -0.005437458793675906, -0.005724711359409649, -0.006032825087766849, -0.00635602780179051, -0.006686226372297064, -0.007024794109646863, -0.0073746869950936465, -0.007733428679931858, -0.008097157623872692, -0.008463824114774738, -0.008831552238540874, -0.009197942886581089, -0.009561554069939244, -0.009920657005586201, -0.01027572263897743, -0.01063645301669014, -0.011019726844549552, -0.011446650854049124, -0.011941401785708728, -0.012524072026303042, -0.01314616516907186, -0.013744394413198913, -0.014250486365711698, -0.014582268960613294, -0.014644094956253035, -0.014484468160544538, -0.013957187575549222, -0.013095886010555856, -0.011954568759898166, -0.010614693381071407, -0.009080390293110073, -0.007316273715503219, -0.005339788455196539, -0.0031820424142816987, -0.0009186800730680599, 0.001365652081694442, 0.0035712851174575424, 0.00566870911955309, 0.007623448506944151, 0.009408914381341671, 0.011005128645197437, 0.012399620874619514, 0.01358756404395597, 0.014602737351722234, 0.016093993033931782, 0.0167721594386432, 0.01724730879034266, 0.01756803949189858, 0.01780514026189777, 0.018013481236114768, 0.018184221977874563, 0.018307564156187364, 0.018371782167116366, 0.018356238843322856, 0.018235253397307014, 0.018014625653835985, 0.017704199029028696, 0.017314086275700805, 0.016860984300136207, 0.01636860140412498, 0.01583857464486918, 0.015251957504425467, 0.014591323646933222, 0.013837360845969116, 0.012965748612405846, 0.013885177371352591, 0.01319137828072086, 0.012389588967036083, 0.011502367224487242, 0.010562466772889998, 0.009644021199834115, 0.008965005179529407, 0.00957421287688033, 0.018408454951610833, 0.03670112926473051], [0.011302209984929468, 0.012520062996446514, 0.0149455098208253, 0.01845909464553686, 0.02282115700069222, 0.02758231679424338, 0.03189466109266941, 0.029297638008124207, -0.017005572837520976, -0.19548797493393044, 0.6198909650131037, 0.20448970879412184, 0.056543667810198504, 0.04183262066050329, 0.032497285635215804, 0.024470837680487283, 0.017023844613548524, 0.00992252267501024, 0.0031674817324110023, -0.003096391461097034, -0.013068437850768659, -0.016984551396331156, -0.02000888919464958, -0.022304484312847345, -0.024048986486363295, -0.025431972968516407, -0.026686326989118773, -0.028035324771376293, -0.029452402943051657, -0.030906967811754078, -0.03240789263913342, -0.03396894683894334, -0.03557993542441866, -0.037225014878879005, -0.038897103992166185, -0.04059077014830046, -0.042300345988930246, -0.04402459480166051, -0.04576077327571959, -0.047515400876871554, -0.04933375827647836, -0.0512919166327097, -0.05348280364476283, -0.05601286462633468, -0.05897410460757179, -0.06216748918505364, -0.06532688416859189, -0.06816014099088596, -0.07030877209249582, -0.07134926735634722, -0.07112507955286392, -0.06928486577620303, -0.06595237656239628, -0.06134899620589577, -0.055825561462391586, -0.04941171009092389, -0.041970408030854466, -0.033582892031770326, -0.024378541600495976, -0.014670270803444763, -0.00481430272590664, 0.004844587608382249, 0.01408027123451208, 0.022734822114024333, 0.030690273382349736, 0.03786036804738379, 0.04419257487452396, 0.04967236521958139, 0.05436428214527671, 0.05949368266645573, 0.06262063832130482, 0.06493980927529093, 0.06660678854484449, 0.06791573851876857, 0.06911271241451372, 0.07016280888642676, 0.07102030702588547, 0.07163280390219152, 0.0719106966955676, 0.07173366628634953, 0.07110781531581167, 0.07007541566177586, 0.06868163548396633, 0.0670013978590482, 0.06513838820642262, 0.06309815934238153, 0.060795311963163796, 0.05815004054564092, 0.05507447985984391, 0.0514593408446082, 0.050875558663975376, 0.04678852144689939, 0.04200591952838708, 0.03648679948951727, 0.030171741162491085, 0.009978947393451353, -0.002329319705962913, -0.01710958753688253, -0.027038343701096302, -0.03510093469841614], [0.015187644197572915, 0.01709995761973548, 0.020897673860128845, 0.02641084874590054, 0.0332982677464116, 0.040927330342835036, 0.04814655361160931, 0.05237874958403461, 0.03255632643817674, -0.12014609869209476, 0.5100337116532868, 0.23928482828694467, 0.07584556929243405, 0.057362952297711794, 0.04451968681790024, 0.032999597091271524, 0.02207730758954525, 0.01152634074425194, 0.0014181927863842032, -0.007969205573320171, -0.02104386956228362, -0.02706200072802624, -0.03171296338294916, -0.03524779269159863, -0.03793989667067713, -0.04008077623999429, -0.04202794337708535, -0.04412329419520295, -0.0463251093911458, -0.04858759050769584, -0.050925537607140775, -0.05336063255105019, -0.05587726999776889, -0.058451218982623544, -0.06107215384881859, -0.06373262539477412, -0.06642555111983732, -0.06915081591057556, -0.07190587524393939, -0.07470244117745029, -0.07761184354526285, -0.08075301361676294, -0.0842704767041022, -0.08832978171641667, -0.09307527234427795, -0.09820252455998608, -0.10330205688102258, -0.10792249307736122, -0.11150746304439464, -0.11339745629377122, -0.11321808851554771, -0.11052634667109205, -0.10550608812597362, -0.09849582282106638, -0.09003842842930751, -0.08018405004388689, -0.06872620243118979, -0.0557927962098663, -0.041582366583943466, -0.026574450956961402, -0.011317242965628341, 0.0036863136528671623, 0.0180505026073885, 0.0315275388429872, 0.04393363575940227, 0.055135244539823505, 0.06505150564512618, 0.07366220180907929, 0.0810379367651071, 0.08850737092634633, 0.09342048391827705, 0.0971077322523661, 0.09979045254235984, 0.10191994800932978, 0.10388047408020741, 0.1056191729410794, 0.1070640243079119, 0.1081332535946315, 0.10868795130910344, 0.10853842616876444, 0.10768729537356526, 0.10619992487526138, 0.10414679009571738, 0.10164491377725732, 0.09885530579932816, 0.0957860168166441, 0.09230352874590335, 0.08830224721498457, 0.08361079199251537, 0.07805115062866586, 0.07417525862800241, 0.0663702708941727, 0.05708430271128461, 0.04606378244094486, 0.03290549147435878, 0.01705061076258222, -0.0023188044652505064, -0.025545994550332168, -0.045530821631116665, -0.06536284157890818], [0.024125814750289857, 0.027768606204224305, 0.034982647611951516, 0.04547730869466548, 0.05866852039581176, 0.07348834767248881, 0.08808114522703411, 0.09881343558543407, 0.08196957489075951, 0.0011002669681653514, 0.39686950691729156, 0.30216972945809717, 0.1201824597643215, 0.09364329428806753, 0.07258633671374054, 0.05267544643564091, 0.03331739240407701, 0.014344760552890695, -0.003973820411011374, -0.021014245354742892, -0.041069368783985906, -0.05228728601996683, -0.06096306178291067, -0.06756557503211623, -0.07260523652430212, -0.07662572819802276, -0.08029274222932165, -0.08424122769461885, -0.08839169676921511, -0.09266111436906328, -0.09707930104871014, -0.10168767278095218, -0.10645725967740534, -0.11134311867715575, -0.11632707006779218, -0.12139695383081364, -0.1265426889921887, -0.13176748607089725, -0.13706980817837303, -0.14247473500098107, -0.14811857291198643, -0.15422690276994924, -0.16107241771409628, -0.1689674793664644, -0.17818681400165903, -0.18816573984828305, -0.19814002216561175, -0.20726365630971513, -0.2144890822717457, -0.2185703143536292, -0.21855279825823348, -0.21379667163960966, -0.20463252872365428, -0.19168808831267506, -0.1759824319305835, -0.15761785349924393, -0.13621733221596002, -0.11202518378218194, -0.08541092509815519, -0.05726585907059143, -0.02861329496003441, -0.00033913901563832166, 0.026764324778352038, 0.052225454733360856, 0.07569687357890159, 0.09692773980794811, 0.11576707720102582, 0.13218124772580386, 0.146247024353769, 0.15937747277514971, 0.16874227808577782, 0.17585179618436442, 0.1810845083638426, 0.18528020621971025, 0.18916690995482952, 0.19264758253582032, 0.19569387057674414, 0.1981135173799007, 0.1996155824023644, 0.1998160499088469, 0.19868396924448067, 0.1963391601661157, 0.19291377694030837, 0.18862936614107206, 0.18378759717267873, 0.1783986089351986, 0.17220495850367656, 0.16496398286630798, 0.1564089237838981, 0.1462103391269689, 0.13789166355622356, 0.12318497431733395, 0.10581414625656038, 0.0853146261356858, 0.060978759631102636, 0.031863566969313875, -0.0034024650957802864, -0.04605626582911731, -0.08946369822065375, -0.1429497959885903], [0.03015948689208922, 0.035003749450683956, 0.044589019542862436, 0.05854205992317291, 0.07611254832123693, 0.09593520754773122, 0.11567759156785935, 0.13101854362563103, 0.11700360819349631, 0.06102795919595655, 0.3771350012758813, 0.34028766616381395, 0.15009538242629838, 0.11827302441914163, 0.09163536819911891, 0.06597158669485223, 0.04080843841445093, 0.016028972363235243, -0.007956570563935637, -0.030280345685404098, -0.05500826737189037, -0.0698275826923834, -0.08129120019680029, -0.09001891397969132, -0.09668531307680049, -0.10200875321559964, -0.10686834682703311, -0.1121019247215704, -0.11760377580654865, -0.12326516227557369, -0.12912639170872617, -0.13524258555402713, -0.1415755220260039, -0.1480659211613455, -0.15469020353128868, -0.16143301110242886, -0.16828230320851878, -0.17524372219222412, -0.1823165493192682, -0.189535244601058, -0.1970812430019688, -0.20525413735883388, -0.21441551409132048, -0.22497955965143293, -0.2373115165069178, -0.2506665509878946, -0.2640346887077305, -0.2762964297101018, -0.2860636204665345, -0.2916834552434772, -0.2917899225739763, -0.2856137951811239, -0.27358684337995415, -0.25653697081445, -0.23581334826795725, -0.21155471913146154, -0.1832662440748502, -0.15127308239451245, -0.11606315289501068, -0.07881285315850724, -0.040874614889039526, -0.0033976509480381782, 0.03254141434861069, 0.06631552878230898, 0.0974638314863644, 0.1256541720322962, 0.15068700156578563, 0.17251953857893876, 0.19123077209416664, 0.20825233270531493, 0.22070815448142547, 0.23019682166446245, 0.23720437587060977, 0.24299445373580275, 0.24845530913231575, 0.2534317577554487, 0.25772522865706493, 0.2611216436507392, 0.26326961830916557, 0.26367353333787985, 0.2622984389258098, 0.25930630561308227, 0.25487451729039273, 0.24929835989969984, 0.24297885651552187, 0.2359306638355916, 0.22781353569861718, 0.21830646803135675, 0.20705672136728964, 0.19362874560768656, 0.18140638272382945, 0.16196910756204708, 0.13903941393375002, 0.11200958200873212, 0.07996376518791845, 0.041695646973649136, -0.004548757913698345, -0.06066382896348617, -0.12063231742539868, -0.2156847850253908], [0.03214038156419428, 0.03751721981712192, 0.04815065636352373, 0.0636356145804148, 0.08315759201881845, 0.10523930113371854, 0.12738571036880894, 0.14515501309649745, 0.13542610419125972, 0.10037411480412914, 0.3353312455430924, 0.33496139488400345, 0.1598476275087593, 0.12693471290392197, 0.09831529760945948, 0.07039502474446217, 0.04286766737104138, 0.01567675251360238, -0.01068558962556116, -0.03522980623856008, -0.06132879934620796, -0.07770898047739132, -0.09038181694957897, -0.10003265343196638, -0.10740735184111976, -0.11330002073929037, -0.11868216136243133, -0.12447917811363163, -0.13057373358755606, -0.1368463040221746, -0.14334208053873393, -0.15012227624874594, -0.15714467754503006, -0.16434382471066625, -0.17169395983449473, -0.17917860033982425, -0.1867853292046095, -0.19452136181645205, -0.20238681993213606, -0.21042072131481865, -0.21882456702176215, -0.22793061671528744, -0.2381394830256072, -0.24991005597666166, -0.2636476670587988, -0.2785298236831711, -0.29343990210880394, -0.3071391662714289, -0.3180902600297419, -0.3244615370333051, -0.3246697554912724, -0.31791779760215805, -0.30467944720996415, -0.2858688735209352, -0.2629793929136094, -0.2361668832405198, -0.20488663495955164, -0.16949973772559193, -0.1305453420127352, -0.08932301836450768, -0.04732806404125354, -0.005815991737304278, 0.03400223064823522, 0.07143071515456083, 0.1059586897522192, 0.13721847574790275, 0.16498943438506675, 0.18922543470754194, 0.20999811602218987, 0.22858596694007077, 0.2424127726447949, 0.2531663993128406, 0.261248184034916, 0.2678423512689127, 0.2740175430873522, 0.27963028469958046, 0.28447297096671825, 0.28831337020590586, 0.29076496933546425, 0.29128076632581157, 0.28982281529281123, 0.286570821900914, 0.2817216610832183, 0.275602802137073, 0.26865876729334276, 0.2609062926387966, 0.2519688869395072, 0.24149115109354233, 0.22908268370720528, 0.2142615383710381, 0.19966865333002728, 0.1878721737925688, 0.16325938958339242, 0.13402696300753153, 0.09931914713252614, 0.05789682443397319, 0.008046567645190697, -0.05336818843445381, -0.13039167954167347, -0.2370973126984943], [0.032405227495747625, 0.037963248544658566, 0.0489515461185691, 0.06495702934451314, 0.08514897266199269, 0.10802365439088057, 0.1310594892259957, 0.14988224055279994, 0.1434029171543322, 0.12046144481510836, 0.3036612528577463, 0.32003235849094686, 0.16109706747284383, 0.12855107229508303, 0.0995475984622929, 0.0710328003250396, 0.042824395101824744, 0.014908958178180802, -0.012182247850156652, -0.03741020600905392, -0.06356269682964834, -0.08045293659221302, -0.09352149555899637, -0.1034752252921823, -0.11108334884274078, -0.11716475833264478, -0.12272108017839654, -0.12870612101878814, -0.1349985867889347, -0.14147564245767352, -0.14818427909229087, -0.15518779189061824, -0.16244267365822038, -0.1698814657325748, -0.1774777958980059, -0.18521497181744298, -0.1930807387593433, -0.2010831392263712, -0.2092228626944084, -0.21754071321070162, -0.22624505487516655, -0.23567917781816358, -0.24625674881799925, -0.25845161117306936, -0.2726827146144685, -0.2881024424892824, -0.30355923314112426, -0.31777496337410643, -0.32916256323915416, -0.3358304235174518, -0.3361008524456932, -0.3291846127768399, -0.31556810969396193, -0.29594921989681255, -0.2720747397115166, -0.24411307611204047, -0.21151184966823214, -0.1746502053970669, -0.13408840264398555, -0.09116978676088992, -0.04743966203815217, -0.004537475848186147, 0.03661677086836895, 0.07530462064585941, 0.1109991552575921, 0.1433214156559645, 0.17204427411467477, 0.19712123029528575, 0.21861672048777564, 0.2367035615416537, 0.25126203048839024, 0.26252251613845984, 0.2709732346627164, 0.27786553172620676, 0.28431185063278763, 0.2901686950977965, 0.2952223763385032, 0.2992352146001578, 0.3018100172004908, 0.3023834017375221, 0.30091678964348545, 0.297596018985899, 0.2926246793672853, 0.28599374385812587, 0.27848815706893343, 0.27013095004938764, 0.26054065562345935, 0.24935444774496748, 0.2361720230623511, 0.22049796160415824, 0.21730998004627314, 0.1951524497209416, 0.169074625077819, 0.1384431171753218, 0.10226982887923068, 0.05930244146518271, 0.007736078235560551, -0.055682019486252676, -0.13511653533880852, -0.24499557997731403]], [[0.001856086130415169, 0.0018188940167543394, 0.0017417534602856104, 0.0016236696320338778, 0.001464454688675919, 0.0012667344010961119, 0.001039126870184776, 0.0008008363648041245, 0.0005865670677214946, 0.0004632539891836079, 0.0005607847024940734, 0.0015125028356651991, 0.44733426724980513, 0.6447417065056793, -0.05869070442410741, -0.0030297896926658237, -0.0013821516244061055, -0.0008976526954050028, -0.0006004443929245228, -0.00036627418557930267, 0.0001726346226206535, 0.0002801651010533896, 0.00036922492999723593, 0.0004409830028430946, 0.0004971022494750102, 0.00053957320007566, 0.0005726472462270216, 0.0006056436813864558, 0.0006398162326696371, 0.0006748259809877817, 0.0007110426046833639, 0.0007486943683767186, 0.0007874088363798512, 0.0008267776280431126, 0.0008665538774677144, 0.0009064712909377644, 0.000945864367315338, 0.000984119646258085, 0.001020674379091085, 0.0010552091661330323, 0.0010883122842845474, 0.0011209310857053989, 0.001155990020571872, 0.0011974292508899328, 0.0012469515255705088, 0.0012976211851837987, 0.001342033149725747, 0.0013723523140062328, 0.0013795422094811476, 0.0013535316691177918, 0.0012941706741378721, 0.001193621119212184, 0.0010597309550628416, 0.000900359444171008, 0.0007243463710485693, 0.0005304725297755805, 0.00031208128819688695, 7.182156985664485e-05, -0.0001850156231823012, -0.000446482149343418, -0.000701589842345126, -0.0009402575333796677, -0.0011615767643674013, -0.001363364820605054, -0.0015442393383681018, -0.0017241282041773136, -0.0018643290466089978, -0.0019797400445821984, -0.00207181893366966, -0.0021407440047765155, -0.002188160923294991, -0.0022164007765929027, -0.00222926351569113, -0.0022341754549701255, -0.0022372081265631324, -0.0022372903810823452, -0.002233574438434226, -0.0022246196137783716, -0.002208067279845182, -0.0021810398775985516, -0.0021434809207579865, -0.002096559379634284, -0.0020414521583510172, -0.0019800944291795478, -0.0019147307105443093, -0.0018450556070172767, -0.0017691142379173503, -0.0016850844500148551, -0.0015909344897611839, -0.0014841297894287854, -0.0016951881902540907, -0.0016073130396550806, -0.0015105123965157903, -0.0014083786301074, -0.0013065873658655107, -0.001217615844218097, -0.0011691283616164258, -0.001681761589325801, -0.0019473664503800402, -0.0037227772239298296], [0.0063061483647339186, 0.006178699034612839, 0.005917684981703519, 0.005518141907408596, 0.004976490890668361, 0.00429631467386591, 0.0034971477824185587, 0.00262564793563303, 0.001763927139120174, 0.0010768246752088134, 0.0008232312047244948, 0.001938197351418597, 0.6495383742714239, 0.4190326894051751, -0.03887025774586819, -0.004761822760832095, -0.0022374852518812463, -0.0013601320819544573, -0.0007256252377075822, -0.00016914092819054593, 0.0008202549758705614, 0.0011544884293905767, 0.0014325054343720665, 0.0016573707924811378, 0.0018339547139791328, 0.001968283980491018, 0.0020736626121721064, 0.002179653863403871, 0.002289998890828838, 0.0024037711476474974, 0.00252234873405667, 0.0026465243032121246, 0.002775066451588878, 0.0029066464462827006, 0.0030405259564295754, 0.0031759681220672113, 0.003311114590575823, 0.003444282261284819, 0.003573897257916382, 0.0036991840962513228, 0.00382229605493486, 0.003946566004786342, 0.00408166902159267, 0.004240578464079341, 0.004429175993499741, 0.0046252916020078005, 0.004804987297942885, 0.004942651333167274, 0.005008319760524317, 0.004968205497388003, 0.0048037552874848595, 0.004502418715259873, 0.0040885171071478755, 0.003587040459689002, 0.0030269803125578362, 0.002405095739621836, 0.0017005837814855502, 0.0009225132642185292, 8.791778782111898e-05, -0.00076496098274821, -0.0016009062804236607, -0.002394954940706093, -0.003135478297477648, -0.0038149990805387253, -0.0044272842012542096, -0.0049985544151938425, -0.005471326917669588, -0.005867673323768881, -0.006189732322377668, -0.006437418998136787, -0.006615681841239744, -0.006731735908799522, -0.006797665537822915, -0.006837702288647652, -0.0068718853322682115, -0.006896725410808378, -0.006908244803154078, -0.0069014816144031795, -0.006868550263851622, -0.006800009279309331, -0.006695624677105869, -0.006559203322594485, -0.006394716579837411, -0.006208727262586067, -0.006008696052178352, -0.005793464212201843, -0.005556295881889867, -0.005290820244197296, -0.004989965677386112, -0.004645005703788475, -0.004731337485791885, -0.003903567106459459, -0.003367976379458208, -0.0027391018405490673, -0.001996457496199947, -0.00115717887949064, -0.00013257870051658582, 0.0004519642180264784, 0.002157149303696197, 0.0026254538639155756], [0.010138450696977715, 0.009933157280854227, 0.009513910255397337, 0.008872157241446868, 0.00800108408822893, 0.0069045260003056455, 0.005610374873151068, 0.004186940108841339, 0.0027533270488260477, 0.0015519872582452322, 0.0009333731352650523, 0.0019620630130882974, 0.7304695578442943, 0.33348910352310535, -0.031640074434866175, -0.005660544763029995, -0.002710815574300712, -0.001577470861994344, -0.00069267557651463, 0.00011577295158361055, 0.0014029999876351744, 0.0019291343459885725, 0.0023672465198912194, 0.0027219369487612674, 0.003000754395752564, 0.0032131227499074383, 0.0033800198614493777, 0.003548217843301565, 0.0037235444581869594, 0.0039045911947134335, 0.004093617660130837, 0.004291904379882206, 0.004497483862162308, 0.004708241077982317, 0.004923025209091719, 0.005140712131488366, 0.005358459358346441, 0.005573705594727933, 0.005784042406145413, 0.005988334700830916, 0.006190100057602536, 0.006394737935257799, 0.006617708972308654, 0.006879721447231962, 0.0071902661467712166, 0.007514202856696746, 0.007813486546366042, 0.00804730457349072, 0.008167749694968893, 0.008120657238413695, 0.00786969328195133, 0.007399757001343867, 0.006749105413261871, 0.005957297796336413, 0.005070568378062304, 0.004084031692564828, 0.002964896427910306, 0.0017277674843196851, 0.00039968998199287634, -0.0009587029140000877, -0.002291555862173735, -0.003562084237431619, -0.004748512625370729, -0.0058387976198986105, -0.006822364259934734, -0.007726410186325493, -0.008485204603827897, -0.0091239399567889, -0.00964504001841001, -0.010048119246076726, -0.01034090162754825, -0.01053473270759705, -0.010648742694609858, -0.01072152842754542, -0.010785094630626471, -0.010833885686060562, -0.010861110923777574, -0.010858768870313538, -0.010814227950304204, -0.010712429876878971, -0.01055298330438327, -0.010341949154897756, -0.010087783810243223, -0.009799032667985442, -0.00948736040243745, -0.009150482302534015, -0.008777176767739387, -0.008356772446898664, -0.00787742120719735, -0.007324588593364126, -0.007015456545476906, -0.006271672383223612, -0.0054095980926188525, -0.004409365738547733, -0.0032399559464320322, -0.0018613770444367683, -0.00021144161626751836, 0.0010591543686982866, 0.0036531626457363114, 0.004960214213617957], [0.020417817591476303, 0.02000358835009098, 0.01916004722345443, 0.01786882082526386, 0.016114052031870718, 0.013899590382099317, 0.011274534613483012, 0.008362962154127603, 0.005378760666498877, 0.0027647911071972584, 0.0010944528399815083, 0.0016286769753597885, 0.839456011575495, 0.22184710455817985, -0.02289604669662684, -0.007382092984875308, -0.0036751512425694547, -0.0019506367832682818, -0.00044109122169501826, 0.0010135092380254948, 0.002995113881062629, 0.004032120791393468, 0.004896604990560533, 0.005597173387664397, 0.006148462607540918, 0.006568917181666331, 0.006899956854690416, 0.007234252295759078, 0.00758316378908975, 0.007944017982383478, 0.008321454105505008, 0.008718063426222665, 0.009129908263876732, 0.009552771807170981, 0.0099844092920024, 0.010422678683318351, 0.01086214775924374, 0.011297949458386924, 0.01172547879343476, 0.012142674551664226, 0.012556732960945755, 0.012978610858164047, 0.01343925507634202, 0.01398006988613955, 0.0146202387948295, 0.0152900047795059, 0.015913635186801948, 0.016409669296370496, 0.01668216226832737, 0.016622344133862384, 0.01614394761102018, 0.015226779150837316, 0.013946184554401027, 0.012380589618195619, 0.010622349162379509, 0.008662278499853685, 0.0064356551616489436, 0.003971941997993593, 0.0013249209151700203, -0.0013850064327901252, -0.004046888694315217, -0.006593385847011869, -0.008974445273905167, -0.011165768221887388, -0.013144942775126898, -0.01493663588788743, -0.01646218266594476, -0.0177516021859818, -0.018807733498397, -0.019629298933303767, -0.020231387377199313, -0.02066627763968448, -0.020940965850012566, -0.0211325281906506, -0.021305327485303466, -0.02144857029031962, -0.021546744432948097, -0.021583538316446632, -0.021533492631849307, -0.02136656220785561, -0.021082005503661485, -0.020691973256848496, -0.02020938408985507, -0.019655594824121787, -0.019054458967845137, -0.018401804139762504, -0.017675426638948995, -0.01685410795279811, -0.015914292316204618, -0.014827077156740103, -0.013843584213141389, -0.012359854784022467, -0.010646276869169326, -0.008664113104650937, -0.006354739922492772, -0.003644460046774175, -0.0004226024077357748, 0.002626496644964623, 0.0076055556108841045, 0.011518597758750592], [0.027696190470463577, 0.02713397516541297, 0.02599005697965371, 0.024239039206315264, 0.021858532798211584, 0.01885216328503988, 0.015283617565558717, 0.011315644586059314, 0.00722767308820073, 0.0036017204634410417, 0.0011610441841452786, 0.001252233590630184, 0.8784201859497686, 0.18022790264688826, -0.020087731853926188, -0.008356450796566304, -0.004250098997741536, -0.002140743210814806, -0.00020530117295112122, 0.0016963226513719075, 0.0041326721040881005, 0.005530041229910454, 0.006695343292833531, 0.007639982243857539, 0.008383579115619341, 0.008950933274963293, 0.009397888466719951, 0.009849522041801253, 0.010321088881987217, 0.01080902992293787, 0.011319674657437793, 0.011856543183512149, 0.012414304305247965, 0.012987255608087845, 0.013572382156616542, 0.014166828541168193, 0.014763346525498504, 0.015355454031269086, 0.015937005617176054, 0.01650529790844827, 0.017070138604629723, 0.01764642448927117, 0.018276056053053883, 0.01901507335991833, 0.019889527143270087, 0.020805210878322867, 0.021659760507116366, 0.022342978404343124, 0.022724938763083822, 0.022658226848582933, 0.022020428298587417, 0.020788361211237307, 0.019063529595825312, 0.016951803836720437, 0.014578149032414549, 0.011930375941448726, 0.008921232566321626, 0.005590705051104976, 0.002011465102109389, -0.001653869356001649, -0.0052554286993411435, -0.008704645358783002, -0.011931070178689296, -0.01490172423495737, -0.017585746986426367, -0.0200041938640901, -0.022072488197696315, -0.02382281450147004, -0.025272974236424113, -0.026412403559729583, -0.027258325099490215, -0.02783945272557869, -0.028206118181973938, -0.02846209229618822, -0.028694081474593652, -0.028887165185593457, -0.029020115239872718, -0.029070692679721715, -0.029004328253422706, -0.028780282298967258, -0.02839743262885919, -0.027872144444825414, -0.02722186502487199, -0.0264754894740303, -0.025665314789539078, -0.02478565680008105, -0.02380639127882045, -0.02269876386825698, -0.02143088009967522, -0.019963629926060718, -0.018566547724708626, -0.016566078235972483, -0.014256164423186083, -0.011584790105984816, -0.008473866099096658, -0.004825772057099475, -0.0004951198312795896, 0.0038514677352437347, 0.010449712366513864, 0.016176203923898454], [0.035086709401616824, 0.034374212832586466, 0.03292530418563086, 0.030707433339503935, 0.027691538070839856, 0.023880942730620778, 0.01935401257475912, 0.014312507219144469, 0.009101912029542525, 0.0044446808686435125, 0.0012137194837806582, 0.0008257930835652261, 0.905941391614286, 0.15216506711843425, -0.018519891425809322, -0.009267830882803012, -0.004799938575923933, -0.0023104445381761105, 5.227285266961857e-05, 0.0024045056321104637, 0.005290985375552196, 0.0070538396691938446, 0.008524255372010724, 0.009716464054967004, 0.010655137192240835, 0.011371516736700973, 0.011936076933785286, 0.01250677215013817, 0.013102804714369318, 0.013719719309220153, 0.014365563420219482, 0.015044800523479592, 0.01575068490541309, 0.016476006469275186, 0.01721696962797788, 0.01796999692380672, 0.018726001685917, 0.019476867474252403, 0.020214889326680523, 0.02093671608838126, 0.02165480930298752, 0.022388067984769954, 0.023189511454691857, 0.024130035369458874, 0.025242664831998725, 0.0264083863478285, 0.027497810977194483, 0.028371575333346857, 0.028865259249331757, 0.028792213722159274, 0.02799307118926976, 0.026441809779411525, 0.02426646241174363, 0.02160074328375532, 0.01860271584537744, 0.015257152453426782, 0.011453949483695, 0.007243779470707348, 0.002718481957393807, -0.0019164908765521866, -0.006471780698371775, -0.01083739357424665, -0.01492205158021702, -0.018683961028407574, -0.022083661358410903, -0.025137967965953835, -0.027770960418827328, -0.030013994023875955, -0.031863792947177574, -0.03331569665691033, -0.03439421397110575, -0.035136622730385605, -0.035607127601978185, -0.035937181829374776, -0.036236565890031346, -0.03648645166515154, -0.03666001460933548, -0.036729152665749984, -0.03665016564027503, -0.03637153018135597, -0.035891833894597255, -0.03523176353041341, -0.03441339880711044, -0.03347332158290606, -0.03245242781917471, -0.031343556997570236, -0.030108596044603513, -0.028711150362217608, -0.027110923870353652, -0.025258486012263895, -0.02336330933373095, -0.020836891682734258, -0.01792066112201139, -0.014549129747577045, -0.010624518476803306, -0.006025064600405056, -0.0005704298525530637, 0.005102683668435196, 0.013336415380262692, 0.020914676584870874], [0.04140474944115585, 0.04056377292846752, 0.038854139409805664, 0.036237173480661286, 0.0326780896723525, 0.028179921368626716, 0.022833520978008413, 0.016873881097950297, 0.010702733280713861, 0.005162195740456858, 0.0012519617529586514, 0.00044115461250168595, 0.9239884438915366, 0.13473640312304597, -0.017773008129378907, -0.010011003096463968, -0.005254548580676206, -0.0024449169828070394, 0.0002807159542532782, 0.0030166669002768573, 0.006282675825902256, 0.008357782552451747, 0.01008888102920507, 0.011492614427356622, 0.012597966873333259, 0.01344168336816695, 0.014106738390970349, 0.014779179186615681, 0.015481579441989064, 0.01620871905846469, 0.01697011497299513, 0.01777103724835609, 0.018603531134839986, 0.019459098010254992, 0.02033327555048165, 0.02122187008347016, 0.022114225815878064, 0.023000831634110718, 0.023872651487095903, 0.024725782385951394, 0.02557495557431436, 0.026442492227904388, 0.02739091534639757, 0.028503817807767104, 0.02982018760065804, 0.031199812884589555, 0.032490209229073704, 0.033527086217150066, 0.034116539618152496, 0.034038382360836505, 0.03310154295672531, 0.03127766002846488, 0.02871743095177746, 0.0255783624253238, 0.022046806628278945, 0.0181049440903849, 0.013623147062950303, 0.008661224142738481, 0.003327395243400539, -0.002136283876495607, -0.007506709875964347, -0.012655630029318642, -0.017473906626920322, -0.02191220999088852, -0.02595901109136878, -0.029551857809527692, -0.03267433543096183, -0.03533068996759843, -0.03752064997384289, -0.03923995190469029, -0.040518057828640465, -0.041399191282892794, -0.04195912041713902, -0.04235299710787814, -0.04271035194279366, -0.04300904490557265, -0.04321749366346664, -0.04330260732754287, -0.043212902022829645, -0.04288766620138428, -0.042325241545897264, -0.04155002205905246, -0.040588058172714554, -0.03948250870082942, -0.038281622224267266, -0.03697697851441144, -0.035523643244449586, -0.033878701956420024, -0.03199458256363002, -0.029812973478239514, -0.027456858289269852, -0.024481109033442555, -0.021046924995388905, -0.01707731492837245, -0.012457701036658315, -0.007045735596637055, -0.0006313016433268804, 0.006179995661394588, 0.01580852669817324, 0.02497822718293432]], [[0.17221343574862688, 0.1714065274216502, 0.16961858389505086, 0.1665884300090426, 0.16192633982636595, 0.15514148864348298, 0.1457177272525261, 0.1332522806883959, 0.11754540536722019, 0.09968251936271899, 0.08224511178451513, 0.06700693614633768, 0.054707607681505274, 0.04554426316194217, 0.03953738095280987, 0.03682116088177545, 0.037904449155735036, 0.04500154794971804, 0.15780198268133963, 1.5123639258779522, 0.44832248953432724, -0.2734857328521278, -0.0659139227681656, 0.0035694316236349584, 0.011415527166720658, 0.012670066767813334, 0.013366534534202494, 0.013919853150085605, 0.014459533560972598, 0.01500949651496632, 0.01559341450123246, 0.01621251875181204, 0.016849641088691535, 0.017493093912913073, 0.0181336740697401, 0.0187596491906943, 0.01933395637345327, 0.019818452385250117, 0.020179903605104084, 0.020394501070856413, 0.020461473323769835, 0.020368265700130974, 0.02020326703035058, 0.02011074877635851, 0.02011304320484216, 0.019941209873639454, 0.019373298947956523, 0.018192631995148572, 0.016173378439724488, 0.013089328365939606, 0.008819649392863156, 0.0034646472534156547, -0.0025595985211194577, -0.008931183212097599, -0.015398824526890823, -0.022064578736186818, -0.029244727082846114, -0.03690743880650216, -0.04536267793298117, -0.05320610874488063, -0.06043773686717566, -0.06683210914469503, -0.07247025303188513, -0.07738239262968317, -0.08156681598468384, -0.08501861820300187, -0.08775303830140488, -0.08980840458394695, -0.09118956090365146, -0.0919014235743678, -0.09201391795801254, -0.09161085379411382, -0.09082036367470757, -0.08984333741557535, -0.0888449039998312, -0.08779883970652659, -0.08665713296862686, -0.08536965332772307, -0.08386148115015571, -0.08206983517973275, -0.0800000177587994, -0.07769071898464079, -0.07518051539305168, -0.07253167604903359, -0.06978826174318199, -0.06691439637416265, -0.06386397557485286, -0.06054475513410451, -0.05634603280047257, -0.052279680856365536, -0.06004326616617266, -0.056744834176729465, -0.053333334680058665, -0.04997834325790637, -0.04695535575725849, -0.0448058426404182, -0.04468610331302812, -0.047869644269913594, -0.06312943216650994, -0.108828131915361], [0.7002516780032192, 0.6968532886497318, 0.6894375628034533, 0.676918383844152, 0.6576737892710004, 0.6296530663978546, 0.5906781347153163, 0.5389944484680056, 0.47364861762088134, 0.39904117270171796, 0.3257541048730513, 0.2609334612427076, 0.20743448793935088, 0.16579499198760778, 0.13562192919087668, 0.11653640923181413, 0.10887283319586373, 0.11619441770867664, 0.3179718615003302, 1.2719297194545407, 0.4255932683997524, -0.18261777328076778, -0.01197919010646779, 0.04650855551074018, 0.06214727716585707, 0.06528760907095785, 0.06686333301117103, 0.068204587499596, 0.06967964016706982, 0.07133220446879292, 0.07323193886096793, 0.07536340169569807, 0.07763998782352846, 0.08000208838059548, 0.08240437376741085, 0.08479504525940723, 0.08702887457796506, 0.08895568613412713, 0.09044115050575083, 0.09138993292891771, 0.09180075965511976, 0.09162609589348818, 0.09122687810165904, 0.09119143097297219, 0.09161454958225142, 0.09140654103002839, 0.08966458146579057, 0.0855035344778475, 0.07799153020937007, 0.06618579548376452, 0.04944786236496626, 0.028247356495216334, 0.004242245522353705, -0.02127597390399703, -0.04727433981123946, -0.07414878401546897, -0.10317154699869649, -0.13412329242607887, -0.16717134017712074, -0.19875690119660044, -0.22803897760982983, -0.2543594168547973, -0.2776955796809768, -0.29814109977749054, -0.31562812035978083, -0.33013076911841915, -0.3417063393878586, -0.3505047059435876, -0.35653964880258415, -0.3598286208756307, -0.3606552864157641, -0.35936627482757294, -0.3565041846983598, -0.352913172411737, -0.34926098538188866, -0.3454152074696549, -0.3411642998129261, -0.3362931943163213, -0.3304885131645502, -0.32349027267441727, -0.315127403967814, -0.3057307935190906, -0.2954555350650975, -0.28456344605722644, -0.2732406141804761, -0.26132256051332564, -0.24858311493055454, -0.23471247631237932, -0.2184432585402448, -0.20141114746618563, -0.19010013191331301, -0.1689360142720137, -0.14508839648755484, -0.11936706624818541, -0.08962895297744924, -0.05553126029645207, -0.01596147465299106, 0.031974005047745245, 0.07926824919415812, 0.08339272937574196], [8.899830913912043, 8.856288015744678, 8.761602299842899, 8.601897588820039, 8.356448082209626, 7.999025933350878, 7.501711522938409, 6.841856024786243, 6.006919845405777, 5.052792574767428, 4.1142206463292705, 3.2818279837655218, 2.591447930554923, 2.0491263864620093, 1.6484426704798225, 1.3818146427863203, 1.2483016484532472, 1.2769102731072428, 1.619364253232066, 4.872283817016269, 2.9162140270987877, -0.5619545698511046, 0.5500643113223587, 0.7762572335865915, 0.8369278236726361, 0.8709722162147767, 0.8872397200933685, 0.9015673860692488, 0.9181618699479199, 0.937418498205526, 0.9601430018813838, 0.9860779379540187, 1.014072340460813, 1.0433324497220815, 1.0732584872201911, 1.1031798714522683, 1.131267214421527, 1.1556265911964687, 1.1745531531245061, 1.1868396647867334, 1.1924755126939564, 1.1908670721254808, 1.1866062374907742, 1.1871753643517264, 1.1937911816457274, 1.1926158415803838, 1.172173925593644, 1.1212036006672694, 1.0278205916409417, 0.8799740369327442, 0.6691090466108245, 0.40137913536470465, 0.09775479408914213, -0.22540188245580067, -0.5549289708995991, -0.8958015587342057, -1.2641478071092156, -1.6569110344068798, -2.072946995527649, -2.4734633937735477, -2.845254958678129, -3.1807306840856957, -3.4785491946966407, -3.739812960051117, -3.963477334859255, -4.14919575669375, -4.297682415486225, -4.410824261001365, -4.488778727310174, -4.531760037958217, -4.543636945619405, -4.528732107213207, -4.493967843760776, -4.450113069796637, -4.40556827074783, -4.358513429660073, -4.30615699843815, -4.245672042476953, -4.172999253756375, -4.084812132620557, -3.981287475028173, -3.8643614895782665, -3.736061351546331, -3.5997691646469203, -3.457922017060205, -3.3084545060962487, -3.148451962238401, -2.9742560296336658, -2.77349868632407, -2.55966815345221, -2.3991427530923017, -2.1322377391447316, -1.832607853346401, -1.4946474971566073, -1.1094432878867952, -0.6662594661767121, -0.17244856204941886, 0.4268979712948196, 1.0399388729015633, 1.2272425947463343], [-1143.386018725447, -1137.7460224888496, -1125.524505899482, -1104.9293158259215, -1073.283169468462, -1027.1950090216383, -963.0468847578953, -877.8833401007173, -770.0381291463335, -646.6864638165058, -525.1729233219094, -417.11424752981566, -327.0545034954505, -255.6672054528241, -201.94109073559864, -164.54027850510693, -142.6651519344646, -137.91339640851126, -160.4650797356173, -401.4705019449116, -201.9239494706031, -36.826308625922856, -88.32515587243347, -107.3826447018673, -113.67740460586593, -117.28390411384798, -118.88227132573986, -120.36743763835537, -122.21788276081703, -124.4634403529876, -127.19721709682547, -130.37813730201225, -133.85176088106766, -137.51138252456488, -141.27685269183957, -145.06041843371648, -148.62919606346006, -151.7417936857552, -154.1794995029652, -155.7877945234229, -156.56604424614775, -156.4393593817315, -155.99827249590257, -156.20472399773485, -157.2165909091487, -157.25760025695345, -154.85334212032885, -148.5553802942283, -136.83158688897373, -118.12476931942649, -91.27828118916204, -57.10684970714559, -18.291351594296128, 23.07294866799495, 65.29071900136292, 108.99366935535953, 156.24842266344035, 206.627098353448, 259.55498426689746, 310.9194987924724, 358.78984366827217, 402.2261273132233, 440.8971255184967, 474.92246548329473, 504.11298225661534, 528.4179817922943, 547.925636276432, 562.8749624610057, 573.2832879899646, 579.1770773500542, 581.0197932101904, 579.3844354506157, 575.1774779299242, 569.7987961273815, 564.3322684783515, 558.5387644338093, 552.0572892300387, 544.5242971095329, 535.4182009819915, 524.3109461966349, 511.2232624892325, 496.4026266908389, 480.1095423334214, 462.7812739703823, 444.7373958854593, 425.713659181362, 405.32872196546367, 383.1476967755102, 358.06938177487496, 330.83803916885216, 303.9088404612095, 269.793226970787, 231.5521236794278, 188.49334797406777, 139.55991676368262, 83.49110507269799, 18.464321111717602, -57.58756839136747, -137.90731596869864, -179.6048553772997], [-23.13092612265065, -23.016542314957945, -22.768944261096724, -22.35181762868974, -21.71090977432467, -20.777485260789074, -19.47815922205079, -17.75285798969467, -15.567529489546285, -13.067298097023146, -10.603255369085728, -8.410248770666014, -6.579835395623563, -5.124998663980339, -4.024121460299551, -3.24792877621918, -2.7760230379486504, -2.6274865704232173, -2.9503517662629655, -6.725150220570185, -3.3499742522043645, -1.2229714899824216, -1.8966621672341517, -2.219975870999879, -2.3379933069857874, -2.406181910435148, -2.435460226502365, -2.4632943273007983, -2.4989786250663544, -2.5429863442168386, -2.597136326589803, -2.6605478440287618, -2.730055670742646, -2.803471729408829, -2.8791553357181576, -2.9553212707118264, -3.027271577421102, -3.0901348268276077, -3.1394883938477367, -3.172209922479552, -3.1882911104626483, -3.186225485585335, -3.1779633647532215, -3.1829691064772168, -3.204446298614113, -3.206470000444704, -3.159211791946673, -3.033359588349436, -2.797885041398052, -2.421229960162454, -1.8796371018754745, -1.1897388575785812, -0.4056874300238066, 0.43017197281374187, 1.287053491987826, 2.1752031403401353, 3.136154080883852, 4.1602139935612605, 5.223790137011658, 6.265958885230779, 7.2363704787592695, 8.117430250959377, 8.901844054704668, 9.592089951212062, 10.184381360571884, 10.677725426280157, 11.073922701682728, 11.377814757173212, 11.589756412385576, 11.710287521143353, 11.748796528979451, 11.716885449167611, 11.632933429017886, 11.52532717326789, 11.416001284600876, 11.300071468539773, 11.170210751332723, 11.019055705427721, 10.836049410375004, 10.612525137469692, 10.348887575714985, 10.050133376488994, 9.721531502259653, 9.371943860633058, 9.0032887425305, 8.613870168673165, 8.196256669100187, 7.742812317292034, 7.244789907782601, 6.691597265910722, 6.117712191767179, 5.428692868367968, 4.6566318910120925, 3.787629054466781, 2.8006652635324607, 1.6710941671295325, 0.3639814941845739, -1.1879978606737436, -2.8170519455274343, -3.7702367172465205], [-12.362818400760554, -12.301587340324792, -12.169133907375855, -11.946029351640501, -11.603246642839878, -11.10400363339527, -10.409013194649653, -9.48607194332812, -8.316864288378733, -6.978944418318334, -5.660030545311153, -4.4855875276834025, -3.504425289905377, -2.7232668844909935, -2.130168170384769, -1.7087246654296309, -1.446612629306559, -1.349571651128227, -1.4772139418179775, -3.1237321522554033, -1.5867678667805099, -0.7887697476044498, -1.050712202263497, -1.2025480004778877, -1.2624833822116366, -1.2973210177185261, -1.3119397576153637, -1.3260715182099223, -1.3445541067734625, -1.3675965535868824, -1.3961491762543494, -1.4297244904595585, -1.466617006535039, -1.5056473542981705, -1.545932153208371, -1.586513900166264, -1.6248861602401135, -1.6584493281628394, -1.684840296841575, -1.7023914668295714, -1.7110999279378716, -1.7101633947681394, -1.7059702248846682, -1.708924946590499, -1.7207430546950548, -1.7222268669107081, -1.697433671515155, -1.630693651924688, -1.505411895426688, -1.3034374717676853, -1.0126877657237254, -0.6421843936700995, -0.2209045904111851, 0.2284709641013579, 0.6874834422290048, 1.1628648583682593, 1.6769492637946644, 2.2246135448897166, 2.793293377392094, 3.3504753051477363, 3.8692831234035276, 4.340590893478412, 4.760238365980484, 5.129541719241622, 5.446475860378195, 5.710512467845066, 5.9226141087523185, 6.0853672254968405, 6.198961316228712, 6.263684806006807, 6.284549539212145, 6.267758154216925, 6.223146859790692, 6.165909582441258, 6.107773735843931, 6.046114766347698, 5.977008176786455, 5.896515161603986, 5.798991475162853, 5.677546573097573, 5.534121602919672, 5.371607932309882, 5.192933983304483, 5.0029086559581515, 4.805118974983696, 4.596738100482068, 4.37354172142331, 4.131345448454946, 3.865422799423786, 3.5700868956423775, 3.256528955929965, 2.888661985402481, 2.4765315394967664, 2.01272893616486, 1.486111699161243, 0.8837169335389686, 0.18729798067854608, -0.6371167870674891, -1.5149042121815952, -2.061273892075087], [-9.742322137614163, -9.694024808166612, -9.589590943064527, -9.413700737588973, -9.143465559904639, -8.749878682794963, -8.201949979640961, -7.474257136201387, -6.55231249746432, -5.497226410538497, -4.4569600075187354, -3.5303583291991907, -2.755826691495184, -2.1385615589422033, -1.6689672119737036, -1.3337604987089278, -1.1225622326198657, -1.037801371477778, -1.117294234693465, -2.240472863005154, -1.1674909207185233, -0.6775325208499785, -0.845375675413759, -0.9551782387610015, -1.0009341437702874, -1.0276326672076608, -1.0386692135540192, -1.0494557929333845, -1.0637438153607108, -1.0816773917574183, -1.1039951672959223, -1.1303051174123508, -1.1592567934160811, -1.189916160018339, -1.221584039571666, -1.253504311741, -1.2837039282007252, -1.310136205808376, -1.3309392453517543, -1.3447994900869338, -1.3517153637970303, -1.3510559910705273, -1.3478562046580442, -1.350315777939801, -1.3597881142101038, -1.3604877535155253, -1.3402341981888315, -1.2866927979524438, -1.1867752758840637, -1.0271493422945719, -0.79765380282704, -0.5053778564185012, -0.17313241049735972, 0.18121045871599334, 0.5431088629282109, 0.917869008657871, 1.3230871946672889, 1.7547274472098533, 2.2028978282913334, 2.641993847470772, 3.050852927322926, 3.4224096970605524, 3.7532601658265365, 4.044435877225067, 4.294339196381675, 4.502554061755287, 4.669838535174388, 4.798229852481239, 4.887877068102758, 4.939007204021406, 4.955569313466231, 4.942452110750571, 4.907412779024168, 4.862434449430394, 4.816757704676907, 4.766626567166882, 4.710273119914367, 4.644755850363008, 4.565699436628624, 4.469464725617584, 4.356225511145548, 4.228101539258001, 4.0873328914142135, 3.9376888327160993, 3.781973165015658, 3.6179426733669535, 3.4422595236723086, 3.251620474786703, 3.042297469723525, 2.8098073479649095, 2.55988124643662, 2.2701890136375273, 1.9456736374401, 1.580507003748496, 1.1659521599906375, 0.6918931026046209, 0.14414964047618453, -0.5030331575527143, -1.1981775517050883, -1.646070193375216]], [[0.01795131838772421, 0.01791973029858693, 0.01783945235181545, 0.01768186918608857, 0.017402280780601093, 0.01694014846136058, 0.01622365191221282, 0.015180943350858497, 0.013747759293764235, 0.011985258212446082, 0.010146146256620862, 0.008437955154667422, 0.006959747105574589, 0.005708070051785841, 0.0047101870834507726, 0.003995994116242849, 0.003485223310359381, 0.0031800232115740314, 0.003063536083359042, 0.0031306172662028437, 0.2865567424514687, 0.2923076682190304, 0.2990450765865011, 0.30684481470742764, 0.3156705804857793, -0.3130846903402896, -0.11811414188449375, 0.0005389875542173824, 0.0007636084287131581, 0.0008464664433868612, 0.000894313472751472, 0.0009293151211941917, 0.0009602946716667733, 0.0009866117393402625, 0.0010084320725651636, 0.0010247009457321464, 0.0010263659068244682, 0.0010199956087258248, 0.0010024465673016604, 0.0009689706737176776, 0.0009185680822830775, 0.0008488084973108589, 0.0007660629445019168, 0.0006818412652858793, 0.000595544344625372, 0.0004210728713307053, 0.000263364798948895, 4.8796455293854584e-05, -0.00023940909960620555, -0.0006217236062066683, -0.0010906757245304135, -0.0016321464208096876, -0.0022093725546767505, -0.002793817082844245, -0.0033656745799140898, -0.003935099664403621, -0.004531682009987578, -0.00515179924614783, -0.005782176365630914, -0.006382533311325478, -0.006908957924931353, -0.007357732565494167, -0.007759109275692655, -0.008100903793733906, -0.008379443305495874, -0.00859165566158446, -0.008711337191086988, -0.00879422020568108, -0.008838221289366559, -0.00883143850127159, -0.008778121946546157, -0.008685146423301324, -0.008563850591065438, -0.00842987873652156, -0.008292480236279863, -0.007993098016714047, -0.007850170124593431, -0.0076995610878943235, -0.007530984349453749, -0.007328178269714266, -0.007108041765499266, -0.0068763015256965935, -0.006630910206930812, -0.006376282478250584, -0.0061153100678892425, -0.0058441119815457665, -0.005558761631346933, -0.00525520456599025, -0.004928730019244723, -0.0045736567680289076, -0.005222202509180526, -0.004935229501732771, -0.004646572447873112, -0.004373288980611016, -0.004143418478797313, -0.004010877215142047, -0.004088361426695932, -0.004505842751454899, -0.005664017919254792, 0.0005871908372344661], [0.06623695090957608, 0.06611275989384047, 0.0658072683785007, 0.0652134078451517, 0.06416402379641825, 0.062432654793858074, 0.059750170232496805, 0.055845828868050236, 0.0504764256018237, 0.043869540778986735, 0.03696558294013069, 0.03053019192671439, 0.02492241325699788, 0.020196423607481535, 0.01638734868958453, 0.013505662354312034, 0.011375025462794465, 0.009961321432234617, 0.009162551162499104, 0.008895973678846028, 0.30853328777612604, 0.31444174122279583, 0.32145228662681513, 0.3295920267683558, 0.33869553536562236, -0.33092009766679753, -0.1913236960329628, 0.0039194342149851714, 0.004232655667820948, 0.004328653097837632, 0.004384226716036774, 0.004432800857793423, 0.004483406484349203, 0.004531529125299666, 0.004574640253665414, 0.004608012943019573, 0.004609733518041159, 0.004583177325953804, 0.004516346173899291, 0.0043965136307941455, 0.004220817504311438, 0.0039807407044132005, 0.0036999163280742554, 0.003420921545251426, 0.0031441142350854324, 0.002679655846756458, 0.0021643930678234688, 0.001444064189194705, 0.000458461995789941, -0.0008565468749913281, -0.0025081066653993792, -0.004440294786185512, -0.006514457406368859, -0.008625802080686048, -0.010700500478216947, -0.01277479371801769, -0.014956320999259805, -0.01723069397061966, -0.01954959447925558, -0.02176895145995295, -0.023752642194993397, -0.02547978413589704, -0.026993997621174454, -0.028284089183483477, -0.029342395242147008, -0.030165448264066738, -0.030714849794672042, -0.031090556682613554, -0.03128979763685168, -0.031294081912512976, -0.03112351229891178, -0.0308050449474144, -0.030381999911306405, -0.029914114797825686, -0.029432038991307526, -0.028678277570694036, -0.028166689591351737, -0.027616881416307127, -0.026998081161868182, -0.026274424584054535, -0.02547437541902395, -0.024613485277235805, -0.023695045779794397, -0.022737806512230938, -0.021752916644728962, -0.02072454283642503, -0.019636104204263573, -0.01847052979843354, -0.017208077149078523, -0.015825117329450477, -0.014774257831031192, -0.013157325382900993, -0.011318983325193039, -0.009270443124564313, -0.006964862286644132, -0.0043475103291590236, -0.0013445099020059003, 0.0022236609406941455, 0.005928602803661917, 0.00579157514976674], [0.1119922390962926, 0.11177920869266486, 0.11125898193613641, 0.11024993683777061, 0.10846856487966931, 0.10553073679938037, 0.10097976284622683, 0.09435562716374477, 0.08524469237592074, 0.07403251302038422, 0.06231229872009904, 0.0513785344332642, 0.041835701422793345, 0.03380212851351434, 0.027311054610891897, 0.0223403105020342, 0.018639611096490653, 0.016134478698679337, 0.014636558631315641, 0.013980486667951163, 0.3246498911176077, 0.3306266271045681, 0.33780588466048844, 0.34617501164087316, 0.3554922954580661, -0.34126591256079186, -0.22582605653752566, 0.007398087926683044, 0.00772173334314464, 0.0078002692777087304, 0.007845911293537549, 0.00789585493590021, 0.007955972758149585, 0.0080177723607881, 0.00807572428559153, 0.008121502726378184, 0.008122645213778104, 0.008076525804809909, 0.00796269866359399, 0.007761560740347827, 0.007468603044507128, 0.007069604875652417, 0.00660457466571659, 0.006145544280527984, 0.0056941447659224, 0.004980468988172893, 0.00413589438702012, 0.00294649005323675, 0.0013111363597010325, -0.0008740472729765528, -0.003635005435833472, -0.0068756569694446365, -0.010360368245178187, -0.01391215933372734, -0.017405903020150333, -0.020902384829283326, -0.024582983615069526, -0.028422963393095555, -0.03234089396900114, -0.03609500189385922, -0.039465480635375215, -0.04241416033787305, -0.0449876302831801, -0.047180451359723326, -0.048982018162498135, -0.0503897191700198, -0.051363206691154774, -0.05202810614472765, -0.05238112129191822, -0.05240086672278544, -0.052123038884696896, -0.05159406892962182, -0.05088820684310715, -0.050107222908182356, -0.04932131620224722, -0.04820497851026407, -0.047363888509443765, -0.04645463060068551, -0.04542861368645446, -0.0442350275969292, -0.042908567068111574, -0.04147338420035654, -0.039939345023666604, -0.03833904824681823, -0.03669185310228505, -0.03497107522483463, -0.03314851348282648, -0.031195282158431797, -0.029078133790279997, -0.026757368586160006, -0.024824808531989206, -0.02197683946736621, -0.018809723638476963, -0.015273982257144623, -0.011436282735989707, -0.007019258694303259, -0.001960744585133547, 0.00399729509192557, 0.010254435286231257, 0.01123971328514404], [0.24571137004771768, 0.24523715945596233, 0.24408749043626665, 0.2418625588789707, 0.23793836331823132, 0.2314693671354528, 0.2214499050114452, 0.20686566607983708, 0.18680369346018758, 0.1621116075799583, 0.1362920353960974, 0.11218498077962756, 0.0911108943393354, 0.07338915573649929, 0.05903421537209338, 0.04790826286192055, 0.0395692041140256, 0.033816082008016356, 0.030200099920548357, 0.028301501142721747, 0.3601443440838104, 0.36610430943954164, 0.37353035443828425, 0.382300748412457, 0.39201402099456606, -0.35684080014628855, -0.2770831318381883, 0.017955853569633088, 0.018205425110418214, 0.018190405725380585, 0.01818249495543865, 0.018220103910427575, 0.018295104880644182, 0.018386943787813536, 0.018480684325992702, 0.018557313679130483, 0.018555869967014842, 0.01845195874962019, 0.01820036511638747, 0.0177623610465594, 0.017128792494914384, 0.01626886133492342, 0.015270458054579732, 0.014291717325012006, 0.013338511778120113, 0.01193285759148522, 0.010139387834928548, 0.007593591811708169, 0.0040751279695462415, -0.0006337327965513115, -0.006620916850521123, -0.013680750924642002, -0.021295421999531154, -0.02907321847887047, -0.0367366983795878, -0.044417229432212255, -0.05251139041893486, -0.0609638051052433, -0.06959604276551741, -0.07788133567850868, -0.0853572424004764, -0.0919325384871012, -0.09764842979602296, -0.10252295544555202, -0.1065379616281875, -0.10969442407133215, -0.11195303052293457, -0.11349760547434239, -0.11432665492101696, -0.11441669156707243, -0.11385033786283111, -0.11273089637726715, -0.11122237532904858, -0.10954996426227914, -0.10787375562472937, -0.10576380787885754, -0.10395951764809173, -0.10199899652518525, -0.0997829361217419, -0.09722162087617597, -0.0943609735530774, -0.09123612964633335, -0.08787801461034879, -0.08436721750417094, -0.08075055609409433, -0.07697052839371435, -0.07296451868584075, -0.06866897499069664, -0.0640112747117257, -0.05890481668573883, -0.05383339811616609, -0.04762369922153537, -0.040734576345665484, -0.033048025199719264, -0.02438057292566424, -0.01465073029061968, -0.003594896171367168, 0.009309117025759732, 0.023021022848582845, 0.027903399443726492], [0.34319483511291193, 0.3425295550547919, 0.3409202042846298, 0.33780779119193366, 0.3323198960649607, 0.3232743401057017, 0.3092648864282839, 0.28887264325903383, 0.260820111827461, 0.22629193314904586, 0.19018342494104196, 0.15646129018825608, 0.12696736938853553, 0.1021734362727753, 0.08207454515014981, 0.06643989084339359, 0.05469797850204002, 0.04655198557428022, 0.04135978470195103, 0.03851061286536193, 0.3768073682625289, 0.38257510157286556, 0.38997357586484693, 0.3988028306696465, 0.40857004938630204, -0.3573011240557551, -0.2931650163416299, 0.025820699193747184, 0.02597138935052242, 0.02586990996240959, 0.025812427999513585, 0.025834030924316888, 0.025914336797980015, 0.02602381109033091, 0.026140386410418704, 0.02623718623392506, 0.02623347214660549, 0.026087164161242606, 0.025734955540025507, 0.025124593073737454, 0.024243608387318236, 0.02304915732751178, 0.02166404809597038, 0.020309195142369757, 0.018992013917958853, 0.017261429390819556, 0.014782849426937621, 0.011247665527922189, 0.0063526736541778175, -0.00018412081208445816, -0.008522086533306068, -0.018367115092553017, -0.028984640890088096, -0.039831098789160004, -0.050520121345939285, -0.06123529942622775, -0.0725301152209178, -0.08432688687608154, -0.09637671275378012, -0.10794563371303206, -0.11839865552477385, -0.12760587786216682, -0.13559876422865605, -0.1424154677585585, -0.1480329326735102, -0.15245560537974168, -0.15565093324031423, -0.15783507839903138, -0.15900780451807917, -0.1591460238977051, -0.15836676162467697, -0.15681475930864508, -0.15471945025439227, -0.15239613395230803, -0.15006613716169198, -0.14767336584416252, -0.1451337420387221, -0.1423600187466661, -0.13922861269105175, -0.13565628438339256, -0.1316500542015723, -0.12726818472823856, -0.12257281672645788, -0.11767050722960826, -0.1126242098836872, -0.10735236187538079, -0.10176672297065392, -0.09577809744856668, -0.0892847953523094, -0.08216572402288656, -0.07485341451283829, -0.0661939509908605, -0.05659083117342155, -0.04588173072997384, -0.03381808976931016, -0.020111195125369675, -0.00471213293402426, 0.013239030603391547, 0.032383751037736115, 0.04037197495433924], [0.44926461521682104, 0.44839130077798617, 0.446281614864128, 0.44220333084432406, 0.4350136907465265, 0.42316416747945973, 0.4048125970964792, 0.3780997714879427, 0.3413514332282226, 0.29611896262992476, 0.24881317746442125, 0.20462671715623718, 0.1659686210138052, 0.13347766752347684, 0.10712664427726695, 0.08658178805277823, 0.07113293295459533, 0.060378200828464026, 0.053464398583251395, 0.04957180126208135, 0.39705398348238796, 0.40265812548394103, 0.4100803761706026, 0.4190375809450949, 0.42894472745094614, -0.3599241927788663, -0.30632081390045807, 0.0344125514606039, 0.034446498080435387, 0.034247220134539354, 0.03413365325027311, 0.034136409964158856, 0.034221357138094655, 0.03434915059968149, 0.034489908025833925, 0.03460818172454322, 0.03460191877412851, 0.03440942556441253, 0.03394770291849906, 0.03314323193099051, 0.03198038314412953, 0.030404461831667257, 0.02857667955807559, 0.026786967549963837, 0.025051502672639798, 0.02277992376827086, 0.019531929331219132, 0.014902660130288835, 0.008494646806373546, -6.186240130056003e-05, -0.010980412652268167, -0.02387251070881823, -0.037776719684652696, -0.05198153199994362, -0.06598092419584, -0.0800148011504775, -0.09480707602398364, -0.11025582412736797, -0.1260356228303072, -0.14118734725416482, -0.1548889470768527, -0.1669685175203007, -0.17744594245681072, -0.18638203057071637, -0.19374853768663156, -0.1995537755678343, -0.20377364767058645, -0.20665770516505377, -0.2082073764572696, -0.2083737065774476, -0.2073183514819555, -0.20524054957433693, -0.2024459826999567, -0.19935312560404378, -0.19627138823165993, -0.1931242448790998, -0.18979324655156235, -0.18616096789914957, -0.1820639674291731, -0.17739199000965172, -0.1721536395304381, -0.16642481009486343, -0.16028655672107964, -0.15387815976127067, -0.14728188789680247, -0.14039093269869765, -0.13308984287138, -0.1252617855768952, -0.11677360373514739, -0.10746677521153995, -0.09771821200595734, -0.08639504001626583, -0.07384110591467757, -0.059845909733094164, -0.04409019923932134, -0.026210322576050715, -0.00591346198314506, 0.017526055121871113, 0.042581775099976536, 0.054003464783336355], [0.5398534647605587, 0.5388023243678953, 0.5362651399450947, 0.5313617036023771, 0.5227183302474471, 0.5084735508607271, 0.48641281479970294, 0.4543007481096531, 0.41012411887818806, 0.35574755968648375, 0.29887636149528235, 0.24575017193387344, 0.19926231539750344, 0.1601955525044404, 0.1285023313491251, 0.10375894054920588, 0.08513920313830355, 0.0721506688947199, 0.06375908014745676, 0.058964960042089974, 0.41172527028077177, 0.41713799000190405, 0.42452079646384844, 0.43351958241613253, 0.4434762644078642, -0.3591118566903994, -0.3126152013609135, 0.04178942243461238, 0.04171324844582402, 0.04142620867832724, 0.04126229860876348, 0.04124733194939173, 0.04133495610076756, 0.0414774055039389, 0.04163806006026013, 0.0417741350032588, 0.041781773883456184, 0.04155193955537335, 0.0409857012353524, 0.0400111033417728, 0.03861008369204866, 0.03671556467082023, 0.03452067671684466, 0.03237338264612116, 0.030292909259861424, 0.027569824693102193, 0.02367483193148388, 0.018121282050576313, 0.01043128874474127, 0.00016036856481014574, -0.01295177493134506, -0.02843610843401229, -0.045137724217228455, -0.06220189757428222, -0.079020519657012, -0.095881602037924, -0.11365459924143577, -0.13221680089365062, -0.15117737806420165, -0.16938492644625575, -0.185858151654399, -0.20038908567189637, -0.21298628608619102, -0.22373054570093784, -0.23258930951440115, -0.23957438530571898, -0.24474879051297446, -0.2482366541343835, -0.2500557259506179, -0.25022574552335, -0.24894221612563885, -0.2464376011029991, -0.24307632492965112, -0.23935969085441705, -0.23565852532597648, -0.23188026959025607, -0.22788189887676766, -0.2235220945393576, -0.21860436248684592, -0.21299651949980355, -0.206708808098685, -0.199832260736193, -0.19246413225314912, -0.1847716882313065, -0.17685373142431401, -0.16858191656651603, -0.1598175234506743, -0.15042015950828472, -0.1402298262112516, -0.12905606023392924, -0.11722004027324995, -0.10362284559518128, -0.08854978683085994, -0.07174908874135984, -0.05284078772850971, -0.03139748514025881, -0.0068305049919226545, 0.021201906901787942, 0.051305429825852206, 0.06572084017109914]], [[0.019634644642015253, 0.0196864436581452, 0.019762500782329922, 0.019827895099133682, 0.019834260193553468, 0.01970832594221847, 0.019361133519284698, 0.01867056070183975, 0.01746098313640143, 0.01574584134790359, 0.01381388110313838, 0.011847285439263545, 0.01002672066024135, 0.008411906841021537, 0.007028474868523922, 0.005874448274148609, 0.004936010607107445, 0.0041974442394526025, 0.0036215156613845882, 0.003170004628833604, 0.05920011403194849, 0.05986028057647012, 0.0607876123195744, 0.06199153213081863, 0.06348901170980789, 0.06530543427376839, 0.06744060649801961, 0.06979092351075845, 0.07234110741939422, 0.07510725609515238, 0.07810673197681213, 0.08135342937771836, 0.08485208423969526, 0.08855081509301821, 0.08671342444829874, -0.023152005656039906, -0.007906754771409548, -0.00042990858353134716, -0.00031432937296871317, -0.0003791711128232836, -0.0004806424346820838, -0.0006137481126474492, -0.0007714424701107746, -0.0009435783869150675, -0.0011302515941189369, -0.001351495105378642, -0.001619387120842488, -0.0019429756896601482, -0.0023287998337336415, -0.002780173673265954, -0.0032919539483099625, -0.003844136685971062, -0.004398776333734913, -0.004929480710151697, -0.005421615327191234, -0.005885584402238866, -0.006349091357536899, -0.006813125265737392, -0.007271173164742404, -0.007693606695128436, -0.008055306676370822, -0.008343838540821326, -0.008569985787031694, -0.008741409454009386, -0.008859893573923016, -0.008928028413640309, -0.008949406169582176, -0.008928798783827775, -0.008866622206603258, -0.00876342452062283, -0.00862521371469704, -0.008458864630495385, -0.008275131558679913, -0.008086317088060443, -0.00790106035075255, -0.0077170996952281076, -0.00753030200212794, -0.007336663510892153, -0.007130824280037851, -0.006910405384542653, -0.006675582945153061, -0.006428687304455061, -0.006172334412130658, -0.005911224901328813, -0.005647228951892418, -0.005375772563169086, -0.005093640602347315, -0.004797547317047492, -0.00448378862231955, -0.004148083953330386, -0.004744559865171695, -0.004502193970236916, -0.0028358457923339324, -0.002342930185804849, -0.001795870441834521, -0.0011822337341539793, -0.00048664622530298404, 0.00033750152588959796, 0.0012878199396725652, 0.000510009426072368], [0.09118166848151957, 0.09140799925550636, 0.09176445133397358, 0.09209470649064391, 0.09215980836918462, 0.0916045975396856, 0.08997577686537338, 0.08670277425691583, 0.08106534781092987, 0.07304632292247008, 0.06388990218875336, 0.05466800944203596, 0.046133255890921626, 0.038577606625667726, 0.032101983662387826, 0.02668823207762522, 0.02226860214532023, 0.01876662319627248, 0.016011369395619104, 0.013829353348808728, 0.0692024395440723, 0.0687735219046474, 0.06883568273426575, 0.06934007543969463, 0.07025475772107884, 0.07156456670430945, 0.07324136244899208, 0.07517700827849838, 0.07735319725101357, 0.07977944639571542, 0.08246703151502109, 0.0854120696722432, 0.08858764637617446, 0.09185047533184686, 0.08325536437608423, -0.02048897453619143, -0.006676692414950957, -0.00011785781171150199, -0.0001412725518693761, -0.0005778590731586974, -0.0011320070892837622, -0.0018016895904832966, -0.0025641442872619364, -0.0033790123126539473, -0.0042507424612569815, -0.005274165525724303, -0.0065067687783428975, -0.007991926819652832, -0.009761765820020819, -0.011833616778181536, -0.014191316061902227, -0.016738505630056643, -0.019300865320580566, -0.021757341820077963, -0.02404009875494175, -0.026196380602867872, -0.028352551838789333, -0.030511052935700403, -0.03264067617099977, -0.0346039330813281, -0.03628489541556426, -0.03764891248429544, -0.03872278716735346, -0.0395317633840111, -0.04009285711409507, -0.04041805861893855, -0.040524134308733174, -0.04043342644374459, -0.04014820496321571, -0.03967142766457582, -0.0390309522085636, -0.03825881630792084, -0.037405258604763444, -0.0365262355429074, -0.035659775486942075, -0.03479482264913967, -0.033912113786436465, -0.0329925923901186, -0.032010975462293347, -0.030956771841698972, -0.02983263679637389, -0.02864880856386471, -0.02741749074078369, -0.0261605518319119, -0.024885350257150878, -0.023568830255238832, -0.022194833321872356, -0.020746272842034213, -0.019203388774030775, -0.017543212922350275, -0.01634602369227173, -0.014430949391807986, -0.012341613288080077, -0.010048542368570704, -0.007504751502432709, -0.004659907663659785, -0.0014528601011191938, 0.002246907890110539, 0.00625377823514216, 0.005308301108328959], [0.17394903387950159, 0.17437438490743037, 0.175055863406112, 0.1756979018998126, 0.1758381567090419, 0.17479235176237773, 0.1716775696875628, 0.16540376186570607, 0.15463998598762518, 0.1393175174612823, 0.1217662514649557, 0.10413317341976873, 0.08781502311388366, 0.07337539800127844, 0.0609986485982028, 0.05064608477968407, 0.042186838312176886, 0.03547345263066438, 0.030180745384385775, 0.025979560485038133, 0.08051914536180954, 0.0788304516602304, 0.07789200831170433, 0.0775875700922065, 0.07782865049562025, 0.07855322279985219, 0.07970103728759972, 0.08115973042753723, 0.08290835374707849, 0.0849498563618632, 0.08729028583727982, 0.08990891512526303, 0.09275167161624966, 0.09561044781877027, 0.0823585141147103, -0.017987440521093176, -0.005199430443359871, 0.0006239476608772129, 0.00032618125983154114, -0.0005679087851879096, -0.001662533512261006, -0.00296339099480699, -0.00443155597413065, -0.005993090895657046, -0.0076582919672103286, -0.009608882595829659, -0.011955163593166953, -0.014780494274402154, -0.018146957315657894, -0.02208849213816915, -0.026577751614335482, -0.03142934781453003, -0.036311583358656876, -0.040994346605657074, -0.04535007253071152, -0.04946781176064911, -0.05358691114030132, -0.05771047984036739, -0.061778063821209234, -0.06552702262932239, -0.06873612182532225, -0.07134934518030676, -0.07340715433663977, -0.0749756119404069, -0.07606986989300538, -0.07671333793166399, -0.07693833783017533, -0.07678775762175706, -0.07626623824103392, -0.0753796708855993, -0.07418112938685437, -0.07273151666148912, -0.07112639639432193, -0.06947204124282925, -0.0678405412932116, -0.06621091164772706, -0.0645467829676363, -0.06281213796630827, -0.06095906829574856, -0.05896796641239113, -0.05684178910174887, -0.05460125090832573, -0.052269421624036694, -0.04988756612977926, -0.04746720617882117, -0.04496534508778316, -0.04235502155720857, -0.03960284463160559, -0.03667171185205607, -0.03351825401661194, -0.030813205119063478, -0.027158077663393992, -0.02317080470610394, -0.018769740704685376, -0.013939943403509387, -0.008514953456871158, -0.002407278738321037, 0.004593244548253736, 0.01205365899749515, 0.011454779680302533], [0.47437831994681884, 0.4755204256219378, 0.47738297715053946, 0.47916728461877006, 0.4795944519083797, 0.476779654396121, 0.4682645731942216, 0.45107219246461633, 0.4216927295558406, 0.379838719905809, 0.3317424847019831, 0.28354302004564125, 0.2389408017849179, 0.19949121238967046, 0.1656742375954338, 0.137373081989635, 0.1142263442360082, 0.09582752048970766, 0.08129229563248866, 0.0697280577765213, 0.12093870685362461, 0.11467474892339305, 0.11010148017465425, 0.10685795678578656, 0.10465044111541773, 0.10324677602315722, 0.10247056786257303, 0.10219638835856233, 0.10239542924059968, 0.10304879270493005, 0.10414704129018995, 0.10561553308014343, 0.10732007679088498, 0.10889739928313875, 0.0849255748140851, -0.009972450404723884, 0.0002924134918120187, 0.004056376036475948, 0.0025326305424919677, -8.425997601433852e-05, -0.0031830227286481906, -0.006806101613434641, -0.010860341275710454, -0.015153451306313796, -0.01971950628019638, -0.025056815304075743, -0.031468229104667934, -0.03918295072579518, -0.048372363757089275, -0.05913081141854611, -0.07139228470683916, -0.08464575623759066, -0.09798808968565836, -0.1107926306114619, -0.12270652744939495, -0.13397235919296618, -0.14524099866932685, -0.15651907641576016, -0.16764127578122848, -0.17789214118430535, -0.18666989573765394, -0.1938513810857972, -0.19951808239316698, -0.20384952438586176, -0.20688693346918904, -0.20869456616220977, -0.20936090113633105, -0.20897338268358245, -0.20757544281326093, -0.20518419687298572, -0.20194397069992515, -0.1980198501450611, -0.19367089262338666, -0.18918406561742393, -0.18475344707245156, -0.18032268707018842, -0.17579446519441394, -0.1710720928948946, -0.16602634235273897, -0.16060548844406053, -0.15481930567276664, -0.14872469387988968, -0.14238420178074174, -0.13591014264153461, -0.12933907682384396, -0.12255137757845824, -0.11546457895220068, -0.10799078878749177, -0.1000277790822185, -0.09145619100231732, -0.08299232333221827, -0.07301983476715979, -0.06214238586634941, -0.05020269211849761, -0.036960417870168065, -0.022172134859195374, -0.005545205423230079, 0.013385486053203567, 0.03321983874840729, 0.03493813954402214], [0.7495328050724682, 0.7513286738062184, 0.7542735509794637, 0.757109059117578, 0.7578057295255759, 0.7533763695287783, 0.7399121895720814, 0.7127073027357234, 0.6662744380604595, 0.6001107267194442, 0.5240043018711042, 0.4477930859452591, 0.3772711266360057, 0.3149049230579954, 0.261441797268474, 0.21669172025398764, 0.18008147301251284, 0.15096663916228661, 0.1279511855504291, 0.1096272054437845, 0.15744368437749467, 0.14698474079788118, 0.13907692563846538, 0.1331350656630893, 0.12867732751721012, 0.125315594382567, 0.12276726645509488, 0.1208963963308491, 0.11966784816668811, 0.11904359578759768, 0.11899191283831403, 0.1194006625157143, 0.12007094420835704, 0.12053537712198673, 0.08966182984467884, -0.0031279030172674145, 0.005318460449613888, 0.007453955610893582, 0.0046936723807045125, 0.0004649269107022162, -0.004494300856171569, -0.010264213578029488, -0.016703867617357565, -0.023513610588737, -0.0307497284723387, -0.039200864929725826, -0.049346484247657786, -0.061549458257757504, -0.07608133324146374, -0.09309186093772488, -0.11248083376195092, -0.13343791424604706, -0.1545365048936011, -0.17478674059448757, -0.1936306984538646, -0.21145096436849198, -0.22927483175661134, -0.24711180707541736, -0.2647004656480108, -0.28091078816136344, -0.29473447523486246, -0.3060460784718967, -0.31496151543239925, -0.32176515667142114, -0.32652293090622814, -0.3293373124474251, -0.33034897433181726, -0.3297443024414933, -0.32754551447721475, -0.3237794339492105, -0.3186737518430247, -0.3124889030422024, -0.305633907323426, -0.2985619230593322, -0.29157928773474867, -0.28459674412970326, -0.27746057541883656, -0.27001806003080286, -0.26206502451094765, -0.2535197639384413, -0.24439776599547, -0.23478891562129478, -0.22479198405158762, -0.21458441761716113, -0.204224007599319, -0.19352183755770655, -0.1823477616900395, -0.17056308606984039, -0.15800659447088383, -0.144490092399656, -0.13059386836964473, -0.11486250720083241, -0.09767407778541075, -0.07880671152687019, -0.057750814597527046, -0.03451609335323395, -0.008259551919859907, 0.02157318524678567, 0.052663191619272985, 0.05700803074225442], [1.0706249699232617, 1.073182339200308, 1.0773905609194874, 1.0814554042891145, 1.0824700958244153, 1.0761595547578529, 1.05691837787941, 1.0180228264450755, 0.9516874475474042, 0.8571501149162198, 0.748338836708336, 0.6394304005692025, 0.5386533879132804, 0.44953897800248965, 0.3731446665770253, 0.3091940745571206, 0.25686644617079274, 0.21523938750002952, 0.18231991149569585, 0.15609918390477662, 0.19954688628394404, 0.18418628556174427, 0.17237960978843986, 0.16327985648079985, 0.15618551158122776, 0.15052623832006912, 0.14589555521907918, 0.1421333751253961, 0.13920975950031478, 0.1370645123764535, 0.1356613564426067, 0.13482737780439577, 0.1342925477015632, 0.13348780022817203, 0.09608574599500948, 0.004735293490752312, 0.011269224011186726, 0.011612132915638184, 0.007355333967670895, 0.0012342806333620468, -0.005902130644396786, -0.014180216939501028, -0.023404202826935918, -0.03314975344415437, -0.04349940510713439, -0.055580753945670205, -0.07007949414503586, -0.08751463333461637, -0.10827483068541188, -0.13257479031278416, -0.16027529936166127, -0.19021652631312555, -0.2203613108380771, -0.24929614953313706, -0.2762238392832237, -0.3016902551888969, -0.3271617492301787, -0.3525680260310336, -0.3776147166660868, -0.4006880761280526, -0.42043145942784715, -0.4366011083787886, -0.4493496010405424, -0.4590825504511148, -0.4658938421576381, -0.4699298114852876, -0.47139133107730785, -0.4705445701692764, -0.467421296942146, -0.46205993901270287, -0.4547856498350031, -0.445970245022255, -0.4361978343363464, -0.4261155852731448, -0.41616087847962474, -0.40620609407822134, -0.39603178547391554, -0.3854199209455803, -0.3740789326560588, -0.36189218630210557, -0.3488818880694936, -0.335176447759879, -0.3209169236247602, -0.306356785355658, -0.2915786156047682, -0.27631265980863157, -0.26037314618436913, -0.24356209208156485, -0.2256494163606551, -0.20636664313310044, -0.18632447556448714, -0.16359888464572572, -0.13905297449033419, -0.11210102357324782, -0.08221034070788304, -0.04884208677404633, -0.01135041045832388, 0.03119200799199687, 0.07537671871283329, 0.0830512214669968], [1.3749932016412947, 1.3782716107533939, 1.3836775587259824, 1.3889091996370988, 1.3902273437647212, 1.3821352648300151, 1.3574170575231082, 1.3074360366342503, 1.2222336197626822, 1.1007974580931381, 0.9609743819377536, 0.8210667377902264, 0.6916059892579883, 0.5771333637446152, 0.4789993589361451, 0.39684523923889686, 0.32961540355024416, 0.2761237634095637, 0.23381158128999802, 0.20010061925031486, 0.23921678536754398, 0.21920695118649136, 0.2037010243172289, 0.19160373573609016, 0.18200525168816123, 0.17414558709864877, 0.16751677505263476, 0.1619616665603702, 0.15743181950408106, 0.15384641470788965, 0.15115631679338135, 0.1491401348477912, 0.14746294379174485, 0.14547052830538001, 0.10274248265169568, 0.01208824412735522, 0.01693435368424282, 0.015643113072945244, 0.009935423957413812, 0.002012100117673579, -0.007193808162283372, -0.01785353306597171, -0.029719892663135055, -0.042250741822717645, -0.055553718614079976, -0.07107782990277754, -0.08970433388100417, -0.1121002924580796, -0.1387654289958447, -0.16997606148528688, -0.20555636331963578, -0.24401493709784441, -0.2827358948353437, -0.3199041902866323, -0.35449577618348066, -0.38710297317077375, -0.41971118801549867, -0.45233724376750895, -0.4845018579851767, -0.5141328033070074, -0.5394883388370473, -0.5602652237786575, -0.5766494616922498, -0.5891615366841305, -0.5979218090739266, -0.6031181895600398, -0.6050086106087545, -0.6039348634910416, -0.5999377703006501, -0.5930667700273499, -0.5837393948617822, -0.572433021199897, -0.5598977164402947, -0.5469645434745904, -0.5341950859754817, -0.5214253485316536, -0.5083735920843914, -0.4947598889811253, -0.48020983603344625, -0.46457369325492026, -0.44788004197483444, -0.4302938101052345, -0.41199613501276716, -0.3933125477195809, -0.3743491327633644, -0.35475951443256104, -0.3343051950930637, -0.3127319849066004, -0.28974450806324675, -0.26499814959938744, -0.23909335994893002, -0.20995469040300943, -0.17811714905344805, -0.14361170916429639, -0.10522224494582343, -0.06237001754165336, -0.014229892140929989, 0.04035283776646136, 0.09692714076966016, 0.1079072259039267]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "fidelity": "Blade_Element_Momentum_Theory_Helmholtz_Wake", "cruise": {"design_power": 215540.6189729788, "design_thrust": 3150, "design_torque": 1121.5914561942334, "design_power_coefficient": [0.09985504896335906], "design_thrust_coefficient": [0.10265825033362035], "design_torque_coefficient": 0.005, "design_Cl": 0.7, "design_efficiency": 0.86, "design_angular_velocity": 192.17391304347828, "design_tip_mach": 0.65, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": null, "design_blade_pitch_command": 0.0, "design_freestream_velocity": 58.1152, "design_altitude": 457.20000000000005}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 0.0, 0.0], "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "electric_propulsion_fraction": 1.0, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 1.0, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "rotation": 1, "variable_pitch": true}, "electronic_speed_controller": {"tag": "propeller_esc_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "bus_voltage": 588.0, "efficiency": 0.95}, "active_crypgenic_tanks_tanks": null, "nacelle": {"tag": "propeller_nacelle", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[5.583, 1.3, 1.092]], "aerodynamic_center": [0.0, 0.0, 0.0], "areas": {"front_projected": 0.0, "side_projected": 0.0, "wetted": 0.0}, "diameter": 0.4, "inlet_diameter": 0.0, "length": 1.24, "orientation_euler_angles": [0.0, 0.0, 0.0], "flow_through": false, "has_pylon": true, "differential_pressure": 0.0, "cowling_airfoil_angle": 0.0, "segments": {"segment_1": {"tag": "segment_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.0, "percent_y_location": 0, "percent_z_location": 0, "height": 0.0, "width": 0.0, "curvature": 2}, "segment_2": {"tag": "segment_2", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.08064516129032259, "percent_y_location": 0, "percent_z_location": 0, "height": 0.2, "width": 0.2, "curvature": 2}, "segment_22": {"tag": "segment_22", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.12096774193548386, "percent_y_location": 0, "percent_z_location": 0, "height": 0.25, "width": 0.25, "curvature": 2}, "segment_4": {"tag": "segment_4", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.16129032258064518, "percent_y_location": 0, "percent_z_location": 0, "height": 0.3, "width": 0.3, "curvature": 2}, "segment_5": {"tag": "segment_5", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.20161290322580647, "percent_y_location": 0, "percent_z_location": 0, "height": 0.35, "width": 0.35, "curvature": 2}, "segment_6": {"tag": "segment_6", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.40322580645161293, "percent_y_location": 0, "percent_z_location": 0, "height": 0.4, "width": 0.4, "curvature": 2}, "segment_7": {"tag": "segment_7", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.6048387096774194, "percent_y_location": 0, "percent_z_location": 0, "height": 0.35, "width": 0.35, "curvature": 2}, "segment_8": {"tag": "segment_8", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.7903225806451613, "percent_y_location": 0, "percent_z_location": 0, "height": 0.3, "width": 0.3, "curvature": 2}, "segment_9": {"tag": "segment_9", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 1.0, "percent_y_location": 0, "percent_z_location": 0, "height": 0.0, "width": 0.0, "curvature": 2}}}, "sealevel_static_power": 221697.0018051931}
\ No newline at end of file
+{"tag": "cruise_propulsor_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "active": true, "wing_mounted": false, "sealevel_static_thrust": 6192.372498200064, "working_fluid": {"tag": "air", "molecular_mass": 28.96442, "gas_specific_constant": 287.0528742, "composition": {"gas": 1.0, "O2": 0.20946, "Ar": 0.00934, "CO2": 0.00036, "N2": 0.78084, "other": 0.0}, "specific_heat_capacity": 1006, "air_surrogate": {"O2": 0.2095, "N2": 0.7809, "AR": 0.0096}, "kinetic_mechanism": "Air.yaml"}, "motor": {"tag": "propeller_motor_1", "mass_properties": {"mass": 46.995026558550954, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "working_fluid": {}, "active": true, "resistance": 0.07618996086121739, "no_load_current": 0.001, "speed_constant": 0.34402687970133916, "efficiency": 0.95, "gearbox": {"gear_ratio": 1.0}, "design_angular_velocity": 192.17391304347828, "design_torque": 1121.5914561942334, "design_current": 385.85860897418104, "inverse_calculation": false, "interpolated_func": null, "nominal_voltage": 588.0, "wing_tag": "horizontal_tail"}, "rotor": {"tag": "propeller_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "number_of_blades": 3, "tip_radius": 1.15, "hub_radius": 0.11499999999999999, "twist_distribution": [1.2858001219480846, 1.1582492970311906, 1.0442917586489076, 0.9444683956520885, 0.858067161290893, 0.7836133725611228, 0.7194144512783092, 0.6639209016481162, 0.6157552599841788, 0.5737406914123029, 0.5368931139356415, 0.5043985341063237, 0.4755866658934704, 0.4499058626865057, 0.4269012596338416, 0.40619652761930636, 0.38747899970815813, 0.37048771660062596, 0.3550039477106991, 0.34090429809360334], "sweep_distribution": 0.0, "chord_distribution": [0.05734547492806923, 0.10179378482846743, 0.1424460499520111, 0.17392695563242955, 0.19515355674578658, 0.2073509810298643, 0.21248451184642214, 0.2124541648939738, 0.20879110996809608, 0.2026165012049558, 0.19469706553420355, 0.1855206933798622, 0.175362234999023, 0.16433061903459759, 0.15239531816761623, 0.1393894449423898, 0.1249786983138569, 0.10855956485404965, 0.08895043005400863, 0.06314537296638266], "thickness_to_chord": [0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465], "max_thickness_distribution": [0.006899535955980281, 0.012247346096623877, 0.01713843410773116, 0.020926067586071313, 0.023479951703145253, 0.02494748802617514, 0.025565130141693426, 0.025561478940097585, 0.025120757519592734, 0.0243778578360722, 0.023425028842503557, 0.022320971204063036, 0.021098753601996888, 0.019771481814735713, 0.018335482939838034, 0.01677067786901198, 0.01503684508376083, 0.013061372706662614, 0.010702094476109082, 0.007597352219714385], "radius_distribution": [0.11499999999999999, 0.16675, 0.21849999999999997, 0.27025, 0.322, 0.3737499999999999, 0.4255, 0.47725, 0.5289999999999999, 0.58075, 0.6324999999999998, 0.6842499999999999, 0.736, 0.7877499999999998, 0.8394999999999999, 0.8912499999999999, 0.9429999999999998, 0.9947499999999999, 1.0464999999999998, 1.09825], "blade_pitch_command": 0.0, "mid_chord_alignment": [0.0, 0.01111207747509955, 0.021275143755985465, 0.029145370176090077, 0.034452020454429334, 0.037501376525448764, 0.038784759229588225, 0.03877717249147614, 0.03786140876000671, 0.03631775656922164, 0.034337897651533576, 0.03204380461294824, 0.029504190017738442, 0.026746286026632086, 0.023762460809886747, 0.02051099250358014, 0.016908305846446918, 0.012803522481495104, 0.007901238781484849, 0.0014499745095783566], "blade_solidity": 0.11402285267735066, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "airfoils": {"airfoil": {"tag": "airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402465, "max_thickness": 0.12031526401402465, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.016043449318962084, 0.019590256985204432, 0.02245677294482681, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.02976247187814689, 0.03120944342544214, 0.03276888891442653, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.04138168201270342, 0.043831218912609625, 0.04622131608757142, 0.04846502418500166, 0.050526443585207935, 0.05241695312849192, 0.05414971456533544, 0.05573788964622039, 0.05719464012162861, 0.05853647479776234, 0.05981375461787535, 0.06109649672976446, 0.06245496040041921, 0.06395940489682914, 0.0656800894859838, 0.0676688505121781, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275303, 0.0842766016889327, 0.085710806953059, 0.0870379883892214, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022884, 0.09268290622537607, 0.09359994223597635, 0.09443196809870935, 0.09517814045560118, 0.0958443004626162, 0.09643671550245721, 0.096961652957827, 0.09742538021142831, 0.09783279989437105, 0.09816741123853424, 0.09839571958896257, 0.0984837621809043, 0.09839757624960772, 0.09810319903032118, 0.09757115844868458, 0.09680920794395251, 0.09584350726715764, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.0904643327380958, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783351, 0.07651653661409304, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.06609674614077089, 0.06331982631104899, 0.06044200824136898, 0.05742402352501027, 0.054226603755252165, 0.05081048052537401, 0.047139368762024875, 0.04325609416755832, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.02820878356517617, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.01671358326777673, 0.01500107028568076, 0.013274898166135715, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.003665223223884563, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413802, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.018968040272831232, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.02271885485138349, -0.02367032713380571, -0.024535690747991005, -0.025270626378542282, -0.025865827824930857, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112896, -0.027577905285351957, -0.027817779092228732, -0.028040959225367316, -0.028244741943301413, -0.02842642350456472, -0.028583300167690947, -0.028712472367814792, -0.02880992257703332, -0.02887123715297097, -0.02889200198907823, -0.02886780297880557, -0.02879422623767004, -0.028668152085203107, -0.02849080290872854, -0.028264310680272065, -0.02799080737185942, -0.027672424955516337, -0.027311321418476225, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.025633665966898873, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.02222011929783598, -0.02149485811539941, -0.020697040726644425, -0.01985855320935335, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.01600951205009446, -0.015348714944608753, -0.014696685836695608, -0.014039154630508432, -0.013364802023979244, -0.012676394865126254, -0.011980898543506178, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.00802202799789677, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.005370460001161809, -0.004922598050038695, -0.004500041231814651, -0.004101592290880574, -0.003726130229006508, -0.003374556208971546, -0.003049954856793557, -0.002755519375891563, -0.0024944429696845878, -0.002269918841591665, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.0016082936412161188, -0.0015644504055181275, -0.0015249242118237462, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.0013576126052634095, 0.0024695527728248144, 0.003369024561693369, 0.0040892320308782235, 0.004663379239388539, 0.005124670246233462, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797651, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659965, 0.010080445889401959, 0.010842812669790206, 0.011597198903229692, 0.01233030788013854, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.01493535663325786, 0.015479284756205192, 0.01599798776282331, 0.01652776875219857, 0.0171051092285589, 0.017766490696132207, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.02166436767347927, 0.022834536936970913, 0.023998601824185305, 0.025113446025102817, 0.026147338867613706, 0.02710674861201224, 0.028006145504330313, 0.028859999790599788, 0.02968278171685253, 0.030488907954972666, 0.031285257126835116, 0.03206346266089256, 0.03281331888555653, 0.033524620129238604, 0.03418716072035033, 0.034791054320257794, 0.03533800740067584, 0.03584432730423963, 0.03632725237345171, 0.03680402095081467, 0.03729187137883104, 0.037806340298267536, 0.03833627656156741, 0.03884933943115907, 0.039312604485775476, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.03991699760853159, 0.03967581602068806, 0.03935466591571174, 0.03897382762536841, 0.03854976535705828, 0.038080726355359515, 0.03755952808633414, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.034812758024605164, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.02987492890811462, 0.028737500985127944, 0.027535774120103586, 0.026250712737485787, 0.024863281261718755, 0.023354444117246718, 0.021706619266509183, 0.01994076897929339, 0.01811947440626736, 0.016307386286377533, 0.014569155358570335, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.006696388322232322, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/sai/Documents/Research/LEADS_Research/RCAIDE_LEADS/VnV/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696687, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522144, 1.3189900988029917, 1.2133829765808901, 1.0761215426599497, 0.9043572397947004, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387613, 0.6364767634570125, 0.6587556980553567, 0.680972878036534, 0.7031258927040288, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.0321, 0.028095562130177523, 0.024411479289940825, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544, 0.022460710059171607, 0.01971976331360947, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648], [-0.09994117752385662, -0.09711004127918234, -0.09581086054830666, -0.09459784035861402, -0.09245347189548461, -0.09153257076964846, -0.09001574556005648]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744561908, 1.6324685435018864, 0.5984913458180275, 0.04447241567611945, 0.0057528331320200795, 0.0022393881794874303, 0.00014972371545378795, -0.0018771829603368912, -0.004555800736470006, -0.008093622361508465, -0.012114355480663532, -0.016291901080270555, -0.020439762425065504, -0.024437973806805246, -0.028216333043157214, -0.0317315025781406, -0.03494448187634495, -0.03779737471329425, -0.040181487634110384, -0.04193912931106033, -0.04467171053295017, -0.0451392245636954, -0.0451339178895979, -0.04472768294806369, -0.04405890649736998, -0.04337421815598758, -0.043018340205243026, -0.043012049351105565, -0.04320767012260687, -0.04351472623982401, -0.04388565947288009, -0.044287300888710426, -0.04469828938296477, -0.04509989436113371, -0.04546735656437459, -0.04576920660704229, -0.046015314952377005, -0.0462240402405635, -0.046365166633289, -0.04645605314918964, -0.04653288006898395, -0.04671797254318854, -0.047083065928941445, -0.047499086276526596, -0.04775948592382151, -0.04760816383732132, -0.04684604980216389, -0.04528031292097421, -0.042713584121938375, -0.03901834478488894, -0.03437040460126495, -0.029007852787020488, -0.023063730192226194, -0.016477168880098158, -0.009110509560628765, -0.0006961191116058339, 0.008415882155061297, 0.017493788088880306, 0.0256882263052477, 0.03262292188114894, 0.038527456799912985, 0.043673453822447875, 0.048200840390853456, 0.052103418303398236, 0.05536649359694452, 0.05799425887866476, 0.05999204270504046, 0.061335023500993, 0.06208147687741848, 0.062377217603170776, 0.06237415287184756, 0.06222841755769565, 0.06215264275945922, 0.062380710298768946, 0.06286144243604938, 0.06339111033180013, 0.06384324092559748, 0.06411876149201601, 0.0641076809141402, 0.06376331251328596, 0.06315447942297686, 0.062348272665749424, 0.06139278392606334, 0.060344746708086136, 0.059241546973631994, 0.058050941459205974, 0.05670370870088394, 0.05514342384033382, 0.05331838468269414, 0.05116499737970429, 0.04880750528421766, 0.0459144495591565, 0.0426806821934551, 0.03908522064104863, 0.0350946692663439, 0.030604159604929848, 0.02533364258248545, 0.018772596766888625, 0.009759473873716984, -0.00404696600042991], [-1.054613963720178, 0.8610460920260787, 0.31333322151896725, 0.03397673714180107, -0.012938687708860567, -0.015546259166158193, -0.01700341795515043, -0.019611513549386003, -0.024770739835784834, -0.03281058292115555, -0.04259590544654223, -0.053173350520733895, -0.06392493836034452, -0.07444700231806113, -0.0844966645782503, -0.09391945593442005, -0.10258172789508888, -0.11030495148130051, -0.11675806491997612, -0.12144938227306318, -0.1264158928168509, -0.12776344456352723, -0.1277835142506375, -0.12667840071076683, -0.12483821514807998, -0.12295961897805041, -0.12201220550434227, -0.12205343067768623, -0.12266298347332959, -0.12358699744244188, -0.12469213643098909, -0.12588665128426574, -0.12711059525736115, -0.12831151596237111, -0.12942032969479852, -0.13034947378887368, -0.1311217832918012, -0.13177538343300887, -0.13226304827595578, -0.13261962130841937, -0.13294750310024972, -0.1335930903590646, -0.13475951684198959, -0.13608363562817702, -0.13698379279429534, -0.13673309345237247, -0.13476520013868298, -0.13052944908253325, -0.12345943171744307, -0.11318323594304819, -0.1000055419681302, -0.08477592706239298, -0.06787325234635858, -0.04913092875314781, -0.028167748297421705, -0.004230034194598691, 0.021691993520975773, 0.04752584478211224, 0.07086742988499434, 0.09064961251379634, 0.10751765227425132, 0.12223630243431625, 0.13519636202174917, 0.14637809620630532, 0.15573925358826204, 0.16329141522125887, 0.1690497408737561, 0.17294471964922584, 0.1751421861646952, 0.17605491281780963, 0.17611270122261935, 0.17575710022459315, 0.1755889159078674, 0.17627132496603565, 0.17766300413678898, 0.17918900470173676, 0.18049236800151047, 0.18129345059142293, 0.18128162211246587, 0.18032393965708832, 0.17861465194557133, 0.17634344034353888, 0.1736467475678775, 0.1706884906955886, 0.16758311217117122, 0.1642332541869771, 0.16043084503082275, 0.15602375495590073, 0.15086670897863722, 0.14478083878411038, 0.13788376888766696, 0.12978675803779607, 0.12074482551991378, 0.11070867627291876, 0.09960070219903744, 0.08715911224938391, 0.07266406902812952, 0.05458703563515416, 0.03059077553923968, -0.005079339634003193], [-0.5797499211983311, 0.47677506545965465, 0.15953590139042917, 0.01409591604234637, -0.022811181664856607, -0.02381603898136546, -0.024280485849653914, -0.026428899080389517, -0.03170197999585239, -0.04040848181702582, -0.051224422447640375, -0.0630455802350941, -0.07513705145447601, -0.08701736851700434, -0.0983953212400415, -0.1090846936022486, -0.11892552595034937, -0.12770860065077844, -0.1350469708891767, -0.14036307785711882, -0.14532078410294305, -0.1468765223121331, -0.14690912512693965, -0.1456508321590966, -0.14354968429428958, -0.14140617962632632, -0.14033329804856293, -0.14039672380666746, -0.14111263672101346, -0.14218979566389614, -0.14347526380367276, -0.14486414595266106, -0.14628766719999997, -0.14768568140473476, -0.14897904055183117, -0.15006749275602968, -0.15097590320716167, -0.15174434213198756, -0.1523289208071076, -0.15276581390614957, -0.15317273944300702, -0.1539479586724419, -0.15532501856615205, -0.15688704063884257, -0.1579661623577029, -0.1577229096119585, -0.15550864168614706, -0.15068914559190394, -0.14261140231796846, -0.13084491146726396, -0.11568750034998421, -0.09816349022468526, -0.07870945680086491, -0.057135827354905314, -0.03300684973767341, -0.005457052717306861, 0.024376865427538173, 0.05411320556803884, 0.08098911373586928, 0.10377607697750003, 0.12321287368587448, 0.14017569457596943, 0.15511435874484267, 0.16800631791600998, 0.1788029002524833, 0.1875173720425037, 0.19416720784695266, 0.19867269314953565, 0.20122418360765662, 0.20229572487807537, 0.20238133344014483, 0.2019884900223293, 0.2018075827247339, 0.20260145223288217, 0.20420930723477515, 0.20596840543750009, 0.2074709960939147, 0.20839577487897776, 0.20838584825542056, 0.2072879599732208, 0.20532509328145648, 0.2027152182066235, 0.1996152550524898, 0.19621452095023476, 0.19264687851973325, 0.18879869555729822, 0.18442747241905932, 0.17936039293474304, 0.1734307520749953, 0.1664332389305195, 0.15855747638476655, 0.14927078161274965, 0.13889867387363874, 0.12738554754548698, 0.11464421828368149, 0.10038201403698507, 0.08378698675847521, 0.06342271100104034, 0.039373501792148755, 0.002863511742108774], [-0.23448954344955272, 0.16583878929398976, 0.0052601039476532245, -0.03660187905648791, -0.039052972117777036, -0.03775598524082886, -0.03678344857875179, -0.038403970036391344, -0.04422070781251988, -0.05453367440660372, -0.06764507324571005, -0.08214874030566617, -0.09708435798108977, -0.11182100476722368, -0.12597518642581354, -0.1393004308855135, -0.15158643915837977, -0.16256366845425294, -0.171734894340631, -0.17835431639209112, -0.18365161314629305, -0.18562629143335463, -0.18567977238375008, -0.18410515079393414, -0.18146811834567309, -0.17877987280319296, -0.1774395930288589, -0.17753574094469785, -0.17845574212151236, -0.17983197477612356, -0.18147148407338248, -0.1832429123215915, -0.18505935915211413, -0.18684493978636063, -0.18850001813182032, -0.1898984714373547, -0.19106991904355936, -0.19206012824555774, -0.1928270195386006, -0.19341123674981395, -0.19396136039036288, -0.19498037909652147, -0.19676337599399574, -0.1987846122784901, -0.20020129090609448, -0.1999562342432458, -0.19722490511143176, -0.19120405023538842, -0.18106559104104666, -0.16626151437050535, -0.14710041190140463, -0.12493799689474769, -0.10032788084627711, -0.0730330012444461, -0.042505515553160116, -0.007652390196794662, 0.030090549957271905, 0.0677168081326425, 0.10173423934420979, 0.13058696751468235, 0.15520512843473955, 0.17669519339036807, 0.1956240713738026, 0.211962967778179, 0.22565011570844007, 0.2367021202394522, 0.2451410249517267, 0.2508662809780398, 0.2541186418681043, 0.2554972554324993, 0.25562655597842765, 0.2551478104451233, 0.2549330512401657, 0.25594676178730985, 0.25798700760830034, 0.2602199067462207, 0.26212751265454254, 0.26330401399018766, 0.26329855960802007, 0.2619172242317508, 0.2594416601815499, 0.2561472707314949, 0.2522324897974594, 0.24793775326864806, 0.24343526664717513, 0.238579296612394, 0.23305911352364092, 0.22665895022690924, 0.21916848479208847, 0.21032862937602836, 0.20028048858515168, 0.18857868092995625, 0.17514480492390544, 0.16070715748017483, 0.14476818213720655, 0.1269898923936548, 0.10641358267750328, 0.08139984863875857, 0.049246867055528644, 0.003259078601665281], [-0.15246479161774737, 0.08068596310856445, -0.01058311182334464, -0.043421161449735624, -0.0441861523028052, -0.04200108177137501, -0.040480308770008216, -0.04182448040019901, -0.04764214949591153, -0.05821840054586571, -0.07176757100626856, -0.08681384324705912, -0.10234151035539413, -0.11768270725729822, -0.13243089742864933, -0.1463244147257732, -0.1591404330465106, -0.1705950616633474, -0.18016501733547072, -0.18706425973101545, -0.19229908332087856, -0.194361972022473, -0.19441584608168028, -0.19276701587521267, -0.1900071132058751, -0.1871942861612447, -0.18579872459978097, -0.18590687638451997, -0.1868772404668635, -0.18832522427790296, -0.19004896106895214, -0.19191104191464076, -0.1938205768143304, -0.19569819574614616, -0.19743968205166046, -0.1989131383451948, -0.20014897048274732, -0.2011935023008387, -0.2020069530488563, -0.20263022644789708, -0.20321884503960227, -0.20429946564424734, -0.20618123741164815, -0.20831411230824393, -0.2098159587785334, -0.20957959544997168, -0.20674133581616655, -0.20045953362873956, -0.18986620754631534, -0.17438627006648266, -0.15432102389218305, -0.13111438047634164, -0.10534109494985819, -0.07675348289777816, -0.04477866979291929, -0.008272426402147275, 0.03126396751945828, 0.07067859574464906, 0.10631483355973242, 0.1365436329757253, 0.1623387579906801, 0.18485841700738556, 0.20469544353862715, 0.22181934625211008, 0.23616536964682971, 0.247750869931903, 0.2565989391253152, 0.26260437672558823, 0.26601941962901454, 0.2674714700078, 0.2676143392307945, 0.26711946945150994, 0.2668999060517981, 0.2679657111612016, 0.27010576154649607, 0.27244705626498517, 0.2744473620384244, 0.2756818403483671, 0.2756784717884606, 0.27423412687520765, 0.2716436777853564, 0.2681954770234862, 0.26409734239143284, 0.2596014128907532, 0.25488898105679, 0.24980676689243406, 0.24402803514773724, 0.23732770699208844, 0.22948567141467768, 0.22021104704954253, 0.209104883062288, 0.19688981521879548, 0.1832605026464582, 0.1681547670247235, 0.1514759144330977, 0.13287019903126623, 0.11133395560320325, 0.08515105326545955, 0.051492200845446576, 0.0033327673969899716], [-0.11377021131835013, 0.03474718408165143, -0.021420156094463575, -0.04817954888128667, -0.047796488669756124, -0.045000323921841424, -0.043101881558425204, -0.0442609101706538, -0.05009362663669717, -0.06087564065246573, -0.07475694067886722, -0.09021054866398157, -0.10618046548655545, -0.12197197572964355, -0.13716182071368868, -0.15147732357804336, -0.16468656261087167, -0.17649515838165789, -0.18636075898155888, -0.1934679328481572, -0.19864924424068528, -0.20078493208443607, -0.20084529782034902, -0.19914677909990333, -0.19630056105569083, -0.1933998031170178, -0.19196294113805318, -0.19207944415490338, -0.19308649102481676, -0.1945869382043541, -0.1963723386759659, -0.19830081430143917, -0.20027852712077898, -0.20222352945025632, -0.20402821840744437, -0.20555643152642586, -0.20683918963457412, -0.20792331430210229, -0.2087704961918643, -0.20942192171747304, -0.21003824798601917, -0.21116358710991412, -0.21311743636459726, -0.21533178429713984, -0.21689548105583825, -0.21666449153744077, -0.2137462829244743, -0.20727093779295688, -0.1963463770796435, -0.18037182098413454, -0.1596443278566588, -0.13566380387673882, -0.10902958711814202, -0.07948612522357963, -0.04644214866534903, -0.008715805019927048, 0.032141635120145506, 0.07287355608241615, 0.10970208344949402, 0.14094422230620124, 0.16760591557670743, 0.19088354347562983, 0.21138907233784285, 0.22909077078479087, 0.24392168215517462, 0.25589971771165493, 0.26504874127836386, 0.2712601189085051, 0.2747945478938874, 0.2763002584419353, 0.2764527243392335, 0.2759456314433074, 0.2757222578751155, 0.2768262507844399, 0.27903968995189277, 0.2814607292184601, 0.2835292275929158, 0.2848063178797079, 0.284804374969685, 0.2833134899065868, 0.28063828248609374, 0.2770766514528737, 0.2728433296552545, 0.268199062628294, 0.26333178981253463, 0.2580827050880197, 0.2521133480535523, 0.24518473024850046, 0.2370729817433097, 0.22749902753082632, 0.21622629518493583, 0.20358522586520303, 0.18948761482363985, 0.17386776251237152, 0.15662480148683872, 0.13739245755479973, 0.1151330487162197, 0.08807255190392194, 0.053286999412602225, 0.003531324012520084], [-0.09611015498074384, 0.01040277164944418, -0.02832408986726012, -0.05133619319031811, -0.05022831935974327, -0.047037863776297255, -0.04489518380349262, -0.0459413204642418, -0.051802610626610804, -0.06274959460145733, -0.0768856502525559, -0.09264655823013801, -0.10894746923723107, -0.1250744718066572, -0.14059238290759027, -0.1552206937776407, -0.16872099117868858, -0.18079132174358428, -0.1908755405494987, -0.19813702350558607, -0.20331786572524999, -0.2055062100116235, -0.205570471895863, -0.2038346516416994, -0.2009243716880571, -0.1979585313610933, -0.19649096766671903, -0.19661315256321063, -0.19764659998991552, -0.19918498183650316, -0.2010150240898493, -0.20299156873989627, -0.2050186130069902, -0.2070123111924091, -0.208862578788629, -0.21043011872877523, -0.21174646094863805, -0.21285891657511502, -0.21372999552164554, -0.21440122294673625, -0.21503705377352395, -0.21619443603141786, -0.218200373624985, -0.22047355107966354, -0.22208151690002706, -0.22185323135213875, -0.21887655954859808, -0.21226053244017876, -0.20108561749764767, -0.18474203416175267, -0.16352506836174482, -0.13897766243838802, -0.11171314941332015, -0.08147012704144262, -0.04764377848789824, -0.009024670518705256, 0.0327992970433854, 0.074494859355903, 0.11219537147260941, 0.1441783979013761, 0.1714735020904722, 0.1953050498660945, 0.2162990444569435, 0.2344228531503029, 0.24960791636284632, 0.2618725548330676, 0.2712411980590325, 0.2776026942859186, 0.28122393456803607, 0.28276840366778483, 0.2829274357231248, 0.2824110048619642, 0.28218452947850287, 0.28331623698218467, 0.2855832034009764, 0.288062450146145, 0.2901807175412116, 0.2914888613279594, 0.2914878258339696, 0.28996274387487886, 0.28722537694789885, 0.28358061555211833, 0.2792482537357472, 0.27449531487517576, 0.2695145429781438, 0.264143129724119, 0.2580276197988025, 0.25093391022933215, 0.24263026712413027, 0.23283055659265134, 0.22127479691947324, 0.20834179316059317, 0.1939168567580264, 0.1779336564957416, 0.1602891904883295, 0.14060881386034765, 0.1178300543133253, 0.09013515546243203, 0.0545328283271281, 0.003605820171735612]], [[-0.00369074145444009, -0.004100105932992471, -0.004569346405350768, -0.005428022783000711, -0.00837501843490931, -0.11458658707506407, -0.6929237128086033, 0.21416582836999692, 0.09093844701838753, 0.010960807455578297, 0.004582627122575206, 0.004042539646003224, 0.0036787695744407035, 0.003326009742512016, 0.002940914252821344, 0.0025178261099417175, 0.002066964536071796, 0.0016091546978041684, 0.0011698548098809606, 0.0007737611877976062, 0.00010357433812924689, -7.145187068098687e-05, -0.00015047773461267344, -0.00013801783817904903, -4.959375956337645e-05, 8.223010342656997e-05, 0.00020482126744319289, 0.00029256365047640166, 0.0003657064923851808, 0.0004404181024430253, 0.000526985260406989, 0.0006367754942445141, 0.0007774302943134981, 0.0009536859439037239, 0.0011726688967136631, 0.0014438424069311878, 0.0017750410926620237, 0.0021737103657859976, 0.0026477399955112885, 0.0032014056308329584, 0.003835443125252818, 0.004540956040953337, 0.005310266268814176, 0.006175777728373147, 0.00720419119892941, 0.008461350609999552, 0.009978695165428753, 0.011774071875624292, 0.013847338066793046, 0.016164672826753226, 0.018622386519030934, 0.021088668435881152, 0.0234695791588795, 0.025757078464326913, 0.0280024858419607, 0.030293510519059857, 0.03259494656507865, 0.034753268722211066, 0.03658798109670162, 0.03799192523781815, 0.039004928385201316, 0.039713171544508256, 0.04018072935920273, 0.04043666567334046, 0.0404889021756015, 0.04035057375145413, 0.04003488985377676, 0.039548833484788486, 0.03890731986920486, 0.03814779848753732, 0.037318793947841794, 0.036468888990056327, 0.03566610043909209, 0.03496991733588206, 0.03436238659635231, 0.03378451219461353, 0.03319521428480212, 0.03255850667972696, 0.03184921595778519, 0.031055973763783162, 0.03019788051246529, 0.029294815358990575, 0.028361661810425657, 0.027418875237894314, 0.0264733150473864, 0.025501971265385084, 0.024480987165709543, 0.023392666697409463, 0.022218668616027257, 0.020937460655826086, 0.01948881067114833, 0.01794225264914732, 0.01626578135708282, 0.014442171357269046, 0.01244191939109315, 0.010220852102328181, 0.007687185921645518, 0.004672562308361589, 0.0009769566095762692, -0.0024037387396177415], [-0.0025971715306504295, -0.0026849619314736873, -0.0027453678882322636, -0.0028842297440259627, -0.003654859708994468, -0.03807461582495937, -0.10185376791910936, 0.031284269424314025, 0.013688801385343435, 0.004057572245685001, 0.002170209930169025, 0.0021088325319642202, 0.002033689126684417, 0.0019015661636865716, 0.0017098598647544436, 0.0014680468996572868, 0.0011907958612672107, 0.0008975243347243902, 0.0006105920938885083, 0.0003519255168404216, 3.142517575375451e-05, -9.204856131427814e-05, -0.0001467257224935051, -0.0001357522722619981, -7.031514060523588e-05, 2.594828071921131e-05, 0.0001148589760700761, 0.00017821552660279082, 0.00023086479743229503, 0.00028449261223924656, 0.0003465775553252963, 0.0004254254265734863, 0.0005266260509897117, 0.0006536377579186485, 0.0008116486286851126, 0.0010075451368571793, 0.0012470116635434833, 0.0015354490478967713, 0.0018785881730056142, 0.0022795139139358536, 0.002738709157956479, 0.0032496166750324725, 0.003806623518959195, 0.004433362491554056, 0.005178471918539496, 0.006090228707609882, 0.007191801651892775, 0.008496492212855412, 0.010004584818896559, 0.011691868495529341, 0.013488507661607788, 0.015292854291522417, 0.01703622595595866, 0.018712525423882558, 0.020358865906642768, 0.02203918800215031, 0.023727636441966526, 0.0253118734154139, 0.026659862972788165, 0.027693240694915168, 0.02844108367920988, 0.02896604244862682, 0.02931478807231663, 0.02950838112094103, 0.02955255613489789, 0.029456874953143357, 0.029230974489049866, 0.028879972989709166, 0.0284148388977558, 0.0278629646310375, 0.027259794286765768, 0.0266408205076586, 0.02605574339453725, 0.025548128443853044, 0.025104958159768508, 0.024683176479911785, 0.024253213433142788, 0.023790526564700935, 0.02327297304218022, 0.02269375148006992, 0.022066917497033847, 0.021407037989978943, 0.02072500837415103, 0.020035818859390937, 0.019344605809774693, 0.01863465013014047, 0.017888597045997368, 0.017093596232034592, 0.016236334405221098, 0.015301177334201787, 0.014264388917214918, 0.013148590133845004, 0.011941639662403929, 0.01063277218990824, 0.009204300729680977, 0.007629167992179054, 0.005850508513539038, 0.004063192400133837, 0.0018795180884597297, 0.00040637621135307535], [-0.0024904801351337564, -0.0025270541462848483, -0.0025208426982371497, -0.0025433689315160018, -0.0029725546677344854, -0.02639210094867807, -0.049725527446272004, 0.015128368847584596, 0.003768946246034694, 0.0019259079638502374, 0.0018303649093980793, 0.0018472653938581209, 0.0018181981421816526, 0.0017191051425954217, 0.001554121612139589, 0.0013355340125232233, 0.0010791858521634122, 0.0008048292810532557, 0.0005349621590474509, 0.000291691180076311, 2.0278438069250977e-05, -9.819622206573053e-05, -0.00015040539880720123, -0.00013935846479306156, -7.584564753417727e-05, 1.7295083786971505e-05, 0.00010318172632397865, 0.0001643188758258945, 0.00021508552545366772, 0.000266760711523602, 0.00032657280087264616, 0.0004025592484159614, 0.0005001307687044245, 0.0006226334359262741, 0.0007750833791409287, 0.0009641381838466789, 0.001195289407239823, 0.0014737544165664622, 0.0018050711892843596, 0.0021922159657326895, 0.002635643492228245, 0.003128995350485307, 0.0036668392839028408, 0.004272034614307713, 0.004991625982264443, 0.005872368877289283, 0.006936728750273921, 0.008197637155060437, 0.009655458316360223, 0.011286878086252247, 0.013025673948663576, 0.014772259547477904, 0.016460161235356315, 0.01808342781717258, 0.01967788555378515, 0.02130537603456993, 0.022940849175140773, 0.024475559267936944, 0.025781700760965393, 0.026783425473770484, 0.027508865792633945, 0.0280185751978544, 0.028357683540808466, 0.028546530847655502, 0.028590654132773466, 0.028499298228356968, 0.028281785329735215, 0.02794307199650954, 0.027493788437925704, 0.026960448844588532, 0.026377349685009554, 0.025778835794692964, 0.02521300222415804, 0.0247220296665397, 0.024293344116393906, 0.023885292016363455, 0.02346936072715651, 0.023022201650596923, 0.02252152888652258, 0.021961105358378467, 0.021354555401337044, 0.020715984896403822, 0.020055941971243416, 0.019388942668745534, 0.018719985903427754, 0.018032914121135373, 0.01731095073599875, 0.016541678788200162, 0.015712235254273236, 0.014807513575664196, 0.013809185982134336, 0.012732689814291364, 0.011590870105117642, 0.010340313101751342, 0.008982135275540586, 0.007494408150370247, 0.00583099971185621, 0.003922906640781182, 0.001818372396548116, 0.0003950191150990232], [-0.002395156698854377, -0.0023827676629113548, -0.0023127210680736845, -0.0022238626594233836, -0.0023271388727930655, -0.015271040064859014, -0.016695174531982215, 0.004874128669816545, 0.002261987375494294, 0.0014246211861394951, 0.0015098606058136569, 0.0016017963961401887, 0.0016167887281319337, 0.0015490637678613243, 0.0014092239799392621, 0.001212281509215418, 0.0009752492039510092, 0.000718254321425988, 0.0004639891964405099, 0.0002347943717839545, 9.656170357051442e-06, -0.0001043569901423166, -0.00015434621694386153, -0.00014319834968819909, -8.135341164031757e-05, 9.053325068538112e-06, 9.228041246968947e-05, 0.00015146042925778295, 0.00020056390613815142, 0.00025051136531504804, 0.00030831145254883334, 0.0003817667725282756, 0.0004761314130440429, 0.0005946531600390402, 0.0007421972824306162, 0.0009252204998903063, 0.001149044829146558, 0.0014187262980358798, 0.0017396333935848917, 0.002114646513833006, 0.0025441947037687374, 0.0030220924254927236, 0.0035430655024035374, 0.004129295470715483, 0.004826430303599014, 0.005679897254007893, 0.0067115500888221165, 0.007934001745845255, 0.0093476938997015, 0.010930107094036726, 0.01261829698665511, 0.014314376964389046, 0.015953805587928235, 0.017530755110164376, 0.019079858819059374, 0.020661123445229142, 0.022250209930199594, 0.023741535745776764, 0.025011024297137044, 0.02598503130583838, 0.026690840554022058, 0.02718733813460297, 0.02751813476861471, 0.027702949339284744, 0.02774714605491661, 0.027659691886846003, 0.027449633537242307, 0.027121786041496856, 0.026686475229105836, 0.02616943823044808, 0.02560396609727684, 0.025023398575101937, 0.024474425668007588, 0.023998020356534942, 0.023582011591612547, 0.023185978367917238, 0.02278234227298232, 0.022348833978690974, 0.021862968949554716, 0.02131903097677515, 0.02073026592652673, 0.020110376860834243, 0.019468477702723013, 0.01881974743116174, 0.018169164212497164, 0.017501015858223546, 0.01679902886216978, 0.016051172567966215, 0.01524499234511429, 0.014365865474404679, 0.01338619369011697, 0.012348664144242126, 0.011228486626509618, 0.010016973520838031, 0.008700294800586355, 0.00725719746936376, 0.005642266484606958, 0.0037899368030209447, 0.0017458826978696952, 0.00037045922089033154], [-0.0023723636219905734, -0.002345413473099958, -0.0022562592012497075, -0.0021341368088140357, -0.0021409173114844307, -0.012003727957971796, -0.010317348432434882, 0.0028883042265917705, 0.0018192863855739795, 0.001279103969430686, 0.0014181989392589387, 0.0015326170612835733, 0.001560721102824508, 0.0015021509458234886, 0.0013694529432342617, 0.0011784827187682429, 0.000946639256265293, 0.0006942073644694293, 0.00044398920625518485, 0.00021844603121149692, 6.525559906005391e-06, -0.00010642518521733555, -0.00015587029657455618, -0.00014466687369408458, -8.317496851885514e-05, 6.62788647810225e-06, 8.925670054258912e-05, 0.00014799171226584191, 0.00019671429623495357, 0.00024626364021266206, 0.00030359926806227533, 0.00037647199519955083, 0.0004701014856508428, 0.0005877138101089563, 0.0007341406325038024, 0.0009157938796813455, 0.0011379574676816404, 0.0014056511470353784, 0.0017242054256372777, 0.002096534972710235, 0.0025230116411920655, 0.0029974821198470395, 0.00351470406569348, 0.004096701531831852, 0.004788805767645501, 0.0056361444683811065, 0.006660428589391541, 0.007874195630504364, 0.009277903147102355, 0.010849213476923419, 0.012526018479881038, 0.01421072479555995, 0.015839186442174663, 0.017405576222073758, 0.018944324686115878, 0.02051504164830748, 0.022093649792282923, 0.023575323368747306, 0.024836827570039518, 0.025804905762185394, 0.026506549285645956, 0.02700023220686155, 0.027329275789936394, 0.027513294826748556, 0.02755761757315364, 0.027471149847908796, 0.0272628779814325, 0.026937585156711023, 0.02650550412869221, 0.025992281667374825, 0.025430901075321057, 0.024854472100865412, 0.02430937445742384, 0.023836325299857502, 0.02342327331802165, 0.02303007427655236, 0.02262935636935919, 0.02219911242654983, 0.021716740505386987, 0.021176315831652383, 0.020591152355782533, 0.019974917788093793, 0.019337814761111675, 0.018693880247107372, 0.01804799772581893, 0.017384615987445784, 0.01668758914928091, 0.015944978272112345, 0.015144419523943116, 0.014271393077989454, 0.013302677683553065, 0.012271704510921154, 0.011158613051072977, 0.009954755699671355, 0.008646586999716094, 0.007212905418946915, 0.0056085072042733886, 0.0037682423264629988, 0.001737426401688433, 0.0003704925838193777], [-0.002359496550003584, -0.0023234437637467643, -0.0022223138666933213, -0.0020793623968754535, -0.0020259262708858467, -0.009970533221106687, -0.007159831638114849, 0.0019029800671490171, 0.0015436481991141745, 0.001189020961097729, 0.0013618066988945077, 0.0014903209947720619, 0.0015266238053086975, 0.0014737334122225528, 0.0013454164828189182, 0.001158064107822345, 0.0009293262044757415, 0.0006795975126513337, 0.0004317617838467846, 0.00020836845032115163, 4.5755604595983285e-06, -0.00010777679061549101, -0.00015691062673178758, -0.00014566612225258484, -8.435934924832839e-05, 5.118025207090081e-06, 8.74207536818983e-05, 0.00014591165821977063, 0.00019442441649243655, 0.00024375365987087556, 0.0003008322388468822, 0.00037338308361253495, 0.0004666073619761172, 0.0005838164732412795, 0.0007297365992704373, 0.0009107423878881987, 0.001132090994565965, 0.0013987800796207961, 0.0017161179431839035, 0.002086951975859717, 0.0025117045978867766, 0.0029842539127779774, 0.0034993746035809972, 0.004079000729136522, 0.004768293720466937, 0.005612223728524378, 0.006632431030768305, 0.007841420212451756, 0.009239665771934105, 0.010804936779567396, 0.012475614994939094, 0.014154234144554073, 0.015776861951840894, 0.017337675250913488, 0.018870966138977565, 0.020436133351399228, 0.022009223942665652, 0.02348580552749768, 0.02474308770642294, 0.025708035235544702, 0.026407499870730135, 0.02689971824913429, 0.027227869118253048, 0.02741164994269311, 0.027456250380874916, 0.027370522837976533, 0.027163408437218286, 0.02683966513942628, 0.02640948267219219, 0.025898311230849475, 0.025339104190144904, 0.02476486553682576, 0.024221814368738766, 0.023750528533525696, 0.023339004111550796, 0.02294724331897289, 0.022547642225180572, 0.02211897137377871, 0.021637841063555555, 0.021099065870824784, 0.020515790714615033, 0.01990159310439943, 0.01926662577561638, 0.018624868250596883, 0.017981181321586215, 0.01732006660139205, 0.0166254358800431, 0.015885393461993882, 0.015087620564346768, 0.014217650733040495, 0.013254705405507059, 0.012227623483793394, 0.011118721870649849, 0.009919381512489117, 0.008615961253061612, 0.007187440307175434, 0.005588757957179838, 0.003754967793045388, 0.0017311415397535392, 0.00036835936919931626], [-0.0023523313337644363, -0.002310875777421715, -0.0022026273675917747, -0.0020473011932274562, -0.0019581603690721774, -0.008766602078917532, -0.0055893996557876795, 0.0014118971834445556, 0.0013802975933516516, 0.0011358548824598044, 0.0013286459866383197, 0.0014655411786382666, 0.0015067110324588713, 0.00145717704328212, 0.0013314319343889264, 0.0011461874112093876, 0.0009192455905871415, 0.0006710703682500767, 0.0004245983383956121, 0.00020243561923758975, 3.4205675232794886e-06, -0.00010859907241988859, -0.00015755801477309456, -0.00014628695729516447, -8.507792195342333e-05, 4.224036357281055e-06, 8.634958546551406e-05, 0.00014470724284012192, 0.00019310512135920443, 0.0002423135542379468, 0.0002993640944306169, 0.00037186048076220913, 0.00046498435274600286, 0.0005819396405956524, 0.0007275258355611842, 0.0009081132330631939, 0.0011289519234460232, 0.0013950306757851934, 0.0017116483382368668, 0.0020816473780365476, 0.002505449620197387, 0.0029769455629678173, 0.00349091731793739, 0.004069250121049552, 0.00475701376818842, 0.005599094174606211, 0.006617094073359262, 0.007823500902234817, 0.009218799099078415, 0.010780816001470121, 0.01244821039192567, 0.014123570847002397, 0.015743081582549737, 0.017300921923295586, 0.01883130836404554, 0.020393524583507665, 0.0219636791338332, 0.023437547918805923, 0.02469257804246978, 0.02565585777762259, 0.026354317293237724, 0.026845940233371206, 0.027173821375768386, 0.027357466158000356, 0.027402162763498737, 0.027316756484559824, 0.02711017528862483, 0.026787169668683147, 0.0263579144476067, 0.02584781365365661, 0.02528975702284487, 0.02471668455966405, 0.024174725691611647, 0.02370438155133036, 0.02329367251754269, 0.022902255761565446, 0.022503313792971814, 0.02207538901887373, 0.02159511697983029, 0.02105731779833498, 0.020475110889128723, 0.01986204953332153, 0.019228265235943495, 0.01858770899274796, 0.017945230723342157, 0.017285361522796937, 0.01659204486638729, 0.015853408690239153, 0.015057158616992751, 0.014188856894664587, 0.013229359973371282, 0.012204300500498682, 0.01109756719427973, 0.009900565432923242, 0.008599830828282641, 0.007174119428337066, 0.0055784969892030125, 0.0037481743386540245, 0.0017280913841280533, 0.0003675242164682017]], [[-0.0001664148926006841, -0.00022174771059010228, -0.00026020245796267187, -0.00028541838018169126, -0.0003050178606518305, -0.00034173869263343266, -0.00047243633136250434, -0.004065985749198655, -0.037312888540013744, -0.09837215139062186, 0.18024521275813588, 0.05096778458549444, 0.013186096516882897, 0.0036668273155852837, 0.003378778640407113, 0.003212918943706831, 0.0030787107620361283, 0.002954292544742774, 0.002834992213157443, 0.0027198681465045063, 0.0024685614949536056, 0.002429900089495981, 0.0024202926798785438, 0.0024404247238083744, 0.0024879585428125243, 0.0025560308488713295, 0.0026313925743215354, 0.0027028943452633686, 0.002775563429173155, 0.0028544993308813205, 0.002943711147151158, 0.00304870507985249, 0.003173167726287243, 0.003319038795717529, 0.0034893526102128636, 0.0036881839610148313, 0.003920527267571617, 0.004191331909538016, 0.004505002626138374, 0.004864489649469284, 0.0052722013638049695, 0.005729494511503625, 0.006236385007599051, 0.00680619653979441, 0.007467940742869193, 0.00824602061625945, 0.009147195338045722, 0.010169930919168986, 0.011301171869677655, 0.01251110832313003, 0.013743010616140219, 0.014931698508837677, 0.016028873426946352, 0.017026823831426903, 0.017949772336440527, 0.018835504599331473, 0.019681935314414884, 0.02043949229584455, 0.021049233017790336, 0.021470265124298265, 0.02171485426474612, 0.021819695593343656, 0.02181554655420845, 0.021720393868057682, 0.02154018078052875, 0.021282804183401616, 0.020956087470305435, 0.020565807658710945, 0.02011738204884479, 0.01961699413105625, 0.019099910805325, 0.018579979472211607, 0.018085785555801818, 0.01763921009233393, 0.017231721001851722, 0.01683964933781099, 0.01644617123444367, 0.01603786578145532, 0.015600277546392852, 0.015131743617363708, 0.014639804288197574, 0.01413254131467606, 0.013616129118854006, 0.013099590473330218, 0.012584560576964474, 0.01205909721601475, 0.011513338912767276, 0.01093962860346026, 0.010329876726769344, 0.009674772174575774, 0.00894002194329661, 0.008167960104667917, 0.0073371585473188256, 0.00643808639699098, 0.0054555883461435434, 0.004368018659725147, 0.0031334404542356967, 0.0016817941526504796, -4.925326690591499e-05, -0.001300979298500914], [-0.00015041418499362215, -0.0001631585871876816, -0.00015202914907205822, -0.00011556211505607903, -5.2880741615848995e-05, 3.025320665433573e-05, 0.00010115240837372272, -0.001469747189352635, -0.007061890922151494, -0.02001583926340892, 0.04075650774732208, 0.011155533559345147, 0.0036079229196669233, 0.0032691216870627125, 0.003182426410178936, 0.003123391432538148, 0.0030542619151856954, 0.0029722385375789942, 0.0028822557309816327, 0.0027892770685706446, 0.002635467731224402, 0.0025986810175085855, 0.0025921809836997258, 0.002616873741851494, 0.0026703597116783887, 0.002745308627557976, 0.002827549978355186, 0.002905435361159345, 0.002984510634216013, 0.0030702710898185288, 0.003167042645110819, 0.003280792951378033, 0.003415526720441063, 0.003573351956300194, 0.0037575556706214283, 0.003972548028745969, 0.004223724228336415, 0.0045164318932830174, 0.004855433965885433, 0.00524391117505746, 0.005684444007405139, 0.006178465801478959, 0.0067260176824480425, 0.007341563286235778, 0.008056515585548854, 0.00889742245028479, 0.009871716803321481, 0.010977862109788893, 0.012201886252089436, 0.013511695491951536, 0.014848004793009092, 0.016138122859759935, 0.01732970503703632, 0.018414301811110926, 0.019417986594490493, 0.020381643048329366, 0.021302851923268442, 0.022127739322748845, 0.022792314602518692, 0.0232523167230254, 0.0235211084583538, 0.023638143983826163, 0.02363684401070953, 0.023536594353977647, 0.023343808673236474, 0.023067024155689512, 0.022714703937232364, 0.02229309231144135, 0.021808315907128128, 0.021271926419396053, 0.020713222371045018, 0.020151033079177268, 0.01961647417270506, 0.019133339381274025, 0.01869239594325992, 0.018267981654324524, 0.017841886537430036, 0.017399582918523088, 0.01692541337123521, 0.016417598846931208, 0.015884417750574475, 0.015334645408563899, 0.014774976984797142, 0.014215180569945057, 0.013657058085890204, 0.013087737780954392, 0.0124965852568631, 0.011875360094156878, 0.01121536026349632, 0.010506565735556028, 0.00972961149473613, 0.00890424662762958, 0.00801834293487695, 0.007063152269413259, 0.00602485689862872, 0.005005390769128296, 0.0037733996618307527, 0.002384519619708957, 0.0009128752147099174, 0.00029687132294273157], [-0.0001439332430595669, -0.00014550409043954007, -0.0001217727662075044, -6.998357118085341e-05, 1.2916464612030479e-05, 0.00012563012014455853, 0.00024736333641743586, 0.0002586004019029512, -0.0014216102401585471, -0.00924503490055611, 0.02153114356025345, 0.008598182288586385, 0.00330856708584594, 0.0031153949280509044, 0.003081941521563202, 0.003051357569163097, 0.003000080618678472, 0.0029302670012272317, 0.002849249101528319, 0.002763434270894583, 0.002637158339692911, 0.0026014313820349674, 0.0025958339268603754, 0.0026213147371619877, 0.002675495900546456, 0.0027510417415509787, 0.0028337664712308618, 0.002912075713436443, 0.0029915620095167773, 0.003077736484849548, 0.0031749388744615596, 0.0032891621766881697, 0.003424430290218778, 0.003582861536468461, 0.0037677565072864196, 0.003983542645879198, 0.004235633838141266, 0.004529396489076554, 0.004869611170722108, 0.005259468139950414, 0.005701551774791643, 0.0061972926799450795, 0.006746737831759987, 0.00736441785080181, 0.008081872002653522, 0.008925784636142754, 0.009903645752356574, 0.01101394224865027, 0.01224268486030222, 0.01355769449600379, 0.014899957085675795, 0.0161959855383399, 0.01739321325014398, 0.018483133016089413, 0.01949188639207472, 0.02046051437043679, 0.021386549581007157, 0.022215854284246852, 0.0228841402658852, 0.02334697235614552, 0.02361778653758935, 0.023736129381017494, 0.02373558390665255, 0.02363559252346175, 0.02344258955594137, 0.02316514333908656, 0.022811749174952347, 0.02238867386861736, 0.021902130774707925, 0.021364873718637236, 0.020804204038937412, 0.02023993955706783, 0.01970336006141201, 0.019218379112024297, 0.01877572814425575, 0.018349633656340063, 0.017921813989002233, 0.017477684038113776, 0.017001522120355918, 0.016491547152212436, 0.015956097947542245, 0.01540399097466018, 0.014841950617209308, 0.014279783878016513, 0.013719307389834002, 0.013147611676864887, 0.012554029897417369, 0.011930206963571196, 0.011267576553836289, 0.010556136101948312, 0.009787435227925436, 0.008967313133756332, 0.00808925986116659, 0.0071458213084603555, 0.00612536450913654, 0.005012810017211888, 0.0037797776131999043, 0.002388699935562386, 0.0009208899561922805, 0.0003075336796085824], [-0.0001377369104146148, -0.00012777836294435672, -9.095627138712042e-05, -2.317176472949741e-05, 8.088519089864918e-05, 0.0002245218035422142, 0.0003991504265859932, 0.0005364161974425173, -0.00028465465602166696, -0.0020306410532408975, 0.008664198133694226, 0.005986794794908241, 0.0030108917127333436, 0.0029673936711505865, 0.002988788561570468, 0.0029874704385964997, 0.0029544471778826607, 0.002896998377900866, 0.0028249570735556758, 0.002746243067498914, 0.0026479571626819116, 0.002613201568945254, 0.0026085166556340223, 0.0026348984727268647, 0.002689983312681616, 0.002766404731385967, 0.0028499124673092516, 0.00292892811336288, 0.003009111602835301, 0.0030960093261589725, 0.00319399018159486, 0.0033090939083837653, 0.0034453780267208844, 0.0036049787813436165, 0.0037912221144960983, 0.004008568505568812, 0.004262469719133064, 0.004558329971748835, 0.00490096444720215, 0.005293584190742394, 0.005738786469990463, 0.006238003978782101, 0.006791289895084329, 0.007413293874357197, 0.008135793834632496, 0.00898570662526212, 0.009970606884563069, 0.011089000505069993, 0.012326832494409436, 0.01365172517564933, 0.015004741605498736, 0.016311320883436047, 0.01751848681647261, 0.018617643437362122, 0.01963509239430326, 0.020612177993959875, 0.02154637471898062, 0.022383086598158203, 0.023057497520818804, 0.023524840008255964, 0.02379867174499977, 0.023918770450691414, 0.023919001994814847, 0.023818933957191885, 0.023625044084798645, 0.023345962283130926, 0.022990246225307785, 0.022564207470092877, 0.02207417023261212, 0.021534173117397082, 0.020969549438715825, 0.020401205516040986, 0.01986069799019477, 0.019372146222678438, 0.018926212868669256, 0.01849692104848303, 0.018065665976503522, 0.017617791702896048, 0.01713749285974835, 0.016623012766647675, 0.0160828256656136, 0.015525829892386761, 0.014958809644836216, 0.014391650102503225, 0.013826191911276396, 0.013249446983568449, 0.012650689344161418, 0.012021620489361156, 0.011353481846522594, 0.01063618846480211, 0.00986014579277245, 0.009033992311371386, 0.008149284153959727, 0.007198499678578756, 0.006169866241971548, 0.005048073109036025, 0.0038043199941470065, 0.0024007786947070854, 0.0009217030139154263, 0.00031670212796738547], [-0.00013572573659774448, -0.0001221901465194265, -8.132241296511326e-05, -8.608762624340409e-06, 0.00010195901819270707, 0.00025511709845587325, 0.0004460768094955082, 0.0006224266451537404, 6.933479395034381e-05, -0.0005761950685617234, 0.006066836181454785, 0.0051709267988860825, 0.0029165099648739653, 0.002919556173690514, 0.002957984089938142, 0.002965762305910653, 0.0029384325850308627, 0.0028848622707760858, 0.0028156554767424964, 0.002739197148612099, 0.002649671209974468, 0.00261523905973531, 0.0026108406604512992, 0.0026374861407187605, 0.002692817673559213, 0.002769463820539596, 0.0028531631199320844, 0.0029323493079577803, 0.003012699752654537, 0.003099768364909196, 0.003197930397269092, 0.0033132363700590648, 0.003449751736445496, 0.0036096169867705754, 0.0037961638793569705, 0.004013860394761259, 0.0042681666889779375, 0.004564495378616371, 0.004907669418330154, 0.0053009043228712995, 0.005746799755132134, 0.00624678816975314, 0.006800924639122843, 0.007423886728625363, 0.008147506820130108, 0.008998757329437423, 0.00998523450187983, 0.01110545106006287, 0.012345340300259114, 0.013672482905996848, 0.015028002453640322, 0.0163370505521664, 0.01754655656536889, 0.01864790227034429, 0.01966742275951605, 0.020646530967092083, 0.021582684870356035, 0.022421179941777343, 0.023097076201235776, 0.0235655306541162, 0.023840130400952224, 0.023960700332142666, 0.023961173222095487, 0.023861143417725342, 0.023667098144131406, 0.02338768109050238, 0.023031464007251742, 0.0226047684480519, 0.022113949160412386, 0.02157343533914184, 0.02100793294632116, 0.020438673630557406, 0.019897280505901498, 0.019407751752376978, 0.018960796111573332, 0.018530408281780368, 0.01809814839830458, 0.01764930129935318, 0.017167999743942286, 0.016652472200433935, 0.01611120371887611, 0.015553106375039693, 0.014984974772890442, 0.01441670981616981, 0.013850153826673013, 0.013272295170933954, 0.012672389348826321, 0.012042123937466481, 0.011372725461590221, 0.010654091707808878, 0.009877910398755988, 0.009050311285288055, 0.008164021255793788, 0.007211498512102289, 0.006180933729511076, 0.0050569576815532626, 0.003810671246981733, 0.0024042329381896562, 0.0009228873178897291, 0.0003234937009087403], [-0.0001344383063520108, -0.00011864246488501948, -7.522134548358741e-05, 6.006512440595243e-07, 0.00011527251286522002, 0.000274433415360761, 0.000475697414649748, 0.0006767407778072741, 0.00029346042078765445, 0.00015243124501733765, 0.004764612503895913, 0.004654070211978235, 0.0028564927567959033, 0.002888969333083541, 0.002938163047117316, 0.0029516921200766644, 0.0029279656822541657, 0.0028768540055294127, 0.0028094475394949197, 0.0027344243751212405, 0.0026504478790034458, 0.002616224238562432, 0.0026120075164758495, 0.0026388166263776706, 0.002694297732981985, 0.0027710770943657165, 0.0028548878199295843, 0.002934172665062947, 0.003014619363949536, 0.0031017859389682457, 0.003200051153402217, 0.0033154716432488534, 0.003452117406549603, 0.0036121313700836683, 0.003798848583554151, 0.004016741252694526, 0.004271274206586713, 0.004567864745892765, 0.004911340179831032, 0.0053049184765477635, 0.0057512005121500434, 0.0062516184239811675, 0.006806228475918236, 0.007429724179805717, 0.00815396866584375, 0.009005966358729243, 0.009993326285693814, 0.011114565660509773, 0.012355612004789372, 0.01368402343077337, 0.015040968607317204, 0.01635142603505412, 0.017562271511795253, 0.01866487374105939, 0.019685585909814448, 0.0206658595459555, 0.021603142484835303, 0.02244266789840222, 0.023119425009780398, 0.02358852827265887, 0.0238635818127561, 0.023984435730780088, 0.023985061172686808, 0.023885067139267403, 0.02369094609678798, 0.023411349448106408, 0.0230548568512933, 0.02262779544716441, 0.022136538552693787, 0.021595760666443854, 0.021029768201904876, 0.02045982213584852, 0.019917666868718254, 0.01942752935221476, 0.0189800445647686, 0.018549159210625867, 0.018116405858853126, 0.017667051896765606, 0.017185213473995216, 0.01666911694073811, 0.016127256326831922, 0.015568553008695142, 0.014999808370582806, 0.014430932747359727, 0.01386376979222805, 0.01328529496566881, 0.012684753723496495, 0.012053826241428037, 0.011383731112238445, 0.010664356907546023, 0.00988861098864951, 0.009056241838910602, 0.008168866569175337, 0.007215211520366881, 0.006183385490817417, 0.005057982685980087, 0.003810025869875759, 0.0024020004974091443, 0.0009226297073097578, 0.00032248540772283186], [-0.0001336635334577047, -0.00011651899777577547, -7.157544063119115e-05, 6.098834515629142e-06, 0.0001232156714884949, 0.00028595310316922417, 0.0004933597815818501, 0.0007091368299992828, 0.0004274539610135995, 0.000517111511083798, 0.004112371304434686, 0.004345035571890352, 0.0028205305206969594, 0.002870576188167937, 0.0029261950567958193, 0.0029431568915304317, 0.002921582773718657, 0.0028719412927707567, 0.002805612743567496, 0.0027314498338715247, 0.0026507903115769674, 0.0026166927214909827, 0.0026125846573600807, 0.002639490231053347, 0.0026950580980931484, 0.002771913478665319, 0.0028557868937156435, 0.0029351270119940104, 0.003015627496280485, 0.003102848569326727, 0.003201170890074462, 0.0033166544686200968, 0.003453371830191847, 0.003613467258135811, 0.0038002776146026694, 0.004018277423245704, 0.004272934053067148, 0.004569667353370207, 0.004913307012294709, 0.005307072315495724, 0.005753564744407587, 0.006254216181421998, 0.006809083599185381, 0.007432869357697875, 0.008157453486848102, 0.009009858285885453, 0.009997700064995606, 0.011119498787106098, 0.012361179170036991, 0.013690287334682036, 0.015048021562511721, 0.016359260437043017, 0.017570850206457593, 0.018674031684569093, 0.019695241970453345, 0.02067595152532451, 0.021613618867256705, 0.022453467357218242, 0.023130472894267815, 0.02359972242252864, 0.023874806014095674, 0.023995800760161706, 0.02399649110861003, 0.023896505912179296, 0.023702341363814966, 0.02342265319645395, 0.023066025501345226, 0.022638788055723457, 0.022147315682539796, 0.02160710918098072, 0.021040726992337916, 0.02047044432909312, 0.019927980953117257, 0.019437564070373815, 0.018989833333670613, 0.018558722567773727, 0.018125755480486595, 0.017676190865791277, 0.017194135221407524, 0.01667780924331856, 0.016135708166959917, 0.015576758082764814, 0.015007763876819308, 0.014438817136078306, 0.013871588552582218, 0.013293043227721893, 0.012692416746947096, 0.012061382734693746, 0.011391153722216251, 0.010671611642064836, 0.009889764904096363, 0.009061081063351052, 0.00817357520459278, 0.007219606639519952, 0.006187337666863358, 0.005061369694339003, 0.003812716302171644, 0.002403833088222328, 0.0009234526213307306, 0.00032252556640483964]], [[-0.004086899341398165, -0.003972271729581582, -0.003833422684790087, -0.0036795577263572746, -0.0035275055000265334, -0.003401208739967655, -0.0033272382398079887, -0.0033203146280486907, -0.0033722314273751533, -0.003409032032146664, -0.0029677227320429444, 0.00047903794753158447, 1.6457757523161032, 2.0236096408181403, -0.1685965337161811, -0.01588354504592226, -0.012008180016022963, -0.011152596563021115, -0.010774480473182071, -0.01053424745351307, -0.009912099446113836, -0.009941976495251385, -0.010013195573267235, -0.010130520794723086, -0.010295216072764823, -0.010503274722324854, -0.010741094552688887, -0.01098758041126809, -0.011248795014462132, -0.01153338761444546, -0.011850123255129944, -0.01221297786369131, -0.012631241333157033, -0.013109209950355466, -0.01365372562002733, -0.014274005120012576, -0.014984032449700287, -0.015797960775117744, -0.016727443717107476, -0.01778099745899105, -0.01896780331332686, -0.02030027631951799, -0.02178555287369354, -0.02345366547227709, -0.025370226476781253, -0.027580642386416745, -0.030085771033843387, -0.03286286342976766, -0.03585593594659697, -0.03896705594848079, -0.04204314454877165, -0.04492356530560115, -0.04748785972367849, -0.04971193616104794, -0.05165516634258617, -0.05340142390982313, -0.05496936700038953, -0.05628222859616808, -0.05724720621670956, -0.05778741508466194, -0.05792283048249738, -0.05773413894294724, -0.05729556591505396, -0.0566574065753558, -0.05583793847116552, -0.0548536296267589, -0.053734747444764565, -0.05249633027801447, -0.051149696910876084, -0.049722595747126674, -0.048258797371201846, -0.04680141155220255, -0.04541305276668948, -0.0441343905205991, -0.04294400500382188, -0.041793039202306814, -0.04064499445125599, -0.039470650960832764, -0.03823879034277026, -0.03694936783321704, -0.035618148334958334, -0.034261886796157846, -0.03289367252800244, -0.03153370680347447, -0.030182738896195115, -0.028810377236020108, -0.027395731513268556, -0.02592184687442651, -0.024370497350391217, -0.022721057212047455, -0.020771275526724208, -0.018853863962618247, -0.016800475434534147, -0.01458529018378071, -0.012167221629944254, -0.009491652512208735, -0.006460466357592588, -0.0028158583625026543, 0.0011823715394687182, 0.003577297673186236], [0.002894812445777423, 0.0028494181728730347, 0.002789655656596182, 0.0027241031485527273, 0.0026672613997602837, 0.002639742292529324, 0.002666330034428615, 0.002769058315992844, 0.002959863248193588, 0.0032195784403313606, 0.0033686612165052966, 0.0025769700770609206, -0.5129967559903895, -0.2796135820647171, 0.028600968631906674, 0.008509780309922254, 0.0073901132046609586, 0.007186689689471919, 0.007109689315875484, 0.007055436566932245, 0.006875313262242781, 0.006908807931492183, 0.006968364067041197, 0.00705790453102206, 0.007178714967144244, 0.007328261506477538, 0.007497389974324815, 0.007672165401108187, 0.0078570687893728, 0.008058155979308514, 0.008281567873513244, 0.008537120992561553, 0.00883135610438272, 0.009167306111675627, 0.009549780579253148, 0.009985248773942447, 0.01048350440375301, 0.01105446192887402, 0.011706291558012073, 0.01244495276847222, 0.01327685074472946, 0.014210644435967888, 0.015251409690292643, 0.016420300750288063, 0.017763322165249305, 0.01931244344229917, 0.02106838662411468, 0.02301531816821469, 0.025114133547049933, 0.027296322066460977, 0.029456194184332957, 0.031479392247538984, 0.03328146734045773, 0.034845442879130016, 0.03621277667641075, 0.03744221760484064, 0.038546559502093236, 0.039471741974123516, 0.040152528544527034, 0.04053516898249024, 0.04063386354602414, 0.04050451583749952, 0.040199606437599754, 0.03975424663557246, 0.03918127990687062, 0.038494378817385856, 0.03771136441307788, 0.03684394362962887, 0.035900256110057434, 0.03489985086991001, 0.033873446795272114, 0.032851299474748054, 0.031877336105105826, 0.030980115028364515, 0.030144604277011617, 0.029336530516165697, 0.028530449370706062, 0.02770592833168603, 0.026841126404906223, 0.025936027149972448, 0.02500172064454633, 0.02404998255882203, 0.023089993295901248, 0.022135898244810093, 0.02118824208034556, 0.020225794120813663, 0.019233990760977652, 0.018201041231474435, 0.017114277508788033, 0.015959362023212617, 0.014668788304771922, 0.013428097397377686, 0.012036282805460598, 0.010548799346646176, 0.00894629806682537, 0.007197794046785197, 0.005276020049727234, 0.0031008482016906514, 0.0009474869747643125, 0.00048495949184287483], [0.002260743122651856, 0.002231832851277496, 0.0021922109547530383, 0.0021489527419386186, 0.002113854326148014, 0.0021036802873308016, 0.0021388758718424565, 0.0022387693789967843, 0.002415925531439143, 0.002661445663459889, 0.002862229455202424, 0.002545378969217545, -0.28136266325596526, -0.10691422299534446, 0.01355403497744008, 0.006144916542446611, 0.0055675922762602244, 0.005482289483079117, 0.0054570223783204485, 0.005435831524421587, 0.0053427698106756185, 0.005371181271826849, 0.005419357121115097, 0.005490461168185367, 0.005585568786471043, 0.005702756686231591, 0.005834963579792118, 0.005971490769359981, 0.006115871866378074, 0.006272823369715925, 0.006447128765333743, 0.006646439262066234, 0.006875855761776967, 0.007137744983285628, 0.007435856323217317, 0.007775231241831578, 0.008163497919169904, 0.00860837900805683, 0.009116239754219472, 0.009691721015413228, 0.010339807086868, 0.011067235660222783, 0.011877974630816105, 0.012788523089492436, 0.01383472309563368, 0.015041506478474409, 0.016409458034996157, 0.017926263489781196, 0.019561484038258994, 0.021261771815677993, 0.022945087520849755, 0.024522016664191, 0.02592676735022226, 0.02714609754402106, 0.028212275373808045, 0.029171060958676852, 0.03003236871222395, 0.030754036962681176, 0.031285209193846086, 0.03158403787348798, 0.03166162228956286, 0.031561393107934474, 0.03132431849823147, 0.030977725265044487, 0.030531624913967933, 0.02999706212341787, 0.029387293439197385, 0.028711654328128073, 0.02797652391568969, 0.027197149976636206, 0.026397470862881252, 0.025601063979074756, 0.024842157470259685, 0.02414300895935425, 0.023491904608953847, 0.022862139005776088, 0.022233915601356815, 0.02159132564434566, 0.020917361714525757, 0.020212013762027484, 0.01948392876656057, 0.018742286267155513, 0.017994089279170754, 0.01725049072692957, 0.016511938772943806, 0.015761937144078475, 0.014989186628287134, 0.014184554655472597, 0.013338236030143249, 0.012439135611669887, 0.011467432731633162, 0.010449312662111765, 0.009365577025100763, 0.00820648070926882, 0.0069568069251477686, 0.005599278217538444, 0.004105221189955269, 0.002423669865784707, 0.000743755169242518, 0.00039620803217078985], [0.001905879391430642, 0.001887106275591429, 0.0018597390091829112, 0.0018300641719992815, 0.0018084299245514587, 0.001809540693963494, 0.0018515652637071814, 0.0019526134342811308, 0.0021260537651854967, 0.0023695800326543363, 0.0026110566106090005, 0.0026019703190519414, -0.13509676424188283, -0.02772245208323422, 0.006503116599118501, 0.004751357112840641, 0.00451918788013304, 0.0045102482110099375, 0.004518794256555803, 0.0045190588068524, 0.0044813578202372905, 0.004507238487720233, 0.004549277265129005, 0.004610227116038597, 0.004691055676423719, 0.004790189119250399, 0.004901749700009631, 0.005016875582668135, 0.00513857491561404, 0.005270812824004996, 0.005417611381602443, 0.005585407847436103, 0.005778496283281703, 0.005998870310635358, 0.006249685057926142, 0.006535181392516657, 0.006861772697022479, 0.00723595214295179, 0.0076630726639637355, 0.008147035287572199, 0.008692026595188345, 0.00930370559261132, 0.009985420633089983, 0.010751062490606264, 0.011630773715840275, 0.012645542520583548, 0.013795879805001836, 0.015071448018149195, 0.016446672215878252, 0.017876712386856206, 0.019292835087191044, 0.020619570856931727, 0.02180159165317988, 0.022827747759998167, 0.02372514901873306, 0.024532269441400766, 0.025257401193336634, 0.025865049869347057, 0.026312419508492668, 0.026564342094017347, 0.026630182733247073, 0.026546359697600726, 0.02634739570697415, 0.02605624781633013, 0.025681339971033123, 0.025232297263985463, 0.024719729531046786, 0.02415167189071955, 0.02353352129256565, 0.02287811558621906, 0.022205591079460983, 0.02153519379531044, 0.0208962590020248, 0.020307517790183468, 0.019759109110421245, 0.0192285649256183, 0.018699285092311353, 0.0181579059752716, 0.01759014005193281, 0.01699599334088073, 0.016382751374810576, 0.015758143473327386, 0.015128189003680525, 0.014502151910534528, 0.013880392067773289, 0.013249021933914428, 0.01259853605686198, 0.011921254456566223, 0.011208931338434949, 0.010452236945083472, 0.009643344589073897, 0.008787098646367623, 0.007875521234667887, 0.006900384944555945, 0.005848813735088639, 0.004706119232469209, 0.0034478487885611663, 0.0020371076922169116, 0.0006245969471531738, 0.00035092451368125125], [0.0018289446633209727, 0.0018125784731887796, 0.0017880934949050607, 0.0017616173359719122, 0.0017431993200446663, 0.001747118576741089, 0.001791085198917484, 0.0018930126388802288, 0.0020665474421351806, 0.0023110067380450365, 0.002564003251920861, 0.002631280314180691, -0.0995685147933163, -0.01465684052695968, 0.0052964962381846495, 0.004433070783316002, 0.004285373439230465, 0.004295343277891095, 0.004312335197228077, 0.004317928603774933, 0.004293752384038666, 0.004319156435982011, 0.004359917928217705, 0.004418703956924034, 0.004496461081747153, 0.00459169301656599, 0.0046987814174609295, 0.004809268565985466, 0.004926049780632361, 0.005052926875881016, 0.005193756456258242, 0.005354712111485611, 0.005539912749541892, 0.005751271044406904, 0.005991813072495061, 0.006265605786579934, 0.006578798549490905, 0.006937617334899184, 0.007347195114264892, 0.007811272094737665, 0.008333861339657411, 0.008920387207159304, 0.009574063856186484, 0.01030821588478237, 0.011151747441287245, 0.012124790632774723, 0.0132278410071647, 0.014450991204507872, 0.015769723980372193, 0.017141048837225586, 0.018499133053563283, 0.019771527094162845, 0.020905176592455617, 0.021889385962430834, 0.022750143241800656, 0.023524338951822293, 0.02421991108724441, 0.0248028125511093, 0.025231997820714808, 0.02547375114291542, 0.025537061954076186, 0.025456820941264238, 0.025266152894189625, 0.024987064501927524, 0.024627634924947347, 0.02419719322253808, 0.02370575428155218, 0.023161077469008907, 0.022568180359677704, 0.021939441729910365, 0.021294198977575392, 0.020651487581276926, 0.02003892922804605, 0.01947448654247038, 0.018948704402186312, 0.01844003997361575, 0.017932577811373848, 0.017413505436999932, 0.016869123860163125, 0.01629943869953319, 0.01571143760978747, 0.015112533148851864, 0.014508497314385008, 0.013908212733809875, 0.013312025180866023, 0.01270662102825084, 0.01208288785199636, 0.011433462699165488, 0.010750439738441135, 0.010024873312305189, 0.009249502638742291, 0.008428321575541992, 0.00755406081083235, 0.006618823686950914, 0.005610246669561712, 0.004514214747063004, 0.003307222584256436, 0.001955776288133393, 0.0005996649957544295, 0.0003391062784370416], [0.001786135118464891, 0.0017711663543510134, 0.0017483478391120838, 0.0017237220625556243, 0.0017071762533759768, 0.001712758819021198, 0.0017579343004530627, 0.00186052573722279, 0.0020343631718258625, 0.0022797209601513498, 0.0025398771234109727, 0.0026523240111364266, -0.07873721237983802, -0.008485840031339668, 0.004711356607396005, 0.004251420248670604, 0.004153457906828413, 0.0041746042468651405, 0.004196605642776839, 0.004205352417139612, 0.0041891249157194835, 0.004214283780782002, 0.004254349331352987, 0.004311941773837212, 0.00438799657396567, 0.004481061086204854, 0.004585662087457059, 0.004693568361278509, 0.004807612746198829, 0.004931506069592267, 0.005069012752717783, 0.0052261595347133285, 0.005406967797043954, 0.005613305154674517, 0.005848125814826915, 0.006115399861303243, 0.00642112956501174, 0.006771392040816557, 0.007171197727717143, 0.007624197228045138, 0.00813430689355458, 0.008706820296222271, 0.009344876958081517, 0.01006148624241156, 0.010884862438702425, 0.011834660970608965, 0.012911369029217287, 0.014105319084391854, 0.015392583330041933, 0.01673120180216675, 0.0180569603025515, 0.019299088766469054, 0.02040579940969392, 0.02136664948486615, 0.0222070018458045, 0.022962864824851246, 0.02364197865704173, 0.024211102096459155, 0.0246301644406346, 0.02486625918378065, 0.024928166807537056, 0.024849925964350785, 0.024663883426642715, 0.02439151622836816, 0.02404071151108787, 0.0236206368691291, 0.02314087307652275, 0.022609014991379534, 0.02203016199222201, 0.021416350758968816, 0.02078644160287881, 0.02015901047553081, 0.019561016117367495, 0.019009990703614234, 0.0184967021565003, 0.018000121351738417, 0.017504713163865367, 0.016997971374957937, 0.016466524567016888, 0.015910379541704475, 0.01533635815940054, 0.014751696770076076, 0.014162029798334957, 0.01357602752110829, 0.012994026570400023, 0.012403030700782889, 0.011794145714412363, 0.011160185369994484, 0.010493432289625215, 0.009785154371243835, 0.00902996967258637, 0.008228350085535779, 0.007374898854661773, 0.006461903050304633, 0.005477283307117268, 0.004407241464788907, 0.0032287952959150767, 0.0019104061879785862, 0.0005856162702074541, 0.000332189193750579], [0.001762481396702207, 0.00174830707299156, 0.0017264333882508042, 0.0017028570846642655, 0.0016873774367305281, 0.0016939176471639026, 0.0017398102987533773, 0.0018428357102184653, 0.0020169363763380766, 0.0022629362600149624, 0.0025273361588213153, 0.002665769265322007, -0.06681881636922427, -0.005499595939453003, 0.004421286954577884, 0.004149282587763628, 0.0040798741367251805, 0.004107447428171927, 0.004132335722382482, 0.004142897097606826, 0.004131223953123829, 0.004156255031659746, 0.004195941730126379, 0.004252878688583007, 0.004327995486357622, 0.0044198637803998615, 0.004523090831278093, 0.004629571200322038, 0.004742103320143095, 0.004864347700680209, 0.005000017786735019, 0.005155059125891144, 0.005333439188352918, 0.005537000686083057, 0.005768658093291131, 0.006032327933544794, 0.006333931135066113, 0.006679462494347859, 0.00707386469455596, 0.007520738783032933, 0.008023947613971944, 0.008588712411537055, 0.00921813147145394, 0.009925039905431707, 0.010737270539829532, 0.01167421529452706, 0.012736356814506456, 0.013914160258202886, 0.015184023846700026, 0.01650455755452635, 0.017812443179443423, 0.01903783826165839, 0.02012965539114123, 0.021077591577226936, 0.02190666386691239, 0.022652392741843094, 0.023322408905062028, 0.02388391656687528, 0.02429738395573206, 0.02453035214398721, 0.024591486190806727, 0.0245143531928007, 0.024330869982657054, 0.02406222062183597, 0.023716028962750553, 0.023301686514888866, 0.022828316880374084, 0.022303574644168985, 0.0217324800874542, 0.02112690499303456, 0.020505453595116983, 0.019886450462695954, 0.019296490511339293, 0.01875286721810453, 0.018246470896287222, 0.01775655629793862, 0.01726779846778864, 0.016767860400332398, 0.016243551749274915, 0.015694880186987434, 0.015128576082440766, 0.014551778189440862, 0.013970044704839325, 0.013391928358027804, 0.012817760234371093, 0.012234719004361336, 0.0116340309757028, 0.0110086074196301, 0.010350836667790365, 0.009652105842314514, 0.008908654711105307, 0.008117850822902152, 0.007275904472024527, 0.00637520413483996, 0.005403827235036619, 0.00434815026384464, 0.0031854794160268373, 0.0018853828090307989, 0.0005778895727219952, 0.0003284235682443793]], [[0.005092432041770852, 0.005015474603446937, 0.004873375033056306, 0.004667440324167129, 0.004402233817446119, 0.004088423609406675, 0.0037461322577696165, 0.0034072308403314184, 0.0031186283143886688, 0.002956398411487665, 0.002946426952795971, 0.0030454499638579526, 0.0032057782301575626, 0.003388910249281439, 0.00356698561179081, 0.003719823488479654, 0.0038309851574455525, 0.0038672500740797064, 0.002105254566244973, -0.018131754854054785, -0.0008558972489752908, 0.00826151731821465, 0.005893453325998575, 0.005323058976841169, 0.005371897675487471, 0.005482246286552552, 0.005604838913037931, 0.005736158334171609, 0.005876588896513839, 0.006027946412413901, 0.0061932729072644, 0.006378030718667602, 0.006585772708924763, 0.006817898090706945, 0.007076632174150851, 0.007364956943904713, 0.007688264761805085, 0.00805215676651581, 0.00846097122770488, 0.00891806194423095, 0.009427862606522112, 0.009998085782859987, 0.010634799941530668, 0.01134866931231183, 0.012160643315207015, 0.01307922686518391, 0.014097024511604678, 0.015196652365459015, 0.016346741866067084, 0.01750066331136872, 0.01859655388257746, 0.019578138519885987, 0.020404370739291643, 0.02106574407318832, 0.02158419126623853, 0.021985045669785937, 0.022283417682527538, 0.02247307981804697, 0.022544517981685736, 0.022485688186777153, 0.022300538265107618, 0.022013060979561825, 0.021648345411080742, 0.021226248876340587, 0.020754961953831554, 0.020243335680937797, 0.019699855753990005, 0.01913241572013102, 0.01854404803626043, 0.017941294541965774, 0.01733632519850844, 0.016741048244661487, 0.016173539932826556, 0.015641586635546233, 0.015136812427626762, 0.014646533872433275, 0.014160588185968047, 0.013670610395163959, 0.013167792759913413, 0.012654122002286584, 0.012133645389756932, 0.011610656080745674, 0.011088681454489206, 0.010573801743796978, 0.010064698402023498, 0.009550270894712156, 0.009024766361589004, 0.008483676291413774, 0.007928456021923509, 0.007339521822319896, 0.006593824098871936, 0.005917203717253936, 0.005196013629033753, 0.004419311670916414, 0.0035696106322716734, 0.0026248713093195123, 0.0015483388355091562, 0.00029358590833088475, -0.001098209764123244, -0.0016576128999000155], [0.004952353714001224, 0.004884131332892882, 0.00475307166516922, 0.004560729755718729, 0.004311808293138643, 0.004016916944082374, 0.0036958263487269875, 0.00337980079383487, 0.003113744381775353, 0.002969530978588732, 0.0029721262510821462, 0.0030804860487672853, 0.0032493977722590182, 0.0034427583745551805, 0.0036354218253847005, 0.003811177508659926, 0.003960029844275687, 0.00406888976655677, 0.003388370024285311, 0.00016060664458639474, 0.00357023475751685, 0.0055096281341340736, 0.005132240063145311, 0.005105295536421781, 0.00518897193721904, 0.005302442966063697, 0.0054253338032506275, 0.005555732055983943, 0.005694483424790766, 0.005843483453110943, 0.006005764925383865, 0.0061866932670333165, 0.0063897674954354194, 0.006616382648305871, 0.006868726639373278, 0.007149715733261524, 0.007464596077215022, 0.00781881560128551, 0.008216597969492334, 0.008661205423377595, 0.00915693802251471, 0.009711270201766768, 0.010330151686352896, 0.011024006921143368, 0.011813184338162874, 0.012705972697794353, 0.013695209590902774, 0.014764016493678561, 0.01588192810659988, 0.017003644346321487, 0.018069126729943888, 0.01902357808142555, 0.019827186961472596, 0.020470721930129773, 0.020975451180514425, 0.0213659486877947, 0.02165672207507549, 0.02184166709780418, 0.02191205396632693, 0.02185550729584888, 0.021676247034189453, 0.02139705029452626, 0.021042755873721224, 0.020632601793750326, 0.020174605443581354, 0.019677379186297507, 0.019149181167651123, 0.018597699764634993, 0.01802593778049602, 0.017440290623544307, 0.01685258099873938, 0.016274359267717697, 0.01572312684438053, 0.01520637879830142, 0.014715958932772675, 0.014239595318775118, 0.013767462355842178, 0.013291473724491772, 0.012803110072884517, 0.012304320200618803, 0.011799536262540655, 0.011292517599756136, 0.010786700333342633, 0.010287969815250033, 0.00979504562591698, 0.00929723513910327, 0.008789086767727867, 0.008266060117771161, 0.007725936105429037, 0.007157084423933142, 0.006550337552957336, 0.0059212917489730905, 0.0052575400986377184, 0.004548511852919055, 0.00378902022594812, 0.002967965761395594, 0.0020725644356589853, 0.0010944370618394725, 0.0001542954765312712, 0.0002571715257355853], [0.004930723171364592, 0.004864357117852494, 0.004735549020760774, 0.004545914005798951, 0.004300196589751105, 0.004009015437955943, 0.003692102306820819, 0.0033806484792711007, 0.0031191936833853792, 0.0029788016652073975, 0.0029842800458179312, 0.003095006416011088, 0.0032662399275484094, 0.003462350601237796, 0.0036587609285404945, 0.0038401352333764342, 0.003997932256453085, 0.00412364519772162, 0.004167407168371289, 0.0034004321660389934, 0.0041714727226495356, 0.005109053351785996, 0.004980355709099402, 0.005052394106885516, 0.005158028927095265, 0.005272454291754093, 0.0053956726231764365, 0.005526134981647316, 0.0056647944961356975, 0.0058135689657408856, 0.005975495455732572, 0.0061559285168052355, 0.006358362216780623, 0.0065841935798417305, 0.006835606571235078, 0.007115508557600574, 0.007429123270191402, 0.0077818750471298735, 0.008177970217848805, 0.008620656939221242, 0.009114213740822353, 0.009666076293206248, 0.010282179680279604, 0.010972915426740318, 0.011758537265342602, 0.012647301942671536, 0.013632085306052318, 0.014696088953354681, 0.01580899016233844, 0.016925697767553885, 0.017986464401459484, 0.018936715725125383, 0.01973683913773684, 0.020377646706031264, 0.020880299308550374, 0.02126924886487887, 0.021558895569783347, 0.02174315052427544, 0.02181344512204023, 0.021757301989220067, 0.021579012285938465, 0.02130112279847187, 0.020948467402792582, 0.02054018288744938, 0.020084263893717383, 0.01958928629669004, 0.019063473554199056, 0.0185144832783875, 0.017945317815825958, 0.01736235253329361, 0.0167773169161694, 0.016201714183373454, 0.015652954796360762, 0.015138487991816595, 0.014650201576144635, 0.014175901947556881, 0.013705830266600577, 0.013231959510565904, 0.012745830653752776, 0.012249393860294052, 0.011746598258282732, 0.011241619056760651, 0.01073786888606709, 0.010241196759403484, 0.00975031590696947, 0.009254582097337632, 0.00874858048629808, 0.008227729700923472, 0.007688934260180579, 0.00712232471318922, 0.006518241736249279, 0.005891569346094339, 0.005230012997412363, 0.004527231038108247, 0.0037733860805281624, 0.0029591942068942162, 0.002066055375467239, 0.0010915701695563419, 0.0001571310413413889, 0.0002728675784287054], [0.004926265454215155, 0.0048615468654711015, 0.004734565728504041, 0.004547003831054922, 0.004303664934015942, 0.004015214475446604, 0.0037014147287767105, 0.0033934935152604203, 0.003135778907337371, 0.00299876493973575, 0.00300718688776908, 0.003120706069323202, 0.0032949014839904795, 0.0034944966362334194, 0.003695403497652166, 0.003883119416755982, 0.004050547874483603, 0.004193799402296947, 0.004283255163308985, 0.003896579284983971, 0.004499489760133565, 0.004921708120656221, 0.004948866784234304, 0.005036547624511669, 0.005144932050954424, 0.005260731003005913, 0.005384718331370762, 0.005515708231290903, 0.005654766168365315, 0.005803839313231842, 0.005965979840114626, 0.006146550253477965, 0.006349051988525497, 0.006574889036999005, 0.006826249102191012, 0.007106040833483889, 0.007419483746575743, 0.007771997482561743, 0.008167785702094916, 0.008610093792471154, 0.009103193615326738, 0.009654507886552127, 0.01026997788177098, 0.010959998577614939, 0.011744799464447285, 0.01263263409171438, 0.013616391850740331, 0.014679296046755747, 0.0157910610621922, 0.016906647763149433, 0.017966392220985807, 0.01891575262532208, 0.019715177606957728, 0.02035549078494814, 0.020857819216647314, 0.021246577717229907, 0.02153610857649685, 0.021720316872703867, 0.021790767099139054, 0.021734823181861644, 0.021556812777944336, 0.02127913417203909, 0.02092670467838971, 0.020518627163746812, 0.020062922337717153, 0.01956816678308111, 0.01904258445809841, 0.01849383499819975, 0.01792493605258738, 0.017342270170663865, 0.01675759574253219, 0.016182389464108483, 0.01563402291359946, 0.015119911208825956, 0.014631933495436544, 0.014157916236437734, 0.01368811802384999, 0.013214524843861614, 0.012728691732745174, 0.01223257384846821, 0.011730122715104938, 0.011225511958301276, 0.010722151059947425, 0.010225877842135323, 0.009735394598696967, 0.009240067273782075, 0.008734501325078269, 0.008214059814767019, 0.007674749665624541, 0.007108516904489132, 0.006512860148910819, 0.005886654113783923, 0.005225474163114098, 0.004522919159632626, 0.0037689944871794724, 0.0029542183720167544, 0.002066151455094846, 0.0010926636266340188, 0.00016069156268651205, 0.0002898762452640978], [0.004925024162572229, 0.004860810308199102, 0.004734387451813485, 0.004547457917046705, 0.004304843802175081, 0.004017225202451675, 0.00370437428973621, 0.003397530934911023, 0.0031409593085041628, 0.0030049801625602708, 0.0030143071811241993, 0.0031286878431654366, 0.003303798305937125, 0.00350446981065684, 0.003706764163877243, 0.0038964344053463067, 0.004066827942139717, 0.0042154745690799154, 0.004318978966923595, 0.004049266677052327, 0.004567992047908484, 0.004880657645027689, 0.004939315237985181, 0.005031808324056717, 0.005141040815907634, 0.005257265039997149, 0.005381492004252558, 0.005512647500239435, 0.0056518315536394255, 0.0058010004148667535, 0.005963210982553478, 0.006143828346576237, 0.0063463562985591, 0.006572201008832198, 0.00682355138705054, 0.007103316553080641, 0.0074167148634488676, 0.007769164657315344, 0.00816486888503597, 0.008607072167529714, 0.00910004442858383, 0.009651204596219222, 0.01026649600497498, 0.01095631496482258, 0.011740884043796, 0.01262845602468391, 0.0136119242760144, 0.014674518336501526, 0.01578596320141485, 0.016901234551843086, 0.017960692545738004, 0.018909803943653634, 0.019709035163180934, 0.020349213134240957, 0.020851462525913397, 0.021240149176678387, 0.021529585712206097, 0.021713672876423902, 0.02178415016041103, 0.02172813615739061, 0.021550099807991135, 0.02127239117844862, 0.020919956279176657, 0.02051188990216432, 0.020056211878511154, 0.019561497214709837, 0.019035968529751427, 0.018487284469277724, 0.017918465403059837, 0.017335894772452416, 0.016751326859186885, 0.0161762339053267, 0.015627978444759123, 0.015113965495033284, 0.0146260708497072, 0.01415212735175352, 0.0136823991243104, 0.013208876247085175, 0.012723118190750636, 0.012227082468677713, 0.01172472173379821, 0.011220209274270988, 0.010716953716004741, 0.010220789590621105, 0.009730800368316464, 0.009236066168143547, 0.008731176047000654, 0.008211396060192605, 0.007671496508176306, 0.007105739170544252, 0.006511718931762136, 0.005885641278621103, 0.00522456812417079, 0.0045220875852504646, 0.003768176519848433, 0.0029532812815638246, 0.0020647856090328055, 0.0010936828988814728, 0.00016183489130149178, 0.0002951549065372333], [0.004924265930462538, 0.004860369862344376, 0.004734298234746411, 0.004547766322008974, 0.004305607802794407, 0.004018512061995697, 0.0037062576064205454, 0.0034000920537016477, 0.00314423951763007, 0.0030089118855253765, 0.0030188093546944976, 0.003133733508907909, 0.0033094215207239617, 0.0035107723587009757, 0.0037139421432814544, 0.003904844989567281, 0.00407710804896168, 0.004229155571456208, 0.004341514427610655, 0.004145561355778747, 0.004603334921774378, 0.004858780946229752, 0.004933318705557607, 0.005028846053976543, 0.005138613558618499, 0.005255106371087712, 0.005379484968856705, 0.0055107454699019984, 0.005650009686175891, 0.005799239600025467, 0.00596149510249928, 0.006142142939106513, 0.006344688403688743, 0.006570539046466144, 0.006821884548080803, 0.007101634339131678, 0.007415006071101294, 0.007767417289109226, 0.008163070516400323, 0.008605209906755442, 0.009098104183534792, 0.009649169923779202, 0.010264351788670845, 0.010954046979306195, 0.011738473799876406, 0.01262588459033186, 0.013609175191031787, 0.014671578987271634, 0.015782827514912914, 0.016897960376877814, 0.017957296910813367, 0.018906293172101546, 0.019705414863227917, 0.02034548236530921, 0.020847601494120942, 0.021236163919442743, 0.021525476483160395, 0.02170944228875551, 0.021779804510398078, 0.02172369440084696, 0.02154558877934492, 0.021267809924269986, 0.020915323293253806, 0.020507219016114773, 0.020051516414312718, 0.019556789494940007, 0.019031259995044264, 0.01848258578637772, 0.017913788553208455, 0.017331252166564358, 0.016746729208562332, 0.016171689262344937, 0.015623489210577433, 0.015109526421131694, 0.014621672702052887, 0.01414776455277645, 0.013678069570372438, 0.013204580405768856, 0.012718859449416212, 0.012223182311635977, 0.011721279297471559, 0.011217294980974565, 0.010714622133858947, 0.010219083163983546, 0.009729359725283633, 0.009234819671359206, 0.008730090133177774, 0.008210453255959689, 0.0076706880603708725, 0.007105061346325297, 0.006511561612152732, 0.005885571857048707, 0.005224576741918396, 0.004522160502498265, 0.003768288403367071, 0.0029533779100565883, 0.0020647489854597996, 0.0010931792568662755, 0.0001625819816983367, 0.00029850771647104037], [0.004923779287374612, 0.004860073039272405, 0.00473421159961045, 0.004547917947907412, 0.004306032629384182, 0.004019250489041619, 0.0037073536688406296, 0.003401594181772672, 0.0031461719592301178, 0.003011233519842796, 0.003021470849566837, 0.0031367180573273357, 0.003312748987529659, 0.0035145032154970893, 0.003718193231730217, 0.003909829235448364, 0.004083205122327771, 0.004237278158526482, 0.004354912605248353, 0.004202944839107606, 0.00462147495308928, 0.0048471707904434004, 0.004929709850853522, 0.00502704528882747, 0.005137130830894112, 0.005253782871135698, 0.005378250947714595, 0.0055095730930990044, 0.005648884093711901, 0.005798149333678418, 0.0059604304655899425, 0.006141095183602088, 0.006343649651943292, 0.0065695022331566325, 0.0068208430518333285, 0.007100581703167977, 0.007413935381620625, 0.007766321120842156, 0.008161941159851409, 0.00860403935112674, 0.009096883672516657, 0.009647889247682855, 0.010263001486323881, 0.010952618047049266, 0.01173695455029296, 0.012624321108844068, 0.013607569549471938, 0.014669926763537604, 0.015781120221836545, 0.01689613163732711, 0.017955334526493928, 0.018904194677818884, 0.019703188983483094, 0.020343142511989314, 0.02084516103092536, 0.021233632680004836, 0.021522857812558614, 0.021706740072277044, 0.021777024498077946, 0.02172084977525345, 0.021542697007161105, 0.021264871673347733, 0.02091235068226019, 0.02050422123993318, 0.02004850228134299, 0.0195537671382708, 0.01902823694831101, 0.01847956904148921, 0.01791078580975404, 0.01732827131522602, 0.01674377669391127, 0.016168769787248856, 0.015620603951732943, 0.015106671801764514, 0.014618843010359333, 0.014145221396608698, 0.013675885520487504, 0.013202807861763935, 0.012717543077876906, 0.012222050136326401, 0.011720281145752453, 0.011216405044496731, 0.01071382472963471, 0.010218364442158115, 0.009728710173010656, 0.00923423468005847, 0.008729567521378316, 0.008209992572116891, 0.0076702902594823555, 0.007104728524285841, 0.006511460359377958, 0.0058855249103463144, 0.005224577941519181, 0.004522201269748859, 0.003768353121198578, 0.0029534336040290335, 0.002064724875161169, 0.0010928573560599804, 0.00016303353957391187, 0.00030051072090014116]], [[0.00756500176791615, 0.0074591530525352995, 0.007255087042051684, 0.006951084575739414, 0.006547988645034112, 0.00605346881726161, 0.0054877660186178805, 0.00488929316942599, 0.0043215083931294205, 0.0039033622094504236, 0.003703368975986437, 0.0036796187760104533, 0.00377410168691482, 0.003945670170221556, 0.004150277709528631, 0.0043549792217717894, 0.004562612267829752, 0.004768632848064081, 0.004964328327829433, 0.005137454609005932, -0.03918003698821255, -0.03280161991153967, -0.027018099347041896, -0.021919105753594327, -0.01761044230671174, 0.02631626619599552, 0.01301220155812699, 0.006707216451294563, 0.006866416634351305, 0.007045409225014398, 0.007242127256517015, 0.007461292450090421, 0.007706036622210269, 0.007978043457726933, 0.008279635134806933, 0.008613962762727655, 0.00898731359966443, 0.009404636956095091, 0.009870587127120438, 0.01038898947881828, 0.010964874673885853, 0.011607203608922898, 0.01232375889495944, 0.013126477055569522, 0.014037086315721252, 0.015064673848879261, 0.016191769749632386, 0.017399538741224522, 0.018650302158859457, 0.01989006050724474, 0.021049169552783454, 0.02206858225914594, 0.022906511630793536, 0.023553290504290357, 0.024033187935332517, 0.024371550346340247, 0.02458622075320019, 0.024678083166876624, 0.02464681210430862, 0.02448417975990814, 0.024195742900595903, 0.02380479209023153, 0.023335844608877533, 0.02281138400611359, 0.022241106814855423, 0.021635181291095762, 0.02100585107515987, 0.020357056171284325, 0.019691671813603578, 0.019016727714841537, 0.018344028769674302, 0.017684953841431855, 0.01705708039007383, 0.01646602991521128, 0.01590270342832499, 0.015377417007599559, 0.014835713594549042, 0.0142912909353054, 0.013736243109992158, 0.013175369305083126, 0.012609941491325254, 0.012043404223792943, 0.011479869693745894, 0.010925480005211785, 0.010378218485031837, 0.009826230886781548, 0.00926414098479013, 0.008687023394170025, 0.008089359621962573, 0.007465163412456349, 0.0066480344235007515, 0.005932464732760461, 0.00516999275054803, 0.004347707037458792, 0.003444877386102715, 0.0024351347767758453, 0.0012749152199465212, -8.861901453894802e-05, -0.0015669408178839433, 0.0002084900664932323], [0.006819294902224022, 0.00672868828576368, 0.0065499277954381195, 0.006281661485618648, 0.005924812084458824, 0.0054864093244517236, 0.004984756014617913, 0.004454552702555237, 0.003952309046251669, 0.0035835571893475466, 0.0034097457008889116, 0.003393727573295093, 0.003484022054755084, 0.0036397371193042207, 0.0038254028053407614, 0.004016486744274707, 0.0042084605344167424, 0.004399001258286105, 0.004581243782130736, 0.00474521743258061, -0.006613595217645051, -0.004851498141792166, -0.0032476892912243517, -0.0018235560319008917, -0.0006033209443034203, 0.010937020235692646, 0.008474696425174138, 0.0060185068000250625, 0.006170419589355938, 0.0063358124242705, 0.00651568810440478, 0.0067150987102581475, 0.006937339812980209, 0.007183882227433956, 0.007456863653907739, 0.007759133528899971, 0.008096094740628505, 0.008472749878565446, 0.00889328448234805, 0.009361028579192429, 0.00988048973996666, 0.010459722950276806, 0.01110581032422367, 0.011829585450913638, 0.012650597107500931, 0.01357549591513496, 0.014591881976078306, 0.01568117707463971, 0.016809415124499454, 0.01792786607264956, 0.018973983852936242, 0.019894394642436412, 0.02065143430322586, 0.021236359419618725, 0.02167097051040522, 0.021978078533329296, 0.022173596812636566, 0.02225822715496109, 0.02223161346928326, 0.022086423082735954, 0.0218274029179604, 0.021475209661617818, 0.0210532735537437, 0.02058132828857145, 0.020068005575166796, 0.01952227737528018, 0.018953708470658047, 0.01836829981931022, 0.01776871761936945, 0.017160732768969015, 0.016554869873295755, 0.01596132994628681, 0.01539589052672426, 0.01486355917657335, 0.01435625041011175, 0.013872038236560868, 0.013384211150250801, 0.012894309710208218, 0.012394979701451866, 0.011889627430840566, 0.011380661222370029, 0.010871438655796083, 0.01036526417603199, 0.009867579709650173, 0.009376572937275523, 0.008881670725145393, 0.008378147597368336, 0.007861691054484907, 0.007327475931034971, 0.006770278474227017, 0.006180565265852837, 0.005566634111468859, 0.004922345786888492, 0.004239306718226782, 0.0035074890460032736, 0.0027179435938922895, 0.0018600235576585454, 0.0009292693908302344, 5.910967939333858e-05, 0.00026641323372528366], [0.006722634823241776, 0.0066344345229416195, 0.00645941898462088, 0.0061963015715440955, 0.00584602993005991, 0.005415561260406944, 0.004922952262136387, 0.004402428914642672, 0.003909538122417527, 0.0035479210910232487, 0.0033780825566162957, 0.003363549462946538, 0.003453760007178336, 0.0036075149257497477, 0.0037908352115712182, 0.00398074154115172, 0.00417111611031058, 0.004360082699066274, 0.00454110419098, 0.004704600108008953, -0.0021096955617654167, -0.0009855767119518507, 4.0558556619587546e-05, 0.0009566869507442138, 0.001749431857917557, 0.00880463979055479, 0.007595042339003335, 0.005926766903026444, 0.006078487840344581, 0.006242480019204414, 0.0064204008156816305, 0.006617416399696726, 0.006836885880595736, 0.007080248280120327, 0.007349621364801963, 0.00764781626851631, 0.007980097548000904, 0.008351523161544163, 0.008766216995176442, 0.009227434278452282, 0.009739612341813754, 0.010310686720289293, 0.010947654697892332, 0.011661213498166992, 0.0124706260241012, 0.013382089079179297, 0.014384159776303727, 0.01545814996863814, 0.016570574664985696, 0.017673382060468704, 0.018704967044279285, 0.019612677980662813, 0.020359385483378165, 0.020936463261982823, 0.02136538502915065, 0.021668629778184373, 0.02186184540239589, 0.02194570157719345, 0.021919832629705056, 0.021777029446831932, 0.021521910505478265, 0.021174760809470176, 0.020758988776741275, 0.020293923874793424, 0.0197880500260371, 0.019250165296438977, 0.018689336625665603, 0.018112065673636962, 0.017521007001615702, 0.01692172325528893, 0.016324565110739476, 0.01573957332784303, 0.01518227928227306, 0.014657606190855153, 0.014157224689791255, 0.0136770050678666, 0.01319581873740966, 0.012712646624529334, 0.012220172429110755, 0.011721535767776719, 0.011219402856221028, 0.010717140103451171, 0.010217911552188496, 0.009727061714946953, 0.009242793335737553, 0.008754684425887067, 0.008258082334389575, 0.007748737736310526, 0.0072218921014404885, 0.006672390836815064, 0.006091063068543981, 0.005489078312459452, 0.004855722711811672, 0.004184648766933022, 0.0034616179545901562, 0.002683318526544909, 0.0018374830509758856, 0.0009191328975273497, 6.138882556483542e-05, 0.00028093207579666567], [0.0066473666119318325, 0.006561285409953195, 0.0063894508331588384, 0.00613063718980122, 0.005785819837785642, 0.00536190542489269, 0.0048767619209311676, 0.0043642495453225585, 0.0038791301485224376, 0.0035234861005474776, 0.0033570712604534003, 0.0033439696019650594, 0.0034343762740652703, 0.0035866588609176106, 0.003768215410119265, 0.003957539475977733, 0.004146914050533826, 0.0043349012223792656, 0.004515269742291011, 0.004678797387234705, 0.001468454836771464, 0.002085710668817615, 0.002652870347417687, 0.0031653087105053576, 0.003618008859091572, 0.007104611855659334, 0.006743986507151219, 0.005853923959083156, 0.006005924364965185, 0.006169032205336741, 0.006345560797215869, 0.006540805753538355, 0.006758199766286851, 0.006999154707122555, 0.007265775087092799, 0.007560842670466285, 0.0078895007956131, 0.00825687814624417, 0.008667050090855118, 0.009123207581006189, 0.0096297318636979, 0.010194464305613122, 0.010824339535569698, 0.01152995235030768, 0.01233034112580069, 0.013231270668225575, 0.014222214122360306, 0.015284316125223737, 0.016384466231377383, 0.01747513805298659, 0.01849547108509076, 0.019393374026493392, 0.020132121346729388, 0.02070316250175135, 0.021127706155213664, 0.021427965849606552, 0.021619367711963815, 0.02170254653293428, 0.021677122281493096, 0.02153598426718824, 0.02128364757033049, 0.02094009805670048, 0.020528803006730628, 0.020068757259797076, 0.01956833097540136, 0.019036186111777112, 0.018480966313483747, 0.017909667956865005, 0.01732492822391991, 0.016732112506976517, 0.016141428364306157, 0.015562793379646929, 0.015011553293744838, 0.014492555113476729, 0.013997499484767518, 0.013519729552372933, 0.013043609746211436, 0.012565577591272702, 0.012078335736218939, 0.01158477548693363, 0.011087830766704922, 0.010591024254426483, 0.010097401984519283, 0.00961215822904564, 0.009133468262913898, 0.008651015685584506, 0.008160212008460283, 0.007656861596019205, 0.007136259886681232, 0.006593308929535416, 0.006024539327618001, 0.005428869974845136, 0.004801918365003533, 0.004137514091408793, 0.0034260719025633996, 0.0026573260289424095, 0.00182088213306658, 0.0009120156884810237, 6.395374065474053e-05, 0.0002963412539391349], [0.0066281385600467715, 0.006542653677145466, 0.0063716910489132125, 0.006114042813556993, 0.005770693269879452, 0.005348537479799752, 0.004865395852934895, 0.004355036018848974, 0.0038720113523920754, 0.003517986646056702, 0.0033525203711540948, 0.0033398460229820083, 0.003430361393398571, 0.003582279961331319, 0.0037633999737529695, 0.003952650301468817, 0.004141824385201415, 0.004329616556864427, 0.004509885007791817, 0.004673511228267286, 0.002374084504279111, 0.002862979186496907, 0.0033138983419088793, 0.0037240794618411312, 0.004090556681919916, 0.006672166835669318, 0.006489355568990177, 0.005835000399223266, 0.005987168299193732, 0.006150096463027485, 0.006326298542247126, 0.006521112315775223, 0.006737994674831149, 0.006978350019048685, 0.00724427998115978, 0.007538558924898501, 0.007866296196767004, 0.00823264473504136, 0.008641667399958029, 0.009096537370510008, 0.009601621255580693, 0.01016473610710442, 0.01079280131011003, 0.011496386337817431, 0.012294476365336978, 0.013192313943519085, 0.014180459784276338, 0.015239589662009816, 0.0163366762311257, 0.017424301914051053, 0.0184418319895791, 0.019337301181422926, 0.020074083802711733, 0.020643657114800353, 0.021067164529518016, 0.021366754779610597, 0.021557798931742454, 0.021640923628233603, 0.021615745772785723, 0.02147518146221402, 0.02122371151474431, 0.020881238003249522, 0.02047125478075248, 0.020012662057876055, 0.019513796835330742, 0.018983280846142543, 0.018429625615765676, 0.01785998364830396, 0.017276989631482383, 0.016685952255922957, 0.016097041061430225, 0.015520141419971201, 0.014970550920298299, 0.014453099653108719, 0.013959528333684516, 0.013479686041727423, 0.013005100705418415, 0.012528726709379847, 0.012043191909239474, 0.011551078147525224, 0.011055708952124986, 0.010560535298388825, 0.010068451429920983, 0.009584677002328429, 0.009107409555687816, 0.008626372509137156, 0.008136996577521236, 0.007635101499930243, 0.0071159983685782375, 0.006574605127938956, 0.006008219723167245, 0.005414180493677109, 0.004788903703706441, 0.004126208911424678, 0.0034164661566113254, 0.0026511790606731003, 0.0018168864695858058, 0.0009104027383436234, 6.481635286130773e-05, 0.00030122604891461686], [0.006617206508347056, 0.006532081259421391, 0.006361636609217033, 0.006104675680277847, 0.005762188552304569, 0.005341064197822134, 0.004859096230845022, 0.004349999956753685, 0.0038682072525787806, 0.003515138245383947, 0.0033502389823003497, 0.003337830674927507, 0.003428429801212493, 0.0035801459425112473, 0.003761023019623605, 0.003950259529028001, 0.004139340220969573, 0.004327042210156698, 0.004507278774555132, 0.004670994939229514, 0.002899174170779433, 0.003313655901009611, 0.0036971870129081015, 0.004048081824309811, 0.0043645443642305135, 0.006421117622716026, 0.006330637495961437, 0.005824123409257746, 0.0059764225466192155, 0.006139265880941112, 0.0063152932413636335, 0.006509869789342094, 0.006726468198554028, 0.006966488419498744, 0.007232030638775009, 0.007525865050873885, 0.007853080542713262, 0.008218846160712143, 0.008627217610877216, 0.009081376683842736, 0.00958567652090998, 0.010147913616546631, 0.010774995451171766, 0.011477473903580535, 0.012274288295488415, 0.013170673938428001, 0.01415721236151947, 0.015214612374118981, 0.016309901108105, 0.01739573861041874, 0.018411591987096795, 0.019305576592336306, 0.020041132317753032, 0.02060975276824649, 0.021032546800729034, 0.021331624741707883, 0.021522324040371136, 0.021605268332424488, 0.021580074713663924, 0.021439677305112797, 0.021188537871862444, 0.02084651096960224, 0.02043711397233859, 0.01997919247671603, 0.01948106527241576, 0.018951331669740716, 0.018398422603229218, 0.017829590286714634, 0.017247467653514714, 0.01665743830948104, 0.01606963323035646, 0.015493886421610878, 0.014945447764528613, 0.014429111341074347, 0.013936534658365711, 0.013457591102938982, 0.01298385895158427, 0.012508318096638653, 0.012023615839523818, 0.01153233531862695, 0.011037796987042315, 0.010543447485119392, 0.010052177329398978, 0.009569198206957537, 0.009092711688508861, 0.008612459244905423, 0.008123878912776493, 0.007622797811205025, 0.0071045351174692, 0.00656401730974295, 0.0059989455077566305, 0.005405818032848434, 0.004781474257496473, 0.004119726800839681, 0.0034109176398277605, 0.0026464628677211033, 0.0018146903200271726, 0.0009095466678011446, 6.536908559936506e-05, 0.00030434398361099945], [0.0066109961025546185, 0.0065260809506942005, 0.0063559368114141385, 0.006099373285580445, 0.005757383933123225, 0.005336854407184961, 0.0048555631682051185, 0.0043471958859178095, 0.003866114580448981, 0.0035135983470625976, 0.003349028989702633, 0.0033367783118212232, 0.003427431192795328, 0.0035790336124950353, 0.0037597741581490434, 0.00394901072035052, 0.004138044148739572, 0.0043257007222002606, 0.004505926203912821, 0.0046697029972477735, 0.0031954021580342024, 0.0035678926658806362, 0.003913395912804457, 0.004230832598722729, 0.0045190591288708564, 0.006279212454626432, 0.006236547313631661, 0.005817911087587948, 0.005970294905121048, 0.006133094920108151, 0.0063090260945546355, 0.006503470104321587, 0.0067199091581062334, 0.0069597406223917534, 0.007225063915757829, 0.007518646874955957, 0.007845519748636665, 0.008210951389295012, 0.008618984591998315, 0.009072751690137762, 0.00957660084527292, 0.010138325017953332, 0.010764828864873493, 0.01146665756156022, 0.012262733067349115, 0.013158286661198676, 0.014143909605165225, 0.015200329161682805, 0.016294603724194723, 0.017379437721655296, 0.018394356779309094, 0.019287521579399187, 0.02002240862094665, 0.020590519947055692, 0.021012943674128332, 0.021311768393873408, 0.02150231252402726, 0.02158519731981369, 0.021560039318146627, 0.021419782327293666, 0.02116887645713101, 0.020827148360223532, 0.020418129580367542, 0.01996063356655974, 0.019462968218935624, 0.01893371939079172, 0.01838104027085351, 0.017812671538616008, 0.017231233790619797, 0.01664186920841606, 0.01605468759134636, 0.015479532043285019, 0.014931645093502248, 0.014415820157393587, 0.013923724925364693, 0.013445244089503908, 0.012971966572112489, 0.01249687982606924, 0.012012638553692539, 0.011521821759113572, 0.011027746958629932, 0.010533858053403627, 0.010043043296408243, 0.00956050972552039, 0.009084461147769958, 0.00860464931742926, 0.008116516640887859, 0.007615894234371174, 0.007098105722253289, 0.006558082315623053, 0.005993742874026944, 0.005401131902455738, 0.004777317010600714, 0.004116108045461555, 0.00340783451304363, 0.0026438646241130426, 0.0018140562160905108, 0.0009090908805401722, 6.571356566328505e-05, 0.00030622338176567707]], [[0.010238406229458756, 0.010109771299184061, 0.009858726229420838, 0.009477097273251998, 0.008953316996476234, 0.008281347444202702, 0.007465712847447415, 0.006540046306596325, 0.005585312399180717, 0.004754163814431298, 0.004172350474288603, 0.003843848564274387, 0.003703716155351525, 0.0036972196772255867, 0.0037774511004826155, 0.003911742882033787, 0.004080588504950592, 0.0042767205355067565, 0.004487214503227428, 0.004698152530850683, -0.0024057478587471578, -0.0008647881591819068, 0.0005524466977339794, 0.0018277216443600345, 0.0029377747702854138, 0.003852764167907395, 0.004586385930229921, 0.005311694530510728, 0.006078285763283247, 0.006893044045668461, 0.007764810260318487, 0.008705049478346792, 0.009723101300403028, 0.010823743497841175, 0.011747804912328939, 0.006804213975513523, 0.007920860948771006, 0.008773849234068955, 0.009215882029827007, 0.009692078066757698, 0.010216411954721616, 0.010797068187927307, 0.011442321603190529, 0.012163726643276798, 0.012979071153041219, 0.01388917901210372, 0.014881361330488509, 0.01593268283182626, 0.017006268467416336, 0.01805126964932852, 0.019005353467983193, 0.019819903361038956, 0.02046341809839064, 0.020929189329815023, 0.021239280530084757, 0.02141303003765641, 0.021465750091233384, 0.021406669606053846, 0.021245422212878035, 0.020983649102846225, 0.020626730699362605, 0.020192747720814804, 0.019702447757175095, 0.019173836031394085, 0.0186155986576483, 0.018036253419208018, 0.017443753555451805, 0.016845825196990745, 0.016244679832932235, 0.015643948119084497, 0.01505148550429679, 0.014474947677763984, 0.0139268030963041, 0.013408172725921241, 0.01290991155569995, 0.012424611758934577, 0.011945642520501567, 0.011467290093614822, 0.010983637513919169, 0.010498229984298581, 0.01001360685035553, 0.009532202604856528, 0.00905618641202586, 0.00858990679230157, 0.008130772165359896, 0.007668906299279451, 0.0072007867676742, 0.00672288080995848, 0.0062310942277954764, 0.005721063993816538, 0.004981540154329531, 0.004387634121959461, 0.004131932033224371, 0.003528759446790932, 0.002884515171473722, 0.0021920049902781963, 0.0014444418123188583, 0.0006453687970493331, -5.640676884798085e-05, 0.00019134222131281036], [0.010065763379763986, 0.009943447032571419, 0.009698998213117531, 0.009324380174455959, 0.008809746885645802, 0.008150273649596926, 0.007352899301258572, 0.006450160598010894, 0.005514697614001062, 0.004700989014713362, 0.004137932858763942, 0.003817137186602148, 0.0036802380660254665, 0.003673051921171167, 0.0037505401343551196, 0.0038810301348153084, 0.004045451127012924, 0.004236699078986572, 0.004441864995584616, 0.0046469385789504585, 0.0032793360870896223, 0.0037600840821191395, 0.004208925588747672, 0.0046224471223766835, 0.004996240131665691, 0.005324353588143247, 0.005610992825241694, 0.0058986287663704996, 0.006200039361702543, 0.006518426037221981, 0.006858535115700228, 0.007227329768569754, 0.0076294903765904585, 0.008066274681503855, 0.0084231328131199, 0.0076854399086719, 0.008178803518104438, 0.008650024599350556, 0.009078094695374192, 0.009545435009585946, 0.01006052219377465, 0.010631169190510163, 0.011265524884855476, 0.011974998019386136, 0.01277703184408483, 0.013672424664545232, 0.014648683849479005, 0.015683229464253542, 0.016739769038455095, 0.01776825608378399, 0.018707321722750827, 0.019509108539511953, 0.020142719746478212, 0.020601568056928234, 0.02090732178449287, 0.021078968577415997, 0.021131409548154508, 0.021073684804096687, 0.020915274503730066, 0.020657984720000234, 0.02030726996036635, 0.019880140460458946, 0.019397719919260585, 0.018877927144001477, 0.018329103033380947, 0.01775962554159726, 0.017177313307654225, 0.01658975939793114, 0.015999162621860127, 0.01540910116742436, 0.014827287986201625, 0.014261230724319783, 0.013723158510219607, 0.01321422118883965, 0.012725510794735054, 0.012249773279849049, 0.011780511812782843, 0.011312148950466765, 0.010838902019785041, 0.010364226384036074, 0.009890539301198585, 0.009420262156090379, 0.008955525159614517, 0.008500601328340764, 0.008053043730421797, 0.007603294949098334, 0.007147983751610766, 0.0066837614788531514, 0.0062067744065873115, 0.005712938724343822, 0.005183164799347142, 0.004647206169880997, 0.004085756381114561, 0.003492977774779457, 0.002859829704503866, 0.0021789998091717453, 0.001443483392254031, 0.0006542901306428461, -4.722221566329753e-05, 0.00027144960329747296], [0.010043912698102503, 0.009922842603300652, 0.009679482936641854, 0.009305814201586892, 0.008792372491293879, 0.008134606270156407, 0.007340028028936373, 0.006440978815972302, 0.005508296209662841, 0.004697163478877224, 0.004137444088777011, 0.003817856951994546, 0.0036814607136929126, 0.003674101275934897, 0.003751092677054122, 0.0038809360686660513, 0.004044627295290339, 0.004235087402660591, 0.004439387567107914, 0.004643470592831324, 0.00401121082785089, 0.004355424460551418, 0.004679562810168892, 0.004982122856580185, 0.005261123039103538, 0.005513684825589529, 0.005742788113302978, 0.005974102284220647, 0.006215674140666578, 0.006470240311169877, 0.006742034577338321, 0.007037466368554798, 0.007360674409696809, 0.00771268726028235, 0.008012989752886772, 0.007794723860448171, 0.008212082436776126, 0.008636948596435151, 0.009062550943348768, 0.009528681541363321, 0.010042554800386677, 0.010611911505290292, 0.011244886061406442, 0.011952874058050528, 0.012753270326269765, 0.013646868677788726, 0.014621199415701697, 0.015653724200557773, 0.016708220076003415, 0.017734736118676098, 0.018672016097757673, 0.019472292153868764, 0.02010475188482015, 0.02056282350544955, 0.020868112289491366, 0.0210395575276485, 0.021091993181418085, 0.021034434772512423, 0.02087634825517574, 0.020619586628265414, 0.020269638414844242, 0.01984330372989246, 0.019361838619590503, 0.018842864714259996, 0.018294919323058587, 0.01772635773331389, 0.01714497871906937, 0.016558356620033098, 0.015968689480360513, 0.015379549835798942, 0.01479863400849193, 0.01423343601173216, 0.013696162310139908, 0.013187967674710588, 0.012699965824958212, 0.01222491562207385, 0.011756328442961438, 0.011288633350374989, 0.010816054412343155, 0.010342032173881799, 0.009869030204898132, 0.009399438830863695, 0.008935389642433834, 0.00848115866335286, 0.008034369304059673, 0.007585463977747723, 0.007130981205289324, 0.006667599770864912, 0.006191458171794947, 0.0056984684242376545, 0.005177374646573789, 0.004642617778024928, 0.004082426513511717, 0.0034917218603135246, 0.002859273981759746, 0.0021799229001582916, 0.0014458712632173815, 0.0006575419061777746, -4.518188483543171e-05, 0.00029054849625055796], [0.010027941578325787, 0.009908062960877805, 0.009665659155054619, 0.009292723217014116, 0.008780173745323942, 0.008123734013211299, 0.007331504228162029, 0.006435646608422742, 0.005505210706097582, 0.004696192305106458, 0.004139516736317385, 0.0038209594596944336, 0.0036849896356713537, 0.003677449496424938, 0.0037539837614871184, 0.003883250588816586, 0.0040463017525426805, 0.004236079390674578, 0.004439626497249813, 0.004642829480656368, 0.004522953374695407, 0.004771562694329684, 0.005008385121891738, 0.005233256308585419, 0.00544589305864565, 0.005645564836948323, 0.005834391188253568, 0.006026288969366721, 0.0062259997986313185, 0.006435941452995267, 0.006659999041860144, 0.0069042122845028595, 0.007172381879719302, 0.007465535302004186, 0.007737951808551987, 0.007867496881991972, 0.008234645502290472, 0.008629039540449268, 0.009052413724177578, 0.009517618346298995, 0.010030588983148356, 0.010598997742149634, 0.0112309693267129, 0.011937893209195612, 0.012737125205851527, 0.013629451257879625, 0.014602412841017966, 0.015633494848315853, 0.01668651659300593, 0.01771158710667545, 0.01864752148132762, 0.019446612632873585, 0.02007811672631708, 0.020535477755675408, 0.020840275086966304, 0.021011412083392047, 0.02106365988429846, 0.0210060128158247, 0.0208479248776624, 0.020591293532733486, 0.02024163792166576, 0.019815546632070948, 0.01933441855579688, 0.018815838649806366, 0.018268332703849807, 0.017700241835846724, 0.017119351634760603, 0.016533409239843127, 0.0159444403642653, 0.01535600954287319, 0.014775800258580562, 0.014211298078182208, 0.013674697720652645, 0.013167166670342248, 0.012679841551163907, 0.012205487003652198, 0.011737613980827675, 0.011270651144755381, 0.010798822607302763, 0.01032555160215768, 0.009853283722476309, 0.009384399949510973, 0.008921029470058822, 0.008467441440453524, 0.008021213520245755, 0.007572822880239678, 0.007118897665539957, 0.006656092949236172, 0.006180564447890272, 0.005688243110543511, 0.005174789185540365, 0.004640921182294101, 0.004081660511880171, 0.0034912150822323093, 0.002860556317219958, 0.0021822851346223852, 0.0014492648035615895, 0.0006613218595552217, -4.3072288529638445e-05, 0.0003102009326870571], [0.010024007735246481, 0.009904483579788946, 0.009662349944096833, 0.009289602964009894, 0.008777277887224906, 0.008121182011088367, 0.007329596914627687, 0.006434632990121048, 0.005504797094097992, 0.004696349812830532, 0.004140555462536779, 0.0038222837003583214, 0.0036864316985608507, 0.00367883530394323, 0.003755236536905877, 0.0038843387553315666, 0.004047209079064149, 0.0042367954418525665, 0.004440130920390898, 0.004643083224395377, 0.004632937619377252, 0.00486092730753178, 0.0050789185905996065, 0.005287036015678337, 0.005485362249644213, 0.005673628876307558, 0.005853769214290214, 0.006037169481931802, 0.006227860821252877, 0.006428194144409672, 0.006642007144842454, 0.006875240577446736, 0.007131633866370296, 0.007412260824355813, 0.007682138705964422, 0.007881997779256505, 0.008239219762983174, 0.008627611292304516, 0.009050336290589479, 0.009515294727631138, 0.010028029803669555, 0.010596193173335523, 0.011227907184837797, 0.011934560355465291, 0.012733497738891243, 0.013625500991516258, 0.01459811293720494, 0.015628822964643935, 0.016681459570368016, 0.017706145339375094, 0.01864171170040323, 0.01944046756880067, 0.02007168943391575, 0.020528827432031514, 0.020833454200478465, 0.021004463438105827, 0.02105660775369308, 0.020998876430311664, 0.02084072131923028, 0.02058405438719671, 0.02023455678324498, 0.0198086374401091, 0.0193277397271172, 0.018809436239004884, 0.01826224665110944, 0.0176945045731825, 0.017113987727224545, 0.01652824842786381, 0.01593947964006761, 0.015351245914745404, 0.014771227582474181, 0.014206907503466648, 0.01367047547090357, 0.013163098457376819, 0.012675915626649702, 0.01220169480611572, 0.011733949476400758, 0.01126711047200566, 0.010795404297385992, 0.010322252781336206, 0.009850100566736087, 0.009381327714148234, 0.00891806274023822, 0.008464573047596584, 0.00801843731679383, 0.007570136342257563, 0.007116298667258394, 0.006653579420792728, 0.006178133700376237, 0.005685891231614116, 0.0051747021429466595, 0.004640874832500475, 0.004081845617745942, 0.003491647881781087, 0.002862169762526894, 0.0021832674730149567, 0.0014504918405014802, 0.0006625898124183107, -4.2387659368202805e-05, 0.00031630787762068564], [0.010021762731331853, 0.009902459164921166, 0.009660490134726444, 0.009287853530478368, 0.00877565790223996, 0.008119763401040082, 0.0073285660987662295, 0.006434144477078405, 0.00550466498819055, 0.004696558744595416, 0.004141306754773575, 0.003823207489994382, 0.0036874265667177645, 0.0036797945428440272, 0.003756113723777418, 0.0038851152213209557, 0.0040478753839846005, 0.004237345633281511, 0.00444055249323494, 0.004643351559725681, 0.004690814695018919, 0.004907928547890266, 0.005115987633801027, 0.0053152689381938826, 0.005506047951733105, 0.005688299604482219, 0.005863858759673582, 0.006042805149551098, 0.006228768596042117, 0.006424065693723115, 0.0066324725035263425, 0.006859916534703668, 0.007110109326766175, 0.007384165615029699, 0.007653881929206804, 0.007889186629427804, 0.008241464829440156, 0.00862688556944908, 0.009049209865264066, 0.00951402333203309, 0.010026621862235203, 0.010594644374624507, 0.011226211907283786, 0.011932712615151565, 0.012731485267778042, 0.013623309460715433, 0.014595729051451121, 0.015626236176059866, 0.016678664735927363, 0.017703145111056078, 0.01863851784772403, 0.019437100444929533, 0.020068180868783342, 0.020525212342774404, 0.020829763074650086, 0.02100072118872286, 0.021052828173809192, 0.02099518330895035, 0.020837154563289294, 0.02058066428298736, 0.020231250249021376, 0.019805398440080096, 0.01932458096814762, 0.018806364410896434, 0.018259266713599485, 0.017691619330572242, 0.017111198087662184, 0.016525553607985848, 0.015936879709064825, 0.015348740802312794, 0.014768815225350366, 0.014204584171823083, 0.013668234511656906, 0.013160932931013319, 0.012673819989422828, 0.012199665222662123, 0.01173198339644646, 0.011265206422606821, 0.010793562018067443, 0.010320471031703726, 0.009848377442369443, 0.009379660698580494, 0.008916448881359043, 0.008463008349325693, 0.008016918376543445, 0.007568661855583306, 0.007114867565241681, 0.0066521907603283295, 0.0061767864330049575, 0.005684583569350724, 0.005173538252421829, 0.004640996569354629, 0.00408206580840536, 0.0034920103014006417, 0.002861767159828334, 0.0021839128700292454, 0.001451274901207751, 0.0006633809900196587, -4.197961431018814e-05, 0.00032014268297630906], [0.010020495623608053, 0.009901322663823816, 0.009659450014788061, 0.009286876554931078, 0.008774754452162426, 0.008118975323588904, 0.007328003526100284, 0.006433898752199551, 0.0055046250894338795, 0.004696716369371213, 0.004141783653742075, 0.003823784935950003, 0.003688045410431138, 0.0036803921014155693, 0.0037566629261623617, 0.0038856053143834757, 0.004048300980447872, 0.004237703374500662, 0.00444083502436001, 0.004643544207570127, 0.004721090027658113, 0.004932501989815311, 0.005135354024309767, 0.005330003056957515, 0.005516825597878115, 0.005695953523006728, 0.005869139388881932, 0.0060457378009110335, 0.006229210501573304, 0.00642185622428913, 0.006627432000413556, 0.0068518464055479875, 0.007098798171499166, 0.0073694306031146135, 0.007639584589146334, 0.007892754229878174, 0.008242573217937936, 0.008626522050830044, 0.009048609945984935, 0.009513339746245221, 0.010025859954649292, 0.010593801952308482, 0.011225286052784432, 0.011931700278089541, 0.012730379758863796, 0.013622102773914223, 0.014594413656609356, 0.015624805985882775, 0.016677116599191008, 0.01770148015424107, 0.018636742210303262, 0.019435225131776035, 0.020066223607561752, 0.0205231927424013, 0.020827698337733423, 0.020998715115163828, 0.021050918417387834, 0.02099329350798613, 0.020835290759319478, 0.020578837038513514, 0.020229473238201203, 0.01980366134148185, 0.01932289069815068, 0.018804724414280053, 0.01825767946800206, 0.0176900860933113, 0.0171097190478636, 0.0165241280149386, 0.015935507367124107, 0.01534742147204192, 0.014767547544251388, 0.014203365847975767, 0.01366706161009011, 0.0131598014372991, 0.01267272675426713, 0.012198608067847649, 0.011730960861969012, 0.011264217650658426, 0.010792606825747892, 0.010319548635273417, 0.009847486672452718, 0.009378800050301075, 0.00891561662002463, 0.008462202165577781, 0.008016136350995755, 0.007567903317638272, 0.007114132002303455, 0.006651477783454041, 0.006176095700682825, 0.005683914542151346, 0.005173013502489477, 0.004640356370827631, 0.004082639757797727, 0.0034922585363023205, 0.002862101169160426, 0.002184332163333774, 0.0014517706175528836, 0.0006638754150316423, -4.171920470707896e-05, 0.00032244664632421924]]], "drag_distribution": [[[-9.726830162034886, 5.77551403786776, 2.67754667921622, 0.3835654672210644, 0.2061017277290296, 0.17364844338725255, 0.13930131964932566, 0.10162571302081913, 0.0626363472287364, 0.02704182034789489, -0.0019750292885798333, -0.02471411434510618, -0.04187098136459945, -0.05424031316241838, -0.06255728945185128, -0.06739936188435165, -0.06915463549964636, -0.06801430633812805, -0.06419916042619303, -0.05777120836112787, -0.06486789926330454, -0.0548035236292205, -0.04475398871694184, -0.03541863768523517, -0.027439236938954108, -0.021421641714727973, -0.017618042601072016, -0.01467992053640775, -0.012045074558256267, -0.009545230742422518, -0.007107688719160866, -0.0046875517403049405, -0.0022514561475673023, 0.0002400359993350723, 0.0028149958360921693, 0.005499054376612087, 0.008129771815286652, 0.010298030429043613, 0.012753074881530036, 0.01512710372561918, 0.01729698992090738, 0.01909820678652669, 0.02071987561423085, 0.022440702632870693, 0.02414195197747126, 0.025656112864282196, 0.02697281340704806, 0.028025654553125726, 0.028760251301889937, 0.029155640911718878, 0.02672659995711871, 0.02406591541016979, 0.021752116160638466, 0.01991585787524424, 0.01831253153373067, 0.016578501810629774, 0.014303298219209134, 0.011910701945689791, 0.010186485664772637, 0.00997847002439401, 0.011415481351071856, 0.013912674727693575, 0.016969439644984107, 0.020238587830957454, 0.02356036511679599, 0.02680166750968623, 0.029863956111478077, 0.03271662793759365, 0.035363799384883036, 0.0377075489641027, 0.039627050590691985, 0.04106442543414997, 0.04203112414657157, 0.04267754298449737, 0.043190154736007146, 0.04358393677256168, 0.043872032586823595, 0.04404972332639759, 0.04406214754319343, 0.043784931958799296, 0.04318068342299576, 0.04224990197627626, 0.04102740355403237, 0.03970971314885058, 0.0387267831614623, 0.037759858186388516, 0.036224127778235984, 0.0343578187935694, 0.03210780081181337, 0.029396849791031958, 0.020910582937987462, 0.020625375674565665, 0.02028679776307537, 0.020134746800038607, 0.020572945815056615, 0.02212888644099613, 0.026306610637583883, 0.038564146753668115, 0.0943784329930314, 0.2023814687475737], [-1.6171088162098692, 1.332315420874194, 0.6725554228542228, 0.269424114823267, 0.18093615724018897, 0.15279686378190707, 0.12060777434704562, 0.08437150538140382, 0.046565921069035045, 0.012067013579467673, -0.015843933053827117, -0.03754404508697121, -0.05377024264476048, -0.06533082409525842, -0.07296416584082716, -0.07724632037885773, -0.07856270707935221, -0.07711056074624734, -0.07308755169185126, -0.06643756019965064, -0.06461784130276302, -0.05489960447443844, -0.0452161418604033, -0.03625708390820866, -0.028655058797272828, -0.02301095860076026, -0.019555098244229484, -0.016966392978653645, -0.014673644388868106, -0.012519737568416763, -0.01043791172456293, -0.008398733818898399, -0.006374642973964473, -0.004332199040175345, -0.00225309752024671, -0.00012756298241829064, 0.0019388883972014002, 0.0037245476420721584, 0.005520709096765451, 0.007121576018400905, 0.008406492531895697, 0.009207676800692904, 0.009713436377347829, 0.010194865318919716, 0.010513840123925589, 0.010472650705519186, 0.010041949222096523, 0.009154714707798233, 0.007771763744167805, 0.005914163334350607, 0.0026066329707767942, -0.000787226241189827, -0.0036511481627937077, -0.005840827553096194, -0.007608805490361338, -0.009346796813520122, -0.01142792253561723, -0.013464328037894881, -0.01472808407101078, -0.014433379752309258, -0.01247851391258575, -0.009381304221324962, -0.005676794341507748, -0.001728123747905616, 0.002298986401008644, 0.006267860560606525, 0.010076888655651834, 0.01369366373446283, 0.017122370966196353, 0.020268953021856228, 0.023014078932538266, 0.02528588792348716, 0.02705530089312572, 0.02844904924024871, 0.029663593240862415, 0.0307309097877694, 0.031669388030324264, 0.03247849349631692, 0.03311770252820213, 0.03346215085612718, 0.033473091875522366, 0.033155403213082496, 0.03253546600791817, 0.031724171000240386, 0.03097570152015865, 0.030180183962860183, 0.029035063635725538, 0.02760030687753623, 0.025804823650665432, 0.023556355371195332, 0.018442545035558318, 0.01652679252135329, 0.014110015065345911, 0.011194320156322084, 0.007807148353252443, 0.003995315384088028, 0.00017318528598949754, -0.01138649619951669, -0.00942723034573698, -0.0042198494901372775], [-1.1050894214701281, 1.0852268787762778, 0.614442854536833, 0.34802996604785247, 0.2507972855655657, 0.2119258263458522, 0.1665394806264441, 0.11511844973822094, 0.06136510271249428, 0.0123184061083721, -0.027289496900715006, -0.05802432906495341, -0.08095523475185148, -0.09724438558805004, -0.10795035595897254, -0.11389771378862681, -0.11563757265744148, -0.1134544173133946, -0.10762369150160075, -0.09802585930868282, -0.09246382757570339, -0.07865995634554515, -0.06491249728719929, -0.05220593055573021, -0.04144328717446267, -0.03348352923791486, -0.028649265715115144, -0.025057512074355123, -0.021887205999160168, -0.018917024196057286, -0.01605331975014357, -0.01325906442435999, -0.010496708711205645, -0.007720347360134655, -0.004907002025351182, -0.0020479283195719766, 0.0007246220284400737, 0.003155240049537104, 0.005509311144896315, 0.007545794633805219, 0.009092704406123432, 0.009908661501652507, 0.01026309330086752, 0.01054174167221572, 0.010540356867676988, 0.01005583534221038, 0.008970799075252592, 0.007190662570175992, 0.004661943606921866, 0.0014303419182585585, -0.0034007365122830555, -0.008288449536066344, -0.012341260085789733, -0.015351622601022095, -0.017687031323850584, -0.019920525172528347, -0.022576939016188693, -0.025115258011737477, -0.026514089115509485, -0.025669719290088697, -0.0224465933917837, -0.01775773149716939, -0.012189461219312983, -0.006266359440689073, -0.00022702397483416844, 0.005732232535374761, 0.01146538887643342, 0.01692587921394203, 0.02212013950261581, 0.026915099518811228, 0.03114062319166596, 0.034689390186545856, 0.0375065187215285, 0.03976583253028815, 0.041752108547321407, 0.04328135773894847, 0.0446068301044631, 0.04573359842694284, 0.04661851212348889, 0.04708008714417648, 0.047061318013396705, 0.04657126917937117, 0.04564550360177264, 0.044414478091827955, 0.0431835738568247, 0.04186444904302093, 0.04011808089334204, 0.037972335661221525, 0.03532033193908889, 0.032025471340841126, 0.03209323685775721, 0.028440613065645198, 0.023733367243777368, 0.017818821185938267, 0.010491992067032515, 0.0016002311628587832, -0.008792443058260407, -0.020179726969953977, -0.06835220735862751, -0.11860996751008761], [-0.3978295541530134, 0.8566485207415537, 0.5498697715772383, 0.43214600382344964, 0.3803021618188821, 0.3215760786603758, 0.2514930258974393, 0.17156255719878216, 0.08783789143365321, 0.011452317018727128, -0.05011691149436068, -0.09779811773260919, -0.133290719330442, -0.1584255066508436, -0.17486522923689662, -0.18390302652157126, -0.18640226876148927, -0.1828125333738312, -0.1735538749399509, -0.15837658305665234, -0.14495860107903383, -0.12348025733301123, -0.10210091865711808, -0.08236027849705019, -0.06567052612816249, -0.053376896019413506, -0.0459247541416598, -0.04042404476722587, -0.03557892806491522, -0.031044335257948554, -0.02667431818522084, -0.022423449936152303, -0.01823340633073048, -0.014033522095591645, -0.00979232776009166, -0.0055039309653707735, -0.001344621514200241, 0.00238463424041808, 0.005859859570393973, 0.008788767874205764, 0.010904486022200044, 0.011831474838446139, 0.012003207144458038, 0.012030961935715113, 0.01158900863972955, 0.010204450797441422, 0.007794046280411731, 0.004207747972428491, -0.0006322133641081933, -0.006639768707766319, -0.014436649276129202, -0.02225714803507064, -0.02868924265510376, -0.03340477907701789, -0.036987032459479055, -0.04035019797803868, -0.04463466457924642, -0.048654875108876165, -0.050848634648248354, -0.049532405896410024, -0.0445121390824653, -0.037112206747131005, -0.02831674364077983, -0.018961144382264716, -0.0094190201712861, 3.992134192536974e-06, 0.009080999720285523, 0.017743343005284625, 0.026008804912316157, 0.03367699976777759, 0.040484056783915895, 0.04624518697330033, 0.050825998722712866, 0.054471971594817356, 0.057640874183742696, 0.06043202191646277, 0.06289895961859794, 0.0650490867708543, 0.06681560119408703, 0.06791516012594129, 0.06825830239707804, 0.06786114294310484, 0.06677467408095218, 0.06515855302161846, 0.06339978781932845, 0.06146979213114721, 0.05898457508759514, 0.05589338189813925, 0.05201847191659291, 0.04713726391849639, 0.047886172594949476, 0.04152552349175091, 0.0418615725246188, 0.030056304581053475, 0.015232534145956074, -0.0033774089701326527, -0.026799903411060453, -0.05720302667414713, -0.09968843409345622, -0.18054100251984473], [-0.11412385445094919, 0.7323213499746819, 0.5552358149325993, 0.45148904288538416, 0.3987693325171066, 0.3372645870408008, 0.26335522284452484, 0.17888641351889698, 0.09035270775364072, 0.009582304571360237, -0.055483216304181716, -0.10584091662345893, -0.14329898723113144, -0.16980011765556374, -0.18710712111955075, -0.19659029471094452, -0.19916422443891807, -0.195306426148592, -0.1854581506481817, -0.1693345830315146, -0.15359192801885801, -0.13083991473302567, -0.10819618119201943, -0.0872899556176636, -0.06961464255661609, -0.05659327660418416, -0.04875083193806088, -0.04297510274587679, -0.03789176486686163, -0.03313784815019051, -0.02856001702713845, -0.024111462299585367, -0.019731727341591475, -0.015347139095872611, -0.01092589390201489, -0.006464259658965751, -0.0021388325169074767, 0.0017640408760301674, 0.0053534796727262475, 0.008348170294487275, 0.010466572408450328, 0.011310298237053188, 0.011337413101165582, 0.0111935921030872, 0.010530592824934851, 0.008842485205598853, 0.006037855889712921, 0.0019571701848921795, -0.0034797580350995803, -0.010176612878117048, -0.018536995743107052, -0.02720909556489805, -0.03440166619665665, -0.03976358998284945, -0.04391836769488552, -0.04784441754425677, -0.05234724549824327, -0.05654826759742631, -0.05879748541328194, -0.05731549385848435, -0.05189920535781204, -0.043931051302575054, -0.03447562411425093, -0.02441972235968012, -0.014160904556763103, -0.00402444227674728, 0.005747969044823812, 0.01508213797786737, 0.023995207969655426, 0.03227394324269769, 0.03963791558278974, 0.04589110672692551, 0.05089075018929589, 0.0548966996840246, 0.05839468820652927, 0.06149090735331295, 0.06424167628041719, 0.06665464585636066, 0.0686593199501347, 0.0699559422476906, 0.07044976126712502, 0.07015847400887813, 0.06913457169986854, 0.06753266443220253, 0.06573302958071524, 0.0637410749417424, 0.06119784081597321, 0.05801889137185851, 0.05401260815433677, 0.04947150743921487, 0.06432759896961783, 0.05602218595272279, 0.04570308641028951, 0.03290792546463228, 0.016972298096222426, -0.0029264047204314984, -0.027882823796653734, -0.06019157944764354, -0.10519553257019928, -0.19047991861657726], [0.054665428615080926, 0.7217601562365437, 0.6011944557627765, 0.500035970820103, 0.442678146543594, 0.3744529743004936, 0.2921046260977112, 0.19786790530622317, 0.0990572458918848, 0.008912926781799335, -0.06367706014327087, -0.11983638107535509, -0.16159098733654112, -0.19111382617360714, -0.21037554961342592, -0.22090754909099936, -0.22373172060053875, -0.21938250072195206, -0.2083502944725769, -0.19030259242583855, -0.1714917461800541, -0.1461053055634538, -0.1208412316516827, -0.09751948139738982, -0.0778084321484723, -0.06329833334809644, -0.05457237811507452, -0.04815555737956491, -0.04251130105108672, -0.03723564062777057, -0.032158147583033286, -0.027227452640163838, -0.02237694842190956, -0.01752512552493782, -0.012637492087244458, -0.007711665682460351, -0.0029378785740137507, 0.00138671655756253, 0.005329590123475788, 0.008596292875904075, 0.010872796221324487, 0.011713457220868279, 0.011629191089616218, 0.011340016710193811, 0.010454500634560283, 0.008403815091830075, 0.005083552660158607, 0.00031507034275840844, -0.006257420575081195, -0.014291607077109292, -0.02405698000063759, -0.0338402950194766, -0.04194976898731362, -0.047990571369898705, -0.05265867479781552, -0.057048944168147084, -0.062063914606603314, -0.06672509267344492, -0.06919134728625591, -0.06747883544345262, -0.06136241768329025, -0.052370011560170716, -0.04170897045174669, -0.030371717599442752, -0.018804014430708147, -0.007370337285036565, 0.003658297764366768, 0.014197929798261654, 0.02426646024680378, 0.03362494442307525, 0.041960255767066114, 0.049053181958990284, 0.05474386470379162, 0.05932242437785676, 0.06333203015253616, 0.06689183100437168, 0.07006431842790181, 0.07285789450638266, 0.07519396966046228, 0.07673785493528724, 0.07738367063441264, 0.07715164727093604, 0.07609937151893523, 0.07438938338104199, 0.07242569325605523, 0.07023945851537004, 0.06746324729175023, 0.06420902304061246, 0.06011629823468431, 0.05487302587973108, 0.06517137796339102, 0.056781662383552076, 0.04595363906418904, 0.0322323666988586, 0.014916151921067005, -0.006883379350017791, -0.034362197167059884, -0.07006234998681561, -0.11997592988403852, -0.21495875363212602], [0.16073098952650647, 0.719193738658826, 0.6291804490457058, 0.5306488023476874, 0.470440142574062, 0.39796951483525494, 0.3102644462528861, 0.20981913866394367, 0.10447374237606165, 0.008369019464206692, -0.06900361931833772, -0.1288490645905688, -0.17333225575764633, -0.20477286788068483, -0.22527392327685836, -0.23646938216786761, -0.23944945104618384, -0.23478485926511747, -0.22299713004826086, -0.2037224553662342, -0.18298181115361034, -0.15593068259322315, -0.1290101048004835, -0.1041618064101079, -0.08316582873965177, -0.06771910104187469, -0.05844179908692379, -0.05162815337883716, -0.045638199809995346, -0.040042298505097926, -0.03465929318237892, -0.029435069269345852, -0.02429926738297442, -0.019165476011799843, -0.013997761730257085, -0.008794850241225732, -0.0037555839639405167, 0.0008170766113429777, 0.0049601699086836, 0.008371790533895833, 0.010716886271857103, 0.011519196962230792, 0.011322701219246901, 0.010894132088857615, 0.009813922286278965, 0.007472643596945932, 0.0036925226621208193, -0.0017208624086697411, -0.00884444417970316, -0.01755090272303688, -0.028008835342088468, -0.038481690648670706, -0.047160255420837585, -0.05362050720859159, -0.058603598265069876, -0.06327805127648715, -0.06860805591493568, -0.07355181925706558, -0.07614746347842782, -0.07427960991650254, -0.06770908960984036, -0.05805312957596188, -0.04661310102356131, -0.03444909973542214, -0.02203706230365667, -0.00976645758292306, 0.002073018105574845, 0.013391171421311654, 0.024206373394864155, 0.03426333251052529, 0.04322784639497749, 0.05086595211765512, 0.05700691179936498, 0.0619601173376351, 0.06630534545048725, 0.07017003807435421, 0.07362059618566812, 0.07666589770866686, 0.07922221885685173, 0.08093265455751085, 0.08168424543152877, 0.08149886943334687, 0.08043729117489827, 0.0786664316941809, 0.0766040407715905, 0.07429931962553786, 0.07161516085879316, 0.06827315232255769, 0.06399577592440175, 0.05847203377803749, 0.06941449031992794, 0.06033290783740049, 0.04869831765816539, 0.033997457811536534, 0.015475182724761971, -0.007821181172710811, -0.03715630086999731, -0.07519516655417254, -0.12835388903454614, -0.22955450764634794]], [[0.036908031936817805, 0.03714493247001657, 0.03763945124264233, 0.03854142819831394, 0.041052337888749305, 0.1192669404730668, 0.2035878673560299, 0.09778599283897846, 0.1120319501123512, 0.03885766859782939, 0.02588138145830821, 0.02142375509148364, 0.017275041209707673, 0.01344885121237708, 0.00997670595527176, 0.00687192928108081, 0.004133928498005519, 0.0017519358696524436, -0.0002870554453521574, -0.0019686738972766794, -0.006424340969376687, -0.0070756881004576415, -0.007428770150564097, -0.00758470563785469, -0.007645134809078337, -0.007714353450228556, -0.007884616983229705, -0.008137072527435441, -0.008423978544563835, -0.008722314420586397, -0.009029055632490866, -0.00934792256694398, -0.009675885187425537, -0.010006973413211646, -0.01033810968362733, -0.01066713052540203, -0.01099668862668974, -0.011331422047486016, -0.011674381103972899, -0.012031831069380137, -0.012423451372406266, -0.012883262272160315, -0.013422376445016197, -0.014045645863467534, -0.014785257696299606, -0.015606480185999815, -0.01644103975851918, -0.017215789282141385, -0.017838180293437523, -0.01819430117524961, -0.018472703194117437, -0.018343156323754235, -0.01778524628975089, -0.01683889178194501, -0.015607741557994707, -0.014124236412682794, -0.01238147502779065, -0.010373779113852292, -0.008098517055861294, -0.005594866568393363, -0.0029384963240875884, -0.00026123862155751223, 0.0023594124916006313, 0.004854832458786731, 0.007182008166576931, 0.00930710896397315, 0.011207789335900685, 0.012876898935793092, 0.014315702651924521, 0.015514116891727341, 0.01647086315064886, 0.017196560400289346, 0.01771929467504994, 0.01812403411938267, 0.01848731208218918, 0.018804653198176972, 0.019110738156404586, 0.019561509470874913, 0.019727248749640287, 0.0197375727027485, 0.019599525826299577, 0.019328448889978127, 0.018938969768618634, 0.01845658498691749, 0.01792322277097094, 0.01734704706366379, 0.016702157783198713, 0.015964905257918428, 0.015109207203430114, 0.014102013901603039, 0.015211436789794561, 0.014436937679274942, 0.013458800006798404, 0.012234040097053516, 0.011417580785094961, 0.01088880982349252, 0.009650967193891212, 0.012276195089667208, 0.025734151583605366, 0.05315344861547674], [0.1016221418712075, 0.10213042219282968, 0.10311058156384441, 0.10463369719375255, 0.1081482875342402, 0.21608102462154233, 0.19977587833781846, 0.13007242966993204, 0.13284681998995942, 0.09094354340300305, 0.06682683638968016, 0.054311187271723425, 0.042374904916871466, 0.0312616009190661, 0.021133181852498253, 0.012056040420563522, 0.004036245432423334, -0.002957431159146676, -0.00893110175036708, -0.01376023752388864, -0.021703112108311412, -0.02372020300545613, -0.024831553026880445, -0.025351160670424318, -0.02559329243160997, -0.025878588404780967, -0.026486729626998336, -0.02735084724551405, -0.028323394007347194, -0.029341771093457147, -0.030399592783539497, -0.03150905777889571, -0.03266141275902248, -0.03383929300275804, -0.03503580886289693, -0.0362480284998211, -0.03748973163132772, -0.038781589752172226, -0.0401395975447479, -0.04158925778021443, -0.043196672575133946, -0.04507267429491813, -0.04725547889324614, -0.04976500984352483, -0.052710120635432164, -0.055994557246535646, -0.05941253109608805, -0.06273669364845567, -0.06567052221604373, -0.06784133284692255, -0.06926737005278373, -0.06936154568877521, -0.06803448980704642, -0.06539958297282944, -0.06178412029163097, -0.05730691785914674, -0.051969312279837275, -0.04576942839791362, -0.03868713644871958, -0.030810472940225007, -0.022377046175988007, -0.013754039820417514, -0.005263082453626197, 0.002868491607620809, 0.010501066213479793, 0.01752680654911133, 0.023873727922539386, 0.02951778670357599, 0.03446134997809277, 0.038671155608983626, 0.042139650376833884, 0.0448943432866989, 0.04701242793774204, 0.04875225806667171, 0.050357885699069856, 0.051814564029956996, 0.053153194036560596, 0.054567796455750384, 0.05542021922214381, 0.05581563884135092, 0.05575477429955755, 0.0552780642735046, 0.05442817150776225, 0.05327859624863785, 0.051950536436518646, 0.05046863896526602, 0.04874794816447524, 0.046709495059910205, 0.04426696387378104, 0.04131248778022569, 0.04092246333374915, 0.03749546016855424, 0.03329865692241937, 0.0281850374398607, 0.022936107887296955, 0.017222553280508205, 0.00942797712881942, -0.018359901729071683, -0.02730182687372814, -0.037372459350366614], [0.15898977521693117, 0.15972302530218407, 0.16109236459015974, 0.16306204797681473, 0.16709810206892273, 0.2897296619539128, 0.23442605860200597, 0.1741333047671485, 0.1496635471751934, 0.12290503657018301, 0.10264357916215627, 0.08295844241753904, 0.06406303968239188, 0.04642720826309523, 0.0303365779505619, 0.015907804628965596, 0.0031536967678363784, -0.00797528251971382, -0.017475915772681445, -0.025116816843046046, -0.03568237199996995, -0.03893440059127724, -0.040733018576655906, -0.041584792998237925, -0.04199620735805623, -0.04248331308722055, -0.04349472084901787, -0.04491937580367899, -0.04651951108107839, -0.04819752780488286, -0.04994427104169646, -0.05177966716209478, -0.053689844807237055, -0.05564723774141414, -0.05764174862275272, -0.059670092238685586, -0.061756613838365004, -0.06393705429848044, -0.06623970623014357, -0.0687080201411989, -0.0714505420606231, -0.07464805605064839, -0.07836362999048817, -0.08263125913618895, -0.08762995189626033, -0.0932088485031276, -0.09903832716647376, -0.10475153191331296, -0.10986660306357357, -0.11377506352260648, -0.11628991038949592, -0.11663126323054841, -0.11464503132167865, -0.11051009342374268, -0.1047565431843452, -0.0975829622101278, -0.08900019355528602, -0.07901122430329845, -0.06757901697869731, -0.05483277119348219, -0.04115682185581453, -0.027127441308747145, -0.013294407833850382, -2.9907435926051387e-05, 0.012438511921650054, 0.023935821128181285, 0.03434489822978035, 0.04362625210004215, 0.05178310601753979, 0.05876105485114751, 0.06454654600460304, 0.06918187377059128, 0.07278774955339835, 0.07577887374108357, 0.07855141088857137, 0.0810812461006353, 0.08338893149123683, 0.08567674290208295, 0.08718081099618472, 0.08795737365024403, 0.08799951872351497, 0.08736973855718853, 0.08613580677335604, 0.08441413524751197, 0.08239681614805706, 0.0801233430894544, 0.07745493072104304, 0.07426206981790107, 0.07040347772310948, 0.06570313621172255, 0.06361064780810938, 0.05769199691612399, 0.04695431459013063, 0.03666918105383155, 0.024831702856747427, 0.010553373069331481, -0.009037445234445022, -0.029492676133044793, -0.049189860449305484, -0.07424977099738375], [0.2384875944386411, 0.23948655130501573, 0.24127322425718548, 0.24355463725974744, 0.24722641877717944, 0.3558500594407212, 0.2715492823732205, 0.2320318096689064, 0.21495796021125632, 0.18068068659198924, 0.15085891290678083, 0.12116117570751696, 0.09245796769702795, 0.06559854083990461, 0.04106399689270006, 0.019050144166903513, -0.0004184067799336256, -0.01741706984152686, -0.0319202010725811, -0.04352116789552955, -0.05633799764388046, -0.06137288202024502, -0.06416839496182483, -0.06550933510662188, -0.06617955673831398, -0.0669766086544935, -0.0685914049859097, -0.07084687596269726, -0.07337508468965792, -0.07603018188491217, -0.07879979614394307, -0.0817151877129861, -0.0847552616025708, -0.0878780183577227, -0.09106942208872401, -0.09432666523140475, -0.09769080515792906, -0.10122099189858418, -0.10496498907093257, -0.10899375726591902, -0.11347847040846572, -0.11870233669705818, -0.1247652990376836, -0.1317229518624192, -0.13985799051549747, -0.14894368518291395, -0.15847311725896662, -0.1678778098695899, -0.176405735624452, -0.18310278456331788, -0.18733735038335125, -0.18816540905578596, -0.18533257804889314, -0.1791096102359714, -0.1702287880299063, -0.15905828965068672, -0.14564169027784687, -0.12999998961097312, -0.11207328039176716, -0.09204513671449104, -0.07051550414414302, -0.04857402768402787, -0.0269126975369888, -0.0061163545500983576, 0.013459100671760503, 0.0315410581506335, 0.04794669697053005, 0.06261389020812345, 0.07554680705917184, 0.08666008199018549, 0.09593065790482307, 0.10342085010332328, 0.10931170403685013, 0.11424245187637935, 0.11883079215567285, 0.12303891019256516, 0.1268524048792434, 0.13040976866963108, 0.13294723757913177, 0.13437276168894402, 0.13466289662629308, 0.1339101409371671, 0.1326307808508869, 0.13057656187210073, 0.12790544050514488, 0.1247560849073122, 0.12092807186435639, 0.11622387694578576, 0.11042331519834793, 0.10325000826836855, 0.10845269013493526, 0.09759464839955574, 0.0844787514358218, 0.06870396877024805, 0.04975557504199859, 0.02682866413731902, -0.001187992979055888, -0.03636930057141257, -0.08233606793103658, -0.15508130098166295], [0.2595908404360466, 0.2606429156334227, 0.26249424059083654, 0.26474225532412243, 0.26790626873642814, 0.359799363667652, 0.27813004668235575, 0.2465412586606189, 0.23063742458529135, 0.19538277076708718, 0.16312167095229962, 0.13073674632338972, 0.09936791454960384, 0.06999007827639603, 0.043145313709573876, 0.019054033569727194, -0.002255087292229249, -0.02086452311765296, -0.03673908468544677, -0.04941534408561616, -0.062306683022785275, -0.06784189081873924, -0.07091886876368451, -0.0724005770752165, -0.07314866178501599, -0.07403944541051234, -0.07583126729231815, -0.07832772431651433, -0.08112437835527588, -0.08406266676670343, -0.08712959917519425, -0.090359680926369, -0.09372984982735438, -0.09719416294061664, -0.10073773044105476, -0.10435823741141088, -0.10810196076717991, -0.11203522022964578, -0.1162118667953507, -0.12067070317925303, -0.12562519011181258, -0.1313887957426924, -0.13807085453045995, -0.14573074021243343, -0.1546770924470658, -0.16465908693417214, -0.17511801480594572, -0.18542660204753214, -0.19475536041502262, -0.20205288105095265, -0.20651269653790066, -0.20719119887691942, -0.20380914189653365, -0.19666807969643885, -0.18668114646421044, -0.1742064619879373, -0.15928448576900384, -0.14193506512297724, -0.12208534848435355, -0.09992700420843638, -0.0761175843394454, -0.05186103637703243, -0.02791134191682926, -0.004913325182874868, 0.016741349566015754, 0.03675312498800168, 0.05492109426148302, 0.07117711463765918, 0.08552584052210044, 0.09770647535434039, 0.1078186996563494, 0.11594669759239763, 0.12229472359345143, 0.12756738106226204, 0.13244537511744903, 0.13688859375389614, 0.14087028148050817, 0.1444871383170766, 0.1470441183176127, 0.14854046515466768, 0.1488551058051465, 0.14805752356632365, 0.1462471535787998, 0.14360614748515968, 0.14044225625813309, 0.13681827122223572, 0.13248967698161734, 0.12722686451069345, 0.12078019378267395, 0.11284078810769373, 0.11738703293255057, 0.10548930239333933, 0.09113119938525437, 0.07387007227061344, 0.05306398055364616, 0.027885966788746917, -0.002862854959794012, -0.04145845172037085, -0.0918635559740937, -0.1716045391683702], [0.28468808969553827, 0.2858170788226203, 0.28778169453110636, 0.29008164287871663, 0.2929661610882352, 0.3752132948997903, 0.29557017645898787, 0.2672575051138378, 0.2505809159092769, 0.21336829344430358, 0.178128498029222, 0.14257091068554043, 0.1080809416294701, 0.07576325269903939, 0.04622526582104344, 0.01971381969765152, -0.0037383122297611777, -0.024221849978799684, -0.041693086955282455, -0.055629158759447656, -0.06902189080122774, -0.07513076663127133, -0.07852919733610562, -0.08016970203875537, -0.0810031573675131, -0.08199637378625513, -0.08398542733130797, -0.08675235016659295, -0.08985083083756265, -0.09310711221118413, -0.096507282464213, -0.10008951963262336, -0.10382846117826301, -0.10763456850217284, -0.11151868808804366, -0.11548150427916178, -0.11957546324902786, -0.12387395507001081, -0.12843661574071313, -0.13335030386607524, -0.1388220133244367, -0.1451940984306359, -0.15258550591338332, -0.16106109259317838, -0.17096220864461875, -0.1820135084358059, -0.19359881958955197, -0.20502602956432558, -0.2153795812370899, -0.22349841326330627, -0.22841461692382056, -0.229151850031534, -0.2254007163680383, -0.21749420510555514, -0.2064416930966293, -0.19264094511184898, -0.17613917770633766, -0.1569597322808607, -0.13501963734923986, -0.1105249313689029, -0.08420109953517783, -0.05735580594257743, -0.030846183653530018, -0.00560296827574743, 0.018111180524483458, 0.03998842300151896, 0.05981782926772895, 0.07752921379524062, 0.09313294931467653, 0.10652783689189742, 0.11768444472652323, 0.126675588809293, 0.1337166730694816, 0.13958022323220218, 0.14501695614086968, 0.14998148939876726, 0.15464767191344866, 0.15867935646592254, 0.16182380556902487, 0.16366418130487748, 0.16414755725898933, 0.163377717696241, 0.16147398972879906, 0.15864243206508438, 0.15522580562532007, 0.15129530964173626, 0.14658203318310342, 0.1408330868236773, 0.13377333765340674, 0.12506216855228763, 0.12861547447266455, 0.11544107213273778, 0.09955627583115237, 0.08047360541355415, 0.05752735627039661, 0.02977117830581772, -0.0041131003523055005, -0.04662814443733227, -0.10212443122066893, -0.18985767722749447], [0.3057411345093363, 0.3069375734495119, 0.3090049851780224, 0.3113680389656969, 0.3140872567844202, 0.39042410513012676, 0.3124332491193881, 0.2854459250070054, 0.26758510678588693, 0.22856238946310556, 0.19080733449391757, 0.15259325764643178, 0.11549553884501934, 0.08072349592283355, 0.04893783830284868, 0.020406967924130485, -0.0048330603147835405, -0.026879851317675767, -0.04568315792403636, -0.06067198554015539, -0.07457332114258797, -0.08115887223817823, -0.08482412456291114, -0.08659600056912119, -0.08749952858528974, -0.08857674460213913, -0.0907284125375644, -0.09371877917877353, -0.09706673477400946, -0.10058576016997986, -0.10422283964951552, -0.10804799792738713, -0.11203549559699051, -0.11613078939012769, -0.12031667905578665, -0.12459133150520689, -0.12901034302253564, -0.1336529178024664, -0.13858333722676333, -0.1438952275104209, -0.14981179600126882, -0.15670225293883713, -0.16469488362926715, -0.17385986729435668, -0.1845659207874732, -0.1965172053917866, -0.2090500159340814, -0.22141844392725396, -0.23263531437837767, -0.24144822308402258, -0.24676324388672644, -0.24756915388357462, -0.2435311745784473, -0.23500805070668238, -0.22308875362331756, -0.2082036511134959, -0.190405356727823, -0.16972006702917192, -0.1460568130899903, -0.11963428837325522, -0.09147126716244686, -0.06276783343257462, -0.03444971018762736, -0.007281220622116189, 0.01827651954141964, 0.04187332646837641, 0.06327405220129825, 0.08240095254665392, 0.09926244437862775, 0.1137472655439405, 0.12582243729465264, 0.13556547263705498, 0.1432073820930147, 0.14958046233751612, 0.15549468630621324, 0.16120314264043614, 0.16634583771109662, 0.1707741418308564, 0.17423329107125732, 0.17627897777274784, 0.17685555815341397, 0.1760747447133496, 0.17406677945979487, 0.1710549521082377, 0.16740965370814828, 0.16320820060984953, 0.158160912812548, 0.15199527190669634, 0.1444147980746145, 0.1350524241817772, 0.13780840196210536, 0.12361553747971783, 0.10650653667870394, 0.08595328350422131, 0.061190690557568976, 0.03128411429030985, -0.005202215588696959, -0.05097577480826001, -0.11071272656472086, -0.20511793321384275]], [[0.004101733563243972, 0.004366624478959808, 0.004901110356256826, 0.005667889000074789, 0.006592289664196302, 0.007529676043245156, 0.008180083346880324, 0.005351993450649068, -0.05701924854540083, -0.2673681876807147, 0.6887323338671546, 0.24446466722192037, 0.07103006135983077, 0.014443716992468792, 0.01124756098306893, 0.00880616603353124, 0.006691192128911952, 0.004761499380636895, 0.002971927646100578, 0.0013216130621227027, -0.0025064126455743804, -0.003442359705046106, -0.004163068606812871, -0.00470718799117139, -0.005116917319344342, -0.005437458793675906, -0.005724711359409649, -0.006032825087766849, -0.00635602780179051, -0.006686226372297064, -0.007024794109646863, -0.0073746869950936465, -0.007733428679931858, -0.008097157623872692, -0.008463824114774738, -0.008831552238540874, -0.009197942886581089, -0.009561554069939244, -0.009920657005586201, -0.01027572263897743, -0.01063645301669014, -0.011019726844549552, -0.011446650854049124, -0.011941401785708728, -0.012524072026303042, -0.01314616516907186, -0.013744394413198913, -0.014250486365711698, -0.014582268960613294, -0.014644094956253035, -0.014484468160544538, -0.013957187575549222, -0.013095886010555856, -0.011954568759898166, -0.010614693381071407, -0.009080390293110073, -0.007316273715503219, -0.005339788455196539, -0.0031820424142816987, -0.0009186800730680599, 0.001365652081694442, 0.0035712851174575424, 0.00566870911955309, 0.007623448506944151, 0.009408914381341671, 0.011005128645197437, 0.012399620874619514, 0.01358756404395597, 0.014602737351722234, 0.016093993033931782, 0.0167721594386432, 0.01724730879034266, 0.01756803949189858, 0.01780514026189777, 0.018013481236114768, 0.018184221977874563, 0.018307564156187364, 0.018371782167116366, 0.018356238843322856, 0.018235253397307014, 0.018014625653835985, 0.017704199029028696, 0.017314086275700805, 0.016860984300136207, 0.01636860140412498, 0.01583857464486918, 0.015251957504425467, 0.014591323646933222, 0.013837360845969116, 0.012965748612405846, 0.013885177371352591, 0.01319137828072086, 0.012389588967036083, 0.011502367224487242, 0.010562466772889998, 0.009644021199834115, 0.008965005179529407, 0.00957421287688033, 0.018408454951610833, 0.03670112926473051], [0.011302209984929468, 0.012520062996446514, 0.0149455098208253, 0.01845909464553686, 0.02282115700069222, 0.02758231679424338, 0.03189466109266941, 0.029297638008124207, -0.017005572837520976, -0.19548797493393044, 0.6198909650131037, 0.20448970879412184, 0.056543667810198504, 0.04183262066050329, 0.032497285635215804, 0.024470837680487283, 0.017023844613548524, 0.00992252267501024, 0.0031674817324110023, -0.003096391461097034, -0.013068437850768659, -0.016984551396331156, -0.02000888919464958, -0.022304484312847345, -0.024048986486363295, -0.025431972968516407, -0.026686326989118773, -0.028035324771376293, -0.029452402943051657, -0.030906967811754078, -0.03240789263913342, -0.03396894683894334, -0.03557993542441866, -0.037225014878879005, -0.038897103992166185, -0.04059077014830046, -0.042300345988930246, -0.04402459480166051, -0.04576077327571959, -0.047515400876871554, -0.04933375827647836, -0.0512919166327097, -0.05348280364476283, -0.05601286462633468, -0.05897410460757179, -0.06216748918505364, -0.06532688416859189, -0.06816014099088596, -0.07030877209249582, -0.07134926735634722, -0.07112507955286392, -0.06928486577620303, -0.06595237656239628, -0.06134899620589577, -0.055825561462391586, -0.04941171009092389, -0.041970408030854466, -0.033582892031770326, -0.024378541600495976, -0.014670270803444763, -0.00481430272590664, 0.004844587608382249, 0.01408027123451208, 0.022734822114024333, 0.030690273382349736, 0.03786036804738379, 0.04419257487452396, 0.04967236521958139, 0.05436428214527671, 0.05949368266645573, 0.06262063832130482, 0.06493980927529093, 0.06660678854484449, 0.06791573851876857, 0.06911271241451372, 0.07016280888642676, 0.07102030702588547, 0.07163280390219152, 0.0719106966955676, 0.07173366628634953, 0.07110781531581167, 0.07007541566177586, 0.06868163548396633, 0.0670013978590482, 0.06513838820642262, 0.06309815934238153, 0.060795311963163796, 0.05815004054564092, 0.05507447985984391, 0.0514593408446082, 0.050875558663975376, 0.04678852144689939, 0.04200591952838708, 0.03648679948951727, 0.030171741162491085, 0.009978947393451353, -0.002329319705962913, -0.01710958753688253, -0.027038343701096302, -0.03510093469841614], [0.015187644197572915, 0.01709995761973548, 0.020897673860128845, 0.02641084874590054, 0.0332982677464116, 0.040927330342835036, 0.04814655361160931, 0.05237874958403461, 0.03255632643817674, -0.12014609869209476, 0.5100337116532868, 0.23928482828694467, 0.07584556929243405, 0.057362952297711794, 0.04451968681790024, 0.032999597091271524, 0.02207730758954525, 0.01152634074425194, 0.0014181927863842032, -0.007969205573320171, -0.02104386956228362, -0.02706200072802624, -0.03171296338294916, -0.03524779269159863, -0.03793989667067713, -0.04008077623999429, -0.04202794337708535, -0.04412329419520295, -0.0463251093911458, -0.04858759050769584, -0.050925537607140775, -0.05336063255105019, -0.05587726999776889, -0.058451218982623544, -0.06107215384881859, -0.06373262539477412, -0.06642555111983732, -0.06915081591057556, -0.07190587524393939, -0.07470244117745029, -0.07761184354526285, -0.08075301361676294, -0.0842704767041022, -0.08832978171641667, -0.09307527234427795, -0.09820252455998608, -0.10330205688102258, -0.10792249307736122, -0.11150746304439464, -0.11339745629377122, -0.11321808851554771, -0.11052634667109205, -0.10550608812597362, -0.09849582282106638, -0.09003842842930751, -0.08018405004388689, -0.06872620243118979, -0.0557927962098663, -0.041582366583943466, -0.026574450956961402, -0.011317242965628341, 0.0036863136528671623, 0.0180505026073885, 0.0315275388429872, 0.04393363575940227, 0.055135244539823505, 0.06505150564512618, 0.07366220180907929, 0.0810379367651071, 0.08850737092634633, 0.09342048391827705, 0.0971077322523661, 0.09979045254235984, 0.10191994800932978, 0.10388047408020741, 0.1056191729410794, 0.1070640243079119, 0.1081332535946315, 0.10868795130910344, 0.10853842616876444, 0.10768729537356526, 0.10619992487526138, 0.10414679009571738, 0.10164491377725732, 0.09885530579932816, 0.0957860168166441, 0.09230352874590335, 0.08830224721498457, 0.08361079199251537, 0.07805115062866586, 0.07417525862800241, 0.0663702708941727, 0.05708430271128461, 0.04606378244094486, 0.03290549147435878, 0.01705061076258222, -0.0023188044652505064, -0.025545994550332168, -0.045530821631116665, -0.06536284157890818], [0.024125814750289857, 0.027768606204224305, 0.034982647611951516, 0.04547730869466548, 0.05866852039581176, 0.07348834767248881, 0.08808114522703411, 0.09881343558543407, 0.08196957489075951, 0.0011002669681653514, 0.39686950691729156, 0.30216972945809717, 0.1201824597643215, 0.09364329428806753, 0.07258633671374054, 0.05267544643564091, 0.03331739240407701, 0.014344760552890695, -0.003973820411011374, -0.021014245354742892, -0.041069368783985906, -0.05228728601996683, -0.06096306178291067, -0.06756557503211623, -0.07260523652430212, -0.07662572819802276, -0.08029274222932165, -0.08424122769461885, -0.08839169676921511, -0.09266111436906328, -0.09707930104871014, -0.10168767278095218, -0.10645725967740534, -0.11134311867715575, -0.11632707006779218, -0.12139695383081364, -0.1265426889921887, -0.13176748607089725, -0.13706980817837303, -0.14247473500098107, -0.14811857291198643, -0.15422690276994924, -0.16107241771409628, -0.1689674793664644, -0.17818681400165903, -0.18816573984828305, -0.19814002216561175, -0.20726365630971513, -0.2144890822717457, -0.2185703143536292, -0.21855279825823348, -0.21379667163960966, -0.20463252872365428, -0.19168808831267506, -0.1759824319305835, -0.15761785349924393, -0.13621733221596002, -0.11202518378218194, -0.08541092509815519, -0.05726585907059143, -0.02861329496003441, -0.00033913901563832166, 0.026764324778352038, 0.052225454733360856, 0.07569687357890159, 0.09692773980794811, 0.11576707720102582, 0.13218124772580386, 0.146247024353769, 0.15937747277514971, 0.16874227808577782, 0.17585179618436442, 0.1810845083638426, 0.18528020621971025, 0.18916690995482952, 0.19264758253582032, 0.19569387057674414, 0.1981135173799007, 0.1996155824023644, 0.1998160499088469, 0.19868396924448067, 0.1963391601661157, 0.19291377694030837, 0.18862936614107206, 0.18378759717267873, 0.1783986089351986, 0.17220495850367656, 0.16496398286630798, 0.1564089237838981, 0.1462103391269689, 0.13789166355622356, 0.12318497431733395, 0.10581414625656038, 0.0853146261356858, 0.060978759631102636, 0.031863566969313875, -0.0034024650957802864, -0.04605626582911731, -0.08946369822065375, -0.1429497959885903], [0.03015948689208922, 0.035003749450683956, 0.044589019542862436, 0.05854205992317291, 0.07611254832123693, 0.09593520754773122, 0.11567759156785935, 0.13101854362563103, 0.11700360819349631, 0.06102795919595655, 0.3771350012758813, 0.34028766616381395, 0.15009538242629838, 0.11827302441914163, 0.09163536819911891, 0.06597158669485223, 0.04080843841445093, 0.016028972363235243, -0.007956570563935637, -0.030280345685404098, -0.05500826737189037, -0.0698275826923834, -0.08129120019680029, -0.09001891397969132, -0.09668531307680049, -0.10200875321559964, -0.10686834682703311, -0.1121019247215704, -0.11760377580654865, -0.12326516227557369, -0.12912639170872617, -0.13524258555402713, -0.1415755220260039, -0.1480659211613455, -0.15469020353128868, -0.16143301110242886, -0.16828230320851878, -0.17524372219222412, -0.1823165493192682, -0.189535244601058, -0.1970812430019688, -0.20525413735883388, -0.21441551409132048, -0.22497955965143293, -0.2373115165069178, -0.2506665509878946, -0.2640346887077305, -0.2762964297101018, -0.2860636204665345, -0.2916834552434772, -0.2917899225739763, -0.2856137951811239, -0.27358684337995415, -0.25653697081445, -0.23581334826795725, -0.21155471913146154, -0.1832662440748502, -0.15127308239451245, -0.11606315289501068, -0.07881285315850724, -0.040874614889039526, -0.0033976509480381782, 0.03254141434861069, 0.06631552878230898, 0.0974638314863644, 0.1256541720322962, 0.15068700156578563, 0.17251953857893876, 0.19123077209416664, 0.20825233270531493, 0.22070815448142547, 0.23019682166446245, 0.23720437587060977, 0.24299445373580275, 0.24845530913231575, 0.2534317577554487, 0.25772522865706493, 0.2611216436507392, 0.26326961830916557, 0.26367353333787985, 0.2622984389258098, 0.25930630561308227, 0.25487451729039273, 0.24929835989969984, 0.24297885651552187, 0.2359306638355916, 0.22781353569861718, 0.21830646803135675, 0.20705672136728964, 0.19362874560768656, 0.18140638272382945, 0.16196910756204708, 0.13903941393375002, 0.11200958200873212, 0.07996376518791845, 0.041695646973649136, -0.004548757913698345, -0.06066382896348617, -0.12063231742539868, -0.2156847850253908], [0.03214038156419428, 0.03751721981712192, 0.04815065636352373, 0.0636356145804148, 0.08315759201881845, 0.10523930113371854, 0.12738571036880894, 0.14515501309649745, 0.13542610419125972, 0.10037411480412914, 0.3353312455430924, 0.33496139488400345, 0.1598476275087593, 0.12693471290392197, 0.09831529760945948, 0.07039502474446217, 0.04286766737104138, 0.01567675251360238, -0.01068558962556116, -0.03522980623856008, -0.06132879934620796, -0.07770898047739132, -0.09038181694957897, -0.10003265343196638, -0.10740735184111976, -0.11330002073929037, -0.11868216136243133, -0.12447917811363163, -0.13057373358755606, -0.1368463040221746, -0.14334208053873393, -0.15012227624874594, -0.15714467754503006, -0.16434382471066625, -0.17169395983449473, -0.17917860033982425, -0.1867853292046095, -0.19452136181645205, -0.20238681993213606, -0.21042072131481865, -0.21882456702176215, -0.22793061671528744, -0.2381394830256072, -0.24991005597666166, -0.2636476670587988, -0.2785298236831711, -0.29343990210880394, -0.3071391662714289, -0.3180902600297419, -0.3244615370333051, -0.3246697554912724, -0.31791779760215805, -0.30467944720996415, -0.2858688735209352, -0.2629793929136094, -0.2361668832405198, -0.20488663495955164, -0.16949973772559193, -0.1305453420127352, -0.08932301836450768, -0.04732806404125354, -0.005815991737304278, 0.03400223064823522, 0.07143071515456083, 0.1059586897522192, 0.13721847574790275, 0.16498943438506675, 0.18922543470754194, 0.20999811602218987, 0.22858596694007077, 0.2424127726447949, 0.2531663993128406, 0.261248184034916, 0.2678423512689127, 0.2740175430873522, 0.27963028469958046, 0.28447297096671825, 0.28831337020590586, 0.29076496933546425, 0.29128076632581157, 0.28982281529281123, 0.286570821900914, 0.2817216610832183, 0.275602802137073, 0.26865876729334276, 0.2609062926387966, 0.2519688869395072, 0.24149115109354233, 0.22908268370720528, 0.2142615383710381, 0.19966865333002728, 0.1878721737925688, 0.16325938958339242, 0.13402696300753153, 0.09931914713252614, 0.05789682443397319, 0.008046567645190697, -0.05336818843445381, -0.13039167954167347, -0.2370973126984943], [0.032405227495747625, 0.037963248544658566, 0.0489515461185691, 0.06495702934451314, 0.08514897266199269, 0.10802365439088057, 0.1310594892259957, 0.14988224055279994, 0.1434029171543322, 0.12046144481510836, 0.3036612528577463, 0.32003235849094686, 0.16109706747284383, 0.12855107229508303, 0.0995475984622929, 0.0710328003250396, 0.042824395101824744, 0.014908958178180802, -0.012182247850156652, -0.03741020600905392, -0.06356269682964834, -0.08045293659221302, -0.09352149555899637, -0.1034752252921823, -0.11108334884274078, -0.11716475833264478, -0.12272108017839654, -0.12870612101878814, -0.1349985867889347, -0.14147564245767352, -0.14818427909229087, -0.15518779189061824, -0.16244267365822038, -0.1698814657325748, -0.1774777958980059, -0.18521497181744298, -0.1930807387593433, -0.2010831392263712, -0.2092228626944084, -0.21754071321070162, -0.22624505487516655, -0.23567917781816358, -0.24625674881799925, -0.25845161117306936, -0.2726827146144685, -0.2881024424892824, -0.30355923314112426, -0.31777496337410643, -0.32916256323915416, -0.3358304235174518, -0.3361008524456932, -0.3291846127768399, -0.31556810969396193, -0.29594921989681255, -0.2720747397115166, -0.24411307611204047, -0.21151184966823214, -0.1746502053970669, -0.13408840264398555, -0.09116978676088992, -0.04743966203815217, -0.004537475848186147, 0.03661677086836895, 0.07530462064585941, 0.1109991552575921, 0.1433214156559645, 0.17204427411467477, 0.19712123029528575, 0.21861672048777564, 0.2367035615416537, 0.25126203048839024, 0.26252251613845984, 0.2709732346627164, 0.27786553172620676, 0.28431185063278763, 0.2901686950977965, 0.2952223763385032, 0.2992352146001578, 0.3018100172004908, 0.3023834017375221, 0.30091678964348545, 0.297596018985899, 0.2926246793672853, 0.28599374385812587, 0.27848815706893343, 0.27013095004938764, 0.26054065562345935, 0.24935444774496748, 0.2361720230623511, 0.22049796160415824, 0.21730998004627314, 0.1951524497209416, 0.169074625077819, 0.1384431171753218, 0.10226982887923068, 0.05930244146518271, 0.007736078235560551, -0.055682019486252676, -0.13511653533880852, -0.24499557997731403]], [[0.001856086130415169, 0.0018188940167543394, 0.0017417534602856104, 0.0016236696320338778, 0.001464454688675919, 0.0012667344010961119, 0.001039126870184776, 0.0008008363648041245, 0.0005865670677214946, 0.0004632539891836079, 0.0005607847024940734, 0.0015125028356651991, 0.44733426724980513, 0.6447417065056793, -0.05869070442410741, -0.0030297896926658237, -0.0013821516244061055, -0.0008976526954050028, -0.0006004443929245228, -0.00036627418557930267, 0.0001726346226206535, 0.0002801651010533896, 0.00036922492999723593, 0.0004409830028430946, 0.0004971022494750102, 0.00053957320007566, 0.0005726472462270216, 0.0006056436813864558, 0.0006398162326696371, 0.0006748259809877817, 0.0007110426046833639, 0.0007486943683767186, 0.0007874088363798512, 0.0008267776280431126, 0.0008665538774677144, 0.0009064712909377644, 0.000945864367315338, 0.000984119646258085, 0.001020674379091085, 0.0010552091661330323, 0.0010883122842845474, 0.0011209310857053989, 0.001155990020571872, 0.0011974292508899328, 0.0012469515255705088, 0.0012976211851837987, 0.001342033149725747, 0.0013723523140062328, 0.0013795422094811476, 0.0013535316691177918, 0.0012941706741378721, 0.001193621119212184, 0.0010597309550628416, 0.000900359444171008, 0.0007243463710485693, 0.0005304725297755805, 0.00031208128819688695, 7.182156985664485e-05, -0.0001850156231823012, -0.000446482149343418, -0.000701589842345126, -0.0009402575333796677, -0.0011615767643674013, -0.001363364820605054, -0.0015442393383681018, -0.0017241282041773136, -0.0018643290466089978, -0.0019797400445821984, -0.00207181893366966, -0.0021407440047765155, -0.002188160923294991, -0.0022164007765929027, -0.00222926351569113, -0.0022341754549701255, -0.0022372081265631324, -0.0022372903810823452, -0.002233574438434226, -0.0022246196137783716, -0.002208067279845182, -0.0021810398775985516, -0.0021434809207579865, -0.002096559379634284, -0.0020414521583510172, -0.0019800944291795478, -0.0019147307105443093, -0.0018450556070172767, -0.0017691142379173503, -0.0016850844500148551, -0.0015909344897611839, -0.0014841297894287854, -0.0016951881902540907, -0.0016073130396550806, -0.0015105123965157903, -0.0014083786301074, -0.0013065873658655107, -0.001217615844218097, -0.0011691283616164258, -0.001681761589325801, -0.0019473664503800402, -0.0037227772239298296], [0.0063061483647339186, 0.006178699034612839, 0.005917684981703519, 0.005518141907408596, 0.004976490890668361, 0.00429631467386591, 0.0034971477824185587, 0.00262564793563303, 0.001763927139120174, 0.0010768246752088134, 0.0008232312047244948, 0.001938197351418597, 0.6495383742714239, 0.4190326894051751, -0.03887025774586819, -0.004761822760832095, -0.0022374852518812463, -0.0013601320819544573, -0.0007256252377075822, -0.00016914092819054593, 0.0008202549758705614, 0.0011544884293905767, 0.0014325054343720665, 0.0016573707924811378, 0.0018339547139791328, 0.001968283980491018, 0.0020736626121721064, 0.002179653863403871, 0.002289998890828838, 0.0024037711476474974, 0.00252234873405667, 0.0026465243032121246, 0.002775066451588878, 0.0029066464462827006, 0.0030405259564295754, 0.0031759681220672113, 0.003311114590575823, 0.003444282261284819, 0.003573897257916382, 0.0036991840962513228, 0.00382229605493486, 0.003946566004786342, 0.00408166902159267, 0.004240578464079341, 0.004429175993499741, 0.0046252916020078005, 0.004804987297942885, 0.004942651333167274, 0.005008319760524317, 0.004968205497388003, 0.0048037552874848595, 0.004502418715259873, 0.0040885171071478755, 0.003587040459689002, 0.0030269803125578362, 0.002405095739621836, 0.0017005837814855502, 0.0009225132642185292, 8.791778782111898e-05, -0.00076496098274821, -0.0016009062804236607, -0.002394954940706093, -0.003135478297477648, -0.0038149990805387253, -0.0044272842012542096, -0.0049985544151938425, -0.005471326917669588, -0.005867673323768881, -0.006189732322377668, -0.006437418998136787, -0.006615681841239744, -0.006731735908799522, -0.006797665537822915, -0.006837702288647652, -0.0068718853322682115, -0.006896725410808378, -0.006908244803154078, -0.0069014816144031795, -0.006868550263851622, -0.006800009279309331, -0.006695624677105869, -0.006559203322594485, -0.006394716579837411, -0.006208727262586067, -0.006008696052178352, -0.005793464212201843, -0.005556295881889867, -0.005290820244197296, -0.004989965677386112, -0.004645005703788475, -0.004731337485791885, -0.003903567106459459, -0.003367976379458208, -0.0027391018405490673, -0.001996457496199947, -0.00115717887949064, -0.00013257870051658582, 0.0004519642180264784, 0.002157149303696197, 0.0026254538639155756], [0.010138450696977715, 0.009933157280854227, 0.009513910255397337, 0.008872157241446868, 0.00800108408822893, 0.0069045260003056455, 0.005610374873151068, 0.004186940108841339, 0.0027533270488260477, 0.0015519872582452322, 0.0009333731352650523, 0.0019620630130882974, 0.7304695578442943, 0.33348910352310535, -0.031640074434866175, -0.005660544763029995, -0.002710815574300712, -0.001577470861994344, -0.00069267557651463, 0.00011577295158361055, 0.0014029999876351744, 0.0019291343459885725, 0.0023672465198912194, 0.0027219369487612674, 0.003000754395752564, 0.0032131227499074383, 0.0033800198614493777, 0.003548217843301565, 0.0037235444581869594, 0.0039045911947134335, 0.004093617660130837, 0.004291904379882206, 0.004497483862162308, 0.004708241077982317, 0.004923025209091719, 0.005140712131488366, 0.005358459358346441, 0.005573705594727933, 0.005784042406145413, 0.005988334700830916, 0.006190100057602536, 0.006394737935257799, 0.006617708972308654, 0.006879721447231962, 0.0071902661467712166, 0.007514202856696746, 0.007813486546366042, 0.00804730457349072, 0.008167749694968893, 0.008120657238413695, 0.00786969328195133, 0.007399757001343867, 0.006749105413261871, 0.005957297796336413, 0.005070568378062304, 0.004084031692564828, 0.002964896427910306, 0.0017277674843196851, 0.00039968998199287634, -0.0009587029140000877, -0.002291555862173735, -0.003562084237431619, -0.004748512625370729, -0.0058387976198986105, -0.006822364259934734, -0.007726410186325493, -0.008485204603827897, -0.0091239399567889, -0.00964504001841001, -0.010048119246076726, -0.01034090162754825, -0.01053473270759705, -0.010648742694609858, -0.01072152842754542, -0.010785094630626471, -0.010833885686060562, -0.010861110923777574, -0.010858768870313538, -0.010814227950304204, -0.010712429876878971, -0.01055298330438327, -0.010341949154897756, -0.010087783810243223, -0.009799032667985442, -0.00948736040243745, -0.009150482302534015, -0.008777176767739387, -0.008356772446898664, -0.00787742120719735, -0.007324588593364126, -0.007015456545476906, -0.006271672383223612, -0.0054095980926188525, -0.004409365738547733, -0.0032399559464320322, -0.0018613770444367683, -0.00021144161626751836, 0.0010591543686982866, 0.0036531626457363114, 0.004960214213617957], [0.020417817591476303, 0.02000358835009098, 0.01916004722345443, 0.01786882082526386, 0.016114052031870718, 0.013899590382099317, 0.011274534613483012, 0.008362962154127603, 0.005378760666498877, 0.0027647911071972584, 0.0010944528399815083, 0.0016286769753597885, 0.839456011575495, 0.22184710455817985, -0.02289604669662684, -0.007382092984875308, -0.0036751512425694547, -0.0019506367832682818, -0.00044109122169501826, 0.0010135092380254948, 0.002995113881062629, 0.004032120791393468, 0.004896604990560533, 0.005597173387664397, 0.006148462607540918, 0.006568917181666331, 0.006899956854690416, 0.007234252295759078, 0.00758316378908975, 0.007944017982383478, 0.008321454105505008, 0.008718063426222665, 0.009129908263876732, 0.009552771807170981, 0.0099844092920024, 0.010422678683318351, 0.01086214775924374, 0.011297949458386924, 0.01172547879343476, 0.012142674551664226, 0.012556732960945755, 0.012978610858164047, 0.01343925507634202, 0.01398006988613955, 0.0146202387948295, 0.0152900047795059, 0.015913635186801948, 0.016409669296370496, 0.01668216226832737, 0.016622344133862384, 0.01614394761102018, 0.015226779150837316, 0.013946184554401027, 0.012380589618195619, 0.010622349162379509, 0.008662278499853685, 0.0064356551616489436, 0.003971941997993593, 0.0013249209151700203, -0.0013850064327901252, -0.004046888694315217, -0.006593385847011869, -0.008974445273905167, -0.011165768221887388, -0.013144942775126898, -0.01493663588788743, -0.01646218266594476, -0.0177516021859818, -0.018807733498397, -0.019629298933303767, -0.020231387377199313, -0.02066627763968448, -0.020940965850012566, -0.0211325281906506, -0.021305327485303466, -0.02144857029031962, -0.021546744432948097, -0.021583538316446632, -0.021533492631849307, -0.02136656220785561, -0.021082005503661485, -0.020691973256848496, -0.02020938408985507, -0.019655594824121787, -0.019054458967845137, -0.018401804139762504, -0.017675426638948995, -0.01685410795279811, -0.015914292316204618, -0.014827077156740103, -0.013843584213141389, -0.012359854784022467, -0.010646276869169326, -0.008664113104650937, -0.006354739922492772, -0.003644460046774175, -0.0004226024077357748, 0.002626496644964623, 0.0076055556108841045, 0.011518597758750592], [0.027696190470463577, 0.02713397516541297, 0.02599005697965371, 0.024239039206315264, 0.021858532798211584, 0.01885216328503988, 0.015283617565558717, 0.011315644586059314, 0.00722767308820073, 0.0036017204634410417, 0.0011610441841452786, 0.001252233590630184, 0.8784201859497686, 0.18022790264688826, -0.020087731853926188, -0.008356450796566304, -0.004250098997741536, -0.002140743210814806, -0.00020530117295112122, 0.0016963226513719075, 0.0041326721040881005, 0.005530041229910454, 0.006695343292833531, 0.007639982243857539, 0.008383579115619341, 0.008950933274963293, 0.009397888466719951, 0.009849522041801253, 0.010321088881987217, 0.01080902992293787, 0.011319674657437793, 0.011856543183512149, 0.012414304305247965, 0.012987255608087845, 0.013572382156616542, 0.014166828541168193, 0.014763346525498504, 0.015355454031269086, 0.015937005617176054, 0.01650529790844827, 0.017070138604629723, 0.01764642448927117, 0.018276056053053883, 0.01901507335991833, 0.019889527143270087, 0.020805210878322867, 0.021659760507116366, 0.022342978404343124, 0.022724938763083822, 0.022658226848582933, 0.022020428298587417, 0.020788361211237307, 0.019063529595825312, 0.016951803836720437, 0.014578149032414549, 0.011930375941448726, 0.008921232566321626, 0.005590705051104976, 0.002011465102109389, -0.001653869356001649, -0.0052554286993411435, -0.008704645358783002, -0.011931070178689296, -0.01490172423495737, -0.017585746986426367, -0.0200041938640901, -0.022072488197696315, -0.02382281450147004, -0.025272974236424113, -0.026412403559729583, -0.027258325099490215, -0.02783945272557869, -0.028206118181973938, -0.02846209229618822, -0.028694081474593652, -0.028887165185593457, -0.029020115239872718, -0.029070692679721715, -0.029004328253422706, -0.028780282298967258, -0.02839743262885919, -0.027872144444825414, -0.02722186502487199, -0.0264754894740303, -0.025665314789539078, -0.02478565680008105, -0.02380639127882045, -0.02269876386825698, -0.02143088009967522, -0.019963629926060718, -0.018566547724708626, -0.016566078235972483, -0.014256164423186083, -0.011584790105984816, -0.008473866099096658, -0.004825772057099475, -0.0004951198312795896, 0.0038514677352437347, 0.010449712366513864, 0.016176203923898454], [0.035086709401616824, 0.034374212832586466, 0.03292530418563086, 0.030707433339503935, 0.027691538070839856, 0.023880942730620778, 0.01935401257475912, 0.014312507219144469, 0.009101912029542525, 0.0044446808686435125, 0.0012137194837806582, 0.0008257930835652261, 0.905941391614286, 0.15216506711843425, -0.018519891425809322, -0.009267830882803012, -0.004799938575923933, -0.0023104445381761105, 5.227285266961857e-05, 0.0024045056321104637, 0.005290985375552196, 0.0070538396691938446, 0.008524255372010724, 0.009716464054967004, 0.010655137192240835, 0.011371516736700973, 0.011936076933785286, 0.01250677215013817, 0.013102804714369318, 0.013719719309220153, 0.014365563420219482, 0.015044800523479592, 0.01575068490541309, 0.016476006469275186, 0.01721696962797788, 0.01796999692380672, 0.018726001685917, 0.019476867474252403, 0.020214889326680523, 0.02093671608838126, 0.02165480930298752, 0.022388067984769954, 0.023189511454691857, 0.024130035369458874, 0.025242664831998725, 0.0264083863478285, 0.027497810977194483, 0.028371575333346857, 0.028865259249331757, 0.028792213722159274, 0.02799307118926976, 0.026441809779411525, 0.02426646241174363, 0.02160074328375532, 0.01860271584537744, 0.015257152453426782, 0.011453949483695, 0.007243779470707348, 0.002718481957393807, -0.0019164908765521866, -0.006471780698371775, -0.01083739357424665, -0.01492205158021702, -0.018683961028407574, -0.022083661358410903, -0.025137967965953835, -0.027770960418827328, -0.030013994023875955, -0.031863792947177574, -0.03331569665691033, -0.03439421397110575, -0.035136622730385605, -0.035607127601978185, -0.035937181829374776, -0.036236565890031346, -0.03648645166515154, -0.03666001460933548, -0.036729152665749984, -0.03665016564027503, -0.03637153018135597, -0.035891833894597255, -0.03523176353041341, -0.03441339880711044, -0.03347332158290606, -0.03245242781917471, -0.031343556997570236, -0.030108596044603513, -0.028711150362217608, -0.027110923870353652, -0.025258486012263895, -0.02336330933373095, -0.020836891682734258, -0.01792066112201139, -0.014549129747577045, -0.010624518476803306, -0.006025064600405056, -0.0005704298525530637, 0.005102683668435196, 0.013336415380262692, 0.020914676584870874], [0.04140474944115585, 0.04056377292846752, 0.038854139409805664, 0.036237173480661286, 0.0326780896723525, 0.028179921368626716, 0.022833520978008413, 0.016873881097950297, 0.010702733280713861, 0.005162195740456858, 0.0012519617529586514, 0.00044115461250168595, 0.9239884438915366, 0.13473640312304597, -0.017773008129378907, -0.010011003096463968, -0.005254548580676206, -0.0024449169828070394, 0.0002807159542532782, 0.0030166669002768573, 0.006282675825902256, 0.008357782552451747, 0.01008888102920507, 0.011492614427356622, 0.012597966873333259, 0.01344168336816695, 0.014106738390970349, 0.014779179186615681, 0.015481579441989064, 0.01620871905846469, 0.01697011497299513, 0.01777103724835609, 0.018603531134839986, 0.019459098010254992, 0.02033327555048165, 0.02122187008347016, 0.022114225815878064, 0.023000831634110718, 0.023872651487095903, 0.024725782385951394, 0.02557495557431436, 0.026442492227904388, 0.02739091534639757, 0.028503817807767104, 0.02982018760065804, 0.031199812884589555, 0.032490209229073704, 0.033527086217150066, 0.034116539618152496, 0.034038382360836505, 0.03310154295672531, 0.03127766002846488, 0.02871743095177746, 0.0255783624253238, 0.022046806628278945, 0.0181049440903849, 0.013623147062950303, 0.008661224142738481, 0.003327395243400539, -0.002136283876495607, -0.007506709875964347, -0.012655630029318642, -0.017473906626920322, -0.02191220999088852, -0.02595901109136878, -0.029551857809527692, -0.03267433543096183, -0.03533068996759843, -0.03752064997384289, -0.03923995190469029, -0.040518057828640465, -0.041399191282892794, -0.04195912041713902, -0.04235299710787814, -0.04271035194279366, -0.04300904490557265, -0.04321749366346664, -0.04330260732754287, -0.043212902022829645, -0.04288766620138428, -0.042325241545897264, -0.04155002205905246, -0.040588058172714554, -0.03948250870082942, -0.038281622224267266, -0.03697697851441144, -0.035523643244449586, -0.033878701956420024, -0.03199458256363002, -0.029812973478239514, -0.027456858289269852, -0.024481109033442555, -0.021046924995388905, -0.01707731492837245, -0.012457701036658315, -0.007045735596637055, -0.0006313016433268804, 0.006179995661394588, 0.01580852669817324, 0.02497822718293432]], [[0.17221343574862688, 0.1714065274216502, 0.16961858389505086, 0.1665884300090426, 0.16192633982636595, 0.15514148864348298, 0.1457177272525261, 0.1332522806883959, 0.11754540536722019, 0.09968251936271899, 0.08224511178451513, 0.06700693614633768, 0.054707607681505274, 0.04554426316194217, 0.03953738095280987, 0.03682116088177545, 0.037904449155735036, 0.04500154794971804, 0.15780198268133963, 1.5123639258779522, 0.44832248953432724, -0.2734857328521278, -0.0659139227681656, 0.0035694316236349584, 0.011415527166720658, 0.012670066767813334, 0.013366534534202494, 0.013919853150085605, 0.014459533560972598, 0.01500949651496632, 0.01559341450123246, 0.01621251875181204, 0.016849641088691535, 0.017493093912913073, 0.0181336740697401, 0.0187596491906943, 0.01933395637345327, 0.019818452385250117, 0.020179903605104084, 0.020394501070856413, 0.020461473323769835, 0.020368265700130974, 0.02020326703035058, 0.02011074877635851, 0.02011304320484216, 0.019941209873639454, 0.019373298947956523, 0.018192631995148572, 0.016173378439724488, 0.013089328365939606, 0.008819649392863156, 0.0034646472534156547, -0.0025595985211194577, -0.008931183212097599, -0.015398824526890823, -0.022064578736186818, -0.029244727082846114, -0.03690743880650216, -0.04536267793298117, -0.05320610874488063, -0.06043773686717566, -0.06683210914469503, -0.07247025303188513, -0.07738239262968317, -0.08156681598468384, -0.08501861820300187, -0.08775303830140488, -0.08980840458394695, -0.09118956090365146, -0.0919014235743678, -0.09201391795801254, -0.09161085379411382, -0.09082036367470757, -0.08984333741557535, -0.0888449039998312, -0.08779883970652659, -0.08665713296862686, -0.08536965332772307, -0.08386148115015571, -0.08206983517973275, -0.0800000177587994, -0.07769071898464079, -0.07518051539305168, -0.07253167604903359, -0.06978826174318199, -0.06691439637416265, -0.06386397557485286, -0.06054475513410451, -0.05634603280047257, -0.052279680856365536, -0.06004326616617266, -0.056744834176729465, -0.053333334680058665, -0.04997834325790637, -0.04695535575725849, -0.0448058426404182, -0.04468610331302812, -0.047869644269913594, -0.06312943216650994, -0.108828131915361], [0.7002516780032192, 0.6968532886497318, 0.6894375628034533, 0.676918383844152, 0.6576737892710004, 0.6296530663978546, 0.5906781347153163, 0.5389944484680056, 0.47364861762088134, 0.39904117270171796, 0.3257541048730513, 0.2609334612427076, 0.20743448793935088, 0.16579499198760778, 0.13562192919087668, 0.11653640923181413, 0.10887283319586373, 0.11619441770867664, 0.3179718615003302, 1.2719297194545407, 0.4255932683997524, -0.18261777328076778, -0.01197919010646779, 0.04650855551074018, 0.06214727716585707, 0.06528760907095785, 0.06686333301117103, 0.068204587499596, 0.06967964016706982, 0.07133220446879292, 0.07323193886096793, 0.07536340169569807, 0.07763998782352846, 0.08000208838059548, 0.08240437376741085, 0.08479504525940723, 0.08702887457796506, 0.08895568613412713, 0.09044115050575083, 0.09138993292891771, 0.09180075965511976, 0.09162609589348818, 0.09122687810165904, 0.09119143097297219, 0.09161454958225142, 0.09140654103002839, 0.08966458146579057, 0.0855035344778475, 0.07799153020937007, 0.06618579548376452, 0.04944786236496626, 0.028247356495216334, 0.004242245522353705, -0.02127597390399703, -0.04727433981123946, -0.07414878401546897, -0.10317154699869649, -0.13412329242607887, -0.16717134017712074, -0.19875690119660044, -0.22803897760982983, -0.2543594168547973, -0.2776955796809768, -0.29814109977749054, -0.31562812035978083, -0.33013076911841915, -0.3417063393878586, -0.3505047059435876, -0.35653964880258415, -0.3598286208756307, -0.3606552864157641, -0.35936627482757294, -0.3565041846983598, -0.352913172411737, -0.34926098538188866, -0.3454152074696549, -0.3411642998129261, -0.3362931943163213, -0.3304885131645502, -0.32349027267441727, -0.315127403967814, -0.3057307935190906, -0.2954555350650975, -0.28456344605722644, -0.2732406141804761, -0.26132256051332564, -0.24858311493055454, -0.23471247631237932, -0.2184432585402448, -0.20141114746618563, -0.19010013191331301, -0.1689360142720137, -0.14508839648755484, -0.11936706624818541, -0.08962895297744924, -0.05553126029645207, -0.01596147465299106, 0.031974005047745245, 0.07926824919415812, 0.08339272937574196], [8.899830913912043, 8.856288015744678, 8.761602299842899, 8.601897588820039, 8.356448082209626, 7.999025933350878, 7.501711522938409, 6.841856024786243, 6.006919845405777, 5.052792574767428, 4.1142206463292705, 3.2818279837655218, 2.591447930554923, 2.0491263864620093, 1.6484426704798225, 1.3818146427863203, 1.2483016484532472, 1.2769102731072428, 1.619364253232066, 4.872283817016269, 2.9162140270987877, -0.5619545698511046, 0.5500643113223587, 0.7762572335865915, 0.8369278236726361, 0.8709722162147767, 0.8872397200933685, 0.9015673860692488, 0.9181618699479199, 0.937418498205526, 0.9601430018813838, 0.9860779379540187, 1.014072340460813, 1.0433324497220815, 1.0732584872201911, 1.1031798714522683, 1.131267214421527, 1.1556265911964687, 1.1745531531245061, 1.1868396647867334, 1.1924755126939564, 1.1908670721254808, 1.1866062374907742, 1.1871753643517264, 1.1937911816457274, 1.1926158415803838, 1.172173925593644, 1.1212036006672694, 1.0278205916409417, 0.8799740369327442, 0.6691090466108245, 0.40137913536470465, 0.09775479408914213, -0.22540188245580067, -0.5549289708995991, -0.8958015587342057, -1.2641478071092156, -1.6569110344068798, -2.072946995527649, -2.4734633937735477, -2.845254958678129, -3.1807306840856957, -3.4785491946966407, -3.739812960051117, -3.963477334859255, -4.14919575669375, -4.297682415486225, -4.410824261001365, -4.488778727310174, -4.531760037958217, -4.543636945619405, -4.528732107213207, -4.493967843760776, -4.450113069796637, -4.40556827074783, -4.358513429660073, -4.30615699843815, -4.245672042476953, -4.172999253756375, -4.084812132620557, -3.981287475028173, -3.8643614895782665, -3.736061351546331, -3.5997691646469203, -3.457922017060205, -3.3084545060962487, -3.148451962238401, -2.9742560296336658, -2.77349868632407, -2.55966815345221, -2.3991427530923017, -2.1322377391447316, -1.832607853346401, -1.4946474971566073, -1.1094432878867952, -0.6662594661767121, -0.17244856204941886, 0.4268979712948196, 1.0399388729015633, 1.2272425947463343], [-1143.386018725447, -1137.7460224888496, -1125.524505899482, -1104.9293158259215, -1073.283169468462, -1027.1950090216383, -963.0468847578953, -877.8833401007173, -770.0381291463335, -646.6864638165058, -525.1729233219094, -417.11424752981566, -327.0545034954505, -255.6672054528241, -201.94109073559864, -164.54027850510693, -142.6651519344646, -137.91339640851126, -160.4650797356173, -401.4705019449116, -201.9239494706031, -36.826308625922856, -88.32515587243347, -107.3826447018673, -113.67740460586593, -117.28390411384798, -118.88227132573986, -120.36743763835537, -122.21788276081703, -124.4634403529876, -127.19721709682547, -130.37813730201225, -133.85176088106766, -137.51138252456488, -141.27685269183957, -145.06041843371648, -148.62919606346006, -151.7417936857552, -154.1794995029652, -155.7877945234229, -156.56604424614775, -156.4393593817315, -155.99827249590257, -156.20472399773485, -157.2165909091487, -157.25760025695345, -154.85334212032885, -148.5553802942283, -136.83158688897373, -118.12476931942649, -91.27828118916204, -57.10684970714559, -18.291351594296128, 23.07294866799495, 65.29071900136292, 108.99366935535953, 156.24842266344035, 206.627098353448, 259.55498426689746, 310.9194987924724, 358.78984366827217, 402.2261273132233, 440.8971255184967, 474.92246548329473, 504.11298225661534, 528.4179817922943, 547.925636276432, 562.8749624610057, 573.2832879899646, 579.1770773500542, 581.0197932101904, 579.3844354506157, 575.1774779299242, 569.7987961273815, 564.3322684783515, 558.5387644338093, 552.0572892300387, 544.5242971095329, 535.4182009819915, 524.3109461966349, 511.2232624892325, 496.4026266908389, 480.1095423334214, 462.7812739703823, 444.7373958854593, 425.713659181362, 405.32872196546367, 383.1476967755102, 358.06938177487496, 330.83803916885216, 303.9088404612095, 269.793226970787, 231.5521236794278, 188.49334797406777, 139.55991676368262, 83.49110507269799, 18.464321111717602, -57.58756839136747, -137.90731596869864, -179.6048553772997], [-23.13092612265065, -23.016542314957945, -22.768944261096724, -22.35181762868974, -21.71090977432467, -20.777485260789074, -19.47815922205079, -17.75285798969467, -15.567529489546285, -13.067298097023146, -10.603255369085728, -8.410248770666014, -6.579835395623563, -5.124998663980339, -4.024121460299551, -3.24792877621918, -2.7760230379486504, -2.6274865704232173, -2.9503517662629655, -6.725150220570185, -3.3499742522043645, -1.2229714899824216, -1.8966621672341517, -2.219975870999879, -2.3379933069857874, -2.406181910435148, -2.435460226502365, -2.4632943273007983, -2.4989786250663544, -2.5429863442168386, -2.597136326589803, -2.6605478440287618, -2.730055670742646, -2.803471729408829, -2.8791553357181576, -2.9553212707118264, -3.027271577421102, -3.0901348268276077, -3.1394883938477367, -3.172209922479552, -3.1882911104626483, -3.186225485585335, -3.1779633647532215, -3.1829691064772168, -3.204446298614113, -3.206470000444704, -3.159211791946673, -3.033359588349436, -2.797885041398052, -2.421229960162454, -1.8796371018754745, -1.1897388575785812, -0.4056874300238066, 0.43017197281374187, 1.287053491987826, 2.1752031403401353, 3.136154080883852, 4.1602139935612605, 5.223790137011658, 6.265958885230779, 7.2363704787592695, 8.117430250959377, 8.901844054704668, 9.592089951212062, 10.184381360571884, 10.677725426280157, 11.073922701682728, 11.377814757173212, 11.589756412385576, 11.710287521143353, 11.748796528979451, 11.716885449167611, 11.632933429017886, 11.52532717326789, 11.416001284600876, 11.300071468539773, 11.170210751332723, 11.019055705427721, 10.836049410375004, 10.612525137469692, 10.348887575714985, 10.050133376488994, 9.721531502259653, 9.371943860633058, 9.0032887425305, 8.613870168673165, 8.196256669100187, 7.742812317292034, 7.244789907782601, 6.691597265910722, 6.117712191767179, 5.428692868367968, 4.6566318910120925, 3.787629054466781, 2.8006652635324607, 1.6710941671295325, 0.3639814941845739, -1.1879978606737436, -2.8170519455274343, -3.7702367172465205], [-12.362818400760554, -12.301587340324792, -12.169133907375855, -11.946029351640501, -11.603246642839878, -11.10400363339527, -10.409013194649653, -9.48607194332812, -8.316864288378733, -6.978944418318334, -5.660030545311153, -4.4855875276834025, -3.504425289905377, -2.7232668844909935, -2.130168170384769, -1.7087246654296309, -1.446612629306559, -1.349571651128227, -1.4772139418179775, -3.1237321522554033, -1.5867678667805099, -0.7887697476044498, -1.050712202263497, -1.2025480004778877, -1.2624833822116366, -1.2973210177185261, -1.3119397576153637, -1.3260715182099223, -1.3445541067734625, -1.3675965535868824, -1.3961491762543494, -1.4297244904595585, -1.466617006535039, -1.5056473542981705, -1.545932153208371, -1.586513900166264, -1.6248861602401135, -1.6584493281628394, -1.684840296841575, -1.7023914668295714, -1.7110999279378716, -1.7101633947681394, -1.7059702248846682, -1.708924946590499, -1.7207430546950548, -1.7222268669107081, -1.697433671515155, -1.630693651924688, -1.505411895426688, -1.3034374717676853, -1.0126877657237254, -0.6421843936700995, -0.2209045904111851, 0.2284709641013579, 0.6874834422290048, 1.1628648583682593, 1.6769492637946644, 2.2246135448897166, 2.793293377392094, 3.3504753051477363, 3.8692831234035276, 4.340590893478412, 4.760238365980484, 5.129541719241622, 5.446475860378195, 5.710512467845066, 5.9226141087523185, 6.0853672254968405, 6.198961316228712, 6.263684806006807, 6.284549539212145, 6.267758154216925, 6.223146859790692, 6.165909582441258, 6.107773735843931, 6.046114766347698, 5.977008176786455, 5.896515161603986, 5.798991475162853, 5.677546573097573, 5.534121602919672, 5.371607932309882, 5.192933983304483, 5.0029086559581515, 4.805118974983696, 4.596738100482068, 4.37354172142331, 4.131345448454946, 3.865422799423786, 3.5700868956423775, 3.256528955929965, 2.888661985402481, 2.4765315394967664, 2.01272893616486, 1.486111699161243, 0.8837169335389686, 0.18729798067854608, -0.6371167870674891, -1.5149042121815952, -2.061273892075087], [-9.742322137614163, -9.694024808166612, -9.589590943064527, -9.413700737588973, -9.143465559904639, -8.749878682794963, -8.201949979640961, -7.474257136201387, -6.55231249746432, -5.497226410538497, -4.4569600075187354, -3.5303583291991907, -2.755826691495184, -2.1385615589422033, -1.6689672119737036, -1.3337604987089278, -1.1225622326198657, -1.037801371477778, -1.117294234693465, -2.240472863005154, -1.1674909207185233, -0.6775325208499785, -0.845375675413759, -0.9551782387610015, -1.0009341437702874, -1.0276326672076608, -1.0386692135540192, -1.0494557929333845, -1.0637438153607108, -1.0816773917574183, -1.1039951672959223, -1.1303051174123508, -1.1592567934160811, -1.189916160018339, -1.221584039571666, -1.253504311741, -1.2837039282007252, -1.310136205808376, -1.3309392453517543, -1.3447994900869338, -1.3517153637970303, -1.3510559910705273, -1.3478562046580442, -1.350315777939801, -1.3597881142101038, -1.3604877535155253, -1.3402341981888315, -1.2866927979524438, -1.1867752758840637, -1.0271493422945719, -0.79765380282704, -0.5053778564185012, -0.17313241049735972, 0.18121045871599334, 0.5431088629282109, 0.917869008657871, 1.3230871946672889, 1.7547274472098533, 2.2028978282913334, 2.641993847470772, 3.050852927322926, 3.4224096970605524, 3.7532601658265365, 4.044435877225067, 4.294339196381675, 4.502554061755287, 4.669838535174388, 4.798229852481239, 4.887877068102758, 4.939007204021406, 4.955569313466231, 4.942452110750571, 4.907412779024168, 4.862434449430394, 4.816757704676907, 4.766626567166882, 4.710273119914367, 4.644755850363008, 4.565699436628624, 4.469464725617584, 4.356225511145548, 4.228101539258001, 4.0873328914142135, 3.9376888327160993, 3.781973165015658, 3.6179426733669535, 3.4422595236723086, 3.251620474786703, 3.042297469723525, 2.8098073479649095, 2.55988124643662, 2.2701890136375273, 1.9456736374401, 1.580507003748496, 1.1659521599906375, 0.6918931026046209, 0.14414964047618453, -0.5030331575527143, -1.1981775517050883, -1.646070193375216]], [[0.01795131838772421, 0.01791973029858693, 0.01783945235181545, 0.01768186918608857, 0.017402280780601093, 0.01694014846136058, 0.01622365191221282, 0.015180943350858497, 0.013747759293764235, 0.011985258212446082, 0.010146146256620862, 0.008437955154667422, 0.006959747105574589, 0.005708070051785841, 0.0047101870834507726, 0.003995994116242849, 0.003485223310359381, 0.0031800232115740314, 0.003063536083359042, 0.0031306172662028437, 0.2865567424514687, 0.2923076682190304, 0.2990450765865011, 0.30684481470742764, 0.3156705804857793, -0.3130846903402896, -0.11811414188449375, 0.0005389875542173824, 0.0007636084287131581, 0.0008464664433868612, 0.000894313472751472, 0.0009293151211941917, 0.0009602946716667733, 0.0009866117393402625, 0.0010084320725651636, 0.0010247009457321464, 0.0010263659068244682, 0.0010199956087258248, 0.0010024465673016604, 0.0009689706737176776, 0.0009185680822830775, 0.0008488084973108589, 0.0007660629445019168, 0.0006818412652858793, 0.000595544344625372, 0.0004210728713307053, 0.000263364798948895, 4.8796455293854584e-05, -0.00023940909960620555, -0.0006217236062066683, -0.0010906757245304135, -0.0016321464208096876, -0.0022093725546767505, -0.002793817082844245, -0.0033656745799140898, -0.003935099664403621, -0.004531682009987578, -0.00515179924614783, -0.005782176365630914, -0.006382533311325478, -0.006908957924931353, -0.007357732565494167, -0.007759109275692655, -0.008100903793733906, -0.008379443305495874, -0.00859165566158446, -0.008711337191086988, -0.00879422020568108, -0.008838221289366559, -0.00883143850127159, -0.008778121946546157, -0.008685146423301324, -0.008563850591065438, -0.00842987873652156, -0.008292480236279863, -0.007993098016714047, -0.007850170124593431, -0.0076995610878943235, -0.007530984349453749, -0.007328178269714266, -0.007108041765499266, -0.0068763015256965935, -0.006630910206930812, -0.006376282478250584, -0.0061153100678892425, -0.0058441119815457665, -0.005558761631346933, -0.00525520456599025, -0.004928730019244723, -0.0045736567680289076, -0.005222202509180526, -0.004935229501732771, -0.004646572447873112, -0.004373288980611016, -0.004143418478797313, -0.004010877215142047, -0.004088361426695932, -0.004505842751454899, -0.005664017919254792, 0.0005871908372344661], [0.06623695090957608, 0.06611275989384047, 0.0658072683785007, 0.0652134078451517, 0.06416402379641825, 0.062432654793858074, 0.059750170232496805, 0.055845828868050236, 0.0504764256018237, 0.043869540778986735, 0.03696558294013069, 0.03053019192671439, 0.02492241325699788, 0.020196423607481535, 0.01638734868958453, 0.013505662354312034, 0.011375025462794465, 0.009961321432234617, 0.009162551162499104, 0.008895973678846028, 0.30853328777612604, 0.31444174122279583, 0.32145228662681513, 0.3295920267683558, 0.33869553536562236, -0.33092009766679753, -0.1913236960329628, 0.0039194342149851714, 0.004232655667820948, 0.004328653097837632, 0.004384226716036774, 0.004432800857793423, 0.004483406484349203, 0.004531529125299666, 0.004574640253665414, 0.004608012943019573, 0.004609733518041159, 0.004583177325953804, 0.004516346173899291, 0.0043965136307941455, 0.004220817504311438, 0.0039807407044132005, 0.0036999163280742554, 0.003420921545251426, 0.0031441142350854324, 0.002679655846756458, 0.0021643930678234688, 0.001444064189194705, 0.000458461995789941, -0.0008565468749913281, -0.0025081066653993792, -0.004440294786185512, -0.006514457406368859, -0.008625802080686048, -0.010700500478216947, -0.01277479371801769, -0.014956320999259805, -0.01723069397061966, -0.01954959447925558, -0.02176895145995295, -0.023752642194993397, -0.02547978413589704, -0.026993997621174454, -0.028284089183483477, -0.029342395242147008, -0.030165448264066738, -0.030714849794672042, -0.031090556682613554, -0.03128979763685168, -0.031294081912512976, -0.03112351229891178, -0.0308050449474144, -0.030381999911306405, -0.029914114797825686, -0.029432038991307526, -0.028678277570694036, -0.028166689591351737, -0.027616881416307127, -0.026998081161868182, -0.026274424584054535, -0.02547437541902395, -0.024613485277235805, -0.023695045779794397, -0.022737806512230938, -0.021752916644728962, -0.02072454283642503, -0.019636104204263573, -0.01847052979843354, -0.017208077149078523, -0.015825117329450477, -0.014774257831031192, -0.013157325382900993, -0.011318983325193039, -0.009270443124564313, -0.006964862286644132, -0.0043475103291590236, -0.0013445099020059003, 0.0022236609406941455, 0.005928602803661917, 0.00579157514976674], [0.1119922390962926, 0.11177920869266486, 0.11125898193613641, 0.11024993683777061, 0.10846856487966931, 0.10553073679938037, 0.10097976284622683, 0.09435562716374477, 0.08524469237592074, 0.07403251302038422, 0.06231229872009904, 0.0513785344332642, 0.041835701422793345, 0.03380212851351434, 0.027311054610891897, 0.0223403105020342, 0.018639611096490653, 0.016134478698679337, 0.014636558631315641, 0.013980486667951163, 0.3246498911176077, 0.3306266271045681, 0.33780588466048844, 0.34617501164087316, 0.3554922954580661, -0.34126591256079186, -0.22582605653752566, 0.007398087926683044, 0.00772173334314464, 0.0078002692777087304, 0.007845911293537549, 0.00789585493590021, 0.007955972758149585, 0.0080177723607881, 0.00807572428559153, 0.008121502726378184, 0.008122645213778104, 0.008076525804809909, 0.00796269866359399, 0.007761560740347827, 0.007468603044507128, 0.007069604875652417, 0.00660457466571659, 0.006145544280527984, 0.0056941447659224, 0.004980468988172893, 0.00413589438702012, 0.00294649005323675, 0.0013111363597010325, -0.0008740472729765528, -0.003635005435833472, -0.0068756569694446365, -0.010360368245178187, -0.01391215933372734, -0.017405903020150333, -0.020902384829283326, -0.024582983615069526, -0.028422963393095555, -0.03234089396900114, -0.03609500189385922, -0.039465480635375215, -0.04241416033787305, -0.0449876302831801, -0.047180451359723326, -0.048982018162498135, -0.0503897191700198, -0.051363206691154774, -0.05202810614472765, -0.05238112129191822, -0.05240086672278544, -0.052123038884696896, -0.05159406892962182, -0.05088820684310715, -0.050107222908182356, -0.04932131620224722, -0.04820497851026407, -0.047363888509443765, -0.04645463060068551, -0.04542861368645446, -0.0442350275969292, -0.042908567068111574, -0.04147338420035654, -0.039939345023666604, -0.03833904824681823, -0.03669185310228505, -0.03497107522483463, -0.03314851348282648, -0.031195282158431797, -0.029078133790279997, -0.026757368586160006, -0.024824808531989206, -0.02197683946736621, -0.018809723638476963, -0.015273982257144623, -0.011436282735989707, -0.007019258694303259, -0.001960744585133547, 0.00399729509192557, 0.010254435286231257, 0.01123971328514404], [0.24571137004771768, 0.24523715945596233, 0.24408749043626665, 0.2418625588789707, 0.23793836331823132, 0.2314693671354528, 0.2214499050114452, 0.20686566607983708, 0.18680369346018758, 0.1621116075799583, 0.1362920353960974, 0.11218498077962756, 0.0911108943393354, 0.07338915573649929, 0.05903421537209338, 0.04790826286192055, 0.0395692041140256, 0.033816082008016356, 0.030200099920548357, 0.028301501142721747, 0.3601443440838104, 0.36610430943954164, 0.37353035443828425, 0.382300748412457, 0.39201402099456606, -0.35684080014628855, -0.2770831318381883, 0.017955853569633088, 0.018205425110418214, 0.018190405725380585, 0.01818249495543865, 0.018220103910427575, 0.018295104880644182, 0.018386943787813536, 0.018480684325992702, 0.018557313679130483, 0.018555869967014842, 0.01845195874962019, 0.01820036511638747, 0.0177623610465594, 0.017128792494914384, 0.01626886133492342, 0.015270458054579732, 0.014291717325012006, 0.013338511778120113, 0.01193285759148522, 0.010139387834928548, 0.007593591811708169, 0.0040751279695462415, -0.0006337327965513115, -0.006620916850521123, -0.013680750924642002, -0.021295421999531154, -0.02907321847887047, -0.0367366983795878, -0.044417229432212255, -0.05251139041893486, -0.0609638051052433, -0.06959604276551741, -0.07788133567850868, -0.0853572424004764, -0.0919325384871012, -0.09764842979602296, -0.10252295544555202, -0.1065379616281875, -0.10969442407133215, -0.11195303052293457, -0.11349760547434239, -0.11432665492101696, -0.11441669156707243, -0.11385033786283111, -0.11273089637726715, -0.11122237532904858, -0.10954996426227914, -0.10787375562472937, -0.10576380787885754, -0.10395951764809173, -0.10199899652518525, -0.0997829361217419, -0.09722162087617597, -0.0943609735530774, -0.09123612964633335, -0.08787801461034879, -0.08436721750417094, -0.08075055609409433, -0.07697052839371435, -0.07296451868584075, -0.06866897499069664, -0.0640112747117257, -0.05890481668573883, -0.05383339811616609, -0.04762369922153537, -0.040734576345665484, -0.033048025199719264, -0.02438057292566424, -0.01465073029061968, -0.003594896171367168, 0.009309117025759732, 0.023021022848582845, 0.027903399443726492], [0.34319483511291193, 0.3425295550547919, 0.3409202042846298, 0.33780779119193366, 0.3323198960649607, 0.3232743401057017, 0.3092648864282839, 0.28887264325903383, 0.260820111827461, 0.22629193314904586, 0.19018342494104196, 0.15646129018825608, 0.12696736938853553, 0.1021734362727753, 0.08207454515014981, 0.06643989084339359, 0.05469797850204002, 0.04655198557428022, 0.04135978470195103, 0.03851061286536193, 0.3768073682625289, 0.38257510157286556, 0.38997357586484693, 0.3988028306696465, 0.40857004938630204, -0.3573011240557551, -0.2931650163416299, 0.025820699193747184, 0.02597138935052242, 0.02586990996240959, 0.025812427999513585, 0.025834030924316888, 0.025914336797980015, 0.02602381109033091, 0.026140386410418704, 0.02623718623392506, 0.02623347214660549, 0.026087164161242606, 0.025734955540025507, 0.025124593073737454, 0.024243608387318236, 0.02304915732751178, 0.02166404809597038, 0.020309195142369757, 0.018992013917958853, 0.017261429390819556, 0.014782849426937621, 0.011247665527922189, 0.0063526736541778175, -0.00018412081208445816, -0.008522086533306068, -0.018367115092553017, -0.028984640890088096, -0.039831098789160004, -0.050520121345939285, -0.06123529942622775, -0.0725301152209178, -0.08432688687608154, -0.09637671275378012, -0.10794563371303206, -0.11839865552477385, -0.12760587786216682, -0.13559876422865605, -0.1424154677585585, -0.1480329326735102, -0.15245560537974168, -0.15565093324031423, -0.15783507839903138, -0.15900780451807917, -0.1591460238977051, -0.15836676162467697, -0.15681475930864508, -0.15471945025439227, -0.15239613395230803, -0.15006613716169198, -0.14767336584416252, -0.1451337420387221, -0.1423600187466661, -0.13922861269105175, -0.13565628438339256, -0.1316500542015723, -0.12726818472823856, -0.12257281672645788, -0.11767050722960826, -0.1126242098836872, -0.10735236187538079, -0.10176672297065392, -0.09577809744856668, -0.0892847953523094, -0.08216572402288656, -0.07485341451283829, -0.0661939509908605, -0.05659083117342155, -0.04588173072997384, -0.03381808976931016, -0.020111195125369675, -0.00471213293402426, 0.013239030603391547, 0.032383751037736115, 0.04037197495433924], [0.44926461521682104, 0.44839130077798617, 0.446281614864128, 0.44220333084432406, 0.4350136907465265, 0.42316416747945973, 0.4048125970964792, 0.3780997714879427, 0.3413514332282226, 0.29611896262992476, 0.24881317746442125, 0.20462671715623718, 0.1659686210138052, 0.13347766752347684, 0.10712664427726695, 0.08658178805277823, 0.07113293295459533, 0.060378200828464026, 0.053464398583251395, 0.04957180126208135, 0.39705398348238796, 0.40265812548394103, 0.4100803761706026, 0.4190375809450949, 0.42894472745094614, -0.3599241927788663, -0.30632081390045807, 0.0344125514606039, 0.034446498080435387, 0.034247220134539354, 0.03413365325027311, 0.034136409964158856, 0.034221357138094655, 0.03434915059968149, 0.034489908025833925, 0.03460818172454322, 0.03460191877412851, 0.03440942556441253, 0.03394770291849906, 0.03314323193099051, 0.03198038314412953, 0.030404461831667257, 0.02857667955807559, 0.026786967549963837, 0.025051502672639798, 0.02277992376827086, 0.019531929331219132, 0.014902660130288835, 0.008494646806373546, -6.186240130056003e-05, -0.010980412652268167, -0.02387251070881823, -0.037776719684652696, -0.05198153199994362, -0.06598092419584, -0.0800148011504775, -0.09480707602398364, -0.11025582412736797, -0.1260356228303072, -0.14118734725416482, -0.1548889470768527, -0.1669685175203007, -0.17744594245681072, -0.18638203057071637, -0.19374853768663156, -0.1995537755678343, -0.20377364767058645, -0.20665770516505377, -0.2082073764572696, -0.2083737065774476, -0.2073183514819555, -0.20524054957433693, -0.2024459826999567, -0.19935312560404378, -0.19627138823165993, -0.1931242448790998, -0.18979324655156235, -0.18616096789914957, -0.1820639674291731, -0.17739199000965172, -0.1721536395304381, -0.16642481009486343, -0.16028655672107964, -0.15387815976127067, -0.14728188789680247, -0.14039093269869765, -0.13308984287138, -0.1252617855768952, -0.11677360373514739, -0.10746677521153995, -0.09771821200595734, -0.08639504001626583, -0.07384110591467757, -0.059845909733094164, -0.04409019923932134, -0.026210322576050715, -0.00591346198314506, 0.017526055121871113, 0.042581775099976536, 0.054003464783336355], [0.5398534647605587, 0.5388023243678953, 0.5362651399450947, 0.5313617036023771, 0.5227183302474471, 0.5084735508607271, 0.48641281479970294, 0.4543007481096531, 0.41012411887818806, 0.35574755968648375, 0.29887636149528235, 0.24575017193387344, 0.19926231539750344, 0.1601955525044404, 0.1285023313491251, 0.10375894054920588, 0.08513920313830355, 0.0721506688947199, 0.06375908014745676, 0.058964960042089974, 0.41172527028077177, 0.41713799000190405, 0.42452079646384844, 0.43351958241613253, 0.4434762644078642, -0.3591118566903994, -0.3126152013609135, 0.04178942243461238, 0.04171324844582402, 0.04142620867832724, 0.04126229860876348, 0.04124733194939173, 0.04133495610076756, 0.0414774055039389, 0.04163806006026013, 0.0417741350032588, 0.041781773883456184, 0.04155193955537335, 0.0409857012353524, 0.0400111033417728, 0.03861008369204866, 0.03671556467082023, 0.03452067671684466, 0.03237338264612116, 0.030292909259861424, 0.027569824693102193, 0.02367483193148388, 0.018121282050576313, 0.01043128874474127, 0.00016036856481014574, -0.01295177493134506, -0.02843610843401229, -0.045137724217228455, -0.06220189757428222, -0.079020519657012, -0.095881602037924, -0.11365459924143577, -0.13221680089365062, -0.15117737806420165, -0.16938492644625575, -0.185858151654399, -0.20038908567189637, -0.21298628608619102, -0.22373054570093784, -0.23258930951440115, -0.23957438530571898, -0.24474879051297446, -0.2482366541343835, -0.2500557259506179, -0.25022574552335, -0.24894221612563885, -0.2464376011029991, -0.24307632492965112, -0.23935969085441705, -0.23565852532597648, -0.23188026959025607, -0.22788189887676766, -0.2235220945393576, -0.21860436248684592, -0.21299651949980355, -0.206708808098685, -0.199832260736193, -0.19246413225314912, -0.1847716882313065, -0.17685373142431401, -0.16858191656651603, -0.1598175234506743, -0.15042015950828472, -0.1402298262112516, -0.12905606023392924, -0.11722004027324995, -0.10362284559518128, -0.08854978683085994, -0.07174908874135984, -0.05284078772850971, -0.03139748514025881, -0.0068305049919226545, 0.021201906901787942, 0.051305429825852206, 0.06572084017109914]], [[0.019634644642015253, 0.0196864436581452, 0.019762500782329922, 0.019827895099133682, 0.019834260193553468, 0.01970832594221847, 0.019361133519284698, 0.01867056070183975, 0.01746098313640143, 0.01574584134790359, 0.01381388110313838, 0.011847285439263545, 0.01002672066024135, 0.008411906841021537, 0.007028474868523922, 0.005874448274148609, 0.004936010607107445, 0.0041974442394526025, 0.0036215156613845882, 0.003170004628833604, 0.05920011403194849, 0.05986028057647012, 0.0607876123195744, 0.06199153213081863, 0.06348901170980789, 0.06530543427376839, 0.06744060649801961, 0.06979092351075845, 0.07234110741939422, 0.07510725609515238, 0.07810673197681213, 0.08135342937771836, 0.08485208423969526, 0.08855081509301821, 0.08671342444829874, -0.023152005656039906, -0.007906754771409548, -0.00042990858353134716, -0.00031432937296871317, -0.0003791711128232836, -0.0004806424346820838, -0.0006137481126474492, -0.0007714424701107746, -0.0009435783869150675, -0.0011302515941189369, -0.001351495105378642, -0.001619387120842488, -0.0019429756896601482, -0.0023287998337336415, -0.002780173673265954, -0.0032919539483099625, -0.003844136685971062, -0.004398776333734913, -0.004929480710151697, -0.005421615327191234, -0.005885584402238866, -0.006349091357536899, -0.006813125265737392, -0.007271173164742404, -0.007693606695128436, -0.008055306676370822, -0.008343838540821326, -0.008569985787031694, -0.008741409454009386, -0.008859893573923016, -0.008928028413640309, -0.008949406169582176, -0.008928798783827775, -0.008866622206603258, -0.00876342452062283, -0.00862521371469704, -0.008458864630495385, -0.008275131558679913, -0.008086317088060443, -0.00790106035075255, -0.0077170996952281076, -0.00753030200212794, -0.007336663510892153, -0.007130824280037851, -0.006910405384542653, -0.006675582945153061, -0.006428687304455061, -0.006172334412130658, -0.005911224901328813, -0.005647228951892418, -0.005375772563169086, -0.005093640602347315, -0.004797547317047492, -0.00448378862231955, -0.004148083953330386, -0.004744559865171695, -0.004502193970236916, -0.0028358457923339324, -0.002342930185804849, -0.001795870441834521, -0.0011822337341539793, -0.00048664622530298404, 0.00033750152588959796, 0.0012878199396725652, 0.000510009426072368], [0.09118166848151957, 0.09140799925550636, 0.09176445133397358, 0.09209470649064391, 0.09215980836918462, 0.0916045975396856, 0.08997577686537338, 0.08670277425691583, 0.08106534781092987, 0.07304632292247008, 0.06388990218875336, 0.05466800944203596, 0.046133255890921626, 0.038577606625667726, 0.032101983662387826, 0.02668823207762522, 0.02226860214532023, 0.01876662319627248, 0.016011369395619104, 0.013829353348808728, 0.0692024395440723, 0.0687735219046474, 0.06883568273426575, 0.06934007543969463, 0.07025475772107884, 0.07156456670430945, 0.07324136244899208, 0.07517700827849838, 0.07735319725101357, 0.07977944639571542, 0.08246703151502109, 0.0854120696722432, 0.08858764637617446, 0.09185047533184686, 0.08325536437608423, -0.02048897453619143, -0.006676692414950957, -0.00011785781171150199, -0.0001412725518693761, -0.0005778590731586974, -0.0011320070892837622, -0.0018016895904832966, -0.0025641442872619364, -0.0033790123126539473, -0.0042507424612569815, -0.005274165525724303, -0.0065067687783428975, -0.007991926819652832, -0.009761765820020819, -0.011833616778181536, -0.014191316061902227, -0.016738505630056643, -0.019300865320580566, -0.021757341820077963, -0.02404009875494175, -0.026196380602867872, -0.028352551838789333, -0.030511052935700403, -0.03264067617099977, -0.0346039330813281, -0.03628489541556426, -0.03764891248429544, -0.03872278716735346, -0.0395317633840111, -0.04009285711409507, -0.04041805861893855, -0.040524134308733174, -0.04043342644374459, -0.04014820496321571, -0.03967142766457582, -0.0390309522085636, -0.03825881630792084, -0.037405258604763444, -0.0365262355429074, -0.035659775486942075, -0.03479482264913967, -0.033912113786436465, -0.0329925923901186, -0.032010975462293347, -0.030956771841698972, -0.02983263679637389, -0.02864880856386471, -0.02741749074078369, -0.0261605518319119, -0.024885350257150878, -0.023568830255238832, -0.022194833321872356, -0.020746272842034213, -0.019203388774030775, -0.017543212922350275, -0.01634602369227173, -0.014430949391807986, -0.012341613288080077, -0.010048542368570704, -0.007504751502432709, -0.004659907663659785, -0.0014528601011191938, 0.002246907890110539, 0.00625377823514216, 0.005308301108328959], [0.17394903387950159, 0.17437438490743037, 0.175055863406112, 0.1756979018998126, 0.1758381567090419, 0.17479235176237773, 0.1716775696875628, 0.16540376186570607, 0.15463998598762518, 0.1393175174612823, 0.1217662514649557, 0.10413317341976873, 0.08781502311388366, 0.07337539800127844, 0.0609986485982028, 0.05064608477968407, 0.042186838312176886, 0.03547345263066438, 0.030180745384385775, 0.025979560485038133, 0.08051914536180954, 0.0788304516602304, 0.07789200831170433, 0.0775875700922065, 0.07782865049562025, 0.07855322279985219, 0.07970103728759972, 0.08115973042753723, 0.08290835374707849, 0.0849498563618632, 0.08729028583727982, 0.08990891512526303, 0.09275167161624966, 0.09561044781877027, 0.0823585141147103, -0.017987440521093176, -0.005199430443359871, 0.0006239476608772129, 0.00032618125983154114, -0.0005679087851879096, -0.001662533512261006, -0.00296339099480699, -0.00443155597413065, -0.005993090895657046, -0.0076582919672103286, -0.009608882595829659, -0.011955163593166953, -0.014780494274402154, -0.018146957315657894, -0.02208849213816915, -0.026577751614335482, -0.03142934781453003, -0.036311583358656876, -0.040994346605657074, -0.04535007253071152, -0.04946781176064911, -0.05358691114030132, -0.05771047984036739, -0.061778063821209234, -0.06552702262932239, -0.06873612182532225, -0.07134934518030676, -0.07340715433663977, -0.0749756119404069, -0.07606986989300538, -0.07671333793166399, -0.07693833783017533, -0.07678775762175706, -0.07626623824103392, -0.0753796708855993, -0.07418112938685437, -0.07273151666148912, -0.07112639639432193, -0.06947204124282925, -0.0678405412932116, -0.06621091164772706, -0.0645467829676363, -0.06281213796630827, -0.06095906829574856, -0.05896796641239113, -0.05684178910174887, -0.05460125090832573, -0.052269421624036694, -0.04988756612977926, -0.04746720617882117, -0.04496534508778316, -0.04235502155720857, -0.03960284463160559, -0.03667171185205607, -0.03351825401661194, -0.030813205119063478, -0.027158077663393992, -0.02317080470610394, -0.018769740704685376, -0.013939943403509387, -0.008514953456871158, -0.002407278738321037, 0.004593244548253736, 0.01205365899749515, 0.011454779680302533], [0.47437831994681884, 0.4755204256219378, 0.47738297715053946, 0.47916728461877006, 0.4795944519083797, 0.476779654396121, 0.4682645731942216, 0.45107219246461633, 0.4216927295558406, 0.379838719905809, 0.3317424847019831, 0.28354302004564125, 0.2389408017849179, 0.19949121238967046, 0.1656742375954338, 0.137373081989635, 0.1142263442360082, 0.09582752048970766, 0.08129229563248866, 0.0697280577765213, 0.12093870685362461, 0.11467474892339305, 0.11010148017465425, 0.10685795678578656, 0.10465044111541773, 0.10324677602315722, 0.10247056786257303, 0.10219638835856233, 0.10239542924059968, 0.10304879270493005, 0.10414704129018995, 0.10561553308014343, 0.10732007679088498, 0.10889739928313875, 0.0849255748140851, -0.009972450404723884, 0.0002924134918120187, 0.004056376036475948, 0.0025326305424919677, -8.425997601433852e-05, -0.0031830227286481906, -0.006806101613434641, -0.010860341275710454, -0.015153451306313796, -0.01971950628019638, -0.025056815304075743, -0.031468229104667934, -0.03918295072579518, -0.048372363757089275, -0.05913081141854611, -0.07139228470683916, -0.08464575623759066, -0.09798808968565836, -0.1107926306114619, -0.12270652744939495, -0.13397235919296618, -0.14524099866932685, -0.15651907641576016, -0.16764127578122848, -0.17789214118430535, -0.18666989573765394, -0.1938513810857972, -0.19951808239316698, -0.20384952438586176, -0.20688693346918904, -0.20869456616220977, -0.20936090113633105, -0.20897338268358245, -0.20757544281326093, -0.20518419687298572, -0.20194397069992515, -0.1980198501450611, -0.19367089262338666, -0.18918406561742393, -0.18475344707245156, -0.18032268707018842, -0.17579446519441394, -0.1710720928948946, -0.16602634235273897, -0.16060548844406053, -0.15481930567276664, -0.14872469387988968, -0.14238420178074174, -0.13591014264153461, -0.12933907682384396, -0.12255137757845824, -0.11546457895220068, -0.10799078878749177, -0.1000277790822185, -0.09145619100231732, -0.08299232333221827, -0.07301983476715979, -0.06214238586634941, -0.05020269211849761, -0.036960417870168065, -0.022172134859195374, -0.005545205423230079, 0.013385486053203567, 0.03321983874840729, 0.03493813954402214], [0.7495328050724682, 0.7513286738062184, 0.7542735509794637, 0.757109059117578, 0.7578057295255759, 0.7533763695287783, 0.7399121895720814, 0.7127073027357234, 0.6662744380604595, 0.6001107267194442, 0.5240043018711042, 0.4477930859452591, 0.3772711266360057, 0.3149049230579954, 0.261441797268474, 0.21669172025398764, 0.18008147301251284, 0.15096663916228661, 0.1279511855504291, 0.1096272054437845, 0.15744368437749467, 0.14698474079788118, 0.13907692563846538, 0.1331350656630893, 0.12867732751721012, 0.125315594382567, 0.12276726645509488, 0.1208963963308491, 0.11966784816668811, 0.11904359578759768, 0.11899191283831403, 0.1194006625157143, 0.12007094420835704, 0.12053537712198673, 0.08966182984467884, -0.0031279030172674145, 0.005318460449613888, 0.007453955610893582, 0.0046936723807045125, 0.0004649269107022162, -0.004494300856171569, -0.010264213578029488, -0.016703867617357565, -0.023513610588737, -0.0307497284723387, -0.039200864929725826, -0.049346484247657786, -0.061549458257757504, -0.07608133324146374, -0.09309186093772488, -0.11248083376195092, -0.13343791424604706, -0.1545365048936011, -0.17478674059448757, -0.1936306984538646, -0.21145096436849198, -0.22927483175661134, -0.24711180707541736, -0.2647004656480108, -0.28091078816136344, -0.29473447523486246, -0.3060460784718967, -0.31496151543239925, -0.32176515667142114, -0.32652293090622814, -0.3293373124474251, -0.33034897433181726, -0.3297443024414933, -0.32754551447721475, -0.3237794339492105, -0.3186737518430247, -0.3124889030422024, -0.305633907323426, -0.2985619230593322, -0.29157928773474867, -0.28459674412970326, -0.27746057541883656, -0.27001806003080286, -0.26206502451094765, -0.2535197639384413, -0.24439776599547, -0.23478891562129478, -0.22479198405158762, -0.21458441761716113, -0.204224007599319, -0.19352183755770655, -0.1823477616900395, -0.17056308606984039, -0.15800659447088383, -0.144490092399656, -0.13059386836964473, -0.11486250720083241, -0.09767407778541075, -0.07880671152687019, -0.057750814597527046, -0.03451609335323395, -0.008259551919859907, 0.02157318524678567, 0.052663191619272985, 0.05700803074225442], [1.0706249699232617, 1.073182339200308, 1.0773905609194874, 1.0814554042891145, 1.0824700958244153, 1.0761595547578529, 1.05691837787941, 1.0180228264450755, 0.9516874475474042, 0.8571501149162198, 0.748338836708336, 0.6394304005692025, 0.5386533879132804, 0.44953897800248965, 0.3731446665770253, 0.3091940745571206, 0.25686644617079274, 0.21523938750002952, 0.18231991149569585, 0.15609918390477662, 0.19954688628394404, 0.18418628556174427, 0.17237960978843986, 0.16327985648079985, 0.15618551158122776, 0.15052623832006912, 0.14589555521907918, 0.1421333751253961, 0.13920975950031478, 0.1370645123764535, 0.1356613564426067, 0.13482737780439577, 0.1342925477015632, 0.13348780022817203, 0.09608574599500948, 0.004735293490752312, 0.011269224011186726, 0.011612132915638184, 0.007355333967670895, 0.0012342806333620468, -0.005902130644396786, -0.014180216939501028, -0.023404202826935918, -0.03314975344415437, -0.04349940510713439, -0.055580753945670205, -0.07007949414503586, -0.08751463333461637, -0.10827483068541188, -0.13257479031278416, -0.16027529936166127, -0.19021652631312555, -0.2203613108380771, -0.24929614953313706, -0.2762238392832237, -0.3016902551888969, -0.3271617492301787, -0.3525680260310336, -0.3776147166660868, -0.4006880761280526, -0.42043145942784715, -0.4366011083787886, -0.4493496010405424, -0.4590825504511148, -0.4658938421576381, -0.4699298114852876, -0.47139133107730785, -0.4705445701692764, -0.467421296942146, -0.46205993901270287, -0.4547856498350031, -0.445970245022255, -0.4361978343363464, -0.4261155852731448, -0.41616087847962474, -0.40620609407822134, -0.39603178547391554, -0.3854199209455803, -0.3740789326560588, -0.36189218630210557, -0.3488818880694936, -0.335176447759879, -0.3209169236247602, -0.306356785355658, -0.2915786156047682, -0.27631265980863157, -0.26037314618436913, -0.24356209208156485, -0.2256494163606551, -0.20636664313310044, -0.18632447556448714, -0.16359888464572572, -0.13905297449033419, -0.11210102357324782, -0.08221034070788304, -0.04884208677404633, -0.01135041045832388, 0.03119200799199687, 0.07537671871283329, 0.0830512214669968], [1.3749932016412947, 1.3782716107533939, 1.3836775587259824, 1.3889091996370988, 1.3902273437647212, 1.3821352648300151, 1.3574170575231082, 1.3074360366342503, 1.2222336197626822, 1.1007974580931381, 0.9609743819377536, 0.8210667377902264, 0.6916059892579883, 0.5771333637446152, 0.4789993589361451, 0.39684523923889686, 0.32961540355024416, 0.2761237634095637, 0.23381158128999802, 0.20010061925031486, 0.23921678536754398, 0.21920695118649136, 0.2037010243172289, 0.19160373573609016, 0.18200525168816123, 0.17414558709864877, 0.16751677505263476, 0.1619616665603702, 0.15743181950408106, 0.15384641470788965, 0.15115631679338135, 0.1491401348477912, 0.14746294379174485, 0.14547052830538001, 0.10274248265169568, 0.01208824412735522, 0.01693435368424282, 0.015643113072945244, 0.009935423957413812, 0.002012100117673579, -0.007193808162283372, -0.01785353306597171, -0.029719892663135055, -0.042250741822717645, -0.055553718614079976, -0.07107782990277754, -0.08970433388100417, -0.1121002924580796, -0.1387654289958447, -0.16997606148528688, -0.20555636331963578, -0.24401493709784441, -0.2827358948353437, -0.3199041902866323, -0.35449577618348066, -0.38710297317077375, -0.41971118801549867, -0.45233724376750895, -0.4845018579851767, -0.5141328033070074, -0.5394883388370473, -0.5602652237786575, -0.5766494616922498, -0.5891615366841305, -0.5979218090739266, -0.6031181895600398, -0.6050086106087545, -0.6039348634910416, -0.5999377703006501, -0.5930667700273499, -0.5837393948617822, -0.572433021199897, -0.5598977164402947, -0.5469645434745904, -0.5341950859754817, -0.5214253485316536, -0.5083735920843914, -0.4947598889811253, -0.48020983603344625, -0.46457369325492026, -0.44788004197483444, -0.4302938101052345, -0.41199613501276716, -0.3933125477195809, -0.3743491327633644, -0.35475951443256104, -0.3343051950930637, -0.3127319849066004, -0.28974450806324675, -0.26499814959938744, -0.23909335994893002, -0.20995469040300943, -0.17811714905344805, -0.14361170916429639, -0.10522224494582343, -0.06237001754165336, -0.014229892140929989, 0.04035283776646136, 0.09692714076966016, 0.1079072259039267]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "fidelity": "Blade_Element_Momentum_Theory_Helmholtz_Wake", "cruise": {"design_power": 215540.6189729788, "design_thrust": 3150, "design_torque": 1121.5914561942334, "design_power_coefficient": [0.09985504896335906], "design_thrust_coefficient": [0.10265825033362035], "design_torque_coefficient": 0.005, "design_Cl": 0.7, "design_efficiency": 0.86, "design_angular_velocity": 192.17391304347828, "design_tip_mach": 0.65, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": null, "design_blade_pitch_command": 0.0, "design_freestream_velocity": 58.1152, "design_altitude": 457.20000000000005}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 0.0, 0.0], "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "electric_propulsion_fraction": 1.0, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 1.0, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "BEMT_surrogate": {"training": {"advance_ratio": [0.0, 0.2, 0.4, 0.6000000000000001, 0.8, 1.0, 1.2000000000000002, 1.4000000000000001, 1.6, 1.8, 2.0], "tip_mach": [0.2, 0.35000000000000003, 0.5, 0.6500000000000001, 0.8], "blade_pitch_command": [-0.17453292519943295, -0.08726646259971647, 0.0, 0.08726646259971647, 0.17453292519943295], "disc_angle": [0.0, 0.5235987755982988, 1.0471975511965976, 1.5707963267948966], "altitude": 0.0, "batch_size": 4}, "accuracy_samples": 10, "cache_folder": null, "surrogate": null, "accuracy": null}, "rotation": 1, "variable_pitch": true}, "electronic_speed_controller": {"tag": "propeller_esc_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[6.583, 1.3, 1.092]], "bus_voltage": 588.0, "efficiency": 0.95}, "active_crypgenic_tanks_tanks": null, "nacelle": {"tag": "propeller_nacelle", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[5.583, 1.3, 1.092]], "aerodynamic_center": [0.0, 0.0, 0.0], "areas": {"front_projected": 0.0, "side_projected": 0.0, "wetted": 0.0}, "diameter": 0.4, "inlet_diameter": 0.0, "length": 1.24, "orientation_euler_angles": [0.0, 0.0, 0.0], "flow_through": false, "has_pylon": true, "differential_pressure": 0.0, "cowling_airfoil_angle": 0.0, "segments": {"segment_1": {"tag": "segment_1", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.0, "percent_y_location": 0, "percent_z_location": 0, "height": 0.0, "width": 0.0, "curvature": 2}, "segment_2": {"tag": "segment_2", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.08064516129032259, "percent_y_location": 0, "percent_z_location": 0, "height": 0.2, "width": 0.2, "curvature": 2}, "segment_22": {"tag": "segment_22", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.12096774193548386, "percent_y_location": 0, "percent_z_location": 0, "height": 0.25, "width": 0.25, "curvature": 2}, "segment_4": {"tag": "segment_4", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.16129032258064518, "percent_y_location": 0, "percent_z_location": 0, "height": 0.3, "width": 0.3, "curvature": 2}, "segment_5": {"tag": "segment_5", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.20161290322580647, "percent_y_location": 0, "percent_z_location": 0, "height": 0.35, "width": 0.35, "curvature": 2}, "segment_6": {"tag": "segment_6", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.40322580645161293, "percent_y_location": 0, "percent_z_location": 0, "height": 0.4, "width": 0.4, "curvature": 2}, "segment_7": {"tag": "segment_7", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.6048387096774194, "percent_y_location": 0, "percent_z_location": 0, "height": 0.35, "width": 0.35, "curvature": 2}, "segment_8": {"tag": "segment_8", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 0.7903225806451613, "percent_y_location": 0, "percent_z_location": 0, "height": 0.3, "width": 0.3, "curvature": 2}, "segment_9": {"tag": "segment_9", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "orientation_euler_angles": [0.0, 0.0, 0.0], "percent_x_location": 1.0, "percent_y_location": 0, "percent_z_location": 0, "height": 0.0, "width": 0.0, "curvature": 2}}}, "sealevel_static_power": 221697.0018051931}
\ No newline at end of file
@@ -0,0 +1,106 @@
+# AVL_shards_test.py
+#
+# Created:  Oct 2026
+
+""" Checks that AVL run cases sharded across concurrent processes give the same surrogate training data
+    as the serial run. AVL is replaced by a stand-in executable that writes the result files stored for
+    the AVL regression."""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.train_AVL_surrogates import train_AVL_surrogates
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Navion    import vehicle_setup
+
+# stand-in for the AVL executable: reads the input deck from stdin until QUIT and copies the requested result
+# files from the folder of the AVL regression results
+stand_in_avl = \
+'''#!{0}
+import os, sys, shutil
+command = None
+for line in sys.stdin:
+    line = line.strip()
+    if line == 'QUIT':
+        break
+    if command in ['st','fn','fs','sb']:
+        shutil.copy(os.path.join({1!r},line),line)
+    command = line
+print('stand-in AVL, geometry ' + sys.argv[1])
+'''
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    regression_folder = os.path.abspath('avl_files_surrogate')
+
+    origin = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_folder:
+        os.chdir(work_folder)
+        try:
+            # training data read from a copy of the regression results
+            shutil.copytree(regression_folder,os.path.join(work_folder,'avl_files_reference'))
+            reference = avl_analysis(os.path.join(work_folder,'avl_files_reference'),'avl',1,False)
+            train_AVL_surrogates(reference)
+
+            avl_bin_name = os.path.join(work_folder,'stand_in_avl')
+            with open(avl_bin_name,'w') as stand_in:
+                stand_in.write(stand_in_avl.format(sys.executable,regression_folder))
+            os.chmod(avl_bin_name,0o755)
+
+            # serial run of the stand-in
+            serial = avl_analysis(os.path.join(work_folder,'avl_files_serial'),avl_bin_name,1,True)
+            train_AVL_surrogates(serial)
+
+            # run cases sharded over three concurrent stand-in processes
+            sharded = avl_analysis(os.path.join(work_folder,'avl_files_sharded'),avl_bin_name,3,True)
+            train_AVL_surrogates(sharded)
+
+            # result files are collected in the run folder and the shard folders are removed
+            run_files = os.listdir(os.path.join(work_folder,'avl_files_sharded'))
+            assert 'stability_axis_derivatives_case_0006_0006.txt' in run_files
+            assert not any(name.startswith('avl_shard_') for name in run_files)
+            with open(os.path.join(work_folder,'avl_files_sharded','avl_log.txt'),'r') as log:
+                # the log is restarted for every batch of run cases, one entry per shard
+                assert log.read().count('stand-in AVL') == 3
+        finally:
+            os.chdir(origin)
+
+    print('Max difference serial : ', np.max(np.abs(serial.training.coefficients  - reference.training.coefficients)))
+    print('Max difference sharded: ', np.max(np.abs(sharded.training.coefficients - reference.training.coefficients)))
+    assert np.array_equal(serial.training.coefficients , reference.training.coefficients)
+    assert np.array_equal(sharded.training.coefficients, reference.training.coefficients)
+    return
+
+def avl_analysis(run_folder,avl_bin_name,number_of_workers,new_regression_results):
+
+    vehicle                                          = vehicle_setup()
+    aerodynamics                                     = RCAIDE.Framework.Analyses.Aerodynamics.Athena_Vortex_Lattice()
+    aerodynamics.vehicle                             = vehicle
+    aerodynamics.settings.filenames.avl_bin_name     = avl_bin_name
+    aerodynamics.settings.filenames.run_folder       = run_folder
+    aerodynamics.settings.trim_aircraft              = False
+    aerodynamics.settings.model_fuselage             = False
+    aerodynamics.settings.print_output               = False
+    aerodynamics.settings.keep_files                 = True
+    aerodynamics.settings.new_regression_results     = new_regression_results
+    aerodynamics.settings.number_of_workers          = number_of_workers
+
+    return aerodynamics
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# VLM_hierarchical_matrix_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                     import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM
+
+import numpy as np
+import sys
+import os
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Hierarchical influence matrix matches the dense VLM
+    # ------------------------------------------------------------------
+    vehicle    = b737_setup()
+    conditions = get_conditions(np.array([0.4  ,0.4  ,0.8  ,1.4  ]),
+                                np.array([-2.  ,4.   ,2.   ,3.   ]))
+    dense      = VLM(conditions, get_settings(20, 4, False), vehicle)
+    results    = VLM(conditions, get_settings(20, 4, True), vehicle)
+    report     = results.influence_matrix
+    print(report)
+    for key in ['CLift', 'CDrag_induced', 'CM']:
+        error = np.max(np.abs(results[key] - dense[key]) / np.abs(dense[key]))
+        print(key, 'error = %.2e' % error)
+        assert error < 1e-4, key
+    assert report.residual < 1e-5
+
+    # ------------------------------------------------------------------
+    #   Compression of a synthetic wing improves with the number of panels
+    # ------------------------------------------------------------------
+    conditions  = get_conditions(np.array([0.3,0.6]), np.array([2.,4.]))
+    compression = []
+    for n_sw, n_cw in [(48, 4), (96, 8)]:
+        dense   = VLM(conditions, get_settings(n_sw, n_cw, False, fuselage=False), synthetic_wing())
+        results = VLM(conditions, get_settings(n_sw, n_cw, True, fuselage=False), synthetic_wing())
+        for key in ['CLift', 'CDrag_induced']:
+            error = np.max(np.abs(results[key] - dense[key]) / np.abs(dense[key]))
+            print(results.VD.n_cp, key, 'error = %.2e' % error)
+            assert error < 1e-4, key
+        compression.append(results.influence_matrix.compression)
+    print('compression', compression)
+    assert compression[1] < 0.7 * compression[0]
+    assert compression[1] < 0.35
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def get_settings(n_sw, n_cw, hierarchical, fuselage=True):
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices       = n_sw
+    settings.number_of_chordwise_vortices      = n_cw
+    settings.model_fuselage                    = fuselage
+    settings.propeller_wake_model              = False
+    settings.use_hierarchical_influence_matrix = hierarchical
+    return settings
+
+def get_conditions(machs, aoas):
+    altitudes  = np.ones_like(machs) * 5000 * Units.ft
+
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    atmosphere                              =  RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    speeds_of_sound                         = atmosphere.compute_values(altitudes).speed_of_sound
+    v_infs                                  = machs * speeds_of_sound.flatten()
+    conditions.freestream.velocity          = np.atleast_2d(v_infs).T
+    conditions.freestream.mach_number       = np.atleast_2d(machs).T
+    conditions.aerodynamics.angles.alpha    = np.atleast_2d(aoas * Units.degrees).T
+
+    return conditions
+
+def synthetic_wing():
+    vehicle                          = RCAIDE.Vehicle()
+    wing                             = RCAIDE.Library.Components.Wings.Main_Wing()
+    wing.tag                         = 'main_wing'
+    wing.areas.reference             = 67.5
+    wing.aspect_ratio                = 30.**2 / wing.areas.reference
+    wing.taper                       = 0.5
+    wing.sweeps.quarter_chord        = 20. * Units.degrees
+    wing.twists.root                 = 2.  * Units.degrees
+    wing.twists.tip                  = 0.
+    wing.dihedral                    = 3.  * Units.degrees
+    wing.thickness_to_chord          = 0.12
+    wing.origin                      = [[10.,0,0]]
+    wing.symmetric                   = True
+    RCAIDE.Library.Methods.Geometry.Planform.wing_planform(wing)
+    vehicle.append_component(wing)
+    vehicle.reference_area           = wing.areas.reference
+
+    return vehicle
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
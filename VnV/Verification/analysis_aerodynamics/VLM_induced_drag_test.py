@@ -0,0 +1,155 @@
+# VLM_induced_drag_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Core                                      import Data, Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM import compute_induced_drag
+
+from scipy.integrate import trapezoid
+from copy import deepcopy
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Dense panelization of a wing, a horizontal tail and a fin
+    # ------------------------------------------------------------------
+    n_sw      = np.array([120, 120, 40, 40, 30, 1])
+    n_cases   = 8
+    inputs    = strip_distribution(n_sw, n_cases)
+
+    ti        = time.time()
+    results   = compute_induced_drag(*inputs)
+    run_time  = time.time() - ti
+
+    ti        = time.time()
+    reference = reference_induced_drag(*inputs)
+    loop_time = time.time() - ti
+
+    print('Vectorized Trefftz plane = %.3f s' % run_time)
+    print('Control point loop       = %.3f s' % loop_time)
+
+    # ------------------------------------------------------------------
+    #   Check Results
+    # ------------------------------------------------------------------
+    for key in ['CDrag_induced', 'sectional_CDrag_induced', 'CDrag_induced_wing', 'alpha_induced']:
+        assert results[key].dtype == reference[key].dtype, key
+        assert np.array_equal(results[key], reference[key]), key
+    assert np.all(results.CDrag_induced > 0.)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def strip_distribution(n_sw, n_cases):
+    """Strip leading edge locations, chords and lift of a set of wings, with single precision coordinates."""
+    rng    = np.random.default_rng(0)
+    spans  = [17., -17., 6., -6., 5., 1.]
+    x, y, z, chord = [], [], [], []
+    for n, span in zip(n_sw, spans):
+        eta = np.linspace(0., 1., n, endpoint=False) + 0.5 / n
+        x.append(5. + 8. * eta * abs(span) / 17.)
+        if span == 5.:
+            y.append(np.zeros(n))
+            z.append(eta * span)
+        else:
+            y.append(eta * span)
+            z.append(0.05 * np.abs(eta * span))
+        chord.append(4. * (1. - 0.6 * eta))
+    x, y, z = [np.concatenate(v).astype(np.float32) for v in (x, y, z)]
+    chord   = np.tile(np.concatenate(chord).astype(np.float32), (n_cases, 1))
+
+    alpha = np.linspace(-2., 10., n_cases)[:, None] * Units.degrees
+    eta   = np.abs(y) / 17.
+    cl    = (0.3 + 5. * alpha) * np.sqrt(np.clip(1. - eta**2, 0., None))[None, :] * (1. + 0.01 * rng.random((n_cases, len(y))))
+    SURF  = np.array([60., 60., 15., 15., 12., 1.])
+    SREF  = 125.
+    return cl, alpha, x, y, z, chord, SURF, n_sw, SREF
+
+def reference_induced_drag(cl, alpha, x_dist, y_dist, z_dist, chord_dist, SURF, n_sw, SREF, v_inf=1):
+    """Trefftz plane induced drag evaluated one control point at a time."""
+    n_cases = len(alpha)
+    n_wings = len(n_sw)
+    rho     = 1
+
+    CDi_wing          = np.zeros((n_cases, n_wings))
+    D_induced         = np.zeros((n_cases, n_wings))
+    Cd_i_distribution = np.zeros_like(cl)
+    alpha_i           = np.zeros_like(cl)
+    circulation_dist  = 0.5 * chord_dist * v_inf * cl
+
+    wing_span_index = 0
+    for wing_index, wing_segments in enumerate(n_sw):
+        i0 = wing_span_index
+        wing_span_index += wing_segments
+        circulation_segments = circulation_dist[:, i0:wing_span_index]
+        cl_segments          = cl[:, i0:wing_span_index]
+
+        y_control_points = np.tile(y_dist[i0:wing_span_index][None, :], (n_cases, 1))
+        z_control_points = np.tile(z_dist[i0:wing_span_index][None, :], (n_cases, 1))
+        x_control_points = np.tile(x_dist[i0:wing_span_index][None, :], (n_cases, 1))
+        y_centerpoints   = (y_control_points[:, :-1] + y_control_points[:, 1:]) / 2
+        z_centerpoints   = (z_control_points[:, :-1] + z_control_points[:, 1:]) / 2
+        x_centerpoints   = (x_control_points[:, :-1] + x_control_points[:, 1:]) / 2
+
+        direction            = np.sign(np.diff(y_control_points, axis=1)) * np.ones_like(y_centerpoints)
+        shed_vortex_segments = direction * np.diff(circulation_segments, axis=1)
+
+        TP_y_centerpoints   = y_centerpoints
+        TP_z_centerpoints   = np.cos(alpha) * z_centerpoints - np.sin(alpha) * x_centerpoints
+        TP_y_control_points = y_control_points
+        TP_z_control_points = np.cos(alpha) * z_control_points - np.sin(alpha) * x_control_points
+
+        n_mid     = len(TP_y_centerpoints[0])
+        V_induced = np.zeros_like(y_control_points)
+        for j in range(len(y_control_points[0])):
+            A = (np.tile(TP_y_control_points[:, j][:, None], (1, n_mid)) - TP_y_centerpoints)**2
+            B = (np.tile(TP_z_control_points[:, j][:, None], (1, n_mid)) - TP_z_centerpoints)**2
+            r = (A + B) ** (0.5)
+            if len(TP_y_control_points[0]) < 2:
+                V_induced[:, j] = 0
+            else:
+                slope      = np.gradient(TP_z_control_points, TP_y_control_points[0], axis=1)
+                n_hat      = np.zeros((n_cases, 2))
+                n_hat[:, 0] = np.cos(np.arctan2(-1, slope[:, j]))
+                n_hat[:, 1] = np.sin(np.arctan2(-1, slope[:, j]))
+                v_hat         = np.zeros((n_cases, 2, n_mid))
+                v_hat[:, 0, :] = -1*(np.tile(TP_z_control_points[:, j][:, None], (1, n_mid)) - TP_z_centerpoints)/r
+                v_hat[:, 1, :] =    (np.tile(TP_y_control_points[:, j][:, None], (1, n_mid)) - TP_y_centerpoints)/r
+                v = v_hat * np.tile(shed_vortex_segments[:, None, :], (1, 2, 1)) / (2*np.pi*np.tile(r[:, None, :], (1, 2, 1)))
+                V_induced[:, j] = np.sum(np.tile(n_hat[:, 0][:, None], (1, n_mid))*v[:, 0, :] + np.tile(n_hat[:, 1][:, None], (1, n_mid))*v[:, 1, :], axis=1)
+
+        drag_sum = np.sqrt(np.square(y_control_points[:, 0]) + np.square(z_control_points[:, 0]))
+        s_wake   = np.atleast_2d(deepcopy(drag_sum)).T
+        for j in range(1, len(y_control_points[0])):
+            drag_sum += np.sqrt(np.square(y_control_points[:, j] - y_control_points[:, j-1]) + np.square(z_control_points[:, j] - z_control_points[:, j-1]))
+            s_wake    = np.hstack((s_wake, np.atleast_2d(drag_sum).T))
+        D_induced[:, wing_index] = -0.5 * rho * trapezoid(V_induced * circulation_segments, s_wake, axis=1)
+        CDi_wing[:, wing_index]  = D_induced[:, wing_index] / (0.5 * rho * v_inf**2 * SURF[wing_index])
+
+        alpha_i_case = np.arctan(V_induced / v_inf)
+        Cd_i_distribution[:, i0:wing_span_index] = cl_segments * np.sin(-alpha_i_case)
+        alpha_i[:, i0:wing_span_index]           = alpha_i_case
+
+    CDi_total = np.sum(D_induced, axis=1) / (0.5 * rho * v_inf**2 * SREF)
+
+    results                         = Data()
+    results.CDrag_induced           = CDi_total[:, np.newaxis]
+    results.sectional_CDrag_induced = Cd_i_distribution
+    results.CDrag_induced_wing      = CDi_wing
+    results.alpha_induced           = alpha_i
+    return results
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# VLM_influence_matrix_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                     import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM, compute_wing_induced_velocity, generate_vortex_distribution
+
+import numpy as np
+import sys
+import os
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    vehicle    = b737_setup()
+    conditions = get_conditions()
+
+    # ------------------------------------------------------------------
+    #   Blocks of control points match the full induced velocities
+    # ------------------------------------------------------------------
+    settings = get_settings(None, np.float64)
+    VD       = generate_vortex_distribution(vehicle, settings)
+    mach     = np.atleast_2d(np.unique(conditions.freestream.mach_number)).T
+    C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD, mach, compute_EW=True)
+    for start in range(0, VD.n_cp, 150):
+        rows = slice(start, min(start + 150, VD.n_cp))
+        C_mn_rows, s_rows, RFLAG_rows, EW_rows = compute_wing_induced_velocity(VD, mach, compute_EW=True, rows=rows)
+        assert np.array_equal(C_mn_rows, C_mn[:, rows])
+        assert np.array_equal(EW_rows, EW[:, rows])
+        assert np.array_equal(RFLAG_rows, RFLAG)
+
+    # ------------------------------------------------------------------
+    #   Blocked influence matrix in double and single precision
+    # ------------------------------------------------------------------
+    dense = VLM(conditions, get_settings(None, np.float64), vehicle)
+    for precision, tolerance in [(np.float64, 1e-12), (np.float32, 1e-6)]:
+        results = VLM(conditions, get_settings(128, precision), vehicle)
+        report  = results.influence_matrix
+        print(report)
+        for key in ['CLift', 'CDrag_induced', 'CM']:
+            error = np.max(np.abs(results[key] - dense[key]) / np.abs(dense[key]))
+            print(key, precision.__name__, 'error = %.2e' % error)
+            assert error < tolerance, key
+        assert report.residual < 1e-12
+        assert report.matrix_memory + report.block_memory < report.dense_memory / 2.
+
+    assert results.influence_matrix.matrix_memory == VD.n_cp**2 * 4 * len(mach)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def get_settings(block_size, precision):
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 20
+    settings.number_of_chordwise_vortices = 4
+    settings.model_fuselage               = True
+    settings.propeller_wake_model         = False
+    settings.influence_matrix_block_size  = block_size
+    settings.influence_matrix_precision   = precision
+    return settings
+
+def get_conditions():
+    machs      = np.array([0.4  ,0.4  ,0.8  ,1.4  ])
+    altitudes  = np.array([5000 ,5000 ,5000 ,5000 ])  *Units.ft
+    aoas       = np.array([-2.  ,4.   ,2.   ,3.   ])  *Units.degrees
+
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    atmosphere                              =  RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    speeds_of_sound                         = atmosphere.compute_values(altitudes).speed_of_sound
+    v_infs                                  = machs * speeds_of_sound.flatten()
+    conditions.freestream.velocity          = np.atleast_2d(v_infs).T
+    conditions.freestream.mach_number       = np.atleast_2d(machs).T
+    conditions.aerodynamics.angles.alpha    = np.atleast_2d(aoas).T
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
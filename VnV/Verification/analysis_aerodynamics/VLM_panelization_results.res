@@ -0,0 +1 @@
+{"float64": {"XA1": [13.619581191181702, 16.196483077110734, 18.773873808424206, 16.053501313234932, 17.304181369048862, 18.55500305772909, 17.56431231418622, 18.469660627567173, 19.374982096107107, 19.61413956288242, 20.335751504277, 21.057349378969647, 20.892613598804616, 21.62103272942059, 22.34944319848683, 22.056367306732838, 22.65961367156541, 23.262856007235115, 22.874369920285766, 23.389632772594553, 23.904894070984483, 23.220659576198017, 23.7897272607241, 24.358793701617834, 13.619581191181702, 16.196483077110734, 18.773873808424206, 16.053501313234932, 17.304181369048862, 18.55500305772909, 17.56431231418622, 18.469660627567173, 19.374982096107107, 19.61413956288242, 20.335751504277, 21.057349378969647, 20.892613598804616, 21.62103272942059, 22.34944319848683, 22.056367306732838, 22.65961367156541, 23.262856007235115, 22.874369920285766, 23.389632772594553, 23.904894070984483, 23.220659576198017, 23.7897272607241, 24.358793701617834, 33.02, 34.44436666666667, 35.86873333333334, 33.431918375068655, 34.36914865056532, 35.30637892606198, 34.77149264028357, 35.51416521007299, 36.25683777986241, 35.562773195799394, 36.19052139487674, 36.818269593954085, 36.25633640340428, 36.78335254906844, 37.310368694732595, 36.82552901798471, 37.26987650385604, 37.71422398972737, 37.23072116736841, 37.78143259790174, 38.332144028435074, 37.50892754438831, 38.001915737417164, 38.49490393044603, 33.02, 34.44436666666667, 35.86873333333334, 33.431918375068655, 34.36914865056532, 35.30637892606198, 34.77149264028357, 35.51416521007299, 36.25683777986241, 35.562773195799394, 36.19052139487674, 36.818269593954085, 36.25633640340428, 36.78335254906844, 37.310368694732595, 36.82552901798471, 37.26987650385604, 37.71422398972737, 37.23072116736841, 37.78143259790174, 38.332144028435074, 37.50892754438831, 38.001915737417164, 38.49490393044603, 26.944, 30.310666666666666, 33.67733333333333, 30.849890234909953, 32.99696795401912, 35.14404567312829, 32.87420030734628, 34.38920030734627, 35.90420030734627, 34.491336476962495, 35.59479230079726, 36.698248124632016, 35.43614510132394, 36.29915705020727, 37.162168999090596, 36.21152950072938, 36.87721426105541, 37.54289902138144, 36.78769208755024, 37.306749518907004, 37.82580695026376, 37.142491256690704, 37.571256024688964, 38.00002079268721, 19.805747300951595, 20.60996390204641, 19.805747300951595, 20.60996390204641, 20.280301034500404, 20.862299372926312, 21.778945927864964, 22.24283340195841, 20.280301034500404, 20.862299372926312, 21.778945927864964, 22.24283340195841, 23.077855093564143, 23.285973047758617, 23.86609900625388, 24.038454274376026, 24.420155625206867, 24.567373260546365, 23.077855093564143, 23.285973047758617, 23.86609900625388, 24.038454274376026, 24.420155625206867, 24.567373260546365, 36.24360920155864, 36.84611437866364, 36.99951034965182, 37.47694271594502, 37.44601779303142, 37.849570206724, 37.83738484039674, 38.17618093403798, 38.15857147559869, 38.444223430801685, 36.24360920155864, 36.84611437866364, 36.99951034965182, 37.47694271594502, 37.44601779303142, 37.849570206724, 37.83738484039674, 38.17618093403798, 38.15857147559869, 38.444223430801685, 0.0, 12.673333333333334, 25.346666666666668, 0.34512450996679256, 12.732029897884512, 25.11893528580223, 0.972571405451605, 12.862820421459311, 24.75306943746702, 1.7686602746214488, 13.043092007811946, 24.317523741002443, 2.6724030908457856, 13.25934035349559, 23.846277616145397, 3.628913889583082, 13.498849905014632, 23.368785920446182, 4.581310062588646, 13.747953697847313, 22.91459733310598, 5.46419861279665, 13.990424377339574, 22.516650141882497, 0.0, 12.673333333333334, 25.346666666666668, 0.34512450996679256, 12.732029897884512, 25.11893528580223, 0.972571405451605, 12.862820421459311, 24.75306943746702, 1.7686602746214488, 13.043092007811946, 24.317523741002443, 2.6724030908457856, 13.25934035349559, 23.846277616145397, 3.628913889583082, 13.498849905014632, 23.368785920446182, 4.581310062588646, 13.747953697847313, 22.91459733310598, 5.46419861279665, 13.990424377339574, 22.516650141882497], "YA1": [0.0, 0.0, 0.0, 3.4320000000000004, 3.4320000000000004, 3.4320000000000004, 5.55984, 5.55984, 5.55984, 9.533585198616375, 9.533585198616375, 9.533585198616375, 12.011999999999999, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, 16.52508, 0.0, 0.0, 0.0, -3.4320000000000004, -3.4320000000000004, -3.4320000000000004, -5.55984, -5.55984, -5.55984, -9.533585198616375, -9.533585198616375, -9.533585198616375, -12.011999999999999, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, -16.52508, 0.0, 0.0, 0.0, 0.648, 0.648, 0.648, 2.755320713028647, 2.755320713028647, 2.755320713028647, 4.000105677741137, 4.000105677741137, 4.000105677741137, 5.091168824543143, 5.091168824543143, 5.091168824543143, 5.986581208578325, 5.986581208578325, 5.986581208578325, 6.6240000000000006, 6.6240000000000006, 6.6240000000000006, 7.061654018903259, 7.061654018903259, 7.061654018903259, 0.0, 0.0, 0.0, -0.648, -0.648, -0.648, -2.755320713028647, -2.755320713028647, -2.755320713028647, -4.000105677741137, -4.000105677741137, -4.000105677741137, -5.091168824543143, -5.091168824543143, -5.091168824543143, -5.986581208578325, -5.986581208578325, -5.986581208578325, -6.6240000000000006, -6.6240000000000006, -6.6240000000000006, -7.061654018903259, -7.061654018903259, -7.061654018903259, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 3.4320000000000004, 3.4320000000000004, -3.4320000000000004, -3.4320000000000004, 5.5598399999999994, 5.5598399999999994, 9.533585198616374, 9.533585198616374, -5.5598399999999994, -5.5598399999999994, -9.533585198616374, -9.533585198616374, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, 0.6479999999999999, 0.6479999999999999, 2.7553207130286466, 2.7553207130286466, 4.000105677741136, 4.000105677741136, 5.091168824543142, 5.091168824543142, 5.9865812085783245, 5.9865812085783245, -0.6479999999999999, -0.6479999999999999, -2.7553207130286466, -2.7553207130286466, -4.000105677741136, -4.000105677741136, -5.091168824543142, -5.091168824543142, -5.9865812085783245, -5.9865812085783245, 1.1450447572027753e-16, 1.1450447572027753e-16, 1.1450447572027753e-16, 0.3436115983169869, 0.3436115983169869, 0.3436115983169869, 0.6755219157699762, 0.6755219157699762, 0.6755219157699762, 0.9844281445806554, 0.9844281445806554, 0.9844281445806554, 1.259810853619062, 1.259810853619062, 1.259810853619062, 1.492292215014048, 1.492292215014048, 1.492292215014048, 1.6739553548339667, 1.6739553548339667, 1.6739553548339667, 1.7986139527331717, 1.7986139527331717, 1.7986139527331717, -1.1450447572027753e-16, -1.1450447572027753e-16, -1.1450447572027753e-16, -0.3436115983169869, -0.3436115983169869, -0.3436115983169869, -0.6755219157699762, -0.6755219157699762, -0.6755219157699762, -0.9844281445806554, -0.9844281445806554, -0.9844281445806554, -1.259810853619062, -1.259810853619062, -1.259810853619062, -1.492292215014048, -1.492292215014048, -1.492292215014048, -1.6739553548339667, -1.6739553548339667, -1.6739553548339667, -1.7986139527331717, -1.7986139527331717, -1.7986139527331717], "ZA1": [-0.36298258256871263, -0.5929538433862225, -0.8159342895097743, -0.25523143167056594, -0.3140925841979749, -0.36775310684769447, -0.22310815476182433, -0.20529412667036467, -0.22007170631653217, 0.15259077659815568, 0.16699322955886353, 0.15541824485049593, 0.3869132448913605, 0.3979485418462295, 0.385286298308543, 0.6002091917310375, 0.6094448274015942, 0.599055098925787, 0.7501347982806172, 0.7580814507469964, 0.7492650701242511, 0.79858037967804, 0.8211718497200857, 0.8161451473604036, -0.36298258256871263, -0.5929538433862225, -0.8159342895097743, -0.25523143167056594, -0.3140925841979749, -0.36775310684769447, -0.22310815476182433, -0.20529412667036467, -0.22007170631653217, 0.15259077659815568, 0.16699322955886353, 0.15541824485049593, 0.3869132448913605, 0.3979485418462295, 0.385286298308543, 0.6002091917310375, 0.6094448274015942, 0.599055098925787, 0.7501347982806172, 0.7580814507469964, 0.7492650701242511, 0.79858037967804, 0.8211718497200857, 0.8161451473604036, 1.466, 1.466, 1.466, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 1.466, 1.466, 1.466, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 1.54, 1.54, 1.54, 3.165102382394349, 3.165102382394349, 3.165102382394349, 4.007346, 4.007346, 4.007346, 6.167900041053287, 6.167900041053287, 6.167900041053287, 7.430199487283941, 7.430199487283941, 7.430199487283941, 8.466141870480202, 8.466141870480202, 8.466141870480202, 9.235916505819018, 9.235916505819018, 9.235916505819018, 9.70994138575891, 9.70994138575891, 9.70994138575891, -0.42425735618209703, -0.4544593261063308, -0.42425735618209703, -0.4544593261063308, -0.2379210697229908, -0.24017803157521647, 0.1413948669297335, 0.1397268333078602, -0.2379210697229908, -0.24017803157521647, 0.1413948669297335, 0.1397268333078602, 0.3765255453911659, 0.374760868736551, 0.591896430405812, 0.5904626065300711, 0.7432085040225828, 0.7420003787023662, 0.3765255453911659, 0.374760868736551, 0.591896430405812, 0.5904626065300711, 0.7432085040225828, 0.7420003787023662, 1.5643478659448828, 1.5643478659448828, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 1.5643478659448828, 1.5643478659448828, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XA2": [16.196483077110734, 18.773873808424206, 21.351097030016234, 17.304181369048862, 18.55500305772909, 19.805747300951595, 18.469660627567173, 19.374982096107107, 20.280301034500408, 20.335751504277, 21.057349378969647, 21.778945927864967, 21.62103272942059, 22.34944319848683, 23.077855093564143, 22.65961367156541, 23.262856007235115, 23.86609900625388, 23.389632772594553, 23.904894070984483, 24.420155625206867, 23.7897272607241, 24.358793701617834, 24.927859761144084, 16.196483077110734, 18.773873808424206, 21.351097030016234, 17.304181369048862, 18.55500305772909, 19.805747300951595, 18.469660627567173, 19.374982096107107, 20.280301034500408, 20.335751504277, 21.057349378969647, 21.778945927864967, 21.62103272942059, 22.34944319848683, 23.077855093564143, 22.65961367156541, 23.262856007235115, 23.86609900625388, 23.389632772594553, 23.904894070984483, 24.420155625206867, 23.7897272607241, 24.358793701617834, 24.927859761144084, 34.44436666666667, 35.86873333333334, 37.2931, 34.36914865056532, 35.30637892606198, 36.243609201558655, 35.51416521007299, 36.25683777986241, 36.99951034965183, 36.19052139487674, 36.818269593954085, 37.44601779303143, 36.78335254906844, 37.310368694732595, 37.83738484039675, 37.26987650385604, 37.71422398972737, 38.1585714755987, 37.78143259790174, 38.332144028435074, 38.88285545896841, 38.001915737417164, 38.49490393044603, 38.987892123474886, 34.44436666666667, 35.86873333333334, 37.2931, 34.36914865056532, 35.30637892606198, 36.243609201558655, 35.51416521007299, 36.25683777986241, 36.99951034965183, 36.19052139487674, 36.818269593954085, 37.44601779303143, 36.78335254906844, 37.310368694732595, 37.83738484039675, 37.26987650385604, 37.71422398972737, 38.1585714755987, 37.78143259790174, 38.332144028435074, 38.88285545896841, 38.001915737417164, 38.49490393044603, 38.987892123474886, 30.310666666666666, 33.67733333333333, 37.044, 32.99696795401912, 35.14404567312829, 37.29112339223746, 34.38920030734627, 35.90420030734627, 37.41920030734627, 35.59479230079726, 36.698248124632016, 37.80170394846678, 36.29915705020727, 37.162168999090596, 38.02518094797393, 36.87721426105541, 37.54289902138144, 38.20858378170747, 37.306749518907004, 37.82580695026376, 38.344864381620525, 37.571256024688964, 38.00002079268721, 38.42878556068546, 20.60996390204641, 21.413866012709892, 20.60996390204641, 21.413866012709892, 20.862299372926312, 21.444282874521637, 22.24283340195841, 22.706713101549735, 20.862299372926312, 21.444282874521637, 22.24283340195841, 22.706713101549735, 23.285973047758617, 23.494087373650782, 24.038454274376026, 24.210807854691556, 24.567373260546365, 24.714590244952998, 23.285973047758617, 23.494087373650782, 24.038454274376026, 24.210807854691556, 24.567373260546365, 24.714590244952998, 36.84611437866364, 37.448619555768644, 37.47694271594502, 37.95437508223822, 37.849570206724, 38.25312262041658, 38.17618093403798, 38.51497702767922, 38.444223430801685, 38.729875386004686, 36.84611437866364, 37.448619555768644, 37.47694271594502, 37.95437508223822, 37.849570206724, 38.25312262041658, 38.17618093403798, 38.51497702767922, 38.444223430801685, 38.729875386004686, 12.673333333333334, 25.346666666666668, 38.02, 12.732029897884512, 25.11893528580223, 37.50584067371995, 12.862820421459311, 24.75306943746702, 36.64331845347473, 13.043092007811946, 24.317523741002443, 35.59195547419294, 13.25934035349559, 23.846277616145393, 34.4332148787952, 13.498849905014632, 23.368785920446182, 33.238721935877734, 13.747953697847313, 22.91459733310598, 32.08124096836465, 13.990424377339574, 22.516650141882497, 31.042875906425422, 12.673333333333334, 25.346666666666668, 38.02, 12.732029897884512, 25.11893528580223, 37.50584067371995, 12.862820421459311, 24.75306943746702, 36.64331845347473, 13.043092007811946, 24.317523741002443, 35.59195547419294, 13.25934035349559, 23.846277616145393, 34.4332148787952, 13.498849905014632, 23.368785920446182, 33.238721935877734, 13.747953697847313, 22.91459733310598, 32.08124096836465, 13.990424377339574, 22.516650141882497, 31.042875906425422], "YA2": [0.0, 0.0, 0.0, 3.4320000000000004, 3.4320000000000004, 3.4320000000000004, 5.55984, 5.55984, 5.55984, 9.533585198616375, 9.533585198616375, 9.533585198616375, 12.011999999999999, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, 16.52508, 0.0, 0.0, 0.0, -3.4320000000000004, -3.4320000000000004, -3.4320000000000004, -5.55984, -5.55984, -5.55984, -9.533585198616375, -9.533585198616375, -9.533585198616375, -12.011999999999999, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, -16.52508, 0.0, 0.0, 0.0, 0.648, 0.648, 0.648, 2.755320713028647, 2.755320713028647, 2.755320713028647, 4.000105677741137, 4.000105677741137, 4.000105677741137, 5.091168824543143, 5.091168824543143, 5.091168824543143, 5.986581208578325, 5.986581208578325, 5.986581208578325, 6.6240000000000006, 6.6240000000000006, 6.6240000000000006, 7.061654018903259, 7.061654018903259, 7.061654018903259, 0.0, 0.0, 0.0, -0.648, -0.648, -0.648, -2.755320713028647, -2.755320713028647, -2.755320713028647, -4.000105677741137, -4.000105677741137, -4.000105677741137, -5.091168824543143, -5.091168824543143, -5.091168824543143, -5.986581208578325, -5.986581208578325, -5.986581208578325, -6.6240000000000006, -6.6240000000000006, -6.6240000000000006, -7.061654018903259, -7.061654018903259, -7.061654018903259, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 3.4320000000000004, 3.4320000000000004, -3.4320000000000004, -3.4320000000000004, 5.5598399999999994, 5.5598399999999994, 9.533585198616374, 9.533585198616374, -5.5598399999999994, -5.5598399999999994, -9.533585198616374, -9.533585198616374, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, 0.6479999999999999, 0.6479999999999999, 2.7553207130286466, 2.7553207130286466, 4.000105677741136, 4.000105677741136, 5.091168824543142, 5.091168824543142, 5.9865812085783245, 5.9865812085783245, -0.6479999999999999, -0.6479999999999999, -2.7553207130286466, -2.7553207130286466, -4.000105677741136, -4.000105677741136, -5.091168824543142, -5.091168824543142, -5.9865812085783245, -5.9865812085783245, 1.1450447572027753e-16, 1.1450447572027753e-16, 1.1450447572027753e-16, 0.3436115983169869, 0.3436115983169869, 0.3436115983169869, 0.6755219157699762, 0.6755219157699762, 0.6755219157699762, 0.9844281445806554, 0.9844281445806554, 0.9844281445806554, 1.259810853619062, 1.259810853619062, 1.259810853619062, 1.492292215014048, 1.492292215014048, 1.492292215014048, 1.6739553548339667, 1.6739553548339667, 1.6739553548339667, 1.7986139527331717, 1.7986139527331717, 1.7986139527331717, -1.1450447572027753e-16, -1.1450447572027753e-16, -1.1450447572027753e-16, -0.3436115983169869, -0.3436115983169869, -0.3436115983169869, -0.6755219157699762, -0.6755219157699762, -0.6755219157699762, -0.9844281445806554, -0.9844281445806554, -0.9844281445806554, -1.259810853619062, -1.259810853619062, -1.259810853619062, -1.492292215014048, -1.492292215014048, -1.492292215014048, -1.6739553548339667, -1.6739553548339667, -1.6739553548339667, -1.7986139527331717, -1.7986139527331717, -1.7986139527331717], "ZA2": [-0.5929538433862225, -0.8159342895097743, -1.0413102362544122, -0.3140925841979749, -0.36775310684769447, -0.42425735618209703, -0.20529412667036467, -0.22007170631653217, -0.23792106972299087, 0.16699322955886353, 0.15541824485049593, 0.14139486692973346, 0.3979485418462295, 0.385286298308543, 0.3765255453911658, 0.6094448274015942, 0.599055098925787, 0.5918964304058121, 0.7580814507469964, 0.7492650701242511, 0.7432085040225826, 0.8211718497200857, 0.8161451473604036, 0.8026491630246806, -0.5929538433862225, -0.8159342895097743, -1.0413102362544122, -0.3140925841979749, -0.36775310684769447, -0.42425735618209703, -0.20529412667036467, -0.22007170631653217, -0.23792106972299087, 0.16699322955886353, 0.15541824485049593, 0.14139486692973346, 0.3979485418462295, 0.385286298308543, 0.3765255453911658, 0.6094448274015942, 0.599055098925787, 0.5918964304058121, 0.7580814507469964, 0.7492650701242511, 0.7432085040225826, 0.8211718497200857, 0.8161451473604036, 0.8026491630246806, 1.466, 1.466, 1.466, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 1.466, 1.466, 1.466, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 1.54, 1.54, 1.54, 3.165102382394349, 3.165102382394349, 3.165102382394349, 4.007346, 4.007346, 4.007346, 6.167900041053287, 6.167900041053287, 6.167900041053287, 7.430199487283941, 7.430199487283941, 7.430199487283941, 8.466141870480202, 8.466141870480202, 8.466141870480202, 9.235916505819018, 9.235916505819018, 9.235916505819018, 9.70994138575891, 9.70994138575891, 9.70994138575891, -0.4544593261063308, -0.49620909828989856, -0.4544593261063308, -0.49620909828989856, -0.24017803157521647, -0.26044799496568133, 0.1397268333078602, 0.12370137281525481, -0.24017803157521647, -0.26044799496568133, 0.1397268333078602, 0.12370137281525481, 0.374760868736551, 0.3630693494825779, 0.5904626065300711, 0.5808077649121204, 0.7420003787023662, 0.7337702592213697, 0.374760868736551, 0.3630693494825779, 0.5904626065300711, 0.5808077649121204, 0.7420003787023662, 0.7337702592213697, 1.5643478659448828, 1.5643478659448828, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 1.5643478659448828, 1.5643478659448828, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XB1": [16.053501313234932, 17.840216680143484, 19.627063944718586, 17.564340757267118, 18.469659015569384, 19.374980372994855, 19.61413956288242, 20.335751504277, 21.057349378969647, 20.892613598804616, 21.499630647028674, 22.10663970818468, 22.056367306732838, 22.65961367156541, 23.262856007235115, 22.874369920285766, 23.389632772594553, 23.904894070984483, 23.220660252692326, 23.6986765861705, 24.17669221938128, 24.420379715096704, 24.681038115096705, 24.9416965150967, 16.053501313234932, 17.840216680143484, 19.627063944718586, 17.564340757267118, 18.469659015569384, 19.374980372994855, 19.61413956288242, 20.335751504277, 21.057349378969647, 20.892613598804616, 21.499630647028674, 22.10663970818468, 22.056367306732838, 22.65961367156541, 23.262856007235115, 22.874369920285766, 23.389632772594553, 23.904894070984483, 23.220660252692326, 23.6986765861705, 24.17669221938128, 24.420379715096704, 24.681038115096705, 24.9416965150967, 33.431918375068655, 34.770818768635316, 36.10971916220198, 34.77149264028357, 35.51416521007299, 36.25683777986241, 35.562773195799394, 36.19052139487674, 36.818269593954085, 36.25633640340428, 36.78335254906844, 37.310368694732595, 36.82552901798471, 37.26987650385604, 37.71422398972737, 37.23072116736841, 37.61621916874174, 38.00171717011508, 37.50892754438831, 38.001915737417164, 38.49490393044603, 37.596870834096094, 38.071612244096094, 38.546353654096094, 33.431918375068655, 34.770818768635316, 36.10971916220198, 34.77149264028357, 35.51416521007299, 36.25683777986241, 35.562773195799394, 36.19052139487674, 36.818269593954085, 36.25633640340428, 36.78335254906844, 37.310368694732595, 36.82552901798471, 37.26987650385604, 37.71422398972737, 37.23072116736841, 37.61621916874174, 38.00171717011508, 37.50892754438831, 38.001915737417164, 38.49490393044603, 37.596870834096094, 38.071612244096094, 38.546353654096094, 30.849890234909953, 32.99696795401912, 35.14404567312829, 32.87420030734628, 34.38920030734627, 35.90420030734627, 34.491336476962495, 35.59479230079726, 36.698248124632016, 35.43614510132394, 36.29915705020727, 37.162168999090596, 36.21152950072938, 36.87721426105541, 37.54289902138144, 36.78769208755024, 37.306749518907004, 37.82580695026376, 37.142491256690704, 37.571256024688964, 38.00002079268721, 37.26229227505438, 37.66056894172104, 38.058845608387706, 20.280300035806487, 20.862294895907084, 20.280300035806487, 20.862294895907084, 21.778945927864964, 22.24283340195841, 22.71364801655346, 23.103869902281804, 21.778945927864964, 22.24283340195841, 22.71364801655346, 23.103869902281804, 23.86609900625388, 24.038454274376026, 24.420155625206867, 24.567373260546365, 24.654707967881944, 24.791283917844737, 23.86609900625388, 24.038454274376026, 24.420155625206867, 24.567373260546365, 24.654707967881944, 24.791283917844737, 36.99951034965182, 37.47694271594502, 37.44601779303142, 37.849570206724, 37.83738484039674, 38.17618093403798, 38.15857147559869, 38.444223430801685, 38.3872151714884, 38.6350353152284, 36.99951034965182, 37.47694271594502, 37.44601779303142, 37.849570206724, 37.83738484039674, 38.17618093403798, 38.15857147559869, 38.444223430801685, 38.3872151714884, 38.6350353152284, 0.34512450996679256, 12.732029897884512, 25.11893528580223, 0.972571405451605, 12.862820421459311, 24.75306943746702, 1.7686602746214488, 13.043092007811946, 24.317523741002443, 2.6724030908457856, 13.25934035349559, 23.846277616145397, 3.628913889583082, 13.498849905014632, 23.368785920446182, 4.581310062588646, 13.747953697847313, 22.91459733310598, 5.46419861279665, 13.990424377339574, 22.516650141882497, 6.182832997419618, 14.201847264790537, 22.220861532161457, 0.34512450996679256, 12.732029897884512, 25.11893528580223, 0.972571405451605, 12.862820421459311, 24.75306943746702, 1.7686602746214488, 13.043092007811946, 24.317523741002443, 2.6724030908457856, 13.25934035349559, 23.846277616145397, 3.628913889583082, 13.498849905014632, 23.368785920446182, 4.581310062588646, 13.747953697847313, 22.91459733310598, 5.46419861279665, 13.990424377339574, 22.516650141882497, 6.182832997419618, 14.201847264790537, 22.220861532161457], "YB1": [3.4320000000000004, 3.4320000000000004, 3.4320000000000004, 5.55984, 5.55984, 5.55984, 9.533585198616375, 9.533585198616375, 9.533585198616375, 12.011999999999999, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, 16.52508, 17.16, 17.16, 17.16, -3.4320000000000004, -3.4320000000000004, -3.4320000000000004, -5.55984, -5.55984, -5.55984, -9.533585198616375, -9.533585198616375, -9.533585198616375, -12.011999999999999, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, -16.52508, -17.16, -17.16, -17.16, 0.648, 0.648, 0.648, 2.755320713028647, 2.755320713028647, 2.755320713028647, 4.000105677741137, 4.000105677741137, 4.000105677741137, 5.091168824543143, 5.091168824543143, 5.091168824543143, 5.986581208578325, 5.986581208578325, 5.986581208578325, 6.6240000000000006, 6.6240000000000006, 6.6240000000000006, 7.061654018903259, 7.061654018903259, 7.061654018903259, 7.2, 7.2, 7.2, -0.648, -0.648, -0.648, -2.755320713028647, -2.755320713028647, -2.755320713028647, -4.000105677741137, -4.000105677741137, -4.000105677741137, -5.091168824543143, -5.091168824543143, -5.091168824543143, -5.986581208578325, -5.986581208578325, -5.986581208578325, -6.6240000000000006, -6.6240000000000006, -6.6240000000000006, -7.061654018903259, -7.061654018903259, -7.061654018903259, -7.2, -7.2, -7.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.55984, 5.55984, -5.55984, -5.55984, 9.533585198616374, 9.533585198616374, 12.011999999999995, 12.011999999999995, -9.533585198616374, -9.533585198616374, -12.011999999999995, -12.011999999999995, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, 2.7553207130286466, 2.7553207130286466, 4.000105677741136, 4.000105677741136, 5.091168824543142, 5.091168824543142, 5.9865812085783245, 5.9865812085783245, 6.623999999999999, 6.623999999999999, -2.7553207130286466, -2.7553207130286466, -4.000105677741136, -4.000105677741136, -5.091168824543142, -5.091168824543142, -5.9865812085783245, -5.9865812085783245, -6.623999999999999, -6.623999999999999, 0.3436115983169869, 0.3436115983169869, 0.3436115983169869, 0.6755219157699762, 0.6755219157699762, 0.6755219157699762, 0.9844281445806554, 0.9844281445806554, 0.9844281445806554, 1.259810853619062, 1.259810853619062, 1.259810853619062, 1.492292215014048, 1.492292215014048, 1.492292215014048, 1.6739553548339667, 1.6739553548339667, 1.6739553548339667, 1.7986139527331717, 1.7986139527331717, 1.7986139527331717, 1.8620229096717145, 1.8620229096717145, 1.8620229096717145, -0.3436115983169869, -0.3436115983169869, -0.3436115983169869, -0.6755219157699762, -0.6755219157699762, -0.6755219157699762, -0.9844281445806554, -0.9844281445806554, -0.9844281445806554, -1.259810853619062, -1.259810853619062, -1.259810853619062, -1.492292215014048, -1.492292215014048, -1.492292215014048, -1.6739553548339667, -1.6739553548339667, -1.6739553548339667, -1.7986139527331717, -1.7986139527331717, -1.7986139527331717, -1.8620229096717145, -1.8620229096717145, -1.8620229096717145], "ZB1": [-0.25523143167056594, -0.33823290288213337, -0.4163912118857701, -0.18857616647572717, -0.20725121032204386, -0.2221636910899421, 0.15259077659815568, 0.16699322955886353, 0.15541824485049593, 0.3869132448913605, 0.3991354036051462, 0.38950536791660006, 0.6002091917310375, 0.6094448274015942, 0.599055098925787, 0.7501347982806172, 0.7580814507469964, 0.7492650701242511, 0.8136037396628089, 0.820998749196804, 0.8128424541766384, 0.8597162221596213, 0.8700758796504209, 0.8677851587969307, -0.25523143167056594, -0.33823290288213337, -0.4163912118857701, -0.18857616647572717, -0.20725121032204386, -0.2221636910899421, 0.15259077659815568, 0.16699322955886353, 0.15541824485049593, 0.3869132448913605, 0.3991354036051462, 0.38950536791660006, 0.6002091917310375, 0.6094448274015942, 0.599055098925787, 0.7501347982806172, 0.7580814507469964, 0.7492650701242511, 0.8136037396628089, 0.820998749196804, 0.8128424541766384, 0.8597162221596213, 0.8700758796504209, 0.8677851587969307, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 2.5587540660542594, 2.5587540660542594, 2.5587540660542594, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 2.5587540660542594, 2.5587540660542594, 2.5587540660542594, 3.165102382394349, 3.165102382394349, 3.165102382394349, 4.007346, 4.007346, 4.007346, 6.167900041053287, 6.167900041053287, 6.167900041053287, 7.430199487283941, 7.430199487283941, 7.430199487283941, 8.466141870480202, 8.466141870480202, 8.466141870480202, 9.235916505819018, 9.235916505819018, 9.235916505819018, 9.70994138575891, 9.70994138575891, 9.70994138575891, 9.870000000000001, 9.870000000000001, 9.870000000000001, -0.2391335574593043, -0.24561346159486905, -0.2391335574593043, -0.24561346159486905, 0.1413948669297335, 0.1397268333078602, 0.3778157463238484, 0.37648127441452695, 0.1413948669297335, 0.1397268333078602, 0.3778157463238484, 0.37648127441452695, 0.591896430405812, 0.5904626065300711, 0.7432085040225828, 0.7420003787023662, 0.8072464783959604, 0.8061321938592594, 0.591896430405812, 0.5904626065300711, 0.7432085040225828, 0.7420003787023662, 0.8072464783959604, 0.8061321938592594, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 2.471333740769918, 2.471333740769918, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 2.471333740769918, 2.471333740769918, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XB2": [17.840216680143484, 19.627063944718586, 21.41386601270989, 18.469659015569384, 19.374980372994855, 20.280300035806487, 20.335751504277, 21.057349378969647, 21.778945927864967, 21.499630647028674, 22.10663970818468, 22.713648016553464, 22.65961367156541, 23.262856007235115, 23.86609900625388, 23.389632772594553, 23.904894070984483, 24.420155625206867, 23.6986765861705, 24.17669221938128, 24.654707967881944, 24.681038115096705, 24.9416965150967, 25.202354915096706, 17.840216680143484, 19.627063944718586, 21.41386601270989, 18.469659015569384, 19.374980372994855, 20.280300035806487, 20.335751504277, 21.057349378969647, 21.778945927864967, 21.499630647028674, 22.10663970818468, 22.713648016553464, 22.65961367156541, 23.262856007235115, 23.86609900625388, 23.389632772594553, 23.904894070984483, 24.420155625206867, 23.6986765861705, 24.17669221938128, 24.654707967881944, 24.681038115096705, 24.9416965150967, 25.202354915096706, 34.770818768635316, 36.10971916220198, 37.44861955576865, 35.51416521007299, 36.25683777986241, 36.99951034965183, 36.19052139487674, 36.818269593954085, 37.44601779303143, 36.78335254906844, 37.310368694732595, 37.83738484039675, 37.26987650385604, 37.71422398972737, 38.1585714755987, 37.61621916874174, 38.00171717011508, 38.38721517148841, 38.001915737417164, 38.49490393044603, 38.987892123474886, 38.071612244096094, 38.546353654096094, 39.021095064096095, 34.770818768635316, 36.10971916220198, 37.44861955576865, 35.51416521007299, 36.25683777986241, 36.99951034965183, 36.19052139487674, 36.818269593954085, 37.44601779303143, 36.78335254906844, 37.310368694732595, 37.83738484039675, 37.26987650385604, 37.71422398972737, 38.1585714755987, 37.61621916874174, 38.00171717011508, 38.38721517148841, 38.001915737417164, 38.49490393044603, 38.987892123474886, 38.071612244096094, 38.546353654096094, 39.021095064096095, 32.99696795401912, 35.14404567312829, 37.29112339223746, 34.38920030734627, 35.90420030734627, 37.41920030734627, 35.59479230079726, 36.698248124632016, 37.80170394846678, 36.29915705020727, 37.162168999090596, 38.02518094797393, 36.87721426105541, 37.54289902138144, 38.20858378170747, 37.306749518907004, 37.82580695026376, 38.344864381620525, 37.571256024688964, 38.00002079268721, 38.42878556068546, 37.66056894172104, 38.058845608387706, 38.457122275054374, 20.862294895907084, 21.44428287452164, 20.862294895907084, 21.44428287452164, 22.24283340195841, 22.706713101549735, 23.103869902281804, 23.494087373650775, 22.24283340195841, 22.706713101549735, 23.103869902281804, 23.494087373650775, 24.038454274376026, 24.210807854691556, 24.567373260546365, 24.714590244952998, 24.791283917844737, 24.927859574467213, 24.038454274376026, 24.210807854691556, 24.567373260546365, 24.714590244952998, 24.791283917844737, 24.927859574467213, 37.47694271594502, 37.95437508223822, 37.849570206724, 38.25312262041658, 38.17618093403798, 38.51497702767922, 38.444223430801685, 38.729875386004686, 38.6350353152284, 38.8828554589684, 37.47694271594502, 37.95437508223822, 37.849570206724, 38.25312262041658, 38.17618093403798, 38.51497702767922, 38.444223430801685, 38.729875386004686, 38.6350353152284, 38.8828554589684, 12.732029897884512, 25.11893528580223, 37.50584067371995, 12.862820421459311, 24.75306943746702, 36.64331845347473, 13.043092007811946, 24.317523741002443, 35.59195547419294, 13.25934035349559, 23.846277616145393, 34.4332148787952, 13.498849905014632, 23.368785920446182, 33.238721935877734, 13.747953697847313, 22.91459733310598, 32.08124096836465, 13.990424377339574, 22.516650141882497, 31.042875906425422, 14.201847264790537, 22.220861532161457, 30.239875799532378, 12.732029897884512, 25.11893528580223, 37.50584067371995, 12.862820421459311, 24.75306943746702, 36.64331845347473, 13.043092007811946, 24.317523741002443, 35.59195547419294, 13.25934035349559, 23.846277616145393, 34.4332148787952, 13.498849905014632, 23.368785920446182, 33.238721935877734, 13.747953697847313, 22.91459733310598, 32.08124096836465, 13.990424377339574, 22.516650141882497, 31.042875906425422, 14.201847264790537, 22.220861532161457, 30.239875799532378], "YB2": [3.4320000000000004, 3.4320000000000004, 3.4320000000000004, 5.55984, 5.55984, 5.55984, 9.533585198616375, 9.533585198616375, 9.533585198616375, 12.011999999999999, 12.011999999999999, 12.011999999999999, 14.268018547111676, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, 16.52508, 17.16, 17.16, 17.16, -3.4320000000000004, -3.4320000000000004, -3.4320000000000004, -5.55984, -5.55984, -5.55984, -9.533585198616375, -9.533585198616375, -9.533585198616375, -12.011999999999999, -12.011999999999999, -12.011999999999999, -14.268018547111676, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, -16.52508, -17.16, -17.16, -17.16, 0.648, 0.648, 0.648, 2.755320713028647, 2.755320713028647, 2.755320713028647, 4.000105677741137, 4.000105677741137, 4.000105677741137, 5.091168824543143, 5.091168824543143, 5.091168824543143, 5.986581208578325, 5.986581208578325, 5.986581208578325, 6.6240000000000006, 6.6240000000000006, 6.6240000000000006, 7.061654018903259, 7.061654018903259, 7.061654018903259, 7.2, 7.2, 7.2, -0.648, -0.648, -0.648, -2.755320713028647, -2.755320713028647, -2.755320713028647, -4.000105677741137, -4.000105677741137, -4.000105677741137, -5.091168824543143, -5.091168824543143, -5.091168824543143, -5.986581208578325, -5.986581208578325, -5.986581208578325, -6.6240000000000006, -6.6240000000000006, -6.6240000000000006, -7.061654018903259, -7.061654018903259, -7.061654018903259, -7.2, -7.2, -7.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.55984, 5.55984, -5.55984, -5.55984, 9.533585198616374, 9.533585198616374, 12.011999999999995, 12.011999999999995, -9.533585198616374, -9.533585198616374, -12.011999999999995, -12.011999999999995, 14.268018547111676, 14.268018547111676, 15.853772777893681, 15.853772777893681, 16.52508, 16.52508, -14.268018547111676, -14.268018547111676, -15.853772777893681, -15.853772777893681, -16.52508, -16.52508, 2.7553207130286466, 2.7553207130286466, 4.000105677741136, 4.000105677741136, 5.091168824543142, 5.091168824543142, 5.9865812085783245, 5.9865812085783245, 6.623999999999999, 6.623999999999999, -2.7553207130286466, -2.7553207130286466, -4.000105677741136, -4.000105677741136, -5.091168824543142, -5.091168824543142, -5.9865812085783245, -5.9865812085783245, -6.623999999999999, -6.623999999999999, 0.3436115983169869, 0.3436115983169869, 0.3436115983169869, 0.6755219157699762, 0.6755219157699762, 0.6755219157699762, 0.9844281445806554, 0.9844281445806554, 0.9844281445806554, 1.259810853619062, 1.259810853619062, 1.259810853619062, 1.492292215014048, 1.492292215014048, 1.492292215014048, 1.6739553548339667, 1.6739553548339667, 1.6739553548339667, 1.7986139527331717, 1.7986139527331717, 1.7986139527331717, 1.8620229096717145, 1.8620229096717145, 1.8620229096717145, -0.3436115983169869, -0.3436115983169869, -0.3436115983169869, -0.6755219157699762, -0.6755219157699762, -0.6755219157699762, -0.9844281445806554, -0.9844281445806554, -0.9844281445806554, -1.259810853619062, -1.259810853619062, -1.259810853619062, -1.492292215014048, -1.492292215014048, -1.492292215014048, -1.6739553548339667, -1.6739553548339667, -1.6739553548339667, -1.7986139527331717, -1.7986139527331717, -1.7986139527331717, -1.8620229096717145, -1.8620229096717145, -1.8620229096717145], "ZB2": [-0.33823290288213337, -0.4163912118857701, -0.4962090982898987, -0.20725121032204386, -0.2221636910899421, -0.2391335574593043, 0.16699322955886353, 0.15541824485049593, 0.14139486692973346, 0.3991354036051462, 0.38950536791660006, 0.3778157463238485, 0.6094448274015942, 0.599055098925787, 0.5918964304058121, 0.7580814507469964, 0.7492650701242511, 0.7432085040225826, 0.820998749196804, 0.8128424541766384, 0.8072464783959605, 0.8700758796504209, 0.8677851587969307, 0.8616151218271186, -0.33823290288213337, -0.4163912118857701, -0.4962090982898987, -0.20725121032204386, -0.2221636910899421, -0.2391335574593043, 0.16699322955886353, 0.15541824485049593, 0.14139486692973346, 0.3991354036051462, 0.38950536791660006, 0.3778157463238485, 0.6094448274015942, 0.599055098925787, 0.5918964304058121, 0.7580814507469964, 0.7492650701242511, 0.7432085040225826, 0.820998749196804, 0.8128424541766384, 0.8072464783959605, 0.8700758796504209, 0.8677851587969307, 0.8616151218271186, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 2.5587540660542594, 2.5587540660542594, 2.5587540660542594, 1.5643478659448833, 1.5643478659448833, 1.5643478659448833, 1.884178876728552, 1.884178876728552, 1.884178876728552, 2.073101631110883, 2.073101631110883, 2.073101631110883, 2.2386938102761396, 2.2386938102761396, 2.2386938102761396, 2.374591799644165, 2.374591799644165, 2.374591799644165, 2.4713337407699187, 2.4713337407699187, 2.4713337407699187, 2.537757103086797, 2.537757103086797, 2.537757103086797, 2.5587540660542594, 2.5587540660542594, 2.5587540660542594, 3.165102382394349, 3.165102382394349, 3.165102382394349, 4.007346, 4.007346, 4.007346, 6.167900041053287, 6.167900041053287, 6.167900041053287, 7.430199487283941, 7.430199487283941, 7.430199487283941, 8.466141870480202, 8.466141870480202, 8.466141870480202, 9.235916505819018, 9.235916505819018, 9.235916505819018, 9.70994138575891, 9.70994138575891, 9.70994138575891, 9.870000000000001, 9.870000000000001, 9.870000000000001, -0.24561346159486905, -0.2604479949656814, -0.24561346159486905, -0.2604479949656814, 0.1397268333078602, 0.12370137281525481, 0.37648127441452695, 0.3630693494825779, 0.1397268333078602, 0.12370137281525481, 0.37648127441452695, 0.3630693494825779, 0.5904626065300711, 0.5808077649121204, 0.7420003787023662, 0.7337702592213697, 0.8061321938592594, 0.7985035053247116, 0.5904626065300711, 0.5808077649121204, 0.7420003787023662, 0.7337702592213697, 0.8061321938592594, 0.7985035053247116, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 2.471333740769918, 2.471333740769918, 1.8841788767285514, 1.8841788767285514, 2.073101631110882, 2.073101631110882, 2.2386938102761387, 2.2386938102761387, 2.374591799644164, 2.374591799644164, 2.471333740769918, 2.471333740769918, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XC": [16.473200554605754, 18.656367952359787, 20.84020635746133, 17.617363634577668, 18.695588605728176, 19.773801888253367, 19.199340210314297, 20.01280010320235, 20.82625825599985, 20.751614820237457, 21.415918373032554, 22.080220981719606, 21.973866063979607, 22.63969285278018, 23.305519612686382, 22.88481001832567, 23.444062009240092, 24.003313987484148, 23.419994989594212, 23.91663351667229, 24.413272038550105, 24.13166694760928, 24.546529333752517, 24.961391625098578, 16.473200554605754, 18.656367952359787, 20.84020635746133, 17.617363634577668, 18.695588605728176, 19.773801888253367, 19.199340210314297, 20.01280010320235, 20.82625825599985, 20.751614820237457, 21.415918373032554, 22.080220981719606, 21.973866063979607, 22.63969285278018, 23.305519612686382, 22.88481001832567, 23.444062009240092, 24.003313987484148, 23.419994989594212, 23.91663351667229, 24.413272038550105, 24.13166694760928, 24.546529333752517, 24.961391625098578, 34.26218433512183, 35.643817865238496, 37.02545139535516, 34.73166907465839, 35.57162049730144, 36.41157191994448, 35.68104070636652, 36.3662510907999, 37.05146147523328, 36.3425914288799, 36.91997360125065, 37.4973557736214, 36.9051940725203, 37.39087588828804, 37.876557704055784, 37.339317150393306, 37.75423989401564, 38.16916263763797, 37.76121171471418, 38.28306152649528, 38.804911338276376, 37.91579779037802, 38.39966259189246, 38.88352739340689, 34.26218433512183, 35.643817865238496, 37.02545139535516, 34.73166907465839, 35.57162049730144, 36.41157191994448, 35.68104070636652, 36.3662510907999, 37.05146147523328, 36.3425914288799, 36.91997360125065, 37.4973557736214, 36.9051940725203, 37.39087588828804, 37.876557704055784, 37.339317150393306, 37.75423989401564, 38.16916263763797, 37.76121171471418, 38.28306152649528, 38.804911338276376, 37.91579779037802, 38.39966259189246, 38.88352739340689, 30.964599262120913, 33.72147145500883, 36.47834364789675, 33.235324415794054, 35.066363275348635, 36.897402134903224, 34.66468932609242, 35.973917238009804, 37.283145149927186, 35.7011662039125, 36.68440009027155, 37.6676339766306, 36.39709856698017, 37.16144692158485, 37.92579527618953, 36.943889116020856, 37.536260211862256, 38.12863130770365, 37.3205249968786, 37.79443609655611, 38.26834719623362, 37.512532303871886, 37.926053021204346, 38.33957373853681, 20.56324011568562, 21.256513471738213, 20.56324011568562, 21.256513471738213, 21.421830277696944, 21.94476759118372, 22.56658780363589, 22.99363944242303, 21.421830277696944, 21.94476759118372, 22.56658780363589, 22.99363944242303, 23.614654581610857, 23.804889187357503, 24.262967181090648, 24.42275275399316, 24.64385441029387, 24.785750840824377, 23.614654581610857, 23.804889187357503, 24.262967181090648, 24.42275275399316, 24.64385441029387, 24.785750840824377, 37.02653635437956, 37.56650512607865, 37.55313336383629, 37.99362575382918, 37.920082006964265, 38.29125626063117, 38.2321461763143, 38.544370200736424, 38.47294536064717, 38.73968141011866, 37.02653635437956, 37.56650512607865, 37.55313336383629, 37.99362575382918, 37.920082006964265, 38.29125626063117, 38.2321461763143, 38.544370200736424, 38.47294536064717, 38.73968141011866, 9.57015177545254, 22.10027113607807, 34.6303904967036, 9.762780859181234, 21.901358061143945, 34.039935263106656, 10.057371120985852, 21.639711495584955, 33.22205187018405, 10.41854505617373, 21.349229554093878, 32.27991405201403, 10.821985969494943, 21.05042260853562, 31.2788592475763, 11.243829345094696, 20.762119170439803, 30.28040899578491, 11.657580362618244, 20.504015062519038, 29.350449762419835, 12.027980817075825, 20.300600833032746, 28.573220848989664, 9.57015177545254, 22.10027113607807, 34.6303904967036, 9.762780859181234, 21.901358061143945, 34.039935263106656, 10.057371120985852, 21.639711495584955, 33.22205187018405, 10.41854505617373, 21.349229554093878, 32.27991405201403, 10.821985969494943, 21.05042260853562, 31.2788592475763, 11.243829345094696, 20.762119170439803, 30.28040899578491, 11.657580362618244, 20.504015062519038, 29.350449762419835, 12.027980817075825, 20.300600833032746, 28.573220848989664], "YC": [1.7160000000000002, 1.7160000000000002, 1.7160000000000002, 4.49592, 4.49592, 4.49592, 7.546712599308188, 7.546712599308188, 7.546712599308188, 10.772792599308186, 10.772792599308186, 10.772792599308186, 13.140009273555837, 13.140009273555837, 13.140009273555837, 15.060895662502679, 15.060895662502679, 15.060895662502679, 16.189426388946842, 16.189426388946842, 16.189426388946842, 16.84254, 16.84254, 16.84254, -1.7160000000000002, -1.7160000000000002, -1.7160000000000002, -4.49592, -4.49592, -4.49592, -7.546712599308188, -7.546712599308188, -7.546712599308188, -10.772792599308186, -10.772792599308186, -10.772792599308186, -13.140009273555837, -13.140009273555837, -13.140009273555837, -15.060895662502679, -15.060895662502679, -15.060895662502679, -16.189426388946842, -16.189426388946842, -16.189426388946842, -16.84254, -16.84254, -16.84254, 0.324, 0.324, 0.324, 1.7016603565143236, 1.7016603565143236, 1.7016603565143236, 3.377713195384892, 3.377713195384892, 3.377713195384892, 4.545637251142139, 4.545637251142139, 4.545637251142139, 5.538875016560734, 5.538875016560734, 5.538875016560734, 6.305290604289163, 6.305290604289163, 6.305290604289163, 6.84282700945163, 6.84282700945163, 6.84282700945163, 7.13082700945163, 7.13082700945163, 7.13082700945163, -0.324, -0.324, -0.324, -1.7016603565143236, -1.7016603565143236, -1.7016603565143236, -3.377713195384892, -3.377713195384892, -3.377713195384892, -4.545637251142139, -4.545637251142139, -4.545637251142139, -5.538875016560734, -5.538875016560734, -5.538875016560734, -6.305290604289163, -6.305290604289163, -6.305290604289163, -6.84282700945163, -6.84282700945163, -6.84282700945163, -7.13082700945163, -7.13082700945163, -7.13082700945163, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 4.49592, 4.49592, -4.49592, -4.49592, 7.5467125993081865, 7.5467125993081865, 10.772792599308184, 10.772792599308184, -7.5467125993081865, -7.5467125993081865, -10.772792599308184, -10.772792599308184, 13.140009273555837, 13.140009273555837, 15.060895662502679, 15.060895662502679, 16.189426388946842, 16.189426388946842, -13.140009273555837, -13.140009273555837, -15.060895662502679, -15.060895662502679, -16.189426388946842, -16.189426388946842, 1.701660356514323, 1.701660356514323, 3.377713195384891, 3.377713195384891, 4.545637251142138, 4.545637251142138, 5.538875016560733, 5.538875016560733, 6.305290604289161, 6.305290604289161, -1.701660356514323, -1.701660356514323, -3.377713195384891, -3.377713195384891, -4.545637251142138, -4.545637251142138, -5.538875016560733, -5.538875016560733, -6.305290604289161, -6.305290604289161, 0.1718057991584935, 0.1718057991584935, 0.1718057991584935, 0.5095667570434815, 0.5095667570434815, 0.5095667570434815, 0.8299750301753158, 0.8299750301753158, 0.8299750301753158, 1.1221194990998586, 1.1221194990998586, 1.1221194990998586, 1.376051534316555, 1.376051534316555, 1.376051534316555, 1.5831237849240074, 1.5831237849240074, 1.5831237849240074, 1.7362846537835692, 1.7362846537835692, 1.7362846537835692, 1.8303184312024432, 1.8303184312024432, 1.8303184312024432, -0.1718057991584935, -0.1718057991584935, -0.1718057991584935, -0.5095667570434815, -0.5095667570434815, -0.5095667570434815, -0.8299750301753158, -0.8299750301753158, -0.8299750301753158, -1.1221194990998586, -1.1221194990998586, -1.1221194990998586, -1.376051534316555, -1.376051534316555, -1.376051534316555, -1.5831237849240074, -1.5831237849240074, -1.5831237849240074, -1.7362846537835692, -1.7362846537835692, -1.7362846537835692, -1.8303184312024432, -1.8303184312024432, -1.8303184312024432], "ZC": [-0.4211213543993631, -0.5632134100370214, -0.6914868525948417, -0.2501054237366126, -0.2827051482032372, -0.3161382097809725, -0.01606006336548932, -0.02921833941373514, -0.04492588064417591, 0.2855444496754095, 0.27495110146138113, 0.26227592976496106, 0.5055940960461875, 0.49511569491157714, 0.4845360535434555, 0.6853360353340059, 0.6766111495052018, 0.667801228523458, 0.7909251886488358, 0.7832169438145018, 0.7754331843973017, 0.8469980706934901, 0.8404559032984202, 0.8297032877671491, -0.4211213543993631, -0.5632134100370214, -0.6914868525948417, -0.2501054237366126, -0.2827051482032372, -0.3161382097809725, -0.01606006336548932, -0.02921833941373514, -0.04492588064417591, 0.2855444496754095, 0.27495110146138113, 0.26227592976496106, 0.5055940960461875, 0.49511569491157714, 0.4845360535434555, 0.6853360353340059, 0.6766111495052018, 0.667801228523458, 0.7909251886488358, 0.7832169438145018, 0.7754331843973017, 0.8469980706934901, 0.8404559032984202, 0.8297032877671491, 1.5151739329724416, 1.5151739329724416, 1.5151739329724416, 1.7242633713367177, 1.7242633713367177, 1.7242633713367177, 1.9786402539197174, 1.9786402539197174, 1.9786402539197174, 2.155897720693511, 2.155897720693511, 2.155897720693511, 2.306642804960152, 2.306642804960152, 2.306642804960152, 2.4229627702070418, 2.4229627702070418, 2.4229627702070418, 2.5045454219283583, 2.5045454219283583, 2.5045454219283583, 2.548255584570528, 2.548255584570528, 2.548255584570528, 1.5151739329724416, 1.5151739329724416, 1.5151739329724416, 1.7242633713367177, 1.7242633713367177, 1.7242633713367177, 1.9786402539197174, 1.9786402539197174, 1.9786402539197174, 2.155897720693511, 2.155897720693511, 2.155897720693511, 2.306642804960152, 2.306642804960152, 2.306642804960152, 2.4229627702070418, 2.4229627702070418, 2.4229627702070418, 2.5045454219283583, 2.5045454219283583, 2.5045454219283583, 2.548255584570528, 2.548255584570528, 2.548255584570528, 2.3525511911971746, 2.3525511911971746, 2.3525511911971746, 3.5862241911971746, 3.5862241911971746, 3.5862241911971746, 5.087623020526644, 5.087623020526644, 5.087623020526644, 6.799049764168614, 6.799049764168614, 6.799049764168614, 7.948170678882072, 7.948170678882072, 7.948170678882072, 8.85102918814961, 8.85102918814961, 8.85102918814961, 9.472928945788965, 9.472928945788965, 9.472928945788965, 9.789970692879454, 9.789970692879454, 9.789970692879454, -0.33832926954984216, -0.3501083435502364, -0.33832926954984216, -0.3501083435502364, -0.04991324293316017, -0.060114165133889105, 0.2583144862756019, 0.2500818707230252, -0.04991324293316017, -0.060114165133889105, 0.2583144862756019, 0.2500818707230252, 0.483534712146129, 0.47486603317873394, 0.6669955848183264, 0.6597362586094009, 0.7747362191112854, 0.7683010212121615, 0.483534712146129, 0.47486603317873394, 0.6669955848183264, 0.6597362586094009, 0.7747362191112854, 0.7683010212121615, 1.724263371336717, 1.724263371336717, 1.9786402539197168, 1.9786402539197168, 2.15589772069351, 2.15589772069351, 2.306642804960151, 2.306642804960151, 2.422962770207041, 2.422962770207041, 1.724263371336717, 1.724263371336717, 1.9786402539197168, 1.9786402539197168, 2.15589772069351, 2.15589772069351, 2.306642804960151, 2.306642804960151, 2.422962770207041, 2.422962770207041, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "normals": [[0.08849733559942426, -0.09389449715683434, 0.9916410867826464], [0.08562553099454867, -0.11446693877540691, 0.9897300583337302], [0.08630310554154007, -0.13634614674699705, 0.9868948790226505], [0.04691328316423042, -0.06453549697490467, 0.9968120753145774], [0.04274504788227926, -0.07344223592941326, 0.9963830081164723], [0.044965484633250286, -0.08542938043183029, 0.9953290542080697], [-0.01960296704082622, -0.0840802352621429, 0.996266148035483], [0.016237681364471686, -0.10082226810006217, 0.9947719376616256], [0.019608894688026155, -0.10228071700426462, 0.994562288737215], [-0.01988433218676443, -0.08393570338849936, 0.9962727593536642], [0.015957224651765228, -0.10067136558090124, 0.9947917586779103], [0.019328568808663887, -0.10212197252786313, 0.994584088528882], [-0.015091274385392896, -0.08639622882174197, 0.9961465479952264], [0.01729151147696296, -0.10121240749997965, 0.9947145581516841], [0.01196709488617063, -0.09912660842248947, 0.9950028663992079], [-0.015250965892905182, -0.08631428702244143, 0.9961512193914843], [0.017132310466690517, -0.1011251631732274, 0.9947261860990999], [0.01180780550296987, -0.0990330623147232, 0.9950140844720602], [-0.01536321403535653, -0.08625668863555098, 0.9961544836621141], [0.017020403137071295, -0.10106555451039721, 0.9947341652766117], [0.011695835031609913, -0.09897074688922355, 0.9950216071538862], [-0.03965888478974766, -0.0212536417875759, 0.9989872149171876], [0.008797794957438588, -0.08906530728366235, 0.9959869325660621], [0.02358439741203021, -0.10253388640857032, 0.9944498872928016], [0.08849733559942426, 0.09389449715683434, 0.9916410867826464], [0.08562553099454867, 0.11446693877540691, 0.9897300583337302], [0.08630310554154007, 0.13634614674699705, 0.9868948790226505], [0.04691328316423042, 0.06453549697490467, 0.9968120753145774], [0.04274504788227926, 0.07344223592941326, 0.9963830081164723], [0.044965484633250286, 0.08542938043183029, 0.9953290542080697], [-0.01960296704082622, 0.0840802352621429, 0.996266148035483], [0.016237681364471686, 0.10082226810006217, 0.9947719376616256], [0.019608894688026155, 0.10228071700426462, 0.994562288737215], [-0.01988433218676443, 0.08393570338849936, 0.9962727593536642], [0.015957224651765228, 0.10067136558090124, 0.9947917586779103], [0.019328568808663887, 0.10212197252786313, 0.994584088528882], [-0.015091274385392896, 0.08639622882174197, 0.9961465479952264], [0.01729151147696296, 0.10121240749997965, 0.9947145581516841], [0.01196709488617063, 0.09912660842248947, 0.9950028663992079], [-0.015250965892905182, 0.08631428702244143, 0.9961512193914843], [0.017132310466690517, 0.1011251631732274, 0.9947261860990999], [0.01180780550296987, 0.0990330623147232, 0.9950140844720602], [-0.01536321403535653, 0.08625668863555098, 0.9961544836621141], [0.017020403137071295, 0.10106555451039721, 0.9947341652766117], [0.011695835031609913, 0.09897074688922355, 0.9950216071538862], [-0.03965888478974766, 0.0212536417875759, 0.9989872149171876], [0.008797794957438588, 0.08906530728366235, 0.9959869325660621], [0.02358439741203021, 0.10253388640857032, 0.9944498872928016], [-0.0, -0.15005303455255387, 0.9886779489912628], [-0.0, -0.15005303455255387, 0.9886779489912628], [-0.0, -0.15005303455255387, 0.9886779489912628], [-0.0, -0.15005303455255395, 0.9886779489912628], [-0.0, -0.15005303455255395, 0.9886779489912627], [-0.0, -0.15005303455255395, 0.9886779489912628], [-0.0, -0.15005303455255406, 0.9886779489912627], [-0.0, -0.15005303455255406, 0.9886779489912627], [-0.0, -0.15005303455255406, 0.9886779489912627], [-0.0, -0.1500530345525539, 0.9886779489912628], [-0.0, -0.1500530345525539, 0.9886779489912628], [-0.0, -0.1500530345525539, 0.9886779489912628], [-0.0, -0.15005303455255353, 0.9886779489912628], [-0.0, -0.15005303455255353, 0.9886779489912628], [-0.0, -0.15005303455255353, 0.9886779489912628], [-0.0, -0.15005303455255414, 0.9886779489912628], [-0.0, -0.15005303455255414, 0.9886779489912628], [-0.0, -0.15005303455255417, 0.9886779489912628], [-0.0, -0.15005303455255364, 0.9886779489912628], [-0.0, -0.15005303455255364, 0.9886779489912628], [-0.0, -0.15005303455255364, 0.9886779489912628], [-0.0, -0.15005303455255423, 0.9886779489912627], [-0.0, -0.15005303455255423, 0.9886779489912627], [-0.0, -0.15005303455255423, 0.9886779489912627], [-0.0, 0.15005303455255387, 0.9886779489912628], [-0.0, 0.15005303455255387, 0.9886779489912628], [-0.0, 0.15005303455255387, 0.9886779489912628], [-0.0, 0.15005303455255395, 0.9886779489912628], [-0.0, 0.15005303455255395, 0.9886779489912627], [-0.0, 0.15005303455255395, 0.9886779489912628], [-0.0, 0.15005303455255406, 0.9886779489912627], [-0.0, 0.15005303455255406, 0.9886779489912627], [-0.0, 0.15005303455255406, 0.9886779489912627], [-0.0, 0.1500530345525539, 0.9886779489912628], [-0.0, 0.1500530345525539, 0.9886779489912628], [-0.0, 0.1500530345525539, 0.9886779489912628], [-0.0, 0.15005303455255353, 0.9886779489912628], [-0.0, 0.15005303455255353, 0.9886779489912628], [-0.0, 0.15005303455255353, 0.9886779489912628], [-0.0, 0.15005303455255414, 0.9886779489912628], [-0.0, 0.15005303455255414, 0.9886779489912628], [-0.0, 0.15005303455255417, 0.9886779489912628], [-0.0, 0.15005303455255364, 0.9886779489912628], [-0.0, 0.15005303455255364, 0.9886779489912628], [-0.0, 0.15005303455255364, 0.9886779489912628], [-0.0, 0.15005303455255423, 0.9886779489912627], [-0.0, 0.15005303455255423, 0.9886779489912627], [-0.0, 0.15005303455255423, 0.9886779489912627], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.03735877093688465, -0.09487910642687108, 0.994787553901698], [0.05158489047498866, -0.10360686425704603, 0.9932797273444703], [0.03735877093688465, 0.09487910642687108, 0.994787553901698], [0.05158489047498866, 0.10360686425704603, 0.9932797273444703], [0.0038598379454276733, -0.09646532594445603, 0.9953288615033048], [0.034608088931582966, -0.10702038884596815, 0.9936543244769588], [0.0035790378153230705, -0.09629781970727826, 0.9953461309554285], [0.034328337380037204, -0.10684921838823273, 0.9936824491670092], [0.0038598379454276733, 0.09646532594445603, 0.9953288615033048], [0.034608088931582966, 0.10702038884596815, 0.9936543244769588], [0.0035790378153230705, 0.09629781970727826, 0.9953461309554285], [0.034328337380037204, 0.10684921838823273, 0.9936824491670092], [0.008438136237979177, -0.09795080240496944, 0.9951554844169086], [0.05572788649259639, -0.11343272664055087, 0.9919815619223769], [0.008278793591740876, -0.09785100699435907, 0.9951666403205321], [0.05556960939889848, -0.11333255459155368, 0.9920018904120124], [0.008166785510053913, -0.09778602201243083, 0.9951739533937858], [0.055458317403711, -0.113267758332395, 0.9920155190081975], [0.008438136237979177, 0.09795080240496944, 0.9951554844169086], [0.05572788649259639, 0.11343272664055087, 0.9919815619223769], [0.008278793591740876, 0.09785100699435907, 0.9951666403205321], [0.05556960939889848, 0.11333255459155368, 0.9920018904120124], [0.008166785510053913, 0.09778602201243083, 0.9951739533937858], [0.055458317403711, 0.113267758332395, 0.9920155190081975], [-0.0, -0.15005303455255387, 0.9886779489912628], [-0.0, -0.15005303455255387, 0.9886779489912628], [-0.0, -0.15005303455255392, 0.9886779489912628], [-0.0, -0.15005303455255392, 0.9886779489912628], [-0.0, -0.1500530345525539, 0.9886779489912628], [-0.0, -0.1500530345525539, 0.9886779489912628], [-0.0, -0.15005303455255356, 0.9886779489912628], [-0.0, -0.15005303455255356, 0.9886779489912628], [-0.0, -0.15005303455255434, 0.9886779489912627], [-0.0, -0.15005303455255437, 0.9886779489912628], [-0.0, 0.15005303455255387, 0.9886779489912628], [-0.0, 0.15005303455255387, 0.9886779489912628], [-0.0, 0.15005303455255392, 0.9886779489912628], [-0.0, 0.15005303455255392, 0.9886779489912628], [-0.0, 0.1500530345525539, 0.9886779489912628], [-0.0, 0.1500530345525539, 0.9886779489912628], [-0.0, 0.15005303455255356, 0.9886779489912628], [-0.0, 0.15005303455255356, 0.9886779489912628], [-0.0, 0.15005303455255434, 0.9886779489912627], [-0.0, 0.15005303455255437, 0.9886779489912628], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0]], "panel_areas": [7.5427662016896795, 7.562575260279685, 7.5892415552822055, 2.3000901059470027, 2.301613424275429, 2.304288461448682, 3.244676091934475, 3.2494535201861012, 3.2501311932087296, 1.6526066869586553, 1.655034912112701, 1.655378039992326, 1.5079416462508906, 1.5100948553468785, 1.5096608754876948, 0.890266969745481, 0.8915365812323762, 0.8912798609056386, 0.33468506511334317, 0.3351620035229166, 0.3350653849372862, 0.263671955134918, 0.2644655658192027, 0.26487431357349056, 7.5427662016896795, 7.562575260279685, 7.5892415552822055, 2.3000901059470027, 2.301613424275429, 2.304288461448682, 3.244676091934475, 3.2494535201861012, 3.2501311932087296, 1.6526066869586553, 1.655034912112701, 1.655378039992326, 1.5079416462508906, 1.5100948553468785, 1.5096608754876948, 0.890266969745481, 0.8915365812323762, 0.8912798609056386, 0.33468506511334317, 0.3351620035229166, 0.3350653849372862, 0.263671955134918, 0.2644655658192027, 0.26487431357349056, 0.9055512246723623, 0.9055512246723669, 0.9055512246723646, 1.790317092314564, 1.7903170923145564, 1.7903170923145715, 0.8627071991215991, 0.8627071991215991, 0.8627071991215991, 0.6371745324521005, 0.6371745324521005, 0.6371745324521005, 0.4398656943677578, 0.4398656943677578, 0.4398656943677546, 0.26750829634964485, 0.26750829634964485, 0.26750829634964024, 0.23100511913199734, 0.23100511913199892, 0.23100511913199734, 0.06770733660237122, 0.06770733660237171, 0.06770733660237122, 0.9055512246723623, 0.9055512246723669, 0.9055512246723646, 1.790317092314564, 1.7903170923145564, 1.7903170923145715, 0.8627071991215991, 0.8627071991215991, 0.8627071991215991, 0.6371745324521005, 0.6371745324521005, 0.6371745324521005, 0.4398656943677578, 0.4398656943677578, 0.4398656943677546, 0.26750829634964485, 0.26750829634964485, 0.26750829634964024, 0.23100511913199734, 0.23100511913199892, 0.23100511913199734, 0.06770733660237122, 0.06770733660237171, 0.06770733660237122, 4.480199568618887, 4.480199568618887, 4.48019956861889, 1.5421807930477747, 1.542180793047779, 1.542180793047779, 2.82865765575285, 2.82865765575285, 2.828657655752858, 1.2411355902662407, 1.2411355902662318, 1.2411355902662407, 0.7918208560613147, 0.7918208560613109, 0.7918208560613147, 0.4559922442865663, 0.4559922442865636, 0.4559922442865663, 0.22464565212681453, 0.22464565212680948, 0.22464565212681284, 0.06618755297621554, 0.06618755297621497, 0.06618755297621554, 1.482395222873408, 1.4842766753582852, 1.482395222873408, 1.4842766753582852, 2.0877874861255146, 2.0912528681234566, 1.0633655586455717, 1.0651281881152568, 2.0877874861255146, 2.0912528681234566, 1.0633655586455717, 1.0651281881152568, 0.43126555614728135, 0.4326378332835533, 0.2546122588512829, 0.25542202147234155, 0.09571823699588386, 0.09602256642056364, 0.43126555614728135, 0.4326378332835533, 0.2546122588512829, 0.25542202147234155, 0.09571823699588386, 0.09602256642056364, 1.1509181307736518, 1.1509181307736518, 0.5545974851496012, 0.5545974851496012, 0.4096121994334935, 0.4096121994334935, 0.282770803522127, 0.28277080352213024, 0.17196961908191205, 0.17196961908191433, 1.1509181307736518, 1.1509181307736518, 0.5545974851496012, 0.5545974851496012, 0.4096121994334935, 0.4096121994334935, 0.282770803522127, 0.28277080352213024, 0.17196961908191205, 0.17196961908191433, 4.305494340607158, 4.305494340607158, 4.305494340607158, 4.0289190125310625, 4.0289190125310625, 4.028919012531063, 3.577857085919078, 3.577857085919078, 3.577857085919079, 3.010121508681366, 3.0101215086813657, 3.010121508681366, 2.3779208747865326, 2.3779208747865326, 2.3779208747865326, 1.7291224153881777, 1.7291224153881777, 1.729122415388178, 1.1027841460965073, 1.1027841460965073, 1.1027841460965073, 0.5245582063607392, 0.5245582063607394, 0.5245582063607395, 4.305494340607158, 4.305494340607158, 4.305494340607158, 4.0289190125310625, 4.0289190125310625, 4.028919012531063, 3.577857085919078, 3.577857085919078, 3.577857085919079, 3.010121508681366, 3.0101215086813657, 3.010121508681366, 2.3779208747865326, 2.3779208747865326, 2.3779208747865326, 1.7291224153881777, 1.7291224153881777, 1.729122415388178, 1.1027841460965073, 1.1027841460965073, 1.1027841460965073, 0.5245582063607392, 0.5245582063607394, 0.5245582063607395]}, "float32": {"XA1": [13.61958122253418, 16.196483612060547, 18.773874282836914, 16.05350112915039, 17.304182052612305, 18.555002212524414, 17.564311981201172, 18.46965980529785, 19.374982833862305, 19.614139556884766, 20.335750579833984, 21.057350158691406, 20.892614364624023, 21.62103271484375, 22.349443435668945, 22.056367874145508, 22.65961456298828, 23.262855529785156, 22.874370574951172, 23.389633178710938, 23.90489387512207, 23.220659255981445, 23.78972816467285, 24.358793258666992, 13.61958122253418, 16.196483612060547, 18.773874282836914, 16.05350112915039, 17.304182052612305, 18.555002212524414, 17.564311981201172, 18.46965980529785, 19.374982833862305, 19.614139556884766, 20.335750579833984, 21.057350158691406, 20.892614364624023, 21.62103271484375, 22.349443435668945, 22.056367874145508, 22.65961456298828, 23.262855529785156, 22.874370574951172, 23.389633178710938, 23.90489387512207, 23.220659255981445, 23.78972816467285, 24.358793258666992, 33.02000045776367, 34.444366455078125, 35.86873245239258, 33.43191909790039, 34.36914825439453, 35.30637741088867, 34.77149200439453, 35.514163970947266, 36.2568359375, 35.562774658203125, 36.190521240234375, 36.818267822265625, 36.2563362121582, 36.78335189819336, 37.310367584228516, 36.82552719116211, 37.26987838745117, 37.71422576904297, 37.23072052001953, 37.78143310546875, 38.33214569091797, 37.50892639160156, 38.001914978027344, 38.494903564453125, 33.02000045776367, 34.444366455078125, 35.86873245239258, 33.43191909790039, 34.36914825439453, 35.30637741088867, 34.77149200439453, 35.514163970947266, 36.2568359375, 35.562774658203125, 36.190521240234375, 36.818267822265625, 36.2563362121582, 36.78335189819336, 37.310367584228516, 36.82552719116211, 37.26987838745117, 37.71422576904297, 37.23072052001953, 37.78143310546875, 38.33214569091797, 37.50892639160156, 38.001914978027344, 38.494903564453125, 26.944000244140625, 30.310667037963867, 33.67733383178711, 30.849889755249023, 32.99696731567383, 35.144046783447266, 32.87419891357422, 34.38920211791992, 35.90420150756836, 34.491336822509766, 35.594791412353516, 36.69824981689453, 35.4361457824707, 36.299156188964844, 37.16217041015625, 36.21152877807617, 36.87721252441406, 37.54290008544922, 36.78769302368164, 37.3067512512207, 37.8258056640625, 37.14249038696289, 37.57125473022461, 38.00001907348633, 19.805747985839844, 20.60996437072754, 19.805747985839844, 20.60996437072754, 20.28030014038086, 20.8622989654541, 21.778945922851562, 22.242834091186523, 20.28030014038086, 20.8622989654541, 21.778945922851562, 22.242834091186523, 23.07785415649414, 23.285972595214844, 23.866098403930664, 24.038454055786133, 24.420156478881836, 24.567373275756836, 23.07785415649414, 23.285972595214844, 23.866098403930664, 24.038454055786133, 24.420156478881836, 24.567373275756836, 36.24361038208008, 36.84611511230469, 36.99951171875, 37.47694396972656, 37.44601821899414, 37.849571228027344, 37.83738327026367, 38.17618179321289, 38.158573150634766, 38.4442253112793, 36.24361038208008, 36.84611511230469, 36.99951171875, 37.47694396972656, 37.44601821899414, 37.849571228027344, 37.83738327026367, 38.17618179321289, 38.158573150634766, 38.4442253112793, 0.0, 12.673333168029785, 25.34666633605957, 0.3451245129108429, 12.732029914855957, 25.118934631347656, 0.9725714325904846, 12.862820625305176, 24.753068923950195, 1.768660306930542, 13.043091773986816, 24.317523956298828, 2.67240309715271, 13.259340286254883, 23.846277236938477, 3.6289138793945312, 13.498849868774414, 23.368785858154297, 4.581310272216797, 13.747953414916992, 22.914596557617188, 5.464198589324951, 13.990424156188965, 22.51664924621582, 0.0, 12.673333168029785, 25.34666633605957, 0.3451245129108429, 12.732029914855957, 25.118934631347656, 0.9725714325904846, 12.862820625305176, 24.753068923950195, 1.768660306930542, 13.043091773986816, 24.317523956298828, 2.67240309715271, 13.259340286254883, 23.846277236938477, 3.6289138793945312, 13.498849868774414, 23.368785858154297, 4.581310272216797, 13.747953414916992, 22.914596557617188, 5.464198589324951, 13.990424156188965, 22.51664924621582], "YA1": [0.0, 0.0, 0.0, 3.431999921798706, 3.431999921798706, 3.431999921798706, 5.559840202331543, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, 16.52507972717285, 0.0, 0.0, 0.0, -3.431999921798706, -3.431999921798706, -3.431999921798706, -5.559840202331543, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, -16.52507972717285, 0.0, 0.0, 0.0, 0.6480000019073486, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, 6.624000072479248, 7.061654090881348, 7.061654090881348, 7.061654090881348, 0.0, 0.0, 0.0, -0.6480000019073486, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, -6.624000072479248, -7.061654090881348, -7.061654090881348, -7.061654090881348, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 3.431999921798706, 3.431999921798706, -3.431999921798706, -3.431999921798706, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, 1.1450448137845768e-16, 1.1450448137845768e-16, 1.1450448137845768e-16, 0.34361159801483154, 0.34361159801483154, 0.34361159801483154, 0.6755219101905823, 0.6755219101905823, 0.6755219101905823, 0.9844281673431396, 0.9844281673431396, 0.9844281673431396, 1.2598108053207397, 1.2598108053207397, 1.2598108053207397, 1.4922921657562256, 1.4922921657562256, 1.4922921657562256, 1.6739553213119507, 1.6739553213119507, 1.6739553213119507, 1.7986139059066772, 1.7986139059066772, 1.7986139059066772, -1.1450448137845768e-16, -1.1450448137845768e-16, -1.1450448137845768e-16, -0.34361159801483154, -0.34361159801483154, -0.34361159801483154, -0.6755219101905823, -0.6755219101905823, -0.6755219101905823, -0.9844281673431396, -0.9844281673431396, -0.9844281673431396, -1.2598108053207397, -1.2598108053207397, -1.2598108053207397, -1.4922921657562256, -1.4922921657562256, -1.4922921657562256, -1.6739553213119507, -1.6739553213119507, -1.6739553213119507, -1.7986139059066772, -1.7986139059066772, -1.7986139059066772], "ZA1": [-0.3629825711250305, -0.5929538607597351, -0.8159343004226685, -0.25523144006729126, -0.31409257650375366, -0.36775311827659607, -0.22310815751552582, -0.20529413223266602, -0.2200717031955719, 0.1525907814502716, 0.16699323058128357, 0.1554182469844818, 0.3869132399559021, 0.3979485332965851, 0.3852863013744354, 0.6002091765403748, 0.6094448566436768, 0.5990551114082336, 0.7501348257064819, 0.7580814361572266, 0.7492650747299194, 0.7985804080963135, 0.8211718201637268, 0.816145122051239, -0.3629825711250305, -0.5929538607597351, -0.8159343004226685, -0.25523144006729126, -0.31409257650375366, -0.36775311827659607, -0.22310815751552582, -0.20529413223266602, -0.2200717031955719, 0.1525907814502716, 0.16699323058128357, 0.1554182469844818, 0.3869132399559021, 0.3979485332965851, 0.3852863013744354, 0.6002091765403748, 0.6094448566436768, 0.5990551114082336, 0.7501348257064819, 0.7580814361572266, 0.7492650747299194, 0.7985804080963135, 0.8211718201637268, 0.816145122051239, 1.465999960899353, 1.465999960899353, 1.465999960899353, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 1.465999960899353, 1.465999960899353, 1.465999960899353, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 1.5399999618530273, 1.5399999618530273, 1.5399999618530273, 3.165102481842041, 3.165102481842041, 3.165102481842041, 4.007346153259277, 4.007346153259277, 4.007346153259277, 6.167900085449219, 6.167900085449219, 6.167900085449219, 7.43019962310791, 7.43019962310791, 7.43019962310791, 8.466141700744629, 8.466141700744629, 8.466141700744629, 9.235916137695312, 9.235916137695312, 9.235916137695312, 9.709940910339355, 9.709940910339355, 9.709940910339355, -0.42425736784935, -0.4544593393802643, -0.42425736784935, -0.4544593393802643, -0.2379210740327835, -0.24017803370952606, 0.14139486849308014, 0.13972683250904083, -0.2379210740327835, -0.24017803370952606, 0.14139486849308014, 0.13972683250904083, 0.37652555108070374, 0.37476086616516113, 0.5918964147567749, 0.5904626250267029, 0.7432085275650024, 0.74200040102005, 0.37652555108070374, 0.37476086616516113, 0.5918964147567749, 0.5904626250267029, 0.7432085275650024, 0.74200040102005, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XA2": [16.196483612060547, 18.773874282836914, 21.351097106933594, 17.304182052612305, 18.555002212524414, 19.805747985839844, 18.46965980529785, 19.374982833862305, 20.28030014038086, 20.335750579833984, 21.057350158691406, 21.778945922851562, 21.62103271484375, 22.349443435668945, 23.07785415649414, 22.65961456298828, 23.262855529785156, 23.866098403930664, 23.389633178710938, 23.90489387512207, 24.420156478881836, 23.78972816467285, 24.358793258666992, 24.927860260009766, 16.196483612060547, 18.773874282836914, 21.351097106933594, 17.304182052612305, 18.555002212524414, 19.805747985839844, 18.46965980529785, 19.374982833862305, 20.28030014038086, 20.335750579833984, 21.057350158691406, 21.778945922851562, 21.62103271484375, 22.349443435668945, 23.07785415649414, 22.65961456298828, 23.262855529785156, 23.866098403930664, 23.389633178710938, 23.90489387512207, 24.420156478881836, 23.78972816467285, 24.358793258666992, 24.927860260009766, 34.444366455078125, 35.86873245239258, 37.29309844970703, 34.36914825439453, 35.30637741088867, 36.24361038208008, 35.514163970947266, 36.2568359375, 36.99951171875, 36.190521240234375, 36.818267822265625, 37.44601821899414, 36.78335189819336, 37.310367584228516, 37.83738327026367, 37.26987838745117, 37.71422576904297, 38.158573150634766, 37.78143310546875, 38.33214569091797, 38.88285446166992, 38.001914978027344, 38.494903564453125, 38.987892150878906, 34.444366455078125, 35.86873245239258, 37.29309844970703, 34.36914825439453, 35.30637741088867, 36.24361038208008, 35.514163970947266, 36.2568359375, 36.99951171875, 36.190521240234375, 36.818267822265625, 37.44601821899414, 36.78335189819336, 37.310367584228516, 37.83738327026367, 37.26987838745117, 37.71422576904297, 38.158573150634766, 37.78143310546875, 38.33214569091797, 38.88285446166992, 38.001914978027344, 38.494903564453125, 38.987892150878906, 30.310667037963867, 33.67733383178711, 37.04399871826172, 32.99696731567383, 35.144046783447266, 37.29112243652344, 34.38920211791992, 35.90420150756836, 37.4192008972168, 35.594791412353516, 36.69824981689453, 37.80170440673828, 36.299156188964844, 37.16217041015625, 38.02518081665039, 36.87721252441406, 37.54290008544922, 38.20858383178711, 37.3067512512207, 37.8258056640625, 38.34486389160156, 37.57125473022461, 38.00001907348633, 38.42878723144531, 20.60996437072754, 21.41386604309082, 20.60996437072754, 21.41386604309082, 20.8622989654541, 21.44428253173828, 22.242834091186523, 22.70671272277832, 20.8622989654541, 21.44428253173828, 22.242834091186523, 22.70671272277832, 23.285972595214844, 23.49408721923828, 24.038454055786133, 24.21080780029297, 24.567373275756836, 24.714590072631836, 23.285972595214844, 23.49408721923828, 24.038454055786133, 24.21080780029297, 24.567373275756836, 24.714590072631836, 36.84611511230469, 37.4486198425293, 37.47694396972656, 37.954376220703125, 37.849571228027344, 38.25312423706055, 38.17618179321289, 38.514976501464844, 38.4442253112793, 38.72987365722656, 36.84611511230469, 37.4486198425293, 37.47694396972656, 37.954376220703125, 37.849571228027344, 38.25312423706055, 38.17618179321289, 38.514976501464844, 38.4442253112793, 38.72987365722656, 12.673333168029785, 25.34666633605957, 38.02000045776367, 12.732029914855957, 25.118934631347656, 37.50584030151367, 12.862820625305176, 24.753068923950195, 36.64331817626953, 13.043091773986816, 24.317523956298828, 35.591957092285156, 13.259340286254883, 23.846277236938477, 34.4332160949707, 13.498849868774414, 23.368785858154297, 33.23872375488281, 13.747953414916992, 22.914596557617188, 32.081241607666016, 13.990424156188965, 22.51664924621582, 31.042875289916992, 12.673333168029785, 25.34666633605957, 38.02000045776367, 12.732029914855957, 25.118934631347656, 37.50584030151367, 12.862820625305176, 24.753068923950195, 36.64331817626953, 13.043091773986816, 24.317523956298828, 35.591957092285156, 13.259340286254883, 23.846277236938477, 34.4332160949707, 13.498849868774414, 23.368785858154297, 33.23872375488281, 13.747953414916992, 22.914596557617188, 32.081241607666016, 13.990424156188965, 22.51664924621582, 31.042875289916992], "YA2": [0.0, 0.0, 0.0, 3.431999921798706, 3.431999921798706, 3.431999921798706, 5.559840202331543, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, 16.52507972717285, 0.0, 0.0, 0.0, -3.431999921798706, -3.431999921798706, -3.431999921798706, -5.559840202331543, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, -16.52507972717285, 0.0, 0.0, 0.0, 0.6480000019073486, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, 6.624000072479248, 7.061654090881348, 7.061654090881348, 7.061654090881348, 0.0, 0.0, 0.0, -0.6480000019073486, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, -6.624000072479248, -7.061654090881348, -7.061654090881348, -7.061654090881348, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 3.431999921798706, 3.431999921798706, -3.431999921798706, -3.431999921798706, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, 1.1450448137845768e-16, 1.1450448137845768e-16, 1.1450448137845768e-16, 0.34361159801483154, 0.34361159801483154, 0.34361159801483154, 0.6755219101905823, 0.6755219101905823, 0.6755219101905823, 0.9844281673431396, 0.9844281673431396, 0.9844281673431396, 1.2598108053207397, 1.2598108053207397, 1.2598108053207397, 1.4922921657562256, 1.4922921657562256, 1.4922921657562256, 1.6739553213119507, 1.6739553213119507, 1.6739553213119507, 1.7986139059066772, 1.7986139059066772, 1.7986139059066772, -1.1450448137845768e-16, -1.1450448137845768e-16, -1.1450448137845768e-16, -0.34361159801483154, -0.34361159801483154, -0.34361159801483154, -0.6755219101905823, -0.6755219101905823, -0.6755219101905823, -0.9844281673431396, -0.9844281673431396, -0.9844281673431396, -1.2598108053207397, -1.2598108053207397, -1.2598108053207397, -1.4922921657562256, -1.4922921657562256, -1.4922921657562256, -1.6739553213119507, -1.6739553213119507, -1.6739553213119507, -1.7986139059066772, -1.7986139059066772, -1.7986139059066772], "ZA2": [-0.5929538607597351, -0.8159343004226685, -1.04131019115448, -0.31409257650375366, -0.36775311827659607, -0.42425736784935, -0.20529413223266602, -0.2200717031955719, -0.2379210740327835, 0.16699323058128357, 0.1554182469844818, 0.14139486849308014, 0.3979485332965851, 0.3852863013744354, 0.37652555108070374, 0.6094448566436768, 0.5990551114082336, 0.5918964147567749, 0.7580814361572266, 0.7492650747299194, 0.7432085275650024, 0.8211718201637268, 0.816145122051239, 0.8026491403579712, -0.5929538607597351, -0.8159343004226685, -1.04131019115448, -0.31409257650375366, -0.36775311827659607, -0.42425736784935, -0.20529413223266602, -0.2200717031955719, -0.2379210740327835, 0.16699323058128357, 0.1554182469844818, 0.14139486849308014, 0.3979485332965851, 0.3852863013744354, 0.37652555108070374, 0.6094448566436768, 0.5990551114082336, 0.5918964147567749, 0.7580814361572266, 0.7492650747299194, 0.7432085275650024, 0.8211718201637268, 0.816145122051239, 0.8026491403579712, 1.465999960899353, 1.465999960899353, 1.465999960899353, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 1.465999960899353, 1.465999960899353, 1.465999960899353, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 1.5399999618530273, 1.5399999618530273, 1.5399999618530273, 3.165102481842041, 3.165102481842041, 3.165102481842041, 4.007346153259277, 4.007346153259277, 4.007346153259277, 6.167900085449219, 6.167900085449219, 6.167900085449219, 7.43019962310791, 7.43019962310791, 7.43019962310791, 8.466141700744629, 8.466141700744629, 8.466141700744629, 9.235916137695312, 9.235916137695312, 9.235916137695312, 9.709940910339355, 9.709940910339355, 9.709940910339355, -0.4544593393802643, -0.4962090849876404, -0.4544593393802643, -0.4962090849876404, -0.24017803370952606, -0.26044800877571106, 0.13972683250904083, 0.12370137125253677, -0.24017803370952606, -0.26044800877571106, 0.13972683250904083, 0.12370137125253677, 0.37476086616516113, 0.3630693554878235, 0.5904626250267029, 0.5808077454566956, 0.74200040102005, 0.7337702512741089, 0.37476086616516113, 0.3630693554878235, 0.5904626250267029, 0.5808077454566956, 0.74200040102005, 0.7337702512741089, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XB1": [16.05350112915039, 17.84021759033203, 19.627063751220703, 17.564340591430664, 18.46965980529785, 19.374980926513672, 19.614139556884766, 20.335750579833984, 21.057350158691406, 20.892614364624023, 21.499629974365234, 22.106639862060547, 22.056367874145508, 22.65961456298828, 23.262855529785156, 22.874370574951172, 23.389633178710938, 23.90489387512207, 23.220661163330078, 23.69867706298828, 24.176692962646484, 24.420379638671875, 24.68103790283203, 24.941696166992188, 16.05350112915039, 17.84021759033203, 19.627063751220703, 17.564340591430664, 18.46965980529785, 19.374980926513672, 19.614139556884766, 20.335750579833984, 21.057350158691406, 20.892614364624023, 21.499629974365234, 22.106639862060547, 22.056367874145508, 22.65961456298828, 23.262855529785156, 22.874370574951172, 23.389633178710938, 23.90489387512207, 23.220661163330078, 23.69867706298828, 24.176692962646484, 24.420379638671875, 24.68103790283203, 24.941696166992188, 33.43191909790039, 34.77082061767578, 36.109718322753906, 34.77149200439453, 35.514163970947266, 36.2568359375, 35.562774658203125, 36.190521240234375, 36.818267822265625, 36.2563362121582, 36.78335189819336, 37.310367584228516, 36.82552719116211, 37.26987838745117, 37.71422576904297, 37.23072052001953, 37.61621856689453, 38.00171661376953, 37.50892639160156, 38.001914978027344, 38.494903564453125, 37.59687042236328, 38.07161331176758, 38.54635238647461, 33.43191909790039, 34.77082061767578, 36.109718322753906, 34.77149200439453, 35.514163970947266, 36.2568359375, 35.562774658203125, 36.190521240234375, 36.818267822265625, 36.2563362121582, 36.78335189819336, 37.310367584228516, 36.82552719116211, 37.26987838745117, 37.71422576904297, 37.23072052001953, 37.61621856689453, 38.00171661376953, 37.50892639160156, 38.001914978027344, 38.494903564453125, 37.59687042236328, 38.07161331176758, 38.54635238647461, 30.849889755249023, 32.99696731567383, 35.144046783447266, 32.87419891357422, 34.38920211791992, 35.90420150756836, 34.491336822509766, 35.594791412353516, 36.69824981689453, 35.4361457824707, 36.299156188964844, 37.16217041015625, 36.21152877807617, 36.87721252441406, 37.54290008544922, 36.78769302368164, 37.3067512512207, 37.8258056640625, 37.14249038696289, 37.57125473022461, 38.00001907348633, 37.262290954589844, 37.66056823730469, 38.05884552001953, 20.28030014038086, 20.862295150756836, 20.28030014038086, 20.862295150756836, 21.778945922851562, 22.242834091186523, 22.713647842407227, 23.103870391845703, 21.778945922851562, 22.242834091186523, 22.713647842407227, 23.103870391845703, 23.866098403930664, 24.038454055786133, 24.420156478881836, 24.567373275756836, 24.654708862304688, 24.791284561157227, 23.866098403930664, 24.038454055786133, 24.420156478881836, 24.567373275756836, 24.654708862304688, 24.791284561157227, 36.99951171875, 37.47694396972656, 37.44601821899414, 37.849571228027344, 37.83738327026367, 38.17618179321289, 38.158573150634766, 38.4442253112793, 38.38721466064453, 38.63503646850586, 36.99951171875, 37.47694396972656, 37.44601821899414, 37.849571228027344, 37.83738327026367, 38.17618179321289, 38.158573150634766, 38.4442253112793, 38.38721466064453, 38.63503646850586, 0.3451245129108429, 12.732029914855957, 25.118934631347656, 0.9725714325904846, 12.862820625305176, 24.753068923950195, 1.768660306930542, 13.043091773986816, 24.317523956298828, 2.67240309715271, 13.259340286254883, 23.846277236938477, 3.6289138793945312, 13.498849868774414, 23.368785858154297, 4.581310272216797, 13.747953414916992, 22.914596557617188, 5.464198589324951, 13.990424156188965, 22.51664924621582, 6.182833194732666, 14.201847076416016, 22.220861434936523, 0.3451245129108429, 12.732029914855957, 25.118934631347656, 0.9725714325904846, 12.862820625305176, 24.753068923950195, 1.768660306930542, 13.043091773986816, 24.317523956298828, 2.67240309715271, 13.259340286254883, 23.846277236938477, 3.6289138793945312, 13.498849868774414, 23.368785858154297, 4.581310272216797, 13.747953414916992, 22.914596557617188, 5.464198589324951, 13.990424156188965, 22.51664924621582, 6.182833194732666, 14.201847076416016, 22.220861434936523], "YB1": [3.431999921798706, 3.431999921798706, 3.431999921798706, 5.559840202331543, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, 16.52507972717285, 17.15999984741211, 17.15999984741211, 17.15999984741211, -3.431999921798706, -3.431999921798706, -3.431999921798706, -5.559840202331543, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, -16.52507972717285, -17.15999984741211, -17.15999984741211, -17.15999984741211, 0.6480000019073486, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, 6.624000072479248, 7.061654090881348, 7.061654090881348, 7.061654090881348, 7.199999809265137, 7.199999809265137, 7.199999809265137, -0.6480000019073486, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, -6.624000072479248, -7.061654090881348, -7.061654090881348, -7.061654090881348, -7.199999809265137, -7.199999809265137, -7.199999809265137, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.559840202331543, 5.559840202331543, -5.559840202331543, -5.559840202331543, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, 0.34361159801483154, 0.34361159801483154, 0.34361159801483154, 0.6755219101905823, 0.6755219101905823, 0.6755219101905823, 0.9844281673431396, 0.9844281673431396, 0.9844281673431396, 1.2598108053207397, 1.2598108053207397, 1.2598108053207397, 1.4922921657562256, 1.4922921657562256, 1.4922921657562256, 1.6739553213119507, 1.6739553213119507, 1.6739553213119507, 1.7986139059066772, 1.7986139059066772, 1.7986139059066772, 1.862022876739502, 1.862022876739502, 1.862022876739502, -0.34361159801483154, -0.34361159801483154, -0.34361159801483154, -0.6755219101905823, -0.6755219101905823, -0.6755219101905823, -0.9844281673431396, -0.9844281673431396, -0.9844281673431396, -1.2598108053207397, -1.2598108053207397, -1.2598108053207397, -1.4922921657562256, -1.4922921657562256, -1.4922921657562256, -1.6739553213119507, -1.6739553213119507, -1.6739553213119507, -1.7986139059066772, -1.7986139059066772, -1.7986139059066772, -1.862022876739502, -1.862022876739502, -1.862022876739502], "ZB1": [-0.25523144006729126, -0.3382329046726227, -0.4163912236690521, -0.18857616186141968, -0.20725120604038239, -0.22216369211673737, 0.1525907814502716, 0.16699323058128357, 0.1554182469844818, 0.3869132399559021, 0.39913541078567505, 0.3895053565502167, 0.6002091765403748, 0.6094448566436768, 0.5990551114082336, 0.7501348257064819, 0.7580814361572266, 0.7492650747299194, 0.8136037588119507, 0.8209987282752991, 0.8128424286842346, 0.8597162365913391, 0.8700758814811707, 0.8677851557731628, -0.25523144006729126, -0.3382329046726227, -0.4163912236690521, -0.18857616186141968, -0.20725120604038239, -0.22216369211673737, 0.1525907814502716, 0.16699323058128357, 0.1554182469844818, 0.3869132399559021, 0.39913541078567505, 0.3895053565502167, 0.6002091765403748, 0.6094448566436768, 0.5990551114082336, 0.7501348257064819, 0.7580814361572266, 0.7492650747299194, 0.8136037588119507, 0.8209987282752991, 0.8128424286842346, 0.8597162365913391, 0.8700758814811707, 0.8677851557731628, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 2.5587539672851562, 2.5587539672851562, 2.5587539672851562, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 2.5587539672851562, 2.5587539672851562, 2.5587539672851562, 3.165102481842041, 3.165102481842041, 3.165102481842041, 4.007346153259277, 4.007346153259277, 4.007346153259277, 6.167900085449219, 6.167900085449219, 6.167900085449219, 7.43019962310791, 7.43019962310791, 7.43019962310791, 8.466141700744629, 8.466141700744629, 8.466141700744629, 9.235916137695312, 9.235916137695312, 9.235916137695312, 9.709940910339355, 9.709940910339355, 9.709940910339355, 9.869999885559082, 9.869999885559082, 9.869999885559082, -0.2391335517168045, -0.2456134557723999, -0.2391335517168045, -0.2456134557723999, 0.14139486849308014, 0.13972683250904083, 0.37781575322151184, 0.3764812648296356, 0.14139486849308014, 0.13972683250904083, 0.37781575322151184, 0.3764812648296356, 0.5918964147567749, 0.5904626250267029, 0.7432085275650024, 0.74200040102005, 0.8072465062141418, 0.8061321973800659, 0.5918964147567749, 0.5904626250267029, 0.7432085275650024, 0.74200040102005, 0.8072465062141418, 0.8061321973800659, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XB2": [17.84021759033203, 19.627063751220703, 21.41386604309082, 18.46965980529785, 19.374980926513672, 20.28030014038086, 20.335750579833984, 21.057350158691406, 21.778945922851562, 21.499629974365234, 22.106639862060547, 22.713647842407227, 22.65961456298828, 23.262855529785156, 23.866098403930664, 23.389633178710938, 23.90489387512207, 24.420156478881836, 23.69867706298828, 24.176692962646484, 24.654708862304688, 24.68103790283203, 24.941696166992188, 25.202354431152344, 17.84021759033203, 19.627063751220703, 21.41386604309082, 18.46965980529785, 19.374980926513672, 20.28030014038086, 20.335750579833984, 21.057350158691406, 21.778945922851562, 21.499629974365234, 22.106639862060547, 22.713647842407227, 22.65961456298828, 23.262855529785156, 23.866098403930664, 23.389633178710938, 23.90489387512207, 24.420156478881836, 23.69867706298828, 24.176692962646484, 24.654708862304688, 24.68103790283203, 24.941696166992188, 25.202354431152344, 34.77082061767578, 36.109718322753906, 37.4486198425293, 35.514163970947266, 36.2568359375, 36.99951171875, 36.190521240234375, 36.818267822265625, 37.44601821899414, 36.78335189819336, 37.310367584228516, 37.83738327026367, 37.26987838745117, 37.71422576904297, 38.158573150634766, 37.61621856689453, 38.00171661376953, 38.38721466064453, 38.001914978027344, 38.494903564453125, 38.987892150878906, 38.07161331176758, 38.54635238647461, 39.021095275878906, 34.77082061767578, 36.109718322753906, 37.4486198425293, 35.514163970947266, 36.2568359375, 36.99951171875, 36.190521240234375, 36.818267822265625, 37.44601821899414, 36.78335189819336, 37.310367584228516, 37.83738327026367, 37.26987838745117, 37.71422576904297, 38.158573150634766, 37.61621856689453, 38.00171661376953, 38.38721466064453, 38.001914978027344, 38.494903564453125, 38.987892150878906, 38.07161331176758, 38.54635238647461, 39.021095275878906, 32.99696731567383, 35.144046783447266, 37.29112243652344, 34.38920211791992, 35.90420150756836, 37.4192008972168, 35.594791412353516, 36.69824981689453, 37.80170440673828, 36.299156188964844, 37.16217041015625, 38.02518081665039, 36.87721252441406, 37.54290008544922, 38.20858383178711, 37.3067512512207, 37.8258056640625, 38.34486389160156, 37.57125473022461, 38.00001907348633, 38.42878723144531, 37.66056823730469, 38.05884552001953, 38.457122802734375, 20.862295150756836, 21.44428253173828, 20.862295150756836, 21.44428253173828, 22.242834091186523, 22.70671272277832, 23.103870391845703, 23.49408721923828, 22.242834091186523, 22.70671272277832, 23.103870391845703, 23.49408721923828, 24.038454055786133, 24.21080780029297, 24.567373275756836, 24.714590072631836, 24.791284561157227, 24.927860260009766, 24.038454055786133, 24.21080780029297, 24.567373275756836, 24.714590072631836, 24.791284561157227, 24.927860260009766, 37.47694396972656, 37.954376220703125, 37.849571228027344, 38.25312423706055, 38.17618179321289, 38.514976501464844, 38.4442253112793, 38.72987365722656, 38.63503646850586, 38.88285446166992, 37.47694396972656, 37.954376220703125, 37.849571228027344, 38.25312423706055, 38.17618179321289, 38.514976501464844, 38.4442253112793, 38.72987365722656, 38.63503646850586, 38.88285446166992, 12.732029914855957, 25.118934631347656, 37.50584030151367, 12.862820625305176, 24.753068923950195, 36.64331817626953, 13.043091773986816, 24.317523956298828, 35.591957092285156, 13.259340286254883, 23.846277236938477, 34.4332160949707, 13.498849868774414, 23.368785858154297, 33.23872375488281, 13.747953414916992, 22.914596557617188, 32.081241607666016, 13.990424156188965, 22.51664924621582, 31.042875289916992, 14.201847076416016, 22.220861434936523, 30.23987579345703, 12.732029914855957, 25.118934631347656, 37.50584030151367, 12.862820625305176, 24.753068923950195, 36.64331817626953, 13.043091773986816, 24.317523956298828, 35.591957092285156, 13.259340286254883, 23.846277236938477, 34.4332160949707, 13.498849868774414, 23.368785858154297, 33.23872375488281, 13.747953414916992, 22.914596557617188, 32.081241607666016, 13.990424156188965, 22.51664924621582, 31.042875289916992, 14.201847076416016, 22.220861434936523, 30.23987579345703], "YB2": [3.431999921798706, 3.431999921798706, 3.431999921798706, 5.559840202331543, 5.559840202331543, 5.559840202331543, 9.533585548400879, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, 12.01200008392334, 14.26801872253418, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, 16.52507972717285, 17.15999984741211, 17.15999984741211, 17.15999984741211, -3.431999921798706, -3.431999921798706, -3.431999921798706, -5.559840202331543, -5.559840202331543, -5.559840202331543, -9.533585548400879, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, -12.01200008392334, -14.26801872253418, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, -16.52507972717285, -17.15999984741211, -17.15999984741211, -17.15999984741211, 0.6480000019073486, 0.6480000019073486, 0.6480000019073486, 2.7553207874298096, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, 6.624000072479248, 7.061654090881348, 7.061654090881348, 7.061654090881348, 7.199999809265137, 7.199999809265137, 7.199999809265137, -0.6480000019073486, -0.6480000019073486, -0.6480000019073486, -2.7553207874298096, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, -6.624000072479248, -7.061654090881348, -7.061654090881348, -7.061654090881348, -7.199999809265137, -7.199999809265137, -7.199999809265137, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5.559840202331543, 5.559840202331543, -5.559840202331543, -5.559840202331543, 9.533585548400879, 9.533585548400879, 12.01200008392334, 12.01200008392334, -9.533585548400879, -9.533585548400879, -12.01200008392334, -12.01200008392334, 14.26801872253418, 14.26801872253418, 15.85377311706543, 15.85377311706543, 16.52507972717285, 16.52507972717285, -14.26801872253418, -14.26801872253418, -15.85377311706543, -15.85377311706543, -16.52507972717285, -16.52507972717285, 2.7553207874298096, 2.7553207874298096, 4.000105857849121, 4.000105857849121, 5.0911688804626465, 5.0911688804626465, 5.986581325531006, 5.986581325531006, 6.624000072479248, 6.624000072479248, -2.7553207874298096, -2.7553207874298096, -4.000105857849121, -4.000105857849121, -5.0911688804626465, -5.0911688804626465, -5.986581325531006, -5.986581325531006, -6.624000072479248, -6.624000072479248, 0.34361159801483154, 0.34361159801483154, 0.34361159801483154, 0.6755219101905823, 0.6755219101905823, 0.6755219101905823, 0.9844281673431396, 0.9844281673431396, 0.9844281673431396, 1.2598108053207397, 1.2598108053207397, 1.2598108053207397, 1.4922921657562256, 1.4922921657562256, 1.4922921657562256, 1.6739553213119507, 1.6739553213119507, 1.6739553213119507, 1.7986139059066772, 1.7986139059066772, 1.7986139059066772, 1.862022876739502, 1.862022876739502, 1.862022876739502, -0.34361159801483154, -0.34361159801483154, -0.34361159801483154, -0.6755219101905823, -0.6755219101905823, -0.6755219101905823, -0.9844281673431396, -0.9844281673431396, -0.9844281673431396, -1.2598108053207397, -1.2598108053207397, -1.2598108053207397, -1.4922921657562256, -1.4922921657562256, -1.4922921657562256, -1.6739553213119507, -1.6739553213119507, -1.6739553213119507, -1.7986139059066772, -1.7986139059066772, -1.7986139059066772, -1.862022876739502, -1.862022876739502, -1.862022876739502], "ZB2": [-0.3382329046726227, -0.4163912236690521, -0.4962090849876404, -0.20725120604038239, -0.22216369211673737, -0.2391335517168045, 0.16699323058128357, 0.1554182469844818, 0.14139486849308014, 0.39913541078567505, 0.3895053565502167, 0.37781575322151184, 0.6094448566436768, 0.5990551114082336, 0.5918964147567749, 0.7580814361572266, 0.7492650747299194, 0.7432085275650024, 0.8209987282752991, 0.8128424286842346, 0.8072465062141418, 0.8700758814811707, 0.8677851557731628, 0.8616151213645935, -0.3382329046726227, -0.4163912236690521, -0.4962090849876404, -0.20725120604038239, -0.22216369211673737, -0.2391335517168045, 0.16699323058128357, 0.1554182469844818, 0.14139486849308014, 0.39913541078567505, 0.3895053565502167, 0.37781575322151184, 0.6094448566436768, 0.5990551114082336, 0.5918964147567749, 0.7580814361572266, 0.7492650747299194, 0.7432085275650024, 0.8209987282752991, 0.8128424286842346, 0.8072465062141418, 0.8700758814811707, 0.8677851557731628, 0.8616151213645935, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 2.5587539672851562, 2.5587539672851562, 2.5587539672851562, 1.5643478631973267, 1.5643478631973267, 1.5643478631973267, 1.884178876876831, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 2.4713337421417236, 2.537757158279419, 2.537757158279419, 2.537757158279419, 2.5587539672851562, 2.5587539672851562, 2.5587539672851562, 3.165102481842041, 3.165102481842041, 3.165102481842041, 4.007346153259277, 4.007346153259277, 4.007346153259277, 6.167900085449219, 6.167900085449219, 6.167900085449219, 7.43019962310791, 7.43019962310791, 7.43019962310791, 8.466141700744629, 8.466141700744629, 8.466141700744629, 9.235916137695312, 9.235916137695312, 9.235916137695312, 9.709940910339355, 9.709940910339355, 9.709940910339355, 9.869999885559082, 9.869999885559082, 9.869999885559082, -0.2456134557723999, -0.26044800877571106, -0.2456134557723999, -0.26044800877571106, 0.13972683250904083, 0.12370137125253677, 0.3764812648296356, 0.3630693554878235, 0.13972683250904083, 0.12370137125253677, 0.3764812648296356, 0.3630693554878235, 0.5904626250267029, 0.5808077454566956, 0.74200040102005, 0.7337702512741089, 0.8061321973800659, 0.7985035181045532, 0.5904626250267029, 0.5808077454566956, 0.74200040102005, 0.7337702512741089, 0.8061321973800659, 0.7985035181045532, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 1.884178876876831, 1.884178876876831, 2.07310152053833, 2.07310152053833, 2.2386937141418457, 2.2386937141418457, 2.374591827392578, 2.374591827392578, 2.4713337421417236, 2.4713337421417236, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "XC": [16.47319984436035, 18.656368255615234, 20.840206146240234, 17.61736297607422, 18.695589065551758, 19.773801803588867, 19.1993408203125, 20.012800216674805, 20.826257705688477, 20.751615524291992, 21.415918350219727, 22.08022117614746, 21.973865509033203, 22.639692306518555, 23.305519104003906, 22.884809494018555, 23.444061279296875, 24.003313064575195, 23.419994354248047, 23.91663360595703, 24.413272857666016, 24.13166618347168, 24.54652976989746, 24.96139144897461, 16.47319984436035, 18.656368255615234, 20.840206146240234, 17.61736297607422, 18.695589065551758, 19.773801803588867, 19.1993408203125, 20.012800216674805, 20.826257705688477, 20.751615524291992, 21.415918350219727, 22.08022117614746, 21.973865509033203, 22.639692306518555, 23.305519104003906, 22.884809494018555, 23.444061279296875, 24.003313064575195, 23.419994354248047, 23.91663360595703, 24.413272857666016, 24.13166618347168, 24.54652976989746, 24.96139144897461, 34.262184143066406, 35.64381790161133, 37.02545166015625, 34.73167037963867, 35.57162094116211, 36.41157150268555, 35.6810417175293, 36.36625289916992, 37.05146026611328, 36.34259033203125, 36.91997528076172, 37.49735641479492, 36.90519332885742, 37.39087677001953, 37.876556396484375, 37.339317321777344, 37.75423812866211, 38.16916275024414, 37.76121139526367, 38.28306198120117, 38.80491256713867, 37.91579818725586, 38.399662017822266, 38.88352584838867, 34.262184143066406, 35.64381790161133, 37.02545166015625, 34.73167037963867, 35.57162094116211, 36.41157150268555, 35.6810417175293, 36.36625289916992, 37.05146026611328, 36.34259033203125, 36.91997528076172, 37.49735641479492, 36.90519332885742, 37.39087677001953, 37.876556396484375, 37.339317321777344, 37.75423812866211, 38.16916275024414, 37.76121139526367, 38.28306198120117, 38.80491256713867, 37.91579818725586, 38.399662017822266, 38.88352584838867, 30.964599609375, 33.72146987915039, 36.47834396362305, 33.23532485961914, 35.06636428833008, 36.897403717041016, 34.66468811035156, 35.97391891479492, 37.283145904541016, 35.701168060302734, 36.68439865112305, 37.667633056640625, 36.397098541259766, 37.16144561767578, 37.92579650878906, 36.94388961791992, 37.536258697509766, 38.128631591796875, 37.320526123046875, 37.794437408447266, 38.268348693847656, 37.51253128051758, 37.92605209350586, 38.33957290649414, 20.56324005126953, 21.256513595581055, 20.56324005126953, 21.256513595581055, 21.421831130981445, 21.944766998291016, 22.566587448120117, 22.99363899230957, 21.421831130981445, 21.944766998291016, 22.566587448120117, 22.99363899230957, 23.614654541015625, 23.804889678955078, 24.262968063354492, 24.422752380371094, 24.64385414123535, 24.785751342773438, 23.614654541015625, 23.804889678955078, 24.262968063354492, 24.422752380371094, 24.64385414123535, 24.785751342773438, 37.02653503417969, 37.566505432128906, 37.55313491821289, 37.99362564086914, 37.920082092285156, 38.291255950927734, 38.232147216796875, 38.544368743896484, 38.47294616699219, 38.739681243896484, 37.02653503417969, 37.566505432128906, 37.55313491821289, 37.99362564086914, 37.920082092285156, 38.291255950927734, 38.232147216796875, 38.544368743896484, 38.47294616699219, 38.739681243896484, 9.570151329040527, 22.100271224975586, 34.63039016723633, 9.762781143188477, 21.901357650756836, 34.03993606567383, 10.057371139526367, 21.639711380004883, 33.22205352783203, 10.41854476928711, 21.34922981262207, 32.27991485595703, 10.821986198425293, 21.05042266845703, 31.278860092163086, 11.243829727172852, 20.76211929321289, 30.28040885925293, 11.657580375671387, 20.50401496887207, 29.35045051574707, 12.02798080444336, 20.300600051879883, 28.57322120666504, 9.570151329040527, 22.100271224975586, 34.63039016723633, 9.762781143188477, 21.901357650756836, 34.03993606567383, 10.057371139526367, 21.639711380004883, 33.22205352783203, 10.41854476928711, 21.34922981262207, 32.27991485595703, 10.821986198425293, 21.05042266845703, 31.278860092163086, 11.243829727172852, 20.76211929321289, 30.28040885925293, 11.657580375671387, 20.50401496887207, 29.35045051574707, 12.02798080444336, 20.300600051879883, 28.57322120666504], "YC": [1.715999960899353, 1.715999960899353, 1.715999960899353, 4.495920181274414, 4.495920181274414, 4.495920181274414, 7.546712398529053, 7.546712398529053, 7.546712398529053, 10.77279281616211, 10.77279281616211, 10.77279281616211, 13.140008926391602, 13.140008926391602, 13.140008926391602, 15.060895919799805, 15.060895919799805, 15.060895919799805, 16.18942642211914, 16.18942642211914, 16.18942642211914, 16.842540740966797, 16.842540740966797, 16.842540740966797, -1.715999960899353, -1.715999960899353, -1.715999960899353, -4.495920181274414, -4.495920181274414, -4.495920181274414, -7.546712398529053, -7.546712398529053, -7.546712398529053, -10.77279281616211, -10.77279281616211, -10.77279281616211, -13.140008926391602, -13.140008926391602, -13.140008926391602, -15.060895919799805, -15.060895919799805, -15.060895919799805, -16.18942642211914, -16.18942642211914, -16.18942642211914, -16.842540740966797, -16.842540740966797, -16.842540740966797, 0.3240000009536743, 0.3240000009536743, 0.3240000009536743, 1.701660394668579, 1.701660394668579, 1.701660394668579, 3.377713203430176, 3.377713203430176, 3.377713203430176, 4.545637130737305, 4.545637130737305, 4.545637130737305, 5.538875102996826, 5.538875102996826, 5.538875102996826, 6.305290699005127, 6.305290699005127, 6.305290699005127, 6.842826843261719, 6.842826843261719, 6.842826843261719, 7.130826950073242, 7.130826950073242, 7.130826950073242, -0.3240000009536743, -0.3240000009536743, -0.3240000009536743, -1.701660394668579, -1.701660394668579, -1.701660394668579, -3.377713203430176, -3.377713203430176, -3.377713203430176, -4.545637130737305, -4.545637130737305, -4.545637130737305, -5.538875102996826, -5.538875102996826, -5.538875102996826, -6.305290699005127, -6.305290699005127, -6.305290699005127, -6.842826843261719, -6.842826843261719, -6.842826843261719, -7.130826950073242, -7.130826950073242, -7.130826950073242, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 4.495920181274414, 4.495920181274414, -4.495920181274414, -4.495920181274414, 7.546712398529053, 7.546712398529053, 10.77279281616211, 10.77279281616211, -7.546712398529053, -7.546712398529053, -10.77279281616211, -10.77279281616211, 13.140008926391602, 13.140008926391602, 15.060895919799805, 15.060895919799805, 16.18942642211914, 16.18942642211914, -13.140008926391602, -13.140008926391602, -15.060895919799805, -15.060895919799805, -16.18942642211914, -16.18942642211914, 1.701660394668579, 1.701660394668579, 3.377713203430176, 3.377713203430176, 4.545637130737305, 4.545637130737305, 5.538875102996826, 5.538875102996826, 6.305290699005127, 6.305290699005127, -1.701660394668579, -1.701660394668579, -3.377713203430176, -3.377713203430176, -4.545637130737305, -4.545637130737305, -5.538875102996826, -5.538875102996826, -6.305290699005127, -6.305290699005127, 0.17180579900741577, 0.17180579900741577, 0.17180579900741577, 0.5095667839050293, 0.5095667839050293, 0.5095667839050293, 0.8299750089645386, 0.8299750089645386, 0.8299750089645386, 1.1221195459365845, 1.1221195459365845, 1.1221195459365845, 1.3760515451431274, 1.3760515451431274, 1.3760515451431274, 1.583123803138733, 1.583123803138733, 1.583123803138733, 1.736284613609314, 1.736284613609314, 1.736284613609314, 1.8303184509277344, 1.8303184509277344, 1.8303184509277344, -0.17180579900741577, -0.17180579900741577, -0.17180579900741577, -0.5095667839050293, -0.5095667839050293, -0.5095667839050293, -0.8299750089645386, -0.8299750089645386, -0.8299750089645386, -1.1221195459365845, -1.1221195459365845, -1.1221195459365845, -1.3760515451431274, -1.3760515451431274, -1.3760515451431274, -1.583123803138733, -1.583123803138733, -1.583123803138733, -1.736284613609314, -1.736284613609314, -1.736284613609314, -1.8303184509277344, -1.8303184509277344, -1.8303184509277344], "ZC": [-0.42112135887145996, -0.5632134079933167, -0.6914868354797363, -0.2501054108142853, -0.282705157995224, -0.31613820791244507, -0.016060063615441322, -0.029218340292572975, -0.04492587968707085, 0.2855444550514221, 0.27495110034942627, 0.26227593421936035, 0.5055940747261047, 0.4951156973838806, 0.4845360517501831, 0.6853360533714294, 0.6766111254692078, 0.6678012013435364, 0.7909252047538757, 0.7832169532775879, 0.7754331827163696, 0.8469980955123901, 0.8404558897018433, 0.8297032713890076, -0.42112135887145996, -0.5632134079933167, -0.6914868354797363, -0.2501054108142853, -0.282705157995224, -0.31613820791244507, -0.016060063615441322, -0.029218340292572975, -0.04492587968707085, 0.2855444550514221, 0.27495110034942627, 0.26227593421936035, 0.5055940747261047, 0.4951156973838806, 0.4845360517501831, 0.6853360533714294, 0.6766111254692078, 0.6678012013435364, 0.7909252047538757, 0.7832169532775879, 0.7754331827163696, 0.8469980955123901, 0.8404558897018433, 0.8297032713890076, 1.5151739120483398, 1.5151739120483398, 1.5151739120483398, 1.7242634296417236, 1.7242634296417236, 1.7242634296417236, 1.9786401987075806, 1.9786401987075806, 1.9786401987075806, 2.155897617340088, 2.155897617340088, 2.155897617340088, 2.306642770767212, 2.306642770767212, 2.306642770767212, 2.4229626655578613, 2.4229626655578613, 2.4229626655578613, 2.5045454502105713, 2.5045454502105713, 2.5045454502105713, 2.548255681991577, 2.548255681991577, 2.548255681991577, 1.5151739120483398, 1.5151739120483398, 1.5151739120483398, 1.7242634296417236, 1.7242634296417236, 1.7242634296417236, 1.9786401987075806, 1.9786401987075806, 1.9786401987075806, 2.155897617340088, 2.155897617340088, 2.155897617340088, 2.306642770767212, 2.306642770767212, 2.306642770767212, 2.4229626655578613, 2.4229626655578613, 2.4229626655578613, 2.5045454502105713, 2.5045454502105713, 2.5045454502105713, 2.548255681991577, 2.548255681991577, 2.548255681991577, 2.352551221847534, 2.352551221847534, 2.352551221847534, 3.58622407913208, 3.58622407913208, 3.58622407913208, 5.087623119354248, 5.087623119354248, 5.087623119354248, 6.7990498542785645, 6.7990498542785645, 6.7990498542785645, 7.9481706619262695, 7.9481706619262695, 7.9481706619262695, 8.851029396057129, 8.851029396057129, 8.851029396057129, 9.472929000854492, 9.472929000854492, 9.472929000854492, 9.789970397949219, 9.789970397949219, 9.789970397949219, -0.3383292555809021, -0.3501083552837372, -0.3383292555809021, -0.3501083552837372, -0.04991324245929718, -0.060114163905382156, 0.25831449031829834, 0.250081866979599, -0.04991324245929718, -0.060114163905382156, 0.25831449031829834, 0.250081866979599, 0.48353472352027893, 0.47486603260040283, 0.6669955849647522, 0.6597362756729126, 0.774736225605011, 0.7683010101318359, 0.48353472352027893, 0.47486603260040283, 0.6669955849647522, 0.6597362756729126, 0.774736225605011, 0.7683010101318359, 1.7242634296417236, 1.7242634296417236, 1.9786401987075806, 1.9786401987075806, 2.155897617340088, 2.155897617340088, 2.306642770767212, 2.306642770767212, 2.4229626655578613, 2.4229626655578613, 1.7242634296417236, 1.7242634296417236, 1.9786401987075806, 1.9786401987075806, 2.155897617340088, 2.155897617340088, 2.306642770767212, 2.306642770767212, 2.4229626655578613, 2.4229626655578613, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], "normals": [[0.0884973332285881, -0.09389449656009674, 0.991641104221344], [0.0856255292892456, -0.11446695774793625, 0.9897300601005554], [0.08630309253931046, -0.13634613156318665, 0.9868948459625244], [0.04691323637962341, -0.0645354613661766, 0.9968120455741882], [0.04274511709809303, -0.07344226539134979, 0.996383011341095], [0.04496542736887932, -0.08542938530445099, 0.9953290224075317], [-0.019602974876761436, -0.08408022671937943, 0.9962661862373352], [0.016237644478678703, -0.10082225501537323, 0.9947719573974609], [0.019608939066529274, -0.10228072851896286, 0.9945622682571411], [-0.019884353503584862, -0.0839357003569603, 0.9962728023529053], [0.01595718413591385, -0.10067135840654373, 0.9947917461395264], [0.019328590482473373, -0.1021219789981842, 0.9945840835571289], [-0.015091286972165108, -0.0863962173461914, 0.996146559715271], [0.017291489988565445, -0.10121241956949234, 0.9947145581245422], [0.011967110447585583, -0.09912660717964172, 0.9950028657913208], [-0.015251031145453453, -0.08631426841020584, 0.9961512088775635], [0.01713237725198269, -0.10112515091896057, 0.9947261810302734], [0.011807854287326336, -0.09903306514024734, 0.9950140714645386], [-0.015363140031695366, -0.08625678718090057, 0.9961544871330261], [0.017020385712385178, -0.10106562823057175, 0.9947341680526733], [0.011695773340761662, -0.09897078573703766, 0.9950215816497803], [-0.039658695459365845, -0.021253958344459534, 0.9989871978759766], [0.008797808550298214, -0.08906535059213638, 0.9959869384765625], [0.023584352806210518, -0.10253386944532394, 0.9944499135017395], [0.0884973332285881, 0.09389449656009674, 0.991641104221344], [0.0856255292892456, 0.11446695774793625, 0.9897300601005554], [0.08630309253931046, 0.13634613156318665, 0.9868948459625244], [0.04691323637962341, 0.0645354613661766, 0.9968120455741882], [0.04274511709809303, 0.07344226539134979, 0.996383011341095], [0.04496542736887932, 0.08542938530445099, 0.9953290224075317], [-0.019602974876761436, 0.08408022671937943, 0.9962661862373352], [0.016237644478678703, 0.10082225501537323, 0.9947719573974609], [0.019608939066529274, 0.10228072851896286, 0.9945622682571411], [-0.019884353503584862, 0.0839357003569603, 0.9962728023529053], [0.01595718413591385, 0.10067135840654373, 0.9947917461395264], [0.019328590482473373, 0.1021219789981842, 0.9945840835571289], [-0.015091286972165108, 0.0863962173461914, 0.996146559715271], [0.017291489988565445, 0.10121241956949234, 0.9947145581245422], [0.011967110447585583, 0.09912660717964172, 0.9950028657913208], [-0.015251031145453453, 0.08631426841020584, 0.9961512088775635], [0.01713237725198269, 0.10112515091896057, 0.9947261810302734], [0.011807854287326336, 0.09903306514024734, 0.9950140714645386], [-0.015363140031695366, 0.08625678718090057, 0.9961544871330261], [0.017020385712385178, 0.10106562823057175, 0.9947341680526733], [0.011695773340761662, 0.09897078573703766, 0.9950215816497803], [-0.039658695459365845, 0.021253958344459534, 0.9989871978759766], [0.008797808550298214, 0.08906535059213638, 0.9959869384765625], [0.023584352806210518, 0.10253386944532394, 0.9944499135017395], [-0.0, -0.15005308389663696, 0.9886779189109802], [-0.0, -0.15005308389663696, 0.9886779189109802], [-0.0, -0.15005308389663696, 0.9886779189109802], [-0.0, -0.1500530242919922, 0.9886779189109802], [-0.0, -0.1500530242919922, 0.9886779189109802], [-0.0, -0.1500530242919922, 0.988677978515625], [-0.0, -0.15005291998386383, 0.9886779189109802], [-0.0, -0.15005291998386383, 0.9886779189109802], [-0.0, -0.15005294978618622, 0.988677978515625], [-0.0, -0.15005306899547577, 0.988677978515625], [-0.0, -0.15005306899547577, 0.988677978515625], [-0.0, -0.15005306899547577, 0.988677978515625], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.1500529944896698, 0.9886779189109802], [-0.0, -0.1500529944896698, 0.9886779189109802], [-0.0, -0.1500529944896698, 0.9886779189109802], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.15005315840244293, 0.9886779189109802], [-0.0, -0.1500522494316101, 0.9886780977249146], [-0.0, -0.1500522494316101, 0.9886780977249146], [-0.0, -0.1500522494316101, 0.9886780977249146], [-0.0, 0.15005308389663696, 0.9886779189109802], [-0.0, 0.15005308389663696, 0.9886779189109802], [-0.0, 0.15005308389663696, 0.9886779189109802], [-0.0, 0.1500530242919922, 0.9886779189109802], [-0.0, 0.1500530242919922, 0.9886779189109802], [-0.0, 0.1500530242919922, 0.988677978515625], [-0.0, 0.15005291998386383, 0.9886779189109802], [-0.0, 0.15005291998386383, 0.9886779189109802], [-0.0, 0.15005294978618622, 0.988677978515625], [-0.0, 0.15005306899547577, 0.988677978515625], [-0.0, 0.15005306899547577, 0.988677978515625], [-0.0, 0.15005306899547577, 0.988677978515625], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.1500529944896698, 0.9886779189109802], [-0.0, 0.1500529944896698, 0.9886779189109802], [-0.0, 0.1500529944896698, 0.9886779189109802], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.15005315840244293, 0.9886779189109802], [-0.0, 0.1500522494316101, 0.9886780977249146], [-0.0, 0.1500522494316101, 0.9886780977249146], [-0.0, 0.1500522494316101, 0.9886780977249146], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.037358783185482025, -0.09487909823656082, 0.9947875738143921], [0.0515848845243454, -0.10360685735940933, 0.9932796955108643], [0.037358783185482025, 0.09487909823656082, 0.9947875738143921], [0.0515848845243454, 0.10360685735940933, 0.9932796955108643], [0.003859831253066659, -0.0964653268456459, 0.9953288435935974], [0.034608107060194016, -0.10702040046453476, 0.9936543107032776], [0.0035790372639894485, -0.09629783034324646, 0.9953461289405823], [0.03432841971516609, -0.10684925317764282, 0.9936825037002563], [0.003859831253066659, 0.0964653268456459, 0.9953288435935974], [0.034608107060194016, 0.10702040046453476, 0.9936543107032776], [0.0035790372639894485, 0.09629783034324646, 0.9953461289405823], [0.03432841971516609, 0.10684925317764282, 0.9936825037002563], [0.008438155986368656, -0.09795079380273819, 0.9951555132865906], [0.055727768689394, -0.11343270540237427, 0.9919816255569458], [0.008278578519821167, -0.09785096347332001, 0.9951667189598083], [0.05556976795196533, -0.1133325919508934, 0.9920018315315247], [0.008166840299963951, -0.09778614342212677, 0.995173990726471], [0.055458586663007736, -0.11326797306537628, 0.9920154213905334], [0.008438155986368656, 0.09795079380273819, 0.9951555132865906], [0.055727768689394, 0.11343270540237427, 0.9919816255569458], [0.008278578519821167, 0.09785096347332001, 0.9951667189598083], [0.05556976795196533, 0.1133325919508934, 0.9920018315315247], [0.008166840299963951, 0.09778614342212677, 0.995173990726471], [0.055458586663007736, 0.11326797306537628, 0.9920154213905334], [-0.0, -0.1500530242919922, 0.9886779189109802], [-0.0, -0.1500530242919922, 0.9886779189109802], [-0.0, -0.15005293488502502, 0.9886779189109802], [-0.0, -0.15005293488502502, 0.9886779189109802], [-0.0, -0.15005305409431458, 0.9886779189109802], [-0.0, -0.15005305409431458, 0.9886779189109802], [-0.0, -0.15005314350128174, 0.9886779189109802], [-0.0, -0.15005317330360413, 0.988677978515625], [-0.0, -0.150053009390831, 0.988677978515625], [-0.0, -0.1500529944896698, 0.9886779189109802], [-0.0, 0.1500530242919922, 0.9886779189109802], [-0.0, 0.1500530242919922, 0.9886779189109802], [-0.0, 0.15005293488502502, 0.9886779189109802], [-0.0, 0.15005293488502502, 0.9886779189109802], [-0.0, 0.15005305409431458, 0.9886779189109802], [-0.0, 0.15005305409431458, 0.9886779189109802], [-0.0, 0.15005314350128174, 0.9886779189109802], [-0.0, 0.15005317330360413, 0.988677978515625], [-0.0, 0.150053009390831, 0.988677978515625], [-0.0, 0.1500529944896698, 0.9886779189109802], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, -0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0], [-0.0, 0.0, 1.0]], "panel_areas": [7.542768478393555, 7.562573432922363, 7.589241027832031, 2.3000922203063965, 2.30161190032959, 2.3042898178100586, 3.244673252105713, 3.249460220336914, 3.250126361846924, 1.6526035070419312, 1.6550378799438477, 1.6553764343261719, 1.5079412460327148, 1.5100936889648438, 1.5096595287322998, 0.8902671337127686, 0.8915351033210754, 0.8912807106971741, 0.3346845209598541, 0.33516156673431396, 0.33506548404693604, 0.2636723518371582, 0.2644651532173157, 0.2648746371269226, 7.542768478393555, 7.562573432922363, 7.589241027832031, 2.3000922203063965, 2.30161190032959, 2.3042898178100586, 3.244673252105713, 3.249460220336914, 3.250126361846924, 1.6526035070419312, 1.6550378799438477, 1.6553764343261719, 1.5079412460327148, 1.5100936889648438, 1.5096595287322998, 0.8902671337127686, 0.8915351033210754, 0.8912807106971741, 0.3346845209598541, 0.33516156673431396, 0.33506548404693604, 0.2636723518371582, 0.2644651532173157, 0.2648746371269226, 0.9055513739585876, 0.9055501222610474, 0.9055513739585876, 1.7903153896331787, 1.7903153896331787, 1.7903234958648682, 0.8627058267593384, 0.8627058267593384, 0.8627106547355652, 0.6371732950210571, 0.6371732950210571, 0.637175440788269, 0.43986719846725464, 0.43986546993255615, 0.43986546993255615, 0.26750949025154114, 0.26750826835632324, 0.26750826835632324, 0.23100546002388, 0.23100546002388, 0.23100462555885315, 0.06770732998847961, 0.06770706176757812, 0.06770732998847961, 0.9055513739585876, 0.9055501222610474, 0.9055513739585876, 1.7903153896331787, 1.7903153896331787, 1.7903234958648682, 0.8627058267593384, 0.8627058267593384, 0.8627106547355652, 0.6371732950210571, 0.6371732950210571, 0.637175440788269, 0.43986719846725464, 0.43986546993255615, 0.43986546993255615, 0.26750949025154114, 0.26750826835632324, 0.26750826835632324, 0.23100546002388, 0.23100546002388, 0.23100462555885315, 0.06770732998847961, 0.06770706176757812, 0.06770732998847961, 4.480199813842773, 4.480201244354248, 4.480196952819824, 1.542182207107544, 1.542181372642517, 1.542179822921753, 2.8286595344543457, 2.8286595344543457, 2.82865571975708, 1.2411339282989502, 1.2411386966705322, 1.2411339282989502, 0.7918193340301514, 0.7918232679367065, 0.7918193340301514, 0.45599204301834106, 0.45599204301834106, 0.45599204301834106, 0.2246456891298294, 0.22464478015899658, 0.22464659810066223, 0.06618771702051163, 0.06618771702051163, 0.0661880224943161, 1.4823954105377197, 1.4842758178710938, 1.4823954105377197, 1.4842758178710938, 2.087790012359619, 2.0912508964538574, 1.0633671283721924, 1.0651259422302246, 2.087790012359619, 2.0912508964538574, 1.0633671283721924, 1.0651259422302246, 0.43126654624938965, 0.43263834714889526, 0.25461190938949585, 0.25542205572128296, 0.09571778029203415, 0.09602243453264236, 0.43126654624938965, 0.43263834714889526, 0.25461190938949585, 0.25542205572128296, 0.09571778029203415, 0.09602243453264236, 1.1509175300598145, 1.1509175300598145, 0.5545978546142578, 0.5545978546142578, 0.40961384773254395, 0.40961170196533203, 0.282772034406662, 0.2827685475349426, 0.1719702184200287, 0.1719677448272705, 1.1509175300598145, 1.1509175300598145, 0.5545978546142578, 0.5545978546142578, 0.40961384773254395, 0.40961170196533203, 0.282772034406662, 0.2827685475349426, 0.1719702184200287, 0.1719677448272705, 4.30549430847168, 4.30549430847168, 4.30549430847168, 4.028919219970703, 4.028918743133545, 4.028919219970703, 3.577857494354248, 3.577857494354248, 3.577857732772827, 3.0101206302642822, 3.0101208686828613, 3.0101211071014404, 2.3779208660125732, 2.3779208660125732, 2.3779213428497314, 1.729122519493103, 1.729122519493103, 1.7291228771209717, 1.1027840375900269, 1.1027839183807373, 1.1027841567993164, 0.5245583057403564, 0.5245583057403564, 0.5245583057403564, 4.30549430847168, 4.30549430847168, 4.30549430847168, 4.028919219970703, 4.028918743133545, 4.028919219970703, 3.577857494354248, 3.577857494354248, 3.577857732772827, 3.0101206302642822, 3.0101208686828613, 3.0101211071014404, 2.3779208660125732, 2.3779208660125732, 2.3779213428497314, 1.729122519493103, 1.729122519493103, 1.7291228771209717, 1.1027840375900269, 1.1027839183807373, 1.1027841567993164, 0.5245583057403564, 0.5245583057403564, 0.5245583057403564]}}
\ No newline at end of file
@@ -0,0 +1,148 @@
+# VLM_panelization_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution
+from RCAIDE.load import load 
+from RCAIDE.save import save  
+
+import numpy as np
+import time
+import sys
+import os
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    update_regression_values = False
+    vehicle = b737_setup()
+
+    # ------------------------------------------------------------------
+    #   Panel coordinates and normals
+    # ------------------------------------------------------------------
+    results = Data()
+    for precision in [np.float64, np.float32]:
+        settings = get_settings(8, precision)
+        settings.number_of_chordwise_vortices = 3
+        results[precision.__name__] = panel_results(generate_vortex_distribution(vehicle, settings))
+
+    # save/load results
+    if update_regression_values:
+        save_results(results)
+    results_tr = load_results()
+
+    for precision in results_tr.keys():
+        for key in results_tr[precision].keys():
+            vals    = results[precision][key]
+            vals_tr = results_tr[precision][key]
+            assert np.array_equal(np.ravel(vals), np.ravel(vals_tr)), precision + '.' + key
+
+    # ------------------------------------------------------------------
+    #   Consistency of the preallocated vortex distribution
+    # ------------------------------------------------------------------
+    for precision in [np.float64, np.float32]:
+        VD = generate_vortex_distribution(vehicle, get_settings(40, precision))
+        check_vortex_distribution(VD, precision)
+
+    # ------------------------------------------------------------------
+    #   Cost of a high resolution panelization
+    # ------------------------------------------------------------------
+    low_time  = panelization_time(vehicle, 50)
+    high_time = panelization_time(vehicle, 400)
+    print('Panelization time, 50 spanwise vortices  = %.3f s' % low_time)
+    print('Panelization time, 400 spanwise vortices = %.3f s' % high_time)
+
+    VD = generate_vortex_distribution(vehicle, get_settings(400, np.float64))
+    check_vortex_distribution(VD, np.float64)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def get_settings(n_sw, precision):
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = n_sw
+    settings.number_of_chordwise_vortices = 5
+    settings.discretize_control_surfaces  = True
+    settings.model_fuselage               = True
+    settings.floating_point_precision     = precision
+    return settings
+
+def panelization_time(vehicle, n_sw):
+    """Shortest of a few panelizations of the vehicle."""
+    settings = get_settings(n_sw, np.float64)
+    times    = []
+    for i in range(3):
+        ti = time.time()
+        generate_vortex_distribution(vehicle, settings)
+        times.append(time.time() - ti)
+    return min(times)
+
+def panel_results(VD):
+    """Panel corners, control points, normals and areas of the vortex distribution."""
+    results = Data()
+    for key in ['XA1', 'YA1', 'ZA1', 'XA2', 'YA2', 'ZA2', 'XB1', 'YB1', 'ZB1', 'XB2', 'YB2', 'ZB2',
+                'XC', 'YC', 'ZC', 'normals', 'panel_areas']:
+        results[key] = np.array(VD[key], dtype = np.float64)
+    return results
+
+def check_vortex_distribution(VD, precision):
+    """Sizes, breaks and symmetry of the panels, strips and points of each surface."""
+    n_sw     = VD.n_sw.astype(int)
+    n_cw     = VD.n_cw.astype(int)
+    n_panels = np.sum(n_sw * n_cw)
+    n_strips = np.sum(n_sw)
+    n_points = np.sum((n_sw + 1) * (n_cw + 1))
+
+    assert VD.n_w == len(n_sw)
+    assert VD.n_cp == n_panels
+    for key in ['XC', 'YC', 'ZC', 'XA1', 'YA1', 'ZA1', 'XB2', 'YB2', 'ZB2', 'surface_ID']:
+        assert len(VD[key]) == n_panels, key
+    for key in ['XC', 'YC', 'ZC', 'XA1', 'XB2']:
+        assert VD[key].dtype == precision, key
+    assert len(VD.chordwise_breaks) == n_strips
+    assert len(VD.X) == n_points
+    assert np.all(np.isfinite(VD.XC)) and np.all(np.isfinite(VD.YC)) and np.all(np.isfinite(VD.ZC))
+
+    assert np.array_equal(VD.spanwise_breaks, np.concatenate([[0], np.cumsum(n_sw)[:-1]]))
+    assert np.array_equal(VD.chordwise_breaks, np.concatenate([[0], np.cumsum(np.repeat(n_cw, n_sw))[:-1]]))
+
+    # the mirrored half of a symmetric surface follows it
+    starts = np.concatenate([[0], np.cumsum(n_sw * n_cw)])
+    for i in range(VD.n_w - 1):
+        if n_sw[i] == n_sw[i+1] and n_cw[i] == n_cw[i+1]:
+            half   = slice(starts[i], starts[i+1])
+            mirror = slice(starts[i+1], starts[i+2])
+            if np.allclose(VD.YC[half], -VD.YC[mirror]) and np.any(VD.YC[half] != 0.):
+                assert np.array_equal(VD.XC[half], VD.XC[mirror])
+                assert np.array_equal(VD.ZC[half], VD.ZC[mirror])
+    return
+
+# ----------------------------------------------------------------------
+#   Save/Load Utility Functions
+# ----------------------------------------------------------------------
+def load_results():
+    return load('VLM_panelization_results.res')
+
+def save_results(results):
+    print('!####! SAVING NEW REGRESSION RESULTS !####!')
+    save(results,'VLM_panelization_results.res')
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# Regression/scripts/Tests/topography_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Geodesics import Topography, load_topography, clear_topography_store
+from RCAIDE.Library.Methods.Noise.Common.generate_terrain_microphone_locations import generate_terrain_microphone_locations
+
+# python imports
+from scipy.interpolate import griddata
+import numpy as np
+import tempfile
+import shutil
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    data_file   = os.path.join(current_dir, 'LA_Metropolitan_Area.txt')
+    data        = np.loadtxt(data_file)
+    points      = np.column_stack((data[:,1],data[:,0]))
+
+    # ------------------------------------------------------------------
+    #   Shared store
+    # ------------------------------------------------------------------
+    clear_topography_store()
+    topography = load_topography(data_file)
+    assert( load_topography(data_file) is topography )
+    assert( load_topography(topography) is topography )
+    assert( np.array_equal(topography.longitude, data[:,0]) )
+    assert( np.array_equal(topography.latitude , data[:,1]) )
+    assert( np.array_equal(topography.elevation, data[:,2]) )
+    assert( topography.bounds() == (np.min(data[:,1]), np.max(data[:,1]), np.min(data[:,0]), np.max(data[:,0])) )
+
+    # ------------------------------------------------------------------
+    #   Elevation lookup
+    # ------------------------------------------------------------------
+    # the map points are found exactly
+    assert( np.allclose(topography.compute_elevation(data[:,1], data[:,0]), data[:,2], rtol=0, atol=1e-9) )
+    assert( np.array_equal(topography.compute_elevation(data[:,1], data[:,0], method='nearest'), data[:,2]) )
+    assert( np.array_equal(topography.find_nearest_points(data[:,1], data[:,0]), np.arange(len(data))) )
+
+    # linear and nearest lookups match griddata, the shape of the query is kept
+    min_lat, max_lat, min_long, max_long = topography.bounds()
+    lat, long = np.meshgrid(np.linspace(min_lat, max_lat, 17), np.linspace(min_long, max_long, 23), indexing='ij')
+    for method in ['linear','nearest']:
+        elevation       = topography.compute_elevation(lat, long, method=method)
+        elevation_truth = griddata(points, data[:,2], (lat, long), method=method)
+        print(method + ' elevation error: ', np.nanmax(np.abs(elevation - elevation_truth)))
+        assert( elevation.shape == lat.shape )
+        assert( np.allclose(elevation, elevation_truth, rtol=0, atol=1e-9, equal_nan=True) )
+
+    # scalar queries are broadcast and points outside the map are NaN
+    assert( np.array_equal(topography.compute_elevation(lat[:,0], long[0,7]), topography.compute_elevation(lat[:,0], np.full(17, long[0,7])), equal_nan=True) )
+    assert( np.isnan(topography.compute_elevation(max_lat + 1., min_long)) )
+    try:
+        topography.compute_elevation(lat, long, method='cubic')
+        raise AssertionError('unknown interpolation method accepted')
+    except ValueError:
+        pass
+
+    # ------------------------------------------------------------------
+    #   Binary grid and reload of modified files
+    # ------------------------------------------------------------------
+    folder = tempfile.mkdtemp()
+    try:
+        copy_file = os.path.join(folder, 'LA_Metropolitan_Area.txt')
+        shutil.copyfile(data_file, copy_file)
+        binary    = load_topography(copy_file, use_binary_grid=True)
+        assert( os.path.isfile(os.path.join(folder, 'LA_Metropolitan_Area.npy')) )
+        assert( np.array_equal(binary.elevation, data[:,2]) )
+        assert( np.array_equal(binary.compute_elevation(lat, long), topography.compute_elevation(lat, long), equal_nan=True) )
+
+        # a newer file replaces the stored topography and its binary grid
+        np.savetxt(copy_file, np.column_stack((data[:,:2], data[:,2] + 10.)))
+        mtime = os.path.getmtime(copy_file) + 10.
+        os.utime(copy_file, (mtime, mtime))
+        modified = load_topography(copy_file, use_binary_grid=True)
+        assert( modified is not binary )
+        assert( np.array_equal(modified.elevation, data[:,2] + 10.) )
+        assert( isinstance(modified, Topography) )
+    finally:
+        shutil.rmtree(folder)
+
+    # ------------------------------------------------------------------
+    #   Microphone grid
+    # ------------------------------------------------------------------
+    settings                         = Data()
+    settings.topography_file         = data_file
+    settings.topography_binary_grid  = False
+    settings.microphone_x_resolution = 11
+    settings.microphone_y_resolution = 13
+    cartesian_pts, lat_long_pts      = generate_terrain_microphone_locations(settings)
+
+    assert( cartesian_pts.shape == (11*13, 3) )
+    assert( lat_long_pts.shape  == (11*13, 3) )
+    lat_grid  = lat_long_pts[:,0].reshape(11,13)
+    long_grid = lat_long_pts[:,1].reshape(11,13)
+    assert( np.allclose(lat_grid[:,0] , np.linspace(min_lat , max_lat , 11)) )
+    assert( np.allclose(long_grid[0,:], np.linspace(min_long, max_long, 13)) )
+    assert( np.array_equal(cartesian_pts[:,2], lat_long_pts[:,2]) )
+    assert( np.allclose(lat_long_pts[:,2], griddata(points, data[:,2], (lat_long_pts[:,0], lat_long_pts[:,1]), method='linear'),
+                        rtol=0, atol=1e-9, equal_nan=True) )
+
+    # the microphones start at the origin of the map and are evenly spaced
+    x_grid = cartesian_pts[:,0].reshape(11,13)
+    y_grid = cartesian_pts[:,1].reshape(11,13)
+    assert( x_grid[0,0] == 0 and y_grid[0,0] == 0 )
+    assert( np.allclose(np.diff(x_grid[:,0]), x_grid[1,0]) and x_grid[1,0] > 0 )
+    assert( np.allclose(np.diff(y_grid[0,:]), y_grid[0,1]) and y_grid[0,1] > 0 )
+
+    clear_topography_store()
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -1 +1 @@
-{"tag": "electric_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "active": true, "wing_mounted": true, "sealevel_static_thrust": 4.29174255674668e-12, "motor": {"tag": "motor", "mass_properties": {"mass": 41.33504955097784, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "working_fluid": {}, "active": true, "resistance": 0.16509979308398082, "no_load_current": 0.01, "speed_constant": 0.4286148282266848, "efficiency": 0.9, "gearbox": {"gear_ratio": 1.0}, "design_angular_velocity": 170.12359648893744, "design_torque": 622.9629153642449, "design_current": 267.02114296044005, "inverse_calculation": false, "interpolated_func": null, "nominal_voltage": 441.0, "propeller_radius": 1.4}, "rotor": {"tag": "lift_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "number_of_blades": 3, "tip_radius": 1.4, "hub_radius": 0.1, "twist_distribution": [0.32622439034125594, 0.32195320561860613, 0.31653788866887983, 0.3092458722600269, 0.3012667945404142, 0.29262867477977855, 0.2833139832919661, 0.27381103681841545, 0.26407421686833094, 0.25435316676482334, 0.2447284258675875, 0.23533322147279012, 0.2264498448155802, 0.218085291371413, 0.21040136066503926, 0.20361567885361379, 0.19799449765865956, 0.1938446852924911, 0.19150428085749968, 0.1914291983886093], "sweep_distribution": 0.0, "chord_distribution": [0.1134672788200092, 0.11359073994780651, 0.11378136461945848, 0.11419374699167349, 0.11464632324143371, 0.115137454209207, 0.11562213688912736, 0.11608671869084229, 0.11650554160593461, 0.11683722812701852, 0.11709437915261804, 0.11723328832568383, 0.1171759290365827, 0.11692868852072154, 0.11642785443158313, 0.11557251960366936, 0.1141960727629176, 0.1120063302367048, 0.10844866496076459, 0.10212055708798577], "thickness_to_chord": [0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402466, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402463, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465], "max_thickness_distribution": [0.013651845608182354, 0.013666699866368757, 0.01368963492406615, 0.01373925081805393, 0.013793702649030307, 0.013852793201083414, 0.013911107925681057, 0.0139670042078105, 0.014017394997414955, 0.01405730194876906, 0.014088241142305544, 0.014104954036136924, 0.014098052838125064, 0.014068306030184266, 0.014008048044522353, 0.013905138208881519, 0.0137395306438352, 0.013476071193671169, 0.013048029756722895, 0.012286661787300285], "radius_distribution": [0.1, 0.165, 0.23, 0.29500000000000004, 0.36000000000000004, 0.42500000000000004, 0.49, 0.555, 0.62, 0.685, 0.7499999999999999, 0.8149999999999998, 0.8799999999999999, 0.945, 1.01, 1.0749999999999997, 1.14, 1.205, 1.27, 1.3349999999999997], "blade_pitch_command": 0.0, "mid_chord_alignment": [0.0, 3.0865281949326445e-05, 7.852144986231907e-05, 0.00018161704291607197, 0.0002947611053561276, 0.00041754384729944874, 0.0005387145172795378, 0.0006548599677082718, 0.000759565696481352, 0.0008424873267523295, 0.0009067750831522094, 0.000941502376418657, 0.0009271625541433723, 0.0008653524251780835, 0.0007401439028934809, 0.0005263101959150397, 0.0001821984857270989, -0.0003652371458261021, -0.0012546534648111528, -0.002836680433005858], "blade_solidity": 0.06901468040217859, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "airfoils": {"airfoil": {"tag": "airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402465, "max_thickness": 0.12031526401402465, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.016043449318962084, 0.019590256985204432, 0.02245677294482681, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.02976247187814689, 0.03120944342544214, 0.03276888891442653, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.04138168201270342, 0.043831218912609625, 0.04622131608757142, 0.04846502418500166, 0.050526443585207935, 0.05241695312849192, 0.05414971456533544, 0.05573788964622039, 0.05719464012162861, 0.05853647479776234, 0.05981375461787535, 0.06109649672976446, 0.06245496040041921, 0.06395940489682914, 0.0656800894859838, 0.0676688505121781, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275303, 0.0842766016889327, 0.085710806953059, 0.0870379883892214, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022884, 0.09268290622537607, 0.09359994223597635, 0.09443196809870935, 0.09517814045560118, 0.0958443004626162, 0.09643671550245721, 0.096961652957827, 0.09742538021142831, 0.09783279989437105, 0.09816741123853424, 0.09839571958896257, 0.0984837621809043, 0.09839757624960772, 0.09810319903032118, 0.09757115844868458, 0.09680920794395251, 0.09584350726715764, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.0904643327380958, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783351, 0.07651653661409304, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.06609674614077089, 0.06331982631104899, 0.06044200824136898, 0.05742402352501027, 0.054226603755252165, 0.05081048052537401, 0.047139368762024875, 0.04325609416755832, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.02820878356517617, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.01671358326777673, 0.01500107028568076, 0.013274898166135715, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.003665223223884563, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413802, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.018968040272831232, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.02271885485138349, -0.02367032713380571, -0.024535690747991005, -0.025270626378542282, -0.025865827824930857, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112896, -0.027577905285351957, -0.027817779092228732, -0.028040959225367316, -0.028244741943301413, -0.02842642350456472, -0.028583300167690947, -0.028712472367814792, -0.02880992257703332, -0.02887123715297097, -0.02889200198907823, -0.02886780297880557, -0.02879422623767004, -0.028668152085203107, -0.02849080290872854, -0.028264310680272065, -0.02799080737185942, -0.027672424955516337, -0.027311321418476225, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.025633665966898873, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.02222011929783598, -0.02149485811539941, -0.020697040726644425, -0.01985855320935335, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.01600951205009446, -0.015348714944608753, -0.014696685836695608, -0.014039154630508432, -0.013364802023979244, -0.012676394865126254, -0.011980898543506178, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.00802202799789677, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.005370460001161809, -0.004922598050038695, -0.004500041231814651, -0.004101592290880574, -0.003726130229006508, -0.003374556208971546, -0.003049954856793557, -0.002755519375891563, -0.0024944429696845878, -0.002269918841591665, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.0016082936412161188, -0.0015644504055181275, -0.0015249242118237462, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.0013576126052634095, 0.0024695527728248144, 0.003369024561693369, 0.0040892320308782235, 0.004663379239388539, 0.005124670246233462, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797651, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659965, 0.010080445889401959, 0.010842812669790206, 0.011597198903229692, 0.01233030788013854, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.01493535663325786, 0.015479284756205192, 0.01599798776282331, 0.01652776875219857, 0.0171051092285589, 0.017766490696132207, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.02166436767347927, 0.022834536936970913, 0.023998601824185305, 0.025113446025102817, 0.026147338867613706, 0.02710674861201224, 0.028006145504330313, 0.028859999790599788, 0.02968278171685253, 0.030488907954972666, 0.031285257126835116, 0.03206346266089256, 0.03281331888555653, 0.033524620129238604, 0.03418716072035033, 0.034791054320257794, 0.03533800740067584, 0.03584432730423963, 0.03632725237345171, 0.03680402095081467, 0.03729187137883104, 0.037806340298267536, 0.03833627656156741, 0.03884933943115907, 0.039312604485775476, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.03991699760853159, 0.03967581602068806, 0.03935466591571174, 0.03897382762536841, 0.03854976535705828, 0.038080726355359515, 0.03755952808633414, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.034812758024605164, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.02987492890811462, 0.028737500985127944, 0.027535774120103586, 0.026250712737485787, 0.024863281261718755, 0.023354444117246718, 0.021706619266509183, 0.01994076897929339, 0.01811947440626736, 0.016307386286377533, 0.014569155358570335, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.006696388322232322, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696687, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522144, 1.3189900988029917, 1.2133829765808901, 1.0761215426599497, 0.9043572397947004, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387613, 0.6364767634570125, 0.6587556980553567, 0.680972878036534, 0.7031258927040288, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.0321, 0.028095562130177523, 0.024411479289940825, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544, 0.022460710059171607, 0.01971976331360947, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744561632, 1.6324685435018702, 0.5984913458180205, 0.04447241567611921, 0.005752833132020015, 0.0022393881794874008, 0.0001497237154537821, -0.0018771829603368851, -0.004555800736469952, -0.008093622361508379, -0.012114355480663393, -0.01629190108027036, -0.020439762425065268, -0.024437973806804972, -0.028216333043156887, -0.03173150257814024, -0.03494448187634454, -0.037797374713293815, -0.04018148763410992, -0.041939129311059836, -0.04467171053294966, -0.0451392245636949, -0.04513391788959742, -0.044727682948063174, -0.04405890649736946, -0.04337421815598706, -0.043018340205242526, -0.04301204935110505, -0.04320767012260637, -0.04351472623982351, -0.04388565947287958, -0.04428730088870989, -0.04469828938296425, -0.04509989436113321, -0.04546735656437412, -0.04576920660704182, -0.046015314952376485, -0.04622404024056295, -0.046365166633288456, -0.0464560531491891, -0.046532880068983415, -0.046717972543188005, -0.047083065928940904, -0.047499086276526076, -0.047759485923820955, -0.04760816383732075, -0.04684604980216338, -0.04528031292097369, -0.04271358412193785, -0.03901834478488849, -0.03437040460126455, -0.0290078527870201, -0.023063730192225927, -0.01647716888009797, -0.009110509560628663, -0.0006961191116059284, 0.008415882155061201, 0.017493788088880104, 0.025688226305247405, 0.03262292188114864, 0.03852745679991255, 0.04367345382244732, 0.0482008403908529, 0.05210341830339764, 0.05536649359694378, 0.05799425887866409, 0.059992042705039855, 0.06133502350099221, 0.06208147687741777, 0.062377217603170144, 0.06237415287184684, 0.06222841755769493, 0.062152642759458504, 0.06238071029876823, 0.06286144243604866, 0.06339111033179941, 0.06384324092559675, 0.06411876149201517, 0.06410768091413946, 0.06376331251328522, 0.0631544794229761, 0.06234827266574871, 0.061392783926062636, 0.060344746708085345, 0.059241546973631314, 0.058050941459205314, 0.056703708700883294, 0.05514342384033319, 0.05331838468269358, 0.0511649973797037, 0.048807505284217095, 0.04591444955915602, 0.04268068219345465, 0.03908522064104818, 0.0350946692663435, 0.03060415960492959, 0.025333642582485147, 0.018772596766888385, 0.009759473873716899, -0.004046966000429867], [-1.0546139637201721, 0.8610460920260768, 0.3133332215189658, 0.03397673714180122, -0.012938687708860511, -0.015546259166158127, -0.01700341795515035, -0.019611513549385933, -0.02477073983578473, -0.0328105829211554, -0.04259590544654205, -0.05317335052073364, -0.06392493836034421, -0.07444700231806081, -0.0844966645782499, -0.09391945593441961, -0.10258172789508838, -0.1103049514813, -0.11675806491997556, -0.12144938227306258, -0.12641589281685034, -0.12776344456352667, -0.12778351425063694, -0.12667840071076625, -0.12483821514807934, -0.12295961897804977, -0.12201220550434169, -0.1220534306776856, -0.12266298347332899, -0.12358699744244127, -0.12469213643098853, -0.12588665128426507, -0.1271105952573605, -0.12831151596237053, -0.12942032969479805, -0.13034947378887318, -0.1311217832918006, -0.13177538343300818, -0.13226304827595514, -0.13261962130841876, -0.13294750310024908, -0.133593090359064, -0.13475951684198895, -0.13608363562817646, -0.1369837927942947, -0.13673309345237178, -0.13476520013868246, -0.13052944908253264, -0.12345943171744239, -0.11318323594304766, -0.10000554196812973, -0.08477592706239241, -0.06787325234635827, -0.04913092875314758, -0.028167748297421573, -0.0042300341945989625, 0.021691993520975672, 0.04752584478211202, 0.070867429884994, 0.09064961251379614, 0.10751765227425081, 0.12223630243431552, 0.13519636202174856, 0.14637809620630463, 0.15573925358826105, 0.16329141522125812, 0.16904974087375554, 0.17294471964922478, 0.17514218616469437, 0.17605491281780905, 0.17611270122261852, 0.17575710022459232, 0.1755889159078666, 0.17627132496603481, 0.17766300413678812, 0.17918900470173593, 0.1804923680015096, 0.18129345059142182, 0.181281622112465, 0.18032393965708746, 0.17861465194557039, 0.17634344034353805, 0.17364674756787668, 0.17068849069558759, 0.16758311217117045, 0.16423325418697632, 0.160430845030822, 0.1560237549559, 0.15086670897863663, 0.14478083878410972, 0.1378837688876663, 0.1297867580377956, 0.12074482551991332, 0.11070867627291825, 0.099600702199037, 0.08715911224938376, 0.07266406902812918, 0.054587035635153824, 0.0305907755392396, -0.00507933963400317], [-0.5797499211983312, 0.47677506545965614, 0.15953590139042917, 0.014095916042346637, -0.022811181664856617, -0.02381603898136547, -0.024280485849653925, -0.02642889908038955, -0.03170197999585241, -0.04040848181702585, -0.05122442244764041, -0.06304558023509411, -0.07513705145447605, -0.08701736851700441, -0.09839532124004154, -0.10908469360224865, -0.11892552595034941, -0.1277086006507785, -0.13504697088917675, -0.14036307785711888, -0.1453207841029431, -0.14687652231213322, -0.14690912512693982, -0.14565083215909672, -0.14354968429428958, -0.1414061796263263, -0.14033329804856298, -0.14039672380666743, -0.1411126367210135, -0.14218979566389617, -0.14347526380367281, -0.14486414595266106, -0.1462876672, -0.14768568140473487, -0.14897904055183145, -0.15006749275602987, -0.15097590320716173, -0.15174434213198756, -0.15232892080710764, -0.15276581390614963, -0.15317273944300708, -0.153947958672442, -0.15532501856615213, -0.1568870406388427, -0.15796616235770297, -0.1577229096119585, -0.15550864168614725, -0.15068914559190402, -0.1426114023179684, -0.13084491146726404, -0.11568750034998426, -0.09816349022468512, -0.07870945680086495, -0.05713582735490534, -0.033006849737673434, -0.005457052717307196, 0.024376865427538183, 0.054113205568038864, 0.08098911373586933, 0.10377607697750033, 0.12321287368587455, 0.1401756945759693, 0.15511435874484275, 0.16800631791601006, 0.17880290025248308, 0.1875173720425038, 0.19416720784695302, 0.19867269314953545, 0.20122418360765673, 0.20229572487807576, 0.20238133344014494, 0.2019884900223294, 0.20180758272473398, 0.20260145223288226, 0.20420930723477526, 0.2059684054375002, 0.2074709960939148, 0.2083957748789776, 0.20838584825542067, 0.20728795997322091, 0.20532509328145646, 0.2027152182066236, 0.1996152550524899, 0.19621452095023456, 0.19264687851973336, 0.1887986955572983, 0.1844274724190594, 0.1793603929347431, 0.17343075207499556, 0.16643323893051956, 0.15855747638476664, 0.14927078161274987, 0.13889867387363897, 0.12738554754548703, 0.11464421828368154, 0.10038201403698543, 0.08378698675847525, 0.0634227110010403, 0.03937350179214884, 0.0028635117421087755], [-0.23448954344955353, 0.1658387892939905, 0.005260103947653576, -0.036601879056487936, -0.039052972117777064, -0.0377559852408289, -0.036783448578751834, -0.038403970036391406, -0.04422070781251993, -0.05453367440660379, -0.06764507324571013, -0.08214874030566624, -0.09708435798108986, -0.1118210047672238, -0.12597518642581365, -0.13930043088551364, -0.1515864391583799, -0.16256366845425307, -0.17173489434063113, -0.17835431639209126, -0.18365161314629325, -0.18562629143335488, -0.18567977238375033, -0.1841051507939343, -0.18146811834567314, -0.17877987280319305, -0.17743959302885906, -0.1775357409446979, -0.1784557421215125, -0.17983197477612367, -0.18147148407338268, -0.18324291232159157, -0.18505935915211424, -0.18684493978636085, -0.1885000181318207, -0.18989847143735503, -0.19106991904355952, -0.19206012824555782, -0.19282701953860074, -0.1934112367498141, -0.19396136039036305, -0.19498037909652163, -0.19676337599399593, -0.19878461227849037, -0.20020129090609468, -0.1999562342432459, -0.1972249051114321, -0.19120405023538858, -0.18106559104104666, -0.16626151437050551, -0.14710041190140477, -0.12493799689474756, -0.1003278808462772, -0.07303300124444617, -0.04250551555316015, -0.007652390196795092, 0.030090549957271933, 0.06771680813264257, 0.10173423934420989, 0.13058696751468277, 0.1552051284347397, 0.176695193390368, 0.1956240713738028, 0.2119629677781792, 0.2256501157084399, 0.23670212023945242, 0.2451410249517273, 0.2508662809780397, 0.2541186418681045, 0.25549725543249985, 0.25562655597842787, 0.2551478104451236, 0.2549330512401659, 0.2559467617873101, 0.2579870076083006, 0.260219906746221, 0.2621275126545428, 0.2633040139901875, 0.2632985596080203, 0.261917224231751, 0.25944166018154996, 0.2561472707314951, 0.2522324897974596, 0.2479377532686479, 0.24343526664717535, 0.23857929661239421, 0.23305911352364117, 0.22665895022690946, 0.21916848479208886, 0.2103286293760286, 0.20028048858515188, 0.1885786809299566, 0.17514480492390577, 0.16070715748017497, 0.14476818213720669, 0.1269898923936553, 0.1064135826775034, 0.08139984863875856, 0.04924686705552878, 0.003259078601665284], [-0.1524647916177476, 0.08068596310856463, -0.010583111823344349, -0.043421161449735485, -0.04418615230280508, -0.04200108177137489, -0.040480308770008105, -0.041824480400198906, -0.04764214949591139, -0.05821840054586556, -0.07176757100626836, -0.08681384324705885, -0.10234151035539382, -0.11768270725729789, -0.13243089742864897, -0.14632441472577276, -0.15914043304651013, -0.1705950616633469, -0.1801650173354702, -0.18706425973101487, -0.19229908332087797, -0.1943619720224725, -0.19441584608167978, -0.1927670158752121, -0.1900071132058744, -0.18719428616124403, -0.18579872459978045, -0.1859068763845193, -0.18687724046686294, -0.18832522427790238, -0.19004896106895158, -0.19191104191464006, -0.19382057681432974, -0.19569819574614558, -0.19743968205166007, -0.1989131383451944, -0.20014897048274674, -0.20119350230083805, -0.20200695304885566, -0.20263022644789647, -0.2032188450396017, -0.20429946564424675, -0.20618123741164754, -0.20831411230824343, -0.2098159587785328, -0.20957959544997098, -0.2067413358161661, -0.20045953362873897, -0.1898662075463146, -0.17438627006648214, -0.1543210238921826, -0.131114380476341, -0.10534109494985787, -0.07675348289777793, -0.04477866979291917, -0.008272426402147693, 0.03126396751945819, 0.07067859574464885, 0.1063148335597321, 0.13654363297572522, 0.16233875799067962, 0.18485841700738478, 0.20469544353862654, 0.22181934625210945, 0.2361653696468286, 0.2477508699319023, 0.2565989391253148, 0.2626043767255871, 0.26601941962901376, 0.26747147000779964, 0.2676143392307937, 0.26711946945150916, 0.2668999060517973, 0.26796571116120077, 0.27010576154649524, 0.27244705626498433, 0.2744473620384236, 0.2756818403483659, 0.27567847178845983, 0.2742341268752069, 0.2716436777853555, 0.2681954770234854, 0.26409734239143207, 0.25960141289075206, 0.25488898105678925, 0.2498067668924333, 0.24402803514773652, 0.23732770699208772, 0.22948567141467718, 0.2202110470495419, 0.2091048830622874, 0.19688981521879512, 0.18326050264645788, 0.168154767024723, 0.15147591443309727, 0.13287019903126623, 0.11133395560320292, 0.0851510532654592, 0.05149220084544653, 0.0033327673969899604], [-0.1137702113183507, 0.03474718408165168, -0.021420156094463343, -0.04817954888128661, -0.04779648866975608, -0.04500032392184139, -0.04310188155842516, -0.04426091017065378, -0.05009362663669712, -0.0608756406524657, -0.07475694067886718, -0.09021054866398147, -0.10618046548655537, -0.12197197572964347, -0.13716182071368857, -0.15147732357804325, -0.1646865626108715, -0.17649515838165772, -0.1863607589815587, -0.193467932848157, -0.1986492442406851, -0.20078493208443599, -0.20084529782034893, -0.19914677909990317, -0.19630056105569052, -0.1933998031170175, -0.19196294113805304, -0.1920794441549031, -0.19308649102481656, -0.19458693820435388, -0.19637233867596574, -0.1983008143014389, -0.20027852712077873, -0.2022235294502562, -0.2040282184074444, -0.20555643152642586, -0.20683918963457398, -0.207923314302102, -0.20877049619186408, -0.20942192171747287, -0.210038247986019, -0.21116358710991392, -0.21311743636459707, -0.2153317842971398, -0.21689548105583809, -0.21666449153744052, -0.2137462829244743, -0.20727093779295672, -0.19634637707964317, -0.18037182098413437, -0.15964432785665866, -0.13566380387673843, -0.10902958711814194, -0.07948612522357958, -0.04644214866534899, -0.008715805019927494, 0.03214163512014548, 0.07287355608241608, 0.10970208344949392, 0.14094422230620146, 0.16760591557670726, 0.1908835434756294, 0.21138907233784268, 0.22909077078479068, 0.24392168215517399, 0.25589971771165476, 0.26504874127836403, 0.2712601189085045, 0.2747945478938872, 0.27630025844193545, 0.27645272433923324, 0.2759456314433072, 0.2757222578751153, 0.2768262507844397, 0.27903968995189254, 0.2814607292184599, 0.28352922759291554, 0.2848063178797072, 0.2848043749696848, 0.2833134899065865, 0.28063828248609335, 0.27707665145287347, 0.27284332965525426, 0.2681990626282934, 0.26333178981253436, 0.2580827050880195, 0.2521133480535521, 0.24518473024850024, 0.23707298174330974, 0.22749902753082613, 0.21622629518493564, 0.20358522586520306, 0.1894876148236399, 0.17386776251237138, 0.1566248014868386, 0.1373924575548, 0.1151330487162196, 0.08807255190392176, 0.05328699941260229, 0.0035313240125200815], [-0.09611015498074467, 0.01040277164944442, -0.02832408986725998, -0.051336193190318215, -0.05022831935974337, -0.047037863776297366, -0.044895183803492715, -0.04594132046424192, -0.05180261062661094, -0.0627495946014575, -0.0768856502525561, -0.09264655823013819, -0.10894746923723131, -0.1250744718066575, -0.14059238290759057, -0.15522069377764103, -0.1687209911786889, -0.18079132174358467, -0.1908755405494991, -0.19813702350558646, -0.20331786572525043, -0.2055062100116241, -0.20557047189586358, -0.2038346516416999, -0.2009243716880574, -0.1979585313610936, -0.19649096766671947, -0.19661315256321094, -0.19764659998991596, -0.19918498183650354, -0.20101502408984975, -0.2029915687398966, -0.20501861300699056, -0.20701231119240962, -0.20886257878862965, -0.21043011872877587, -0.21174646094863853, -0.2128589165751154, -0.21372999552164598, -0.21440122294673672, -0.21503705377352442, -0.21619443603141833, -0.2182003736249855, -0.22047355107966418, -0.22208151690002756, -0.22185323135213916, -0.21887655954859875, -0.21226053244017923, -0.20108561749764794, -0.18474203416175308, -0.16352506836174519, -0.13897766243838805, -0.1117131494133204, -0.08147012704144281, -0.047643778487898344, -0.009024670518705742, 0.032799297043385474, 0.07449485935590316, 0.11219537147260966, 0.14417839790137676, 0.1714735020904726, 0.1953050498660947, 0.21629904445694398, 0.23442285315030342, 0.24960791636284643, 0.2618725548330682, 0.2712411980590335, 0.2776026942859189, 0.2812239345680367, 0.28276840366778583, 0.2829274357231254, 0.2824110048619648, 0.28218452947850353, 0.2833162369821853, 0.28558320340097704, 0.2880624501461457, 0.2901807175412123, 0.29148886132795965, 0.29148782583397026, 0.28996274387487947, 0.28722537694789935, 0.283580615552119, 0.2792482537357478, 0.274495314875176, 0.2695145429781444, 0.26414312972411963, 0.2580276197988031, 0.2509339102293327, 0.24263026712413102, 0.23283055659265187, 0.22127479691947372, 0.2083417931605938, 0.19391685675802703, 0.177933656495742, 0.16028919048832987, 0.14060881386034838, 0.11783005431332556, 0.09013515546243213, 0.05453282832712832, 0.00360582017173562]], [[-0.003690741454440091, -0.00410010593299247, -0.0045693464053507635, -0.00542802278300071, -0.008375018434909311, -0.11458658707506415, -0.6929237128086033, 0.21416582836999692, 0.09093844701838755, 0.01096080745557829, 0.004582627122575206, 0.004042539646003226, 0.0036787695744407026, 0.0033260097425120137, 0.002940914252821345, 0.002517826109941715, 0.002066964536071794, 0.0016091546978041621, 0.0011698548098809589, 0.0007737611877976045, 0.0001035743381292442, -7.145187068098688e-05, -0.00015047773461267344, -0.00013801783817905607, -4.959375956337643e-05, 8.223010342657426e-05, 0.00020482126744319294, 0.0002925636504764016, 0.0003657064923851808, 0.0004404181024430254, 0.0005269852604069925, 0.0006367754942445099, 0.0007774302943134982, 0.0009536859439037241, 0.0011726688967136675, 0.0014438424069311878, 0.0017750410926620237, 0.0021737103657859976, 0.002647739995511283, 0.0032014056308329584, 0.003835443125252818, 0.004540956040953346, 0.005310266268814177, 0.006175777728373147, 0.00720419119892941, 0.008461350609999552, 0.009978695165428743, 0.011774071875624292, 0.013847338066793046, 0.01616467282675324, 0.018622386519030934, 0.021088668435881128, 0.0234695791588795, 0.02575707846432689, 0.0280024858419607, 0.030293510519059857, 0.03259494656507867, 0.034753268722211066, 0.03658798109670162, 0.03799192523781815, 0.039004928385201316, 0.039713171544508256, 0.04018072935920273, 0.04043666567334046, 0.0404889021756015, 0.040350573751454136, 0.04003488985377676, 0.039548833484788486, 0.03890731986920486, 0.03814779848753732, 0.03731879394784178, 0.03646888899005634, 0.035666100439092116, 0.03496991733588206, 0.03436238659635227, 0.03378451219461353, 0.03319521428480212, 0.03255850667972696, 0.0318492159577852, 0.031055973763783162, 0.03019788051246529, 0.029294815358990575, 0.028361661810425678, 0.027418875237894304, 0.0264733150473864, 0.02550197126538507, 0.02448098716570953, 0.023392666697409466, 0.022218668616027257, 0.020937460655826072, 0.01948881067114833, 0.017942252649147266, 0.01626578135708282, 0.014442171357269046, 0.01244191939109315, 0.010220852102328181, 0.007687185921645518, 0.004672562308361589, 0.0009769566095762692, -0.0024037387396177415], [-0.002597171530650431, -0.002684961931473688, -0.0027453678882322636, -0.002884229744025963, -0.0036548597089944694, -0.03807461582495942, -0.10185376791910938, 0.03128426942431403, 0.013688801385343443, 0.004057572245685001, 0.0021702099301690253, 0.0021088325319642224, 0.002033689126684417, 0.0019015661636865707, 0.0017098598647544447, 0.001468046899657285, 0.0011907958612672094, 0.0008975243347243863, 0.000610592093888507, 0.0003519255168404202, 3.142517575375259e-05, -9.204856131427814e-05, -0.00014672572249350513, -0.0001357522722620033, -7.03151406052359e-05, 2.594828071921443e-05, 0.00011485897607007613, 0.00017821552660279087, 0.00023086479743229511, 0.0002844926122392466, 0.00034657755532529897, 0.0004254254265734833, 0.0005266260509897118, 0.0006536377579186486, 0.0008116486286851159, 0.0010075451368571796, 0.0012470116635434837, 0.0015354490478967718, 0.0018785881730056105, 0.0022795139139358545, 0.0027387091579564797, 0.0032496166750324807, 0.003806623518959196, 0.004433362491554057, 0.005178471918539497, 0.0060902287076098835, 0.007191801651892768, 0.008496492212855413, 0.01000458481889656, 0.011691868495529355, 0.013488507661607791, 0.015292854291522405, 0.017036225955958665, 0.018712525423882548, 0.020358865906642775, 0.022039188002150316, 0.023727636441966543, 0.025311873415413907, 0.026659862972788172, 0.027693240694915175, 0.02844108367920989, 0.028966042448626828, 0.029314788072316637, 0.02950838112094104, 0.029552556134897896, 0.029456874953143374, 0.029230974489049873, 0.028879972989709173, 0.02841483889775581, 0.027862964631037507, 0.027259794286765764, 0.026640820507658612, 0.02605574339453728, 0.02554812844385305, 0.025104958159768487, 0.024683176479911792, 0.024253213433142795, 0.023790526564700945, 0.02327297304218023, 0.022693751480069926, 0.022066917497033853, 0.021407037989978946, 0.02072500837415105, 0.020035818859390934, 0.019344605809774696, 0.018634650130140467, 0.017888597045997365, 0.0170935962320346, 0.0162363344052211, 0.015301177334201778, 0.014264388917214923, 0.01314859013384497, 0.011941639662403932, 0.010632772189908244, 0.00920430072968098, 0.007629167992179056, 0.005850508513539039, 0.004063192400133838, 0.0018795180884597302, 0.00040637621135307546], [-0.002490480135133756, -0.0025270541462848474, -0.002520842698237149, -0.0025433689315160005, -0.0029725546677344854, -0.026392100948678086, -0.049725527446272, 0.015128368847584592, 0.0037689462460346926, 0.0019259079638502378, 0.001830364909398079, 0.001847265393858122, 0.001818198142181652, 0.00171910514259542, 0.001554121612139589, 0.0013355340125232214, 0.0010791858521634104, 0.0008048292810532515, 0.0005349621590474493, 0.00029169118007630945, 2.02784380692491e-05, -9.819622206573052e-05, -0.0001504053988072012, -0.00013935846479306655, -7.584564753417726e-05, 1.729508378697451e-05, 0.00010318172632397865, 0.00016431887582589444, 0.0002150855254536677, 0.000266760711523602, 0.0003265728008726486, 0.00040255924841595836, 0.0005001307687044244, 0.000622633435926274, 0.0007750833791409316, 0.0009641381838466788, 0.0011952894072398228, 0.001473754416566462, 0.0018050711892843554, 0.002192215965732689, 0.0026356434922282447, 0.0031289953504853134, 0.0036668392839028403, 0.004272034614307713, 0.004991625982264442, 0.005872368877289282, 0.006936728750273912, 0.008197637155060436, 0.009655458316360221, 0.011286878086252256, 0.013025673948663575, 0.014772259547477887, 0.016460161235356315, 0.01808342781717256, 0.019677885553785145, 0.021305376034569928, 0.02294084917514078, 0.02447555926793694, 0.02578170076096539, 0.02678342547377048, 0.02750886579263394, 0.028018575197854396, 0.028357683540808462, 0.028546530847655495, 0.028590654132773462, 0.02849929822835697, 0.028281785329735208, 0.027943071996509538, 0.0274937884379257, 0.02696044884458853, 0.026377349685009543, 0.025778835794692968, 0.025213002224158062, 0.024722029666539698, 0.024293344116393875, 0.02388529201636345, 0.023469360727156507, 0.02302220165059692, 0.02252152888652258, 0.021961105358378467, 0.02135455540133704, 0.02071598489640382, 0.020055941971243427, 0.019388942668745524, 0.01871998590342775, 0.018032914121135363, 0.01731095073599874, 0.016541678788200162, 0.015712235254273232, 0.014807513575664183, 0.013809185982134334, 0.012732689814291324, 0.01159087010511764, 0.01034031310175134, 0.008982135275540586, 0.007494408150370246, 0.005830999711856209, 0.003922906640781181, 0.0018183723965481157, 0.0003950191150990231], [-0.002395156698854377, -0.0023827676629113548, -0.0023127210680736845, -0.0022238626594233827, -0.0023271388727930664, -0.015271040064859027, -0.01669517453198222, 0.004874128669816545, 0.002261987375494294, 0.0014246211861394954, 0.001509860605813657, 0.00160179639614019, 0.001616788728131934, 0.0015490637678613234, 0.0014092239799392626, 0.0012122815092154165, 0.0009752492039510075, 0.0007182543214259842, 0.00046398919644050844, 0.00023479437178395305, 9.656170357049622e-06, -0.00010435699014231661, -0.00015434621694386156, -0.00014319834968820396, -8.135341164031755e-05, 9.05332506854103e-06, 9.228041246968948e-05, 0.00015146042925778295, 0.00020056390613815148, 0.00025051136531504804, 0.0003083114525488358, 0.00038176677252827276, 0.000476131413044043, 0.0005946531600390402, 0.0007421972824306193, 0.0009252204998903064, 0.0011490448291465582, 0.00141872629803588, 0.001739633393584888, 0.0021146465138330065, 0.002544194703768738, 0.0030220924254927306, 0.003543065502403538, 0.004129295470715484, 0.0048264303035990145, 0.0056798972540078934, 0.0067115500888221095, 0.007934001745845257, 0.0093476938997015, 0.010930107094036736, 0.012618296986655111, 0.014314376964389032, 0.015953805587928235, 0.017530755110164362, 0.019079858819059374, 0.020661123445229145, 0.02225020993019961, 0.023741535745776768, 0.025011024297137047, 0.025985031305838385, 0.02669084055402206, 0.027187338134602973, 0.027518134768614713, 0.027702949339284747, 0.027747146054916613, 0.027659691886846017, 0.02744963353724231, 0.02712178604149686, 0.02668647522910584, 0.026169438230448084, 0.025603966097276838, 0.025023398575101947, 0.024474425668007616, 0.023998020356534946, 0.023582011591612523, 0.023185978367917238, 0.022782342272982325, 0.022348833978690977, 0.021862968949554723, 0.02131903097677515, 0.020730265926526735, 0.020110376860834243, 0.019468477702723034, 0.018819747431161733, 0.018169164212497167, 0.017501015858223543, 0.016799028862169774, 0.016051172567966215, 0.015244992345114292, 0.014365865474404669, 0.013386193690116972, 0.012348664144242091, 0.01122848662650962, 0.010016973520838031, 0.008700294800586357, 0.0072571974693637605, 0.005642266484606959, 0.003789936803020945, 0.0017458826978696954, 0.00037045922089033154], [-0.0023723636219905734, -0.002345413473099958, -0.0022562592012497075, -0.0021341368088140353, -0.0021409173114844316, -0.012003727957971805, -0.010317348432434882, 0.0028883042265917696, 0.0018192863855739788, 0.001279103969430686, 0.0014181989392589387, 0.0015326170612835744, 0.0015607211028245077, 0.0015021509458234873, 0.001369452943234262, 0.0011784827187682413, 0.0009466392562652915, 0.0006942073644694254, 0.0004439892062551834, 0.00021844603121149537, 6.525559906003585e-06, -0.00010642518521733555, -0.00015587029657455618, -0.0001446668736940894, -8.317496851885514e-05, 6.627886478105146e-06, 8.925670054258912e-05, 0.00014799171226584191, 0.0001967142962349536, 0.00024626364021266206, 0.0003035992680622777, 0.00037647199519954795, 0.0004701014856508428, 0.0005877138101089563, 0.0007341406325038053, 0.0009157938796813455, 0.0011379574676816404, 0.0014056511470353784, 0.0017242054256372738, 0.002096534972710235, 0.0025230116411920655, 0.002997482119847046, 0.00351470406569348, 0.004096701531831852, 0.004788805767645501, 0.0056361444683811065, 0.006660428589391533, 0.007874195630504364, 0.009277903147102355, 0.01084921347692343, 0.012526018479881038, 0.014210724795559935, 0.015839186442174663, 0.01740557622207374, 0.018944324686115878, 0.02051504164830748, 0.022093649792282934, 0.023575323368747306, 0.024836827570039518, 0.025804905762185394, 0.026506549285645956, 0.02700023220686155, 0.027329275789936394, 0.027513294826748556, 0.02755761757315364, 0.027471149847908802, 0.0272628779814325, 0.026937585156711023, 0.02650550412869221, 0.025992281667374825, 0.02543090107532105, 0.02485447210086542, 0.02430937445742386, 0.023836325299857502, 0.02342327331802162, 0.02303007427655236, 0.02262935636935919, 0.02219911242654983, 0.02171674050538699, 0.021176315831652383, 0.020591152355782533, 0.019974917788093793, 0.01933781476111169, 0.018693880247107365, 0.01804799772581893, 0.017384615987445777, 0.016687589149280903, 0.015944978272112345, 0.015144419523943116, 0.014271393077989442, 0.013302677683553065, 0.012271704510921118, 0.011158613051072979, 0.009954755699671355, 0.008646586999716094, 0.007212905418946915, 0.0056085072042733886, 0.0037682423264629988, 0.001737426401688433, 0.0003704925838193777], [-0.0023594965500035848, -0.002323443763746765, -0.0022223138666933218, -0.0020793623968754535, -0.002025926270885848, -0.009970533221106699, -0.007159831638114852, 0.001902980067149017, 0.001543648199114175, 0.0011890209610977294, 0.0013618066988945081, 0.0014903209947720636, 0.001526623805308698, 0.0014737334122225524, 0.0013454164828189188, 0.0011580641078223438, 0.0009293262044757403, 0.0006795975126513301, 0.00043176178384678323, 0.0002083684503211502, 4.57556045959653e-06, -0.00010777679061549105, -0.00015691062673178763, -0.0001456661222525897, -8.435934924832841e-05, 5.1180252070929665e-06, 8.742075368189833e-05, 0.0001459116582197707, 0.0001944244164924366, 0.00024375365987087564, 0.0003008322388468847, 0.00037338308361253223, 0.0004666073619761174, 0.0005838164732412797, 0.0007297365992704405, 0.0009107423878881992, 0.0011320909945659653, 0.0013987800796207966, 0.0017161179431839002, 0.0020869519758597178, 0.0025117045978867774, 0.0029842539127779852, 0.0034993746035809985, 0.004079000729136524, 0.0047682937204669385, 0.00561222372852438, 0.0066324310307683, 0.00784142021245176, 0.009239665771934108, 0.01080493677956741, 0.0124756149949391, 0.014154234144554063, 0.0157768619518409, 0.01733767525091348, 0.018870966138977572, 0.020436133351399235, 0.022009223942665673, 0.023485805527497686, 0.024743087706422952, 0.025708035235544713, 0.026407499870730145, 0.0268997182491343, 0.027227869118253055, 0.02741164994269312, 0.027456250380874927, 0.02737052283797655, 0.027163408437218296, 0.026839665139426292, 0.026409482672192196, 0.025898311230849486, 0.025339104190144904, 0.02476486553682578, 0.024221814368738798, 0.023750528533525706, 0.02333900411155078, 0.022947243318972896, 0.022547642225180582, 0.022118971373778717, 0.021637841063555565, 0.021099065870824794, 0.02051579071461504, 0.019901593104399436, 0.019266625775616403, 0.018624868250596883, 0.017981181321586222, 0.01732006660139205, 0.016625435880043095, 0.01588539346199389, 0.015087620564346774, 0.014217650733040488, 0.013254705405507064, 0.012227623483793361, 0.011118721870649852, 0.00991938151248912, 0.008615961253061615, 0.007187440307175437, 0.00558875795717984, 0.0037549677930453895, 0.0017311415397535399, 0.0003683593691993164], [-0.0023523313337644367, -0.002310875777421716, -0.0022026273675917747, -0.002047301193227456, -0.0019581603690721782, -0.008766602078917538, -0.005589399655787681, 0.0014118971834445552, 0.001380297593351652, 0.0011358548824598048, 0.00132864598663832, 0.0014655411786382681, 0.0015067110324588715, 0.0014571770432821192, 0.0013314319343889268, 0.0011461874112093863, 0.0009192455905871403, 0.0006710703682500729, 0.0004245983383956106, 0.00020243561923758829, 3.4205675232776925e-06, -0.00010859907241988862, -0.0001575580147730946, -0.0001462869572951693, -8.507792195342334e-05, 4.224036357283934e-06, 8.634958546551408e-05, 0.00014470724284012195, 0.00019310512135920445, 0.0002423135542379469, 0.00029936409443061935, 0.00037186048076220637, 0.00046498435274600297, 0.0005819396405956527, 0.0007275258355611872, 0.0009081132330631941, 0.0011289519234460234, 0.0013950306757851939, 0.0017116483382368633, 0.002081647378036548, 0.0025054496201973872, 0.0029769455629678246, 0.003490917317937391, 0.004069250121049553, 0.004757013768188422, 0.005599094174606212, 0.006617094073359256, 0.007823500902234819, 0.009218799099078417, 0.010780816001470133, 0.012448210391925672, 0.014123570847002385, 0.01574308158254974, 0.017300921923295576, 0.018831308364045545, 0.02039352458350767, 0.02196367913383322, 0.02343754791880593, 0.024692578042469788, 0.025655857777622595, 0.02635431729323773, 0.026845940233371213, 0.02717382137576839, 0.027357466158000363, 0.027402162763498744, 0.027316756484559838, 0.027110175288624836, 0.026787169668683154, 0.02635791444760671, 0.025847813653656616, 0.025289757022844868, 0.024716684559664064, 0.024174725691611675, 0.023704381551330367, 0.02329367251754267, 0.022902255761565453, 0.02250331379297182, 0.022075389018873737, 0.021595116979830298, 0.021057317798334984, 0.020475110889128727, 0.019862049533321532, 0.019228265235943516, 0.018587708992747958, 0.01794523072334216, 0.017285361522796933, 0.016592044866387285, 0.01585340869023916, 0.015057158616992755, 0.014188856894664578, 0.013229359973371286, 0.012204300500498647, 0.011097567194279734, 0.009900565432923244, 0.008599830828282645, 0.007174119428337068, 0.005578496989203014, 0.0037481743386540258, 0.0017280913841280535, 0.00036752421646820186]], [[-0.0001664148926006843, -0.00022174771059010266, -0.0002602024579626707, -0.00028541838018169034, -0.00030501786065183093, -0.0003417386926334338, -0.0004724363313625043, -0.004065985749198652, -0.037312888540013724, -0.09837215139062176, 0.18024521275813601, 0.05096778458549444, 0.013186096516882908, 0.003666827315585283, 0.0033787786404071126, 0.0032129189437068275, 0.0030787107620361288, 0.002954292544742774, 0.002834992213157442, 0.002719868146504506, 0.0024685614949536048, 0.002429900089495979, 0.0024202926798785416, 0.0024404247238083735, 0.0024879585428125212, 0.0025560308488713286, 0.0026313925743215332, 0.0027028943452633647, 0.0027755634291731536, 0.0028544993308813223, 0.0029437111471511566, 0.0030487050798524875, 0.003173167726287244, 0.003319038795717529, 0.003489352610212862, 0.0036881839610148296, 0.003920527267571611, 0.004191331909538014, 0.004505002626138373, 0.004864489649469284, 0.005272201363804968, 0.005729494511503622, 0.006236385007599049, 0.0068061965397944015, 0.00746794074286919, 0.008246020616259444, 0.009147195338045717, 0.010169930919168983, 0.01130117186967765, 0.012511108323130024, 0.013743010616140213, 0.014931698508837672, 0.016028873426946342, 0.017026823831426893, 0.01794977233644052, 0.018835504599331466, 0.01968193531441487, 0.020439492295844543, 0.021049233017790325, 0.021470265124298255, 0.02171485426474611, 0.02181969559334364, 0.021815546554208438, 0.021720393868057672, 0.021540180780528724, 0.021282804183401626, 0.02095608747030543, 0.020565807658710952, 0.020117382048844785, 0.019616994131056237, 0.01909991080532499, 0.0185799794722116, 0.018085785555801804, 0.017639210092333924, 0.017231721001851715, 0.016839649337810982, 0.01644617123444366, 0.016037865781455312, 0.015600277546392849, 0.015131743617363701, 0.014639804288197559, 0.014132541314676055, 0.013616129118854013, 0.013099590473330211, 0.012584560576964469, 0.012059097216014758, 0.011513338912767271, 0.010939628603460257, 0.010329876726769355, 0.00967477217457578, 0.008940021943296607, 0.008167960104667908, 0.007337158547318823, 0.006438086396990973, 0.005455588346143553, 0.004368018659725143, 0.003133440454235695, 0.0016817941526504788, -4.925326690591277e-05, -0.0013009792985009185], [-0.00015041418499362244, -0.0001631585871876821, -0.00015202914907205725, -0.00011556211505607817, -5.288074161584915e-05, 3.0253206654334334e-05, 0.0001011524083737225, -0.0014697471893526347, -0.007061890922151491, -0.020015839263408903, 0.0407565077473221, 0.011155533559345154, 0.0036079229196669216, 0.0032691216870627112, 0.003182426410178935, 0.003123391432538145, 0.0030542619151856963, 0.002972238537578995, 0.0028822557309816322, 0.0027892770685706446, 0.0026354677312244016, 0.0025986810175085834, 0.0025921809836997236, 0.002616873741851493, 0.0026703597116783857, 0.0027453086275579753, 0.002827549978355184, 0.0029054353611593416, 0.0029845106342160123, 0.003070271089818531, 0.0031670426451108178, 0.003280792951378031, 0.0034155267204410643, 0.003573351956300196, 0.0037575556706214274, 0.0039725480287459685, 0.004223724228336409, 0.004516431893283016, 0.0048554339658854325, 0.005243911175057461, 0.005684444007405138, 0.006178465801478957, 0.006726017682448041, 0.007341563286235769, 0.008056515585548851, 0.008897422450284787, 0.009871716803321478, 0.01097786210978889, 0.012201886252089433, 0.01351169549195153, 0.01484800479300909, 0.016138122859759928, 0.017329705037036316, 0.01841430181111092, 0.019417986594490486, 0.02038164304832936, 0.021302851923268428, 0.02212773932274884, 0.022792314602518685, 0.02325231672302539, 0.023521108458353795, 0.02363814398382615, 0.02363684401070952, 0.023536594353977636, 0.023343808673236453, 0.023067024155689522, 0.02271470393723236, 0.02229309231144136, 0.02180831590712813, 0.02127192641939604, 0.02071322237104501, 0.020151033079177257, 0.019616474172705047, 0.01913333938127402, 0.01869239594325991, 0.018267981654324517, 0.017841886537430032, 0.017399582918523084, 0.016925413371235213, 0.0164175988469312, 0.015884417750574458, 0.015334645408563894, 0.01477497698479715, 0.014215180569945054, 0.0136570580858902, 0.0130877377809544, 0.012496585256863096, 0.011875360094156875, 0.011215360263496335, 0.010506565735556039, 0.009729611494736126, 0.008904246627629571, 0.008018342934876948, 0.007063152269413251, 0.00602485689862873, 0.005005390769128294, 0.003773399661830751, 0.0023845196197089563, 0.0009128752147099204, 0.0002968713229427291], [-0.00014393324305956716, -0.00014550409043954062, -0.00012177276620750345, -6.998357118085267e-05, 1.2916464612030446e-05, 0.00012563012014455707, 0.0002473633364174358, 0.0002586004019029505, -0.0014216102401585441, -0.009245034900556101, 0.021531143560253468, 0.008598182288586394, 0.003308567085845939, 0.003115394928050905, 0.0030819415215632014, 0.0030513575691630953, 0.0030000806186784744, 0.002930267001227232, 0.0028492491015283195, 0.002763434270894583, 0.0026371583396929115, 0.002601431382034966, 0.0025958339268603737, 0.0026213147371619873, 0.0026754959005464533, 0.0027510417415509783, 0.0028337664712308605, 0.0029120757134364398, 0.002991562009516777, 0.0030777364848495505, 0.003174938874461559, 0.0032891621766881676, 0.00342443029021878, 0.0035828615364684622, 0.0037677565072864187, 0.003983542645879197, 0.004235633838141261, 0.004529396489076553, 0.004869611170722108, 0.005259468139950416, 0.005701551774791642, 0.006197292679945079, 0.0067467378317599865, 0.007364417850801803, 0.00808187200265352, 0.008925784636142752, 0.009903645752356572, 0.011013942248650268, 0.012242684860302219, 0.013557694496003789, 0.014899957085675795, 0.016195985538339897, 0.017393213250143976, 0.01848313301608941, 0.019491886392074716, 0.020460514370436788, 0.02138654958100715, 0.02221585428424685, 0.022884140265885197, 0.023346972356145516, 0.023617786537589346, 0.023736129381017487, 0.023735583906652542, 0.023635592523461747, 0.023442589555941352, 0.023165143339086574, 0.022811749174952347, 0.022388673868617377, 0.02190213077470793, 0.021364873718637226, 0.02080420403893741, 0.020239939557067828, 0.019703360061412, 0.019218379112024293, 0.01877572814425575, 0.018349633656340063, 0.017921813989002226, 0.017477684038113773, 0.017001522120355925, 0.016491547152212432, 0.01595609794754223, 0.015403990974660177, 0.014841950617209318, 0.014279783878016511, 0.013719307389834, 0.0131476116768649, 0.012554029897417367, 0.011930206963571194, 0.011267576553836305, 0.010556136101948322, 0.009787435227925434, 0.008967313133756323, 0.008089259861166589, 0.007145821308460348, 0.00612536450913655, 0.005012810017211887, 0.0037797776131999034, 0.0023886999355623856, 0.0009208899561922835, 0.00030753367960857983], [-0.0001377369104146151, -0.00012777836294435726, -9.095627138711959e-05, -2.3171764729496625e-05, 8.08851908986492e-05, 0.00022452180354221282, 0.00039915042658599317, 0.0005364161974425161, -0.0002846546560216654, -0.002030641053240895, 0.00866419813369423, 0.005986794794908248, 0.0030108917127333427, 0.0029673936711505874, 0.002988788561570468, 0.0029874704385964975, 0.0029544471778826633, 0.0028969983779008673, 0.0028249570735556766, 0.0027462430674989147, 0.002647957162681912, 0.002613201568945253, 0.002608516655634021, 0.0026348984727268647, 0.002689983312681614, 0.002766404731385967, 0.0028499124673092503, 0.0029289281133628776, 0.003009111602835301, 0.0030960093261589755, 0.00319399018159486, 0.003309093908383764, 0.003445378026720887, 0.0036049787813436183, 0.0037912221144960983, 0.004008568505568812, 0.00426246971913306, 0.004558329971748835, 0.004900964447202152, 0.005293584190742396, 0.005738786469990463, 0.006238003978782101, 0.006791289895084329, 0.007413293874357191, 0.008135793834632496, 0.00898570662526212, 0.009970606884563069, 0.011089000505069993, 0.012326832494409436, 0.01365172517564933, 0.01500474160549874, 0.016311320883436047, 0.01751848681647261, 0.018617643437362122, 0.01963509239430326, 0.020612177993959875, 0.021546374718980618, 0.022383086598158203, 0.023057497520818804, 0.023524840008255964, 0.02379867174499977, 0.02391877045069141, 0.02391900199481484, 0.023818933957191885, 0.02362504408479863, 0.023345962283130947, 0.022990246225307792, 0.022564207470092894, 0.02207417023261213, 0.021534173117397075, 0.020969549438715825, 0.020401205516040986, 0.019860697990194763, 0.019372146222678438, 0.018926212868669256, 0.01849692104848303, 0.018065665976503522, 0.017617791702896048, 0.01713749285974836, 0.016623012766647675, 0.01608282566561359, 0.015525829892386761, 0.014958809644836228, 0.014391650102503224, 0.013826191911276396, 0.013249446983568463, 0.012650689344161418, 0.012021620489361156, 0.011353481846522611, 0.010636188464802122, 0.00986014579277245, 0.00903399231137138, 0.008149284153959727, 0.00719849967857875, 0.0061698662419715595, 0.005048073109036025, 0.0038043199941470065, 0.0024007786947070854, 0.0009217030139154295, 0.00031670212796738303], [-0.00013572573659774483, -0.00012219014651942704, -8.132241296511242e-05, -8.608762624339597e-06, 0.00010195901819270712, 0.00025511709845587184, 0.0004460768094955082, 0.0006224266451537392, 6.933479395034523e-05, -0.0005761950685617218, 0.006066836181454788, 0.005170926798886088, 0.0029165099648739636, 0.002919556173690514, 0.0029579840899381423, 0.0029657623059106512, 0.002938432585030865, 0.002884862270776086, 0.0028156554767424964, 0.0027391971486120993, 0.0026496712099744685, 0.002615239059735309, 0.002610840660451298, 0.0026374861407187605, 0.0026928176735592107, 0.002769463820539596, 0.0028531631199320835, 0.0029323493079577777, 0.003012699752654537, 0.003099768364909199, 0.003197930397269092, 0.0033132363700590635, 0.003449751736445499, 0.0036096169867705775, 0.0037961638793569705, 0.004013860394761259, 0.004268166688977933, 0.004564495378616371, 0.004907669418330155, 0.005300904322871302, 0.005746799755132134, 0.00624678816975314, 0.006800924639122843, 0.0074238867286253556, 0.008147506820130108, 0.008998757329437423, 0.00998523450187983, 0.01110545106006287, 0.012345340300259114, 0.013672482905996848, 0.015028002453640325, 0.0163370505521664, 0.01754655656536889, 0.01864790227034429, 0.01966742275951605, 0.020646530967092083, 0.02158268487035603, 0.022421179941777343, 0.023097076201235776, 0.0235655306541162, 0.023840130400952224, 0.023960700332142662, 0.02396117322209548, 0.023861143417725342, 0.02366709814413139, 0.0233876810905024, 0.02303146400725175, 0.022604768448051916, 0.022113949160412393, 0.02157343533914183, 0.02100793294632116, 0.020438673630557406, 0.01989728050590149, 0.019407751752376978, 0.018960796111573332, 0.018530408281780368, 0.01809814839830458, 0.01764930129935318, 0.017167999743942293, 0.016652472200433935, 0.0161112037188761, 0.015553106375039693, 0.014984974772890453, 0.01441670981616981, 0.013850153826673013, 0.01327229517093397, 0.012672389348826321, 0.012042123937466478, 0.01137272546159024, 0.010654091707808892, 0.009877910398755988, 0.00905031128528805, 0.008164021255793788, 0.007211498512102282, 0.006180933729511087, 0.0050569576815532626, 0.003810671246981733, 0.0024042329381896562, 0.0009228873178897322, 0.00032349370090873773], [-0.00013443830635201108, -0.00011864246488502, -7.522134548358657e-05, 6.006512440603282e-07, 0.00011527251286522002, 0.0002744334153607596, 0.0004756974146497478, 0.0006767407778072727, 0.0002934604207876558, 0.00015243124501733855, 0.004764612503895914, 0.004654070211978238, 0.0028564927567959007, 0.0028889693330835407, 0.0029381630471173154, 0.0029516921200766614, 0.0029279656822541666, 0.002876854005529413, 0.0028094475394949193, 0.0027344243751212405, 0.0026504478790034453, 0.0026162242385624297, 0.0026120075164758473, 0.0026388166263776698, 0.002694297732981982, 0.0027710770943657156, 0.0028548878199295825, 0.0029341726650629436, 0.003014619363949535, 0.003101785938968248, 0.003200051153402216, 0.003315471643248851, 0.0034521174065496045, 0.003612131370083669, 0.0037988485835541495, 0.004016741252694524, 0.004271274206586708, 0.004567864745892763, 0.004911340179831032, 0.005304918476547764, 0.005751200512150042, 0.006251618423981166, 0.006806228475918234, 0.007429724179805708, 0.008153968665843746, 0.00900596635872924, 0.009993326285693811, 0.01111456566050977, 0.012355612004789369, 0.013684023430773367, 0.015040968607317202, 0.016351426035054115, 0.017562271511795246, 0.018664873741059382, 0.01968558590981444, 0.020665859545955494, 0.021603142484835292, 0.022442667898402213, 0.02311942500978039, 0.023588528272658858, 0.023863581812756093, 0.023984435730780074, 0.023985061172686794, 0.023885067139267396, 0.023690946096787957, 0.02341134944810642, 0.023054856851293295, 0.02262779544716442, 0.02213653855269379, 0.02159576066644384, 0.02102976820190487, 0.020459822135848512, 0.019917666868718237, 0.019427529352214753, 0.018980044564768594, 0.018549159210625863, 0.01811640585885312, 0.0176670518967656, 0.017185213473995216, 0.016669116940738107, 0.01612725632683191, 0.015568553008695135, 0.014999808370582813, 0.014430932747359723, 0.013863769792228045, 0.01328529496566882, 0.01268475372349649, 0.012053826241428034, 0.01138373111223846, 0.010664356907546033, 0.009888610988649507, 0.009056241838910593, 0.008168866569175336, 0.007215211520366872, 0.006183385490817426, 0.005057982685980085, 0.0038100258698757577, 0.0024020004974091434, 0.0009226297073097607, 0.00032248540772282925], [-0.000133663533457705, -0.00011651899777577598, -7.157544063119034e-05, 6.098834515629946e-06, 0.00012321567148849494, 0.0002859531031692228, 0.0004933597815818499, 0.0007091368299992815, 0.00042745396101360024, 0.0005171115110837988, 0.004112371304434687, 0.004345035571890353, 0.002820530520696958, 0.0028705761881679366, 0.002926195056795819, 0.0029431568915304295, 0.002921582773718659, 0.002871941292770757, 0.0028056127435674965, 0.002731449833871525, 0.0026507903115769674, 0.002616692721490981, 0.002612584657360079, 0.0026394902310533466, 0.002695058098093146, 0.0027719134786653187, 0.002855786893715642, 0.0029351270119940074, 0.0030156274962804845, 0.0031028485693267295, 0.0032011708900744618, 0.003316654468620095, 0.0034533718301918486, 0.003613467258135812, 0.003800277614602669, 0.004018277423245703, 0.004272934053067143, 0.004569667353370206, 0.004913307012294709, 0.005307072315495725, 0.005753564744407586, 0.006254216181421996, 0.006809083599185379, 0.007432869357697867, 0.0081574534868481, 0.009009858285885452, 0.009997700064995604, 0.011119498787106094, 0.01236117917003699, 0.013690287334682034, 0.015048021562511721, 0.016359260437043013, 0.017570850206457593, 0.01867403168456909, 0.01969524197045334, 0.020675951525324508, 0.021613618867256695, 0.02245346735721824, 0.02313047289426781, 0.023599722422528637, 0.02387480601409567, 0.023995800760161695, 0.023996491108610022, 0.023896505912179292, 0.02370234136381495, 0.023422653196453966, 0.023066025501345226, 0.02263878805572347, 0.022147315682539803, 0.02160710918098071, 0.021040726992337912, 0.020470444329093118, 0.019927980953117243, 0.019437564070373812, 0.01898983333367061, 0.018558722567773724, 0.018125755480486592, 0.017676190865791273, 0.01719413522140753, 0.016677809243318558, 0.016135708166959903, 0.015576758082764812, 0.015007763876819319, 0.014438817136078304, 0.013871588552582217, 0.013293043227721905, 0.012692416746947094, 0.012061382734693742, 0.011391153722216267, 0.010671611642064848, 0.009889764904096363, 0.009061081063351044, 0.008173575204592779, 0.007219606639519944, 0.0061873376668633686, 0.0050613696943390026, 0.003812716302171643, 0.0024038330882223276, 0.0009234526213307337, 0.0003225255664048371]], [[-0.00408689934139812, -0.003972271729581539, -0.0038334226847900467, -0.0036795577263572334, -0.003527505500026495, -0.003401208739967618, -0.0033272382398079523, -0.0033203146280486573, -0.003372231427375117, -0.003409032032146631, -0.0029677227320429288, 0.0004790379475315419, 1.645775752316097, 2.023609640818118, -0.16859653371617908, -0.015883545045922057, -0.012008180016022836, -0.011152596563020992, -0.010774480473181962, -0.010534247453512953, -0.009912099446113732, -0.009941976495251274, -0.010013195573267122, -0.010130520794722977, -0.010295216072764714, -0.010503274722324742, -0.010741094552688776, -0.010987580411267968, -0.01124879501446201, -0.011533387614445334, -0.011850123255129814, -0.012212977863691174, -0.012631241333156892, -0.013109209950355324, -0.013653725620027184, -0.01427400512001242, -0.014984032449700124, -0.015797960775117574, -0.0167274437171073, -0.017780997458990866, -0.018967803313326655, -0.020300276319517776, -0.021785552873693298, -0.023453665472276827, -0.025370226476780975, -0.027580642386416443, -0.030085771033843058, -0.03286286342976729, -0.035855935946596584, -0.038967055948480364, -0.042043144548771186, -0.04492356530560066, -0.04748785972367798, -0.04971193616104739, -0.051655166342585636, -0.05340142390982254, -0.05496936700038891, -0.056282228596167466, -0.057247206216708944, -0.057787415084661314, -0.057922830482496745, -0.05773413894294662, -0.05729556591505333, -0.05665740657535515, -0.05583793847116494, -0.054853629626758306, -0.053734747444763996, -0.05249633027801389, -0.05114969691087558, -0.049722595747126126, -0.04825879737120132, -0.04680141155220202, -0.04541305276668897, -0.044134390520598636, -0.04294400500382142, -0.041793039202306384, -0.040644994451255585, -0.03947065096083237, -0.03823879034276983, -0.03694936783321663, -0.03561814833495794, -0.03426188679615748, -0.032893672528002044, -0.03153370680347415, -0.030182738896194775, -0.028810377236019816, -0.02739573151326827, -0.025921846874426252, -0.02437049735039093, -0.022721057212047188, -0.02077127552672397, -0.018853863962618053, -0.016800475434533953, -0.014585290183780557, -0.01216722162994412, -0.009491652512208617, -0.006460466357592519, -0.002815858362502593, 0.0011823715394686993, 0.003577297673186165], [0.0028948124457774333, 0.0028494181728730447, 0.002789655656596193, 0.0027241031485527372, 0.0026672613997602936, 0.002639742292529334, 0.0026663300344286246, 0.002769058315992856, 0.0029598632481935986, 0.0032195784403313754, 0.003368661216505315, 0.002576970077060944, -0.512996755990395, -0.2796135820647181, 0.028600968631906754, 0.008509780309922275, 0.007390113204660986, 0.007186689689471944, 0.007109689315875516, 0.007055436566932271, 0.006875313262242809, 0.006908807931492208, 0.00696836406704122, 0.007057904531022085, 0.007178714967144273, 0.007328261506477565, 0.0074973899743248475, 0.007672165401108215, 0.00785706878937283, 0.008058155979308541, 0.008281567873513274, 0.008537120992561584, 0.008831356104382751, 0.00916730611167566, 0.009549780579253184, 0.009985248773942483, 0.010483504403753048, 0.01105446192887406, 0.01170629155801212, 0.01244495276847227, 0.013276850744729509, 0.014210644435967945, 0.015251409690292697, 0.01642030075028812, 0.017763322165249368, 0.01931244344229924, 0.021068386624114754, 0.023015318168214772, 0.025114133547050024, 0.027296322066461078, 0.02945619418433306, 0.0314793922475391, 0.03328146734045786, 0.03484544287913014, 0.0362127766764109, 0.037442217604840775, 0.03854655950209337, 0.03947174197412366, 0.04015252854452718, 0.04053516898249039, 0.040633863546024294, 0.04050451583749967, 0.04019960643759989, 0.03975424663557259, 0.03918127990687078, 0.038494378817386, 0.037711364413078034, 0.036843943629629, 0.03590025611005761, 0.03489985086991013, 0.03387344679527224, 0.032851299474748165, 0.03187733610510594, 0.03098011502836463, 0.030144604277011735, 0.02933653051616582, 0.0285304493707062, 0.027705928331686155, 0.026841126404906313, 0.025936027149972538, 0.025001720644546428, 0.024049982558822125, 0.02308999329590131, 0.022135898244810194, 0.021188242080345636, 0.020225794120813753, 0.01923399076097773, 0.018201041231474528, 0.017114277508788085, 0.015959362023212666, 0.014668788304771967, 0.013428097397377742, 0.012036282805460635, 0.010548799346646216, 0.008946298066825401, 0.007197794046785217, 0.005276020049727252, 0.003100848201690656, 0.0009474869747643159, 0.0004849594918428916], [0.002260743122651861, 0.0022318328512775003, 0.0021922109547530427, 0.0021489527419386225, 0.002113854326148018, 0.002103680287330806, 0.00213887587184246, 0.00223876937899679, 0.002415925531439147, 0.0026614456634598957, 0.002862229455202433, 0.002545378969217558, -0.28136266325596776, -0.10691422299534466, 0.013554034977440095, 0.0061449165424466165, 0.005567592276260235, 0.005482289483079127, 0.005457022378320463, 0.005435831524421597, 0.005342769810675631, 0.005371181271826859, 0.0054193571211151054, 0.005490461168185377, 0.005585568786471056, 0.005702756686231602, 0.005834963579792133, 0.005971490769359992, 0.006115871866378086, 0.006272823369715935, 0.006447128765333755, 0.006646439262066245, 0.0068758557617769785, 0.007137744983285642, 0.0074358563232173325, 0.007775231241831593, 0.00816349791916992, 0.008608379008056848, 0.009116239754219492, 0.009691721015413251, 0.01033980708686802, 0.011067235660222809, 0.011877974630816126, 0.012788523089492455, 0.013834723095633704, 0.015041506478474435, 0.016409458034996185, 0.017926263489781227, 0.01956148403825903, 0.02126177181567803, 0.022945087520849797, 0.02452201666419105, 0.02592676735022231, 0.027146097544021107, 0.028212275373808115, 0.029171060958676904, 0.030032368712223995, 0.030754036962681235, 0.03128520919384614, 0.031584037873488034, 0.031661622289562916, 0.03156139310793454, 0.03132431849823152, 0.03097772526504453, 0.030531624913968, 0.029997062123417923, 0.029387293439197455, 0.02871165432812813, 0.027976523915689777, 0.02719714997663625, 0.0263974708628813, 0.025601063979074794, 0.024842157470259727, 0.0241430089593543, 0.0234919046089539, 0.022862139005776147, 0.02223391560135688, 0.02159132564434572, 0.020917361714525795, 0.02021201376202752, 0.019483928766560608, 0.018742286267155555, 0.01799408927917077, 0.01725049072692962, 0.01651193877294384, 0.015761937144078513, 0.014989186628287172, 0.014184554655472645, 0.013338236030143266, 0.01243913561166991, 0.011467432731633176, 0.010449312662111791, 0.009365577025100776, 0.008206480709268835, 0.006956806925147781, 0.005599278217538448, 0.004105221189955276, 0.0024236698657847085, 0.0007437551692425193, 0.0003962080321708023], [0.0019058793914306434, 0.0018871062755914294, 0.0018597390091829127, 0.0018300641719992826, 0.0018084299245514598, 0.0018095406939634953, 0.0018515652637071823, 0.0019526134342811327, 0.0021260537651854976, 0.002369580032654339, 0.0026110566106090044, 0.002601970319051948, -0.13509676424188388, -0.02772245208323423, 0.006503116599118499, 0.004751357112840641, 0.004519187880133043, 0.00451024821100994, 0.004518794256555808, 0.004519058806852403, 0.004481357820237295, 0.004507238487720235, 0.0045492772651290056, 0.0046102271160385995, 0.004691055676423723, 0.004790189119250402, 0.004901749700009637, 0.005016875582668137, 0.005138574915614044, 0.005270812824004998, 0.005417611381602446, 0.005585407847436105, 0.0057784962832817055, 0.005998870310635361, 0.006249685057926146, 0.006535181392516661, 0.006861772697022483, 0.007235952142951795, 0.007663072663963742, 0.008147035287572208, 0.00869202659518835, 0.009303705592611329, 0.009985420633089988, 0.010751062490606266, 0.01163077371584028, 0.012645542520583555, 0.013795879805001842, 0.015071448018149202, 0.016446672215878262, 0.01787671238685622, 0.01929283508719105, 0.02061957085693174, 0.021801591653179894, 0.022827747759998178, 0.023725149018733092, 0.02453226944140078, 0.02525740119333664, 0.02586504986934707, 0.026312419508492686, 0.026564342094017358, 0.02663018273324709, 0.026546359697600747, 0.02634739570697416, 0.02605624781633013, 0.025681339971033147, 0.025232297263985477, 0.02471972953104681, 0.024151671890719567, 0.023533521292565692, 0.02287811558621907, 0.022205591079460994, 0.021535193795310444, 0.020896259002024808, 0.020307517790183482, 0.019759109110421266, 0.019228564925618325, 0.01869928509231139, 0.01815790597527163, 0.017590140051932816, 0.016995993340880738, 0.016382751374810586, 0.0157581434733274, 0.01512818900368052, 0.014502151910534552, 0.0138803920677733, 0.013249021933914447, 0.012598536056861996, 0.01192125445656625, 0.011208931338434949, 0.010452236945083477, 0.009643344589073897, 0.008787098646367631, 0.007875521234667886, 0.00690038494455595, 0.0058488137350886414, 0.004706119232469206, 0.003447848788561168, 0.002037107692216913, 0.0006245969471531742, 0.00035092451368126144], [0.001828944663320974, 0.00181257847318878, 0.001788093494905062, 0.0017616173359719133, 0.0017431993200446674, 0.00174711857674109, 0.0017910851989174847, 0.0018930126388802305, 0.0020665474421351815, 0.0023110067380450396, 0.002564003251920865, 0.002631280314180697, -0.09956851479331706, -0.014656840526959687, 0.005296496238184651, 0.004433070783316002, 0.0042853734392304665, 0.004295343277891097, 0.004312335197228082, 0.004317928603774936, 0.00429375238403867, 0.004319156435982013, 0.0043599179282177054, 0.004418703956924036, 0.004496461081747157, 0.004591693016565993, 0.004698781417460935, 0.004809268565985468, 0.0049260497806323635, 0.005052926875881018, 0.005193756456258245, 0.005354712111485613, 0.005539912749541894, 0.0057512710444069075, 0.005991813072495065, 0.006265605786579937, 0.006578798549490909, 0.006937617334899189, 0.007347195114264899, 0.007811272094737673, 0.008333861339657415, 0.00892038720715931, 0.009574063856186489, 0.010308215884782371, 0.011151747441287248, 0.012124790632774728, 0.013227841007164705, 0.014450991204507877, 0.015769723980372203, 0.017141048837225593, 0.01849913305356329, 0.019771527094162855, 0.020905176592455627, 0.021889385962430844, 0.022750143241800684, 0.023524338951822304, 0.024219911087244413, 0.024802812551109315, 0.02523199782071482, 0.025473751142915432, 0.0255370619540762, 0.025456820941264256, 0.025266152894189636, 0.024987064501927524, 0.024627634924947368, 0.024197193222538094, 0.0237057542815522, 0.02316107746900892, 0.022568180359677743, 0.021939441729910376, 0.0212941989775754, 0.02065148758127693, 0.02003892922804606, 0.01947448654247039, 0.018948704402186333, 0.018440039973615773, 0.017932577811373883, 0.017413505436999956, 0.01686912386016313, 0.016299438699533198, 0.01571143760978748, 0.015112533148851878, 0.014508497314385005, 0.013908212733809898, 0.013312025180866034, 0.01270662102825086, 0.012082887851996375, 0.01143346269916551, 0.010750439738441135, 0.010024873312305192, 0.009249502638742291, 0.008428321575542, 0.00755406081083235, 0.006618823686950919, 0.0056102466695617135, 0.004514214747063002, 0.0033072225842564374, 0.001955776288133394, 0.0005996649957544299, 0.00033910627843705134], [0.001786135118464892, 0.0017711663543510136, 0.0017483478391120846, 0.0017237220625556252, 0.0017071762533759772, 0.0017127588190211992, 0.001757934300453063, 0.0018605257372227909, 0.002034363171825863, 0.0022797209601513515, 0.0025398771234109757, 0.002652324011136431, -0.07873721237983862, -0.008485840031339672, 0.004711356607396006, 0.004251420248670603, 0.004153457906828415, 0.004174604246865141, 0.004196605642776844, 0.004205352417139613, 0.004189124915719487, 0.004214283780782003, 0.004254349331352988, 0.004311941773837214, 0.004387996573965673, 0.004481061086204856, 0.004585662087457063, 0.004693568361278511, 0.004807612746198831, 0.004931506069592269, 0.005069012752717785, 0.00522615953471333, 0.0054069677970439555, 0.00561330515467452, 0.005848125814826919, 0.006115399861303245, 0.0064211295650117425, 0.006771392040816561, 0.0071711977277171485, 0.007624197228045146, 0.008134306893554584, 0.008706820296222278, 0.009344876958081519, 0.010061486242411561, 0.010884862438702427, 0.011834660970608967, 0.01291136902921729, 0.01410531908439186, 0.01539258333004194, 0.016731201802166758, 0.01805696030255151, 0.01929908876646906, 0.02040579940969393, 0.021366649484866152, 0.022207001845804524, 0.022962864824851253, 0.02364197865704173, 0.024211102096459165, 0.024630164440634615, 0.02486625918378066, 0.024928166807537067, 0.024849925964350802, 0.024663883426642722, 0.024391516228368156, 0.02404071151108789, 0.02362063686912911, 0.023140873076522767, 0.022609014991379545, 0.022030161992222047, 0.02141635075896882, 0.020786441602878816, 0.02015901047553081, 0.019561016117367498, 0.019009990703614248, 0.018496702156500313, 0.018000121351738438, 0.0175047131638654, 0.016997971374957958, 0.01646652456701689, 0.01591037954170448, 0.015336358159400546, 0.014751696770076086, 0.014162029798334948, 0.01357602752110831, 0.012994026570400032, 0.012403030700782905, 0.011794145714412377, 0.011160185369994505, 0.010493432289625213, 0.009785154371243837, 0.009029969672586369, 0.008228350085535786, 0.0073748988546617706, 0.006461903050304636, 0.00547728330711727, 0.0044072414647889045, 0.003228795295915078, 0.001910406187978588, 0.0005856162702074544, 0.00033218919375058864], [0.0017624813967022082, 0.0017483070729915602, 0.0017264333882508053, 0.0017028570846642662, 0.0016873774367305288, 0.0016939176471639037, 0.0017398102987533778, 0.0018428357102184669, 0.0020169363763380774, 0.0022629362600149645, 0.002527336158821318, 0.002665769265322011, -0.06681881636922476, -0.005499595939453005, 0.004421286954577884, 0.004149282587763628, 0.004079874136725182, 0.004107447428171929, 0.004132335722382486, 0.0041428970976068276, 0.004131223953123832, 0.004156255031659747, 0.00419594173012638, 0.004252878688583009, 0.004327995486357625, 0.004419863780399863, 0.004523090831278097, 0.00462957120032204, 0.004742103320143098, 0.004864347700680211, 0.005000017786735021, 0.005155059125891145, 0.00533343918835292, 0.005537000686083059, 0.0057686580932911355, 0.006032327933544797, 0.0063339311350661155, 0.006679462494347863, 0.007073864694555964, 0.007520738783032939, 0.008023947613971948, 0.008588712411537061, 0.009218131471453943, 0.009925039905431707, 0.010737270539829535, 0.011674215294527064, 0.01273635681450646, 0.01391416025820289, 0.015184023846700031, 0.01650455755452636, 0.017812443179443426, 0.0190378382616584, 0.02012965539114124, 0.021077591577226943, 0.02190666386691241, 0.0226523927418431, 0.02332240890506203, 0.02388391656687529, 0.024297383955732072, 0.024530352143987223, 0.02459148619080674, 0.024514353192800716, 0.02433086998265706, 0.024062220621835967, 0.023716028962750574, 0.023301686514888877, 0.022828316880374105, 0.022303574644168996, 0.021732480087454233, 0.021126904993034563, 0.020505453595116987, 0.019886450462695954, 0.019296490511339297, 0.018752867218104544, 0.01824647089628724, 0.01775655629793864, 0.017267798467788666, 0.016767860400332422, 0.01624355174927492, 0.015694880186987437, 0.015128576082440774, 0.01455177818944087, 0.013970044704839318, 0.013391928358027825, 0.012817760234371102, 0.012234719004361351, 0.011634030975702814, 0.011008607419630122, 0.010350836667790363, 0.009652105842314518, 0.008908654711105305, 0.008117850822902159, 0.007275904472024525, 0.006375204134839964, 0.00540382723503662, 0.004348150263844637, 0.0031854794160268377, 0.0018853828090308006, 0.0005778895727219954, 0.00032842356824438866]], [[0.005092432041770855, 0.005015474603446939, 0.004873375033056306, 0.004667440324167131, 0.0044022338174461205, 0.004088423609406676, 0.003746132257769618, 0.0034072308403314193, 0.00311862831438867, 0.002956398411487666, 0.0029464269527959704, 0.003045449963857954, 0.0032057782301575634, 0.0033889102492814407, 0.003566985611790812, 0.0037198234884796553, 0.003830985157445554, 0.003867250074079705, 0.002105254566244963, -0.018131754854054816, -0.000855897248975239, 0.008261517318214605, 0.005893453325998573, 0.005323058976841167, 0.005371897675487473, 0.005482246286552555, 0.005604838913037934, 0.005736158334171612, 0.005876588896513841, 0.0060279464124139035, 0.006193272907264405, 0.0063780307186676, 0.006585772708924764, 0.006817898090706947, 0.007076632174150854, 0.007364956943904715, 0.007688264761805088, 0.008052156766515814, 0.008460971227704884, 0.008918061944230957, 0.009427862606522121, 0.009998085782859989, 0.010634799941530673, 0.011348669312311835, 0.012160643315207017, 0.013079226865183905, 0.014097024511604684, 0.01519665236545902, 0.016346741866067088, 0.017500663311368726, 0.018596553882577468, 0.019578138519885983, 0.02040437073929165, 0.021065744073188335, 0.021584191266238534, 0.021985045669785944, 0.02228341768252754, 0.02247307981804699, 0.02254451798168574, 0.02248568818677716, 0.02230053826510762, 0.02201306097956182, 0.021648345411080756, 0.02122624887634059, 0.020754961953831565, 0.020243335680937797, 0.019699855753990015, 0.019132415720131024, 0.018544048036260433, 0.017941294541965778, 0.01733632519850844, 0.016741048244661487, 0.01617353993282656, 0.015641586635546226, 0.015136812427626774, 0.014646533872433275, 0.014160588185968053, 0.013670610395163974, 0.013167792759913411, 0.012654122002286586, 0.012133645389756942, 0.011610656080745674, 0.011088681454489204, 0.010573801743796983, 0.010064698402023498, 0.009550270894712155, 0.009024766361588993, 0.008483676291413765, 0.007928456021923515, 0.0073395218223198935, 0.006593824098871938, 0.005917203717253939, 0.005196013629033766, 0.004419311670916415, 0.0035696106322716777, 0.002624871309319506, 0.0015483388355091608, 0.00029358590833088833, -0.001098209764123239, -0.0016576128999000155], [0.004952353714001226, 0.004884131332892882, 0.00475307166516922, 0.004560729755718729, 0.004311808293138643, 0.004016916944082374, 0.0036958263487269875, 0.00337980079383487, 0.003113744381775352, 0.002969530978588732, 0.002972126251082144, 0.0030804860487672853, 0.003249397772259019, 0.0034427583745551813, 0.0036354218253847005, 0.003811177508659926, 0.003960029844275686, 0.004068889766556769, 0.003388370024285305, 0.00016060664458639046, 0.0035702347575168616, 0.005509628134134063, 0.005132240063145307, 0.0051052955364217795, 0.00518897193721904, 0.005302442966063697, 0.005425333803250628, 0.005555732055983944, 0.005694483424790766, 0.005843483453110943, 0.006005764925383866, 0.006186693267033313, 0.006389767495435418, 0.006616382648305871, 0.006868726639373278, 0.007149715733261524, 0.007464596077215022, 0.00781881560128551, 0.008216597969492336, 0.008661205423377597, 0.009156938022514716, 0.009711270201766768, 0.010330151686352896, 0.01102400692114337, 0.011813184338162872, 0.012705972697794344, 0.013695209590902774, 0.014764016493678561, 0.015881928106599878, 0.017003644346321487, 0.018069126729943888, 0.01902357808142554, 0.019827186961472596, 0.020470721930129776, 0.020975451180514422, 0.0213659486877947, 0.02165672207507549, 0.02184166709780419, 0.02191205396632693, 0.02185550729584888, 0.021676247034189453, 0.021397050294526248, 0.021042755873721227, 0.020632601793750326, 0.020174605443581364, 0.019677379186297507, 0.019149181167651127, 0.018597699764634993, 0.018025937780496024, 0.0174402906235443, 0.016852580998739375, 0.01627435926771769, 0.015723126844380524, 0.015206378798301412, 0.014715958932772683, 0.014239595318775113, 0.013767462355842183, 0.013291473724491788, 0.012803110072884517, 0.012304320200618807, 0.011799536262540664, 0.011292517599756137, 0.010786700333342635, 0.010287969815250039, 0.009795045625916984, 0.009297235139103271, 0.008789086767727858, 0.008266060117771154, 0.0077259361054290415, 0.007157084423933137, 0.006550337552957337, 0.00592129174897309, 0.005257540098637728, 0.004548511852919055, 0.003789020225948123, 0.002967965761395587, 0.0020725644356589883, 0.0010944370618394758, 0.00015429547653127637, 0.00025717152573558554], [0.004930723171364595, 0.004864357117852496, 0.0047355490207607745, 0.004545914005798952, 0.004300196589751106, 0.004009015437955944, 0.00369210230682082, 0.003380648479271102, 0.00311919368338538, 0.002978801665207399, 0.002984280045817931, 0.003095006416011089, 0.0032662399275484107, 0.003462350601237798, 0.003658760928540496, 0.0038401352333764355, 0.003997932256453087, 0.004123645197721619, 0.004167407168371289, 0.0034004321660389887, 0.004171472722649544, 0.0051090533517859915, 0.0049803557090994, 0.005052394106885518, 0.005158028927095267, 0.005272454291754095, 0.00539567262317644, 0.005526134981647319, 0.0056647944961357, 0.005813568965740887, 0.005975495455732577, 0.006155928516805234, 0.006358362216780624, 0.006584193579841732, 0.00683560657123508, 0.007115508557600576, 0.007429123270191405, 0.007781875047129876, 0.008177970217848808, 0.008620656939221247, 0.009114213740822361, 0.009666076293206252, 0.010282179680279608, 0.010972915426740323, 0.011758537265342603, 0.012647301942671533, 0.013632085306052323, 0.014696088953354686, 0.01580899016233844, 0.01692569776755389, 0.01798646440145949, 0.01893671572512538, 0.019736839137736845, 0.020377646706031278, 0.020880299308550378, 0.021269248864878878, 0.02155889556978335, 0.021743150524275456, 0.02181344512204024, 0.021757301989220074, 0.021579012285938472, 0.021301122798471874, 0.020948467402792593, 0.020540182887449382, 0.020084263893717397, 0.01958928629669005, 0.019063473554199066, 0.018514483278387506, 0.017945317815825965, 0.017362352533293615, 0.016777316916169405, 0.016201714183373454, 0.015652954796360766, 0.015138487991816595, 0.014650201576144646, 0.014175901947556887, 0.013705830266600591, 0.013231959510565924, 0.01274583065375278, 0.012249393860294059, 0.011746598258282746, 0.011241619056760657, 0.010737868886067096, 0.010241196759403492, 0.009750315906969476, 0.009254582097337639, 0.008748580486298077, 0.008227729700923468, 0.007688934260180585, 0.007122324713189217, 0.006518241736249282, 0.00589156934609434, 0.005230012997412374, 0.004527231038108249, 0.0037733860805281667, 0.0029591942068942106, 0.0020660553754672435, 0.0010915701695563453, 0.00015713104134139412, 0.0002728675784287057], [0.004926265454215156, 0.004861546865471101, 0.00473456572850404, 0.004547003831054921, 0.004303664934015942, 0.0040152144754466036, 0.00370141472877671, 0.00339349351526042, 0.00313577890733737, 0.0029987649397357494, 0.003007186887769078, 0.0031207060693232017, 0.003294901483990479, 0.0034944966362334203, 0.0036954034976521655, 0.0038831194167559817, 0.0040505478744836025, 0.004193799402296945, 0.004283255163308982, 0.0038965792849839673, 0.004499489760133568, 0.004921708120656219, 0.004948866784234301, 0.005036547624511668, 0.0051449320509544235, 0.005260731003005912, 0.005384718331370762, 0.005515708231290903, 0.005654766168365314, 0.005803839313231841, 0.005965979840114626, 0.00614655025347796, 0.0063490519885254955, 0.006574889036999004, 0.00682624910219101, 0.007106040833483888, 0.0074194837465757415, 0.007771997482561742, 0.008167785702094916, 0.008610093792471156, 0.009103193615326743, 0.009654507886552125, 0.010269977881770979, 0.010959998577614939, 0.011744799464447281, 0.012632634091714367, 0.01361639185074033, 0.014679296046755743, 0.015791061062192194, 0.01690664776314943, 0.017966392220985804, 0.018915752625322066, 0.019715177606957724, 0.020355490784948145, 0.020857819216647307, 0.021246577717229903, 0.021536108576496845, 0.021720316872703874, 0.02179076709913905, 0.021734823181861644, 0.021556812777944332, 0.02127913417203908, 0.02092670467838971, 0.020518627163746805, 0.020062922337717157, 0.019568166783081105, 0.01904258445809841, 0.018493834998199746, 0.017924936052587385, 0.01734227017066386, 0.01675759574253218, 0.016182389464108476, 0.015634022913599457, 0.015119911208825948, 0.014631933495436553, 0.01415791623643773, 0.013688118023849994, 0.013214524843861626, 0.012728691732745174, 0.012232573848468212, 0.011730122715104948, 0.011225511958301277, 0.010722151059947426, 0.010225877842135328, 0.00973539459869697, 0.009240067273782076, 0.008734501325078263, 0.008214059814767015, 0.007674749665624545, 0.007108516904489127, 0.006512860148910819, 0.005886654113783922, 0.005225474163114106, 0.004522919159632626, 0.003768994487179475, 0.0029542183720167488, 0.002066151455094849, 0.0010926636266340218, 0.0001606915626865172, 0.00028987624526409793], [0.004925024162572231, 0.004860810308199102, 0.004734387451813484, 0.004547457917046705, 0.004304843802175081, 0.004017225202451675, 0.00370437428973621, 0.003397530934911023, 0.0031409593085041628, 0.0030049801625602708, 0.003014307181124198, 0.0031286878431654366, 0.003303798305937125, 0.0035044698106568403, 0.003706764163877243, 0.0038964344053463067, 0.004066827942139718, 0.004215474569079913, 0.004318978966923594, 0.004049266677052326, 0.004567992047908487, 0.004880657645027688, 0.004939315237985179, 0.005031808324056717, 0.005141040815907634, 0.005257265039997149, 0.00538149200425256, 0.005512647500239436, 0.0056518315536394255, 0.0058010004148667535, 0.0059632109825534805, 0.006143828346576234, 0.006346356298559099, 0.006572201008832198, 0.00682355138705054, 0.007103316553080641, 0.0074167148634488676, 0.007769164657315344, 0.008164868885035972, 0.008607072167529716, 0.009100044428583835, 0.009651204596219222, 0.01026649600497498, 0.010956314964822581, 0.011740884043795998, 0.012628456024683899, 0.0136119242760144, 0.014674518336501526, 0.015785963201414847, 0.016901234551843086, 0.017960692545738004, 0.018909803943653623, 0.019709035163180934, 0.020349213134240964, 0.020851462525913394, 0.021240149176678387, 0.021529585712206093, 0.021713672876423912, 0.02178415016041103, 0.021728136157390613, 0.021550099807991135, 0.02127239117844861, 0.020919956279176664, 0.02051188990216432, 0.02005621187851116, 0.019561497214709837, 0.019035968529751434, 0.018487284469277727, 0.01791846540305984, 0.017335894772452416, 0.016751326859186885, 0.016176233905326697, 0.015627978444759123, 0.015113965495033278, 0.01462607084970721, 0.01415212735175352, 0.013682399124310409, 0.01320887624708519, 0.01272311819075064, 0.012227082468677718, 0.011724721733798222, 0.011220209274270993, 0.010716953716004746, 0.010220789590621112, 0.009730800368316469, 0.009236066168143552, 0.00873117604700065, 0.008211396060192604, 0.007671496508176308, 0.007105739170544247, 0.006511718931762136, 0.0058856412786211015, 0.005224568124170798, 0.0045220875852504646, 0.0037681765198484363, 0.002953281281563818, 0.002064785609032809, 0.001093682898881476, 0.00016183489130149696, 0.00029515490653723336], [0.004924265930462538, 0.004860369862344375, 0.0047342982347464094, 0.004547766322008974, 0.004305607802794407, 0.004018512061995696, 0.003706257606420545, 0.0034000920537016473, 0.003144239517630069, 0.003008911885525376, 0.003018809354694496, 0.0031337335089079085, 0.003309421520723961, 0.0035107723587009757, 0.003713942143281454, 0.0039048449895672807, 0.004077108048961679, 0.0042291555714562045, 0.004341514427610653, 0.004145561355778744, 0.00460333492177438, 0.00485878094622975, 0.0049333187055576036, 0.005028846053976542, 0.005138613558618498, 0.005255106371087711, 0.005379484968856706, 0.005510745469901999, 0.0056500096861758905, 0.005799239600025466, 0.005961495102499281, 0.0061421429391065084, 0.0063446884036887415, 0.006570539046466143, 0.006821884548080802, 0.0071016343391316775, 0.007415006071101293, 0.007767417289109225, 0.008163070516400323, 0.008605209906755442, 0.009098104183534794, 0.0096491699237792, 0.010264351788670844, 0.010954046979306194, 0.011738473799876402, 0.01262588459033185, 0.013609175191031785, 0.014671578987271632, 0.015782827514912907, 0.01689796037687781, 0.017957296910813363, 0.018906293172101532, 0.019705414863227914, 0.02034548236530921, 0.020847601494120932, 0.02123616391944274, 0.02152547648316039, 0.02170944228875552, 0.021779804510398074, 0.02172369440084696, 0.021545588779344916, 0.02126780992426997, 0.020915323293253806, 0.020507219016114766, 0.020051516414312725, 0.019556789494940007, 0.019031259995044264, 0.01848258578637772, 0.017913788553208458, 0.017331252166564354, 0.01674672920856233, 0.01617168926234493, 0.015623489210577431, 0.015109526421131685, 0.014621672702052895, 0.014147764552776446, 0.013678069570372443, 0.01320458040576887, 0.012718859449416215, 0.01222318231163598, 0.01172127929747157, 0.011217294980974568, 0.01071462213385895, 0.010219083163983553, 0.009729359725283637, 0.00923481967135921, 0.008730090133177767, 0.008210453255959685, 0.007670688060370875, 0.007105061346325291, 0.00651156161215273, 0.0058855718570487055, 0.005224576741918403, 0.004522160502498264, 0.0037682884033670735, 0.0029533779100565814, 0.0020647489854598027, 0.0010931792568662786, 0.0001625819816983419, 0.0002985077164710404], [0.0049237792873746125, 0.004860073039272404, 0.004734211599610448, 0.004547917947907411, 0.0043060326293841815, 0.004019250489041618, 0.003707353668840629, 0.0034015941817726715, 0.003146171959230117, 0.0030112335198427954, 0.0030214708495668345, 0.0031367180573273353, 0.0033127489875296586, 0.0035145032154970893, 0.0037181932317302165, 0.003909829235448364, 0.00408320512232777, 0.004237278158526478, 0.00435491260524835, 0.004202944839107603, 0.0046214749530892815, 0.0048471707904434, 0.00492970985085352, 0.005027045288827469, 0.0051371308308941115, 0.005253782871135697, 0.005378250947714596, 0.005509573093099005, 0.0056488840937119, 0.005798149333678417, 0.005960430465589944, 0.006141095183602082, 0.00634364965194329, 0.006569502233156632, 0.006820843051833327, 0.007100581703167976, 0.007413935381620624, 0.0077663211208421545, 0.008161941159851409, 0.008604039351126741, 0.00909688367251666, 0.009647889247682853, 0.01026300148632388, 0.010952618047049266, 0.011736954550292956, 0.012624321108844061, 0.013607569549471935, 0.014669926763537601, 0.015781120221836538, 0.016896131637327106, 0.017955334526493925, 0.01890419467781887, 0.01970318898348309, 0.020343142511989314, 0.020845161030925353, 0.021233632680004833, 0.021522857812558607, 0.021706740072277048, 0.021777024498077942, 0.02172084977525345, 0.0215426970071611, 0.021264871673347722, 0.02091235068226019, 0.020504221239933174, 0.020048502281342997, 0.019553767138270797, 0.01902823694831101, 0.018479569041489206, 0.017910785809754044, 0.017328271315226018, 0.016743776693911264, 0.016168769787248852, 0.015620603951732941, 0.015106671801764506, 0.014618843010359341, 0.014145221396608697, 0.01367588552048751, 0.013202807861763949, 0.012717543077876906, 0.012222050136326405, 0.011720281145752465, 0.011216405044496735, 0.010713824729634714, 0.01021836444215812, 0.00972871017301066, 0.009234234680058474, 0.008729567521378311, 0.008209992572116888, 0.007670290259482358, 0.007104728524285835, 0.006511460359377957, 0.005885524910346313, 0.005224577941519188, 0.004522201269748858, 0.0037683531211985806, 0.0029534336040290265, 0.002064724875161172, 0.0010928573560599834, 0.00016303353957391705, 0.0003005107209001412]], [[0.007565001767916007, 0.007459153052535159, 0.007255087042051547, 0.006951084575739283, 0.006547988645033989, 0.0060534688172614965, 0.005487766018617781, 0.004889293169425897, 0.004321508393129338, 0.003903362209450349, 0.0037033689759863675, 0.0036796187760103857, 0.003774101686914748, 0.003945670170221482, 0.004150277709528553, 0.004354979221771707, 0.004562612267829663, 0.004768632848063991, 0.00496432832782934, 0.005137454609005834, -0.039180036988205824, -0.032801619911533894, -0.02701809934703698, -0.021919105753590174, -0.017610442306708208, 0.02631626619599224, 0.013012201558125285, 0.006707216451294436, 0.006866416634351175, 0.007045409225014267, 0.007242127256516877, 0.007461292450090281, 0.007706036622210123, 0.007978043457726782, 0.008279635134806776, 0.008613962762727493, 0.00898731359966426, 0.009404636956094914, 0.009870587127120252, 0.010388989478818085, 0.01096487467388564, 0.011607203608922678, 0.012323758894959205, 0.013126477055569276, 0.014037086315720988, 0.015064673848878975, 0.016191769749632073, 0.017399538741224196, 0.018650302158859097, 0.01989006050724437, 0.021049169552783048, 0.02206858225914552, 0.022906511630793113, 0.02355329050428992, 0.02403318793533207, 0.0243715503463398, 0.024586220753199734, 0.024678083166876166, 0.024646812104308174, 0.02448417975990769, 0.024195742900595472, 0.023804792090231106, 0.02333584460887712, 0.0228113840061132, 0.02224110681485503, 0.021635181291095394, 0.021005851075159506, 0.020357056171283985, 0.019691671813603255, 0.019016727714841235, 0.018344028769673996, 0.01768495384143157, 0.017057080390073562, 0.01646602991521103, 0.015902703428324744, 0.01537741700759927, 0.014835713594548761, 0.014291290935305132, 0.013736243109991898, 0.013175369305082873, 0.012609941491325022, 0.012043404223792709, 0.011479869693745683, 0.010925480005211582, 0.010378218485031641, 0.009826230886781358, 0.009264140984789958, 0.008687023394169878, 0.008089359621962423, 0.0074651634124562015, 0.006648034423500622, 0.005932464732760365, 0.005169992750547939, 0.004347707037458708, 0.00344487738610265, 0.0024351347767757993, 0.0012749152199464959, -8.861901453894619e-05, -0.0015669408178839135, 0.00020849006649322838], [0.006819294902223983, 0.006728688285763641, 0.006549927795438081, 0.006281661485618611, 0.00592481208445879, 0.005486409324451692, 0.004984756014617885, 0.004454552702555211, 0.003952309046251647, 0.0035835571893475257, 0.003409745700888892, 0.0033937275732950746, 0.003484022054755063, 0.0036397371193041994, 0.0038254028053407393, 0.004016486744274683, 0.004208460534416714, 0.004399001258286079, 0.00458124378213071, 0.004745217432580581, -0.006613595217643145, -0.004851498141790528, -0.00324768929122296, -0.0018235560318997112, -0.0006033209443024217, 0.010937020235691717, 0.008474696425173497, 0.006018506800025028, 0.0061704195893559025, 0.006335812424270466, 0.006515688104404741, 0.00671509871025811, 0.006937339812980167, 0.0071838822274339145, 0.0074568636539076956, 0.007759133528899924, 0.008096094740628458, 0.008472749878565397, 0.008893284482348, 0.009361028579192373, 0.009880489739966598, 0.010459722950276746, 0.011105810324223602, 0.01182958545091357, 0.01265059710750086, 0.013575495915134881, 0.01459188197607822, 0.015681177074639622, 0.016809415124499353, 0.01792786607264946, 0.01897398385293613, 0.019894394642436294, 0.02065143430322575, 0.021236359419618607, 0.021670970510405098, 0.021978078533329174, 0.02217359681263644, 0.022258227154960963, 0.02223161346928313, 0.022086423082735833, 0.02182740291796029, 0.021475209661617693, 0.021053273553743587, 0.020581328288571354, 0.02006800557516669, 0.01952227737528008, 0.018953708470657946, 0.01836829981931013, 0.017768717619369368, 0.017160732768968942, 0.01655486987329567, 0.015961329946286733, 0.015395890526724194, 0.014863559176573293, 0.014356250410111689, 0.013872038236560788, 0.013384211150250723, 0.012894309710208144, 0.012394979701451791, 0.011889627430840493, 0.011380661222369968, 0.01087143865579601, 0.010365264176031935, 0.00986757970965012, 0.009376572937275469, 0.008881670725145337, 0.00837814759736829, 0.007861691054484875, 0.007327475931034931, 0.006770278474226973, 0.006180565265852795, 0.005566634111468836, 0.004922345786888471, 0.0042393067182267576, 0.003507489046003253, 0.002717943593892274, 0.0018600235576585334, 0.0009292693908302292, 5.910967939333825e-05, 0.00026641323372528214], [0.0067226348232417524, 0.006634434522941596, 0.006459418984620858, 0.006196301571544074, 0.005846029930059889, 0.005415561260406926, 0.004922952262136371, 0.004402428914642657, 0.003909538122417513, 0.003547921091023236, 0.003378082556616284, 0.003363549462946528, 0.003453760007178324, 0.0036075149257497347, 0.0037908352115712048, 0.003980741541151706, 0.0041711161103105635, 0.004360082699066259, 0.004541104190979983, 0.004704600108008936, -0.002109695561764199, -0.0009855767119508027, 4.055855662047974e-05, 0.0009566869507449667, 0.0017494318579181951, 0.008804639790554198, 0.007595042339002899, 0.005926766903026424, 0.006078487840344559, 0.006242480019204394, 0.006420400815681608, 0.006617416399696703, 0.006836885880595713, 0.007080248280120302, 0.007349621364801936, 0.007647816268516283, 0.007980097548000874, 0.008351523161544134, 0.00876621699517641, 0.009227434278452249, 0.009739612341813716, 0.010310686720289258, 0.010947654697892292, 0.01166121349816695, 0.012470626024101159, 0.013382089079179251, 0.014384159776303676, 0.015458149968638089, 0.016570574664985634, 0.01767338206046865, 0.01870496704427922, 0.019612677980662744, 0.0203593854833781, 0.020936463261982757, 0.02136538502915058, 0.021668629778184307, 0.021861845402395816, 0.021945701577193368, 0.021919832629704983, 0.021777029446831856, 0.021521910505478192, 0.021174760809470103, 0.020758988776741205, 0.020293923874793368, 0.019788050026037035, 0.019250165296438918, 0.01868933662566554, 0.018112065673636914, 0.017521007001615654, 0.016921723255288894, 0.016324565110739427, 0.015739573327842985, 0.015182279282273026, 0.014657606190855122, 0.014157224689791217, 0.013677005067866555, 0.013195818737409612, 0.012712646624529289, 0.012220172429110708, 0.011721535767776672, 0.011219402856220992, 0.010717140103451124, 0.010217911552188463, 0.009727061714946921, 0.00924279333573752, 0.008754684425887033, 0.008258082334389549, 0.007748737736310512, 0.007221892101440467, 0.006672390836815034, 0.006091063068543953, 0.005489078312459443, 0.004855722711811662, 0.004184648766933007, 0.003461617954590144, 0.0026833185265448998, 0.0018374830509758778, 0.0009191328975273464, 6.13888255648352e-05, 0.0002809320757966647], [0.006647366611931821, 0.0065612854099531825, 0.006389450833158827, 0.006130637189801209, 0.005785819837785632, 0.005361905424892682, 0.004876761920931161, 0.004364249545322551, 0.0038791301485224306, 0.0035234861005474707, 0.0033570712604533946, 0.003343969601965056, 0.0034343762740652642, 0.003586658860917604, 0.0037682154101192585, 0.003957539475977726, 0.004146914050533816, 0.004334901222379259, 0.0045152697422910035, 0.004678797387234697, 0.0014684548367721003, 0.002085710668818163, 0.0026528703474181527, 0.003165308710505752, 0.0036180088590919072, 0.007104611855659026, 0.006743986507150973, 0.005853923959083147, 0.0060059243649651746, 0.006169032205336733, 0.006345560797215858, 0.006540805753538344, 0.006758199766286839, 0.006999154707122542, 0.007265775087092786, 0.007560842670466272, 0.007889500795613087, 0.008256878146244156, 0.008667050090855102, 0.009123207581006173, 0.009629731863697878, 0.010194464305613105, 0.010824339535569678, 0.011529952350307663, 0.01233034112580067, 0.013231270668225555, 0.014222214122360282, 0.015284316125223716, 0.01638446623137735, 0.017475138052986568, 0.01849547108509073, 0.019393374026493354, 0.02013212134672936, 0.020703162501751318, 0.021127706155213626, 0.02142796584960652, 0.021619367711963777, 0.02170254653293424, 0.021677122281493058, 0.021535984267188207, 0.021283647570330456, 0.020940098056700444, 0.020528803006730593, 0.020068757259797055, 0.019568330975401328, 0.019036186111777084, 0.018480966313483713, 0.017909667956864984, 0.017324928223919886, 0.016732112506976506, 0.01614142836430613, 0.015562793379646908, 0.015011553293744826, 0.014492555113476715, 0.013997499484767497, 0.01351972955237291, 0.013043609746211417, 0.012565577591272683, 0.012078335736218916, 0.011584775486933605, 0.011087830766704908, 0.010591024254426457, 0.010097401984519269, 0.009612158229045624, 0.00913346826291388, 0.008651015685584488, 0.00816021200846027, 0.007656861596019205, 0.007136259886681222, 0.006593308929535398, 0.006024539327617985, 0.005428869974845137, 0.004801918365003532, 0.004137514091408786, 0.0034260719025633935, 0.0026573260289424047, 0.0018208821330665756, 0.000912015688481022, 6.395374065474041e-05, 0.00029634125393913436], [0.006628138560046764, 0.0065426536771454585, 0.006371691048913205, 0.006114042813556986, 0.0057706932698794455, 0.005348537479799746, 0.004865395852934891, 0.004355036018848969, 0.003872011352392071, 0.003517986646056697, 0.003352520371154091, 0.0033398460229820052, 0.0034303613933985666, 0.0035822799613313147, 0.003763399973752965, 0.003952650301468812, 0.004141824385201408, 0.0043296165568644214, 0.004509885007791811, 0.00467351122826728, 0.0023740845042795893, 0.0028629791864973175, 0.003313898341909229, 0.0037240794618414266, 0.0040905566819201674, 0.006672166835669088, 0.006489355568989988, 0.00583500039922326, 0.005987168299193725, 0.00615009646302748, 0.006326298542247118, 0.006521112315775215, 0.006737994674831141, 0.006978350019048677, 0.0072442799811597725, 0.007538558924898493, 0.007866296196766995, 0.008232644735041351, 0.00864166739995802, 0.009096537370509998, 0.009601621255580678, 0.010164736107104408, 0.010792801310110017, 0.011496386337817417, 0.012294476365336966, 0.013192313943519073, 0.014180459784276322, 0.015239589662009806, 0.01633667623112568, 0.017424301914051043, 0.01844183198957908, 0.019337301181422902, 0.020074083802711716, 0.020643657114800335, 0.02106716452951799, 0.021366754779610576, 0.02155779893174243, 0.02164092362823358, 0.0216157457727857, 0.02147518146221399, 0.021223711514744288, 0.020881238003249494, 0.020471254780752454, 0.02001266205787604, 0.019513796835330714, 0.018983280846142522, 0.01842962561576565, 0.017859983648303938, 0.017276989631482366, 0.01668595225592295, 0.0160970410614302, 0.01552014141997118, 0.014970550920298285, 0.014453099653108705, 0.013959528333684499, 0.013479686041727407, 0.013005100705418401, 0.012528726709379831, 0.012043191909239455, 0.011551078147525207, 0.011055708952124977, 0.010560535298388804, 0.010068451429920975, 0.009584677002328418, 0.009107409555687805, 0.008626372509137142, 0.00813699657752123, 0.0076351014999302465, 0.007115998368578232, 0.006574605127938942, 0.006008219723167233, 0.005414180493677113, 0.0047889037037064435, 0.004126208911424674, 0.0034164661566113215, 0.0026511790606730972, 0.0018168864695858025, 0.0009104027383436224, 6.481635286130765e-05, 0.0003012260489146165], [0.006617206508347049, 0.006532081259421385, 0.006361636609217026, 0.0061046756802778405, 0.005762188552304563, 0.00534106419782213, 0.0048590962308450196, 0.004349999956753681, 0.0038682072525787767, 0.003515138245383943, 0.0033502389823003463, 0.0033378306749275053, 0.0034284298012124893, 0.003580145942511244, 0.003761023019623601, 0.003950259529027998, 0.0041393402209695665, 0.004327042210156693, 0.0045072787745551275, 0.004670994939229509, 0.0028991741707798157, 0.0033136559010099403, 0.003697187012908382, 0.004048081824310047, 0.004364544364230715, 0.006421117622715841, 0.0063306374959612825, 0.00582412340925774, 0.005976422546619209, 0.006139265880941109, 0.0063152932413636275, 0.006509869789342087, 0.006726468198554021, 0.006966488419498737, 0.007232030638775001, 0.007525865050873878, 0.007853080542713255, 0.008218846160712135, 0.008627217610877206, 0.009081376683842728, 0.009585676520909966, 0.01014791361654662, 0.010774995451171752, 0.011477473903580525, 0.012274288295488404, 0.013170673938427992, 0.014157212361519457, 0.015214612374118973, 0.01630990110810498, 0.017395738610418734, 0.018411591987096777, 0.019305576592336286, 0.020041132317753018, 0.020609752768246472, 0.021032546800729014, 0.021331624741707866, 0.021522324040371115, 0.021605268332424467, 0.0215800747136639, 0.021439677305112773, 0.021188537871862423, 0.020846510969602213, 0.020437113972338567, 0.01997919247671602, 0.019481065272415738, 0.018951331669740695, 0.01839842260322919, 0.017829590286714617, 0.017247467653514696, 0.016657438309481035, 0.01606963323035644, 0.015493886421610857, 0.0149454477645286, 0.014429111341074337, 0.013936534658365696, 0.013457591102938968, 0.012983858951584258, 0.01250831809663864, 0.012023615839523804, 0.011532335318626933, 0.011037796987042308, 0.010543447485119373, 0.010052177329398972, 0.009569198206957528, 0.009092711688508852, 0.008612459244905411, 0.008123878912776487, 0.007622797811205031, 0.007104535117469195, 0.006564017309742938, 0.005998945507756619, 0.005405818032848439, 0.0047814742574964755, 0.0041197268008396765, 0.003410917639827757, 0.0026464628677211007, 0.0018146903200271698, 0.0009095466678011437, 6.536908559936499e-05, 0.0003043439836109991], [0.0066109961025546116, 0.006526080950694194, 0.0063559368114141325, 0.006099373285580439, 0.005757383933123219, 0.005336854407184958, 0.004855563168205116, 0.004347195885917805, 0.003866114580448977, 0.003513598347062594, 0.0033490289897026297, 0.003336778311821222, 0.0034274311927953247, 0.003579033612495032, 0.00375977415814904, 0.0039490107203505155, 0.004138044148739565, 0.004325700722200256, 0.004505926203912816, 0.004669702997247768, 0.0031954021580345294, 0.003567892665880917, 0.003913395912804696, 0.004230832598722931, 0.004519059128871028, 0.006279212454626273, 0.0062365473136315255, 0.005817911087587942, 0.005970294905121042, 0.006133094920108146, 0.006309026094554629, 0.00650347010432158, 0.0067199091581062265, 0.006959740622391748, 0.0072250639157578215, 0.007518646874955949, 0.007845519748636657, 0.008210951389295005, 0.008618984591998306, 0.009072751690137753, 0.009576600845272907, 0.010138325017953321, 0.010764828864873479, 0.011466657561560208, 0.012262733067349107, 0.013158286661198667, 0.014143909605165213, 0.015200329161682796, 0.016294603724194705, 0.017379437721655285, 0.018394356779309076, 0.019287521579399166, 0.020022408620946636, 0.020590519947055675, 0.02101294367412831, 0.021311768393873394, 0.02150231252402724, 0.02158519731981367, 0.02156003931814661, 0.02141978232729364, 0.021168876457130992, 0.02082714836022351, 0.020418129580367515, 0.019960633566559728, 0.0194629682189356, 0.0189337193907917, 0.018381040270853483, 0.017812671538615987, 0.01723123379061978, 0.016641869208416052, 0.016054687591346335, 0.015479532043285001, 0.014931645093502236, 0.014415820157393577, 0.013923724925364677, 0.013445244089503894, 0.012971966572112475, 0.012496879826069226, 0.012012638553692523, 0.011521821759113555, 0.011027746958629925, 0.010533858053403608, 0.010043043296408238, 0.009560509725520383, 0.00908446114776995, 0.008604649317429248, 0.008116516640887852, 0.0076158942343711785, 0.007098105722253285, 0.0065580823156230405, 0.005993742874026932, 0.005401131902455743, 0.004777317010600718, 0.0041161080454615515, 0.0034078345130436265, 0.00264386462411304, 0.0018140562160905076, 0.0009090908805401713, 6.571356566328498e-05, 0.00030622338176567674]], [[0.010238406229458758, 0.010109771299184066, 0.009858726229420842, 0.009477097273252, 0.008953316996476238, 0.0082813474442027, 0.007465712847447414, 0.006540046306596331, 0.005585312399180713, 0.004754163814431302, 0.004172350474288602, 0.003843848564274388, 0.003703716155351526, 0.0036972196772255867, 0.0037774511004826155, 0.00391174288203379, 0.004080588504950594, 0.004276720535506757, 0.0044872145032274265, 0.004698152530850684, -0.0024057478587473516, -0.00086478815918207, 0.0005524466977338523, 0.0018277216443599363, 0.00293777477028534, 0.00385276416790734, 0.004586385930229883, 0.005311694530510704, 0.006078285763283235, 0.006893044045668469, 0.007764810260318514, 0.00870504947834684, 0.009723101300403103, 0.010823743497841268, 0.011747804912329022, 0.006804213975513526, 0.007920860948771005, 0.00877384923406896, 0.009215882029827016, 0.009692078066757703, 0.01021641195472162, 0.010797068187927307, 0.011442321603190534, 0.012163726643276805, 0.012979071153041222, 0.013889179012103712, 0.014881361330488509, 0.015932682831826268, 0.01700626846741634, 0.018051269649328537, 0.019005353467983203, 0.019819903361038962, 0.02046341809839064, 0.020929189329815016, 0.02123928053008476, 0.02141303003765641, 0.021465750091233398, 0.02140666960605384, 0.02124542221287805, 0.020983649102846218, 0.020626730699362612, 0.02019274772081481, 0.019702447757175088, 0.01917383603139408, 0.01861559865764831, 0.018036253419208035, 0.01744375355545181, 0.01684582519699074, 0.016244679832932225, 0.015643948119084494, 0.015051485504296783, 0.014474947677763984, 0.013926803096304114, 0.013408172725921251, 0.012909911555699947, 0.01242461175893457, 0.011945642520501587, 0.01146729009361483, 0.010983637513919169, 0.010498229984298588, 0.01001360685035555, 0.009532202604856549, 0.009056186412025878, 0.008589906792301576, 0.008130772165359906, 0.00766890629927947, 0.007200786767674195, 0.006722880809958472, 0.006231094227795483, 0.0057210639938165475, 0.0049815401543295236, 0.004387634121959478, 0.004131932033224384, 0.0035287594467909356, 0.0028845151714737218, 0.0021920049902781984, 0.0014444418123188685, 0.0006453687970493565, -5.6406768847975637e-05, 0.00019134222131281857], [0.010065763379763984, 0.00994344703257142, 0.00969899821311753, 0.009324380174455957, 0.008809746885645802, 0.008150273649596923, 0.0073528993012585715, 0.006450160598010896, 0.00551469761400106, 0.004700989014713363, 0.004137932858763941, 0.003817137186602149, 0.003680238066025467, 0.0036730519211711668, 0.00375054013435512, 0.0038810301348153092, 0.004045451127012926, 0.004236699078986572, 0.004441864995584614, 0.004646938578950459, 0.0032793360870895746, 0.0037600840821190957, 0.0042089255887476406, 0.004622447122376658, 0.004996240131665671, 0.005324353588143232, 0.005610992825241685, 0.005898628766370492, 0.0062000393617025395, 0.0065184260372219815, 0.006858535115700234, 0.007227329768569765, 0.007629490376590482, 0.00806627468150388, 0.008423132813119913, 0.007685439908671895, 0.008178803518104436, 0.008650024599350558, 0.009078094695374196, 0.009545435009585948, 0.010060522193774651, 0.01063116919051016, 0.011265524884855476, 0.01197499801938614, 0.012777031844084833, 0.013672424664545222, 0.014648683849479002, 0.015683229464253545, 0.016739769038455095, 0.017768256083783997, 0.018707321722750834, 0.01950910853951196, 0.02014271974647821, 0.020601568056928223, 0.020907321784492866, 0.021078968577415994, 0.021131409548154515, 0.021073684804096677, 0.020915274503730073, 0.02065798472000022, 0.020307269960366352, 0.019880140460458946, 0.01939771991926057, 0.018877927144001466, 0.018329103033380954, 0.017759625541597268, 0.01717731330765422, 0.01658975939793113, 0.015999162621860113, 0.015409101167424354, 0.014827287986201615, 0.01426123072431978, 0.013723158510219617, 0.01321422118883966, 0.012725510794735051, 0.01224977327984904, 0.011780511812782862, 0.01131214895046677, 0.01083890201978504, 0.01036422638403608, 0.009890539301198603, 0.009420262156090395, 0.008955525159614532, 0.008500601328340771, 0.008053043730421806, 0.00760329494909835, 0.00714798375161076, 0.006683761478853143, 0.006206774406587317, 0.005712938724343831, 0.005183164799347137, 0.004647206169881007, 0.0040857563811145725, 0.0034929777747794593, 0.0028598297045038658, 0.0021789998091717466, 0.0014434833922540406, 0.000654290130642869, -4.7222215663292566e-05, 0.00027144960329748217], [0.010043912698102507, 0.009922842603300659, 0.009679482936641857, 0.009305814201586897, 0.008792372491293879, 0.008134606270156405, 0.0073400280289363734, 0.0064409788159723045, 0.005508296209662842, 0.004697163478877227, 0.004137444088777011, 0.003817856951994547, 0.0036814607136929135, 0.0036741012759348977, 0.003751092677054123, 0.003880936068666054, 0.004044627295290342, 0.0042350874026605935, 0.004439387567107913, 0.004643470592831328, 0.004011210827850864, 0.004355424460551393, 0.0046795628101688755, 0.0049821228565801725, 0.005261123039103527, 0.005513684825589522, 0.005742788113302974, 0.005974102284220645, 0.006215674140666577, 0.0064702403111698776, 0.0067420345773383265, 0.007037466368554807, 0.007360674409696826, 0.007712687260282366, 0.008012989752886777, 0.007794723860448169, 0.008212082436776126, 0.008636948596435158, 0.009062550943348775, 0.009528681541363326, 0.010042554800386681, 0.010611911505290294, 0.011244886061406448, 0.011952874058050535, 0.012753270326269774, 0.013646868677788719, 0.014621199415701698, 0.015653724200557783, 0.01670822007600342, 0.01773473611867611, 0.018672016097757687, 0.019472292153868778, 0.02010475188482015, 0.020562823505449544, 0.020868112289491373, 0.021039557527648505, 0.021091993181418103, 0.02103443477251242, 0.02087634825517576, 0.02061958662826541, 0.020269638414844252, 0.01984330372989247, 0.019361838619590496, 0.018842864714259996, 0.0182949193230586, 0.017726357733313904, 0.017144978719069375, 0.016558356620033094, 0.015968689480360503, 0.01537954983579894, 0.014798634008491926, 0.014233436011732162, 0.013696162310139924, 0.0131879676747106, 0.012699965824958212, 0.012224915622073845, 0.011756328442961463, 0.011288633350374997, 0.010816054412343155, 0.010342032173881806, 0.009869030204898153, 0.009399438830863716, 0.008935389642433851, 0.008481158663352868, 0.008034369304059685, 0.007585463977747743, 0.00713098120528932, 0.0066675997708649055, 0.0061914581717949545, 0.005698468424237665, 0.005177374646573784, 0.004642617778024939, 0.004082426513511729, 0.0034917218603135536, 0.002859273981759747, 0.0021799229001582938, 0.0014458712632173915, 0.0006575419061777977, -4.5181884835426575e-05, 0.0002905484962505678], [0.01002794157832579, 0.009908062960877807, 0.009665659155054622, 0.009292723217014118, 0.00878017374532394, 0.008123734013211297, 0.00733150422816203, 0.0064356466084227425, 0.005505210706097581, 0.004696192305106459, 0.004139516736317384, 0.0038209594596944345, 0.003684989635671354, 0.0036774494964249374, 0.0037539837614871184, 0.0038832505888165875, 0.004046301752542682, 0.004236079390674578, 0.004439626497249812, 0.004642829480656369, 0.004522953374695396, 0.004771562694329671, 0.00500838512189173, 0.005233256308585412, 0.005445893058645644, 0.005645564836948318, 0.005834391188253566, 0.006026288969366718, 0.006225999798631316, 0.006435941452995266, 0.006659999041860143, 0.006904212284502865, 0.007172381879719313, 0.007465535302004195, 0.007737951808551987, 0.007867496881991967, 0.008234645502290472, 0.008629039540449272, 0.009052413724177581, 0.009517618346299, 0.01003058898314836, 0.010598997742149634, 0.011230969326712904, 0.011937893209195617, 0.012737125205851532, 0.013629451257879616, 0.014602412841017964, 0.015633494848315856, 0.01668651659300593, 0.017711587106675458, 0.01864752148132763, 0.0194466126328736, 0.020078116726317076, 0.0205354777556754, 0.020840275086966304, 0.021011412083392047, 0.021063659884298466, 0.021006012815824694, 0.020847924877662412, 0.020591293532733475, 0.020241637921665764, 0.019815546632070948, 0.019334418555796873, 0.018815838649806363, 0.018268332703849813, 0.017700241835846734, 0.017119351634760607, 0.016533409239843123, 0.015944440364265285, 0.015356009542873184, 0.014775800258580555, 0.014211298078182206, 0.013674697720652655, 0.013167166670342257, 0.012679841551163903, 0.01220548700365219, 0.011737613980827696, 0.011270651144755388, 0.010798822607302761, 0.010325551602157685, 0.009853283722476328, 0.00938439994951099, 0.008921029470058838, 0.008467441440453532, 0.008021213520245762, 0.007572822880239695, 0.007118897665539951, 0.006656092949236164, 0.006180564447890278, 0.005688243110543519, 0.00517478918554036, 0.004640921182294111, 0.004081660511880184, 0.0034912150822323127, 0.002860556317219958, 0.0021822851346223865, 0.0014492648035615988, 0.0006613218595552445, -4.3072288529633586e-05, 0.0003102009326870669], [0.01002400773524648, 0.009904483579788948, 0.00966234994409683, 0.009289602964009895, 0.008777277887224905, 0.008121182011088364, 0.007329596914627685, 0.006434632990121045, 0.0055047970940979895, 0.004696349812830532, 0.004140555462536776, 0.0038222837003583214, 0.0036864316985608502, 0.003678835303943229, 0.003755236536905876, 0.003884338755331567, 0.004047209079064149, 0.004236795441852566, 0.004440130920390895, 0.004643083224395377, 0.004632937619377244, 0.004860927307531769, 0.005078918590599601, 0.005287036015678332, 0.005485362249644208, 0.005673628876307554, 0.005853769214290211, 0.0060371694819317985, 0.006227860821252875, 0.00642819414440967, 0.0066420071448424515, 0.0068752405774467375, 0.007131633866370303, 0.007412260824355818, 0.007682138705964419, 0.007881997779256498, 0.00823921976298317, 0.008627611292304514, 0.00905033629058948, 0.00951529472763114, 0.010028029803669555, 0.01059619317333552, 0.011227907184837798, 0.011934560355465293, 0.012733497738891243, 0.013625500991516245, 0.014598112937204935, 0.015628822964643935, 0.016681459570368016, 0.017706145339375097, 0.01864171170040323, 0.019440467568800676, 0.020071689433915744, 0.0205288274320315, 0.02083345420047846, 0.02100446343810582, 0.02105660775369309, 0.02099887643031165, 0.020840721319230288, 0.020584054387196696, 0.02023455678324498, 0.019808637440109095, 0.019327739727117186, 0.018809436239004874, 0.018262246651109443, 0.017694504573182508, 0.01711398772722454, 0.016528248427863802, 0.015939479640067596, 0.015351245914745397, 0.014771227582474171, 0.014206907503466643, 0.013670475470903578, 0.013163098457376824, 0.012675915626649695, 0.01220169480611571, 0.011733949476400772, 0.011267110472005666, 0.010795404297385989, 0.01032225278133621, 0.009850100566736103, 0.009381327714148248, 0.008918062740238231, 0.00846457304759659, 0.008018437316793837, 0.007570136342257578, 0.007116298667258387, 0.006653579420792719, 0.006178133700376242, 0.005685891231614125, 0.005174702142946653, 0.004640874832500484, 0.004081845617745953, 0.0034916478817810896, 0.0028621697625268935, 0.0021832674730149575, 0.0014504918405014893, 0.0006625898124183332, -4.2387659368197885e-05, 0.0003163078776206955], [0.010021762731331856, 0.009902459164921171, 0.009660490134726446, 0.009287853530478372, 0.008775657902239963, 0.008119763401040083, 0.007328566098766233, 0.0064341444770784064, 0.00550466498819055, 0.004696558744595418, 0.004141306754773574, 0.003823207489994385, 0.0036874265667177653, 0.0036797945428440277, 0.0037561137237774192, 0.0038851152213209583, 0.004047875383984603, 0.004237345633281513, 0.00444055249323494, 0.004643351559725685, 0.004690814695018915, 0.004907928547890261, 0.005115987633801026, 0.005315268938193882, 0.005506047951733102, 0.005688299604482217, 0.005863858759673582, 0.006042805149551096, 0.006228768596042117, 0.006424065693723114, 0.0066324725035263425, 0.006859916534703674, 0.007110109326766186, 0.007384165615029706, 0.007653881929206803, 0.007889186629427801, 0.008241464829440158, 0.008626885569449086, 0.009049209865264075, 0.009514023332033097, 0.010026621862235208, 0.010594644374624509, 0.011226211907283795, 0.011932712615151572, 0.012731485267778047, 0.013623309460715428, 0.014595729051451123, 0.015626236176059873, 0.01667866473592737, 0.017703145111056088, 0.018638517847724044, 0.019437100444929547, 0.020068180868783342, 0.020525212342774397, 0.020829763074650093, 0.021000721188722864, 0.021052828173809202, 0.020995183308950338, 0.02083715456328931, 0.020580664282987358, 0.020231250249021386, 0.019805398440080106, 0.01932458096814761, 0.01880636441089643, 0.0182592667135995, 0.01769161933057226, 0.01711119808766219, 0.016525553607985844, 0.015936879709064815, 0.015348740802312792, 0.014768815225350361, 0.014204584171823085, 0.01366823451165692, 0.01316093293101333, 0.012673819989422828, 0.012199665222662116, 0.011731983396446483, 0.011265206422606831, 0.010793562018067445, 0.010320471031703735, 0.009848377442369464, 0.009379660698580514, 0.00891644888135906, 0.0084630083493257, 0.008016918376543456, 0.007568661855583325, 0.007114867565241677, 0.006652190760328323, 0.006176786433004964, 0.005684583569350733, 0.005173538252421826, 0.0046409965693546395, 0.004082065808405374, 0.0034920103014006456, 0.002861767159828335, 0.002183912870029247, 0.0014512749012077608, 0.0006633809900196816, -4.197961431018332e-05, 0.00032014268297631915], [0.010020495623608051, 0.009901322663823816, 0.009659450014788058, 0.009286876554931076, 0.008774754452162421, 0.008118975323588901, 0.007328003526100283, 0.0064338987521995504, 0.005504625089433877, 0.004696716369371213, 0.004141783653742071, 0.0038237849359500026, 0.0036880454104311375, 0.0036803921014155676, 0.003756662926162361, 0.003885605314383476, 0.004048300980447872, 0.004237703374500662, 0.004440835024360007, 0.004643544207570127, 0.004721090027658107, 0.004932501989815302, 0.005135354024309764, 0.005330003056957511, 0.00551682559787811, 0.005695953523006725, 0.005869139388881931, 0.006045737800911029, 0.0062292105015733, 0.0064218562242891256, 0.006627432000413553, 0.006851846405547988, 0.007098798171499171, 0.007369430603114615, 0.007639584589146328, 0.007892754229878167, 0.008242573217937933, 0.008626522050830044, 0.009048609945984935, 0.009513339746245221, 0.01002585995464929, 0.010593801952308477, 0.011225286052784432, 0.011931700278089541, 0.012730379758863796, 0.01362210277391421, 0.014594413656609349, 0.015624805985882773, 0.016677116599191005, 0.017701480154241077, 0.018636742210303262, 0.01943522513177604, 0.020066223607561745, 0.020523192742401285, 0.02082769833773342, 0.020998715115163817, 0.021050918417387838, 0.02099329350798611, 0.02083529075931948, 0.020578837038513497, 0.0202294732382012, 0.01980366134148185, 0.01932289069815066, 0.018804724414280043, 0.018257679468002063, 0.017690086093311304, 0.017109719047863597, 0.01652412801493859, 0.01593550736712409, 0.015347421472041909, 0.014767547544251374, 0.014203365847975763, 0.013667061610090118, 0.013159801437299105, 0.012672726754267121, 0.012198608067847637, 0.011730960861969028, 0.01126421765065843, 0.010792606825747886, 0.010319548635273419, 0.009847486672452731, 0.009378800050301093, 0.008915616620024642, 0.008462202165577784, 0.00801613635099576, 0.007567903317638288, 0.007114132002303447, 0.00665147778345403, 0.006176095700682828, 0.005683914542151355, 0.00517301350248947, 0.004640356370827639, 0.0040826397577977385, 0.0034922585363023223, 0.002862101169160425, 0.0021843321633337742, 0.0014517706175528925, 0.0006638754150316647, -4.171920470707412e-05, 0.0003224466463242292]]], "drag_distribution": [[[-9.726830162034485, 5.775514037867556, 2.6775466792161158, 0.3835654672210506, 0.20610172772902144, 0.17364844338724578, 0.13930131964932027, 0.10162571302081512, 0.06263634722873393, 0.02704182034789386, -0.001975029288579802, -0.024714114345105214, -0.04187098136459783, -0.05424031316241628, -0.06255728945184884, -0.06739936188434902, -0.06915463549964365, -0.06801430633812541, -0.06419916042619055, -0.057771208361125634, -0.0648678992633021, -0.054803523629218504, -0.04475398871694021, -0.03541863768523388, -0.027439236938953157, -0.021421641714727213, -0.01761804260107143, -0.014679920536407293, -0.01204507455825593, -0.009545230742422294, -0.007107688719160712, -0.004687551740304903, -0.00225145614756731, 0.00024003599933497094, 0.002814995836091937, 0.005499054376611696, 0.008129771815286152, 0.010298030429043158, 0.012753074881529517, 0.015127103725618585, 0.017296989920906693, 0.019098206786525955, 0.020719875614230044, 0.02244070263286989, 0.024141951977470318, 0.025656112864281266, 0.026972813407047106, 0.028025654553124637, 0.028760251301888806, 0.029155640911717746, 0.02672659995711769, 0.02406591541016886, 0.021752116160637647, 0.019915857875243484, 0.018312531533729956, 0.016578501810629292, 0.0143032982192086, 0.011910701945689352, 0.010186485664772267, 0.009978470024393579, 0.011415481351071444, 0.013912674727693098, 0.016969439644983462, 0.020238587830956712, 0.02356036511679516, 0.026801667509685198, 0.02986395611147691, 0.032716627937592405, 0.03536379938488168, 0.037707548964101216, 0.0396270505906905, 0.041064425434148365, 0.04203112414656995, 0.04267754298449571, 0.043190154736005446, 0.04358393677255998, 0.04387203258682188, 0.04404972332639591, 0.04406214754319172, 0.04378493195879759, 0.0431806834229941, 0.042249901976274616, 0.04102740355403079, 0.03970971314884903, 0.03872678316146036, 0.03775985818638661, 0.03622412777823414, 0.03435781879356763, 0.032107800811811665, 0.02939684979103038, 0.020910582937986734, 0.020625375674565016, 0.02028679776307447, 0.020134746800037646, 0.0205729458150557, 0.02212888644099522, 0.026306610637583026, 0.0385641467536666, 0.09437843299302805, 0.20238146874756546], [-1.617108816209843, 1.3323154208741823, 0.6725554228542157, 0.2694241148232646, 0.18093615724018697, 0.1527968637819054, 0.1206077743470444, 0.08437150538140292, 0.04656592106903452, 0.012067013579467557, -0.015843933053827013, -0.03754404508697083, -0.05377024264475992, -0.06533082409525773, -0.07296416584082638, -0.07724632037885688, -0.07856270707935142, -0.07711056074624652, -0.07308755169185052, -0.06643756019964996, -0.06461784130276237, -0.05489960447443793, -0.04521614186040288, -0.03625708390820832, -0.028655058797272582, -0.02301095860076004, -0.019555098244229314, -0.016966392978653513, -0.01467364438886803, -0.012519737568416714, -0.010437911724562873, -0.008398733818898389, -0.0063746429739644245, -0.004332199040175314, -0.00225309752024672, -0.00012756298241836826, 0.0019388883972013007, 0.0037245476420720625, 0.00552070909676537, 0.0071215760184008305, 0.008406492531895605, 0.00920767680069281, 0.009713436377347728, 0.010194865318919673, 0.010513840123925481, 0.01047265070551914, 0.010041949222096502, 0.009154714707798139, 0.007771763744167714, 0.005914163334350553, 0.0026066329707767743, -0.0007872262411898394, -0.003651148162793654, -0.0058408275530961225, -0.0076088054903612505, -0.00934679681351988, -0.011427922535617106, -0.013464328037894735, -0.014728084071010615, -0.014433379752309159, -0.012478513912585608, -0.009381304221324811, -0.005676794341507679, -0.0017281237479055828, 0.0022989864010086953, 0.006267860560606462, 0.01007688865565172, 0.01369366373446271, 0.01712237096619618, 0.020268953021855968, 0.023014078932538044, 0.0252858879234869, 0.027055300893125432, 0.028449049240248415, 0.029663593240862103, 0.030730909787769073, 0.031669388030323924, 0.03247849349631664, 0.03311770252820178, 0.033462150856126825, 0.03347309187552204, 0.03315540321308214, 0.03253546600791783, 0.03172417100024001, 0.03097570152015814, 0.030180183962859677, 0.02903506363572504, 0.027600306877535744, 0.02580482365066494, 0.023556355371194892, 0.018442545035558162, 0.016526792521353167, 0.014110015065345701, 0.011194320156321887, 0.0078071483532523136, 0.003995315384088018, 0.00017318528598956904, -0.011386496199516542, -0.0094272303457369, -0.004219849490137242], [-1.105089421470112, 1.0852268787762709, 0.6144428545368281, 0.3480299660478502, 0.2507972855655636, 0.21192582634585044, 0.16653948062644283, 0.11511844973822004, 0.06136510271249373, 0.012318406108372015, -0.02728949690071488, -0.058024329064952966, -0.08095523475185085, -0.09724438558804924, -0.10795035595897166, -0.11389771378862588, -0.11563757265744055, -0.1134544173133937, -0.10762369150159994, -0.09802585930868205, -0.09246382757570268, -0.0786599563455446, -0.06491249728719883, -0.05220593055572982, -0.041443287174462405, -0.0334835292379146, -0.028649265715114954, -0.025057512074354985, -0.021887205999160084, -0.018917024196057234, -0.016053319750143492, -0.013259064424359968, -0.01049670871120557, -0.0077203473601345825, -0.004907002025351164, -0.002047928319572057, 0.0007246220284399875, 0.003155240049537009, 0.0055093111448962385, 0.007545794633805158, 0.009092704406123352, 0.009908661501652429, 0.01026309330086744, 0.010541741672215733, 0.010540356867676907, 0.010055835342210395, 0.008970799075252636, 0.007190662570175939, 0.00466194360692181, 0.0014303419182585576, -0.0034007365122830117, -0.008288449536066313, -0.012341260085789622, -0.015351622601021962, -0.017687031323850442, -0.019920525172527983, -0.022576939016188503, -0.02511525801173727, -0.02651408911550926, -0.02566971929008857, -0.022446593391783516, -0.017757731497169176, -0.012189461219312877, -0.006266359440689006, -0.0002270239748340647, 0.005732232535374715, 0.011465388876433301, 0.01692587921394192, 0.022120139502615644, 0.026915099518810943, 0.03114062319166574, 0.03468939018654558, 0.037506518721528194, 0.039765832530287835, 0.04175210854732107, 0.04328135773894813, 0.04460683010446274, 0.045733598426942544, 0.04661851212348851, 0.0470800871441761, 0.047061318013396365, 0.046571269179370794, 0.04564550360177229, 0.044414478091827546, 0.04318357385682416, 0.04186444904302041, 0.040118080893341526, 0.037972335661221025, 0.03532033193908837, 0.03202547134084068, 0.03209323685775695, 0.02844061306564493, 0.02373336724377714, 0.01781882118593812, 0.010491992067032382, 0.0016002311628588455, -0.008792443058260217, -0.020179726969953786, -0.06835220735862699, -0.11860996751008665], [-0.3978295541530054, 0.8566485207415494, 0.5498697715772357, 0.432146003823447, 0.3803021618188796, 0.32157607866037374, 0.2514930258974379, 0.17156255719878108, 0.08783789143365259, 0.011452317018727075, -0.05011691149436051, -0.09779811773260864, -0.1332907193304412, -0.15842550665084257, -0.17486522923689554, -0.1839030265215701, -0.18640226876148816, -0.18281253337383005, -0.17355387493994992, -0.15837658305665137, -0.14495860107903297, -0.1234802573330106, -0.10210091865711753, -0.08236027849704973, -0.06567052612816215, -0.053376896019413166, -0.04592475414165957, -0.040424044767225685, -0.03557892806491511, -0.0310443352579485, -0.026674318185220727, -0.022423449936152272, -0.018233406330730333, -0.014033522095591517, -0.009792327760091592, -0.005503930965370832, -0.0013446215142002998, 0.002384634240417948, 0.005859859570393878, 0.008788767874205709, 0.010904486022199972, 0.01183147483844606, 0.012003207144457963, 0.01203096193571518, 0.011589008639729479, 0.010204450797441486, 0.007794046280411859, 0.004207747972428465, -0.0006322133641082146, -0.00663976870776627, -0.014436649276129112, -0.022257148035070572, -0.028689242655103565, -0.03340477907701769, -0.03698703245947883, -0.04035019797803814, -0.044634664579246135, -0.04865487510887587, -0.05084863464824804, -0.04953240589640987, -0.044512139082465034, -0.03711220674713069, -0.028316743640779653, -0.018961144382264598, -0.00941902017128589, 3.992134192536949e-06, 0.009080999720285417, 0.01774334300528455, 0.026008804912315997, 0.03367699976777725, 0.040484056783915645, 0.046245186973300045, 0.050825998722712554, 0.05447197159481702, 0.05764087418374234, 0.060432021916462395, 0.06289895961859755, 0.06504908677085403, 0.06681560119408662, 0.06791516012594087, 0.06825830239707768, 0.06786114294310443, 0.06677467408095179, 0.06515855302161797, 0.06339978781932791, 0.061469792131146665, 0.058984575087594616, 0.055893381898138736, 0.052018471916592354, 0.047137263918495924, 0.047886172594949185, 0.041525523491750586, 0.0418615725246185, 0.03005630458105328, 0.01523253414595598, -0.00337740897013241, -0.02679990341106028, -0.05720302667414675, -0.09968843409345564, -0.18054100251984362], [-0.11412385445094449, 0.7323213499746799, 0.555235814932598, 0.45148904288538266, 0.398769332517105, 0.33726458704079953, 0.263355222844524, 0.17888641351889634, 0.09035270775364032, 0.009582304571360228, -0.05548321630418168, -0.10584091662345858, -0.1432989872311309, -0.1698001176555631, -0.18710712111955005, -0.1965902947109438, -0.19916422443891738, -0.1953064261485913, -0.18545815064818114, -0.16933458303151402, -0.15359192801885752, -0.13083991473302534, -0.10819618119201914, -0.08728995561766334, -0.06961464255661592, -0.05659327660418396, -0.04875083193806075, -0.04297510274587669, -0.03789176486686159, -0.03313784815019051, -0.028560017027138385, -0.024111462299585388, -0.01973172734159136, -0.015347139095872486, -0.010925893902014833, -0.006464259658965817, -0.0021388325169075222, 0.0017640408760300193, 0.005353479672726175, 0.008348170294487246, 0.010466572408450281, 0.011310298237053148, 0.011337413101165542, 0.011193592103087312, 0.010530592824934813, 0.00884248520559897, 0.006037855889713086, 0.001957170184892164, -0.003479758035099612, -0.010176612878117013, -0.018536995743106997, -0.02720909556489802, -0.03440166619665653, -0.03976358998284931, -0.04391836769488537, -0.047844417544256286, -0.05234724549824308, -0.05654826759742612, -0.05879748541328173, -0.05731549385848429, -0.05189920535781187, -0.043931051302574804, -0.03447562411425081, -0.024419722359680027, -0.014160904556762902, -0.004024442276747274, 0.005747969044823738, 0.015082137977867343, 0.023995207969655326, 0.03227394324269744, 0.039637915582789604, 0.04589110672692534, 0.05089075018929571, 0.05489669968402441, 0.05839468820652905, 0.06149090735331274, 0.06424167628041695, 0.06665464585636055, 0.06865931995013447, 0.06995594224769035, 0.07044976126712482, 0.07015847400887788, 0.06913457169986831, 0.06753266443220217, 0.06573302958071489, 0.06374107494174205, 0.061197840815972855, 0.058018891371858165, 0.054012608154336374, 0.04947150743921457, 0.06432759896961758, 0.05602218595272253, 0.04570308641028928, 0.032907925464632164, 0.016972298096222367, -0.0029264047204312664, -0.02788282379665363, -0.0601915794476433, -0.10519553257019895, -0.19047991861657662], [0.05466542861508439, 0.7217601562365417, 0.6011944557627752, 0.5000359708201014, 0.4426781465435924, 0.3744529743004923, 0.29210462609771043, 0.19786790530622256, 0.09905724589188437, 0.008912926781799332, -0.06367706014327085, -0.11983638107535476, -0.16159098733654065, -0.1911138261736065, -0.2103755496134252, -0.22090754909099866, -0.22373172060053814, -0.21938250072195137, -0.20835029447257633, -0.19030259242583794, -0.1714917461800536, -0.14610530556345344, -0.1208412316516824, -0.09751948139738952, -0.07780843214847215, -0.0632983333480962, -0.054572378115074364, -0.048155557379564805, -0.0425113010510867, -0.03723564062777057, -0.03215814758303321, -0.027227452640163838, -0.02237694842190943, -0.01752512552493769, -0.012637492087244398, -0.007711665682460406, -0.002937878574013801, 0.001386716557562387, 0.005329590123475712, 0.008596292875904047, 0.010872796221324452, 0.011713457220868242, 0.011629191089616181, 0.011340016710193954, 0.01045450063456025, 0.008403815091830216, 0.005083552660158799, 0.00031507034275840746, -0.0062574205750812045, -0.014291607077109258, -0.024056980000637513, -0.03384029501947657, -0.041949768987313486, -0.04799057136989855, -0.05265867479781535, -0.05704894416814655, -0.06206391460660312, -0.06672509267344473, -0.06919134728625569, -0.06747883544345258, -0.06136241768329006, -0.052370011560170446, -0.041708970451746555, -0.030371717599442655, -0.018804014430707908, -0.007370337285036552, 0.0036582977643666967, 0.01419792979826165, 0.024266460246803703, 0.03362494442307498, 0.04196025576706598, 0.04905318195899013, 0.054743864703791445, 0.05932242437785657, 0.06333203015253598, 0.06689183100437147, 0.07006431842790159, 0.07285789450638258, 0.07519396966046205, 0.07673785493528701, 0.07738367063441248, 0.07715164727093579, 0.07609937151893499, 0.07438938338104162, 0.07242569325605486, 0.0702394585153697, 0.06746324729174988, 0.06420902304061214, 0.060116298234683924, 0.05487302587973079, 0.06517137796339081, 0.05678166238355181, 0.04595363906418883, 0.03223236669885848, 0.014916151921066958, -0.0068833793500175065, -0.03436219716705976, -0.07006234998681536, -0.11997592988403817, -0.21495875363212535], [0.16073098952650947, 0.719193738658825, 0.6291804490457052, 0.5306488023476865, 0.47044014257406086, 0.397969514835254, 0.31026444625288563, 0.2098191386639433, 0.10447374237606133, 0.008369019464206704, -0.0690036193183378, -0.1288490645905686, -0.173332255757646, -0.20477286788068438, -0.22527392327685786, -0.23646938216786717, -0.23944945104618345, -0.23478485926511702, -0.22299713004826052, -0.20372245536623382, -0.18298181115361006, -0.155930682593223, -0.12901010480048333, -0.10416180641010771, -0.08316582873965173, -0.06771910104187454, -0.05844179908692372, -0.05162815337883711, -0.04563819980999537, -0.04004229850509799, -0.0346592931823789, -0.029435069269345904, -0.02429926738297431, -0.01916547601179971, -0.013997761730257028, -0.00879485024122579, -0.003755583963940562, 0.0008170766113428283, 0.004960169908683517, 0.008371790533895807, 0.010716886271857072, 0.01151919696223074, 0.01132270121924687, 0.010894132088857754, 0.009813922286278925, 0.007472643596946077, 0.0036925226621210023, -0.0017208624086697591, -0.008844444179703197, -0.01755090272303687, -0.02800883534208845, -0.038481690648670755, -0.047160255420837516, -0.0536205072085915, -0.05860359826506979, -0.06327805127648665, -0.06860805591493556, -0.07355181925706547, -0.0761474634784277, -0.07427960991650258, -0.06770908960984025, -0.05805312957596166, -0.04661310102356124, -0.03444909973542208, -0.022037062303656457, -0.009766457582923063, 0.0020730181055747567, 0.01339117142131165, 0.02420637339486411, 0.03426333251052504, 0.043227846394977384, 0.050865952117655024, 0.05700691179936485, 0.061960117337634964, 0.06630534545048711, 0.07017003807435408, 0.07362059618566796, 0.07666589770866689, 0.07922221885685157, 0.08093265455751071, 0.0816842454315287, 0.08149886943334671, 0.08043729117489812, 0.07866643169418057, 0.07660404077159026, 0.07429931962553758, 0.07161516085879291, 0.06827315232255746, 0.06399577592440144, 0.05847203377803725, 0.06941449031992779, 0.06033290783740028, 0.04869831765816521, 0.03399745781153644, 0.015475182724761921, -0.007821181172710537, -0.037156300869997265, -0.07519516655417237, -0.12835388903454598, -0.22955450764634752]], [[0.03690803193681781, 0.03714493247001659, 0.03763945124264232, 0.03854142819831392, 0.04105233788874932, 0.11926694047306687, 0.20358786735602988, 0.09778599283897847, 0.1120319501123512, 0.038857668597829374, 0.02588138145830821, 0.021423755091483636, 0.01727504120970767, 0.01344885121237709, 0.009976705955271767, 0.006871929281080814, 0.0041339284980055225, 0.0017519358696524586, -0.0002870554453521458, -0.0019686738972766677, -0.006424340969376693, -0.007075688100457642, -0.007428770150564097, -0.007584705637854691, -0.007645134809078338, -0.007714353450228568, -0.007884616983229707, -0.008137072527435443, -0.008423978544563834, -0.008722314420586397, -0.009029055632490875, -0.009347922566943983, -0.009675885187425537, -0.010006973413211646, -0.010338109683627325, -0.010667130525402028, -0.010996688626689738, -0.011331422047486016, -0.011674381103972887, -0.012031831069380135, -0.012423451372406264, -0.01288326227216033, -0.013422376445016197, -0.014045645863467534, -0.014785257696299603, -0.015606480185999815, -0.016441039758519165, -0.017215789282141382, -0.017838180293437523, -0.018194301175249606, -0.018472703194117434, -0.018343156323754214, -0.017785246289750884, -0.01683889178194499, -0.01560774155799471, -0.014124236412682794, -0.012381475027790648, -0.010373779113852287, -0.008098517055861293, -0.005594866568393363, -0.0029384963240875884, -0.00026123862155751017, 0.002359412491600632, 0.0048548324587867325, 0.007182008166576932, 0.009307108963973148, 0.011207789335900688, 0.012876898935793094, 0.014315702651924521, 0.015514116891727343, 0.01647086315064886, 0.017196560400289343, 0.017719294675049964, 0.018124034119382668, 0.01848731208218916, 0.018804653198176962, 0.019110738156404575, 0.019561509470874906, 0.019727248749640276, 0.019737572702748493, 0.019599525826299573, 0.01932844888997812, 0.018938969768618644, 0.018456584986917463, 0.017923222770970932, 0.017347047063663783, 0.01670215778319871, 0.01596490525791842, 0.015109207203430106, 0.014102013901603034, 0.01521143678979457, 0.014436937679274953, 0.013458800006798301, 0.012234040097053516, 0.011417580785094961, 0.01088880982349252, 0.009650967193891212, 0.012276195089667206, 0.025734151583605366, 0.05315344861547674], [0.10162214187120755, 0.10213042219282972, 0.10311058156384444, 0.10463369719375257, 0.10814828753424026, 0.2160810246215425, 0.19977587833781854, 0.13007242966993213, 0.13284681998995948, 0.09094354340300306, 0.06682683638968019, 0.054311187271723425, 0.04237490491687147, 0.03126160091906614, 0.021133181852498278, 0.012056040420563538, 0.004036245432423354, -0.0029574311591466255, -0.008931101750367055, -0.013760237523888618, -0.02170311210831144, -0.02372020300545613, -0.024831553026880452, -0.025351160670424328, -0.025593292431609977, -0.025878588404781012, -0.026486729626998346, -0.02735084724551406, -0.028323394007347204, -0.029341771093457158, -0.030399592783539528, -0.03150905777889574, -0.032661412759022485, -0.03383929300275805, -0.03503580886289693, -0.03624802849982112, -0.03748973163132773, -0.03878158975217223, -0.04013959754474788, -0.041589257780214446, -0.04319667257513395, -0.0450726742949182, -0.047255478893246154, -0.049765009843524846, -0.05271012063543218, -0.05599455724653567, -0.059412531096088024, -0.06273669364845569, -0.06567052221604375, -0.06784133284692258, -0.06926737005278376, -0.06936154568877516, -0.06803448980704645, -0.06539958297282938, -0.06178412029163099, -0.05730691785914676, -0.051969312279837296, -0.045769428397913633, -0.03868713644871959, -0.030810472940225025, -0.022377046175988017, -0.013754039820417521, -0.005263082453626197, 0.002868491607620811, 0.010501066213479798, 0.017526806549111328, 0.023873727922539396, 0.029517786703576007, 0.03446134997809278, 0.03867115560898364, 0.042139650376833905, 0.044894343286698904, 0.04701242793774211, 0.04875225806667172, 0.05035788569906981, 0.051814564029957, 0.0531531940365606, 0.05456779645575038, 0.05542021922214382, 0.05581563884135092, 0.05575477429955757, 0.055278064273504596, 0.05442817150776234, 0.0532785962486378, 0.05195053643651866, 0.05046863896526603, 0.048747948164475245, 0.04670949505991021, 0.04426696387378105, 0.04131248778022569, 0.04092246333374918, 0.0374954601685542, 0.03329865692241925, 0.028185037439860717, 0.022936107887296955, 0.017222553280508215, 0.009427977128819424, -0.018359901729071693, -0.02730182687372815, -0.03737245935036663], [0.15898977521693108, 0.15972302530218396, 0.16109236459015958, 0.1630620479768146, 0.16709810206892264, 0.28972966195391264, 0.2344260586020058, 0.1741333047671484, 0.14966354717519326, 0.12290503657018294, 0.10264357916215619, 0.08295844241753894, 0.06406303968239183, 0.04642720826309525, 0.030336577950561897, 0.015907804628965606, 0.0031536967678364087, -0.00797528251971373, -0.01747591577268139, -0.025116816843045987, -0.03568237199996996, -0.038934400591277216, -0.04073301857665588, -0.04158479299823789, -0.041996207358056196, -0.04248331308722058, -0.043494720849017836, -0.04491937580367896, -0.04651951108107835, -0.048197527804882824, -0.04994427104169646, -0.051779667162094756, -0.05368984480723702, -0.05564723774141409, -0.05764174862275264, -0.059670092238685545, -0.06175661383836496, -0.0639370542984804, -0.06623970623014347, -0.06870802014119884, -0.07145054206062304, -0.07464805605064842, -0.07836362999048811, -0.08263125913618889, -0.08762995189626027, -0.09320884850312754, -0.09903832716647362, -0.10475153191331288, -0.10986660306357349, -0.1137750635226064, -0.11628991038949581, -0.11663126323054818, -0.11464503132167855, -0.11051009342374248, -0.10475654318434514, -0.09758296221012773, -0.08900019355528595, -0.07901122430329838, -0.06757901697869727, -0.05483277119348214, -0.04115682185581449, -0.027127441308747124, -0.01329440783385037, -2.9907435926048575e-05, 0.012438511921650047, 0.02393582112818125, 0.034344898229780325, 0.04362625210004213, 0.05178310601753975, 0.05876105485114747, 0.06454654600460301, 0.06918187377059122, 0.0727877495533984, 0.07577887374108351, 0.0785514108885712, 0.08108124610063523, 0.08338893149123676, 0.08567674290208287, 0.08718081099618465, 0.08795737365024395, 0.08799951872351491, 0.08736973855718845, 0.08613580677335607, 0.0844141352475118, 0.08239681614805698, 0.08012334308945435, 0.07745493072104297, 0.074262069817901, 0.07040347772310943, 0.06570313621172251, 0.06361064780810934, 0.057691996916123825, 0.046954314590130504, 0.03666918105383152, 0.02483170285674741, 0.010553373069331469, -0.009037445234445019, -0.029492676133044772, -0.04918986044930545, -0.0742497709973837], [0.23848759443864123, 0.23948655130501587, 0.24127322425718556, 0.2435546372597475, 0.24722641877717957, 0.3558500594407214, 0.2715492823732206, 0.23203180966890655, 0.21495796021125638, 0.18068068659198933, 0.1508589129067809, 0.12116117570751697, 0.09245796769702798, 0.06559854083990474, 0.04106399689270011, 0.01905014416690356, -0.0004184067799335739, -0.01741706984152673, -0.031920201072581054, -0.0435211678955295, -0.056337997643880526, -0.061372882020245045, -0.06416839496182486, -0.06550933510662191, -0.06617955673831401, -0.06697660865449362, -0.06859140498590972, -0.0708468759626973, -0.07337508468965796, -0.07603018188491222, -0.07879979614394317, -0.08171518771298616, -0.08475526160257084, -0.08787801835772274, -0.09106942208872401, -0.09432666523140479, -0.0976908051579291, -0.10122099189858422, -0.10496498907093256, -0.10899375726591906, -0.11347847040846577, -0.11870233669705836, -0.12476529903768364, -0.13172295186241925, -0.13985799051549752, -0.148943685182914, -0.15847311725896657, -0.16787780986958997, -0.17640573562445208, -0.18310278456331794, -0.1873373503833513, -0.18816540905578585, -0.1853325780488932, -0.17910961023597133, -0.17022878802990637, -0.15905828965068677, -0.14564169027784699, -0.12999998961097317, -0.11207328039176721, -0.09204513671449108, -0.07051550414414305, -0.048574027684027896, -0.026912697536988817, -0.006116354550098364, 0.013459100671760506, 0.031541058150633496, 0.04794669697053007, 0.06261389020812348, 0.07554680705917187, 0.08666008199018553, 0.09593065790482311, 0.10342085010332329, 0.10931170403685031, 0.11424245187637941, 0.11883079215567274, 0.12303891019256517, 0.12685240487924343, 0.13040976866963114, 0.13294723757913182, 0.13437276168894405, 0.13466289662629313, 0.13391014093716713, 0.1326307808508871, 0.13057656187210062, 0.12790544050514494, 0.12475608490731226, 0.12092807186435645, 0.1162238769457858, 0.11042331519834797, 0.10325000826836861, 0.1084526901349353, 0.09759464839955548, 0.08447875143582184, 0.06870396877024808, 0.04975557504199861, 0.026828664137319023, -0.001187992979055892, -0.036369300571412584, -0.08233606793103662, -0.155081300981663], [0.25959084043604663, 0.2606429156334228, 0.26249424059083654, 0.26474225532412243, 0.26790626873642825, 0.35979936366765203, 0.27813004668235586, 0.24654125866061904, 0.2306374245852914, 0.19538277076708724, 0.16312167095229968, 0.1307367463233897, 0.09936791454960385, 0.06999007827639615, 0.043145313709573904, 0.01905403356972724, -0.0022550872922291933, -0.020864523117652817, -0.036739084685446705, -0.04941534408561611, -0.062306683022785345, -0.06784189081873926, -0.07091886876368453, -0.07240057707521652, -0.073148661785016, -0.07403944541051247, -0.07583126729231818, -0.07832772431651434, -0.08112437835527589, -0.08406266676670346, -0.08712959917519432, -0.09035968092636905, -0.09372984982735441, -0.09719416294061667, -0.10073773044105475, -0.10435823741141091, -0.10810196076717994, -0.11203522022964581, -0.11621186679535064, -0.12067070317925306, -0.1256251901118126, -0.13138879574269258, -0.13807085453045997, -0.14573074021243348, -0.15467709244706584, -0.16465908693417217, -0.17511801480594563, -0.18542660204753217, -0.19475536041502264, -0.2020528810509527, -0.20651269653790072, -0.20719119887691925, -0.2038091418965337, -0.1966680796964387, -0.1866811464642105, -0.17420646198793732, -0.15928448576900392, -0.1419350651229773, -0.12208534848435358, -0.09992700420843638, -0.07611758433944542, -0.051861036377032446, -0.027911341916829268, -0.0049133251828748625, 0.01674134956601576, 0.036753124988001665, 0.05492109426148303, 0.07117711463765919, 0.08552584052210045, 0.09770647535434042, 0.10781869965634944, 0.11594669759239763, 0.1222947235934516, 0.12756738106226206, 0.13244537511744892, 0.13688859375389617, 0.14087028148050823, 0.14448713831707663, 0.14704411831761274, 0.1485404651546677, 0.1488551058051465, 0.14805752356632365, 0.14624715357880003, 0.14360614748515954, 0.14044225625813314, 0.13681827122223578, 0.1324896769816174, 0.12722686451069345, 0.12078019378267396, 0.11284078810769375, 0.1173870329325506, 0.10548930239333901, 0.09113119938525438, 0.07387007227061346, 0.05306398055364617, 0.027885966788746924, -0.0028628549597940127, -0.041458451720370854, -0.09186355597409371, -0.17160453916837026], [0.28468808969553827, 0.2858170788226203, 0.28778169453110636, 0.2900816428787166, 0.2929661610882352, 0.3752132948997903, 0.29557017645898787, 0.26725750511383783, 0.2505809159092769, 0.21336829344430358, 0.178128498029222, 0.14257091068554034, 0.1080809416294701, 0.07576325269903951, 0.04622526582104347, 0.01971381969765157, -0.003738312229761114, -0.02422184997879952, -0.04169308695528239, -0.05562915875944759, -0.06902189080122781, -0.07513076663127133, -0.07852919733610562, -0.08016970203875537, -0.0810031573675131, -0.08199637378625524, -0.08398542733130797, -0.08675235016659295, -0.08985083083756265, -0.09310711221118413, -0.09650728246421307, -0.10008951963262339, -0.10382846117826301, -0.10763456850217284, -0.1115186880880436, -0.11548150427916178, -0.11957546324902786, -0.12387395507001081, -0.12843661574071305, -0.13335030386607524, -0.1388220133244367, -0.14519409843063605, -0.15258550591338332, -0.16106109259317838, -0.17096220864461875, -0.1820135084358059, -0.19359881958955186, -0.20502602956432558, -0.2153795812370899, -0.22349841326330624, -0.22841461692382056, -0.22915185003153374, -0.2254007163680383, -0.21749420510555495, -0.2064416930966293, -0.19264094511184898, -0.1761391777063377, -0.1569597322808607, -0.13501963734923986, -0.1105249313689029, -0.08420109953517783, -0.05735580594257743, -0.030846183653530018, -0.0056029682757474325, 0.01811118052448345, 0.039988423001518926, 0.05981782926772895, 0.07752921379524062, 0.09313294931467653, 0.10652783689189742, 0.11768444472652324, 0.12667558880929297, 0.13371667306948176, 0.13958022323220218, 0.14501695614086949, 0.14998148939876726, 0.15464767191344866, 0.15867935646592254, 0.16182380556902487, 0.16366418130487748, 0.16414755725898933, 0.163377717696241, 0.16147398972879926, 0.15864243206508416, 0.15522580562532007, 0.15129530964173626, 0.14658203318310345, 0.1408330868236773, 0.13377333765340674, 0.12506216855228766, 0.12861547447266455, 0.1154410721327374, 0.09955627583115238, 0.08047360541355414, 0.05752735627039662, 0.029771178305817724, -0.004113100352305493, -0.04662814443733227, -0.10212443122066893, -0.18985767722749447], [0.3057411345093368, 0.30693757344951234, 0.3090049851780228, 0.3113680389656973, 0.3140872567844207, 0.3904241051301273, 0.3124332491193885, 0.2854459250070059, 0.2675851067858873, 0.2285623894631059, 0.19080733449391785, 0.15259325764643195, 0.11549553884501948, 0.0807234959228338, 0.048937838302848785, 0.020406967924130562, -0.004833060314783479, -0.02687985131767563, -0.045683157924036356, -0.0606719855401554, -0.07457332114258813, -0.08115887223817835, -0.08482412456291126, -0.08659600056912131, -0.08749952858528987, -0.08857674460213939, -0.09072841253756453, -0.09371877917877366, -0.0970667347740096, -0.10058576016998001, -0.10422283964951574, -0.10804799792738733, -0.11203549559699066, -0.11613078939012786, -0.12031667905578676, -0.12459133150520707, -0.12901034302253583, -0.1336529178024666, -0.13858333722676344, -0.14389522751042108, -0.14981179600126904, -0.15670225293883755, -0.16469488362926737, -0.17385986729435693, -0.18456592078747344, -0.19651720539178688, -0.20905001593408154, -0.22141844392725427, -0.232635314378378, -0.24144822308402294, -0.2467632438867268, -0.24756915388357473, -0.24353117457844767, -0.2350080507066825, -0.22308875362331787, -0.2082036511134962, -0.19040535672782327, -0.16972006702917214, -0.14605681308999052, -0.1196342883732554, -0.091471267162447, -0.06276783343257471, -0.03444971018762741, -0.007281220622116196, 0.018276519541419668, 0.041873326468376444, 0.06327405220129835, 0.08240095254665403, 0.0992624443786279, 0.11374726554394067, 0.12582243729465287, 0.13556547263705515, 0.14320738209301506, 0.14958046233751635, 0.15549468630621327, 0.16120314264043636, 0.16634583771109687, 0.17077414183085665, 0.17423329107125757, 0.1762789777727481, 0.17685555815341422, 0.17607474471334988, 0.17406677945979532, 0.17105495210823773, 0.1674096537081485, 0.16320820060984978, 0.15816091281254824, 0.15199527190669657, 0.1444147980746147, 0.13505242418177743, 0.1378084019621056, 0.12361553747971758, 0.10650653667870409, 0.08595328350422143, 0.06119069055756905, 0.03128411429030989, -0.005202215588696968, -0.05097577480826009, -0.11071272656472105, -0.20511793321384303]], [[0.004101733563243963, 0.0043666244789598045, 0.0049011103562568116, 0.005667889000074768, 0.0065922896641962825, 0.007529676043245146, 0.008180083346880305, 0.005351993450649066, -0.05701924854540069, -0.2673681876807139, 0.6887323338671539, 0.24446466722191992, 0.0710300613598307, 0.014443716992468773, 0.011247560983068906, 0.008806166033531225, 0.006691192128911935, 0.0047614993806368786, 0.0029719276461005694, 0.0013216130621227064, -0.002506412645574381, -0.003442359705046091, -0.004163068606812853, -0.00470718799117138, -0.005116917319344325, -0.005437458793675893, -0.005724711359409637, -0.006032825087766828, -0.006356027801790496, -0.006686226372297055, -0.007024794109646846, -0.007374686995093632, -0.007733428679931846, -0.008097157623872676, -0.008463824114774718, -0.008831552238540855, -0.009197942886581061, -0.009561554069939221, -0.009920657005586177, -0.010275722638977412, -0.010636453016690112, -0.011019726844549526, -0.011446650854049098, -0.011941401785708693, -0.012524072026303013, -0.013146165169071829, -0.013744394413198881, -0.014250486365711666, -0.01458226896061326, -0.014644094956253005, -0.014484468160544505, -0.013957187575549188, -0.013095886010555826, -0.011954568759898136, -0.010614693381071382, -0.009080390293110053, -0.0073162737155031965, -0.005339788455196524, -0.0031820424142816935, -0.00091868007306806, 0.0013656520816944387, 0.003571285117457534, 0.005668709119553074, 0.007623448506944131, 0.009408914381341645, 0.01100512864519742, 0.012399620874619485, 0.013587564043955948, 0.014602737351722206, 0.016093993033931754, 0.01677215943864317, 0.017247308790342628, 0.017568039491898554, 0.01780514026189774, 0.018013481236114733, 0.01818422197787453, 0.01830756415618733, 0.01837178216711633, 0.018356238843322825, 0.01823525339730698, 0.018014625653835936, 0.017704199029028665, 0.01731408627570079, 0.016860984300136175, 0.016368601404124952, 0.015838574644869173, 0.015251957504425437, 0.014591323646933196, 0.01383736084596911, 0.012965748612405828, 0.013885177371352602, 0.013191378280720836, 0.012389588967036045, 0.011502367224487203, 0.01056246677288995, 0.009644021199834143, 0.008965005179529386, 0.00957421287688032, 0.01840845495161082, 0.036701129264730466], [0.011302209984929455, 0.012520062996446505, 0.014945509820825244, 0.01845909464553679, 0.022821157000692153, 0.02758231679424335, 0.03189466109266935, 0.02929763800812419, -0.01700557283752092, -0.1954879749339299, 0.6198909650131027, 0.2044897087941216, 0.05654366781019839, 0.041832620660503216, 0.032497285635215735, 0.024470837680487263, 0.017023844613548472, 0.0099225226750102, 0.003167481732410998, -0.0030963914610970074, -0.013068437850768656, -0.016984551396331083, -0.0200088891946495, -0.022304484312847293, -0.024048986486363208, -0.025431972968516348, -0.02668632698911872, -0.028035324771376203, -0.029452402943051587, -0.030906967811754026, -0.032407892639133344, -0.03396894683894327, -0.03557993542441861, -0.03722501487887893, -0.038897103992166095, -0.04059077014830037, -0.042300345988930114, -0.044024594801660405, -0.045760773275719466, -0.04751540087687148, -0.04933375827647825, -0.05129191663270958, -0.053482803644762704, -0.056012864626334515, -0.05897410460757166, -0.06216748918505349, -0.06532688416859175, -0.06816014099088581, -0.07030877209249566, -0.07134926735634706, -0.07112507955286375, -0.06928486577620285, -0.06595237656239612, -0.06134899620589562, -0.055825561462391454, -0.04941171009092377, -0.04197040803085434, -0.03358289203177025, -0.02437854160049592, -0.014670270803444733, -0.0048143027259066285, 0.0048445876083822404, 0.014080271234512042, 0.022734822114024274, 0.030690273382349652, 0.037860368047383734, 0.04419257487452386, 0.049672365219581315, 0.0543642821452766, 0.05949368266645561, 0.06262063832130468, 0.06493980927529079, 0.06660678854484436, 0.06791573851876843, 0.06911271241451358, 0.0701628088864266, 0.07102030702588533, 0.07163280390219137, 0.07191069669556745, 0.07173366628634939, 0.07110781531581147, 0.07007541566177572, 0.06868163548396626, 0.06700139785904806, 0.06513838820642248, 0.06309815934238151, 0.06079531196316367, 0.0581500405456408, 0.05507447985984388, 0.0514593408446081, 0.05087555866397534, 0.04678852144689929, 0.04200591952838697, 0.03648679948951716, 0.030171741162491016, 0.00997894739345134, -0.0023293197059629065, -0.017109587536882468, -0.027038343701096205, -0.035100934698416145], [0.015187644197572903, 0.01709995761973548, 0.020897673860128772, 0.026410848745900443, 0.03329826774641151, 0.040927330342835015, 0.04814655361160922, 0.05237874958403457, 0.03255632643817671, -0.12014609869209439, 0.5100337116532863, 0.2392848282869445, 0.07584556929243394, 0.05736295229771172, 0.04451968681790015, 0.0329995970912715, 0.02207730758954517, 0.011526340744251887, 0.0014181927863842077, -0.007969205573320128, -0.02104386956228362, -0.027062000728026142, -0.03171296338294905, -0.03524779269159856, -0.037939896670677015, -0.04008077623999421, -0.042027943377085264, -0.044123294195202827, -0.04632510939114571, -0.048587590507695774, -0.05092553760714067, -0.0533606325510501, -0.05587726999776881, -0.058451218982623454, -0.06107215384881847, -0.06373262539477399, -0.06642555111983713, -0.06915081591057544, -0.07190587524393922, -0.07470244117745019, -0.0776118435452627, -0.08075301361676279, -0.08427047670410204, -0.08832978171641644, -0.09307527234427779, -0.09820252455998589, -0.10330205688102237, -0.107922493077361, -0.11150746304439442, -0.113397456293771, -0.11321808851554747, -0.11052634667109183, -0.10550608812597341, -0.09849582282106618, -0.09003842842930733, -0.08018405004388672, -0.0687262024311896, -0.055792796209866186, -0.04158236658394338, -0.02657445095696135, -0.011317242965628325, 0.003686313652867155, 0.01805050260738846, 0.03152753884298713, 0.04393363575940216, 0.05513524453982344, 0.06505150564512605, 0.0736622018090792, 0.08103793676510693, 0.08850737092634615, 0.09342048391827688, 0.09710773225236591, 0.09979045254235967, 0.10191994800932962, 0.10388047408020723, 0.10561917294107921, 0.1070640243079117, 0.10813325359463129, 0.10868795130910322, 0.10853842616876426, 0.10768729537356496, 0.10619992487526118, 0.10414679009571731, 0.10164491377725712, 0.09885530579932796, 0.0957860168166441, 0.09230352874590317, 0.0883022472149844, 0.08361079199251535, 0.07805115062866573, 0.07417525862800234, 0.06637027089417256, 0.05708430271128446, 0.04606378244094476, 0.03290549147435882, 0.01705061076258218, -0.0023188044652505055, -0.025545994550332105, -0.04553082163111655, -0.06536284157890813], [0.024125814750289822, 0.027768606204224288, 0.03498264761195134, 0.045477308694665264, 0.05866852039581156, 0.07348834767248871, 0.08808114522703386, 0.09881343558543393, 0.08196957489075933, 0.0011002669681654256, 0.39686950691729084, 0.30216972945809656, 0.1201824597643212, 0.09364329428806732, 0.07258633671374033, 0.05267544643564084, 0.03331739240407684, 0.014344760552890596, -0.003973820411011343, -0.021014245354742788, -0.04106936878398586, -0.052287286019966586, -0.06096306178291041, -0.06756557503211603, -0.07260523652430181, -0.07662572819802253, -0.08029274222932144, -0.08424122769461853, -0.08839169676921485, -0.09266111436906307, -0.09707930104870986, -0.10168767278095191, -0.10645725967740512, -0.11134311867715549, -0.11632707006779185, -0.12139695383081328, -0.12654268899218823, -0.1317674860708969, -0.1370698081783726, -0.1424747350009807, -0.148118572911986, -0.1542269027699488, -0.1610724177140958, -0.16896747936646375, -0.17818681400165853, -0.1881657398482825, -0.19814002216561116, -0.20726365630971455, -0.2144890822717451, -0.21857031435362856, -0.21855279825823284, -0.21379667163960905, -0.2046325287236537, -0.1916880883126745, -0.175982431930583, -0.15761785349924345, -0.13621733221595955, -0.11202518378218158, -0.08541092509815494, -0.057265859070591264, -0.028613294960034327, -0.0003391390156383068, 0.026764324778351955, 0.05222545473336069, 0.07569687357890134, 0.09692773980794792, 0.11576707720102548, 0.13218124772580359, 0.14624702435376857, 0.15937747277514927, 0.16874227808577733, 0.17585179618436392, 0.18108450836384207, 0.18528020621970973, 0.189166909954829, 0.1926475825358198, 0.19569387057674364, 0.19811351737990016, 0.19961558240236382, 0.19981604990884635, 0.19868396924447995, 0.19633916016611513, 0.19291377694030803, 0.18862936614107148, 0.1837875971726782, 0.17839860893519843, 0.1722049585036761, 0.1649639828663075, 0.15640892378389792, 0.1462103391269685, 0.13789166355622326, 0.12318497431733358, 0.10581414625656005, 0.08531462613568556, 0.06097875963110269, 0.03186356696931379, -0.00340246509578028, -0.04605626582911715, -0.08946369822065348, -0.14294979598859003], [0.03015948689208917, 0.035003749450683914, 0.044589019542862186, 0.05854205992317258, 0.07611254832123662, 0.09593520754773102, 0.11567759156785895, 0.13101854362563076, 0.11700360819349594, 0.06102795919595639, 0.37713500127588023, 0.34028766616381306, 0.15009538242629794, 0.11827302441914127, 0.09163536819911859, 0.06597158669485209, 0.0408084384144507, 0.016028972363235108, -0.007956570563935582, -0.030280345685403935, -0.05500826737189027, -0.06982758269238303, -0.08129120019679989, -0.090018913979691, -0.09668531307680005, -0.10200875321559928, -0.10686834682703275, -0.1121019247215699, -0.11760377580654824, -0.12326516227557333, -0.12912639170872572, -0.13524258555402668, -0.14157552202600354, -0.14806592116134507, -0.15469020353128815, -0.16143301110242828, -0.16828230320851809, -0.1752437221922235, -0.1823165493192675, -0.18953524460105742, -0.1970812430019681, -0.20525413735883316, -0.2144155140913197, -0.224979559651432, -0.23731151650691698, -0.2506665509878937, -0.26403468870772956, -0.2762964297101009, -0.2860636204665335, -0.29168345524347616, -0.29178992257397524, -0.2856137951811229, -0.2735868433799532, -0.2565369708144491, -0.2358133482679564, -0.2115547191314608, -0.18326624407484948, -0.15127308239451193, -0.11606315289501026, -0.07881285315850696, -0.04087461488903938, -0.003397650948038148, 0.032541414348610576, 0.06631552878230874, 0.09746383148636399, 0.12565417203229587, 0.1506870015657851, 0.17251953857893831, 0.19123077209416595, 0.20825233270531424, 0.22070815448142472, 0.23019682166446168, 0.23720437587060894, 0.24299445373580197, 0.24845530913231487, 0.25343175775544774, 0.25772522865706404, 0.2611216436507383, 0.2632696183091647, 0.26367353333787896, 0.2622984389258086, 0.2593063056130814, 0.2548745172903921, 0.24929835989969895, 0.24297885651552104, 0.23593066383559125, 0.22781353569861637, 0.21830646803135603, 0.20705672136728928, 0.19362874560768595, 0.18140638272382892, 0.1619691075620465, 0.1390394139337495, 0.11200958200873173, 0.07996376518791849, 0.04169564697364899, -0.004548757913698328, -0.060663828963485926, -0.12063231742539823, -0.2156847850253901], [0.032140381564194256, 0.03751721981712192, 0.04815065636352353, 0.06363561458041454, 0.08315759201881821, 0.10523930113371847, 0.12738571036880864, 0.1451550130964973, 0.13542610419125947, 0.10037411480412894, 0.335331245543092, 0.334961394884003, 0.15984762750875903, 0.12693471290392175, 0.09831529760945926, 0.07039502474446213, 0.04286766737104118, 0.015676752513602267, -0.010685589625561109, -0.03522980623855996, -0.06132879934620792, -0.077708980477391, -0.09038181694957863, -0.10003265343196614, -0.10740735184111941, -0.11330002073929012, -0.11868216136243108, -0.12447917811363124, -0.13057373358755575, -0.13684630402217438, -0.1433420805387336, -0.15012227624874563, -0.15714467754502986, -0.16434382471066594, -0.17169395983449434, -0.17917860033982383, -0.1867853292046089, -0.1945213618164516, -0.20238681993213556, -0.21042072131481826, -0.21882456702176165, -0.22793061671528692, -0.23813948302560664, -0.24991005597666088, -0.26364766705879816, -0.2785298236831704, -0.2934399021088033, -0.3071391662714282, -0.31809026002974117, -0.3244615370333044, -0.32466975549127164, -0.3179177976021573, -0.3046794472099634, -0.28586887352093454, -0.2629793929136088, -0.23616688324051927, -0.20488663495955106, -0.1694997377255915, -0.1305453420127349, -0.08932301836450748, -0.04732806404125343, -0.005815991737304264, 0.03400223064823515, 0.07143071515456066, 0.10595868975221892, 0.13721847574790258, 0.16498943438506633, 0.18922543470754166, 0.20999811602218937, 0.2285859669400703, 0.2424127726447944, 0.25316639931284, 0.26124818403491545, 0.2678423512689121, 0.2740175430873516, 0.2796302846995799, 0.28447297096671764, 0.2883133702059052, 0.2907649693354636, 0.2912807663258109, 0.28982281529281034, 0.2865708219009134, 0.28172166108321794, 0.2756028021370724, 0.26865876729334215, 0.2609062926387965, 0.25196888693950664, 0.24149115109354174, 0.22908268370720514, 0.21426153837103767, 0.19966865333002695, 0.1878721737925684, 0.16325938958339212, 0.13402696300753122, 0.09931914713252636, 0.05789682443397307, 0.008046567645190692, -0.05336818843445368, -0.1303916795416731, -0.23709731269849385], [0.03240522749574763, 0.037963248544658594, 0.04895154611856891, 0.06495702934451289, 0.08514897266199249, 0.10802365439088056, 0.1310594892259955, 0.1498822405527999, 0.14340291715433198, 0.12046144481510819, 0.30366125285774603, 0.3200323584909466, 0.16109706747284364, 0.1285510722950829, 0.09954759846229273, 0.07103280032503959, 0.04282439510182458, 0.014908958178180694, -0.012182247850156598, -0.037410206009053794, -0.06356269682964835, -0.08045293659221274, -0.09352149555899607, -0.10347522529218213, -0.11108334884274046, -0.11716475833264459, -0.12272108017839638, -0.12870612101878784, -0.13499858678893448, -0.14147564245767336, -0.14818427909229062, -0.15518779189061804, -0.16244267365822024, -0.1698814657325746, -0.17747779589800564, -0.18521497181744268, -0.19308073875934287, -0.20108313922637083, -0.209222862694408, -0.2175407132107014, -0.22624505487516616, -0.2356791778181632, -0.24625674881799883, -0.2584516111730687, -0.2726827146144681, -0.2881024424892819, -0.3035592331411237, -0.31777496337410593, -0.3291625632391536, -0.33583042351745124, -0.33610085244569265, -0.32918461277683936, -0.3155681096939613, -0.29594921989681205, -0.27207473971151613, -0.24411307611204008, -0.21151184966823172, -0.1746502053970666, -0.13408840264398533, -0.09116978676088977, -0.04743966203815209, -0.004537475848186139, 0.036616770868368904, 0.07530462064585929, 0.11099915525759188, 0.1433214156559644, 0.17204427411467446, 0.19712123029528558, 0.21861672048777528, 0.2367035615416533, 0.2512620304883898, 0.26252251613845945, 0.27097323466271594, 0.2778655317262063, 0.28431185063278713, 0.290168695097796, 0.2952223763385028, 0.2992352146001573, 0.3018100172004903, 0.3023834017375216, 0.3009167896434847, 0.2975960189858985, 0.2926246793672851, 0.2859937438581254, 0.278488157068933, 0.27013095004938764, 0.2605406556234589, 0.24935444774496707, 0.2361720230623511, 0.2204979616041579, 0.21730998004627275, 0.19515244972094126, 0.1690746250778187, 0.13844311717532154, 0.10226982887923093, 0.05930244146518262, 0.007736078235560527, -0.0556820194862526, -0.13511653533880827, -0.24499557997731372]], [[0.0018560861304151644, 0.0018188940167543333, 0.0017417534602856054, 0.001623669632033873, 0.0014644546886759143, 0.001266734401096109, 0.0010391268701847726, 0.0008008363648041226, 0.0005865670677214928, 0.00046325398918360705, 0.0005607847024940702, 0.0015125028356651892, 0.447334267249807, 0.6447417065056772, -0.05869070442410716, -0.0030297896926658034, -0.0013821516244061029, -0.0008976526954049999, -0.0006004443929245207, -0.0003662741855793013, 0.00017263462262065362, 0.0002801651010533886, 0.000369224929997235, 0.00044098300284309294, 0.0004971022494750086, 0.000539573200075658, 0.0005726472462270202, 0.0006056436813864539, 0.0006398162326696348, 0.0006748259809877795, 0.0007110426046833616, 0.0007486943683767162, 0.0007874088363798487, 0.0008267776280431098, 0.0008665538774677121, 0.0009064712909377615, 0.0009458643673153349, 0.000984119646258082, 0.0010206743790910828, 0.00105520916613303, 0.001088312284284544, 0.0011209310857053958, 0.0011559900205718684, 0.0011974292508899291, 0.0012469515255705047, 0.0012976211851837946, 0.0013420331497257427, 0.0013723523140062284, 0.001379542209481143, 0.001353531669117788, 0.001294170674137868, 0.00119362111921218, 0.0010597309550628383, 0.0009003594441710051, 0.000724346371048567, 0.0005304725297755788, 0.0003120812881968862, 7.182156985664462e-05, -0.0001850156231823008, -0.00044648214934341713, -0.0007015898423451242, -0.000940257533379665, -0.0011615767643673976, -0.001363364820605049, -0.001544239338368097, -0.0017241282041773193, -0.0018643290466090047, -0.0019797400445822036, -0.0020718189336696668, -0.00214074400477652, -0.0021881609232949958, -0.0022164007765929066, -0.0022292635156911348, -0.002234175454970131, -0.0022372081265631372, -0.0022372903810823513, -0.0022335744384342337, -0.0022246196137783785, -0.002208067279845187, -0.002181039877598557, -0.0021434809207579912, -0.0020965593796342906, -0.0020414521583510207, -0.0019800944291795556, -0.0019147307105443164, -0.0018450556070172845, -0.0017691142379173584, -0.0016850844500148645, -0.0015909344897611904, -0.0014841297894287928, -0.0016951881902540849, -0.0016073130396550743, -0.0015105123965157856, -0.001408378630107392, -0.0013065873658655097, -0.0012176158442180935, -0.0011691283616164186, -0.0016817615893259556, -0.0019473664503800278, -0.0037227772239298127], [0.006306148364733897, 0.006178699034612813, 0.005917684981703496, 0.005518141907408574, 0.00497649089066834, 0.004296314673865896, 0.0034971477824185444, 0.002625647935633021, 0.0017639271391201665, 0.0010768246752088113, 0.000823231204724491, 0.0019381973514185826, 0.6495383742714258, 0.4190326894051733, -0.038870257745867984, -0.004761822760832059, -0.0022374852518812403, -0.001360132081954452, -0.0007256252377075771, -0.00016914092819054458, 0.0008202549758705604, 0.0011544884293905719, 0.0014325054343720606, 0.0016573707924811302, 0.0018339547139791252, 0.001968283980491009, 0.002073662612172099, 0.002179653863403862, 0.0022899988908288275, 0.0024037711476474874, 0.0025223487340566594, 0.0026465243032121138, 0.0027750664515888666, 0.0029066464462826876, 0.0030405259564295645, 0.003175968122067197, 0.00331111459057581, 0.0034442822612848045, 0.0035738972579163713, 0.003699184096251311, 0.0038222960549348433, 0.003946566004786326, 0.0040816690215926535, 0.004240578464079324, 0.004429175993499723, 0.004625291602007781, 0.004804987297942865, 0.0049426513331672535, 0.005008319760524296, 0.004968205497387984, 0.00480375528748484, 0.004502418715259853, 0.004088517107147859, 0.003587040459688987, 0.0030269803125578232, 0.0024050957396218263, 0.0017005837814855424, 0.0009225132642185254, 8.791778782111862e-05, -0.0007649609827482075, -0.001600906280423654, -0.0023949549407060833, -0.003135478297477635, -0.0038149990805387084, -0.004427284201254192, -0.004998554415193838, -0.005471326917669587, -0.005867673323768875, -0.006189732322377668, -0.0064374189981367775, -0.006615681841239734, -0.0067317359087995104, -0.006797665537822905, -0.006837702288647643, -0.006871885332268202, -0.006896725410808373, -0.006908244803154076, -0.006901481614403175, -0.006868550263851613, -0.006800009279309322, -0.00669562467710586, -0.0065592033225944845, -0.0063947165798373925, -0.006208727262586067, -0.006008696052178349, -0.0057934642122018445, -0.005556295881889869, -0.005290820244197301, -0.00498996567738611, -0.004645005703788474, -0.004731337485791865, -0.0039035671064594395, -0.003367976379458187, -0.0027391018405490564, -0.0019964574961999397, -0.0011571788794906258, -0.00013257870051658184, 0.00045196421802625543, 0.002157149303696189, 0.002625453863915555], [0.010138450696977675, 0.009933157280854178, 0.009513910255397296, 0.008872157241446828, 0.008001084088228893, 0.00690452600030562, 0.0056103748731510415, 0.004186940108841322, 0.002753327048826035, 0.001551987258245229, 0.0009333731352650487, 0.0019620630130882844, 0.7304695578442959, 0.3334891035231038, -0.031640074434866, -0.00566054476302995, -0.0027108155743007026, -0.0015774708619943375, -0.0006926755765146232, 0.00011577295158361188, 0.0014029999876351714, 0.0019291343459885636, 0.002367246519891209, 0.002721936948761254, 0.00300075439575255, 0.003213122749907422, 0.0033800198614493643, 0.003548217843301548, 0.00372354445818694, 0.0039045911947134153, 0.004093617660130819, 0.004291904379882186, 0.004497483862162287, 0.0047082410779822935, 0.004923025209091698, 0.0051407121314883415, 0.0053584593583464145, 0.005573705594727906, 0.005784042406145393, 0.005988334700830894, 0.006190100057602506, 0.006394737935257772, 0.006617708972308622, 0.0068797214472319295, 0.007190266146771183, 0.007514202856696711, 0.007813486546366006, 0.008047304573490684, 0.008167749694968855, 0.008120657238413657, 0.007869693281951293, 0.007399757001343831, 0.006749105413261841, 0.005957297796336385, 0.00507056837806228, 0.004084031692564809, 0.0029648964279102913, 0.001727767484319676, 0.0003996899819928734, -0.0009587029140000844, -0.0022915558621737246, -0.003562084237431603, -0.004748512625370707, -0.00583879761989858, -0.006822364259934704, -0.007726410186325477, -0.008485204603827883, -0.009123939956788877, -0.009645040018409998, -0.010048119246076698, -0.010340901627548225, -0.010534732707597015, -0.010648742694609829, -0.010721528427545398, -0.010785094630626442, -0.010833885686060541, -0.010861110923777556, -0.010858768870313519, -0.010814227950304175, -0.010712429876878943, -0.010552983304383243, -0.010341949154897738, -0.010087783810243185, -0.009799032667985428, -0.009487360402437434, -0.009150482302534003, -0.008777176767739377, -0.008356772446898664, -0.007877421207197333, -0.007324588593364113, -0.007015456545476873, -0.00627167238322358, -0.005409598092618816, -0.004409365738547714, -0.003239955946432019, -0.0018613770444367457, -0.0002114416162675114, 0.0010591543686980292, 0.0036531626457362958, 0.0049602142136179195], [0.020417817591476217, 0.020003588350090886, 0.01916004722345435, 0.01786882082526378, 0.016114052031870645, 0.013899590382099265, 0.01127453461348296, 0.008362962154127572, 0.0053787606664988516, 0.002764791107197255, 0.0010944528399815085, 0.0016286769753597842, 0.8394560115754971, 0.22184710455817883, -0.022896046696626707, -0.00738209298487525, -0.0036751512425694417, -0.0019506367832682748, -0.0004410912216950069, 0.0010135092380254935, 0.002995113881062623, 0.00403212079139345, 0.004896604990560511, 0.005597173387664369, 0.0061484626075408895, 0.006568917181666297, 0.006899956854690388, 0.007234252295759045, 0.007583163789089712, 0.007944017982383441, 0.00832145410550497, 0.008718063426222621, 0.009129908263876689, 0.009552771807170934, 0.009984409292002358, 0.010422678683318299, 0.010862147759243686, 0.011297949458386873, 0.011725478793434718, 0.01214267455166418, 0.012556732960945694, 0.012978610858163991, 0.013439255076341958, 0.013980069886139488, 0.014620238794829432, 0.015290004779505829, 0.015913635186801875, 0.01640966929637042, 0.016682162268327295, 0.016622344133862307, 0.01614394761102011, 0.015226779150837241, 0.013946184554400965, 0.012380589618195562, 0.010622349162379459, 0.008662278499853645, 0.0064356551616489115, 0.003971941997993575, 0.0013249209151700143, -0.001385006432790121, -0.0040468886943151984, -0.006593385847011839, -0.008974445273905125, -0.011165768221887331, -0.013144942775126843, -0.014936635887887382, -0.016462182665944715, -0.017751602185981742, -0.01880773349839696, -0.019629298933303698, -0.020231387377199244, -0.0206662776396844, -0.02094096585001249, -0.021132528190650535, -0.021305327485303394, -0.021448570290319557, -0.021546744432948045, -0.021583538316446577, -0.021533492631849227, -0.021366562207855534, -0.02108200550366141, -0.020691973256848437, -0.02020938408985497, -0.019655594824121738, -0.01905445896784509, -0.018401804139762463, -0.01767542663894896, -0.016854107952798087, -0.015914292316204566, -0.014827077156740054, -0.013843584213141325, -0.012359854784022404, -0.010646276869169257, -0.008664113104650898, -0.006354739922492743, -0.0036444600467741327, -0.0004226024077357611, 0.0026264966449643075, 0.007605555610884072, 0.01151859775875052], [0.027696190470463435, 0.027133975165412813, 0.02599005697965357, 0.024239039206315136, 0.021858532798211462, 0.018852163285039792, 0.015283617565558632, 0.011315644586059262, 0.00722767308820069, 0.0036017204634410343, 0.0011610441841452808, 0.0012522335906301836, 0.8784201859497698, 0.1802279026468873, -0.02008773185392606, -0.008356450796566236, -0.004250098997741516, -0.0021407432108147967, -0.00020530117295110788, 0.0016963226513719027, 0.004132672104088088, 0.0055300412299104235, 0.0066953432928334965, 0.007639982243857492, 0.008383579115619296, 0.00895093327496324, 0.009397888466719908, 0.009849522041801199, 0.010321088881987154, 0.010809029922937809, 0.011319674657437731, 0.011856543183512083, 0.012414304305247896, 0.01298725560808777, 0.013572382156616474, 0.01416682854116811, 0.014763346525498423, 0.015355454031268997, 0.015937005617175988, 0.016505297908448194, 0.017070138604629626, 0.01764642448927108, 0.018276056053053782, 0.01901507335991823, 0.019889527143269976, 0.020805210878322752, 0.021659760507116245, 0.022342978404343, 0.022724938763083697, 0.022658226848582808, 0.022020428298587295, 0.020788361211237186, 0.019063529595825208, 0.016951803836720344, 0.014578149032414466, 0.01193037594144866, 0.008921232566321574, 0.0055907050511049446, 0.0020114651021093752, -0.0016538693560016456, -0.005255428699341114, -0.008704645358782957, -0.01193107017868923, -0.014901724234957281, -0.01758574698642628, -0.020004193864090015, -0.022072488197696232, -0.023822814501469933, -0.02527297423642403, -0.026412403559729465, -0.027258325099490086, -0.027839452725578556, -0.028206118181973803, -0.028462092296188103, -0.028694081474593517, -0.028887165185593335, -0.02902011523987262, -0.029070692679721608, -0.029004328253422574, -0.028780282298967123, -0.028397432628859062, -0.027872144444825307, -0.027221865024871828, -0.02647548947403021, -0.02566531478953898, -0.024785656800080966, -0.023806391278820376, -0.02269876386825692, -0.021430880099675125, -0.019963629926060635, -0.01856654772470852, -0.016566078235972392, -0.014256164423185976, -0.011584790105984753, -0.008473866099096611, -0.004825772057099414, -0.0004951198312795717, 0.003851467735243407, 0.01044971236651381, 0.016176203923898336], [0.03508670940161661, 0.034374212832586244, 0.03292530418563066, 0.03070743333950375, 0.027691538070839683, 0.02388094273062065, 0.019354012574758998, 0.01431250721914439, 0.00910191202954247, 0.0044446808686435, 0.0012137194837806623, 0.0008257930835652332, 0.9059413916142869, 0.1521650671184333, -0.01851989142580919, -0.009267830882802931, -0.004799938575923906, -0.002310444538176099, 5.22728526696337e-05, 0.0024045056321104546, 0.005290985375552175, 0.0070538396691938, 0.008524255372010672, 0.009716464054966937, 0.010655137192240769, 0.011371516736700896, 0.011936076933785218, 0.012506772150138092, 0.013102804714369231, 0.013719719309220068, 0.014365563420219392, 0.015044800523479496, 0.01575068490541299, 0.01647600646927508, 0.01721696962797778, 0.017969996923806603, 0.018726001685916885, 0.019476867474252278, 0.02021488932668042, 0.020936716088381147, 0.021654809302987382, 0.02238806798476982, 0.02318951145469171, 0.02413003536945872, 0.025242664831998565, 0.026408386347828335, 0.02749781097719431, 0.028371575333346676, 0.02886525924933157, 0.02879221372215909, 0.027993071189269587, 0.02644180977941135, 0.024266462411743482, 0.021600743283755185, 0.018602715845377326, 0.015257152453426686, 0.011453949483694926, 0.007243779470707303, 0.0027184819573937897, -0.0019164908765521784, -0.0064717806983717345, -0.010837393574246583, -0.014922051580216927, -0.01868396102840745, -0.022083661358410774, -0.025137967965953703, -0.027770960418827192, -0.030013994023875785, -0.03186379294717744, -0.033315696656910136, -0.03439421397110555, -0.0351366227303854, -0.03560712760197797, -0.03593718182937459, -0.03623656589003113, -0.03648645166515135, -0.03666001460933532, -0.0367291526657498, -0.03665016564027482, -0.036371530181355756, -0.03589183389459704, -0.035231763530413227, -0.03441339880711018, -0.0334733215829059, -0.03245242781917455, -0.031343556997570084, -0.030108596044603367, -0.028711150362217486, -0.02711092387035349, -0.025258486012263746, -0.023363309333730795, -0.020836891682734116, -0.017920661122011235, -0.01454912974757695, -0.010624518476803237, -0.006025064600404971, -0.0005704298525530347, 0.005102683668434838, 0.013336415380262617, 0.02091467658487072], [0.04140474944115563, 0.04056377292846728, 0.03885413940980545, 0.036237173480661085, 0.03267808967235231, 0.02817992136862658, 0.02283352097800828, 0.016873881097950214, 0.0107027332807138, 0.005162195740456847, 0.0012519617529586596, 0.00044115461250170113, 0.9239884438915377, 0.13473640312304522, -0.017773008129378792, -0.010011003096463883, -0.00525454858067618, -0.0024449169828070307, 0.0002807159542532964, 0.003016666900276847, 0.006282675825902233, 0.0083577825524517, 0.010088881029205014, 0.011492614427356553, 0.012597966873333186, 0.013441683368166866, 0.014106738390970276, 0.014779179186615596, 0.01548157944198897, 0.016208719058464598, 0.016970114972995033, 0.01777103724835599, 0.01860353113483988, 0.01945909801025487, 0.020333275550481544, 0.021221870083470037, 0.022114225815877936, 0.023000831634110586, 0.023872651487095792, 0.024725782385951273, 0.025574955574314207, 0.026442492227904242, 0.027390915346397413, 0.028503817807766937, 0.029820187600657865, 0.031199812884589378, 0.032490209229073516, 0.03352708621714988, 0.034116539618152295, 0.03403838236083631, 0.033101542956725113, 0.03127766002846471, 0.028717430951777298, 0.02557836242532365, 0.022046806628278813, 0.018104944090384795, 0.01362314706295022, 0.008661224142738427, 0.0033273952434005193, -0.002136283876495599, -0.007506709875964304, -0.012655630029318571, -0.01747390662692022, -0.021912209990888384, -0.02595901109136865, -0.029551857809527522, -0.03267433543096166, -0.03533068996759823, -0.037520649973842725, -0.03923995190469006, -0.04051805782864023, -0.04139919128289254, -0.04195912041713878, -0.04235299710787791, -0.04271035194279342, -0.04300904490557243, -0.04321749366346645, -0.04330260732754266, -0.043212902022829396, -0.04288766620138404, -0.04232524154589702, -0.041550022059052255, -0.04058805817271427, -0.03948250870082925, -0.03828162222426708, -0.036976978514411264, -0.03552364324444942, -0.03387870195641989, -0.03199458256362983, -0.02981297347823934, -0.02745685828926969, -0.02448110903344241, -0.021046924995388735, -0.017077314928372354, -0.012457701036658242, -0.007045735596636964, -0.0006313016433268537, 0.006179995661394231, 0.015808526698173155, 0.02497822718293414]], [[0.17221343574863002, 0.17140652742165327, 0.1696185838950538, 0.16658843000904558, 0.16192633982636884, 0.15514148864348576, 0.1457177272525287, 0.13325228068839828, 0.11754540536722227, 0.09968251936272078, 0.08224511178451654, 0.06700693614633887, 0.05470760768150624, 0.04554426316194303, 0.039537380952810584, 0.03682116088177611, 0.037904449155735716, 0.04500154794971885, 0.157801982681343, 1.5123639258779809, 0.4483224895343315, -0.2734857328521284, -0.06591392276816643, 0.0035694316236353687, 0.011415527166720863, 0.012670066767813562, 0.013366534534202753, 0.013919853150085853, 0.014459533560972857, 0.015009496514966589, 0.015593414501232743, 0.0162125187518123, 0.01684964108869184, 0.017493093912913385, 0.018133674069740424, 0.018759649190694633, 0.019333956373453635, 0.01981845238525047, 0.02017990360510444, 0.020394501070856795, 0.020461473323770227, 0.02036826570013136, 0.02020326703035094, 0.02011074877635887, 0.020113043204842484, 0.01994120987363981, 0.01937329894795687, 0.01819263199514891, 0.016173378439724787, 0.01308932836593984, 0.008819649392863314, 0.003464647253415698, -0.002559598521119503, -0.00893118321209775, -0.01539882452689106, -0.022064578736187203, -0.029244727082846617, -0.03690743880650282, -0.045362677932982584, -0.05320610874488222, -0.0604377368671774, -0.06683210914469687, -0.07247025303188712, -0.07738239262968523, -0.08156681598468601, -0.08501861820300408, -0.08775303830140715, -0.08980840458394927, -0.0911895609036538, -0.09190142357437014, -0.09201391795801489, -0.09161085379411614, -0.0908203636747099, -0.08984333741557764, -0.08884490399983358, -0.08779883970652888, -0.08665713296862916, -0.08536965332772542, -0.08386148115015793, -0.08206983517973494, -0.08000001775880164, -0.07769071898464293, -0.07518051539305377, -0.07253167604903561, -0.06978826174318398, -0.06691439637416452, -0.0638639755748547, -0.06054475513410631, -0.05634603280047365, -0.05227968085636645, -0.060043266166173684, -0.056744834176730444, -0.05333333468005961, -0.04997834325790738, -0.04695535575725934, -0.04480584264041903, -0.04468610331302885, -0.04786964426991445, -0.0631294321665111, -0.10882813191536284], [0.7002516780032441, 0.6968532886497562, 0.689437562803477, 0.6769183838441757, 0.6576737892710234, 0.6296530663978767, 0.5906781347153369, 0.5389944484680245, 0.47364861762089777, 0.39904117270173195, 0.3257541048730625, 0.26093346124271677, 0.20743448793935806, 0.16579499198761372, 0.13562192919088142, 0.11653640923181821, 0.10887283319586756, 0.11619441770868061, 0.3179718615003423, 1.2719297194545867, 0.425593268399764, -0.1826177732807703, -0.011979190106467592, 0.04650855551074247, 0.062147277165859244, 0.06528760907096012, 0.06686333301117343, 0.06820458749959839, 0.06967964016707225, 0.07133220446879542, 0.07323193886097053, 0.0753634016957006, 0.0776399878235312, 0.08000208838059829, 0.08240437376741372, 0.0847950452594102, 0.0870288745779681, 0.08895568613413024, 0.09044115050575396, 0.09138993292892099, 0.09180075965512306, 0.09162609589349142, 0.09122687810166223, 0.09119143097297538, 0.09161454958225451, 0.09140654103003158, 0.08966458146579374, 0.0855035344778505, 0.07799153020937284, 0.06618579548376684, 0.04944786236496799, 0.028247356495217247, 0.004242245522353853, -0.021275973903997738, -0.047274339811241003, -0.07414878401547156, -0.10317154699870006, -0.13412329242608367, -0.1671713401771277, -0.1987569011966086, -0.22803897760983882, -0.2543594168548073, -0.2776955796809878, -0.29814109977750214, -0.3156281203597932, -0.3301307691184319, -0.3417063393878718, -0.35050470594360117, -0.35653964880259786, -0.3598286208756445, -0.3606552864157779, -0.3593662748275867, -0.35650418469837347, -0.3529131724117505, -0.34926098538190237, -0.3454152074696682, -0.34116429981293955, -0.33629319431633475, -0.330488513164563, -0.32349027267442987, -0.3151274039678267, -0.3057307935191026, -0.29545553506510924, -0.28456344605723777, -0.27324061418048706, -0.2613225605133359, -0.24858311493056442, -0.23471247631238878, -0.21844325854025268, -0.20141114746619262, -0.19010013191331956, -0.16893601427201968, -0.14508839648756025, -0.11936706624818956, -0.08962895297745246, -0.05553126029645399, -0.015961474652991515, 0.03197400504774634, 0.0792682491941608, 0.08339272937574509], [8.899830913915208, 8.856288015747824, 8.761602299846006, 8.601897588823094, 8.356448082212593, 7.999025933353718, 7.501711522941073, 6.841856024788673, 6.006919845407909, 5.052792574769223, 4.11422064633073, 3.281827983766687, 2.591447930555843, 2.049126386462739, 1.6484426704804078, 1.381814642786811, 1.2483016484536904, 1.276910273107695, 1.6193642532326413, 4.87228381701802, 2.916214027099798, -0.5619545698512742, 0.5500643113225628, 0.7762572335868672, 0.8369278236729333, 0.870972216215086, 0.8872397200936848, 0.9015673860695688, 0.918161869948246, 0.937418498205859, 0.9601430018817252, 0.9860779379543673, 1.0140723404611733, 1.043332449722452, 1.0732584872205724, 1.1031798714526602, 1.1312672144219287, 1.155626591196879, 1.174553153124923, 1.186839664787156, 1.1924755126943811, 1.1908670721259043, 1.1866062374911956, 1.1871753643521477, 1.19379118164615, 1.1926158415808068, 1.1721739255940604, 1.1212036006676678, 1.0278205916413081, 0.8799740369330568, 0.6691090466110621, 0.40137913536484626, 0.09775479408917685, -0.22540188245588025, -0.5549289708997948, -0.8958015587345239, -1.2641478071096641, -1.6569110344074693, -2.072946995528395, -2.4734633937744364, -2.8452549586791496, -3.180730684086835, -3.4785491946978873, -3.7398129600524554, -3.9634773348606753, -4.149195756695234, -4.297682415487762, -4.410824261002943, -4.488778727311779, -4.531760037959838, -4.54363694562103, -4.528732107214827, -4.493967843762383, -4.450113069798229, -4.405568270749408, -4.358513429661633, -4.306156998439693, -4.245672042478478, -4.172999253757869, -4.0848121326220195, -3.9812874750296023, -3.8643614895796508, -3.736061351547672, -3.5997691646482113, -3.4579220170614455, -3.3084545060974344, -3.14845196223953, -2.974256029634733, -2.773498686325058, -2.559668153453118, -2.3991427530931526, -2.1322377391454888, -1.832607853347056, -1.4946474971571382, -1.10944328788719, -0.6662594661769481, -0.17244856204947942, 0.4268979712949707, 1.0399388729019314, 1.2272425947467718], [-1143.3860186956738, -1137.7460224592228, -1125.524505870173, -1104.929315797149, -1073.2831694405136, -1027.19500899489, -963.0468847328176, -877.8833400778572, -770.0381291262815, -646.6864637996661, -525.1729233082334, -417.11424751895396, -327.054503486934, -255.6672054461668, -201.9410907303401, -164.54027850082227, -142.6651519307496, -137.9133964049198, -160.4650797314388, -401.47050193445887, -201.92394946534367, -36.82630862496551, -88.32515587013411, -107.38264469907107, -113.67740460290577, -117.28390411079391, -118.88227132264431, -120.36743763522097, -122.21788275763447, -124.46344034974658, -127.19721709351332, -130.378137298617, -133.8517608775822, -137.51138252098409, -141.27685268816072, -145.0604184299391, -148.62919605958976, -151.74179368180384, -154.17949949895032, -155.7877945193663, -156.56604424207092, -156.43935937765787, -155.99827249184037, -156.2047239936672, -157.2165909050545, -157.2576002528584, -154.85334211629646, -148.55538029035995, -136.83158688541067, -118.12476931635052, -91.27828118678516, -57.106849705658405, -18.291351593819822, 23.07294866739401, 65.2907189996625, 108.99366935252132, 156.24842265937164, 206.62709834806762, 259.5549842601393, 310.91949878437686, 358.7898436589299, 402.22612730274994, 440.8971255070165, 474.9224654709284, 504.112982243489, 528.4179817785349, 547.9256362621646, 562.8749624463491, 573.2832879750368, 579.177077334973, 581.0197931950612, 579.384435435529, 575.1774779149471, 569.7987961125443, 564.3322684636572, 558.5387644192655, 552.057289215664, 544.5242970953547, 535.4182009680497, 524.3109461829824, 511.22326247592133, 496.40262667791325, 480.1095423209202, 462.78127395833206, 444.7373958738788, 425.7136591702767, 405.32872195490927, 383.1476967655334, 358.0693817655509, 330.83803916023675, 303.90884045329545, 269.79322696376136, 231.5521236733985, 188.49334796915917, 139.5599167600483, 83.4911050705235, 18.464321111236412, -57.58756838986786, -137.90731596510733, -179.60485537262298], [-23.130926122652024, -23.016542314959302, -22.76894426109806, -22.351817628691062, -21.710909774325952, -20.7774852607903, -19.478159222051943, -17.75285798969572, -15.567529489547198, -13.067298097023917, -10.603255369086346, -8.410248770666511, -6.5798353956239515, -5.124998663980646, -4.02412146029979, -3.247928776219372, -2.7760230379488138, -2.6274865704233683, -2.950351766263139, -6.725150220570605, -3.349974252204545, -1.2229714899825161, -1.8966621672342732, -2.21997587100001, -2.3379933069859256, -2.40618191043529, -2.435460226502512, -2.4632943273009436, -2.498978625066502, -2.5429863442169887, -2.5971363265899576, -2.6605478440289145, -2.7300556707428076, -2.8034717294089946, -2.8791553357183273, -2.955321270712001, -3.027271577421281, -3.09013482682779, -3.1394883938479214, -3.1722099224797415, -3.1882911104628406, -3.186225485585524, -3.1779633647534093, -3.1829691064774033, -3.2044462986142985, -3.206470000444894, -3.15921179194686, -3.033359588349615, -2.7978850413982186, -2.421229960162597, -1.879637101875588, -1.18973885757865, -0.40568743002383056, 0.43017197281376485, 1.2870534919878995, 2.1752031403402636, 3.136154080884036, 4.160213993561512, 5.223790137011966, 6.265958885231151, 7.236370478759697, 8.117430250959854, 8.901844054705194, 9.592089951212628, 10.18438136057249, 10.677725426280787, 11.073922701683385, 11.377814757173883, 11.589756412386263, 11.710287521144044, 11.748796528980144, 11.7168854491683, 11.632933429018571, 11.525327173268572, 11.416001284601558, 11.300071468540441, 11.170210751333393, 11.019055705428388, 10.836049410375644, 10.612525137470321, 10.348887575715604, 10.050133376489589, 9.721531502260234, 9.371943860633614, 9.003288742531035, 8.613870168673671, 8.19625666910067, 7.74281231729249, 7.244789907783037, 6.691597265911116, 6.11771219176754, 5.428692868368288, 4.656631891012379, 3.787629054467005, 2.800665263532628, 1.6710941671296289, 0.36398149418459536, -1.1879978606738122, -2.817051945527598, -3.7702367172467457], [-12.362818400759963, -12.301587340324197, -12.169133907375262, -11.946029351639924, -11.603246642839316, -11.104003633394733, -10.40901319464915, -9.486071943327662, -8.316864288378328, -6.9789444183179965, -5.6600305453108755, -4.485587527683186, -3.5044252899052073, -2.723266884490864, -2.1301681703846658, -1.7087246654295483, -1.4466126293064887, -1.3495716511281592, -1.477213941817905, -3.1237321522552617, -1.5867678667804266, -0.7887697476044205, -1.0507122022634503, -1.2025480004778295, -1.2624833822115755, -1.2973210177184635, -1.3119397576153016, -1.3260715182098584, -1.3445541067733975, -1.3675965535868164, -1.3961491762542828, -1.4297244904594872, -1.4666170065349684, -1.5056473542980977, -1.5459321532082964, -1.5865139001661872, -1.6248861602400348, -1.6584493281627593, -1.6848402968414933, -1.7023914668294902, -1.7110999279377905, -1.7101633947680575, -1.7059702248845858, -1.7089249465904157, -1.7207430546949691, -1.7222268669106242, -1.697433671515073, -1.6306936519246091, -1.5054118954266158, -1.3034374717676223, -1.0126877657236766, -0.6421843936700679, -0.2209045904111744, 0.22847096410134554, 0.6874834422289703, 1.162864858368203, 1.676949263794584, 2.2246135448896105, 2.793293377391959, 3.350475305147576, 3.8692831234033407, 4.3405908934782005, 4.760238365980254, 5.129541719241374, 5.446475860377934, 5.710512467844791, 5.9226141087520325, 6.0853672254965465, 6.198961316228415, 6.263684806006504, 6.284549539211842, 6.267758154216622, 6.223146859790391, 6.165909582440958, 6.107773735843641, 6.046114766347406, 5.977008176786171, 5.89651516160371, 5.798991475162573, 5.677546573097299, 5.53412160291941, 5.371607932309622, 5.192933983304236, 5.002908655957911, 4.805118974983465, 4.596738100481844, 4.373541721423098, 4.131345448454746, 3.865422799423603, 3.570086895642204, 3.2565289559298067, 2.8886619854023414, 2.476531539496653, 2.0127289361647627, 1.4861116991611723, 0.8837169335389244, 0.1872979806785372, -0.6371167870674573, -1.5149042121815206, -2.0612738920749885], [-9.742322137613902, -9.694024808166349, -9.589590943064263, -9.413700737588718, -9.14346555990439, -8.749878682794725, -8.201949979640737, -7.474257136201184, -6.55231249746414, -5.497226410538348, -4.456960007518612, -3.5303583291990948, -2.755826691495109, -2.138561558942147, -1.6689672119736587, -1.3337604987088916, -1.122562232619835, -1.0378013714777479, -1.1172942346934343, -2.2404728630051007, -1.1674909207184874, -0.6775325208499658, -0.8453756754137385, -0.9551782387609755, -1.0009341437702601, -1.0276326672076328, -1.0386692135539923, -1.0494557929333561, -1.063743815360682, -1.0816773917573888, -1.1039951672958932, -1.1303051174123184, -1.15925679341605, -1.1899161600183066, -1.2215840395716326, -1.253504311740966, -1.2837039282006903, -1.3101362058083403, -1.330939245351718, -1.344799490086898, -1.3517153637969948, -1.3510559910704911, -1.3478562046580076, -1.3503157779397643, -1.3597881142100652, -1.3604877535154878, -1.340234198188795, -1.2866927979524088, -1.1867752758840324, -1.027149342294544, -0.7976538028270184, -0.5053778564184864, -0.173132410497355, 0.18121045871598737, 0.5431088629281946, 0.917869008657846, 1.3230871946672522, 1.7547274472098067, 2.202897828291273, 2.6419938474707, 3.0508529273228424, 3.422409697060457, 3.7532601658264357, 4.044435877224957, 4.294339196381561, 4.5025540617551645, 4.669838535174262, 4.798229852481108, 4.8878770681026245, 4.939007204021271, 4.955569313466096, 4.942452110750437, 4.9074127790240345, 4.862434449430261, 4.816757704676779, 4.766626567166752, 4.710273119914241, 4.6447558503628885, 4.5656994366285, 4.469464725617463, 4.3562255111454355, 4.228101539257886, 4.087332891414106, 3.9376888327159945, 3.781973165015556, 3.617942673366854, 3.4422595236722136, 3.2516204747866144, 3.0422974697234464, 2.8098073479648322, 2.55988124643655, 2.2701890136374656, 1.9456736374400523, 1.5805070037484528, 1.1659521599906064, 0.691893102604601, 0.1441496404761809, -0.5030331575526998, -1.1981775517050546, -1.646070193375172]], [[0.017951318387726355, 0.017919730298589072, 0.01783945235181758, 0.017681869186090684, 0.01740228078060317, 0.016940148461362606, 0.01622365191221476, 0.01518094335086031, 0.013747759293765878, 0.011985258212447518, 0.010146146256622074, 0.008437955154668431, 0.006959747105575421, 0.005708070051786524, 0.0047101870834513355, 0.003995994116243328, 0.0034852233103597947, 0.00318002321157441, 0.003063536083359406, 0.0031306172662032205, 0.2865567424514648, 0.29230766821902643, 0.299045076586497, 0.3068448147074233, 0.31567058048577484, -0.3130846903402834, -0.11811414188448115, 0.0005389875542174467, 0.0007636084287132493, 0.0008464664433869626, 0.0008943134727515815, 0.000929315121194304, 0.0009602946716668893, 0.0009866117393403824, 0.001008432072565286, 0.0010247009457322706, 0.0010263659068245926, 0.0010199956087259487, 0.001002446567301783, 0.000968970673717796, 0.00091856808228319, 0.000848808497310963, 0.0007660629445020122, 0.0006818412652859647, 0.0005955443446254458, 0.0004210728713309205, 0.00026336479894910315, 4.879645529405635e-05, -0.00023940909960602232, -0.0006217236062065017, -0.001090675724530283, -0.0016321464208096017, -0.002209372554676716, -0.002793817082844265, -0.003365674579914162, -0.00393509966440375, -0.004531682009987763, -0.005151799246148079, -0.005782176365631228, -0.006382533311325852, -0.006908957924931799, -0.007357732565494659, -0.007759109275693192, -0.008100903793734484, -0.008379443305496477, -0.008591655661585089, -0.008711337191087623, -0.008794220205681727, -0.008838221289367211, -0.008831438501272245, -0.008778121946546796, -0.00868514642330195, -0.008563850591066052, -0.008429878736522158, -0.008292480236280443, -0.007993098016714988, -0.00785017012459435, -0.007699561087895227, -0.007530984349454631, -0.007328178269715134, -0.007108041765500117, -0.00687630152569741, -0.006630910206931606, -0.006376282478251347, -0.006115310067889973, -0.005844111981546465, -0.005558761631347598, -0.005255204565990888, -0.004928730019245314, -0.0045736567680294505, -0.0052222025091811335, -0.0049352295017333495, -0.004646572447873684, -0.0043732889806115515, -0.004143418478797808, -0.004010877215142527, -0.004088361426696422, -0.004505842751455435, -0.005664017919255468, 0.0005871908372345363], [0.06623695090958527, 0.06611275989384964, 0.06580726837850982, 0.06521340784516075, 0.06416402379642713, 0.06243265479386674, 0.05975017023250511, 0.05584582886805798, 0.0504764256018307, 0.043869540778992834, 0.03696558294013582, 0.030530191926718634, 0.024922413257001345, 0.020196423607484335, 0.016387348689586804, 0.01350566235431391, 0.011375025462796031, 0.009961321432235996, 0.009162551162500374, 0.008895973678847266, 0.3085332877761202, 0.3144417412227898, 0.3214522866268089, 0.3295920267683493, 0.33869553536561564, -0.3309200976667878, -0.1913236960329454, 0.003919434214985715, 0.004232655667821534, 0.004328653097838234, 0.004384226716037387, 0.004432800857794038, 0.004483406484349829, 0.0045315291253002965, 0.004574640253666053, 0.0046080129430202165, 0.0046097335180418034, 0.004583177325954444, 0.00451634617389992, 0.00439651363079476, 0.004220817504312026, 0.003980740704413757, 0.0036999163280747806, 0.0034209215452519074, 0.0031441142350858682, 0.002679655846757105, 0.0021643930678240564, 0.0014440641891952267, 0.0004584619957903603, -0.000856546874991057, -0.002508106665399298, -0.0044402947861856635, -0.0065144574063692754, -0.008625802080686737, -0.010700500478217884, -0.012774793718018904, -0.014956320999261296, -0.01723069397062144, -0.01954959447925767, -0.02176895145995533, -0.023752642194996072, -0.025479784135899925, -0.026993997621177556, -0.028284089183486762, -0.029342395242150418, -0.03016544826407026, -0.030714849794675623, -0.031090556682617197, -0.03128979763685535, -0.031294081912516675, -0.031123512298915416, -0.030805044947417995, -0.030381999911309944, -0.029914114797829156, -0.02943203899131093, -0.028678277570697987, -0.028166689591355612, -0.02761688141631093, -0.026998081161871884, -0.026274424584058167, -0.025474375419027487, -0.024613485277239194, -0.02369504577979769, -0.022737806512234095, -0.021752916644731977, -0.020724542836427898, -0.019636104204266296, -0.018470529798436143, -0.017208077149080916, -0.015825117329452656, -0.014774257831033236, -0.013157325382902844, -0.011318983325194628, -0.0092704431245656, -0.006964862286645095, -0.004347510329159628, -0.0013445099020060868, 0.0022236609406944565, 0.00592860280366274, 0.005791575149767544], [0.11199223909630948, 0.11177920869268168, 0.11125898193615316, 0.11024993683778721, 0.10846856487968563, 0.10553073679939626, 0.10097976284624205, 0.09435562716375898, 0.08524469237593357, 0.07403251302039539, 0.06231229872010842, 0.05137853443327194, 0.041835701422799645, 0.033802128513519436, 0.02731105461089601, 0.02234031050203757, 0.018639611096493442, 0.016134478698681762, 0.014636558631317841, 0.01398048666795328, 0.32464989111760245, 0.33062662710456275, 0.33780588466048284, 0.3461750116408674, 0.3554922954580599, -0.34126591256078154, -0.22582605653750723, 0.007398087926684158, 0.007721733343145803, 0.0078002692777099075, 0.007845911293538734, 0.007895854935901399, 0.007955972758150787, 0.008017772360789311, 0.008075724285592754, 0.00812150272637941, 0.008122645213779334, 0.008076525804811134, 0.007962698663595193, 0.007761560740348996, 0.007468603044508257, 0.00706960487565349, 0.006604574665717597, 0.006145544280528918, 0.005694144765923262, 0.004980468988173969, 0.004135894387021085, 0.0029464900532375727, 0.0013111363597016498, -0.0008740472729761986, -0.003635005435833517, -0.006875656969445128, -0.010360368245179162, -0.013912159333728842, -0.017405903020152318, -0.020902384829285824, -0.024582983615072544, -0.02842296339309911, -0.03234089396900528, -0.0360950018938639, -0.03946548063538044, -0.04241416033787866, -0.044987630283186114, -0.04718045135972968, -0.048982018162504734, -0.05038971917002661, -0.0513632066911617, -0.05202810614473471, -0.05238112129192533, -0.05240086672279258, -0.052123038884703946, -0.051594068929628784, -0.050888206843114014, -0.05010722290818912, -0.04932131620225384, -0.04820497851027131, -0.04736388850945086, -0.04645463060069247, -0.04542861368646125, -0.044235027596935844, -0.04290856706811805, -0.04147338420036274, -0.03993934502367263, -0.03833904824682403, -0.03669185310229058, -0.03497107522483989, -0.03314851348283148, -0.031195282158436564, -0.02907813379028439, -0.026757368586164006, -0.024824808531992933, -0.02197683946736957, -0.018809723638479832, -0.015273982257146927, -0.01143628273599143, -0.0070192586943043185, -0.0019607445851338415, 0.003997295091926176, 0.010254435286232802, 0.011239713285145734], [0.24571137004775861, 0.24523715945600316, 0.24408749043630731, 0.24186255887901098, 0.23793836331827095, 0.23146936713549138, 0.22144990501148215, 0.20686566607987156, 0.1868036934602187, 0.16211160757998536, 0.13629203539612011, 0.11218498077964628, 0.09111089433935059, 0.07338915573651152, 0.05903421537210321, 0.047908262861928536, 0.03956920411403216, 0.03381608200802198, 0.030200099920553388, 0.028301501142726483, 0.3601443440838071, 0.366104309439538, 0.37353035443828014, 0.38230074841245265, 0.39201402099456134, -0.35684080014627567, -0.27708313183816796, 0.01795585356963608, 0.018205425110421246, 0.018190405725383618, 0.018182494955441678, 0.018220103910430618, 0.01829510488064723, 0.018386943787816596, 0.01848068432599579, 0.018557313679133585, 0.01855586996701793, 0.018451958749623264, 0.018200365116390508, 0.017762361046562355, 0.017128792494917236, 0.016268861334926138, 0.015270458054582292, 0.014291717325014395, 0.013338511778122343, 0.01193285759148764, 0.010139387834930689, 0.007593591811709921, 0.0040751279695474445, -0.0006337327965508031, -0.0066209168505216125, -0.01368075092464354, -0.02129542199953396, -0.029073218478874535, -0.036736698379593084, -0.04441722943221882, -0.05251139041894268, -0.060963805105252525, -0.06959604276552803, -0.07788133567852067, -0.08535724240048966, -0.09193253848711554, -0.09764842979603824, -0.10252295544556814, -0.10653796162820421, -0.10969442407134943, -0.11195303052295212, -0.11349760547436027, -0.11432665492103497, -0.11441669156709054, -0.113850337862849, -0.11273089637728487, -0.11122237532906609, -0.10954996426229636, -0.10787375562474628, -0.10576380787887511, -0.10395951764810903, -0.10199899652520221, -0.09978293612175845, -0.09722162087619214, -0.09436097355309314, -0.09123612964634846, -0.08787801461036343, -0.08436721750418501, -0.08075055609410778, -0.07697052839372716, -0.07296451868585292, -0.06866897499070825, -0.06401127471173639, -0.05890481668574858, -0.05383339811617503, -0.04762369922154342, -0.040734576345672346, -0.03304802519972477, -0.024380572925668302, -0.014650730290622123, -0.003594896171367762, 0.009309117025761288, 0.02302102284858668, 0.02790339944373114], [0.34319483511298143, 0.34252955505486127, 0.3409202042846989, 0.33780779119200205, 0.33231989606502804, 0.32327434010576717, 0.30926488642834665, 0.28887264325909234, 0.2608201118275138, 0.2262919331490918, 0.19018342494108048, 0.15646129018828783, 0.12696736938856126, 0.10217343627279599, 0.08207454515016643, 0.06643989084340705, 0.05469797850205105, 0.04655198557428965, 0.04135978470195941, 0.03851061286536975, 0.37680736826253863, 0.38257510157287516, 0.3899735758648565, 0.3988028306696559, 0.4085700493863112, -0.3573011240557513, -0.29316501634161746, 0.025820699193752412, 0.02597138935052768, 0.025869909962414835, 0.02581242799951881, 0.02583403092432213, 0.02591433679798526, 0.02602381109033618, 0.02614038641042401, 0.02623718623393037, 0.0262334721466108, 0.0260871641612479, 0.02573495554003072, 0.025124593073742544, 0.02424360838732316, 0.02304915732751646, 0.021664048095974792, 0.020309195142373882, 0.018992013917962715, 0.01726142939082309, 0.014782849426940628, 0.011247665527924493, 0.00635267365417913, -0.00018412081208447022, -0.00852208653330777, -0.018367115092556712, -0.028984640890093942, -0.03983109878916807, -0.05052012134594949, -0.061235299426240175, -0.07253011522093247, -0.0843268868760986, -0.09637671275379962, -0.10794563371305389, -0.11839865552479786, -0.12760587786219263, -0.13559876422868344, -0.1424154677585874, -0.14803293267354015, -0.15245560537977257, -0.1556509332403457, -0.15783507839906336, -0.1590078045181114, -0.15914602389773747, -0.15836676162470903, -0.1568147593086768, -0.15471945025442363, -0.15239613395233892, -0.15006613716172237, -0.1476733658441924, -0.14513374203875148, -0.14236001874669493, -0.13922861269107986, -0.13565628438342, -0.13165005420159898, -0.12726818472826423, -0.12257281672648274, -0.11767050722963208, -0.11262420988371, -0.10735236187540252, -0.10176672297067456, -0.09577809744858627, -0.08928479535232751, -0.08216572402290312, -0.07485341451285342, -0.06619395099087406, -0.05659083117343312, -0.04588173072998314, -0.03381808976931701, -0.020111195125373748, -0.004712132934025208, 0.013239030603394231, 0.03238375103774267, 0.04037197495434741], [0.4492646152169146, 0.44839130077807954, 0.4462816148642209, 0.44220333084441615, 0.4350136907466171, 0.4231641674795479, 0.40481259709656364, 0.37809977148802143, 0.3413514332282937, 0.29611896262998655, 0.24881317746447304, 0.20462671715627986, 0.16596862101383975, 0.13347766752350462, 0.10712664427728927, 0.08658178805279625, 0.07113293295461005, 0.06037820082847658, 0.053464398583262525, 0.04957180126209171, 0.39705398348240056, 0.40265812548395336, 0.4100803761706147, 0.41903758094510707, 0.4289447274509581, -0.35992419277886106, -0.3063208139004451, 0.03441255146061106, 0.034446498080442554, 0.034247220134546494, 0.03413365325028022, 0.03413640996416596, 0.03422135713810178, 0.03434915059968864, 0.03448990802584111, 0.034608181724550435, 0.03460191877413572, 0.03440942556441971, 0.03394770291850613, 0.03314323193099739, 0.031980383144136204, 0.030404461831673602, 0.028576679558081557, 0.02678696754996943, 0.025051502672644995, 0.022779923768275586, 0.019531929331223215, 0.014902660130291939, 0.008494646806375348, -6.18624013005399e-05, -0.01098041265227042, -0.023872510708823198, -0.037776719684660565, -0.051981531999954506, -0.06598092419585369, -0.08001480115049417, -0.09480707602400336, -0.11025582412739089, -0.1260356228303334, -0.14118734725419413, -0.15488894707688494, -0.1669685175203354, -0.17744594245684767, -0.18638203057075522, -0.19374853768667183, -0.19955377556787585, -0.20377364767062878, -0.2066577051650968, -0.208207376457313, -0.20837370657749116, -0.20731835148199856, -0.20524054957437965, -0.20244598269999883, -0.19935312560408533, -0.19627138823170076, -0.19312424487914, -0.18979324655160187, -0.18616096789918835, -0.18206396742921097, -0.1773919900096886, -0.172153639530474, -0.16642481009489796, -0.16028655672111308, -0.1538781597613027, -0.14728188789683314, -0.14039093269872685, -0.13308984287140774, -0.1252617855769216, -0.11677360373517173, -0.10746677521156218, -0.09771821200597765, -0.08639504001628404, -0.0738411059146931, -0.059845909733106634, -0.04409019923933052, -0.02621032257605617, -0.005913461983146283, 0.017526055121874766, 0.042581775099985404, 0.054003464783347596], [0.5398534647606731, 0.5388023243680096, 0.5362651399452083, 0.5313617036024897, 0.5227183302475578, 0.508473550860835, 0.4864128147998062, 0.45430074810974935, 0.410124118878275, 0.3557475596865593, 0.2988763614953457, 0.24575017193392557, 0.19926231539754566, 0.16019555250447437, 0.12850233134915232, 0.1037589405492279, 0.08513920313832149, 0.07215066889473519, 0.06375908014747025, 0.05896496004210252, 0.4117252702807868, 0.41713799000191876, 0.4245207964638629, 0.43351958241614713, 0.4434762644078785, -0.359111856690393, -0.31261520136089993, 0.04178942243462124, 0.04171324844583286, 0.04142620867833603, 0.041262298608772244, 0.04124733194940047, 0.041334956100776324, 0.041477405503947705, 0.041638060060268954, 0.04177413500326765, 0.04178177388346506, 0.04155193955538215, 0.0409857012353611, 0.040011103341781276, 0.038610083692056846, 0.03671556467082802, 0.034520676716852036, 0.032373382646128046, 0.030292909259867825, 0.027569824693108112, 0.023674831931488918, 0.018121282050580154, 0.010431288744743483, 0.00016036856481021938, -0.012951774931347766, -0.028436108434018316, -0.04513772421723802, -0.062201897574295395, -0.07902051965702875, -0.09588160203794434, -0.11365459924145983, -0.13221680089367863, -0.15117737806423368, -0.16938492644629158, -0.18585815165443845, -0.20038908567193878, -0.21298628608623607, -0.22373054570098533, -0.2325893095144504, -0.23957438530576974, -0.24474879051302617, -0.2482366541344361, -0.25005572595067094, -0.2502257455234032, -0.24894221612569153, -0.2464376011030513, -0.2430763249297027, -0.23935969085446784, -0.23565852532602638, -0.23188026959030522, -0.22788189887681595, -0.22352209453940497, -0.21860436248689216, -0.21299651949984866, -0.20670880809872885, -0.19983226073623517, -0.19246413225318995, -0.18477168823134563, -0.1768537314243515, -0.16858191656655172, -0.15981752345070815, -0.15042015950831694, -0.14022982621128136, -0.12905606023395647, -0.11722004027327473, -0.10362284559520353, -0.08854978683087888, -0.07174908874137505, -0.052840787728520903, -0.03139748514026547, -0.006830504991924092, 0.02120190690179244, 0.05130542982586308, 0.06572084017111307]], [[0.01963464464201471, 0.019686443658144658, 0.01976250078232937, 0.01982789509913313, 0.019834260193552902, 0.019708325942217927, 0.019361133519284167, 0.018670560701839208, 0.017460983136400963, 0.01574584134790315, 0.013813881103138002, 0.011847285439263224, 0.010026720660241082, 0.008411906841021307, 0.00702847486852373, 0.005874448274148445, 0.0049360106071073126, 0.004197444239452488, 0.0036215156613844893, 0.0031700046288335166, 0.059200114031948366, 0.05986028057646998, 0.06078761231957429, 0.06199153213081852, 0.0634890117098078, 0.06530543427376827, 0.0674406064980195, 0.06979092351075834, 0.07234110741939412, 0.07510725609515229, 0.07810673197681202, 0.08135342937771826, 0.08485208423969517, 0.0885508150930181, 0.08671342444829817, -0.02315200565603917, -0.007906754771409357, -0.0004299085835313291, -0.0003143293729687052, -0.00037917111282327387, -0.0004806424346820704, -0.0006137481126474328, -0.000771442470110753, -0.0009435783869150403, -0.0011302515941189052, -0.0013514951053786044, -0.0016193871208424434, -0.0019429756896600947, -0.0023287998337335773, -0.002780173673265879, -0.0032919539483098723, -0.003844136685970956, -0.00439877633373479, -0.00492948071015156, -0.005421615327191084, -0.005885584402238701, -0.0063490913575367245, -0.006813125265737198, -0.007271173164742204, -0.0076936066951282175, -0.0080553066763706, -0.008343838540821095, -0.008569985787031453, -0.00874140945400914, -0.008859893573922771, -0.008928028413640064, -0.008949406169581928, -0.008928798783827524, -0.008866622206603005, -0.008763424520622584, -0.008625213714696796, -0.008458864630495149, -0.008275131558679689, -0.008086317088060225, -0.007901060350752326, -0.007717099695227885, -0.007530302002127742, -0.007336663510891952, -0.00713082428003765, -0.006910405384542464, -0.006675582945152886, -0.006428687304454896, -0.006172334412130496, -0.005911224901328654, -0.005647228951892265, -0.00537577256316895, -0.005093640602347166, -0.004797547317047354, -0.004483788622319425, -0.004148083953330279, -0.004744559865171573, -0.004502193970236776, -0.0028358457923338696, -0.0023429301858047887, -0.0017958704418344772, -0.0011822337341539457, -0.00048664622530297704, 0.000337501525889573, 0.0012878199396725266, 0.0005100094260723315], [0.09118166848151657, 0.09140799925550339, 0.09176445133397054, 0.09209470649064087, 0.09215980836918156, 0.09160459753968259, 0.08997577686537042, 0.08670277425691293, 0.08106534781092728, 0.07304632292246765, 0.06388990218875129, 0.0546680094420342, 0.04613325589092015, 0.03857760662566647, 0.032101983662386785, 0.02668823207762434, 0.02226860214531952, 0.018766623196271873, 0.016011369395618584, 0.013829353348808273, 0.06920243954407189, 0.06877352190464699, 0.0688356827342654, 0.06934007543969431, 0.07025475772107852, 0.07156456670430918, 0.0732413624489918, 0.07517700827849812, 0.07735319725101332, 0.0797794463957152, 0.08246703151502088, 0.085412069672243, 0.08858764637617428, 0.09185047533184675, 0.08325536437608319, -0.020488974536190672, -0.0066766924149507575, -0.00011785781171148617, -0.00014127255186937145, -0.0005778590731586783, -0.0011320070892837247, -0.001801689590483237, -0.0025641442872618475, -0.0033790123126538393, -0.004250742461256832, -0.005274165525724129, -0.006506768778342682, -0.007991926819652571, -0.0097617658200205, -0.011833616778181151, -0.014191316061901762, -0.0167385056300561, -0.019300865320579924, -0.02175734182007724, -0.02404009875494096, -0.026196380602867, -0.02835255183878841, -0.03051105293569938, -0.032640676170998716, -0.03460393308132695, -0.03628489541556307, -0.0376489124842942, -0.038722787167352155, -0.03953176338400978, -0.04009285711409375, -0.04041805861893725, -0.04052413430873185, -0.040433426443743245, -0.04014820496321436, -0.0396714276645745, -0.03903095220856228, -0.03825881630791958, -0.037405258604762244, -0.036526235542906224, -0.03565977548694089, -0.03479482264913849, -0.03391211378643541, -0.03299259239011753, -0.03201097546229228, -0.03095677184169797, -0.029832636796372956, -0.028648808563863835, -0.027417490740782834, -0.026160551831911058, -0.02488535025715008, -0.023568830255238114, -0.02219483332187159, -0.020746272842033512, -0.019203388774030144, -0.017543212922349727, -0.016346023692271186, -0.01443094939180753, -0.012341613288079737, -0.01004854236857039, -0.007504751502432485, -0.004659907663659637, -0.001452860101119185, 0.0022469078901103854, 0.0062537782351419335, 0.005308301108328723], [0.17394903387949526, 0.1743743849074241, 0.1750558634061056, 0.17569790189980622, 0.17583815670903546, 0.17479235176237135, 0.17167756968755657, 0.1654037618657, 0.15463998598761966, 0.1393175174612772, 0.12176625146495133, 0.104133173419765, 0.08781502311388055, 0.07337539800127581, 0.06099864859820062, 0.050646084779682216, 0.042186838312175394, 0.03547345263066312, 0.030180745384384703, 0.025979560485037193, 0.08051914536180871, 0.0788304516602296, 0.07789200831170366, 0.0775875700922059, 0.0778286504956197, 0.07855322279985166, 0.07970103728759927, 0.08115973042753678, 0.08290835374707804, 0.08494985636186284, 0.0872902858372795, 0.08990891512526272, 0.0927516716162494, 0.09561044781877003, 0.08235851411470892, -0.017987440521092433, -0.005199430443359697, 0.0006239476608772053, 0.0003261812598315292, -0.0005679087851878888, -0.0016625335122609454, -0.0029633909948068816, -0.00443155597413048, -0.00599309089565682, -0.007658291967210048, -0.009608882595829316, -0.011955163593166515, -0.014780494274401628, -0.01814695731565723, -0.022088492138168343, -0.026577751614334517, -0.0314293478145289, -0.03631158335865555, -0.040994346605655575, -0.04535007253070988, -0.049467811760647296, -0.05358691114029939, -0.057710479840365245, -0.06177806382120702, -0.06552702262931999, -0.06873612182531975, -0.0713493451803042, -0.07340715433663705, -0.07497561194040415, -0.07606986989300263, -0.07671333793166124, -0.07693833783017252, -0.07678775762175423, -0.07626623824103108, -0.07537967088559652, -0.0741811293868516, -0.07273151666148646, -0.0711263963943194, -0.06947204124282678, -0.06784054129320909, -0.06621091164772458, -0.06454678296763407, -0.06281213796630603, -0.060959068295746315, -0.05896796641238901, -0.0568417891017469, -0.054601250908323865, -0.05226942162403486, -0.049887566129777475, -0.047467206178819485, -0.04496534508778163, -0.04235502155720696, -0.039602844631604114, -0.036671711852054735, -0.03351825401661078, -0.030813205119062336, -0.027158077663393038, -0.02317080470610321, -0.018769740704683905, -0.013939943403508917, -0.008514953456870854, -0.0024072787383210194, 0.004593244548253422, 0.012053658997494679, 0.01145477968030203], [0.47437831994679713, 0.47552042562191604, 0.47738297715051753, 0.47916728461874813, 0.47959445190835753, 0.47677965439609904, 0.4682645731942002, 0.45107219246459546, 0.4216927295558214, 0.37983871990579166, 0.331742484701968, 0.2835430200456284, 0.23894080178490718, 0.1994912123896614, 0.16567423759542627, 0.1373730819896287, 0.11422634423600309, 0.09582752048970337, 0.081292295632485, 0.06972805777651811, 0.12093870685362174, 0.11467474892339033, 0.11010148017465195, 0.10685795678578444, 0.10465044111541576, 0.10324677602315542, 0.10247056786257137, 0.1021963883585608, 0.10239542924059822, 0.10304879270492874, 0.10414704129018873, 0.10561553308014225, 0.10732007679088397, 0.10889739928313782, 0.08492557481408262, -0.009972450404723351, 0.0002924134918120052, 0.004056376036475781, 0.002532630542491851, -8.425997601433464e-05, -0.003183022728648044, -0.006806101613434327, -0.010860341275709954, -0.015153451306313076, -0.01971950628019543, -0.02505681530407463, -0.031468229104666505, -0.03918295072579341, -0.04837236375708704, -0.059130811418543455, -0.0713922847068359, -0.0846457562375868, -0.09798808968565385, -0.11079263061145679, -0.12270652744938931, -0.13397235919296, -0.14524099866932025, -0.15651907641575288, -0.16764127578122082, -0.1778921411842971, -0.18666989573764536, -0.19385138108578834, -0.19951808239315774, -0.20384952438585238, -0.20688693346917963, -0.20869456616220033, -0.20936090113632144, -0.2089733826835728, -0.20757544281325124, -0.20518419687297623, -0.2019439706999157, -0.19801985014505197, -0.193670892623378, -0.18918406561741544, -0.18475344707244298, -0.18032268707017998, -0.1757944651944062, -0.1710720928948868, -0.16602634235273128, -0.16060548844405323, -0.15481930567275975, -0.1487246938798832, -0.1423842017807354, -0.1359101426415285, -0.12933907682383813, -0.12255137757845294, -0.1154645789521952, -0.10799078878748673, -0.10002777908221391, -0.0914561910023133, -0.08299232333221442, -0.07301983476715655, -0.06214238586634688, -0.05020269211849539, -0.03696041787016648, -0.022172134859194406, -0.005545205423230045, 0.013385486053202519, 0.033219838748405645, 0.03493813954402033], [0.7495328050724317, 0.751328673806182, 0.7542735509794267, 0.7571090591175411, 0.7578057295255386, 0.7533763695287414, 0.7399121895720451, 0.7127073027356882, 0.6662744380604272, 0.6001107267194149, 0.5240043018710789, 0.4477930859452375, 0.3772711266359877, 0.3149049230579801, 0.26144179726846134, 0.21669172025397704, 0.1800814730125042, 0.15096663916227943, 0.12795118555042295, 0.10962720544377917, 0.15744368437749, 0.14698474079787688, 0.13907692563846172, 0.13313506566308597, 0.128677327517207, 0.12531559438256415, 0.12276726645509232, 0.12089639633084673, 0.11966784816668598, 0.11904359578759573, 0.11899191283831226, 0.11940066251571264, 0.12007094420835562, 0.12053537712198549, 0.08966182984467579, -0.003127903017267196, 0.005318460449613627, 0.007453955610893249, 0.004693672380704282, 0.0004649269107021934, -0.004494300856171349, -0.010264213578028985, -0.016703867617356715, -0.023513610588735814, -0.03074972847233716, -0.039200864929723904, -0.049346484247655364, -0.06154945825775452, -0.07608133324146, -0.09309186093772034, -0.11248083376194543, -0.1334379142460405, -0.15453650489359352, -0.17478674059447902, -0.19363069845385517, -0.2114509643684816, -0.2292748317566002, -0.24711180707540514, -0.264700465647998, -0.28091078816134957, -0.2947344752348481, -0.3060460784718818, -0.3149615154323837, -0.3217651566714053, -0.3265229309062123, -0.3293373124474092, -0.3303489743318011, -0.329744302441477, -0.32754551447719854, -0.32377943394919456, -0.3186737518430089, -0.31248890304218707, -0.30563390732341134, -0.29856192305931795, -0.29157928773473424, -0.28459674412968905, -0.2774605754188235, -0.2700180600307898, -0.2620650245109347, -0.25351976393842907, -0.24439776599545845, -0.23478891562128384, -0.224791984051577, -0.21458441761715083, -0.20422400759930923, -0.19352183755769758, -0.1823477616900303, -0.1705630860698319, -0.15800659447087614, -0.1444900923996492, -0.13059386836963827, -0.114862507200827, -0.09767407778540645, -0.07880671152686647, -0.05775081459752436, -0.03451609335323233, -0.008259551919859848, 0.021573185246783942, 0.052663191619270217, 0.057008030742251345], [1.0706249699231971, 1.073182339200243, 1.077390560919422, 1.0814554042890492, 1.0824700958243496, 1.0761595547577876, 1.0569183778793458, 1.0180228264450135, 0.9516874475473471, 0.857150114916168, 0.7483388367082909, 0.6394304005691641, 0.5386533879132483, 0.4495389780024626, 0.37314466657700285, 0.30919407455710185, 0.25686644617077736, 0.21523938750001667, 0.182319911495685, 0.15609918390476718, 0.19954688628393535, 0.18418628556173622, 0.17237960978843286, 0.1632798564807935, 0.15618551158122182, 0.1505262383200636, 0.14589555521907416, 0.14213337512539137, 0.1392097595003104, 0.13706451237644954, 0.135661356442603, 0.1348273778043923, 0.13429254770156, 0.13348780022816906, 0.09608574599500487, 0.004735293490752071, 0.011269224011186043, 0.011612132915637525, 0.0073553339676704485, 0.0012342806333619251, -0.005902130644396427, -0.014180216939500168, -0.02340420282693445, -0.03314975344415231, -0.043499405107131704, -0.055580753945666826, -0.07007949414503162, -0.08751463333461111, -0.10827483068540522, -0.1325747903127762, -0.16027529936165158, -0.1902165263131141, -0.2203613108380637, -0.24929614953312193, -0.276223839283207, -0.3016902551888786, -0.327161749230159, -0.3525680260310121, -0.37761471666606417, -0.4006880761280281, -0.42043145942782173, -0.4366011083787621, -0.44934960104051497, -0.4590825504510868, -0.4658938421576101, -0.4699298114852594, -0.4713913310772793, -0.47054457016924767, -0.46742129694211737, -0.4620599390126747, -0.45478564983497516, -0.44597024502222804, -0.43619783433632037, -0.4261155852731195, -0.4161608784795993, -0.4062060940781963, -0.39603178547389223, -0.38541992094555716, -0.374078932656036, -0.36189218630208386, -0.34888188806947307, -0.3351764477598595, -0.3209169236247413, -0.3063567853556397, -0.29157861560475073, -0.2763126598086156, -0.260373146184353, -0.24356209208154989, -0.22564941636064145, -0.2063666431330883, -0.18632447556447573, -0.1635988846457161, -0.13905297449032644, -0.11210102357324121, -0.0822103407078783, -0.04884208677404349, -0.011350410458323709, 0.031192007991994, 0.07537671871282844, 0.08305122146699137], [1.3749932016412139, 1.378271610753313, 1.383677558725901, 1.3889091996370173, 1.390227343764639, 1.3821352648299337, 1.3574170575230284, 1.3074360366341733, 1.222233619762611, 1.1007974580930735, 0.9609743819376975, 0.8210667377901787, 0.6916059892579484, 0.5771333637445815, 0.47899935893611717, 0.39684523923887355, 0.3296154035502251, 0.27612376340954775, 0.23381158128998447, 0.20010061925030312, 0.23921678536753366, 0.21920695118648176, 0.2037010243172206, 0.1916037357360827, 0.18200525168815426, 0.17414558709864236, 0.16751677505262902, 0.16196166656036487, 0.15743181950407623, 0.15384641470788515, 0.15115631679337727, 0.14914013484778738, 0.14746294379174157, 0.145470528305377, 0.10274248265169085, 0.012088244127354507, 0.016934353684241822, 0.01564311307294438, 0.009935423957413226, 0.0020121001176734606, -0.007193808162282948, -0.017853533065970654, -0.029719892663133244, -0.04225074182271509, -0.05555371861407658, -0.07107782990277335, -0.08970433388099888, -0.11210029245807306, -0.13876542899583652, -0.16997606148527686, -0.2055563633196237, -0.2440149370978302, -0.282735894835327, -0.31990419028661343, -0.35449577618345984, -0.38710297317075093, -0.41971118801547413, -0.45233724376748213, -0.48450185798514844, -0.5141328033069769, -0.5394883388370155, -0.5602652237786246, -0.5766494616922156, -0.5891615366840957, -0.5979218090738916, -0.6031181895600047, -0.6050086106087189, -0.6039348634910058, -0.5999377703006145, -0.5930667700273148, -0.5837393948617474, -0.5724330211998633, -0.5598977164402622, -0.5469645434745587, -0.53419508597545, -0.5214253485316223, -0.5083735920843624, -0.4947598889810965, -0.4802098360334178, -0.4645736932548931, -0.4478800419748089, -0.43029381010521023, -0.41199613501274357, -0.3933125477195581, -0.37434913276334275, -0.35475951443254117, -0.3343051950930435, -0.3127319849065818, -0.28974450806322977, -0.2649981495993724, -0.2390933599489158, -0.20995469040299747, -0.17811714905343842, -0.14361170916428814, -0.10522224494581754, -0.06237001754164984, -0.014229892140929823, 0.040352837766457726, 0.09692714076965411, 0.10790722590391988]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "fidelity": "Blade_Element_Momentum_Theory_Helmholtz_Wake", "cruise": {"design_power": null, "design_thrust": null, "design_torque": null, "design_power_coefficient": 0.01, "design_thrust_coefficient": 0.01, "design_torque_coefficient": 0.005, "design_Cl": 0.7, "design_efficiency": 0.86, "design_angular_velocity": null, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": null, "design_blade_pitch_command": 0.0}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 1.5707963267948966, 0.0], "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "electric_propulsion_fraction": 1.0, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 1.0, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "hover": {"design_thrust": 3641.9625, "design_torque": 622.9629153642449, "design_power": 105980.69164099888, "design_angular_velocity": 170.12359648893744, "design_tip_mach": null, "design_freestream_velocity": 15.698535592238565, "design_acoustics": null, "design_performance": null, "design_blade_pitch_command": 0.0, "design_efficiency": 0.86, "design_SPL_dBA": 0, "design_Cl": 0.5466910678114905, "design_thrust_coefficient": 0.0659890262228906, "design_power_coefficient": 0.025354487663395694, "design_torque_coefficient": null, "design_altitude": 12.192}, "oei": {"design_thrust": 4166.172337814469, "design_torque": 668.1722841909705, "design_power": 129418.55407430105, "design_angular_velocity": 193.6903956305256, "design_freestream_velocity": 16.782440474352303, "design_tip_mach": null, "design_altitude": 12.192, "design_acoustics": null, "design_blade_pitch_command": -0.025291053006083173, "design_performance": null, "design_SPL_dBA": null, "design_Cl": null, "design_thrust_coefficient": null, "design_power_coefficient": null}, "active": true}, "electronic_speed_controller": {"tag": "electronic_speed_controller", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "bus_voltage": 588.0, "efficiency": 0.95}, "active_crypgenic_tanks_tanks": null, "nacelle": {"tag": "nacelle", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "aerodynamic_center": [0.0, 0.0, 0.0], "areas": {"front_projected": 0.0, "side_projected": 0.0, "wetted": 0.0}, "diameter": 0.3, "inlet_diameter": 0.0, "length": 0.45, "orientation_euler_angles": [0, -1.5707963267948966, 0.0], "flow_through": false, "has_pylon": true, "differential_pressure": 0.0, "cowling_airfoil_angle": 0.0}, "working_fluid": {"tag": "air", "molecular_mass": 28.96442, "gas_specific_constant": 287.0528742, "composition": {"gas": 1.0, "O2": 0.20946, "Ar": 0.00934, "CO2": 0.00036, "N2": 0.78084, "other": 0.0}, "specific_heat_capacity": 1006}, "sealevel_static_power": 267999.65674641833}
\ No newline at end of file
+{"tag": "electric_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "active": true, "wing_mounted": true, "sealevel_static_thrust": 4.29174255674668e-12, "motor": {"tag": "motor", "mass_properties": {"mass": 41.33504955097784, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "working_fluid": {}, "active": true, "resistance": 0.16509979308398082, "no_load_current": 0.01, "speed_constant": 0.4286148282266848, "efficiency": 0.9, "gearbox": {"gear_ratio": 1.0}, "design_angular_velocity": 170.12359648893744, "design_torque": 622.9629153642449, "design_current": 267.02114296044005, "inverse_calculation": false, "interpolated_func": null, "nominal_voltage": 441.0, "propeller_radius": 1.4}, "rotor": {"tag": "lift_rotor", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "number_of_blades": 3, "tip_radius": 1.4, "hub_radius": 0.1, "twist_distribution": [0.32622439034125594, 0.32195320561860613, 0.31653788866887983, 0.3092458722600269, 0.3012667945404142, 0.29262867477977855, 0.2833139832919661, 0.27381103681841545, 0.26407421686833094, 0.25435316676482334, 0.2447284258675875, 0.23533322147279012, 0.2264498448155802, 0.218085291371413, 0.21040136066503926, 0.20361567885361379, 0.19799449765865956, 0.1938446852924911, 0.19150428085749968, 0.1914291983886093], "sweep_distribution": 0.0, "chord_distribution": [0.1134672788200092, 0.11359073994780651, 0.11378136461945848, 0.11419374699167349, 0.11464632324143371, 0.115137454209207, 0.11562213688912736, 0.11608671869084229, 0.11650554160593461, 0.11683722812701852, 0.11709437915261804, 0.11723328832568383, 0.1171759290365827, 0.11692868852072154, 0.11642785443158313, 0.11557251960366936, 0.1141960727629176, 0.1120063302367048, 0.10844866496076459, 0.10212055708798577], "thickness_to_chord": [0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402466, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402463, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465, 0.12031526401402465], "max_thickness_distribution": [0.013651845608182354, 0.013666699866368757, 0.01368963492406615, 0.01373925081805393, 0.013793702649030307, 0.013852793201083414, 0.013911107925681057, 0.0139670042078105, 0.014017394997414955, 0.01405730194876906, 0.014088241142305544, 0.014104954036136924, 0.014098052838125064, 0.014068306030184266, 0.014008048044522353, 0.013905138208881519, 0.0137395306438352, 0.013476071193671169, 0.013048029756722895, 0.012286661787300285], "radius_distribution": [0.1, 0.165, 0.23, 0.29500000000000004, 0.36000000000000004, 0.42500000000000004, 0.49, 0.555, 0.62, 0.685, 0.7499999999999999, 0.8149999999999998, 0.8799999999999999, 0.945, 1.01, 1.0749999999999997, 1.14, 1.205, 1.27, 1.3349999999999997], "blade_pitch_command": 0.0, "mid_chord_alignment": [0.0, 3.0865281949326445e-05, 7.852144986231907e-05, 0.00018161704291607197, 0.0002947611053561276, 0.00041754384729944874, 0.0005387145172795378, 0.0006548599677082718, 0.000759565696481352, 0.0008424873267523295, 0.0009067750831522094, 0.000941502376418657, 0.0009271625541433723, 0.0008653524251780835, 0.0007401439028934809, 0.0005263101959150397, 0.0001821984857270989, -0.0003652371458261021, -0.0012546534648111528, -0.002836680433005858], "blade_solidity": 0.06901468040217859, "flap_angle": 0.0, "number_azimuthal_stations": 16, "vtk_airfoil_points": 40, "airfoils": {"airfoil": {"tag": "airfoil", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[0.0, 0.0, 0.0]], "coordinate_file": "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/NACA_4412.txt", "geometry": {"thickness_to_chord": 0.12031526401402465, "max_thickness": 0.12031526401402465, "x_coordinates": [1.0, 0.9814986041918321, 0.9627179125828096, 0.9439399294906926, 0.925166127050739, 0.9063979951973198, 0.8876370570644889, 0.8688849585974798, 0.8501434433355801, 0.8314143048152758, 0.8126993946862192, 0.7940006322429313, 0.7753200050008656, 0.756659574822571, 0.7380215049082569, 0.7194080751470893, 0.7008216977172956, 0.6822649200925803, 0.6637403963528624, 0.645250955842517, 0.626799645772505, 0.6083897600856984, 0.5900248658119063, 0.571708729724946, 0.5534453814827941, 0.535239264316922, 0.5170952982448289, 0.49901895013235004, 0.48101643938803296, 0.46309510629202194, 0.4452631963781565, 0.4275299115395387, 0.4099055688962534, 0.39240178150249916, 0.3750314325460706, 0.357808928370942, 0.34075082080467095, 0.32387621751014195, 0.30720724855378506, 0.2907696368921567, 0.2745936850479651, 0.25871484137809875, 0.2431740309303782, 0.22801724442061427, 0.21329603594425958, 0.1990687049367147, 0.1853997496370617, 0.17235801737867823, 0.16001078976617483, 0.1484169477183293, 0.1376194134058754, 0.12763845294525444, 0.11846796489977444, 0.11007670049089632, 0.1024137182167369, 0.0954160659771718, 0.08901711107700098, 0.08315099268701516, 0.07775548663074952, 0.07277400767035845, 0.06815571418013859, 0.06385579097428683, 0.05983566008186675, 0.05606222004199868, 0.05250706653476362, 0.0491458183572621, 0.04595930785055342, 0.042933270255651794, 0.04005493749787476, 0.037312709084026195, 0.034696070445075014, 0.03219550170016633, 0.0298023853906419, 0.02750891790918816, 0.025308027034296163, 0.023192935808851622, 0.02115608201712639, 0.019190358145905088, 0.017289413487845455, 0.015447549057252933, 0.013659629176746041, 0.011921538211868638, 0.010241509544193898, 0.008638453084516204, 0.007129684138173528, 0.005730775074766114, 0.00445590503966137, 0.0033181570291437672, 0.0023297725998544455, 0.0015023725325003807, 0.000847150244475165, 0.0003750435511636885, 9.509610563002236e-05, 0.0, 7.452001018022221e-05, 0.00030452347237569575, 0.000676914321409992, 0.0011794915261896218, 0.0018008204127729721, 0.0025301145243810616, 0.0033571259261699605, 0.004272042061421051, 0.005265387412293136, 0.006327928317567679, 0.0074505793552065115, 0.008624309710555625, 0.009840047921614168, 0.011088583319122047, 0.01236046235776236, 0.01364655057113249, 0.014945039096245016, 0.016259016038259397, 0.017591824949329357, 0.01894702157978385, 0.020328411630572713, 0.021740093543628998, 0.0231865073605088, 0.024672490890805244, 0.026203221053714757, 0.027782487236306667, 0.029412931963032407, 0.03109738619483352, 0.03283892449750685, 0.03464088602719837, 0.036506897406641925, 0.038440897432663844, 0.04044716342366599, 0.042530338808020283, 0.04469546123204342, 0.046947989971229266, 0.049293830672406766, 0.05173948490954553, 0.05429411634253652, 0.05696980059975158, 0.05978044316179767, 0.06274208283139807, 0.06587331118102385, 0.0691957837270325, 0.07273484085473012, 0.07652023982094654, 0.08058583014904505, 0.08496906148422065, 0.089712805806937, 0.09486582584922006, 0.10048259915310902, 0.10662336682668508, 0.11335580363417899, 0.12074993170533967, 0.1288720199331354, 0.13777743006425117, 0.14750304006375375, 0.15806139200497055, 0.16943786265293181, 0.1815934222119159, 0.19447112364529714, 0.208003472982633, 0.22212174784617358, 0.23676094425459845, 0.2518603787802792, 0.26736486724739394, 0.2832251009720127, 0.299397256762339, 0.3158426761256465, 0.3325281696925176, 0.34942470654161184, 0.36650653142338824, 0.3837506629710889, 0.4011364641352233, 0.41864598663077307, 0.43626545690558494, 0.45398318187240944, 0.47178880195424955, 0.48967309748227106, 0.5076278171140842, 0.5256451983061614, 0.5437177470751237, 0.561838553623006, 0.5800012410127093, 0.5981998972115157, 0.6164291550142874, 0.6346847885225873, 0.6529631737513845, 0.67126097844783, 0.6895751277335864, 0.7079027582787132, 0.7262406360647307, 0.7445849862001512, 0.7629321371831269, 0.7812785489577723, 0.7996207982694651, 0.8179555977495703, 0.8362798957017255, 0.8545907625570829, 0.8728853412047842, 0.8911608379734586, 0.9094145277711615, 0.9276440415599844, 0.9458473593930258, 0.9640225088883382, 0.9821675448872287, 1.0], "y_coordinates": [-0.003899557014304108, -0.003965450288149787, -0.004089785075419923, -0.004262840238633295, -0.004474885763102654, -0.004716190465313486, -0.004977700900684799, -0.005257969835374713, -0.0055603467171377674, -0.005888236905053348, -0.006245022025924555, -0.006634032213701064, -0.00705716068060325, -0.007514113484612934, -0.008004396547600223, -0.008527499531081744, -0.009082894725243514, -0.009669764011902459, -0.01028608853516519, -0.010929521393664241, -0.011597713534716756, -0.01228831450580067, -0.012998847135051207, -0.013724612801888237, -0.014459054164914338, -0.015195633371582015, -0.015927906504120987, -0.01664953818435914, -0.017357279349697073, -0.018057496381499314, -0.018758272413468363, -0.01946739513737556, -0.020192310484602672, -0.020939850435522333, -0.021710094131471416, -0.022495834932805332, -0.023289617373986875, -0.024084157926099147, -0.02487237392941989, -0.02564801501660149, -0.02641447208591279, -0.02718183482954174, -0.02795774059718128, -0.028722689603506327, -0.02943236145279451, -0.03004843386043372, -0.030548243258206785, -0.03093703612204972, -0.031225993980944448, -0.03142733957182306, -0.03154849251401395, -0.031587316973441436, -0.03154672379907596, -0.0314345385791228, -0.0312609850909314, -0.03103682859636295, -0.030772791208272705, -0.03047826324983898, -0.030160740466022865, -0.029825794211040025, -0.029472391463777222, -0.029095957464163383, -0.0286941177384919, -0.028266015948487398, -0.02781170554798779, -0.027331770656851048, -0.02682752646749548, -0.02630091878864877, -0.025753698873117813, -0.02518737604178764, -0.024603239977866776, -0.024002383115249656, -0.023385721771080347, -0.022754015392798553, -0.022107883697649995, -0.021444841874105357, -0.020750950783107774, -0.020011571688111036, -0.019214318300964397, -0.01834859390179029, -0.01740521934856992, -0.016376539237984114, -0.015264905036656874, -0.014081233517464695, -0.012835473433447944, -0.01153638265051692, -0.010191704284991457, -0.008808316041135439, -0.0073923575098291455, -0.005949339296477094, -0.004484237139173562, -0.0030015736162306503, -0.0015055042653778843, 0.0, 0.00151116470561765, 0.003024434321032745, 0.0045364249693986, 0.006043880163895953, 0.007543629436265651, 0.009032549066208179, 0.010507524185682942, 0.011965411576297852, 0.013403002502951716, 0.014816984933787171, 0.01620390448576055, 0.01756012340638186, 0.018881776854469606, 0.020164725674259285, 0.02140450476531517, 0.022596783781377444, 0.023742788438980582, 0.02484746124843818, 0.025915920916832664, 0.02695346335161884, 0.027965628432981678, 0.0289582751167327, 0.029937666890962847, 0.03091057003318596, 0.031884109771249516, 0.03286214476169529, 0.03384574186594778, 0.03483593092172032, 0.03583378635317488, 0.03684043425125774, 0.037857060232974485, 0.038884918212483216, 0.039925340236404636, 0.040979747557494034, 0.04204966314426527, 0.04313672584805332, 0.04424270647095047, 0.04536952940885742, 0.04651934711092833, 0.047694570177395895, 0.04889786622353596, 0.05013219903990042, 0.051400875267589276, 0.052707598222880896, 0.05405652929830145, 0.055452358806650746, 0.05690052720187732, 0.058407487139250445, 0.05998069968882116, 0.06162878880057992, 0.06336173992867573, 0.06518947002390746, 0.06711593127660478, 0.0691400726394503, 0.0712549228235825, 0.07344564670357719, 0.07568824816321433, 0.07795009667946298, 0.08019650393779813, 0.08239384182621884, 0.0845111752483459, 0.08652267855731853, 0.08840124510902292, 0.09011823856487722, 0.09164943724696237, 0.09297546468702177, 0.09408223342067987, 0.09495964933503866, 0.09560153149150259, 0.09600759325468042, 0.09618111755204445, 0.09612770520407414, 0.09585492271456166, 0.09537200736825038, 0.09468927789691249, 0.09381706055586757, 0.09276640938941323, 0.09154922113152997, 0.09017812144285317, 0.08866618545185483, 0.08702022885609838, 0.08523869941268786, 0.08331957523689061, 0.08126090752084213, 0.07906081388457424, 0.07671833927533663, 0.07423750988437107, 0.07162421090488018, 0.06888446791792896, 0.06602443029541259, 0.06305023994699901, 0.059963934729950714, 0.05676235665660661, 0.053442023641031046, 0.049999459621278365, 0.046431197646000455, 0.042734289382326804, 0.03890806393091963, 0.03495251090313596, 0.03086765362385812, 0.026653549191735383, 0.02231031746698798, 0.017838771375195156, 0.013240418157354838, 0.008516831495265543, 0.003669623092761436, -0.001299557014304108], "x_upper_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "x_lower_surface": [0.0, 0.0029835684633233656, 0.005495398864107563, 0.007633290556781445, 0.009495042895773863, 0.011178455235513671, 0.012781326930429718, 0.014401457334950855, 0.016136645803505933, 0.01808469169052381, 0.02034339435043333, 0.023010553137663356, 0.02618245030633179, 0.02987598021789672, 0.03399124860432431, 0.03841901276927576, 0.04305003001641234, 0.04777505764939526, 0.05248655095606092, 0.05711111124345979, 0.061606963318156155, 0.06593352453527067, 0.07005021224992403, 0.07391644381723692, 0.07750993516859131, 0.08099347412039165, 0.08463731026676208, 0.08871301688355863, 0.09349216724663727, 0.09924633463185403, 0.10618323138176163, 0.11414598540546432, 0.12284854577009241, 0.1320047101687122, 0.14132827629439002, 0.1505330554072626, 0.15941192765493456, 0.16802305011648858, 0.17648015059219263, 0.1848969568823147, 0.1933871967871227, 0.20206398490556696, 0.21095415649494886, 0.21991005271261319, 0.22876296466442167, 0.23734418345623623, 0.2454850001939189, 0.2530251979813624, 0.2601128466847941, 0.26728429606874665, 0.27510065390950467, 0.2841230279833525, 0.2949125260665745, 0.3079923356666426, 0.3232909407152381, 0.3402646419567859, 0.35835673348350827, 0.37701050938762737, 0.3956692637613654, 0.41382871561702983, 0.43141915959031674, 0.44858576806174055, 0.46547524058290646, 0.48223427670541846, 0.4990095759808816, 0.5159232725419913, 0.5329802330322019, 0.5501503711502891, 0.5674035945976118, 0.584709811075529, 0.6020389293063492, 0.6193617292646798, 0.6366514498806471, 0.65388176079721, 0.671026331657328, 0.6880588321039602, 0.7049536176478475, 0.721740725289753, 0.7385460873202617, 0.7555051174661778, 0.7727532294543051, 0.7904258370114485, 0.8086470512659383, 0.8272412658080573, 0.8457092490452216, 0.8635356764272546, 0.8802052234039802, 0.8952025654252215, 0.9080540170788528, 0.9188060849794258, 0.9278588799318661, 0.9356192701068533, 0.9424941236750667, 0.9488903088071867, 0.9552146936738926, 0.961874146445864, 0.9692755352937806, 0.9778257283883225, 0.987931593900169, 1.0], "y_upper_surface": [0.0, 0.006380448434411382, 0.011684222338048238, 0.016043449318962084, 0.019590256985204432, 0.02245677294482681, 0.024775124805880726, 0.0266774401764177, 0.028295846664489248, 0.02976247187814689, 0.03120944342544214, 0.03276888891442653, 0.034571312065779534, 0.03666224067904225, 0.03896219329809893, 0.04138168201270342, 0.043831218912609625, 0.04622131608757142, 0.04846502418500166, 0.050526443585207935, 0.05241695312849192, 0.05414971456533544, 0.05573788964622039, 0.05719464012162861, 0.05853647479776234, 0.05981375461787535, 0.06109649672976446, 0.06245496040041921, 0.06395940489682914, 0.0656800894859838, 0.0676688505121781, 0.06987234717171274, 0.0721999724999295, 0.07456107586302006, 0.07686500662717619, 0.07902111828787567, 0.08096282982043052, 0.08270430013275303, 0.0842766016889327, 0.085710806953059, 0.0870379883892214, 0.08828913732842156, 0.08948382942265995, 0.09061855288962625, 0.09168701080022884, 0.09268290622537607, 0.09359994223597635, 0.09443196809870935, 0.09517814045560118, 0.0958443004626162, 0.09643671550245721, 0.096961652957827, 0.09742538021142831, 0.09783279989437105, 0.09816741123853424, 0.09839571958896257, 0.0984837621809043, 0.09839757624960772, 0.09810319903032118, 0.09757115844868458, 0.09680920794395251, 0.09584350726715764, 0.09470034698598487, 0.0934060176681191, 0.09198680988124525, 0.0904643327380958, 0.08883784757584529, 0.08709995471617446, 0.08524325333783067, 0.08326034261956128, 0.08114382794560088, 0.07889161030783351, 0.07651653661409304, 0.07403407171213082, 0.07145968044969825, 0.06880882767454666, 0.06609674614077089, 0.06331982631104899, 0.06044200824136898, 0.05742402352501027, 0.054226603755252165, 0.05081048052537401, 0.047139368762024875, 0.04325609416755832, 0.03928890366932827, 0.035370291948646625, 0.031632753686825256, 0.02820878356517617, 0.02522084411119842, 0.022666067534134495, 0.02045639187752719, 0.01850212712690006, 0.01671358326777673, 0.01500107028568076, 0.013274898166135715, 0.01144537689466523, 0.009422816456792805, 0.007117526838042063, 0.004439818023936638, 0.0013], "y_lower_surface": [0.0, -0.003665223223884563, -0.006745116792398609, -0.009305400195575348, -0.011411792923447985, -0.013130014466049736, -0.014525784313413802, -0.0156648219555734, -0.01661284688256173, -0.017435578584412005, -0.018198736551157432, -0.018968040272831232, -0.01980839017236283, -0.020741825952895296, -0.021727334318491106, -0.02271885485138349, -0.02367032713380571, -0.024535690747991005, -0.025270626378542282, -0.025865827824930857, -0.02634441542554817, -0.02673073235062825, -0.02704912177040515, -0.027323926855112896, -0.027577905285351957, -0.027817779092228732, -0.028040959225367316, -0.028244741943301413, -0.02842642350456472, -0.028583300167690947, -0.028712472367814792, -0.02880992257703332, -0.02887123715297097, -0.02889200198907823, -0.02886780297880557, -0.02879422623767004, -0.028668152085203107, -0.02849080290872854, -0.028264310680272065, -0.02799080737185942, -0.027672424955516337, -0.027311321418476225, -0.02691331516898971, -0.02649162756784114, -0.026060373029115777, -0.025633665966898873, -0.025225620795275707, -0.024849859458193766, -0.0245021256542495, -0.024155645854136956, -0.02378221075555379, -0.023353611056197657, -0.02284163745376622, -0.02222011929783598, -0.02149485811539941, -0.020697040726644425, -0.01985855320935335, -0.019011281641308535, -0.018187112100292314, -0.017414490637169912, -0.01669334724899932, -0.01600951205009446, -0.015348714944608753, -0.014696685836695608, -0.014039154630508432, -0.013364802023979244, -0.012676394865126254, -0.011980898543506178, -0.01128527916908439, -0.010596502851826234, -0.009921534244260078, -0.009266094258623172, -0.008632393570162943, -0.00802202799789677, -0.00743659336084203, -0.0068776854780161, -0.00634688832454166, -0.0058448243407931005, -0.005370460001161809, -0.004922598050038695, -0.004500041231814651, -0.004101592290880574, -0.003726130229006508, -0.003374556208971546, -0.003049954856793557, -0.002755519375891563, -0.0024944429696845878, -0.002269918841591665, -0.0020847476996542613, -0.0019368268611264893, -0.0018207205288729047, -0.001730929210039391, -0.0016619534117718344, -0.0016082936412161188, -0.0015644504055181275, -0.0015249242118237462, -0.001484215567278858, -0.0014368249790293478, -0.0013772529542211013, -0.0013], "camber_coordinates": [0.0, 0.0013576126052634095, 0.0024695527728248144, 0.003369024561693369, 0.0040892320308782235, 0.004663379239388539, 0.005124670246233462, 0.0055063091104221515, 0.005841499890963758, 0.0061634466468674445, 0.0065053534371423555, 0.006900424320797651, 0.0073814609467083535, 0.007960207363073478, 0.008617429489803912, 0.009331413580659965, 0.010080445889401959, 0.010842812669790206, 0.011597198903229692, 0.01233030788013854, 0.013036268851471876, 0.013709491107353595, 0.014344383937907618, 0.01493535663325786, 0.015479284756205192, 0.01599798776282331, 0.01652776875219857, 0.0171051092285589, 0.017766490696132207, 0.01854839465914643, 0.019478189072181653, 0.02053121229733971, 0.02166436767347927, 0.022834536936970913, 0.023998601824185305, 0.025113446025102817, 0.026147338867613706, 0.02710674861201224, 0.028006145504330313, 0.028859999790599788, 0.02968278171685253, 0.030488907954972666, 0.031285257126835116, 0.03206346266089256, 0.03281331888555653, 0.033524620129238604, 0.03418716072035033, 0.034791054320257794, 0.03533800740067584, 0.03584432730423963, 0.03632725237345171, 0.03680402095081467, 0.03729187137883104, 0.037806340298267536, 0.03833627656156741, 0.03884933943115907, 0.039312604485775476, 0.03969314730414959, 0.039958043465014435, 0.04007833390575733, 0.040057930347476595, 0.03991699760853159, 0.03967581602068806, 0.03935466591571174, 0.03897382762536841, 0.03854976535705828, 0.038080726355359515, 0.03755952808633414, 0.036978987084373145, 0.03633191988386752, 0.0356111468506704, 0.034812758024605164, 0.033942071521965045, 0.03300602185711703, 0.03201154354442811, 0.030965571098265275, 0.02987492890811462, 0.028737500985127944, 0.027535774120103586, 0.026250712737485787, 0.024863281261718755, 0.023354444117246718, 0.021706619266509183, 0.01994076897929339, 0.01811947440626736, 0.016307386286377533, 0.014569155358570335, 0.012969432361792252, 0.011568048205772079, 0.010364620336504003, 0.009317835674327143, 0.008385598958430334, 0.007525814928002446, 0.006696388322232322, 0.005855223880308794, 0.004960226341420741, 0.003969300444756974, 0.0028403509295063575, 0.0015312825348577684, 0.0]}, "polar_files": ["/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_50000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_100000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_200000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_1000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_3500000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_5000000.txt", "/Users/matthewclarke/Documents/LEADS/CODES/RCAIDE_LEADS/Regressions/Vehicles/Airfoils/Polars/NACA_4412_polar_Re_7500000.txt"], "polars": {"aoa_from_polar": [[-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927], [-0.10471975511965978, -0.10035643198967395, -0.09599310885968812, -0.0916297857297023, -0.08726646259971647, -0.08290313946973066, -0.07853981633974483, -0.07417649320975901, -0.06981317007977318, -0.06544984694978735, -0.061086523819801536, -0.05672320068981571, -0.05235987755982989, -0.04799655442984406, -0.04363323129985824, -0.039269908169872414, -0.03490658503988659, -0.030543261909900768, -0.026179938779914945, -0.02181661564992912, -0.017453292519943295, -0.013089969389957472, -0.008726646259971648, -0.004363323129985824, 0.0, 0.004363323129985824, 0.008726646259971648, 0.013089969389957472, 0.017453292519943295, 0.02181661564992912, 0.026179938779914945, 0.030543261909900768, 0.03490658503988659, 0.039269908169872414, 0.04363323129985824, 0.04799655442984406, 0.05235987755982989, 0.05672320068981571, 0.061086523819801536, 0.06544984694978735, 0.06981317007977318, 0.07417649320975901, 0.07853981633974483, 0.08290313946973066, 0.08726646259971647, 0.0916297857297023, 0.09599310885968812, 0.10035643198967395, 0.10471975511965978, 0.1090830782496456, 0.11344640137963143, 0.11780972450961724, 0.12217304763960307, 0.1265363707695889, 0.1308996938995747, 0.13526301702956053, 0.13962634015954636, 0.1439896632895322, 0.14835298641951802, 0.15271630954950383, 0.15707963267948966, 0.16144295580947549, 0.16580627893946132, 0.17016960206944712, 0.17453292519943295, 0.17889624832941878, 0.1832595714594046, 0.18762289458939044, 0.19198621771937624, 0.19634954084936207, 0.2007128639793479, 0.20507618710933373, 0.20943951023931956, 0.21380283336930536, 0.2181661564992912, 0.22252947962927702, 0.22689280275926285, 0.23125612588924865, 0.23561944901923448, 0.2399827721492203, 0.24434609527920614, 0.24870941840919197, 0.2530727415391778, 0.25743606466916363, 0.2617993877991494, 0.26616271092913524, 0.27052603405912107, 0.2748893571891069, 0.2792526803190927]], "re_from_polar": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "lift_coefficients": [[-0.8668389012070687, -0.9628795671610489, -0.9789613216382629, -0.9437247187342035, -0.876931904863378, -0.7917162610101387, -0.6964139738440771, -0.5960208838257406, -0.4078, -0.4453, -0.4519, -0.2525, -0.1457, 0.042949999999999995, 0.1943, 0.3281, 0.4286, 0.5265, 0.6102, 0.6895, 0.7592, 0.8095, 0.8781, 0.9207, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.9807, 0.564092063115252, 0.6208651346861369, 0.6744664974274013, 0.7249683439283658, 0.7724421853437302, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.1908932203108227, -1.1034999307696687, -1.0090137319431105, -0.9087271851510879, -0.803806877682798, -0.6952924031788213, -0.5840951957297257, -0.4709971702917467, -0.4744, -0.339, -0.1732, -0.0135, 0.1378, 0.3011, 0.4335, 0.5631, 0.6774, 0.7929, 0.8957, 0.9995, 1.1016, 1.1987, 1.2769, 1.3281, 1.3127, 1.3189, 1.3787, 1.4319, 1.4512, 1.4201, 1.3171, 1.3956729083522144, 1.3189900988029917, 1.2133829765808901, 1.0761215426599497, 0.9043572397947004, 0.8169588484951222, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.9892621516469651, -0.9019462782843927, -0.8103549182974268, -0.7151947443190507, -0.6171266974117984, -0.5167630039127251, -0.4146634754774159, -0.3113307408167738, -0.293, -0.1466, 0.003, 0.1342, 0.2541, 0.3583, 0.4938, 0.5988, 0.7038, 0.8084, 0.9127, 1.0156, 1.1122, 1.2002, 1.2799, 1.3267, 1.3275, 1.3429, 1.3641, 1.3923, 1.418, 1.4342, 1.4362, 1.4246380419144926, 1.3907990750802153, 1.3400748158881686, 1.2712764344832739, 1.183187284374868, 1.0745634507802917, 0.9441342664028092, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-0.992446947221973, -0.9012266559399362, -0.8057119708761068, -0.7065322056252733, -0.6042935254653763, -0.4995764576963993, -0.39293263829048397, -0.2848803353942884, -0.1743, -0.0666, 0.0434, 0.1541, 0.2641, 0.3734, 0.4741, 0.5983, 0.7023, 0.8073, 0.9127, 1.0155, 1.1155, 1.2103, 1.2891, 1.3388, 1.3845, 1.427, 1.4602, 1.4938, 1.5091, 1.5124, 1.5055, 1.5024801888012511, 1.475631538512678, 1.434129150608317, 1.3771278221584196, 1.3037720318370243, 1.21319624498583, 1.104525197911813, 0.9768741635716025, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.027208451114869, -0.9277768697802068, -0.8254219774461379, -0.7207781366894633, -0.6144021905760322, -0.5067734079985751, -0.3982934198786351, -0.2892861425147429, -0.1825, -0.0718, 0.0394, 0.1512, 0.2625, 0.3734, 0.4833, 0.5842, 0.7055, 0.8135, 0.921, 1.0254, 1.128, 1.2208, 1.2973, 1.3676, 1.4317, 1.4938, 1.55, 1.5959, 1.6325, 1.6585, 1.6698, 1.6614833943075813, 1.635442973016239, 1.5899849911538615, 1.5233385995476214, 1.4336558616859691, 1.3190117698692427, 1.1774042607063917, 1.0067542300086276, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.087134885160501, -0.9795048637915695, -0.8701386679948996, -0.7595754135497517, -0.6482275339213107, -0.5363984179468942, -0.42429981193874156, -0.3120689483583656, -0.2022, -0.0886, 0.0251, 0.1389, 0.2524, 0.3661, 0.4798, 0.5935, 0.7056, 0.8099, 0.929, 1.0353, 1.1366, 1.2308, 1.3225, 1.414, 1.5015, 1.575, 1.6417, 1.7004, 1.7521, 1.7955, 1.8247, 1.8127484882372966, 1.7743956989694207, 1.705607654231657, 1.601952658442782, 1.458581747359764, 1.2702090608565502, 1.0310921423984265, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0933090757116088, -0.9840210870838201, -0.8734707290931002, -0.762104285261265, -0.6502405387035232, -0.5380963313858868, -0.4258098305873951, -0.31346136261766194, -0.20425, -0.0902, 0.024, 0.1383, 0.2525, 0.3669, 0.4813, 0.5958, 0.7093, 0.8212, 0.9308, 1.0365, 1.1371, 1.2336, 1.3299, 1.4246, 1.5155, 1.597, 1.6652, 1.7284, 1.7845, 1.8284, 1.8681, 1.8544166426133375, 1.8099630651544494, 1.7291358974873132, 1.6056265051204497, 1.4323683623792094, 1.2014829656993908, 0.9042243093847673, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771], [-1.0965082200600442, -0.986122589954553, -0.8748866537218764, -0.7631412658924641, -0.6511110068171198, -0.5389352079198726, -0.4266936554536957, -0.3144272071666496, -0.2062, -0.0918, 0.0229, 0.1377, 0.2527, 0.3678, 0.483, 0.598, 0.7127, 0.8247, 0.9321, 1.0369, 1.1384, 1.2383, 1.3374, 1.4355, 1.5295, 1.618, 1.6917, 1.7572, 1.8143, 1.868, 1.9068, 1.891044716200477, 1.8390999124402823, 1.74308232590407, 1.593854576970384, 1.3808927157763653, 1.0921462524308685, 0.8585884729194884, 0.897400507862631, 0.9334637092160134, 0.9668461363949694, 0.9976151491562684, 1.0258374043529437, 1.0515788526241736, 1.0749047350178667, 1.095879579543516, 1.1145671976527294, 1.1310306806447277, 1.145332395993917, 1.1575339835965335, 1.1676963519331338, 1.1758796741435562, 1.1821433840107622, 1.186546171849761, 1.1891459802975801, 1.1900000000000002, 1.189164665190508, 1.1866956491566083, 1.1826478595883416, 1.1770754338034886, 1.1700317338435728, 1.1615693414343655, 1.1517400528041342, 1.1405948733523983, 1.128184012161403, 1.114556876341934, 1.0997620652044378, 1.0838473642456912, 1.0668597389404633, 1.048845328326717, 1.0298494383719237, 1.0099165351069443, 0.9890902375127129, 0.9674133101435616, 0.9449276554694761, 0.9216743059178071, 0.8976934155929732, 0.8730242516504152, 0.8477051852984732, 0.8217736823988906, 0.7952662936332109, 0.7682186441983773, 0.7406654229902223, 0.7126403712281303, 0.6841762704677934, 0.6553049299414383, 0.6260571731558979, 0.5964628236680811, 0.566550689944257, 0.5363485491935105, 0.5058831300458653, 0.47518009392073884, 0.44426401489999784, 0.4131583578795709, 0.3818854547210808, 0.35046647805532516, 0.3189214122952245, 0.2872690212853754, 0.2555268118296233, 0.22371099206501363, 0.19183642323292582, 0.1599165627279245, 0.1279633951602268, 0.09598734604598294, 0.06399716832672771]], "drag_coefficients": [[0.49027715986783027, 0.46761244875208674, 0.44490672320157065, 0.4221624469229053, 0.39938208780569795, 0.37656811765475895, 0.35372301192189626, 0.3308492494373141, 0.08962, 0.08207, 0.07317, 0.03925, 0.03529, 0.0335, 0.03343, 0.03667, 0.04038, 0.04459, 0.04955, 0.05512, 0.06142, 0.06914, 0.07561, 0.08352, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.08551, 0.6141384916387613, 0.6364767634570125, 0.6587556980553567, 0.680972878036534, 0.7031258927040288, 0.7252123383236447, 0.7472298183843238, 0.7691759438581823, 0.7910483334597351, 0.812844613904279, 0.8345624201654078, 0.8561993957316324, 0.877753192862076, 0.8992214728412178, 0.9206019062326588, 0.9418921731318779, 0.9630899634179564, 0.9841929770042389, 1.005198924087908, 1.0261055253984406, 1.0469105124449216, 1.0676116277621903, 1.0882066251557878, 1.1086932699456828, 1.1290693392087476, 1.1493326220199584, 1.1694809196922937, 1.1895120460153061, 1.2094238274923381, 1.2292141035763593, 1.2488807269043989, 1.2684215635305482, 1.2878344931575054, 1.3071174093666402, 1.326268219846555, 1.3452848466201097, 1.364165226269898, 1.3829073101621387, 1.4015090646689645, 1.4199684713890834, 1.4382835273667878, 1.4564522453092854, 1.474472653802334, 1.4923427975241508, 1.5100607374575776, 1.5276245511004731, 1.5450323326743203, 1.5622821933310092, 1.5793722613577927, 1.5963006823803771, 1.6130656195641322, 1.6296652538133987, 1.6460977839688722, 1.6623614270030385, 1.6784544182136434, 1.6943750114151737, 1.710121479128327, 1.7256921127674563, 1.7410852228259586, 1.7562991390595992, 1.7713322106677416, 1.7861828064724694, 1.800849315095579, 1.8153301451334245, 1.8296237253295933, 1.8437285047453964, 1.8576429529281568, 1.8713655600772705, 1.8848948372080296, 1.8982293163131865, 1.9113675505222403, 1.9243081142584326, 1.9370496033934295, 1.9495906353996781], [0.1118217122473246, 0.10006000000000001, 0.08908240190249703, 0.07888891795481569, 0.07516, 0.07516, 0.07516, 0.07516, 0.07516, 0.03524, 0.02773, 0.02457, 0.02248, 0.01877, 0.01835, 0.01782, 0.01798, 0.01834, 0.01941, 0.02057, 0.02159, 0.02216, 0.02285, 0.02421, 0.02965, 0.03755, 0.0443, 0.05205, 0.06218, 0.07667, 0.10006, 0.129788014102524, 0.15951059950495539, 0.189222328498549, 0.21891777535707285, 0.24859151732761287, 0.27823813562083355, 0.3078522164005158, 0.33742835177218966, 0.3669611407706819, 0.39644519034639947, 0.4258751163501653, 0.4552455445164308, 0.4845511114446825, 0.5137864655788643, 0.5429462681846388, 0.5720251943243032, 0.6010179338291907, 0.6299191922693708, 0.6587236919204777, 0.6874261727274883, 0.7160213932652715, 0.744504131695737, 0.7728691867214077, 0.8011113785352402, 0.8292255497665203, 0.8572065664226636, 0.8850493188267439, 0.9127487225505839, 0.940299719343235, 0.9676972780546732, 0.9949363955545519, 1.0220120976458333, 1.0489194399731376, 1.0756535089256443, 1.102209422534376, 1.1285823313637071, 1.1547674193969304, 1.1807599049157194, 1.2065550413733306, 1.2321481182613796, 1.2575344619700388, 1.282709436641495, 1.3076684450165148, 1.33240692927396, 1.3569203718631015, 1.3812042963285802, 1.405254268127862, 1.4290658954410396, 1.452634829972833, 1.4759567677466428, 1.4990274498905058, 1.5218426634148212, 1.5443982419816904, 1.5666900666657462, 1.5887140667063133, 1.6104662202507845, 1.6319425550890556, 1.6531391493789038, 1.6740521323621618, 1.6946776850715668, 1.7150120410281497, 1.7350514869290408, 1.7547923633255658, 1.7742310652915043, 1.793364043081394, 1.812187802778757, 1.8306989069341353, 1.848893975192806, 1.8667696849120798, 1.884322771768054, 1.9015500303517192, 1.9184483147543057, 1.935014539141766, 1.9512456783182837], [0.05351578512396693, 0.04730634527089072, 0.0415745546372819, 0.03632041322314049, 0.031543921028466475, 0.02724507805325986, 0.02357, 0.02357, 0.02357, 0.01934, 0.01638, 0.01437, 0.01274, 0.0107, 0.01005, 0.01039, 0.01097, 0.01171, 0.01256, 0.01352, 0.01444, 0.01536, 0.0167, 0.01944, 0.02555, 0.03209, 0.03917, 0.04629, 0.05407, 0.06336, 0.07501, 0.10507651731318803, 0.13513754411144424, 0.1651875908824725, 0.19522117011906398, 0.22523279732118395, 0.2552169919975083, 0.28516827866622896, 0.31508118785494343, 0.34495025709944804, 0.3747700319412509, 0.4045350669236226, 0.43423992658600385, 0.4638791864565871, 0.49344743404289093, 0.5229392698201494, 0.5523493082173293, 0.5816721786006032, 0.610902526254092, 0.6400350133577025, 0.6690643199618782, 0.6979851449590881, 0.7267922070518733, 0.7554802457172763, 0.7840440221674791, 0.8124783203064676, 0.8407779476825561, 0.8689377364365924, 0.8969525442456722, 0.924817255262191, 0.9525267810480593, 0.980076061503915, 1.0074600657931594, 1.0346737932606487, 1.0617122743458773, 1.0885705714904776, 1.1152437800398807, 1.1417270291389656, 1.168015482621538, 1.194104339893473, 1.2199888368093619, 1.2456642465425045, 1.2711258804480852, 1.2963690889193775, 1.3213892622368193, 1.3461818314098033, 1.3707422690110311, 1.395066090003278, 1.4191488525584146, 1.442986158868539, 1.4665736559490727, 1.489907036433665, 1.512982039360775, 1.5357944509517722, 1.5583401053804282, 1.5806148855336422, 1.6026147237632813, 1.62433560262898, 1.6457735556317752, 1.6669246679384377, 1.6877850770963687, 1.7083509737389306, 1.7286186022810834, 1.7485842616052034, 1.7682443057369495, 1.7875951445110643, 1.8066332442269821, 1.8253551282941272, 1.843757377866779, 1.8618366324683986, 1.8795895906052906, 1.8970130103694973, 1.9141037100308114, 1.930858568617798, 1.9472745264877216], [0.056809727891156486, 0.05003845049130766, 0.04375962962962965, 0.03797326530612245, 0.0326793575207861, 0.027877906273620565, 0.023568911564625854, 0.019752373393801967, 0.01225, 0.01079, 0.00973, 0.00898, 0.00844, 0.00807, 0.00703, 0.00705, 0.00759, 0.0082, 0.00884, 0.00957, 0.01038, 0.01152, 0.01362, 0.01711, 0.0206, 0.02457, 0.02976, 0.03568, 0.0441, 0.05486, 0.06789, 0.09805273060100951, 0.12820995311736044, 0.15835616047023837, 0.1884858475923325, 0.21859351243312908, 0.24867365696365298, 0.2787207881804755, 0.30872941910880397, 0.3386940698044705, 0.36860926835463775, 0.39846955187703637, 0.4282694675175552, 0.4580035734459986, 0.4876664398498317, 0.5172526499257315, 0.5467568008687602, 0.5761735048589846, 0.6054973900453581, 0.634723101526686, 0.663845302329497, 0.6928586743826399, 0.7217579194884276, 0.7505377602901538, 0.779192941235804, 0.8077182295377817, 0.8361084161284814, 0.8643583166115272, 0.8924627722085073, 0.9204166507010318, 0.9482148473679357, 0.9758522859174663, 1.0033239194142753, 1.0306247312010508, 1.057749735814622, 1.0846939798963633, 1.1114525430967408, 1.1380205389738274, 1.1643931158856269, 1.1905654578760443, 1.2165327855543369, 1.2422903569678916, 1.2678334684681616, 1.2931574555696121, 1.318257693801512, 1.3431295995524184, 1.3677686309072006, 1.39217028847645, 1.4163301162181234, 1.4402437022512704, 1.4639066796616993, 1.487314727299425, 1.5104635705677683, 1.5333489822039468, 1.555966783051028, 1.57831284282109, 1.6003830808494677, 1.6221734668399281, 1.6436800216006549, 1.6648988177708959, 1.6858259805381486, 1.7064576883457472, 1.7267901735907256, 1.7468197233118306, 1.7665426798675505, 1.7859554416040482, 1.8050544635128645, 1.823836257878284, 1.8422973949142312, 1.8604345033905934, 1.878244271248848, 1.8957234462068855, 1.9128688363529154, 1.9296773107283502, 1.9461457998995535], [0.051192608445848886, 0.0454448118356794, 0.04008669635162308, 0.03511826199367997, 0.03053950876185003, 0.026350436656133288, 0.02255104567652973, 0.019141335823039354, 0.00935, 0.00845, 0.0078, 0.00745, 0.00715, 0.00697, 0.00678, 0.00594, 0.00622, 0.006685, 0.00722, 0.00797, 0.00884, 0.01036, 0.01288, 0.01527, 0.01746, 0.01986, 0.02282, 0.02683, 0.03209, 0.03899, 0.04827, 0.07869785766660745, 0.10912015883310144, 0.13953134801405392, 0.16992587175322132, 0.20029817963767457, 0.23064272531137192, 0.26095396748799216, 0.2912263709628411, 0.32145440762364774, 0.3516325574600662, 0.38175530957169634, 0.41181716317444234, 0.4418126286050233, 0.4717362283234525, 0.5015824979133051, 0.5313459870795855, 0.5610212606440191, 0.5906028995375829, 0.6200855017900931, 0.6494636835166719, 0.6787320799009108, 0.7078853461745511, 0.736918158593505, 0.7658252154100368, 0.7946012378409261, 0.8232409710314391, 0.8517391850149295, 0.8800906756678939, 0.9082902656603101, 0.9363328054010788, 0.9642131739784046, 0.9919262800949354, 1.0194670629974967, 1.0468304934012478, 1.0740115744080885, 1.101005342419157, 1.1278068680412419, 1.154411256986951, 1.1808136509684672, 1.2070092285847325, 1.2329932062018945, 1.258760838826856, 1.2843074209737706, 1.3096282875233205, 1.3347188145746256, 1.3595744202896234, 1.3841905657297702, 1.4085627556849059, 1.432686539494135, 1.4565575118585725, 1.4801713136458035, 1.5035236326859165, 1.526610204558957, 1.549426813373665, 1.5719692925373452, 1.5942335255167408, 1.6162154465897611, 1.6379110415879339, 1.6593163486294402, 1.6804274588426042, 1.7012405170797003, 1.7217517226209482, 1.7419573298685767, 1.7618536490308094, 1.7814370467956704, 1.8007039469944683, 1.8196508312548527, 1.8382742396433072, 1.8565707712969797, 1.8745370850447196, 1.8921699000172172, 1.9094659962461307, 1.9264222152520927, 1.9430354606214846], [0.05132130177514794, 0.046035443786982246, 0.041069940828402374, 0.03642479289940829, 0.0321, 0.028095562130177523, 0.024411479289940825, 0.021047751479289944, 0.00697, 0.00658, 0.00632, 0.00616, 0.00605, 0.00599, 0.00595, 0.0059, 0.00549, 0.00503, 0.00548, 0.00624, 0.00735, 0.00895, 0.01056, 0.01194, 0.0133, 0.01483, 0.01664, 0.01905, 0.02218, 0.0263, 0.0321, 0.06274636452953906, 0.09338713265693077, 0.12401670900199974, 0.15462950022832694, 0.18521991606466234, 0.21578237032577635, 0.2463112819325663, 0.2768010759312295, 0.30724618451131835, 0.3376410480224913, 0.3679801159897724, 0.3982578481271369, 0.4284687153492348, 0.4586072007810697, 0.4886678007654492, 0.5186450258680179, 0.5485334018796975, 0.5783274708163432, 0.6080217919154394, 0.6376109426296493, 0.6670895196170392, 0.6964521397277935, 0.7256934409872453, 0.7548080835750389, 0.7837907508002453, 0.812636150072256, 0.8413390138672748, 0.8698941006902322, 0.8982961960319477, 0.9265401133213604, 0.9546206948726641, 0.9825328128271615, 1.0102713700896746, 1.0378313012593383, 1.065207573554602, 1.0923951877322797, 1.119389179000472, 1.146184617925198, 1.172776611330571, 1.1991603031923521, 1.2253308755247196, 1.251283549260092, 1.277013585121846, 1.302516284489765, 1.3277869902580655, 1.3528210876858402, 1.3776140052397694, 1.4021612154289362, 1.426458235631603, 1.4505006289137938, 1.4742840048395314, 1.4978040202725862, 1.5210563801695847, 1.5440368383643401, 1.5667411983432495, 1.5891653140116342, 1.6113050904508621, 1.6331564846661346, 1.654715506324785, 1.6759782184849616, 1.6969407383145636, 1.717599237800291, 1.73794994444669, 1.757989141965055, 1.7777131709520684, 1.7971184295580531, 1.8162013741447158, 1.834958519932255, 1.8533864416357293, 1.8714817740905525, 1.8892412128670166, 1.9066615148737194, 1.9237394989497947, 1.9404720464458285], [0.050893999999999995, 0.04580216, 0.04100984000000001, 0.03651704000000001, 0.03232376000000001, 0.02843, 0.024835760000000002, 0.021541040000000004, 0.006574999999999999, 0.00628, 0.00607, 0.00592, 0.00583, 0.00576, 0.00572, 0.00566, 0.00551, 0.00517, 0.00527, 0.00611, 0.00732, 0.00878, 0.01007, 0.01128, 0.01251, 0.01385, 0.01544, 0.01745, 0.02009, 0.02385, 0.02843, 0.05912595761469423, 0.08981630977093533, 0.1204954520338959, 0.15115778201581226, 0.1817977003990498, 0.21240961195860653, 0.24298792658387036, 0.27352706029944124, 0.30402143628483413, 0.33446548589287467, 0.3648536496666022, 0.39518037835449543, 0.4254401339238331, 0.45562739057200685, 0.4857366357356018, 0.5157623710970559, 0.5456991135887226, 0.5755413963941445, 0.6052837699463619, 0.6349208029230707, 0.6644470832384485, 0.6938572190314668, 0.7231458396505122, 0.7523075966341333, 0.7813371646877344, 0.8102292426560405, 0.8389785544911527, 0.8675798502160194, 0.8960279068831477, 0.9243175295283752, 0.9524435521195366, 0.9804008384998434, 1.008184283325809, 1.0357888129995478, 1.0632093865952763, 1.0904409967798467, 1.1174786707271491, 1.1443174710262098, 1.1709524965828233, 1.1973788835145514, 1.2235918060389288, 1.24958647735471, 1.2753581505159977, 1.300902119299094, 1.3262137190619132, 1.3512883275958039, 1.3761213659696205, 1.4007082993658926, 1.4250446379089374, 1.4491259374847683, 1.4729478005526406, 1.4965058769481008, 1.5197958646773766, 1.5428135107029777, 1.565554611720347, 1.5880150149254406, 1.6101906187730781, 1.6320773737259362, 1.6536712829940434, 1.6749684032646428, 1.6959648454222904, 1.716656775259053, 1.7370404141746845, 1.7571120398666427, 1.7768679870098283, 1.7963046479259166, 1.8154184732421672, 1.8342059725395792, 1.8526637149902874, 1.8707883299840713, 1.8885765077438723, 1.906024999930197, 1.9231306202343068, 1.9398902449600732], [0.039740591715976346, 0.03580792899408285, 0.03211360946745563, 0.028657633136094682, 0.02544, 0.022460710059171607, 0.01971976331360947, 0.017217159763313616, 0.00623, 0.00596, 0.0058, 0.00568, 0.0056, 0.00553, 0.00546, 0.00544, 0.00541, 0.0053, 0.00544, 0.00606, 0.00724, 0.00845, 0.00958, 0.01059, 0.01169, 0.01288, 0.01422, 0.01595, 0.01831, 0.02117, 0.02544, 0.05617636179033837, 0.08690711074392542, 0.11762663504898299, 0.14832932494349102, 0.17900957373959978, 0.20966177884747905, 0.24028034279842053, 0.2708596742670035, 0.30139418909213994, 0.33187831129681106, 0.36230647410630834, 0.3926731209647958, 0.4229727065500046, 0.4531996977858767, 0.4833485748529741, 0.5134138321964631, 0.543389979531498, 0.5732715428458139, 0.6030530653993481, 0.6327291087207085, 0.6622942536003054, 0.6917431010799637, 0.7210702734388414, 0.7502704151754664, 0.7793381939857161, 0.8082683017365626, 0.8370554554354022, 0.8656943981947944, 0.8941799001924364, 0.9225067596261887, 0.9506698036639916, 0.9786638893884864, 1.0064839047361744, 1.034124769430945, 1.061581435911793, 1.0888488902545674, 1.1159221530875758, 1.1427962805008764, 1.1694663649490997, 1.1959275361476238, 1.2221749619619495, 1.2482038492901073, 1.2740094449379362, 1.2995870364870759, 1.3249319531555115, 1.3500395666505154, 1.3749052920138318, 1.3995245884589445, 1.4238929602002812, 1.4480059572742, 1.4718591763516045, 1.495448261542049, 1.5187689051891748, 1.541816848657345, 1.5645878831093174, 1.5870778502748366, 1.6092826432099794, 1.6311982070471371, 1.652820539735483, 1.6741456927717948, 1.6951697719215013, 1.7158889379298154, 1.7362994072228328, 1.7563974525984543, 1.7761794039070224, 1.795641648721533, 1.814780632997312, 1.8335928617210235, 1.8520748995489058, 1.8702233714341048, 1.8880349632430002, 1.9055064223604068, 1.9226345582835418, 1.9394162432046487]], "cm": [[-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669], [-0.09994117752385662, -0.09711004127918231, -0.09581086054830669, -0.09459784035861409, -0.09245347189548467, -0.09153257076964845, -0.09001574556005669]], "boundary_layer": {"angle_of_attacks": [-0.06981317007977318, 0.0, 0.03490658503988659, 0.06981317007977318, 0.13962634015954636, 0.17453292519943295, 0.24434609527920614], "reynolds_numbers": [10000.0, 50000.0, 100000.0, 300000.0, 500000.0, 750000.0, 1000000.0]}, "lift_distribution_func": null, "drag_distribution_func": null, "lift_distribution": [[[-1.6470045744561632, 1.6324685435018702, 0.5984913458180205, 0.04447241567611921, 0.005752833132020015, 0.0022393881794874008, 0.0001497237154537821, -0.0018771829603368851, -0.004555800736469952, -0.008093622361508379, -0.012114355480663393, -0.01629190108027036, -0.020439762425065268, -0.024437973806804972, -0.028216333043156887, -0.03173150257814024, -0.03494448187634454, -0.037797374713293815, -0.04018148763410992, -0.041939129311059836, -0.04467171053294966, -0.0451392245636949, -0.04513391788959742, -0.044727682948063174, -0.04405890649736946, -0.04337421815598706, -0.043018340205242526, -0.04301204935110505, -0.04320767012260637, -0.04351472623982351, -0.04388565947287958, -0.04428730088870989, -0.04469828938296425, -0.04509989436113321, -0.04546735656437412, -0.04576920660704182, -0.046015314952376485, -0.04622404024056295, -0.046365166633288456, -0.0464560531491891, -0.046532880068983415, -0.046717972543188005, -0.047083065928940904, -0.047499086276526076, -0.047759485923820955, -0.04760816383732075, -0.04684604980216338, -0.04528031292097369, -0.04271358412193785, -0.03901834478488849, -0.03437040460126455, -0.0290078527870201, -0.023063730192225927, -0.01647716888009797, -0.009110509560628663, -0.0006961191116059284, 0.008415882155061201, 0.017493788088880104, 0.025688226305247405, 0.03262292188114864, 0.03852745679991255, 0.04367345382244732, 0.0482008403908529, 0.05210341830339764, 0.05536649359694378, 0.05799425887866409, 0.059992042705039855, 0.06133502350099221, 0.06208147687741777, 0.062377217603170144, 0.06237415287184684, 0.06222841755769493, 0.062152642759458504, 0.06238071029876823, 0.06286144243604866, 0.06339111033179941, 0.06384324092559675, 0.06411876149201517, 0.06410768091413946, 0.06376331251328522, 0.0631544794229761, 0.06234827266574871, 0.061392783926062636, 0.060344746708085345, 0.059241546973631314, 0.058050941459205314, 0.056703708700883294, 0.05514342384033319, 0.05331838468269358, 0.0511649973797037, 0.048807505284217095, 0.04591444955915602, 0.04268068219345465, 0.03908522064104818, 0.0350946692663435, 0.03060415960492959, 0.025333642582485147, 0.018772596766888385, 0.009759473873716899, -0.004046966000429867], [-1.0546139637201721, 0.8610460920260768, 0.3133332215189658, 0.03397673714180122, -0.012938687708860511, -0.015546259166158127, -0.01700341795515035, -0.019611513549385933, -0.02477073983578473, -0.0328105829211554, -0.04259590544654205, -0.05317335052073364, -0.06392493836034421, -0.07444700231806081, -0.0844966645782499, -0.09391945593441961, -0.10258172789508838, -0.1103049514813, -0.11675806491997556, -0.12144938227306258, -0.12641589281685034, -0.12776344456352667, -0.12778351425063694, -0.12667840071076625, -0.12483821514807934, -0.12295961897804977, -0.12201220550434169, -0.1220534306776856, -0.12266298347332899, -0.12358699744244127, -0.12469213643098853, -0.12588665128426507, -0.1271105952573605, -0.12831151596237053, -0.12942032969479805, -0.13034947378887318, -0.1311217832918006, -0.13177538343300818, -0.13226304827595514, -0.13261962130841876, -0.13294750310024908, -0.133593090359064, -0.13475951684198895, -0.13608363562817646, -0.1369837927942947, -0.13673309345237178, -0.13476520013868246, -0.13052944908253264, -0.12345943171744239, -0.11318323594304766, -0.10000554196812973, -0.08477592706239241, -0.06787325234635827, -0.04913092875314758, -0.028167748297421573, -0.0042300341945989625, 0.021691993520975672, 0.04752584478211202, 0.070867429884994, 0.09064961251379614, 0.10751765227425081, 0.12223630243431552, 0.13519636202174856, 0.14637809620630463, 0.15573925358826105, 0.16329141522125812, 0.16904974087375554, 0.17294471964922478, 0.17514218616469437, 0.17605491281780905, 0.17611270122261852, 0.17575710022459232, 0.1755889159078666, 0.17627132496603481, 0.17766300413678812, 0.17918900470173593, 0.1804923680015096, 0.18129345059142182, 0.181281622112465, 0.18032393965708746, 0.17861465194557039, 0.17634344034353805, 0.17364674756787668, 0.17068849069558759, 0.16758311217117045, 0.16423325418697632, 0.160430845030822, 0.1560237549559, 0.15086670897863663, 0.14478083878410972, 0.1378837688876663, 0.1297867580377956, 0.12074482551991332, 0.11070867627291825, 0.099600702199037, 0.08715911224938376, 0.07266406902812918, 0.054587035635153824, 0.0305907755392396, -0.00507933963400317], [-0.5797499211983312, 0.47677506545965614, 0.15953590139042917, 0.014095916042346637, -0.022811181664856617, -0.02381603898136547, -0.024280485849653925, -0.02642889908038955, -0.03170197999585241, -0.04040848181702585, -0.05122442244764041, -0.06304558023509411, -0.07513705145447605, -0.08701736851700441, -0.09839532124004154, -0.10908469360224865, -0.11892552595034941, -0.1277086006507785, -0.13504697088917675, -0.14036307785711888, -0.1453207841029431, -0.14687652231213322, -0.14690912512693982, -0.14565083215909672, -0.14354968429428958, -0.1414061796263263, -0.14033329804856298, -0.14039672380666743, -0.1411126367210135, -0.14218979566389617, -0.14347526380367281, -0.14486414595266106, -0.1462876672, -0.14768568140473487, -0.14897904055183145, -0.15006749275602987, -0.15097590320716173, -0.15174434213198756, -0.15232892080710764, -0.15276581390614963, -0.15317273944300708, -0.153947958672442, -0.15532501856615213, -0.1568870406388427, -0.15796616235770297, -0.1577229096119585, -0.15550864168614725, -0.15068914559190402, -0.1426114023179684, -0.13084491146726404, -0.11568750034998426, -0.09816349022468512, -0.07870945680086495, -0.05713582735490534, -0.033006849737673434, -0.005457052717307196, 0.024376865427538183, 0.054113205568038864, 0.08098911373586933, 0.10377607697750033, 0.12321287368587455, 0.1401756945759693, 0.15511435874484275, 0.16800631791601006, 0.17880290025248308, 0.1875173720425038, 0.19416720784695302, 0.19867269314953545, 0.20122418360765673, 0.20229572487807576, 0.20238133344014494, 0.2019884900223294, 0.20180758272473398, 0.20260145223288226, 0.20420930723477526, 0.2059684054375002, 0.2074709960939148, 0.2083957748789776, 0.20838584825542067, 0.20728795997322091, 0.20532509328145646, 0.2027152182066236, 0.1996152550524899, 0.19621452095023456, 0.19264687851973336, 0.1887986955572983, 0.1844274724190594, 0.1793603929347431, 0.17343075207499556, 0.16643323893051956, 0.15855747638476664, 0.14927078161274987, 0.13889867387363897, 0.12738554754548703, 0.11464421828368154, 0.10038201403698543, 0.08378698675847525, 0.0634227110010403, 0.03937350179214884, 0.0028635117421087755], [-0.23448954344955353, 0.1658387892939905, 0.005260103947653576, -0.036601879056487936, -0.039052972117777064, -0.0377559852408289, -0.036783448578751834, -0.038403970036391406, -0.04422070781251993, -0.05453367440660379, -0.06764507324571013, -0.08214874030566624, -0.09708435798108986, -0.1118210047672238, -0.12597518642581365, -0.13930043088551364, -0.1515864391583799, -0.16256366845425307, -0.17173489434063113, -0.17835431639209126, -0.18365161314629325, -0.18562629143335488, -0.18567977238375033, -0.1841051507939343, -0.18146811834567314, -0.17877987280319305, -0.17743959302885906, -0.1775357409446979, -0.1784557421215125, -0.17983197477612367, -0.18147148407338268, -0.18324291232159157, -0.18505935915211424, -0.18684493978636085, -0.1885000181318207, -0.18989847143735503, -0.19106991904355952, -0.19206012824555782, -0.19282701953860074, -0.1934112367498141, -0.19396136039036305, -0.19498037909652163, -0.19676337599399593, -0.19878461227849037, -0.20020129090609468, -0.1999562342432459, -0.1972249051114321, -0.19120405023538858, -0.18106559104104666, -0.16626151437050551, -0.14710041190140477, -0.12493799689474756, -0.1003278808462772, -0.07303300124444617, -0.04250551555316015, -0.007652390196795092, 0.030090549957271933, 0.06771680813264257, 0.10173423934420989, 0.13058696751468277, 0.1552051284347397, 0.176695193390368, 0.1956240713738028, 0.2119629677781792, 0.2256501157084399, 0.23670212023945242, 0.2451410249517273, 0.2508662809780397, 0.2541186418681045, 0.25549725543249985, 0.25562655597842787, 0.2551478104451236, 0.2549330512401659, 0.2559467617873101, 0.2579870076083006, 0.260219906746221, 0.2621275126545428, 0.2633040139901875, 0.2632985596080203, 0.261917224231751, 0.25944166018154996, 0.2561472707314951, 0.2522324897974596, 0.2479377532686479, 0.24343526664717535, 0.23857929661239421, 0.23305911352364117, 0.22665895022690946, 0.21916848479208886, 0.2103286293760286, 0.20028048858515188, 0.1885786809299566, 0.17514480492390577, 0.16070715748017497, 0.14476818213720669, 0.1269898923936553, 0.1064135826775034, 0.08139984863875856, 0.04924686705552878, 0.003259078601665284], [-0.1524647916177476, 0.08068596310856463, -0.010583111823344349, -0.043421161449735485, -0.04418615230280508, -0.04200108177137489, -0.040480308770008105, -0.041824480400198906, -0.04764214949591139, -0.05821840054586556, -0.07176757100626836, -0.08681384324705885, -0.10234151035539382, -0.11768270725729789, -0.13243089742864897, -0.14632441472577276, -0.15914043304651013, -0.1705950616633469, -0.1801650173354702, -0.18706425973101487, -0.19229908332087797, -0.1943619720224725, -0.19441584608167978, -0.1927670158752121, -0.1900071132058744, -0.18719428616124403, -0.18579872459978045, -0.1859068763845193, -0.18687724046686294, -0.18832522427790238, -0.19004896106895158, -0.19191104191464006, -0.19382057681432974, -0.19569819574614558, -0.19743968205166007, -0.1989131383451944, -0.20014897048274674, -0.20119350230083805, -0.20200695304885566, -0.20263022644789647, -0.2032188450396017, -0.20429946564424675, -0.20618123741164754, -0.20831411230824343, -0.2098159587785328, -0.20957959544997098, -0.2067413358161661, -0.20045953362873897, -0.1898662075463146, -0.17438627006648214, -0.1543210238921826, -0.131114380476341, -0.10534109494985787, -0.07675348289777793, -0.04477866979291917, -0.008272426402147693, 0.03126396751945819, 0.07067859574464885, 0.1063148335597321, 0.13654363297572522, 0.16233875799067962, 0.18485841700738478, 0.20469544353862654, 0.22181934625210945, 0.2361653696468286, 0.2477508699319023, 0.2565989391253148, 0.2626043767255871, 0.26601941962901376, 0.26747147000779964, 0.2676143392307937, 0.26711946945150916, 0.2668999060517973, 0.26796571116120077, 0.27010576154649524, 0.27244705626498433, 0.2744473620384236, 0.2756818403483659, 0.27567847178845983, 0.2742341268752069, 0.2716436777853555, 0.2681954770234854, 0.26409734239143207, 0.25960141289075206, 0.25488898105678925, 0.2498067668924333, 0.24402803514773652, 0.23732770699208772, 0.22948567141467718, 0.2202110470495419, 0.2091048830622874, 0.19688981521879512, 0.18326050264645788, 0.168154767024723, 0.15147591443309727, 0.13287019903126623, 0.11133395560320292, 0.0851510532654592, 0.05149220084544653, 0.0033327673969899604], [-0.1137702113183507, 0.03474718408165168, -0.021420156094463343, -0.04817954888128661, -0.04779648866975608, -0.04500032392184139, -0.04310188155842516, -0.04426091017065378, -0.05009362663669712, -0.0608756406524657, -0.07475694067886718, -0.09021054866398147, -0.10618046548655537, -0.12197197572964347, -0.13716182071368857, -0.15147732357804325, -0.1646865626108715, -0.17649515838165772, -0.1863607589815587, -0.193467932848157, -0.1986492442406851, -0.20078493208443599, -0.20084529782034893, -0.19914677909990317, -0.19630056105569052, -0.1933998031170175, -0.19196294113805304, -0.1920794441549031, -0.19308649102481656, -0.19458693820435388, -0.19637233867596574, -0.1983008143014389, -0.20027852712077873, -0.2022235294502562, -0.2040282184074444, -0.20555643152642586, -0.20683918963457398, -0.207923314302102, -0.20877049619186408, -0.20942192171747287, -0.210038247986019, -0.21116358710991392, -0.21311743636459707, -0.2153317842971398, -0.21689548105583809, -0.21666449153744052, -0.2137462829244743, -0.20727093779295672, -0.19634637707964317, -0.18037182098413437, -0.15964432785665866, -0.13566380387673843, -0.10902958711814194, -0.07948612522357958, -0.04644214866534899, -0.008715805019927494, 0.03214163512014548, 0.07287355608241608, 0.10970208344949392, 0.14094422230620146, 0.16760591557670726, 0.1908835434756294, 0.21138907233784268, 0.22909077078479068, 0.24392168215517399, 0.25589971771165476, 0.26504874127836403, 0.2712601189085045, 0.2747945478938872, 0.27630025844193545, 0.27645272433923324, 0.2759456314433072, 0.2757222578751153, 0.2768262507844397, 0.27903968995189254, 0.2814607292184599, 0.28352922759291554, 0.2848063178797072, 0.2848043749696848, 0.2833134899065865, 0.28063828248609335, 0.27707665145287347, 0.27284332965525426, 0.2681990626282934, 0.26333178981253436, 0.2580827050880195, 0.2521133480535521, 0.24518473024850024, 0.23707298174330974, 0.22749902753082613, 0.21622629518493564, 0.20358522586520306, 0.1894876148236399, 0.17386776251237138, 0.1566248014868386, 0.1373924575548, 0.1151330487162196, 0.08807255190392176, 0.05328699941260229, 0.0035313240125200815], [-0.09611015498074467, 0.01040277164944442, -0.02832408986725998, -0.051336193190318215, -0.05022831935974337, -0.047037863776297366, -0.044895183803492715, -0.04594132046424192, -0.05180261062661094, -0.0627495946014575, -0.0768856502525561, -0.09264655823013819, -0.10894746923723131, -0.1250744718066575, -0.14059238290759057, -0.15522069377764103, -0.1687209911786889, -0.18079132174358467, -0.1908755405494991, -0.19813702350558646, -0.20331786572525043, -0.2055062100116241, -0.20557047189586358, -0.2038346516416999, -0.2009243716880574, -0.1979585313610936, -0.19649096766671947, -0.19661315256321094, -0.19764659998991596, -0.19918498183650354, -0.20101502408984975, -0.2029915687398966, -0.20501861300699056, -0.20701231119240962, -0.20886257878862965, -0.21043011872877587, -0.21174646094863853, -0.2128589165751154, -0.21372999552164598, -0.21440122294673672, -0.21503705377352442, -0.21619443603141833, -0.2182003736249855, -0.22047355107966418, -0.22208151690002756, -0.22185323135213916, -0.21887655954859875, -0.21226053244017923, -0.20108561749764794, -0.18474203416175308, -0.16352506836174519, -0.13897766243838805, -0.1117131494133204, -0.08147012704144281, -0.047643778487898344, -0.009024670518705742, 0.032799297043385474, 0.07449485935590316, 0.11219537147260966, 0.14417839790137676, 0.1714735020904726, 0.1953050498660947, 0.21629904445694398, 0.23442285315030342, 0.24960791636284643, 0.2618725548330682, 0.2712411980590335, 0.2776026942859189, 0.2812239345680367, 0.28276840366778583, 0.2829274357231254, 0.2824110048619648, 0.28218452947850353, 0.2833162369821853, 0.28558320340097704, 0.2880624501461457, 0.2901807175412123, 0.29148886132795965, 0.29148782583397026, 0.28996274387487947, 0.28722537694789935, 0.283580615552119, 0.2792482537357478, 0.274495314875176, 0.2695145429781444, 0.26414312972411963, 0.2580276197988031, 0.2509339102293327, 0.24263026712413102, 0.23283055659265187, 0.22127479691947372, 0.2083417931605938, 0.19391685675802703, 0.177933656495742, 0.16028919048832987, 0.14060881386034838, 0.11783005431332556, 0.09013515546243213, 0.05453282832712832, 0.00360582017173562]], [[-0.003690741454440091, -0.00410010593299247, -0.0045693464053507635, -0.00542802278300071, -0.008375018434909311, -0.11458658707506415, -0.6929237128086033, 0.21416582836999692, 0.09093844701838755, 0.01096080745557829, 0.004582627122575206, 0.004042539646003226, 0.0036787695744407026, 0.0033260097425120137, 0.002940914252821345, 0.002517826109941715, 0.002066964536071794, 0.0016091546978041621, 0.0011698548098809589, 0.0007737611877976045, 0.0001035743381292442, -7.145187068098688e-05, -0.00015047773461267344, -0.00013801783817905607, -4.959375956337643e-05, 8.223010342657426e-05, 0.00020482126744319294, 0.0002925636504764016, 0.0003657064923851808, 0.0004404181024430254, 0.0005269852604069925, 0.0006367754942445099, 0.0007774302943134982, 0.0009536859439037241, 0.0011726688967136675, 0.0014438424069311878, 0.0017750410926620237, 0.0021737103657859976, 0.002647739995511283, 0.0032014056308329584, 0.003835443125252818, 0.004540956040953346, 0.005310266268814177, 0.006175777728373147, 0.00720419119892941, 0.008461350609999552, 0.009978695165428743, 0.011774071875624292, 0.013847338066793046, 0.01616467282675324, 0.018622386519030934, 0.021088668435881128, 0.0234695791588795, 0.02575707846432689, 0.0280024858419607, 0.030293510519059857, 0.03259494656507867, 0.034753268722211066, 0.03658798109670162, 0.03799192523781815, 0.039004928385201316, 0.039713171544508256, 0.04018072935920273, 0.04043666567334046, 0.0404889021756015, 0.040350573751454136, 0.04003488985377676, 0.039548833484788486, 0.03890731986920486, 0.03814779848753732, 0.03731879394784178, 0.03646888899005634, 0.035666100439092116, 0.03496991733588206, 0.03436238659635227, 0.03378451219461353, 0.03319521428480212, 0.03255850667972696, 0.0318492159577852, 0.031055973763783162, 0.03019788051246529, 0.029294815358990575, 0.028361661810425678, 0.027418875237894304, 0.0264733150473864, 0.02550197126538507, 0.02448098716570953, 0.023392666697409466, 0.022218668616027257, 0.020937460655826072, 0.01948881067114833, 0.017942252649147266, 0.01626578135708282, 0.014442171357269046, 0.01244191939109315, 0.010220852102328181, 0.007687185921645518, 0.004672562308361589, 0.0009769566095762692, -0.0024037387396177415], [-0.002597171530650431, -0.002684961931473688, -0.0027453678882322636, -0.002884229744025963, -0.0036548597089944694, -0.03807461582495942, -0.10185376791910938, 0.03128426942431403, 0.013688801385343443, 0.004057572245685001, 0.0021702099301690253, 0.0021088325319642224, 0.002033689126684417, 0.0019015661636865707, 0.0017098598647544447, 0.001468046899657285, 0.0011907958612672094, 0.0008975243347243863, 0.000610592093888507, 0.0003519255168404202, 3.142517575375259e-05, -9.204856131427814e-05, -0.00014672572249350513, -0.0001357522722620033, -7.03151406052359e-05, 2.594828071921443e-05, 0.00011485897607007613, 0.00017821552660279087, 0.00023086479743229511, 0.0002844926122392466, 0.00034657755532529897, 0.0004254254265734833, 0.0005266260509897118, 0.0006536377579186486, 0.0008116486286851159, 0.0010075451368571796, 0.0012470116635434837, 0.0015354490478967718, 0.0018785881730056105, 0.0022795139139358545, 0.0027387091579564797, 0.0032496166750324807, 0.003806623518959196, 0.004433362491554057, 0.005178471918539497, 0.0060902287076098835, 0.007191801651892768, 0.008496492212855413, 0.01000458481889656, 0.011691868495529355, 0.013488507661607791, 0.015292854291522405, 0.017036225955958665, 0.018712525423882548, 0.020358865906642775, 0.022039188002150316, 0.023727636441966543, 0.025311873415413907, 0.026659862972788172, 0.027693240694915175, 0.02844108367920989, 0.028966042448626828, 0.029314788072316637, 0.02950838112094104, 0.029552556134897896, 0.029456874953143374, 0.029230974489049873, 0.028879972989709173, 0.02841483889775581, 0.027862964631037507, 0.027259794286765764, 0.026640820507658612, 0.02605574339453728, 0.02554812844385305, 0.025104958159768487, 0.024683176479911792, 0.024253213433142795, 0.023790526564700945, 0.02327297304218023, 0.022693751480069926, 0.022066917497033853, 0.021407037989978946, 0.02072500837415105, 0.020035818859390934, 0.019344605809774696, 0.018634650130140467, 0.017888597045997365, 0.0170935962320346, 0.0162363344052211, 0.015301177334201778, 0.014264388917214923, 0.01314859013384497, 0.011941639662403932, 0.010632772189908244, 0.00920430072968098, 0.007629167992179056, 0.005850508513539039, 0.004063192400133838, 0.0018795180884597302, 0.00040637621135307546], [-0.002490480135133756, -0.0025270541462848474, -0.002520842698237149, -0.0025433689315160005, -0.0029725546677344854, -0.026392100948678086, -0.049725527446272, 0.015128368847584592, 0.0037689462460346926, 0.0019259079638502378, 0.001830364909398079, 0.001847265393858122, 0.001818198142181652, 0.00171910514259542, 0.001554121612139589, 0.0013355340125232214, 0.0010791858521634104, 0.0008048292810532515, 0.0005349621590474493, 0.00029169118007630945, 2.02784380692491e-05, -9.819622206573052e-05, -0.0001504053988072012, -0.00013935846479306655, -7.584564753417726e-05, 1.729508378697451e-05, 0.00010318172632397865, 0.00016431887582589444, 0.0002150855254536677, 0.000266760711523602, 0.0003265728008726486, 0.00040255924841595836, 0.0005001307687044244, 0.000622633435926274, 0.0007750833791409316, 0.0009641381838466788, 0.0011952894072398228, 0.001473754416566462, 0.0018050711892843554, 0.002192215965732689, 0.0026356434922282447, 0.0031289953504853134, 0.0036668392839028403, 0.004272034614307713, 0.004991625982264442, 0.005872368877289282, 0.006936728750273912, 0.008197637155060436, 0.009655458316360221, 0.011286878086252256, 0.013025673948663575, 0.014772259547477887, 0.016460161235356315, 0.01808342781717256, 0.019677885553785145, 0.021305376034569928, 0.02294084917514078, 0.02447555926793694, 0.02578170076096539, 0.02678342547377048, 0.02750886579263394, 0.028018575197854396, 0.028357683540808462, 0.028546530847655495, 0.028590654132773462, 0.02849929822835697, 0.028281785329735208, 0.027943071996509538, 0.0274937884379257, 0.02696044884458853, 0.026377349685009543, 0.025778835794692968, 0.025213002224158062, 0.024722029666539698, 0.024293344116393875, 0.02388529201636345, 0.023469360727156507, 0.02302220165059692, 0.02252152888652258, 0.021961105358378467, 0.02135455540133704, 0.02071598489640382, 0.020055941971243427, 0.019388942668745524, 0.01871998590342775, 0.018032914121135363, 0.01731095073599874, 0.016541678788200162, 0.015712235254273232, 0.014807513575664183, 0.013809185982134334, 0.012732689814291324, 0.01159087010511764, 0.01034031310175134, 0.008982135275540586, 0.007494408150370246, 0.005830999711856209, 0.003922906640781181, 0.0018183723965481157, 0.0003950191150990231], [-0.002395156698854377, -0.0023827676629113548, -0.0023127210680736845, -0.0022238626594233827, -0.0023271388727930664, -0.015271040064859027, -0.01669517453198222, 0.004874128669816545, 0.002261987375494294, 0.0014246211861394954, 0.001509860605813657, 0.00160179639614019, 0.001616788728131934, 0.0015490637678613234, 0.0014092239799392626, 0.0012122815092154165, 0.0009752492039510075, 0.0007182543214259842, 0.00046398919644050844, 0.00023479437178395305, 9.656170357049622e-06, -0.00010435699014231661, -0.00015434621694386156, -0.00014319834968820396, -8.135341164031755e-05, 9.05332506854103e-06, 9.228041246968948e-05, 0.00015146042925778295, 0.00020056390613815148, 0.00025051136531504804, 0.0003083114525488358, 0.00038176677252827276, 0.000476131413044043, 0.0005946531600390402, 0.0007421972824306193, 0.0009252204998903064, 0.0011490448291465582, 0.00141872629803588, 0.001739633393584888, 0.0021146465138330065, 0.002544194703768738, 0.0030220924254927306, 0.003543065502403538, 0.004129295470715484, 0.0048264303035990145, 0.0056798972540078934, 0.0067115500888221095, 0.007934001745845257, 0.0093476938997015, 0.010930107094036736, 0.012618296986655111, 0.014314376964389032, 0.015953805587928235, 0.017530755110164362, 0.019079858819059374, 0.020661123445229145, 0.02225020993019961, 0.023741535745776768, 0.025011024297137047, 0.025985031305838385, 0.02669084055402206, 0.027187338134602973, 0.027518134768614713, 0.027702949339284747, 0.027747146054916613, 0.027659691886846017, 0.02744963353724231, 0.02712178604149686, 0.02668647522910584, 0.026169438230448084, 0.025603966097276838, 0.025023398575101947, 0.024474425668007616, 0.023998020356534946, 0.023582011591612523, 0.023185978367917238, 0.022782342272982325, 0.022348833978690977, 0.021862968949554723, 0.02131903097677515, 0.020730265926526735, 0.020110376860834243, 0.019468477702723034, 0.018819747431161733, 0.018169164212497167, 0.017501015858223543, 0.016799028862169774, 0.016051172567966215, 0.015244992345114292, 0.014365865474404669, 0.013386193690116972, 0.012348664144242091, 0.01122848662650962, 0.010016973520838031, 0.008700294800586357, 0.0072571974693637605, 0.005642266484606959, 0.003789936803020945, 0.0017458826978696954, 0.00037045922089033154], [-0.0023723636219905734, -0.002345413473099958, -0.0022562592012497075, -0.0021341368088140353, -0.0021409173114844316, -0.012003727957971805, -0.010317348432434882, 0.0028883042265917696, 0.0018192863855739788, 0.001279103969430686, 0.0014181989392589387, 0.0015326170612835744, 0.0015607211028245077, 0.0015021509458234873, 0.001369452943234262, 0.0011784827187682413, 0.0009466392562652915, 0.0006942073644694254, 0.0004439892062551834, 0.00021844603121149537, 6.525559906003585e-06, -0.00010642518521733555, -0.00015587029657455618, -0.0001446668736940894, -8.317496851885514e-05, 6.627886478105146e-06, 8.925670054258912e-05, 0.00014799171226584191, 0.0001967142962349536, 0.00024626364021266206, 0.0003035992680622777, 0.00037647199519954795, 0.0004701014856508428, 0.0005877138101089563, 0.0007341406325038053, 0.0009157938796813455, 0.0011379574676816404, 0.0014056511470353784, 0.0017242054256372738, 0.002096534972710235, 0.0025230116411920655, 0.002997482119847046, 0.00351470406569348, 0.004096701531831852, 0.004788805767645501, 0.0056361444683811065, 0.006660428589391533, 0.007874195630504364, 0.009277903147102355, 0.01084921347692343, 0.012526018479881038, 0.014210724795559935, 0.015839186442174663, 0.01740557622207374, 0.018944324686115878, 0.02051504164830748, 0.022093649792282934, 0.023575323368747306, 0.024836827570039518, 0.025804905762185394, 0.026506549285645956, 0.02700023220686155, 0.027329275789936394, 0.027513294826748556, 0.02755761757315364, 0.027471149847908802, 0.0272628779814325, 0.026937585156711023, 0.02650550412869221, 0.025992281667374825, 0.02543090107532105, 0.02485447210086542, 0.02430937445742386, 0.023836325299857502, 0.02342327331802162, 0.02303007427655236, 0.02262935636935919, 0.02219911242654983, 0.02171674050538699, 0.021176315831652383, 0.020591152355782533, 0.019974917788093793, 0.01933781476111169, 0.018693880247107365, 0.01804799772581893, 0.017384615987445777, 0.016687589149280903, 0.015944978272112345, 0.015144419523943116, 0.014271393077989442, 0.013302677683553065, 0.012271704510921118, 0.011158613051072979, 0.009954755699671355, 0.008646586999716094, 0.007212905418946915, 0.0056085072042733886, 0.0037682423264629988, 0.001737426401688433, 0.0003704925838193777], [-0.0023594965500035848, -0.002323443763746765, -0.0022223138666933218, -0.0020793623968754535, -0.002025926270885848, -0.009970533221106699, -0.007159831638114852, 0.001902980067149017, 0.001543648199114175, 0.0011890209610977294, 0.0013618066988945081, 0.0014903209947720636, 0.001526623805308698, 0.0014737334122225524, 0.0013454164828189188, 0.0011580641078223438, 0.0009293262044757403, 0.0006795975126513301, 0.00043176178384678323, 0.0002083684503211502, 4.57556045959653e-06, -0.00010777679061549105, -0.00015691062673178763, -0.0001456661222525897, -8.435934924832841e-05, 5.1180252070929665e-06, 8.742075368189833e-05, 0.0001459116582197707, 0.0001944244164924366, 0.00024375365987087564, 0.0003008322388468847, 0.00037338308361253223, 0.0004666073619761174, 0.0005838164732412797, 0.0007297365992704405, 0.0009107423878881992, 0.0011320909945659653, 0.0013987800796207966, 0.0017161179431839002, 0.0020869519758597178, 0.0025117045978867774, 0.0029842539127779852, 0.0034993746035809985, 0.004079000729136524, 0.0047682937204669385, 0.00561222372852438, 0.0066324310307683, 0.00784142021245176, 0.009239665771934108, 0.01080493677956741, 0.0124756149949391, 0.014154234144554063, 0.0157768619518409, 0.01733767525091348, 0.018870966138977572, 0.020436133351399235, 0.022009223942665673, 0.023485805527497686, 0.024743087706422952, 0.025708035235544713, 0.026407499870730145, 0.0268997182491343, 0.027227869118253055, 0.02741164994269312, 0.027456250380874927, 0.02737052283797655, 0.027163408437218296, 0.026839665139426292, 0.026409482672192196, 0.025898311230849486, 0.025339104190144904, 0.02476486553682578, 0.024221814368738798, 0.023750528533525706, 0.02333900411155078, 0.022947243318972896, 0.022547642225180582, 0.022118971373778717, 0.021637841063555565, 0.021099065870824794, 0.02051579071461504, 0.019901593104399436, 0.019266625775616403, 0.018624868250596883, 0.017981181321586222, 0.01732006660139205, 0.016625435880043095, 0.01588539346199389, 0.015087620564346774, 0.014217650733040488, 0.013254705405507064, 0.012227623483793361, 0.011118721870649852, 0.00991938151248912, 0.008615961253061615, 0.007187440307175437, 0.00558875795717984, 0.0037549677930453895, 0.0017311415397535399, 0.0003683593691993164], [-0.0023523313337644367, -0.002310875777421716, -0.0022026273675917747, -0.002047301193227456, -0.0019581603690721782, -0.008766602078917538, -0.005589399655787681, 0.0014118971834445552, 0.001380297593351652, 0.0011358548824598048, 0.00132864598663832, 0.0014655411786382681, 0.0015067110324588715, 0.0014571770432821192, 0.0013314319343889268, 0.0011461874112093863, 0.0009192455905871403, 0.0006710703682500729, 0.0004245983383956106, 0.00020243561923758829, 3.4205675232776925e-06, -0.00010859907241988862, -0.0001575580147730946, -0.0001462869572951693, -8.507792195342334e-05, 4.224036357283934e-06, 8.634958546551408e-05, 0.00014470724284012195, 0.00019310512135920445, 0.0002423135542379469, 0.00029936409443061935, 0.00037186048076220637, 0.00046498435274600297, 0.0005819396405956527, 0.0007275258355611872, 0.0009081132330631941, 0.0011289519234460234, 0.0013950306757851939, 0.0017116483382368633, 0.002081647378036548, 0.0025054496201973872, 0.0029769455629678246, 0.003490917317937391, 0.004069250121049553, 0.004757013768188422, 0.005599094174606212, 0.006617094073359256, 0.007823500902234819, 0.009218799099078417, 0.010780816001470133, 0.012448210391925672, 0.014123570847002385, 0.01574308158254974, 0.017300921923295576, 0.018831308364045545, 0.02039352458350767, 0.02196367913383322, 0.02343754791880593, 0.024692578042469788, 0.025655857777622595, 0.02635431729323773, 0.026845940233371213, 0.02717382137576839, 0.027357466158000363, 0.027402162763498744, 0.027316756484559838, 0.027110175288624836, 0.026787169668683154, 0.02635791444760671, 0.025847813653656616, 0.025289757022844868, 0.024716684559664064, 0.024174725691611675, 0.023704381551330367, 0.02329367251754267, 0.022902255761565453, 0.02250331379297182, 0.022075389018873737, 0.021595116979830298, 0.021057317798334984, 0.020475110889128727, 0.019862049533321532, 0.019228265235943516, 0.018587708992747958, 0.01794523072334216, 0.017285361522796933, 0.016592044866387285, 0.01585340869023916, 0.015057158616992755, 0.014188856894664578, 0.013229359973371286, 0.012204300500498647, 0.011097567194279734, 0.009900565432923244, 0.008599830828282645, 0.007174119428337068, 0.005578496989203014, 0.0037481743386540258, 0.0017280913841280535, 0.00036752421646820186]], [[-0.0001664148926006843, -0.00022174771059010266, -0.0002602024579626707, -0.00028541838018169034, -0.00030501786065183093, -0.0003417386926334338, -0.0004724363313625043, -0.004065985749198652, -0.037312888540013724, -0.09837215139062176, 0.18024521275813601, 0.05096778458549444, 0.013186096516882908, 0.003666827315585283, 0.0033787786404071126, 0.0032129189437068275, 0.0030787107620361288, 0.002954292544742774, 0.002834992213157442, 0.002719868146504506, 0.0024685614949536048, 0.002429900089495979, 0.0024202926798785416, 0.0024404247238083735, 0.0024879585428125212, 0.0025560308488713286, 0.0026313925743215332, 0.0027028943452633647, 0.0027755634291731536, 0.0028544993308813223, 0.0029437111471511566, 0.0030487050798524875, 0.003173167726287244, 0.003319038795717529, 0.003489352610212862, 0.0036881839610148296, 0.003920527267571611, 0.004191331909538014, 0.004505002626138373, 0.004864489649469284, 0.005272201363804968, 0.005729494511503622, 0.006236385007599049, 0.0068061965397944015, 0.00746794074286919, 0.008246020616259444, 0.009147195338045717, 0.010169930919168983, 0.01130117186967765, 0.012511108323130024, 0.013743010616140213, 0.014931698508837672, 0.016028873426946342, 0.017026823831426893, 0.01794977233644052, 0.018835504599331466, 0.01968193531441487, 0.020439492295844543, 0.021049233017790325, 0.021470265124298255, 0.02171485426474611, 0.02181969559334364, 0.021815546554208438, 0.021720393868057672, 0.021540180780528724, 0.021282804183401626, 0.02095608747030543, 0.020565807658710952, 0.020117382048844785, 0.019616994131056237, 0.01909991080532499, 0.0185799794722116, 0.018085785555801804, 0.017639210092333924, 0.017231721001851715, 0.016839649337810982, 0.01644617123444366, 0.016037865781455312, 0.015600277546392849, 0.015131743617363701, 0.014639804288197559, 0.014132541314676055, 0.013616129118854013, 0.013099590473330211, 0.012584560576964469, 0.012059097216014758, 0.011513338912767271, 0.010939628603460257, 0.010329876726769355, 0.00967477217457578, 0.008940021943296607, 0.008167960104667908, 0.007337158547318823, 0.006438086396990973, 0.005455588346143553, 0.004368018659725143, 0.003133440454235695, 0.0016817941526504788, -4.925326690591277e-05, -0.0013009792985009185], [-0.00015041418499362244, -0.0001631585871876821, -0.00015202914907205725, -0.00011556211505607817, -5.288074161584915e-05, 3.0253206654334334e-05, 0.0001011524083737225, -0.0014697471893526347, -0.007061890922151491, -0.020015839263408903, 0.0407565077473221, 0.011155533559345154, 0.0036079229196669216, 0.0032691216870627112, 0.003182426410178935, 0.003123391432538145, 0.0030542619151856963, 0.002972238537578995, 0.0028822557309816322, 0.0027892770685706446, 0.0026354677312244016, 0.0025986810175085834, 0.0025921809836997236, 0.002616873741851493, 0.0026703597116783857, 0.0027453086275579753, 0.002827549978355184, 0.0029054353611593416, 0.0029845106342160123, 0.003070271089818531, 0.0031670426451108178, 0.003280792951378031, 0.0034155267204410643, 0.003573351956300196, 0.0037575556706214274, 0.0039725480287459685, 0.004223724228336409, 0.004516431893283016, 0.0048554339658854325, 0.005243911175057461, 0.005684444007405138, 0.006178465801478957, 0.006726017682448041, 0.007341563286235769, 0.008056515585548851, 0.008897422450284787, 0.009871716803321478, 0.01097786210978889, 0.012201886252089433, 0.01351169549195153, 0.01484800479300909, 0.016138122859759928, 0.017329705037036316, 0.01841430181111092, 0.019417986594490486, 0.02038164304832936, 0.021302851923268428, 0.02212773932274884, 0.022792314602518685, 0.02325231672302539, 0.023521108458353795, 0.02363814398382615, 0.02363684401070952, 0.023536594353977636, 0.023343808673236453, 0.023067024155689522, 0.02271470393723236, 0.02229309231144136, 0.02180831590712813, 0.02127192641939604, 0.02071322237104501, 0.020151033079177257, 0.019616474172705047, 0.01913333938127402, 0.01869239594325991, 0.018267981654324517, 0.017841886537430032, 0.017399582918523084, 0.016925413371235213, 0.0164175988469312, 0.015884417750574458, 0.015334645408563894, 0.01477497698479715, 0.014215180569945054, 0.0136570580858902, 0.0130877377809544, 0.012496585256863096, 0.011875360094156875, 0.011215360263496335, 0.010506565735556039, 0.009729611494736126, 0.008904246627629571, 0.008018342934876948, 0.007063152269413251, 0.00602485689862873, 0.005005390769128294, 0.003773399661830751, 0.0023845196197089563, 0.0009128752147099204, 0.0002968713229427291], [-0.00014393324305956716, -0.00014550409043954062, -0.00012177276620750345, -6.998357118085267e-05, 1.2916464612030446e-05, 0.00012563012014455707, 0.0002473633364174358, 0.0002586004019029505, -0.0014216102401585441, -0.009245034900556101, 0.021531143560253468, 0.008598182288586394, 0.003308567085845939, 0.003115394928050905, 0.0030819415215632014, 0.0030513575691630953, 0.0030000806186784744, 0.002930267001227232, 0.0028492491015283195, 0.002763434270894583, 0.0026371583396929115, 0.002601431382034966, 0.0025958339268603737, 0.0026213147371619873, 0.0026754959005464533, 0.0027510417415509783, 0.0028337664712308605, 0.0029120757134364398, 0.002991562009516777, 0.0030777364848495505, 0.003174938874461559, 0.0032891621766881676, 0.00342443029021878, 0.0035828615364684622, 0.0037677565072864187, 0.003983542645879197, 0.004235633838141261, 0.004529396489076553, 0.004869611170722108, 0.005259468139950416, 0.005701551774791642, 0.006197292679945079, 0.0067467378317599865, 0.007364417850801803, 0.00808187200265352, 0.008925784636142752, 0.009903645752356572, 0.011013942248650268, 0.012242684860302219, 0.013557694496003789, 0.014899957085675795, 0.016195985538339897, 0.017393213250143976, 0.01848313301608941, 0.019491886392074716, 0.020460514370436788, 0.02138654958100715, 0.02221585428424685, 0.022884140265885197, 0.023346972356145516, 0.023617786537589346, 0.023736129381017487, 0.023735583906652542, 0.023635592523461747, 0.023442589555941352, 0.023165143339086574, 0.022811749174952347, 0.022388673868617377, 0.02190213077470793, 0.021364873718637226, 0.02080420403893741, 0.020239939557067828, 0.019703360061412, 0.019218379112024293, 0.01877572814425575, 0.018349633656340063, 0.017921813989002226, 0.017477684038113773, 0.017001522120355925, 0.016491547152212432, 0.01595609794754223, 0.015403990974660177, 0.014841950617209318, 0.014279783878016511, 0.013719307389834, 0.0131476116768649, 0.012554029897417367, 0.011930206963571194, 0.011267576553836305, 0.010556136101948322, 0.009787435227925434, 0.008967313133756323, 0.008089259861166589, 0.007145821308460348, 0.00612536450913655, 0.005012810017211887, 0.0037797776131999034, 0.0023886999355623856, 0.0009208899561922835, 0.00030753367960857983], [-0.0001377369104146151, -0.00012777836294435726, -9.095627138711959e-05, -2.3171764729496625e-05, 8.08851908986492e-05, 0.00022452180354221282, 0.00039915042658599317, 0.0005364161974425161, -0.0002846546560216654, -0.002030641053240895, 0.00866419813369423, 0.005986794794908248, 0.0030108917127333427, 0.0029673936711505874, 0.002988788561570468, 0.0029874704385964975, 0.0029544471778826633, 0.0028969983779008673, 0.0028249570735556766, 0.0027462430674989147, 0.002647957162681912, 0.002613201568945253, 0.002608516655634021, 0.0026348984727268647, 0.002689983312681614, 0.002766404731385967, 0.0028499124673092503, 0.0029289281133628776, 0.003009111602835301, 0.0030960093261589755, 0.00319399018159486, 0.003309093908383764, 0.003445378026720887, 0.0036049787813436183, 0.0037912221144960983, 0.004008568505568812, 0.00426246971913306, 0.004558329971748835, 0.004900964447202152, 0.005293584190742396, 0.005738786469990463, 0.006238003978782101, 0.006791289895084329, 0.007413293874357191, 0.008135793834632496, 0.00898570662526212, 0.009970606884563069, 0.011089000505069993, 0.012326832494409436, 0.01365172517564933, 0.01500474160549874, 0.016311320883436047, 0.01751848681647261, 0.018617643437362122, 0.01963509239430326, 0.020612177993959875, 0.021546374718980618, 0.022383086598158203, 0.023057497520818804, 0.023524840008255964, 0.02379867174499977, 0.02391877045069141, 0.02391900199481484, 0.023818933957191885, 0.02362504408479863, 0.023345962283130947, 0.022990246225307792, 0.022564207470092894, 0.02207417023261213, 0.021534173117397075, 0.020969549438715825, 0.020401205516040986, 0.019860697990194763, 0.019372146222678438, 0.018926212868669256, 0.01849692104848303, 0.018065665976503522, 0.017617791702896048, 0.01713749285974836, 0.016623012766647675, 0.01608282566561359, 0.015525829892386761, 0.014958809644836228, 0.014391650102503224, 0.013826191911276396, 0.013249446983568463, 0.012650689344161418, 0.012021620489361156, 0.011353481846522611, 0.010636188464802122, 0.00986014579277245, 0.00903399231137138, 0.008149284153959727, 0.00719849967857875, 0.0061698662419715595, 0.005048073109036025, 0.0038043199941470065, 0.0024007786947070854, 0.0009217030139154295, 0.00031670212796738303], [-0.00013572573659774483, -0.00012219014651942704, -8.132241296511242e-05, -8.608762624339597e-06, 0.00010195901819270712, 0.00025511709845587184, 0.0004460768094955082, 0.0006224266451537392, 6.933479395034523e-05, -0.0005761950685617218, 0.006066836181454788, 0.005170926798886088, 0.0029165099648739636, 0.002919556173690514, 0.0029579840899381423, 0.0029657623059106512, 0.002938432585030865, 0.002884862270776086, 0.0028156554767424964, 0.0027391971486120993, 0.0026496712099744685, 0.002615239059735309, 0.002610840660451298, 0.0026374861407187605, 0.0026928176735592107, 0.002769463820539596, 0.0028531631199320835, 0.0029323493079577777, 0.003012699752654537, 0.003099768364909199, 0.003197930397269092, 0.0033132363700590635, 0.003449751736445499, 0.0036096169867705775, 0.0037961638793569705, 0.004013860394761259, 0.004268166688977933, 0.004564495378616371, 0.004907669418330155, 0.005300904322871302, 0.005746799755132134, 0.00624678816975314, 0.006800924639122843, 0.0074238867286253556, 0.008147506820130108, 0.008998757329437423, 0.00998523450187983, 0.01110545106006287, 0.012345340300259114, 0.013672482905996848, 0.015028002453640325, 0.0163370505521664, 0.01754655656536889, 0.01864790227034429, 0.01966742275951605, 0.020646530967092083, 0.02158268487035603, 0.022421179941777343, 0.023097076201235776, 0.0235655306541162, 0.023840130400952224, 0.023960700332142662, 0.02396117322209548, 0.023861143417725342, 0.02366709814413139, 0.0233876810905024, 0.02303146400725175, 0.022604768448051916, 0.022113949160412393, 0.02157343533914183, 0.02100793294632116, 0.020438673630557406, 0.01989728050590149, 0.019407751752376978, 0.018960796111573332, 0.018530408281780368, 0.01809814839830458, 0.01764930129935318, 0.017167999743942293, 0.016652472200433935, 0.0161112037188761, 0.015553106375039693, 0.014984974772890453, 0.01441670981616981, 0.013850153826673013, 0.01327229517093397, 0.012672389348826321, 0.012042123937466478, 0.01137272546159024, 0.010654091707808892, 0.009877910398755988, 0.00905031128528805, 0.008164021255793788, 0.007211498512102282, 0.006180933729511087, 0.0050569576815532626, 0.003810671246981733, 0.0024042329381896562, 0.0009228873178897322, 0.00032349370090873773], [-0.00013443830635201108, -0.00011864246488502, -7.522134548358657e-05, 6.006512440603282e-07, 0.00011527251286522002, 0.0002744334153607596, 0.0004756974146497478, 0.0006767407778072727, 0.0002934604207876558, 0.00015243124501733855, 0.004764612503895914, 0.004654070211978238, 0.0028564927567959007, 0.0028889693330835407, 0.0029381630471173154, 0.0029516921200766614, 0.0029279656822541666, 0.002876854005529413, 0.0028094475394949193, 0.0027344243751212405, 0.0026504478790034453, 0.0026162242385624297, 0.0026120075164758473, 0.0026388166263776698, 0.002694297732981982, 0.0027710770943657156, 0.0028548878199295825, 0.0029341726650629436, 0.003014619363949535, 0.003101785938968248, 0.003200051153402216, 0.003315471643248851, 0.0034521174065496045, 0.003612131370083669, 0.0037988485835541495, 0.004016741252694524, 0.004271274206586708, 0.004567864745892763, 0.004911340179831032, 0.005304918476547764, 0.005751200512150042, 0.006251618423981166, 0.006806228475918234, 0.007429724179805708, 0.008153968665843746, 0.00900596635872924, 0.009993326285693811, 0.01111456566050977, 0.012355612004789369, 0.013684023430773367, 0.015040968607317202, 0.016351426035054115, 0.017562271511795246, 0.018664873741059382, 0.01968558590981444, 0.020665859545955494, 0.021603142484835292, 0.022442667898402213, 0.02311942500978039, 0.023588528272658858, 0.023863581812756093, 0.023984435730780074, 0.023985061172686794, 0.023885067139267396, 0.023690946096787957, 0.02341134944810642, 0.023054856851293295, 0.02262779544716442, 0.02213653855269379, 0.02159576066644384, 0.02102976820190487, 0.020459822135848512, 0.019917666868718237, 0.019427529352214753, 0.018980044564768594, 0.018549159210625863, 0.01811640585885312, 0.0176670518967656, 0.017185213473995216, 0.016669116940738107, 0.01612725632683191, 0.015568553008695135, 0.014999808370582813, 0.014430932747359723, 0.013863769792228045, 0.01328529496566882, 0.01268475372349649, 0.012053826241428034, 0.01138373111223846, 0.010664356907546033, 0.009888610988649507, 0.009056241838910593, 0.008168866569175336, 0.007215211520366872, 0.006183385490817426, 0.005057982685980085, 0.0038100258698757577, 0.0024020004974091434, 0.0009226297073097607, 0.00032248540772282925], [-0.000133663533457705, -0.00011651899777577598, -7.157544063119034e-05, 6.098834515629946e-06, 0.00012321567148849494, 0.0002859531031692228, 0.0004933597815818499, 0.0007091368299992815, 0.00042745396101360024, 0.0005171115110837988, 0.004112371304434687, 0.004345035571890353, 0.002820530520696958, 0.0028705761881679366, 0.002926195056795819, 0.0029431568915304295, 0.002921582773718659, 0.002871941292770757, 0.0028056127435674965, 0.002731449833871525, 0.0026507903115769674, 0.002616692721490981, 0.002612584657360079, 0.0026394902310533466, 0.002695058098093146, 0.0027719134786653187, 0.002855786893715642, 0.0029351270119940074, 0.0030156274962804845, 0.0031028485693267295, 0.0032011708900744618, 0.003316654468620095, 0.0034533718301918486, 0.003613467258135812, 0.003800277614602669, 0.004018277423245703, 0.004272934053067143, 0.004569667353370206, 0.004913307012294709, 0.005307072315495725, 0.005753564744407586, 0.006254216181421996, 0.006809083599185379, 0.007432869357697867, 0.0081574534868481, 0.009009858285885452, 0.009997700064995604, 0.011119498787106094, 0.01236117917003699, 0.013690287334682034, 0.015048021562511721, 0.016359260437043013, 0.017570850206457593, 0.01867403168456909, 0.01969524197045334, 0.020675951525324508, 0.021613618867256695, 0.02245346735721824, 0.02313047289426781, 0.023599722422528637, 0.02387480601409567, 0.023995800760161695, 0.023996491108610022, 0.023896505912179292, 0.02370234136381495, 0.023422653196453966, 0.023066025501345226, 0.02263878805572347, 0.022147315682539803, 0.02160710918098071, 0.021040726992337912, 0.020470444329093118, 0.019927980953117243, 0.019437564070373812, 0.01898983333367061, 0.018558722567773724, 0.018125755480486592, 0.017676190865791273, 0.01719413522140753, 0.016677809243318558, 0.016135708166959903, 0.015576758082764812, 0.015007763876819319, 0.014438817136078304, 0.013871588552582217, 0.013293043227721905, 0.012692416746947094, 0.012061382734693742, 0.011391153722216267, 0.010671611642064848, 0.009889764904096363, 0.009061081063351044, 0.008173575204592779, 0.007219606639519944, 0.0061873376668633686, 0.0050613696943390026, 0.003812716302171643, 0.0024038330882223276, 0.0009234526213307337, 0.0003225255664048371]], [[-0.00408689934139812, -0.003972271729581539, -0.0038334226847900467, -0.0036795577263572334, -0.003527505500026495, -0.003401208739967618, -0.0033272382398079523, -0.0033203146280486573, -0.003372231427375117, -0.003409032032146631, -0.0029677227320429288, 0.0004790379475315419, 1.645775752316097, 2.023609640818118, -0.16859653371617908, -0.015883545045922057, -0.012008180016022836, -0.011152596563020992, -0.010774480473181962, -0.010534247453512953, -0.009912099446113732, -0.009941976495251274, -0.010013195573267122, -0.010130520794722977, -0.010295216072764714, -0.010503274722324742, -0.010741094552688776, -0.010987580411267968, -0.01124879501446201, -0.011533387614445334, -0.011850123255129814, -0.012212977863691174, -0.012631241333156892, -0.013109209950355324, -0.013653725620027184, -0.01427400512001242, -0.014984032449700124, -0.015797960775117574, -0.0167274437171073, -0.017780997458990866, -0.018967803313326655, -0.020300276319517776, -0.021785552873693298, -0.023453665472276827, -0.025370226476780975, -0.027580642386416443, -0.030085771033843058, -0.03286286342976729, -0.035855935946596584, -0.038967055948480364, -0.042043144548771186, -0.04492356530560066, -0.04748785972367798, -0.04971193616104739, -0.051655166342585636, -0.05340142390982254, -0.05496936700038891, -0.056282228596167466, -0.057247206216708944, -0.057787415084661314, -0.057922830482496745, -0.05773413894294662, -0.05729556591505333, -0.05665740657535515, -0.05583793847116494, -0.054853629626758306, -0.053734747444763996, -0.05249633027801389, -0.05114969691087558, -0.049722595747126126, -0.04825879737120132, -0.04680141155220202, -0.04541305276668897, -0.044134390520598636, -0.04294400500382142, -0.041793039202306384, -0.040644994451255585, -0.03947065096083237, -0.03823879034276983, -0.03694936783321663, -0.03561814833495794, -0.03426188679615748, -0.032893672528002044, -0.03153370680347415, -0.030182738896194775, -0.028810377236019816, -0.02739573151326827, -0.025921846874426252, -0.02437049735039093, -0.022721057212047188, -0.02077127552672397, -0.018853863962618053, -0.016800475434533953, -0.014585290183780557, -0.01216722162994412, -0.009491652512208617, -0.006460466357592519, -0.002815858362502593, 0.0011823715394686993, 0.003577297673186165], [0.0028948124457774333, 0.0028494181728730447, 0.002789655656596193, 0.0027241031485527372, 0.0026672613997602936, 0.002639742292529334, 0.0026663300344286246, 0.002769058315992856, 0.0029598632481935986, 0.0032195784403313754, 0.003368661216505315, 0.002576970077060944, -0.512996755990395, -0.2796135820647181, 0.028600968631906754, 0.008509780309922275, 0.007390113204660986, 0.007186689689471944, 0.007109689315875516, 0.007055436566932271, 0.006875313262242809, 0.006908807931492208, 0.00696836406704122, 0.007057904531022085, 0.007178714967144273, 0.007328261506477565, 0.0074973899743248475, 0.007672165401108215, 0.00785706878937283, 0.008058155979308541, 0.008281567873513274, 0.008537120992561584, 0.008831356104382751, 0.00916730611167566, 0.009549780579253184, 0.009985248773942483, 0.010483504403753048, 0.01105446192887406, 0.01170629155801212, 0.01244495276847227, 0.013276850744729509, 0.014210644435967945, 0.015251409690292697, 0.01642030075028812, 0.017763322165249368, 0.01931244344229924, 0.021068386624114754, 0.023015318168214772, 0.025114133547050024, 0.027296322066461078, 0.02945619418433306, 0.0314793922475391, 0.03328146734045786, 0.03484544287913014, 0.0362127766764109, 0.037442217604840775, 0.03854655950209337, 0.03947174197412366, 0.04015252854452718, 0.04053516898249039, 0.040633863546024294, 0.04050451583749967, 0.04019960643759989, 0.03975424663557259, 0.03918127990687078, 0.038494378817386, 0.037711364413078034, 0.036843943629629, 0.03590025611005761, 0.03489985086991013, 0.03387344679527224, 0.032851299474748165, 0.03187733610510594, 0.03098011502836463, 0.030144604277011735, 0.02933653051616582, 0.0285304493707062, 0.027705928331686155, 0.026841126404906313, 0.025936027149972538, 0.025001720644546428, 0.024049982558822125, 0.02308999329590131, 0.022135898244810194, 0.021188242080345636, 0.020225794120813753, 0.01923399076097773, 0.018201041231474528, 0.017114277508788085, 0.015959362023212666, 0.014668788304771967, 0.013428097397377742, 0.012036282805460635, 0.010548799346646216, 0.008946298066825401, 0.007197794046785217, 0.005276020049727252, 0.003100848201690656, 0.0009474869747643159, 0.0004849594918428916], [0.002260743122651861, 0.0022318328512775003, 0.0021922109547530427, 0.0021489527419386225, 0.002113854326148018, 0.002103680287330806, 0.00213887587184246, 0.00223876937899679, 0.002415925531439147, 0.0026614456634598957, 0.002862229455202433, 0.002545378969217558, -0.28136266325596776, -0.10691422299534466, 0.013554034977440095, 0.0061449165424466165, 0.005567592276260235, 0.005482289483079127, 0.005457022378320463, 0.005435831524421597, 0.005342769810675631, 0.005371181271826859, 0.0054193571211151054, 0.005490461168185377, 0.005585568786471056, 0.005702756686231602, 0.005834963579792133, 0.005971490769359992, 0.006115871866378086, 0.006272823369715935, 0.006447128765333755, 0.006646439262066245, 0.0068758557617769785, 0.007137744983285642, 0.0074358563232173325, 0.007775231241831593, 0.00816349791916992, 0.008608379008056848, 0.009116239754219492, 0.009691721015413251, 0.01033980708686802, 0.011067235660222809, 0.011877974630816126, 0.012788523089492455, 0.013834723095633704, 0.015041506478474435, 0.016409458034996185, 0.017926263489781227, 0.01956148403825903, 0.02126177181567803, 0.022945087520849797, 0.02452201666419105, 0.02592676735022231, 0.027146097544021107, 0.028212275373808115, 0.029171060958676904, 0.030032368712223995, 0.030754036962681235, 0.03128520919384614, 0.031584037873488034, 0.031661622289562916, 0.03156139310793454, 0.03132431849823152, 0.03097772526504453, 0.030531624913968, 0.029997062123417923, 0.029387293439197455, 0.02871165432812813, 0.027976523915689777, 0.02719714997663625, 0.0263974708628813, 0.025601063979074794, 0.024842157470259727, 0.0241430089593543, 0.0234919046089539, 0.022862139005776147, 0.02223391560135688, 0.02159132564434572, 0.020917361714525795, 0.02021201376202752, 0.019483928766560608, 0.018742286267155555, 0.01799408927917077, 0.01725049072692962, 0.01651193877294384, 0.015761937144078513, 0.014989186628287172, 0.014184554655472645, 0.013338236030143266, 0.01243913561166991, 0.011467432731633176, 0.010449312662111791, 0.009365577025100776, 0.008206480709268835, 0.006956806925147781, 0.005599278217538448, 0.004105221189955276, 0.0024236698657847085, 0.0007437551692425193, 0.0003962080321708023], [0.0019058793914306434, 0.0018871062755914294, 0.0018597390091829127, 0.0018300641719992826, 0.0018084299245514598, 0.0018095406939634953, 0.0018515652637071823, 0.0019526134342811327, 0.0021260537651854976, 0.002369580032654339, 0.0026110566106090044, 0.002601970319051948, -0.13509676424188388, -0.02772245208323423, 0.006503116599118499, 0.004751357112840641, 0.004519187880133043, 0.00451024821100994, 0.004518794256555808, 0.004519058806852403, 0.004481357820237295, 0.004507238487720235, 0.0045492772651290056, 0.0046102271160385995, 0.004691055676423723, 0.004790189119250402, 0.004901749700009637, 0.005016875582668137, 0.005138574915614044, 0.005270812824004998, 0.005417611381602446, 0.005585407847436105, 0.0057784962832817055, 0.005998870310635361, 0.006249685057926146, 0.006535181392516661, 0.006861772697022483, 0.007235952142951795, 0.007663072663963742, 0.008147035287572208, 0.00869202659518835, 0.009303705592611329, 0.009985420633089988, 0.010751062490606266, 0.01163077371584028, 0.012645542520583555, 0.013795879805001842, 0.015071448018149202, 0.016446672215878262, 0.01787671238685622, 0.01929283508719105, 0.02061957085693174, 0.021801591653179894, 0.022827747759998178, 0.023725149018733092, 0.02453226944140078, 0.02525740119333664, 0.02586504986934707, 0.026312419508492686, 0.026564342094017358, 0.02663018273324709, 0.026546359697600747, 0.02634739570697416, 0.02605624781633013, 0.025681339971033147, 0.025232297263985477, 0.02471972953104681, 0.024151671890719567, 0.023533521292565692, 0.02287811558621907, 0.022205591079460994, 0.021535193795310444, 0.020896259002024808, 0.020307517790183482, 0.019759109110421266, 0.019228564925618325, 0.01869928509231139, 0.01815790597527163, 0.017590140051932816, 0.016995993340880738, 0.016382751374810586, 0.0157581434733274, 0.01512818900368052, 0.014502151910534552, 0.0138803920677733, 0.013249021933914447, 0.012598536056861996, 0.01192125445656625, 0.011208931338434949, 0.010452236945083477, 0.009643344589073897, 0.008787098646367631, 0.007875521234667886, 0.00690038494455595, 0.0058488137350886414, 0.004706119232469206, 0.003447848788561168, 0.002037107692216913, 0.0006245969471531742, 0.00035092451368126144], [0.001828944663320974, 0.00181257847318878, 0.001788093494905062, 0.0017616173359719133, 0.0017431993200446674, 0.00174711857674109, 0.0017910851989174847, 0.0018930126388802305, 0.0020665474421351815, 0.0023110067380450396, 0.002564003251920865, 0.002631280314180697, -0.09956851479331706, -0.014656840526959687, 0.005296496238184651, 0.004433070783316002, 0.0042853734392304665, 0.004295343277891097, 0.004312335197228082, 0.004317928603774936, 0.00429375238403867, 0.004319156435982013, 0.0043599179282177054, 0.004418703956924036, 0.004496461081747157, 0.004591693016565993, 0.004698781417460935, 0.004809268565985468, 0.0049260497806323635, 0.005052926875881018, 0.005193756456258245, 0.005354712111485613, 0.005539912749541894, 0.0057512710444069075, 0.005991813072495065, 0.006265605786579937, 0.006578798549490909, 0.006937617334899189, 0.007347195114264899, 0.007811272094737673, 0.008333861339657415, 0.00892038720715931, 0.009574063856186489, 0.010308215884782371, 0.011151747441287248, 0.012124790632774728, 0.013227841007164705, 0.014450991204507877, 0.015769723980372203, 0.017141048837225593, 0.01849913305356329, 0.019771527094162855, 0.020905176592455627, 0.021889385962430844, 0.022750143241800684, 0.023524338951822304, 0.024219911087244413, 0.024802812551109315, 0.02523199782071482, 0.025473751142915432, 0.0255370619540762, 0.025456820941264256, 0.025266152894189636, 0.024987064501927524, 0.024627634924947368, 0.024197193222538094, 0.0237057542815522, 0.02316107746900892, 0.022568180359677743, 0.021939441729910376, 0.0212941989775754, 0.02065148758127693, 0.02003892922804606, 0.01947448654247039, 0.018948704402186333, 0.018440039973615773, 0.017932577811373883, 0.017413505436999956, 0.01686912386016313, 0.016299438699533198, 0.01571143760978748, 0.015112533148851878, 0.014508497314385005, 0.013908212733809898, 0.013312025180866034, 0.01270662102825086, 0.012082887851996375, 0.01143346269916551, 0.010750439738441135, 0.010024873312305192, 0.009249502638742291, 0.008428321575542, 0.00755406081083235, 0.006618823686950919, 0.0056102466695617135, 0.004514214747063002, 0.0033072225842564374, 0.001955776288133394, 0.0005996649957544299, 0.00033910627843705134], [0.001786135118464892, 0.0017711663543510136, 0.0017483478391120846, 0.0017237220625556252, 0.0017071762533759772, 0.0017127588190211992, 0.001757934300453063, 0.0018605257372227909, 0.002034363171825863, 0.0022797209601513515, 0.0025398771234109757, 0.002652324011136431, -0.07873721237983862, -0.008485840031339672, 0.004711356607396006, 0.004251420248670603, 0.004153457906828415, 0.004174604246865141, 0.004196605642776844, 0.004205352417139613, 0.004189124915719487, 0.004214283780782003, 0.004254349331352988, 0.004311941773837214, 0.004387996573965673, 0.004481061086204856, 0.004585662087457063, 0.004693568361278511, 0.004807612746198831, 0.004931506069592269, 0.005069012752717785, 0.00522615953471333, 0.0054069677970439555, 0.00561330515467452, 0.005848125814826919, 0.006115399861303245, 0.0064211295650117425, 0.006771392040816561, 0.0071711977277171485, 0.007624197228045146, 0.008134306893554584, 0.008706820296222278, 0.009344876958081519, 0.010061486242411561, 0.010884862438702427, 0.011834660970608967, 0.01291136902921729, 0.01410531908439186, 0.01539258333004194, 0.016731201802166758, 0.01805696030255151, 0.01929908876646906, 0.02040579940969393, 0.021366649484866152, 0.022207001845804524, 0.022962864824851253, 0.02364197865704173, 0.024211102096459165, 0.024630164440634615, 0.02486625918378066, 0.024928166807537067, 0.024849925964350802, 0.024663883426642722, 0.024391516228368156, 0.02404071151108789, 0.02362063686912911, 0.023140873076522767, 0.022609014991379545, 0.022030161992222047, 0.02141635075896882, 0.020786441602878816, 0.02015901047553081, 0.019561016117367498, 0.019009990703614248, 0.018496702156500313, 0.018000121351738438, 0.0175047131638654, 0.016997971374957958, 0.01646652456701689, 0.01591037954170448, 0.015336358159400546, 0.014751696770076086, 0.014162029798334948, 0.01357602752110831, 0.012994026570400032, 0.012403030700782905, 0.011794145714412377, 0.011160185369994505, 0.010493432289625213, 0.009785154371243837, 0.009029969672586369, 0.008228350085535786, 0.0073748988546617706, 0.006461903050304636, 0.00547728330711727, 0.0044072414647889045, 0.003228795295915078, 0.001910406187978588, 0.0005856162702074544, 0.00033218919375058864], [0.0017624813967022082, 0.0017483070729915602, 0.0017264333882508053, 0.0017028570846642662, 0.0016873774367305288, 0.0016939176471639037, 0.0017398102987533778, 0.0018428357102184669, 0.0020169363763380774, 0.0022629362600149645, 0.002527336158821318, 0.002665769265322011, -0.06681881636922476, -0.005499595939453005, 0.004421286954577884, 0.004149282587763628, 0.004079874136725182, 0.004107447428171929, 0.004132335722382486, 0.0041428970976068276, 0.004131223953123832, 0.004156255031659747, 0.00419594173012638, 0.004252878688583009, 0.004327995486357625, 0.004419863780399863, 0.004523090831278097, 0.00462957120032204, 0.004742103320143098, 0.004864347700680211, 0.005000017786735021, 0.005155059125891145, 0.00533343918835292, 0.005537000686083059, 0.0057686580932911355, 0.006032327933544797, 0.0063339311350661155, 0.006679462494347863, 0.007073864694555964, 0.007520738783032939, 0.008023947613971948, 0.008588712411537061, 0.009218131471453943, 0.009925039905431707, 0.010737270539829535, 0.011674215294527064, 0.01273635681450646, 0.01391416025820289, 0.015184023846700031, 0.01650455755452636, 0.017812443179443426, 0.0190378382616584, 0.02012965539114124, 0.021077591577226943, 0.02190666386691241, 0.0226523927418431, 0.02332240890506203, 0.02388391656687529, 0.024297383955732072, 0.024530352143987223, 0.02459148619080674, 0.024514353192800716, 0.02433086998265706, 0.024062220621835967, 0.023716028962750574, 0.023301686514888877, 0.022828316880374105, 0.022303574644168996, 0.021732480087454233, 0.021126904993034563, 0.020505453595116987, 0.019886450462695954, 0.019296490511339297, 0.018752867218104544, 0.01824647089628724, 0.01775655629793864, 0.017267798467788666, 0.016767860400332422, 0.01624355174927492, 0.015694880186987437, 0.015128576082440774, 0.01455177818944087, 0.013970044704839318, 0.013391928358027825, 0.012817760234371102, 0.012234719004361351, 0.011634030975702814, 0.011008607419630122, 0.010350836667790363, 0.009652105842314518, 0.008908654711105305, 0.008117850822902159, 0.007275904472024525, 0.006375204134839964, 0.00540382723503662, 0.004348150263844637, 0.0031854794160268377, 0.0018853828090308006, 0.0005778895727219954, 0.00032842356824438866]], [[0.005092432041770855, 0.005015474603446939, 0.004873375033056306, 0.004667440324167131, 0.0044022338174461205, 0.004088423609406676, 0.003746132257769618, 0.0034072308403314193, 0.00311862831438867, 0.002956398411487666, 0.0029464269527959704, 0.003045449963857954, 0.0032057782301575634, 0.0033889102492814407, 0.003566985611790812, 0.0037198234884796553, 0.003830985157445554, 0.003867250074079705, 0.002105254566244963, -0.018131754854054816, -0.000855897248975239, 0.008261517318214605, 0.005893453325998573, 0.005323058976841167, 0.005371897675487473, 0.005482246286552555, 0.005604838913037934, 0.005736158334171612, 0.005876588896513841, 0.0060279464124139035, 0.006193272907264405, 0.0063780307186676, 0.006585772708924764, 0.006817898090706947, 0.007076632174150854, 0.007364956943904715, 0.007688264761805088, 0.008052156766515814, 0.008460971227704884, 0.008918061944230957, 0.009427862606522121, 0.009998085782859989, 0.010634799941530673, 0.011348669312311835, 0.012160643315207017, 0.013079226865183905, 0.014097024511604684, 0.01519665236545902, 0.016346741866067088, 0.017500663311368726, 0.018596553882577468, 0.019578138519885983, 0.02040437073929165, 0.021065744073188335, 0.021584191266238534, 0.021985045669785944, 0.02228341768252754, 0.02247307981804699, 0.02254451798168574, 0.02248568818677716, 0.02230053826510762, 0.02201306097956182, 0.021648345411080756, 0.02122624887634059, 0.020754961953831565, 0.020243335680937797, 0.019699855753990015, 0.019132415720131024, 0.018544048036260433, 0.017941294541965778, 0.01733632519850844, 0.016741048244661487, 0.01617353993282656, 0.015641586635546226, 0.015136812427626774, 0.014646533872433275, 0.014160588185968053, 0.013670610395163974, 0.013167792759913411, 0.012654122002286586, 0.012133645389756942, 0.011610656080745674, 0.011088681454489204, 0.010573801743796983, 0.010064698402023498, 0.009550270894712155, 0.009024766361588993, 0.008483676291413765, 0.007928456021923515, 0.0073395218223198935, 0.006593824098871938, 0.005917203717253939, 0.005196013629033766, 0.004419311670916415, 0.0035696106322716777, 0.002624871309319506, 0.0015483388355091608, 0.00029358590833088833, -0.001098209764123239, -0.0016576128999000155], [0.004952353714001226, 0.004884131332892882, 0.00475307166516922, 0.004560729755718729, 0.004311808293138643, 0.004016916944082374, 0.0036958263487269875, 0.00337980079383487, 0.003113744381775352, 0.002969530978588732, 0.002972126251082144, 0.0030804860487672853, 0.003249397772259019, 0.0034427583745551813, 0.0036354218253847005, 0.003811177508659926, 0.003960029844275686, 0.004068889766556769, 0.003388370024285305, 0.00016060664458639046, 0.0035702347575168616, 0.005509628134134063, 0.005132240063145307, 0.0051052955364217795, 0.00518897193721904, 0.005302442966063697, 0.005425333803250628, 0.005555732055983944, 0.005694483424790766, 0.005843483453110943, 0.006005764925383866, 0.006186693267033313, 0.006389767495435418, 0.006616382648305871, 0.006868726639373278, 0.007149715733261524, 0.007464596077215022, 0.00781881560128551, 0.008216597969492336, 0.008661205423377597, 0.009156938022514716, 0.009711270201766768, 0.010330151686352896, 0.01102400692114337, 0.011813184338162872, 0.012705972697794344, 0.013695209590902774, 0.014764016493678561, 0.015881928106599878, 0.017003644346321487, 0.018069126729943888, 0.01902357808142554, 0.019827186961472596, 0.020470721930129776, 0.020975451180514422, 0.0213659486877947, 0.02165672207507549, 0.02184166709780419, 0.02191205396632693, 0.02185550729584888, 0.021676247034189453, 0.021397050294526248, 0.021042755873721227, 0.020632601793750326, 0.020174605443581364, 0.019677379186297507, 0.019149181167651127, 0.018597699764634993, 0.018025937780496024, 0.0174402906235443, 0.016852580998739375, 0.01627435926771769, 0.015723126844380524, 0.015206378798301412, 0.014715958932772683, 0.014239595318775113, 0.013767462355842183, 0.013291473724491788, 0.012803110072884517, 0.012304320200618807, 0.011799536262540664, 0.011292517599756137, 0.010786700333342635, 0.010287969815250039, 0.009795045625916984, 0.009297235139103271, 0.008789086767727858, 0.008266060117771154, 0.0077259361054290415, 0.007157084423933137, 0.006550337552957337, 0.00592129174897309, 0.005257540098637728, 0.004548511852919055, 0.003789020225948123, 0.002967965761395587, 0.0020725644356589883, 0.0010944370618394758, 0.00015429547653127637, 0.00025717152573558554], [0.004930723171364595, 0.004864357117852496, 0.0047355490207607745, 0.004545914005798952, 0.004300196589751106, 0.004009015437955944, 0.00369210230682082, 0.003380648479271102, 0.00311919368338538, 0.002978801665207399, 0.002984280045817931, 0.003095006416011089, 0.0032662399275484107, 0.003462350601237798, 0.003658760928540496, 0.0038401352333764355, 0.003997932256453087, 0.004123645197721619, 0.004167407168371289, 0.0034004321660389887, 0.004171472722649544, 0.0051090533517859915, 0.0049803557090994, 0.005052394106885518, 0.005158028927095267, 0.005272454291754095, 0.00539567262317644, 0.005526134981647319, 0.0056647944961357, 0.005813568965740887, 0.005975495455732577, 0.006155928516805234, 0.006358362216780624, 0.006584193579841732, 0.00683560657123508, 0.007115508557600576, 0.007429123270191405, 0.007781875047129876, 0.008177970217848808, 0.008620656939221247, 0.009114213740822361, 0.009666076293206252, 0.010282179680279608, 0.010972915426740323, 0.011758537265342603, 0.012647301942671533, 0.013632085306052323, 0.014696088953354686, 0.01580899016233844, 0.01692569776755389, 0.01798646440145949, 0.01893671572512538, 0.019736839137736845, 0.020377646706031278, 0.020880299308550378, 0.021269248864878878, 0.02155889556978335, 0.021743150524275456, 0.02181344512204024, 0.021757301989220074, 0.021579012285938472, 0.021301122798471874, 0.020948467402792593, 0.020540182887449382, 0.020084263893717397, 0.01958928629669005, 0.019063473554199066, 0.018514483278387506, 0.017945317815825965, 0.017362352533293615, 0.016777316916169405, 0.016201714183373454, 0.015652954796360766, 0.015138487991816595, 0.014650201576144646, 0.014175901947556887, 0.013705830266600591, 0.013231959510565924, 0.01274583065375278, 0.012249393860294059, 0.011746598258282746, 0.011241619056760657, 0.010737868886067096, 0.010241196759403492, 0.009750315906969476, 0.009254582097337639, 0.008748580486298077, 0.008227729700923468, 0.007688934260180585, 0.007122324713189217, 0.006518241736249282, 0.00589156934609434, 0.005230012997412374, 0.004527231038108249, 0.0037733860805281667, 0.0029591942068942106, 0.0020660553754672435, 0.0010915701695563453, 0.00015713104134139412, 0.0002728675784287057], [0.004926265454215156, 0.004861546865471101, 0.00473456572850404, 0.004547003831054921, 0.004303664934015942, 0.0040152144754466036, 0.00370141472877671, 0.00339349351526042, 0.00313577890733737, 0.0029987649397357494, 0.003007186887769078, 0.0031207060693232017, 0.003294901483990479, 0.0034944966362334203, 0.0036954034976521655, 0.0038831194167559817, 0.0040505478744836025, 0.004193799402296945, 0.004283255163308982, 0.0038965792849839673, 0.004499489760133568, 0.004921708120656219, 0.004948866784234301, 0.005036547624511668, 0.0051449320509544235, 0.005260731003005912, 0.005384718331370762, 0.005515708231290903, 0.005654766168365314, 0.005803839313231841, 0.005965979840114626, 0.00614655025347796, 0.0063490519885254955, 0.006574889036999004, 0.00682624910219101, 0.007106040833483888, 0.0074194837465757415, 0.007771997482561742, 0.008167785702094916, 0.008610093792471156, 0.009103193615326743, 0.009654507886552125, 0.010269977881770979, 0.010959998577614939, 0.011744799464447281, 0.012632634091714367, 0.01361639185074033, 0.014679296046755743, 0.015791061062192194, 0.01690664776314943, 0.017966392220985804, 0.018915752625322066, 0.019715177606957724, 0.020355490784948145, 0.020857819216647307, 0.021246577717229903, 0.021536108576496845, 0.021720316872703874, 0.02179076709913905, 0.021734823181861644, 0.021556812777944332, 0.02127913417203908, 0.02092670467838971, 0.020518627163746805, 0.020062922337717157, 0.019568166783081105, 0.01904258445809841, 0.018493834998199746, 0.017924936052587385, 0.01734227017066386, 0.01675759574253218, 0.016182389464108476, 0.015634022913599457, 0.015119911208825948, 0.014631933495436553, 0.01415791623643773, 0.013688118023849994, 0.013214524843861626, 0.012728691732745174, 0.012232573848468212, 0.011730122715104948, 0.011225511958301277, 0.010722151059947426, 0.010225877842135328, 0.00973539459869697, 0.009240067273782076, 0.008734501325078263, 0.008214059814767015, 0.007674749665624545, 0.007108516904489127, 0.006512860148910819, 0.005886654113783922, 0.005225474163114106, 0.004522919159632626, 0.003768994487179475, 0.0029542183720167488, 0.002066151455094849, 0.0010926636266340218, 0.0001606915626865172, 0.00028987624526409793], [0.004925024162572231, 0.004860810308199102, 0.004734387451813484, 0.004547457917046705, 0.004304843802175081, 0.004017225202451675, 0.00370437428973621, 0.003397530934911023, 0.0031409593085041628, 0.0030049801625602708, 0.003014307181124198, 0.0031286878431654366, 0.003303798305937125, 0.0035044698106568403, 0.003706764163877243, 0.0038964344053463067, 0.004066827942139718, 0.004215474569079913, 0.004318978966923594, 0.004049266677052326, 0.004567992047908487, 0.004880657645027688, 0.004939315237985179, 0.005031808324056717, 0.005141040815907634, 0.005257265039997149, 0.00538149200425256, 0.005512647500239436, 0.0056518315536394255, 0.0058010004148667535, 0.0059632109825534805, 0.006143828346576234, 0.006346356298559099, 0.006572201008832198, 0.00682355138705054, 0.007103316553080641, 0.0074167148634488676, 0.007769164657315344, 0.008164868885035972, 0.008607072167529716, 0.009100044428583835, 0.009651204596219222, 0.01026649600497498, 0.010956314964822581, 0.011740884043795998, 0.012628456024683899, 0.0136119242760144, 0.014674518336501526, 0.015785963201414847, 0.016901234551843086, 0.017960692545738004, 0.018909803943653623, 0.019709035163180934, 0.020349213134240964, 0.020851462525913394, 0.021240149176678387, 0.021529585712206093, 0.021713672876423912, 0.02178415016041103, 0.021728136157390613, 0.021550099807991135, 0.02127239117844861, 0.020919956279176664, 0.02051188990216432, 0.02005621187851116, 0.019561497214709837, 0.019035968529751434, 0.018487284469277727, 0.01791846540305984, 0.017335894772452416, 0.016751326859186885, 0.016176233905326697, 0.015627978444759123, 0.015113965495033278, 0.01462607084970721, 0.01415212735175352, 0.013682399124310409, 0.01320887624708519, 0.01272311819075064, 0.012227082468677718, 0.011724721733798222, 0.011220209274270993, 0.010716953716004746, 0.010220789590621112, 0.009730800368316469, 0.009236066168143552, 0.00873117604700065, 0.008211396060192604, 0.007671496508176308, 0.007105739170544247, 0.006511718931762136, 0.0058856412786211015, 0.005224568124170798, 0.0045220875852504646, 0.0037681765198484363, 0.002953281281563818, 0.002064785609032809, 0.001093682898881476, 0.00016183489130149696, 0.00029515490653723336], [0.004924265930462538, 0.004860369862344375, 0.0047342982347464094, 0.004547766322008974, 0.004305607802794407, 0.004018512061995696, 0.003706257606420545, 0.0034000920537016473, 0.003144239517630069, 0.003008911885525376, 0.003018809354694496, 0.0031337335089079085, 0.003309421520723961, 0.0035107723587009757, 0.003713942143281454, 0.0039048449895672807, 0.004077108048961679, 0.0042291555714562045, 0.004341514427610653, 0.004145561355778744, 0.00460333492177438, 0.00485878094622975, 0.0049333187055576036, 0.005028846053976542, 0.005138613558618498, 0.005255106371087711, 0.005379484968856706, 0.005510745469901999, 0.0056500096861758905, 0.005799239600025466, 0.005961495102499281, 0.0061421429391065084, 0.0063446884036887415, 0.006570539046466143, 0.006821884548080802, 0.0071016343391316775, 0.007415006071101293, 0.007767417289109225, 0.008163070516400323, 0.008605209906755442, 0.009098104183534794, 0.0096491699237792, 0.010264351788670844, 0.010954046979306194, 0.011738473799876402, 0.01262588459033185, 0.013609175191031785, 0.014671578987271632, 0.015782827514912907, 0.01689796037687781, 0.017957296910813363, 0.018906293172101532, 0.019705414863227914, 0.02034548236530921, 0.020847601494120932, 0.02123616391944274, 0.02152547648316039, 0.02170944228875552, 0.021779804510398074, 0.02172369440084696, 0.021545588779344916, 0.02126780992426997, 0.020915323293253806, 0.020507219016114766, 0.020051516414312725, 0.019556789494940007, 0.019031259995044264, 0.01848258578637772, 0.017913788553208458, 0.017331252166564354, 0.01674672920856233, 0.01617168926234493, 0.015623489210577431, 0.015109526421131685, 0.014621672702052895, 0.014147764552776446, 0.013678069570372443, 0.01320458040576887, 0.012718859449416215, 0.01222318231163598, 0.01172127929747157, 0.011217294980974568, 0.01071462213385895, 0.010219083163983553, 0.009729359725283637, 0.00923481967135921, 0.008730090133177767, 0.008210453255959685, 0.007670688060370875, 0.007105061346325291, 0.00651156161215273, 0.0058855718570487055, 0.005224576741918403, 0.004522160502498264, 0.0037682884033670735, 0.0029533779100565814, 0.0020647489854598027, 0.0010931792568662786, 0.0001625819816983419, 0.0002985077164710404], [0.0049237792873746125, 0.004860073039272404, 0.004734211599610448, 0.004547917947907411, 0.0043060326293841815, 0.004019250489041618, 0.003707353668840629, 0.0034015941817726715, 0.003146171959230117, 0.0030112335198427954, 0.0030214708495668345, 0.0031367180573273353, 0.0033127489875296586, 0.0035145032154970893, 0.0037181932317302165, 0.003909829235448364, 0.00408320512232777, 0.004237278158526478, 0.00435491260524835, 0.004202944839107603, 0.0046214749530892815, 0.0048471707904434, 0.00492970985085352, 0.005027045288827469, 0.0051371308308941115, 0.005253782871135697, 0.005378250947714596, 0.005509573093099005, 0.0056488840937119, 0.005798149333678417, 0.005960430465589944, 0.006141095183602082, 0.00634364965194329, 0.006569502233156632, 0.006820843051833327, 0.007100581703167976, 0.007413935381620624, 0.0077663211208421545, 0.008161941159851409, 0.008604039351126741, 0.00909688367251666, 0.009647889247682853, 0.01026300148632388, 0.010952618047049266, 0.011736954550292956, 0.012624321108844061, 0.013607569549471935, 0.014669926763537601, 0.015781120221836538, 0.016896131637327106, 0.017955334526493925, 0.01890419467781887, 0.01970318898348309, 0.020343142511989314, 0.020845161030925353, 0.021233632680004833, 0.021522857812558607, 0.021706740072277048, 0.021777024498077942, 0.02172084977525345, 0.0215426970071611, 0.021264871673347722, 0.02091235068226019, 0.020504221239933174, 0.020048502281342997, 0.019553767138270797, 0.01902823694831101, 0.018479569041489206, 0.017910785809754044, 0.017328271315226018, 0.016743776693911264, 0.016168769787248852, 0.015620603951732941, 0.015106671801764506, 0.014618843010359341, 0.014145221396608697, 0.01367588552048751, 0.013202807861763949, 0.012717543077876906, 0.012222050136326405, 0.011720281145752465, 0.011216405044496735, 0.010713824729634714, 0.01021836444215812, 0.00972871017301066, 0.009234234680058474, 0.008729567521378311, 0.008209992572116888, 0.007670290259482358, 0.007104728524285835, 0.006511460359377957, 0.005885524910346313, 0.005224577941519188, 0.004522201269748858, 0.0037683531211985806, 0.0029534336040290265, 0.002064724875161172, 0.0010928573560599834, 0.00016303353957391705, 0.0003005107209001412]], [[0.007565001767916007, 0.007459153052535159, 0.007255087042051547, 0.006951084575739283, 0.006547988645033989, 0.0060534688172614965, 0.005487766018617781, 0.004889293169425897, 0.004321508393129338, 0.003903362209450349, 0.0037033689759863675, 0.0036796187760103857, 0.003774101686914748, 0.003945670170221482, 0.004150277709528553, 0.004354979221771707, 0.004562612267829663, 0.004768632848063991, 0.00496432832782934, 0.005137454609005834, -0.039180036988205824, -0.032801619911533894, -0.02701809934703698, -0.021919105753590174, -0.017610442306708208, 0.02631626619599224, 0.013012201558125285, 0.006707216451294436, 0.006866416634351175, 0.007045409225014267, 0.007242127256516877, 0.007461292450090281, 0.007706036622210123, 0.007978043457726782, 0.008279635134806776, 0.008613962762727493, 0.00898731359966426, 0.009404636956094914, 0.009870587127120252, 0.010388989478818085, 0.01096487467388564, 0.011607203608922678, 0.012323758894959205, 0.013126477055569276, 0.014037086315720988, 0.015064673848878975, 0.016191769749632073, 0.017399538741224196, 0.018650302158859097, 0.01989006050724437, 0.021049169552783048, 0.02206858225914552, 0.022906511630793113, 0.02355329050428992, 0.02403318793533207, 0.0243715503463398, 0.024586220753199734, 0.024678083166876166, 0.024646812104308174, 0.02448417975990769, 0.024195742900595472, 0.023804792090231106, 0.02333584460887712, 0.0228113840061132, 0.02224110681485503, 0.021635181291095394, 0.021005851075159506, 0.020357056171283985, 0.019691671813603255, 0.019016727714841235, 0.018344028769673996, 0.01768495384143157, 0.017057080390073562, 0.01646602991521103, 0.015902703428324744, 0.01537741700759927, 0.014835713594548761, 0.014291290935305132, 0.013736243109991898, 0.013175369305082873, 0.012609941491325022, 0.012043404223792709, 0.011479869693745683, 0.010925480005211582, 0.010378218485031641, 0.009826230886781358, 0.009264140984789958, 0.008687023394169878, 0.008089359621962423, 0.0074651634124562015, 0.006648034423500622, 0.005932464732760365, 0.005169992750547939, 0.004347707037458708, 0.00344487738610265, 0.0024351347767757993, 0.0012749152199464959, -8.861901453894619e-05, -0.0015669408178839135, 0.00020849006649322838], [0.006819294902223983, 0.006728688285763641, 0.006549927795438081, 0.006281661485618611, 0.00592481208445879, 0.005486409324451692, 0.004984756014617885, 0.004454552702555211, 0.003952309046251647, 0.0035835571893475257, 0.003409745700888892, 0.0033937275732950746, 0.003484022054755063, 0.0036397371193041994, 0.0038254028053407393, 0.004016486744274683, 0.004208460534416714, 0.004399001258286079, 0.00458124378213071, 0.004745217432580581, -0.006613595217643145, -0.004851498141790528, -0.00324768929122296, -0.0018235560318997112, -0.0006033209443024217, 0.010937020235691717, 0.008474696425173497, 0.006018506800025028, 0.0061704195893559025, 0.006335812424270466, 0.006515688104404741, 0.00671509871025811, 0.006937339812980167, 0.0071838822274339145, 0.0074568636539076956, 0.007759133528899924, 0.008096094740628458, 0.008472749878565397, 0.008893284482348, 0.009361028579192373, 0.009880489739966598, 0.010459722950276746, 0.011105810324223602, 0.01182958545091357, 0.01265059710750086, 0.013575495915134881, 0.01459188197607822, 0.015681177074639622, 0.016809415124499353, 0.01792786607264946, 0.01897398385293613, 0.019894394642436294, 0.02065143430322575, 0.021236359419618607, 0.021670970510405098, 0.021978078533329174, 0.02217359681263644, 0.022258227154960963, 0.02223161346928313, 0.022086423082735833, 0.02182740291796029, 0.021475209661617693, 0.021053273553743587, 0.020581328288571354, 0.02006800557516669, 0.01952227737528008, 0.018953708470657946, 0.01836829981931013, 0.017768717619369368, 0.017160732768968942, 0.01655486987329567, 0.015961329946286733, 0.015395890526724194, 0.014863559176573293, 0.014356250410111689, 0.013872038236560788, 0.013384211150250723, 0.012894309710208144, 0.012394979701451791, 0.011889627430840493, 0.011380661222369968, 0.01087143865579601, 0.010365264176031935, 0.00986757970965012, 0.009376572937275469, 0.008881670725145337, 0.00837814759736829, 0.007861691054484875, 0.007327475931034931, 0.006770278474226973, 0.006180565265852795, 0.005566634111468836, 0.004922345786888471, 0.0042393067182267576, 0.003507489046003253, 0.002717943593892274, 0.0018600235576585334, 0.0009292693908302292, 5.910967939333825e-05, 0.00026641323372528214], [0.0067226348232417524, 0.006634434522941596, 0.006459418984620858, 0.006196301571544074, 0.005846029930059889, 0.005415561260406926, 0.004922952262136371, 0.004402428914642657, 0.003909538122417513, 0.003547921091023236, 0.003378082556616284, 0.003363549462946528, 0.003453760007178324, 0.0036075149257497347, 0.0037908352115712048, 0.003980741541151706, 0.0041711161103105635, 0.004360082699066259, 0.004541104190979983, 0.004704600108008936, -0.002109695561764199, -0.0009855767119508027, 4.055855662047974e-05, 0.0009566869507449667, 0.0017494318579181951, 0.008804639790554198, 0.007595042339002899, 0.005926766903026424, 0.006078487840344559, 0.006242480019204394, 0.006420400815681608, 0.006617416399696703, 0.006836885880595713, 0.007080248280120302, 0.007349621364801936, 0.007647816268516283, 0.007980097548000874, 0.008351523161544134, 0.00876621699517641, 0.009227434278452249, 0.009739612341813716, 0.010310686720289258, 0.010947654697892292, 0.01166121349816695, 0.012470626024101159, 0.013382089079179251, 0.014384159776303676, 0.015458149968638089, 0.016570574664985634, 0.01767338206046865, 0.01870496704427922, 0.019612677980662744, 0.0203593854833781, 0.020936463261982757, 0.02136538502915058, 0.021668629778184307, 0.021861845402395816, 0.021945701577193368, 0.021919832629704983, 0.021777029446831856, 0.021521910505478192, 0.021174760809470103, 0.020758988776741205, 0.020293923874793368, 0.019788050026037035, 0.019250165296438918, 0.01868933662566554, 0.018112065673636914, 0.017521007001615654, 0.016921723255288894, 0.016324565110739427, 0.015739573327842985, 0.015182279282273026, 0.014657606190855122, 0.014157224689791217, 0.013677005067866555, 0.013195818737409612, 0.012712646624529289, 0.012220172429110708, 0.011721535767776672, 0.011219402856220992, 0.010717140103451124, 0.010217911552188463, 0.009727061714946921, 0.00924279333573752, 0.008754684425887033, 0.008258082334389549, 0.007748737736310512, 0.007221892101440467, 0.006672390836815034, 0.006091063068543953, 0.005489078312459443, 0.004855722711811662, 0.004184648766933007, 0.003461617954590144, 0.0026833185265448998, 0.0018374830509758778, 0.0009191328975273464, 6.13888255648352e-05, 0.0002809320757966647], [0.006647366611931821, 0.0065612854099531825, 0.006389450833158827, 0.006130637189801209, 0.005785819837785632, 0.005361905424892682, 0.004876761920931161, 0.004364249545322551, 0.0038791301485224306, 0.0035234861005474707, 0.0033570712604533946, 0.003343969601965056, 0.0034343762740652642, 0.003586658860917604, 0.0037682154101192585, 0.003957539475977726, 0.004146914050533816, 0.004334901222379259, 0.0045152697422910035, 0.004678797387234697, 0.0014684548367721003, 0.002085710668818163, 0.0026528703474181527, 0.003165308710505752, 0.0036180088590919072, 0.007104611855659026, 0.006743986507150973, 0.005853923959083147, 0.0060059243649651746, 0.006169032205336733, 0.006345560797215858, 0.006540805753538344, 0.006758199766286839, 0.006999154707122542, 0.007265775087092786, 0.007560842670466272, 0.007889500795613087, 0.008256878146244156, 0.008667050090855102, 0.009123207581006173, 0.009629731863697878, 0.010194464305613105, 0.010824339535569678, 0.011529952350307663, 0.01233034112580067, 0.013231270668225555, 0.014222214122360282, 0.015284316125223716, 0.01638446623137735, 0.017475138052986568, 0.01849547108509073, 0.019393374026493354, 0.02013212134672936, 0.020703162501751318, 0.021127706155213626, 0.02142796584960652, 0.021619367711963777, 0.02170254653293424, 0.021677122281493058, 0.021535984267188207, 0.021283647570330456, 0.020940098056700444, 0.020528803006730593, 0.020068757259797055, 0.019568330975401328, 0.019036186111777084, 0.018480966313483713, 0.017909667956864984, 0.017324928223919886, 0.016732112506976506, 0.01614142836430613, 0.015562793379646908, 0.015011553293744826, 0.014492555113476715, 0.013997499484767497, 0.01351972955237291, 0.013043609746211417, 0.012565577591272683, 0.012078335736218916, 0.011584775486933605, 0.011087830766704908, 0.010591024254426457, 0.010097401984519269, 0.009612158229045624, 0.00913346826291388, 0.008651015685584488, 0.00816021200846027, 0.007656861596019205, 0.007136259886681222, 0.006593308929535398, 0.006024539327617985, 0.005428869974845137, 0.004801918365003532, 0.004137514091408786, 0.0034260719025633935, 0.0026573260289424047, 0.0018208821330665756, 0.000912015688481022, 6.395374065474041e-05, 0.00029634125393913436], [0.006628138560046764, 0.0065426536771454585, 0.006371691048913205, 0.006114042813556986, 0.0057706932698794455, 0.005348537479799746, 0.004865395852934891, 0.004355036018848969, 0.003872011352392071, 0.003517986646056697, 0.003352520371154091, 0.0033398460229820052, 0.0034303613933985666, 0.0035822799613313147, 0.003763399973752965, 0.003952650301468812, 0.004141824385201408, 0.0043296165568644214, 0.004509885007791811, 0.00467351122826728, 0.0023740845042795893, 0.0028629791864973175, 0.003313898341909229, 0.0037240794618414266, 0.0040905566819201674, 0.006672166835669088, 0.006489355568989988, 0.00583500039922326, 0.005987168299193725, 0.00615009646302748, 0.006326298542247118, 0.006521112315775215, 0.006737994674831141, 0.006978350019048677, 0.0072442799811597725, 0.007538558924898493, 0.007866296196766995, 0.008232644735041351, 0.00864166739995802, 0.009096537370509998, 0.009601621255580678, 0.010164736107104408, 0.010792801310110017, 0.011496386337817417, 0.012294476365336966, 0.013192313943519073, 0.014180459784276322, 0.015239589662009806, 0.01633667623112568, 0.017424301914051043, 0.01844183198957908, 0.019337301181422902, 0.020074083802711716, 0.020643657114800335, 0.02106716452951799, 0.021366754779610576, 0.02155779893174243, 0.02164092362823358, 0.0216157457727857, 0.02147518146221399, 0.021223711514744288, 0.020881238003249494, 0.020471254780752454, 0.02001266205787604, 0.019513796835330714, 0.018983280846142522, 0.01842962561576565, 0.017859983648303938, 0.017276989631482366, 0.01668595225592295, 0.0160970410614302, 0.01552014141997118, 0.014970550920298285, 0.014453099653108705, 0.013959528333684499, 0.013479686041727407, 0.013005100705418401, 0.012528726709379831, 0.012043191909239455, 0.011551078147525207, 0.011055708952124977, 0.010560535298388804, 0.010068451429920975, 0.009584677002328418, 0.009107409555687805, 0.008626372509137142, 0.00813699657752123, 0.0076351014999302465, 0.007115998368578232, 0.006574605127938942, 0.006008219723167233, 0.005414180493677113, 0.0047889037037064435, 0.004126208911424674, 0.0034164661566113215, 0.0026511790606730972, 0.0018168864695858025, 0.0009104027383436224, 6.481635286130765e-05, 0.0003012260489146165], [0.006617206508347049, 0.006532081259421385, 0.006361636609217026, 0.0061046756802778405, 0.005762188552304563, 0.00534106419782213, 0.0048590962308450196, 0.004349999956753681, 0.0038682072525787767, 0.003515138245383943, 0.0033502389823003463, 0.0033378306749275053, 0.0034284298012124893, 0.003580145942511244, 0.003761023019623601, 0.003950259529027998, 0.0041393402209695665, 0.004327042210156693, 0.0045072787745551275, 0.004670994939229509, 0.0028991741707798157, 0.0033136559010099403, 0.003697187012908382, 0.004048081824310047, 0.004364544364230715, 0.006421117622715841, 0.0063306374959612825, 0.00582412340925774, 0.005976422546619209, 0.006139265880941109, 0.0063152932413636275, 0.006509869789342087, 0.006726468198554021, 0.006966488419498737, 0.007232030638775001, 0.007525865050873878, 0.007853080542713255, 0.008218846160712135, 0.008627217610877206, 0.009081376683842728, 0.009585676520909966, 0.01014791361654662, 0.010774995451171752, 0.011477473903580525, 0.012274288295488404, 0.013170673938427992, 0.014157212361519457, 0.015214612374118973, 0.01630990110810498, 0.017395738610418734, 0.018411591987096777, 0.019305576592336286, 0.020041132317753018, 0.020609752768246472, 0.021032546800729014, 0.021331624741707866, 0.021522324040371115, 0.021605268332424467, 0.0215800747136639, 0.021439677305112773, 0.021188537871862423, 0.020846510969602213, 0.020437113972338567, 0.01997919247671602, 0.019481065272415738, 0.018951331669740695, 0.01839842260322919, 0.017829590286714617, 0.017247467653514696, 0.016657438309481035, 0.01606963323035644, 0.015493886421610857, 0.0149454477645286, 0.014429111341074337, 0.013936534658365696, 0.013457591102938968, 0.012983858951584258, 0.01250831809663864, 0.012023615839523804, 0.011532335318626933, 0.011037796987042308, 0.010543447485119373, 0.010052177329398972, 0.009569198206957528, 0.009092711688508852, 0.008612459244905411, 0.008123878912776487, 0.007622797811205031, 0.007104535117469195, 0.006564017309742938, 0.005998945507756619, 0.005405818032848439, 0.0047814742574964755, 0.0041197268008396765, 0.003410917639827757, 0.0026464628677211007, 0.0018146903200271698, 0.0009095466678011437, 6.536908559936499e-05, 0.0003043439836109991], [0.0066109961025546116, 0.006526080950694194, 0.0063559368114141325, 0.006099373285580439, 0.005757383933123219, 0.005336854407184958, 0.004855563168205116, 0.004347195885917805, 0.003866114580448977, 0.003513598347062594, 0.0033490289897026297, 0.003336778311821222, 0.0034274311927953247, 0.003579033612495032, 0.00375977415814904, 0.0039490107203505155, 0.004138044148739565, 0.004325700722200256, 0.004505926203912816, 0.004669702997247768, 0.0031954021580345294, 0.003567892665880917, 0.003913395912804696, 0.004230832598722931, 0.004519059128871028, 0.006279212454626273, 0.0062365473136315255, 0.005817911087587942, 0.005970294905121042, 0.006133094920108146, 0.006309026094554629, 0.00650347010432158, 0.0067199091581062265, 0.006959740622391748, 0.0072250639157578215, 0.007518646874955949, 0.007845519748636657, 0.008210951389295005, 0.008618984591998306, 0.009072751690137753, 0.009576600845272907, 0.010138325017953321, 0.010764828864873479, 0.011466657561560208, 0.012262733067349107, 0.013158286661198667, 0.014143909605165213, 0.015200329161682796, 0.016294603724194705, 0.017379437721655285, 0.018394356779309076, 0.019287521579399166, 0.020022408620946636, 0.020590519947055675, 0.02101294367412831, 0.021311768393873394, 0.02150231252402724, 0.02158519731981367, 0.02156003931814661, 0.02141978232729364, 0.021168876457130992, 0.02082714836022351, 0.020418129580367515, 0.019960633566559728, 0.0194629682189356, 0.0189337193907917, 0.018381040270853483, 0.017812671538615987, 0.01723123379061978, 0.016641869208416052, 0.016054687591346335, 0.015479532043285001, 0.014931645093502236, 0.014415820157393577, 0.013923724925364677, 0.013445244089503894, 0.012971966572112475, 0.012496879826069226, 0.012012638553692523, 0.011521821759113555, 0.011027746958629925, 0.010533858053403608, 0.010043043296408238, 0.009560509725520383, 0.00908446114776995, 0.008604649317429248, 0.008116516640887852, 0.0076158942343711785, 0.007098105722253285, 0.0065580823156230405, 0.005993742874026932, 0.005401131902455743, 0.004777317010600718, 0.0041161080454615515, 0.0034078345130436265, 0.00264386462411304, 0.0018140562160905076, 0.0009090908805401713, 6.571356566328498e-05, 0.00030622338176567674]], [[0.010238406229458758, 0.010109771299184066, 0.009858726229420842, 0.009477097273252, 0.008953316996476238, 0.0082813474442027, 0.007465712847447414, 0.006540046306596331, 0.005585312399180713, 0.004754163814431302, 0.004172350474288602, 0.003843848564274388, 0.003703716155351526, 0.0036972196772255867, 0.0037774511004826155, 0.00391174288203379, 0.004080588504950594, 0.004276720535506757, 0.0044872145032274265, 0.004698152530850684, -0.0024057478587473516, -0.00086478815918207, 0.0005524466977338523, 0.0018277216443599363, 0.00293777477028534, 0.00385276416790734, 0.004586385930229883, 0.005311694530510704, 0.006078285763283235, 0.006893044045668469, 0.007764810260318514, 0.00870504947834684, 0.009723101300403103, 0.010823743497841268, 0.011747804912329022, 0.006804213975513526, 0.007920860948771005, 0.00877384923406896, 0.009215882029827016, 0.009692078066757703, 0.01021641195472162, 0.010797068187927307, 0.011442321603190534, 0.012163726643276805, 0.012979071153041222, 0.013889179012103712, 0.014881361330488509, 0.015932682831826268, 0.01700626846741634, 0.018051269649328537, 0.019005353467983203, 0.019819903361038962, 0.02046341809839064, 0.020929189329815016, 0.02123928053008476, 0.02141303003765641, 0.021465750091233398, 0.02140666960605384, 0.02124542221287805, 0.020983649102846218, 0.020626730699362612, 0.02019274772081481, 0.019702447757175088, 0.01917383603139408, 0.01861559865764831, 0.018036253419208035, 0.01744375355545181, 0.01684582519699074, 0.016244679832932225, 0.015643948119084494, 0.015051485504296783, 0.014474947677763984, 0.013926803096304114, 0.013408172725921251, 0.012909911555699947, 0.01242461175893457, 0.011945642520501587, 0.01146729009361483, 0.010983637513919169, 0.010498229984298588, 0.01001360685035555, 0.009532202604856549, 0.009056186412025878, 0.008589906792301576, 0.008130772165359906, 0.00766890629927947, 0.007200786767674195, 0.006722880809958472, 0.006231094227795483, 0.0057210639938165475, 0.0049815401543295236, 0.004387634121959478, 0.004131932033224384, 0.0035287594467909356, 0.0028845151714737218, 0.0021920049902781984, 0.0014444418123188685, 0.0006453687970493565, -5.6406768847975637e-05, 0.00019134222131281857], [0.010065763379763984, 0.00994344703257142, 0.00969899821311753, 0.009324380174455957, 0.008809746885645802, 0.008150273649596923, 0.0073528993012585715, 0.006450160598010896, 0.00551469761400106, 0.004700989014713363, 0.004137932858763941, 0.003817137186602149, 0.003680238066025467, 0.0036730519211711668, 0.00375054013435512, 0.0038810301348153092, 0.004045451127012926, 0.004236699078986572, 0.004441864995584614, 0.004646938578950459, 0.0032793360870895746, 0.0037600840821190957, 0.0042089255887476406, 0.004622447122376658, 0.004996240131665671, 0.005324353588143232, 0.005610992825241685, 0.005898628766370492, 0.0062000393617025395, 0.0065184260372219815, 0.006858535115700234, 0.007227329768569765, 0.007629490376590482, 0.00806627468150388, 0.008423132813119913, 0.007685439908671895, 0.008178803518104436, 0.008650024599350558, 0.009078094695374196, 0.009545435009585948, 0.010060522193774651, 0.01063116919051016, 0.011265524884855476, 0.01197499801938614, 0.012777031844084833, 0.013672424664545222, 0.014648683849479002, 0.015683229464253545, 0.016739769038455095, 0.017768256083783997, 0.018707321722750834, 0.01950910853951196, 0.02014271974647821, 0.020601568056928223, 0.020907321784492866, 0.021078968577415994, 0.021131409548154515, 0.021073684804096677, 0.020915274503730073, 0.02065798472000022, 0.020307269960366352, 0.019880140460458946, 0.01939771991926057, 0.018877927144001466, 0.018329103033380954, 0.017759625541597268, 0.01717731330765422, 0.01658975939793113, 0.015999162621860113, 0.015409101167424354, 0.014827287986201615, 0.01426123072431978, 0.013723158510219617, 0.01321422118883966, 0.012725510794735051, 0.01224977327984904, 0.011780511812782862, 0.01131214895046677, 0.01083890201978504, 0.01036422638403608, 0.009890539301198603, 0.009420262156090395, 0.008955525159614532, 0.008500601328340771, 0.008053043730421806, 0.00760329494909835, 0.00714798375161076, 0.006683761478853143, 0.006206774406587317, 0.005712938724343831, 0.005183164799347137, 0.004647206169881007, 0.0040857563811145725, 0.0034929777747794593, 0.0028598297045038658, 0.0021789998091717466, 0.0014434833922540406, 0.000654290130642869, -4.7222215663292566e-05, 0.00027144960329748217], [0.010043912698102507, 0.009922842603300659, 0.009679482936641857, 0.009305814201586897, 0.008792372491293879, 0.008134606270156405, 0.0073400280289363734, 0.0064409788159723045, 0.005508296209662842, 0.004697163478877227, 0.004137444088777011, 0.003817856951994547, 0.0036814607136929135, 0.0036741012759348977, 0.003751092677054123, 0.003880936068666054, 0.004044627295290342, 0.0042350874026605935, 0.004439387567107913, 0.004643470592831328, 0.004011210827850864, 0.004355424460551393, 0.0046795628101688755, 0.0049821228565801725, 0.005261123039103527, 0.005513684825589522, 0.005742788113302974, 0.005974102284220645, 0.006215674140666577, 0.0064702403111698776, 0.0067420345773383265, 0.007037466368554807, 0.007360674409696826, 0.007712687260282366, 0.008012989752886777, 0.007794723860448169, 0.008212082436776126, 0.008636948596435158, 0.009062550943348775, 0.009528681541363326, 0.010042554800386681, 0.010611911505290294, 0.011244886061406448, 0.011952874058050535, 0.012753270326269774, 0.013646868677788719, 0.014621199415701698, 0.015653724200557783, 0.01670822007600342, 0.01773473611867611, 0.018672016097757687, 0.019472292153868778, 0.02010475188482015, 0.020562823505449544, 0.020868112289491373, 0.021039557527648505, 0.021091993181418103, 0.02103443477251242, 0.02087634825517576, 0.02061958662826541, 0.020269638414844252, 0.01984330372989247, 0.019361838619590496, 0.018842864714259996, 0.0182949193230586, 0.017726357733313904, 0.017144978719069375, 0.016558356620033094, 0.015968689480360503, 0.01537954983579894, 0.014798634008491926, 0.014233436011732162, 0.013696162310139924, 0.0131879676747106, 0.012699965824958212, 0.012224915622073845, 0.011756328442961463, 0.011288633350374997, 0.010816054412343155, 0.010342032173881806, 0.009869030204898153, 0.009399438830863716, 0.008935389642433851, 0.008481158663352868, 0.008034369304059685, 0.007585463977747743, 0.00713098120528932, 0.0066675997708649055, 0.0061914581717949545, 0.005698468424237665, 0.005177374646573784, 0.004642617778024939, 0.004082426513511729, 0.0034917218603135536, 0.002859273981759747, 0.0021799229001582938, 0.0014458712632173915, 0.0006575419061777977, -4.5181884835426575e-05, 0.0002905484962505678], [0.01002794157832579, 0.009908062960877807, 0.009665659155054622, 0.009292723217014118, 0.00878017374532394, 0.008123734013211297, 0.00733150422816203, 0.0064356466084227425, 0.005505210706097581, 0.004696192305106459, 0.004139516736317384, 0.0038209594596944345, 0.003684989635671354, 0.0036774494964249374, 0.0037539837614871184, 0.0038832505888165875, 0.004046301752542682, 0.004236079390674578, 0.004439626497249812, 0.004642829480656369, 0.004522953374695396, 0.004771562694329671, 0.00500838512189173, 0.005233256308585412, 0.005445893058645644, 0.005645564836948318, 0.005834391188253566, 0.006026288969366718, 0.006225999798631316, 0.006435941452995266, 0.006659999041860143, 0.006904212284502865, 0.007172381879719313, 0.007465535302004195, 0.007737951808551987, 0.007867496881991967, 0.008234645502290472, 0.008629039540449272, 0.009052413724177581, 0.009517618346299, 0.01003058898314836, 0.010598997742149634, 0.011230969326712904, 0.011937893209195617, 0.012737125205851532, 0.013629451257879616, 0.014602412841017964, 0.015633494848315856, 0.01668651659300593, 0.017711587106675458, 0.01864752148132763, 0.0194466126328736, 0.020078116726317076, 0.0205354777556754, 0.020840275086966304, 0.021011412083392047, 0.021063659884298466, 0.021006012815824694, 0.020847924877662412, 0.020591293532733475, 0.020241637921665764, 0.019815546632070948, 0.019334418555796873, 0.018815838649806363, 0.018268332703849813, 0.017700241835846734, 0.017119351634760607, 0.016533409239843123, 0.015944440364265285, 0.015356009542873184, 0.014775800258580555, 0.014211298078182206, 0.013674697720652655, 0.013167166670342257, 0.012679841551163903, 0.01220548700365219, 0.011737613980827696, 0.011270651144755388, 0.010798822607302761, 0.010325551602157685, 0.009853283722476328, 0.00938439994951099, 0.008921029470058838, 0.008467441440453532, 0.008021213520245762, 0.007572822880239695, 0.007118897665539951, 0.006656092949236164, 0.006180564447890278, 0.005688243110543519, 0.00517478918554036, 0.004640921182294111, 0.004081660511880184, 0.0034912150822323127, 0.002860556317219958, 0.0021822851346223865, 0.0014492648035615988, 0.0006613218595552445, -4.3072288529633586e-05, 0.0003102009326870669], [0.01002400773524648, 0.009904483579788948, 0.00966234994409683, 0.009289602964009895, 0.008777277887224905, 0.008121182011088364, 0.007329596914627685, 0.006434632990121045, 0.0055047970940979895, 0.004696349812830532, 0.004140555462536776, 0.0038222837003583214, 0.0036864316985608502, 0.003678835303943229, 0.003755236536905876, 0.003884338755331567, 0.004047209079064149, 0.004236795441852566, 0.004440130920390895, 0.004643083224395377, 0.004632937619377244, 0.004860927307531769, 0.005078918590599601, 0.005287036015678332, 0.005485362249644208, 0.005673628876307554, 0.005853769214290211, 0.0060371694819317985, 0.006227860821252875, 0.00642819414440967, 0.0066420071448424515, 0.0068752405774467375, 0.007131633866370303, 0.007412260824355818, 0.007682138705964419, 0.007881997779256498, 0.00823921976298317, 0.008627611292304514, 0.00905033629058948, 0.00951529472763114, 0.010028029803669555, 0.01059619317333552, 0.011227907184837798, 0.011934560355465293, 0.012733497738891243, 0.013625500991516245, 0.014598112937204935, 0.015628822964643935, 0.016681459570368016, 0.017706145339375097, 0.01864171170040323, 0.019440467568800676, 0.020071689433915744, 0.0205288274320315, 0.02083345420047846, 0.02100446343810582, 0.02105660775369309, 0.02099887643031165, 0.020840721319230288, 0.020584054387196696, 0.02023455678324498, 0.019808637440109095, 0.019327739727117186, 0.018809436239004874, 0.018262246651109443, 0.017694504573182508, 0.01711398772722454, 0.016528248427863802, 0.015939479640067596, 0.015351245914745397, 0.014771227582474171, 0.014206907503466643, 0.013670475470903578, 0.013163098457376824, 0.012675915626649695, 0.01220169480611571, 0.011733949476400772, 0.011267110472005666, 0.010795404297385989, 0.01032225278133621, 0.009850100566736103, 0.009381327714148248, 0.008918062740238231, 0.00846457304759659, 0.008018437316793837, 0.007570136342257578, 0.007116298667258387, 0.006653579420792719, 0.006178133700376242, 0.005685891231614125, 0.005174702142946653, 0.004640874832500484, 0.004081845617745953, 0.0034916478817810896, 0.0028621697625268935, 0.0021832674730149575, 0.0014504918405014893, 0.0006625898124183332, -4.2387659368197885e-05, 0.0003163078776206955], [0.010021762731331856, 0.009902459164921171, 0.009660490134726446, 0.009287853530478372, 0.008775657902239963, 0.008119763401040083, 0.007328566098766233, 0.0064341444770784064, 0.00550466498819055, 0.004696558744595418, 0.004141306754773574, 0.003823207489994385, 0.0036874265667177653, 0.0036797945428440277, 0.0037561137237774192, 0.0038851152213209583, 0.004047875383984603, 0.004237345633281513, 0.00444055249323494, 0.004643351559725685, 0.004690814695018915, 0.004907928547890261, 0.005115987633801026, 0.005315268938193882, 0.005506047951733102, 0.005688299604482217, 0.005863858759673582, 0.006042805149551096, 0.006228768596042117, 0.006424065693723114, 0.0066324725035263425, 0.006859916534703674, 0.007110109326766186, 0.007384165615029706, 0.007653881929206803, 0.007889186629427801, 0.008241464829440158, 0.008626885569449086, 0.009049209865264075, 0.009514023332033097, 0.010026621862235208, 0.010594644374624509, 0.011226211907283795, 0.011932712615151572, 0.012731485267778047, 0.013623309460715428, 0.014595729051451123, 0.015626236176059873, 0.01667866473592737, 0.017703145111056088, 0.018638517847724044, 0.019437100444929547, 0.020068180868783342, 0.020525212342774397, 0.020829763074650093, 0.021000721188722864, 0.021052828173809202, 0.020995183308950338, 0.02083715456328931, 0.020580664282987358, 0.020231250249021386, 0.019805398440080106, 0.01932458096814761, 0.01880636441089643, 0.0182592667135995, 0.01769161933057226, 0.01711119808766219, 0.016525553607985844, 0.015936879709064815, 0.015348740802312792, 0.014768815225350361, 0.014204584171823085, 0.01366823451165692, 0.01316093293101333, 0.012673819989422828, 0.012199665222662116, 0.011731983396446483, 0.011265206422606831, 0.010793562018067445, 0.010320471031703735, 0.009848377442369464, 0.009379660698580514, 0.00891644888135906, 0.0084630083493257, 0.008016918376543456, 0.007568661855583325, 0.007114867565241677, 0.006652190760328323, 0.006176786433004964, 0.005684583569350733, 0.005173538252421826, 0.0046409965693546395, 0.004082065808405374, 0.0034920103014006456, 0.002861767159828335, 0.002183912870029247, 0.0014512749012077608, 0.0006633809900196816, -4.197961431018332e-05, 0.00032014268297631915], [0.010020495623608051, 0.009901322663823816, 0.009659450014788058, 0.009286876554931076, 0.008774754452162421, 0.008118975323588901, 0.007328003526100283, 0.0064338987521995504, 0.005504625089433877, 0.004696716369371213, 0.004141783653742071, 0.0038237849359500026, 0.0036880454104311375, 0.0036803921014155676, 0.003756662926162361, 0.003885605314383476, 0.004048300980447872, 0.004237703374500662, 0.004440835024360007, 0.004643544207570127, 0.004721090027658107, 0.004932501989815302, 0.005135354024309764, 0.005330003056957511, 0.00551682559787811, 0.005695953523006725, 0.005869139388881931, 0.006045737800911029, 0.0062292105015733, 0.0064218562242891256, 0.006627432000413553, 0.006851846405547988, 0.007098798171499171, 0.007369430603114615, 0.007639584589146328, 0.007892754229878167, 0.008242573217937933, 0.008626522050830044, 0.009048609945984935, 0.009513339746245221, 0.01002585995464929, 0.010593801952308477, 0.011225286052784432, 0.011931700278089541, 0.012730379758863796, 0.01362210277391421, 0.014594413656609349, 0.015624805985882773, 0.016677116599191005, 0.017701480154241077, 0.018636742210303262, 0.01943522513177604, 0.020066223607561745, 0.020523192742401285, 0.02082769833773342, 0.020998715115163817, 0.021050918417387838, 0.02099329350798611, 0.02083529075931948, 0.020578837038513497, 0.0202294732382012, 0.01980366134148185, 0.01932289069815066, 0.018804724414280043, 0.018257679468002063, 0.017690086093311304, 0.017109719047863597, 0.01652412801493859, 0.01593550736712409, 0.015347421472041909, 0.014767547544251374, 0.014203365847975763, 0.013667061610090118, 0.013159801437299105, 0.012672726754267121, 0.012198608067847637, 0.011730960861969028, 0.01126421765065843, 0.010792606825747886, 0.010319548635273419, 0.009847486672452731, 0.009378800050301093, 0.008915616620024642, 0.008462202165577784, 0.00801613635099576, 0.007567903317638288, 0.007114132002303447, 0.00665147778345403, 0.006176095700682828, 0.005683914542151355, 0.00517301350248947, 0.004640356370827639, 0.0040826397577977385, 0.0034922585363023223, 0.002862101169160425, 0.0021843321633337742, 0.0014517706175528925, 0.0006638754150316647, -4.171920470707412e-05, 0.0003224466463242292]]], "drag_distribution": [[[-9.726830162034485, 5.775514037867556, 2.6775466792161158, 0.3835654672210506, 0.20610172772902144, 0.17364844338724578, 0.13930131964932027, 0.10162571302081512, 0.06263634722873393, 0.02704182034789386, -0.001975029288579802, -0.024714114345105214, -0.04187098136459783, -0.05424031316241628, -0.06255728945184884, -0.06739936188434902, -0.06915463549964365, -0.06801430633812541, -0.06419916042619055, -0.057771208361125634, -0.0648678992633021, -0.054803523629218504, -0.04475398871694021, -0.03541863768523388, -0.027439236938953157, -0.021421641714727213, -0.01761804260107143, -0.014679920536407293, -0.01204507455825593, -0.009545230742422294, -0.007107688719160712, -0.004687551740304903, -0.00225145614756731, 0.00024003599933497094, 0.002814995836091937, 0.005499054376611696, 0.008129771815286152, 0.010298030429043158, 0.012753074881529517, 0.015127103725618585, 0.017296989920906693, 0.019098206786525955, 0.020719875614230044, 0.02244070263286989, 0.024141951977470318, 0.025656112864281266, 0.026972813407047106, 0.028025654553124637, 0.028760251301888806, 0.029155640911717746, 0.02672659995711769, 0.02406591541016886, 0.021752116160637647, 0.019915857875243484, 0.018312531533729956, 0.016578501810629292, 0.0143032982192086, 0.011910701945689352, 0.010186485664772267, 0.009978470024393579, 0.011415481351071444, 0.013912674727693098, 0.016969439644983462, 0.020238587830956712, 0.02356036511679516, 0.026801667509685198, 0.02986395611147691, 0.032716627937592405, 0.03536379938488168, 0.037707548964101216, 0.0396270505906905, 0.041064425434148365, 0.04203112414656995, 0.04267754298449571, 0.043190154736005446, 0.04358393677255998, 0.04387203258682188, 0.04404972332639591, 0.04406214754319172, 0.04378493195879759, 0.0431806834229941, 0.042249901976274616, 0.04102740355403079, 0.03970971314884903, 0.03872678316146036, 0.03775985818638661, 0.03622412777823414, 0.03435781879356763, 0.032107800811811665, 0.02939684979103038, 0.020910582937986734, 0.020625375674565016, 0.02028679776307447, 0.020134746800037646, 0.0205729458150557, 0.02212888644099522, 0.026306610637583026, 0.0385641467536666, 0.09437843299302805, 0.20238146874756546], [-1.617108816209843, 1.3323154208741823, 0.6725554228542157, 0.2694241148232646, 0.18093615724018697, 0.1527968637819054, 0.1206077743470444, 0.08437150538140292, 0.04656592106903452, 0.012067013579467557, -0.015843933053827013, -0.03754404508697083, -0.05377024264475992, -0.06533082409525773, -0.07296416584082638, -0.07724632037885688, -0.07856270707935142, -0.07711056074624652, -0.07308755169185052, -0.06643756019964996, -0.06461784130276237, -0.05489960447443793, -0.04521614186040288, -0.03625708390820832, -0.028655058797272582, -0.02301095860076004, -0.019555098244229314, -0.016966392978653513, -0.01467364438886803, -0.012519737568416714, -0.010437911724562873, -0.008398733818898389, -0.0063746429739644245, -0.004332199040175314, -0.00225309752024672, -0.00012756298241836826, 0.0019388883972013007, 0.0037245476420720625, 0.00552070909676537, 0.0071215760184008305, 0.008406492531895605, 0.00920767680069281, 0.009713436377347728, 0.010194865318919673, 0.010513840123925481, 0.01047265070551914, 0.010041949222096502, 0.009154714707798139, 0.007771763744167714, 0.005914163334350553, 0.0026066329707767743, -0.0007872262411898394, -0.003651148162793654, -0.0058408275530961225, -0.0076088054903612505, -0.00934679681351988, -0.011427922535617106, -0.013464328037894735, -0.014728084071010615, -0.014433379752309159, -0.012478513912585608, -0.009381304221324811, -0.005676794341507679, -0.0017281237479055828, 0.0022989864010086953, 0.006267860560606462, 0.01007688865565172, 0.01369366373446271, 0.01712237096619618, 0.020268953021855968, 0.023014078932538044, 0.0252858879234869, 0.027055300893125432, 0.028449049240248415, 0.029663593240862103, 0.030730909787769073, 0.031669388030323924, 0.03247849349631664, 0.03311770252820178, 0.033462150856126825, 0.03347309187552204, 0.03315540321308214, 0.03253546600791783, 0.03172417100024001, 0.03097570152015814, 0.030180183962859677, 0.02903506363572504, 0.027600306877535744, 0.02580482365066494, 0.023556355371194892, 0.018442545035558162, 0.016526792521353167, 0.014110015065345701, 0.011194320156321887, 0.0078071483532523136, 0.003995315384088018, 0.00017318528598956904, -0.011386496199516542, -0.0094272303457369, -0.004219849490137242], [-1.105089421470112, 1.0852268787762709, 0.6144428545368281, 0.3480299660478502, 0.2507972855655636, 0.21192582634585044, 0.16653948062644283, 0.11511844973822004, 0.06136510271249373, 0.012318406108372015, -0.02728949690071488, -0.058024329064952966, -0.08095523475185085, -0.09724438558804924, -0.10795035595897166, -0.11389771378862588, -0.11563757265744055, -0.1134544173133937, -0.10762369150159994, -0.09802585930868205, -0.09246382757570268, -0.0786599563455446, -0.06491249728719883, -0.05220593055572982, -0.041443287174462405, -0.0334835292379146, -0.028649265715114954, -0.025057512074354985, -0.021887205999160084, -0.018917024196057234, -0.016053319750143492, -0.013259064424359968, -0.01049670871120557, -0.0077203473601345825, -0.004907002025351164, -0.002047928319572057, 0.0007246220284399875, 0.003155240049537009, 0.0055093111448962385, 0.007545794633805158, 0.009092704406123352, 0.009908661501652429, 0.01026309330086744, 0.010541741672215733, 0.010540356867676907, 0.010055835342210395, 0.008970799075252636, 0.007190662570175939, 0.00466194360692181, 0.0014303419182585576, -0.0034007365122830117, -0.008288449536066313, -0.012341260085789622, -0.015351622601021962, -0.017687031323850442, -0.019920525172527983, -0.022576939016188503, -0.02511525801173727, -0.02651408911550926, -0.02566971929008857, -0.022446593391783516, -0.017757731497169176, -0.012189461219312877, -0.006266359440689006, -0.0002270239748340647, 0.005732232535374715, 0.011465388876433301, 0.01692587921394192, 0.022120139502615644, 0.026915099518810943, 0.03114062319166574, 0.03468939018654558, 0.037506518721528194, 0.039765832530287835, 0.04175210854732107, 0.04328135773894813, 0.04460683010446274, 0.045733598426942544, 0.04661851212348851, 0.0470800871441761, 0.047061318013396365, 0.046571269179370794, 0.04564550360177229, 0.044414478091827546, 0.04318357385682416, 0.04186444904302041, 0.040118080893341526, 0.037972335661221025, 0.03532033193908837, 0.03202547134084068, 0.03209323685775695, 0.02844061306564493, 0.02373336724377714, 0.01781882118593812, 0.010491992067032382, 0.0016002311628588455, -0.008792443058260217, -0.020179726969953786, -0.06835220735862699, -0.11860996751008665], [-0.3978295541530054, 0.8566485207415494, 0.5498697715772357, 0.432146003823447, 0.3803021618188796, 0.32157607866037374, 0.2514930258974379, 0.17156255719878108, 0.08783789143365259, 0.011452317018727075, -0.05011691149436051, -0.09779811773260864, -0.1332907193304412, -0.15842550665084257, -0.17486522923689554, -0.1839030265215701, -0.18640226876148816, -0.18281253337383005, -0.17355387493994992, -0.15837658305665137, -0.14495860107903297, -0.1234802573330106, -0.10210091865711753, -0.08236027849704973, -0.06567052612816215, -0.053376896019413166, -0.04592475414165957, -0.040424044767225685, -0.03557892806491511, -0.0310443352579485, -0.026674318185220727, -0.022423449936152272, -0.018233406330730333, -0.014033522095591517, -0.009792327760091592, -0.005503930965370832, -0.0013446215142002998, 0.002384634240417948, 0.005859859570393878, 0.008788767874205709, 0.010904486022199972, 0.01183147483844606, 0.012003207144457963, 0.01203096193571518, 0.011589008639729479, 0.010204450797441486, 0.007794046280411859, 0.004207747972428465, -0.0006322133641082146, -0.00663976870776627, -0.014436649276129112, -0.022257148035070572, -0.028689242655103565, -0.03340477907701769, -0.03698703245947883, -0.04035019797803814, -0.044634664579246135, -0.04865487510887587, -0.05084863464824804, -0.04953240589640987, -0.044512139082465034, -0.03711220674713069, -0.028316743640779653, -0.018961144382264598, -0.00941902017128589, 3.992134192536949e-06, 0.009080999720285417, 0.01774334300528455, 0.026008804912315997, 0.03367699976777725, 0.040484056783915645, 0.046245186973300045, 0.050825998722712554, 0.05447197159481702, 0.05764087418374234, 0.060432021916462395, 0.06289895961859755, 0.06504908677085403, 0.06681560119408662, 0.06791516012594087, 0.06825830239707768, 0.06786114294310443, 0.06677467408095179, 0.06515855302161797, 0.06339978781932791, 0.061469792131146665, 0.058984575087594616, 0.055893381898138736, 0.052018471916592354, 0.047137263918495924, 0.047886172594949185, 0.041525523491750586, 0.0418615725246185, 0.03005630458105328, 0.01523253414595598, -0.00337740897013241, -0.02679990341106028, -0.05720302667414675, -0.09968843409345564, -0.18054100251984362], [-0.11412385445094449, 0.7323213499746799, 0.555235814932598, 0.45148904288538266, 0.398769332517105, 0.33726458704079953, 0.263355222844524, 0.17888641351889634, 0.09035270775364032, 0.009582304571360228, -0.05548321630418168, -0.10584091662345858, -0.1432989872311309, -0.1698001176555631, -0.18710712111955005, -0.1965902947109438, -0.19916422443891738, -0.1953064261485913, -0.18545815064818114, -0.16933458303151402, -0.15359192801885752, -0.13083991473302534, -0.10819618119201914, -0.08728995561766334, -0.06961464255661592, -0.05659327660418396, -0.04875083193806075, -0.04297510274587669, -0.03789176486686159, -0.03313784815019051, -0.028560017027138385, -0.024111462299585388, -0.01973172734159136, -0.015347139095872486, -0.010925893902014833, -0.006464259658965817, -0.0021388325169075222, 0.0017640408760300193, 0.005353479672726175, 0.008348170294487246, 0.010466572408450281, 0.011310298237053148, 0.011337413101165542, 0.011193592103087312, 0.010530592824934813, 0.00884248520559897, 0.006037855889713086, 0.001957170184892164, -0.003479758035099612, -0.010176612878117013, -0.018536995743106997, -0.02720909556489802, -0.03440166619665653, -0.03976358998284931, -0.04391836769488537, -0.047844417544256286, -0.05234724549824308, -0.05654826759742612, -0.05879748541328173, -0.05731549385848429, -0.05189920535781187, -0.043931051302574804, -0.03447562411425081, -0.024419722359680027, -0.014160904556762902, -0.004024442276747274, 0.005747969044823738, 0.015082137977867343, 0.023995207969655326, 0.03227394324269744, 0.039637915582789604, 0.04589110672692534, 0.05089075018929571, 0.05489669968402441, 0.05839468820652905, 0.06149090735331274, 0.06424167628041695, 0.06665464585636055, 0.06865931995013447, 0.06995594224769035, 0.07044976126712482, 0.07015847400887788, 0.06913457169986831, 0.06753266443220217, 0.06573302958071489, 0.06374107494174205, 0.061197840815972855, 0.058018891371858165, 0.054012608154336374, 0.04947150743921457, 0.06432759896961758, 0.05602218595272253, 0.04570308641028928, 0.032907925464632164, 0.016972298096222367, -0.0029264047204312664, -0.02788282379665363, -0.0601915794476433, -0.10519553257019895, -0.19047991861657662], [0.05466542861508439, 0.7217601562365417, 0.6011944557627752, 0.5000359708201014, 0.4426781465435924, 0.3744529743004923, 0.29210462609771043, 0.19786790530622256, 0.09905724589188437, 0.008912926781799332, -0.06367706014327085, -0.11983638107535476, -0.16159098733654065, -0.1911138261736065, -0.2103755496134252, -0.22090754909099866, -0.22373172060053814, -0.21938250072195137, -0.20835029447257633, -0.19030259242583794, -0.1714917461800536, -0.14610530556345344, -0.1208412316516824, -0.09751948139738952, -0.07780843214847215, -0.0632983333480962, -0.054572378115074364, -0.048155557379564805, -0.0425113010510867, -0.03723564062777057, -0.03215814758303321, -0.027227452640163838, -0.02237694842190943, -0.01752512552493769, -0.012637492087244398, -0.007711665682460406, -0.002937878574013801, 0.001386716557562387, 0.005329590123475712, 0.008596292875904047, 0.010872796221324452, 0.011713457220868242, 0.011629191089616181, 0.011340016710193954, 0.01045450063456025, 0.008403815091830216, 0.005083552660158799, 0.00031507034275840746, -0.0062574205750812045, -0.014291607077109258, -0.024056980000637513, -0.03384029501947657, -0.041949768987313486, -0.04799057136989855, -0.05265867479781535, -0.05704894416814655, -0.06206391460660312, -0.06672509267344473, -0.06919134728625569, -0.06747883544345258, -0.06136241768329006, -0.052370011560170446, -0.041708970451746555, -0.030371717599442655, -0.018804014430707908, -0.007370337285036552, 0.0036582977643666967, 0.01419792979826165, 0.024266460246803703, 0.03362494442307498, 0.04196025576706598, 0.04905318195899013, 0.054743864703791445, 0.05932242437785657, 0.06333203015253598, 0.06689183100437147, 0.07006431842790159, 0.07285789450638258, 0.07519396966046205, 0.07673785493528701, 0.07738367063441248, 0.07715164727093579, 0.07609937151893499, 0.07438938338104162, 0.07242569325605486, 0.0702394585153697, 0.06746324729174988, 0.06420902304061214, 0.060116298234683924, 0.05487302587973079, 0.06517137796339081, 0.05678166238355181, 0.04595363906418883, 0.03223236669885848, 0.014916151921066958, -0.0068833793500175065, -0.03436219716705976, -0.07006234998681536, -0.11997592988403817, -0.21495875363212535], [0.16073098952650947, 0.719193738658825, 0.6291804490457052, 0.5306488023476865, 0.47044014257406086, 0.397969514835254, 0.31026444625288563, 0.2098191386639433, 0.10447374237606133, 0.008369019464206704, -0.0690036193183378, -0.1288490645905686, -0.173332255757646, -0.20477286788068438, -0.22527392327685786, -0.23646938216786717, -0.23944945104618345, -0.23478485926511702, -0.22299713004826052, -0.20372245536623382, -0.18298181115361006, -0.155930682593223, -0.12901010480048333, -0.10416180641010771, -0.08316582873965173, -0.06771910104187454, -0.05844179908692372, -0.05162815337883711, -0.04563819980999537, -0.04004229850509799, -0.0346592931823789, -0.029435069269345904, -0.02429926738297431, -0.01916547601179971, -0.013997761730257028, -0.00879485024122579, -0.003755583963940562, 0.0008170766113428283, 0.004960169908683517, 0.008371790533895807, 0.010716886271857072, 0.01151919696223074, 0.01132270121924687, 0.010894132088857754, 0.009813922286278925, 0.007472643596946077, 0.0036925226621210023, -0.0017208624086697591, -0.008844444179703197, -0.01755090272303687, -0.02800883534208845, -0.038481690648670755, -0.047160255420837516, -0.0536205072085915, -0.05860359826506979, -0.06327805127648665, -0.06860805591493556, -0.07355181925706547, -0.0761474634784277, -0.07427960991650258, -0.06770908960984025, -0.05805312957596166, -0.04661310102356124, -0.03444909973542208, -0.022037062303656457, -0.009766457582923063, 0.0020730181055747567, 0.01339117142131165, 0.02420637339486411, 0.03426333251052504, 0.043227846394977384, 0.050865952117655024, 0.05700691179936485, 0.061960117337634964, 0.06630534545048711, 0.07017003807435408, 0.07362059618566796, 0.07666589770866689, 0.07922221885685157, 0.08093265455751071, 0.0816842454315287, 0.08149886943334671, 0.08043729117489812, 0.07866643169418057, 0.07660404077159026, 0.07429931962553758, 0.07161516085879291, 0.06827315232255746, 0.06399577592440144, 0.05847203377803725, 0.06941449031992779, 0.06033290783740028, 0.04869831765816521, 0.03399745781153644, 0.015475182724761921, -0.007821181172710537, -0.037156300869997265, -0.07519516655417237, -0.12835388903454598, -0.22955450764634752]], [[0.03690803193681781, 0.03714493247001659, 0.03763945124264232, 0.03854142819831392, 0.04105233788874932, 0.11926694047306687, 0.20358786735602988, 0.09778599283897847, 0.1120319501123512, 0.038857668597829374, 0.02588138145830821, 0.021423755091483636, 0.01727504120970767, 0.01344885121237709, 0.009976705955271767, 0.006871929281080814, 0.0041339284980055225, 0.0017519358696524586, -0.0002870554453521458, -0.0019686738972766677, -0.006424340969376693, -0.007075688100457642, -0.007428770150564097, -0.007584705637854691, -0.007645134809078338, -0.007714353450228568, -0.007884616983229707, -0.008137072527435443, -0.008423978544563834, -0.008722314420586397, -0.009029055632490875, -0.009347922566943983, -0.009675885187425537, -0.010006973413211646, -0.010338109683627325, -0.010667130525402028, -0.010996688626689738, -0.011331422047486016, -0.011674381103972887, -0.012031831069380135, -0.012423451372406264, -0.01288326227216033, -0.013422376445016197, -0.014045645863467534, -0.014785257696299603, -0.015606480185999815, -0.016441039758519165, -0.017215789282141382, -0.017838180293437523, -0.018194301175249606, -0.018472703194117434, -0.018343156323754214, -0.017785246289750884, -0.01683889178194499, -0.01560774155799471, -0.014124236412682794, -0.012381475027790648, -0.010373779113852287, -0.008098517055861293, -0.005594866568393363, -0.0029384963240875884, -0.00026123862155751017, 0.002359412491600632, 0.0048548324587867325, 0.007182008166576932, 0.009307108963973148, 0.011207789335900688, 0.012876898935793094, 0.014315702651924521, 0.015514116891727343, 0.01647086315064886, 0.017196560400289343, 0.017719294675049964, 0.018124034119382668, 0.01848731208218916, 0.018804653198176962, 0.019110738156404575, 0.019561509470874906, 0.019727248749640276, 0.019737572702748493, 0.019599525826299573, 0.01932844888997812, 0.018938969768618644, 0.018456584986917463, 0.017923222770970932, 0.017347047063663783, 0.01670215778319871, 0.01596490525791842, 0.015109207203430106, 0.014102013901603034, 0.01521143678979457, 0.014436937679274953, 0.013458800006798301, 0.012234040097053516, 0.011417580785094961, 0.01088880982349252, 0.009650967193891212, 0.012276195089667206, 0.025734151583605366, 0.05315344861547674], [0.10162214187120755, 0.10213042219282972, 0.10311058156384444, 0.10463369719375257, 0.10814828753424026, 0.2160810246215425, 0.19977587833781854, 0.13007242966993213, 0.13284681998995948, 0.09094354340300306, 0.06682683638968019, 0.054311187271723425, 0.04237490491687147, 0.03126160091906614, 0.021133181852498278, 0.012056040420563538, 0.004036245432423354, -0.0029574311591466255, -0.008931101750367055, -0.013760237523888618, -0.02170311210831144, -0.02372020300545613, -0.024831553026880452, -0.025351160670424328, -0.025593292431609977, -0.025878588404781012, -0.026486729626998346, -0.02735084724551406, -0.028323394007347204, -0.029341771093457158, -0.030399592783539528, -0.03150905777889574, -0.032661412759022485, -0.03383929300275805, -0.03503580886289693, -0.03624802849982112, -0.03748973163132773, -0.03878158975217223, -0.04013959754474788, -0.041589257780214446, -0.04319667257513395, -0.0450726742949182, -0.047255478893246154, -0.049765009843524846, -0.05271012063543218, -0.05599455724653567, -0.059412531096088024, -0.06273669364845569, -0.06567052221604375, -0.06784133284692258, -0.06926737005278376, -0.06936154568877516, -0.06803448980704645, -0.06539958297282938, -0.06178412029163099, -0.05730691785914676, -0.051969312279837296, -0.045769428397913633, -0.03868713644871959, -0.030810472940225025, -0.022377046175988017, -0.013754039820417521, -0.005263082453626197, 0.002868491607620811, 0.010501066213479798, 0.017526806549111328, 0.023873727922539396, 0.029517786703576007, 0.03446134997809278, 0.03867115560898364, 0.042139650376833905, 0.044894343286698904, 0.04701242793774211, 0.04875225806667172, 0.05035788569906981, 0.051814564029957, 0.0531531940365606, 0.05456779645575038, 0.05542021922214382, 0.05581563884135092, 0.05575477429955757, 0.055278064273504596, 0.05442817150776234, 0.0532785962486378, 0.05195053643651866, 0.05046863896526603, 0.048747948164475245, 0.04670949505991021, 0.04426696387378105, 0.04131248778022569, 0.04092246333374918, 0.0374954601685542, 0.03329865692241925, 0.028185037439860717, 0.022936107887296955, 0.017222553280508215, 0.009427977128819424, -0.018359901729071693, -0.02730182687372815, -0.03737245935036663], [0.15898977521693108, 0.15972302530218396, 0.16109236459015958, 0.1630620479768146, 0.16709810206892264, 0.28972966195391264, 0.2344260586020058, 0.1741333047671484, 0.14966354717519326, 0.12290503657018294, 0.10264357916215619, 0.08295844241753894, 0.06406303968239183, 0.04642720826309525, 0.030336577950561897, 0.015907804628965606, 0.0031536967678364087, -0.00797528251971373, -0.01747591577268139, -0.025116816843045987, -0.03568237199996996, -0.038934400591277216, -0.04073301857665588, -0.04158479299823789, -0.041996207358056196, -0.04248331308722058, -0.043494720849017836, -0.04491937580367896, -0.04651951108107835, -0.048197527804882824, -0.04994427104169646, -0.051779667162094756, -0.05368984480723702, -0.05564723774141409, -0.05764174862275264, -0.059670092238685545, -0.06175661383836496, -0.0639370542984804, -0.06623970623014347, -0.06870802014119884, -0.07145054206062304, -0.07464805605064842, -0.07836362999048811, -0.08263125913618889, -0.08762995189626027, -0.09320884850312754, -0.09903832716647362, -0.10475153191331288, -0.10986660306357349, -0.1137750635226064, -0.11628991038949581, -0.11663126323054818, -0.11464503132167855, -0.11051009342374248, -0.10475654318434514, -0.09758296221012773, -0.08900019355528595, -0.07901122430329838, -0.06757901697869727, -0.05483277119348214, -0.04115682185581449, -0.027127441308747124, -0.01329440783385037, -2.9907435926048575e-05, 0.012438511921650047, 0.02393582112818125, 0.034344898229780325, 0.04362625210004213, 0.05178310601753975, 0.05876105485114747, 0.06454654600460301, 0.06918187377059122, 0.0727877495533984, 0.07577887374108351, 0.0785514108885712, 0.08108124610063523, 0.08338893149123676, 0.08567674290208287, 0.08718081099618465, 0.08795737365024395, 0.08799951872351491, 0.08736973855718845, 0.08613580677335607, 0.0844141352475118, 0.08239681614805698, 0.08012334308945435, 0.07745493072104297, 0.074262069817901, 0.07040347772310943, 0.06570313621172251, 0.06361064780810934, 0.057691996916123825, 0.046954314590130504, 0.03666918105383152, 0.02483170285674741, 0.010553373069331469, -0.009037445234445019, -0.029492676133044772, -0.04918986044930545, -0.0742497709973837], [0.23848759443864123, 0.23948655130501587, 0.24127322425718556, 0.2435546372597475, 0.24722641877717957, 0.3558500594407214, 0.2715492823732206, 0.23203180966890655, 0.21495796021125638, 0.18068068659198933, 0.1508589129067809, 0.12116117570751697, 0.09245796769702798, 0.06559854083990474, 0.04106399689270011, 0.01905014416690356, -0.0004184067799335739, -0.01741706984152673, -0.031920201072581054, -0.0435211678955295, -0.056337997643880526, -0.061372882020245045, -0.06416839496182486, -0.06550933510662191, -0.06617955673831401, -0.06697660865449362, -0.06859140498590972, -0.0708468759626973, -0.07337508468965796, -0.07603018188491222, -0.07879979614394317, -0.08171518771298616, -0.08475526160257084, -0.08787801835772274, -0.09106942208872401, -0.09432666523140479, -0.0976908051579291, -0.10122099189858422, -0.10496498907093256, -0.10899375726591906, -0.11347847040846577, -0.11870233669705836, -0.12476529903768364, -0.13172295186241925, -0.13985799051549752, -0.148943685182914, -0.15847311725896657, -0.16787780986958997, -0.17640573562445208, -0.18310278456331794, -0.1873373503833513, -0.18816540905578585, -0.1853325780488932, -0.17910961023597133, -0.17022878802990637, -0.15905828965068677, -0.14564169027784699, -0.12999998961097317, -0.11207328039176721, -0.09204513671449108, -0.07051550414414305, -0.048574027684027896, -0.026912697536988817, -0.006116354550098364, 0.013459100671760506, 0.031541058150633496, 0.04794669697053007, 0.06261389020812348, 0.07554680705917187, 0.08666008199018553, 0.09593065790482311, 0.10342085010332329, 0.10931170403685031, 0.11424245187637941, 0.11883079215567274, 0.12303891019256517, 0.12685240487924343, 0.13040976866963114, 0.13294723757913182, 0.13437276168894405, 0.13466289662629313, 0.13391014093716713, 0.1326307808508871, 0.13057656187210062, 0.12790544050514494, 0.12475608490731226, 0.12092807186435645, 0.1162238769457858, 0.11042331519834797, 0.10325000826836861, 0.1084526901349353, 0.09759464839955548, 0.08447875143582184, 0.06870396877024808, 0.04975557504199861, 0.026828664137319023, -0.001187992979055892, -0.036369300571412584, -0.08233606793103662, -0.155081300981663], [0.25959084043604663, 0.2606429156334228, 0.26249424059083654, 0.26474225532412243, 0.26790626873642825, 0.35979936366765203, 0.27813004668235586, 0.24654125866061904, 0.2306374245852914, 0.19538277076708724, 0.16312167095229968, 0.1307367463233897, 0.09936791454960385, 0.06999007827639615, 0.043145313709573904, 0.01905403356972724, -0.0022550872922291933, -0.020864523117652817, -0.036739084685446705, -0.04941534408561611, -0.062306683022785345, -0.06784189081873926, -0.07091886876368453, -0.07240057707521652, -0.073148661785016, -0.07403944541051247, -0.07583126729231818, -0.07832772431651434, -0.08112437835527589, -0.08406266676670346, -0.08712959917519432, -0.09035968092636905, -0.09372984982735441, -0.09719416294061667, -0.10073773044105475, -0.10435823741141091, -0.10810196076717994, -0.11203522022964581, -0.11621186679535064, -0.12067070317925306, -0.1256251901118126, -0.13138879574269258, -0.13807085453045997, -0.14573074021243348, -0.15467709244706584, -0.16465908693417217, -0.17511801480594563, -0.18542660204753217, -0.19475536041502264, -0.2020528810509527, -0.20651269653790072, -0.20719119887691925, -0.2038091418965337, -0.1966680796964387, -0.1866811464642105, -0.17420646198793732, -0.15928448576900392, -0.1419350651229773, -0.12208534848435358, -0.09992700420843638, -0.07611758433944542, -0.051861036377032446, -0.027911341916829268, -0.0049133251828748625, 0.01674134956601576, 0.036753124988001665, 0.05492109426148303, 0.07117711463765919, 0.08552584052210045, 0.09770647535434042, 0.10781869965634944, 0.11594669759239763, 0.1222947235934516, 0.12756738106226206, 0.13244537511744892, 0.13688859375389617, 0.14087028148050823, 0.14448713831707663, 0.14704411831761274, 0.1485404651546677, 0.1488551058051465, 0.14805752356632365, 0.14624715357880003, 0.14360614748515954, 0.14044225625813314, 0.13681827122223578, 0.1324896769816174, 0.12722686451069345, 0.12078019378267396, 0.11284078810769375, 0.1173870329325506, 0.10548930239333901, 0.09113119938525438, 0.07387007227061346, 0.05306398055364617, 0.027885966788746924, -0.0028628549597940127, -0.041458451720370854, -0.09186355597409371, -0.17160453916837026], [0.28468808969553827, 0.2858170788226203, 0.28778169453110636, 0.2900816428787166, 0.2929661610882352, 0.3752132948997903, 0.29557017645898787, 0.26725750511383783, 0.2505809159092769, 0.21336829344430358, 0.178128498029222, 0.14257091068554034, 0.1080809416294701, 0.07576325269903951, 0.04622526582104347, 0.01971381969765157, -0.003738312229761114, -0.02422184997879952, -0.04169308695528239, -0.05562915875944759, -0.06902189080122781, -0.07513076663127133, -0.07852919733610562, -0.08016970203875537, -0.0810031573675131, -0.08199637378625524, -0.08398542733130797, -0.08675235016659295, -0.08985083083756265, -0.09310711221118413, -0.09650728246421307, -0.10008951963262339, -0.10382846117826301, -0.10763456850217284, -0.1115186880880436, -0.11548150427916178, -0.11957546324902786, -0.12387395507001081, -0.12843661574071305, -0.13335030386607524, -0.1388220133244367, -0.14519409843063605, -0.15258550591338332, -0.16106109259317838, -0.17096220864461875, -0.1820135084358059, -0.19359881958955186, -0.20502602956432558, -0.2153795812370899, -0.22349841326330624, -0.22841461692382056, -0.22915185003153374, -0.2254007163680383, -0.21749420510555495, -0.2064416930966293, -0.19264094511184898, -0.1761391777063377, -0.1569597322808607, -0.13501963734923986, -0.1105249313689029, -0.08420109953517783, -0.05735580594257743, -0.030846183653530018, -0.0056029682757474325, 0.01811118052448345, 0.039988423001518926, 0.05981782926772895, 0.07752921379524062, 0.09313294931467653, 0.10652783689189742, 0.11768444472652324, 0.12667558880929297, 0.13371667306948176, 0.13958022323220218, 0.14501695614086949, 0.14998148939876726, 0.15464767191344866, 0.15867935646592254, 0.16182380556902487, 0.16366418130487748, 0.16414755725898933, 0.163377717696241, 0.16147398972879926, 0.15864243206508416, 0.15522580562532007, 0.15129530964173626, 0.14658203318310345, 0.1408330868236773, 0.13377333765340674, 0.12506216855228766, 0.12861547447266455, 0.1154410721327374, 0.09955627583115238, 0.08047360541355414, 0.05752735627039662, 0.029771178305817724, -0.004113100352305493, -0.04662814443733227, -0.10212443122066893, -0.18985767722749447], [0.3057411345093368, 0.30693757344951234, 0.3090049851780228, 0.3113680389656973, 0.3140872567844207, 0.3904241051301273, 0.3124332491193885, 0.2854459250070059, 0.2675851067858873, 0.2285623894631059, 0.19080733449391785, 0.15259325764643195, 0.11549553884501948, 0.0807234959228338, 0.048937838302848785, 0.020406967924130562, -0.004833060314783479, -0.02687985131767563, -0.045683157924036356, -0.0606719855401554, -0.07457332114258813, -0.08115887223817835, -0.08482412456291126, -0.08659600056912131, -0.08749952858528987, -0.08857674460213939, -0.09072841253756453, -0.09371877917877366, -0.0970667347740096, -0.10058576016998001, -0.10422283964951574, -0.10804799792738733, -0.11203549559699066, -0.11613078939012786, -0.12031667905578676, -0.12459133150520707, -0.12901034302253583, -0.1336529178024666, -0.13858333722676344, -0.14389522751042108, -0.14981179600126904, -0.15670225293883755, -0.16469488362926737, -0.17385986729435693, -0.18456592078747344, -0.19651720539178688, -0.20905001593408154, -0.22141844392725427, -0.232635314378378, -0.24144822308402294, -0.2467632438867268, -0.24756915388357473, -0.24353117457844767, -0.2350080507066825, -0.22308875362331787, -0.2082036511134962, -0.19040535672782327, -0.16972006702917214, -0.14605681308999052, -0.1196342883732554, -0.091471267162447, -0.06276783343257471, -0.03444971018762741, -0.007281220622116196, 0.018276519541419668, 0.041873326468376444, 0.06327405220129835, 0.08240095254665403, 0.0992624443786279, 0.11374726554394067, 0.12582243729465287, 0.13556547263705515, 0.14320738209301506, 0.14958046233751635, 0.15549468630621327, 0.16120314264043636, 0.16634583771109687, 0.17077414183085665, 0.17423329107125757, 0.1762789777727481, 0.17685555815341422, 0.17607474471334988, 0.17406677945979532, 0.17105495210823773, 0.1674096537081485, 0.16320820060984978, 0.15816091281254824, 0.15199527190669657, 0.1444147980746147, 0.13505242418177743, 0.1378084019621056, 0.12361553747971758, 0.10650653667870409, 0.08595328350422143, 0.06119069055756905, 0.03128411429030989, -0.005202215588696968, -0.05097577480826009, -0.11071272656472105, -0.20511793321384303]], [[0.004101733563243963, 0.0043666244789598045, 0.0049011103562568116, 0.005667889000074768, 0.0065922896641962825, 0.007529676043245146, 0.008180083346880305, 0.005351993450649066, -0.05701924854540069, -0.2673681876807139, 0.6887323338671539, 0.24446466722191992, 0.0710300613598307, 0.014443716992468773, 0.011247560983068906, 0.008806166033531225, 0.006691192128911935, 0.0047614993806368786, 0.0029719276461005694, 0.0013216130621227064, -0.002506412645574381, -0.003442359705046091, -0.004163068606812853, -0.00470718799117138, -0.005116917319344325, -0.005437458793675893, -0.005724711359409637, -0.006032825087766828, -0.006356027801790496, -0.006686226372297055, -0.007024794109646846, -0.007374686995093632, -0.007733428679931846, -0.008097157623872676, -0.008463824114774718, -0.008831552238540855, -0.009197942886581061, -0.009561554069939221, -0.009920657005586177, -0.010275722638977412, -0.010636453016690112, -0.011019726844549526, -0.011446650854049098, -0.011941401785708693, -0.012524072026303013, -0.013146165169071829, -0.013744394413198881, -0.014250486365711666, -0.01458226896061326, -0.014644094956253005, -0.014484468160544505, -0.013957187575549188, -0.013095886010555826, -0.011954568759898136, -0.010614693381071382, -0.009080390293110053, -0.0073162737155031965, -0.005339788455196524, -0.0031820424142816935, -0.00091868007306806, 0.0013656520816944387, 0.003571285117457534, 0.005668709119553074, 0.007623448506944131, 0.009408914381341645, 0.01100512864519742, 0.012399620874619485, 0.013587564043955948, 0.014602737351722206, 0.016093993033931754, 0.01677215943864317, 0.017247308790342628, 0.017568039491898554, 0.01780514026189774, 0.018013481236114733, 0.01818422197787453, 0.01830756415618733, 0.01837178216711633, 0.018356238843322825, 0.01823525339730698, 0.018014625653835936, 0.017704199029028665, 0.01731408627570079, 0.016860984300136175, 0.016368601404124952, 0.015838574644869173, 0.015251957504425437, 0.014591323646933196, 0.01383736084596911, 0.012965748612405828, 0.013885177371352602, 0.013191378280720836, 0.012389588967036045, 0.011502367224487203, 0.01056246677288995, 0.009644021199834143, 0.008965005179529386, 0.00957421287688032, 0.01840845495161082, 0.036701129264730466], [0.011302209984929455, 0.012520062996446505, 0.014945509820825244, 0.01845909464553679, 0.022821157000692153, 0.02758231679424335, 0.03189466109266935, 0.02929763800812419, -0.01700557283752092, -0.1954879749339299, 0.6198909650131027, 0.2044897087941216, 0.05654366781019839, 0.041832620660503216, 0.032497285635215735, 0.024470837680487263, 0.017023844613548472, 0.0099225226750102, 0.003167481732410998, -0.0030963914610970074, -0.013068437850768656, -0.016984551396331083, -0.0200088891946495, -0.022304484312847293, -0.024048986486363208, -0.025431972968516348, -0.02668632698911872, -0.028035324771376203, -0.029452402943051587, -0.030906967811754026, -0.032407892639133344, -0.03396894683894327, -0.03557993542441861, -0.03722501487887893, -0.038897103992166095, -0.04059077014830037, -0.042300345988930114, -0.044024594801660405, -0.045760773275719466, -0.04751540087687148, -0.04933375827647825, -0.05129191663270958, -0.053482803644762704, -0.056012864626334515, -0.05897410460757166, -0.06216748918505349, -0.06532688416859175, -0.06816014099088581, -0.07030877209249566, -0.07134926735634706, -0.07112507955286375, -0.06928486577620285, -0.06595237656239612, -0.06134899620589562, -0.055825561462391454, -0.04941171009092377, -0.04197040803085434, -0.03358289203177025, -0.02437854160049592, -0.014670270803444733, -0.0048143027259066285, 0.0048445876083822404, 0.014080271234512042, 0.022734822114024274, 0.030690273382349652, 0.037860368047383734, 0.04419257487452386, 0.049672365219581315, 0.0543642821452766, 0.05949368266645561, 0.06262063832130468, 0.06493980927529079, 0.06660678854484436, 0.06791573851876843, 0.06911271241451358, 0.0701628088864266, 0.07102030702588533, 0.07163280390219137, 0.07191069669556745, 0.07173366628634939, 0.07110781531581147, 0.07007541566177572, 0.06868163548396626, 0.06700139785904806, 0.06513838820642248, 0.06309815934238151, 0.06079531196316367, 0.0581500405456408, 0.05507447985984388, 0.0514593408446081, 0.05087555866397534, 0.04678852144689929, 0.04200591952838697, 0.03648679948951716, 0.030171741162491016, 0.00997894739345134, -0.0023293197059629065, -0.017109587536882468, -0.027038343701096205, -0.035100934698416145], [0.015187644197572903, 0.01709995761973548, 0.020897673860128772, 0.026410848745900443, 0.03329826774641151, 0.040927330342835015, 0.04814655361160922, 0.05237874958403457, 0.03255632643817671, -0.12014609869209439, 0.5100337116532863, 0.2392848282869445, 0.07584556929243394, 0.05736295229771172, 0.04451968681790015, 0.0329995970912715, 0.02207730758954517, 0.011526340744251887, 0.0014181927863842077, -0.007969205573320128, -0.02104386956228362, -0.027062000728026142, -0.03171296338294905, -0.03524779269159856, -0.037939896670677015, -0.04008077623999421, -0.042027943377085264, -0.044123294195202827, -0.04632510939114571, -0.048587590507695774, -0.05092553760714067, -0.0533606325510501, -0.05587726999776881, -0.058451218982623454, -0.06107215384881847, -0.06373262539477399, -0.06642555111983713, -0.06915081591057544, -0.07190587524393922, -0.07470244117745019, -0.0776118435452627, -0.08075301361676279, -0.08427047670410204, -0.08832978171641644, -0.09307527234427779, -0.09820252455998589, -0.10330205688102237, -0.107922493077361, -0.11150746304439442, -0.113397456293771, -0.11321808851554747, -0.11052634667109183, -0.10550608812597341, -0.09849582282106618, -0.09003842842930733, -0.08018405004388672, -0.0687262024311896, -0.055792796209866186, -0.04158236658394338, -0.02657445095696135, -0.011317242965628325, 0.003686313652867155, 0.01805050260738846, 0.03152753884298713, 0.04393363575940216, 0.05513524453982344, 0.06505150564512605, 0.0736622018090792, 0.08103793676510693, 0.08850737092634615, 0.09342048391827688, 0.09710773225236591, 0.09979045254235967, 0.10191994800932962, 0.10388047408020723, 0.10561917294107921, 0.1070640243079117, 0.10813325359463129, 0.10868795130910322, 0.10853842616876426, 0.10768729537356496, 0.10619992487526118, 0.10414679009571731, 0.10164491377725712, 0.09885530579932796, 0.0957860168166441, 0.09230352874590317, 0.0883022472149844, 0.08361079199251535, 0.07805115062866573, 0.07417525862800234, 0.06637027089417256, 0.05708430271128446, 0.04606378244094476, 0.03290549147435882, 0.01705061076258218, -0.0023188044652505055, -0.025545994550332105, -0.04553082163111655, -0.06536284157890813], [0.024125814750289822, 0.027768606204224288, 0.03498264761195134, 0.045477308694665264, 0.05866852039581156, 0.07348834767248871, 0.08808114522703386, 0.09881343558543393, 0.08196957489075933, 0.0011002669681654256, 0.39686950691729084, 0.30216972945809656, 0.1201824597643212, 0.09364329428806732, 0.07258633671374033, 0.05267544643564084, 0.03331739240407684, 0.014344760552890596, -0.003973820411011343, -0.021014245354742788, -0.04106936878398586, -0.052287286019966586, -0.06096306178291041, -0.06756557503211603, -0.07260523652430181, -0.07662572819802253, -0.08029274222932144, -0.08424122769461853, -0.08839169676921485, -0.09266111436906307, -0.09707930104870986, -0.10168767278095191, -0.10645725967740512, -0.11134311867715549, -0.11632707006779185, -0.12139695383081328, -0.12654268899218823, -0.1317674860708969, -0.1370698081783726, -0.1424747350009807, -0.148118572911986, -0.1542269027699488, -0.1610724177140958, -0.16896747936646375, -0.17818681400165853, -0.1881657398482825, -0.19814002216561116, -0.20726365630971455, -0.2144890822717451, -0.21857031435362856, -0.21855279825823284, -0.21379667163960905, -0.2046325287236537, -0.1916880883126745, -0.175982431930583, -0.15761785349924345, -0.13621733221595955, -0.11202518378218158, -0.08541092509815494, -0.057265859070591264, -0.028613294960034327, -0.0003391390156383068, 0.026764324778351955, 0.05222545473336069, 0.07569687357890134, 0.09692773980794792, 0.11576707720102548, 0.13218124772580359, 0.14624702435376857, 0.15937747277514927, 0.16874227808577733, 0.17585179618436392, 0.18108450836384207, 0.18528020621970973, 0.189166909954829, 0.1926475825358198, 0.19569387057674364, 0.19811351737990016, 0.19961558240236382, 0.19981604990884635, 0.19868396924447995, 0.19633916016611513, 0.19291377694030803, 0.18862936614107148, 0.1837875971726782, 0.17839860893519843, 0.1722049585036761, 0.1649639828663075, 0.15640892378389792, 0.1462103391269685, 0.13789166355622326, 0.12318497431733358, 0.10581414625656005, 0.08531462613568556, 0.06097875963110269, 0.03186356696931379, -0.00340246509578028, -0.04605626582911715, -0.08946369822065348, -0.14294979598859003], [0.03015948689208917, 0.035003749450683914, 0.044589019542862186, 0.05854205992317258, 0.07611254832123662, 0.09593520754773102, 0.11567759156785895, 0.13101854362563076, 0.11700360819349594, 0.06102795919595639, 0.37713500127588023, 0.34028766616381306, 0.15009538242629794, 0.11827302441914127, 0.09163536819911859, 0.06597158669485209, 0.0408084384144507, 0.016028972363235108, -0.007956570563935582, -0.030280345685403935, -0.05500826737189027, -0.06982758269238303, -0.08129120019679989, -0.090018913979691, -0.09668531307680005, -0.10200875321559928, -0.10686834682703275, -0.1121019247215699, -0.11760377580654824, -0.12326516227557333, -0.12912639170872572, -0.13524258555402668, -0.14157552202600354, -0.14806592116134507, -0.15469020353128815, -0.16143301110242828, -0.16828230320851809, -0.1752437221922235, -0.1823165493192675, -0.18953524460105742, -0.1970812430019681, -0.20525413735883316, -0.2144155140913197, -0.224979559651432, -0.23731151650691698, -0.2506665509878937, -0.26403468870772956, -0.2762964297101009, -0.2860636204665335, -0.29168345524347616, -0.29178992257397524, -0.2856137951811229, -0.2735868433799532, -0.2565369708144491, -0.2358133482679564, -0.2115547191314608, -0.18326624407484948, -0.15127308239451193, -0.11606315289501026, -0.07881285315850696, -0.04087461488903938, -0.003397650948038148, 0.032541414348610576, 0.06631552878230874, 0.09746383148636399, 0.12565417203229587, 0.1506870015657851, 0.17251953857893831, 0.19123077209416595, 0.20825233270531424, 0.22070815448142472, 0.23019682166446168, 0.23720437587060894, 0.24299445373580197, 0.24845530913231487, 0.25343175775544774, 0.25772522865706404, 0.2611216436507383, 0.2632696183091647, 0.26367353333787896, 0.2622984389258086, 0.2593063056130814, 0.2548745172903921, 0.24929835989969895, 0.24297885651552104, 0.23593066383559125, 0.22781353569861637, 0.21830646803135603, 0.20705672136728928, 0.19362874560768595, 0.18140638272382892, 0.1619691075620465, 0.1390394139337495, 0.11200958200873173, 0.07996376518791849, 0.04169564697364899, -0.004548757913698328, -0.060663828963485926, -0.12063231742539823, -0.2156847850253901], [0.032140381564194256, 0.03751721981712192, 0.04815065636352353, 0.06363561458041454, 0.08315759201881821, 0.10523930113371847, 0.12738571036880864, 0.1451550130964973, 0.13542610419125947, 0.10037411480412894, 0.335331245543092, 0.334961394884003, 0.15984762750875903, 0.12693471290392175, 0.09831529760945926, 0.07039502474446213, 0.04286766737104118, 0.015676752513602267, -0.010685589625561109, -0.03522980623855996, -0.06132879934620792, -0.077708980477391, -0.09038181694957863, -0.10003265343196614, -0.10740735184111941, -0.11330002073929012, -0.11868216136243108, -0.12447917811363124, -0.13057373358755575, -0.13684630402217438, -0.1433420805387336, -0.15012227624874563, -0.15714467754502986, -0.16434382471066594, -0.17169395983449434, -0.17917860033982383, -0.1867853292046089, -0.1945213618164516, -0.20238681993213556, -0.21042072131481826, -0.21882456702176165, -0.22793061671528692, -0.23813948302560664, -0.24991005597666088, -0.26364766705879816, -0.2785298236831704, -0.2934399021088033, -0.3071391662714282, -0.31809026002974117, -0.3244615370333044, -0.32466975549127164, -0.3179177976021573, -0.3046794472099634, -0.28586887352093454, -0.2629793929136088, -0.23616688324051927, -0.20488663495955106, -0.1694997377255915, -0.1305453420127349, -0.08932301836450748, -0.04732806404125343, -0.005815991737304264, 0.03400223064823515, 0.07143071515456066, 0.10595868975221892, 0.13721847574790258, 0.16498943438506633, 0.18922543470754166, 0.20999811602218937, 0.2285859669400703, 0.2424127726447944, 0.25316639931284, 0.26124818403491545, 0.2678423512689121, 0.2740175430873516, 0.2796302846995799, 0.28447297096671764, 0.2883133702059052, 0.2907649693354636, 0.2912807663258109, 0.28982281529281034, 0.2865708219009134, 0.28172166108321794, 0.2756028021370724, 0.26865876729334215, 0.2609062926387965, 0.25196888693950664, 0.24149115109354174, 0.22908268370720514, 0.21426153837103767, 0.19966865333002695, 0.1878721737925684, 0.16325938958339212, 0.13402696300753122, 0.09931914713252636, 0.05789682443397307, 0.008046567645190692, -0.05336818843445368, -0.1303916795416731, -0.23709731269849385], [0.03240522749574763, 0.037963248544658594, 0.04895154611856891, 0.06495702934451289, 0.08514897266199249, 0.10802365439088056, 0.1310594892259955, 0.1498822405527999, 0.14340291715433198, 0.12046144481510819, 0.30366125285774603, 0.3200323584909466, 0.16109706747284364, 0.1285510722950829, 0.09954759846229273, 0.07103280032503959, 0.04282439510182458, 0.014908958178180694, -0.012182247850156598, -0.037410206009053794, -0.06356269682964835, -0.08045293659221274, -0.09352149555899607, -0.10347522529218213, -0.11108334884274046, -0.11716475833264459, -0.12272108017839638, -0.12870612101878784, -0.13499858678893448, -0.14147564245767336, -0.14818427909229062, -0.15518779189061804, -0.16244267365822024, -0.1698814657325746, -0.17747779589800564, -0.18521497181744268, -0.19308073875934287, -0.20108313922637083, -0.209222862694408, -0.2175407132107014, -0.22624505487516616, -0.2356791778181632, -0.24625674881799883, -0.2584516111730687, -0.2726827146144681, -0.2881024424892819, -0.3035592331411237, -0.31777496337410593, -0.3291625632391536, -0.33583042351745124, -0.33610085244569265, -0.32918461277683936, -0.3155681096939613, -0.29594921989681205, -0.27207473971151613, -0.24411307611204008, -0.21151184966823172, -0.1746502053970666, -0.13408840264398533, -0.09116978676088977, -0.04743966203815209, -0.004537475848186139, 0.036616770868368904, 0.07530462064585929, 0.11099915525759188, 0.1433214156559644, 0.17204427411467446, 0.19712123029528558, 0.21861672048777528, 0.2367035615416533, 0.2512620304883898, 0.26252251613845945, 0.27097323466271594, 0.2778655317262063, 0.28431185063278713, 0.290168695097796, 0.2952223763385028, 0.2992352146001573, 0.3018100172004903, 0.3023834017375216, 0.3009167896434847, 0.2975960189858985, 0.2926246793672851, 0.2859937438581254, 0.278488157068933, 0.27013095004938764, 0.2605406556234589, 0.24935444774496707, 0.2361720230623511, 0.2204979616041579, 0.21730998004627275, 0.19515244972094126, 0.1690746250778187, 0.13844311717532154, 0.10226982887923093, 0.05930244146518262, 0.007736078235560527, -0.0556820194862526, -0.13511653533880827, -0.24499557997731372]], [[0.0018560861304151644, 0.0018188940167543333, 0.0017417534602856054, 0.001623669632033873, 0.0014644546886759143, 0.001266734401096109, 0.0010391268701847726, 0.0008008363648041226, 0.0005865670677214928, 0.00046325398918360705, 0.0005607847024940702, 0.0015125028356651892, 0.447334267249807, 0.6447417065056772, -0.05869070442410716, -0.0030297896926658034, -0.0013821516244061029, -0.0008976526954049999, -0.0006004443929245207, -0.0003662741855793013, 0.00017263462262065362, 0.0002801651010533886, 0.000369224929997235, 0.00044098300284309294, 0.0004971022494750086, 0.000539573200075658, 0.0005726472462270202, 0.0006056436813864539, 0.0006398162326696348, 0.0006748259809877795, 0.0007110426046833616, 0.0007486943683767162, 0.0007874088363798487, 0.0008267776280431098, 0.0008665538774677121, 0.0009064712909377615, 0.0009458643673153349, 0.000984119646258082, 0.0010206743790910828, 0.00105520916613303, 0.001088312284284544, 0.0011209310857053958, 0.0011559900205718684, 0.0011974292508899291, 0.0012469515255705047, 0.0012976211851837946, 0.0013420331497257427, 0.0013723523140062284, 0.001379542209481143, 0.001353531669117788, 0.001294170674137868, 0.00119362111921218, 0.0010597309550628383, 0.0009003594441710051, 0.000724346371048567, 0.0005304725297755788, 0.0003120812881968862, 7.182156985664462e-05, -0.0001850156231823008, -0.00044648214934341713, -0.0007015898423451242, -0.000940257533379665, -0.0011615767643673976, -0.001363364820605049, -0.001544239338368097, -0.0017241282041773193, -0.0018643290466090047, -0.0019797400445822036, -0.0020718189336696668, -0.00214074400477652, -0.0021881609232949958, -0.0022164007765929066, -0.0022292635156911348, -0.002234175454970131, -0.0022372081265631372, -0.0022372903810823513, -0.0022335744384342337, -0.0022246196137783785, -0.002208067279845187, -0.002181039877598557, -0.0021434809207579912, -0.0020965593796342906, -0.0020414521583510207, -0.0019800944291795556, -0.0019147307105443164, -0.0018450556070172845, -0.0017691142379173584, -0.0016850844500148645, -0.0015909344897611904, -0.0014841297894287928, -0.0016951881902540849, -0.0016073130396550743, -0.0015105123965157856, -0.001408378630107392, -0.0013065873658655097, -0.0012176158442180935, -0.0011691283616164186, -0.0016817615893259556, -0.0019473664503800278, -0.0037227772239298127], [0.006306148364733897, 0.006178699034612813, 0.005917684981703496, 0.005518141907408574, 0.00497649089066834, 0.004296314673865896, 0.0034971477824185444, 0.002625647935633021, 0.0017639271391201665, 0.0010768246752088113, 0.000823231204724491, 0.0019381973514185826, 0.6495383742714258, 0.4190326894051733, -0.038870257745867984, -0.004761822760832059, -0.0022374852518812403, -0.001360132081954452, -0.0007256252377075771, -0.00016914092819054458, 0.0008202549758705604, 0.0011544884293905719, 0.0014325054343720606, 0.0016573707924811302, 0.0018339547139791252, 0.001968283980491009, 0.002073662612172099, 0.002179653863403862, 0.0022899988908288275, 0.0024037711476474874, 0.0025223487340566594, 0.0026465243032121138, 0.0027750664515888666, 0.0029066464462826876, 0.0030405259564295645, 0.003175968122067197, 0.00331111459057581, 0.0034442822612848045, 0.0035738972579163713, 0.003699184096251311, 0.0038222960549348433, 0.003946566004786326, 0.0040816690215926535, 0.004240578464079324, 0.004429175993499723, 0.004625291602007781, 0.004804987297942865, 0.0049426513331672535, 0.005008319760524296, 0.004968205497387984, 0.00480375528748484, 0.004502418715259853, 0.004088517107147859, 0.003587040459688987, 0.0030269803125578232, 0.0024050957396218263, 0.0017005837814855424, 0.0009225132642185254, 8.791778782111862e-05, -0.0007649609827482075, -0.001600906280423654, -0.0023949549407060833, -0.003135478297477635, -0.0038149990805387084, -0.004427284201254192, -0.004998554415193838, -0.005471326917669587, -0.005867673323768875, -0.006189732322377668, -0.0064374189981367775, -0.006615681841239734, -0.0067317359087995104, -0.006797665537822905, -0.006837702288647643, -0.006871885332268202, -0.006896725410808373, -0.006908244803154076, -0.006901481614403175, -0.006868550263851613, -0.006800009279309322, -0.00669562467710586, -0.0065592033225944845, -0.0063947165798373925, -0.006208727262586067, -0.006008696052178349, -0.0057934642122018445, -0.005556295881889869, -0.005290820244197301, -0.00498996567738611, -0.004645005703788474, -0.004731337485791865, -0.0039035671064594395, -0.003367976379458187, -0.0027391018405490564, -0.0019964574961999397, -0.0011571788794906258, -0.00013257870051658184, 0.00045196421802625543, 0.002157149303696189, 0.002625453863915555], [0.010138450696977675, 0.009933157280854178, 0.009513910255397296, 0.008872157241446828, 0.008001084088228893, 0.00690452600030562, 0.0056103748731510415, 0.004186940108841322, 0.002753327048826035, 0.001551987258245229, 0.0009333731352650487, 0.0019620630130882844, 0.7304695578442959, 0.3334891035231038, -0.031640074434866, -0.00566054476302995, -0.0027108155743007026, -0.0015774708619943375, -0.0006926755765146232, 0.00011577295158361188, 0.0014029999876351714, 0.0019291343459885636, 0.002367246519891209, 0.002721936948761254, 0.00300075439575255, 0.003213122749907422, 0.0033800198614493643, 0.003548217843301548, 0.00372354445818694, 0.0039045911947134153, 0.004093617660130819, 0.004291904379882186, 0.004497483862162287, 0.0047082410779822935, 0.004923025209091698, 0.0051407121314883415, 0.0053584593583464145, 0.005573705594727906, 0.005784042406145393, 0.005988334700830894, 0.006190100057602506, 0.006394737935257772, 0.006617708972308622, 0.0068797214472319295, 0.007190266146771183, 0.007514202856696711, 0.007813486546366006, 0.008047304573490684, 0.008167749694968855, 0.008120657238413657, 0.007869693281951293, 0.007399757001343831, 0.006749105413261841, 0.005957297796336385, 0.00507056837806228, 0.004084031692564809, 0.0029648964279102913, 0.001727767484319676, 0.0003996899819928734, -0.0009587029140000844, -0.0022915558621737246, -0.003562084237431603, -0.004748512625370707, -0.00583879761989858, -0.006822364259934704, -0.007726410186325477, -0.008485204603827883, -0.009123939956788877, -0.009645040018409998, -0.010048119246076698, -0.010340901627548225, -0.010534732707597015, -0.010648742694609829, -0.010721528427545398, -0.010785094630626442, -0.010833885686060541, -0.010861110923777556, -0.010858768870313519, -0.010814227950304175, -0.010712429876878943, -0.010552983304383243, -0.010341949154897738, -0.010087783810243185, -0.009799032667985428, -0.009487360402437434, -0.009150482302534003, -0.008777176767739377, -0.008356772446898664, -0.007877421207197333, -0.007324588593364113, -0.007015456545476873, -0.00627167238322358, -0.005409598092618816, -0.004409365738547714, -0.003239955946432019, -0.0018613770444367457, -0.0002114416162675114, 0.0010591543686980292, 0.0036531626457362958, 0.0049602142136179195], [0.020417817591476217, 0.020003588350090886, 0.01916004722345435, 0.01786882082526378, 0.016114052031870645, 0.013899590382099265, 0.01127453461348296, 0.008362962154127572, 0.0053787606664988516, 0.002764791107197255, 0.0010944528399815085, 0.0016286769753597842, 0.8394560115754971, 0.22184710455817883, -0.022896046696626707, -0.00738209298487525, -0.0036751512425694417, -0.0019506367832682748, -0.0004410912216950069, 0.0010135092380254935, 0.002995113881062623, 0.00403212079139345, 0.004896604990560511, 0.005597173387664369, 0.0061484626075408895, 0.006568917181666297, 0.006899956854690388, 0.007234252295759045, 0.007583163789089712, 0.007944017982383441, 0.00832145410550497, 0.008718063426222621, 0.009129908263876689, 0.009552771807170934, 0.009984409292002358, 0.010422678683318299, 0.010862147759243686, 0.011297949458386873, 0.011725478793434718, 0.01214267455166418, 0.012556732960945694, 0.012978610858163991, 0.013439255076341958, 0.013980069886139488, 0.014620238794829432, 0.015290004779505829, 0.015913635186801875, 0.01640966929637042, 0.016682162268327295, 0.016622344133862307, 0.01614394761102011, 0.015226779150837241, 0.013946184554400965, 0.012380589618195562, 0.010622349162379459, 0.008662278499853645, 0.0064356551616489115, 0.003971941997993575, 0.0013249209151700143, -0.001385006432790121, -0.0040468886943151984, -0.006593385847011839, -0.008974445273905125, -0.011165768221887331, -0.013144942775126843, -0.014936635887887382, -0.016462182665944715, -0.017751602185981742, -0.01880773349839696, -0.019629298933303698, -0.020231387377199244, -0.0206662776396844, -0.02094096585001249, -0.021132528190650535, -0.021305327485303394, -0.021448570290319557, -0.021546744432948045, -0.021583538316446577, -0.021533492631849227, -0.021366562207855534, -0.02108200550366141, -0.020691973256848437, -0.02020938408985497, -0.019655594824121738, -0.01905445896784509, -0.018401804139762463, -0.01767542663894896, -0.016854107952798087, -0.015914292316204566, -0.014827077156740054, -0.013843584213141325, -0.012359854784022404, -0.010646276869169257, -0.008664113104650898, -0.006354739922492743, -0.0036444600467741327, -0.0004226024077357611, 0.0026264966449643075, 0.007605555610884072, 0.01151859775875052], [0.027696190470463435, 0.027133975165412813, 0.02599005697965357, 0.024239039206315136, 0.021858532798211462, 0.018852163285039792, 0.015283617565558632, 0.011315644586059262, 0.00722767308820069, 0.0036017204634410343, 0.0011610441841452808, 0.0012522335906301836, 0.8784201859497698, 0.1802279026468873, -0.02008773185392606, -0.008356450796566236, -0.004250098997741516, -0.0021407432108147967, -0.00020530117295110788, 0.0016963226513719027, 0.004132672104088088, 0.0055300412299104235, 0.0066953432928334965, 0.007639982243857492, 0.008383579115619296, 0.00895093327496324, 0.009397888466719908, 0.009849522041801199, 0.010321088881987154, 0.010809029922937809, 0.011319674657437731, 0.011856543183512083, 0.012414304305247896, 0.01298725560808777, 0.013572382156616474, 0.01416682854116811, 0.014763346525498423, 0.015355454031268997, 0.015937005617175988, 0.016505297908448194, 0.017070138604629626, 0.01764642448927108, 0.018276056053053782, 0.01901507335991823, 0.019889527143269976, 0.020805210878322752, 0.021659760507116245, 0.022342978404343, 0.022724938763083697, 0.022658226848582808, 0.022020428298587295, 0.020788361211237186, 0.019063529595825208, 0.016951803836720344, 0.014578149032414466, 0.01193037594144866, 0.008921232566321574, 0.0055907050511049446, 0.0020114651021093752, -0.0016538693560016456, -0.005255428699341114, -0.008704645358782957, -0.01193107017868923, -0.014901724234957281, -0.01758574698642628, -0.020004193864090015, -0.022072488197696232, -0.023822814501469933, -0.02527297423642403, -0.026412403559729465, -0.027258325099490086, -0.027839452725578556, -0.028206118181973803, -0.028462092296188103, -0.028694081474593517, -0.028887165185593335, -0.02902011523987262, -0.029070692679721608, -0.029004328253422574, -0.028780282298967123, -0.028397432628859062, -0.027872144444825307, -0.027221865024871828, -0.02647548947403021, -0.02566531478953898, -0.024785656800080966, -0.023806391278820376, -0.02269876386825692, -0.021430880099675125, -0.019963629926060635, -0.01856654772470852, -0.016566078235972392, -0.014256164423185976, -0.011584790105984753, -0.008473866099096611, -0.004825772057099414, -0.0004951198312795717, 0.003851467735243407, 0.01044971236651381, 0.016176203923898336], [0.03508670940161661, 0.034374212832586244, 0.03292530418563066, 0.03070743333950375, 0.027691538070839683, 0.02388094273062065, 0.019354012574758998, 0.01431250721914439, 0.00910191202954247, 0.0044446808686435, 0.0012137194837806623, 0.0008257930835652332, 0.9059413916142869, 0.1521650671184333, -0.01851989142580919, -0.009267830882802931, -0.004799938575923906, -0.002310444538176099, 5.22728526696337e-05, 0.0024045056321104546, 0.005290985375552175, 0.0070538396691938, 0.008524255372010672, 0.009716464054966937, 0.010655137192240769, 0.011371516736700896, 0.011936076933785218, 0.012506772150138092, 0.013102804714369231, 0.013719719309220068, 0.014365563420219392, 0.015044800523479496, 0.01575068490541299, 0.01647600646927508, 0.01721696962797778, 0.017969996923806603, 0.018726001685916885, 0.019476867474252278, 0.02021488932668042, 0.020936716088381147, 0.021654809302987382, 0.02238806798476982, 0.02318951145469171, 0.02413003536945872, 0.025242664831998565, 0.026408386347828335, 0.02749781097719431, 0.028371575333346676, 0.02886525924933157, 0.02879221372215909, 0.027993071189269587, 0.02644180977941135, 0.024266462411743482, 0.021600743283755185, 0.018602715845377326, 0.015257152453426686, 0.011453949483694926, 0.007243779470707303, 0.0027184819573937897, -0.0019164908765521784, -0.0064717806983717345, -0.010837393574246583, -0.014922051580216927, -0.01868396102840745, -0.022083661358410774, -0.025137967965953703, -0.027770960418827192, -0.030013994023875785, -0.03186379294717744, -0.033315696656910136, -0.03439421397110555, -0.0351366227303854, -0.03560712760197797, -0.03593718182937459, -0.03623656589003113, -0.03648645166515135, -0.03666001460933532, -0.0367291526657498, -0.03665016564027482, -0.036371530181355756, -0.03589183389459704, -0.035231763530413227, -0.03441339880711018, -0.0334733215829059, -0.03245242781917455, -0.031343556997570084, -0.030108596044603367, -0.028711150362217486, -0.02711092387035349, -0.025258486012263746, -0.023363309333730795, -0.020836891682734116, -0.017920661122011235, -0.01454912974757695, -0.010624518476803237, -0.006025064600404971, -0.0005704298525530347, 0.005102683668434838, 0.013336415380262617, 0.02091467658487072], [0.04140474944115563, 0.04056377292846728, 0.03885413940980545, 0.036237173480661085, 0.03267808967235231, 0.02817992136862658, 0.02283352097800828, 0.016873881097950214, 0.0107027332807138, 0.005162195740456847, 0.0012519617529586596, 0.00044115461250170113, 0.9239884438915377, 0.13473640312304522, -0.017773008129378792, -0.010011003096463883, -0.00525454858067618, -0.0024449169828070307, 0.0002807159542532964, 0.003016666900276847, 0.006282675825902233, 0.0083577825524517, 0.010088881029205014, 0.011492614427356553, 0.012597966873333186, 0.013441683368166866, 0.014106738390970276, 0.014779179186615596, 0.01548157944198897, 0.016208719058464598, 0.016970114972995033, 0.01777103724835599, 0.01860353113483988, 0.01945909801025487, 0.020333275550481544, 0.021221870083470037, 0.022114225815877936, 0.023000831634110586, 0.023872651487095792, 0.024725782385951273, 0.025574955574314207, 0.026442492227904242, 0.027390915346397413, 0.028503817807766937, 0.029820187600657865, 0.031199812884589378, 0.032490209229073516, 0.03352708621714988, 0.034116539618152295, 0.03403838236083631, 0.033101542956725113, 0.03127766002846471, 0.028717430951777298, 0.02557836242532365, 0.022046806628278813, 0.018104944090384795, 0.01362314706295022, 0.008661224142738427, 0.0033273952434005193, -0.002136283876495599, -0.007506709875964304, -0.012655630029318571, -0.01747390662692022, -0.021912209990888384, -0.02595901109136865, -0.029551857809527522, -0.03267433543096166, -0.03533068996759823, -0.037520649973842725, -0.03923995190469006, -0.04051805782864023, -0.04139919128289254, -0.04195912041713878, -0.04235299710787791, -0.04271035194279342, -0.04300904490557243, -0.04321749366346645, -0.04330260732754266, -0.043212902022829396, -0.04288766620138404, -0.04232524154589702, -0.041550022059052255, -0.04058805817271427, -0.03948250870082925, -0.03828162222426708, -0.036976978514411264, -0.03552364324444942, -0.03387870195641989, -0.03199458256362983, -0.02981297347823934, -0.02745685828926969, -0.02448110903344241, -0.021046924995388735, -0.017077314928372354, -0.012457701036658242, -0.007045735596636964, -0.0006313016433268537, 0.006179995661394231, 0.015808526698173155, 0.02497822718293414]], [[0.17221343574863002, 0.17140652742165327, 0.1696185838950538, 0.16658843000904558, 0.16192633982636884, 0.15514148864348576, 0.1457177272525287, 0.13325228068839828, 0.11754540536722227, 0.09968251936272078, 0.08224511178451654, 0.06700693614633887, 0.05470760768150624, 0.04554426316194303, 0.039537380952810584, 0.03682116088177611, 0.037904449155735716, 0.04500154794971885, 0.157801982681343, 1.5123639258779809, 0.4483224895343315, -0.2734857328521284, -0.06591392276816643, 0.0035694316236353687, 0.011415527166720863, 0.012670066767813562, 0.013366534534202753, 0.013919853150085853, 0.014459533560972857, 0.015009496514966589, 0.015593414501232743, 0.0162125187518123, 0.01684964108869184, 0.017493093912913385, 0.018133674069740424, 0.018759649190694633, 0.019333956373453635, 0.01981845238525047, 0.02017990360510444, 0.020394501070856795, 0.020461473323770227, 0.02036826570013136, 0.02020326703035094, 0.02011074877635887, 0.020113043204842484, 0.01994120987363981, 0.01937329894795687, 0.01819263199514891, 0.016173378439724787, 0.01308932836593984, 0.008819649392863314, 0.003464647253415698, -0.002559598521119503, -0.00893118321209775, -0.01539882452689106, -0.022064578736187203, -0.029244727082846617, -0.03690743880650282, -0.045362677932982584, -0.05320610874488222, -0.0604377368671774, -0.06683210914469687, -0.07247025303188712, -0.07738239262968523, -0.08156681598468601, -0.08501861820300408, -0.08775303830140715, -0.08980840458394927, -0.0911895609036538, -0.09190142357437014, -0.09201391795801489, -0.09161085379411614, -0.0908203636747099, -0.08984333741557764, -0.08884490399983358, -0.08779883970652888, -0.08665713296862916, -0.08536965332772542, -0.08386148115015793, -0.08206983517973494, -0.08000001775880164, -0.07769071898464293, -0.07518051539305377, -0.07253167604903561, -0.06978826174318398, -0.06691439637416452, -0.0638639755748547, -0.06054475513410631, -0.05634603280047365, -0.05227968085636645, -0.060043266166173684, -0.056744834176730444, -0.05333333468005961, -0.04997834325790738, -0.04695535575725934, -0.04480584264041903, -0.04468610331302885, -0.04786964426991445, -0.0631294321665111, -0.10882813191536284], [0.7002516780032441, 0.6968532886497562, 0.689437562803477, 0.6769183838441757, 0.6576737892710234, 0.6296530663978767, 0.5906781347153369, 0.5389944484680245, 0.47364861762089777, 0.39904117270173195, 0.3257541048730625, 0.26093346124271677, 0.20743448793935806, 0.16579499198761372, 0.13562192919088142, 0.11653640923181821, 0.10887283319586756, 0.11619441770868061, 0.3179718615003423, 1.2719297194545867, 0.425593268399764, -0.1826177732807703, -0.011979190106467592, 0.04650855551074247, 0.062147277165859244, 0.06528760907096012, 0.06686333301117343, 0.06820458749959839, 0.06967964016707225, 0.07133220446879542, 0.07323193886097053, 0.0753634016957006, 0.0776399878235312, 0.08000208838059829, 0.08240437376741372, 0.0847950452594102, 0.0870288745779681, 0.08895568613413024, 0.09044115050575396, 0.09138993292892099, 0.09180075965512306, 0.09162609589349142, 0.09122687810166223, 0.09119143097297538, 0.09161454958225451, 0.09140654103003158, 0.08966458146579374, 0.0855035344778505, 0.07799153020937284, 0.06618579548376684, 0.04944786236496799, 0.028247356495217247, 0.004242245522353853, -0.021275973903997738, -0.047274339811241003, -0.07414878401547156, -0.10317154699870006, -0.13412329242608367, -0.1671713401771277, -0.1987569011966086, -0.22803897760983882, -0.2543594168548073, -0.2776955796809878, -0.29814109977750214, -0.3156281203597932, -0.3301307691184319, -0.3417063393878718, -0.35050470594360117, -0.35653964880259786, -0.3598286208756445, -0.3606552864157779, -0.3593662748275867, -0.35650418469837347, -0.3529131724117505, -0.34926098538190237, -0.3454152074696682, -0.34116429981293955, -0.33629319431633475, -0.330488513164563, -0.32349027267442987, -0.3151274039678267, -0.3057307935191026, -0.29545553506510924, -0.28456344605723777, -0.27324061418048706, -0.2613225605133359, -0.24858311493056442, -0.23471247631238878, -0.21844325854025268, -0.20141114746619262, -0.19010013191331956, -0.16893601427201968, -0.14508839648756025, -0.11936706624818956, -0.08962895297745246, -0.05553126029645399, -0.015961474652991515, 0.03197400504774634, 0.0792682491941608, 0.08339272937574509], [8.899830913915208, 8.856288015747824, 8.761602299846006, 8.601897588823094, 8.356448082212593, 7.999025933353718, 7.501711522941073, 6.841856024788673, 6.006919845407909, 5.052792574769223, 4.11422064633073, 3.281827983766687, 2.591447930555843, 2.049126386462739, 1.6484426704804078, 1.381814642786811, 1.2483016484536904, 1.276910273107695, 1.6193642532326413, 4.87228381701802, 2.916214027099798, -0.5619545698512742, 0.5500643113225628, 0.7762572335868672, 0.8369278236729333, 0.870972216215086, 0.8872397200936848, 0.9015673860695688, 0.918161869948246, 0.937418498205859, 0.9601430018817252, 0.9860779379543673, 1.0140723404611733, 1.043332449722452, 1.0732584872205724, 1.1031798714526602, 1.1312672144219287, 1.155626591196879, 1.174553153124923, 1.186839664787156, 1.1924755126943811, 1.1908670721259043, 1.1866062374911956, 1.1871753643521477, 1.19379118164615, 1.1926158415808068, 1.1721739255940604, 1.1212036006676678, 1.0278205916413081, 0.8799740369330568, 0.6691090466110621, 0.40137913536484626, 0.09775479408917685, -0.22540188245588025, -0.5549289708997948, -0.8958015587345239, -1.2641478071096641, -1.6569110344074693, -2.072946995528395, -2.4734633937744364, -2.8452549586791496, -3.180730684086835, -3.4785491946978873, -3.7398129600524554, -3.9634773348606753, -4.149195756695234, -4.297682415487762, -4.410824261002943, -4.488778727311779, -4.531760037959838, -4.54363694562103, -4.528732107214827, -4.493967843762383, -4.450113069798229, -4.405568270749408, -4.358513429661633, -4.306156998439693, -4.245672042478478, -4.172999253757869, -4.0848121326220195, -3.9812874750296023, -3.8643614895796508, -3.736061351547672, -3.5997691646482113, -3.4579220170614455, -3.3084545060974344, -3.14845196223953, -2.974256029634733, -2.773498686325058, -2.559668153453118, -2.3991427530931526, -2.1322377391454888, -1.832607853347056, -1.4946474971571382, -1.10944328788719, -0.6662594661769481, -0.17244856204947942, 0.4268979712949707, 1.0399388729019314, 1.2272425947467718], [-1143.3860186956738, -1137.7460224592228, -1125.524505870173, -1104.929315797149, -1073.2831694405136, -1027.19500899489, -963.0468847328176, -877.8833400778572, -770.0381291262815, -646.6864637996661, -525.1729233082334, -417.11424751895396, -327.054503486934, -255.6672054461668, -201.9410907303401, -164.54027850082227, -142.6651519307496, -137.9133964049198, -160.4650797314388, -401.47050193445887, -201.92394946534367, -36.82630862496551, -88.32515587013411, -107.38264469907107, -113.67740460290577, -117.28390411079391, -118.88227132264431, -120.36743763522097, -122.21788275763447, -124.46344034974658, -127.19721709351332, -130.378137298617, -133.8517608775822, -137.51138252098409, -141.27685268816072, -145.0604184299391, -148.62919605958976, -151.74179368180384, -154.17949949895032, -155.7877945193663, -156.56604424207092, -156.43935937765787, -155.99827249184037, -156.2047239936672, -157.2165909050545, -157.2576002528584, -154.85334211629646, -148.55538029035995, -136.83158688541067, -118.12476931635052, -91.27828118678516, -57.106849705658405, -18.291351593819822, 23.07294866739401, 65.2907189996625, 108.99366935252132, 156.24842265937164, 206.62709834806762, 259.5549842601393, 310.91949878437686, 358.7898436589299, 402.22612730274994, 440.8971255070165, 474.9224654709284, 504.112982243489, 528.4179817785349, 547.9256362621646, 562.8749624463491, 573.2832879750368, 579.177077334973, 581.0197931950612, 579.384435435529, 575.1774779149471, 569.7987961125443, 564.3322684636572, 558.5387644192655, 552.057289215664, 544.5242970953547, 535.4182009680497, 524.3109461829824, 511.22326247592133, 496.40262667791325, 480.1095423209202, 462.78127395833206, 444.7373958738788, 425.7136591702767, 405.32872195490927, 383.1476967655334, 358.0693817655509, 330.83803916023675, 303.90884045329545, 269.79322696376136, 231.5521236733985, 188.49334796915917, 139.5599167600483, 83.4911050705235, 18.464321111236412, -57.58756838986786, -137.90731596510733, -179.60485537262298], [-23.130926122652024, -23.016542314959302, -22.76894426109806, -22.351817628691062, -21.710909774325952, -20.7774852607903, -19.478159222051943, -17.75285798969572, -15.567529489547198, -13.067298097023917, -10.603255369086346, -8.410248770666511, -6.5798353956239515, -5.124998663980646, -4.02412146029979, -3.247928776219372, -2.7760230379488138, -2.6274865704233683, -2.950351766263139, -6.725150220570605, -3.349974252204545, -1.2229714899825161, -1.8966621672342732, -2.21997587100001, -2.3379933069859256, -2.40618191043529, -2.435460226502512, -2.4632943273009436, -2.498978625066502, -2.5429863442169887, -2.5971363265899576, -2.6605478440289145, -2.7300556707428076, -2.8034717294089946, -2.8791553357183273, -2.955321270712001, -3.027271577421281, -3.09013482682779, -3.1394883938479214, -3.1722099224797415, -3.1882911104628406, -3.186225485585524, -3.1779633647534093, -3.1829691064774033, -3.2044462986142985, -3.206470000444894, -3.15921179194686, -3.033359588349615, -2.7978850413982186, -2.421229960162597, -1.879637101875588, -1.18973885757865, -0.40568743002383056, 0.43017197281376485, 1.2870534919878995, 2.1752031403402636, 3.136154080884036, 4.160213993561512, 5.223790137011966, 6.265958885231151, 7.236370478759697, 8.117430250959854, 8.901844054705194, 9.592089951212628, 10.18438136057249, 10.677725426280787, 11.073922701683385, 11.377814757173883, 11.589756412386263, 11.710287521144044, 11.748796528980144, 11.7168854491683, 11.632933429018571, 11.525327173268572, 11.416001284601558, 11.300071468540441, 11.170210751333393, 11.019055705428388, 10.836049410375644, 10.612525137470321, 10.348887575715604, 10.050133376489589, 9.721531502260234, 9.371943860633614, 9.003288742531035, 8.613870168673671, 8.19625666910067, 7.74281231729249, 7.244789907783037, 6.691597265911116, 6.11771219176754, 5.428692868368288, 4.656631891012379, 3.787629054467005, 2.800665263532628, 1.6710941671296289, 0.36398149418459536, -1.1879978606738122, -2.817051945527598, -3.7702367172467457], [-12.362818400759963, -12.301587340324197, -12.169133907375262, -11.946029351639924, -11.603246642839316, -11.104003633394733, -10.40901319464915, -9.486071943327662, -8.316864288378328, -6.9789444183179965, -5.6600305453108755, -4.485587527683186, -3.5044252899052073, -2.723266884490864, -2.1301681703846658, -1.7087246654295483, -1.4466126293064887, -1.3495716511281592, -1.477213941817905, -3.1237321522552617, -1.5867678667804266, -0.7887697476044205, -1.0507122022634503, -1.2025480004778295, -1.2624833822115755, -1.2973210177184635, -1.3119397576153016, -1.3260715182098584, -1.3445541067733975, -1.3675965535868164, -1.3961491762542828, -1.4297244904594872, -1.4666170065349684, -1.5056473542980977, -1.5459321532082964, -1.5865139001661872, -1.6248861602400348, -1.6584493281627593, -1.6848402968414933, -1.7023914668294902, -1.7110999279377905, -1.7101633947680575, -1.7059702248845858, -1.7089249465904157, -1.7207430546949691, -1.7222268669106242, -1.697433671515073, -1.6306936519246091, -1.5054118954266158, -1.3034374717676223, -1.0126877657236766, -0.6421843936700679, -0.2209045904111744, 0.22847096410134554, 0.6874834422289703, 1.162864858368203, 1.676949263794584, 2.2246135448896105, 2.793293377391959, 3.350475305147576, 3.8692831234033407, 4.3405908934782005, 4.760238365980254, 5.129541719241374, 5.446475860377934, 5.710512467844791, 5.9226141087520325, 6.0853672254965465, 6.198961316228415, 6.263684806006504, 6.284549539211842, 6.267758154216622, 6.223146859790391, 6.165909582440958, 6.107773735843641, 6.046114766347406, 5.977008176786171, 5.89651516160371, 5.798991475162573, 5.677546573097299, 5.53412160291941, 5.371607932309622, 5.192933983304236, 5.002908655957911, 4.805118974983465, 4.596738100481844, 4.373541721423098, 4.131345448454746, 3.865422799423603, 3.570086895642204, 3.2565289559298067, 2.8886619854023414, 2.476531539496653, 2.0127289361647627, 1.4861116991611723, 0.8837169335389244, 0.1872979806785372, -0.6371167870674573, -1.5149042121815206, -2.0612738920749885], [-9.742322137613902, -9.694024808166349, -9.589590943064263, -9.413700737588718, -9.14346555990439, -8.749878682794725, -8.201949979640737, -7.474257136201184, -6.55231249746414, -5.497226410538348, -4.456960007518612, -3.5303583291990948, -2.755826691495109, -2.138561558942147, -1.6689672119736587, -1.3337604987088916, -1.122562232619835, -1.0378013714777479, -1.1172942346934343, -2.2404728630051007, -1.1674909207184874, -0.6775325208499658, -0.8453756754137385, -0.9551782387609755, -1.0009341437702601, -1.0276326672076328, -1.0386692135539923, -1.0494557929333561, -1.063743815360682, -1.0816773917573888, -1.1039951672958932, -1.1303051174123184, -1.15925679341605, -1.1899161600183066, -1.2215840395716326, -1.253504311740966, -1.2837039282006903, -1.3101362058083403, -1.330939245351718, -1.344799490086898, -1.3517153637969948, -1.3510559910704911, -1.3478562046580076, -1.3503157779397643, -1.3597881142100652, -1.3604877535154878, -1.340234198188795, -1.2866927979524088, -1.1867752758840324, -1.027149342294544, -0.7976538028270184, -0.5053778564184864, -0.173132410497355, 0.18121045871598737, 0.5431088629281946, 0.917869008657846, 1.3230871946672522, 1.7547274472098067, 2.202897828291273, 2.6419938474707, 3.0508529273228424, 3.422409697060457, 3.7532601658264357, 4.044435877224957, 4.294339196381561, 4.5025540617551645, 4.669838535174262, 4.798229852481108, 4.8878770681026245, 4.939007204021271, 4.955569313466096, 4.942452110750437, 4.9074127790240345, 4.862434449430261, 4.816757704676779, 4.766626567166752, 4.710273119914241, 4.6447558503628885, 4.5656994366285, 4.469464725617463, 4.3562255111454355, 4.228101539257886, 4.087332891414106, 3.9376888327159945, 3.781973165015556, 3.617942673366854, 3.4422595236722136, 3.2516204747866144, 3.0422974697234464, 2.8098073479648322, 2.55988124643655, 2.2701890136374656, 1.9456736374400523, 1.5805070037484528, 1.1659521599906064, 0.691893102604601, 0.1441496404761809, -0.5030331575526998, -1.1981775517050546, -1.646070193375172]], [[0.017951318387726355, 0.017919730298589072, 0.01783945235181758, 0.017681869186090684, 0.01740228078060317, 0.016940148461362606, 0.01622365191221476, 0.01518094335086031, 0.013747759293765878, 0.011985258212447518, 0.010146146256622074, 0.008437955154668431, 0.006959747105575421, 0.005708070051786524, 0.0047101870834513355, 0.003995994116243328, 0.0034852233103597947, 0.00318002321157441, 0.003063536083359406, 0.0031306172662032205, 0.2865567424514648, 0.29230766821902643, 0.299045076586497, 0.3068448147074233, 0.31567058048577484, -0.3130846903402834, -0.11811414188448115, 0.0005389875542174467, 0.0007636084287132493, 0.0008464664433869626, 0.0008943134727515815, 0.000929315121194304, 0.0009602946716668893, 0.0009866117393403824, 0.001008432072565286, 0.0010247009457322706, 0.0010263659068245926, 0.0010199956087259487, 0.001002446567301783, 0.000968970673717796, 0.00091856808228319, 0.000848808497310963, 0.0007660629445020122, 0.0006818412652859647, 0.0005955443446254458, 0.0004210728713309205, 0.00026336479894910315, 4.879645529405635e-05, -0.00023940909960602232, -0.0006217236062065017, -0.001090675724530283, -0.0016321464208096017, -0.002209372554676716, -0.002793817082844265, -0.003365674579914162, -0.00393509966440375, -0.004531682009987763, -0.005151799246148079, -0.005782176365631228, -0.006382533311325852, -0.006908957924931799, -0.007357732565494659, -0.007759109275693192, -0.008100903793734484, -0.008379443305496477, -0.008591655661585089, -0.008711337191087623, -0.008794220205681727, -0.008838221289367211, -0.008831438501272245, -0.008778121946546796, -0.00868514642330195, -0.008563850591066052, -0.008429878736522158, -0.008292480236280443, -0.007993098016714988, -0.00785017012459435, -0.007699561087895227, -0.007530984349454631, -0.007328178269715134, -0.007108041765500117, -0.00687630152569741, -0.006630910206931606, -0.006376282478251347, -0.006115310067889973, -0.005844111981546465, -0.005558761631347598, -0.005255204565990888, -0.004928730019245314, -0.0045736567680294505, -0.0052222025091811335, -0.0049352295017333495, -0.004646572447873684, -0.0043732889806115515, -0.004143418478797808, -0.004010877215142527, -0.004088361426696422, -0.004505842751455435, -0.005664017919255468, 0.0005871908372345363], [0.06623695090958527, 0.06611275989384964, 0.06580726837850982, 0.06521340784516075, 0.06416402379642713, 0.06243265479386674, 0.05975017023250511, 0.05584582886805798, 0.0504764256018307, 0.043869540778992834, 0.03696558294013582, 0.030530191926718634, 0.024922413257001345, 0.020196423607484335, 0.016387348689586804, 0.01350566235431391, 0.011375025462796031, 0.009961321432235996, 0.009162551162500374, 0.008895973678847266, 0.3085332877761202, 0.3144417412227898, 0.3214522866268089, 0.3295920267683493, 0.33869553536561564, -0.3309200976667878, -0.1913236960329454, 0.003919434214985715, 0.004232655667821534, 0.004328653097838234, 0.004384226716037387, 0.004432800857794038, 0.004483406484349829, 0.0045315291253002965, 0.004574640253666053, 0.0046080129430202165, 0.0046097335180418034, 0.004583177325954444, 0.00451634617389992, 0.00439651363079476, 0.004220817504312026, 0.003980740704413757, 0.0036999163280747806, 0.0034209215452519074, 0.0031441142350858682, 0.002679655846757105, 0.0021643930678240564, 0.0014440641891952267, 0.0004584619957903603, -0.000856546874991057, -0.002508106665399298, -0.0044402947861856635, -0.0065144574063692754, -0.008625802080686737, -0.010700500478217884, -0.012774793718018904, -0.014956320999261296, -0.01723069397062144, -0.01954959447925767, -0.02176895145995533, -0.023752642194996072, -0.025479784135899925, -0.026993997621177556, -0.028284089183486762, -0.029342395242150418, -0.03016544826407026, -0.030714849794675623, -0.031090556682617197, -0.03128979763685535, -0.031294081912516675, -0.031123512298915416, -0.030805044947417995, -0.030381999911309944, -0.029914114797829156, -0.02943203899131093, -0.028678277570697987, -0.028166689591355612, -0.02761688141631093, -0.026998081161871884, -0.026274424584058167, -0.025474375419027487, -0.024613485277239194, -0.02369504577979769, -0.022737806512234095, -0.021752916644731977, -0.020724542836427898, -0.019636104204266296, -0.018470529798436143, -0.017208077149080916, -0.015825117329452656, -0.014774257831033236, -0.013157325382902844, -0.011318983325194628, -0.0092704431245656, -0.006964862286645095, -0.004347510329159628, -0.0013445099020060868, 0.0022236609406944565, 0.00592860280366274, 0.005791575149767544], [0.11199223909630948, 0.11177920869268168, 0.11125898193615316, 0.11024993683778721, 0.10846856487968563, 0.10553073679939626, 0.10097976284624205, 0.09435562716375898, 0.08524469237593357, 0.07403251302039539, 0.06231229872010842, 0.05137853443327194, 0.041835701422799645, 0.033802128513519436, 0.02731105461089601, 0.02234031050203757, 0.018639611096493442, 0.016134478698681762, 0.014636558631317841, 0.01398048666795328, 0.32464989111760245, 0.33062662710456275, 0.33780588466048284, 0.3461750116408674, 0.3554922954580599, -0.34126591256078154, -0.22582605653750723, 0.007398087926684158, 0.007721733343145803, 0.0078002692777099075, 0.007845911293538734, 0.007895854935901399, 0.007955972758150787, 0.008017772360789311, 0.008075724285592754, 0.00812150272637941, 0.008122645213779334, 0.008076525804811134, 0.007962698663595193, 0.007761560740348996, 0.007468603044508257, 0.00706960487565349, 0.006604574665717597, 0.006145544280528918, 0.005694144765923262, 0.004980468988173969, 0.004135894387021085, 0.0029464900532375727, 0.0013111363597016498, -0.0008740472729761986, -0.003635005435833517, -0.006875656969445128, -0.010360368245179162, -0.013912159333728842, -0.017405903020152318, -0.020902384829285824, -0.024582983615072544, -0.02842296339309911, -0.03234089396900528, -0.0360950018938639, -0.03946548063538044, -0.04241416033787866, -0.044987630283186114, -0.04718045135972968, -0.048982018162504734, -0.05038971917002661, -0.0513632066911617, -0.05202810614473471, -0.05238112129192533, -0.05240086672279258, -0.052123038884703946, -0.051594068929628784, -0.050888206843114014, -0.05010722290818912, -0.04932131620225384, -0.04820497851027131, -0.04736388850945086, -0.04645463060069247, -0.04542861368646125, -0.044235027596935844, -0.04290856706811805, -0.04147338420036274, -0.03993934502367263, -0.03833904824682403, -0.03669185310229058, -0.03497107522483989, -0.03314851348283148, -0.031195282158436564, -0.02907813379028439, -0.026757368586164006, -0.024824808531992933, -0.02197683946736957, -0.018809723638479832, -0.015273982257146927, -0.01143628273599143, -0.0070192586943043185, -0.0019607445851338415, 0.003997295091926176, 0.010254435286232802, 0.011239713285145734], [0.24571137004775861, 0.24523715945600316, 0.24408749043630731, 0.24186255887901098, 0.23793836331827095, 0.23146936713549138, 0.22144990501148215, 0.20686566607987156, 0.1868036934602187, 0.16211160757998536, 0.13629203539612011, 0.11218498077964628, 0.09111089433935059, 0.07338915573651152, 0.05903421537210321, 0.047908262861928536, 0.03956920411403216, 0.03381608200802198, 0.030200099920553388, 0.028301501142726483, 0.3601443440838071, 0.366104309439538, 0.37353035443828014, 0.38230074841245265, 0.39201402099456134, -0.35684080014627567, -0.27708313183816796, 0.01795585356963608, 0.018205425110421246, 0.018190405725383618, 0.018182494955441678, 0.018220103910430618, 0.01829510488064723, 0.018386943787816596, 0.01848068432599579, 0.018557313679133585, 0.01855586996701793, 0.018451958749623264, 0.018200365116390508, 0.017762361046562355, 0.017128792494917236, 0.016268861334926138, 0.015270458054582292, 0.014291717325014395, 0.013338511778122343, 0.01193285759148764, 0.010139387834930689, 0.007593591811709921, 0.0040751279695474445, -0.0006337327965508031, -0.0066209168505216125, -0.01368075092464354, -0.02129542199953396, -0.029073218478874535, -0.036736698379593084, -0.04441722943221882, -0.05251139041894268, -0.060963805105252525, -0.06959604276552803, -0.07788133567852067, -0.08535724240048966, -0.09193253848711554, -0.09764842979603824, -0.10252295544556814, -0.10653796162820421, -0.10969442407134943, -0.11195303052295212, -0.11349760547436027, -0.11432665492103497, -0.11441669156709054, -0.113850337862849, -0.11273089637728487, -0.11122237532906609, -0.10954996426229636, -0.10787375562474628, -0.10576380787887511, -0.10395951764810903, -0.10199899652520221, -0.09978293612175845, -0.09722162087619214, -0.09436097355309314, -0.09123612964634846, -0.08787801461036343, -0.08436721750418501, -0.08075055609410778, -0.07697052839372716, -0.07296451868585292, -0.06866897499070825, -0.06401127471173639, -0.05890481668574858, -0.05383339811617503, -0.04762369922154342, -0.040734576345672346, -0.03304802519972477, -0.024380572925668302, -0.014650730290622123, -0.003594896171367762, 0.009309117025761288, 0.02302102284858668, 0.02790339944373114], [0.34319483511298143, 0.34252955505486127, 0.3409202042846989, 0.33780779119200205, 0.33231989606502804, 0.32327434010576717, 0.30926488642834665, 0.28887264325909234, 0.2608201118275138, 0.2262919331490918, 0.19018342494108048, 0.15646129018828783, 0.12696736938856126, 0.10217343627279599, 0.08207454515016643, 0.06643989084340705, 0.05469797850205105, 0.04655198557428965, 0.04135978470195941, 0.03851061286536975, 0.37680736826253863, 0.38257510157287516, 0.3899735758648565, 0.3988028306696559, 0.4085700493863112, -0.3573011240557513, -0.29316501634161746, 0.025820699193752412, 0.02597138935052768, 0.025869909962414835, 0.02581242799951881, 0.02583403092432213, 0.02591433679798526, 0.02602381109033618, 0.02614038641042401, 0.02623718623393037, 0.0262334721466108, 0.0260871641612479, 0.02573495554003072, 0.025124593073742544, 0.02424360838732316, 0.02304915732751646, 0.021664048095974792, 0.020309195142373882, 0.018992013917962715, 0.01726142939082309, 0.014782849426940628, 0.011247665527924493, 0.00635267365417913, -0.00018412081208447022, -0.00852208653330777, -0.018367115092556712, -0.028984640890093942, -0.03983109878916807, -0.05052012134594949, -0.061235299426240175, -0.07253011522093247, -0.0843268868760986, -0.09637671275379962, -0.10794563371305389, -0.11839865552479786, -0.12760587786219263, -0.13559876422868344, -0.1424154677585874, -0.14803293267354015, -0.15245560537977257, -0.1556509332403457, -0.15783507839906336, -0.1590078045181114, -0.15914602389773747, -0.15836676162470903, -0.1568147593086768, -0.15471945025442363, -0.15239613395233892, -0.15006613716172237, -0.1476733658441924, -0.14513374203875148, -0.14236001874669493, -0.13922861269107986, -0.13565628438342, -0.13165005420159898, -0.12726818472826423, -0.12257281672648274, -0.11767050722963208, -0.11262420988371, -0.10735236187540252, -0.10176672297067456, -0.09577809744858627, -0.08928479535232751, -0.08216572402290312, -0.07485341451285342, -0.06619395099087406, -0.05659083117343312, -0.04588173072998314, -0.03381808976931701, -0.020111195125373748, -0.004712132934025208, 0.013239030603394231, 0.03238375103774267, 0.04037197495434741], [0.4492646152169146, 0.44839130077807954, 0.4462816148642209, 0.44220333084441615, 0.4350136907466171, 0.4231641674795479, 0.40481259709656364, 0.37809977148802143, 0.3413514332282937, 0.29611896262998655, 0.24881317746447304, 0.20462671715627986, 0.16596862101383975, 0.13347766752350462, 0.10712664427728927, 0.08658178805279625, 0.07113293295461005, 0.06037820082847658, 0.053464398583262525, 0.04957180126209171, 0.39705398348240056, 0.40265812548395336, 0.4100803761706147, 0.41903758094510707, 0.4289447274509581, -0.35992419277886106, -0.3063208139004451, 0.03441255146061106, 0.034446498080442554, 0.034247220134546494, 0.03413365325028022, 0.03413640996416596, 0.03422135713810178, 0.03434915059968864, 0.03448990802584111, 0.034608181724550435, 0.03460191877413572, 0.03440942556441971, 0.03394770291850613, 0.03314323193099739, 0.031980383144136204, 0.030404461831673602, 0.028576679558081557, 0.02678696754996943, 0.025051502672644995, 0.022779923768275586, 0.019531929331223215, 0.014902660130291939, 0.008494646806375348, -6.18624013005399e-05, -0.01098041265227042, -0.023872510708823198, -0.037776719684660565, -0.051981531999954506, -0.06598092419585369, -0.08001480115049417, -0.09480707602400336, -0.11025582412739089, -0.1260356228303334, -0.14118734725419413, -0.15488894707688494, -0.1669685175203354, -0.17744594245684767, -0.18638203057075522, -0.19374853768667183, -0.19955377556787585, -0.20377364767062878, -0.2066577051650968, -0.208207376457313, -0.20837370657749116, -0.20731835148199856, -0.20524054957437965, -0.20244598269999883, -0.19935312560408533, -0.19627138823170076, -0.19312424487914, -0.18979324655160187, -0.18616096789918835, -0.18206396742921097, -0.1773919900096886, -0.172153639530474, -0.16642481009489796, -0.16028655672111308, -0.1538781597613027, -0.14728188789683314, -0.14039093269872685, -0.13308984287140774, -0.1252617855769216, -0.11677360373517173, -0.10746677521156218, -0.09771821200597765, -0.08639504001628404, -0.0738411059146931, -0.059845909733106634, -0.04409019923933052, -0.02621032257605617, -0.005913461983146283, 0.017526055121874766, 0.042581775099985404, 0.054003464783347596], [0.5398534647606731, 0.5388023243680096, 0.5362651399452083, 0.5313617036024897, 0.5227183302475578, 0.508473550860835, 0.4864128147998062, 0.45430074810974935, 0.410124118878275, 0.3557475596865593, 0.2988763614953457, 0.24575017193392557, 0.19926231539754566, 0.16019555250447437, 0.12850233134915232, 0.1037589405492279, 0.08513920313832149, 0.07215066889473519, 0.06375908014747025, 0.05896496004210252, 0.4117252702807868, 0.41713799000191876, 0.4245207964638629, 0.43351958241614713, 0.4434762644078785, -0.359111856690393, -0.31261520136089993, 0.04178942243462124, 0.04171324844583286, 0.04142620867833603, 0.041262298608772244, 0.04124733194940047, 0.041334956100776324, 0.041477405503947705, 0.041638060060268954, 0.04177413500326765, 0.04178177388346506, 0.04155193955538215, 0.0409857012353611, 0.040011103341781276, 0.038610083692056846, 0.03671556467082802, 0.034520676716852036, 0.032373382646128046, 0.030292909259867825, 0.027569824693108112, 0.023674831931488918, 0.018121282050580154, 0.010431288744743483, 0.00016036856481021938, -0.012951774931347766, -0.028436108434018316, -0.04513772421723802, -0.062201897574295395, -0.07902051965702875, -0.09588160203794434, -0.11365459924145983, -0.13221680089367863, -0.15117737806423368, -0.16938492644629158, -0.18585815165443845, -0.20038908567193878, -0.21298628608623607, -0.22373054570098533, -0.2325893095144504, -0.23957438530576974, -0.24474879051302617, -0.2482366541344361, -0.25005572595067094, -0.2502257455234032, -0.24894221612569153, -0.2464376011030513, -0.2430763249297027, -0.23935969085446784, -0.23565852532602638, -0.23188026959030522, -0.22788189887681595, -0.22352209453940497, -0.21860436248689216, -0.21299651949984866, -0.20670880809872885, -0.19983226073623517, -0.19246413225318995, -0.18477168823134563, -0.1768537314243515, -0.16858191656655172, -0.15981752345070815, -0.15042015950831694, -0.14022982621128136, -0.12905606023395647, -0.11722004027327473, -0.10362284559520353, -0.08854978683087888, -0.07174908874137505, -0.052840787728520903, -0.03139748514026547, -0.006830504991924092, 0.02120190690179244, 0.05130542982586308, 0.06572084017111307]], [[0.01963464464201471, 0.019686443658144658, 0.01976250078232937, 0.01982789509913313, 0.019834260193552902, 0.019708325942217927, 0.019361133519284167, 0.018670560701839208, 0.017460983136400963, 0.01574584134790315, 0.013813881103138002, 0.011847285439263224, 0.010026720660241082, 0.008411906841021307, 0.00702847486852373, 0.005874448274148445, 0.0049360106071073126, 0.004197444239452488, 0.0036215156613844893, 0.0031700046288335166, 0.059200114031948366, 0.05986028057646998, 0.06078761231957429, 0.06199153213081852, 0.0634890117098078, 0.06530543427376827, 0.0674406064980195, 0.06979092351075834, 0.07234110741939412, 0.07510725609515229, 0.07810673197681202, 0.08135342937771826, 0.08485208423969517, 0.0885508150930181, 0.08671342444829817, -0.02315200565603917, -0.007906754771409357, -0.0004299085835313291, -0.0003143293729687052, -0.00037917111282327387, -0.0004806424346820704, -0.0006137481126474328, -0.000771442470110753, -0.0009435783869150403, -0.0011302515941189052, -0.0013514951053786044, -0.0016193871208424434, -0.0019429756896600947, -0.0023287998337335773, -0.002780173673265879, -0.0032919539483098723, -0.003844136685970956, -0.00439877633373479, -0.00492948071015156, -0.005421615327191084, -0.005885584402238701, -0.0063490913575367245, -0.006813125265737198, -0.007271173164742204, -0.0076936066951282175, -0.0080553066763706, -0.008343838540821095, -0.008569985787031453, -0.00874140945400914, -0.008859893573922771, -0.008928028413640064, -0.008949406169581928, -0.008928798783827524, -0.008866622206603005, -0.008763424520622584, -0.008625213714696796, -0.008458864630495149, -0.008275131558679689, -0.008086317088060225, -0.007901060350752326, -0.007717099695227885, -0.007530302002127742, -0.007336663510891952, -0.00713082428003765, -0.006910405384542464, -0.006675582945152886, -0.006428687304454896, -0.006172334412130496, -0.005911224901328654, -0.005647228951892265, -0.00537577256316895, -0.005093640602347166, -0.004797547317047354, -0.004483788622319425, -0.004148083953330279, -0.004744559865171573, -0.004502193970236776, -0.0028358457923338696, -0.0023429301858047887, -0.0017958704418344772, -0.0011822337341539457, -0.00048664622530297704, 0.000337501525889573, 0.0012878199396725266, 0.0005100094260723315], [0.09118166848151657, 0.09140799925550339, 0.09176445133397054, 0.09209470649064087, 0.09215980836918156, 0.09160459753968259, 0.08997577686537042, 0.08670277425691293, 0.08106534781092728, 0.07304632292246765, 0.06388990218875129, 0.0546680094420342, 0.04613325589092015, 0.03857760662566647, 0.032101983662386785, 0.02668823207762434, 0.02226860214531952, 0.018766623196271873, 0.016011369395618584, 0.013829353348808273, 0.06920243954407189, 0.06877352190464699, 0.0688356827342654, 0.06934007543969431, 0.07025475772107852, 0.07156456670430918, 0.0732413624489918, 0.07517700827849812, 0.07735319725101332, 0.0797794463957152, 0.08246703151502088, 0.085412069672243, 0.08858764637617428, 0.09185047533184675, 0.08325536437608319, -0.020488974536190672, -0.0066766924149507575, -0.00011785781171148617, -0.00014127255186937145, -0.0005778590731586783, -0.0011320070892837247, -0.001801689590483237, -0.0025641442872618475, -0.0033790123126538393, -0.004250742461256832, -0.005274165525724129, -0.006506768778342682, -0.007991926819652571, -0.0097617658200205, -0.011833616778181151, -0.014191316061901762, -0.0167385056300561, -0.019300865320579924, -0.02175734182007724, -0.02404009875494096, -0.026196380602867, -0.02835255183878841, -0.03051105293569938, -0.032640676170998716, -0.03460393308132695, -0.03628489541556307, -0.0376489124842942, -0.038722787167352155, -0.03953176338400978, -0.04009285711409375, -0.04041805861893725, -0.04052413430873185, -0.040433426443743245, -0.04014820496321436, -0.0396714276645745, -0.03903095220856228, -0.03825881630791958, -0.037405258604762244, -0.036526235542906224, -0.03565977548694089, -0.03479482264913849, -0.03391211378643541, -0.03299259239011753, -0.03201097546229228, -0.03095677184169797, -0.029832636796372956, -0.028648808563863835, -0.027417490740782834, -0.026160551831911058, -0.02488535025715008, -0.023568830255238114, -0.02219483332187159, -0.020746272842033512, -0.019203388774030144, -0.017543212922349727, -0.016346023692271186, -0.01443094939180753, -0.012341613288079737, -0.01004854236857039, -0.007504751502432485, -0.004659907663659637, -0.001452860101119185, 0.0022469078901103854, 0.0062537782351419335, 0.005308301108328723], [0.17394903387949526, 0.1743743849074241, 0.1750558634061056, 0.17569790189980622, 0.17583815670903546, 0.17479235176237135, 0.17167756968755657, 0.1654037618657, 0.15463998598761966, 0.1393175174612772, 0.12176625146495133, 0.104133173419765, 0.08781502311388055, 0.07337539800127581, 0.06099864859820062, 0.050646084779682216, 0.042186838312175394, 0.03547345263066312, 0.030180745384384703, 0.025979560485037193, 0.08051914536180871, 0.0788304516602296, 0.07789200831170366, 0.0775875700922059, 0.0778286504956197, 0.07855322279985166, 0.07970103728759927, 0.08115973042753678, 0.08290835374707804, 0.08494985636186284, 0.0872902858372795, 0.08990891512526272, 0.0927516716162494, 0.09561044781877003, 0.08235851411470892, -0.017987440521092433, -0.005199430443359697, 0.0006239476608772053, 0.0003261812598315292, -0.0005679087851878888, -0.0016625335122609454, -0.0029633909948068816, -0.00443155597413048, -0.00599309089565682, -0.007658291967210048, -0.009608882595829316, -0.011955163593166515, -0.014780494274401628, -0.01814695731565723, -0.022088492138168343, -0.026577751614334517, -0.0314293478145289, -0.03631158335865555, -0.040994346605655575, -0.04535007253070988, -0.049467811760647296, -0.05358691114029939, -0.057710479840365245, -0.06177806382120702, -0.06552702262931999, -0.06873612182531975, -0.0713493451803042, -0.07340715433663705, -0.07497561194040415, -0.07606986989300263, -0.07671333793166124, -0.07693833783017252, -0.07678775762175423, -0.07626623824103108, -0.07537967088559652, -0.0741811293868516, -0.07273151666148646, -0.0711263963943194, -0.06947204124282678, -0.06784054129320909, -0.06621091164772458, -0.06454678296763407, -0.06281213796630603, -0.060959068295746315, -0.05896796641238901, -0.0568417891017469, -0.054601250908323865, -0.05226942162403486, -0.049887566129777475, -0.047467206178819485, -0.04496534508778163, -0.04235502155720696, -0.039602844631604114, -0.036671711852054735, -0.03351825401661078, -0.030813205119062336, -0.027158077663393038, -0.02317080470610321, -0.018769740704683905, -0.013939943403508917, -0.008514953456870854, -0.0024072787383210194, 0.004593244548253422, 0.012053658997494679, 0.01145477968030203], [0.47437831994679713, 0.47552042562191604, 0.47738297715051753, 0.47916728461874813, 0.47959445190835753, 0.47677965439609904, 0.4682645731942002, 0.45107219246459546, 0.4216927295558214, 0.37983871990579166, 0.331742484701968, 0.2835430200456284, 0.23894080178490718, 0.1994912123896614, 0.16567423759542627, 0.1373730819896287, 0.11422634423600309, 0.09582752048970337, 0.081292295632485, 0.06972805777651811, 0.12093870685362174, 0.11467474892339033, 0.11010148017465195, 0.10685795678578444, 0.10465044111541576, 0.10324677602315542, 0.10247056786257137, 0.1021963883585608, 0.10239542924059822, 0.10304879270492874, 0.10414704129018873, 0.10561553308014225, 0.10732007679088397, 0.10889739928313782, 0.08492557481408262, -0.009972450404723351, 0.0002924134918120052, 0.004056376036475781, 0.002532630542491851, -8.425997601433464e-05, -0.003183022728648044, -0.006806101613434327, -0.010860341275709954, -0.015153451306313076, -0.01971950628019543, -0.02505681530407463, -0.031468229104666505, -0.03918295072579341, -0.04837236375708704, -0.059130811418543455, -0.0713922847068359, -0.0846457562375868, -0.09798808968565385, -0.11079263061145679, -0.12270652744938931, -0.13397235919296, -0.14524099866932025, -0.15651907641575288, -0.16764127578122082, -0.1778921411842971, -0.18666989573764536, -0.19385138108578834, -0.19951808239315774, -0.20384952438585238, -0.20688693346917963, -0.20869456616220033, -0.20936090113632144, -0.2089733826835728, -0.20757544281325124, -0.20518419687297623, -0.2019439706999157, -0.19801985014505197, -0.193670892623378, -0.18918406561741544, -0.18475344707244298, -0.18032268707017998, -0.1757944651944062, -0.1710720928948868, -0.16602634235273128, -0.16060548844405323, -0.15481930567275975, -0.1487246938798832, -0.1423842017807354, -0.1359101426415285, -0.12933907682383813, -0.12255137757845294, -0.1154645789521952, -0.10799078878748673, -0.10002777908221391, -0.0914561910023133, -0.08299232333221442, -0.07301983476715655, -0.06214238586634688, -0.05020269211849539, -0.03696041787016648, -0.022172134859194406, -0.005545205423230045, 0.013385486053202519, 0.033219838748405645, 0.03493813954402033], [0.7495328050724317, 0.751328673806182, 0.7542735509794267, 0.7571090591175411, 0.7578057295255386, 0.7533763695287414, 0.7399121895720451, 0.7127073027356882, 0.6662744380604272, 0.6001107267194149, 0.5240043018710789, 0.4477930859452375, 0.3772711266359877, 0.3149049230579801, 0.26144179726846134, 0.21669172025397704, 0.1800814730125042, 0.15096663916227943, 0.12795118555042295, 0.10962720544377917, 0.15744368437749, 0.14698474079787688, 0.13907692563846172, 0.13313506566308597, 0.128677327517207, 0.12531559438256415, 0.12276726645509232, 0.12089639633084673, 0.11966784816668598, 0.11904359578759573, 0.11899191283831226, 0.11940066251571264, 0.12007094420835562, 0.12053537712198549, 0.08966182984467579, -0.003127903017267196, 0.005318460449613627, 0.007453955610893249, 0.004693672380704282, 0.0004649269107021934, -0.004494300856171349, -0.010264213578028985, -0.016703867617356715, -0.023513610588735814, -0.03074972847233716, -0.039200864929723904, -0.049346484247655364, -0.06154945825775452, -0.07608133324146, -0.09309186093772034, -0.11248083376194543, -0.1334379142460405, -0.15453650489359352, -0.17478674059447902, -0.19363069845385517, -0.2114509643684816, -0.2292748317566002, -0.24711180707540514, -0.264700465647998, -0.28091078816134957, -0.2947344752348481, -0.3060460784718818, -0.3149615154323837, -0.3217651566714053, -0.3265229309062123, -0.3293373124474092, -0.3303489743318011, -0.329744302441477, -0.32754551447719854, -0.32377943394919456, -0.3186737518430089, -0.31248890304218707, -0.30563390732341134, -0.29856192305931795, -0.29157928773473424, -0.28459674412968905, -0.2774605754188235, -0.2700180600307898, -0.2620650245109347, -0.25351976393842907, -0.24439776599545845, -0.23478891562128384, -0.224791984051577, -0.21458441761715083, -0.20422400759930923, -0.19352183755769758, -0.1823477616900303, -0.1705630860698319, -0.15800659447087614, -0.1444900923996492, -0.13059386836963827, -0.114862507200827, -0.09767407778540645, -0.07880671152686647, -0.05775081459752436, -0.03451609335323233, -0.008259551919859848, 0.021573185246783942, 0.052663191619270217, 0.057008030742251345], [1.0706249699231971, 1.073182339200243, 1.077390560919422, 1.0814554042890492, 1.0824700958243496, 1.0761595547577876, 1.0569183778793458, 1.0180228264450135, 0.9516874475473471, 0.857150114916168, 0.7483388367082909, 0.6394304005691641, 0.5386533879132483, 0.4495389780024626, 0.37314466657700285, 0.30919407455710185, 0.25686644617077736, 0.21523938750001667, 0.182319911495685, 0.15609918390476718, 0.19954688628393535, 0.18418628556173622, 0.17237960978843286, 0.1632798564807935, 0.15618551158122182, 0.1505262383200636, 0.14589555521907416, 0.14213337512539137, 0.1392097595003104, 0.13706451237644954, 0.135661356442603, 0.1348273778043923, 0.13429254770156, 0.13348780022816906, 0.09608574599500487, 0.004735293490752071, 0.011269224011186043, 0.011612132915637525, 0.0073553339676704485, 0.0012342806333619251, -0.005902130644396427, -0.014180216939500168, -0.02340420282693445, -0.03314975344415231, -0.043499405107131704, -0.055580753945666826, -0.07007949414503162, -0.08751463333461111, -0.10827483068540522, -0.1325747903127762, -0.16027529936165158, -0.1902165263131141, -0.2203613108380637, -0.24929614953312193, -0.276223839283207, -0.3016902551888786, -0.327161749230159, -0.3525680260310121, -0.37761471666606417, -0.4006880761280281, -0.42043145942782173, -0.4366011083787621, -0.44934960104051497, -0.4590825504510868, -0.4658938421576101, -0.4699298114852594, -0.4713913310772793, -0.47054457016924767, -0.46742129694211737, -0.4620599390126747, -0.45478564983497516, -0.44597024502222804, -0.43619783433632037, -0.4261155852731195, -0.4161608784795993, -0.4062060940781963, -0.39603178547389223, -0.38541992094555716, -0.374078932656036, -0.36189218630208386, -0.34888188806947307, -0.3351764477598595, -0.3209169236247413, -0.3063567853556397, -0.29157861560475073, -0.2763126598086156, -0.260373146184353, -0.24356209208154989, -0.22564941636064145, -0.2063666431330883, -0.18632447556447573, -0.1635988846457161, -0.13905297449032644, -0.11210102357324121, -0.0822103407078783, -0.04884208677404349, -0.011350410458323709, 0.031192007991994, 0.07537671871282844, 0.08305122146699137], [1.3749932016412139, 1.378271610753313, 1.383677558725901, 1.3889091996370173, 1.390227343764639, 1.3821352648299337, 1.3574170575230284, 1.3074360366341733, 1.222233619762611, 1.1007974580930735, 0.9609743819376975, 0.8210667377901787, 0.6916059892579484, 0.5771333637445815, 0.47899935893611717, 0.39684523923887355, 0.3296154035502251, 0.27612376340954775, 0.23381158128998447, 0.20010061925030312, 0.23921678536753366, 0.21920695118648176, 0.2037010243172206, 0.1916037357360827, 0.18200525168815426, 0.17414558709864236, 0.16751677505262902, 0.16196166656036487, 0.15743181950407623, 0.15384641470788515, 0.15115631679337727, 0.14914013484778738, 0.14746294379174157, 0.145470528305377, 0.10274248265169085, 0.012088244127354507, 0.016934353684241822, 0.01564311307294438, 0.009935423957413226, 0.0020121001176734606, -0.007193808162282948, -0.017853533065970654, -0.029719892663133244, -0.04225074182271509, -0.05555371861407658, -0.07107782990277335, -0.08970433388099888, -0.11210029245807306, -0.13876542899583652, -0.16997606148527686, -0.2055563633196237, -0.2440149370978302, -0.282735894835327, -0.31990419028661343, -0.35449577618345984, -0.38710297317075093, -0.41971118801547413, -0.45233724376748213, -0.48450185798514844, -0.5141328033069769, -0.5394883388370155, -0.5602652237786246, -0.5766494616922156, -0.5891615366840957, -0.5979218090738916, -0.6031181895600047, -0.6050086106087189, -0.6039348634910058, -0.5999377703006145, -0.5930667700273148, -0.5837393948617474, -0.5724330211998633, -0.5598977164402622, -0.5469645434745587, -0.53419508597545, -0.5214253485316223, -0.5083735920843624, -0.4947598889810965, -0.4802098360334178, -0.4645736932548931, -0.4478800419748089, -0.43029381010521023, -0.41199613501274357, -0.3933125477195581, -0.37434913276334275, -0.35475951443254117, -0.3343051950930435, -0.3127319849065818, -0.28974450806322977, -0.2649981495993724, -0.2390933599489158, -0.20995469040299747, -0.17811714905343842, -0.14361170916428814, -0.10522224494581754, -0.06237001754164984, -0.014229892140929823, 0.040352837766457726, 0.09692714076965411, 0.10790722590391988]]], "reynolds_numbers": [50000.0, 100000.0, 200000.0, 500000.0, 1000000.0, 3500000.0, 5000000.0, 7500000.0], "angle_of_attacks": [-0.24434609527920614, -0.22689280275926285, -0.20943951023931956, -0.19198621771937624, -0.17453292519943295, -0.15707963267948966, -0.13962634015954636, -0.12217304763960307, -0.10471975511965978, -0.08726646259971647, -0.06981317007977318, -0.05235987755982989, -0.03490658503988659, -0.017453292519943295, 0.0, 0.017453292519943295, 0.03490658503988659, 0.05235987755982989, 0.06981317007977318, 0.08726646259971647, 0.10471975511965978, 0.12217304763960307, 0.13962634015954636, 0.15707963267948966, 0.17453292519943295, 0.19198621771937624, 0.20943951023931956, 0.22689280275926285, 0.24434609527920614, 0.2617993877991494, 0.2792526803190927, 0.29670597283903605, 0.3141592653589793, 0.33161255787892263, 0.3490658503988659, 0.3665191429188092, 0.3839724354387525, 0.4014257279586958, 0.4188790204786391, 0.4363323129985824, 0.4537856055185257, 0.47123889803846897, 0.4886921905584123, 0.5061454830783556, 0.5235987755982988, 0.5410520681182421, 0.5585053606381855, 0.5759586531581288, 0.5934119456780721, 0.6108652381980153, 0.6283185307179586, 0.6457718232379019, 0.6632251157578453, 0.6806784082777885, 0.6981317007977318, 0.7155849933176751, 0.7330382858376184, 0.7504915783575618, 0.767944870877505, 0.7853981633974483, 0.8028514559173916, 0.8203047484373349, 0.8377580409572782, 0.8552113334772214, 0.8726646259971648, 0.8901179185171081, 0.9075712110370514, 0.9250245035569946, 0.9424777960769379, 0.9599310885968813, 0.9773843811168246, 0.9948376736367679, 1.0122909661567112, 1.0297442586766545, 1.0471975511965976, 1.064650843716541, 1.0821041362364843, 1.0995574287564276, 1.117010721276371, 1.1344640137963142, 1.1519173063162575, 1.1693705988362009, 1.1868238913561442, 1.2042771838760873, 1.2217304763960306, 1.239183768915974, 1.2566370614359172, 1.2740903539558606, 1.2915436464758039, 1.3089969389957472, 1.3264502315156905, 1.3439035240356338, 1.361356816555577, 1.3788101090755203, 1.3962634015954636, 1.413716694115407, 1.4311699866353502, 1.4486232791552935, 1.4660765716752369, 1.4835298641951802, 1.5009831567151235, 1.5184364492350666, 1.53588974175501, 1.5533430342749532, 1.5707963267948966]}, "prev": null, "next": null, "number_of_points": 201}}, "airfoil_polar_stations": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], "fidelity": "Blade_Element_Momentum_Theory_Helmholtz_Wake", "cruise": {"design_power": null, "design_thrust": null, "design_torque": null, "design_power_coefficient": 0.01, "design_thrust_coefficient": 0.01, "design_torque_coefficient": 0.005, "design_Cl": 0.7, "design_efficiency": 0.86, "design_angular_velocity": null, "design_tip_mach": null, "design_acoustics": null, "design_performance": null, "design_SPL_dBA": null, "design_blade_pitch_command": 0.0}, "induced_power_factor": 1.48, "profile_drag_coefficient": 0.03, "clockwise_rotation": true, "phase_offset_angle": 0.0, "orientation_euler_angles": [0.0, 1.5707963267948966, 0.0], "ducted": false, "sol_tolerance": 1e-08, "use_2d_analysis": false, "nonuniform_freestream": false, "axial_velocities_2d": null, "tangential_velocities_2d": null, "radial_velocities_2d": null, "start_angle": 0.0, "start_angle_idx": 0, "electric_propulsion_fraction": 1.0, "optimization_parameters": {"tip_mach_range": [0.3, 0.7], "multiobjective_aeroacoustic_weight": 1.0, "multiobjective_performance_weight": 1.0, "multiobjective_acoustic_weight": 1.0, "noise_evaluation_angle": 2.356194490192345, "tolerance": 0.0001, "ideal_SPL_dBA": 30, "ideal_efficiency": 1.0, "ideal_figure_of_merit": 1.0}, "BEMT_surrogate": {"training": {"advance_ratio": [0.0, 0.2, 0.4, 0.6000000000000001, 0.8, 1.0, 1.2000000000000002, 1.4000000000000001, 1.6, 1.8, 2.0], "tip_mach": [0.2, 0.35000000000000003, 0.5, 0.6500000000000001, 0.8], "blade_pitch_command": [-0.17453292519943295, -0.08726646259971647, 0.0, 0.08726646259971647, 0.17453292519943295], "disc_angle": [0.0, 0.5235987755982988, 1.0471975511965976, 1.5707963267948966], "altitude": 0.0, "batch_size": 4}, "accuracy_samples": 10, "cache_folder": null, "surrogate": null, "accuracy": null}, "hover": {"design_thrust": 3641.9625, "design_torque": 622.9629153642449, "design_power": 105980.69164099888, "design_angular_velocity": 170.12359648893744, "design_tip_mach": null, "design_freestream_velocity": 15.698535592238565, "design_acoustics": null, "design_performance": null, "design_blade_pitch_command": 0.0, "design_efficiency": 0.86, "design_SPL_dBA": 0, "design_Cl": 0.5466910678114905, "design_thrust_coefficient": 0.0659890262228906, "design_power_coefficient": 0.025354487663395694, "design_torque_coefficient": null, "design_altitude": 12.192}, "oei": {"design_thrust": 4166.172337814469, "design_torque": 668.1722841909705, "design_power": 129418.55407430105, "design_angular_velocity": 193.6903956305256, "design_freestream_velocity": 16.782440474352303, "design_tip_mach": null, "design_altitude": 12.192, "design_acoustics": null, "design_blade_pitch_command": -0.025291053006083173, "design_performance": null, "design_SPL_dBA": null, "design_Cl": null, "design_thrust_coefficient": null, "design_power_coefficient": null}, "active": true}, "electronic_speed_controller": {"tag": "electronic_speed_controller", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "bus_voltage": 588.0, "efficiency": 0.95}, "active_crypgenic_tanks_tanks": null, "nacelle": {"tag": "nacelle", "mass_properties": {"mass": 0.0, "volume": 0.0, "center_of_gravity": [[0.0, 0.0, 0.0]], "moments_of_inertia": {"center": [0.0, 0.0, 0.0], "tensor": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]}}, "origin": [[-0.073, 1.95, 1.2]], "aerodynamic_center": [0.0, 0.0, 0.0], "areas": {"front_projected": 0.0, "side_projected": 0.0, "wetted": 0.0}, "diameter": 0.3, "inlet_diameter": 0.0, "length": 0.45, "orientation_euler_angles": [0, -1.5707963267948966, 0.0], "flow_through": false, "has_pylon": true, "differential_pressure": 0.0, "cowling_airfoil_angle": 0.0}, "working_fluid": {"tag": "air", "molecular_mass": 28.96442, "gas_specific_constant": 287.0528742, "composition": {"gas": 1.0, "O2": 0.20946, "Ar": 0.00934, "CO2": 0.00036, "N2": 0.78084, "other": 0.0}, "specific_heat_capacity": 1006}, "sealevel_static_power": 267999.65674641833}
\ No newline at end of file
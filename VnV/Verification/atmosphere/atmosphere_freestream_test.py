@@ -0,0 +1,157 @@
+# atmosphere_freestream_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                      import Units
+from RCAIDE.Framework.Mission.Common            import Results
+from RCAIDE.Framework.Mission.Common.Conditions import Conditions
+from RCAIDE.Framework.Core.Arrays               import atleast_2d_col
+from RCAIDE.Library.Attributes.Gases            import Air
+from RCAIDE.Library.Attributes.Planets          import Earth
+
+import numpy as np
+import time
+
+keys = ['pressure','temperature','density','speed_of_sound','dynamic_viscosity',
+        'kinematic_viscosity','thermal_conductivity','prandtl_number']
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+
+    # ------------------------------------------------------------------
+    #   Layer search matches the layer loop, breaks included
+    # ------------------------------------------------------------------
+    z = np.concatenate([np.linspace(-1.9,84.,200) * Units.km, atmosphere.breaks.altitude[1:-1]])
+    for temperature_deviation in [0., 10.]:
+        reference  = reference_values(atmosphere,z,temperature_deviation)
+        atmo_data  = atmosphere.compute_values(z,temperature_deviation)
+        for key in keys:
+            assert np.allclose(atmo_data[key],reference[key],rtol=1e-12,atol=0.), key
+
+    # ------------------------------------------------------------------
+    #   Freestream arrays are written in place
+    # ------------------------------------------------------------------
+    rows       = 16
+    altitude   = np.linspace(0.,12.,rows)[:,None] * Units.km
+    conditions = Results.template(rows)
+    pressure   = conditions.freestream.pressure
+    atmosphere.compute_freestream(altitude,0.,conditions.freestream)
+    assert conditions.freestream.pressure is pressure
+    reference  = reference_values(atmosphere,altitude,0.)
+    for key in keys:
+        assert np.allclose(conditions.freestream[key],reference[key],rtol=1e-12,atol=0.), key
+
+    # ------------------------------------------------------------------
+    #   Lookup table interpolation error
+    # ------------------------------------------------------------------
+    table_atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    table_atmosphere.settings.use_lookup_table       = True
+    table_atmosphere.settings.lookup_table_tolerance = 1e-6
+    z_dense    = np.linspace(-1.9,84.,20001) * Units.km
+    table_data = table_atmosphere.compute_values(z_dense,0.)
+    reference  = reference_values(atmosphere,z_dense,0.)
+    table      = table_atmosphere.tables[(0.,False)]
+    print('Lookup table nodes = %d, interpolation error = %.2e' % (len(table.altitude),table.error))
+    for key in keys:
+        error = np.max(np.abs(table_data[key]/reference[key] - 1.))
+        assert error < 1e-6, key
+
+    # ------------------------------------------------------------------
+    #   Per call time of a mission segment update
+    # ------------------------------------------------------------------
+    repeats   = 500
+    freestream = conditions.freestream
+    ti = time.time()
+    for i in range(repeats):
+        atmo_data = reference_values(atmosphere,altitude,0.)
+        for key in keys:
+            freestream[key] = atmo_data[key]
+    reference_time = (time.time() - ti) / repeats
+
+    ti = time.time()
+    for i in range(repeats):
+        atmosphere.compute_freestream(altitude,0.,freestream)
+    layer_time = (time.time() - ti) / repeats
+
+    ti = time.time()
+    for i in range(repeats):
+        table_atmosphere.compute_freestream(altitude,0.,freestream)
+    table_time = (time.time() - ti) / repeats
+
+    print('Layer loop   = %.2e s per call' % reference_time)
+    print('Layer search = %.2e s per call, speedup = %.1f' % (layer_time, reference_time / layer_time))
+    print('Lookup table = %.2e s per call, speedup = %.1f' % (table_time, reference_time / table_time))
+
+    # ------------------------------------------------------------------
+    #   Constant temperature atmosphere
+    # ------------------------------------------------------------------
+    constant   = RCAIDE.Framework.Analyses.Atmospheric.Constant_Temperature()
+    atmo_data  = constant.compute_values(z,250.)
+    assert np.all(atmo_data.temperature == 250.)
+    assert np.allclose(atmo_data.density,atmo_data.pressure/(constant.fluid_properties.gas_specific_constant*250.),rtol=1e-12)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def reference_values(atmosphere,altitude,temperature_deviation):
+    """Atmospheric values assigned layer by layer with boolean masks, building the gas and planet for each call."""
+
+    gas  = atmosphere.fluid_properties
+    grav = atmosphere.planet.sea_level_gravity
+    Rad  = atmosphere.planet.mean_radius
+    R    = gas.gas_specific_constant
+    assert gas == Air() and atmosphere.planet == Earth()
+
+    zs = atleast_2d_col(altitude)
+    zs = zs/(1 + zs/Rad)
+
+    z0    = np.zeros_like(zs)
+    T0    = np.zeros_like(zs)
+    p0    = np.zeros_like(zs)
+    alpha = np.zeros_like(zs)
+    p     = np.zeros_like(zs)
+    for i in range(len(atmosphere.breaks.altitude)-1):
+        i_inside = (zs >= atmosphere.breaks.altitude[i]) & (zs <= atmosphere.breaks.altitude[i+1])
+        z0[i_inside]    = atmosphere.breaks.altitude[i]
+        T0[i_inside]    = atmosphere.breaks.temperature[i]
+        p0[i_inside]    = atmosphere.breaks.pressure[i]
+        alpha[i_inside] = -(atmosphere.breaks.temperature[i+1] - atmosphere.breaks.temperature[i])/ \
+                           (atmosphere.breaks.altitude[i+1]    - atmosphere.breaks.altitude[i])
+
+    dz      = zs - z0
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ((1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)))
+    T   = T0 - dz*alpha + temperature_deviation
+    rho = gas.compute_density(T,p)
+    mu  = gas.compute_absolute_viscosity(T)
+
+    atmo_data = Conditions()
+    atmo_data.expand_rows(zs.shape[0])
+    atmo_data.pressure             = p
+    atmo_data.temperature          = T
+    atmo_data.density              = rho
+    atmo_data.speed_of_sound       = gas.compute_speed_of_sound(T,p)
+    atmo_data.dynamic_viscosity    = mu
+    atmo_data.kinematic_viscosity  = mu/rho
+    atmo_data.thermal_conductivity = gas.compute_thermal_conductivity(T)
+    atmo_data.prandtl_number       = gas.compute_prandtl_number(T)
+
+    return atmo_data
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# conditions_template_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Mission.Common import Conditions, Results, State
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Templates reproduce construction followed by expand_rows
+    # ------------------------------------------------------------------
+    for klass in [Conditions, Results, State]:
+        compare(klass(), klass.template())
+        for rows in [1, 2, 16]:
+            conditions = klass()
+            conditions.expand_rows(rows)
+            compare(conditions, klass.template(rows))
+
+    # expanded arrays are sized to fewer rows
+    state = Ground_State()
+    state.expand_rows(16)
+    compare(state, Ground_State.template(16))
+    assert Ground_State.template(16).residuals.force_x.shape == (15, 1)
+
+    # clones do not share arrays with each other or with the template
+    first  = Results.template(4)
+    first.frames.inertial.time[:] = 5.
+    first.freestream.altitude     = 1.
+    second = Results.template(4)
+    assert np.all(second.frames.inertial.time == 0.)
+    assert np.all(second.freestream.altitude == 0.)
+    assert second.frames is not first.frames
+
+    # ------------------------------------------------------------------
+    #   Construction time
+    # ------------------------------------------------------------------
+    rows    = 16
+    repeats = 100
+    for klass in [Results, State]:
+        ti = time.time()
+        for i in range(repeats):
+            conditions = klass()
+            conditions.expand_rows(rows)
+        construct_time = (time.time() - ti) / repeats
+
+        ti = time.time()
+        for i in range(repeats):
+            conditions = klass.template(rows)
+        template_time = (time.time() - ti) / repeats
+
+        print('%-8s construct + expand_rows = %.2e s, template = %.2e s, speedup = %.1f' % (klass.__name__, construct_time, template_time, construct_time / template_time))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+class Ground_State(State):
+    """State with the residuals and unknowns of a ground segment, which are one and two rows short."""
+    def __defaults__(self):
+        self.residuals.force_x     = self.ones_row_m1(1) * 0.0
+        self.unknowns.ground_speed = self.ones_row_m2(1) * 1.0
+
+def compare(expected, actual, path='conditions'):
+    """Asserts that two condition trees have the same classes, keys, sizes and array values."""
+    assert type(expected) == type(actual), path
+    if isinstance(expected, dict):
+        assert set(expected.keys()) == set(actual.keys()), path
+        assert getattr(expected, '_size', None) == getattr(actual, '_size', None), path
+        for key, value in expected.items():
+            compare(value, actual[key], path + '.' + str(key))
+    elif isinstance(expected, np.ndarray):
+        assert expected.shape == actual.shape, path
+        assert expected.dtype == actual.dtype, path
+        assert np.array_equal(expected, actual, equal_nan=True), path
+    else:
+        assert expected == actual, path
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# import_time_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import subprocess
+import sys
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Import RCAIDE in a fresh interpreter and record -X importtime
+    # ------------------------------------------------------------------
+    import_times, total_time = import_time_benchmark()
+
+    print('RCAIDE import time          = %.3f s' % total_time)
+    print('Modules imported            = %d' % len(import_times))
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)[:10]
+    print('Slowest modules (self time) :')
+    for name, t in slowest:
+        print('    %-70s %.4f s' % (name, t))
+
+    # ------------------------------------------------------------------
+    #   Check Results
+    # ------------------------------------------------------------------
+    # heavy optional leaves must only be loaded on first use
+    deferred_modules = ['matplotlib', 'plotly', 'pandas', 'sklearn', 'cantera', 'openvsp', 'gmsh',
+                        'RCAIDE.Library.Plots.Mission',
+                        'RCAIDE.Framework.External_Interfaces.OpenVSP',
+                        'RCAIDE.Framework.Optimization.Packages.additive']
+    for module in deferred_modules:
+        assert module not in import_times, module + ' is imported by import RCAIDE'
+
+    # lazy attribute access still resolves plotting functions and subpackages
+    import RCAIDE
+    assert callable(RCAIDE.Library.Plots.plot_flight_conditions)
+    assert callable(RCAIDE.Library.Plots.Noise.plot_noise_level)
+    assert callable(RCAIDE.Framework.Optimization.Packages.scipy.SciPy_Solve)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Function
+# ----------------------------------------------------------------------
+def import_time_benchmark():
+    """Runs 'import RCAIDE' under python -X importtime and returns the self import time of every module and the
+    cumulative import time of RCAIDE in seconds."""
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import RCAIDE'],
+                             capture_output=True, text=True, check=True)
+
+    import_times = {}
+    total_time   = 0.
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        import_times[name.strip()] = float(self_us) * 1E-6
+        if name.strip() == 'RCAIDE':
+            total_time = float(cumulative_us) * 1E-6
+
+    return import_times, total_time
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# merged_state_test.py
+#
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Core           import Data
+from RCAIDE.Framework.Mission.Common import Results, State
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   50 segment mission state
+    # ------------------------------------------------------------------
+    n_segments = 50
+    n_points   = 16
+    mission    = mission_state(n_segments, n_points)
+
+    ti           = time.time()
+    merged_state = mission.merged()
+    merge_time   = time.time() - ti
+
+    ti           = time.time()
+    reference    = pairwise_merge(mission)
+    pairwise_time = time.time() - ti
+
+    print('Linear merge of %d segments   = %.3f s' % (n_segments, merge_time))
+    print('Pairwise merge of %d segments = %.3f s' % (n_segments, pairwise_time))
+
+    # ------------------------------------------------------------------
+    #   Check Results
+    # ------------------------------------------------------------------
+    compare(reference, merged_state)
+
+    conditions = merged_state.conditions
+    assert conditions.frames.inertial.time.shape == (n_segments * n_points, 1)
+    assert conditions.frames.inertial.position_vector.shape == (n_segments * n_points, 3)
+    assert merged_state.residuals.force_x.shape == (n_segments * (n_points - 1), 1)
+    assert np.array_equal(conditions.frames.inertial.time[n_points:2 * n_points], mission.segments.segment_1.conditions.frames.inertial.time)
+
+    # the merged arrays are copies of the segment arrays
+    conditions.frames.inertial.time[:] = -1.
+    assert np.all(mission.segments.segment_0.conditions.frames.inertial.time >= 0.)
+
+    # merging an empty container returns the default state
+    assert len(State.Container().merged().conditions) == 0
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+def mission_state(n_segments, n_points):
+    """Builds a mission state container of segments with random conditions."""
+    rng     = np.random.default_rng(0)
+    mission = State.Container()
+    for i in range(n_segments):
+        state                   = State.template(n_points)
+        state.conditions.update(Results.template(n_points))
+        state.unknowns.throttle = rng.random((n_points, 1))
+        state.residuals.force_x = rng.random((n_points - 1, 1))
+        randomize(state.conditions, rng)
+        state.conditions.frames.inertial.time = i + np.linspace(0, 1, n_points)[:, None]
+        mission.segments['segment_' + str(i)] = state
+    return mission
+
+def randomize(conditions, rng):
+    """Fills every array of a condition tree with random values."""
+    for key, value in conditions.items():
+        if isinstance(value, Data):
+            randomize(value, rng)
+        elif isinstance(value, np.ndarray):
+            conditions[key] = rng.random(value.shape)
+    return
+
+def pairwise_merge(mission):
+    """Reference merge that appends each segment to the merged arrays of the previous segments."""
+    state_out = Data()
+    for i, sub_state in enumerate(mission.segments.values()):
+        for key in ['unknowns', 'conditions', 'residuals']:
+            if i == 0:
+                state_out[key] = sub_state[key]
+            else:
+                state_out[key] = append(state_out[key], sub_state[key])
+    return state_out
+
+def append(A, B):
+    """Stacks the arrays of B below the arrays of A."""
+    C = Data()
+    for key, a in A.items():
+        if isinstance(a, Data):
+            C[key] = append(a, B[key])
+        elif isinstance(a, np.ndarray):
+            C[key] = np.vstack([a, B[key]])
+        else:
+            C[key] = a
+    return C
+
+def compare(expected, actual, path='state'):
+    """Asserts that two merged states hold the same keys and arrays."""
+    for key, value in expected.items():
+        if isinstance(value, Data):
+            compare(value, actual[key], path + '.' + str(key))
+        elif isinstance(value, np.ndarray):
+            assert np.array_equal(value, actual[key]), path + '.' + str(key)
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
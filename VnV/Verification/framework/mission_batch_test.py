@@ -0,0 +1,195 @@
+# Regression/scripts/Tests/mission_batch_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                          import Units
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737    import vehicle_setup as vehicle_setup
+from Boeing_737    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # reference: the first mission evaluated on its own
+    vehicle   = vehicle_setup()
+    reference = mission_setup(vehicle, 0.78).evaluate()
+    CL_truth  = reference.segments.cruise.conditions.aerodynamics.coefficients.lift.total[:,0]
+
+    # batch of two independent missions and a mission that fails
+    missions = RCAIDE.Framework.Mission.Missions()
+    missions.append_mission(mission_setup(vehicle, 0.78))
+    missions.append_mission(mission_setup(vehicle, 0.74))
+    missions.append_mission(mission_setup(vehicle, None))
+    tags = list(missions.keys())[1:]
+
+    serial_cases   = missions.evaluate_batch(number_of_workers = 1)
+    parallel_cases = missions.evaluate_batch(number_of_workers = 2)
+
+    for cases in [serial_cases, parallel_cases]:
+        # cases are returned in mission order
+        assert list(cases.keys()) == tags
+
+        case_1, case_2, case_3 = cases.values()
+        print(case_1.tag, case_1.converged, case_1.evaluation_time)
+        print(case_2.tag, case_2.converged, case_2.evaluation_time)
+        print(case_3.tag, case_3.converged, case_3.error)
+
+        assert case_1.converged and case_2.converged
+        assert np.allclose(case_1.results.segments.cruise.conditions.aerodynamics.coefficients.lift.total[:,0], CL_truth, rtol = 1e-10)
+
+        # the failed mission is reported without stopping the batch
+        assert case_3.converged == False
+        assert case_3.results is None
+        assert 'airspeed not set' in case_3.error
+
+    # serial and parallel evaluations are identical
+    for tag in tags[:2]:
+        CL_serial   = serial_cases[tag].results.segments.cruise.conditions.aerodynamics.coefficients.lift.total
+        CL_parallel = parallel_cases[tag].results.segments.cruise.conditions.aerodynamics.coefficients.lift.total
+        assert np.array_equal(CL_serial, CL_parallel)
+
+    # a worker trains the surrogates of identical analyses once
+    assert serial_cases[tags[0]].surrogates_restored == 0
+    assert serial_cases[tags[1]].surrogates_restored == 1
+
+    # the batch leaves the missions of the container untouched
+    assert missions[tags[0]].segments.cruise.analyses.aerodynamics.training.subsonic is None
+
+    # one mission across vehicle variants
+    vehicles = []
+    for mass in [70000., 79015.8]:
+        variant                                   = vehicle_setup()
+        variant.tag                               = 'boeing_737_' + str(int(mass))
+        variant.mass_properties.takeoff           = mass * Units.kg
+        vehicles.append(variant)
+    variants = RCAIDE.Framework.Mission.Missions()
+    variants.append_vehicle_variants(lambda vehicle: mission_setup(vehicle, 0.78), vehicles)
+    variant_cases = variants.evaluate_batch(number_of_workers = 2)
+
+    light_case, heavy_case = variant_cases.values()
+    assert light_case.converged and heavy_case.converged
+    CL_light = light_case.results.segments.cruise.conditions.aerodynamics.coefficients.lift.total[0,0]
+    CL_heavy = heavy_case.results.segments.cruise.conditions.aerodynamics.coefficients.lift.total[0,0]
+    print('CL light: ', CL_light, ' CL heavy: ', CL_heavy)
+    assert CL_light < CL_heavy
+
+    # duplicate variant tags are numbered, and the duplicate reuses the surrogate training of the first variant
+    duplicates = RCAIDE.Framework.Mission.Missions()
+    duplicates.append_vehicle_variants(lambda vehicle: mission_setup(vehicle, 0.78), [vehicles[0], vehicles[0]])
+    assert list(duplicates.keys())[1:] == ['cruise_mach_0_78_boeing_737_70000', 'cruise_mach_0_78_boeing_737_70000_2']
+    first_case, duplicate_case = duplicates.evaluate_batch(number_of_workers = 1).values()
+    assert first_case.surrogates_restored == 0 and duplicate_case.surrogates_restored == 1
+    assert np.array_equal(first_case.results.segments.cruise.conditions.aerodynamics.coefficients.lift.total,
+                          duplicate_case.results.segments.cruise.conditions.aerodynamics.coefficients.lift.total)
+    return
+
+# ----------------------------------------------------------------------
+#   Define the Vehicle Analyses
+# ----------------------------------------------------------------------
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Conventional()
+    weights.aircraft_type  =  "Transport"
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.settings.model_fuselage               = True
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy= RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(vehicle, mach_number):
+
+    configs  = configs_setup(vehicle)
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'cruise_mach_' + str(mach_number)
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant speed
+    # ------------------------------------------------------------------
+    segment     = Segments.Cruise.Constant_Mach_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.altitude                                      = 25000. * Units.ft
+    segment.mach_number                                   = mach_number
+    segment.distance                                      = 500 * Units.km
+    segment.state.numerics.number_of_control_points       = 2
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
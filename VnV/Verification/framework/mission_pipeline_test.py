@@ -0,0 +1,192 @@
+# Regression/scripts/Tests/mission_pipeline_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                          import Units
+
+# python imports
+import numpy as np
+import threading
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Embraer_190   import vehicle_setup as vehicle_setup
+from Embraer_190   import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    # the same mission with its noise post-processing inline and on the background worker
+    serial    = mission_setup(vehicle).evaluate()
+    mission   = mission_setup(vehicle)
+    mission.settings.pipeline_post_processing = True
+    pipelined = mission.evaluate()
+
+    for tag in ['climb', 'cruise']:
+        segment = pipelined.segments[tag]
+        assert segment.state.numerics.solver.converged
+        assert np.array_equal(segment.conditions.noise.hemisphere_SPL_dBA,
+                              serial.segments[tag].conditions.noise.hemisphere_SPL_dBA)
+        assert np.array_equal(segment.conditions.frames.inertial.position_vector,
+                              serial.segments[tag].conditions.frames.inertial.position_vector)
+
+        # the deferred steps are put back in the segment process
+        assert segment.process.post_process.noise == RCAIDE.Library.Mission.Common.Update.noise
+    print('cruise SPL dBA: ', pipelined.segments.cruise.conditions.noise.hemisphere_SPL_dBA[:,0])
+
+    # a failed segment leaves its deferred steps in place and stops the background worker
+    failing = mission_setup(vehicle)
+    failing.settings.pipeline_post_processing = True
+    failing.segments.cruise.mach_number       = None
+    threads = threading.active_count()
+    failed  = False
+    try:
+        failing.evaluate()
+    except IndexError:
+        failed = True
+    assert failed
+    assert threading.active_count() == threads
+    assert failing.segments.cruise.process.post_process.noise == RCAIDE.Library.Mission.Common.Update.noise
+
+    # the mission can then be evaluated again
+    failing.segments.cruise.mach_number = 0.4
+    recovered = failing.evaluate()
+    assert np.array_equal(recovered.segments.cruise.conditions.noise.hemisphere_SPL_dBA,
+                          serial.segments.cruise.conditions.noise.hemisphere_SPL_dBA)
+    return
+
+# ----------------------------------------------------------------------
+#   Define the Vehicle Analyses
+# ----------------------------------------------------------------------
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Conventional()
+    weights.aircraft_type  =  "Transport"
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.settings.model_fuselage               = True
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy= RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Noise Analysis
+    noise = RCAIDE.Framework.Analyses.Noise.Correlation_Buildup()
+    noise.vehicle = vehicle
+    analyses.append(noise)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(vehicle):
+
+    configs  = configs_setup(vehicle)
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'pipeline_mission'
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    # ------------------------------------------------------------------
+    #   Climb Segment: constant speed, constant rate
+    # ------------------------------------------------------------------
+    segment     = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_start                                = 1000.  * Units.ft
+    segment.altitude_end                                  = 3000.  * Units.ft
+    segment.air_speed                                     = 180.   * Units.knots
+    segment.climb_rate                                    = 1500.  * Units['ft/min']
+    segment.state.numerics.number_of_control_points       = 4
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant speed
+    # ------------------------------------------------------------------
+    segment     = Segments.Cruise.Constant_Mach_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.mach_number                                   = 0.4
+    segment.distance                                      = 20.    * Units.km
+    segment.state.numerics.number_of_control_points       = 2
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# Regression/scripts/Tests/mission_surrogate_training_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                          import Units
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737    import vehicle_setup as vehicle_setup
+from Boeing_737    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # two vehicle variants and a duplicate of the first, trained in a pool at setup
+    vehicles = []
+    for mass in [70000., 79015.8]:
+        variant                                   = vehicle_setup()
+        variant.tag                               = 'boeing_737_' + str(int(mass))
+        variant.mass_properties.takeoff           = mass * Units.kg
+        vehicles.append(variant)
+
+    # reference: a mission training its surrogates when it is evaluated
+    reference = mission_setup(vehicles[0], 0.78).evaluate()
+    CL_truth  = reference.segments.cruise.conditions.aerodynamics.coefficients.lift.total
+
+    missions = RCAIDE.Framework.Mission.Missions()
+    missions.append_vehicle_variants(lambda vehicle: mission_setup(vehicle, 0.78), vehicles)
+    duplicate     = mission_setup(vehicles[0], 0.78)
+    duplicate.tag = 'duplicate'
+    missions.append_mission(duplicate)
+    missions.train_surrogates(number_of_workers = 2)
+
+    tags         = list(missions.keys())[1:]
+    aerodynamics = [missions[tag].segments.cruise.analyses.aerodynamics for tag in tags]
+    for analysis in aerodynamics:
+        assert analysis.training_restored
+        assert analysis.training.subsonic is not None
+
+    # identical analyses share the same training data, in separate copies
+    assert aerodynamics[0].training is not aerodynamics[2].training
+    assert np.array_equal(aerodynamics[0].training.subsonic.Clift_alpha, aerodynamics[2].training.subsonic.Clift_alpha)
+
+    # the evaluation only builds the surrogates from the restored training data
+    results = missions[tags[0]].evaluate()
+    CL      = results.segments.cruise.conditions.aerodynamics.coefficients.lift.total
+    assert aerodynamics[0].training_restored == False
+    assert np.array_equal(CL, CL_truth)
+
+    # training in a pool during the mission pre-processing
+    mission                                      = mission_setup(vehicles[0], 0.78)
+    mission.settings.number_of_surrogate_workers = 2
+    results                                      = mission.evaluate()
+    CL                                           = results.segments.cruise.conditions.aerodynamics.coefficients.lift.total
+    assert np.array_equal(CL, CL_truth)
+    return
+
+# ----------------------------------------------------------------------
+#   Define the Vehicle Analyses
+# ----------------------------------------------------------------------
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Conventional()
+    weights.aircraft_type  =  "Transport"
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.settings.model_fuselage               = True
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy= RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(vehicle, mach_number):
+
+    configs  = configs_setup(vehicle)
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'cruise_mach_' + str(mach_number)
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant speed
+    # ------------------------------------------------------------------
+    segment     = Segments.Cruise.Constant_Mach_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.altitude                                      = 25000. * Units.ft
+    segment.mach_number                                   = mach_number
+    segment.distance                                      = 500 * Units.km
+    segment.state.numerics.number_of_control_points       = 2
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# Regression/scripts/Tests/mission_warm_start_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                          import Units
+
+# python imports
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737    import vehicle_setup as vehicle_setup
+from Boeing_737    import configs_setup as configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    # a mission re-evaluated with a slightly longer cruise, as in a payload range sweep
+    mission                   = mission_setup(vehicle, 4, 300 * Units.km)
+    mission.warm_start.active = True
+    mission.evaluate()
+    cold_counts = evaluation_counts(mission)
+    mission.segments.cruise.distance = 320 * Units.km
+    warm        = mission.evaluate()
+    warm_counts = evaluation_counts(mission)
+    cold        = mission_setup(vehicle, 4, 320 * Units.km).evaluate()
+
+    report = mission.warm_start.report
+    print(report)
+    print('cold evaluations: ', cold_counts, ' warm evaluations: ', warm_counts)
+    for tag in ['climb', 'cruise']:
+        assert warm.segments[tag].state.numerics.solver.converged
+        assert np.allclose(warm.segments[tag].conditions.aerodynamics.coefficients.lift.total,
+                           cold.segments[tag].conditions.aerodynamics.coefficients.lift.total, rtol = 1e-5)
+        assert report.segments[tag].warm_solves == 1
+        assert report.segments[tag].evaluations_saved == report.segments[tag].cold_evaluations - warm.segments[tag].state.numerics.solver.evaluations
+    assert report.evaluations_saved == sum(cold_counts) - sum(warm_counts)
+    assert report.evaluations_saved > 0
+
+    # the store warm starts another mission with a finer climb discretization
+    finer            = mission_setup(vehicle, 6, 320 * Units.km)
+    finer.warm_start = mission.warm_start
+    warm_finer       = finer.evaluate()
+    cold_finer       = mission_setup(vehicle, 6, 320 * Units.km).evaluate()
+    print('cold evaluations: ', evaluation_counts(cold_finer), ' warm evaluations: ', evaluation_counts(warm_finer))
+    assert np.allclose(warm_finer.segments.climb.conditions.aerodynamics.coefficients.lift.total,
+                       cold_finer.segments.climb.conditions.aerodynamics.coefficients.lift.total, rtol = 1e-5)
+    assert report.segments.climb.warm_solves == 2
+
+    # turning the warm start off starts the next evaluation from the default initial guess, with the store kept
+    mission.warm_start.active = False
+    mission.evaluate()
+    assert evaluation_counts(mission) == evaluation_counts(cold)
+    for segment in mission.segments.values():
+        assert segment.state.numerics.solver.warm_start is None
+    assert len(mission.warm_start.segments) == 2
+
+    # clearing the store starts the next evaluation from the default initial guess
+    mission.warm_start.active = True
+    mission.clear_warm_start()
+    mission.evaluate()
+    assert evaluation_counts(mission) == cold_counts
+    assert mission.warm_start.report.segments.climb.warm_solves == 0
+    assert mission.warm_start.report.evaluations_saved == 0
+    return
+
+def evaluation_counts(mission):
+    return [segment.state.numerics.solver.evaluations for segment in mission.segments.values()]
+
+# ----------------------------------------------------------------------
+#   Define the Vehicle Analyses
+# ----------------------------------------------------------------------
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Conventional()
+    weights.aircraft_type  =  "Transport"
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.settings.model_fuselage               = True
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy= RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(vehicle, climb_control_points, cruise_distance):
+
+    configs  = configs_setup(vehicle)
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    for tag,config in list(configs.items()):
+        analyses[tag] = base_analysis(config)
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'warm_start_mission'
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+
+    # ------------------------------------------------------------------
+    #   Climb Segment: constant speed, constant rate
+    # ------------------------------------------------------------------
+    segment     = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_start                                = 20000. * Units.ft
+    segment.altitude_end                                  = 25000. * Units.ft
+    segment.air_speed                                     = 220.   * Units.knots
+    segment.climb_rate                                    = 1500.  * Units['ft/min']
+    segment.state.numerics.number_of_control_points       = climb_control_points
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: constant speed
+    # ------------------------------------------------------------------
+    segment     = Segments.Cruise.Constant_Mach_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.mach_number                                   = 0.78
+    segment.distance                                      = cruise_distance
+    segment.state.numerics.number_of_control_points       = 2
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['starboard_propulsor','port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# Regression/scripts/Tests/save_load_binary_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data, DataOrdered
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    data                                = Data()
+    data.tag                            = 'results'
+    data.segments                       = DataOrdered()
+    data.segments.cruise                = Data()
+    data.segments.cruise.conditions     = Data()
+    data.segments.cruise.conditions.energy             = Data()
+    data.segments.cruise.conditions.energy.power       = np.linspace(0.,1.,6).reshape(3,2)
+    data.segments.cruise.conditions.energy.active      = True
+    data.segments.cruise.conditions.frames             = Data()
+    data.segments.cruise.conditions.frames.time        = np.arange(3.)[:,None]
+    data.segments.climb                 = Data()
+    data.segments.climb.mach            = np.float64(0.5)
+    data.segments.climb.flag            = None
+    data.arrays                         = [np.ones(3), np.zeros(3)]
+    data.ragged                         = [np.ones(2), np.ones(3)]
+    data.numbers                        = [1, 2.5, 'three', [4, 5]]
+    data.nested_tuple                   = (1, (2, 3), [np.arange(2)])
+    data.list_of_data                   = [Data(x = np.ones(2)), DataOrdered(y = 2.)]
+
+    directory = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(directory, 'results')
+        RCAIDE.save(data, filename, binary_format = True)
+
+        # full round trip
+        loaded = RCAIDE.load(filename, binary_format = True)
+        check_equal(data, loaded)
+
+        # arrays are read into writable arrays by default
+        loaded.arrays[0][0] = 2.
+        loaded.segments.cruise.conditions.energy.power[0,0] = 2.
+        assert loaded.arrays[0][0] == 2.
+
+        # memory-mapped arrays are read-only views
+        mapped = RCAIDE.load(filename, binary_format = True, mmap_mode = 'r')
+        assert isinstance(mapped.segments.cruise.conditions.energy.power, np.memmap)
+        assert not mapped.segments.cruise.conditions.energy.power.flags.writeable
+        check_equal(data, mapped)
+
+        # partial read
+        energy = RCAIDE.load(filename, binary_format = True, keys = 'segments.cruise.conditions.energy')
+        check_equal(data.segments.cruise.conditions.energy, energy)
+        mach   = RCAIDE.load(filename, binary_format = True, keys = ['segments', 'climb', 'mach'])
+        assert mach == 0.5
+        try:
+            RCAIDE.load(filename, binary_format = True, keys = 'arrays.0')
+            raise AssertionError('partial read into a list did not raise')
+        except KeyError:
+            pass
+    finally:
+        shutil.rmtree(directory)
+    return
+
+def check_equal(expected, loaded):
+    """Checks that a loaded value has the type and content of the saved value."""
+    if isinstance(expected, np.ndarray):
+        assert isinstance(loaded, np.ndarray)
+        assert loaded.dtype == expected.dtype and np.array_equal(loaded, expected)
+    elif isinstance(expected, (list, tuple)):
+        assert type(loaded) == type(expected)
+        assert len(loaded) == len(expected)
+        for expected_item, loaded_item in zip(expected, loaded):
+            check_equal(expected_item, loaded_item)
+    elif isinstance(expected, (Data, DataOrdered)):
+        assert type(loaded) == type(expected)
+        assert list(loaded.keys()) == list(expected.keys())
+        for key in expected.keys():
+            check_equal(expected[key], loaded[key])
+    else:
+        assert loaded == expected and type(loaded) == type(expected.item() if isinstance(expected, np.generic) else expected)
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# dfdc_shards_test.py
+#
+# Created:  Oct 2026
+
+""" Checks that DFDC run cases sharded across concurrent processes give the same ducted fan performance
+    maps as the stored DFDC results, that a stored performance map is reused without running DFDC and that
+    the results of a failed DFDC run are not stored.
+    DFDC is replaced by a stand-in executable that writes the result files stored for the DFDC regression."""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+from RCAIDE.Library.Methods.Powertrain.Converters.Ducted_Fan import design_ducted_fan
+
+# python imports
+import numpy as np
+import tempfile
+import warnings
+import shutil
+import sys
+import os
+
+# stand-in for the DFDC executable: reads the input deck from stdin until QUIT and copies the requested geometry
+# and result files from the folder of the DFDC regression results, whose names differ from the requested names in case
+stand_in_dfdc = \
+'''#!{0}
+import os, sys, shutil
+commands = ['', '']
+for line in sys.stdin:
+    line = line.strip()
+    if line == 'QUIT':
+        break
+    if (commands[-1] == 'shoo') or (commands == ['writ','N']):
+        for filename in os.listdir({1!r}):
+            if filename.lower() == line.lower():
+                shutil.copy(os.path.join({1!r},filename),line)
+    commands = [commands[-1], line]
+print('stand-in DFDC, case ' + sys.argv[1])
+'''
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    regression_folder = os.path.abspath('dfdc_files')
+
+    origin = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_folder:
+        os.chdir(work_folder)
+        try:
+            dfdc_bin_name = os.path.join(work_folder,'stand_in_dfdc')
+            with open(dfdc_bin_name,'w') as stand_in:
+                stand_in.write(stand_in_dfdc.format(sys.executable,regression_folder))
+            os.chmod(dfdc_bin_name,0o755)
+            cache_folder = os.path.join(work_folder,'performance_maps')
+
+            # performance map read from a copy of the regression results
+            shutil.copytree(regression_folder,os.path.join(work_folder,'dfdc_files_reference'))
+            reference = ducted_fan_setup(os.path.join(work_folder,'dfdc_files_reference'),'dfdc',1,None)
+            design_ducted_fan(reference, new_regression_results = True)
+
+            # run cases sharded over three concurrent stand-in processes, the performance map is stored
+            sharded = ducted_fan_setup(os.path.join(work_folder,'dfdc_files_sharded'),dfdc_bin_name,3,cache_folder)
+            design_ducted_fan(sharded)
+
+            run_files = os.listdir(os.path.join(work_folder,'dfdc_files_sharded'))
+            assert 'ducted_fan_geometry.txt' in run_files
+            assert not any(name.startswith('dfdc_shard_') for name in run_files)
+            with open(os.path.join(work_folder,'dfdc_files_sharded','dfdc_log.txt'),'r') as log:
+                assert log.read().count('stand-in DFDC') == 3
+            assert len(os.listdir(cache_folder)) == 1
+
+            # an identical ducted fan reads the stored performance map, DFDC cannot be found and is not run
+            cached = ducted_fan_setup(os.path.join(work_folder,'dfdc_files_cached'),os.path.join(work_folder,'no_dfdc'),1,cache_folder)
+            design_ducted_fan(cached)
+
+            # a different ducted fan is not matched to the stored performance map
+            modified = ducted_fan_setup(os.path.join(work_folder,'dfdc_files_modified'),dfdc_bin_name,1,cache_folder)
+            modified.number_of_rotor_blades = 10
+            design_ducted_fan(modified)
+            assert len(os.listdir(cache_folder)) == 2
+
+            # a DFDC run that exits with an error is not stored, the next design of the ducted fan runs DFDC again
+            failing_bin_name = os.path.join(work_folder,'failing_dfdc')
+            with open(failing_bin_name,'w') as stand_in:
+                stand_in.write(stand_in_dfdc.format(sys.executable,regression_folder) + 'sys.exit(1)\n')
+            os.chmod(failing_bin_name,0o755)
+            failed = ducted_fan_setup(os.path.join(work_folder,'dfdc_files_failed'),failing_bin_name,3,cache_folder)
+            failed.number_of_rotor_blades = 8
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                design_ducted_fan(failed)
+            messages = [str(warning.message) for warning in caught]
+            assert any('DFDC exited with status 1' in message for message in messages)
+            assert any('not stored in the cache' in message for message in messages)
+            assert len(os.listdir(cache_folder)) == 2
+        finally:
+            os.chdir(origin)
+
+    points = np.array([[0.2,0.65,0.5],[0.4,0.75,1.2]])
+    for ducted_fan in [sharded,cached]:
+        assert np.array_equal(ducted_fan.rotor.twist_distribution, reference.rotor.twist_distribution)
+        assert ducted_fan.cruise.design_thrust == reference.cruise.design_thrust
+        for tag in ['thrust','power','efficiency','torque']:
+            error = np.max(np.abs(ducted_fan.performance_surrogates[tag](points) - reference.performance_surrogates[tag](points)))
+            print(tag + ' surrogate error: ', error)
+            assert error == 0.
+    return
+
+def ducted_fan_setup(run_folder,dfdc_bin_name,number_of_workers,cache_folder):
+
+    ducted_fan                                   = RCAIDE.Library.Components.Powertrain.Converters.Ducted_Fan()
+    ducted_fan.tag                               = 'ducted_fan'
+    ducted_fan.number_of_rotor_blades            = 12
+    ducted_fan.number_of_radial_stations         = 20
+    ducted_fan.tip_radius                        = 6 * Units.inches  / 2
+    ducted_fan.hub_radius                        = 0.25 * ducted_fan.tip_radius
+    ducted_fan.exit_radius                       = 1.1 * ducted_fan.tip_radius
+    ducted_fan.blade_clearance                   = 0.001
+    ducted_fan.length                            = 10. * Units.inches
+    ducted_fan.fan_effectiveness                 = 1.1
+    ducted_fan.fidelity                          = 'Blade_Element_Momentum_Theory'
+    ducted_fan.cruise.design_thrust              = 75
+    ducted_fan.cruise.design_altitude            = 5000  * Units.ft
+    ducted_fan.cruise.design_angular_velocity    = (0.8* 339.709) /  ducted_fan.tip_radius
+    ducted_fan.cruise.design_freestream_velocity = 90 *  Units.mph
+    ducted_fan.cruise.design_reference_velocity  = 90 *  Units.mph
+    airfoil                                      = RCAIDE.Library.Components.Airfoils.NACA_4_Series_Airfoil()
+    airfoil.NACA_4_Series_code                   = '2208'
+    ducted_fan.append_duct_airfoil(airfoil)
+    airfoil                                      = RCAIDE.Library.Components.Airfoils.NACA_4_Series_Airfoil()
+    airfoil.NACA_4_Series_code                   = '0008'
+    ducted_fan.append_hub_airfoil(airfoil)
+    ducted_fan.DFDC.bin_name                     = dfdc_bin_name
+    ducted_fan.DFDC.run_folder                   = run_folder
+    ducted_fan.DFDC.number_of_workers            = number_of_workers
+    ducted_fan.DFDC.cache_folder                 = cache_folder
+
+    return ducted_fan
+
+
+if __name__ == '__main__':
+    main()
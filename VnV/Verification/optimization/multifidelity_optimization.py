@@ -54,7 +54,27 @@ def main():
 
     assert( np.isclose(obj,  0, atol=1e-6) )
     assert( np.isclose(x1 ,-.1, atol=1e-2) )
-    assert( np.isclose(x2 ,  0, atol=1e-2) )      
+    assert( np.isclose(x2 ,  0, atol=1e-2) )
+
+    # every sample is evaluated once per fidelity level
+    x_samples = np.load('x_samples.npy')
+    assert( len(solver.sample_cache) == 2*len(np.unique(x_samples,axis=0)) )
+
+    # ------------------------------------------------------------------
+    #   Samples evaluated in parallel
+    # ------------------------------------------------------------------
+
+    np.random.seed(0)
+    solver = set_add_solver()
+    problem.number_of_workers = 2
+
+    print('Checking basic additive with samples evaluated in parallel...')
+    outputs_parallel = solver.Additive_Solve(problem,max_iterations=10,num_samples=20,tolerance=1e-8,print_output=False)
+    problem.number_of_workers = 1
+    print(outputs_parallel)
+
+    assert( np.array_equal(outputs_parallel[0], outputs[0]) )
+    assert( np.array_equal(outputs_parallel[1], outputs[1]) )
     
     # ------------------------------------------------------------------
     #   Active constraint
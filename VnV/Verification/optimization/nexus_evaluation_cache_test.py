@@ -0,0 +1,145 @@
+# nexus_evaluation_cache_test.py
+# Created: Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from   RCAIDE.Framework.Core import Units
+import RCAIDE.Framework.Optimization.Packages.scipy as scipy_setup
+
+import numpy as np
+import tempfile
+import pickle
+import os , sys
+
+from optimization_packages import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    x_a = np.array([ 0.5, 1.5])
+    x_b = np.array([-0.7, 0.2])
+    x_c = np.array([ 1.1,-1.3])
+
+    # ------------------------------------------------------------------
+    #   Without the cache only the last inputs are remembered
+    # ------------------------------------------------------------------
+    problem = setup('SLSQP')
+    obj_a   = problem.objective(x_a)
+    obj_b   = problem.objective(x_b)
+    assert( np.array_equal(problem.objective(x_a), obj_a) )
+    assert( problem.evaluation_count == 3 )
+
+    # ------------------------------------------------------------------
+    #   Least recently used cache
+    # ------------------------------------------------------------------
+    problem = setup('SLSQP')
+    problem.evaluation_cache.maximum_size = 2
+    problem.objective(x_a)
+    problem.objective(x_b)
+    assert( np.array_equal(problem.objective(x_a), obj_a) )
+    assert( np.array_equal(problem.all_constraints(x_a), x_a) )
+    assert( problem.evaluation_count == 2 )
+
+    # x_b is the least recently used entry and is dropped for x_c
+    problem.objective(x_c)
+    problem.objective(x_a)
+    assert( problem.evaluation_count == 3 )
+    assert( np.array_equal(problem.objective(x_b), obj_b) )
+    assert( problem.evaluation_count == 4 )
+
+    # the key includes the fidelity level
+    problem.fidelity_level = 2
+    problem.objective(x_b)
+    assert( problem.evaluation_count == 5 )
+
+    statistics = problem.evaluation_cache.statistics()
+    print('Cache statistics: ', statistics)
+    assert( statistics.misses == 5 )
+    assert( statistics.entries == 2 )
+
+    # inputs within the significant digits of the key share an entry
+    problem.fidelity_level = 1
+    problem.objective(x_b)
+    problem.objective(x_b*(1 + 1e-14))
+    assert( problem.evaluation_count == 5 )
+
+    # ------------------------------------------------------------------
+    #   Optimization with the cache
+    # ------------------------------------------------------------------
+    problem = optimization_setup()
+    sys.stdout = open(os.devnull,'w')
+    outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP')
+    sys.stdout = sys.__stdout__
+    evaluations_without_cache = problem.evaluation_count
+
+    problem = optimization_setup()
+    problem.evaluation_cache.maximum_size = 64
+    sys.stdout = open(os.devnull,'w')
+    outputs_cache = scipy_setup.SciPy_Solve(problem, solver='SLSQP')
+    sys.stdout = sys.__stdout__
+    print('SLSQP evaluations without and with the cache: ', evaluations_without_cache, problem.evaluation_count)
+    assert( np.array_equal(outputs[0], outputs_cache[0]) )
+    assert( problem.evaluation_count <= evaluations_without_cache )
+
+    # ------------------------------------------------------------------
+    #   Persistence across restarts
+    # ------------------------------------------------------------------
+    with tempfile.TemporaryDirectory() as folder:
+        cache_file = os.path.join(folder, 'nexus_cache.pkl')
+
+        problem = setup('SLSQP')
+        problem.evaluation_cache.maximum_size = 10
+        problem.evaluation_cache.file         = cache_file
+        problem.objective(x_a)
+        problem.objective(x_b)
+        assert( os.path.isfile(cache_file) )
+
+        restarted = setup('SLSQP')
+        restarted.evaluation_cache.maximum_size = 10
+        restarted.evaluation_cache.file         = cache_file
+        assert( np.array_equal(restarted.objective(x_a), obj_a) )
+        assert( np.array_equal(restarted.objective(x_b), obj_b) )
+        assert( restarted.evaluation_count == 0 )
+        assert( restarted.evaluation_cache.hits == 2 )
+
+        # each store appends its entry to the file instead of rewriting it
+        with open(cache_file,'rb') as file:
+            saved = file.read()
+        restarted.objective(x_c)
+        with open(cache_file,'rb') as file:
+            appended = file.read()
+        assert( appended.startswith(saved) and len(appended) > len(saved) )
+        assert( restarted.evaluation_cache.file_records == 3 )
+
+        # the file is rewritten with the current entries once it holds twice the maximum number of records
+        for ii in range(20):
+            restarted.objective(np.array([0.1*ii, 0.3]))
+        assert( restarted.evaluation_cache.file_records <= 2*restarted.evaluation_cache.maximum_size )
+
+        # a record cut short by an interrupted optimization is dropped
+        with open(cache_file,'ab') as file:
+            file.write(pickle.dumps(((0.,0.,1),None))[:-5])
+        interrupted = setup('SLSQP')
+        interrupted.evaluation_cache.maximum_size = 10
+        interrupted.evaluation_cache.file         = cache_file
+        assert( np.array_equal(interrupted.objective(np.array([1.9, 0.3])), restarted.objective(np.array([1.9, 0.3]))) )
+        assert( interrupted.evaluation_count == 0 )
+        assert( len(interrupted.evaluation_cache.entries) == 10 )
+
+    return
+
+def optimization_setup():
+    problem = setup('SLSQP')
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., 1*Units.less],
+        [ 'x1' , '=',   0., 1., 1*Units.less],
+        [ 'x2' , '>',   1., 1., 1*Units.less],
+        [ 'x2' , '<',   2., 1., 1*Units.less],
+        ],dtype=object)
+    return problem
+
+if __name__ == '__main__':
+    main()
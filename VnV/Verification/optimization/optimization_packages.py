@@ -9,12 +9,14 @@
 from   RCAIDE.Framework.Core         import Units, Data
 import RCAIDE.Framework.Optimization.Packages.scipy as scipy_setup 
 from   RCAIDE.Framework.Optimization.Common         import Nexus
+from   RCAIDE.Framework.Optimization.Packages.particle_swarm import particle_swarm_optimization
 
 import numpy as np
 import vehicle_opt_pack
 import procedure_opt_pack
 
 import os , sys
+import importlib
 
 def main():
     
@@ -49,6 +51,50 @@ def main():
     assert( np.isclose(x1 ,  0, atol=1e-2) )
     assert( np.isclose(x2 ,  1, atol=1e-2))
     
+    # ------------------------------------------------------------------
+    #   SLSQP with parallel finite differences
+    # ------------------------------------------------------------------  
+    print('\n\n Checking parallel finite differences')
+    problem     = setup(solver_name)
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., 1*Units.less],
+        [ 'x1' , '=',   0., 1., 1*Units.less],
+        [ 'x2' , '>',   1., 1., 1*Units.less],
+        [ 'x2' , '<',   2., 1., 1*Units.less],
+        ],dtype=object)        
+    x0                        = np.array([0.7, -0.3])
+    grad_serial, jac_serial   = problem.finite_difference(x0)
+    problem.number_of_workers = 2
+    grad_parallel,jac_parallel= problem.finite_difference(x0) 
+    assert( np.array_equal(grad_serial, grad_parallel) )
+    assert( np.array_equal(jac_serial , jac_parallel) )
+
+    # an open pool of workers is reused by every gradient until it is closed
+    worker_pools = importlib.import_module('RCAIDE.Framework.Optimization.Common.Nexus')._worker_pools
+    problem.open_worker_pool()
+    pool = worker_pools[id(problem)]
+    for x_pool in [x0, x0 + 0.1]:
+        problem.number_of_workers = 1
+        grad_serial, jac_serial   = problem.finite_difference(x_pool)
+        problem.number_of_workers = 2
+        grad_pooled, jac_pooled   = problem.finite_difference(x_pool)
+        assert( worker_pools[id(problem)] is pool )
+        assert( np.array_equal(grad_serial, grad_pooled) )
+        assert( np.array_equal(jac_serial , jac_pooled) )
+    problem.close_worker_pool()
+    assert( id(problem) not in worker_pools )
+
+    sys.stdout = open(os.devnull,'w')   
+    outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08, number_of_workers = 2)  
+    sys.stdout = sys.__stdout__  
+    print(outputs)
+    assert( id(problem) not in worker_pools )
+    
+    #   Check Results 
+    assert( np.isclose(outputs[1],  1, atol=1e-6) )
+    assert( np.isclose(outputs[0][0] ,  0, atol=1e-2) )
+    assert( np.isclose(outputs[0][1] ,  1, atol=1e-2))
+    
     # ------------------------------------------------------------------
     #   Differential Evolution 
     # ------------------------------------------------------------------  
@@ -101,11 +147,55 @@ def main():
     #   Check Results 
     assert( np.isclose(obj,  1, atol=1e-2) )
     assert( np.isclose(x1 ,  0, atol=1e-1) )
-    assert( np.isclose(x2 ,  1, atol=1e-1) )     
+    assert( np.isclose(x2 ,  1, atol=1e-1) )
 
+    # ------------------------------------------------------------------
+    #   Particle Swarm Optimization, generations evaluated in parallel
+    # ------------------------------------------------------------------
+    print('\n\n Checking particle swarm optimization with parallel generations')
+    problem     = setup(solver_name)
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., 1*Units.less],
+        [ 'x2' , '>',   1., 1., 1*Units.less],
+        [ 'x2' , '<',   2., 1., 1*Units.less],
+        ],dtype=object)
+    sys.stdout = open(os.devnull,'w')
+    outputs = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization' , pop_size =  40 , prob_seed = 1, number_of_workers = 2 )
+    sys.stdout = sys.__stdout__
+    print(outputs)
+    assert( np.isclose(outputs[1][0],  1, atol=1e-2) )
+    assert( np.isclose(outputs[0][0] ,  0, atol=1e-1) )
+    assert( np.isclose(outputs[0][1] ,  1, atol=1e-1) )
+
+    # the same seeded swarm is found with serial, parallel and batch evaluations of the generations
+    lb      = np.array([-2., -2.])
+    ub      = np.array([ 2.,  2.])
+    sys.stdout = open(os.devnull,'w')
+    serial   = particle_swarm_optimization(quadratic, lb, ub, f_ieqcons=quadratic_constraint, swarmsize=20, maxiter=30, synchronous=True, seed=3)
+    parallel = particle_swarm_optimization(quadratic, lb, ub, f_ieqcons=quadratic_constraint, swarmsize=20, maxiter=30, processes=2, seed=3)
+    batch    = particle_swarm_optimization(quadratic, lb, ub, swarmsize=20, maxiter=30, batch_func=quadratic_batch, seed=3)
+    asynchronous = particle_swarm_optimization(quadratic, lb, ub, f_ieqcons=quadratic_constraint, swarmsize=20, maxiter=30, processes=2, asynchronous=True, seed=3)
+    sys.stdout = sys.__stdout__
+    print(serial, parallel, batch, asynchronous)
+    assert( np.array_equal(serial[0], parallel[0]) and serial[1] == parallel[1] )
+    assert( np.array_equal(serial[0], batch[0]) and serial[1] == batch[1] )
+    assert( np.isclose(serial[0][1] ,  1.2, atol=1e-2) )
+    assert( np.isclose(asynchronous[0][1] ,  1.2, atol=1e-2) )
 
     return
 
+# ----------------------------------------------------------------------
+#   Particle Swarm Test Functions
+# ----------------------------------------------------------------------
+def quadratic(x):
+    return (x[0] - 0.5)**2 + (x[1] - 1.)**2 + 1.
+
+def quadratic_constraint(x):
+    return np.array([x[1] - 1.2])
+
+def quadratic_batch(x):
+    return (x[:,0] - 0.5)**2 + (x[:,1] - 1.)**2 + 1., x[:,1:2] - 1.2
+
 # ----------------------------------------------------------------------        
 #   Inputs, Objective, & Constraints
 # ----------------------------------------------------------------------  
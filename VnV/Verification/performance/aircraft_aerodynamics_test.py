@@ -9,7 +9,7 @@ The script below documents how to set up and plot the results of polar analysis
 # ---------------------------------------------------------------------- 
 import RCAIDE
 from RCAIDE.Framework.Core import Units , Data   
-from RCAIDE.Library.Methods.Performance                            import aircraft_aerodynamic_analysis 
+from RCAIDE.Library.Methods.Performance                            import aircraft_aerodynamic_analysis, aircraft_aerodynamic_polar_sweep 
 from RCAIDE.Library.Plots                                          import *   
 import numpy as np
 import matplotlib.pyplot  as plt
@@ -34,10 +34,49 @@ def main():
     
     results                           = aircraft_aerodynamic_analysis(aerodynamics_analysis = aerodynamics_analysis_routine,
                                                                       angle_of_attack_range = angle_of_attack_range,
-                                                                      Mach_number_range = Mach_number_range,
-                                                                      control_surface_deflection_range= control_surface_deflection_range)
+                                                                      Mach_number_range = Mach_number_range)
   
     plot_aircraft_aerodynamics(results) 
+
+    # polar sweep over angle of attack, Mach number and elevator deflection 
+    sweep = aircraft_aerodynamic_polar_sweep(aerodynamics_analysis            = aerodynamics_analysis_routine,
+                                             angle_of_attack_range            = angle_of_attack_range,
+                                             Mach_number_range                = Mach_number_range,
+                                             control_surface_deflection_range = control_surface_deflection_range,
+                                             initialize                       = False)
+    assert sweep.lift_coefficient.shape == (18,10,7,1)
+    assert np.array_equal(results.lift_coefficient, sweep.lift_coefficient[:,:,0,0])
+    assert np.all(np.diff(sweep.lift_coefficient[:,0,:,0],axis=1) != 0)
+    print('CL at 5 deg, Mach 0.5, 10 deg elevator: ', sweep.lift_coefficient[10,5,2,0])
+    print('CD at 5 deg, Mach 0.5, 10 deg elevator: ', sweep.drag_coefficient[10,5,2,0])
+    CL_truth = 0.9922507383325214
+    CD_truth = 0.04066632728020371
+    assert np.abs(sweep.lift_coefficient[10,5,2,0] - CL_truth)/CL_truth < 1e-6
+    assert np.abs(sweep.drag_coefficient[10,5,2,0] - CD_truth)/CD_truth < 1e-6
+
+    # a sweep over several deflections is not reduced to its first deflection
+    try:
+        aircraft_aerodynamic_analysis(aerodynamics_analysis            = aerodynamics_analysis_routine,
+                                      angle_of_attack_range            = angle_of_attack_range,
+                                      Mach_number_range                = Mach_number_range,
+                                      control_surface_deflection_range = control_surface_deflection_range)
+        rejected = False
+    except ValueError:
+        rejected = True
+    assert rejected
+
+    # evaluation of the whole grid in one batch and over altitude, reusing the trained analysis
+    altitude_range = np.array([[0.],[10000.]])*Units.ft
+    batch_sweep    = aircraft_aerodynamic_polar_sweep(aerodynamics_analysis            = aerodynamics_analysis_routine,
+                                                      angle_of_attack_range            = angle_of_attack_range,
+                                                      Mach_number_range                = Mach_number_range,
+                                                      control_surface_deflection_range = control_surface_deflection_range,
+                                                      altitude_range                   = altitude_range,
+                                                      batch_size                       = None,
+                                                      initialize                       = False)
+    assert np.allclose(batch_sweep.lift_coefficient[...,0], sweep.lift_coefficient[...,0], rtol = 1e-12, atol = 1e-14)
+    assert np.allclose(batch_sweep.drag_coefficient[...,0], sweep.drag_coefficient[...,0], rtol = 1e-12, atol = 1e-14)
+    assert np.all(batch_sweep.drag_coefficient[...,1] != batch_sweep.drag_coefficient[...,0])
     
     return  
   
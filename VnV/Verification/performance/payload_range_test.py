@@ -54,10 +54,18 @@ def fuel_aircraft_payload_range():
     payload_range_results =  compute_payload_range_diagram(mission = missions.base_mission)
                                 
     fuel_r                 = payload_range_results.range[-1]  
-    fuel_r_true            = 5361598.851769192 # Spot on with Airport planning manual! " https://www.embraercommercialaviation.com/wp-content/uploads/2017/06/APM_190.pdf"
+    fuel_r_true            = 5361653.659262353 # Spot on with Airport planning manual! " https://www.embraercommercialaviation.com/wp-content/uploads/2017/06/APM_190.pdf"
     print('Fuel Range: ' + str(fuel_r))
+    print('Mission Solves: ' + str(payload_range_results.mission_solves))
     fuel_error =  abs(fuel_r - fuel_r_true) /fuel_r_true
     assert(abs(fuel_error)<1e-6)
+    assert(np.all(payload_range_results.mission_solves[1:] <= 5))
+    
+    # the warm start of the mission is left as it was by the sweep
+    assert(missions.base_mission.warm_start.active == False)
+    assert(len(missions.base_mission.warm_start.segments) == 0)
+    for segment in missions.base_mission.segments.values():
+        assert(segment.state.numerics.solver.warm_start is None)
     
     return  
 
@@ -82,11 +90,15 @@ def electric_aircraft_payload_range():
         # create mission instances (for multiple types of missions)
         missions = missions_setup(mission)   
     
-        payload_range_results =  compute_payload_range_diagram(mission = missions.base_mission) 
+        # dense payload range curve, evaluated in two processes
+        payload_range_results =  compute_payload_range_diagram(mission = missions.base_mission, number_of_payload_levels = 2, number_of_workers = 2) 
         electric_r         =  payload_range_results.range[-1]
         print('Electric Range: ' + str(electric_r ))
         electric_error =  abs(electric_r - electric_r_truth[i]) /electric_r_truth[i]
         assert(abs(electric_error)<1e-6)        
+        assert(len(payload_range_results.range) == 5)
+        assert(np.all(np.diff(payload_range_results.payload) <= 0))
+        assert(np.all(payload_range_results.mission_solves[1:] == 1))
 
     return  
 
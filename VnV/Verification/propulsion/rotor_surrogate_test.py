@@ -0,0 +1,80 @@
+# rotor_surrogate_test.py
+#
+# Created:  Oct 2026
+
+""" Checks that the surrogate of the Blade Element Momentum Theory rotor analysis reproduces the direct
+    analysis of a propeller and that a trained surrogate is reused from the cache folder."""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                                                                            import Units
+from RCAIDE.Library.Methods.Performance                                                               import rotor_aerodynamic_analysis
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Surrogate import surrogate_key
+
+# python imports
+import numpy as np
+import tempfile
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from Test_Propeller    import Test_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    velocity_range   = np.linspace(10, 100, 10)
+    angular_velocity = 2200*Units.rpm
+
+    # direct analysis
+    propeller = Test_Propeller()
+    direct    = rotor_aerodynamic_analysis(propeller, velocity_range, angular_velocity = angular_velocity)
+
+    with tempfile.TemporaryDirectory() as cache_folder:
+        # surrogate trained on the first evaluation and stored in the cache folder
+        propeller = surrogate_propeller(cache_folder)
+        surrogate = rotor_aerodynamic_analysis(propeller, velocity_range, angular_velocity = angular_velocity)
+        assert os.listdir(cache_folder) == ['BEMT_surrogate_' + surrogate_key(propeller) + '.pkl']
+
+        # an identical propeller reuses the trained surrogate
+        propeller_2 = surrogate_propeller(cache_folder)
+        surrogate_2 = rotor_aerodynamic_analysis(propeller_2, velocity_range, angular_velocity = angular_velocity)
+        assert propeller_2.BEMT_surrogate.surrogate.key == propeller.BEMT_surrogate.surrogate.key
+        assert np.array_equal(surrogate_2.thrust, surrogate.thrust)
+
+    # the surrogate provides every output of the direct analysis with the same shape
+    for key in direct.keys():
+        assert np.shape(surrogate[key]) == np.shape(direct[key])
+
+    for tag in ['thrust','torque','power']:
+        error = np.max(np.abs(np.linalg.norm(surrogate[tag],axis=1) - np.linalg.norm(direct[tag],axis=1)))/np.max(np.linalg.norm(direct[tag],axis=1))
+        print(tag + ' surrogate error: ', error)
+        print(tag + ' accuracy report: ', propeller.BEMT_surrogate.accuracy[tag].max_relative_error)
+        assert error < 0.03
+        assert propeller.BEMT_surrogate.accuracy[tag].max_relative_error < 0.03
+
+    # noise-relevant distributions
+    error = np.max(np.abs(surrogate.disc_thrust_distribution - direct.disc_thrust_distribution))/np.max(np.abs(direct.disc_thrust_distribution))
+    print('thrust distribution surrogate error: ', error)
+    assert error < 0.05
+    return
+
+def surrogate_propeller(cache_folder):
+
+    propeller                                             = Test_Propeller()
+    propeller.fidelity                                    = 'Blade_Element_Momentum_Theory_Surrogate'
+    propeller.BEMT_surrogate.training.advance_ratio       = np.linspace(0,1.5,11)
+    propeller.BEMT_surrogate.training.tip_mach            = np.array([0.6,0.8])
+    propeller.BEMT_surrogate.training.blade_pitch_command = np.array([0.])
+    propeller.BEMT_surrogate.accuracy_samples             = 4
+    propeller.BEMT_surrogate.cache_folder                 = cache_folder
+
+    return propeller
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# rotor_wake_convergence_test.py
+#
+# Created:  Oct 2026
+
+""" Checks the element-wise solution of the inflow angles of the Helmholtz wake: every blade element of a
+    propeller in axial and inclined flow converges, and the 2D analysis of an axisymmetric inflow reproduces
+    the 1D analysis."""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                              import Units
+from RCAIDE.Library.Methods.Performance                 import rotor_aerodynamic_analysis
+
+# python imports
+import numpy as np
+import time
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from Test_Propeller    import Test_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # hover, cruise and windmilling inflow
+    velocity_range   = np.array([0., 30., 60., 90., 120.])
+    angular_velocity = 2200*Units.rpm
+
+    propeller  = Test_Propeller()
+    results_1d = rotor_aerodynamic_analysis(propeller, velocity_range, angular_velocity = angular_velocity)
+    assert np.all(results_1d.inflow_angle_converged)
+
+    # the 2D analysis of an axisymmetric inflow gives the 1D loads around the disc
+    propeller.use_2d_analysis = True
+    ti         = time.time()
+    results_2d = rotor_aerodynamic_analysis(propeller, velocity_range, angular_velocity = angular_velocity)
+    print('2D analysis time: ', time.time() - ti)
+    assert results_2d.inflow_angle_converged.shape == (len(velocity_range),len(propeller.chord_distribution),propeller.number_azimuthal_stations)
+    assert np.all(results_2d.inflow_angle_converged)
+
+    thrust_1d = np.linalg.norm(results_1d.thrust,axis=1)
+    thrust_2d = np.linalg.norm(results_2d.thrust,axis=1)
+    print('1D thrust: ', thrust_1d)
+    print('2D thrust: ', thrust_2d)
+    assert np.allclose(thrust_2d, thrust_1d, rtol = 1e-6)
+    assert np.allclose(results_2d.torque, results_1d.torque, rtol = 1e-6)
+
+    # inclined inflow
+    results_aoa = rotor_aerodynamic_analysis(propeller, velocity_range[1:], angular_velocity = angular_velocity, angle_of_attack = 20*Units.degrees)
+    assert np.all(results_aoa.inflow_angle_converged)
+    disc_thrust = results_aoa.disc_thrust_distribution
+    print('Azimuthal thrust variation: ', np.max(np.ptp(disc_thrust,axis=2)))
+    assert np.max(np.ptp(disc_thrust,axis=2)) > 0.
+    return
+
+if __name__ == '__main__':
+    main()
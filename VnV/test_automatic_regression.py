@@ -14,12 +14,19 @@ modules = [
     'Verification/analysis_aerodynamics/airfoil_panel_method_test.py',    
     'Verification/analysis_aerodynamics/airfoil_panel_method_convergence.py',
     'Verification/analysis_aerodynamics/VLM_control_surface_test.py',    
-    'Verification/analysis_aerodynamics/VLM_moving_surface_test.py',   
+    'Verification/analysis_aerodynamics/VLM_moving_surface_test.py',
+    'Verification/analysis_aerodynamics/VLM_induced_drag_test.py',
+    'Verification/analysis_aerodynamics/VLM_panelization_test.py',
+    'Verification/analysis_aerodynamics/VLM_influence_matrix_test.py',
+    'Verification/analysis_aerodynamics/VLM_hierarchical_matrix_test.py',
     'Verification/analysis_aerodynamics/AVL_test.py',     
+    'Verification/analysis_aerodynamics/AVL_shards_test.py',
     'Verification/atmosphere/atmosphere.py',
     'Verification/atmosphere/constant_temperature.py',
+    'Verification/atmosphere/atmosphere_freestream_test.py',
     'Verification/analysis_emissions/emissions_test.py',   
     'Verification/analysis_noise/digital_elevation_test.py',  
+    'Verification/analysis_noise/topography_test.py',
     'Verification/analysis_noise/frequency_domain_test.py', 
     'Verification/analysis_noise/empirical_jet_noise_test.py',    
     'Verification/analysis_stability/trimmed_flight_test.py', 
@@ -34,9 +41,18 @@ modules = [
     'Verification/geometry/wing_fuel_volume_compute.py',
     'Verification/geometry/fuselage_planform_compute.py',  
     'Verification/future_capability_coverage/coverage_test.py',    
+    'Verification/framework/import_time_test.py',
+    'Verification/framework/save_load_binary_test.py',
+    'Verification/framework/conditions_template_test.py',
+    'Verification/framework/merged_state_test.py',
+    'Verification/framework/mission_batch_test.py',
+    'Verification/framework/mission_warm_start_test.py',
+    'Verification/framework/mission_surrogate_training_test.py',
+    'Verification/framework/mission_pipeline_test.py',
     'Verification/mission_segments/transition_segment_test.py', 
     'Verification/network_electric/battery_electric_aircraft_test.py',
     'Verification/network_electric/electric_ducted_fan_aircraft_test.py',
+    'Verification/network_electric/dfdc_shards_test.py',
     'Verification/network_fuel_cell/hydrogen_fuel_cell_aircraft_test.py', 
     'Verification/network_hybrid/hybrid_network_test.py', 
     'Verification/network_turbofan/turbofan_network_test.py',
@@ -46,6 +62,7 @@ modules = [
     'Verification/network_internal_combustion_engine/ICE_test.py',
     'Verification/network_internal_combustion_engine/ICE_constant_speed_test.py',
     'Verification/optimization/optimization_packages.py',
+    'Verification/optimization/nexus_evaluation_cache_test.py',
     'Verification/optimization/multifidelity_optimization.py',
     'Verification/performance/landing_field_length_test.py',
     'Verification/performance/payload_range_test.py',
@@ -55,6 +72,8 @@ modules = [
     'Verification/performance/noise_certification_test.py', 
     'Verification/performance/V_n_diagram_test.py', 
     'Verification/propulsion/rotor_performance_test.py',  
+    'Verification/propulsion/rotor_surrogate_test.py',
+    'Verification/propulsion/rotor_wake_convergence_test.py',
     'Verification/propulsion/propeller_non_uniform_inflow.py',    
     'Verification/propulsion/propeller_wing_interaction_test.py', 
     'Verification/propulsion/generator_test.py',